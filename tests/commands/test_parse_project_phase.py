@@ -85,7 +85,9 @@ def test_parse_project_phase_with_dbt(dbt_project, working_dir, output_dir):
         )
 
         # Verify dbt_phase was called with correct parameters
-        mock_dbt.assert_called_once_with(working_dir, output_dir, "test_profile", "test_target")
+        mock_dbt.assert_called_once_with(
+            working_dir, output_dir, "test_profile", "test_target", parsed_files=None
+        )
 
         # Verify project was parsed correctly
         assert project is not None
@@ -172,3 +174,21 @@ def test_parse_project_phase_with_stacktrace_logging(basic_project, working_dir,
             mock_logger_instance.debug.assert_called_with("    Running dbt phase...")
             assert mock_logger_instance.info.call_count > 0
             assert "dbt phase completed in" in mock_logger_instance.info.call_args[0][0]
+
+
+def test_parse_project_phase_reuses_the_project_cache(basic_project, working_dir, output_dir):
+    setup_project_files(basic_project, working_dir)
+    kwargs = dict(
+        working_dir=working_dir,
+        output_dir=output_dir,
+        default_source="source",
+        dbt_profile=None,
+        dbt_target=None,
+    )
+    first = parse_project_phase(**kwargs)
+
+    with patch("visivo.commands.parse_project_phase.ParserFactory") as parser_factory:
+        second = parse_project_phase(**kwargs)
+
+    parser_factory.assert_not_called()
+    assert second.model_dump_json() == first.model_dump_json()
@@ -8,11 +8,13 @@ from tests.factories.model_factories import (
     ChartFactory,
     ItemFactory,
     RowFactory,
+    SourceFactory,
 )
 from tests.support.utils import temp_folder, temp_yml_file
 from visivo.commands.run_phase import run_phase
 from visivo.commands.utils import create_file_database
 from visivo.models.defaults import Defaults
+from visivo.models.sources.source import Source
 from visivo.parsers.file_names import PROJECT_FILE_NAME
 
 
@@ -65,3 +67,104 @@ def test_run_phase():
         dag_filter="+dashboard+",
     )
     assert os.path.exists(f"{output_dir}/main/insights/{insight.name}.json")
+
+
+def test_run_phase_incremental_skips_unchanged_jobs():
+    output_dir = temp_folder()
+    project, insight = _make_project_with_insight()
+    create_file_database(url=project.sources[0].url(), output_dir=output_dir)
+    tmp = temp_yml_file(dict=json.loads(project.model_dump_json()), name=PROJECT_FILE_NAME)
+    working_dir = os.path.dirname(tmp)
+    run_kwargs = dict(
+        default_source="source",
+        working_dir=working_dir,
+        output_dir=output_dir,
+        dag_filter="+dashboard+",
+    )
+
+    first = run_phase(incremental=True, **run_kwargs)
+    assert len(first.successful_job_results) > 0
+    assert os.path.exists(f"{output_dir}/main/run_manifest.json")
+
+    def rebuilt(runner):
+        # Source schema jobs always run; only models, insights and inputs are skipped
+        return sorted(
+            result.item.name
+            for result in runner.successful_job_results
+            if not isinstance(result.item, Source)
+        )
+
+    second = run_phase(incremental=True, **run_kwargs)
+    assert rebuilt(second) == []
+    assert second.failed_job_results == []
+
+    full_refresh = run_phase(incremental=False, **run_kwargs)
+    assert rebuilt(full_refresh) == rebuilt(first)
+
+    os.remove(f"{output_dir}/main/insights/{insight.name}.json")
+    assert rebuilt(run_phase(incremental=True, **run_kwargs)) == [insight.name]
+
+
+def test_run_phase_incremental_reruns_jobs_on_server_sources(monkeypatch):
+    """Warehouse data can change without the project changing, so a model on a
+    Postgres source runs on every incremental run while one on a SQLite file
+    is skipped until the file changes."""
+    from functools import wraps
+
+    from visivo.jobs.dag_runner import DagRunner
+    from visivo.jobs.job import JobResult
+    from visivo.jobs.run_manifest import RunManifest
+    from visivo.models.sources.postgresql_source import PostgresqlSource
+
+    output_dir = temp_folder()
+    warehouse = PostgresqlSource(
+        name="warehouse", type="postgresql", database="analytics", username="u", password="p"
+    )
+    pg_model = SqlModelFactory(name="pg_model", source="ref(warehouse)")
+    file_model = SqlModelFactory(name="file_model", source="ref(source)")
+    project = ProjectFactory(
+        defaults=Defaults(source_name="source"),
+        sources=[SourceFactory(), warehouse],
+        models=[pg_model, file_model],
+        dashboards=[],
+    )
+    tmp = temp_yml_file(dict=json.loads(project.model_dump_json()), name=PROJECT_FILE_NAME)
+
+    executed = []
+    create_jobs = DagRunner.create_jobs_from_item
+
+    def fake_jobs(runner, item):
+        # Stand in for the warehouse: write what the job would, without connecting
+        job = create_jobs(runner, item)
+        if job is None:
+            return job
+        action = job.action
+
+        @wraps(action)
+        def fake_action(**kwargs):
+            executed.append(item.name)
+            manifest = RunManifest(output_dir=output_dir, dag=runner.project_dag)
+            for path in manifest.outputs(item, job):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                open(path, "w").close()
+            return JobResult(item=item, success=True, message=f"ran {item.name}")
+
+        job.action = fake_action
+        return job
+
+    monkeypatch.setattr(DagRunner, "create_jobs_from_item", fake_jobs)
+    run_kwargs = dict(
+        default_source="source",
+        working_dir=os.path.dirname(tmp),
+        output_dir=output_dir,
+        dag_filter="+pg_model,+file_model",
+        incremental=True,
+    )
+
+    run_phase(**run_kwargs)
+    assert {"pg_model", "file_model"} <= set(executed)
+
+    executed.clear()
+    run_phase(**run_kwargs)
+    assert "pg_model" in executed
+    assert "file_model" not in executed
@@ -118,7 +118,7 @@ def test_serve_new_project_in_empty_dir_does_not_pass_traces(tmp_path):
 def test_serve_command_raises_when_parse_fails(output_dir, tmp_path):
     port = get_test_port()
 
-    with patch("visivo.commands.serve.parse_project_phase") as mock_parse:
+    with patch("visivo.commands.parse_project_phase.parse_project_phase") as mock_parse:
         mock_parse.side_effect = click.ClickException("Mock parse failure")
 
         result = runner.invoke(
@@ -144,8 +144,8 @@ def test_serve_command_does_not_claim_build_complete_before_data_ready(output_di
     mock_server = MagicMock()
 
     with (
-        patch("visivo.commands.serve.parse_project_phase") as mock_parse,
-        patch("visivo.commands.serve.serve_phase") as mock_serve_phase,
+        patch("visivo.commands.parse_project_phase.parse_project_phase") as mock_parse,
+        patch("visivo.commands.serve_phase.serve_phase") as mock_serve_phase,
     ):
         mock_parse.return_value = ProjectFactory()
         mock_serve_phase.return_value = (mock_server, MagicMock(), MagicMock())
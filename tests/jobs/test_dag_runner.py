@@ -1,6 +1,8 @@
 """Tests for dag_runner Input job creation."""
 
+import networkx
 import pytest
+from visivo.jobs.job import Job, JobResult
 from visivo.models.inputs.types.single_select import SingleSelectInput
 from visivo.models.project import Project
 from tests.factories.model_factories import SourceFactory
@@ -46,3 +48,223 @@ class TestDagRunnerInputJobs:
         assert (
             job_obj.action == input_action
         ), f"Expected job.action to be run_input_job.action, got {job_obj.action}"
+
+    def test_source_schema_job_gets_the_run_thread_count(self):
+        from visivo.jobs.dag_runner import DagRunner
+
+        source = SourceFactory()
+        project = Project(name="test_project", sources=[source], dashboards=[])
+        dag_runner = DagRunner(
+            project=project,
+            output_dir=temp_folder(),
+            threads=6,
+            soft_failure=False,
+            server_url="",
+            job_dag=project.dag(),
+            working_dir=".",
+        )
+
+        assert dag_runner.create_jobs_from_item(source).kwargs["threads"] == 6
+
+    def test_source_schema_jobs_share_the_run_threads(self):
+        from visivo.jobs.dag_runner import DagRunner
+
+        warehouse = SourceFactory(name="warehouse")
+        limited = SourceFactory(name="limited", max_concurrent_queries=2)
+        lake = SourceFactory(name="lake")
+        project = Project(name="test_project", sources=[warehouse, limited, lake], dashboards=[])
+        dag_runner = DagRunner(
+            project=project,
+            output_dir=temp_folder(),
+            threads=12,
+            soft_failure=False,
+            server_url="",
+            job_dag=project.dag(),
+            working_dir=".",
+        )
+
+        assert dag_runner.create_jobs_from_item(warehouse).kwargs["threads"] == 4
+        assert dag_runner.create_jobs_from_item(limited).kwargs["threads"] == 2
+
+
+class _Node:
+    def __init__(self, name):
+        self.name = name
+
+
+class TestDagRunnerScheduling:
+    """The scheduler starts a node once its dependencies finish, without polling."""
+
+    def _runner(self, job_dag, action, source=None):
+        from visivo.jobs.dag_runner import DagRunner
+
+        project = Project(name="test_project", sources=[SourceFactory()], dashboards=[])
+        dag_runner = DagRunner(
+            project=project,
+            output_dir=temp_folder(),
+            threads=4,
+            soft_failure=True,
+            server_url="",
+            job_dag=job_dag,
+            working_dir=".",
+        )
+
+        def create_job(item):
+            if item.name.startswith("nojob"):
+                return None
+            return Job(item=item, source=source, action=action, node=item)
+
+        dag_runner.create_jobs_from_item = create_job
+        return dag_runner
+
+    def _dag(self, edges):
+        nodes = {}
+        dag = networkx.DiGraph()
+        for dependent, dependency in edges:
+            nodes.setdefault(dependent, _Node(dependent))
+            nodes.setdefault(dependency, _Node(dependency))
+            dag.add_edge(nodes[dependent], nodes[dependency])
+        return dag
+
+    def test_runs_dependencies_before_dependents(self):
+        # insight -> (model_a, model_b) -> source; edges point at dependencies
+        dag = self._dag(
+            [
+                ("insight", "model_a"),
+                ("insight", "model_b"),
+                ("model_a", "source"),
+                ("model_b", "source"),
+            ]
+        )
+        order = []
+
+        def action(node):
+            order.append(node.name)
+            return JobResult(item=node, success=True, message=node.name)
+
+        self._runner(dag, action).run()
+
+        assert order[0] == "source"
+        assert order[-1] == "insight"
+        assert sorted(order[1:3]) == ["model_a", "model_b"]
+
+    def test_failure_skips_every_downstream_node(self):
+        dag = self._dag(
+            [
+                ("dashboard", "nojob_chart"),
+                ("nojob_chart", "insight"),
+                ("insight", "model"),
+                ("model", "source"),
+                ("other_model", "source"),
+            ]
+        )
+        ran = []
+
+        def action(node):
+            ran.append(node.name)
+            return JobResult(item=node, success=node.name != "model", message=node.name)
+
+        dag_runner = self._runner(dag, action)
+        dag_runner.run()
+
+        assert sorted(ran) == ["model", "other_model", "source"]
+        assert [r.item.name for r in dag_runner.failed_job_results] == ["model"]
+
+    def test_action_exception_counts_as_failure(self):
+        dag = self._dag([("insight", "model")])
+
+        def action(node):
+            if node.name == "model":
+                raise RuntimeError("boom")
+            return JobResult(item=node, success=True, message=node.name)
+
+        dag_runner = self._runner(dag, action)
+        dag_runner.run()
+
+        assert len(dag_runner.failed_job_results) == 1
+        assert "boom" in dag_runner.failed_job_results[0].message
+        assert dag_runner.successful_job_results == []
+
+    def test_max_concurrent_queries_limits_jobs_per_source(self):
+        import threading
+        import time
+
+        dag = self._dag([("insight", f"model_{i}") for i in range(6)])
+        source = SourceFactory(max_concurrent_queries=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def action(node):
+            with lock:
+                active.append(node.name)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.remove(node.name)
+            return JobResult(item=node, success=True, message=node.name)
+
+        dag_runner = self._runner(dag, action, source=source)
+        dag_runner.run()
+
+        assert len(dag_runner.successful_job_results) == 7
+        assert max(peak) == 2
+
+    def _run_with_timeout(self, dag_runner):
+        import threading
+
+        thread = threading.Thread(target=dag_runner.run, daemon=True)
+        thread.start()
+        thread.join(timeout=10)
+        assert not thread.is_alive(), "run never finished"
+
+    def test_job_factory_error_fails_only_that_node(self):
+        dag = self._dag([("insight", "model"), ("model", "source"), ("other_model", "source")])
+        ran = []
+
+        def action(node):
+            ran.append(node.name)
+            return JobResult(item=node, success=True, message=node.name)
+
+        dag_runner = self._runner(dag, action)
+        create_job = dag_runner.create_jobs_from_item
+
+        def failing_create_job(item):
+            if item.name == "model":
+                raise ValueError("no source for model")
+            return create_job(item)
+
+        dag_runner.create_jobs_from_item = failing_create_job
+        self._run_with_timeout(dag_runner)
+
+        assert sorted(ran) == ["other_model", "source"]
+        assert [r.item.name for r in dag_runner.failed_job_results] == ["model"]
+        assert "no source for model" in dag_runner.failed_job_results[0].message
+
+    def test_bookkeeping_error_still_completes_the_node(self):
+        dag = self._dag([("insight", "model"), ("other_model", "source")])
+        ran = []
+
+        def action(node):
+            ran.append(node.name)
+            return JobResult(item=node, success=True, message=node.name)
+
+        class BrokenManifest:
+            def record(self, node, job):
+                if node.name == "model":
+                    raise OSError("disk full")
+
+            def forget(self, node):
+                pass
+
+            def save(self):
+                pass
+
+        dag_runner = self._runner(dag, action)
+        dag_runner.run_manifest = BrokenManifest()
+        self._run_with_timeout(dag_runner)
+
+        assert sorted(ran) == ["model", "other_model", "source"]
+        assert [r.item.name for r in dag_runner.failed_job_results] == ["model"]
+        assert "disk full" in dag_runner.failed_job_results[0].message
+        assert "model" not in [r.item.name for r in dag_runner.successful_job_results]
@@ -0,0 +1,67 @@
+import os
+
+from visivo.jobs.file_index import index_path, load_index, record_file, save_index
+from visivo.jobs.run_model_data_job import write_parquet_from_data
+from visivo.models.base.named_model import alpha_hash
+from tests.support.utils import temp_folder
+
+
+def test_record_file_keys_by_hash_of_stem():
+    run_output_dir = os.path.join(temp_folder(), "main")
+    path = os.path.join(run_output_dir, "models", "orders.parquet")
+    os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as fp:
+        fp.write(b"PAR1orders")
+
+    record_file(run_output_dir, path)
+    save_index()
+
+    entry = load_index(run_output_dir)[alpha_hash("orders")]
+    assert entry["path"] == os.path.join("models", "orders.parquet")
+    assert entry["size"] == len(b"PAR1orders")
+
+
+def test_index_is_written_once_when_saved(monkeypatch):
+    run_output_dir = os.path.join(temp_folder(), "main")
+    os.makedirs(os.path.join(run_output_dir, "models"))
+    paths = []
+    for name in ["a", "b", "c"]:
+        path = os.path.join(run_output_dir, "models", f"{name}.parquet")
+        with open(path, "wb") as fp:
+            fp.write(b"PAR1" + name.encode())
+        paths.append(path)
+    hashed = []
+    monkeypatch.setattr(
+        "visivo.jobs.file_index.content_hash", lambda path: hashed.append(path) or "hash"
+    )
+
+    for path in paths:
+        record_file(run_output_dir, path)
+
+    assert not os.path.exists(index_path(run_output_dir))
+    assert len(load_index(run_output_dir)) == 3
+
+    save_index()
+
+    assert set(load_index(run_output_dir)) == {alpha_hash(name) for name in ["a", "b", "c"]}
+    assert hashed == []
+
+
+def test_model_parquet_is_indexed_as_it_is_written():
+    output_dir = temp_folder()
+
+    path = write_parquet_from_data([{"x": 1}, {"x": 2}], output_dir, "model_a", "run-1")
+    write_parquet_from_data([{"y": 1}], output_dir, "model_b", "run-1")
+
+    entries = load_index(f"{output_dir}/run-1")
+    assert set(entries) == {alpha_hash("model_a"), alpha_hash("model_b")}
+    assert entries[alpha_hash("model_a")]["size"] == os.path.getsize(path)
+
+
+def test_unreadable_index_starts_empty():
+    run_output_dir = temp_folder()
+    os.makedirs(run_output_dir, exist_ok=True)
+    with open(os.path.join(run_output_dir, "files_index.json"), "w") as fp:
+        fp.write("{not json")
+
+    assert load_index(run_output_dir) == {}
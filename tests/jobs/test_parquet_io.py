@@ -12,9 +12,15 @@ from datetime import datetime, date
 from decimal import Decimal
 
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
-from visivo.jobs.parquet_io import write_dicts_to_parquet
+from visivo.jobs.parquet_io import (
+    write_arrow_batches_to_parquet,
+    write_arrow_to_parquet,
+    write_dicts_to_parquet,
+)
 
 # ---------------------------------------------------------------------------
 # B14: Decimal columns are cast to Float64 before parquet write
@@ -155,3 +161,168 @@ def test_single_row_round_trip(tmp_path):
     assert df["a"][0] == 1
     assert df["b"][0] == "two"
     assert df["c"][0] == pytest.approx(3.14)
+
+
+# ---------------------------------------------------------------------------
+# write_arrow_to_parquet: the columnar path used by model/insight jobs
+# ---------------------------------------------------------------------------
+
+
+def test_arrow_decimal_columns_cast_to_float64(tmp_path):
+    parquet_path = tmp_path / "out.parquet"
+    table = pa.table(
+        {
+            "v": pa.array([Decimal("0.714646"), Decimal("1.5")], type=pa.decimal128(10, 6)),
+            "name": ["a", "b"],
+        }
+    )
+    write_arrow_to_parquet(table, str(parquet_path))
+
+    df = pl.read_parquet(parquet_path)
+    assert df.schema["v"] == pl.Float64
+    assert df.schema["name"] == pl.String
+    assert df["v"].to_list()[0] == pytest.approx(0.714646)
+
+
+def test_arrow_null_heavy_column_keeps_source_type(tmp_path):
+    parquet_path = tmp_path / "out.parquet"
+    values = [None] * 200 + [datetime(2026, 4, 25, 12, 0, 0)]
+    table = pa.table({"event_time": pa.array(values, type=pa.timestamp("us"))})
+    write_arrow_to_parquet(table, str(parquet_path))
+
+    df = pl.read_parquet(parquet_path)
+    assert df.height == 201
+    assert df["event_time"][-1] == datetime(2026, 4, 25, 12, 0, 0)
+
+
+def test_arrow_empty_table_writes_empty_parquet(tmp_path):
+    parquet_path = tmp_path / "out.parquet"
+    write_arrow_to_parquet(pa.table({"a": pa.array([], type=pa.int64())}), str(parquet_path))
+
+    df = pl.read_parquet(parquet_path)
+    assert df.height == 0
+    assert df.columns == ["a"]
+
+
+# ---------------------------------------------------------------------------
+# write_arrow_batches_to_parquet: streaming, one row group per batch
+# ---------------------------------------------------------------------------
+
+
+def test_batches_written_as_row_groups(tmp_path):
+    parquet_path = tmp_path / "out.parquet"
+    batches = [pa.record_batch({"id": [1, 2]}), pa.record_batch({"id": [3]})]
+
+    write_arrow_batches_to_parquet(iter(batches), str(parquet_path))
+
+    assert pq.ParquetFile(parquet_path).num_row_groups == 2
+    assert pl.read_parquet(parquet_path)["id"].to_list() == [1, 2, 3]
+
+
+def test_batches_cast_to_first_batch_schema(tmp_path):
+    parquet_path = tmp_path / "out.parquet"
+    batches = [
+        pa.record_batch({"v": pa.array([None], type=pa.null()), "d": [Decimal("1.5")]}),
+        pa.record_batch({"v": ["x"], "d": [Decimal("2.25")]}),
+    ]
+
+    write_arrow_batches_to_parquet(iter(batches), str(parquet_path))
+
+    df = pl.read_parquet(parquet_path)
+    assert df.schema["v"] == pl.String
+    assert df.schema["d"] == pl.Float64
+    assert df["v"].to_list() == [None, "x"]
+
+
+def test_column_null_in_the_first_batch_takes_its_later_type(tmp_path):
+    parquet_path = tmp_path / "out.parquet"
+    batches = [
+        pa.record_batch({"id": [1, 2], "n": pa.array([None, None], type=pa.null())}),
+        pa.record_batch({"id": [3], "n": [7]}),
+        pa.record_batch({"id": [4], "n": [8.5]}),
+    ]
+
+    write_arrow_batches_to_parquet(iter(batches), str(parquet_path))
+
+    df = pl.read_parquet(parquet_path)
+    assert df.schema["n"] == pl.Float64
+    assert df["n"].to_list() == [None, None, 7.0, 8.5]
+    assert df["id"].to_list() == [1, 2, 3, 4]
+    assert pq.ParquetFile(parquet_path).num_row_groups == 3
+    assert not (tmp_path / "out.parquet.partial.previous").exists()
+
+
+def test_column_changing_to_an_incompatible_type_fails_loudly(tmp_path):
+    parquet_path = tmp_path / "out.parquet"
+    batches = [pa.record_batch({"v": [1]}), pa.record_batch({"v": ["not a number"]})]
+
+    with pytest.raises(ValueError, match="changed type"):
+        write_arrow_batches_to_parquet(iter(batches), str(parquet_path))
+
+    assert not parquet_path.exists()
+
+
+def test_failed_stream_keeps_previous_file(tmp_path):
+    parquet_path = tmp_path / "out.parquet"
+    write_arrow_to_parquet(pa.table({"id": [1]}), str(parquet_path))
+
+    def failing_batches():
+        yield pa.record_batch({"id": [2]})
+        raise RuntimeError("query failed")
+
+    with pytest.raises(RuntimeError):
+        write_arrow_batches_to_parquet(failing_batches(), str(parquet_path))
+
+    assert pl.read_parquet(parquet_path)["id"].to_list() == [1]
+    assert not (tmp_path / "out.parquet.partial").exists()
+
+
+# ---------------------------------------------------------------------------
+# Viewer layout: sort order, row groups, dictionary encoding, zstd level
+# ---------------------------------------------------------------------------
+
+
+def test_layout_sorts_by_known_columns_and_records_them(tmp_path):
+    from visivo.jobs.parquet_io import ROW_GROUP_ROWS
+
+    parquet_path = tmp_path / "out.parquet"
+    table = pa.table({"region": ["west", "east", "west", "east"], "v": [1, 2, 3, 4]})
+
+    layout = write_arrow_to_parquet(table, str(parquet_path), sort_by=["region", "missing"])
+
+    assert layout["sort_by"] == ["region"]
+    assert layout["row_group_rows"] == ROW_GROUP_ROWS
+    assert pl.read_parquet(parquet_path)["v"].to_list() == [2, 4, 1, 3]
+    sorting = pq.ParquetFile(parquet_path).metadata.row_group(0).sorting_columns
+    assert [column.column_index for column in sorting] == [0]
+
+
+def test_layout_splits_large_results_into_row_groups_with_statistics(tmp_path):
+    from visivo.jobs.parquet_io import ROW_GROUP_ROWS
+
+    parquet_path = tmp_path / "out.parquet"
+    rows = ROW_GROUP_ROWS * 2 + 10
+    table = pa.table({"k": list(range(rows))[::-1]})
+
+    write_arrow_to_parquet(table, str(parquet_path), sort_by=["k"])
+
+    metadata = pq.ParquetFile(parquet_path).metadata
+    assert metadata.num_row_groups == 3
+    first = metadata.row_group(0).column(0).statistics
+    assert (first.min, first.max) == (0, ROW_GROUP_ROWS - 1)
+
+
+def test_only_repeating_string_columns_are_dictionary_encoded(tmp_path):
+    parquet_path = tmp_path / "out.parquet"
+    data = [{"region": "east" if i % 2 else "west", "id": f"id-{i}", "n": i} for i in range(100)]
+
+    layout = write_dicts_to_parquet(data, str(parquet_path))
+
+    assert layout["dictionary_columns"] == ["region", "n"]
+    assert len(pl.read_parquet(parquet_path)) == 100
+
+
+def test_zstd_level_drops_as_results_grow():
+    from visivo.jobs.parquet_io import zstd_level
+
+    assert zstd_level(1024) > zstd_level(100 * 1024 * 1024) > zstd_level(1024**3)
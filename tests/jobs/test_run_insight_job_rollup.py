@@ -0,0 +1,118 @@
+"""Dynamic insights with ``rollup`` query a pre-aggregated parquet of their model."""
+
+import json
+import os
+
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from visivo.jobs.run_input_job import action as input_action
+from visivo.jobs.run_insight_job import action
+from visivo.models.inputs.types.single_select import SingleSelectInput
+from visivo.models.insight import Insight
+from visivo.models.interaction import InsightInteraction
+from visivo.models.models.sql_model import SqlModel
+from visivo.models.project import Project
+from visivo.models.props.insight_props import InsightProps
+from visivo.models.sources.duckdb_source import DuckdbSource
+
+
+def _project(y="?{ sum(${ref(orders).amount}) }", rollup=True):
+    source = DuckdbSource(name="test_source", database="test.duckdb", type="duckdb")
+    orders = SqlModel(name="orders", sql="SELECT * FROM orders", source="ref(test_source)")
+    region = SingleSelectInput(name="region_input", options=["east", "west"])
+    insight = Insight(
+        name="orders_by_month",
+        rollup=rollup,
+        props=InsightProps(type="bar", x="?{ ${ref(orders).month} }", y=y),
+        interactions=[
+            InsightInteraction(filter="?{ ${ref(orders).region} = ${ref(region_input).value} }"),
+            InsightInteraction(sort="?{ ${ref(orders).month} ASC }"),
+        ],
+    )
+    project = Project(
+        name="p",
+        sources=[source],
+        models=[orders],
+        inputs=[region],
+        insights=[insight],
+        dashboards=[],
+    )
+    return project, insight, orders
+
+
+def _write_model(output_dir, project, orders):
+    run_dir = os.path.join(output_dir, "main")
+    os.makedirs(os.path.join(run_dir, "schemas"))
+    os.makedirs(os.path.join(run_dir, "models"))
+    with open(os.path.join(run_dir, "schemas", "orders.json"), "w") as fp:
+        json.dump(
+            {orders.name_hash(): {"month": "VARCHAR", "region": "VARCHAR", "amount": "INTEGER"}}, fp
+        )
+    rows = 1000
+    table = pa.table(
+        {
+            "month": [f"2024-0{i % 4 + 1}" for i in range(rows)],
+            "region": ["east" if i % 3 else "west" for i in range(rows)],
+            "amount": list(range(rows)),
+        }
+    )
+    pq.write_table(table, os.path.join(run_dir, "models", "orders.parquet"))
+    for input_obj in project.inputs:
+        assert input_action(input_obj, project.dag(), output_dir).success
+
+
+def _run_viewer_query(output_dir, insight_data, region):
+    conn = duckdb.connect(":memory:")
+    for file in insight_data["files"]:
+        conn.execute(
+            f"CREATE VIEW \"{file['name_hash']}\" AS "
+            f"SELECT * FROM read_parquet('{file['signed_data_file_url']}')"
+        )
+    query = insight_data["query"].replace("${region_input.value}", region)
+    return conn.execute(query).fetchall()
+
+
+def _insight_data(output_dir, insight):
+    with open(os.path.join(output_dir, "main", "insights", f"{insight.name}.json")) as fp:
+        return json.load(fp)
+
+
+def test_rollup_answers_the_query_from_a_smaller_file(tmpdir):
+    output_dir = str(tmpdir)
+    project, insight, orders = _project()
+    _write_model(output_dir, project, orders)
+    plain_project, plain_insight, _ = _project(rollup=False)
+
+    assert action(plain_insight, plain_project.dag(), output_dir).success
+    plain = _insight_data(output_dir, plain_insight)
+    assert action(insight, project.dag(), output_dir).success
+    rolled = _insight_data(output_dir, insight)
+
+    assert [f["name_hash"] for f in plain["files"]] == [orders.name_hash()]
+    assert [f["name_hash"] for f in rolled["files"]] == [insight.name_hash()]
+    assert rolled["files"][0]["rollup_of"] == orders.name_hash()
+    assert pq.ParquetFile(rolled["files"][0]["signed_data_file_url"]).metadata.num_rows == 8
+    for region in ("east", "west"):
+        assert _run_viewer_query(output_dir, rolled, region) == _run_viewer_query(
+            output_dir, plain, region
+        )
+
+
+def test_non_decomposable_aggregate_queries_the_model(tmpdir):
+    output_dir = str(tmpdir)
+    project, insight, orders = _project(y="?{ avg(${ref(orders).amount}) }")
+    _write_model(output_dir, project, orders)
+    # A rollup left by an earlier run is removed rather than shipped unused
+    stale = os.path.join(output_dir, "main", "insights", f"{insight.name}.parquet")
+    os.makedirs(os.path.dirname(stale))
+    with open(stale, "wb") as fp:
+        fp.write(b"PAR1")
+
+    assert action(insight, project.dag(), output_dir).success
+
+    assert [f["name_hash"] for f in _insight_data(output_dir, insight)["files"]] == [
+        orders.name_hash()
+    ]
+    assert not os.path.exists(stale)
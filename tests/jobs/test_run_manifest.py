@@ -0,0 +1,133 @@
+import os
+
+import networkx
+
+from visivo.jobs.job import Job
+from visivo.jobs.run_manifest import RunManifest
+from visivo.jobs.run_sql_model_job import (
+    model_query_and_schema_action,
+    schema_only_action,
+)
+from visivo.models.sources.postgresql_source import PostgresqlSource
+from tests.factories.model_factories import DuckdbSourceFactory, SourceFactory, SqlModelFactory
+from tests.support.utils import temp_file, temp_folder
+
+
+def _dag(model, source):
+    dag = networkx.DiGraph()
+    dag.add_edge(model, source)
+    return dag
+
+
+def _write_outputs(output_dir, model, parquet=False):
+    os.makedirs(f"{output_dir}/main/schemas", exist_ok=True)
+    open(f"{output_dir}/main/schemas/{model.name}.json", "w").close()
+    if parquet:
+        os.makedirs(f"{output_dir}/main/models", exist_ok=True)
+        open(f"{output_dir}/main/models/{model.name}.parquet", "w").close()
+
+
+def _job(model, action=schema_only_action):
+    return Job(item=model, source=None, action=action, sql_model=model)
+
+
+def test_unchanged_after_record_and_reload():
+    output_dir = temp_folder()
+    source = SourceFactory()
+    model = SqlModelFactory(name="model", source="ref(source)")
+    _write_outputs(output_dir, model)
+
+    manifest = RunManifest(output_dir=output_dir, dag=_dag(model, source))
+    assert not manifest.is_unchanged(model, _job(model))
+    manifest.record(model, _job(model))
+    manifest.save()
+
+    reloaded = RunManifest(output_dir=output_dir, dag=_dag(model, source))
+    assert reloaded.is_unchanged(model, _job(model))
+
+
+def test_sql_change_is_detected():
+    output_dir = temp_folder()
+    source = SourceFactory()
+    model = SqlModelFactory(name="model", source="ref(source)")
+    _write_outputs(output_dir, model)
+    manifest = RunManifest(output_dir=output_dir, dag=_dag(model, source))
+    manifest.record(model, _job(model))
+    manifest.save()
+
+    changed = SqlModelFactory(name="model", source="ref(source)", sql="select 2 as x")
+    reloaded = RunManifest(output_dir=output_dir, dag=_dag(changed, source))
+    assert not reloaded.is_unchanged(changed, _job(changed))
+
+
+def test_upstream_source_change_is_detected():
+    output_dir = temp_folder()
+    model = SqlModelFactory(name="model", source="ref(source)")
+    _write_outputs(output_dir, model)
+    manifest = RunManifest(output_dir=output_dir, dag=_dag(model, SourceFactory()))
+    manifest.record(model, _job(model))
+    manifest.save()
+
+    moved = SourceFactory(database="tmp/other.sqlite")
+    reloaded = RunManifest(output_dir=output_dir, dag=_dag(model, moved))
+    assert not reloaded.is_unchanged(model, _job(model))
+
+
+def test_source_file_modification_is_detected():
+    output_dir = temp_folder()
+    working_dir = os.path.dirname(temp_file("data.sqlite", "a", output_dir=temp_folder()))
+    source = SourceFactory(database="data.sqlite")
+    model = SqlModelFactory(name="model", source="ref(source)")
+    _write_outputs(output_dir, model)
+    manifest = RunManifest(output_dir=output_dir, dag=_dag(model, source), working_dir=working_dir)
+    manifest.record(model, _job(model))
+    manifest.save()
+
+    with open(f"{working_dir}/data.sqlite", "w") as fp:
+        fp.write("ab")
+    reloaded = RunManifest(output_dir=output_dir, dag=_dag(model, source), working_dir=working_dir)
+    assert not reloaded.is_unchanged(model, _job(model))
+
+
+def test_missing_output_or_new_action_reruns():
+    output_dir = temp_folder()
+    source = SourceFactory()
+    model = SqlModelFactory(name="model", source="ref(source)")
+    _write_outputs(output_dir, model)
+    manifest = RunManifest(output_dir=output_dir, dag=_dag(model, source))
+    manifest.record(model, _job(model))
+
+    # Now needed as data: the parquet was never written
+    assert not manifest.is_unchanged(model, _job(model, model_query_and_schema_action))
+
+    os.remove(f"{output_dir}/main/schemas/{model.name}.json")
+    assert not manifest.is_unchanged(model, _job(model))
+
+
+def test_forget_drops_entry():
+    output_dir = temp_folder()
+    source = SourceFactory()
+    model = SqlModelFactory(name="model", source="ref(source)")
+    _write_outputs(output_dir, model)
+    manifest = RunManifest(output_dir=output_dir, dag=_dag(model, source))
+    manifest.record(model, _job(model))
+    manifest.forget(model)
+
+    assert not manifest.is_unchanged(model, _job(model))
+
+
+def test_jobs_on_sources_without_local_data_always_run():
+    output_dir = temp_folder()
+    model = SqlModelFactory(name="model", source="ref(source)")
+    _write_outputs(output_dir, model)
+    sources = [
+        PostgresqlSource(name="source", type="postgresql", database="db", username="u"),
+        DuckdbSourceFactory(name="source", database="md:analytics"),
+        SourceFactory(after_connect="ATTACH DATABASE 'other.sqlite' AS other"),
+    ]
+    for source in sources:
+        manifest = RunManifest(output_dir=output_dir, dag=_dag(model, source))
+        manifest.record(model, _job(model))
+
+        assert not manifest.tracks_data(model)
+        assert not manifest.is_unchanged(model, _job(model))
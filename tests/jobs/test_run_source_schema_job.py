@@ -249,3 +249,90 @@ class TestSchemaBuildOutcomes:
 
         assert result.success
         assert "WARNING" in result.message
+
+
+class TestIncrementalSchema:
+    """Introspection is skipped or narrowed when the stored schema is still good."""
+
+    @staticmethod
+    def _duckdb(tables):
+        source = seeded_source(name="incremental")
+        with source.connect(read_only=False) as connection:
+            for name in tables:
+                connection.execute(f"CREATE TABLE {name} (a INT)")
+        return source
+
+    def test_unchanged_database_file_reuses_the_stored_schema(self):
+        source = self._duckdb(["t1"])
+        output_dir = temp_folder()
+        assert action(source_to_build=source, output_dir=output_dir).success
+
+        result = action(source_to_build=source, output_dir=output_dir)
+
+        assert result.success
+        assert "Reused schema" in result.message
+        assert "1 tables" in result.message
+
+    def test_a_changed_database_file_is_introspected_again(self):
+        from visivo.query.schema_aggregator import SchemaAggregator
+
+        source = self._duckdb(["t1"])
+        output_dir = temp_folder()
+        action(source_to_build=source, output_dir=output_dir)
+        with source.connect(read_only=False) as connection:
+            connection.execute("CREATE TABLE t2 (b INT)")
+
+        result = action(source_to_build=source, output_dir=output_dir)
+
+        assert "Built schema" in result.message
+        stored = SchemaAggregator.load_source_schema("incremental", output_dir)
+        assert set(stored["tables"]) == {"t1", "t2"}
+
+    def test_ttl_skips_introspection_entirely(self, monkeypatch):
+        source = self._duckdb(["t1"])
+        source.schema_cache_ttl = 3600
+        output_dir = temp_folder()
+        action(source_to_build=source, output_dir=output_dir)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("introspected inside the TTL")
+
+        monkeypatch.setattr(DuckdbSource, "schema_fingerprint", fail)
+        monkeypatch.setattr(DuckdbSource, "get_schema", fail)
+        result = action(source_to_build=source, output_dir=output_dir)
+
+        assert "within schema_cache_ttl" in result.message
+
+    def test_only_changed_tables_are_described(self, monkeypatch):
+        from visivo.query.schema_aggregator import SchemaAggregator
+
+        source = self._duckdb(["t1", "t2", "t3"])
+        output_dir = temp_folder()
+        fingerprints = {"t1": "a", "t2": "a", "t3": "a"}
+        monkeypatch.setattr(DuckdbSource, "schema_fingerprint", lambda self: None)
+        monkeypatch.setattr(DuckdbSource, "table_fingerprints", lambda self: dict(fingerprints))
+        action(source_to_build=source, output_dir=output_dir)
+
+        described = []
+        real_get_schema = DuckdbSource.get_schema
+
+        def get_schema(self, table_names=None, max_workers=1):
+            described.append(table_names)
+            return real_get_schema(self, table_names=table_names, max_workers=max_workers)
+
+        monkeypatch.setattr(DuckdbSource, "get_schema", get_schema)
+        with source.connect(read_only=False) as connection:
+            connection.execute("ALTER TABLE t2 ADD COLUMN b INT")
+            connection.execute("DROP TABLE t3")
+        fingerprints.update({"t2": "b"})
+        del fingerprints["t3"]
+
+        result = action(source_to_build=source, output_dir=output_dir)
+
+        assert result.success, result.message
+        assert described == [["t2"]]
+        stored = SchemaAggregator.load_source_schema("incremental", output_dir)
+        assert set(stored["tables"]) == {"t1", "t2"}
+        assert set(stored["tables"]["t2"]["columns"]) == {"a", "b"}
+        assert set(stored["sqlglot_schema"]) == {"t1", "t2"}
+        assert stored["metadata"]["total_tables"] == 2
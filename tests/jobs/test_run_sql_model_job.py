@@ -152,3 +152,86 @@ class TestSqlModelSchemaArtifact:
         legacy = data[model_hash]
         assert set(legacy.keys()) == {"id", "name"}
         assert all(isinstance(v, str) for v in legacy.values())
+
+
+class TestSqlModelStreamingMaterialization:
+    """Verify defaults.max_batch_rows streams model data as parquet row groups."""
+
+    def test_max_batch_rows_writes_one_row_group_per_batch(self):
+        import pyarrow.parquet as pq
+        from visivo.jobs.run_sql_model_job import model_query_and_schema_action
+
+        output_dir = temp_folder()
+        source = SqliteSource(
+            name="source", database=os.path.join(output_dir, "stream.sqlite"), type="sqlite"
+        )
+        model = SqlModel(
+            name="numbers",
+            sql="SELECT 1 AS n UNION ALL SELECT 2 UNION ALL SELECT 3",
+            source=f"ref({source.name})",
+        )
+        project = Project(name="p", sources=[source], models=[model], dashboards=[])
+
+        result = model_query_and_schema_action(model, project.dag(), output_dir, max_batch_rows=2)
+
+        assert result.success, result.message
+        parquet_file = pq.ParquetFile(os.path.join(output_dir, "main", "models", "numbers.parquet"))
+        assert parquet_file.num_row_groups == 2
+        assert parquet_file.metadata.num_rows == 3
+
+    def test_max_batch_rows_only_passed_to_data_jobs(self):
+        from visivo.jobs.run_sql_model_job import job
+
+        source = SourceFactory()
+        model = SqlModel(name="data", sql="SELECT 1 as x", source=f"ref({source.name})")
+        project = Project(name="p", sources=[source], models=[model], dashboards=[])
+
+        sql_job = job(project.dag(), temp_folder(), model, max_batch_rows=1000)
+
+        assert "max_batch_rows" not in sql_job.kwargs
+
+
+class TestSqlModelParquetLayout:
+    def _sort_by(self, y="?{ sum(${ref(orders).amount}) }", tables=()):
+        from visivo.jobs.run_sql_model_job import job
+
+        source = SourceFactory()
+        model = SqlModel(name="orders", sql="SELECT 1 as x", source=f"ref({source.name})")
+        input_obj = SingleSelectInput(name="region_input", options=["east", "west"])
+        insight = Insight(
+            name="orders_insight",
+            props=InsightProps(type="bar", x="?{ ${ref(orders).month} }", y=y),
+            interactions=[
+                InsightInteraction(
+                    filter="?{ ${ref(orders).region} = ${ref(region_input).value} }"
+                ),
+                InsightInteraction(filter="?{ ${ref(orders).amount} > 0 }"),
+                InsightInteraction(split="?{ ${ref(orders).product} }"),
+            ],
+        )
+        project = Project(
+            name="test_project",
+            sources=[source],
+            models=[model],
+            inputs=[input_obj],
+            insights=[insight],
+            tables=list(tables),
+            dashboards=[],
+        )
+
+        return job(project.dag(), temp_folder(), model).kwargs.get("sort_by")
+
+    def test_data_job_sorts_by_fields_an_aggregating_insight_splits_and_filters_on(self):
+        # The split first, then the input filter; the plain filter is not sorted by
+        assert self._sort_by() == ["product", "region"]
+
+    def test_raw_insight_keeps_model_order_within_each_split(self):
+        # Drawn in the order stored: only the stable sort by its split is safe
+        assert self._sort_by(y="?{ ${ref(orders).amount} }") == ["product"]
+
+    def test_model_a_table_reads_is_not_sorted(self):
+        from visivo.models.table import Table
+
+        table = Table(name="orders_table", data="${ref(orders)}")
+
+        assert self._sort_by(tables=[table]) is None
@@ -9,6 +9,7 @@ Tests validate:
 """
 
 import tempfile
+import pyarrow as pa
 import pytest
 from tests.factories.model_factories import (
     SqlModelFactory,
@@ -77,7 +78,7 @@ class TestSingleSelectValidation:
 
         mocker.patch(
             "visivo.jobs.run_input_job.get_source_for_model",
-            return_value=mocker.Mock(read_sql=lambda q: [{"x": "option1"}]),
+            return_value=mocker.Mock(read_arrow=lambda q: pa.table({"x": ["option1"]})),
         )
 
         with tempfile.TemporaryDirectory() as output_dir:
@@ -174,7 +175,7 @@ class TestMultiSelectValidation:
 
         mocker.patch(
             "visivo.jobs.run_input_job.get_source_for_model",
-            return_value=mocker.Mock(read_sql=lambda q: [{"MIN(price)": 0}]),
+            return_value=mocker.Mock(read_arrow=lambda q: pa.table({"MIN(price)": [0]})),
         )
 
         with tempfile.TemporaryDirectory() as output_dir:
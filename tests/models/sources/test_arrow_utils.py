@@ -0,0 +1,77 @@
+from decimal import Decimal
+
+import pyarrow as pa
+
+from visivo.models.sources.arrow_utils import (
+    combine_record_batches,
+    iter_cursor_batches,
+    rows_to_record_batch,
+)
+
+
+def test_rows_to_record_batch_infers_types():
+    batch = rows_to_record_batch(["id", "amount", "name"], [(1, Decimal("1.50"), "a")])
+
+    assert batch.schema.field("id").type == pa.int64()
+    assert pa.types.is_decimal(batch.schema.field("amount").type)
+    assert batch.schema.field("name").type == pa.string()
+
+
+def test_rows_to_record_batch_serializes_complex_values_as_json():
+    batch = rows_to_record_batch(["payload"], [({"a": 1},), ([1, 2],)])
+
+    assert batch.column(0).to_pylist() == ['{"a": 1}', "[1, 2]"]
+
+
+def test_rows_to_record_batch_stringifies_mixed_columns():
+    batch = rows_to_record_batch(["v"], [(1,), ("two",), (None,)])
+
+    assert batch.column(0).to_pylist() == ["1", "two", None]
+
+
+def test_rows_to_record_batch_keeps_last_duplicate_column():
+    batch = rows_to_record_batch(["a", "b", "a"], [(1, 2, 3)])
+
+    assert batch.schema.names == ["a", "b"]
+    assert batch.column(0).to_pylist() == [3]
+
+
+def test_combine_record_batches_promotes_all_null_batches():
+    batches = [
+        rows_to_record_batch(["v"], [(None,), (None,)]),
+        rows_to_record_batch(["v"], [("x",)]),
+    ]
+
+    table = combine_record_batches(batches)
+
+    assert table.schema.field("v").type == pa.string()
+    assert table.column("v").to_pylist() == [None, None, "x"]
+
+
+def test_combine_record_batches_stringifies_conflicting_batches():
+    batches = [rows_to_record_batch(["v"], [(1,)]), rows_to_record_batch(["v"], [("x",)])]
+
+    table = combine_record_batches(batches)
+
+    assert table.column("v").to_pylist() == ["1", "x"]
+
+
+def test_iter_cursor_batches_splits_on_batch_rows():
+    rows = [(i,) for i in range(5)]
+
+    def fetchmany(size):
+        taken = rows[:size]
+        del rows[:size]
+        return taken
+
+    batches = list(iter_cursor_batches(fetchmany, ["v"], batch_rows=2))
+
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+
+
+def test_iter_cursor_batches_without_rows_keeps_columns():
+    batches = list(iter_cursor_batches(lambda size: [], ["a", "b"]))
+    table = combine_record_batches(batches)
+
+    assert table.num_rows == 0
+    assert table.column_names == ["a", "b"]
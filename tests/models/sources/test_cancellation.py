@@ -0,0 +1,84 @@
+import threading
+import time
+
+import click
+import duckdb
+import pytest
+
+from visivo.models.sources.cancellation import (
+    CancellationToken,
+    QueryCancelled,
+    cancellation_scope,
+    current_token,
+    interruptible,
+)
+from visivo.models.sources.duckdb_source import DuckdbSource
+from visivo.models.sources.sqlite_source import SqliteSource
+
+# Runs for minutes unless interrupted
+SLOW_DUCKDB_QUERY = "SELECT count(*) AS n FROM range(100000000000) a"
+SLOW_SQLITE_QUERY = """
+    WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c)
+    SELECT count(*) AS n FROM (SELECT x FROM c LIMIT 100000000000)
+"""
+
+
+def _cancel_soon(token, delay=0.3):
+    timer = threading.Timer(delay, token.cancel)
+    timer.start()
+    return timer
+
+
+def test_interruptible_does_nothing_outside_a_scope():
+    calls = []
+    with interruptible(lambda: calls.append(1)):
+        pass
+    assert current_token() is None
+    assert calls == []
+
+
+def test_cancel_calls_the_registered_interrupt_once():
+    token = CancellationToken()
+    calls = []
+    with cancellation_scope(token):
+        with interruptible(lambda: calls.append(1)):
+            assert token.cancel("stop") is True
+            assert token.cancel("again") is False
+    assert calls == [1]
+    assert token.reason == "stop"
+
+
+def test_a_query_does_not_start_after_cancel():
+    token = CancellationToken()
+    token.cancel()
+    with cancellation_scope(token):
+        with pytest.raises(QueryCancelled):
+            with interruptible(None):
+                pass
+
+
+def test_cancel_interrupts_a_running_duckdb_query(tmpdir):
+    duckdb.connect(f"{tmpdir}/db.duckdb").close()
+    source = DuckdbSource(name="db", database=f"{tmpdir}/db.duckdb", type="duckdb")
+    token = CancellationToken()
+    timer = _cancel_soon(token)
+
+    start = time.time()
+    with cancellation_scope(token), pytest.raises(click.ClickException, match="INTERRUPT"):
+        source.read_sql(SLOW_DUCKDB_QUERY)
+    timer.cancel()
+
+    assert time.time() - start < 10
+
+
+def test_cancel_interrupts_a_running_sqlite_query(tmpdir):
+    source = SqliteSource(name="db", database=f"{tmpdir}/db.sqlite", type="sqlite")
+    token = CancellationToken()
+    timer = _cancel_soon(token)
+
+    start = time.time()
+    with cancellation_scope(token), pytest.raises(Exception, match="interrupt"):
+        source.read_sql(SLOW_SQLITE_QUERY)
+    timer.cancel()
+
+    assert time.time() - start < 10
@@ -262,3 +262,102 @@ class TestDuckDBConnectionManagement:
         finally:
             if os.path.exists(db_path):
                 os.unlink(db_path)
+
+
+class TestDuckDBConnectionCache:
+    """A run shares one set-up connection per source across threads."""
+
+    def _database(self, tmp_path, name="cache.duckdb", rows=3):
+        db_path = str(tmp_path / name)
+        DuckdbSource.create_empty_database(db_path)
+        source = DuckdbSource(name=name.split(".")[0], database=db_path, type="duckdb")
+        with source.connect(read_only=False) as conn:
+            conn.execute(f"CREATE TABLE test_table AS SELECT range AS id FROM range({rows})")
+        return source
+
+    def test_setup_runs_once_for_many_threads(self, tmp_path):
+        from unittest.mock import patch
+        from visivo.models.sources.base_duckdb_source import duckdb_connection_cache
+
+        source = self._database(tmp_path)
+        results = []
+        with duckdb_connection_cache([source]):
+            with patch.object(
+                DuckdbSource, "get_connection", wraps=source.get_connection
+            ) as get_connection:
+                threads = [
+                    threading.Thread(
+                        target=lambda: results.append(
+                            source.read_sql("SELECT count(*) AS n FROM test_table")
+                        )
+                    )
+                    for _ in range(8)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                assert get_connection.call_count == 1
+
+        assert results == [[{"n": 3}]] * 8
+        assert source._connection_cache is None
+
+    def test_cursors_see_attachments(self, tmp_path):
+        from visivo.models.sources.base_duckdb_source import duckdb_connection_cache
+
+        other = self._database(tmp_path, name="other.duckdb", rows=5)
+        source = DuckdbSource(
+            name="main",
+            database=self._database(tmp_path).database,
+            type="duckdb",
+            attach=[{"schema_name": "other", "source": other}],
+        )
+        with duckdb_connection_cache([source]):
+            first = source.read_sql("SELECT count(*) AS n FROM other.test_table")
+            second = source.read_sql("SELECT count(*) AS n FROM other.test_table")
+
+        assert first == second == [{"n": 5}]
+
+    def test_write_reopens_cached_connection(self, tmp_path):
+        import polars as pl
+        from visivo.models.sources.base_duckdb_source import duckdb_connection_cache
+
+        source = self._database(tmp_path)
+        with duckdb_connection_cache([source]):
+            assert source.read_sql("SELECT count(*) AS n FROM test_table") == [{"n": 3}]
+            source.write_dataframe("seeded", pl.DataFrame({"x": [1, 2]}))
+            assert source.read_sql("SELECT count(*) AS n FROM seeded") == [{"n": 2}]
+
+    def test_write_waits_for_open_cursors(self, tmp_path):
+        import polars as pl
+        from visivo.models.sources.base_duckdb_source import duckdb_connection_cache
+
+        source = self._database(tmp_path)
+        with duckdb_connection_cache([source]):
+            with source.connect(read_only=True) as cursor:
+                writer = threading.Thread(
+                    target=source.write_dataframe, args=("seeded", pl.DataFrame({"x": [1, 2]}))
+                )
+                writer.start()
+                writer.join(timeout=0.2)
+                assert writer.is_alive()
+                assert cursor.execute("SELECT count(*) FROM test_table").fetchone() == (3,)
+            writer.join(timeout=5)
+            assert not writer.is_alive()
+            assert source.read_sql("SELECT count(*) AS n FROM seeded") == [{"n": 2}]
+
+    def test_csv_is_materialized_once(self, tmp_path):
+        from visivo.models.sources.base_duckdb_source import duckdb_connection_cache
+        from visivo.models.sources.csv_source import CSVFileSource
+
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_text("x,y\n1,2\n3,4\n")
+        source = CSVFileSource(name="data", file=str(csv_path), type="csv")
+
+        with duckdb_connection_cache([source]):
+            assert source.read_sql("SELECT sum(x) AS total FROM data") == [{"total": 4}]
+            # Served from the in-memory table, not the file
+            csv_path.write_text("x,y\n100,2\n")
+            assert source.read_sql("SELECT sum(x) AS total FROM data") == [{"total": 4}]
+
+        assert source.read_sql("SELECT sum(x) AS total FROM data") == [{"total": 100}]
@@ -17,3 +17,50 @@ def test_DuckdbSource_missing_data():
 
     assert error["msg"] == "Field required"
     assert error["type"] == "missing"
+
+
+def test_DuckdbSource_read_arrow(tmp_path):
+    database = str(tmp_path / "arrow.duckdb")
+    DuckdbSource.create_empty_database(database)
+    source = DuckdbSource(name="source", database=database, type="duckdb")
+
+    table = source.read_arrow("select 1 as id, 2.50::decimal(10, 2) as amount")
+
+    assert table.column_names == ["id", "amount"]
+    assert table.num_rows == 1
+
+
+def test_DuckdbSource_iter_arrow_batches_keeps_schema_when_empty(tmp_path):
+    database = str(tmp_path / "arrow.duckdb")
+    DuckdbSource.create_empty_database(database)
+    source = DuckdbSource(name="source", database=database, type="duckdb")
+
+    batches = list(source.iter_arrow_batches("select 1 as id where false", batch_rows=10))
+
+    assert len(batches) == 1
+    assert batches[0].num_rows == 0
+    assert batches[0].schema.names == ["id"]
+
+
+def test_DuckdbSource_get_schema_reads_all_columns_in_one_query(tmp_path, monkeypatch):
+    import duckdb
+
+    database = str(tmp_path / "schema.duckdb")
+    with duckdb.connect(database) as conn:
+        conn.execute("create table orders (id integer not null, total decimal(10, 2))")
+        conn.execute("create table customers (id integer, name varchar)")
+        conn.execute("create view big_orders as select id from orders where total > 100")
+    source = DuckdbSource(name="source", database=database, type="duckdb")
+
+    def no_describe(*args, **kwargs):
+        raise AssertionError("tables should not be described one at a time")
+
+    monkeypatch.setattr(DuckdbSource, "_extract_table_schema_from_duckdb", no_describe)
+    schema = source.get_schema()
+
+    assert sorted(schema["tables"]) == ["big_orders", "customers", "orders"]
+    orders = schema["tables"]["orders"]["columns"]
+    assert list(orders) == ["id", "total"]
+    assert orders["id"]["nullable"] is False
+    assert orders["total"]["type"] == "DECIMAL(10,2)"
+    assert schema["metadata"]["total_columns"] == 5
@@ -150,7 +150,7 @@ def test_falls_back_to_generic_reflection_and_says_so(source, monkeypatch):
     monkeypatch.setattr(
         SqlalchemySource,
         "_columns_by_table",
-        lambda self, inspector, schema, errors: {"from_generic": []},
+        lambda self, inspector, schema, errors, max_workers=1: {"from_generic": []},
     )
     connection = _Connection([], raises=PermissionError("permission denied for pg_class"))
     errors = []
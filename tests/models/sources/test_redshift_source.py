@@ -246,3 +246,29 @@ def test_get_connection_ssl_disabled_passes_ssl_false(mock_redshift_connector):
     call_kwargs = mock_redshift_connector.connect.call_args[1]
     assert call_kwargs["ssl"] is False
     assert "sslmode" not in call_kwargs
+
+
+def test_get_schema_reads_all_columns_in_one_query(mock_redshift_connector):
+    cursor = mock_redshift_connector.connect.return_value.cursor.return_value
+    cursor.fetchall.return_value = [
+        ("analytics", "customers", "id", "integer", "NO"),
+        ("analytics", "orders", "id", "integer", "NO"),
+        ("analytics", "orders", "total", "numeric", "YES"),
+    ]
+    source = RedshiftSource(
+        name="test",
+        database="dev",
+        type="redshift",
+        host="localhost",
+        username="user",
+        password="pass",
+        db_schema="analytics",
+    )
+
+    schema = source.get_schema()
+
+    assert cursor.execute.call_count == 1
+    assert cursor.execute.call_args[0][1] == ("analytics",)
+    assert sorted(schema["tables"]) == ["customers", "orders"]
+    assert schema["tables"]["orders"]["columns"]["total"]["nullable"] is True
+    assert schema["metadata"]["total_columns"] == 3
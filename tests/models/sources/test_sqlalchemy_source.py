@@ -23,3 +23,23 @@ def test_SqlAlchemySource_get_engine():
     source = MockSqlAlchemySource(**data)
     engine = source.get_engine()
     assert engine is not None
+
+
+def test_SqlAlchemySource_pools_connections():
+    source = MockSqlAlchemySource(
+        name="source", database="database", type="mock", max_overflow=2, pool_recycle=300
+    )
+    engine = source.get_engine()
+    assert engine.pool.__class__.__name__ == "QueuePool"
+    assert engine.pool._max_overflow == 2
+    assert engine.pool._recycle == 300
+
+
+def test_SqlAlchemySource_pool_size_zero_disables_pooling():
+    from sqlalchemy.pool import NullPool
+
+    class PooledMockSource(MockSqlAlchemySource):
+        connection_pool_size: int = 0
+
+    source = PooledMockSource(name="source", database="database", type="mock")
+    assert source.pool_options() == {"poolclass": NullPool}
@@ -124,7 +124,7 @@ class TestGetSchema:
 
     def test_returns_minimal_schema_on_error(self, sqlite_db, mocker):
         mocker.patch(
-            "visivo.models.sources.sqlalchemy_source.inspect",
+            "sqlalchemy.inspect",
             side_effect=RuntimeError("inspector unavailable"),
         )
         schema = sqlite_db.get_schema()
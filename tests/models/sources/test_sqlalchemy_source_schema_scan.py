@@ -260,3 +260,106 @@ def test_schema_listing_failure_falls_back_and_says_so(sqlite_source, monkeypatc
 
     assert sorted(result["tables"]) == ["orders", "users"]
     assert any("could not list schemas" in e for e in result["metadata"]["errors"])
+
+
+@pytest.fixture
+def multi_schema_source(tmp_path):
+    """Three SQLite schemas: ``main`` plus two attached databases."""
+    paths = {}
+    for name, table in [("main", "orders"), ("sales", "deals"), ("ops", "tickets")]:
+        paths[name] = str(tmp_path / f"{name}.db")
+        con = sqlite3.connect(paths[name])
+        con.execute(f"CREATE TABLE {table} (id INTEGER, note TEXT)")
+        con.commit()
+        con.close()
+    return SqliteSource(
+        name="scan",
+        type="sqlite",
+        database=paths["main"],
+        attach=[
+            {
+                "schema_name": name,
+                "source": {"name": name, "type": "sqlite", "database": paths[name]},
+            }
+            for name in ["sales", "ops"]
+        ],
+    )
+
+
+def test_schemas_reflected_in_parallel_match_serial(multi_schema_source, monkeypatch):
+    import threading
+
+    from sqlalchemy.engine.reflection import Inspector
+
+    serial = multi_schema_source.get_schema()
+
+    # Every schema's reflection must be in flight at once to pass the barrier.
+    real = Inspector.get_multi_columns
+    barrier = threading.Barrier(3, timeout=5)
+
+    def together(self, **kwargs):
+        barrier.wait()
+        return real(self, **kwargs)
+
+    monkeypatch.setattr(Inspector, "get_multi_columns", together)
+    parallel = multi_schema_source.get_schema(max_workers=3)
+
+    assert (
+        sorted(parallel["tables"])
+        == sorted(serial["tables"])
+        == [
+            "ops.tickets",
+            "orders",
+            "sales.deals",
+        ]
+    )
+    assert parallel["metadata"]["scanned_schemas"] == serial["metadata"]["scanned_schemas"]
+    assert parallel["metadata"]["errors"] == []
+
+
+def test_per_table_fallback_reflects_tables_in_parallel(sqlite_source, monkeypatch):
+    import threading
+
+    from sqlalchemy.engine.reflection import Inspector
+
+    def deny(self, *args, **kwargs):
+        raise PermissionError("permission denied for table pg_collation")
+
+    real = Inspector.get_columns
+    threads = set()
+
+    def recording(self, *args, **kwargs):
+        threads.add(threading.get_ident())
+        return real(self, *args, **kwargs)
+
+    monkeypatch.setattr(Inspector, "get_multi_columns", deny)
+    monkeypatch.setattr(Inspector, "get_columns", recording)
+
+    result = sqlite_source.get_schema(max_workers=2)
+
+    assert sorted(result["tables"]) == ["orders", "users"]
+    assert threading.get_ident() not in threads
+
+
+def test_parallel_reflection_sees_the_cancellation_token(multi_schema_source, monkeypatch):
+    from sqlalchemy.engine.reflection import Inspector
+
+    from visivo.models.sources.cancellation import (
+        CancellationToken,
+        cancellation_scope,
+        current_token,
+    )
+
+    real = Inspector.get_multi_columns
+    tokens = []
+
+    def recording(self, **kwargs):
+        tokens.append(current_token())
+        return real(self, **kwargs)
+
+    monkeypatch.setattr(Inspector, "get_multi_columns", recording)
+    token = CancellationToken()
+    with cancellation_scope(token):
+        multi_schema_source.get_schema(max_workers=3)
+
+    assert tokens == [token, token, token]
@@ -24,3 +24,75 @@ def test_Source_password_json():
     source = SourceFactory(password="password")
 
     assert "**********" in source.model_dump_json()
+
+
+def test_SqliteSource_read_arrow(tmp_path):
+    source = SqliteSource(name="source", database=str(tmp_path / "arrow.sqlite"), type="sqlite")
+
+    table = source.read_arrow("select 1 as id, 'a' as name union all select 2, null")
+
+    assert table.column_names == ["id", "name"]
+    assert table.column("id").to_pylist() == [1, 2]
+    assert table.column("name").to_pylist() == ["a", None]
+
+
+def test_SqliteSource_iter_arrow_batches(tmp_path):
+    source = SqliteSource(name="source", database=str(tmp_path / "arrow.sqlite"), type="sqlite")
+
+    batches = list(
+        source.iter_arrow_batches(
+            "select 1 as id union all select 2 union all select 3", batch_rows=2
+        )
+    )
+
+    assert [batch.num_rows for batch in batches] == [2, 1]
+
+
+def test_SqliteSource_attach_survives_pooled_connection_reuse(tmp_path):
+    import sqlite3
+
+    static_path = str(tmp_path / "static.sqlite")
+    with sqlite3.connect(static_path) as conn:
+        conn.execute("create table data (x integer)")
+        conn.execute("insert into data values (1)")
+    source = SqliteSource(
+        name="source",
+        database=str(tmp_path / "local.sqlite"),
+        type="sqlite",
+        attach=[
+            {
+                "schema_name": "static",
+                "source": {"name": "static_source", "database": static_path, "type": "sqlite"},
+            }
+        ],
+    )
+
+    # The second query checks out the same pooled connection, already attached
+    assert source.read_sql("select x from static.data") == [{"x": 1}]
+    assert source.read_sql("select x from static.data") == [{"x": 1}]
+
+
+def test_SqliteSource_introspect_includes_foreign_keys(tmp_path):
+    import sqlite3
+    from sqlalchemy import inspect
+
+    database = str(tmp_path / "fks.sqlite")
+    with sqlite3.connect(database) as conn:
+        conn.execute("create table customers (id integer primary key)")
+        conn.execute(
+            "create table orders (id integer, customer_id integer references customers(id))"
+        )
+    source = SqliteSource(name="source", database=database, type="sqlite")
+
+    db_entry = source._introspect_database(inspect(source.get_engine()), "main")
+
+    tables = {t["name"]: t for s in db_entry["schemas"] for t in s["tables"]}
+    assert tables["orders"]["columns"] == ["id", "customer_id"]
+    assert tables["orders"]["foreign_keys"] == [
+        {
+            "columns": ["customer_id"],
+            "references_schema": "main",
+            "references_table": "customers",
+            "references_columns": ["id"],
+        }
+    ]
@@ -222,6 +222,74 @@ def test_get_diff_dag_filter():
     assert diff_filter == "dashboard+,row+,item+,chart+,insight+"
 
 
+def test_diff_returns_changed_names_and_their_descendants():
+    existing_project = ProjectFactory()
+    new_project = ProjectFactory()
+    existing_filter = f"+{existing_project.dashboards[0].name}+"
+    new_project.dashboards[0].rows[0].items[0].chart.insights[0].props.x = "?{updated_field}"
+
+    diff = new_project.dag().diff(existing_project, existing_filter)
+
+    assert diff.changed == ["dashboard", "row", "item", "chart", "insight"]
+    assert new_project.dag().get_node_by_name("chart") in diff.nodes
+    assert new_project.dag().get_node_by_name("insight") in diff.nodes
+    assert new_project.dag().get_node_by_name("source") not in diff.nodes
+    assert new_project not in diff.nodes
+    assert diff.dag_filter == "dashboard+,row+,item+,chart+,insight+"
+
+
+def test_diff_includes_insights_that_read_a_changed_model():
+    def project_with_model(sql):
+        return ProjectFactory(
+            models=[SqlModelFactory(name="model", sql=sql)],
+            insights=[InsightFactory(name="model_insight", model="ref(model)")],
+        )
+
+    existing_project = project_with_model("select * from test_table")
+    new_project = project_with_model("select * from other_table")
+
+    diff = new_project.dag().diff(existing_project, "+model_insight+")
+
+    assert diff.changed == ["model"]
+    assert new_project.dag().get_node_by_name("model") in diff.nodes
+    assert new_project.dag().get_node_by_name("model_insight") in diff.nodes
+    assert new_project.dag().get_node_by_name("source") not in diff.nodes
+    assert new_project not in diff.nodes
+
+
+def test_diff_compares_hashes_stamped_at_parse_time():
+    existing_project = ProjectFactory()
+    new_project = ProjectFactory()
+    existing_filter = f"+{existing_project.dashboards[0].name}+"
+    existing_project.dag().stamp_content_hashes()
+    new_dag = new_project.dag()
+    new_dag.stamp_content_hashes()
+
+    # Not re-stamped, so the stamp still reflects the parsed config
+    new_project.dashboards[0].rows[0].items[0].chart.insights[0].props.x = "?{updated_field}"
+    assert new_dag.diff(existing_project, existing_filter).changed == []
+
+    new_dag.stamp_content_hashes()
+    assert "insight" in new_dag.diff(existing_project, existing_filter).changed
+
+
+def test_linking_an_edge_updates_descendants_and_keeps_names():
+    project = ProjectFactory()
+    dag = project.dag()
+    chart = dag.get_node_by_name("chart")
+    source = dag.get_node_by_name("source")
+    assert source not in dag.ordered_descendants(chart)
+
+    dag.add_edge(chart, source)
+
+    assert source in dag.ordered_descendants(chart)
+    assert dag.get_node_by_name("source") is source
+
+    other_source = SourceFactory(name="other_source")
+    dag.add_edge(chart, other_source)
+    assert dag.get_node_by_name("other_source") is other_source
+
+
 def test_get_descendant_by_name_single_node():
     """Test getting a single descendant by name."""
     project = ProjectFactory()
@@ -261,3 +329,50 @@ def test_get_descendant_by_name_not_found_from_node():
         dag.get_descendant_by_name("dashboard", from_node=insight)
 
     assert "No descendant found with name 'dashboard'" in str(exc_info.value)
+
+
+def test_descendants_of_type_matches_full_traversal():
+    from networkx.algorithms.traversal.depth_first_search import dfs_tree
+
+    project = ProjectFactory()
+    dag = project.dag()
+    dashboard = project.dashboards[0]
+
+    expected = [node for node in dfs_tree(dag, dashboard) if isinstance(node, Model)]
+    assert list(dag.descendants_of_type(Model, from_node=dashboard)) == expected
+    assert dag.descendants_of_type(Model, from_node=dashboard) is dag.descendants_of_type(
+        Model, from_node=dashboard
+    )
+
+
+def test_lookup_index_is_reset_when_the_dag_changes():
+    project = ProjectFactory()
+    dag = project.dag().copy()
+    source = project.sources[0]
+    assert dag.get_node_by_name(source.name) == source
+
+    other = SourceFactory(name="other_source")
+    dag.add_node(other)
+
+    assert dag.get_node_by_name("other_source") == other
+    assert other in dag.descendants_of_type(Source)
+
+    dag.remove_node(other)
+
+    assert dag.nodes_with_name("other_source") == ()
+    assert other not in dag.descendants_of_type(Source)
+
+
+def test_models_needing_data_includes_models_tables_read():
+    model = SqlModelFactory(name="table_model")
+    table = Table(name="table_name", data=f"${{ref({model.name})}}")
+    project = Project(
+        name="project",
+        sources=[SourceFactory()],
+        models=[model, SqlModelFactory(name="unused_model")],
+        tables=[table],
+        dashboards=[],
+    )
+    dag = project.dag()
+
+    assert dag.models_needing_data() == {model}
@@ -150,3 +150,14 @@ def test_Core_Parser_omitting_default_source_preserves_yaml_defaults():
     core_parser = CoreParser(project_file=tmp, files=[tmp])
     project = core_parser.parse()
     assert project.defaults.source_name == "local-duckdb"
+
+
+def test_Core_Parser_uses_yaml_loaded_during_discovery_once():
+    tmp = temp_yml_file({"name": "on disk"}, name=PROJECT_FILE_NAME)
+
+    core_parser = CoreParser(
+        project_file=tmp, files=[tmp], loaded_files={str(tmp): {"name": "from discovery"}}
+    )
+
+    assert core_parser.parse().name == "from discovery"
+    assert core_parser.parse().name == "on disk"
@@ -0,0 +1,74 @@
+import os
+
+from tests.support.utils import temp_file, temp_folder
+from visivo.discovery.discover import Discover
+from visivo.parsers.parsed_files import ParsedFiles
+
+
+def _bump(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_an_unchanged_file_is_parsed_once():
+    folder = temp_folder()
+    path = temp_file("models.yml", "models:\n  - name: a\n", folder)
+    parsed_files = ParsedFiles()
+
+    first = parsed_files.load(path)
+    first["models"].append({"name": "merged"})
+    second = parsed_files.load(path)
+
+    assert parsed_files.reads == 1
+    assert second["models"] == [{"name": "a"}]
+
+
+def test_a_changed_file_is_parsed_again():
+    folder = temp_folder()
+    path = temp_file("models.yml", "models:\n  - name: a\n", folder)
+    parsed_files = ParsedFiles()
+    parsed_files.load(path)
+
+    with open(path, "w") as fp:
+        fp.write("models:\n  - name: b\n")
+    _bump(path)
+
+    assert parsed_files.load(path)["models"] == [{"name": "b"}]
+    assert parsed_files.reads == 2
+
+
+def test_invalidated_paths_are_parsed_again():
+    folder = temp_folder()
+    path = temp_file("models.yml", "models:\n  - name: a\n", folder)
+    parsed_files = ParsedFiles()
+    parsed_files.load(path)
+
+    parsed_files.invalidate([path])
+    parsed_files.load(path)
+
+    assert parsed_files.reads == 2
+
+
+def test_discovery_only_parses_the_changed_include():
+    folder = temp_folder()
+    project_file = temp_file(
+        "project.visivo.yml", "name: project\nincludes:\n  - path: objects\n", folder
+    )
+    os.makedirs(f"{folder}/objects")
+    changed = temp_file("a.yml", "models:\n  - name: a\n", f"{folder}/objects")
+    temp_file("b.yml", "models:\n  - name: b\n", f"{folder}/objects")
+    parsed_files = ParsedFiles()
+    discover = Discover(
+        working_dir=folder, output_dir=folder, home_dir=folder, parsed_files=parsed_files
+    )
+    discover.files
+    assert parsed_files.reads == 3
+
+    with open(changed, "w") as fp:
+        fp.write("models:\n  - name: renamed\n")
+    parsed_files.invalidate([changed])
+    discover.files
+
+    assert parsed_files.reads == 4
+    assert discover.loaded_files[str(changed)]["models"][0]["name"] == "renamed"
+    assert str(project_file) in discover.loaded_files
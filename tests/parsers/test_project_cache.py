@@ -0,0 +1,73 @@
+import os
+
+from tests.factories.model_factories import ProjectFactory
+from tests.support.utils import temp_file, temp_folder
+from visivo.parsers.project_cache import ProjectCache
+
+
+def _bump(path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def _cached():
+    output_dir = temp_folder()
+    project_file = temp_file(
+        "project.visivo.yml", "name: project\nhost: ${env.CACHE_TEST_HOST}\n", output_dir
+    )
+    include_dir = f"{output_dir}/models"
+    os.makedirs(include_dir)
+    project = ProjectFactory()
+    cache = ProjectCache(output_dir)
+    cache.save(project, files=[project_file], watched=[include_dir])
+    return cache, project, project_file, include_dir
+
+
+def test_unchanged_project_is_loaded_from_the_cache():
+    cache, project, _, _ = _cached()
+
+    loaded = cache.load()
+
+    assert loaded is not project
+    assert loaded.model_dump_json() == project.model_dump_json()
+    assert loaded.dag().number_of_nodes() == project.dag().number_of_nodes()
+
+
+def test_a_changed_file_misses():
+    cache, _, project_file, _ = _cached()
+
+    _bump(project_file)
+
+    assert cache.load() is None
+
+
+def test_a_file_added_to_an_included_directory_misses():
+    cache, _, _, include_dir = _cached()
+
+    temp_file("new.visivo.yml", "models: []\n", include_dir)
+
+    assert cache.load() is None
+
+
+def test_a_changed_env_var_misses(monkeypatch):
+    monkeypatch.setenv("CACHE_TEST_HOST", "before")
+    cache, _, _, _ = _cached()
+    assert cache.load() is not None
+
+    monkeypatch.setenv("CACHE_TEST_HOST", "after")
+
+    assert cache.load() is None
+
+
+def test_a_different_default_source_misses():
+    cache, _, _, _ = _cached()
+
+    assert cache.load(default_source="other") is None
+
+
+def test_an_unreadable_cache_misses():
+    cache, _, _, _ = _cached()
+    with open(cache.path, "wb") as fp:
+        fp.write(b"not a pickle")
+
+    assert cache.load() is None
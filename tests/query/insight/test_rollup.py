@@ -0,0 +1,62 @@
+from visivo.query.insight.rollup import plan_rollup
+
+QUERY = """SELECT
+  "m"."month" AS "x",
+  sum("m"."amount") AS "y",
+  count(*) AS "n"
+FROM "m"
+WHERE
+  "m"."region" IN (${region.values}) AND "m"."note" LIKE '%${search.value}%'
+GROUP BY
+  "m"."month"
+HAVING
+  max("m"."amount") > ${threshold.value}
+ORDER BY
+  "x" ASC"""
+
+
+def test_rollup_groups_by_every_column_read_outside_an_aggregate():
+    plan = plan_rollup(QUERY, "m", "r")
+
+    assert plan.rollup_sql == (
+        'SELECT "month", "region", "note", SUM("amount") AS "__visivo_sum_amount", '
+        'COUNT(*) AS "__visivo_count", MAX("amount") AS "__visivo_max_amount" '
+        'FROM "m" GROUP BY "month", "region", "note"'
+    )
+
+
+def test_query_reaggregates_the_partials_and_keeps_placeholders():
+    query = plan_rollup(QUERY, "m", "r").query
+
+    assert 'FROM "r" AS "m"' in query
+    assert 'SUM("m"."__visivo_sum_amount") AS "y"' in query
+    assert 'CAST(SUM("m"."__visivo_count") AS BIGINT) AS "n"' in query
+    assert 'MAX("m"."__visivo_max_amount") > ${threshold.value}' in query
+    assert "IN (${region.values})" in query
+    assert "LIKE '%${search.value}%'" in query
+
+
+def test_dimension_aliased_to_its_own_name_is_grouped_by():
+    plan = plan_rollup('SELECT x AS x, SUM(y) AS s FROM "m" GROUP BY x ORDER BY s', "m", "r")
+
+    assert plan.rollup_sql == ('SELECT "x", SUM("y") AS "__visivo_sum_y" FROM "m" GROUP BY "x"')
+    assert 'SUM("m"."__visivo_sum_y") AS s' in plan.query
+
+
+def test_alias_of_an_expression_is_not_a_dimension():
+    plan = plan_rollup(
+        'SELECT UPPER("m"."a") AS u, SUM("m"."b") AS s FROM "m" GROUP BY u ORDER BY s', "m", "r"
+    )
+
+    assert plan.rollup_sql == 'SELECT "a", SUM("b") AS "__visivo_sum_b" FROM "m" GROUP BY "a"'
+
+
+def test_queries_a_rollup_cannot_answer():
+    for query in (
+        QUERY.replace("sum(", "avg("),
+        QUERY.replace("count(*)", 'count(DISTINCT "m"."amount")'),
+        QUERY.replace('sum("m"."amount")', 'sum("m"."amount" * ${rate.value})'),
+        'SELECT "m"."month" AS "x" FROM "m"',
+        'SELECT "m"."a", sum("o"."b") FROM "m" JOIN "o" ON "m"."id" = "o"."id" GROUP BY "m"."a"',
+    ):
+        assert plan_rollup(query, "m", "r") is None, query
@@ -482,3 +482,50 @@ def test_datetime_data_handling():
         "15:30:45",
         "10:15:30",
     ], "Time values should be ISO strings"
+
+
+def test_mixed_value_types_are_written_unchanged():
+    output_dir = temp_folder()
+    data = [
+        {"cohort_on": "a", "x": 1, "y": "one"},
+        {"cohort_on": "a", "x": 2.5, "y": 2},
+        {"cohort_on": "b", "x": [3, 4], "y": None},
+    ]
+
+    Aggregator.aggregate_data(data, output_dir)
+
+    with open(f"{output_dir}/data.json") as f:
+        result = json.load(f)
+    assert result == {"a": {"x": [1, 2.5], "y": ["one", 2]}, "b": {"x": [3, 4], "y": [None]}}
+
+
+def test_frame_and_row_aggregation_agree():
+    from visivo.query.aggregator import Aggregator as Agg
+
+    data = [
+        {"cohort_on": "a", "x": 1, "when": date(2024, 1, 2), "price": Decimal("1.50")},
+        {"cohort_on": "b", "x": 2, "when": date(2024, 1, 3), "price": Decimal("2.25")},
+        {"cohort_on": "a", "x": 3, "when": None, "price": None},
+        {"cohort_on": None, "x": 4, "when": None, "price": None},
+    ]
+    frame_dir, rows_dir = temp_folder(), temp_folder()
+
+    assert Agg._to_frame(data) is not None
+    Agg.aggregate_data(data, frame_dir)
+    Agg._write_rows(data, rows_dir, "json")
+
+    with open(f"{frame_dir}/data.json") as f, open(f"{rows_dir}/data.json") as g:
+        assert json.load(f) == json.load(g)
+
+
+def test_compact_json_and_arrow_output():
+    output_dir = temp_folder()
+    data = [{"cohort_on": "a", "x": 1}, {"cohort_on": "a", "x": 2}]
+
+    Aggregator.aggregate_data(data, output_dir, output_format="compact-json")
+    with open(f"{output_dir}/data.json") as f:
+        assert f.read() == '{"a":{"x":[1,2]}}'
+
+    Aggregator.aggregate_data(data, output_dir, output_format="arrow")
+    frame = pl.read_ipc(f"{output_dir}/data.arrow")
+    assert frame.to_dicts() == [{"cohort_on": "a", "x": [1, 2]}]
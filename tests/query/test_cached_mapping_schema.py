@@ -268,3 +268,31 @@ class TestCachedMappingSchemaProviderDialect:
         # Standard types should parse without dialect
         assert isinstance(schema["users"]["id"], exp.DataType)
         assert isinstance(schema["users"]["name"], exp.DataType)
+
+
+class TestCachedMappingSchemaProviderMappingSchema:
+    """Tests for the prebuilt MappingSchemas the provider shares."""
+
+    def test_mapping_schema_is_built_once_per_table_set(self):
+        stored_schema = {
+            "sqlglot_schema": {
+                "users": {"id": "INT"},
+                "orders": {"id": "INT", "total": "DECIMAL"},
+            },
+            "metadata": {},
+        }
+        provider = CachedMappingSchemaProvider(stored_schema)
+
+        orders = provider.get_mapping_schema({"orders"})
+
+        assert provider.get_mapping_schema({"orders"}) is orders
+        assert orders.column_names("orders") == ["id", "total"]
+        assert orders.find(exp.to_table("users")) is None
+        assert provider.get_mapping_schema(set()).find(exp.to_table("users")) is not None
+
+    def test_fingerprint_follows_schema_contents(self):
+        def provider(columns):
+            return CachedMappingSchemaProvider({"sqlglot_schema": {"t": columns}, "metadata": {}})
+
+        assert provider({"a": "INT"}).fingerprint == provider({"a": "INT"}).fingerprint
+        assert provider({"a": "INT"}).fingerprint != provider({"a": "TEXT"}).fingerprint
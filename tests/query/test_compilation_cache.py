@@ -0,0 +1,90 @@
+import json
+import os
+
+from visivo.models.insight import Insight
+from visivo.models.models.sql_model import SqlModel
+from visivo.models.project import Project
+from visivo.models.props.insight_props import InsightProps
+from visivo.query.compilation_cache import CompilationCache
+from tests.factories.model_factories import SourceFactory
+
+
+def test_get_or_build_builds_once_per_key():
+    cache = CompilationCache()
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"x": "INT"}
+
+    first = cache.get_or_build("model_schema", ("out", "m"), build)
+    second = cache.get_or_build("model_schema", ("out", "m"), build)
+
+    assert first is second
+    assert len(calls) == 1
+    assert cache.misses["model_schema"] == 1
+    assert cache.hits["model_schema"] == 1
+
+
+def test_get_or_build_does_not_store_none():
+    cache = CompilationCache()
+    results = iter([None, {"x": "INT"}])
+
+    assert cache.get_or_build("model_schema", "m", lambda: next(results)) is None
+    assert cache.get_or_build("model_schema", "m", lambda: next(results)) == {"x": "INT"}
+    assert cache.misses["model_schema"] == 2
+
+
+def _project_with_insights(tmpdir, insight_count):
+    source = SourceFactory()
+    model = SqlModel(name="m", sql="SELECT * FROM t", source=f"ref({source.name})")
+    insights = [
+        Insight(
+            name=f"insight_{i}",
+            props=InsightProps(type="bar", x="?{${ref(m).sex}}", y="?{sum(${ref(m).total})}"),
+        )
+        for i in range(insight_count)
+    ]
+    project = Project(name="p", sources=[source], models=[model], insights=insights, dashboards=[])
+    schema_dir = os.path.join(str(tmpdir), "schemas")
+    os.makedirs(schema_dir, exist_ok=True)
+    with open(os.path.join(schema_dir, f"{model.name}.json"), "w") as f:
+        json.dump({model.name_hash(): {"sex": "VARCHAR", "total": "DOUBLE"}}, f)
+    return project, insights
+
+
+def test_shared_cache_compiles_the_same_queries_with_shared_work(tmpdir):
+    project, insights = _project_with_insights(tmpdir, 3)
+    dag = project.dag()
+    cache = CompilationCache()
+
+    uncached = [insight.get_query_info(dag, str(tmpdir)) for insight in insights]
+    cached = [
+        insight.get_query_info(dag, str(tmpdir), compilation_cache=cache) for insight in insights
+    ]
+
+    assert [info.pre_query for info in cached] == [info.pre_query for info in uncached]
+    assert [info.props_mapping for info in cached] == [info.props_mapping for info in uncached]
+    assert cache.misses["model_schema"] == 1
+    assert cache.misses["relation_graph"] == 1
+    assert cache.hits["relation_graph"] == 2
+    assert cache.misses["model_cte"] == 1
+    assert cache.hits["model_cte"] == 2
+    assert cache.hits["expression"] > 0
+
+
+def test_schema_overrides_bypass_shared_resolutions(tmpdir):
+    project, insights = _project_with_insights(tmpdir, 1)
+    dag = project.dag()
+    model = project.models[0]
+    cache = CompilationCache()
+
+    insights[0].get_query_info(
+        dag,
+        str(tmpdir),
+        schema_overrides={"m": {model.name_hash(): {"sex": "VARCHAR", "total": "DOUBLE"}}},
+        compilation_cache=cache,
+    )
+
+    assert cache.misses["expression"] == 0
+    assert cache.misses["relation_graph"] == 0
@@ -396,6 +396,70 @@ class TestValidationIntegration:
             assert "no input" in error_msg or "programming error" in error_msg
 
 
+class TestValueClassGrouping:
+    """Combinations whose values parse alike are validated once"""
+
+    def test_value_class(self):
+        from visivo.query.input_validator import value_class
+
+        assert value_class("East", quoted=True) == value_class("West", quoted=True)
+        assert value_class("O'Brien", quoted=True) == ("value", "O'Brien")
+        assert value_class("12", quoted=False) == value_class("-3.5e2", quoted=False)
+        assert value_class("East", quoted=False) == ("value", "East")
+
+    def test_quoted_placeholder_names(self):
+        from visivo.query.input_validator import quoted_placeholder_names
+
+        query = "SELECT * FROM t WHERE a = '${region.value}' AND b = ${limit.value} OR c = '${limit.value}'"
+
+        assert quoted_placeholder_names(query) == {("region", "value")}
+
+    def test_quoted_values_validate_once_per_class(self, monkeypatch):
+        from visivo.query import input_validator
+        from visivo.models.project import Project
+
+        options = ["electronics", "books", "toys", "O'Brien"]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_dir = Path(tmpdir) / "inputs"
+            input_dir.mkdir()
+            input_obj = SingleSelectInputFactory(name="category_input", options=options)
+            with open(input_dir / f"{input_obj.name}.json", "w") as f:
+                json.dump({"name": input_obj.name, "static_props": {"options": options}}, f)
+
+            insight = InsightFactory(name="test_insight")
+            project = Project(
+                name="test_project",
+                sources=[SourceFactory()],
+                inputs=[input_obj],
+                insights=[insight],
+            )
+            dag = project.dag()
+            dag.add_edge(insight, input_obj)
+
+            validated = []
+            validate = input_validator.validate_query
+
+            def counting_validate(**kwargs):
+                validated.append(kwargs["query_sql"])
+                return validate(**kwargs)
+
+            monkeypatch.setattr(input_validator, "validate_query", counting_validate)
+
+            # The unescaped quote only fails because it is validated on its own
+            with pytest.raises(Exception):
+                input_validator.validate_insight_with_inputs(
+                    insight=insight,
+                    query="SELECT * FROM products WHERE category = '${category_input.value}'",
+                    dag=dag,
+                    output_dir=tmpdir,
+                )
+
+        assert validated == [
+            "SELECT * FROM products WHERE category = 'electronics'",
+            "SELECT * FROM products WHERE category = 'O'Brien'",
+        ]
+
+
 class TestEdgeCases:
     """Test edge cases and error handling"""
 
@@ -407,6 +407,36 @@ def test_mixed_data_types_in_columns():
     assert flat_data["number_col"] == [1.5, 2.5, None, 3.0]
 
 
+def test_flat_structure_passes_values_through_unchanged():
+    """Uniform rows are transposed as-is, in column order, without coercing values"""
+    big = 2**63 + 1
+    data = [
+        {"amount": Decimal("1.10"), "id": big, "day": date(2024, 1, 1)},
+        {"amount": Decimal("2.25"), "id": 7, "day": date(2024, 1, 2)},
+    ]
+
+    tokenized_insight = TokenizedInsight(
+        name="passthrough_insight",
+        source="test_source",
+        source_type="duckdb",
+        pre_query="SELECT * FROM test",
+        post_query="SELECT * FROM insight_data",
+        select_items={},
+        interactions=[],
+        input_dependencies=[],
+        selects={},
+        columns={},
+        props={},
+    )
+
+    flat_data = InsightAggregator.generate_flat_structure(data, tokenized_insight)
+
+    assert list(flat_data) == ["amount", "id", "day"]
+    assert flat_data["amount"] == [Decimal("1.10"), Decimal("2.25")]
+    assert flat_data["id"] == [big, 7]
+    assert flat_data["day"] == [date(2024, 1, 1), date(2024, 1, 2)]
+
+
 def test_very_long_column_names():
     """Test handling of very long column names"""
     long_column_name = "very_" + "long_" * 50 + "column_name"
@@ -483,3 +513,33 @@ def test_nested_dict_serialization():
     assert result["list_of_dicts"] == [{"a": 1}, {"b": 2}]
     assert result["time_obj"] == "14:30:00"
     assert result["mixed_list"] == [1, "string", {"key": "value"}, None]
+
+
+def test_flat_structure_keeps_mixed_values_and_writes_compact_json():
+    data = [{"props.x": 1, "props.y": "a"}, {"props.x": 2.5, "props.y": Decimal("1.5")}]
+    tokenized_insight = TokenizedInsight(
+        name="test_insight",
+        source="test_source",
+        source_type="sqlite",
+        pre_query="SELECT * FROM test",
+        post_query="SELECT * FROM insight_data",
+        select_items={},
+        interactions=[],
+        input_dependencies=[],
+        selects={},
+        columns={},
+        props={},
+    )
+
+    flat_data = InsightAggregator.generate_flat_structure(data, tokenized_insight)
+    assert flat_data == {"props.x": [1, 2.5], "props.y": ["a", Decimal("1.5")]}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        InsightAggregator.aggregate_insight_data(
+            flat_data, temp_dir, tokenized_insight, compact=True
+        )
+        with open(os.path.join(temp_dir, "insight.json")) as f:
+            contents = f.read()
+
+    assert "\n" not in contents
+    assert json.loads(contents)["data"] == {"props.x": [1, 2.5], "props.y": ["a", 1.5]}
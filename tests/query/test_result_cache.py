@@ -0,0 +1,203 @@
+import os
+
+import duckdb
+import pyarrow as pa
+import pytest
+
+from visivo.models.sources.duckdb_source import DuckdbSource
+from visivo.query import result_cache
+from visivo.query.result_cache import QueryResultCache, limit_sql, read_rows
+
+
+@pytest.fixture
+def source(tmp_path):
+    db_path = str(tmp_path / "warehouse.duckdb")
+    con = duckdb.connect(db_path)
+    con.execute("CREATE TABLE numbers AS SELECT range AS n FROM range(100)")
+    con.close()
+    return DuckdbSource(name="warehouse", database=db_path, type="duckdb")
+
+
+class CountingSource:
+    """Wraps a source to record the SQL it is asked to run."""
+
+    def __init__(self, source):
+        self._source = source
+        self.queries = []
+
+    def __getattr__(self, name):
+        return getattr(self._source, name)
+
+    def read_sql(self, query, **kwargs):
+        self.queries.append(query)
+        return self._source.read_sql(query, **kwargs)
+
+
+def test_limit_sql_wraps_the_query_as_written():
+    sql = "select n from numbers order by n -- newest first\n;"
+
+    assert limit_sql(sql, "duckdb", 11) == (
+        "SELECT * FROM (\nselect n from numbers order by n -- newest first\n) AS q LIMIT 11"
+    )
+    assert limit_sql("SELECT a FROM t UNION ALL SELECT b FROM u", "tsql", 11).startswith(
+        "SELECT TOP 11 * FROM (\n"
+    )
+    assert limit_sql("DESCRIBE t", "duckdb", 11) is None
+    assert limit_sql("SELECT 1", None, 11) is None
+
+
+def test_read_rows_pushes_the_limit_into_the_query(source):
+    counting = CountingSource(source)
+    sql = "select n from numbers order by n"
+
+    result = read_rows(counting, sql, max_rows=10)
+
+    assert counting.queries == [f"SELECT * FROM (\n{sql}\n) AS q LIMIT 11"]
+    assert [row["n"] for row in result.rows] == list(range(10))
+    assert result.is_truncated is True
+
+
+def test_read_rows_runs_the_sql_as_written_when_the_limited_query_fails(source):
+    class NoSubquerySource(CountingSource):
+        def read_sql(self, query, **kwargs):
+            self.queries.append(query)
+            if query.startswith("SELECT * FROM ("):
+                raise RuntimeError("subqueries are not supported")
+            return self._source.read_sql(query, **kwargs)
+
+    counting = NoSubquerySource(source)
+
+    result = read_rows(counting, "SELECT n FROM numbers", max_rows=10)
+
+    assert counting.queries[-1] == "SELECT n FROM numbers"
+    assert len(result.rows) == 10
+    assert result.is_truncated is True
+
+
+def test_read_rows_is_not_truncated_when_the_result_fits(source):
+    result = read_rows(source, "SELECT n FROM numbers WHERE n < 10", max_rows=10)
+
+    assert len(result.rows) == 10
+    assert result.is_truncated is False
+
+
+def test_read_rows_answers_the_same_query_from_the_cache(source, tmp_path):
+    cache = QueryResultCache(str(tmp_path / "cache"))
+    counting = CountingSource(source)
+
+    first = read_rows(counting, "SELECT n FROM numbers WHERE n < 3", cache=cache)
+    second = read_rows(counting, "select n\nfrom numbers\nwhere n < 3", cache=cache)
+
+    assert len(counting.queries) == 1
+    assert first.cached is False
+    assert second.cached is True
+    assert second.rows == first.rows
+    assert cache.hits == 1
+
+
+def test_refresh_runs_the_query_again_and_stores_the_new_result(source, tmp_path):
+    cache = QueryResultCache(str(tmp_path / "cache"))
+    counting = CountingSource(source)
+
+    read_rows(counting, "SELECT n FROM numbers WHERE n < 3", cache=cache)
+    refreshed = read_rows(counting, "SELECT n FROM numbers WHERE n < 3", cache=cache, refresh=True)
+    after = read_rows(counting, "SELECT n FROM numbers WHERE n < 3", cache=cache)
+
+    assert len(counting.queries) == 2
+    assert refreshed.cached is False
+    assert after.cached is True
+    assert len(cache) == 1
+
+
+def test_read_rows_keys_on_the_row_limit(source, tmp_path):
+    cache = QueryResultCache(str(tmp_path / "cache"))
+
+    read_rows(source, "SELECT n FROM numbers", max_rows=10, cache=cache)
+    result = read_rows(source, "SELECT n FROM numbers", cache=cache)
+
+    assert result.cached is False
+    assert len(result.rows) == 100
+
+
+def test_stored_schema_change_misses(source, tmp_path):
+    schema_dir = tmp_path / "schemas"
+    schema_dir.mkdir()
+    schema_file = schema_dir / "warehouse.json"
+    schema_file.write_text("{}")
+    cache = QueryResultCache(str(tmp_path / "cache"), schema_dir=str(schema_dir))
+
+    read_rows(source, "SELECT n FROM numbers", cache=cache)
+    schema_file.write_text('{"tables": {}}')
+
+    assert read_rows(source, "SELECT n FROM numbers", cache=cache).cached is False
+
+
+def test_least_recently_used_results_are_dropped_past_max_bytes(tmp_path):
+    table = pa.table({"n": list(range(1000))})
+    cache = QueryResultCache(str(tmp_path / "cache"))
+    cache.put("probe", "s", table)
+    size = cache.total_bytes
+    cache = QueryResultCache(str(tmp_path / "cache"), max_bytes=2 * size)
+
+    cache.put("a", "s", table)
+    cache.put("b", "s", table)
+    cache.get("a")
+    cache.put("c", "s", table)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.total_bytes == 2 * size
+    assert sorted(os.listdir(tmp_path / "cache")) == ["a.arrow", "c.arrow"]
+
+
+def test_expired_results_are_not_returned(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache, "monotonic", lambda: now[0])
+    cache = QueryResultCache(str(tmp_path / "cache"), ttl_seconds=60)
+    cache.put("a", "s", pa.table({"n": [1]}))
+
+    now[0] += 30
+    assert cache.get("a") is not None
+    now[0] += 60
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_invalidate_drops_one_source_or_all(tmp_path):
+    cache = QueryResultCache(str(tmp_path / "cache"))
+    cache.put("a", "one", pa.table({"n": [1]}))
+    cache.put("b", "two", pa.table({"n": [2]}))
+    cache.put("c", "two", pa.table({"n": [3]}))
+
+    assert cache.invalidate("two") == 2
+    assert cache.get("a") is not None
+    assert cache.invalidate() == 1
+    assert cache.total_bytes == 0
+
+
+def test_files_from_a_previous_cache_are_removed(tmp_path):
+    QueryResultCache(str(tmp_path / "cache")).put("a", "s", pa.table({"n": [1]}))
+
+    cache = QueryResultCache(str(tmp_path / "cache"))
+
+    assert os.listdir(tmp_path / "cache") == []
+    assert cache.get("a") is None
+
+
+def test_rows_with_mixed_value_types_are_not_cached(tmp_path):
+    cache = QueryResultCache(str(tmp_path / "cache"))
+
+    class MixedSource:
+        name = "mixed"
+
+        def get_dialect(self):
+            return "duckdb"
+
+        def read_sql(self, query):
+            return [{"v": 1}, {"v": "one"}]
+
+    result = read_rows(MixedSource(), "SELECT v FROM t", cache=cache)
+
+    assert result.rows == [{"v": 1}, {"v": "one"}]
+    assert len(cache) == 0
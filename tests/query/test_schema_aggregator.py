@@ -457,3 +457,53 @@ class TestSchemaAggregatorRunId:
 
         assert main_loaded["metadata"]["total_tables"] == 1
         assert preview_loaded["metadata"]["total_tables"] == 2
+
+
+class TestSchemaAggregatorRetainTables:
+    """Carrying unchanged tables over from a stored schema."""
+
+    def test_retain_tables_filters_flat_and_nested_schemas(self):
+        stored = {
+            "tables": {"orders": {"columns": {}}, "EDW.FACT": {"columns": {}}, "gone": {}},
+            "sqlglot_schema": {
+                "orders": {"id": "INT"},
+                "gone": {"id": "INT"},
+                "edw": {"fact": {"id": "INT"}, "dropped": {"id": "INT"}},
+            },
+            "metadata": {"default_schema": "PUBLIC"},
+        }
+
+        retained = SchemaAggregator.retain_tables(stored, ["orders", "EDW.FACT"])
+
+        assert set(retained["tables"]) == {"orders", "EDW.FACT"}
+        assert retained["sqlglot_schema"] == {
+            "orders": {"id": "INT"},
+            "edw": {"fact": {"id": "INT"}},
+        }
+        assert retained["metadata"] == {"default_schema": "PUBLIC"}
+
+    def test_aggregate_merges_retained_tables(self, tmp_path):
+        schema = MappingSchema()
+        schema.add_table("edw.new_table", {"x": exp.DataType.build("INT")})
+        retained = {
+            "tables": {"edw.fact": {"columns": {"id": {"type": "INT", "nullable": True}}}},
+            "sqlglot_schema": {"edw": {"fact": {"id": "INT"}}},
+            "metadata": {"default_schema": "edw"},
+        }
+
+        stored = SchemaAggregator.aggregate_source_schema(
+            source_name="warehouse",
+            source_type="snowflake",
+            schema_data={
+                "tables": {"edw.new_table": {"columns": {"x": {"type": "INT"}}}},
+                "sqlglot_schema": schema,
+                "metadata": {},
+            },
+            output_dir=str(tmp_path),
+            retained=retained,
+        )
+
+        assert set(stored["tables"]) == {"edw.fact", "edw.new_table"}
+        assert set(stored["sqlglot_schema"]["edw"]) == {"fact", "new_table"}
+        assert stored["metadata"]["total_tables"] == 2
+        assert stored["metadata"]["default_schema"] == "edw"
@@ -0,0 +1,133 @@
+"""
+Tests for visivo.query.source_schema_store and the providers reading from it.
+"""
+
+import json
+import os
+import sqlite3
+
+import pytest
+from sqlglot import exp
+
+from visivo.query.cached_mapping_schema import CachedMappingSchemaProvider
+from visivo.query.schema_aggregator import SchemaAggregator
+from visivo.query.source_schema_cache import SourceSchemaCache
+from visivo.query.source_schema_store import SourceSchemaStore, store_path
+from visivo.query.sqlglot_type_mapper import SqlglotTypeMapper
+
+FLAT_SCHEMA = {
+    "orders": {"id": "INT", "total": "DECIMAL(10, 2)"},
+    "customers": {"id": "INT", "name": "VARCHAR"},
+    "events": {"id": "INT", "at": "TIMESTAMP"},
+}
+
+NESTED_SCHEMA = {
+    "EDW": {"fact_orders": {"id": "INT"}, "users": {"id": "INT"}},
+    "REPORTING": {"users": {"id": "INT", "email": "VARCHAR"}},
+}
+
+
+def _aggregate(tmp_path, sqlglot_schema, metadata=None, source_name="warehouse"):
+    stored = SchemaAggregator.aggregate_source_schema(
+        source_name=source_name,
+        source_type="duckdb",
+        schema_data={"tables": {}, "metadata": metadata or {}},
+        output_dir=str(tmp_path),
+    )
+    # Written the way the aggregator serializes a MappingSchema
+    stored["sqlglot_schema"] = sqlglot_schema
+    schema_file = SchemaAggregator.source_schema_file(source_name, str(tmp_path))
+    with open(schema_file, "w") as fp:
+        json.dump(stored, fp)
+    SchemaAggregator._write_store(schema_file, stored)
+    return schema_file, stored
+
+
+class TestSourceSchemaStore:
+    def test_aggregate_writes_a_store_next_to_the_json(self, tmp_path):
+        SchemaAggregator.aggregate_source_schema(
+            source_name="warehouse",
+            source_type="duckdb",
+            schema_data={"tables": {"orders": {"columns": {"id": {"type": "INT"}}}}},
+            output_dir=str(tmp_path),
+        )
+        schema_file = SchemaAggregator.source_schema_file("warehouse", str(tmp_path))
+
+        assert os.path.exists(store_path(schema_file))
+        assert SourceSchemaStore.open(schema_file) is not None
+        names = [s["source_name"] for s in SchemaAggregator.list_stored_schemas(str(tmp_path))]
+        assert names == ["warehouse"]
+
+    def test_store_reads_only_the_requested_tables(self, tmp_path):
+        schema_file, _ = _aggregate(tmp_path, FLAT_SCHEMA)
+        store = SourceSchemaStore.open(schema_file)
+
+        assert store.tables({"orders", "missing"}) == [
+            (None, "orders", {"id": "INT", "total": "DECIMAL(10, 2)"})
+        ]
+        assert store.table_count == 3
+        assert store.column_count == 6
+
+    def test_store_is_ignored_once_the_json_changes(self, tmp_path):
+        schema_file, stored = _aggregate(tmp_path, FLAT_SCHEMA)
+        stored["sqlglot_schema"] = {"orders": {"id": "BIGINT"}}
+        with open(schema_file, "w") as fp:
+            json.dump(stored, fp, indent=2)
+
+        assert SourceSchemaStore.open(schema_file) is None
+        provider = SourceSchemaCache().get_provider("warehouse", "duckdb", str(tmp_path))
+        assert provider.get_filtered_schema({"orders"})["orders"]["id"].sql() == "BIGINT"
+
+
+class TestProviderFromStore:
+    def test_builds_only_the_tables_models_ask_for(self, tmp_path):
+        _aggregate(tmp_path, FLAT_SCHEMA)
+        provider = SourceSchemaCache().get_provider("warehouse", "duckdb", str(tmp_path))
+
+        filtered = provider.get_filtered_schema({"orders"})
+
+        assert list(provider._flat_schema) == ["orders"]
+        assert filtered["orders"]["total"].sql() == "DECIMAL(10, 2)"
+        assert provider.table_count == 3
+        assert provider.column_count == 6
+
+    def test_matches_the_provider_built_from_the_json(self, tmp_path):
+        _, stored = _aggregate(tmp_path, NESTED_SCHEMA, metadata={"default_schema": "EDW"})
+        from_json = CachedMappingSchemaProvider(stored, dialect="duckdb")
+        from_store = SourceSchemaCache().get_provider("warehouse", "duckdb", str(tmp_path))
+
+        assert from_store._store is not None
+        assert from_store.is_nested is True
+        assert from_store.default_schema == "EDW"
+        assert from_store.fingerprint == from_json.fingerprint
+        for tables, schema_names in [({"users"}, None), ({"users"}, {"REPORTING"})]:
+            assert from_store.get_filtered_schema(tables, schema_names) == (
+                from_json.get_filtered_schema(tables, schema_names)
+            )
+        assert from_store.get_full_schema() == from_json.get_full_schema()
+
+    def test_clearing_the_cache_closes_the_store(self, tmp_path):
+        _aggregate(tmp_path, FLAT_SCHEMA)
+        cache = SourceSchemaCache()
+        store = cache.get_provider("warehouse", "duckdb", str(tmp_path))._store
+        cache.clear_source("warehouse")
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            store.tables({"orders"})
+        assert cache.cached_sources == 0
+
+
+class TestTypeStringMemo:
+    def test_each_call_gets_its_own_copy_of_one_parse(self):
+        first = SqlglotTypeMapper._parse_type_string("TIMESTAMP_TZ", dialect="snowflake")
+        before = SqlglotTypeMapper._parsed_type.cache_info().hits
+        second = SqlglotTypeMapper._parse_type_string("TIMESTAMP_TZ", dialect="snowflake")
+
+        assert SqlglotTypeMapper._parsed_type.cache_info().hits == before + 1
+        assert first == second
+        assert first is not second
+
+    def test_unparseable_types_fall_back_to_varchar(self):
+        assert SqlglotTypeMapper.build_type("NOT A TYPE(", dialect="duckdb") == (
+            exp.DataType.build("VARCHAR")
+        )
@@ -849,3 +849,68 @@ class TestNormalizeIdentifierForDialect:
         assert result.this == "MyMixedCase"
         sql = result.sql(dialect="clickhouse")
         assert sql == '"MyMixedCase"'
+
+
+class TestSchemaFromSqlCache:
+    """schema_from_sql reuses results for the same SQL and schema contents."""
+
+    def test_repeat_call_is_served_from_cache(self, monkeypatch):
+        from visivo.query import sqlglot_utils
+
+        sqlglot_utils.clear_schema_from_sql_cache()
+        calls = []
+        infer = sqlglot_utils._column_schema_from_sql
+
+        def counting_infer(*args):
+            calls.append(args)
+            return infer(*args)
+
+        monkeypatch.setattr(sqlglot_utils, "_column_schema_from_sql", counting_infer)
+        sql = "SELECT a, b FROM t"
+
+        schema = {"t": {"a": "INT", "b": "TEXT"}}
+        first = sqlglot_utils.schema_from_sql("duckdb", sql, schema, "m1", schema_fingerprint="v1")
+        second = sqlglot_utils.schema_from_sql("duckdb", sql, schema, "m2", schema_fingerprint="v1")
+        changed = sqlglot_utils.schema_from_sql(
+            "duckdb", sql, {"t": {"a": "BIGINT", "b": "TEXT"}}, "m1", schema_fingerprint="v2"
+        )
+        unkeyed = sqlglot_utils.schema_from_sql("duckdb", sql, schema, "m1")
+
+        assert len(calls) == 3
+        assert second == {"m2": first["m1"]}
+        assert changed["m1"]["a"] == "BIGINT"
+        assert unkeyed == first
+
+    def test_inference_is_keyed_by_the_stored_schema(self, monkeypatch):
+        from visivo.query import sqlglot_utils
+        from visivo.query.model_schema_inference import infer_model_columns
+
+        sqlglot_utils.clear_schema_from_sql_cache()
+        calls = []
+        infer = sqlglot_utils._column_schema_from_sql
+
+        def counting_infer(*args):
+            calls.append(args)
+            return infer(*args)
+
+        monkeypatch.setattr(sqlglot_utils, "_column_schema_from_sql", counting_infer)
+        stored = {"sqlglot_schema": {"t": {"a": "INT"}}, "metadata": {}}
+
+        first = infer_model_columns("SELECT a FROM t", "duckdb", "m", stored)
+        second = infer_model_columns("SELECT a FROM t", "duckdb", "m", dict(stored))
+        changed = infer_model_columns(
+            "SELECT a FROM t", "duckdb", "m", {"sqlglot_schema": {"t": {"a": "TEXT"}}}
+        )
+
+        assert len(calls) == 2
+        assert first == second == {"a": "INT"}
+        assert changed == {"a": "TEXT"}
+
+    def test_accepts_prebuilt_mapping_schema(self):
+        from sqlglot.schema import MappingSchema
+        from visivo.query.sqlglot_utils import schema_from_sql
+
+        schema = MappingSchema(schema={"t": {"a": "INT"}})
+        result = schema_from_sql("duckdb", "SELECT a + 1 AS a1 FROM t", schema, "model")
+
+        assert result == {"model": {"a1": "INT"}}
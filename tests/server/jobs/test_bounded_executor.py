@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+
+from visivo.models.sources.cancellation import current_token, interruptible
+from visivo.server.jobs.bounded_executor import BoundedJobExecutor, ExecutorFull
+
+
+def _wait_for(condition, timeout=5):
+    event = threading.Event()
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return True
+        event.wait(0.01)
+    return False
+
+
+def test_submit_past_the_queue_raises_executor_full():
+    executor = BoundedJobExecutor("test", max_workers=1, max_queued=1)
+    release = threading.Event()
+
+    executor.submit("a", release.wait)
+    executor.submit("b", release.wait)
+    with pytest.raises(ExecutorFull):
+        executor.submit("c", release.wait)
+
+    release.set()
+    assert _wait_for(lambda: executor.pending == 0)
+    executor.submit("c", lambda: None)
+
+
+def test_a_job_cancelled_while_queued_never_runs():
+    executor = BoundedJobExecutor("test", max_workers=1, max_queued=1)
+    release = threading.Event()
+    ran = []
+
+    executor.submit("a", release.wait)
+    executor.submit("b", lambda: ran.append("b"))
+    assert executor.cancel("b") is True
+    release.set()
+
+    assert _wait_for(lambda: executor.pending == 0)
+    assert ran == []
+    assert executor.cancel("b") is False
+
+
+def test_work_runs_under_its_cancellation_token():
+    executor = BoundedJobExecutor("test", max_workers=1, max_queued=0)
+    seen = []
+
+    token = executor.submit("a", lambda: seen.append(current_token()))
+
+    assert _wait_for(lambda: executor.pending == 0)
+    assert seen == [token]
+
+
+def test_a_job_past_its_timeout_is_cancelled_and_reported():
+    timed_out = []
+    executor = BoundedJobExecutor(
+        "test",
+        max_workers=1,
+        max_queued=0,
+        timeout=0.05,
+        on_timeout=lambda job_id, reason: timed_out.append((job_id, reason)),
+    )
+    cancelled = threading.Event()
+
+    def work():
+        with interruptible(cancelled.set):
+            cancelled.wait(5)
+
+    token = executor.submit("a", work)
+
+    assert _wait_for(lambda: executor.pending == 0)
+    assert cancelled.is_set()
+    assert timed_out == [("a", "Timed out after 0.05 seconds")]
+    assert token.reason == "Timed out after 0.05 seconds"
@@ -0,0 +1,71 @@
+from copy import deepcopy
+from types import SimpleNamespace
+
+from visivo.models.insight import Insight
+from visivo.models.models.sql_model import SqlModel
+from visivo.models.project import Project
+from visivo.server.jobs.project_injection import inject_cached_objects, overlay_cached_objects
+
+
+def _project(tmp_path):
+    return Project(
+        name="project",
+        sources=[{"name": "db", "type": "duckdb", "database": str(tmp_path / "db.duckdb")}],
+        models=[{"name": "m", "sql": "select 1 as x, 2 as y", "source": "ref(db)"}],
+        insights=[{"name": "i", "props": {"type": "scatter", "x": "?{${ref(m).x}}"}}],
+        charts=[{"name": "c", "insights": ["ref(i)"]}],
+        dashboards=[{"name": "d", "rows": [{"items": [{"chart": "ref(c)"}]}]}],
+    )
+
+
+def _app(project, **cached):
+    app = SimpleNamespace(project=project)
+    for field, objects in cached.items():
+        manager = SimpleNamespace(cached_objects={obj.name: obj for obj in objects})
+        setattr(app, f"{field}_manager", manager)
+    return app
+
+
+def _key(node):
+    return (type(node).__name__, getattr(node, "name", None) or node.path)
+
+
+def _shape(dag):
+    return (
+        sorted(_key(node) for node in dag.nodes()),
+        sorted((_key(a), _key(b)) for a, b in dag.edges()),
+    )
+
+
+def _edited(project):
+    insight = Insight(name="i", props={"type": "scatter", "x": "?{${ref(m2).x}}"})
+    model = SqlModel(name="m2", sql="select 3 as x", source="ref(db)")
+    return _app(project, insight=[insight], model=[model])
+
+
+def test_overlay_dag_matches_a_full_rebuild(tmp_path):
+    project = _project(tmp_path)
+    app = _edited(project)
+
+    rebuilt = deepcopy(project)
+    inject_cached_objects(app, rebuilt)
+    rebuilt.invalidate_dag_cache()
+    overlay = overlay_cached_objects(app, project)
+
+    assert _shape(overlay.dag()) == _shape(rebuilt.dag())
+    assert overlay.dag().get_project() is overlay
+
+
+def test_overlay_shares_unedited_objects_and_leaves_the_project_alone(tmp_path):
+    project = _project(tmp_path)
+    published_shape = _shape(project.dag())
+    app = _edited(project)
+
+    overlay = overlay_cached_objects(app, project)
+
+    assert overlay.charts[0] is project.charts[0]
+    assert overlay.models[0] is project.models[0]
+    assert overlay.insights[0] is not app.insight_manager.cached_objects["i"]
+    assert overlay.sources[0] is not project.sources[0]
+    assert [model.name for model in project.models] == ["m"]
+    assert _shape(project.dag()) == published_shape
@@ -53,6 +53,18 @@ class TestProjectChangeHandlerFilters:
         handler.on_modified(event)
         callback.assert_called_once()
 
+    def test_callback_gets_the_changed_paths_including_debounced_ones(self):
+        callback = Mock()
+        handler = ProjectChangeHandler(callback)
+        handler.on_modified(Mock(is_directory=False, src_path="/proj/a.yml"))
+        handler.on_modified(Mock(is_directory=False, src_path="/proj/b.yml"))
+        handler.last_event_time = 0
+        handler.on_modified(Mock(is_directory=False, src_path="/proj/c.yml"))
+
+        assert callback.call_args_list[0].args == ({"/proj/a.yml"},)
+        assert callback.call_args_list[1].args == ({"/proj/b.yml", "/proj/c.yml"},)
+        assert handler.changed_paths == set()
+
 
 class TestFindAvailablePort:
     def test_returns_a_bindable_port(self):
@@ -78,7 +90,7 @@ class TestStartFileWatcher:
         handler = mock_observer_cls.return_value.schedule.call_args[0][0]
         handler.callback()
 
-        inner.assert_called_once_with(one_shot=True)
+        inner.assert_called_once_with(one_shot=True, changed_paths=None)
         server.socketio.emit.assert_called_once_with("reload")
 
 
@@ -196,3 +196,100 @@ def test_parquet_resolves_from_any_producing_directory(client, output_dir):
         response = client.get(f"/api/files/{alpha_hash(stem)}/main/")
         assert response.status_code == 200, kind
         assert response.data == f"PAR1{kind}".encode()
+
+
+# ---------- Write-time index, ETags and Range requests ----------
+
+
+def test_indexed_parquet_served_without_directory_scan(client, output_dir, monkeypatch):
+    """A file recorded in the run's index is found there; the directory is
+    not listed."""
+    from visivo.jobs.file_index import record_file, save_index
+
+    path = _put_parquet(output_dir, "main", "indexed_model", payload=b"PAR1indexed")
+    record_file(os.path.join(output_dir, "main"), path)
+    save_index()
+    monkeypatch.setattr(
+        os, "listdir", lambda *_: pytest.fail("directory scanned despite the index")
+    )
+
+    response = client.get(f"/api/files/{alpha_hash('indexed_model')}/main/")
+
+    assert response.status_code == 200
+    assert response.data == b"PAR1indexed"
+
+
+def test_etag_is_the_content_hash_and_if_none_match_gets_304(client, output_dir):
+    from visivo.jobs.file_index import content_hash, record_file, save_index
+
+    path = _put_parquet(output_dir, "main", "etag_model", payload=b"PAR1etag")
+    record_file(os.path.join(output_dir, "main"), path)
+    save_index()
+    url = f"/api/files/{alpha_hash('etag_model')}/main/"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.get_etag()[0] == content_hash(path)
+    assert "no-cache" in first.headers["Cache-Control"]
+
+    second = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 304
+    assert second.data == b""
+
+
+def test_rewritten_file_gets_a_new_etag_even_if_not_reindexed(client, output_dir):
+    """The index entry's size and mtime no longer match, so the ETag is
+    computed from the file on disk rather than served stale."""
+    from visivo.jobs.file_index import content_hash, record_file, save_index
+
+    path = _put_parquet(output_dir, "main", "changed_model", payload=b"PAR1before")
+    record_file(os.path.join(output_dir, "main"), path)
+    save_index()
+    url = f"/api/files/{alpha_hash('changed_model')}/main/"
+    old_etag = client.get(url).headers["ETag"]
+
+    _put_parquet(output_dir, "main", "changed_model", payload=b"PAR1after-change")
+
+    response = client.get(url, headers={"If-None-Match": old_etag})
+    assert response.status_code == 200
+    assert response.data == b"PAR1after-change"
+    assert response.get_etag()[0] == content_hash(path)
+
+
+def test_etag_cache_drops_the_least_recently_served_file(client, output_dir, monkeypatch):
+    from visivo.server.views import file_views
+
+    hashed = []
+    real_content_hash = file_views.content_hash
+
+    def counting(path):
+        hashed.append(os.path.basename(path))
+        return real_content_hash(path)
+
+    monkeypatch.setattr(file_views, "MAX_CACHED_ETAGS", 1)
+    monkeypatch.setattr(file_views, "content_hash", counting)
+    _put_parquet(output_dir, "main", "first", payload=b"PAR1first")
+    _put_parquet(output_dir, "main", "second", payload=b"PAR1second")
+
+    for stem in ("first", "first", "second", "first"):
+        assert client.get(f"/api/files/{alpha_hash(stem)}/main/").status_code == 200
+
+    assert hashed == ["first.parquet", "second.parquet", "first.parquet"]
+
+
+def test_range_request_returns_only_the_requested_bytes(client, output_dir):
+    """DuckDB-WASM reads the parquet footer and row groups with Range requests."""
+    payload = b"PAR1" + bytes(range(200)) + b"PAR1"
+    _put_parquet(output_dir, "main", "ranged_model", payload=payload)
+    url = f"/api/files/{alpha_hash('ranged_model')}/main/"
+
+    head = client.get(url)
+    assert head.headers["Accept-Ranges"] == "bytes"
+
+    response = client.get(url, headers={"Range": "bytes=-8"})
+    assert response.status_code == 206
+    assert response.data == payload[-8:]
+    assert (
+        response.headers["Content-Range"]
+        == f"bytes {len(payload) - 8}-{len(payload) - 1}/{len(payload)}"
+    )
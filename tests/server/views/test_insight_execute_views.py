@@ -20,11 +20,13 @@ from visivo.models.inputs.types.multi_select import MultiSelectInput
 from visivo.models.models.sql_model import SqlModel
 from visivo.models.sources.duckdb_source import DuckdbSource
 from visivo.server.views.insight_execute_views import register_insight_execute_views
+from visivo.query.result_cache import QueryResultCache
 
 
 class FlaskAppStub:
-    def __init__(self, project):
+    def __init__(self, project, output_dir):
         self.project = project
+        self.query_result_cache = QueryResultCache(f"{output_dir}/query_results")
 
 
 # The FULL table: five rows, amount summing to 150 (west=30, east=120). A
@@ -57,7 +59,7 @@ def project(duckdb_file):
 def app(tmp_path, project):
     app = Flask(__name__)
     app.config["TESTING"] = True
-    stub = FlaskAppStub(project)
+    stub = FlaskAppStub(project, str(tmp_path))
     register_insight_execute_views(app, stub, str(tmp_path))
     app.output_dir = str(tmp_path)
     return app
@@ -103,6 +105,15 @@ def test_aggregate_executes_against_the_full_source_not_a_sample(client):
     assert {"name": "orders_q"} == {"name": data["models"][0]["name"]}
 
 
+def test_repeated_draft_is_answered_from_the_result_cache(client):
+    first = client.post("/api/insight-execute-draft/", json=_aggregate_payload()).get_json()
+    second = client.post("/api/insight-execute-draft/", json=_aggregate_payload()).get_json()
+
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert second["rows"] == first["rows"]
+
+
 def test_execution_writes_no_parquet_or_artifacts(client, app):
     client.post("/api/insight-execute-draft/", json=_aggregate_payload())
     # The executor is called with no output_dir/name, so nothing is materialized.
@@ -145,7 +156,7 @@ def test_insight_referencing_an_input_is_409_requires_client_lane(duckdb_file, t
         name="p", sources=[source], models=[model], inputs=[an_input], insights=[insight]
     )
     app = Flask(__name__)
-    register_insight_execute_views(app, FlaskAppStub(proj), str(tmp_path))
+    register_insight_execute_views(app, FlaskAppStub(proj, str(tmp_path)), str(tmp_path))
     client = app.test_client()
 
     resp = client.post(
@@ -196,7 +207,7 @@ def test_multi_source_insight_is_rejected_400_multi_source(duckdb_file, tmp_path
         name="p", sources=[source1, source2], models=[model_a, model_b], insights=[insight]
     )
     app = Flask(__name__)
-    register_insight_execute_views(app, FlaskAppStub(proj), str(tmp_path))
+    register_insight_execute_views(app, FlaskAppStub(proj, str(tmp_path)), str(tmp_path))
     client = app.test_client()
 
     resp = client.post(
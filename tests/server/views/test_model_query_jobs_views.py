@@ -1,4 +1,5 @@
 import pytest
+import threading
 import time
 import tempfile
 from unittest.mock import Mock, patch, MagicMock
@@ -7,6 +8,8 @@ from flask import Flask
 
 from visivo.server.views.model_query_jobs_views import register_model_query_jobs_views
 from visivo.server.managers.model_query_job_manager import ModelQueryJobManager
+from visivo.query.result_cache import QueryResultCache
+from visivo.models.sources.cancellation import interruptible
 
 
 class TestModelQueryJobsViews:
@@ -44,6 +47,7 @@ class TestModelQueryJobsViews:
         flask_app.project.models = []
         flask_app.project.path = temp_output_dir
         flask_app.project.sources = [mock_source]
+        flask_app.query_result_cache = QueryResultCache(f"{temp_output_dir}/query_results")
 
         register_model_query_jobs_views(app, flask_app, temp_output_dir)
 
@@ -146,6 +150,53 @@ class TestModelQueryJobsViews:
         assert data["job_id"] == job_id
         assert "cancelled" in data["message"].lower()
 
+    def test_cancel_interrupts_the_running_query(self, client, app):
+        """Test that cancelling a running job interrupts its query and keeps it cancelled."""
+        started = threading.Event()
+        interrupted = threading.Event()
+
+        def read_sql(query):
+            with interruptible(interrupted.set):
+                started.set()
+                interrupted.wait(5)
+            raise Exception("Query interrupted")
+
+        app.mock_source.read_sql.side_effect = read_sql
+        job_id = client.post(
+            "/api/model-query-jobs/",
+            json={"source_name": "test_source", "sql": "SELECT * FROM test"},
+        ).get_json()["job_id"]
+        assert started.wait(5)
+
+        client.delete(f"/api/model-query-jobs/{job_id}/")
+
+        assert interrupted.wait(5)
+        time.sleep(0.1)
+        data = client.get(f"/api/model-query-jobs/{job_id}/").get_json()
+        assert data["status"] == "cancelled"
+        assert data["error"] is None
+
+    def test_start_query_job_when_executor_is_full_is_429(self, client, app, monkeypatch):
+        """Test that a job is refused with 429 once every worker and queue slot is taken."""
+        ModelQueryJobManager._instance = None
+        monkeypatch.setattr(ModelQueryJobManager, "MAX_RUNNING", 1)
+        monkeypatch.setattr(ModelQueryJobManager, "MAX_QUEUED", 0)
+        release = threading.Event()
+        app.mock_source.read_sql.side_effect = lambda query: release.wait(5) and []
+
+        first = client.post(
+            "/api/model-query-jobs/", json={"source_name": "test_source", "sql": "SELECT 1"}
+        )
+        second = client.post(
+            "/api/model-query-jobs/", json={"source_name": "test_source", "sql": "SELECT 2"}
+        )
+        release.set()
+
+        assert first.status_code == 202
+        assert second.status_code == 429
+        assert second.headers["Retry-After"] == "1"
+        assert len(ModelQueryJobManager.instance()._jobs) == 1
+
     def test_cancel_job_not_found(self, client, app):
         """Test cancelling a non-existent job."""
         response = client.delete("/api/model-query-jobs/nonexistent-job-id/")
@@ -181,6 +232,49 @@ class TestModelQueryJobsViews:
         assert result["source_name"] == "test_source"
         assert "execution_time_ms" in result
 
+    def _run_job(self, client, sql, **body):
+        start_response = client.post(
+            "/api/model-query-jobs/",
+            json={"source_name": "test_source", "sql": sql, **body},
+            content_type="application/json",
+        )
+        job_id = start_response.get_json()["job_id"]
+        for _ in range(50):
+            data = client.get(f"/api/model-query-jobs/{job_id}/").get_json()
+            if data["status"] in ("completed", "failed"):
+                return data
+            time.sleep(0.1)
+        return data
+
+    def test_repeated_query_is_answered_from_the_result_cache(self, client, app):
+        """Test that running the same query again does not query the source."""
+        first = self._run_job(client, "SELECT id, name FROM users")
+        second = self._run_job(client, "SELECT id, name FROM users")
+
+        assert first["result"]["cached"] is False
+        assert second["result"]["cached"] is True
+        assert second["result"]["rows"] == first["result"]["rows"]
+        assert app.mock_source.read_sql.call_count == 1
+
+    def test_refresh_runs_a_cached_query_again(self, client, app):
+        """Test that refresh: true skips the result cache for one request."""
+        self._run_job(client, "SELECT id, name FROM users")
+        refreshed = self._run_job(client, "SELECT id, name FROM users", refresh=True)
+
+        assert refreshed["result"]["cached"] is False
+        assert app.mock_source.read_sql.call_count == 2
+
+    def test_clearing_the_query_cache_runs_the_query_again(self, client, app):
+        """Test that DELETE /api/query-cache/ drops cached results."""
+        self._run_job(client, "SELECT id, name FROM users")
+
+        response = client.delete("/api/query-cache/?source_name=test_source")
+        assert response.get_json() == {"invalidated": 1}
+        assert client.get("/api/query-cache/").get_json()["entries"] == 0
+
+        assert self._run_job(client, "SELECT id, name FROM users")["result"]["cached"] is False
+        assert app.mock_source.read_sql.call_count == 2
+
     def test_query_failure_when_source_not_found(self, client, app):
         """Test that query fails when source is not found in project."""
         # Remove the mock source
@@ -8,6 +8,7 @@ from flask import Flask
 from visivo.constants import DEFAULT_RUN_ID
 from visivo.server.views.source_schema_jobs_views import register_source_schema_jobs_views
 from visivo.server.managers.preview_run_manager import PreviewRunManager, RunStatus, PreviewRun
+from visivo.server.jobs.bounded_executor import ExecutorFull
 
 
 class TestSourceSchemaJobsViews:
@@ -193,17 +194,13 @@ class TestGenerateSourceSchema(TestSourceSchemaJobsViews):
     """Tests for POST /api/source-schema-jobs/ (RESTful API)"""
 
     @patch("visivo.server.views.source_schema_jobs_views.PreviewRunManager")
-    @patch("visivo.server.views.source_schema_jobs_views.threading.Thread")
-    def test_generate_schema_success(self, mock_thread, mock_run_manager_class, client, app):
+    def test_generate_schema_success(self, mock_run_manager_class, client, app):
         """Test triggering schema generation with RESTful API."""
         mock_run_manager = Mock()
         mock_run_manager_class.instance.return_value = mock_run_manager
         mock_run_manager.find_existing_run.return_value = None
         mock_run_manager.create_run.return_value = "test-job-id"
 
-        mock_thread_instance = Mock()
-        mock_thread.return_value = mock_thread_instance
-
         response = client.post(
             "/api/source-schema-jobs/",
             json={"config": {"source_name": "test_source"}, "run": True},
@@ -213,7 +210,25 @@ class TestGenerateSourceSchema(TestSourceSchemaJobsViews):
         data = response.get_json()
         assert "run_id" in data
         assert data["run_id"] == "test-job-id"
-        mock_thread_instance.start.assert_called_once()
+        mock_run_manager.submit.assert_called_once()
+        assert mock_run_manager.submit.call_args[0][0] == "test-job-id"
+
+    @patch("visivo.server.views.source_schema_jobs_views.PreviewRunManager")
+    def test_generate_schema_when_executor_is_full_is_429(self, mock_run_manager_class, client):
+        """Test that a run the executor cannot take is refused and forgotten."""
+        mock_run_manager = Mock()
+        mock_run_manager_class.instance.return_value = mock_run_manager
+        mock_run_manager.find_existing_run.return_value = None
+        mock_run_manager.create_run.return_value = "test-job-id"
+        mock_run_manager.submit.side_effect = ExecutorFull("busy")
+
+        response = client.post(
+            "/api/source-schema-jobs/",
+            json={"config": {"source_name": "test_source"}, "run": True},
+        )
+
+        assert response.status_code == 429
+        mock_run_manager.delete_run.assert_called_once_with("test-job-id")
 
     @patch("visivo.server.views.source_schema_jobs_views.PreviewRunManager")
     def test_generate_schema_returns_existing_job(self, mock_run_manager_class, client, app):
@@ -342,6 +357,32 @@ class TestGetSchemaGenerationStatus(TestSourceSchemaJobsViews):
         assert response.status_code == 404
 
 
+class TestCancelSourceSchemaJob(TestSourceSchemaJobsViews):
+    """Tests for DELETE /api/source-schema-jobs/<job_id>/"""
+
+    @patch("visivo.server.views.source_schema_jobs_views.PreviewRunManager")
+    def test_cancel_job(self, mock_run_manager_class, client):
+        mock_run_manager = Mock()
+        mock_run_manager_class.instance.return_value = mock_run_manager
+        mock_run_manager.get_run.return_value = Mock(object_type="source_schema")
+
+        response = client.delete("/api/source-schema-jobs/test-job-id/")
+
+        assert response.status_code == 200
+        mock_run_manager.cancel_run.assert_called_once_with("test-job-id")
+
+    @patch("visivo.server.views.source_schema_jobs_views.PreviewRunManager")
+    def test_cancel_job_not_found(self, mock_run_manager_class, client):
+        mock_run_manager = Mock()
+        mock_run_manager_class.instance.return_value = mock_run_manager
+        mock_run_manager.get_run.return_value = None
+
+        response = client.delete("/api/source-schema-jobs/test-job-id/")
+
+        assert response.status_code == 404
+        mock_run_manager.cancel_run.assert_not_called()
+
+
 class TestSchemaFallbackBehavior(TestSourceSchemaJobsViews):
     """Tests for run_id fallback behavior (main -> preview)."""
 
@@ -440,19 +481,13 @@ class TestSourceSchemaInvalidation(TestSourceSchemaJobsViews):
     """Tests for schema invalidation on POST."""
 
     @patch("visivo.server.views.source_schema_jobs_views.PreviewRunManager")
-    @patch("visivo.server.views.source_schema_jobs_views.threading.Thread")
-    def test_post_invalidates_completed_runs(
-        self, mock_thread, mock_run_manager_class, client, app
-    ):
+    def test_post_invalidates_completed_runs(self, mock_run_manager_class, client, app):
         """Test that POST invalidates completed runs for the source."""
         mock_run_manager = Mock()
         mock_run_manager_class.instance.return_value = mock_run_manager
         mock_run_manager.find_existing_run.return_value = None
         mock_run_manager.create_run.return_value = "test-job-id"
 
-        mock_thread_instance = Mock()
-        mock_thread.return_value = mock_thread_instance
-
         response = client.post(
             "/api/source-schema-jobs/",
             json={"config": {"source_name": "test_source"}, "run": True},
@@ -86,3 +86,71 @@ def test_generic_exception_still_reports_the_issue_url():
 
     assert "An unexpected error has occurred" in output
     assert "Click here to report this issue" in output
+
+
+# Imported only once a command runs; `visivo --help` and `--version` must not
+HEAVY_MODULES = [
+    "duckdb",
+    "polars",
+    "sqlglot",
+    "flask",
+    "networkx",
+    "sqlalchemy",
+    "pydantic",
+    "posthog",
+]
+
+
+@pytest.mark.parametrize("args", [["--help"], ["--version"]])
+def test_cli_startup_does_not_import_heavy_modules(args):
+    import json
+    import subprocess
+
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "from click.testing import CliRunner\n"
+        "from visivo.command_line import visivo\n"
+        f"result = CliRunner().invoke(visivo, {args!r})\n"
+        "print(json.dumps({'exit_code': result.exit_code, 'output': result.output,\n"
+        "    'seconds': time.perf_counter() - start,\n"
+        f"    'loaded': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))\n"
+    )
+    env = {**os.environ, "VISIVO_TELEMETRY_DISABLED": "true"}
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True
+    )
+    report = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    assert report["exit_code"] == 0
+    assert report["loaded"] == []
+    # Generous, so a slow CI machine passes; eager imports took several seconds
+    assert report["seconds"] < 2.0
+    if args == ["--help"]:
+        for command in ["run", "serve", "compile", "authorize", "deploy", "list"]:
+            assert command in report["output"]
+
+
+QUERY_DRIVER_MODULES = ["duckdb", "polars", "pyarrow", "sqlalchemy", "clickhouse_sqlalchemy"]
+
+
+def test_loading_project_models_does_not_import_query_drivers():
+    import json
+    import subprocess
+
+    script = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import visivo.models.project\n"
+        "print(json.dumps({'seconds': time.perf_counter() - start,\n"
+        f"    'loaded': [m for m in {QUERY_DRIVER_MODULES!r} if m in sys.modules]}}))\n"
+    )
+    env = {**os.environ, "VISIVO_TELEMETRY_DISABLED": "true"}
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True
+    )
+    report = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    assert report["loaded"] == []
+    # Generous, so a slow CI machine passes; with the drivers imported it took 1.5s+
+    assert report["seconds"] < 1.5
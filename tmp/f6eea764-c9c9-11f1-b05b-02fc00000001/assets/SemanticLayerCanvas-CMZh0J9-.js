@@ -0,0 +1,18 @@
+import{r as Ud,b as Yd,R as D,c as R,d as jm,e as kn,f as pt,h as Ve,i as ys,j as Gm,k as rt,l as Wd,m as Kd,n as Um,o as Xd,p as Ym,q as Wm,s as Km,t as vs,u as Qt,v as It,x as Zd,y as bs,z as xs,A as Xm,B as An,C as xe,D as Qd,E as _s,F as Zm,G as Tn,H as Qm,I as ws,J as Jm,K as Jd,L as Es,M as Ss,N as eg,O as eh,P as tg,Q as ng,S as ce,T as rg,a as ig,w as og,g as ag,U as sg,V as U,W as Mt,X as Pn,Y as Ns,Z as ug,_ as iu,$ as cg,a0 as lg,a1 as th,a2 as fg,a3 as dg,a4 as hg}from"./index-BmYYgOqq.js";function _e(e){if(typeof e=="string"||typeof e=="number")return""+e;let t="";if(Array.isArray(e))for(let n=0,r;n<e.length;n++)(r=_e(e[n]))!==""&&(t+=(t&&" ")+r);else for(let n in e)e[n]&&(t+=(t&&" ")+n);return t}var tr={exports:{}},nr={},rr={exports:{}},ir={};/**
+ * @license React
+ * use-sync-external-store-shim.production.js
+ *
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */var ou;function pg(){if(ou)return ir;ou=1;var e=Ud();function t(f,d){return f===d&&(f!==0||1/f===1/d)||f!==f&&d!==d}var n=typeof Object.is=="function"?Object.is:t,r=e.useState,i=e.useEffect,o=e.useLayoutEffect,a=e.useDebugValue;function s(f,d){var h=d(),m=r({inst:{value:h,getSnapshot:d}}),p=m[0].inst,g=m[1];return o(function(){p.value=h,p.getSnapshot=d,u(p)&&g({inst:p})},[f,h,d]),i(function(){return u(p)&&g({inst:p}),f(function(){u(p)&&g({inst:p})})},[f]),a(h),h}function u(f){var d=f.getSnapshot;f=f.value;try{var h=d();return!n(f,h)}catch{return!0}}function l(f,d){return d()}var c=typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"?l:s;return ir.useSyncExternalStore=e.useSyncExternalStore!==void 0?e.useSyncExternalStore:c,ir}var au;function mg(){return au||(au=1,rr.exports=pg()),rr.exports}/**
+ * @license React
+ * use-sync-external-store-shim/with-selector.production.js
+ *
+ * Copyright (c) Meta Platforms, Inc. and affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */var su;function gg(){if(su)return nr;su=1;var e=Ud(),t=mg();function n(l,c){return l===c&&(l!==0||1/l===1/c)||l!==l&&c!==c}var r=typeof Object.is=="function"?Object.is:n,i=t.useSyncExternalStore,o=e.useRef,a=e.useEffect,s=e.useMemo,u=e.useDebugValue;return nr.useSyncExternalStoreWithSelector=function(l,c,f,d,h){var m=o(null);if(m.current===null){var p={hasValue:!1,value:null};m.current=p}else p=m.current;m=s(function(){function y(S){if(!v){if(v=!0,x=S,S=d(S),h!==void 0&&p.hasValue){var N=p.value;if(h(N,S))return b=N}return b=S}if(N=b,r(x,S))return N;var T=d(S);return h!==void 0&&h(N,T)?(x=S,N):(x=S,b=T)}var v=!1,x,b,w=f===void 0?null:f;return[function(){return y(c())},w===null?void 0:function(){return y(w())}]},[c,f,d,h]);var g=i(l,m[0],m[1]);return a(function(){p.hasValue=!0,p.value=g},[g]),u(g),g},nr}var uu;function yg(){return uu||(uu=1,tr.exports=gg()),tr.exports}var vg=yg();const bg=Yd(vg),xg={},cu=e=>{let t;const n=new Set,r=(c,f)=>{const d=typeof c=="function"?c(t):c;if(!Object.is(d,t)){const h=t;t=f??(typeof d!="object"||d===null)?d:Object.assign({},t,d),n.forEach(m=>m(t,h))}},i=()=>t,u={setState:r,getState:i,getInitialState:()=>l,subscribe:c=>(n.add(c),()=>n.delete(c)),destroy:()=>{(xg?"production":void 0)!=="production"&&console.warn("[DEPRECATED] The `destroy` method will be unsupported in a future version. Instead use unsubscribe function returned by subscribe. Everything will be garbage-collected if store is garbage-collected."),n.clear()}},l=t=e(r,i,u);return u},_g=e=>e?cu(e):cu,{useDebugValue:wg}=D,{useSyncExternalStoreWithSelector:Eg}=bg,Sg=e=>e;function nh(e,t=Sg,n){const r=Eg(e.subscribe,e.getState,e.getServerState||e.getInitialState,t,n);return wg(r),r}const lu=(e,t)=>{const n=_g(e),r=(i,o=t)=>nh(n,i,o);return Object.assign(r,n),r},Ng=(e,t)=>e?lu(e,t):lu;function Ce(e,t){if(Object.is(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;if(e instanceof Map&&t instanceof Map){if(e.size!==t.size)return!1;for(const[r,i]of e)if(!Object.is(i,t.get(r)))return!1;return!0}if(e instanceof Set&&t instanceof Set){if(e.size!==t.size)return!1;for(const r of e)if(!t.has(r))return!1;return!0}const n=Object.keys(e);if(n.length!==Object.keys(t).length)return!1;for(const r of n)if(!Object.prototype.hasOwnProperty.call(t,r)||!Object.is(e[r],t[r]))return!1;return!0}var Rg={value:()=>{}};function On(){for(var e=0,t=arguments.length,n={},r;e<t;++e){if(!(r=arguments[e]+"")||r in n||/[\s.]/.test(r))throw new Error("illegal type: "+r);n[r]=[]}return new gn(n)}function gn(e){this._=e}function qg(e,t){return e.trim().split(/^|\s+/).map(function(n){var r="",i=n.indexOf(".");if(i>=0&&(r=n.slice(i+1),n=n.slice(0,i)),n&&!t.hasOwnProperty(n))throw new Error("unknown type: "+n);return{type:n,name:r}})}gn.prototype=On.prototype={constructor:gn,on:function(e,t){var n=this._,r=qg(e+"",n),i,o=-1,a=r.length;if(arguments.length<2){for(;++o<a;)if((i=(e=r[o]).type)&&(i=Cg(n[i],e.name)))return i;return}if(t!=null&&typeof t!="function")throw new Error("invalid callback: "+t);for(;++o<a;)if(i=(e=r[o]).type)n[i]=fu(n[i],e.name,t);else if(t==null)for(i in n)n[i]=fu(n[i],e.name,null);return this},copy:function(){var e={},t=this._;for(var n in t)e[n]=t[n].slice();return new gn(e)},call:function(e,t){if((i=arguments.length-2)>0)for(var n=new Array(i),r=0,i,o;r<i;++r)n[r]=arguments[r+2];if(!this._.hasOwnProperty(e))throw new Error("unknown type: "+e);for(o=this._[e],r=0,i=o.length;r<i;++r)o[r].value.apply(t,n)},apply:function(e,t,n){if(!this._.hasOwnProperty(e))throw new Error("unknown type: "+e);for(var r=this._[e],i=0,o=r.length;i<o;++i)r[i].value.apply(t,n)}};function Cg(e,t){for(var n=0,r=e.length,i;n<r;++n)if((i=e[n]).name===t)return i.value}function fu(e,t,n){for(var r=0,i=e.length;r<i;++r)if(e[r].name===t){e[r]=Rg,e=e.slice(0,r).concat(e.slice(r+1));break}return n!=null&&e.push({name:t,value:n}),e}var ts="http://www.w3.org/1999/xhtml";const du={svg:"http://www.w3.org/2000/svg",xhtml:ts,xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"};function Ln(e){var t=e+="",n=t.indexOf(":");return n>=0&&(t=e.slice(0,n))!=="xmlns"&&(e=e.slice(n+1)),du.hasOwnProperty(t)?{space:du[t],local:e}:e}function Ig(e){return function(){var t=this.ownerDocument,n=this.namespaceURI;return n===ts&&t.documentElement.namespaceURI===ts?t.createElement(e):t.createElementNS(n,e)}}function Mg(e){return function(){return this.ownerDocument.createElementNS(e.space,e.local)}}function rh(e){var t=Ln(e);return(t.local?Mg:Ig)(t)}function kg(){}function Rs(e){return e==null?kg:function(){return this.querySelector(e)}}function Ag(e){typeof e!="function"&&(e=Rs(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o=t[i],a=o.length,s=r[i]=new Array(a),u,l,c=0;c<a;++c)(u=o[c])&&(l=e.call(u,u.__data__,c,o))&&("__data__"in u&&(l.__data__=u.__data__),s[c]=l);return new Me(r,this._parents)}function Tg(e){return e==null?[]:Array.isArray(e)?e:Array.from(e)}function Pg(){return[]}function ih(e){return e==null?Pg:function(){return this.querySelectorAll(e)}}function Og(e){return function(){return Tg(e.apply(this,arguments))}}function Lg(e){typeof e=="function"?e=Og(e):e=ih(e);for(var t=this._groups,n=t.length,r=[],i=[],o=0;o<n;++o)for(var a=t[o],s=a.length,u,l=0;l<s;++l)(u=a[l])&&(r.push(e.call(u,u.__data__,l,a)),i.push(u));return new Me(r,i)}function oh(e){return function(){return this.matches(e)}}function ah(e){return function(t){return t.matches(e)}}var $g=Array.prototype.find;function Dg(e){return function(){return $g.call(this.children,e)}}function Fg(){return this.firstElementChild}function zg(e){return this.select(e==null?Fg:Dg(typeof e=="function"?e:ah(e)))}var Bg=Array.prototype.filter;function Hg(){return Array.from(this.children)}function Vg(e){return function(){return Bg.call(this.children,e)}}function jg(e){return this.selectAll(e==null?Hg:Vg(typeof e=="function"?e:ah(e)))}function Gg(e){typeof e!="function"&&(e=oh(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o=t[i],a=o.length,s=r[i]=[],u,l=0;l<a;++l)(u=o[l])&&e.call(u,u.__data__,l,o)&&s.push(u);return new Me(r,this._parents)}function sh(e){return new Array(e.length)}function Ug(){return new Me(this._enter||this._groups.map(sh),this._parents)}function _n(e,t){this.ownerDocument=e.ownerDocument,this.namespaceURI=e.namespaceURI,this._next=null,this._parent=e,this.__data__=t}_n.prototype={constructor:_n,appendChild:function(e){return this._parent.insertBefore(e,this._next)},insertBefore:function(e,t){return this._parent.insertBefore(e,t)},querySelector:function(e){return this._parent.querySelector(e)},querySelectorAll:function(e){return this._parent.querySelectorAll(e)}};function Yg(e){return function(){return e}}function Wg(e,t,n,r,i,o){for(var a=0,s,u=t.length,l=o.length;a<l;++a)(s=t[a])?(s.__data__=o[a],r[a]=s):n[a]=new _n(e,o[a]);for(;a<u;++a)(s=t[a])&&(i[a]=s)}function Kg(e,t,n,r,i,o,a){var s,u,l=new Map,c=t.length,f=o.length,d=new Array(c),h;for(s=0;s<c;++s)(u=t[s])&&(d[s]=h=a.call(u,u.__data__,s,t)+"",l.has(h)?i[s]=u:l.set(h,u));for(s=0;s<f;++s)h=a.call(e,o[s],s,o)+"",(u=l.get(h))?(r[s]=u,u.__data__=o[s],l.delete(h)):n[s]=new _n(e,o[s]);for(s=0;s<c;++s)(u=t[s])&&l.get(d[s])===u&&(i[s]=u)}function Xg(e){return e.__data__}function Zg(e,t){if(!arguments.length)return Array.from(this,Xg);var n=t?Kg:Wg,r=this._parents,i=this._groups;typeof e!="function"&&(e=Yg(e));for(var o=i.length,a=new Array(o),s=new Array(o),u=new Array(o),l=0;l<o;++l){var c=r[l],f=i[l],d=f.length,h=Qg(e.call(c,c&&c.__data__,l,r)),m=h.length,p=s[l]=new Array(m),g=a[l]=new Array(m),y=u[l]=new Array(d);n(c,f,p,g,y,h,t);for(var v=0,x=0,b,w;v<m;++v)if(b=p[v]){for(v>=x&&(x=v+1);!(w=g[x])&&++x<m;);b._next=w||null}}return a=new Me(a,r),a._enter=s,a._exit=u,a}function Qg(e){return typeof e=="object"&&"length"in e?e:Array.from(e)}function Jg(){return new Me(this._exit||this._groups.map(sh),this._parents)}function ey(e,t,n){var r=this.enter(),i=this,o=this.exit();return typeof e=="function"?(r=e(r),r&&(r=r.selection())):r=r.append(e+""),t!=null&&(i=t(i),i&&(i=i.selection())),n==null?o.remove():n(o),r&&i?r.merge(i).order():i}function ty(e){for(var t=e.selection?e.selection():e,n=this._groups,r=t._groups,i=n.length,o=r.length,a=Math.min(i,o),s=new Array(i),u=0;u<a;++u)for(var l=n[u],c=r[u],f=l.length,d=s[u]=new Array(f),h,m=0;m<f;++m)(h=l[m]||c[m])&&(d[m]=h);for(;u<i;++u)s[u]=n[u];return new Me(s,this._parents)}function ny(){for(var e=this._groups,t=-1,n=e.length;++t<n;)for(var r=e[t],i=r.length-1,o=r[i],a;--i>=0;)(a=r[i])&&(o&&a.compareDocumentPosition(o)^4&&o.parentNode.insertBefore(a,o),o=a);return this}function ry(e){e||(e=iy);function t(f,d){return f&&d?e(f.__data__,d.__data__):!f-!d}for(var n=this._groups,r=n.length,i=new Array(r),o=0;o<r;++o){for(var a=n[o],s=a.length,u=i[o]=new Array(s),l,c=0;c<s;++c)(l=a[c])&&(u[c]=l);u.sort(t)}return new Me(i,this._parents).order()}function iy(e,t){return e<t?-1:e>t?1:e>=t?0:NaN}function oy(){var e=arguments[0];return arguments[0]=this,e.apply(null,arguments),this}function ay(){return Array.from(this)}function sy(){for(var e=this._groups,t=0,n=e.length;t<n;++t)for(var r=e[t],i=0,o=r.length;i<o;++i){var a=r[i];if(a)return a}return null}function uy(){let e=0;for(const t of this)++e;return e}function cy(){return!this.node()}function ly(e){for(var t=this._groups,n=0,r=t.length;n<r;++n)for(var i=t[n],o=0,a=i.length,s;o<a;++o)(s=i[o])&&e.call(s,s.__data__,o,i);return this}function fy(e){return function(){this.removeAttribute(e)}}function dy(e){return function(){this.removeAttributeNS(e.space,e.local)}}function hy(e,t){return function(){this.setAttribute(e,t)}}function py(e,t){return function(){this.setAttributeNS(e.space,e.local,t)}}function my(e,t){return function(){var n=t.apply(this,arguments);n==null?this.removeAttribute(e):this.setAttribute(e,n)}}function gy(e,t){return function(){var n=t.apply(this,arguments);n==null?this.removeAttributeNS(e.space,e.local):this.setAttributeNS(e.space,e.local,n)}}function yy(e,t){var n=Ln(e);if(arguments.length<2){var r=this.node();return n.local?r.getAttributeNS(n.space,n.local):r.getAttribute(n)}return this.each((t==null?n.local?dy:fy:typeof t=="function"?n.local?gy:my:n.local?py:hy)(n,t))}function uh(e){return e.ownerDocument&&e.ownerDocument.defaultView||e.document&&e||e.defaultView}function vy(e){return function(){this.style.removeProperty(e)}}function by(e,t,n){return function(){this.style.setProperty(e,t,n)}}function xy(e,t,n){return function(){var r=t.apply(this,arguments);r==null?this.style.removeProperty(e):this.style.setProperty(e,r,n)}}function _y(e,t,n){return arguments.length>1?this.each((t==null?vy:typeof t=="function"?xy:by)(e,t,n??"")):Rt(this.node(),e)}function Rt(e,t){return e.style.getPropertyValue(t)||uh(e).getComputedStyle(e,null).getPropertyValue(t)}function wy(e){return function(){delete this[e]}}function Ey(e,t){return function(){this[e]=t}}function Sy(e,t){return function(){var n=t.apply(this,arguments);n==null?delete this[e]:this[e]=n}}function Ny(e,t){return arguments.length>1?this.each((t==null?wy:typeof t=="function"?Sy:Ey)(e,t)):this.node()[e]}function ch(e){return e.trim().split(/^|\s+/)}function qs(e){return e.classList||new lh(e)}function lh(e){this._node=e,this._names=ch(e.getAttribute("class")||"")}lh.prototype={add:function(e){var t=this._names.indexOf(e);t<0&&(this._names.push(e),this._node.setAttribute("class",this._names.join(" ")))},remove:function(e){var t=this._names.indexOf(e);t>=0&&(this._names.splice(t,1),this._node.setAttribute("class",this._names.join(" ")))},contains:function(e){return this._names.indexOf(e)>=0}};function fh(e,t){for(var n=qs(e),r=-1,i=t.length;++r<i;)n.add(t[r])}function dh(e,t){for(var n=qs(e),r=-1,i=t.length;++r<i;)n.remove(t[r])}function Ry(e){return function(){fh(this,e)}}function qy(e){return function(){dh(this,e)}}function Cy(e,t){return function(){(t.apply(this,arguments)?fh:dh)(this,e)}}function Iy(e,t){var n=ch(e+"");if(arguments.length<2){for(var r=qs(this.node()),i=-1,o=n.length;++i<o;)if(!r.contains(n[i]))return!1;return!0}return this.each((typeof t=="function"?Cy:t?Ry:qy)(n,t))}function My(){this.textContent=""}function ky(e){return function(){this.textContent=e}}function Ay(e){return function(){var t=e.apply(this,arguments);this.textContent=t??""}}function Ty(e){return arguments.length?this.each(e==null?My:(typeof e=="function"?Ay:ky)(e)):this.node().textContent}function Py(){this.innerHTML=""}function Oy(e){return function(){this.innerHTML=e}}function Ly(e){return function(){var t=e.apply(this,arguments);this.innerHTML=t??""}}function $y(e){return arguments.length?this.each(e==null?Py:(typeof e=="function"?Ly:Oy)(e)):this.node().innerHTML}function Dy(){this.nextSibling&&this.parentNode.appendChild(this)}function Fy(){return this.each(Dy)}function zy(){this.previousSibling&&this.parentNode.insertBefore(this,this.parentNode.firstChild)}function By(){return this.each(zy)}function Hy(e){var t=typeof e=="function"?e:rh(e);return this.select(function(){return this.appendChild(t.apply(this,arguments))})}function Vy(){return null}function jy(e,t){var n=typeof e=="function"?e:rh(e),r=t==null?Vy:typeof t=="function"?t:Rs(t);return this.select(function(){return this.insertBefore(n.apply(this,arguments),r.apply(this,arguments)||null)})}function Gy(){var e=this.parentNode;e&&e.removeChild(this)}function Uy(){return this.each(Gy)}function Yy(){var e=this.cloneNode(!1),t=this.parentNode;return t?t.insertBefore(e,this.nextSibling):e}function Wy(){var e=this.cloneNode(!0),t=this.parentNode;return t?t.insertBefore(e,this.nextSibling):e}function Ky(e){return this.select(e?Wy:Yy)}function Xy(e){return arguments.length?this.property("__data__",e):this.node().__data__}function Zy(e){return function(t){e.call(this,t,this.__data__)}}function Qy(e){return e.trim().split(/^|\s+/).map(function(t){var n="",r=t.indexOf(".");return r>=0&&(n=t.slice(r+1),t=t.slice(0,r)),{type:t,name:n}})}function Jy(e){return function(){var t=this.__on;if(t){for(var n=0,r=-1,i=t.length,o;n<i;++n)o=t[n],(!e.type||o.type===e.type)&&o.name===e.name?this.removeEventListener(o.type,o.listener,o.options):t[++r]=o;++r?t.length=r:delete this.__on}}}function ev(e,t,n){return function(){var r=this.__on,i,o=Zy(t);if(r){for(var a=0,s=r.length;a<s;++a)if((i=r[a]).type===e.type&&i.name===e.name){this.removeEventListener(i.type,i.listener,i.options),this.addEventListener(i.type,i.listener=o,i.options=n),i.value=t;return}}this.addEventListener(e.type,o,n),i={type:e.type,name:e.name,value:t,listener:o,options:n},r?r.push(i):this.__on=[i]}}function tv(e,t,n){var r=Qy(e+""),i,o=r.length,a;if(arguments.length<2){var s=this.node().__on;if(s){for(var u=0,l=s.length,c;u<l;++u)for(i=0,c=s[u];i<o;++i)if((a=r[i]).type===c.type&&a.name===c.name)return c.value}return}for(s=t?ev:Jy,i=0;i<o;++i)this.each(s(r[i],t,n));return this}function hh(e,t,n){var r=uh(e),i=r.CustomEvent;typeof i=="function"?i=new i(t,n):(i=r.document.createEvent("Event"),n?(i.initEvent(t,n.bubbles,n.cancelable),i.detail=n.detail):i.initEvent(t,!1,!1)),e.dispatchEvent(i)}function nv(e,t){return function(){return hh(this,e,t)}}function rv(e,t){return function(){return hh(this,e,t.apply(this,arguments))}}function iv(e,t){return this.each((typeof t=="function"?rv:nv)(e,t))}function*ov(){for(var e=this._groups,t=0,n=e.length;t<n;++t)for(var r=e[t],i=0,o=r.length,a;i<o;++i)(a=r[i])&&(yield a)}var ph=[null];function Me(e,t){this._groups=e,this._parents=t}function Jt(){return new Me([[document.documentElement]],ph)}function av(){return this}Me.prototype=Jt.prototype={constructor:Me,select:Ag,selectAll:Lg,selectChild:zg,selectChildren:jg,filter:Gg,data:Zg,enter:Ug,exit:Jg,join:ey,merge:ty,selection:av,order:ny,sort:ry,call:oy,nodes:ay,node:sy,size:uy,empty:cy,each:ly,attr:yy,style:_y,property:Ny,classed:Iy,text:Ty,html:$y,raise:Fy,lower:By,append:Hy,insert:jy,remove:Uy,clone:Ky,datum:Xy,on:tv,dispatch:iv,[Symbol.iterator]:ov};function Ae(e){return typeof e=="string"?new Me([[document.querySelector(e)]],[document.documentElement]):new Me([[e]],ph)}function sv(e){let t;for(;t=e.sourceEvent;)e=t;return e}function Oe(e,t){if(e=sv(e),t===void 0&&(t=e.currentTarget),t){var n=t.ownerSVGElement||t;if(n.createSVGPoint){var r=n.createSVGPoint();return r.x=e.clientX,r.y=e.clientY,r=r.matrixTransform(t.getScreenCTM().inverse()),[r.x,r.y]}if(t.getBoundingClientRect){var i=t.getBoundingClientRect();return[e.clientX-i.left-t.clientLeft,e.clientY-i.top-t.clientTop]}}return[e.pageX,e.pageY]}const uv={passive:!1},jt={capture:!0,passive:!1};function or(e){e.stopImmediatePropagation()}function wt(e){e.preventDefault(),e.stopImmediatePropagation()}function mh(e){var t=e.document.documentElement,n=Ae(e).on("dragstart.drag",wt,jt);"onselectstart"in t?n.on("selectstart.drag",wt,jt):(t.__noselect=t.style.MozUserSelect,t.style.MozUserSelect="none")}function gh(e,t){var n=e.document.documentElement,r=Ae(e).on("dragstart.drag",null);t&&(r.on("click.drag",wt,jt),setTimeout(function(){r.on("click.drag",null)},0)),"onselectstart"in n?r.on("selectstart.drag",null):(n.style.MozUserSelect=n.__noselect,delete n.__noselect)}const rn=e=>()=>e;function ns(e,{sourceEvent:t,subject:n,target:r,identifier:i,active:o,x:a,y:s,dx:u,dy:l,dispatch:c}){Object.defineProperties(this,{type:{value:e,enumerable:!0,configurable:!0},sourceEvent:{value:t,enumerable:!0,configurable:!0},subject:{value:n,enumerable:!0,configurable:!0},target:{value:r,enumerable:!0,configurable:!0},identifier:{value:i,enumerable:!0,configurable:!0},active:{value:o,enumerable:!0,configurable:!0},x:{value:a,enumerable:!0,configurable:!0},y:{value:s,enumerable:!0,configurable:!0},dx:{value:u,enumerable:!0,configurable:!0},dy:{value:l,enumerable:!0,configurable:!0},_:{value:c}})}ns.prototype.on=function(){var e=this._.on.apply(this._,arguments);return e===this._?this:e};function cv(e){return!e.ctrlKey&&!e.button}function lv(){return this.parentNode}function fv(e,t){return t??{x:e.x,y:e.y}}function dv(){return navigator.maxTouchPoints||"ontouchstart"in this}function hv(){var e=cv,t=lv,n=fv,r=dv,i={},o=On("start","drag","end"),a=0,s,u,l,c,f=0;function d(b){b.on("mousedown.drag",h).filter(r).on("touchstart.drag",g).on("touchmove.drag",y,uv).on("touchend.drag touchcancel.drag",v).style("touch-action","none").style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function h(b,w){if(!(c||!e.call(this,b,w))){var S=x(this,t.call(this,b,w),b,w,"mouse");S&&(Ae(b.view).on("mousemove.drag",m,jt).on("mouseup.drag",p,jt),mh(b.view),or(b),l=!1,s=b.clientX,u=b.clientY,S("start",b))}}function m(b){if(wt(b),!l){var w=b.clientX-s,S=b.clientY-u;l=w*w+S*S>f}i.mouse("drag",b)}function p(b){Ae(b.view).on("mousemove.drag mouseup.drag",null),gh(b.view,l),wt(b),i.mouse("end",b)}function g(b,w){if(e.call(this,b,w)){var S=b.changedTouches,N=t.call(this,b,w),T=S.length,E,k;for(E=0;E<T;++E)(k=x(this,N,b,w,S[E].identifier,S[E]))&&(or(b),k("start",b,S[E]))}}function y(b){var w=b.changedTouches,S=w.length,N,T;for(N=0;N<S;++N)(T=i[w[N].identifier])&&(wt(b),T("drag",b,w[N]))}function v(b){var w=b.changedTouches,S=w.length,N,T;for(c&&clearTimeout(c),c=setTimeout(function(){c=null},500),N=0;N<S;++N)(T=i[w[N].identifier])&&(or(b),T("end",b,w[N]))}function x(b,w,S,N,T,E){var k=o.copy(),C=Oe(E||S,w),O,P,_;if((_=n.call(b,new ns("beforestart",{sourceEvent:S,target:d,identifier:T,active:a,x:C[0],y:C[1],dx:0,dy:0,dispatch:k}),N))!=null)return O=_.x-C[0]||0,P=_.y-C[1]||0,function M(I,B,$){var A=C,z;switch(I){case"start":i[T]=M,z=a++;break;case"end":delete i[T],--a;case"drag":C=Oe($||B,w),z=a;break}k.call(I,b,new ns(I,{sourceEvent:B,subject:_,target:d,identifier:T,active:z,x:C[0]+O,y:C[1]+P,dx:C[0]-A[0],dy:C[1]-A[1],dispatch:k}),N)}}return d.filter=function(b){return arguments.length?(e=typeof b=="function"?b:rn(!!b),d):e},d.container=function(b){return arguments.length?(t=typeof b=="function"?b:rn(b),d):t},d.subject=function(b){return arguments.length?(n=typeof b=="function"?b:rn(b),d):n},d.touchable=function(b){return arguments.length?(r=typeof b=="function"?b:rn(!!b),d):r},d.on=function(){var b=o.on.apply(o,arguments);return b===o?d:b},d.clickDistance=function(b){return arguments.length?(f=(b=+b)*b,d):Math.sqrt(f)},d}function Cs(e,t,n){e.prototype=t.prototype=n,n.constructor=e}function yh(e,t){var n=Object.create(e.prototype);for(var r in t)n[r]=t[r];return n}function en(){}var Gt=.7,wn=1/Gt,Et="\\s*([+-]?\\d+)\\s*",Ut="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",He="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",pv=/^#([0-9a-f]{3,8})$/,mv=new RegExp(`^rgb\\(${Et},${Et},${Et}\\)$`),gv=new RegExp(`^rgb\\(${He},${He},${He}\\)$`),yv=new RegExp(`^rgba\\(${Et},${Et},${Et},${Ut}\\)$`),vv=new RegExp(`^rgba\\(${He},${He},${He},${Ut}\\)$`),bv=new RegExp(`^hsl\\(${Ut},${He},${He}\\)$`),xv=new RegExp(`^hsla\\(${Ut},${He},${He},${Ut}\\)$`),hu={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};Cs(en,Yt,{copy(e){return Object.assign(new this.constructor,this,e)},displayable(){return this.rgb().displayable()},hex:pu,formatHex:pu,formatHex8:_v,formatHsl:wv,formatRgb:mu,toString:mu});function pu(){return this.rgb().formatHex()}function _v(){return this.rgb().formatHex8()}function wv(){return vh(this).formatHsl()}function mu(){return this.rgb().formatRgb()}function Yt(e){var t,n;return e=(e+"").trim().toLowerCase(),(t=pv.exec(e))?(n=t[1].length,t=parseInt(t[1],16),n===6?gu(t):n===3?new Re(t>>8&15|t>>4&240,t>>4&15|t&240,(t&15)<<4|t&15,1):n===8?on(t>>24&255,t>>16&255,t>>8&255,(t&255)/255):n===4?on(t>>12&15|t>>8&240,t>>8&15|t>>4&240,t>>4&15|t&240,((t&15)<<4|t&15)/255):null):(t=mv.exec(e))?new Re(t[1],t[2],t[3],1):(t=gv.exec(e))?new Re(t[1]*255/100,t[2]*255/100,t[3]*255/100,1):(t=yv.exec(e))?on(t[1],t[2],t[3],t[4]):(t=vv.exec(e))?on(t[1]*255/100,t[2]*255/100,t[3]*255/100,t[4]):(t=bv.exec(e))?bu(t[1],t[2]/100,t[3]/100,1):(t=xv.exec(e))?bu(t[1],t[2]/100,t[3]/100,t[4]):hu.hasOwnProperty(e)?gu(hu[e]):e==="transparent"?new Re(NaN,NaN,NaN,0):null}function gu(e){return new Re(e>>16&255,e>>8&255,e&255,1)}function on(e,t,n,r){return r<=0&&(e=t=n=NaN),new Re(e,t,n,r)}function Ev(e){return e instanceof en||(e=Yt(e)),e?(e=e.rgb(),new Re(e.r,e.g,e.b,e.opacity)):new Re}function rs(e,t,n,r){return arguments.length===1?Ev(e):new Re(e,t,n,r??1)}function Re(e,t,n,r){this.r=+e,this.g=+t,this.b=+n,this.opacity=+r}Cs(Re,rs,yh(en,{brighter(e){return e=e==null?wn:Math.pow(wn,e),new Re(this.r*e,this.g*e,this.b*e,this.opacity)},darker(e){return e=e==null?Gt:Math.pow(Gt,e),new Re(this.r*e,this.g*e,this.b*e,this.opacity)},rgb(){return this},clamp(){return new Re(ct(this.r),ct(this.g),ct(this.b),En(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:yu,formatHex:yu,formatHex8:Sv,formatRgb:vu,toString:vu}));function yu(){return`#${st(this.r)}${st(this.g)}${st(this.b)}`}function Sv(){return`#${st(this.r)}${st(this.g)}${st(this.b)}${st((isNaN(this.opacity)?1:this.opacity)*255)}`}function vu(){const e=En(this.opacity);return`${e===1?"rgb(":"rgba("}${ct(this.r)}, ${ct(this.g)}, ${ct(this.b)}${e===1?")":`, ${e})`}`}function En(e){return isNaN(e)?1:Math.max(0,Math.min(1,e))}function ct(e){return Math.max(0,Math.min(255,Math.round(e)||0))}function st(e){return e=ct(e),(e<16?"0":"")+e.toString(16)}function bu(e,t,n,r){return r<=0?e=t=n=NaN:n<=0||n>=1?e=t=NaN:t<=0&&(e=NaN),new Le(e,t,n,r)}function vh(e){if(e instanceof Le)return new Le(e.h,e.s,e.l,e.opacity);if(e instanceof en||(e=Yt(e)),!e)return new Le;if(e instanceof Le)return e;e=e.rgb();var t=e.r/255,n=e.g/255,r=e.b/255,i=Math.min(t,n,r),o=Math.max(t,n,r),a=NaN,s=o-i,u=(o+i)/2;return s?(t===o?a=(n-r)/s+(n<r)*6:n===o?a=(r-t)/s+2:a=(t-n)/s+4,s/=u<.5?o+i:2-o-i,a*=60):s=u>0&&u<1?0:a,new Le(a,s,u,e.opacity)}function Nv(e,t,n,r){return arguments.length===1?vh(e):new Le(e,t,n,r??1)}function Le(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}Cs(Le,Nv,yh(en,{brighter(e){return e=e==null?wn:Math.pow(wn,e),new Le(this.h,this.s,this.l*e,this.opacity)},darker(e){return e=e==null?Gt:Math.pow(Gt,e),new Le(this.h,this.s,this.l*e,this.opacity)},rgb(){var e=this.h%360+(this.h<0)*360,t=isNaN(e)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*t,i=2*n-r;return new Re(ar(e>=240?e-240:e+120,i,r),ar(e,i,r),ar(e<120?e+240:e-120,i,r),this.opacity)},clamp(){return new Le(xu(this.h),an(this.s),an(this.l),En(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const e=En(this.opacity);return`${e===1?"hsl(":"hsla("}${xu(this.h)}, ${an(this.s)*100}%, ${an(this.l)*100}%${e===1?")":`, ${e})`}`}}));function xu(e){return e=(e||0)%360,e<0?e+360:e}function an(e){return Math.max(0,Math.min(1,e||0))}function ar(e,t,n){return(e<60?t+(n-t)*e/60:e<180?n:e<240?t+(n-t)*(240-e)/60:t)*255}const bh=e=>()=>e;function Rv(e,t){return function(n){return e+n*t}}function qv(e,t,n){return e=Math.pow(e,n),t=Math.pow(t,n)-e,n=1/n,function(r){return Math.pow(e+r*t,n)}}function Cv(e){return(e=+e)==1?xh:function(t,n){return n-t?qv(t,n,e):bh(isNaN(t)?n:t)}}function xh(e,t){var n=t-e;return n?Rv(e,n):bh(isNaN(e)?t:e)}const _u=(function e(t){var n=Cv(t);function r(i,o){var a=n((i=rs(i)).r,(o=rs(o)).r),s=n(i.g,o.g),u=n(i.b,o.b),l=xh(i.opacity,o.opacity);return function(c){return i.r=a(c),i.g=s(c),i.b=u(c),i.opacity=l(c),i+""}}return r.gamma=e,r})(1);function Je(e,t){return e=+e,t=+t,function(n){return e*(1-n)+t*n}}var is=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,sr=new RegExp(is.source,"g");function Iv(e){return function(){return e}}function Mv(e){return function(t){return e(t)+""}}function kv(e,t){var n=is.lastIndex=sr.lastIndex=0,r,i,o,a=-1,s=[],u=[];for(e=e+"",t=t+"";(r=is.exec(e))&&(i=sr.exec(t));)(o=i.index)>n&&(o=t.slice(n,o),s[a]?s[a]+=o:s[++a]=o),(r=r[0])===(i=i[0])?s[a]?s[a]+=i:s[++a]=i:(s[++a]=null,u.push({i:a,x:Je(r,i)})),n=sr.lastIndex;return n<t.length&&(o=t.slice(n),s[a]?s[a]+=o:s[++a]=o),s.length<2?u[0]?Mv(u[0].x):Iv(t):(t=u.length,function(l){for(var c=0,f;c<t;++c)s[(f=u[c]).i]=f.x(l);return s.join("")})}var wu=180/Math.PI,os={translateX:0,translateY:0,rotate:0,skewX:0,scaleX:1,scaleY:1};function _h(e,t,n,r,i,o){var a,s,u;return(a=Math.sqrt(e*e+t*t))&&(e/=a,t/=a),(u=e*n+t*r)&&(n-=e*u,r-=t*u),(s=Math.sqrt(n*n+r*r))&&(n/=s,r/=s,u/=s),e*r<t*n&&(e=-e,t=-t,u=-u,a=-a),{translateX:i,translateY:o,rotate:Math.atan2(t,e)*wu,skewX:Math.atan(u)*wu,scaleX:a,scaleY:s}}var sn;function Av(e){const t=new(typeof DOMMatrix=="function"?DOMMatrix:WebKitCSSMatrix)(e+"");return t.isIdentity?os:_h(t.a,t.b,t.c,t.d,t.e,t.f)}function Tv(e){return e==null||(sn||(sn=document.createElementNS("http://www.w3.org/2000/svg","g")),sn.setAttribute("transform",e),!(e=sn.transform.baseVal.consolidate()))?os:(e=e.matrix,_h(e.a,e.b,e.c,e.d,e.e,e.f))}function wh(e,t,n,r){function i(l){return l.length?l.pop()+" ":""}function o(l,c,f,d,h,m){if(l!==f||c!==d){var p=h.push("translate(",null,t,null,n);m.push({i:p-4,x:Je(l,f)},{i:p-2,x:Je(c,d)})}else(f||d)&&h.push("translate("+f+t+d+n)}function a(l,c,f,d){l!==c?(l-c>180?c+=360:c-l>180&&(l+=360),d.push({i:f.push(i(f)+"rotate(",null,r)-2,x:Je(l,c)})):c&&f.push(i(f)+"rotate("+c+r)}function s(l,c,f,d){l!==c?d.push({i:f.push(i(f)+"skewX(",null,r)-2,x:Je(l,c)}):c&&f.push(i(f)+"skewX("+c+r)}function u(l,c,f,d,h,m){if(l!==f||c!==d){var p=h.push(i(h)+"scale(",null,",",null,")");m.push({i:p-4,x:Je(l,f)},{i:p-2,x:Je(c,d)})}else(f!==1||d!==1)&&h.push(i(h)+"scale("+f+","+d+")")}return function(l,c){var f=[],d=[];return l=e(l),c=e(c),o(l.translateX,l.translateY,c.translateX,c.translateY,f,d),a(l.rotate,c.rotate,f,d),s(l.skewX,c.skewX,f,d),u(l.scaleX,l.scaleY,c.scaleX,c.scaleY,f,d),l=c=null,function(h){for(var m=-1,p=d.length,g;++m<p;)f[(g=d[m]).i]=g.x(h);return f.join("")}}}var Pv=wh(Av,"px, ","px)","deg)"),Ov=wh(Tv,", ",")",")"),Lv=1e-12;function Eu(e){return((e=Math.exp(e))+1/e)/2}function $v(e){return((e=Math.exp(e))-1/e)/2}function Dv(e){return((e=Math.exp(2*e))-1)/(e+1)}const Fv=(function e(t,n,r){function i(o,a){var s=o[0],u=o[1],l=o[2],c=a[0],f=a[1],d=a[2],h=c-s,m=f-u,p=h*h+m*m,g,y;if(p<Lv)y=Math.log(d/l)/t,g=function(N){return[s+N*h,u+N*m,l*Math.exp(t*N*y)]};else{var v=Math.sqrt(p),x=(d*d-l*l+r*p)/(2*l*n*v),b=(d*d-l*l-r*p)/(2*d*n*v),w=Math.log(Math.sqrt(x*x+1)-x),S=Math.log(Math.sqrt(b*b+1)-b);y=(S-w)/t,g=function(N){var T=N*y,E=Eu(w),k=l/(n*v)*(E*Dv(t*T+w)-$v(w));return[s+k*h,u+k*m,l*E/Eu(t*T+w)]}}return g.duration=y*1e3*t/Math.SQRT2,g}return i.rho=function(o){var a=Math.max(.001,+o),s=a*a,u=s*s;return e(a,s,u)},i})(Math.SQRT2,2,4);var qt=0,zt=0,Ot=0,Eh=1e3,Sn,Bt,Nn=0,ft=0,$n=0,Wt=typeof performance=="object"&&performance.now?performance:Date,Sh=typeof window=="object"&&window.requestAnimationFrame?window.requestAnimationFrame.bind(window):function(e){setTimeout(e,17)};function Is(){return ft||(Sh(zv),ft=Wt.now()+$n)}function zv(){ft=0}function Rn(){this._call=this._time=this._next=null}Rn.prototype=Nh.prototype={constructor:Rn,restart:function(e,t,n){if(typeof e!="function")throw new TypeError("callback is not a function");n=(n==null?Is():+n)+(t==null?0:+t),!this._next&&Bt!==this&&(Bt?Bt._next=this:Sn=this,Bt=this),this._call=e,this._time=n,as()},stop:function(){this._call&&(this._call=null,this._time=1/0,as())}};function Nh(e,t,n){var r=new Rn;return r.restart(e,t,n),r}function Bv(){Is(),++qt;for(var e=Sn,t;e;)(t=ft-e._time)>=0&&e._call.call(void 0,t),e=e._next;--qt}function Su(){ft=(Nn=Wt.now())+$n,qt=zt=0;try{Bv()}finally{qt=0,Vv(),ft=0}}function Hv(){var e=Wt.now(),t=e-Nn;t>Eh&&($n-=t,Nn=e)}function Vv(){for(var e,t=Sn,n,r=1/0;t;)t._call?(r>t._time&&(r=t._time),e=t,t=t._next):(n=t._next,t._next=null,t=e?e._next=n:Sn=n);Bt=e,as(r)}function as(e){if(!qt){zt&&(zt=clearTimeout(zt));var t=e-ft;t>24?(e<1/0&&(zt=setTimeout(Su,e-Wt.now()-$n)),Ot&&(Ot=clearInterval(Ot))):(Ot||(Nn=Wt.now(),Ot=setInterval(Hv,Eh)),qt=1,Sh(Su))}}function Nu(e,t,n){var r=new Rn;return t=t==null?0:+t,r.restart(i=>{r.stop(),e(i+t)},t,n),r}var jv=On("start","end","cancel","interrupt"),Gv=[],Rh=0,Ru=1,ss=2,yn=3,qu=4,us=5,vn=6;function Dn(e,t,n,r,i,o){var a=e.__transition;if(!a)e.__transition={};else if(n in a)return;Uv(e,n,{name:t,index:r,group:i,on:jv,tween:Gv,time:o.time,delay:o.delay,duration:o.duration,ease:o.ease,timer:null,state:Rh})}function Ms(e,t){var n=Fe(e,t);if(n.state>Rh)throw new Error("too late; already scheduled");return n}function je(e,t){var n=Fe(e,t);if(n.state>yn)throw new Error("too late; already running");return n}function Fe(e,t){var n=e.__transition;if(!n||!(n=n[t]))throw new Error("transition not found");return n}function Uv(e,t,n){var r=e.__transition,i;r[t]=n,n.timer=Nh(o,0,n.time);function o(l){n.state=Ru,n.timer.restart(a,n.delay,n.time),n.delay<=l&&a(l-n.delay)}function a(l){var c,f,d,h;if(n.state!==Ru)return u();for(c in r)if(h=r[c],h.name===n.name){if(h.state===yn)return Nu(a);h.state===qu?(h.state=vn,h.timer.stop(),h.on.call("interrupt",e,e.__data__,h.index,h.group),delete r[c]):+c<t&&(h.state=vn,h.timer.stop(),h.on.call("cancel",e,e.__data__,h.index,h.group),delete r[c])}if(Nu(function(){n.state===yn&&(n.state=qu,n.timer.restart(s,n.delay,n.time),s(l))}),n.state=ss,n.on.call("start",e,e.__data__,n.index,n.group),n.state===ss){for(n.state=yn,i=new Array(d=n.tween.length),c=0,f=-1;c<d;++c)(h=n.tween[c].value.call(e,e.__data__,n.index,n.group))&&(i[++f]=h);i.length=f+1}}function s(l){for(var c=l<n.duration?n.ease.call(null,l/n.duration):(n.timer.restart(u),n.state=us,1),f=-1,d=i.length;++f<d;)i[f].call(e,c);n.state===us&&(n.on.call("end",e,e.__data__,n.index,n.group),u())}function u(){n.state=vn,n.timer.stop(),delete r[t];for(var l in r)return;delete e.__transition}}function bn(e,t){var n=e.__transition,r,i,o=!0,a;if(n){t=t==null?null:t+"";for(a in n){if((r=n[a]).name!==t){o=!1;continue}i=r.state>ss&&r.state<us,r.state=vn,r.timer.stop(),r.on.call(i?"interrupt":"cancel",e,e.__data__,r.index,r.group),delete n[a]}o&&delete e.__transition}}function Yv(e){return this.each(function(){bn(this,e)})}function Wv(e,t){var n,r;return function(){var i=je(this,e),o=i.tween;if(o!==n){r=n=o;for(var a=0,s=r.length;a<s;++a)if(r[a].name===t){r=r.slice(),r.splice(a,1);break}}i.tween=r}}function Kv(e,t,n){var r,i;if(typeof n!="function")throw new Error;return function(){var o=je(this,e),a=o.tween;if(a!==r){i=(r=a).slice();for(var s={name:t,value:n},u=0,l=i.length;u<l;++u)if(i[u].name===t){i[u]=s;break}u===l&&i.push(s)}o.tween=i}}function Xv(e,t){var n=this._id;if(e+="",arguments.length<2){for(var r=Fe(this.node(),n).tween,i=0,o=r.length,a;i<o;++i)if((a=r[i]).name===e)return a.value;return null}return this.each((t==null?Wv:Kv)(n,e,t))}function ks(e,t,n){var r=e._id;return e.each(function(){var i=je(this,r);(i.value||(i.value={}))[t]=n.apply(this,arguments)}),function(i){return Fe(i,r).value[t]}}function qh(e,t){var n;return(typeof t=="number"?Je:t instanceof Yt?_u:(n=Yt(t))?(t=n,_u):kv)(e,t)}function Zv(e){return function(){this.removeAttribute(e)}}function Qv(e){return function(){this.removeAttributeNS(e.space,e.local)}}function Jv(e,t,n){var r,i=n+"",o;return function(){var a=this.getAttribute(e);return a===i?null:a===r?o:o=t(r=a,n)}}function e0(e,t,n){var r,i=n+"",o;return function(){var a=this.getAttributeNS(e.space,e.local);return a===i?null:a===r?o:o=t(r=a,n)}}function t0(e,t,n){var r,i,o;return function(){var a,s=n(this),u;return s==null?void this.removeAttribute(e):(a=this.getAttribute(e),u=s+"",a===u?null:a===r&&u===i?o:(i=u,o=t(r=a,s)))}}function n0(e,t,n){var r,i,o;return function(){var a,s=n(this),u;return s==null?void this.removeAttributeNS(e.space,e.local):(a=this.getAttributeNS(e.space,e.local),u=s+"",a===u?null:a===r&&u===i?o:(i=u,o=t(r=a,s)))}}function r0(e,t){var n=Ln(e),r=n==="transform"?Ov:qh;return this.attrTween(e,typeof t=="function"?(n.local?n0:t0)(n,r,ks(this,"attr."+e,t)):t==null?(n.local?Qv:Zv)(n):(n.local?e0:Jv)(n,r,t))}function i0(e,t){return function(n){this.setAttribute(e,t.call(this,n))}}function o0(e,t){return function(n){this.setAttributeNS(e.space,e.local,t.call(this,n))}}function a0(e,t){var n,r;function i(){var o=t.apply(this,arguments);return o!==r&&(n=(r=o)&&o0(e,o)),n}return i._value=t,i}function s0(e,t){var n,r;function i(){var o=t.apply(this,arguments);return o!==r&&(n=(r=o)&&i0(e,o)),n}return i._value=t,i}function u0(e,t){var n="attr."+e;if(arguments.length<2)return(n=this.tween(n))&&n._value;if(t==null)return this.tween(n,null);if(typeof t!="function")throw new Error;var r=Ln(e);return this.tween(n,(r.local?a0:s0)(r,t))}function c0(e,t){return function(){Ms(this,e).delay=+t.apply(this,arguments)}}function l0(e,t){return t=+t,function(){Ms(this,e).delay=t}}function f0(e){var t=this._id;return arguments.length?this.each((typeof e=="function"?c0:l0)(t,e)):Fe(this.node(),t).delay}function d0(e,t){return function(){je(this,e).duration=+t.apply(this,arguments)}}function h0(e,t){return t=+t,function(){je(this,e).duration=t}}function p0(e){var t=this._id;return arguments.length?this.each((typeof e=="function"?d0:h0)(t,e)):Fe(this.node(),t).duration}function m0(e,t){if(typeof t!="function")throw new Error;return function(){je(this,e).ease=t}}function g0(e){var t=this._id;return arguments.length?this.each(m0(t,e)):Fe(this.node(),t).ease}function y0(e,t){return function(){var n=t.apply(this,arguments);if(typeof n!="function")throw new Error;je(this,e).ease=n}}function v0(e){if(typeof e!="function")throw new Error;return this.each(y0(this._id,e))}function b0(e){typeof e!="function"&&(e=oh(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o=t[i],a=o.length,s=r[i]=[],u,l=0;l<a;++l)(u=o[l])&&e.call(u,u.__data__,l,o)&&s.push(u);return new Ke(r,this._parents,this._name,this._id)}function x0(e){if(e._id!==this._id)throw new Error;for(var t=this._groups,n=e._groups,r=t.length,i=n.length,o=Math.min(r,i),a=new Array(r),s=0;s<o;++s)for(var u=t[s],l=n[s],c=u.length,f=a[s]=new Array(c),d,h=0;h<c;++h)(d=u[h]||l[h])&&(f[h]=d);for(;s<r;++s)a[s]=t[s];return new Ke(a,this._parents,this._name,this._id)}function _0(e){return(e+"").trim().split(/^|\s+/).every(function(t){var n=t.indexOf(".");return n>=0&&(t=t.slice(0,n)),!t||t==="start"})}function w0(e,t,n){var r,i,o=_0(t)?Ms:je;return function(){var a=o(this,e),s=a.on;s!==r&&(i=(r=s).copy()).on(t,n),a.on=i}}function E0(e,t){var n=this._id;return arguments.length<2?Fe(this.node(),n).on.on(e):this.each(w0(n,e,t))}function S0(e){return function(){var t=this.parentNode;for(var n in this.__transition)if(+n!==e)return;t&&t.removeChild(this)}}function N0(){return this.on("end.remove",S0(this._id))}function R0(e){var t=this._name,n=this._id;typeof e!="function"&&(e=Rs(e));for(var r=this._groups,i=r.length,o=new Array(i),a=0;a<i;++a)for(var s=r[a],u=s.length,l=o[a]=new Array(u),c,f,d=0;d<u;++d)(c=s[d])&&(f=e.call(c,c.__data__,d,s))&&("__data__"in c&&(f.__data__=c.__data__),l[d]=f,Dn(l[d],t,n,d,l,Fe(c,n)));return new Ke(o,this._parents,t,n)}function q0(e){var t=this._name,n=this._id;typeof e!="function"&&(e=ih(e));for(var r=this._groups,i=r.length,o=[],a=[],s=0;s<i;++s)for(var u=r[s],l=u.length,c,f=0;f<l;++f)if(c=u[f]){for(var d=e.call(c,c.__data__,f,u),h,m=Fe(c,n),p=0,g=d.length;p<g;++p)(h=d[p])&&Dn(h,t,n,p,d,m);o.push(d),a.push(c)}return new Ke(o,a,t,n)}var C0=Jt.prototype.constructor;function I0(){return new C0(this._groups,this._parents)}function M0(e,t){var n,r,i;return function(){var o=Rt(this,e),a=(this.style.removeProperty(e),Rt(this,e));return o===a?null:o===n&&a===r?i:i=t(n=o,r=a)}}function Ch(e){return function(){this.style.removeProperty(e)}}function k0(e,t,n){var r,i=n+"",o;return function(){var a=Rt(this,e);return a===i?null:a===r?o:o=t(r=a,n)}}function A0(e,t,n){var r,i,o;return function(){var a=Rt(this,e),s=n(this),u=s+"";return s==null&&(u=s=(this.style.removeProperty(e),Rt(this,e))),a===u?null:a===r&&u===i?o:(i=u,o=t(r=a,s))}}function T0(e,t){var n,r,i,o="style."+t,a="end."+o,s;return function(){var u=je(this,e),l=u.on,c=u.value[o]==null?s||(s=Ch(t)):void 0;(l!==n||i!==c)&&(r=(n=l).copy()).on(a,i=c),u.on=r}}function P0(e,t,n){var r=(e+="")=="transform"?Pv:qh;return t==null?this.styleTween(e,M0(e,r)).on("end.style."+e,Ch(e)):typeof t=="function"?this.styleTween(e,A0(e,r,ks(this,"style."+e,t))).each(T0(this._id,e)):this.styleTween(e,k0(e,r,t),n).on("end.style."+e,null)}function O0(e,t,n){return function(r){this.style.setProperty(e,t.call(this,r),n)}}function L0(e,t,n){var r,i;function o(){var a=t.apply(this,arguments);return a!==i&&(r=(i=a)&&O0(e,a,n)),r}return o._value=t,o}function $0(e,t,n){var r="style."+(e+="");if(arguments.length<2)return(r=this.tween(r))&&r._value;if(t==null)return this.tween(r,null);if(typeof t!="function")throw new Error;return this.tween(r,L0(e,t,n??""))}function D0(e){return function(){this.textContent=e}}function F0(e){return function(){var t=e(this);this.textContent=t??""}}function z0(e){return this.tween("text",typeof e=="function"?F0(ks(this,"text",e)):D0(e==null?"":e+""))}function B0(e){return function(t){this.textContent=e.call(this,t)}}function H0(e){var t,n;function r(){var i=e.apply(this,arguments);return i!==n&&(t=(n=i)&&B0(i)),t}return r._value=e,r}function V0(e){var t="text";if(arguments.length<1)return(t=this.tween(t))&&t._value;if(e==null)return this.tween(t,null);if(typeof e!="function")throw new Error;return this.tween(t,H0(e))}function j0(){for(var e=this._name,t=this._id,n=Ih(),r=this._groups,i=r.length,o=0;o<i;++o)for(var a=r[o],s=a.length,u,l=0;l<s;++l)if(u=a[l]){var c=Fe(u,t);Dn(u,e,n,l,a,{time:c.time+c.delay+c.duration,delay:0,duration:c.duration,ease:c.ease})}return new Ke(r,this._parents,e,n)}function G0(){var e,t,n=this,r=n._id,i=n.size();return new Promise(function(o,a){var s={value:a},u={value:function(){--i===0&&o()}};n.each(function(){var l=je(this,r),c=l.on;c!==e&&(t=(e=c).copy(),t._.cancel.push(s),t._.interrupt.push(s),t._.end.push(u)),l.on=t}),i===0&&o()})}var U0=0;function Ke(e,t,n,r){this._groups=e,this._parents=t,this._name=n,this._id=r}function Ih(){return++U0}var Ue=Jt.prototype;Ke.prototype={constructor:Ke,select:R0,selectAll:q0,selectChild:Ue.selectChild,selectChildren:Ue.selectChildren,filter:b0,merge:x0,selection:I0,transition:j0,call:Ue.call,nodes:Ue.nodes,node:Ue.node,size:Ue.size,empty:Ue.empty,each:Ue.each,on:E0,attr:r0,attrTween:u0,style:P0,styleTween:$0,text:z0,textTween:V0,remove:N0,tween:Xv,delay:f0,duration:p0,ease:g0,easeVarying:v0,end:G0,[Symbol.iterator]:Ue[Symbol.iterator]};function Y0(e){return((e*=2)<=1?e*e*e:(e-=2)*e*e+2)/2}var W0={time:null,delay:0,duration:250,ease:Y0};function K0(e,t){for(var n;!(n=e.__transition)||!(n=n[t]);)if(!(e=e.parentNode))throw new Error(`transition ${t} not found`);return n}function X0(e){var t,n;e instanceof Ke?(t=e._id,e=e._name):(t=Ih(),(n=W0).time=Is(),e=e==null?null:e+"");for(var r=this._groups,i=r.length,o=0;o<i;++o)for(var a=r[o],s=a.length,u,l=0;l<s;++l)(u=a[l])&&Dn(u,e,t,l,a,n||K0(u,t));return new Ke(r,this._parents,e,t)}Jt.prototype.interrupt=Yv;Jt.prototype.transition=X0;const un=e=>()=>e;function Z0(e,{sourceEvent:t,target:n,transform:r,dispatch:i}){Object.defineProperties(this,{type:{value:e,enumerable:!0,configurable:!0},sourceEvent:{value:t,enumerable:!0,configurable:!0},target:{value:n,enumerable:!0,configurable:!0},transform:{value:r,enumerable:!0,configurable:!0},_:{value:i}})}function Ye(e,t,n){this.k=e,this.x=t,this.y=n}Ye.prototype={constructor:Ye,scale:function(e){return e===1?this:new Ye(this.k*e,this.x,this.y)},translate:function(e,t){return e===0&t===0?this:new Ye(this.k,this.x+this.k*e,this.y+this.k*t)},apply:function(e){return[e[0]*this.k+this.x,e[1]*this.k+this.y]},applyX:function(e){return e*this.k+this.x},applyY:function(e){return e*this.k+this.y},invert:function(e){return[(e[0]-this.x)/this.k,(e[1]-this.y)/this.k]},invertX:function(e){return(e-this.x)/this.k},invertY:function(e){return(e-this.y)/this.k},rescaleX:function(e){return e.copy().domain(e.range().map(this.invertX,this).map(e.invert,e))},rescaleY:function(e){return e.copy().domain(e.range().map(this.invertY,this).map(e.invert,e))},toString:function(){return"translate("+this.x+","+this.y+") scale("+this.k+")"}};var We=new Ye(1,0,0);Ye.prototype;function ur(e){e.stopImmediatePropagation()}function Lt(e){e.preventDefault(),e.stopImmediatePropagation()}function Q0(e){return(!e.ctrlKey||e.type==="wheel")&&!e.button}function J0(){var e=this;return e instanceof SVGElement?(e=e.ownerSVGElement||e,e.hasAttribute("viewBox")?(e=e.viewBox.baseVal,[[e.x,e.y],[e.x+e.width,e.y+e.height]]):[[0,0],[e.width.baseVal.value,e.height.baseVal.value]]):[[0,0],[e.clientWidth,e.clientHeight]]}function Cu(){return this.__zoom||We}function eb(e){return-e.deltaY*(e.deltaMode===1?.05:e.deltaMode?1:.002)*(e.ctrlKey?10:1)}function tb(){return navigator.maxTouchPoints||"ontouchstart"in this}function nb(e,t,n){var r=e.invertX(t[0][0])-n[0][0],i=e.invertX(t[1][0])-n[1][0],o=e.invertY(t[0][1])-n[0][1],a=e.invertY(t[1][1])-n[1][1];return e.translate(i>r?(r+i)/2:Math.min(0,r)||Math.max(0,i),a>o?(o+a)/2:Math.min(0,o)||Math.max(0,a))}function Mh(){var e=Q0,t=J0,n=nb,r=eb,i=tb,o=[0,1/0],a=[[-1/0,-1/0],[1/0,1/0]],s=250,u=Fv,l=On("start","zoom","end"),c,f,d,h=500,m=150,p=0,g=10;function y(_){_.property("__zoom",Cu).on("wheel.zoom",T,{passive:!1}).on("mousedown.zoom",E).on("dblclick.zoom",k).filter(i).on("touchstart.zoom",C).on("touchmove.zoom",O).on("touchend.zoom touchcancel.zoom",P).style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}y.transform=function(_,M,I,B){var $=_.selection?_.selection():_;$.property("__zoom",Cu),_!==$?w(_,M,I,B):$.interrupt().each(function(){S(this,arguments).event(B).start().zoom(null,typeof M=="function"?M.apply(this,arguments):M).end()})},y.scaleBy=function(_,M,I,B){y.scaleTo(_,function(){var $=this.__zoom.k,A=typeof M=="function"?M.apply(this,arguments):M;return $*A},I,B)},y.scaleTo=function(_,M,I,B){y.transform(_,function(){var $=t.apply(this,arguments),A=this.__zoom,z=I==null?b($):typeof I=="function"?I.apply(this,arguments):I,H=A.invert(z),V=typeof M=="function"?M.apply(this,arguments):M;return n(x(v(A,V),z,H),$,a)},I,B)},y.translateBy=function(_,M,I,B){y.transform(_,function(){return n(this.__zoom.translate(typeof M=="function"?M.apply(this,arguments):M,typeof I=="function"?I.apply(this,arguments):I),t.apply(this,arguments),a)},null,B)},y.translateTo=function(_,M,I,B,$){y.transform(_,function(){var A=t.apply(this,arguments),z=this.__zoom,H=B==null?b(A):typeof B=="function"?B.apply(this,arguments):B;return n(We.translate(H[0],H[1]).scale(z.k).translate(typeof M=="function"?-M.apply(this,arguments):-M,typeof I=="function"?-I.apply(this,arguments):-I),A,a)},B,$)};function v(_,M){return M=Math.max(o[0],Math.min(o[1],M)),M===_.k?_:new Ye(M,_.x,_.y)}function x(_,M,I){var B=M[0]-I[0]*_.k,$=M[1]-I[1]*_.k;return B===_.x&&$===_.y?_:new Ye(_.k,B,$)}function b(_){return[(+_[0][0]+ +_[1][0])/2,(+_[0][1]+ +_[1][1])/2]}function w(_,M,I,B){_.on("start.zoom",function(){S(this,arguments).event(B).start()}).on("interrupt.zoom end.zoom",function(){S(this,arguments).event(B).end()}).tween("zoom",function(){var $=this,A=arguments,z=S($,A).event(B),H=t.apply($,A),V=I==null?b(H):typeof I=="function"?I.apply($,A):I,Y=Math.max(H[1][0]-H[0][0],H[1][1]-H[0][1]),q=$.__zoom,L=typeof M=="function"?M.apply($,A):M,F=u(q.invert(V).concat(Y/q.k),L.invert(V).concat(Y/L.k));return function(j){if(j===1)j=L;else{var W=F(j),J=Y/W[2];j=new Ye(J,V[0]-W[0]*J,V[1]-W[1]*J)}z.zoom(null,j)}})}function S(_,M,I){return!I&&_.__zooming||new N(_,M)}function N(_,M){this.that=_,this.args=M,this.active=0,this.sourceEvent=null,this.extent=t.apply(_,M),this.taps=0}N.prototype={event:function(_){return _&&(this.sourceEvent=_),this},start:function(){return++this.active===1&&(this.that.__zooming=this,this.emit("start")),this},zoom:function(_,M){return this.mouse&&_!=="mouse"&&(this.mouse[1]=M.invert(this.mouse[0])),this.touch0&&_!=="touch"&&(this.touch0[1]=M.invert(this.touch0[0])),this.touch1&&_!=="touch"&&(this.touch1[1]=M.invert(this.touch1[0])),this.that.__zoom=M,this.emit("zoom"),this},end:function(){return--this.active===0&&(delete this.that.__zooming,this.emit("end")),this},emit:function(_){var M=Ae(this.that).datum();l.call(_,this.that,new Z0(_,{sourceEvent:this.sourceEvent,target:y,transform:this.that.__zoom,dispatch:l}),M)}};function T(_,...M){if(!e.apply(this,arguments))return;var I=S(this,M).event(_),B=this.__zoom,$=Math.max(o[0],Math.min(o[1],B.k*Math.pow(2,r.apply(this,arguments)))),A=Oe(_);if(I.wheel)(I.mouse[0][0]!==A[0]||I.mouse[0][1]!==A[1])&&(I.mouse[1]=B.invert(I.mouse[0]=A)),clearTimeout(I.wheel);else{if(B.k===$)return;I.mouse=[A,B.invert(A)],bn(this),I.start()}Lt(_),I.wheel=setTimeout(z,m),I.zoom("mouse",n(x(v(B,$),I.mouse[0],I.mouse[1]),I.extent,a));function z(){I.wheel=null,I.end()}}function E(_,...M){if(d||!e.apply(this,arguments))return;var I=_.currentTarget,B=S(this,M,!0).event(_),$=Ae(_.view).on("mousemove.zoom",V,!0).on("mouseup.zoom",Y,!0),A=Oe(_,I),z=_.clientX,H=_.clientY;mh(_.view),ur(_),B.mouse=[A,this.__zoom.invert(A)],bn(this),B.start();function V(q){if(Lt(q),!B.moved){var L=q.clientX-z,F=q.clientY-H;B.moved=L*L+F*F>p}B.event(q).zoom("mouse",n(x(B.that.__zoom,B.mouse[0]=Oe(q,I),B.mouse[1]),B.extent,a))}function Y(q){$.on("mousemove.zoom mouseup.zoom",null),gh(q.view,B.moved),Lt(q),B.event(q).end()}}function k(_,...M){if(e.apply(this,arguments)){var I=this.__zoom,B=Oe(_.changedTouches?_.changedTouches[0]:_,this),$=I.invert(B),A=I.k*(_.shiftKey?.5:2),z=n(x(v(I,A),B,$),t.apply(this,M),a);Lt(_),s>0?Ae(this).transition().duration(s).call(w,z,B,_):Ae(this).call(y.transform,z,B,_)}}function C(_,...M){if(e.apply(this,arguments)){var I=_.touches,B=I.length,$=S(this,M,_.changedTouches.length===B).event(_),A,z,H,V;for(ur(_),z=0;z<B;++z)H=I[z],V=Oe(H,this),V=[V,this.__zoom.invert(V),H.identifier],$.touch0?!$.touch1&&$.touch0[2]!==V[2]&&($.touch1=V,$.taps=0):($.touch0=V,A=!0,$.taps=1+!!c);c&&(c=clearTimeout(c)),A&&($.taps<2&&(f=V[0],c=setTimeout(function(){c=null},h)),bn(this),$.start())}}function O(_,...M){if(this.__zooming){var I=S(this,M).event(_),B=_.changedTouches,$=B.length,A,z,H,V;for(Lt(_),A=0;A<$;++A)z=B[A],H=Oe(z,this),I.touch0&&I.touch0[2]===z.identifier?I.touch0[0]=H:I.touch1&&I.touch1[2]===z.identifier&&(I.touch1[0]=H);if(z=I.that.__zoom,I.touch1){var Y=I.touch0[0],q=I.touch0[1],L=I.touch1[0],F=I.touch1[1],j=(j=L[0]-Y[0])*j+(j=L[1]-Y[1])*j,W=(W=F[0]-q[0])*W+(W=F[1]-q[1])*W;z=v(z,Math.sqrt(j/W)),H=[(Y[0]+L[0])/2,(Y[1]+L[1])/2],V=[(q[0]+F[0])/2,(q[1]+F[1])/2]}else if(I.touch0)H=I.touch0[0],V=I.touch0[1];else return;I.zoom("touch",n(x(z,H,V),I.extent,a))}}function P(_,...M){if(this.__zooming){var I=S(this,M).event(_),B=_.changedTouches,$=B.length,A,z;for(ur(_),d&&clearTimeout(d),d=setTimeout(function(){d=null},h),A=0;A<$;++A)z=B[A],I.touch0&&I.touch0[2]===z.identifier?delete I.touch0:I.touch1&&I.touch1[2]===z.identifier&&delete I.touch1;if(I.touch1&&!I.touch0&&(I.touch0=I.touch1,delete I.touch1),I.touch0)I.touch0[1]=this.__zoom.invert(I.touch0[0]);else if(I.end(),I.taps===2&&(z=Oe(z,this),Math.hypot(f[0]-z[0],f[1]-z[1])<g)){var H=Ae(this).on("dblclick.zoom");H&&H.apply(this,arguments)}}}return y.wheelDelta=function(_){return arguments.length?(r=typeof _=="function"?_:un(+_),y):r},y.filter=function(_){return arguments.length?(e=typeof _=="function"?_:un(!!_),y):e},y.touchable=function(_){return arguments.length?(i=typeof _=="function"?_:un(!!_),y):i},y.extent=function(_){return arguments.length?(t=typeof _=="function"?_:un([[+_[0][0],+_[0][1]],[+_[1][0],+_[1][1]]]),y):t},y.scaleExtent=function(_){return arguments.length?(o[0]=+_[0],o[1]=+_[1],y):[o[0],o[1]]},y.translateExtent=function(_){return arguments.length?(a[0][0]=+_[0][0],a[1][0]=+_[1][0],a[0][1]=+_[0][1],a[1][1]=+_[1][1],y):[[a[0][0],a[0][1]],[a[1][0],a[1][1]]]},y.constrain=function(_){return arguments.length?(n=_,y):n},y.duration=function(_){return arguments.length?(s=+_,y):s},y.interpolate=function(_){return arguments.length?(u=_,y):u},y.on=function(){var _=l.on.apply(l,arguments);return _===l?y:_},y.clickDistance=function(_){return arguments.length?(p=(_=+_)*_,y):Math.sqrt(p)},y.tapDistance=function(_){return arguments.length?(g=+_,y):g},y}const Fn=R.createContext(null),rb=Fn.Provider,Xe={error001:()=>"[React Flow]: Seems like you have not used zustand provider as an ancestor. Help: https://reactflow.dev/error#001",error002:()=>"It looks like you've created a new nodeTypes or edgeTypes object. If this wasn't on purpose please define the nodeTypes/edgeTypes outside of the component or memoize them.",error003:e=>`Node type "${e}" not found. Using fallback type "default".`,error004:()=>"The React Flow parent container needs a width and a height to render the graph.",error005:()=>"Only child nodes can use a parent extent.",error006:()=>"Can't create edge. An edge needs a source and a target.",error007:e=>`The old edge with id=${e} does not exist.`,error009:e=>`Marker type "${e}" doesn't exist.`,error008:(e,t)=>`Couldn't create edge for ${e?"target":"source"} handle id: "${e?t.targetHandle:t.sourceHandle}", edge id: ${t.id}.`,error010:()=>"Handle: No node id found. Make sure to only use a Handle inside a custom Node.",error011:e=>`Edge type "${e}" not found. Using fallback type "default".`,error012:e=>`Node with id "${e}" does not exist, it may have been removed. This can happen when a node is deleted before the "onNodeClick" handler is called.`},kh=Xe.error001();function le(e,t){const n=R.useContext(Fn);if(n===null)throw new Error(kh);return nh(n,e,t)}const ve=()=>{const e=R.useContext(Fn);if(e===null)throw new Error(kh);return R.useMemo(()=>({getState:e.getState,setState:e.setState,subscribe:e.subscribe,destroy:e.destroy}),[e])},ib=e=>e.userSelectionActive?"none":"all";function As({position:e,children:t,className:n,style:r,...i}){const o=le(ib),a=`${e}`.split("-");return D.createElement("div",{className:_e(["react-flow__panel",n,...a]),style:{...r,pointerEvents:o},...i},t)}function ob({proOptions:e,position:t="bottom-right"}){return e!=null&&e.hideAttribution?null:D.createElement(As,{position:t,className:"react-flow__attribution","data-message":"Please only hide this attribution when you are subscribed to React Flow Pro: https://reactflow.dev/pro"},D.createElement("a",{href:"https://reactflow.dev",target:"_blank",rel:"noopener noreferrer","aria-label":"React Flow attribution"},"React Flow"))}const ab=({x:e,y:t,label:n,labelStyle:r={},labelShowBg:i=!0,labelBgStyle:o={},labelBgPadding:a=[2,4],labelBgBorderRadius:s=2,children:u,className:l,...c})=>{const f=R.useRef(null),[d,h]=R.useState({x:0,y:0,width:0,height:0}),m=_e(["react-flow__edge-textwrapper",l]);return R.useEffect(()=>{if(f.current){const p=f.current.getBBox();h({x:p.x,y:p.y,width:p.width,height:p.height})}},[n]),typeof n>"u"||!n?null:D.createElement("g",{transform:`translate(${e-d.width/2} ${t-d.height/2})`,className:m,visibility:d.width?"visible":"hidden",...c},i&&D.createElement("rect",{width:d.width+2*a[0],x:-a[0],y:-a[1],height:d.height+2*a[1],className:"react-flow__edge-textbg",style:o,rx:s,ry:s}),D.createElement("text",{className:"react-flow__edge-text",y:d.height/2,dy:"0.3em",ref:f,style:r},n),u)};var sb=R.memo(ab);const Ts=e=>({width:e.offsetWidth,height:e.offsetHeight}),Ct=(e,t=0,n=1)=>Math.min(Math.max(e,t),n),Ps=(e={x:0,y:0},t)=>({x:Ct(e.x,t[0][0],t[1][0]),y:Ct(e.y,t[0][1],t[1][1])}),Iu=(e,t,n)=>e<t?Ct(Math.abs(e-t),1,50)/50:e>n?-Ct(Math.abs(e-n),1,50)/50:0,Ah=(e,t)=>{const n=Iu(e.x,35,t.width-35)*20,r=Iu(e.y,35,t.height-35)*20;return[n,r]},Th=e=>{var t;return((t=e.getRootNode)==null?void 0:t.call(e))||(window==null?void 0:window.document)},Ph=(e,t)=>({x:Math.min(e.x,t.x),y:Math.min(e.y,t.y),x2:Math.max(e.x2,t.x2),y2:Math.max(e.y2,t.y2)}),Kt=({x:e,y:t,width:n,height:r})=>({x:e,y:t,x2:e+n,y2:t+r}),Oh=({x:e,y:t,x2:n,y2:r})=>({x:e,y:t,width:n-e,height:r-t}),Mu=e=>({...e.positionAbsolute||{x:0,y:0},width:e.width||0,height:e.height||0}),ub=(e,t)=>Oh(Ph(Kt(e),Kt(t))),cs=(e,t)=>{const n=Math.max(0,Math.min(e.x+e.width,t.x+t.width)-Math.max(e.x,t.x)),r=Math.max(0,Math.min(e.y+e.height,t.y+t.height)-Math.max(e.y,t.y));return Math.ceil(n*r)},cb=e=>Te(e.width)&&Te(e.height)&&Te(e.x)&&Te(e.y),Te=e=>!isNaN(e)&&isFinite(e),me=Symbol.for("internals"),Lh=["Enter"," ","Escape"],lb=(e,t)=>{},fb=e=>"nativeEvent"in e;function ls(e){var i,o;const t=fb(e)?e.nativeEvent:e,n=((o=(i=t.composedPath)==null?void 0:i.call(t))==null?void 0:o[0])||e.target;return["INPUT","SELECT","TEXTAREA"].includes(n==null?void 0:n.nodeName)||(n==null?void 0:n.hasAttribute("contenteditable"))||!!(n!=null&&n.closest(".nokey"))}const $h=e=>"clientX"in e,nt=(e,t)=>{var o,a;const n=$h(e),r=n?e.clientX:(o=e.touches)==null?void 0:o[0].clientX,i=n?e.clientY:(a=e.touches)==null?void 0:a[0].clientY;return{x:r-((t==null?void 0:t.left)??0),y:i-((t==null?void 0:t.top)??0)}},qn=()=>{var e;return typeof navigator<"u"&&((e=navigator==null?void 0:navigator.userAgent)==null?void 0:e.indexOf("Mac"))>=0},kt=({id:e,path:t,labelX:n,labelY:r,label:i,labelStyle:o,labelShowBg:a,labelBgStyle:s,labelBgPadding:u,labelBgBorderRadius:l,style:c,markerEnd:f,markerStart:d,interactionWidth:h=20})=>D.createElement(D.Fragment,null,D.createElement("path",{id:e,style:c,d:t,fill:"none",className:"react-flow__edge-path",markerEnd:f,markerStart:d}),h&&D.createElement("path",{d:t,fill:"none",strokeOpacity:0,strokeWidth:h,className:"react-flow__edge-interaction"}),i&&Te(n)&&Te(r)?D.createElement(sb,{x:n,y:r,label:i,labelStyle:o,labelShowBg:a,labelBgStyle:s,labelBgPadding:u,labelBgBorderRadius:l}):null);kt.displayName="BaseEdge";function $t(e,t,n){return n===void 0?n:r=>{const i=t().edges.find(o=>o.id===e);i&&n(r,{...i})}}function Dh({sourceX:e,sourceY:t,targetX:n,targetY:r}){const i=Math.abs(n-e)/2,o=n<e?n+i:n-i,a=Math.abs(r-t)/2,s=r<t?r+a:r-a;return[o,s,i,a]}function Fh({sourceX:e,sourceY:t,targetX:n,targetY:r,sourceControlX:i,sourceControlY:o,targetControlX:a,targetControlY:s}){const u=e*.125+i*.375+a*.375+n*.125,l=t*.125+o*.375+s*.375+r*.125,c=Math.abs(u-e),f=Math.abs(l-t);return[u,l,c,f]}var dt;(function(e){e.Strict="strict",e.Loose="loose"})(dt||(dt={}));var ut;(function(e){e.Free="free",e.Vertical="vertical",e.Horizontal="horizontal"})(ut||(ut={}));var Xt;(function(e){e.Partial="partial",e.Full="full"})(Xt||(Xt={}));var tt;(function(e){e.Bezier="default",e.Straight="straight",e.Step="step",e.SmoothStep="smoothstep",e.SimpleBezier="simplebezier"})(tt||(tt={}));var Cn;(function(e){e.Arrow="arrow",e.ArrowClosed="arrowclosed"})(Cn||(Cn={}));var Q;(function(e){e.Left="left",e.Top="top",e.Right="right",e.Bottom="bottom"})(Q||(Q={}));function ku({pos:e,x1:t,y1:n,x2:r,y2:i}){return e===Q.Left||e===Q.Right?[.5*(t+r),n]:[t,.5*(n+i)]}function zh({sourceX:e,sourceY:t,sourcePosition:n=Q.Bottom,targetX:r,targetY:i,targetPosition:o=Q.Top}){const[a,s]=ku({pos:n,x1:e,y1:t,x2:r,y2:i}),[u,l]=ku({pos:o,x1:r,y1:i,x2:e,y2:t}),[c,f,d,h]=Fh({sourceX:e,sourceY:t,targetX:r,targetY:i,sourceControlX:a,sourceControlY:s,targetControlX:u,targetControlY:l});return[`M${e},${t} C${a},${s} ${u},${l} ${r},${i}`,c,f,d,h]}const Os=R.memo(({sourceX:e,sourceY:t,targetX:n,targetY:r,sourcePosition:i=Q.Bottom,targetPosition:o=Q.Top,label:a,labelStyle:s,labelShowBg:u,labelBgStyle:l,labelBgPadding:c,labelBgBorderRadius:f,style:d,markerEnd:h,markerStart:m,interactionWidth:p})=>{const[g,y,v]=zh({sourceX:e,sourceY:t,sourcePosition:i,targetX:n,targetY:r,targetPosition:o});return D.createElement(kt,{path:g,labelX:y,labelY:v,label:a,labelStyle:s,labelShowBg:u,labelBgStyle:l,labelBgPadding:c,labelBgBorderRadius:f,style:d,markerEnd:h,markerStart:m,interactionWidth:p})});Os.displayName="SimpleBezierEdge";const Au={[Q.Left]:{x:-1,y:0},[Q.Right]:{x:1,y:0},[Q.Top]:{x:0,y:-1},[Q.Bottom]:{x:0,y:1}},db=({source:e,sourcePosition:t=Q.Bottom,target:n})=>t===Q.Left||t===Q.Right?e.x<n.x?{x:1,y:0}:{x:-1,y:0}:e.y<n.y?{x:0,y:1}:{x:0,y:-1},Tu=(e,t)=>Math.sqrt(Math.pow(t.x-e.x,2)+Math.pow(t.y-e.y,2));function hb({source:e,sourcePosition:t=Q.Bottom,target:n,targetPosition:r=Q.Top,center:i,offset:o}){const a=Au[t],s=Au[r],u={x:e.x+a.x*o,y:e.y+a.y*o},l={x:n.x+s.x*o,y:n.y+s.y*o},c=db({source:u,sourcePosition:t,target:l}),f=c.x!==0?"x":"y",d=c[f];let h=[],m,p;const g={x:0,y:0},y={x:0,y:0},[v,x,b,w]=Dh({sourceX:e.x,sourceY:e.y,targetX:n.x,targetY:n.y});if(a[f]*s[f]===-1){m=i.x??v,p=i.y??x;const N=[{x:m,y:u.y},{x:m,y:l.y}],T=[{x:u.x,y:p},{x:l.x,y:p}];a[f]===d?h=f==="x"?N:T:h=f==="x"?T:N}else{const N=[{x:u.x,y:l.y}],T=[{x:l.x,y:u.y}];if(f==="x"?h=a.x===d?T:N:h=a.y===d?N:T,t===r){const P=Math.abs(e[f]-n[f]);if(P<=o){const _=Math.min(o-1,o-P);a[f]===d?g[f]=(u[f]>e[f]?-1:1)*_:y[f]=(l[f]>n[f]?-1:1)*_}}if(t!==r){const P=f==="x"?"y":"x",_=a[f]===s[P],M=u[P]>l[P],I=u[P]<l[P];(a[f]===1&&(!_&&M||_&&I)||a[f]!==1&&(!_&&I||_&&M))&&(h=f==="x"?N:T)}const E={x:u.x+g.x,y:u.y+g.y},k={x:l.x+y.x,y:l.y+y.y},C=Math.max(Math.abs(E.x-h[0].x),Math.abs(k.x-h[0].x)),O=Math.max(Math.abs(E.y-h[0].y),Math.abs(k.y-h[0].y));C>=O?(m=(E.x+k.x)/2,p=h[0].y):(m=h[0].x,p=(E.y+k.y)/2)}return[[e,{x:u.x+g.x,y:u.y+g.y},...h,{x:l.x+y.x,y:l.y+y.y},n],m,p,b,w]}function pb(e,t,n,r){const i=Math.min(Tu(e,t)/2,Tu(t,n)/2,r),{x:o,y:a}=t;if(e.x===o&&o===n.x||e.y===a&&a===n.y)return`L${o} ${a}`;if(e.y===a){const l=e.x<n.x?-1:1,c=e.y<n.y?1:-1;return`L ${o+i*l},${a}Q ${o},${a} ${o},${a+i*c}`}const s=e.x<n.x?1:-1,u=e.y<n.y?-1:1;return`L ${o},${a+i*u}Q ${o},${a} ${o+i*s},${a}`}function fs({sourceX:e,sourceY:t,sourcePosition:n=Q.Bottom,targetX:r,targetY:i,targetPosition:o=Q.Top,borderRadius:a=5,centerX:s,centerY:u,offset:l=20}){const[c,f,d,h,m]=hb({source:{x:e,y:t},sourcePosition:n,target:{x:r,y:i},targetPosition:o,center:{x:s,y:u},offset:l});return[c.reduce((g,y,v)=>{let x="";return v>0&&v<c.length-1?x=pb(c[v-1],y,c[v+1],a):x=`${v===0?"M":"L"}${y.x} ${y.y}`,g+=x,g},""),f,d,h,m]}const zn=R.memo(({sourceX:e,sourceY:t,targetX:n,targetY:r,label:i,labelStyle:o,labelShowBg:a,labelBgStyle:s,labelBgPadding:u,labelBgBorderRadius:l,style:c,sourcePosition:f=Q.Bottom,targetPosition:d=Q.Top,markerEnd:h,markerStart:m,pathOptions:p,interactionWidth:g})=>{const[y,v,x]=fs({sourceX:e,sourceY:t,sourcePosition:f,targetX:n,targetY:r,targetPosition:d,borderRadius:p==null?void 0:p.borderRadius,offset:p==null?void 0:p.offset});return D.createElement(kt,{path:y,labelX:v,labelY:x,label:i,labelStyle:o,labelShowBg:a,labelBgStyle:s,labelBgPadding:u,labelBgBorderRadius:l,style:c,markerEnd:h,markerStart:m,interactionWidth:g})});zn.displayName="SmoothStepEdge";const Ls=R.memo(e=>{var t;return D.createElement(zn,{...e,pathOptions:R.useMemo(()=>{var n;return{borderRadius:0,offset:(n=e.pathOptions)==null?void 0:n.offset}},[(t=e.pathOptions)==null?void 0:t.offset])})});Ls.displayName="StepEdge";function mb({sourceX:e,sourceY:t,targetX:n,targetY:r}){const[i,o,a,s]=Dh({sourceX:e,sourceY:t,targetX:n,targetY:r});return[`M ${e},${t}L ${n},${r}`,i,o,a,s]}const $s=R.memo(({sourceX:e,sourceY:t,targetX:n,targetY:r,label:i,labelStyle:o,labelShowBg:a,labelBgStyle:s,labelBgPadding:u,labelBgBorderRadius:l,style:c,markerEnd:f,markerStart:d,interactionWidth:h})=>{const[m,p,g]=mb({sourceX:e,sourceY:t,targetX:n,targetY:r});return D.createElement(kt,{path:m,labelX:p,labelY:g,label:i,labelStyle:o,labelShowBg:a,labelBgStyle:s,labelBgPadding:u,labelBgBorderRadius:l,style:c,markerEnd:f,markerStart:d,interactionWidth:h})});$s.displayName="StraightEdge";function cn(e,t){return e>=0?.5*e:t*25*Math.sqrt(-e)}function Pu({pos:e,x1:t,y1:n,x2:r,y2:i,c:o}){switch(e){case Q.Left:return[t-cn(t-r,o),n];case Q.Right:return[t+cn(r-t,o),n];case Q.Top:return[t,n-cn(n-i,o)];case Q.Bottom:return[t,n+cn(i-n,o)]}}function Ds({sourceX:e,sourceY:t,sourcePosition:n=Q.Bottom,targetX:r,targetY:i,targetPosition:o=Q.Top,curvature:a=.25}){const[s,u]=Pu({pos:n,x1:e,y1:t,x2:r,y2:i,c:a}),[l,c]=Pu({pos:o,x1:r,y1:i,x2:e,y2:t,c:a}),[f,d,h,m]=Fh({sourceX:e,sourceY:t,targetX:r,targetY:i,sourceControlX:s,sourceControlY:u,targetControlX:l,targetControlY:c});return[`M${e},${t} C${s},${u} ${l},${c} ${r},${i}`,f,d,h,m]}const In=R.memo(({sourceX:e,sourceY:t,targetX:n,targetY:r,sourcePosition:i=Q.Bottom,targetPosition:o=Q.Top,label:a,labelStyle:s,labelShowBg:u,labelBgStyle:l,labelBgPadding:c,labelBgBorderRadius:f,style:d,markerEnd:h,markerStart:m,pathOptions:p,interactionWidth:g})=>{const[y,v,x]=Ds({sourceX:e,sourceY:t,sourcePosition:i,targetX:n,targetY:r,targetPosition:o,curvature:p==null?void 0:p.curvature});return D.createElement(kt,{path:y,labelX:v,labelY:x,label:a,labelStyle:s,labelShowBg:u,labelBgStyle:l,labelBgPadding:c,labelBgBorderRadius:f,style:d,markerEnd:h,markerStart:m,interactionWidth:g})});In.displayName="BezierEdge";const Fs=R.createContext(null),gb=Fs.Provider;Fs.Consumer;const yb=()=>R.useContext(Fs),vb=e=>"id"in e&&"source"in e&&"target"in e,bb=({source:e,sourceHandle:t,target:n,targetHandle:r})=>`reactflow__edge-${e}${t||""}-${n}${r||""}`,ds=(e,t)=>typeof e>"u"?"":typeof e=="string"?e:`${t?`${t}__`:""}${Object.keys(e).sort().map(r=>`${r}=${e[r]}`).join("&")}`,xb=(e,t)=>t.some(n=>n.source===e.source&&n.target===e.target&&(n.sourceHandle===e.sourceHandle||!n.sourceHandle&&!e.sourceHandle)&&(n.targetHandle===e.targetHandle||!n.targetHandle&&!e.targetHandle)),_b=(e,t)=>{if(!e.source||!e.target)return t;let n;return vb(e)?n={...e}:n={...e,id:bb(e)},xb(n,t)?t:t.concat(n)},hs=({x:e,y:t},[n,r,i],o,[a,s])=>{const u={x:(e-n)/i,y:(t-r)/i};return o?{x:a*Math.round(u.x/a),y:s*Math.round(u.y/s)}:u},Bh=({x:e,y:t},[n,r,i])=>({x:e*i+n,y:t*i+r}),lt=(e,t=[0,0])=>{if(!e)return{x:0,y:0,positionAbsolute:{x:0,y:0}};const n=(e.width??0)*t[0],r=(e.height??0)*t[1],i={x:e.position.x-n,y:e.position.y-r};return{...i,positionAbsolute:e.positionAbsolute?{x:e.positionAbsolute.x-n,y:e.positionAbsolute.y-r}:i}},Bn=(e,t=[0,0])=>{if(e.length===0)return{x:0,y:0,width:0,height:0};const n=e.reduce((r,i)=>{const{x:o,y:a}=lt(i,t).positionAbsolute;return Ph(r,Kt({x:o,y:a,width:i.width||0,height:i.height||0}))},{x:1/0,y:1/0,x2:-1/0,y2:-1/0});return Oh(n)},Hh=(e,t,[n,r,i]=[0,0,1],o=!1,a=!1,s=[0,0])=>{const u={x:(t.x-n)/i,y:(t.y-r)/i,width:t.width/i,height:t.height/i},l=[];return e.forEach(c=>{const{width:f,height:d,selectable:h=!0,hidden:m=!1}=c;if(a&&!h||m)return!1;const{positionAbsolute:p}=lt(c,s),g={x:p.x,y:p.y,width:f||0,height:d||0},y=cs(u,g),v=typeof f>"u"||typeof d>"u"||f===null||d===null,x=o&&y>0,b=(f||0)*(d||0);(v||x||y>=b||c.dragging)&&l.push(c)}),l},Vh=(e,t)=>{const n=e.map(r=>r.id);return t.filter(r=>n.includes(r.source)||n.includes(r.target))},jh=(e,t,n,r,i,o=.1)=>{const a=t/(e.width*(1+o)),s=n/(e.height*(1+o)),u=Math.min(a,s),l=Ct(u,r,i),c=e.x+e.width/2,f=e.y+e.height/2,d=t/2-c*l,h=n/2-f*l;return{x:d,y:h,zoom:l}},at=(e,t=0)=>e.transition().duration(t);function Ou(e,t,n,r){return(t[n]||[]).reduce((i,o)=>{var a,s;return`${e.id}-${o.id}-${n}`!==r&&i.push({id:o.id||null,type:n,nodeId:e.id,x:(((a=e.positionAbsolute)==null?void 0:a.x)??0)+o.x+o.width/2,y:(((s=e.positionAbsolute)==null?void 0:s.y)??0)+o.y+o.height/2}),i},[])}function wb(e,t,n,r,i,o){const{x:a,y:s}=nt(e),l=t.elementsFromPoint(a,s).find(m=>m.classList.contains("react-flow__handle"));if(l){const m=l.getAttribute("data-nodeid");if(m){const p=zs(void 0,l),g=l.getAttribute("data-handleid"),y=o({nodeId:m,id:g,type:p});if(y){const v=i.find(x=>x.nodeId===m&&x.type===p&&x.id===g);return{handle:{id:g,type:p,nodeId:m,x:(v==null?void 0:v.x)||n.x,y:(v==null?void 0:v.y)||n.y},validHandleResult:y}}}}let c=[],f=1/0;if(i.forEach(m=>{const p=Math.sqrt((m.x-n.x)**2+(m.y-n.y)**2);if(p<=r){const g=o(m);p<=f&&(p<f?c=[{handle:m,validHandleResult:g}]:p===f&&c.push({handle:m,validHandleResult:g}),f=p)}}),!c.length)return{handle:null,validHandleResult:Gh()};if(c.length===1)return c[0];const d=c.some(({validHandleResult:m})=>m.isValid),h=c.some(({handle:m})=>m.type==="target");return c.find(({handle:m,validHandleResult:p})=>h?m.type==="target":d?p.isValid:!0)||c[0]}const Eb={source:null,target:null,sourceHandle:null,targetHandle:null},Gh=()=>({handleDomNode:null,isValid:!1,connection:Eb,endHandle:null});function Uh(e,t,n,r,i,o,a){const s=i==="target",u=a.querySelector(`.react-flow__handle[data-id="${e==null?void 0:e.nodeId}-${e==null?void 0:e.id}-${e==null?void 0:e.type}"]`),l={...Gh(),handleDomNode:u};if(u){const c=zs(void 0,u),f=u.getAttribute("data-nodeid"),d=u.getAttribute("data-handleid"),h=u.classList.contains("connectable"),m=u.classList.contains("connectableend"),p={source:s?f:n,sourceHandle:s?d:r,target:s?n:f,targetHandle:s?r:d};l.connection=p,h&&m&&(t===dt.Strict?s&&c==="source"||!s&&c==="target":f!==n||d!==r)&&(l.endHandle={nodeId:f,handleId:d,type:c},l.isValid=o(p))}return l}function Sb({nodes:e,nodeId:t,handleId:n,handleType:r}){return e.reduce((i,o)=>{if(o[me]){const{handleBounds:a}=o[me];let s=[],u=[];a&&(s=Ou(o,a,"source",`${t}-${n}-${r}`),u=Ou(o,a,"target",`${t}-${n}-${r}`)),i.push(...s,...u)}return i},[])}function zs(e,t){return e||(t!=null&&t.classList.contains("target")?"target":t!=null&&t.classList.contains("source")?"source":null)}function cr(e){e==null||e.classList.remove("valid","connecting","react-flow__handle-valid","react-flow__handle-connecting")}function Nb(e,t){let n=null;return t?n="valid":e&&!t&&(n="invalid"),n}function Yh({event:e,handleId:t,nodeId:n,onConnect:r,isTarget:i,getState:o,setState:a,isValidConnection:s,edgeUpdaterType:u,onReconnectEnd:l}){const c=Th(e.target),{connectionMode:f,domNode:d,autoPanOnConnect:h,connectionRadius:m,onConnectStart:p,panBy:g,getNodes:y,cancelConnection:v}=o();let x=0,b;const{x:w,y:S}=nt(e),N=c==null?void 0:c.elementFromPoint(w,S),T=zs(u,N),E=d==null?void 0:d.getBoundingClientRect();if(!E||!T)return;let k,C=nt(e,E),O=!1,P=null,_=!1,M=null;const I=Sb({nodes:y(),nodeId:n,handleId:t,handleType:T}),B=()=>{if(!h)return;const[z,H]=Ah(C,E);g({x:z,y:H}),x=requestAnimationFrame(B)};a({connectionPosition:C,connectionStatus:null,connectionNodeId:n,connectionHandleId:t,connectionHandleType:T,connectionStartHandle:{nodeId:n,handleId:t,type:T},connectionEndHandle:null}),p==null||p(e,{nodeId:n,handleId:t,handleType:T});function $(z){const{transform:H}=o();C=nt(z,E);const{handle:V,validHandleResult:Y}=wb(z,c,hs(C,H,!1,[1,1]),m,I,q=>Uh(q,f,n,t,i?"target":"source",s,c));if(b=V,O||(B(),O=!0),M=Y.handleDomNode,P=Y.connection,_=Y.isValid,a({connectionPosition:b&&_?Bh({x:b.x,y:b.y},H):C,connectionStatus:Nb(!!b,_),connectionEndHandle:Y.endHandle}),!b&&!_&&!M)return cr(k);P.source!==P.target&&M&&(cr(k),k=M,M.classList.add("connecting","react-flow__handle-connecting"),M.classList.toggle("valid",_),M.classList.toggle("react-flow__handle-valid",_))}function A(z){var H,V;(b||M)&&P&&_&&(r==null||r(P)),(V=(H=o()).onConnectEnd)==null||V.call(H,z),u&&(l==null||l(z)),cr(k),v(),cancelAnimationFrame(x),O=!1,_=!1,P=null,M=null,c.removeEventListener("mousemove",$),c.removeEventListener("mouseup",A),c.removeEventListener("touchmove",$),c.removeEventListener("touchend",A)}c.addEventListener("mousemove",$),c.addEventListener("mouseup",A),c.addEventListener("touchmove",$),c.addEventListener("touchend",A)}const Lu=()=>!0,Rb=e=>({connectionStartHandle:e.connectionStartHandle,connectOnClick:e.connectOnClick,noPanClassName:e.noPanClassName}),qb=(e,t,n)=>r=>{const{connectionStartHandle:i,connectionEndHandle:o,connectionClickStartHandle:a}=r;return{connecting:(i==null?void 0:i.nodeId)===e&&(i==null?void 0:i.handleId)===t&&(i==null?void 0:i.type)===n||(o==null?void 0:o.nodeId)===e&&(o==null?void 0:o.handleId)===t&&(o==null?void 0:o.type)===n,clickConnecting:(a==null?void 0:a.nodeId)===e&&(a==null?void 0:a.handleId)===t&&(a==null?void 0:a.type)===n}},Wh=R.forwardRef(({type:e="source",position:t=Q.Top,isValidConnection:n,isConnectable:r=!0,isConnectableStart:i=!0,isConnectableEnd:o=!0,id:a,onConnect:s,children:u,className:l,onMouseDown:c,onTouchStart:f,...d},h)=>{var E,k;const m=a||null,p=e==="target",g=ve(),y=yb(),{connectOnClick:v,noPanClassName:x}=le(Rb,Ce),{connecting:b,clickConnecting:w}=le(qb(y,m,e),Ce);y||(k=(E=g.getState()).onError)==null||k.call(E,"010",Xe.error010());const S=C=>{const{defaultEdgeOptions:O,onConnect:P,hasDefaultEdges:_}=g.getState(),M={...O,...C};if(_){const{edges:I,setEdges:B}=g.getState();B(_b(M,I))}P==null||P(M),s==null||s(M)},N=C=>{if(!y)return;const O=$h(C);i&&(O&&C.button===0||!O)&&Yh({event:C,handleId:m,nodeId:y,onConnect:S,isTarget:p,getState:g.getState,setState:g.setState,isValidConnection:n||g.getState().isValidConnection||Lu}),O?c==null||c(C):f==null||f(C)},T=C=>{const{onClickConnectStart:O,onClickConnectEnd:P,connectionClickStartHandle:_,connectionMode:M,isValidConnection:I}=g.getState();if(!y||!_&&!i)return;if(!_){O==null||O(C,{nodeId:y,handleId:m,handleType:e}),g.setState({connectionClickStartHandle:{nodeId:y,type:e,handleId:m}});return}const B=Th(C.target),$=n||I||Lu,{connection:A,isValid:z}=Uh({nodeId:y,id:m,type:e},M,_.nodeId,_.handleId||null,_.type,$,B);z&&S(A),P==null||P(C),g.setState({connectionClickStartHandle:null})};return D.createElement("div",{"data-handleid":m,"data-nodeid":y,"data-handlepos":t,"data-id":`${y}-${m}-${e}`,className:_e(["react-flow__handle",`react-flow__handle-${t}`,"nodrag",x,l,{source:!p,target:p,connectable:r,connectablestart:i,connectableend:o,connecting:w,connectionindicator:r&&(i&&!b||o&&b)}]),onMouseDown:N,onTouchStart:N,onClick:v?T:void 0,ref:h,...d},u)});Wh.displayName="Handle";var ht=R.memo(Wh);const Kh=({data:e,isConnectable:t,targetPosition:n=Q.Top,sourcePosition:r=Q.Bottom})=>D.createElement(D.Fragment,null,D.createElement(ht,{type:"target",position:n,isConnectable:t}),e==null?void 0:e.label,D.createElement(ht,{type:"source",position:r,isConnectable:t}));Kh.displayName="DefaultNode";var ps=R.memo(Kh);const Xh=({data:e,isConnectable:t,sourcePosition:n=Q.Bottom})=>D.createElement(D.Fragment,null,e==null?void 0:e.label,D.createElement(ht,{type:"source",position:n,isConnectable:t}));Xh.displayName="InputNode";var Zh=R.memo(Xh);const Qh=({data:e,isConnectable:t,targetPosition:n=Q.Top})=>D.createElement(D.Fragment,null,D.createElement(ht,{type:"target",position:n,isConnectable:t}),e==null?void 0:e.label);Qh.displayName="OutputNode";var Jh=R.memo(Qh);const Bs=()=>null;Bs.displayName="GroupNode";const Cb=e=>({selectedNodes:e.getNodes().filter(t=>t.selected),selectedEdges:e.edges.filter(t=>t.selected).map(t=>({...t}))}),ln=e=>e.id;function Ib(e,t){return Ce(e.selectedNodes.map(ln),t.selectedNodes.map(ln))&&Ce(e.selectedEdges.map(ln),t.selectedEdges.map(ln))}const ep=R.memo(({onSelectionChange:e})=>{const t=ve(),{selectedNodes:n,selectedEdges:r}=le(Cb,Ib);return R.useEffect(()=>{const i={nodes:n,edges:r};e==null||e(i),t.getState().onSelectionChange.forEach(o=>o(i))},[n,r,e]),null});ep.displayName="SelectionListener";const Mb=e=>!!e.onSelectionChange;function kb({onSelectionChange:e}){const t=le(Mb);return e||t?D.createElement(ep,{onSelectionChange:e}):null}const Ab=e=>({setNodes:e.setNodes,setEdges:e.setEdges,setDefaultNodesAndEdges:e.setDefaultNodesAndEdges,setMinZoom:e.setMinZoom,setMaxZoom:e.setMaxZoom,setTranslateExtent:e.setTranslateExtent,setNodeExtent:e.setNodeExtent,reset:e.reset});function yt(e,t){R.useEffect(()=>{typeof e<"u"&&t(e)},[e])}function re(e,t,n){R.useEffect(()=>{typeof t<"u"&&n({[e]:t})},[t])}const Tb=({nodes:e,edges:t,defaultNodes:n,defaultEdges:r,onConnect:i,onConnectStart:o,onConnectEnd:a,onClickConnectStart:s,onClickConnectEnd:u,nodesDraggable:l,nodesConnectable:c,nodesFocusable:f,edgesFocusable:d,edgesUpdatable:h,elevateNodesOnSelect:m,minZoom:p,maxZoom:g,nodeExtent:y,onNodesChange:v,onEdgesChange:x,elementsSelectable:b,connectionMode:w,snapGrid:S,snapToGrid:N,translateExtent:T,connectOnClick:E,defaultEdgeOptions:k,fitView:C,fitViewOptions:O,onNodesDelete:P,onEdgesDelete:_,onNodeDrag:M,onNodeDragStart:I,onNodeDragStop:B,onSelectionDrag:$,onSelectionDragStart:A,onSelectionDragStop:z,noPanClassName:H,nodeOrigin:V,rfId:Y,autoPanOnConnect:q,autoPanOnNodeDrag:L,onError:F,connectionRadius:j,isValidConnection:W,nodeDragThreshold:J})=>{const{setNodes:ee,setEdges:ie,setDefaultNodesAndEdges:ue,setMinZoom:ae,setMaxZoom:ne,setTranslateExtent:te,setNodeExtent:pe,reset:X}=le(Ab,Ce),Z=ve();return R.useEffect(()=>{const fe=r==null?void 0:r.map(Ie=>({...Ie,...k}));return ue(n,fe),()=>{X()}},[]),re("defaultEdgeOptions",k,Z.setState),re("connectionMode",w,Z.setState),re("onConnect",i,Z.setState),re("onConnectStart",o,Z.setState),re("onConnectEnd",a,Z.setState),re("onClickConnectStart",s,Z.setState),re("onClickConnectEnd",u,Z.setState),re("nodesDraggable",l,Z.setState),re("nodesConnectable",c,Z.setState),re("nodesFocusable",f,Z.setState),re("edgesFocusable",d,Z.setState),re("edgesUpdatable",h,Z.setState),re("elementsSelectable",b,Z.setState),re("elevateNodesOnSelect",m,Z.setState),re("snapToGrid",N,Z.setState),re("snapGrid",S,Z.setState),re("onNodesChange",v,Z.setState),re("onEdgesChange",x,Z.setState),re("connectOnClick",E,Z.setState),re("fitViewOnInit",C,Z.setState),re("fitViewOnInitOptions",O,Z.setState),re("onNodesDelete",P,Z.setState),re("onEdgesDelete",_,Z.setState),re("onNodeDrag",M,Z.setState),re("onNodeDragStart",I,Z.setState),re("onNodeDragStop",B,Z.setState),re("onSelectionDrag",$,Z.setState),re("onSelectionDragStart",A,Z.setState),re("onSelectionDragStop",z,Z.setState),re("noPanClassName",H,Z.setState),re("nodeOrigin",V,Z.setState),re("rfId",Y,Z.setState),re("autoPanOnConnect",q,Z.setState),re("autoPanOnNodeDrag",L,Z.setState),re("onError",F,Z.setState),re("connectionRadius",j,Z.setState),re("isValidConnection",W,Z.setState),re("nodeDragThreshold",J,Z.setState),yt(e,ee),yt(t,ie),yt(p,ae),yt(g,ne),yt(T,te),yt(y,pe),null},$u={display:"none"},Pb={position:"absolute",width:1,height:1,margin:-1,border:0,padding:0,overflow:"hidden",clip:"rect(0px, 0px, 0px, 0px)",clipPath:"inset(100%)"},tp="react-flow__node-desc",np="react-flow__edge-desc",Ob="react-flow__aria-live",Lb=e=>e.ariaLiveMessage;function $b({rfId:e}){const t=le(Lb);return D.createElement("div",{id:`${Ob}-${e}`,"aria-live":"assertive","aria-atomic":"true",style:Pb},t)}function Db({rfId:e,disableKeyboardA11y:t}){return D.createElement(D.Fragment,null,D.createElement("div",{id:`${tp}-${e}`,style:$u},"Press enter or space to select a node.",!t&&"You can then use the arrow keys to move the node around."," Press delete to remove it and escape to cancel."," "),D.createElement("div",{id:`${np}-${e}`,style:$u},"Press enter or space to select an edge. You can then press delete to remove it or escape to cancel."),!t&&D.createElement($b,{rfId:e}))}var Zt=(e=null,t={actInsideInputWithModifier:!0})=>{const[n,r]=R.useState(!1),i=R.useRef(!1),o=R.useRef(new Set([])),[a,s]=R.useMemo(()=>{if(e!==null){const l=(Array.isArray(e)?e:[e]).filter(f=>typeof f=="string").map(f=>f.split("+")),c=l.reduce((f,d)=>f.concat(...d),[]);return[l,c]}return[[],[]]},[e]);return R.useEffect(()=>{const u=typeof document<"u"?document:null,l=(t==null?void 0:t.target)||u;if(e!==null){const c=h=>{if(i.current=h.ctrlKey||h.metaKey||h.shiftKey,(!i.current||i.current&&!t.actInsideInputWithModifier)&&ls(h))return!1;const p=Fu(h.code,s);o.current.add(h[p]),Du(a,o.current,!1)&&(h.preventDefault(),r(!0))},f=h=>{if((!i.current||i.current&&!t.actInsideInputWithModifier)&&ls(h))return!1;const p=Fu(h.code,s);Du(a,o.current,!0)?(r(!1),o.current.clear()):o.current.delete(h[p]),h.key==="Meta"&&o.current.clear(),i.current=!1},d=()=>{o.current.clear(),r(!1)};return l==null||l.addEventListener("keydown",c),l==null||l.addEventListener("keyup",f),window.addEventListener("blur",d),()=>{l==null||l.removeEventListener("keydown",c),l==null||l.removeEventListener("keyup",f),window.removeEventListener("blur",d)}}},[e,r]),n};function Du(e,t,n){return e.filter(r=>n||r.length===t.size).some(r=>r.every(i=>t.has(i)))}function Fu(e,t){return t.includes(e)?"code":"key"}function rp(e,t,n,r){var s,u;const i=e.parentNode||e.parentId;if(!i)return n;const o=t.get(i),a=lt(o,r);return rp(o,t,{x:(n.x??0)+a.x,y:(n.y??0)+a.y,z:(((s=o[me])==null?void 0:s.z)??0)>(n.z??0)?((u=o[me])==null?void 0:u.z)??0:n.z??0},r)}function ip(e,t,n){e.forEach(r=>{var o;const i=r.parentNode||r.parentId;if(i&&!e.has(i))throw new Error(`Parent node ${i} not found`);if(i||n!=null&&n[r.id]){const{x:a,y:s,z:u}=rp(r,e,{...r.position,z:((o=r[me])==null?void 0:o.z)??0},t);r.positionAbsolute={x:a,y:s},r[me].z=u,n!=null&&n[r.id]&&(r[me].isParent=!0)}})}function lr(e,t,n,r){const i=new Map,o={},a=r?1e3:0;return e.forEach(s=>{var h;const u=(Te(s.zIndex)?s.zIndex:0)+(s.selected?a:0),l=t.get(s.id),c={...s,positionAbsolute:{x:s.position.x,y:s.position.y}},f=s.parentNode||s.parentId;f&&(o[f]=!0);const d=(l==null?void 0:l.type)&&(l==null?void 0:l.type)!==s.type;Object.defineProperty(c,me,{enumerable:!1,value:{handleBounds:d||(h=l==null?void 0:l[me])==null?void 0:h.handleBounds,z:u}}),i.set(s.id,c)}),ip(i,n,o),i}function op(e,t={}){const{getNodes:n,width:r,height:i,minZoom:o,maxZoom:a,d3Zoom:s,d3Selection:u,fitViewOnInitDone:l,fitViewOnInit:c,nodeOrigin:f}=e(),d=t.initial&&!l&&c;if(s&&u&&(d||!t.initial)){const m=n().filter(g=>{var v;const y=t.includeHiddenNodes?g.width&&g.height:!g.hidden;return(v=t.nodes)!=null&&v.length?y&&t.nodes.some(x=>x.id===g.id):y}),p=m.every(g=>g.width&&g.height);if(m.length>0&&p){const g=Bn(m,f),{x:y,y:v,zoom:x}=jh(g,r,i,t.minZoom??o,t.maxZoom??a,t.padding??.1),b=We.translate(y,v).scale(x);return typeof t.duration=="number"&&t.duration>0?s.transform(at(u,t.duration),b):s.transform(u,b),!0}}return!1}function Fb(e,t){return e.forEach(n=>{const r=t.get(n.id);r&&t.set(r.id,{...r,[me]:r[me],selected:n.selected})}),new Map(t)}function zb(e,t){return t.map(n=>{const r=e.find(i=>i.id===n.id);return r&&(n.selected=r.selected),n})}function fn({changedNodes:e,changedEdges:t,get:n,set:r}){const{nodeInternals:i,edges:o,onNodesChange:a,onEdgesChange:s,hasDefaultNodes:u,hasDefaultEdges:l}=n();e!=null&&e.length&&(u&&r({nodeInternals:Fb(e,i)}),a==null||a(e)),t!=null&&t.length&&(l&&r({edges:zb(t,o)}),s==null||s(t))}const vt=()=>{},Bb={zoomIn:vt,zoomOut:vt,zoomTo:vt,getZoom:()=>1,setViewport:vt,getViewport:()=>({x:0,y:0,zoom:1}),fitView:()=>!1,setCenter:vt,fitBounds:vt,project:e=>e,screenToFlowPosition:e=>e,flowToScreenPosition:e=>e,viewportInitialized:!1},Hb=e=>({d3Zoom:e.d3Zoom,d3Selection:e.d3Selection}),Vb=()=>{const e=ve(),{d3Zoom:t,d3Selection:n}=le(Hb,Ce);return R.useMemo(()=>n&&t?{zoomIn:i=>t.scaleBy(at(n,i==null?void 0:i.duration),1.2),zoomOut:i=>t.scaleBy(at(n,i==null?void 0:i.duration),1/1.2),zoomTo:(i,o)=>t.scaleTo(at(n,o==null?void 0:o.duration),i),getZoom:()=>e.getState().transform[2],setViewport:(i,o)=>{const[a,s,u]=e.getState().transform,l=We.translate(i.x??a,i.y??s).scale(i.zoom??u);t.transform(at(n,o==null?void 0:o.duration),l)},getViewport:()=>{const[i,o,a]=e.getState().transform;return{x:i,y:o,zoom:a}},fitView:i=>op(e.getState,i),setCenter:(i,o,a)=>{const{width:s,height:u,maxZoom:l}=e.getState(),c=typeof(a==null?void 0:a.zoom)<"u"?a.zoom:l,f=s/2-i*c,d=u/2-o*c,h=We.translate(f,d).scale(c);t.transform(at(n,a==null?void 0:a.duration),h)},fitBounds:(i,o)=>{const{width:a,height:s,minZoom:u,maxZoom:l}=e.getState(),{x:c,y:f,zoom:d}=jh(i,a,s,u,l,(o==null?void 0:o.padding)??.1),h=We.translate(c,f).scale(d);t.transform(at(n,o==null?void 0:o.duration),h)},project:i=>{const{transform:o,snapToGrid:a,snapGrid:s}=e.getState();return console.warn("[DEPRECATED] `project` is deprecated. Instead use `screenToFlowPosition`. There is no need to subtract the react flow bounds anymore! https://reactflow.dev/api-reference/types/react-flow-instance#screen-to-flow-position"),hs(i,o,a,s)},screenToFlowPosition:i=>{const{transform:o,snapToGrid:a,snapGrid:s,domNode:u}=e.getState();if(!u)return i;const{x:l,y:c}=u.getBoundingClientRect(),f={x:i.x-l,y:i.y-c};return hs(f,o,a,s)},flowToScreenPosition:i=>{const{transform:o,domNode:a}=e.getState();if(!a)return i;const{x:s,y:u}=a.getBoundingClientRect(),l=Bh(i,o);return{x:l.x+s,y:l.y+u}},viewportInitialized:!0}:Bb,[t,n])};function Hn(){const e=Vb(),t=ve(),n=R.useCallback(()=>t.getState().getNodes().map(p=>({...p})),[]),r=R.useCallback(p=>t.getState().nodeInternals.get(p),[]),i=R.useCallback(()=>{const{edges:p=[]}=t.getState();return p.map(g=>({...g}))},[]),o=R.useCallback(p=>{const{edges:g=[]}=t.getState();return g.find(y=>y.id===p)},[]),a=R.useCallback(p=>{const{getNodes:g,setNodes:y,hasDefaultNodes:v,onNodesChange:x}=t.getState(),b=g(),w=typeof p=="function"?p(b):p;if(v)y(w);else if(x){const S=w.length===0?b.map(N=>({type:"remove",id:N.id})):w.map(N=>({item:N,type:"reset"}));x(S)}},[]),s=R.useCallback(p=>{const{edges:g=[],setEdges:y,hasDefaultEdges:v,onEdgesChange:x}=t.getState(),b=typeof p=="function"?p(g):p;if(v)y(b);else if(x){const w=b.length===0?g.map(S=>({type:"remove",id:S.id})):b.map(S=>({item:S,type:"reset"}));x(w)}},[]),u=R.useCallback(p=>{const g=Array.isArray(p)?p:[p],{getNodes:y,setNodes:v,hasDefaultNodes:x,onNodesChange:b}=t.getState();if(x){const S=[...y(),...g];v(S)}else if(b){const w=g.map(S=>({item:S,type:"add"}));b(w)}},[]),l=R.useCallback(p=>{const g=Array.isArray(p)?p:[p],{edges:y=[],setEdges:v,hasDefaultEdges:x,onEdgesChange:b}=t.getState();if(x)v([...y,...g]);else if(b){const w=g.map(S=>({item:S,type:"add"}));b(w)}},[]),c=R.useCallback(()=>{const{getNodes:p,edges:g=[],transform:y}=t.getState(),[v,x,b]=y;return{nodes:p().map(w=>({...w})),edges:g.map(w=>({...w})),viewport:{x:v,y:x,zoom:b}}},[]),f=R.useCallback(({nodes:p,edges:g})=>{const{nodeInternals:y,getNodes:v,edges:x,hasDefaultNodes:b,hasDefaultEdges:w,onNodesDelete:S,onEdgesDelete:N,onNodesChange:T,onEdgesChange:E}=t.getState(),k=(p||[]).map(M=>M.id),C=(g||[]).map(M=>M.id),O=v().reduce((M,I)=>{const B=I.parentNode||I.parentId,$=!k.includes(I.id)&&B&&M.find(z=>z.id===B);return(typeof I.deletable=="boolean"?I.deletable:!0)&&(k.includes(I.id)||$)&&M.push(I),M},[]),P=x.filter(M=>typeof M.deletable=="boolean"?M.deletable:!0),_=P.filter(M=>C.includes(M.id));if(O||_){const M=Vh(O,P),I=[..._,...M],B=I.reduce(($,A)=>($.includes(A.id)||$.push(A.id),$),[]);if((w||b)&&(w&&t.setState({edges:x.filter($=>!B.includes($.id))}),b&&(O.forEach($=>{y.delete($.id)}),t.setState({nodeInternals:new Map(y)}))),B.length>0&&(N==null||N(I),E&&E(B.map($=>({id:$,type:"remove"})))),O.length>0&&(S==null||S(O),T)){const $=O.map(A=>({id:A.id,type:"remove"}));T($)}}},[]),d=R.useCallback(p=>{const g=cb(p),y=g?null:t.getState().nodeInternals.get(p.id);return!g&&!y?[null,null,g]:[g?p:Mu(y),y,g]},[]),h=R.useCallback((p,g=!0,y)=>{const[v,x,b]=d(p);return v?(y||t.getState().getNodes()).filter(w=>{if(!b&&(w.id===x.id||!w.positionAbsolute))return!1;const S=Mu(w),N=cs(S,v);return g&&N>0||N>=v.width*v.height}):[]},[]),m=R.useCallback((p,g,y=!0)=>{const[v]=d(p);if(!v)return!1;const x=cs(v,g);return y&&x>0||x>=v.width*v.height},[]);return R.useMemo(()=>({...e,getNodes:n,getNode:r,getEdges:i,getEdge:o,setNodes:a,setEdges:s,addNodes:u,addEdges:l,toObject:c,deleteElements:f,getIntersectingNodes:h,isNodeIntersecting:m}),[e,n,r,i,o,a,s,u,l,c,f,h,m])}const jb={actInsideInputWithModifier:!1};var Gb=({deleteKeyCode:e,multiSelectionKeyCode:t})=>{const n=ve(),{deleteElements:r}=Hn(),i=Zt(e,jb),o=Zt(t);R.useEffect(()=>{if(i){const{edges:a,getNodes:s}=n.getState(),u=s().filter(c=>c.selected),l=a.filter(c=>c.selected);r({nodes:u,edges:l}),n.setState({nodesSelectionActive:!1})}},[i]),R.useEffect(()=>{n.setState({multiSelectionActive:o})},[o])};function Ub(e){const t=ve();R.useEffect(()=>{let n;const r=()=>{var o,a;if(!e.current)return;const i=Ts(e.current);(i.height===0||i.width===0)&&((a=(o=t.getState()).onError)==null||a.call(o,"004",Xe.error004())),t.setState({width:i.width||500,height:i.height||500})};return r(),window.addEventListener("resize",r),e.current&&(n=new ResizeObserver(()=>r()),n.observe(e.current)),()=>{window.removeEventListener("resize",r),n&&e.current&&n.unobserve(e.current)}},[])}const Hs={position:"absolute",width:"100%",height:"100%",top:0,left:0},Yb=(e,t)=>e.x!==t.x||e.y!==t.y||e.zoom!==t.k,dn=e=>({x:e.x,y:e.y,zoom:e.k}),bt=(e,t)=>e.target.closest(`.${t}`),zu=(e,t)=>t===2&&Array.isArray(e)&&e.includes(2),Bu=e=>{const t=e.ctrlKey&&qn()?10:1;return-e.deltaY*(e.deltaMode===1?.05:e.deltaMode?1:.002)*t},Wb=e=>({d3Zoom:e.d3Zoom,d3Selection:e.d3Selection,d3ZoomHandler:e.d3ZoomHandler,userSelectionActive:e.userSelectionActive}),Kb=({onMove:e,onMoveStart:t,onMoveEnd:n,onPaneContextMenu:r,zoomOnScroll:i=!0,zoomOnPinch:o=!0,panOnScroll:a=!1,panOnScrollSpeed:s=.5,panOnScrollMode:u=ut.Free,zoomOnDoubleClick:l=!0,elementsSelectable:c,panOnDrag:f=!0,defaultViewport:d,translateExtent:h,minZoom:m,maxZoom:p,zoomActivationKeyCode:g,preventScrolling:y=!0,children:v,noWheelClassName:x,noPanClassName:b})=>{const w=R.useRef(),S=ve(),N=R.useRef(!1),T=R.useRef(!1),E=R.useRef(null),k=R.useRef({x:0,y:0,zoom:0}),{d3Zoom:C,d3Selection:O,d3ZoomHandler:P,userSelectionActive:_}=le(Wb,Ce),M=Zt(g),I=R.useRef(0),B=R.useRef(!1),$=R.useRef();return Ub(E),R.useEffect(()=>{if(E.current){const A=E.current.getBoundingClientRect(),z=Mh().scaleExtent([m,p]).translateExtent(h),H=Ae(E.current).call(z),V=We.translate(d.x,d.y).scale(Ct(d.zoom,m,p)),Y=[[0,0],[A.width,A.height]],q=z.constrain()(V,Y,h);z.transform(H,q),z.wheelDelta(Bu),S.setState({d3Zoom:z,d3Selection:H,d3ZoomHandler:H.on("wheel.zoom"),transform:[q.x,q.y,q.k],domNode:E.current.closest(".react-flow")})}},[]),R.useEffect(()=>{O&&C&&(a&&!M&&!_?O.on("wheel.zoom",A=>{if(bt(A,x))return!1;A.preventDefault(),A.stopImmediatePropagation();const z=O.property("__zoom").k||1;if(A.ctrlKey&&o){const W=Oe(A),J=Bu(A),ee=z*Math.pow(2,J);C.scaleTo(O,ee,W,A);return}const H=A.deltaMode===1?20:1;let V=u===ut.Vertical?0:A.deltaX*H,Y=u===ut.Horizontal?0:A.deltaY*H;!qn()&&A.shiftKey&&u!==ut.Vertical&&(V=A.deltaY*H,Y=0),C.translateBy(O,-(V/z)*s,-(Y/z)*s,{internal:!0});const q=dn(O.property("__zoom")),{onViewportChangeStart:L,onViewportChange:F,onViewportChangeEnd:j}=S.getState();clearTimeout($.current),B.current||(B.current=!0,t==null||t(A,q),L==null||L(q)),B.current&&(e==null||e(A,q),F==null||F(q),$.current=setTimeout(()=>{n==null||n(A,q),j==null||j(q),B.current=!1},150))},{passive:!1}):typeof P<"u"&&O.on("wheel.zoom",function(A,z){if(!y&&A.type==="wheel"&&!A.ctrlKey||bt(A,x))return null;A.preventDefault(),P.call(this,A,z)},{passive:!1}))},[_,a,u,O,C,P,M,o,y,x,t,e,n]),R.useEffect(()=>{C&&C.on("start",A=>{var V,Y;if(!A.sourceEvent||A.sourceEvent.internal)return null;I.current=(V=A.sourceEvent)==null?void 0:V.button;const{onViewportChangeStart:z}=S.getState(),H=dn(A.transform);N.current=!0,k.current=H,((Y=A.sourceEvent)==null?void 0:Y.type)==="mousedown"&&S.setState({paneDragging:!0}),z==null||z(H),t==null||t(A.sourceEvent,H)})},[C,t]),R.useEffect(()=>{C&&(_&&!N.current?C.on("zoom",null):_||C.on("zoom",A=>{var H;const{onViewportChange:z}=S.getState();if(S.setState({transform:[A.transform.x,A.transform.y,A.transform.k]}),T.current=!!(r&&zu(f,I.current??0)),(e||z)&&!((H=A.sourceEvent)!=null&&H.internal)){const V=dn(A.transform);z==null||z(V),e==null||e(A.sourceEvent,V)}}))},[_,C,e,f,r]),R.useEffect(()=>{C&&C.on("end",A=>{if(!A.sourceEvent||A.sourceEvent.internal)return null;const{onViewportChangeEnd:z}=S.getState();if(N.current=!1,S.setState({paneDragging:!1}),r&&zu(f,I.current??0)&&!T.current&&r(A.sourceEvent),T.current=!1,(n||z)&&Yb(k.current,A.transform)){const H=dn(A.transform);k.current=H,clearTimeout(w.current),w.current=setTimeout(()=>{z==null||z(H),n==null||n(A.sourceEvent,H)},a?150:0)}})},[C,a,f,n,r]),R.useEffect(()=>{C&&C.filter(A=>{const z=M||i,H=o&&A.ctrlKey;if((f===!0||Array.isArray(f)&&f.includes(1))&&A.button===1&&A.type==="mousedown"&&(bt(A,"react-flow__node")||bt(A,"react-flow__edge")))return!0;if(!f&&!z&&!a&&!l&&!o||_||!l&&A.type==="dblclick"||bt(A,x)&&A.type==="wheel"||bt(A,b)&&(A.type!=="wheel"||a&&A.type==="wheel"&&!M)||!o&&A.ctrlKey&&A.type==="wheel"||!z&&!a&&!H&&A.type==="wheel"||!f&&(A.type==="mousedown"||A.type==="touchstart")||Array.isArray(f)&&!f.includes(A.button)&&A.type==="mousedown")return!1;const V=Array.isArray(f)&&f.includes(A.button)||!A.button||A.button<=1;return(!A.ctrlKey||A.type==="wheel")&&V})},[_,C,i,o,a,l,f,c,M]),D.createElement("div",{className:"react-flow__renderer",ref:E,style:Hs},v)},Xb=e=>({userSelectionActive:e.userSelectionActive,userSelectionRect:e.userSelectionRect});function Zb(){const{userSelectionActive:e,userSelectionRect:t}=le(Xb,Ce);return e&&t?D.createElement("div",{className:"react-flow__selection react-flow__container",style:{width:t.width,height:t.height,transform:`translate(${t.x}px, ${t.y}px)`}}):null}function Hu(e,t){const n=t.parentNode||t.parentId,r=e.find(i=>i.id===n);if(r){const i=t.position.x+t.width-r.width,o=t.position.y+t.height-r.height;if(i>0||o>0||t.position.x<0||t.position.y<0){if(r.style={...r.style},r.style.width=r.style.width??r.width,r.style.height=r.style.height??r.height,i>0&&(r.style.width+=i),o>0&&(r.style.height+=o),t.position.x<0){const a=Math.abs(t.position.x);r.position.x=r.position.x-a,r.style.width+=a,t.position.x=0}if(t.position.y<0){const a=Math.abs(t.position.y);r.position.y=r.position.y-a,r.style.height+=a,t.position.y=0}r.width=r.style.width,r.height=r.style.height}}}function Qb(e,t){if(e.some(r=>r.type==="reset"))return e.filter(r=>r.type==="reset").map(r=>r.item);const n=e.filter(r=>r.type==="add").map(r=>r.item);return t.reduce((r,i)=>{const o=e.filter(s=>s.id===i.id);if(o.length===0)return r.push(i),r;const a={...i};for(const s of o)if(s)switch(s.type){case"select":{a.selected=s.selected;break}case"position":{typeof s.position<"u"&&(a.position=s.position),typeof s.positionAbsolute<"u"&&(a.positionAbsolute=s.positionAbsolute),typeof s.dragging<"u"&&(a.dragging=s.dragging),a.expandParent&&Hu(r,a);break}case"dimensions":{typeof s.dimensions<"u"&&(a.width=s.dimensions.width,a.height=s.dimensions.height),typeof s.updateStyle<"u"&&(a.style={...a.style||{},...s.dimensions}),typeof s.resizing=="boolean"&&(a.resizing=s.resizing),a.expandParent&&Hu(r,a);break}case"remove":return r}return r.push(a),r},n)}function ap(e,t){return Qb(e,t)}const et=(e,t)=>({id:e,type:"select",selected:t});function _t(e,t){return e.reduce((n,r)=>{const i=t.includes(r.id);return!r.selected&&i?(r.selected=!0,n.push(et(r.id,!0))):r.selected&&!i&&(r.selected=!1,n.push(et(r.id,!1))),n},[])}const fr=(e,t)=>n=>{n.target===t.current&&(e==null||e(n))},Jb=e=>({userSelectionActive:e.userSelectionActive,elementsSelectable:e.elementsSelectable,dragging:e.paneDragging}),sp=R.memo(({isSelecting:e,selectionMode:t=Xt.Full,panOnDrag:n,onSelectionStart:r,onSelectionEnd:i,onPaneClick:o,onPaneContextMenu:a,onPaneScroll:s,onPaneMouseEnter:u,onPaneMouseMove:l,onPaneMouseLeave:c,children:f})=>{const d=R.useRef(null),h=ve(),m=R.useRef(0),p=R.useRef(0),g=R.useRef(),{userSelectionActive:y,elementsSelectable:v,dragging:x}=le(Jb,Ce),b=()=>{h.setState({userSelectionActive:!1,userSelectionRect:null}),m.current=0,p.current=0},w=P=>{o==null||o(P),h.getState().resetSelectedElements(),h.setState({nodesSelectionActive:!1})},S=P=>{if(Array.isArray(n)&&(n!=null&&n.includes(2))){P.preventDefault();return}a==null||a(P)},N=s?P=>s(P):void 0,T=P=>{const{resetSelectedElements:_,domNode:M}=h.getState();if(g.current=M==null?void 0:M.getBoundingClientRect(),!v||!e||P.button!==0||P.target!==d.current||!g.current)return;const{x:I,y:B}=nt(P,g.current);_(),h.setState({userSelectionRect:{width:0,height:0,startX:I,startY:B,x:I,y:B}}),r==null||r(P)},E=P=>{const{userSelectionRect:_,nodeInternals:M,edges:I,transform:B,onNodesChange:$,onEdgesChange:A,nodeOrigin:z,getNodes:H}=h.getState();if(!e||!g.current||!_)return;h.setState({userSelectionActive:!0,nodesSelectionActive:!1});const V=nt(P,g.current),Y=_.startX??0,q=_.startY??0,L={..._,x:V.x<Y?V.x:Y,y:V.y<q?V.y:q,width:Math.abs(V.x-Y),height:Math.abs(V.y-q)},F=H(),j=Hh(M,L,B,t===Xt.Partial,!0,z),W=Vh(j,I).map(ee=>ee.id),J=j.map(ee=>ee.id);if(m.current!==J.length){m.current=J.length;const ee=_t(F,J);ee.length&&($==null||$(ee))}if(p.current!==W.length){p.current=W.length;const ee=_t(I,W);ee.length&&(A==null||A(ee))}h.setState({userSelectionRect:L})},k=P=>{if(P.button!==0)return;const{userSelectionRect:_}=h.getState();!y&&_&&P.target===d.current&&(w==null||w(P)),h.setState({nodesSelectionActive:m.current>0}),b(),i==null||i(P)},C=P=>{y&&(h.setState({nodesSelectionActive:m.current>0}),i==null||i(P)),b()},O=v&&(e||y);return D.createElement("div",{className:_e(["react-flow__pane",{dragging:x,selection:e}]),onClick:O?void 0:fr(w,d),onContextMenu:fr(S,d),onWheel:fr(N,d),onMouseEnter:O?void 0:u,onMouseDown:O?T:void 0,onMouseMove:O?E:l,onMouseUp:O?k:void 0,onMouseLeave:O?C:c,ref:d,style:Hs},f,D.createElement(Zb,null))});sp.displayName="Pane";function up(e,t){const n=e.parentNode||e.parentId;if(!n)return!1;const r=t.get(n);return r?r.selected?!0:up(r,t):!1}function Vu(e,t,n){let r=e;do{if(r!=null&&r.matches(t))return!0;if(r===n.current)return!1;r=r.parentElement}while(r);return!1}function ex(e,t,n,r){return Array.from(e.values()).filter(i=>(i.selected||i.id===r)&&(!i.parentNode||i.parentId||!up(i,e))&&(i.draggable||t&&typeof i.draggable>"u")).map(i=>{var o,a;return{id:i.id,position:i.position||{x:0,y:0},positionAbsolute:i.positionAbsolute||{x:0,y:0},distance:{x:n.x-(((o=i.positionAbsolute)==null?void 0:o.x)??0),y:n.y-(((a=i.positionAbsolute)==null?void 0:a.y)??0)},delta:{x:0,y:0},extent:i.extent,parentNode:i.parentNode||i.parentId,parentId:i.parentNode||i.parentId,width:i.width,height:i.height,expandParent:i.expandParent}})}function tx(e,t){return!t||t==="parent"?t:[t[0],[t[1][0]-(e.width||0),t[1][1]-(e.height||0)]]}function cp(e,t,n,r,i=[0,0],o){const a=tx(e,e.extent||r);let s=a;const u=e.parentNode||e.parentId;if(e.extent==="parent"&&!e.expandParent)if(u&&e.width&&e.height){const f=n.get(u),{x:d,y:h}=lt(f,i).positionAbsolute;s=f&&Te(d)&&Te(h)&&Te(f.width)&&Te(f.height)?[[d+e.width*i[0],h+e.height*i[1]],[d+f.width-e.width+e.width*i[0],h+f.height-e.height+e.height*i[1]]]:s}else o==null||o("005",Xe.error005()),s=a;else if(e.extent&&u&&e.extent!=="parent"){const f=n.get(u),{x:d,y:h}=lt(f,i).positionAbsolute;s=[[e.extent[0][0]+d,e.extent[0][1]+h],[e.extent[1][0]+d,e.extent[1][1]+h]]}let l={x:0,y:0};if(u){const f=n.get(u);l=lt(f,i).positionAbsolute}const c=s&&s!=="parent"?Ps(t,s):t;return{position:{x:c.x-l.x,y:c.y-l.y},positionAbsolute:c}}function dr({nodeId:e,dragItems:t,nodeInternals:n}){const r=t.map(i=>({...n.get(i.id),position:i.position,positionAbsolute:i.positionAbsolute}));return[e?r.find(i=>i.id===e):r[0],r]}const ju=(e,t,n,r)=>{const i=t.querySelectorAll(e);if(!i||!i.length)return null;const o=Array.from(i),a=t.getBoundingClientRect(),s={x:a.width*r[0],y:a.height*r[1]};return o.map(u=>{const l=u.getBoundingClientRect();return{id:u.getAttribute("data-handleid"),position:u.getAttribute("data-handlepos"),x:(l.left-a.left-s.x)/n,y:(l.top-a.top-s.y)/n,...Ts(u)}})};function Dt(e,t,n){return n===void 0?n:r=>{const i=t().nodeInternals.get(e);i&&n(r,{...i})}}function ms({id:e,store:t,unselect:n=!1,nodeRef:r}){const{addSelectedNodes:i,unselectNodesAndEdges:o,multiSelectionActive:a,nodeInternals:s,onError:u}=t.getState(),l=s.get(e);if(!l){u==null||u("012",Xe.error012(e));return}t.setState({nodesSelectionActive:!1}),l.selected?(n||l.selected&&a)&&(o({nodes:[l],edges:[]}),requestAnimationFrame(()=>{var c;return(c=r==null?void 0:r.current)==null?void 0:c.blur()})):i([e])}function nx(){const e=ve();return R.useCallback(({sourceEvent:n})=>{const{transform:r,snapGrid:i,snapToGrid:o}=e.getState(),a=n.touches?n.touches[0].clientX:n.clientX,s=n.touches?n.touches[0].clientY:n.clientY,u={x:(a-r[0])/r[2],y:(s-r[1])/r[2]};return{xSnapped:o?i[0]*Math.round(u.x/i[0]):u.x,ySnapped:o?i[1]*Math.round(u.y/i[1]):u.y,...u}},[])}function hr(e){return(t,n,r)=>e==null?void 0:e(t,r)}function lp({nodeRef:e,disabled:t=!1,noDragClassName:n,handleSelector:r,nodeId:i,isSelectable:o,selectNodesOnDrag:a}){const s=ve(),[u,l]=R.useState(!1),c=R.useRef([]),f=R.useRef({x:null,y:null}),d=R.useRef(0),h=R.useRef(null),m=R.useRef({x:0,y:0}),p=R.useRef(null),g=R.useRef(!1),y=R.useRef(!1),v=R.useRef(!1),x=nx();return R.useEffect(()=>{if(e!=null&&e.current){const b=Ae(e.current),w=({x:T,y:E})=>{const{nodeInternals:k,onNodeDrag:C,onSelectionDrag:O,updateNodePositions:P,nodeExtent:_,snapGrid:M,snapToGrid:I,nodeOrigin:B,onError:$}=s.getState();f.current={x:T,y:E};let A=!1,z={x:0,y:0,x2:0,y2:0};if(c.current.length>1&&_){const V=Bn(c.current,B);z=Kt(V)}if(c.current=c.current.map(V=>{const Y={x:T-V.distance.x,y:E-V.distance.y};I&&(Y.x=M[0]*Math.round(Y.x/M[0]),Y.y=M[1]*Math.round(Y.y/M[1]));const q=[[_[0][0],_[0][1]],[_[1][0],_[1][1]]];c.current.length>1&&_&&!V.extent&&(q[0][0]=V.positionAbsolute.x-z.x+_[0][0],q[1][0]=V.positionAbsolute.x+(V.width??0)-z.x2+_[1][0],q[0][1]=V.positionAbsolute.y-z.y+_[0][1],q[1][1]=V.positionAbsolute.y+(V.height??0)-z.y2+_[1][1]);const L=cp(V,Y,k,q,B,$);return A=A||V.position.x!==L.position.x||V.position.y!==L.position.y,V.position=L.position,V.positionAbsolute=L.positionAbsolute,V}),!A)return;P(c.current,!0,!0),l(!0);const H=i?C:hr(O);if(H&&p.current){const[V,Y]=dr({nodeId:i,dragItems:c.current,nodeInternals:k});H(p.current,V,Y)}},S=()=>{if(!h.current)return;const[T,E]=Ah(m.current,h.current);if(T!==0||E!==0){const{transform:k,panBy:C}=s.getState();f.current.x=(f.current.x??0)-T/k[2],f.current.y=(f.current.y??0)-E/k[2],C({x:T,y:E})&&w(f.current)}d.current=requestAnimationFrame(S)},N=T=>{var B;const{nodeInternals:E,multiSelectionActive:k,nodesDraggable:C,unselectNodesAndEdges:O,onNodeDragStart:P,onSelectionDragStart:_}=s.getState();y.current=!0;const M=i?P:hr(_);(!a||!o)&&!k&&i&&((B=E.get(i))!=null&&B.selected||O()),i&&o&&a&&ms({id:i,store:s,nodeRef:e});const I=x(T);if(f.current=I,c.current=ex(E,C,I,i),M&&c.current){const[$,A]=dr({nodeId:i,dragItems:c.current,nodeInternals:E});M(T.sourceEvent,$,A)}};if(t)b.on(".drag",null);else{const T=hv().on("start",E=>{const{domNode:k,nodeDragThreshold:C}=s.getState();C===0&&N(E),v.current=!1;const O=x(E);f.current=O,h.current=(k==null?void 0:k.getBoundingClientRect())||null,m.current=nt(E.sourceEvent,h.current)}).on("drag",E=>{var P,_;const k=x(E),{autoPanOnNodeDrag:C,nodeDragThreshold:O}=s.getState();if(E.sourceEvent.type==="touchmove"&&E.sourceEvent.touches.length>1&&(v.current=!0),!v.current){if(!g.current&&y.current&&C&&(g.current=!0,S()),!y.current){const M=k.xSnapped-(((P=f==null?void 0:f.current)==null?void 0:P.x)??0),I=k.ySnapped-(((_=f==null?void 0:f.current)==null?void 0:_.y)??0);Math.sqrt(M*M+I*I)>O&&N(E)}(f.current.x!==k.xSnapped||f.current.y!==k.ySnapped)&&c.current&&y.current&&(p.current=E.sourceEvent,m.current=nt(E.sourceEvent,h.current),w(k))}}).on("end",E=>{if(!(!y.current||v.current)&&(l(!1),g.current=!1,y.current=!1,cancelAnimationFrame(d.current),c.current)){const{updateNodePositions:k,nodeInternals:C,onNodeDragStop:O,onSelectionDragStop:P}=s.getState(),_=i?O:hr(P);if(k(c.current,!1,!1),_){const[M,I]=dr({nodeId:i,dragItems:c.current,nodeInternals:C});_(E.sourceEvent,M,I)}}}).filter(E=>{const k=E.target;return!E.button&&(!n||!Vu(k,`.${n}`,e))&&(!r||Vu(k,r,e))});return b.call(T),()=>{b.on(".drag",null)}}}},[e,t,n,r,o,s,i,a,x]),u}function fp(){const e=ve();return R.useCallback(n=>{const{nodeInternals:r,nodeExtent:i,updateNodePositions:o,getNodes:a,snapToGrid:s,snapGrid:u,onError:l,nodesDraggable:c}=e.getState(),f=a().filter(v=>v.selected&&(v.draggable||c&&typeof v.draggable>"u")),d=s?u[0]:5,h=s?u[1]:5,m=n.isShiftPressed?4:1,p=n.x*d*m,g=n.y*h*m,y=f.map(v=>{if(v.positionAbsolute){const x={x:v.positionAbsolute.x+p,y:v.positionAbsolute.y+g};s&&(x.x=u[0]*Math.round(x.x/u[0]),x.y=u[1]*Math.round(x.y/u[1]));const{positionAbsolute:b,position:w}=cp(v,x,r,i,void 0,l);v.position=w,v.positionAbsolute=b}return v});o(y,!0,!1)},[])}const St={ArrowUp:{x:0,y:-1},ArrowDown:{x:0,y:1},ArrowLeft:{x:-1,y:0},ArrowRight:{x:1,y:0}};var Ft=e=>{const t=({id:n,type:r,data:i,xPos:o,yPos:a,xPosOrigin:s,yPosOrigin:u,selected:l,onClick:c,onMouseEnter:f,onMouseMove:d,onMouseLeave:h,onContextMenu:m,onDoubleClick:p,style:g,className:y,isDraggable:v,isSelectable:x,isConnectable:b,isFocusable:w,selectNodesOnDrag:S,sourcePosition:N,targetPosition:T,hidden:E,resizeObserver:k,dragHandle:C,zIndex:O,isParent:P,noDragClassName:_,noPanClassName:M,initialized:I,disableKeyboardA11y:B,ariaLabel:$,rfId:A,hasHandleBounds:z})=>{const H=ve(),V=R.useRef(null),Y=R.useRef(null),q=R.useRef(N),L=R.useRef(T),F=R.useRef(r),j=x||v||c||f||d||h,W=fp(),J=Dt(n,H.getState,f),ee=Dt(n,H.getState,d),ie=Dt(n,H.getState,h),ue=Dt(n,H.getState,m),ae=Dt(n,H.getState,p),ne=X=>{const{nodeDragThreshold:Z}=H.getState();if(x&&(!S||!v||Z>0)&&ms({id:n,store:H,nodeRef:V}),c){const fe=H.getState().nodeInternals.get(n);fe&&c(X,{...fe})}},te=X=>{if(!ls(X)&&!B)if(Lh.includes(X.key)&&x){const Z=X.key==="Escape";ms({id:n,store:H,unselect:Z,nodeRef:V})}else v&&l&&Object.prototype.hasOwnProperty.call(St,X.key)&&(H.setState({ariaLiveMessage:`Moved selected node ${X.key.replace("Arrow","").toLowerCase()}. New position, x: ${~~o}, y: ${~~a}`}),W({x:St[X.key].x,y:St[X.key].y,isShiftPressed:X.shiftKey}))};R.useEffect(()=>()=>{Y.current&&(k==null||k.unobserve(Y.current),Y.current=null)},[]),R.useEffect(()=>{if(V.current&&!E){const X=V.current;(!I||!z||Y.current!==X)&&(Y.current&&(k==null||k.unobserve(Y.current)),k==null||k.observe(X),Y.current=X)}},[E,I,z]),R.useEffect(()=>{const X=F.current!==r,Z=q.current!==N,fe=L.current!==T;V.current&&(X||Z||fe)&&(X&&(F.current=r),Z&&(q.current=N),fe&&(L.current=T),H.getState().updateNodeDimensions([{id:n,nodeElement:V.current,forceUpdate:!0}]))},[n,r,N,T]);const pe=lp({nodeRef:V,disabled:E||!v,noDragClassName:_,handleSelector:C,nodeId:n,isSelectable:x,selectNodesOnDrag:S});return E?null:D.createElement("div",{className:_e(["react-flow__node",`react-flow__node-${r}`,{[M]:v},y,{selected:l,selectable:x,parent:P,dragging:pe}]),ref:V,style:{zIndex:O,transform:`translate(${s}px,${u}px)`,pointerEvents:j?"all":"none",visibility:I?"visible":"hidden",...g},"data-id":n,"data-testid":`rf__node-${n}`,onMouseEnter:J,onMouseMove:ee,onMouseLeave:ie,onContextMenu:ue,onClick:ne,onDoubleClick:ae,onKeyDown:w?te:void 0,tabIndex:w?0:void 0,role:w?"button":void 0,"aria-describedby":B?void 0:`${tp}-${A}`,"aria-label":$},D.createElement(gb,{value:n},D.createElement(e,{id:n,data:i,type:r,xPos:o,yPos:a,selected:l,isConnectable:b,sourcePosition:N,targetPosition:T,dragging:pe,dragHandle:C,zIndex:O})))};return t.displayName="NodeWrapper",R.memo(t)};const rx=e=>{const t=e.getNodes().filter(n=>n.selected);return{...Bn(t,e.nodeOrigin),transformString:`translate(${e.transform[0]}px,${e.transform[1]}px) scale(${e.transform[2]})`,userSelectionActive:e.userSelectionActive}};function ix({onSelectionContextMenu:e,noPanClassName:t,disableKeyboardA11y:n}){const r=ve(),{width:i,height:o,x:a,y:s,transformString:u,userSelectionActive:l}=le(rx,Ce),c=fp(),f=R.useRef(null);if(R.useEffect(()=>{var m;n||(m=f.current)==null||m.focus({preventScroll:!0})},[n]),lp({nodeRef:f}),l||!i||!o)return null;const d=e?m=>{const p=r.getState().getNodes().filter(g=>g.selected);e(m,p)}:void 0,h=m=>{Object.prototype.hasOwnProperty.call(St,m.key)&&c({x:St[m.key].x,y:St[m.key].y,isShiftPressed:m.shiftKey})};return D.createElement("div",{className:_e(["react-flow__nodesselection","react-flow__container",t]),style:{transform:u}},D.createElement("div",{ref:f,className:"react-flow__nodesselection-rect",onContextMenu:d,tabIndex:n?void 0:-1,onKeyDown:n?void 0:h,style:{width:i,height:o,top:s,left:a}}))}var ox=R.memo(ix);const ax=e=>e.nodesSelectionActive,dp=({children:e,onPaneClick:t,onPaneMouseEnter:n,onPaneMouseMove:r,onPaneMouseLeave:i,onPaneContextMenu:o,onPaneScroll:a,deleteKeyCode:s,onMove:u,onMoveStart:l,onMoveEnd:c,selectionKeyCode:f,selectionOnDrag:d,selectionMode:h,onSelectionStart:m,onSelectionEnd:p,multiSelectionKeyCode:g,panActivationKeyCode:y,zoomActivationKeyCode:v,elementsSelectable:x,zoomOnScroll:b,zoomOnPinch:w,panOnScroll:S,panOnScrollSpeed:N,panOnScrollMode:T,zoomOnDoubleClick:E,panOnDrag:k,defaultViewport:C,translateExtent:O,minZoom:P,maxZoom:_,preventScrolling:M,onSelectionContextMenu:I,noWheelClassName:B,noPanClassName:$,disableKeyboardA11y:A})=>{const z=le(ax),H=Zt(f),V=Zt(y),Y=V||k,q=V||S,L=H||d&&Y!==!0;return Gb({deleteKeyCode:s,multiSelectionKeyCode:g}),D.createElement(Kb,{onMove:u,onMoveStart:l,onMoveEnd:c,onPaneContextMenu:o,elementsSelectable:x,zoomOnScroll:b,zoomOnPinch:w,panOnScroll:q,panOnScrollSpeed:N,panOnScrollMode:T,zoomOnDoubleClick:E,panOnDrag:!H&&Y,defaultViewport:C,translateExtent:O,minZoom:P,maxZoom:_,zoomActivationKeyCode:v,preventScrolling:M,noWheelClassName:B,noPanClassName:$},D.createElement(sp,{onSelectionStart:m,onSelectionEnd:p,onPaneClick:t,onPaneMouseEnter:n,onPaneMouseMove:r,onPaneMouseLeave:i,onPaneContextMenu:o,onPaneScroll:a,panOnDrag:Y,isSelecting:!!L,selectionMode:h},e,z&&D.createElement(ox,{onSelectionContextMenu:I,noPanClassName:$,disableKeyboardA11y:A})))};dp.displayName="FlowRenderer";var sx=R.memo(dp);function ux(e){return le(R.useCallback(n=>e?Hh(n.nodeInternals,{x:0,y:0,width:n.width,height:n.height},n.transform,!0):n.getNodes(),[e]))}function cx(e){const t={input:Ft(e.input||Zh),default:Ft(e.default||ps),output:Ft(e.output||Jh),group:Ft(e.group||Bs)},n={},r=Object.keys(e).filter(i=>!["input","default","output","group"].includes(i)).reduce((i,o)=>(i[o]=Ft(e[o]||ps),i),n);return{...t,...r}}const lx=({x:e,y:t,width:n,height:r,origin:i})=>!n||!r?{x:e,y:t}:i[0]<0||i[1]<0||i[0]>1||i[1]>1?{x:e,y:t}:{x:e-n*i[0],y:t-r*i[1]},fx=e=>({nodesDraggable:e.nodesDraggable,nodesConnectable:e.nodesConnectable,nodesFocusable:e.nodesFocusable,elementsSelectable:e.elementsSelectable,updateNodeDimensions:e.updateNodeDimensions,onError:e.onError}),hp=e=>{const{nodesDraggable:t,nodesConnectable:n,nodesFocusable:r,elementsSelectable:i,updateNodeDimensions:o,onError:a}=le(fx,Ce),s=ux(e.onlyRenderVisibleElements),u=R.useRef(),l=R.useMemo(()=>{if(typeof ResizeObserver>"u")return null;const c=new ResizeObserver(f=>{const d=f.map(h=>({id:h.target.getAttribute("data-id"),nodeElement:h.target,forceUpdate:!0}));o(d)});return u.current=c,c},[]);return R.useEffect(()=>()=>{var c;(c=u==null?void 0:u.current)==null||c.disconnect()},[]),D.createElement("div",{className:"react-flow__nodes",style:Hs},s.map(c=>{var w,S,N;let f=c.type||"default";e.nodeTypes[f]||(a==null||a("003",Xe.error003(f)),f="default");const d=e.nodeTypes[f]||e.nodeTypes.default,h=!!(c.draggable||t&&typeof c.draggable>"u"),m=!!(c.selectable||i&&typeof c.selectable>"u"),p=!!(c.connectable||n&&typeof c.connectable>"u"),g=!!(c.focusable||r&&typeof c.focusable>"u"),y=e.nodeExtent?Ps(c.positionAbsolute,e.nodeExtent):c.positionAbsolute,v=(y==null?void 0:y.x)??0,x=(y==null?void 0:y.y)??0,b=lx({x:v,y:x,width:c.width??0,height:c.height??0,origin:e.nodeOrigin});return D.createElement(d,{key:c.id,id:c.id,className:c.className,style:c.style,type:f,data:c.data,sourcePosition:c.sourcePosition||Q.Bottom,targetPosition:c.targetPosition||Q.Top,hidden:c.hidden,xPos:v,yPos:x,xPosOrigin:b.x,yPosOrigin:b.y,selectNodesOnDrag:e.selectNodesOnDrag,onClick:e.onNodeClick,onMouseEnter:e.onNodeMouseEnter,onMouseMove:e.onNodeMouseMove,onMouseLeave:e.onNodeMouseLeave,onContextMenu:e.onNodeContextMenu,onDoubleClick:e.onNodeDoubleClick,selected:!!c.selected,isDraggable:h,isSelectable:m,isConnectable:p,isFocusable:g,resizeObserver:l,dragHandle:c.dragHandle,zIndex:((w=c[me])==null?void 0:w.z)??0,isParent:!!((S=c[me])!=null&&S.isParent),noDragClassName:e.noDragClassName,noPanClassName:e.noPanClassName,initialized:!!c.width&&!!c.height,rfId:e.rfId,disableKeyboardA11y:e.disableKeyboardA11y,ariaLabel:c.ariaLabel,hasHandleBounds:!!((N=c[me])!=null&&N.handleBounds)})}))};hp.displayName="NodeRenderer";var dx=R.memo(hp);const hx=(e,t,n)=>n===Q.Left?e-t:n===Q.Right?e+t:e,px=(e,t,n)=>n===Q.Top?e-t:n===Q.Bottom?e+t:e,Gu="react-flow__edgeupdater",Uu=({position:e,centerX:t,centerY:n,radius:r=10,onMouseDown:i,onMouseEnter:o,onMouseOut:a,type:s})=>D.createElement("circle",{onMouseDown:i,onMouseEnter:o,onMouseOut:a,className:_e([Gu,`${Gu}-${s}`]),cx:hx(t,r,e),cy:px(n,r,e),r,stroke:"transparent",fill:"transparent"}),mx=()=>!0;var xt=e=>{const t=({id:n,className:r,type:i,data:o,onClick:a,onEdgeDoubleClick:s,selected:u,animated:l,label:c,labelStyle:f,labelShowBg:d,labelBgStyle:h,labelBgPadding:m,labelBgBorderRadius:p,style:g,source:y,target:v,sourceX:x,sourceY:b,targetX:w,targetY:S,sourcePosition:N,targetPosition:T,elementsSelectable:E,hidden:k,sourceHandleId:C,targetHandleId:O,onContextMenu:P,onMouseEnter:_,onMouseMove:M,onMouseLeave:I,reconnectRadius:B,onReconnect:$,onReconnectStart:A,onReconnectEnd:z,markerEnd:H,markerStart:V,rfId:Y,ariaLabel:q,isFocusable:L,isReconnectable:F,pathOptions:j,interactionWidth:W,disableKeyboardA11y:J})=>{const ee=R.useRef(null),[ie,ue]=R.useState(!1),[ae,ne]=R.useState(!1),te=ve(),pe=R.useMemo(()=>`url('#${ds(V,Y)}')`,[V,Y]),X=R.useMemo(()=>`url('#${ds(H,Y)}')`,[H,Y]);if(k)return null;const Z=be=>{var Be;const{edges:Ne,addSelectedEdges:Ee,unselectNodesAndEdges:Se,multiSelectionActive:it}=te.getState(),Ge=Ne.find(Tt=>Tt.id===n);Ge&&(E&&(te.setState({nodesSelectionActive:!1}),Ge.selected&&it?(Se({nodes:[],edges:[Ge]}),(Be=ee.current)==null||Be.blur()):Ee([n])),a&&a(be,Ge))},fe=$t(n,te.getState,s),Ie=$t(n,te.getState,P),ke=$t(n,te.getState,_),G=$t(n,te.getState,M),K=$t(n,te.getState,I),oe=(be,Ne)=>{if(be.button!==0)return;const{edges:Ee,isValidConnection:Se}=te.getState(),it=Ne?v:y,Ge=(Ne?O:C)||null,Be=Ne?"target":"source",Tt=Se||mx,Qn=Ne,Pt=Ee.find(ot=>ot.id===n);ne(!0),A==null||A(be,Pt,Be);const Jn=ot=>{ne(!1),z==null||z(ot,Pt,Be)};Yh({event:be,handleId:Ge,nodeId:it,onConnect:ot=>$==null?void 0:$(Pt,ot),isTarget:Qn,getState:te.getState,setState:te.setState,isValidConnection:Tt,edgeUpdaterType:Be,onReconnectEnd:Jn})},se=be=>oe(be,!0),de=be=>oe(be,!1),ge=()=>ue(!0),ye=()=>ue(!1),we=!E&&!a,ze=be=>{var Ne;if(!J&&Lh.includes(be.key)&&E){const{unselectNodesAndEdges:Ee,addSelectedEdges:Se,edges:it}=te.getState();be.key==="Escape"?((Ne=ee.current)==null||Ne.blur(),Ee({edges:[it.find(Be=>Be.id===n)]})):Se([n])}};return D.createElement("g",{className:_e(["react-flow__edge",`react-flow__edge-${i}`,r,{selected:u,animated:l,inactive:we,updating:ie}]),onClick:Z,onDoubleClick:fe,onContextMenu:Ie,onMouseEnter:ke,onMouseMove:G,onMouseLeave:K,onKeyDown:L?ze:void 0,tabIndex:L?0:void 0,role:L?"button":"img","data-testid":`rf__edge-${n}`,"aria-label":q===null?void 0:q||`Edge from ${y} to ${v}`,"aria-describedby":L?`${np}-${Y}`:void 0,ref:ee},!ae&&D.createElement(e,{id:n,source:y,target:v,selected:u,animated:l,label:c,labelStyle:f,labelShowBg:d,labelBgStyle:h,labelBgPadding:m,labelBgBorderRadius:p,data:o,style:g,sourceX:x,sourceY:b,targetX:w,targetY:S,sourcePosition:N,targetPosition:T,sourceHandleId:C,targetHandleId:O,markerStart:pe,markerEnd:X,pathOptions:j,interactionWidth:W}),F&&D.createElement(D.Fragment,null,(F==="source"||F===!0)&&D.createElement(Uu,{position:N,centerX:x,centerY:b,radius:B,onMouseDown:se,onMouseEnter:ge,onMouseOut:ye,type:"source"}),(F==="target"||F===!0)&&D.createElement(Uu,{position:T,centerX:w,centerY:S,radius:B,onMouseDown:de,onMouseEnter:ge,onMouseOut:ye,type:"target"})))};return t.displayName="EdgeWrapper",R.memo(t)};function gx(e){const t={default:xt(e.default||In),straight:xt(e.bezier||$s),step:xt(e.step||Ls),smoothstep:xt(e.step||zn),simplebezier:xt(e.simplebezier||Os)},n={},r=Object.keys(e).filter(i=>!["default","bezier"].includes(i)).reduce((i,o)=>(i[o]=xt(e[o]||In),i),n);return{...t,...r}}function Yu(e,t,n=null){const r=((n==null?void 0:n.x)||0)+t.x,i=((n==null?void 0:n.y)||0)+t.y,o=(n==null?void 0:n.width)||t.width,a=(n==null?void 0:n.height)||t.height;switch(e){case Q.Top:return{x:r+o/2,y:i};case Q.Right:return{x:r+o,y:i+a/2};case Q.Bottom:return{x:r+o/2,y:i+a};case Q.Left:return{x:r,y:i+a/2}}}function Wu(e,t){return e?e.length===1||!t?e[0]:t&&e.find(n=>n.id===t)||null:null}const yx=(e,t,n,r,i,o)=>{const a=Yu(n,e,t),s=Yu(o,r,i);return{sourceX:a.x,sourceY:a.y,targetX:s.x,targetY:s.y}};function vx({sourcePos:e,targetPos:t,sourceWidth:n,sourceHeight:r,targetWidth:i,targetHeight:o,width:a,height:s,transform:u}){const l={x:Math.min(e.x,t.x),y:Math.min(e.y,t.y),x2:Math.max(e.x+n,t.x+i),y2:Math.max(e.y+r,t.y+o)};l.x===l.x2&&(l.x2+=1),l.y===l.y2&&(l.y2+=1);const c=Kt({x:(0-u[0])/u[2],y:(0-u[1])/u[2],width:a/u[2],height:s/u[2]}),f=Math.max(0,Math.min(c.x2,l.x2)-Math.max(c.x,l.x)),d=Math.max(0,Math.min(c.y2,l.y2)-Math.max(c.y,l.y));return Math.ceil(f*d)>0}function Ku(e){var r,i,o,a,s;const t=((r=e==null?void 0:e[me])==null?void 0:r.handleBounds)||null,n=t&&(e==null?void 0:e.width)&&(e==null?void 0:e.height)&&typeof((i=e==null?void 0:e.positionAbsolute)==null?void 0:i.x)<"u"&&typeof((o=e==null?void 0:e.positionAbsolute)==null?void 0:o.y)<"u";return[{x:((a=e==null?void 0:e.positionAbsolute)==null?void 0:a.x)||0,y:((s=e==null?void 0:e.positionAbsolute)==null?void 0:s.y)||0,width:(e==null?void 0:e.width)||0,height:(e==null?void 0:e.height)||0},t,!!n]}const bx=[{level:0,isMaxLevel:!0,edges:[]}];function xx(e,t,n=!1){let r=-1;const i=e.reduce((a,s)=>{var c,f;const u=Te(s.zIndex);let l=u?s.zIndex:0;if(n){const d=t.get(s.target),h=t.get(s.source),m=s.selected||(d==null?void 0:d.selected)||(h==null?void 0:h.selected),p=Math.max(((c=h==null?void 0:h[me])==null?void 0:c.z)||0,((f=d==null?void 0:d[me])==null?void 0:f.z)||0,1e3);l=(u?s.zIndex:0)+(m?p:0)}return a[l]?a[l].push(s):a[l]=[s],r=l>r?l:r,a},{}),o=Object.entries(i).map(([a,s])=>{const u=+a;return{edges:s,level:u,isMaxLevel:u===r}});return o.length===0?bx:o}function _x(e,t,n){const r=le(R.useCallback(i=>e?i.edges.filter(o=>{const a=t.get(o.source),s=t.get(o.target);return(a==null?void 0:a.width)&&(a==null?void 0:a.height)&&(s==null?void 0:s.width)&&(s==null?void 0:s.height)&&vx({sourcePos:a.positionAbsolute||{x:0,y:0},targetPos:s.positionAbsolute||{x:0,y:0},sourceWidth:a.width,sourceHeight:a.height,targetWidth:s.width,targetHeight:s.height,width:i.width,height:i.height,transform:i.transform})}):i.edges,[e,t]));return xx(r,t,n)}const wx=({color:e="none",strokeWidth:t=1})=>D.createElement("polyline",{style:{stroke:e,strokeWidth:t},strokeLinecap:"round",strokeLinejoin:"round",fill:"none",points:"-5,-4 0,0 -5,4"}),Ex=({color:e="none",strokeWidth:t=1})=>D.createElement("polyline",{style:{stroke:e,fill:e,strokeWidth:t},strokeLinecap:"round",strokeLinejoin:"round",points:"-5,-4 0,0 -5,4 -5,-4"}),Xu={[Cn.Arrow]:wx,[Cn.ArrowClosed]:Ex};function Sx(e){const t=ve();return R.useMemo(()=>{var i,o;return Object.prototype.hasOwnProperty.call(Xu,e)?Xu[e]:((o=(i=t.getState()).onError)==null||o.call(i,"009",Xe.error009(e)),null)},[e])}const Nx=({id:e,type:t,color:n,width:r=12.5,height:i=12.5,markerUnits:o="strokeWidth",strokeWidth:a,orient:s="auto-start-reverse"})=>{const u=Sx(t);return u?D.createElement("marker",{className:"react-flow__arrowhead",id:e,markerWidth:`${r}`,markerHeight:`${i}`,viewBox:"-10 -10 20 20",markerUnits:o,orient:s,refX:"0",refY:"0"},D.createElement(u,{color:n,strokeWidth:a})):null},Rx=({defaultColor:e,rfId:t})=>n=>{const r=[];return n.edges.reduce((i,o)=>([o.markerStart,o.markerEnd].forEach(a=>{if(a&&typeof a=="object"){const s=ds(a,t);r.includes(s)||(i.push({id:s,color:a.color||e,...a}),r.push(s))}}),i),[]).sort((i,o)=>i.id.localeCompare(o.id))},pp=({defaultColor:e,rfId:t})=>{const n=le(R.useCallback(Rx({defaultColor:e,rfId:t}),[e,t]),(r,i)=>!(r.length!==i.length||r.some((o,a)=>o.id!==i[a].id)));return D.createElement("defs",null,n.map(r=>D.createElement(Nx,{id:r.id,key:r.id,type:r.type,color:r.color,width:r.width,height:r.height,markerUnits:r.markerUnits,strokeWidth:r.strokeWidth,orient:r.orient})))};pp.displayName="MarkerDefinitions";var qx=R.memo(pp);const Cx=e=>({nodesConnectable:e.nodesConnectable,edgesFocusable:e.edgesFocusable,edgesUpdatable:e.edgesUpdatable,elementsSelectable:e.elementsSelectable,width:e.width,height:e.height,connectionMode:e.connectionMode,nodeInternals:e.nodeInternals,onError:e.onError}),mp=({defaultMarkerColor:e,onlyRenderVisibleElements:t,elevateEdgesOnSelect:n,rfId:r,edgeTypes:i,noPanClassName:o,onEdgeContextMenu:a,onEdgeMouseEnter:s,onEdgeMouseMove:u,onEdgeMouseLeave:l,onEdgeClick:c,onEdgeDoubleClick:f,onReconnect:d,onReconnectStart:h,onReconnectEnd:m,reconnectRadius:p,children:g,disableKeyboardA11y:y})=>{const{edgesFocusable:v,edgesUpdatable:x,elementsSelectable:b,width:w,height:S,connectionMode:N,nodeInternals:T,onError:E}=le(Cx,Ce),k=_x(t,T,n);return w?D.createElement(D.Fragment,null,k.map(({level:C,edges:O,isMaxLevel:P})=>D.createElement("svg",{key:C,style:{zIndex:C},width:w,height:S,className:"react-flow__edges react-flow__container"},P&&D.createElement(qx,{defaultColor:e,rfId:r}),D.createElement("g",null,O.map(_=>{const[M,I,B]=Ku(T.get(_.source)),[$,A,z]=Ku(T.get(_.target));if(!B||!z)return null;let H=_.type||"default";i[H]||(E==null||E("011",Xe.error011(H)),H="default");const V=i[H]||i.default,Y=N===dt.Strict?A.target:(A.target??[]).concat(A.source??[]),q=Wu(I.source,_.sourceHandle),L=Wu(Y,_.targetHandle),F=(q==null?void 0:q.position)||Q.Bottom,j=(L==null?void 0:L.position)||Q.Top,W=!!(_.focusable||v&&typeof _.focusable>"u"),J=_.reconnectable||_.updatable,ee=typeof d<"u"&&(J||x&&typeof J>"u");if(!q||!L)return E==null||E("008",Xe.error008(q,_)),null;const{sourceX:ie,sourceY:ue,targetX:ae,targetY:ne}=yx(M,q,F,$,L,j);return D.createElement(V,{key:_.id,id:_.id,className:_e([_.className,o]),type:H,data:_.data,selected:!!_.selected,animated:!!_.animated,hidden:!!_.hidden,label:_.label,labelStyle:_.labelStyle,labelShowBg:_.labelShowBg,labelBgStyle:_.labelBgStyle,labelBgPadding:_.labelBgPadding,labelBgBorderRadius:_.labelBgBorderRadius,style:_.style,source:_.source,target:_.target,sourceHandleId:_.sourceHandle,targetHandleId:_.targetHandle,markerEnd:_.markerEnd,markerStart:_.markerStart,sourceX:ie,sourceY:ue,targetX:ae,targetY:ne,sourcePosition:F,targetPosition:j,elementsSelectable:b,onContextMenu:a,onMouseEnter:s,onMouseMove:u,onMouseLeave:l,onClick:c,onEdgeDoubleClick:f,onReconnect:d,onReconnectStart:h,onReconnectEnd:m,reconnectRadius:p,rfId:r,ariaLabel:_.ariaLabel,isFocusable:W,isReconnectable:ee,pathOptions:"pathOptions"in _?_.pathOptions:void 0,interactionWidth:_.interactionWidth,disableKeyboardA11y:y})})))),g):null};mp.displayName="EdgeRenderer";var Ix=R.memo(mp);const Mx=e=>`translate(${e.transform[0]}px,${e.transform[1]}px) scale(${e.transform[2]})`;function kx({children:e}){const t=le(Mx);return D.createElement("div",{className:"react-flow__viewport react-flow__container",style:{transform:t}},e)}function Ax(e){const t=Hn(),n=R.useRef(!1);R.useEffect(()=>{!n.current&&t.viewportInitialized&&e&&(setTimeout(()=>e(t),1),n.current=!0)},[e,t.viewportInitialized])}const Tx={[Q.Left]:Q.Right,[Q.Right]:Q.Left,[Q.Top]:Q.Bottom,[Q.Bottom]:Q.Top},gp=({nodeId:e,handleType:t,style:n,type:r=tt.Bezier,CustomComponent:i,connectionStatus:o})=>{var S,N,T;const{fromNode:a,handleId:s,toX:u,toY:l,connectionMode:c}=le(R.useCallback(E=>({fromNode:E.nodeInternals.get(e),handleId:E.connectionHandleId,toX:(E.connectionPosition.x-E.transform[0])/E.transform[2],toY:(E.connectionPosition.y-E.transform[1])/E.transform[2],connectionMode:E.connectionMode}),[e]),Ce),f=(S=a==null?void 0:a[me])==null?void 0:S.handleBounds;let d=f==null?void 0:f[t];if(c===dt.Loose&&(d=d||(f==null?void 0:f[t==="source"?"target":"source"])),!a||!d)return null;const h=s?d.find(E=>E.id===s):d[0],m=h?h.x+h.width/2:(a.width??0)/2,p=h?h.y+h.height/2:a.height??0,g=(((N=a.positionAbsolute)==null?void 0:N.x)??0)+m,y=(((T=a.positionAbsolute)==null?void 0:T.y)??0)+p,v=h==null?void 0:h.position,x=v?Tx[v]:null;if(!v||!x)return null;if(i)return D.createElement(i,{connectionLineType:r,connectionLineStyle:n,fromNode:a,fromHandle:h,fromX:g,fromY:y,toX:u,toY:l,fromPosition:v,toPosition:x,connectionStatus:o});let b="";const w={sourceX:g,sourceY:y,sourcePosition:v,targetX:u,targetY:l,targetPosition:x};return r===tt.Bezier?[b]=Ds(w):r===tt.Step?[b]=fs({...w,borderRadius:0}):r===tt.SmoothStep?[b]=fs(w):r===tt.SimpleBezier?[b]=zh(w):b=`M${g},${y} ${u},${l}`,D.createElement("path",{d:b,fill:"none",className:"react-flow__connection-path",style:n})};gp.displayName="ConnectionLine";const Px=e=>({nodeId:e.connectionNodeId,handleType:e.connectionHandleType,nodesConnectable:e.nodesConnectable,connectionStatus:e.connectionStatus,width:e.width,height:e.height});function Ox({containerStyle:e,style:t,type:n,component:r}){const{nodeId:i,handleType:o,nodesConnectable:a,width:s,height:u,connectionStatus:l}=le(Px,Ce);return!(i&&o&&s&&a)?null:D.createElement("svg",{style:e,width:s,height:u,className:"react-flow__edges react-flow__connectionline react-flow__container"},D.createElement("g",{className:_e(["react-flow__connection",l])},D.createElement(gp,{nodeId:i,handleType:o,style:t,type:n,CustomComponent:r,connectionStatus:l})))}function Zu(e,t){return R.useRef(null),ve(),R.useMemo(()=>t(e),[e])}const yp=({nodeTypes:e,edgeTypes:t,onMove:n,onMoveStart:r,onMoveEnd:i,onInit:o,onNodeClick:a,onEdgeClick:s,onNodeDoubleClick:u,onEdgeDoubleClick:l,onNodeMouseEnter:c,onNodeMouseMove:f,onNodeMouseLeave:d,onNodeContextMenu:h,onSelectionContextMenu:m,onSelectionStart:p,onSelectionEnd:g,connectionLineType:y,connectionLineStyle:v,connectionLineComponent:x,connectionLineContainerStyle:b,selectionKeyCode:w,selectionOnDrag:S,selectionMode:N,multiSelectionKeyCode:T,panActivationKeyCode:E,zoomActivationKeyCode:k,deleteKeyCode:C,onlyRenderVisibleElements:O,elementsSelectable:P,selectNodesOnDrag:_,defaultViewport:M,translateExtent:I,minZoom:B,maxZoom:$,preventScrolling:A,defaultMarkerColor:z,zoomOnScroll:H,zoomOnPinch:V,panOnScroll:Y,panOnScrollSpeed:q,panOnScrollMode:L,zoomOnDoubleClick:F,panOnDrag:j,onPaneClick:W,onPaneMouseEnter:J,onPaneMouseMove:ee,onPaneMouseLeave:ie,onPaneScroll:ue,onPaneContextMenu:ae,onEdgeContextMenu:ne,onEdgeMouseEnter:te,onEdgeMouseMove:pe,onEdgeMouseLeave:X,onReconnect:Z,onReconnectStart:fe,onReconnectEnd:Ie,reconnectRadius:ke,noDragClassName:G,noWheelClassName:K,noPanClassName:oe,elevateEdgesOnSelect:se,disableKeyboardA11y:de,nodeOrigin:ge,nodeExtent:ye,rfId:we})=>{const ze=Zu(e,cx),be=Zu(t,gx);return Ax(o),D.createElement(sx,{onPaneClick:W,onPaneMouseEnter:J,onPaneMouseMove:ee,onPaneMouseLeave:ie,onPaneContextMenu:ae,onPaneScroll:ue,deleteKeyCode:C,selectionKeyCode:w,selectionOnDrag:S,selectionMode:N,onSelectionStart:p,onSelectionEnd:g,multiSelectionKeyCode:T,panActivationKeyCode:E,zoomActivationKeyCode:k,elementsSelectable:P,onMove:n,onMoveStart:r,onMoveEnd:i,zoomOnScroll:H,zoomOnPinch:V,zoomOnDoubleClick:F,panOnScroll:Y,panOnScrollSpeed:q,panOnScrollMode:L,panOnDrag:j,defaultViewport:M,translateExtent:I,minZoom:B,maxZoom:$,onSelectionContextMenu:m,preventScrolling:A,noDragClassName:G,noWheelClassName:K,noPanClassName:oe,disableKeyboardA11y:de},D.createElement(kx,null,D.createElement(Ix,{edgeTypes:be,onEdgeClick:s,onEdgeDoubleClick:l,onlyRenderVisibleElements:O,onEdgeContextMenu:ne,onEdgeMouseEnter:te,onEdgeMouseMove:pe,onEdgeMouseLeave:X,onReconnect:Z,onReconnectStart:fe,onReconnectEnd:Ie,reconnectRadius:ke,defaultMarkerColor:z,noPanClassName:oe,elevateEdgesOnSelect:!!se,disableKeyboardA11y:de,rfId:we},D.createElement(Ox,{style:v,type:y,component:x,containerStyle:b})),D.createElement("div",{className:"react-flow__edgelabel-renderer"}),D.createElement(dx,{nodeTypes:ze,onNodeClick:a,onNodeDoubleClick:u,onNodeMouseEnter:c,onNodeMouseMove:f,onNodeMouseLeave:d,onNodeContextMenu:h,selectNodesOnDrag:_,onlyRenderVisibleElements:O,noPanClassName:oe,noDragClassName:G,disableKeyboardA11y:de,nodeOrigin:ge,nodeExtent:ye,rfId:we})))};yp.displayName="GraphView";var Lx=R.memo(yp);const gs=[[Number.NEGATIVE_INFINITY,Number.NEGATIVE_INFINITY],[Number.POSITIVE_INFINITY,Number.POSITIVE_INFINITY]],Qe={rfId:"1",width:0,height:0,transform:[0,0,1],nodeInternals:new Map,edges:[],onNodesChange:null,onEdgesChange:null,hasDefaultNodes:!1,hasDefaultEdges:!1,d3Zoom:null,d3Selection:null,d3ZoomHandler:void 0,minZoom:.5,maxZoom:2,translateExtent:gs,nodeExtent:gs,nodesSelectionActive:!1,userSelectionActive:!1,userSelectionRect:null,connectionNodeId:null,connectionHandleId:null,connectionHandleType:"source",connectionPosition:{x:0,y:0},connectionStatus:null,connectionMode:dt.Strict,domNode:null,paneDragging:!1,noPanClassName:"nopan",nodeOrigin:[0,0],nodeDragThreshold:0,snapGrid:[15,15],snapToGrid:!1,nodesDraggable:!0,nodesConnectable:!0,nodesFocusable:!0,edgesFocusable:!0,edgesUpdatable:!0,elementsSelectable:!0,elevateNodesOnSelect:!0,fitViewOnInit:!1,fitViewOnInitDone:!1,fitViewOnInitOptions:void 0,onSelectionChange:[],multiSelectionActive:!1,connectionStartHandle:null,connectionEndHandle:null,connectionClickStartHandle:null,connectOnClick:!0,ariaLiveMessage:"",autoPanOnConnect:!0,autoPanOnNodeDrag:!0,connectionRadius:20,onError:lb,isValidConnection:void 0},$x=()=>Ng((e,t)=>({...Qe,setNodes:n=>{const{nodeInternals:r,nodeOrigin:i,elevateNodesOnSelect:o}=t();e({nodeInternals:lr(n,r,i,o)})},getNodes:()=>Array.from(t().nodeInternals.values()),setEdges:n=>{const{defaultEdgeOptions:r={}}=t();e({edges:n.map(i=>({...r,...i}))})},setDefaultNodesAndEdges:(n,r)=>{const i=typeof n<"u",o=typeof r<"u",a=i?lr(n,new Map,t().nodeOrigin,t().elevateNodesOnSelect):new Map;e({nodeInternals:a,edges:o?r:[],hasDefaultNodes:i,hasDefaultEdges:o})},updateNodeDimensions:n=>{const{onNodesChange:r,nodeInternals:i,fitViewOnInit:o,fitViewOnInitDone:a,fitViewOnInitOptions:s,domNode:u,nodeOrigin:l}=t(),c=u==null?void 0:u.querySelector(".react-flow__viewport");if(!c)return;const f=window.getComputedStyle(c),{m22:d}=new window.DOMMatrixReadOnly(f.transform),h=n.reduce((p,g)=>{const y=i.get(g.id);if(y!=null&&y.hidden)i.set(y.id,{...y,[me]:{...y[me],handleBounds:void 0}});else if(y){const v=Ts(g.nodeElement);!!(v.width&&v.height&&(y.width!==v.width||y.height!==v.height||g.forceUpdate))&&(i.set(y.id,{...y,[me]:{...y[me],handleBounds:{source:ju(".source",g.nodeElement,d,l),target:ju(".target",g.nodeElement,d,l)}},...v}),p.push({id:y.id,type:"dimensions",dimensions:v}))}return p},[]);ip(i,l);const m=a||o&&!a&&op(t,{initial:!0,...s});e({nodeInternals:new Map(i),fitViewOnInitDone:m}),(h==null?void 0:h.length)>0&&(r==null||r(h))},updateNodePositions:(n,r=!0,i=!1)=>{const{triggerNodeChanges:o}=t(),a=n.map(s=>{const u={id:s.id,type:"position",dragging:i};return r&&(u.positionAbsolute=s.positionAbsolute,u.position=s.position),u});o(a)},triggerNodeChanges:n=>{const{onNodesChange:r,nodeInternals:i,hasDefaultNodes:o,nodeOrigin:a,getNodes:s,elevateNodesOnSelect:u}=t();if(n!=null&&n.length){if(o){const l=ap(n,s()),c=lr(l,i,a,u);e({nodeInternals:c})}r==null||r(n)}},addSelectedNodes:n=>{const{multiSelectionActive:r,edges:i,getNodes:o}=t();let a,s=null;r?a=n.map(u=>et(u,!0)):(a=_t(o(),n),s=_t(i,[])),fn({changedNodes:a,changedEdges:s,get:t,set:e})},addSelectedEdges:n=>{const{multiSelectionActive:r,edges:i,getNodes:o}=t();let a,s=null;r?a=n.map(u=>et(u,!0)):(a=_t(i,n),s=_t(o(),[])),fn({changedNodes:s,changedEdges:a,get:t,set:e})},unselectNodesAndEdges:({nodes:n,edges:r}={})=>{const{edges:i,getNodes:o}=t(),a=n||o(),s=r||i,u=a.map(c=>(c.selected=!1,et(c.id,!1))),l=s.map(c=>et(c.id,!1));fn({changedNodes:u,changedEdges:l,get:t,set:e})},setMinZoom:n=>{const{d3Zoom:r,maxZoom:i}=t();r==null||r.scaleExtent([n,i]),e({minZoom:n})},setMaxZoom:n=>{const{d3Zoom:r,minZoom:i}=t();r==null||r.scaleExtent([i,n]),e({maxZoom:n})},setTranslateExtent:n=>{var r;(r=t().d3Zoom)==null||r.translateExtent(n),e({translateExtent:n})},resetSelectedElements:()=>{const{edges:n,getNodes:r}=t(),o=r().filter(s=>s.selected).map(s=>et(s.id,!1)),a=n.filter(s=>s.selected).map(s=>et(s.id,!1));fn({changedNodes:o,changedEdges:a,get:t,set:e})},setNodeExtent:n=>{const{nodeInternals:r}=t();r.forEach(i=>{i.positionAbsolute=Ps(i.position,n)}),e({nodeExtent:n,nodeInternals:new Map(r)})},panBy:n=>{const{transform:r,width:i,height:o,d3Zoom:a,d3Selection:s,translateExtent:u}=t();if(!a||!s||!n.x&&!n.y)return!1;const l=We.translate(r[0]+n.x,r[1]+n.y).scale(r[2]),c=[[0,0],[i,o]],f=a==null?void 0:a.constrain()(l,c,u);return a.transform(s,f),r[0]!==f.x||r[1]!==f.y||r[2]!==f.k},cancelConnection:()=>e({connectionNodeId:Qe.connectionNodeId,connectionHandleId:Qe.connectionHandleId,connectionHandleType:Qe.connectionHandleType,connectionStatus:Qe.connectionStatus,connectionStartHandle:Qe.connectionStartHandle,connectionEndHandle:Qe.connectionEndHandle}),reset:()=>e({...Qe})}),Object.is),Vs=({children:e})=>{const t=R.useRef(null);return t.current||(t.current=$x()),D.createElement(rb,{value:t.current},e)};Vs.displayName="ReactFlowProvider";const vp=({children:e})=>R.useContext(Fn)?D.createElement(D.Fragment,null,e):D.createElement(Vs,null,e);vp.displayName="ReactFlowWrapper";const Dx={input:Zh,default:ps,output:Jh,group:Bs},Fx={default:In,straight:$s,step:Ls,smoothstep:zn,simplebezier:Os},zx=[0,0],Bx=[15,15],Hx={x:0,y:0,zoom:1},Vx={width:"100%",height:"100%",overflow:"hidden",position:"relative",zIndex:0},bp=R.forwardRef(({nodes:e,edges:t,defaultNodes:n,defaultEdges:r,className:i,nodeTypes:o=Dx,edgeTypes:a=Fx,onNodeClick:s,onEdgeClick:u,onInit:l,onMove:c,onMoveStart:f,onMoveEnd:d,onConnect:h,onConnectStart:m,onConnectEnd:p,onClickConnectStart:g,onClickConnectEnd:y,onNodeMouseEnter:v,onNodeMouseMove:x,onNodeMouseLeave:b,onNodeContextMenu:w,onNodeDoubleClick:S,onNodeDragStart:N,onNodeDrag:T,onNodeDragStop:E,onNodesDelete:k,onEdgesDelete:C,onSelectionChange:O,onSelectionDragStart:P,onSelectionDrag:_,onSelectionDragStop:M,onSelectionContextMenu:I,onSelectionStart:B,onSelectionEnd:$,connectionMode:A=dt.Strict,connectionLineType:z=tt.Bezier,connectionLineStyle:H,connectionLineComponent:V,connectionLineContainerStyle:Y,deleteKeyCode:q="Backspace",selectionKeyCode:L="Shift",selectionOnDrag:F=!1,selectionMode:j=Xt.Full,panActivationKeyCode:W="Space",multiSelectionKeyCode:J=qn()?"Meta":"Control",zoomActivationKeyCode:ee=qn()?"Meta":"Control",snapToGrid:ie=!1,snapGrid:ue=Bx,onlyRenderVisibleElements:ae=!1,selectNodesOnDrag:ne=!0,nodesDraggable:te,nodesConnectable:pe,nodesFocusable:X,nodeOrigin:Z=zx,edgesFocusable:fe,edgesUpdatable:Ie,elementsSelectable:ke,defaultViewport:G=Hx,minZoom:K=.5,maxZoom:oe=2,translateExtent:se=gs,preventScrolling:de=!0,nodeExtent:ge,defaultMarkerColor:ye="#b1b1b7",zoomOnScroll:we=!0,zoomOnPinch:ze=!0,panOnScroll:be=!1,panOnScrollSpeed:Ne=.5,panOnScrollMode:Ee=ut.Free,zoomOnDoubleClick:Se=!0,panOnDrag:it=!0,onPaneClick:Ge,onPaneMouseEnter:Be,onPaneMouseMove:Tt,onPaneMouseLeave:Qn,onPaneScroll:Pt,onPaneContextMenu:Jn,children:eu,onEdgeContextMenu:ot,onEdgeDoubleClick:fm,onEdgeMouseEnter:dm,onEdgeMouseMove:hm,onEdgeMouseLeave:pm,onEdgeUpdate:mm,onEdgeUpdateStart:gm,onEdgeUpdateEnd:ym,onReconnect:vm,onReconnectStart:bm,onReconnectEnd:xm,reconnectRadius:_m=10,edgeUpdaterRadius:wm=10,onNodesChange:Em,onEdgesChange:Sm,noDragClassName:Nm="nodrag",noWheelClassName:Rm="nowheel",noPanClassName:tu="nopan",fitView:qm=!1,fitViewOptions:Cm,connectOnClick:Im=!0,attributionPosition:Mm,proOptions:km,defaultEdgeOptions:Am,elevateNodesOnSelect:Tm=!0,elevateEdgesOnSelect:Pm=!1,disableKeyboardA11y:nu=!1,autoPanOnConnect:Om=!0,autoPanOnNodeDrag:Lm=!0,connectionRadius:$m=20,isValidConnection:Dm,onError:Fm,style:zm,id:ru,nodeDragThreshold:Bm,...Hm},Vm)=>{const er=ru||"1";return D.createElement("div",{...Hm,style:{...zm,...Vx},ref:Vm,className:_e(["react-flow",i]),"data-testid":"rf__wrapper",id:ru},D.createElement(vp,null,D.createElement(Lx,{onInit:l,onMove:c,onMoveStart:f,onMoveEnd:d,onNodeClick:s,onEdgeClick:u,onNodeMouseEnter:v,onNodeMouseMove:x,onNodeMouseLeave:b,onNodeContextMenu:w,onNodeDoubleClick:S,nodeTypes:o,edgeTypes:a,connectionLineType:z,connectionLineStyle:H,connectionLineComponent:V,connectionLineContainerStyle:Y,selectionKeyCode:L,selectionOnDrag:F,selectionMode:j,deleteKeyCode:q,multiSelectionKeyCode:J,panActivationKeyCode:W,zoomActivationKeyCode:ee,onlyRenderVisibleElements:ae,selectNodesOnDrag:ne,defaultViewport:G,translateExtent:se,minZoom:K,maxZoom:oe,preventScrolling:de,zoomOnScroll:we,zoomOnPinch:ze,zoomOnDoubleClick:Se,panOnScroll:be,panOnScrollSpeed:Ne,panOnScrollMode:Ee,panOnDrag:it,onPaneClick:Ge,onPaneMouseEnter:Be,onPaneMouseMove:Tt,onPaneMouseLeave:Qn,onPaneScroll:Pt,onPaneContextMenu:Jn,onSelectionContextMenu:I,onSelectionStart:B,onSelectionEnd:$,onEdgeContextMenu:ot,onEdgeDoubleClick:fm,onEdgeMouseEnter:dm,onEdgeMouseMove:hm,onEdgeMouseLeave:pm,onReconnect:vm??mm,onReconnectStart:bm??gm,onReconnectEnd:xm??ym,reconnectRadius:_m??wm,defaultMarkerColor:ye,noDragClassName:Nm,noWheelClassName:Rm,noPanClassName:tu,elevateEdgesOnSelect:Pm,rfId:er,disableKeyboardA11y:nu,nodeOrigin:Z,nodeExtent:ge}),D.createElement(Tb,{nodes:e,edges:t,defaultNodes:n,defaultEdges:r,onConnect:h,onConnectStart:m,onConnectEnd:p,onClickConnectStart:g,onClickConnectEnd:y,nodesDraggable:te,nodesConnectable:pe,nodesFocusable:X,edgesFocusable:fe,edgesUpdatable:Ie,elementsSelectable:ke,elevateNodesOnSelect:Tm,minZoom:K,maxZoom:oe,nodeExtent:ge,onNodesChange:Em,onEdgesChange:Sm,snapToGrid:ie,snapGrid:ue,connectionMode:A,translateExtent:se,connectOnClick:Im,defaultEdgeOptions:Am,fitView:qm,fitViewOptions:Cm,onNodesDelete:k,onEdgesDelete:C,onNodeDragStart:N,onNodeDrag:T,onNodeDragStop:E,onSelectionDrag:_,onSelectionDragStart:P,onSelectionDragStop:M,noPanClassName:tu,nodeOrigin:Z,rfId:er,autoPanOnConnect:Om,autoPanOnNodeDrag:Lm,onError:Fm,connectionRadius:$m,isValidConnection:Dm,nodeDragThreshold:Bm}),D.createElement(kb,{onSelectionChange:O}),eu,D.createElement(ob,{proOptions:km,position:Mm}),D.createElement(Db,{rfId:er,disableKeyboardA11y:nu})))});bp.displayName="ReactFlow";const jx=e=>t=>t.nodeInternals.size===0?!1:t.getNodes().filter(n=>e.includeHiddenNodes?!0:!n.hidden).every(n=>{var r;return((r=n[me])==null?void 0:r.handleBounds)!==void 0}),Gx={includeHiddenNodes:!1};function Ux(e=Gx){return le(jx(e))}function xp(e,t){if(Object.is(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;if(e instanceof Map&&t instanceof Map){if(e.size!==t.size)return!1;for(const[r,i]of e)if(!Object.is(i,t.get(r)))return!1;return!0}if(e instanceof Set&&t instanceof Set){if(e.size!==t.size)return!1;for(const r of e)if(!t.has(r))return!1;return!0}const n=Object.keys(e);if(n.length!==Object.keys(t).length)return!1;for(const r of n)if(!Object.prototype.hasOwnProperty.call(t,r)||!Object.is(e[r],t[r]))return!1;return!0}const _p=({id:e,x:t,y:n,width:r,height:i,style:o,color:a,strokeColor:s,strokeWidth:u,className:l,borderRadius:c,shapeRendering:f,onClick:d,selected:h})=>{const{background:m,backgroundColor:p}=o||{},g=a||m||p;return D.createElement("rect",{className:_e(["react-flow__minimap-node",{selected:h},l]),x:t,y:n,rx:c,ry:c,width:r,height:i,fill:g,stroke:s,strokeWidth:u,shapeRendering:f,onClick:d?y=>d(y,e):void 0})};_p.displayName="MiniMapNode";var Yx=R.memo(_p);const Wx=e=>e.nodeOrigin,Kx=e=>e.getNodes().filter(t=>!t.hidden&&t.width&&t.height),pr=e=>e instanceof Function?e:()=>e;function Xx({nodeStrokeColor:e="transparent",nodeColor:t="#e2e2e2",nodeClassName:n="",nodeBorderRadius:r=5,nodeStrokeWidth:i=2,nodeComponent:o=Yx,onClick:a}){const s=le(Kx,xp),u=le(Wx),l=pr(t),c=pr(e),f=pr(n),d=typeof window>"u"||window.chrome?"crispEdges":"geometricPrecision";return D.createElement(D.Fragment,null,s.map(h=>{const{x:m,y:p}=lt(h,u).positionAbsolute;return D.createElement(o,{key:h.id,x:m,y:p,width:h.width,height:h.height,style:h.style,selected:h.selected,className:f(h),color:l(h),borderRadius:r,strokeColor:c(h),strokeWidth:i,shapeRendering:d,onClick:a,id:h.id})}))}var Zx=R.memo(Xx);const Qx=200,Jx=150,e_=e=>{const t=e.getNodes(),n={x:-e.transform[0]/e.transform[2],y:-e.transform[1]/e.transform[2],width:e.width/e.transform[2],height:e.height/e.transform[2]};return{viewBB:n,boundingRect:t.length>0?ub(Bn(t,e.nodeOrigin),n):n,rfId:e.rfId}},t_="react-flow__minimap-desc";function wp({style:e,className:t,nodeStrokeColor:n="transparent",nodeColor:r="#e2e2e2",nodeClassName:i="",nodeBorderRadius:o=5,nodeStrokeWidth:a=2,nodeComponent:s,maskColor:u="rgb(240, 240, 240, 0.6)",maskStrokeColor:l="none",maskStrokeWidth:c=1,position:f="bottom-right",onClick:d,onNodeClick:h,pannable:m=!1,zoomable:p=!1,ariaLabel:g="React Flow mini map",inversePan:y=!1,zoomStep:v=10,offsetScale:x=5}){const b=ve(),w=R.useRef(null),{boundingRect:S,viewBB:N,rfId:T}=le(e_,xp),E=(e==null?void 0:e.width)??Qx,k=(e==null?void 0:e.height)??Jx,C=S.width/E,O=S.height/k,P=Math.max(C,O),_=P*E,M=P*k,I=x*P,B=S.x-(_-S.width)/2-I,$=S.y-(M-S.height)/2-I,A=_+I*2,z=M+I*2,H=`${t_}-${T}`,V=R.useRef(0);V.current=P,R.useEffect(()=>{if(w.current){const L=Ae(w.current),F=J=>{const{transform:ee,d3Selection:ie,d3Zoom:ue}=b.getState();if(J.sourceEvent.type!=="wheel"||!ie||!ue)return;const ae=-J.sourceEvent.deltaY*(J.sourceEvent.deltaMode===1?.05:J.sourceEvent.deltaMode?1:.002)*v,ne=ee[2]*Math.pow(2,ae);ue.scaleTo(ie,ne)},j=J=>{const{transform:ee,d3Selection:ie,d3Zoom:ue,translateExtent:ae,width:ne,height:te}=b.getState();if(J.sourceEvent.type!=="mousemove"||!ie||!ue)return;const pe=V.current*Math.max(1,ee[2])*(y?-1:1),X={x:ee[0]-J.sourceEvent.movementX*pe,y:ee[1]-J.sourceEvent.movementY*pe},Z=[[0,0],[ne,te]],fe=We.translate(X.x,X.y).scale(ee[2]),Ie=ue.constrain()(fe,Z,ae);ue.transform(ie,Ie)},W=Mh().on("zoom",m?j:null).on("zoom.wheel",p?F:null);return L.call(W),()=>{L.on("zoom",null)}}},[m,p,y,v]);const Y=d?L=>{const F=Oe(L);d(L,{x:F[0],y:F[1]})}:void 0,q=h?(L,F)=>{const j=b.getState().nodeInternals.get(F);h(L,j)}:void 0;return D.createElement(As,{position:f,style:e,className:_e(["react-flow__minimap",t]),"data-testid":"rf__minimap"},D.createElement("svg",{width:E,height:k,viewBox:`${B} ${$} ${A} ${z}`,role:"img","aria-labelledby":H,ref:w,onClick:Y},g&&D.createElement("title",{id:H},g),D.createElement(Zx,{onClick:q,nodeColor:r,nodeStrokeColor:n,nodeBorderRadius:o,nodeClassName:i,nodeStrokeWidth:a,nodeComponent:s}),D.createElement("path",{className:"react-flow__minimap-mask",d:`M${B-I},${$-I}h${A+I*2}v${z+I*2}h${-A-I*2}z
+        M${N.x},${N.y}h${N.width}v${N.height}h${-N.width}z`,fill:u,fillRule:"evenodd",stroke:l,strokeWidth:c,pointerEvents:"none"})))}wp.displayName="MiniMap";var n_=R.memo(wp);function r_(e,t){if(Object.is(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;if(e instanceof Map&&t instanceof Map){if(e.size!==t.size)return!1;for(const[r,i]of e)if(!Object.is(i,t.get(r)))return!1;return!0}if(e instanceof Set&&t instanceof Set){if(e.size!==t.size)return!1;for(const r of e)if(!t.has(r))return!1;return!0}const n=Object.keys(e);if(n.length!==Object.keys(t).length)return!1;for(const r of n)if(!Object.prototype.hasOwnProperty.call(t,r)||!Object.is(e[r],t[r]))return!1;return!0}function i_(){return D.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 32 32"},D.createElement("path",{d:"M32 18.133H18.133V32h-4.266V18.133H0v-4.266h13.867V0h4.266v13.867H32z"}))}function o_(){return D.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 32 5"},D.createElement("path",{d:"M0 0h32v4.2H0z"}))}function a_(){return D.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 32 30"},D.createElement("path",{d:"M3.692 4.63c0-.53.4-.938.939-.938h5.215V0H4.708C2.13 0 0 2.054 0 4.63v5.216h3.692V4.631zM27.354 0h-5.2v3.692h5.17c.53 0 .984.4.984.939v5.215H32V4.631A4.624 4.624 0 0027.354 0zm.954 24.83c0 .532-.4.94-.939.94h-5.215v3.768h5.215c2.577 0 4.631-2.13 4.631-4.707v-5.139h-3.692v5.139zm-23.677.94c-.531 0-.939-.4-.939-.94v-5.138H0v5.139c0 2.577 2.13 4.707 4.708 4.707h5.138V25.77H4.631z"}))}function s_(){return D.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 25 32"},D.createElement("path",{d:"M21.333 10.667H19.81V7.619C19.81 3.429 16.38 0 12.19 0 8 0 4.571 3.429 4.571 7.619v3.048H3.048A3.056 3.056 0 000 13.714v15.238A3.056 3.056 0 003.048 32h18.285a3.056 3.056 0 003.048-3.048V13.714a3.056 3.056 0 00-3.048-3.047zM12.19 24.533a3.056 3.056 0 01-3.047-3.047 3.056 3.056 0 013.047-3.048 3.056 3.056 0 013.048 3.048 3.056 3.056 0 01-3.048 3.047zm4.724-13.866H7.467V7.619c0-2.59 2.133-4.724 4.723-4.724 2.591 0 4.724 2.133 4.724 4.724v3.048z"}))}function u_(){return D.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 25 32"},D.createElement("path",{d:"M21.333 10.667H19.81V7.619C19.81 3.429 16.38 0 12.19 0c-4.114 1.828-1.37 2.133.305 2.438 1.676.305 4.42 2.59 4.42 5.181v3.048H3.047A3.056 3.056 0 000 13.714v15.238A3.056 3.056 0 003.048 32h18.285a3.056 3.056 0 003.048-3.048V13.714a3.056 3.056 0 00-3.048-3.047zM12.19 24.533a3.056 3.056 0 01-3.047-3.047 3.056 3.056 0 013.047-3.048 3.056 3.056 0 013.048 3.048 3.056 3.056 0 01-3.048 3.047z"}))}const Ht=({children:e,className:t,...n})=>D.createElement("button",{type:"button",className:_e(["react-flow__controls-button",t]),...n},e);Ht.displayName="ControlButton";const c_=e=>({isInteractive:e.nodesDraggable||e.nodesConnectable||e.elementsSelectable,minZoomReached:e.transform[2]<=e.minZoom,maxZoomReached:e.transform[2]>=e.maxZoom}),Ep=({style:e,showZoom:t=!0,showFitView:n=!0,showInteractive:r=!0,fitViewOptions:i,onZoomIn:o,onZoomOut:a,onFitView:s,onInteractiveChange:u,className:l,children:c,position:f="bottom-left"})=>{const d=ve(),[h,m]=R.useState(!1),{isInteractive:p,minZoomReached:g,maxZoomReached:y}=le(c_,r_),{zoomIn:v,zoomOut:x,fitView:b}=Hn();if(R.useEffect(()=>{m(!0)},[]),!h)return null;const w=()=>{v(),o==null||o()},S=()=>{x(),a==null||a()},N=()=>{b(i),s==null||s()},T=()=>{d.setState({nodesDraggable:!p,nodesConnectable:!p,elementsSelectable:!p}),u==null||u(!p)};return D.createElement(As,{className:_e(["react-flow__controls",l]),position:f,style:e,"data-testid":"rf__controls"},t&&D.createElement(D.Fragment,null,D.createElement(Ht,{onClick:w,className:"react-flow__controls-zoomin",title:"zoom in","aria-label":"zoom in",disabled:y},D.createElement(i_,null)),D.createElement(Ht,{onClick:S,className:"react-flow__controls-zoomout",title:"zoom out","aria-label":"zoom out",disabled:g},D.createElement(o_,null))),n&&D.createElement(Ht,{className:"react-flow__controls-fitview",onClick:N,title:"fit view","aria-label":"fit view"},D.createElement(a_,null)),r&&D.createElement(Ht,{className:"react-flow__controls-interactive",onClick:T,title:"toggle interactivity","aria-label":"toggle interactivity"},p?D.createElement(u_,null):D.createElement(s_,null)),c)};Ep.displayName="Controls";var l_=R.memo(Ep);function f_(e,t){if(Object.is(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;if(e instanceof Map&&t instanceof Map){if(e.size!==t.size)return!1;for(const[r,i]of e)if(!Object.is(i,t.get(r)))return!1;return!0}if(e instanceof Set&&t instanceof Set){if(e.size!==t.size)return!1;for(const r of e)if(!t.has(r))return!1;return!0}const n=Object.keys(e);if(n.length!==Object.keys(t).length)return!1;for(const r of n)if(!Object.prototype.hasOwnProperty.call(t,r)||!Object.is(e[r],t[r]))return!1;return!0}var $e;(function(e){e.Lines="lines",e.Dots="dots",e.Cross="cross"})($e||($e={}));function d_({color:e,dimensions:t,lineWidth:n}){return D.createElement("path",{stroke:e,strokeWidth:n,d:`M${t[0]/2} 0 V${t[1]} M0 ${t[1]/2} H${t[0]}`})}function h_({color:e,radius:t}){return D.createElement("circle",{cx:t,cy:t,r:t,fill:e})}const p_={[$e.Dots]:"#91919a",[$e.Lines]:"#eee",[$e.Cross]:"#e2e2e2"},m_={[$e.Dots]:1,[$e.Lines]:1,[$e.Cross]:6},g_=e=>({transform:e.transform,patternId:`pattern-${e.rfId}`});function Sp({id:e,variant:t=$e.Dots,gap:n=20,size:r,lineWidth:i=1,offset:o=2,color:a,style:s,className:u}){const l=R.useRef(null),{transform:c,patternId:f}=le(g_,f_),d=a||p_[t],h=r||m_[t],m=t===$e.Dots,p=t===$e.Cross,g=Array.isArray(n)?n:[n,n],y=[g[0]*c[2]||1,g[1]*c[2]||1],v=h*c[2],x=p?[v,v]:y,b=m?[v/o,v/o]:[x[0]/o,x[1]/o];return D.createElement("svg",{className:_e(["react-flow__background",u]),style:{...s,position:"absolute",width:"100%",height:"100%",top:0,left:0},ref:l,"data-testid":"rf__background"},D.createElement("pattern",{id:f+e,x:c[0]%y[0],y:c[1]%y[1],width:y[0],height:y[1],patternUnits:"userSpaceOnUse",patternTransform:`translate(-${b[0]},-${b[1]})`},m?D.createElement(h_,{color:d,radius:v/o}):D.createElement(d_,{dimensions:x,color:d,lineWidth:i})),D.createElement("rect",{x:"0",y:"0",width:"100%",height:"100%",fill:`url(#${f+e})`}))}Sp.displayName="Background";var y_=R.memo(Sp);const Nt=260,v_=36,b_=30,x_=30,__=30,w_=22,E_=2,S_=10,Qu=56,N_=28,R_=({columns:e=[],metrics:t=[],dimensions:n=[]}={})=>{let r=v_;r+=e.length>0?e.length*b_:x_;const i=o=>o.length>0?__+Math.ceil(o.length/E_)*w_:0;return r+=i(t),r+=i(n),r+S_};function js(e){throw new Error('Could not dynamically require "'+e+'". Please configure the dynamicRequireTargets or/and ignoreDynamicRequires option of @rollup/plugin-commonjs appropriately for this require call to work.')}var mr,Ju;function Gs(){if(Ju)return mr;Ju=1;function e(t,n){for(var r=-1,i=t==null?0:t.length;++r<i&&n(t[r],r,t)!==!1;);return t}return mr=e,mr}var gr,ec;function Np(){if(ec)return gr;ec=1;var e=jm(),t=(function(){try{var n=e(Object,"defineProperty");return n({},"",{}),n}catch{}})();return gr=t,gr}var yr,tc;function Vn(){if(tc)return yr;tc=1;var e=Np();function t(n,r,i){r=="__proto__"&&e?e(n,r,{configurable:!0,enumerable:!0,value:i,writable:!0}):n[r]=i}return yr=t,yr}var vr,nc;function jn(){if(nc)return vr;nc=1;var e=Vn(),t=kn(),n=Object.prototype,r=n.hasOwnProperty;function i(o,a,s){var u=o[a];(!(r.call(o,a)&&t(u,s))||s===void 0&&!(a in o))&&e(o,a,s)}return vr=i,vr}var br,rc;function tn(){if(rc)return br;rc=1;var e=jn(),t=Vn();function n(r,i,o,a){var s=!o;o||(o={});for(var u=-1,l=i.length;++u<l;){var c=i[u],f=a?a(o[c],r[c],c,o,r):void 0;f===void 0&&(f=r[c]),s?t(o,c,f):e(o,c,f)}return o}return br=n,br}var xr,ic;function q_(){if(ic)return xr;ic=1;var e=tn(),t=pt();function n(r,i){return r&&e(i,t(i),r)}return xr=n,xr}var _r,oc;function C_(){if(oc)return _r;oc=1;function e(t){var n=[];if(t!=null)for(var r in Object(t))n.push(r);return n}return _r=e,_r}var wr,ac;function I_(){if(ac)return wr;ac=1;var e=Ve(),t=ys(),n=C_(),r=Object.prototype,i=r.hasOwnProperty;function o(a){if(!e(a))return n(a);var s=t(a),u=[];for(var l in a)l=="constructor"&&(s||!i.call(a,l))||u.push(l);return u}return wr=o,wr}var Er,sc;function mt(){if(sc)return Er;sc=1;var e=Gm(),t=I_(),n=rt();function r(i){return n(i)?e(i,!0):t(i)}return Er=r,Er}var Sr,uc;function M_(){if(uc)return Sr;uc=1;var e=tn(),t=mt();function n(r,i){return r&&e(i,t(i),r)}return Sr=n,Sr}var Vt={exports:{}};Vt.exports;var cc;function Rp(){return cc||(cc=1,(function(e,t){var n=Wd(),r=t&&!t.nodeType&&t,i=r&&!0&&e&&!e.nodeType&&e,o=i&&i.exports===r,a=o?n.Buffer:void 0,s=a?a.allocUnsafe:void 0;function u(l,c){if(c)return l.slice();var f=l.length,d=s?s(f):new l.constructor(f);return l.copy(d),d}e.exports=u})(Vt,Vt.exports)),Vt.exports}var Nr,lc;function qp(){if(lc)return Nr;lc=1;function e(t,n){var r=-1,i=t.length;for(n||(n=Array(i));++r<i;)n[r]=t[r];return n}return Nr=e,Nr}var Rr,fc;function k_(){if(fc)return Rr;fc=1;var e=tn(),t=Kd();function n(r,i){return e(r,t(r),i)}return Rr=n,Rr}var qr,dc;function Gn(){if(dc)return qr;dc=1;var e=Um(),t=e(Object.getPrototypeOf,Object);return qr=t,qr}var Cr,hc;function Cp(){if(hc)return Cr;hc=1;var e=Xd(),t=Gn(),n=Kd(),r=Ym(),i=Object.getOwnPropertySymbols,o=i?function(a){for(var s=[];a;)e(s,n(a)),a=t(a);return s}:r;return Cr=o,Cr}var Ir,pc;function A_(){if(pc)return Ir;pc=1;var e=tn(),t=Cp();function n(r,i){return e(r,t(r),i)}return Ir=n,Ir}var Mr,mc;function T_(){if(mc)return Mr;mc=1;var e=Wm(),t=Cp(),n=mt();function r(i){return e(i,n,t)}return Mr=r,Mr}var kr,gc;function P_(){if(gc)return kr;gc=1;var e=Object.prototype,t=e.hasOwnProperty;function n(r){var i=r.length,o=new r.constructor(i);return i&&typeof r[0]=="string"&&t.call(r,"index")&&(o.index=r.index,o.input=r.input),o}return kr=n,kr}var Ar,yc;function Us(){if(yc)return Ar;yc=1;var e=Km();function t(n){var r=new n.constructor(n.byteLength);return new e(r).set(new e(n)),r}return Ar=t,Ar}var Tr,vc;function O_(){if(vc)return Tr;vc=1;var e=Us();function t(n,r){var i=r?e(n.buffer):n.buffer;return new n.constructor(i,n.byteOffset,n.byteLength)}return Tr=t,Tr}var Pr,bc;function L_(){if(bc)return Pr;bc=1;var e=/\w*$/;function t(n){var r=new n.constructor(n.source,e.exec(n));return r.lastIndex=n.lastIndex,r}return Pr=t,Pr}var Or,xc;function $_(){if(xc)return Or;xc=1;var e=vs(),t=e?e.prototype:void 0,n=t?t.valueOf:void 0;function r(i){return n?Object(n.call(i)):{}}return Or=r,Or}var Lr,_c;function Ip(){if(_c)return Lr;_c=1;var e=Us();function t(n,r){var i=r?e(n.buffer):n.buffer;return new n.constructor(i,n.byteOffset,n.length)}return Lr=t,Lr}var $r,wc;function D_(){if(wc)return $r;wc=1;var e=Us(),t=O_(),n=L_(),r=$_(),i=Ip(),o="[object Boolean]",a="[object Date]",s="[object Map]",u="[object Number]",l="[object RegExp]",c="[object Set]",f="[object String]",d="[object Symbol]",h="[object ArrayBuffer]",m="[object DataView]",p="[object Float32Array]",g="[object Float64Array]",y="[object Int8Array]",v="[object Int16Array]",x="[object Int32Array]",b="[object Uint8Array]",w="[object Uint8ClampedArray]",S="[object Uint16Array]",N="[object Uint32Array]";function T(E,k,C){var O=E.constructor;switch(k){case h:return e(E);case o:case a:return new O(+E);case m:return t(E,C);case p:case g:case y:case v:case x:case b:case w:case S:case N:return i(E,C);case s:return new O;case u:case f:return new O(E);case l:return n(E);case c:return new O;case d:return r(E)}}return $r=T,$r}var Dr,Ec;function Mp(){if(Ec)return Dr;Ec=1;var e=Ve(),t=Object.create,n=(function(){function r(){}return function(i){if(!e(i))return{};if(t)return t(i);r.prototype=i;var o=new r;return r.prototype=void 0,o}})();return Dr=n,Dr}var Fr,Sc;function kp(){if(Sc)return Fr;Sc=1;var e=Mp(),t=Gn(),n=ys();function r(i){return typeof i.constructor=="function"&&!n(i)?e(t(i)):{}}return Fr=r,Fr}var zr,Nc;function F_(){if(Nc)return zr;Nc=1;var e=Qt(),t=It(),n="[object Map]";function r(i){return t(i)&&e(i)==n}return zr=r,zr}var Br,Rc;function z_(){if(Rc)return Br;Rc=1;var e=F_(),t=bs(),n=Zd(),r=n&&n.isMap,i=r?t(r):e;return Br=i,Br}var Hr,qc;function B_(){if(qc)return Hr;qc=1;var e=Qt(),t=It(),n="[object Set]";function r(i){return t(i)&&e(i)==n}return Hr=r,Hr}var Vr,Cc;function H_(){if(Cc)return Vr;Cc=1;var e=B_(),t=bs(),n=Zd(),r=n&&n.isSet,i=r?t(r):e;return Vr=i,Vr}var jr,Ic;function Ap(){if(Ic)return jr;Ic=1;var e=xs(),t=Gs(),n=jn(),r=q_(),i=M_(),o=Rp(),a=qp(),s=k_(),u=A_(),l=Xm(),c=T_(),f=Qt(),d=P_(),h=D_(),m=kp(),p=xe(),g=An(),y=z_(),v=Ve(),x=H_(),b=pt(),w=mt(),S=1,N=2,T=4,E="[object Arguments]",k="[object Array]",C="[object Boolean]",O="[object Date]",P="[object Error]",_="[object Function]",M="[object GeneratorFunction]",I="[object Map]",B="[object Number]",$="[object Object]",A="[object RegExp]",z="[object Set]",H="[object String]",V="[object Symbol]",Y="[object WeakMap]",q="[object ArrayBuffer]",L="[object DataView]",F="[object Float32Array]",j="[object Float64Array]",W="[object Int8Array]",J="[object Int16Array]",ee="[object Int32Array]",ie="[object Uint8Array]",ue="[object Uint8ClampedArray]",ae="[object Uint16Array]",ne="[object Uint32Array]",te={};te[E]=te[k]=te[q]=te[L]=te[C]=te[O]=te[F]=te[j]=te[W]=te[J]=te[ee]=te[I]=te[B]=te[$]=te[A]=te[z]=te[H]=te[V]=te[ie]=te[ue]=te[ae]=te[ne]=!0,te[P]=te[_]=te[Y]=!1;function pe(X,Z,fe,Ie,ke,G){var K,oe=Z&S,se=Z&N,de=Z&T;if(fe&&(K=ke?fe(X,Ie,ke,G):fe(X)),K!==void 0)return K;if(!v(X))return X;var ge=p(X);if(ge){if(K=d(X),!oe)return a(X,K)}else{var ye=f(X),we=ye==_||ye==M;if(g(X))return o(X,oe);if(ye==$||ye==E||we&&!ke){if(K=se||we?{}:m(X),!oe)return se?u(X,i(K,X)):s(X,r(K,X))}else{if(!te[ye])return ke?X:{};K=h(X,ye,oe)}}G||(G=new e);var ze=G.get(X);if(ze)return ze;G.set(X,K),x(X)?X.forEach(function(Ee){K.add(pe(Ee,Z,fe,Ee,X,G))}):y(X)&&X.forEach(function(Ee,Se){K.set(Se,pe(Ee,Z,fe,Se,X,G))});var be=de?se?c:l:se?w:b,Ne=ge?void 0:be(X);return t(Ne||X,function(Ee,Se){Ne&&(Se=Ee,Ee=X[Se]),n(K,Se,pe(Ee,Z,fe,Se,X,G))}),K}return jr=pe,jr}var Gr,Mc;function V_(){if(Mc)return Gr;Mc=1;var e=Ap(),t=4;function n(r){return e(r,t)}return Gr=n,Gr}var Ur,kc;function Ys(){if(kc)return Ur;kc=1;function e(t){return function(){return t}}return Ur=e,Ur}var Yr,Ac;function j_(){if(Ac)return Yr;Ac=1;function e(t){return function(n,r,i){for(var o=-1,a=Object(n),s=i(n),u=s.length;u--;){var l=s[t?u:++o];if(r(a[l],l,a)===!1)break}return n}}return Yr=e,Yr}var Wr,Tc;function Ws(){if(Tc)return Wr;Tc=1;var e=j_(),t=e();return Wr=t,Wr}var Kr,Pc;function Ks(){if(Pc)return Kr;Pc=1;var e=Ws(),t=pt();function n(r,i){return r&&e(r,i,t)}return Kr=n,Kr}var Xr,Oc;function G_(){if(Oc)return Xr;Oc=1;var e=rt();function t(n,r){return function(i,o){if(i==null)return i;if(!e(i))return n(i,o);for(var a=i.length,s=r?a:-1,u=Object(i);(r?s--:++s<a)&&o(u[s],s,u)!==!1;);return i}}return Xr=t,Xr}var Zr,Lc;function Un(){if(Lc)return Zr;Lc=1;var e=Ks(),t=G_(),n=t(e);return Zr=n,Zr}var Qr,$c;function gt(){if($c)return Qr;$c=1;function e(t){return t}return Qr=e,Qr}var Jr,Dc;function Tp(){if(Dc)return Jr;Dc=1;var e=gt();function t(n){return typeof n=="function"?n:e}return Jr=t,Jr}var ei,Fc;function Pp(){if(Fc)return ei;Fc=1;var e=Gs(),t=Un(),n=Tp(),r=xe();function i(o,a){var s=r(o)?e:t;return s(o,n(a))}return ei=i,ei}var ti,zc;function Op(){return zc||(zc=1,ti=Pp()),ti}var ni,Bc;function U_(){if(Bc)return ni;Bc=1;var e=Un();function t(n,r){var i=[];return e(n,function(o,a,s){r(o,a,s)&&i.push(o)}),i}return ni=t,ni}var ri,Hc;function Y_(){if(Hc)return ri;Hc=1;var e=xs(),t=Qd(),n=1,r=2;function i(o,a,s,u){var l=s.length,c=l,f=!u;if(o==null)return!c;for(o=Object(o);l--;){var d=s[l];if(f&&d[2]?d[1]!==o[d[0]]:!(d[0]in o))return!1}for(;++l<c;){d=s[l];var h=d[0],m=o[h],p=d[1];if(f&&d[2]){if(m===void 0&&!(h in o))return!1}else{var g=new e;if(u)var y=u(m,p,h,o,a,g);if(!(y===void 0?t(p,m,n|r,u,g):y))return!1}}return!0}return ri=i,ri}var ii,Vc;function Lp(){if(Vc)return ii;Vc=1;var e=Ve();function t(n){return n===n&&!e(n)}return ii=t,ii}var oi,jc;function W_(){if(jc)return oi;jc=1;var e=Lp(),t=pt();function n(r){for(var i=t(r),o=i.length;o--;){var a=i[o],s=r[a];i[o]=[a,s,e(s)]}return i}return oi=n,oi}var ai,Gc;function $p(){if(Gc)return ai;Gc=1;function e(t,n){return function(r){return r==null?!1:r[t]===n&&(n!==void 0||t in Object(r))}}return ai=e,ai}var si,Uc;function K_(){if(Uc)return si;Uc=1;var e=Y_(),t=W_(),n=$p();function r(i){var o=t(i);return o.length==1&&o[0][2]?n(o[0][0],o[0][1]):function(a){return a===i||e(a,i,o)}}return si=r,si}var ui,Yc;function At(){if(Yc)return ui;Yc=1;var e=_s(),t=It(),n="[object Symbol]";function r(i){return typeof i=="symbol"||t(i)&&e(i)==n}return ui=r,ui}var ci,Wc;function Xs(){if(Wc)return ci;Wc=1;var e=xe(),t=At(),n=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,r=/^\w*$/;function i(o,a){if(e(o))return!1;var s=typeof o;return s=="number"||s=="symbol"||s=="boolean"||o==null||t(o)?!0:r.test(o)||!n.test(o)||a!=null&&o in Object(a)}return ci=i,ci}var li,Kc;function X_(){if(Kc)return li;Kc=1;var e=Zm(),t="Expected a function";function n(r,i){if(typeof r!="function"||i!=null&&typeof i!="function")throw new TypeError(t);var o=function(){var a=arguments,s=i?i.apply(this,a):a[0],u=o.cache;if(u.has(s))return u.get(s);var l=r.apply(this,a);return o.cache=u.set(s,l)||u,l};return o.cache=new(n.Cache||e),o}return n.Cache=e,li=n,li}var fi,Xc;function Z_(){if(Xc)return fi;Xc=1;var e=X_(),t=500;function n(r){var i=e(r,function(a){return o.size===t&&o.clear(),a}),o=i.cache;return i}return fi=n,fi}var di,Zc;function Q_(){if(Zc)return di;Zc=1;var e=Z_(),t=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,n=/\\(\\)?/g,r=e(function(i){var o=[];return i.charCodeAt(0)===46&&o.push(""),i.replace(t,function(a,s,u,l){o.push(u?l.replace(n,"$1"):s||a)}),o});return di=r,di}var hi,Qc;function Yn(){if(Qc)return hi;Qc=1;function e(t,n){for(var r=-1,i=t==null?0:t.length,o=Array(i);++r<i;)o[r]=n(t[r],r,t);return o}return hi=e,hi}var pi,Jc;function J_(){if(Jc)return pi;Jc=1;var e=vs(),t=Yn(),n=xe(),r=At(),i=e?e.prototype:void 0,o=i?i.toString:void 0;function a(s){if(typeof s=="string")return s;if(n(s))return t(s,a)+"";if(r(s))return o?o.call(s):"";var u=s+"";return u=="0"&&1/s==-1/0?"-0":u}return pi=a,pi}var mi,el;function Dp(){if(el)return mi;el=1;var e=J_();function t(n){return n==null?"":e(n)}return mi=t,mi}var gi,tl;function Wn(){if(tl)return gi;tl=1;var e=xe(),t=Xs(),n=Q_(),r=Dp();function i(o,a){return e(o)?o:t(o,a)?[o]:n(r(o))}return gi=i,gi}var yi,nl;function nn(){if(nl)return yi;nl=1;var e=At();function t(n){if(typeof n=="string"||e(n))return n;var r=n+"";return r=="0"&&1/n==-1/0?"-0":r}return yi=t,yi}var vi,rl;function Kn(){if(rl)return vi;rl=1;var e=Wn(),t=nn();function n(r,i){i=e(i,r);for(var o=0,a=i.length;r!=null&&o<a;)r=r[t(i[o++])];return o&&o==a?r:void 0}return vi=n,vi}var bi,il;function ew(){if(il)return bi;il=1;var e=Kn();function t(n,r,i){var o=n==null?void 0:e(n,r);return o===void 0?i:o}return bi=t,bi}var xi,ol;function tw(){if(ol)return xi;ol=1;function e(t,n){return t!=null&&n in Object(t)}return xi=e,xi}var _i,al;function Fp(){if(al)return _i;al=1;var e=Wn(),t=Tn(),n=xe(),r=ws(),i=Qm(),o=nn();function a(s,u,l){u=e(u,s);for(var c=-1,f=u.length,d=!1;++c<f;){var h=o(u[c]);if(!(d=s!=null&&l(s,h)))break;s=s[h]}return d||++c!=f?d:(f=s==null?0:s.length,!!f&&i(f)&&r(h,f)&&(n(s)||t(s)))}return _i=a,_i}var wi,sl;function zp(){if(sl)return wi;sl=1;var e=tw(),t=Fp();function n(r,i){return r!=null&&t(r,i,e)}return wi=n,wi}var Ei,ul;function nw(){if(ul)return Ei;ul=1;var e=Qd(),t=ew(),n=zp(),r=Xs(),i=Lp(),o=$p(),a=nn(),s=1,u=2;function l(c,f){return r(c)&&i(f)?o(a(c),f):function(d){var h=t(d,c);return h===void 0&&h===f?n(d,c):e(f,h,s|u)}}return Ei=l,Ei}var Si,cl;function Bp(){if(cl)return Si;cl=1;function e(t){return function(n){return n==null?void 0:n[t]}}return Si=e,Si}var Ni,ll;function rw(){if(ll)return Ni;ll=1;var e=Kn();function t(n){return function(r){return e(r,n)}}return Ni=t,Ni}var Ri,fl;function iw(){if(fl)return Ri;fl=1;var e=Bp(),t=rw(),n=Xs(),r=nn();function i(o){return n(o)?e(r(o)):t(o)}return Ri=i,Ri}var qi,dl;function Ze(){if(dl)return qi;dl=1;var e=K_(),t=nw(),n=gt(),r=xe(),i=iw();function o(a){return typeof a=="function"?a:a==null?n:typeof a=="object"?r(a)?t(a[0],a[1]):e(a):i(a)}return qi=o,qi}var Ci,hl;function Hp(){if(hl)return Ci;hl=1;var e=Jm(),t=U_(),n=Ze(),r=xe();function i(o,a){var s=r(o)?e:t;return s(o,n(a,3))}return Ci=i,Ci}var Ii,pl;function ow(){if(pl)return Ii;pl=1;var e=Object.prototype,t=e.hasOwnProperty;function n(r,i){return r!=null&&t.call(r,i)}return Ii=n,Ii}var Mi,ml;function Vp(){if(ml)return Mi;ml=1;var e=ow(),t=Fp();function n(r,i){return r!=null&&t(r,i,e)}return Mi=n,Mi}var ki,gl;function aw(){if(gl)return ki;gl=1;var e=Jd(),t=Qt(),n=Tn(),r=xe(),i=rt(),o=An(),a=ys(),s=Es(),u="[object Map]",l="[object Set]",c=Object.prototype,f=c.hasOwnProperty;function d(h){if(h==null)return!0;if(i(h)&&(r(h)||typeof h=="string"||typeof h.splice=="function"||o(h)||s(h)||n(h)))return!h.length;var m=t(h);if(m==u||m==l)return!h.size;if(a(h))return!e(h).length;for(var p in h)if(f.call(h,p))return!1;return!0}return ki=d,ki}var Ai,yl;function jp(){if(yl)return Ai;yl=1;function e(t){return t===void 0}return Ai=e,Ai}var Ti,vl;function Gp(){if(vl)return Ti;vl=1;var e=Un(),t=rt();function n(r,i){var o=-1,a=t(r)?Array(r.length):[];return e(r,function(s,u,l){a[++o]=i(s,u,l)}),a}return Ti=n,Ti}var Pi,bl;function Up(){if(bl)return Pi;bl=1;var e=Yn(),t=Ze(),n=Gp(),r=xe();function i(o,a){var s=r(o)?e:n;return s(o,t(a,3))}return Pi=i,Pi}var Oi,xl;function sw(){if(xl)return Oi;xl=1;function e(t,n,r,i){var o=-1,a=t==null?0:t.length;for(i&&a&&(r=t[++o]);++o<a;)r=n(r,t[o],o,t);return r}return Oi=e,Oi}var Li,_l;function uw(){if(_l)return Li;_l=1;function e(t,n,r,i,o){return o(t,function(a,s,u){r=i?(i=!1,a):n(r,a,s,u)}),r}return Li=e,Li}var $i,wl;function Yp(){if(wl)return $i;wl=1;var e=sw(),t=Un(),n=Ze(),r=uw(),i=xe();function o(a,s,u){var l=i(a)?e:r,c=arguments.length<3;return l(a,n(s,4),u,c,t)}return $i=o,$i}var Di,El;function cw(){if(El)return Di;El=1;var e=_s(),t=xe(),n=It(),r="[object String]";function i(o){return typeof o=="string"||!t(o)&&n(o)&&e(o)==r}return Di=i,Di}var Fi,Sl;function lw(){if(Sl)return Fi;Sl=1;var e=Bp(),t=e("length");return Fi=t,Fi}var zi,Nl;function fw(){if(Nl)return zi;Nl=1;var e="\\ud800-\\udfff",t="\\u0300-\\u036f",n="\\ufe20-\\ufe2f",r="\\u20d0-\\u20ff",i=t+n+r,o="\\ufe0e\\ufe0f",a="\\u200d",s=RegExp("["+a+e+i+o+"]");function u(l){return s.test(l)}return zi=u,zi}var Bi,Rl;function dw(){if(Rl)return Bi;Rl=1;var e="\\ud800-\\udfff",t="\\u0300-\\u036f",n="\\ufe20-\\ufe2f",r="\\u20d0-\\u20ff",i=t+n+r,o="\\ufe0e\\ufe0f",a="["+e+"]",s="["+i+"]",u="\\ud83c[\\udffb-\\udfff]",l="(?:"+s+"|"+u+")",c="[^"+e+"]",f="(?:\\ud83c[\\udde6-\\uddff]){2}",d="[\\ud800-\\udbff][\\udc00-\\udfff]",h="\\u200d",m=l+"?",p="["+o+"]?",g="(?:"+h+"(?:"+[c,f,d].join("|")+")"+p+m+")*",y=p+m+g,v="(?:"+[c+s+"?",s,f,d,a].join("|")+")",x=RegExp(u+"(?="+u+")|"+v+y,"g");function b(w){for(var S=x.lastIndex=0;x.test(w);)++S;return S}return Bi=b,Bi}var Hi,ql;function hw(){if(ql)return Hi;ql=1;var e=lw(),t=fw(),n=dw();function r(i){return t(i)?n(i):e(i)}return Hi=r,Hi}var Vi,Cl;function pw(){if(Cl)return Vi;Cl=1;var e=Jd(),t=Qt(),n=rt(),r=cw(),i=hw(),o="[object Map]",a="[object Set]";function s(u){if(u==null)return 0;if(n(u))return r(u)?i(u):u.length;var l=t(u);return l==o||l==a?u.size:e(u).length}return Vi=s,Vi}var ji,Il;function mw(){if(Il)return ji;Il=1;var e=Gs(),t=Mp(),n=Ks(),r=Ze(),i=Gn(),o=xe(),a=An(),s=Ss(),u=Ve(),l=Es();function c(f,d,h){var m=o(f),p=m||a(f)||l(f);if(d=r(d,4),h==null){var g=f&&f.constructor;p?h=m?new g:[]:u(f)?h=s(g)?t(i(f)):{}:h={}}return(p?e:n)(f,function(y,v,x){return d(h,y,v,x)}),h}return ji=c,ji}var Gi,Ml;function gw(){if(Ml)return Gi;Ml=1;var e=vs(),t=Tn(),n=xe(),r=e?e.isConcatSpreadable:void 0;function i(o){return n(o)||t(o)||!!(r&&o&&o[r])}return Gi=i,Gi}var Ui,kl;function Zs(){if(kl)return Ui;kl=1;var e=Xd(),t=gw();function n(r,i,o,a,s){var u=-1,l=r.length;for(o||(o=t),s||(s=[]);++u<l;){var c=r[u];i>0&&o(c)?i>1?n(c,i-1,o,a,s):e(s,c):a||(s[s.length]=c)}return s}return Ui=n,Ui}var Yi,Al;function yw(){if(Al)return Yi;Al=1;function e(t,n,r){switch(r.length){case 0:return t.call(n);case 1:return t.call(n,r[0]);case 2:return t.call(n,r[0],r[1]);case 3:return t.call(n,r[0],r[1],r[2])}return t.apply(n,r)}return Yi=e,Yi}var Wi,Tl;function Wp(){if(Tl)return Wi;Tl=1;var e=yw(),t=Math.max;function n(r,i,o){return i=t(i===void 0?r.length-1:i,0),function(){for(var a=arguments,s=-1,u=t(a.length-i,0),l=Array(u);++s<u;)l[s]=a[i+s];s=-1;for(var c=Array(i+1);++s<i;)c[s]=a[s];return c[i]=o(l),e(r,this,c)}}return Wi=n,Wi}var Ki,Pl;function vw(){if(Pl)return Ki;Pl=1;var e=Ys(),t=Np(),n=gt(),r=t?function(i,o){return t(i,"toString",{configurable:!0,enumerable:!1,value:e(o),writable:!0})}:n;return Ki=r,Ki}var Xi,Ol;function bw(){if(Ol)return Xi;Ol=1;var e=800,t=16,n=Date.now;function r(i){var o=0,a=0;return function(){var s=n(),u=t-(s-a);if(a=s,u>0){if(++o>=e)return arguments[0]}else o=0;return i.apply(void 0,arguments)}}return Xi=r,Xi}var Zi,Ll;function Kp(){if(Ll)return Zi;Ll=1;var e=vw(),t=bw(),n=t(e);return Zi=n,Zi}var Qi,$l;function Xn(){if($l)return Qi;$l=1;var e=gt(),t=Wp(),n=Kp();function r(i,o){return n(t(i,o,e),i+"")}return Qi=r,Qi}var Ji,Dl;function Xp(){if(Dl)return Ji;Dl=1;function e(t,n,r,i){for(var o=t.length,a=r+(i?1:-1);i?a--:++a<o;)if(n(t[a],a,t))return a;return-1}return Ji=e,Ji}var eo,Fl;function xw(){if(Fl)return eo;Fl=1;function e(t){return t!==t}return eo=e,eo}var to,zl;function _w(){if(zl)return to;zl=1;function e(t,n,r){for(var i=r-1,o=t.length;++i<o;)if(t[i]===n)return i;return-1}return to=e,to}var no,Bl;function ww(){if(Bl)return no;Bl=1;var e=Xp(),t=xw(),n=_w();function r(i,o,a){return o===o?n(i,o,a):e(i,t,a)}return no=r,no}var ro,Hl;function Ew(){if(Hl)return ro;Hl=1;var e=ww();function t(n,r){var i=n==null?0:n.length;return!!i&&e(n,r,0)>-1}return ro=t,ro}var io,Vl;function Sw(){if(Vl)return io;Vl=1;function e(t,n,r){for(var i=-1,o=t==null?0:t.length;++i<o;)if(r(n,t[i]))return!0;return!1}return io=e,io}var oo,jl;function Nw(){if(jl)return oo;jl=1;function e(){}return oo=e,oo}var ao,Gl;function Rw(){if(Gl)return ao;Gl=1;var e=eg(),t=Nw(),n=eh(),r=1/0,i=e&&1/n(new e([,-0]))[1]==r?function(o){return new e(o)}:t;return ao=i,ao}var so,Ul;function qw(){if(Ul)return so;Ul=1;var e=tg(),t=Ew(),n=Sw(),r=ng(),i=Rw(),o=eh(),a=200;function s(u,l,c){var f=-1,d=t,h=u.length,m=!0,p=[],g=p;if(c)m=!1,d=n;else if(h>=a){var y=l?null:i(u);if(y)return o(y);m=!1,d=r,g=new e}else g=l?[]:p;e:for(;++f<h;){var v=u[f],x=l?l(v):v;if(v=c||v!==0?v:0,m&&x===x){for(var b=g.length;b--;)if(g[b]===x)continue e;l&&g.push(x),p.push(v)}else d(g,x,c)||(g!==p&&g.push(x),p.push(v))}return p}return so=s,so}var uo,Yl;function Zp(){if(Yl)return uo;Yl=1;var e=rt(),t=It();function n(r){return t(r)&&e(r)}return uo=n,uo}var co,Wl;function Cw(){if(Wl)return co;Wl=1;var e=Zs(),t=Xn(),n=qw(),r=Zp(),i=t(function(o){return n(e(o,1,r,!0))});return co=i,co}var lo,Kl;function Iw(){if(Kl)return lo;Kl=1;var e=Yn();function t(n,r){return e(r,function(i){return n[i]})}return lo=t,lo}var fo,Xl;function Qp(){if(Xl)return fo;Xl=1;var e=Iw(),t=pt();function n(r){return r==null?[]:e(r,t(r))}return fo=n,fo}var ho,Zl;function Pe(){if(Zl)return ho;Zl=1;var e;if(typeof js=="function")try{e={clone:V_(),constant:Ys(),each:Op(),filter:Hp(),has:Vp(),isArray:xe(),isEmpty:aw(),isFunction:Ss(),isUndefined:jp(),keys:pt(),map:Up(),reduce:Yp(),size:pw(),transform:mw(),union:Cw(),values:Qp()}}catch{}return e||(e=window._),ho=e,ho}var po,Ql;function Qs(){if(Ql)return po;Ql=1;var e=Pe();po=i;var t="\0",n="\0",r="";function i(c){this._isDirected=e.has(c,"directed")?c.directed:!0,this._isMultigraph=e.has(c,"multigraph")?c.multigraph:!1,this._isCompound=e.has(c,"compound")?c.compound:!1,this._label=void 0,this._defaultNodeLabelFn=e.constant(void 0),this._defaultEdgeLabelFn=e.constant(void 0),this._nodes={},this._isCompound&&(this._parent={},this._children={},this._children[n]={}),this._in={},this._preds={},this._out={},this._sucs={},this._edgeObjs={},this._edgeLabels={}}i.prototype._nodeCount=0,i.prototype._edgeCount=0,i.prototype.isDirected=function(){return this._isDirected},i.prototype.isMultigraph=function(){return this._isMultigraph},i.prototype.isCompound=function(){return this._isCompound},i.prototype.setGraph=function(c){return this._label=c,this},i.prototype.graph=function(){return this._label},i.prototype.setDefaultNodeLabel=function(c){return e.isFunction(c)||(c=e.constant(c)),this._defaultNodeLabelFn=c,this},i.prototype.nodeCount=function(){return this._nodeCount},i.prototype.nodes=function(){return e.keys(this._nodes)},i.prototype.sources=function(){var c=this;return e.filter(this.nodes(),function(f){return e.isEmpty(c._in[f])})},i.prototype.sinks=function(){var c=this;return e.filter(this.nodes(),function(f){return e.isEmpty(c._out[f])})},i.prototype.setNodes=function(c,f){var d=arguments,h=this;return e.each(c,function(m){d.length>1?h.setNode(m,f):h.setNode(m)}),this},i.prototype.setNode=function(c,f){return e.has(this._nodes,c)?(arguments.length>1&&(this._nodes[c]=f),this):(this._nodes[c]=arguments.length>1?f:this._defaultNodeLabelFn(c),this._isCompound&&(this._parent[c]=n,this._children[c]={},this._children[n][c]=!0),this._in[c]={},this._preds[c]={},this._out[c]={},this._sucs[c]={},++this._nodeCount,this)},i.prototype.node=function(c){return this._nodes[c]},i.prototype.hasNode=function(c){return e.has(this._nodes,c)},i.prototype.removeNode=function(c){var f=this;if(e.has(this._nodes,c)){var d=function(h){f.removeEdge(f._edgeObjs[h])};delete this._nodes[c],this._isCompound&&(this._removeFromParentsChildList(c),delete this._parent[c],e.each(this.children(c),function(h){f.setParent(h)}),delete this._children[c]),e.each(e.keys(this._in[c]),d),delete this._in[c],delete this._preds[c],e.each(e.keys(this._out[c]),d),delete this._out[c],delete this._sucs[c],--this._nodeCount}return this},i.prototype.setParent=function(c,f){if(!this._isCompound)throw new Error("Cannot set parent in a non-compound graph");if(e.isUndefined(f))f=n;else{f+="";for(var d=f;!e.isUndefined(d);d=this.parent(d))if(d===c)throw new Error("Setting "+f+" as parent of "+c+" would create a cycle");this.setNode(f)}return this.setNode(c),this._removeFromParentsChildList(c),this._parent[c]=f,this._children[f][c]=!0,this},i.prototype._removeFromParentsChildList=function(c){delete this._children[this._parent[c]][c]},i.prototype.parent=function(c){if(this._isCompound){var f=this._parent[c];if(f!==n)return f}},i.prototype.children=function(c){if(e.isUndefined(c)&&(c=n),this._isCompound){var f=this._children[c];if(f)return e.keys(f)}else{if(c===n)return this.nodes();if(this.hasNode(c))return[]}},i.prototype.predecessors=function(c){var f=this._preds[c];if(f)return e.keys(f)},i.prototype.successors=function(c){var f=this._sucs[c];if(f)return e.keys(f)},i.prototype.neighbors=function(c){var f=this.predecessors(c);if(f)return e.union(f,this.successors(c))},i.prototype.isLeaf=function(c){var f;return this.isDirected()?f=this.successors(c):f=this.neighbors(c),f.length===0},i.prototype.filterNodes=function(c){var f=new this.constructor({directed:this._isDirected,multigraph:this._isMultigraph,compound:this._isCompound});f.setGraph(this.graph());var d=this;e.each(this._nodes,function(p,g){c(g)&&f.setNode(g,p)}),e.each(this._edgeObjs,function(p){f.hasNode(p.v)&&f.hasNode(p.w)&&f.setEdge(p,d.edge(p))});var h={};function m(p){var g=d.parent(p);return g===void 0||f.hasNode(g)?(h[p]=g,g):g in h?h[g]:m(g)}return this._isCompound&&e.each(f.nodes(),function(p){f.setParent(p,m(p))}),f},i.prototype.setDefaultEdgeLabel=function(c){return e.isFunction(c)||(c=e.constant(c)),this._defaultEdgeLabelFn=c,this},i.prototype.edgeCount=function(){return this._edgeCount},i.prototype.edges=function(){return e.values(this._edgeObjs)},i.prototype.setPath=function(c,f){var d=this,h=arguments;return e.reduce(c,function(m,p){return h.length>1?d.setEdge(m,p,f):d.setEdge(m,p),p}),this},i.prototype.setEdge=function(){var c,f,d,h,m=!1,p=arguments[0];typeof p=="object"&&p!==null&&"v"in p?(c=p.v,f=p.w,d=p.name,arguments.length===2&&(h=arguments[1],m=!0)):(c=p,f=arguments[1],d=arguments[3],arguments.length>2&&(h=arguments[2],m=!0)),c=""+c,f=""+f,e.isUndefined(d)||(d=""+d);var g=s(this._isDirected,c,f,d);if(e.has(this._edgeLabels,g))return m&&(this._edgeLabels[g]=h),this;if(!e.isUndefined(d)&&!this._isMultigraph)throw new Error("Cannot set a named edge when isMultigraph = false");this.setNode(c),this.setNode(f),this._edgeLabels[g]=m?h:this._defaultEdgeLabelFn(c,f,d);var y=u(this._isDirected,c,f,d);return c=y.v,f=y.w,Object.freeze(y),this._edgeObjs[g]=y,o(this._preds[f],c),o(this._sucs[c],f),this._in[f][g]=y,this._out[c][g]=y,this._edgeCount++,this},i.prototype.edge=function(c,f,d){var h=arguments.length===1?l(this._isDirected,arguments[0]):s(this._isDirected,c,f,d);return this._edgeLabels[h]},i.prototype.hasEdge=function(c,f,d){var h=arguments.length===1?l(this._isDirected,arguments[0]):s(this._isDirected,c,f,d);return e.has(this._edgeLabels,h)},i.prototype.removeEdge=function(c,f,d){var h=arguments.length===1?l(this._isDirected,arguments[0]):s(this._isDirected,c,f,d),m=this._edgeObjs[h];return m&&(c=m.v,f=m.w,delete this._edgeLabels[h],delete this._edgeObjs[h],a(this._preds[f],c),a(this._sucs[c],f),delete this._in[f][h],delete this._out[c][h],this._edgeCount--),this},i.prototype.inEdges=function(c,f){var d=this._in[c];if(d){var h=e.values(d);return f?e.filter(h,function(m){return m.v===f}):h}},i.prototype.outEdges=function(c,f){var d=this._out[c];if(d){var h=e.values(d);return f?e.filter(h,function(m){return m.w===f}):h}},i.prototype.nodeEdges=function(c,f){var d=this.inEdges(c,f);if(d)return d.concat(this.outEdges(c,f))};function o(c,f){c[f]?c[f]++:c[f]=1}function a(c,f){--c[f]||delete c[f]}function s(c,f,d,h){var m=""+f,p=""+d;if(!c&&m>p){var g=m;m=p,p=g}return m+r+p+r+(e.isUndefined(h)?t:h)}function u(c,f,d,h){var m=""+f,p=""+d;if(!c&&m>p){var g=m;m=p,p=g}var y={v:m,w:p};return h&&(y.name=h),y}function l(c,f){return s(c,f.v,f.w,f.name)}return po}var mo,Jl;function Mw(){return Jl||(Jl=1,mo="2.1.8"),mo}var go,ef;function kw(){return ef||(ef=1,go={Graph:Qs(),version:Mw()}),go}var yo,tf;function Aw(){if(tf)return yo;tf=1;var e=Pe(),t=Qs();yo={write:n,read:o};function n(a){var s={options:{directed:a.isDirected(),multigraph:a.isMultigraph(),compound:a.isCompound()},nodes:r(a),edges:i(a)};return e.isUndefined(a.graph())||(s.value=e.clone(a.graph())),s}function r(a){return e.map(a.nodes(),function(s){var u=a.node(s),l=a.parent(s),c={v:s};return e.isUndefined(u)||(c.value=u),e.isUndefined(l)||(c.parent=l),c})}function i(a){return e.map(a.edges(),function(s){var u=a.edge(s),l={v:s.v,w:s.w};return e.isUndefined(s.name)||(l.name=s.name),e.isUndefined(u)||(l.value=u),l})}function o(a){var s=new t(a.options).setGraph(a.value);return e.each(a.nodes,function(u){s.setNode(u.v,u.value),u.parent&&s.setParent(u.v,u.parent)}),e.each(a.edges,function(u){s.setEdge({v:u.v,w:u.w,name:u.name},u.value)}),s}return yo}var vo,nf;function Tw(){if(nf)return vo;nf=1;var e=Pe();vo=t;function t(n){var r={},i=[],o;function a(s){e.has(r,s)||(r[s]=!0,o.push(s),e.each(n.successors(s),a),e.each(n.predecessors(s),a))}return e.each(n.nodes(),function(s){o=[],a(s),o.length&&i.push(o)}),i}return vo}var bo,rf;function Jp(){if(rf)return bo;rf=1;var e=Pe();bo=t;function t(){this._arr=[],this._keyIndices={}}return t.prototype.size=function(){return this._arr.length},t.prototype.keys=function(){return this._arr.map(function(n){return n.key})},t.prototype.has=function(n){return e.has(this._keyIndices,n)},t.prototype.priority=function(n){var r=this._keyIndices[n];if(r!==void 0)return this._arr[r].priority},t.prototype.min=function(){if(this.size()===0)throw new Error("Queue underflow");return this._arr[0].key},t.prototype.add=function(n,r){var i=this._keyIndices;if(n=String(n),!e.has(i,n)){var o=this._arr,a=o.length;return i[n]=a,o.push({key:n,priority:r}),this._decrease(a),!0}return!1},t.prototype.removeMin=function(){this._swap(0,this._arr.length-1);var n=this._arr.pop();return delete this._keyIndices[n.key],this._heapify(0),n.key},t.prototype.decrease=function(n,r){var i=this._keyIndices[n];if(r>this._arr[i].priority)throw new Error("New priority is greater than current priority. Key: "+n+" Old: "+this._arr[i].priority+" New: "+r);this._arr[i].priority=r,this._decrease(i)},t.prototype._heapify=function(n){var r=this._arr,i=2*n,o=i+1,a=n;i<r.length&&(a=r[i].priority<r[a].priority?i:a,o<r.length&&(a=r[o].priority<r[a].priority?o:a),a!==n&&(this._swap(n,a),this._heapify(a)))},t.prototype._decrease=function(n){for(var r=this._arr,i=r[n].priority,o;n!==0&&(o=n>>1,!(r[o].priority<i));)this._swap(n,o),n=o},t.prototype._swap=function(n,r){var i=this._arr,o=this._keyIndices,a=i[n],s=i[r];i[n]=s,i[r]=a,o[s.key]=n,o[a.key]=r},bo}var xo,of;function em(){if(of)return xo;of=1;var e=Pe(),t=Jp();xo=r;var n=e.constant(1);function r(o,a,s,u){return i(o,String(a),s||n,u||function(l){return o.outEdges(l)})}function i(o,a,s,u){var l={},c=new t,f,d,h=function(m){var p=m.v!==f?m.v:m.w,g=l[p],y=s(m),v=d.distance+y;if(y<0)throw new Error("dijkstra does not allow negative edge weights. Bad edge: "+m+" Weight: "+y);v<g.distance&&(g.distance=v,g.predecessor=f,c.decrease(p,v))};for(o.nodes().forEach(function(m){var p=m===a?0:Number.POSITIVE_INFINITY;l[m]={distance:p},c.add(m,p)});c.size()>0&&(f=c.removeMin(),d=l[f],d.distance!==Number.POSITIVE_INFINITY);)u(f).forEach(h);return l}return xo}var _o,af;function Pw(){if(af)return _o;af=1;var e=em(),t=Pe();_o=n;function n(r,i,o){return t.transform(r.nodes(),function(a,s){a[s]=e(r,s,i,o)},{})}return _o}var wo,sf;function tm(){if(sf)return wo;sf=1;var e=Pe();wo=t;function t(n){var r=0,i=[],o={},a=[];function s(u){var l=o[u]={onStack:!0,lowlink:r,index:r++};if(i.push(u),n.successors(u).forEach(function(d){e.has(o,d)?o[d].onStack&&(l.lowlink=Math.min(l.lowlink,o[d].index)):(s(d),l.lowlink=Math.min(l.lowlink,o[d].lowlink))}),l.lowlink===l.index){var c=[],f;do f=i.pop(),o[f].onStack=!1,c.push(f);while(u!==f);a.push(c)}}return n.nodes().forEach(function(u){e.has(o,u)||s(u)}),a}return wo}var Eo,uf;function Ow(){if(uf)return Eo;uf=1;var e=Pe(),t=tm();Eo=n;function n(r){return e.filter(t(r),function(i){return i.length>1||i.length===1&&r.hasEdge(i[0],i[0])})}return Eo}var So,cf;function Lw(){if(cf)return So;cf=1;var e=Pe();So=n;var t=e.constant(1);function n(i,o,a){return r(i,o||t,a||function(s){return i.outEdges(s)})}function r(i,o,a){var s={},u=i.nodes();return u.forEach(function(l){s[l]={},s[l][l]={distance:0},u.forEach(function(c){l!==c&&(s[l][c]={distance:Number.POSITIVE_INFINITY})}),a(l).forEach(function(c){var f=c.v===l?c.w:c.v,d=o(c);s[l][f]={distance:d,predecessor:l}})}),u.forEach(function(l){var c=s[l];u.forEach(function(f){var d=s[f];u.forEach(function(h){var m=d[l],p=c[h],g=d[h],y=m.distance+p.distance;y<g.distance&&(g.distance=y,g.predecessor=p.predecessor)})})}),s}return So}var No,lf;function nm(){if(lf)return No;lf=1;var e=Pe();No=t,t.CycleException=n;function t(r){var i={},o={},a=[];function s(u){if(e.has(o,u))throw new n;e.has(i,u)||(o[u]=!0,i[u]=!0,e.each(r.predecessors(u),s),delete o[u],a.push(u))}if(e.each(r.sinks(),s),e.size(i)!==r.nodeCount())throw new n;return a}function n(){}return n.prototype=new Error,No}var Ro,ff;function $w(){if(ff)return Ro;ff=1;var e=nm();Ro=t;function t(n){try{e(n)}catch(r){if(r instanceof e.CycleException)return!1;throw r}return!0}return Ro}var qo,df;function rm(){if(df)return qo;df=1;var e=Pe();qo=t;function t(r,i,o){e.isArray(i)||(i=[i]);var a=(r.isDirected()?r.successors:r.neighbors).bind(r),s=[],u={};return e.each(i,function(l){if(!r.hasNode(l))throw new Error("Graph does not have node: "+l);n(r,l,o==="post",u,a,s)}),s}function n(r,i,o,a,s,u){e.has(a,i)||(a[i]=!0,o||u.push(i),e.each(s(i),function(l){n(r,l,o,a,s,u)}),o&&u.push(i))}return qo}var Co,hf;function Dw(){if(hf)return Co;hf=1;var e=rm();Co=t;function t(n,r){return e(n,r,"post")}return Co}var Io,pf;function Fw(){if(pf)return Io;pf=1;var e=rm();Io=t;function t(n,r){return e(n,r,"pre")}return Io}var Mo,mf;function zw(){if(mf)return Mo;mf=1;var e=Pe(),t=Qs(),n=Jp();Mo=r;function r(i,o){var a=new t,s={},u=new n,l;function c(d){var h=d.v===l?d.w:d.v,m=u.priority(h);if(m!==void 0){var p=o(d);p<m&&(s[h]=l,u.decrease(h,p))}}if(i.nodeCount()===0)return a;e.each(i.nodes(),function(d){u.add(d,Number.POSITIVE_INFINITY),a.setNode(d)}),u.decrease(i.nodes()[0],0);for(var f=!1;u.size()>0;){if(l=u.removeMin(),e.has(s,l))a.setEdge(l,s[l]);else{if(f)throw new Error("Input graph is not connected: "+i);f=!0}i.nodeEdges(l).forEach(c)}return a}return Mo}var ko,gf;function Bw(){return gf||(gf=1,ko={components:Tw(),dijkstra:em(),dijkstraAll:Pw(),findCycles:Ow(),floydWarshall:Lw(),isAcyclic:$w(),postorder:Dw(),preorder:Fw(),prim:zw(),tarjan:tm(),topsort:nm()}),ko}var Ao,yf;function Hw(){if(yf)return Ao;yf=1;var e=kw();return Ao={Graph:e.Graph,json:Aw(),alg:Bw(),version:e.version},Ao}var To,vf;function De(){if(vf)return To;vf=1;var e;if(typeof js=="function")try{e=Hw()}catch{}return e||(e=window.graphlib),To=e,To}var Po,bf;function Vw(){if(bf)return Po;bf=1;var e=Ap(),t=1,n=4;function r(i){return e(i,t|n)}return Po=r,Po}var Oo,xf;function Zn(){if(xf)return Oo;xf=1;var e=kn(),t=rt(),n=ws(),r=Ve();function i(o,a,s){if(!r(s))return!1;var u=typeof a;return(u=="number"?t(s)&&n(a,s.length):u=="string"&&a in s)?e(s[a],o):!1}return Oo=i,Oo}var Lo,_f;function jw(){if(_f)return Lo;_f=1;var e=Xn(),t=kn(),n=Zn(),r=mt(),i=Object.prototype,o=i.hasOwnProperty,a=e(function(s,u){s=Object(s);var l=-1,c=u.length,f=c>2?u[2]:void 0;for(f&&n(u[0],u[1],f)&&(c=1);++l<c;)for(var d=u[l],h=r(d),m=-1,p=h.length;++m<p;){var g=h[m],y=s[g];(y===void 0||t(y,i[g])&&!o.call(s,g))&&(s[g]=d[g])}return s});return Lo=a,Lo}var $o,wf;function Gw(){if(wf)return $o;wf=1;var e=Ze(),t=rt(),n=pt();function r(i){return function(o,a,s){var u=Object(o);if(!t(o)){var l=e(a,3);o=n(o),a=function(f){return l(u[f],f,u)}}var c=i(o,a,s);return c>-1?u[l?o[c]:c]:void 0}}return $o=r,$o}var Do,Ef;function Uw(){if(Ef)return Do;Ef=1;var e=/\s/;function t(n){for(var r=n.length;r--&&e.test(n.charAt(r)););return r}return Do=t,Do}var Fo,Sf;function Yw(){if(Sf)return Fo;Sf=1;var e=Uw(),t=/^\s+/;function n(r){return r&&r.slice(0,e(r)+1).replace(t,"")}return Fo=n,Fo}var zo,Nf;function Ww(){if(Nf)return zo;Nf=1;var e=Yw(),t=Ve(),n=At(),r=NaN,i=/^[-+]0x[0-9a-f]+$/i,o=/^0b[01]+$/i,a=/^0o[0-7]+$/i,s=parseInt;function u(l){if(typeof l=="number")return l;if(n(l))return r;if(t(l)){var c=typeof l.valueOf=="function"?l.valueOf():l;l=t(c)?c+"":c}if(typeof l!="string")return l===0?l:+l;l=e(l);var f=o.test(l);return f||a.test(l)?s(l.slice(2),f?2:8):i.test(l)?r:+l}return zo=u,zo}var Bo,Rf;function im(){if(Rf)return Bo;Rf=1;var e=Ww(),t=1/0,n=17976931348623157e292;function r(i){if(!i)return i===0?i:0;if(i=e(i),i===t||i===-t){var o=i<0?-1:1;return o*n}return i===i?i:0}return Bo=r,Bo}var Ho,qf;function Kw(){if(qf)return Ho;qf=1;var e=im();function t(n){var r=e(n),i=r%1;return r===r?i?r-i:r:0}return Ho=t,Ho}var Vo,Cf;function Xw(){if(Cf)return Vo;Cf=1;var e=Xp(),t=Ze(),n=Kw(),r=Math.max;function i(o,a,s){var u=o==null?0:o.length;if(!u)return-1;var l=s==null?0:n(s);return l<0&&(l=r(u+l,0)),e(o,t(a,3),l)}return Vo=i,Vo}var jo,If;function Zw(){if(If)return jo;If=1;var e=Gw(),t=Xw(),n=e(t);return jo=n,jo}var Go,Mf;function om(){if(Mf)return Go;Mf=1;var e=Zs();function t(n){var r=n==null?0:n.length;return r?e(n,1):[]}return Go=t,Go}var Uo,kf;function Qw(){if(kf)return Uo;kf=1;var e=Ws(),t=Tp(),n=mt();function r(i,o){return i==null?i:e(i,t(o),n)}return Uo=r,Uo}var Yo,Af;function Jw(){if(Af)return Yo;Af=1;function e(t){var n=t==null?0:t.length;return n?t[n-1]:void 0}return Yo=e,Yo}var Wo,Tf;function e1(){if(Tf)return Wo;Tf=1;var e=Vn(),t=Ks(),n=Ze();function r(i,o){var a={};return o=n(o,3),t(i,function(s,u,l){e(a,u,o(s,u,l))}),a}return Wo=r,Wo}var Ko,Pf;function Js(){if(Pf)return Ko;Pf=1;var e=At();function t(n,r,i){for(var o=-1,a=n.length;++o<a;){var s=n[o],u=r(s);if(u!=null&&(l===void 0?u===u&&!e(u):i(u,l)))var l=u,c=s}return c}return Ko=t,Ko}var Xo,Of;function t1(){if(Of)return Xo;Of=1;function e(t,n){return t>n}return Xo=e,Xo}var Zo,Lf;function n1(){if(Lf)return Zo;Lf=1;var e=Js(),t=t1(),n=gt();function r(i){return i&&i.length?e(i,n,t):void 0}return Zo=r,Zo}var Qo,$f;function am(){if($f)return Qo;$f=1;var e=Vn(),t=kn();function n(r,i,o){(o!==void 0&&!t(r[i],o)||o===void 0&&!(i in r))&&e(r,i,o)}return Qo=n,Qo}var Jo,Df;function r1(){if(Df)return Jo;Df=1;var e=_s(),t=Gn(),n=It(),r="[object Object]",i=Function.prototype,o=Object.prototype,a=i.toString,s=o.hasOwnProperty,u=a.call(Object);function l(c){if(!n(c)||e(c)!=r)return!1;var f=t(c);if(f===null)return!0;var d=s.call(f,"constructor")&&f.constructor;return typeof d=="function"&&d instanceof d&&a.call(d)==u}return Jo=l,Jo}var ea,Ff;function sm(){if(Ff)return ea;Ff=1;function e(t,n){if(!(n==="constructor"&&typeof t[n]=="function")&&n!="__proto__")return t[n]}return ea=e,ea}var ta,zf;function i1(){if(zf)return ta;zf=1;var e=tn(),t=mt();function n(r){return e(r,t(r))}return ta=n,ta}var na,Bf;function o1(){if(Bf)return na;Bf=1;var e=am(),t=Rp(),n=Ip(),r=qp(),i=kp(),o=Tn(),a=xe(),s=Zp(),u=An(),l=Ss(),c=Ve(),f=r1(),d=Es(),h=sm(),m=i1();function p(g,y,v,x,b,w,S){var N=h(g,v),T=h(y,v),E=S.get(T);if(E){e(g,v,E);return}var k=w?w(N,T,v+"",g,y,S):void 0,C=k===void 0;if(C){var O=a(T),P=!O&&u(T),_=!O&&!P&&d(T);k=T,O||P||_?a(N)?k=N:s(N)?k=r(N):P?(C=!1,k=t(T,!0)):_?(C=!1,k=n(T,!0)):k=[]:f(T)||o(T)?(k=N,o(N)?k=m(N):(!c(N)||l(N))&&(k=i(T))):C=!1}C&&(S.set(T,k),b(k,T,x,w,S),S.delete(T)),e(g,v,k)}return na=p,na}var ra,Hf;function a1(){if(Hf)return ra;Hf=1;var e=xs(),t=am(),n=Ws(),r=o1(),i=Ve(),o=mt(),a=sm();function s(u,l,c,f,d){u!==l&&n(l,function(h,m){if(d||(d=new e),i(h))r(u,l,m,c,s,f,d);else{var p=f?f(a(u,m),h,m+"",u,l,d):void 0;p===void 0&&(p=h),t(u,m,p)}},o)}return ra=s,ra}var ia,Vf;function s1(){if(Vf)return ia;Vf=1;var e=Xn(),t=Zn();function n(r){return e(function(i,o){var a=-1,s=o.length,u=s>1?o[s-1]:void 0,l=s>2?o[2]:void 0;for(u=r.length>3&&typeof u=="function"?(s--,u):void 0,l&&t(o[0],o[1],l)&&(u=s<3?void 0:u,s=1),i=Object(i);++a<s;){var c=o[a];c&&r(i,c,a,u)}return i})}return ia=n,ia}var oa,jf;function u1(){if(jf)return oa;jf=1;var e=a1(),t=s1(),n=t(function(r,i,o){e(r,i,o)});return oa=n,oa}var aa,Gf;function um(){if(Gf)return aa;Gf=1;function e(t,n){return t<n}return aa=e,aa}var sa,Uf;function c1(){if(Uf)return sa;Uf=1;var e=Js(),t=um(),n=gt();function r(i){return i&&i.length?e(i,n,t):void 0}return sa=r,sa}var ua,Yf;function l1(){if(Yf)return ua;Yf=1;var e=Js(),t=Ze(),n=um();function r(i,o){return i&&i.length?e(i,t(o,2),n):void 0}return ua=r,ua}var ca,Wf;function f1(){if(Wf)return ca;Wf=1;var e=Wd(),t=function(){return e.Date.now()};return ca=t,ca}var la,Kf;function d1(){if(Kf)return la;Kf=1;var e=jn(),t=Wn(),n=ws(),r=Ve(),i=nn();function o(a,s,u,l){if(!r(a))return a;s=t(s,a);for(var c=-1,f=s.length,d=f-1,h=a;h!=null&&++c<f;){var m=i(s[c]),p=u;if(m==="__proto__"||m==="constructor"||m==="prototype")return a;if(c!=d){var g=h[m];p=l?l(g,m,h):void 0,p===void 0&&(p=r(g)?g:n(s[c+1])?[]:{})}e(h,m,p),h=h[m]}return a}return la=o,la}var fa,Xf;function h1(){if(Xf)return fa;Xf=1;var e=Kn(),t=d1(),n=Wn();function r(i,o,a){for(var s=-1,u=o.length,l={};++s<u;){var c=o[s],f=e(i,c);a(f,c)&&t(l,n(c,i),f)}return l}return fa=r,fa}var da,Zf;function p1(){if(Zf)return da;Zf=1;var e=h1(),t=zp();function n(r,i){return e(r,i,function(o,a){return t(r,a)})}return da=n,da}var ha,Qf;function m1(){if(Qf)return ha;Qf=1;var e=om(),t=Wp(),n=Kp();function r(i){return n(t(i,void 0,e),i+"")}return ha=r,ha}var pa,Jf;function g1(){if(Jf)return pa;Jf=1;var e=p1(),t=m1(),n=t(function(r,i){return r==null?{}:e(r,i)});return pa=n,pa}var ma,ed;function y1(){if(ed)return ma;ed=1;var e=Math.ceil,t=Math.max;function n(r,i,o,a){for(var s=-1,u=t(e((i-r)/(o||1)),0),l=Array(u);u--;)l[a?u:++s]=r,r+=o;return l}return ma=n,ma}var ga,td;function v1(){if(td)return ga;td=1;var e=y1(),t=Zn(),n=im();function r(i){return function(o,a,s){return s&&typeof s!="number"&&t(o,a,s)&&(a=s=void 0),o=n(o),a===void 0?(a=o,o=0):a=n(a),s=s===void 0?o<a?1:-1:n(s),e(o,a,s,i)}}return ga=r,ga}var ya,nd;function b1(){if(nd)return ya;nd=1;var e=v1(),t=e();return ya=t,ya}var va,rd;function x1(){if(rd)return va;rd=1;function e(t,n){var r=t.length;for(t.sort(n);r--;)t[r]=t[r].value;return t}return va=e,va}var ba,id;function _1(){if(id)return ba;id=1;var e=At();function t(n,r){if(n!==r){var i=n!==void 0,o=n===null,a=n===n,s=e(n),u=r!==void 0,l=r===null,c=r===r,f=e(r);if(!l&&!f&&!s&&n>r||s&&u&&c&&!l&&!f||o&&u&&c||!i&&c||!a)return 1;if(!o&&!s&&!f&&n<r||f&&i&&a&&!o&&!s||l&&i&&a||!u&&a||!c)return-1}return 0}return ba=t,ba}var xa,od;function w1(){if(od)return xa;od=1;var e=_1();function t(n,r,i){for(var o=-1,a=n.criteria,s=r.criteria,u=a.length,l=i.length;++o<u;){var c=e(a[o],s[o]);if(c){if(o>=l)return c;var f=i[o];return c*(f=="desc"?-1:1)}}return n.index-r.index}return xa=t,xa}var _a,ad;function E1(){if(ad)return _a;ad=1;var e=Yn(),t=Kn(),n=Ze(),r=Gp(),i=x1(),o=bs(),a=w1(),s=gt(),u=xe();function l(c,f,d){f.length?f=e(f,function(p){return u(p)?function(g){return t(g,p.length===1?p[0]:p)}:p}):f=[s];var h=-1;f=e(f,o(n));var m=r(c,function(p,g,y){var v=e(f,function(x){return x(p)});return{criteria:v,index:++h,value:p}});return i(m,function(p,g){return a(p,g,d)})}return _a=l,_a}var wa,sd;function S1(){if(sd)return wa;sd=1;var e=Zs(),t=E1(),n=Xn(),r=Zn(),i=n(function(o,a){if(o==null)return[];var s=a.length;return s>1&&r(o,a[0],a[1])?a=[]:s>2&&r(a[0],a[1],a[2])&&(a=[a[0]]),t(o,e(a,1),[])});return wa=i,wa}var Ea,ud;function N1(){if(ud)return Ea;ud=1;var e=Dp(),t=0;function n(r){var i=++t;return e(r)+i}return Ea=n,Ea}var Sa,cd;function R1(){if(cd)return Sa;cd=1;function e(t,n,r){for(var i=-1,o=t.length,a=n.length,s={};++i<o;){var u=i<a?n[i]:void 0;r(s,t[i],u)}return s}return Sa=e,Sa}var Na,ld;function q1(){if(ld)return Na;ld=1;var e=jn(),t=R1();function n(r,i){return t(r||[],i||[],e)}return Na=n,Na}var Ra,fd;function he(){if(fd)return Ra;fd=1;var e;if(typeof js=="function")try{e={cloneDeep:Vw(),constant:Ys(),defaults:jw(),each:Op(),filter:Hp(),find:Zw(),flatten:om(),forEach:Pp(),forIn:Qw(),has:Vp(),isUndefined:jp(),last:Jw(),map:Up(),mapValues:e1(),max:n1(),merge:u1(),min:c1(),minBy:l1(),now:f1(),pick:g1(),range:b1(),reduce:Yp(),sortBy:S1(),uniqueId:N1(),values:Qp(),zipObject:q1()}}catch{}return e||(e=window._),Ra=e,Ra}var qa,dd;function C1(){if(dd)return qa;dd=1,qa=e;function e(){var r={};r._next=r._prev=r,this._sentinel=r}e.prototype.dequeue=function(){var r=this._sentinel,i=r._prev;if(i!==r)return t(i),i},e.prototype.enqueue=function(r){var i=this._sentinel;r._prev&&r._next&&t(r),r._next=i._next,i._next._prev=r,i._next=r,r._prev=i},e.prototype.toString=function(){for(var r=[],i=this._sentinel,o=i._prev;o!==i;)r.push(JSON.stringify(o,n)),o=o._prev;return"["+r.join(", ")+"]"};function t(r){r._prev._next=r._next,r._next._prev=r._prev,delete r._next,delete r._prev}function n(r,i){if(r!=="_next"&&r!=="_prev")return i}return qa}var Ca,hd;function I1(){if(hd)return Ca;hd=1;var e=he(),t=De().Graph,n=C1();Ca=i;var r=e.constant(1);function i(l,c){if(l.nodeCount()<=1)return[];var f=s(l,c||r),d=o(f.graph,f.buckets,f.zeroIdx);return e.flatten(e.map(d,function(h){return l.outEdges(h.v,h.w)}),!0)}function o(l,c,f){for(var d=[],h=c[c.length-1],m=c[0],p;l.nodeCount();){for(;p=m.dequeue();)a(l,c,f,p);for(;p=h.dequeue();)a(l,c,f,p);if(l.nodeCount()){for(var g=c.length-2;g>0;--g)if(p=c[g].dequeue(),p){d=d.concat(a(l,c,f,p,!0));break}}}return d}function a(l,c,f,d,h){var m=h?[]:void 0;return e.forEach(l.inEdges(d.v),function(p){var g=l.edge(p),y=l.node(p.v);h&&m.push({v:p.v,w:p.w}),y.out-=g,u(c,f,y)}),e.forEach(l.outEdges(d.v),function(p){var g=l.edge(p),y=p.w,v=l.node(y);v.in-=g,u(c,f,v)}),l.removeNode(d.v),m}function s(l,c){var f=new t,d=0,h=0;e.forEach(l.nodes(),function(g){f.setNode(g,{v:g,in:0,out:0})}),e.forEach(l.edges(),function(g){var y=f.edge(g.v,g.w)||0,v=c(g),x=y+v;f.setEdge(g.v,g.w,x),h=Math.max(h,f.node(g.v).out+=v),d=Math.max(d,f.node(g.w).in+=v)});var m=e.range(h+d+3).map(function(){return new n}),p=d+1;return e.forEach(f.nodes(),function(g){u(m,p,f.node(g))}),{graph:f,buckets:m,zeroIdx:p}}function u(l,c,f){f.out?f.in?l[f.out-f.in+c].enqueue(f):l[l.length-1].enqueue(f):l[0].enqueue(f)}return Ca}var Ia,pd;function M1(){if(pd)return Ia;pd=1;var e=he(),t=I1();Ia={run:n,undo:i};function n(o){var a=o.graph().acyclicer==="greedy"?t(o,s(o)):r(o);e.forEach(a,function(u){var l=o.edge(u);o.removeEdge(u),l.forwardName=u.name,l.reversed=!0,o.setEdge(u.w,u.v,l,e.uniqueId("rev"))});function s(u){return function(l){return u.edge(l).weight}}}function r(o){var a=[],s={},u={};function l(c){e.has(u,c)||(u[c]=!0,s[c]=!0,e.forEach(o.outEdges(c),function(f){e.has(s,f.w)?a.push(f):l(f.w)}),delete s[c])}return e.forEach(o.nodes(),l),a}function i(o){e.forEach(o.edges(),function(a){var s=o.edge(a);if(s.reversed){o.removeEdge(a);var u=s.forwardName;delete s.reversed,delete s.forwardName,o.setEdge(a.w,a.v,s,u)}})}return Ia}var Ma,md;function qe(){if(md)return Ma;md=1;var e=he(),t=De().Graph;Ma={addDummyNode:n,simplify:r,asNonCompoundGraph:i,successorWeights:o,predecessorWeights:a,intersectRect:s,buildLayerMatrix:u,normalizeRanks:l,removeEmptyRanks:c,addBorderNode:f,maxRank:d,partition:h,time:m,notime:p};function n(g,y,v,x){var b;do b=e.uniqueId(x);while(g.hasNode(b));return v.dummy=y,g.setNode(b,v),b}function r(g){var y=new t().setGraph(g.graph());return e.forEach(g.nodes(),function(v){y.setNode(v,g.node(v))}),e.forEach(g.edges(),function(v){var x=y.edge(v.v,v.w)||{weight:0,minlen:1},b=g.edge(v);y.setEdge(v.v,v.w,{weight:x.weight+b.weight,minlen:Math.max(x.minlen,b.minlen)})}),y}function i(g){var y=new t({multigraph:g.isMultigraph()}).setGraph(g.graph());return e.forEach(g.nodes(),function(v){g.children(v).length||y.setNode(v,g.node(v))}),e.forEach(g.edges(),function(v){y.setEdge(v,g.edge(v))}),y}function o(g){var y=e.map(g.nodes(),function(v){var x={};return e.forEach(g.outEdges(v),function(b){x[b.w]=(x[b.w]||0)+g.edge(b).weight}),x});return e.zipObject(g.nodes(),y)}function a(g){var y=e.map(g.nodes(),function(v){var x={};return e.forEach(g.inEdges(v),function(b){x[b.v]=(x[b.v]||0)+g.edge(b).weight}),x});return e.zipObject(g.nodes(),y)}function s(g,y){var v=g.x,x=g.y,b=y.x-v,w=y.y-x,S=g.width/2,N=g.height/2;if(!b&&!w)throw new Error("Not possible to find intersection inside of the rectangle");var T,E;return Math.abs(w)*S>Math.abs(b)*N?(w<0&&(N=-N),T=N*b/w,E=N):(b<0&&(S=-S),T=S,E=S*w/b),{x:v+T,y:x+E}}function u(g){var y=e.map(e.range(d(g)+1),function(){return[]});return e.forEach(g.nodes(),function(v){var x=g.node(v),b=x.rank;e.isUndefined(b)||(y[b][x.order]=v)}),y}function l(g){var y=e.min(e.map(g.nodes(),function(v){return g.node(v).rank}));e.forEach(g.nodes(),function(v){var x=g.node(v);e.has(x,"rank")&&(x.rank-=y)})}function c(g){var y=e.min(e.map(g.nodes(),function(w){return g.node(w).rank})),v=[];e.forEach(g.nodes(),function(w){var S=g.node(w).rank-y;v[S]||(v[S]=[]),v[S].push(w)});var x=0,b=g.graph().nodeRankFactor;e.forEach(v,function(w,S){e.isUndefined(w)&&S%b!==0?--x:x&&e.forEach(w,function(N){g.node(N).rank+=x})})}function f(g,y,v,x){var b={width:0,height:0};return arguments.length>=4&&(b.rank=v,b.order=x),n(g,"border",b,y)}function d(g){return e.max(e.map(g.nodes(),function(y){var v=g.node(y).rank;if(!e.isUndefined(v))return v}))}function h(g,y){var v={lhs:[],rhs:[]};return e.forEach(g,function(x){y(x)?v.lhs.push(x):v.rhs.push(x)}),v}function m(g,y){var v=e.now();try{return y()}finally{console.log(g+" time: "+(e.now()-v)+"ms")}}function p(g,y){return y()}return Ma}var ka,gd;function k1(){if(gd)return ka;gd=1;var e=he(),t=qe();ka={run:n,undo:i};function n(o){o.graph().dummyChains=[],e.forEach(o.edges(),function(a){r(o,a)})}function r(o,a){var s=a.v,u=o.node(s).rank,l=a.w,c=o.node(l).rank,f=a.name,d=o.edge(a),h=d.labelRank;if(c!==u+1){o.removeEdge(a);var m,p,g;for(g=0,++u;u<c;++g,++u)d.points=[],p={width:0,height:0,edgeLabel:d,edgeObj:a,rank:u},m=t.addDummyNode(o,"edge",p,"_d"),u===h&&(p.width=d.width,p.height=d.height,p.dummy="edge-label",p.labelpos=d.labelpos),o.setEdge(s,m,{weight:d.weight},f),g===0&&o.graph().dummyChains.push(m),s=m;o.setEdge(s,l,{weight:d.weight},f)}}function i(o){e.forEach(o.graph().dummyChains,function(a){var s=o.node(a),u=s.edgeLabel,l;for(o.setEdge(s.edgeObj,u);s.dummy;)l=o.successors(a)[0],o.removeNode(a),u.points.push({x:s.x,y:s.y}),s.dummy==="edge-label"&&(u.x=s.x,u.y=s.y,u.width=s.width,u.height=s.height),a=l,s=o.node(a)})}return ka}var Aa,yd;function Mn(){if(yd)return Aa;yd=1;var e=he();Aa={longestPath:t,slack:n};function t(r){var i={};function o(a){var s=r.node(a);if(e.has(i,a))return s.rank;i[a]=!0;var u=e.min(e.map(r.outEdges(a),function(l){return o(l.w)-r.edge(l).minlen}));return(u===Number.POSITIVE_INFINITY||u===void 0||u===null)&&(u=0),s.rank=u}e.forEach(r.sources(),o)}function n(r,i){return r.node(i.w).rank-r.node(i.v).rank-r.edge(i).minlen}return Aa}var Ta,vd;function cm(){if(vd)return Ta;vd=1;var e=he(),t=De().Graph,n=Mn().slack;Ta=r;function r(s){var u=new t({directed:!1}),l=s.nodes()[0],c=s.nodeCount();u.setNode(l,{});for(var f,d;i(u,s)<c;)f=o(u,s),d=u.hasNode(f.v)?n(s,f):-n(s,f),a(u,s,d);return u}function i(s,u){function l(c){e.forEach(u.nodeEdges(c),function(f){var d=f.v,h=c===d?f.w:d;!s.hasNode(h)&&!n(u,f)&&(s.setNode(h,{}),s.setEdge(c,h,{}),l(h))})}return e.forEach(s.nodes(),l),s.nodeCount()}function o(s,u){return e.minBy(u.edges(),function(l){if(s.hasNode(l.v)!==s.hasNode(l.w))return n(u,l)})}function a(s,u,l){e.forEach(s.nodes(),function(c){u.node(c).rank+=l})}return Ta}var Pa,bd;function A1(){if(bd)return Pa;bd=1;var e=he(),t=cm(),n=Mn().slack,r=Mn().longestPath,i=De().alg.preorder,o=De().alg.postorder,a=qe().simplify;Pa=s,s.initLowLimValues=f,s.initCutValues=u,s.calcCutValue=c,s.leaveEdge=h,s.enterEdge=m,s.exchangeEdges=p;function s(x){x=a(x),r(x);var b=t(x);f(b),u(b,x);for(var w,S;w=h(b);)S=m(b,x,w),p(b,x,w,S)}function u(x,b){var w=o(x,x.nodes());w=w.slice(0,w.length-1),e.forEach(w,function(S){l(x,b,S)})}function l(x,b,w){var S=x.node(w),N=S.parent;x.edge(w,N).cutvalue=c(x,b,w)}function c(x,b,w){var S=x.node(w),N=S.parent,T=!0,E=b.edge(w,N),k=0;return E||(T=!1,E=b.edge(N,w)),k=E.weight,e.forEach(b.nodeEdges(w),function(C){var O=C.v===w,P=O?C.w:C.v;if(P!==N){var _=O===T,M=b.edge(C).weight;if(k+=_?M:-M,y(x,w,P)){var I=x.edge(w,P).cutvalue;k+=_?-I:I}}}),k}function f(x,b){arguments.length<2&&(b=x.nodes()[0]),d(x,{},1,b)}function d(x,b,w,S,N){var T=w,E=x.node(S);return b[S]=!0,e.forEach(x.neighbors(S),function(k){e.has(b,k)||(w=d(x,b,w,k,S))}),E.low=T,E.lim=w++,N?E.parent=N:delete E.parent,w}function h(x){return e.find(x.edges(),function(b){return x.edge(b).cutvalue<0})}function m(x,b,w){var S=w.v,N=w.w;b.hasEdge(S,N)||(S=w.w,N=w.v);var T=x.node(S),E=x.node(N),k=T,C=!1;T.lim>E.lim&&(k=E,C=!0);var O=e.filter(b.edges(),function(P){return C===v(x,x.node(P.v),k)&&C!==v(x,x.node(P.w),k)});return e.minBy(O,function(P){return n(b,P)})}function p(x,b,w,S){var N=w.v,T=w.w;x.removeEdge(N,T),x.setEdge(S.v,S.w,{}),f(x),u(x,b),g(x,b)}function g(x,b){var w=e.find(x.nodes(),function(N){return!b.node(N).parent}),S=i(x,w);S=S.slice(1),e.forEach(S,function(N){var T=x.node(N).parent,E=b.edge(N,T),k=!1;E||(E=b.edge(T,N),k=!0),b.node(N).rank=b.node(T).rank+(k?E.minlen:-E.minlen)})}function y(x,b,w){return x.hasEdge(b,w)}function v(x,b,w){return w.low<=b.lim&&b.lim<=w.lim}return Pa}var Oa,xd;function T1(){if(xd)return Oa;xd=1;var e=Mn(),t=e.longestPath,n=cm(),r=A1();Oa=i;function i(u){switch(u.graph().ranker){case"network-simplex":s(u);break;case"tight-tree":a(u);break;case"longest-path":o(u);break;default:s(u)}}var o=t;function a(u){t(u),n(u)}function s(u){r(u)}return Oa}var La,_d;function P1(){if(_d)return La;_d=1;var e=he();La=t;function t(i){var o=r(i);e.forEach(i.graph().dummyChains,function(a){for(var s=i.node(a),u=s.edgeObj,l=n(i,o,u.v,u.w),c=l.path,f=l.lca,d=0,h=c[d],m=!0;a!==u.w;){if(s=i.node(a),m){for(;(h=c[d])!==f&&i.node(h).maxRank<s.rank;)d++;h===f&&(m=!1)}if(!m){for(;d<c.length-1&&i.node(h=c[d+1]).minRank<=s.rank;)d++;h=c[d]}i.setParent(a,h),a=i.successors(a)[0]}})}function n(i,o,a,s){var u=[],l=[],c=Math.min(o[a].low,o[s].low),f=Math.max(o[a].lim,o[s].lim),d,h;d=a;do d=i.parent(d),u.push(d);while(d&&(o[d].low>c||f>o[d].lim));for(h=d,d=s;(d=i.parent(d))!==h;)l.push(d);return{path:u.concat(l.reverse()),lca:h}}function r(i){var o={},a=0;function s(u){var l=a;e.forEach(i.children(u),s),o[u]={low:l,lim:a++}}return e.forEach(i.children(),s),o}return La}var $a,wd;function O1(){if(wd)return $a;wd=1;var e=he(),t=qe();$a={run:n,cleanup:a};function n(s){var u=t.addDummyNode(s,"root",{},"_root"),l=i(s),c=e.max(e.values(l))-1,f=2*c+1;s.graph().nestingRoot=u,e.forEach(s.edges(),function(h){s.edge(h).minlen*=f});var d=o(s)+1;e.forEach(s.children(),function(h){r(s,u,f,d,c,l,h)}),s.graph().nodeRankFactor=f}function r(s,u,l,c,f,d,h){var m=s.children(h);if(!m.length){h!==u&&s.setEdge(u,h,{weight:0,minlen:l});return}var p=t.addBorderNode(s,"_bt"),g=t.addBorderNode(s,"_bb"),y=s.node(h);s.setParent(p,h),y.borderTop=p,s.setParent(g,h),y.borderBottom=g,e.forEach(m,function(v){r(s,u,l,c,f,d,v);var x=s.node(v),b=x.borderTop?x.borderTop:v,w=x.borderBottom?x.borderBottom:v,S=x.borderTop?c:2*c,N=b!==w?1:f-d[h]+1;s.setEdge(p,b,{weight:S,minlen:N,nestingEdge:!0}),s.setEdge(w,g,{weight:S,minlen:N,nestingEdge:!0})}),s.parent(h)||s.setEdge(u,p,{weight:0,minlen:f+d[h]})}function i(s){var u={};function l(c,f){var d=s.children(c);d&&d.length&&e.forEach(d,function(h){l(h,f+1)}),u[c]=f}return e.forEach(s.children(),function(c){l(c,1)}),u}function o(s){return e.reduce(s.edges(),function(u,l){return u+s.edge(l).weight},0)}function a(s){var u=s.graph();s.removeNode(u.nestingRoot),delete u.nestingRoot,e.forEach(s.edges(),function(l){var c=s.edge(l);c.nestingEdge&&s.removeEdge(l)})}return $a}var Da,Ed;function L1(){if(Ed)return Da;Ed=1;var e=he(),t=qe();Da=n;function n(i){function o(a){var s=i.children(a),u=i.node(a);if(s.length&&e.forEach(s,o),e.has(u,"minRank")){u.borderLeft=[],u.borderRight=[];for(var l=u.minRank,c=u.maxRank+1;l<c;++l)r(i,"borderLeft","_bl",a,u,l),r(i,"borderRight","_br",a,u,l)}}e.forEach(i.children(),o)}function r(i,o,a,s,u,l){var c={width:0,height:0,rank:l,borderType:o},f=u[o][l-1],d=t.addDummyNode(i,"border",c,a);u[o][l]=d,i.setParent(d,s),f&&i.setEdge(f,d,{weight:1})}return Da}var Fa,Sd;function $1(){if(Sd)return Fa;Sd=1;var e=he();Fa={adjust:t,undo:n};function t(l){var c=l.graph().rankdir.toLowerCase();(c==="lr"||c==="rl")&&r(l)}function n(l){var c=l.graph().rankdir.toLowerCase();(c==="bt"||c==="rl")&&o(l),(c==="lr"||c==="rl")&&(s(l),r(l))}function r(l){e.forEach(l.nodes(),function(c){i(l.node(c))}),e.forEach(l.edges(),function(c){i(l.edge(c))})}function i(l){var c=l.width;l.width=l.height,l.height=c}function o(l){e.forEach(l.nodes(),function(c){a(l.node(c))}),e.forEach(l.edges(),function(c){var f=l.edge(c);e.forEach(f.points,a),e.has(f,"y")&&a(f)})}function a(l){l.y=-l.y}function s(l){e.forEach(l.nodes(),function(c){u(l.node(c))}),e.forEach(l.edges(),function(c){var f=l.edge(c);e.forEach(f.points,u),e.has(f,"x")&&u(f)})}function u(l){var c=l.x;l.x=l.y,l.y=c}return Fa}var za,Nd;function D1(){if(Nd)return za;Nd=1;var e=he();za=t;function t(n){var r={},i=e.filter(n.nodes(),function(l){return!n.children(l).length}),o=e.max(e.map(i,function(l){return n.node(l).rank})),a=e.map(e.range(o+1),function(){return[]});function s(l){if(!e.has(r,l)){r[l]=!0;var c=n.node(l);a[c.rank].push(l),e.forEach(n.successors(l),s)}}var u=e.sortBy(i,function(l){return n.node(l).rank});return e.forEach(u,s),a}return za}var Ba,Rd;function F1(){if(Rd)return Ba;Rd=1;var e=he();Ba=t;function t(r,i){for(var o=0,a=1;a<i.length;++a)o+=n(r,i[a-1],i[a]);return o}function n(r,i,o){for(var a=e.zipObject(o,e.map(o,function(d,h){return h})),s=e.flatten(e.map(i,function(d){return e.sortBy(e.map(r.outEdges(d),function(h){return{pos:a[h.w],weight:r.edge(h).weight}}),"pos")}),!0),u=1;u<o.length;)u<<=1;var l=2*u-1;u-=1;var c=e.map(new Array(l),function(){return 0}),f=0;return e.forEach(s.forEach(function(d){var h=d.pos+u;c[h]+=d.weight;for(var m=0;h>0;)h%2&&(m+=c[h+1]),h=h-1>>1,c[h]+=d.weight;f+=d.weight*m})),f}return Ba}var Ha,qd;function z1(){if(qd)return Ha;qd=1;var e=he();Ha=t;function t(n,r){return e.map(r,function(i){var o=n.inEdges(i);if(o.length){var a=e.reduce(o,function(s,u){var l=n.edge(u),c=n.node(u.v);return{sum:s.sum+l.weight*c.order,weight:s.weight+l.weight}},{sum:0,weight:0});return{v:i,barycenter:a.sum/a.weight,weight:a.weight}}else return{v:i}})}return Ha}var Va,Cd;function B1(){if(Cd)return Va;Cd=1;var e=he();Va=t;function t(i,o){var a={};e.forEach(i,function(u,l){var c=a[u.v]={indegree:0,in:[],out:[],vs:[u.v],i:l};e.isUndefined(u.barycenter)||(c.barycenter=u.barycenter,c.weight=u.weight)}),e.forEach(o.edges(),function(u){var l=a[u.v],c=a[u.w];!e.isUndefined(l)&&!e.isUndefined(c)&&(c.indegree++,l.out.push(a[u.w]))});var s=e.filter(a,function(u){return!u.indegree});return n(s)}function n(i){var o=[];function a(l){return function(c){c.merged||(e.isUndefined(c.barycenter)||e.isUndefined(l.barycenter)||c.barycenter>=l.barycenter)&&r(l,c)}}function s(l){return function(c){c.in.push(l),--c.indegree===0&&i.push(c)}}for(;i.length;){var u=i.pop();o.push(u),e.forEach(u.in.reverse(),a(u)),e.forEach(u.out,s(u))}return e.map(e.filter(o,function(l){return!l.merged}),function(l){return e.pick(l,["vs","i","barycenter","weight"])})}function r(i,o){var a=0,s=0;i.weight&&(a+=i.barycenter*i.weight,s+=i.weight),o.weight&&(a+=o.barycenter*o.weight,s+=o.weight),i.vs=o.vs.concat(i.vs),i.barycenter=a/s,i.weight=s,i.i=Math.min(o.i,i.i),o.merged=!0}return Va}var ja,Id;function H1(){if(Id)return ja;Id=1;var e=he(),t=qe();ja=n;function n(o,a){var s=t.partition(o,function(p){return e.has(p,"barycenter")}),u=s.lhs,l=e.sortBy(s.rhs,function(p){return-p.i}),c=[],f=0,d=0,h=0;u.sort(i(!!a)),h=r(c,l,h),e.forEach(u,function(p){h+=p.vs.length,c.push(p.vs),f+=p.barycenter*p.weight,d+=p.weight,h=r(c,l,h)});var m={vs:e.flatten(c,!0)};return d&&(m.barycenter=f/d,m.weight=d),m}function r(o,a,s){for(var u;a.length&&(u=e.last(a)).i<=s;)a.pop(),o.push(u.vs),s++;return s}function i(o){return function(a,s){return a.barycenter<s.barycenter?-1:a.barycenter>s.barycenter?1:o?s.i-a.i:a.i-s.i}}return ja}var Ga,Md;function V1(){if(Md)return Ga;Md=1;var e=he(),t=z1(),n=B1(),r=H1();Ga=i;function i(s,u,l,c){var f=s.children(u),d=s.node(u),h=d?d.borderLeft:void 0,m=d?d.borderRight:void 0,p={};h&&(f=e.filter(f,function(w){return w!==h&&w!==m}));var g=t(s,f);e.forEach(g,function(w){if(s.children(w.v).length){var S=i(s,w.v,l,c);p[w.v]=S,e.has(S,"barycenter")&&a(w,S)}});var y=n(g,l);o(y,p);var v=r(y,c);if(h&&(v.vs=e.flatten([h,v.vs,m],!0),s.predecessors(h).length)){var x=s.node(s.predecessors(h)[0]),b=s.node(s.predecessors(m)[0]);e.has(v,"barycenter")||(v.barycenter=0,v.weight=0),v.barycenter=(v.barycenter*v.weight+x.order+b.order)/(v.weight+2),v.weight+=2}return v}function o(s,u){e.forEach(s,function(l){l.vs=e.flatten(l.vs.map(function(c){return u[c]?u[c].vs:c}),!0)})}function a(s,u){e.isUndefined(s.barycenter)?(s.barycenter=u.barycenter,s.weight=u.weight):(s.barycenter=(s.barycenter*s.weight+u.barycenter*u.weight)/(s.weight+u.weight),s.weight+=u.weight)}return Ga}var Ua,kd;function j1(){if(kd)return Ua;kd=1;var e=he(),t=De().Graph;Ua=n;function n(i,o,a){var s=r(i),u=new t({compound:!0}).setGraph({root:s}).setDefaultNodeLabel(function(l){return i.node(l)});return e.forEach(i.nodes(),function(l){var c=i.node(l),f=i.parent(l);(c.rank===o||c.minRank<=o&&o<=c.maxRank)&&(u.setNode(l),u.setParent(l,f||s),e.forEach(i[a](l),function(d){var h=d.v===l?d.w:d.v,m=u.edge(h,l),p=e.isUndefined(m)?0:m.weight;u.setEdge(h,l,{weight:i.edge(d).weight+p})}),e.has(c,"minRank")&&u.setNode(l,{borderLeft:c.borderLeft[o],borderRight:c.borderRight[o]}))}),u}function r(i){for(var o;i.hasNode(o=e.uniqueId("_root")););return o}return Ua}var Ya,Ad;function G1(){if(Ad)return Ya;Ad=1;var e=he();Ya=t;function t(n,r,i){var o={},a;e.forEach(i,function(s){for(var u=n.parent(s),l,c;u;){if(l=n.parent(u),l?(c=o[l],o[l]=u):(c=a,a=u),c&&c!==u){r.setEdge(c,u);return}u=l}})}return Ya}var Wa,Td;function U1(){if(Td)return Wa;Td=1;var e=he(),t=D1(),n=F1(),r=V1(),i=j1(),o=G1(),a=De().Graph,s=qe();Wa=u;function u(d){var h=s.maxRank(d),m=l(d,e.range(1,h+1),"inEdges"),p=l(d,e.range(h-1,-1,-1),"outEdges"),g=t(d);f(d,g);for(var y=Number.POSITIVE_INFINITY,v,x=0,b=0;b<4;++x,++b){c(x%2?m:p,x%4>=2),g=s.buildLayerMatrix(d);var w=n(d,g);w<y&&(b=0,v=e.cloneDeep(g),y=w)}f(d,v)}function l(d,h,m){return e.map(h,function(p){return i(d,p,m)})}function c(d,h){var m=new a;e.forEach(d,function(p){var g=p.graph().root,y=r(p,g,m,h);e.forEach(y.vs,function(v,x){p.node(v).order=x}),o(p,m,y.vs)})}function f(d,h){e.forEach(h,function(m){e.forEach(m,function(p,g){d.node(p).order=g})})}return Wa}var Ka,Pd;function Y1(){if(Pd)return Ka;Pd=1;var e=he(),t=De().Graph,n=qe();Ka={positionX:m,findType1Conflicts:r,findType2Conflicts:i,addConflict:a,hasConflict:s,verticalAlignment:u,horizontalCompaction:l,alignCoordinates:d,findSmallestWidthAlignment:f,balance:h};function r(y,v){var x={};function b(w,S){var N=0,T=0,E=w.length,k=e.last(S);return e.forEach(S,function(C,O){var P=o(y,C),_=P?y.node(P).order:E;(P||C===k)&&(e.forEach(S.slice(T,O+1),function(M){e.forEach(y.predecessors(M),function(I){var B=y.node(I),$=B.order;($<N||_<$)&&!(B.dummy&&y.node(M).dummy)&&a(x,I,M)})}),T=O+1,N=_)}),S}return e.reduce(v,b),x}function i(y,v){var x={};function b(S,N,T,E,k){var C;e.forEach(e.range(N,T),function(O){C=S[O],y.node(C).dummy&&e.forEach(y.predecessors(C),function(P){var _=y.node(P);_.dummy&&(_.order<E||_.order>k)&&a(x,P,C)})})}function w(S,N){var T=-1,E,k=0;return e.forEach(N,function(C,O){if(y.node(C).dummy==="border"){var P=y.predecessors(C);P.length&&(E=y.node(P[0]).order,b(N,k,O,T,E),k=O,T=E)}b(N,k,N.length,E,S.length)}),N}return e.reduce(v,w),x}function o(y,v){if(y.node(v).dummy)return e.find(y.predecessors(v),function(x){return y.node(x).dummy})}function a(y,v,x){if(v>x){var b=v;v=x,x=b}var w=y[v];w||(y[v]=w={}),w[x]=!0}function s(y,v,x){if(v>x){var b=v;v=x,x=b}return e.has(y[v],x)}function u(y,v,x,b){var w={},S={},N={};return e.forEach(v,function(T){e.forEach(T,function(E,k){w[E]=E,S[E]=E,N[E]=k})}),e.forEach(v,function(T){var E=-1;e.forEach(T,function(k){var C=b(k);if(C.length){C=e.sortBy(C,function(I){return N[I]});for(var O=(C.length-1)/2,P=Math.floor(O),_=Math.ceil(O);P<=_;++P){var M=C[P];S[k]===k&&E<N[M]&&!s(x,k,M)&&(S[M]=k,S[k]=w[k]=w[M],E=N[M])}}})}),{root:w,align:S}}function l(y,v,x,b,w){var S={},N=c(y,v,x,w),T=w?"borderLeft":"borderRight";function E(O,P){for(var _=N.nodes(),M=_.pop(),I={};M;)I[M]?O(M):(I[M]=!0,_.push(M),_=_.concat(P(M))),M=_.pop()}function k(O){S[O]=N.inEdges(O).reduce(function(P,_){return Math.max(P,S[_.v]+N.edge(_))},0)}function C(O){var P=N.outEdges(O).reduce(function(M,I){return Math.min(M,S[I.w]-N.edge(I))},Number.POSITIVE_INFINITY),_=y.node(O);P!==Number.POSITIVE_INFINITY&&_.borderType!==T&&(S[O]=Math.max(S[O],P))}return E(k,N.predecessors.bind(N)),E(C,N.successors.bind(N)),e.forEach(b,function(O){S[O]=S[x[O]]}),S}function c(y,v,x,b){var w=new t,S=y.graph(),N=p(S.nodesep,S.edgesep,b);return e.forEach(v,function(T){var E;e.forEach(T,function(k){var C=x[k];if(w.setNode(C),E){var O=x[E],P=w.edge(O,C);w.setEdge(O,C,Math.max(N(y,k,E),P||0))}E=k})}),w}function f(y,v){return e.minBy(e.values(v),function(x){var b=Number.NEGATIVE_INFINITY,w=Number.POSITIVE_INFINITY;return e.forIn(x,function(S,N){var T=g(y,N)/2;b=Math.max(S+T,b),w=Math.min(S-T,w)}),b-w})}function d(y,v){var x=e.values(v),b=e.min(x),w=e.max(x);e.forEach(["u","d"],function(S){e.forEach(["l","r"],function(N){var T=S+N,E=y[T],k;if(E!==v){var C=e.values(E);k=N==="l"?b-e.min(C):w-e.max(C),k&&(y[T]=e.mapValues(E,function(O){return O+k}))}})})}function h(y,v){return e.mapValues(y.ul,function(x,b){if(v)return y[v.toLowerCase()][b];var w=e.sortBy(e.map(y,b));return(w[1]+w[2])/2})}function m(y){var v=n.buildLayerMatrix(y),x=e.merge(r(y,v),i(y,v)),b={},w;e.forEach(["u","d"],function(N){w=N==="u"?v:e.values(v).reverse(),e.forEach(["l","r"],function(T){T==="r"&&(w=e.map(w,function(O){return e.values(O).reverse()}));var E=(N==="u"?y.predecessors:y.successors).bind(y),k=u(y,w,x,E),C=l(y,w,k.root,k.align,T==="r");T==="r"&&(C=e.mapValues(C,function(O){return-O})),b[N+T]=C})});var S=f(y,b);return d(b,S),h(b,y.graph().align)}function p(y,v,x){return function(b,w,S){var N=b.node(w),T=b.node(S),E=0,k;if(E+=N.width/2,e.has(N,"labelpos"))switch(N.labelpos.toLowerCase()){case"l":k=-N.width/2;break;case"r":k=N.width/2;break}if(k&&(E+=x?k:-k),k=0,E+=(N.dummy?v:y)/2,E+=(T.dummy?v:y)/2,E+=T.width/2,e.has(T,"labelpos"))switch(T.labelpos.toLowerCase()){case"l":k=T.width/2;break;case"r":k=-T.width/2;break}return k&&(E+=x?k:-k),k=0,E}}function g(y,v){return y.node(v).width}return Ka}var Xa,Od;function W1(){if(Od)return Xa;Od=1;var e=he(),t=qe(),n=Y1().positionX;Xa=r;function r(o){o=t.asNonCompoundGraph(o),i(o),e.forEach(n(o),function(a,s){o.node(s).x=a})}function i(o){var a=t.buildLayerMatrix(o),s=o.graph().ranksep,u=0;e.forEach(a,function(l){var c=e.max(e.map(l,function(f){return o.node(f).height}));e.forEach(l,function(f){o.node(f).y=u+c/2}),u+=c+s})}return Xa}var Za,Ld;function K1(){if(Ld)return Za;Ld=1;var e=he(),t=M1(),n=k1(),r=T1(),i=qe().normalizeRanks,o=P1(),a=qe().removeEmptyRanks,s=O1(),u=L1(),l=$1(),c=U1(),f=W1(),d=qe(),h=De().Graph;Za=m;function m(q,L){var F=L&&L.debugTiming?d.time:d.notime;F("layout",function(){var j=F("  buildLayoutGraph",function(){return E(q)});F("  runLayout",function(){p(j,F)}),F("  updateInputGraph",function(){g(q,j)})})}function p(q,L){L("    makeSpaceForEdgeLabels",function(){k(q)}),L("    removeSelfEdges",function(){A(q)}),L("    acyclic",function(){t.run(q)}),L("    nestingGraph.run",function(){s.run(q)}),L("    rank",function(){r(d.asNonCompoundGraph(q))}),L("    injectEdgeLabelProxies",function(){C(q)}),L("    removeEmptyRanks",function(){a(q)}),L("    nestingGraph.cleanup",function(){s.cleanup(q)}),L("    normalizeRanks",function(){i(q)}),L("    assignRankMinMax",function(){O(q)}),L("    removeEdgeLabelProxies",function(){P(q)}),L("    normalize.run",function(){n.run(q)}),L("    parentDummyChains",function(){o(q)}),L("    addBorderSegments",function(){u(q)}),L("    order",function(){c(q)}),L("    insertSelfEdges",function(){z(q)}),L("    adjustCoordinateSystem",function(){l.adjust(q)}),L("    position",function(){f(q)}),L("    positionSelfEdges",function(){H(q)}),L("    removeBorderNodes",function(){$(q)}),L("    normalize.undo",function(){n.undo(q)}),L("    fixupEdgeLabelCoords",function(){I(q)}),L("    undoCoordinateSystem",function(){l.undo(q)}),L("    translateGraph",function(){_(q)}),L("    assignNodeIntersects",function(){M(q)}),L("    reversePoints",function(){B(q)}),L("    acyclic.undo",function(){t.undo(q)})}function g(q,L){e.forEach(q.nodes(),function(F){var j=q.node(F),W=L.node(F);j&&(j.x=W.x,j.y=W.y,L.children(F).length&&(j.width=W.width,j.height=W.height))}),e.forEach(q.edges(),function(F){var j=q.edge(F),W=L.edge(F);j.points=W.points,e.has(W,"x")&&(j.x=W.x,j.y=W.y)}),q.graph().width=L.graph().width,q.graph().height=L.graph().height}var y=["nodesep","edgesep","ranksep","marginx","marginy"],v={ranksep:50,edgesep:20,nodesep:50,rankdir:"tb"},x=["acyclicer","ranker","rankdir","align"],b=["width","height"],w={width:0,height:0},S=["minlen","weight","width","height","labeloffset"],N={minlen:1,weight:1,width:0,height:0,labeloffset:10,labelpos:"r"},T=["labelpos"];function E(q){var L=new h({multigraph:!0,compound:!0}),F=Y(q.graph());return L.setGraph(e.merge({},v,V(F,y),e.pick(F,x))),e.forEach(q.nodes(),function(j){var W=Y(q.node(j));L.setNode(j,e.defaults(V(W,b),w)),L.setParent(j,q.parent(j))}),e.forEach(q.edges(),function(j){var W=Y(q.edge(j));L.setEdge(j,e.merge({},N,V(W,S),e.pick(W,T)))}),L}function k(q){var L=q.graph();L.ranksep/=2,e.forEach(q.edges(),function(F){var j=q.edge(F);j.minlen*=2,j.labelpos.toLowerCase()!=="c"&&(L.rankdir==="TB"||L.rankdir==="BT"?j.width+=j.labeloffset:j.height+=j.labeloffset)})}function C(q){e.forEach(q.edges(),function(L){var F=q.edge(L);if(F.width&&F.height){var j=q.node(L.v),W=q.node(L.w),J={rank:(W.rank-j.rank)/2+j.rank,e:L};d.addDummyNode(q,"edge-proxy",J,"_ep")}})}function O(q){var L=0;e.forEach(q.nodes(),function(F){var j=q.node(F);j.borderTop&&(j.minRank=q.node(j.borderTop).rank,j.maxRank=q.node(j.borderBottom).rank,L=e.max(L,j.maxRank))}),q.graph().maxRank=L}function P(q){e.forEach(q.nodes(),function(L){var F=q.node(L);F.dummy==="edge-proxy"&&(q.edge(F.e).labelRank=F.rank,q.removeNode(L))})}function _(q){var L=Number.POSITIVE_INFINITY,F=0,j=Number.POSITIVE_INFINITY,W=0,J=q.graph(),ee=J.marginx||0,ie=J.marginy||0;function ue(ae){var ne=ae.x,te=ae.y,pe=ae.width,X=ae.height;L=Math.min(L,ne-pe/2),F=Math.max(F,ne+pe/2),j=Math.min(j,te-X/2),W=Math.max(W,te+X/2)}e.forEach(q.nodes(),function(ae){ue(q.node(ae))}),e.forEach(q.edges(),function(ae){var ne=q.edge(ae);e.has(ne,"x")&&ue(ne)}),L-=ee,j-=ie,e.forEach(q.nodes(),function(ae){var ne=q.node(ae);ne.x-=L,ne.y-=j}),e.forEach(q.edges(),function(ae){var ne=q.edge(ae);e.forEach(ne.points,function(te){te.x-=L,te.y-=j}),e.has(ne,"x")&&(ne.x-=L),e.has(ne,"y")&&(ne.y-=j)}),J.width=F-L+ee,J.height=W-j+ie}function M(q){e.forEach(q.edges(),function(L){var F=q.edge(L),j=q.node(L.v),W=q.node(L.w),J,ee;F.points?(J=F.points[0],ee=F.points[F.points.length-1]):(F.points=[],J=W,ee=j),F.points.unshift(d.intersectRect(j,J)),F.points.push(d.intersectRect(W,ee))})}function I(q){e.forEach(q.edges(),function(L){var F=q.edge(L);if(e.has(F,"x"))switch((F.labelpos==="l"||F.labelpos==="r")&&(F.width-=F.labeloffset),F.labelpos){case"l":F.x-=F.width/2+F.labeloffset;break;case"r":F.x+=F.width/2+F.labeloffset;break}})}function B(q){e.forEach(q.edges(),function(L){var F=q.edge(L);F.reversed&&F.points.reverse()})}function $(q){e.forEach(q.nodes(),function(L){if(q.children(L).length){var F=q.node(L),j=q.node(F.borderTop),W=q.node(F.borderBottom),J=q.node(e.last(F.borderLeft)),ee=q.node(e.last(F.borderRight));F.width=Math.abs(ee.x-J.x),F.height=Math.abs(W.y-j.y),F.x=J.x+F.width/2,F.y=j.y+F.height/2}}),e.forEach(q.nodes(),function(L){q.node(L).dummy==="border"&&q.removeNode(L)})}function A(q){e.forEach(q.edges(),function(L){if(L.v===L.w){var F=q.node(L.v);F.selfEdges||(F.selfEdges=[]),F.selfEdges.push({e:L,label:q.edge(L)}),q.removeEdge(L)}})}function z(q){var L=d.buildLayerMatrix(q);e.forEach(L,function(F){var j=0;e.forEach(F,function(W,J){var ee=q.node(W);ee.order=J+j,e.forEach(ee.selfEdges,function(ie){d.addDummyNode(q,"selfedge",{width:ie.label.width,height:ie.label.height,rank:ee.rank,order:J+ ++j,e:ie.e,label:ie.label},"_se")}),delete ee.selfEdges})})}function H(q){e.forEach(q.nodes(),function(L){var F=q.node(L);if(F.dummy==="selfedge"){var j=q.node(F.e.v),W=j.x+j.width/2,J=j.y,ee=F.x-W,ie=j.height/2;q.setEdge(F.e,F.label),q.removeNode(L),F.label.points=[{x:W+2*ee/3,y:J-ie},{x:W+5*ee/6,y:J-ie},{x:W+ee,y:J},{x:W+5*ee/6,y:J+ie},{x:W+2*ee/3,y:J+ie}],F.label.x=F.x,F.label.y=F.y}})}function V(q,L){return e.mapValues(e.pick(q,L),Number)}function Y(q){var L={};return e.forEach(q,function(F,j){L[j.toLowerCase()]=F}),L}return Za}var Qa,$d;function X1(){if($d)return Qa;$d=1;var e=he(),t=qe(),n=De().Graph;Qa={debugOrdering:r};function r(i){var o=t.buildLayerMatrix(i),a=new n({compound:!0,multigraph:!0}).setGraph({});return e.forEach(i.nodes(),function(s){a.setNode(s,{label:s}),a.setParent(s,"layer"+i.node(s).rank)}),e.forEach(i.edges(),function(s){a.setEdge(s.v,s.w,{},s.name)}),e.forEach(o,function(s,u){var l="layer"+u;a.setNode(l,{rank:"same"}),e.reduce(s,function(c,f){return a.setEdge(c,f,{style:"invis"}),f})}),a}return Qa}var Ja,Dd;function Z1(){return Dd||(Dd=1,Ja="0.8.5"),Ja}var es,Fd;function Q1(){return Fd||(Fd=1,es={graphlib:De(),layout:K1(),debug:X1(),util:{time:qe().time,notime:qe().notime},version:Z1()}),es}var J1=Q1();const zd=Yd(J1);function eE(e,t,n=null,r={}){const{ranksep:i=100,nodesep:o=50,rankdir:a="LR"}=r,s=new zd.graphlib.Graph;s.setGraph({rankdir:a,nodesep:o,ranksep:i}),s.setDefaultEdgeLabel(()=>({})),e.forEach(c=>{var m,p;const f=(c.data.name||"").length,d=((m=c.layoutSize)==null?void 0:m.width)??Math.max(180,f*8+80),h=((p=c.layoutSize)==null?void 0:p.height)??50;s.setNode(c.id,{width:d,height:h})}),t.forEach(c=>{s.setEdge(c.source,c.target)}),zd.layout(s);let u=0,l=0;if(n){const c=s.node(n.id);if(c){const f=c.x-c.width/2,d=c.y-c.height/2;u=n.position.x-f,l=n.position.y-d}}return e.map(c=>{const f=s.node(c.id);return{...c,position:{x:f.x-f.width/2+u,y:f.y-f.height/2+l}}})}function tE(e,t){const n=(e||[]).map(s=>s.id),r=new Map(n.map(s=>[s,s])),i=s=>{let u=s;for(;r.get(u)!==u;)u=r.get(u);let l=s;for(;r.get(l)!==u;){const c=r.get(l);r.set(l,u),l=c}return u},o=(s,u)=>{const l=i(s),c=i(u);l!==c&&r.set(l,c)};(t||[]).forEach(s=>{const{source:u,target:l}=s;u==null||l==null||u!==l&&(!r.has(u)||!r.has(l)||o(u,l))});const a=new Map;return n.forEach(s=>{const u=i(s);a.has(u)||a.set(u,[]),a.get(u).push(s)}),Array.from(a.values())}function nE(e){if(!Array.isArray(e)||e.length===0)return{};const t=e.length,n=Math.min(t,Math.max(2,Math.ceil(Math.sqrt(t)))),r=new Array(n).fill(0),i=new Array(n).fill(0),o=Array.from({length:n},()=>[]);e.forEach(u=>{const l=u.width??Nt,c=u.height??80;let f=0;for(let h=1;h<n;h+=1)r[h]<r[f]&&(f=h);const d=r[f];o[f].push({boxId:u.id,y:d,width:l}),r[f]=d+c+N_,l>i[f]&&(i[f]=l)});const a=new Array(n).fill(0);for(let u=1;u<n;u+=1){const l=u*(Nt+Qu),c=a[u-1]+(i[u-1]||Nt)+Qu;a[u]=Math.max(l,c)}const s={};return o.forEach((u,l)=>{u.forEach(c=>{s[c.boxId]={x:a[l],y:c.y}})}),s}function rE({nodes:e,edges:t,options:n={}}){const r=Array.isArray(e)?e:[];if(r.length===0)return{nodes:r};const i=Array.isArray(t)?t:[],o=new Map(r.map(f=>[f.id,f])),a=tE(r,i),s=new Map,u=[];a.forEach((f,d)=>{var N,T;const h=`cluster-${d}`,m=f.map(E=>o.get(E)).filter(Boolean);if(m.length===1){const E=m[0];s.set(E.id,{x:0,y:0}),u.push({id:h,members:[E.id],width:((N=E.layoutSize)==null?void 0:N.width)??Nt,height:((T=E.layoutSize)==null?void 0:T.height)??80});return}const p=new Set(f),g=i.filter(E=>E.source!==E.target&&p.has(E.source)&&p.has(E.target)),y={ranksep:n.ranksep??90,nodesep:n.nodesep??50,rankdir:n.direction??"LR"};let v;try{v=eE(m,g,null,y)}catch{v=m.map(E=>({...E,position:{x:0,y:0}}))}let x=1/0,b=1/0,w=-1/0,S=-1/0;v.forEach(E=>{var _,M;const k=((_=E.layoutSize)==null?void 0:_.width)??Nt,C=((M=E.layoutSize)==null?void 0:M.height)??80,{x:O,y:P}=E.position;O<x&&(x=O),P<b&&(b=P),O+k>w&&(w=O+k),P+C>S&&(S=P+C)}),v.forEach(E=>{s.set(E.id,{x:E.position.x-x,y:E.position.y-b})}),u.push({id:h,members:f,width:w-x,height:S-b})});const l=nE(u);return{nodes:r.map(f=>{const d=u.find(p=>p.members.includes(f.id)),h=d&&l[d.id]||{x:0,y:0},m=s.get(f.id)||{x:0,y:0};return{...f,position:{x:h.x+m.x,y:h.y+m.y}}})}}function iE({nodes:e,edges:t,options:n={}}){return rE({nodes:e,edges:t,options:n})}const xn=e=>`erd-model-${e}`,oE=e=>`erd-relnode-${e}`,aE=e=>`erd-reledge-${e}-a`,sE=e=>`erd-reledge-${e}-b`,uE=e=>{var n;if(!e)return[];const t=e.columns||((n=e.config)==null?void 0:n.columns)||[];return Array.isArray(t)?t.map(r=>typeof r=="string"?r:r==null?void 0:r.name).filter(r=>typeof r=="string"&&r.length>0):[]},Bd=/\$\{\s*ref\(\s*([^)]+?)\s*\)\s*\.\s*([^}\s]+?)\s*\}/g,cE=e=>{if(!e||typeof e!="string")return null;const t=[];let n;for(Bd.lastIndex=0;(n=Bd.exec(e))!==null;)t.push({model:n[1].trim(),column:n[2].trim()});return t.length!==2?null:{a:t[0],b:t[1]}};function lE(e={}){const{scopeModelNames:t=null,extraModelNames:n=[],columnsByModel:r={},fieldsByModel:i={},layout:o="dagre",savedPositions:a={},layoutVersion:s=0}=e,u=ce(m=>m.models),l=ce(m=>m.relations),c=Array.isArray(t)?[...t].sort().join("|"):"__all__",f=Array.isArray(n)?[...n].sort().join("|"):"",d=Object.keys(i).sort().map(m=>{var p,g;return`${m}:${(((p=i[m])==null?void 0:p.metrics)||[]).length},${(((g=i[m])==null?void 0:g.dimensions)||[]).length}`}).join("|"),h=Object.keys(a||{}).sort().map(m=>{var p,g;return`${m}:${(p=a[m])==null?void 0:p.x},${(g=a[m])==null?void 0:g.y}`}).join("|");return R.useMemo(()=>{const m=Array.isArray(u)?u:[],p=Array.isArray(l)?l:[];let g=m;if(Array.isArray(t)){const C=new Set([...t,...n].filter(Boolean));g=m.filter(O=>C.has(O.name))}const y=new Set(g.map(C=>C.name)),v=C=>{const O=uE(C),P=Array.isArray(r[C.name])?r[C.name]:[];return O.length>0?O:P},x=new Map(g.map(C=>[C.name,v(C)])),b=g.map(C=>{const O=x.get(C.name)||[],P=i[C.name]||{metrics:[],dimensions:[]},_=P.metrics||[],M=P.dimensions||[];return{id:xn(C.name),type:"erdModelNode",position:{x:0,y:0},layoutSize:{width:Nt,height:R_({columns:O,metrics:_,dimensions:M})},data:{name:C.name,objectType:"model",columns:O,metrics:_,dimensions:M,model:C}}}),w=(C,O)=>{const P=x.get(C)||[];return P.includes(O)?O:P.find(M=>M.toLowerCase()===String(O).toLowerCase())||null},S=[],N=[];p.forEach(C=>{var A,z,H;const O=C.condition||((A=C.config)==null?void 0:A.condition),P=cE(O);if(!P||!y.has(P.a.model)||!y.has(P.b.model))return;const _=C.join_type||((z=C.config)==null?void 0:z.join_type)||"inner",M=!!(C.is_default??((H=C.config)==null?void 0:H.is_default)),I=oE(C.name);S.push({id:I,type:"relationNode",position:{x:0,y:0},layoutSize:{width:Math.max(120,C.name.length*7+56),height:40},data:{relationName:C.name,joinType:_,isDefault:M,condition:O,modelA:P.a.model,columnA:P.a.column,modelB:P.b.model,columnB:P.b.column}});const B=w(P.a.model,P.a.column),$=w(P.b.model,P.b.column);N.push({id:aE(C.name),type:"relationLinkEdge",source:xn(P.a.model),...B?{sourceHandle:B}:{},target:I,data:{relationName:C.name,modelEnd:"source",column:P.a.column,columns:x.get(P.a.model)||[]}}),N.push({id:sE(C.name),type:"relationLinkEdge",source:I,target:xn(P.b.model),...$?{targetHandle:$}:{},data:{relationName:C.name,modelEnd:"target",column:P.b.column,columns:x.get(P.b.model)||[]}})});const T=[...b,...S],{nodes:E}=iE({nodes:T,edges:N,options:{direction:"LR"}});return{nodes:E.map(C=>{const O=a==null?void 0:a[C.id];return O&&Number.isFinite(O.x)&&Number.isFinite(O.y)?{...C,position:{x:O.x,y:O.y}}:C}),edges:N}},[u,l,c,f,r,i,d,o,h,s])}const Hd={available:!1,columns:[]},fE=async(e,{sql:t,sourceName:n,projectId:r}={})=>{if(!rg("modelSchemaDetail"))return Hd;const i={};t&&(i.sql=t),n&&(i.source_name=n);const o=await ig(og(ag("modelSchemaDetail",{name:e}),r),{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(i)});return o.status===200?{available:!0,...await o.json()}:Hd},dE=async(e,{projectId:t}={})=>((await fE(e,{projectId:t})).columns||[]).map(r=>r.name);function lm(e){const t=ce(l=>{var c;return(c=l.project)==null?void 0:c.id}),[n,r]=R.useState({}),[i,o]=R.useState(!1),a=R.useRef(new Set),s=R.useRef(!0);R.useEffect(()=>(s.current=!0,()=>{s.current=!1}),[]);const u=Array.isArray(e)?[...new Set(e.filter(Boolean))].sort().join("|"):"";return R.useEffect(()=>{const c=(u?u.split("|"):[]).filter(f=>!a.current.has(f));c.length!==0&&(c.forEach(f=>a.current.add(f)),o(!0),Promise.all(c.map(async f=>{try{return[f,await dE(f,{projectId:t})]}catch{return[f,[]]}})).then(f=>{s.current&&(r(d=>{const h={...d};return f.forEach(([m,p])=>{h[m]=p}),h}),o(!1))}))},[u,t]),{columnsByModel:n,loading:i}}const Vd=e=>{var n;if(!e)return null;const t=e.parentModel||((n=e.config)==null?void 0:n.model)||null;return t?sg(t):null},hn=e=>{var t;return typeof e=="string"?e:(e==null?void 0:e.name)||((t=e==null?void 0:e.config)==null?void 0:t.name)},hE=(e=[],t=[],n=[])=>{const r={},i=a=>(r[a]||(r[a]={metrics:new Set,dimensions:new Set}),r[a]);(e||[]).forEach(a=>{const s=a.config||a,u=i(a.name);((s==null?void 0:s.metrics)||[]).forEach(l=>{const c=hn(l);c&&u.metrics.add(c)}),((s==null?void 0:s.dimensions)||[]).forEach(l=>{const c=hn(l);c&&u.dimensions.add(c)})}),(t||[]).forEach(a=>{const s=Vd(a),u=hn(a);s&&u&&i(s).metrics.add(u)}),(n||[]).forEach(a=>{const s=Vd(a),u=hn(a);s&&u&&i(s).dimensions.add(u)});const o={};return Object.keys(r).forEach(a=>{o[a]={metrics:[...r[a].metrics].sort(),dimensions:[...r[a].dimensions].sort()}}),o},pn=({type:e,colors:t,id:n,position:r,style:i})=>U.jsx(ht,{type:e,id:n,position:r||(e==="target"?"left":"right"),style:{background:t.connectionHandle,width:8,height:8,border:"2px solid white",...i}}),jd=({label:e,names:t,type:n})=>{const r=ce(d=>d.createExploration),i=ce(d=>d.buildExplorationSeedState),o=ce(d=>d.openWorkspaceTab),a=R.useRef(new Set),[s,u]=R.useState(()=>new Set),l=R.useCallback(d=>{if(!r||a.current.has(d))return;a.current.add(d),u(new Set(a.current));const h={type:n,name:d},m=i?i(h):null;r(h,null,m).then(p=>{p!=null&&p.success&&o&&(o({id:`exploration:${p.id}`,type:"exploration",name:p.id}),Ns("explore_this_used",{source_type:n}))}).finally(()=>{a.current.delete(d),u(new Set(a.current))})},[n,r,i,o]);if(R.useEffect(()=>{const d=a.current;return()=>{d.clear()}},[]),!t||t.length===0)return null;const c=Mt(n),f=Pn(n);return U.jsxs("div",{"data-testid":`erd-fields-${n}`,className:"border-t border-gray-100 px-3 py-1.5",children:[U.jsxs("div",{className:"mb-1 flex items-center gap-1 text-[9px] font-semibold uppercase tracking-wide text-gray-400",children:[f&&U.jsx(f,{style:{fontSize:11},className:c.text,"aria-hidden":"true"}),e]}),U.jsx("div",{className:"flex flex-wrap gap-1",children:t.map(d=>U.jsx("button",{type:"button","data-testid":`erd-${n}-pill-${d}`,title:`Explore ${d}`,disabled:s.has(d),onPointerDown:h=>h.stopPropagation(),onClick:h=>{h.stopPropagation(),l(d)},className:["inline-flex max-w-[120px] items-center truncate rounded px-1.5 py-0.5 text-[10px] font-medium transition-colors","cursor-pointer hover:ring-1 hover:ring-inset disabled:cursor-not-allowed disabled:opacity-60",c.bg,c.text].join(" "),children:d},d))})]})},pE=({name:e,colors:t})=>{const n=ce(l=>l.createExploration),r=ce(l=>l.buildExplorationSeedState),i=ce(l=>l.openWorkspaceTab),o=R.useRef(!1),[a,s]=R.useState(!1),u=R.useCallback(l=>{if(l.stopPropagation(),!n||o.current)return;o.current=!0,s(!0);const c={type:"model",name:e},f=r?r(c):null;n(c,null,f).then(d=>{d!=null&&d.success&&i&&(i({id:`exploration:${d.id}`,type:"exploration",name:d.id}),Ns("explore_this_used",{source_type:"model"}))}).finally(()=>{o.current=!1,s(!1)})},[e,n,r,i]);return U.jsx("button",{type:"button","data-testid":`semantic-erd-model-explore-${e}`,title:`Explore ${e}`,"aria-label":`Explore ${e}`,disabled:a,onPointerDown:l=>l.stopPropagation(),onClick:u,className:["ml-auto flex h-5 w-5 shrink-0 items-center justify-center rounded transition-colors","hover:bg-black/10 disabled:cursor-not-allowed disabled:opacity-60",t.text].join(" "),children:U.jsx(ug,{style:{fontSize:13},"aria-hidden":"true"})})},mE=({data:e,selected:t})=>{const{name:n,columns:r=[],metrics:i=[],dimensions:o=[]}=e,a=Mt("model"),s=Pn("model");return U.jsxs("div",{"data-testid":`semantic-erd-model-node-${n}`,className:["min-w-[200px] max-w-[280px] rounded-lg border-2 bg-white shadow-sm transition-all duration-150",t?`${a.borderSelected} shadow-md`:a.border].join(" "),children:[U.jsxs("div",{className:["flex items-center gap-2 rounded-t-md px-3 py-2 text-[12px] font-semibold",a.bg,a.text].join(" "),children:[s&&U.jsx(s,{style:{fontSize:16},className:"shrink-0","aria-hidden":"true"}),U.jsx("span",{className:"min-w-0 flex-1 truncate",title:n,children:n}),U.jsx(pE,{name:n,colors:a})]}),r.length>0?U.jsx("ul",{className:"divide-y divide-gray-100",children:r.map(u=>U.jsxs("li",{"data-testid":`semantic-erd-column-${n}-${u}`,className:"relative flex items-center px-3 py-1.5 text-[12px] text-gray-700 hover:bg-gray-50",children:[U.jsx(pn,{type:"target",colors:a,id:u,position:Q.Left}),U.jsx("span",{className:"truncate",title:u,children:u}),U.jsx(pn,{type:"source",colors:a,id:u,position:Q.Right})]},u))}):U.jsxs("div",{className:"relative px-3 py-2 text-[11px] italic text-gray-400",children:[U.jsx(pn,{type:"target",colors:a,position:Q.Left}),"No columns loaded",U.jsx(pn,{type:"source",colors:a,position:Q.Right})]}),U.jsx(jd,{label:"Metrics",names:i,type:"metric"}),U.jsx(jd,{label:"Dimensions",names:o,type:"dimension"})]})},gE=({data:e={},selected:t})=>{const{relationName:n,isDefault:r}=e,i=Mt("relation"),o=Pn("relation");return U.jsxs("div",{"data-testid":`erd-relation-node-${n}`,title:e.condition||n,className:["relative inline-flex items-center gap-1.5 rounded-full border px-3 py-1.5 text-[11px] font-semibold shadow-sm transition-all duration-150",i.bg,i.text,t?i.borderSelected:i.border].join(" "),children:[U.jsx(ht,{type:"target",position:Q.Left,style:{background:i.connectionHandle,width:8,height:8,border:"2px solid white"}}),U.jsxs("span",{"data-testid":`erd-relation-pill-${n}`,className:"inline-flex items-center gap-1.5",children:[o&&U.jsx(o,{style:{fontSize:13},className:"shrink-0","aria-hidden":"true"}),U.jsx("span",{className:"max-w-[160px] truncate",title:n,children:n}),r&&U.jsx("span",{"data-testid":`erd-relation-default-${n}`,"aria-label":"default",title:"Default relation",className:"text-amber-500",children:"★"})]}),U.jsx(ht,{type:"source",position:Q.Right,style:{background:i.connectionHandle,width:8,height:8,border:"2px solid white"}})]})},yE=["=","!=",">","<",">=","<="],vE=[{value:"inner",label:"Inner"},{value:"left",label:"Left"},{value:"right",label:"Right"},{value:"full",label:"Full"}],bE="var(--color-primary-500)",xE=(e,t)=>e&&t?`${e}_to_${t}`:"new_relation",Gd=({side:e,models:t,columnsByModel:n={},value:r,onChange:i,testId:o})=>{const[a,s]=R.useState(""),u=Mt("model"),l=Pn("model"),c=t.find(m=>m.name===r.model)||null,f=R.useMemo(()=>{const m=a.replace(/^@/,"").trim().toLowerCase();return m?t.filter(p=>p.name.toLowerCase().includes(m)):t},[t,a]),d=R.useMemo(()=>{var y;const m=n[r.model],p=(c==null?void 0:c.columns)||((y=c==null?void 0:c.config)==null?void 0:y.columns)||[];return(Array.isArray(m)&&m.length?m:p).map(v=>typeof v=="string"?v:v==null?void 0:v.name).filter(Boolean)},[n,r.model,c]),h=R.useMemo(()=>{const m=[{value:"",label:"Select column…"}];return r.column&&!d.includes(r.column)&&m.push({value:r.column,label:r.column}),d.forEach(p=>m.push({value:p,label:p})),m},[d,r.column]);return U.jsxs("div",{className:"flex flex-col gap-1","data-testid":o,children:[U.jsx("span",{className:"text-[10px] font-semibold uppercase tracking-wide text-gray-400",children:e}),U.jsxs("div",{className:"flex items-center gap-1.5 rounded-md border border-gray-200 px-2 py-1",children:[l&&U.jsx(l,{style:{fontSize:14},className:`shrink-0 ${u.text}`,"aria-hidden":"true"}),U.jsx("input",{type:"text","data-testid":`${o}-model-input`,value:a||r.model||"",onChange:m=>{s(m.target.value)},placeholder:"@model",className:"w-full bg-transparent text-[12px] outline-none placeholder:text-gray-300"})]}),a&&f.length>0&&U.jsx("ul",{"data-testid":`${o}-model-options`,className:"max-h-28 overflow-auto rounded-md border border-gray-100 bg-white text-[12px] shadow-sm",children:f.map(m=>U.jsx("li",{children:U.jsx("button",{type:"button","data-testid":`${o}-model-option-${m.name}`,className:"flex w-full items-center px-2 py-1 text-left hover:bg-primary-50",onClick:()=>{s(""),i({model:m.name,column:""})},children:m.name})},m.name))}),U.jsx(th,{"data-testid":`${o}-column-select`,size:"sm",placeholder:"Select column…",value:r.column||"",options:h,onChange:m=>i({...r,column:m||""}),disabled:!c})]})},_E=({x:e,y:t,models:n=[],initialA:r=null,initialB:i=null,onClose:o,onSaved:a})=>{const s=R.useRef(null),u=ce($=>$.saveRelation),l=ce($=>$.relations),[c,f]=R.useState(r||{model:"",column:""}),[d,h]=R.useState(i||{model:"",column:""}),m=R.useMemo(()=>[c.model,d.model].filter(Boolean),[c.model,d.model]),{columnsByModel:p}=lm(m),[g,y]=R.useState("="),[v,x]=R.useState("inner"),[b,w]=R.useState(!1),[S,N]=R.useState(""),[T,E]=R.useState(!1),[k,C]=R.useState(!1),[O,P]=R.useState(null);R.useEffect(()=>{const $=V=>!!(V&&V.closest&&V.closest(".vis-select__menu")),A=V=>{s.current&&s.current.contains(V.target)||$(V.target)||o&&o()},z=V=>{V.key==="Escape"&&o&&o()},H=()=>o&&o();return document.addEventListener("pointerdown",A,!0),document.addEventListener("keydown",z),window.addEventListener("scroll",H,!0),()=>{document.removeEventListener("pointerdown",A,!0),document.removeEventListener("keydown",z),window.removeEventListener("scroll",H,!0)}},[o]);const _=R.useMemo(()=>!c.model||!c.column||!d.model||!d.column?"":`${iu(c.model,c.column)} ${g} ${iu(d.model,d.column)}`,[c,d,g]),M=T?S.trim():_,I=M.length>0&&!k,B=async()=>{if(!M){P("Pick a column on each side (or use custom SQL) first.");return}C(!0),P(null);const $=(l||[]).map(V=>V==null?void 0:V.name).filter(Boolean),A=fg(xE(c.model,d.model),$),z={name:A,join_type:v,condition:M,is_default:b||void 0},H=await u(A,z);C(!1),H!=null&&H.success?(a&&a({name:A,config:z}),o&&o()):P((H==null?void 0:H.error)||"Failed to save relation")};return cg.createPortal(U.jsxs("div",{ref:s,role:"dialog","aria-label":"Author relation","data-testid":"join-operator-popover",className:"fixed z-[90] w-[320px] rounded-lg border border-primary-100 bg-white p-3 shadow-xl",style:{top:t,left:e},onPointerDown:$=>$.stopPropagation(),children:[U.jsxs("div",{className:"mb-2 flex items-center gap-1.5 text-[11px] font-semibold uppercase tracking-wide text-gray-400",children:[U.jsx(lg,{style:{fontSize:13},"aria-hidden":"true"}),"New relation"]}),U.jsxs("div",{className:"flex gap-2",children:[U.jsx(Gd,{side:"From",models:n,columnsByModel:p,value:c,onChange:f,testId:"join-endpoint-a"}),U.jsx(Gd,{side:"To",models:n,columnsByModel:p,value:d,onChange:h,testId:"join-endpoint-b"})]}),U.jsxs("div",{className:"mt-2 flex flex-col gap-1",children:[U.jsx("span",{className:"text-[10px] font-semibold uppercase tracking-wide text-gray-400",children:"Operator"}),U.jsx("div",{role:"group","aria-label":"Operator","data-testid":"join-operator-segmented",className:"flex overflow-hidden rounded-md border border-gray-200",children:yE.map($=>U.jsx("button",{type:"button","data-testid":`join-operator-${$}`,"aria-pressed":g===$,onClick:()=>y($),className:["flex-1 px-1 py-1 text-[12px] font-medium transition-colors",g===$?"bg-primary-100 text-primary-700":"text-gray-600 hover:bg-gray-50"].join(" "),children:$},$))})]}),U.jsxs("div",{className:"mt-2 flex flex-col gap-1",children:[U.jsx("span",{className:"text-[10px] font-semibold uppercase tracking-wide text-gray-400",children:"Join type"}),U.jsx(th,{"data-testid":"join-type-select",size:"sm",value:v,options:vE,onChange:x})]}),U.jsxs("label",{className:"mt-2 flex items-center gap-1.5 text-[12px] text-gray-600",children:[U.jsx("input",{type:"checkbox","data-testid":"join-is-default",checked:b,onChange:$=>w($.target.checked)}),"Default relation for these models"]}),U.jsxs("div",{className:"mt-2 rounded-md bg-gray-50 px-2 py-1.5",children:[U.jsx("span",{className:"text-[10px] font-semibold uppercase tracking-wide text-gray-400",children:"Preview"}),U.jsx("pre",{"data-testid":"join-condition-preview",className:"mt-0.5 whitespace-pre-wrap break-words font-mono text-[11px] text-gray-700",children:M||"—"})]}),U.jsxs("details",{className:"mt-2",onToggle:$=>E($.target.open),children:[U.jsx("summary",{className:"cursor-pointer text-[11px] font-medium text-gray-500",children:"Custom SQL"}),U.jsx("textarea",{"data-testid":"join-custom-sql",value:S,onChange:$=>N($.target.value),rows:2,placeholder:"${ref(a).x} = ${ref(b).y}",className:"mt-1 w-full rounded-md border border-gray-200 px-2 py-1 font-mono text-[11px] outline-none"}),U.jsx("p",{className:"mt-0.5 text-[10px] text-gray-400",children:"When set, custom SQL overrides the builder above."})]}),O&&U.jsx("p",{"data-testid":"join-popover-error",className:"mt-2 text-[11px] text-highlight-700",children:O}),U.jsxs("div",{className:"mt-3 flex justify-end gap-2",children:[U.jsx("button",{type:"button","data-testid":"join-popover-cancel",onClick:()=>o&&o(),className:"rounded-md px-2.5 py-1 text-[12px] font-medium text-gray-600 hover:bg-gray-50",children:"Cancel"}),U.jsx("button",{type:"button","data-testid":"join-popover-save",onClick:B,disabled:!I,className:"rounded-md px-3 py-1 text-[12px] font-semibold text-white transition-colors disabled:opacity-40",style:{background:bE},children:k?"Saving…":"Save relation"})]})]}),document.body)},wE=Mt("relation").connectionHandle;function EE({id:e,sourceX:t,sourceY:n,sourcePosition:r,targetX:i,targetY:o,targetPosition:a,style:s}){const[u]=Ds({sourceX:t,sourceY:n,sourcePosition:r,targetX:i,targetY:o,targetPosition:a});return U.jsx(kt,{id:e,path:u,style:{stroke:wE,strokeWidth:1.5,...s}})}function SE(e,t,n={}){const r=new Map((e||[]).map(i=>[i.id,i]));return(t||[]).map(i=>{const o=i.id,a=r.get(o),s=n==null?void 0:n[o],u=s&&Number.isFinite(s.x)&&Number.isFinite(s.y);let l;return u?l={x:s.x,y:s.y}:a?l=i.position||a.position:l=i.position,a?{...a,data:i.data,type:i.type,layoutSize:i.layoutSize,position:l}:{...i,position:l}})}const NE=({onTidy:e,hasEdits:t=!1,testId:n})=>{const r=Mt("relation").connectionHandle,{confirm:i,ConfirmDialog:o}=dg(),a=async()=>{t&&!await i({title:"Reset the layout?",body:"This clears your moved cards and edges.",confirmLabel:"Reset",danger:!0})||e&&e()};return U.jsxs(U.Fragment,{children:[U.jsxs("button",{type:"button","data-testid":n,onClick:a,className:"relative inline-flex items-center gap-1.5 rounded-md border border-gray-200 bg-white/90 px-2.5 py-1 text-[11px] font-medium text-gray-700 shadow-sm transition-colors hover:bg-gray-50",title:"Tidy layout — re-run auto-layout and fit to view",children:[U.jsx("svg",{width:"13",height:"13",viewBox:"0 0 24 24",fill:"none","aria-hidden":"true",children:U.jsx("path",{d:"M4 6h16M4 12h10M4 18h7",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round"})}),"Tidy layout",t&&U.jsx("span",{"data-testid":n?`${n}-edited-dot`:void 0,title:"Layout edited",className:"absolute -right-1 -top-1 h-2 w-2 rounded-full",style:{background:r}})]}),o]})},mn="semantic-layer",RE=()=>U.jsx("div",{"data-testid":"semantic-layer-erd-empty",className:"flex flex-1 items-center justify-center bg-gray-50 p-12 text-center",children:U.jsxs("div",{className:"max-w-[380px] rounded-2xl border border-gray-200 bg-white p-8 shadow-sm",children:[U.jsx("h2",{className:"text-[15px] font-semibold text-gray-900",children:"No models yet"}),U.jsx("p",{className:"mt-1.5 text-[13px] leading-relaxed text-gray-500",children:"Add models with metrics and dimensions to see your semantic layer here, then drag a column from one model onto another to relate them."})]})}),qE=()=>{const e=ce(G=>G.fetchModels),t=ce(G=>G.fetchRelations),n=ce(G=>G.fetchMetrics),r=ce(G=>G.fetchDimensions),i=ce(G=>G.models),o=ce(G=>G.metrics),a=ce(G=>G.dimensions),s=ce(G=>G.getErdLayout(mn)),u=ce(G=>G.workspaceErdLayoutVersion[mn]||0),l=ce(G=>G.setErdNodePositions),c=ce(G=>G.clearErdLayout),f=ce(G=>G.openEditRelationModal),d=ce(G=>G.getRelationByName),h=s.nodes,m=ce(G=>G.createExploration),p=ce(G=>G.buildExplorationSeedState),g=ce(G=>G.openWorkspaceTab),y=ce(G=>G.setWorkspaceSelection),[v,x]=R.useState(null),b=R.useCallback((G,K)=>{var oe;(K==null?void 0:K.type)!=="semanticLayerModelNode"||!((oe=K.data)!=null&&oe.name)||(G.preventDefault(),x({x:G.clientX,y:G.clientY,obj:{type:"model",name:K.data.name}}))},[]),w=R.useCallback(()=>x(null),[]),S=R.useCallback(G=>{y&&y(G)},[y]),N=R.useCallback(G=>{g&&g({id:`${G.type}:${G.name}`,type:G.type,name:G.name})},[g]),T=R.useCallback(G=>{if(!m||!g)return;const K={type:G.type,name:G.name},oe=p?p(K):null;m(K,null,oe).then(se=>{se!=null&&se.success&&(g({id:`exploration:${se.id}`,type:"exploration",name:se.id}),Ns("explore_this_used",{source_type:G.type}))})},[m,g,p]),E=ce(G=>G.workspaceSemanticLayerFocusIntent),k=ce(G=>G.clearWorkspaceSemanticLayerFocusIntent),{fitView:C,setCenter:O}=Hn(),P=Ux();R.useEffect(()=>{(!i||i.length===0)&&typeof e=="function"&&e(),typeof t=="function"&&t(),(!o||o.length===0)&&typeof n=="function"&&n(),(!a||a.length===0)&&typeof r=="function"&&r()},[]);const _=R.useMemo(()=>(i||[]).map(G=>G.name),[i]),{columnsByModel:M}=lm(_),I=R.useMemo(()=>hE(i||[],o||[],a||[]),[i,o,a]),{nodes:B,edges:$}=lE({columnsByModel:M,fieldsByModel:I,layout:"grid",savedPositions:h,layoutVersion:u}),A=R.useMemo(()=>B.map(G=>G.type==="erdModelNode"?{...G,type:"semanticLayerModelNode"}:G),[B]),z=R.useMemo(()=>({semanticLayerModelNode:mE,relationNode:gE}),[]),H=R.useMemo(()=>({relationLinkEdge:EE}),[]),V=R.useCallback((G,K)=>{var oe,se;if((K==null?void 0:K.type)==="relationNode"&&((oe=K.data)!=null&&oe.relationName)){const de=d?d(K.data.relationName):{name:K.data.relationName};f&&f(de);return}(K==null?void 0:K.type)==="semanticLayerModelNode"&&((se=K.data)!=null&&se.name)&&y&&y({type:"model",name:K.data.name})},[d,f,y]),[Y,q]=R.useState([]);R.useEffect(()=>{q(G=>SE(G,A,h))},[A,u]);const L=R.useCallback(G=>q(K=>ap(G,K)),[]),F=R.useCallback((G,K)=>{K&&l&&l(mn,{[K.id]:K.position})},[l]),j=R.useRef(!1);R.useEffect(()=>{P&&!j.current&&Y.length>0&&(j.current=!0,C({padding:.2,maxZoom:1.2}))},[P,Y.length,C]);const W=R.useCallback(()=>{c&&c(mn),setTimeout(()=>C({padding:.2,maxZoom:1.2}),0)},[c,C]),J=R.useCallback((G,K)=>{var se;const oe=G==="metric"?"metrics":"dimensions";for(const[de,ge]of Object.entries(I))if((se=ge[oe])!=null&&se.includes(K))return de;return null},[I]);R.useEffect(()=>{var ge,ye;if(!(E!=null&&E.objectKey)||Y.length===0)return;const G=E.objectKey.indexOf(":"),K=E.objectKey.slice(0,G),oe=E.objectKey.slice(G+1),se=K==="metric"||K==="dimension"?J(K,oe):oe,de=se?Y.find(we=>we.id===xn(se)):null;if(de){const we=de.width||((ge=de.layoutSize)==null?void 0:ge.width)||260,ze=de.height||((ye=de.layoutSize)==null?void 0:ye.height)||120;O(de.position.x+we/2,de.position.y+ze/2,{zoom:1,duration:400})}k==null||k()},[E,Y,J,O,k]);const ee=Object.keys(h||{}).length>0,ie=R.useRef(null),[ue,ae]=R.useState(null),ne=R.useCallback(G=>{var oe;const K=Y.find(se=>se.id===G);return((oe=K==null?void 0:K.data)==null?void 0:oe.name)||null},[Y]),te=R.useCallback((G,K)=>{ie.current=K},[]),pe=R.useCallback(G=>G.source!==G.target,[]),X=R.useCallback(G=>{const K=ne(G.source),oe=ne(G.target);!K||!oe||K===oe||ae({x:window.innerWidth/2-160,y:120,initialA:{model:K,column:G.sourceHandle||""},initialB:{model:oe,column:G.targetHandle||""}})},[ne]),Z=R.useCallback(G=>{var de,ge,ye;const K=ie.current;if(ie.current=null,!(((ye=(ge=(de=G==null?void 0:G.target)==null?void 0:de.classList)==null?void 0:ge.contains)==null?void 0:ye.call(ge,"react-flow__pane"))??!1)||!K)return;const se=ne(K.nodeId);se&&ae(we=>we||{x:(G.clientX||window.innerWidth/2)+8,y:G.clientY||120,initialA:{model:se,column:K.handleId||""},initialB:{model:"",column:""}})},[ne]),fe=R.useCallback(()=>ae(null),[]),Ie=R.useCallback(()=>{typeof t=="function"&&t()},[t]),ke=A.length>0;return U.jsxs("div",{"data-testid":"semantic-layer-erd",className:"relative flex h-full w-full flex-col",children:[ke?U.jsxs("div",{className:"relative flex flex-1 flex-col",children:[U.jsx("div",{"data-testid":"semantic-layer-erd-toolbar",className:"flex items-center justify-end gap-2 border-b border-gray-100 bg-white px-3 py-1.5",children:U.jsx(NE,{onTidy:W,hasEdits:ee,testId:"semantic-layer-erd-reset-layout"})}),U.jsx("div",{className:"relative flex-1",children:U.jsxs(bp,{nodes:Y,edges:$,nodeTypes:z,edgeTypes:H,nodesDraggable:!0,onNodesChange:L,onNodeDragStop:F,onNodeClick:V,onNodeContextMenu:b,onConnectStart:te,onConnect:X,onConnectEnd:Z,isValidConnection:pe,minZoom:.1,maxZoom:2,fitViewOptions:{padding:.2,maxZoom:1.2},style:{background:"#f8fafc"},children:[U.jsx(y_,{color:"#e2e8f0",gap:16}),U.jsx(l_,{}),U.jsx(n_,{style:{background:"#f1f5f9"}})]})})]}):U.jsx(RE,{}),ue&&U.jsx(_E,{x:ue.x,y:ue.y,models:i||[],initialA:ue.initialA,initialB:ue.initialB,onClose:fe,onSaved:Ie}),v&&U.jsx(hg,{x:v.x,y:v.y,obj:v.obj,onOpen:S,onOpenInNewTab:N,onExploreThis:T,onDismiss:w,testIdPrefix:"semantic-erd-node-ctx"})]})},IE=e=>U.jsx(Vs,{children:U.jsx(qE,{...e})});export{IE as default};
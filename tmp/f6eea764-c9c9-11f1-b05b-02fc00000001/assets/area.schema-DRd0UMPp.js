@@ -0,0 +1 @@
+const e="https://json-schema.org/draft/2020-12/schema",t="https://visivo.io/trace-properties/schema",r="A schema to validate plotly trace properties",o={color:{type:"string",oneOf:[{pattern:"^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})$",description:"Hex color (e.g., #d3d3d3 or #fff)"},{pattern:"^rgb\\(\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*\\)$",description:"RGB color (e.g., rgb(255, 0, 0))"},{pattern:"^rgba\\(\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(0|1|0?\\.\\d+)\\s*\\)$",description:"RGBA color (e.g., rgba(255, 0, 0, 0.5))"},{pattern:"^hsl\\(\\s*\\d{1,3}\\s*,\\s*\\d{1,3}%\\s*,\\s*\\d{1,3}%\\s*\\)$",description:"HSL color (e.g., hsl(0, 100%, 50%))"},{pattern:"^hsv\\(\\s*\\d{1,3}\\s*,\\s*\\d{1,3}%\\s*,\\s*\\d{1,3}%\\s*\\)$",description:"HSV color (e.g., hsv(0, 100%, 100%))"},{pattern:"^(aliceblue|antiquewhite|aqua|aquamarine|azure|beige|bisque|black|blanchedalmond|blue|blueviolet|brown|burlywood|cadetblue|chartreuse|chocolate|coral|cornflowerblue|cornsilk|crimson|cyan|darkblue|darkcyan|darkgoldenrod|darkgray|darkgreen|darkgrey|darkkhaki|darkmagenta|darkolivegreen|darkorange|darkorchid|darkred|darksalmon|darkseagreen|darkslateblue|darkslategray|darkslategrey|darkturquoise|darkviolet|deeppink|deepskyblue|dimgray|dimgrey|dodgerblue|firebrick|floralwhite|forestgreen|fuchsia|gainsboro|ghostwhite|gold|goldenrod|gray|green|greenyellow|grey|honeydew|hotpink|indianred|indigo|ivory|khaki|lavender|lavenderblush|lawngreen|lemonchiffon|lightblue|lightcoral|lightcyan|lightgoldenrodyellow|lightgray|lightgreen|lightgrey|lightpink|lightsalmon|lightseagreen|lightskyblue|lightslategray|lightslategrey|lightsteelblue|lightyellow|lime|limegreen|linen|magenta|maroon|mediumaquamarine|mediumblue|mediumorchid|mediumpurple|mediumseagreen|mediumslateblue|mediumspringgreen|mediumturquoise|mediumvioletred|midnightblue|mintcream|mistyrose|moccasin|navajowhite|navy|oldlace|olive|olivedrab|orange|orangered|orchid|palegoldenrod|palegreen|paleturquoise|palevioletred|papayawhip|peachpuff|peru|pink|plum|powderblue|purple|rebeccapurple|red|rosybrown|royalblue|saddlebrown|salmon|sandybrown|seagreen|seashell|sienna|silver|skyblue|slateblue|slategray|slategrey|snow|springgreen|steelblue|tan|teal|thistle|tomato|turquoise|violet|wheat|white|whitesmoke|yellow|yellowgreen)$",description:"Named CSS color"}]},colorscale:{description:"A Plotly colorscale either by name or a custom array of [value, color] pairs.",oneOf:[{type:"string",enum:["Greys","YlGnBu","Greens","YlOrRd","Bluered","RdBu","Reds","Blues","Picnic","Rainbow","Portland","Jet","Hot","Blackbody","Earth","Electric","Viridis","Cividis"],description:"Predefined Plotly colorscale name"},{type:"array",items:{type:"array",minItems:2,maxItems:2,items:{oneOf:[{type:"number",minimum:0,maximum:1},{$ref:"#/$defs/color"}]}},description:"Custom colorscale as an array of [value, color] pairs"}]},"query-string":{type:"string",description:"A string that will pull the value from the traces query results.",oneOf:[{pattern:"^\\?\\{.*\\}$",description:"String in the format ?{ x } where x can be anything"},{pattern:"^query\\(.*\\)$",description:"String in the format query( x ) where x can be anything"},{pattern:"^column\\(.*\\)(?:\\[\\d+\\])?$",description:"String in the format column( x ) or column( x )[n] where x can be anything and n is a number"}]}},n="object",a=JSON.parse('{"type":{"oneOf":[{"const":"area"},{"$ref":"#/$defs/query-string"}]},"visible":{"oneOf":[{"description":"Determines whether or not this trace is visible. If *legendonly*, the trace is not drawn, but can appear as a legend item (provided that the legend itself is visible).","enum":[true,false,"legendonly"],"default":true},{"$ref":"#/$defs/query-string"}]},"showlegend":{"oneOf":[{"description":"Determines whether or not an item corresponding to this trace is shown in the legend.","type":"boolean","default":true},{"$ref":"#/$defs/query-string"}]},"legendgroup":{"oneOf":[{"description":"Sets the legend group for this trace. Traces part of the same legend group hide/show at the same time when toggling legend items.","type":"string","default":""},{"$ref":"#/$defs/query-string"}]},"opacity":{"oneOf":[{"description":"Sets the opacity of the trace.","type":"number","minimum":0,"maximum":1,"default":1},{"$ref":"#/$defs/query-string"}]},"name":{"oneOf":[{"description":"Sets the trace name. The trace name appear as the legend item and on hover.","type":"string"},{"$ref":"#/$defs/query-string"}]},"uid":{"oneOf":[{"description":"Assign an id to this trace, Use this to provide object constancy between traces during animations and transitions.","type":"string"},{"$ref":"#/$defs/query-string"}]},"ids":{"oneOf":[{"description":"Assigns id labels to each datum. These ids for object constancy of data points during animation. Should be an array of strings, not numbers or any other type.","type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}},{"$ref":"#/$defs/query-string"}]},"customdata":{"oneOf":[{"description":"Assigns extra data each datum. This may be useful when listening to hover, click and selection events. Note that, *scatter* traces also appends customdata items in the markers DOM elements","type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}},{"$ref":"#/$defs/query-string"}]},"hoverinfo":{"description":"Determines which trace information appear on hover. If `none` or `skip` are set, no information is displayed upon hovering. But, if `none` is set, click and hover events are still fired.","oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["all","none","skip"]},{"type":"string","pattern":"^(x|y|z|text|name)(\\\\+(x|y|z|text|name))*$"}],"default":"all"},{"type":"array","items":{"oneOf":[{"type":"string","enum":["all","none","skip"]},{"type":"string","pattern":"^(x|y|z|text|name)(\\\\+(x|y|z|text|name))*$"}],"default":"all"}}]},"hoverlabel":{"type":"object","properties":{"bgcolor":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color","default":"#444"},{"type":"array","items":{"$ref":"#/$defs/color","default":"#444"}}]},"bordercolor":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color","default":"#444"},{"type":"array","items":{"$ref":"#/$defs/color","default":"#444"}}]},"align":{"description":"Sets the horizontal alignment of the text content within hover label box. Has an effect only if the hover label text spans more two or more lines","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["left","right","auto"],"default":"auto"},{"type":"array","items":{"enum":["left","right","auto"],"default":"auto"}}]},"namelength":{"description":"Sets the default length (in number of characters) of the trace name in the hover labels for all traces. -1 shows the whole name regardless of length. 0-3 shows the first 0-3 characters, and an integer >3 will show the whole name if it is less than that many characters, but if it is longer, will truncate to `namelength - 3` characters and add an ellipsis.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":-1,"default":15},{"type":"array","items":{"type":"integer","minimum":-1,"default":15}}]},"bgcolorsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  bgcolor .","type":"string"},{"$ref":"#/$defs/query-string"}]},"bordercolorsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  bordercolor .","type":"string"},{"$ref":"#/$defs/query-string"}]},"alignsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  align .","type":"string"},{"$ref":"#/$defs/query-string"}]},"namelengthsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  namelength .","type":"string"},{"$ref":"#/$defs/query-string"}]}}},"stream":{"type":"object","properties":{"token":{"oneOf":[{"description":"The stream id number links a data trace on a plot with a stream. See https://chart-studio.plotly.com/settings for more details.","type":"string","pattern":".*\\\\S.*$"},{"$ref":"#/$defs/query-string"}]},"maxpoints":{"oneOf":[{"description":"Sets the maximum number of points to keep on the plots from an incoming stream. If `maxpoints` is set to *50*, only the newest 50 points will be displayed on the plot.","type":"number","minimum":0,"maximum":10000,"default":500},{"$ref":"#/$defs/query-string"}]}}},"uirevision":{"description":"Controls persistence of some user-driven changes to the trace: `constraintrange` in `parcoords` traces, as well as some `editable: true` modifications such as `name` and `colorbar.title`. Defaults to `layout.uirevision`. Note that other user-driven trace attribute changes are controlled by `layout` attributes: `trace.visible` is controlled by `layout.legend.uirevision`, `selectedpoints` is controlled by `layout.selectionrevision`, and `colorbar.(x|y)` (accessible with `config: {editable: true}`) is controlled by `layout.editrevision`. Trace changes are tracked by `uid`, which only falls back on trace index if no `uid` is provided. So if your app can add/remove traces before the end of the `data` array, such that the same trace has a different index, you can still preserve user-driven changes if you give each trace a `uid` that stays with it as it moves."},"r":{"oneOf":[{"description":"Area traces are deprecated! Please switch to the *barpolar* trace type. Sets the radial coordinates for legacy polar chart only.","type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}},{"$ref":"#/$defs/query-string"}]},"t":{"oneOf":[{"description":"Area traces are deprecated! Please switch to the *barpolar* trace type. Sets the angular coordinates for legacy polar chart only.","type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}},{"$ref":"#/$defs/query-string"}]},"marker":{"type":"object","properties":{"color":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color","default":"#444"},{"type":"array","items":{"$ref":"#/$defs/color","default":"#444"}}]},"size":{"description":"Area traces are deprecated! Please switch to the *barpolar* trace type. Sets the marker size (in px).","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":6},{"type":"array","items":{"type":"number","minimum":0,"default":6}}]},"symbol":{"description":"Area traces are deprecated! Please switch to the *barpolar* trace type. Sets the marker symbol type. Adding 100 is equivalent to appending *-open* to a symbol name. Adding 200 is equivalent to appending *-dot* to a symbol name. Adding 300 is equivalent to appending *-open-dot* or *dot-open* to a symbol name.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":[0,"0","circle",100,"100","circle-open",200,"200","circle-dot",300,"300","circle-open-dot",1,"1","square",101,"101","square-open",201,"201","square-dot",301,"301","square-open-dot",2,"2","diamond",102,"102","diamond-open",202,"202","diamond-dot",302,"302","diamond-open-dot",3,"3","cross",103,"103","cross-open",203,"203","cross-dot",303,"303","cross-open-dot",4,"4","x",104,"104","x-open",204,"204","x-dot",304,"304","x-open-dot",5,"5","triangle-up",105,"105","triangle-up-open",205,"205","triangle-up-dot",305,"305","triangle-up-open-dot",6,"6","triangle-down",106,"106","triangle-down-open",206,"206","triangle-down-dot",306,"306","triangle-down-open-dot",7,"7","triangle-left",107,"107","triangle-left-open",207,"207","triangle-left-dot",307,"307","triangle-left-open-dot",8,"8","triangle-right",108,"108","triangle-right-open",208,"208","triangle-right-dot",308,"308","triangle-right-open-dot",9,"9","triangle-ne",109,"109","triangle-ne-open",209,"209","triangle-ne-dot",309,"309","triangle-ne-open-dot",10,"10","triangle-se",110,"110","triangle-se-open",210,"210","triangle-se-dot",310,"310","triangle-se-open-dot",11,"11","triangle-sw",111,"111","triangle-sw-open",211,"211","triangle-sw-dot",311,"311","triangle-sw-open-dot",12,"12","triangle-nw",112,"112","triangle-nw-open",212,"212","triangle-nw-dot",312,"312","triangle-nw-open-dot",13,"13","pentagon",113,"113","pentagon-open",213,"213","pentagon-dot",313,"313","pentagon-open-dot",14,"14","hexagon",114,"114","hexagon-open",214,"214","hexagon-dot",314,"314","hexagon-open-dot",15,"15","hexagon2",115,"115","hexagon2-open",215,"215","hexagon2-dot",315,"315","hexagon2-open-dot",16,"16","octagon",116,"116","octagon-open",216,"216","octagon-dot",316,"316","octagon-open-dot",17,"17","star",117,"117","star-open",217,"217","star-dot",317,"317","star-open-dot",18,"18","hexagram",118,"118","hexagram-open",218,"218","hexagram-dot",318,"318","hexagram-open-dot",19,"19","star-triangle-up",119,"119","star-triangle-up-open",219,"219","star-triangle-up-dot",319,"319","star-triangle-up-open-dot",20,"20","star-triangle-down",120,"120","star-triangle-down-open",220,"220","star-triangle-down-dot",320,"320","star-triangle-down-open-dot",21,"21","star-square",121,"121","star-square-open",221,"221","star-square-dot",321,"321","star-square-open-dot",22,"22","star-diamond",122,"122","star-diamond-open",222,"222","star-diamond-dot",322,"322","star-diamond-open-dot",23,"23","diamond-tall",123,"123","diamond-tall-open",223,"223","diamond-tall-dot",323,"323","diamond-tall-open-dot",24,"24","diamond-wide",124,"124","diamond-wide-open",224,"224","diamond-wide-dot",324,"324","diamond-wide-open-dot",25,"25","hourglass",125,"125","hourglass-open",26,"26","bowtie",126,"126","bowtie-open",27,"27","circle-cross",127,"127","circle-cross-open",28,"28","circle-x",128,"128","circle-x-open",29,"29","square-cross",129,"129","square-cross-open",30,"30","square-x",130,"130","square-x-open",31,"31","diamond-cross",131,"131","diamond-cross-open",32,"32","diamond-x",132,"132","diamond-x-open",33,"33","cross-thin",133,"133","cross-thin-open",34,"34","x-thin",134,"134","x-thin-open",35,"35","asterisk",135,"135","asterisk-open",36,"36","hash",136,"136","hash-open",236,"236","hash-dot",336,"336","hash-open-dot",37,"37","y-up",137,"137","y-up-open",38,"38","y-down",138,"138","y-down-open",39,"39","y-left",139,"139","y-left-open",40,"40","y-right",140,"140","y-right-open",41,"41","line-ew",141,"141","line-ew-open",42,"42","line-ns",142,"142","line-ns-open",43,"43","line-ne",143,"143","line-ne-open",44,"44","line-nw",144,"144","line-nw-open",45,"45","arrow-up",145,"145","arrow-up-open",46,"46","arrow-down",146,"146","arrow-down-open",47,"47","arrow-left",147,"147","arrow-left-open",48,"48","arrow-right",148,"148","arrow-right-open",49,"49","arrow-bar-up",149,"149","arrow-bar-up-open",50,"50","arrow-bar-down",150,"150","arrow-bar-down-open",51,"51","arrow-bar-left",151,"151","arrow-bar-left-open",52,"52","arrow-bar-right",152,"152","arrow-bar-right-open"],"default":"circle"},{"type":"array","items":{"enum":[0,"0","circle",100,"100","circle-open",200,"200","circle-dot",300,"300","circle-open-dot",1,"1","square",101,"101","square-open",201,"201","square-dot",301,"301","square-open-dot",2,"2","diamond",102,"102","diamond-open",202,"202","diamond-dot",302,"302","diamond-open-dot",3,"3","cross",103,"103","cross-open",203,"203","cross-dot",303,"303","cross-open-dot",4,"4","x",104,"104","x-open",204,"204","x-dot",304,"304","x-open-dot",5,"5","triangle-up",105,"105","triangle-up-open",205,"205","triangle-up-dot",305,"305","triangle-up-open-dot",6,"6","triangle-down",106,"106","triangle-down-open",206,"206","triangle-down-dot",306,"306","triangle-down-open-dot",7,"7","triangle-left",107,"107","triangle-left-open",207,"207","triangle-left-dot",307,"307","triangle-left-open-dot",8,"8","triangle-right",108,"108","triangle-right-open",208,"208","triangle-right-dot",308,"308","triangle-right-open-dot",9,"9","triangle-ne",109,"109","triangle-ne-open",209,"209","triangle-ne-dot",309,"309","triangle-ne-open-dot",10,"10","triangle-se",110,"110","triangle-se-open",210,"210","triangle-se-dot",310,"310","triangle-se-open-dot",11,"11","triangle-sw",111,"111","triangle-sw-open",211,"211","triangle-sw-dot",311,"311","triangle-sw-open-dot",12,"12","triangle-nw",112,"112","triangle-nw-open",212,"212","triangle-nw-dot",312,"312","triangle-nw-open-dot",13,"13","pentagon",113,"113","pentagon-open",213,"213","pentagon-dot",313,"313","pentagon-open-dot",14,"14","hexagon",114,"114","hexagon-open",214,"214","hexagon-dot",314,"314","hexagon-open-dot",15,"15","hexagon2",115,"115","hexagon2-open",215,"215","hexagon2-dot",315,"315","hexagon2-open-dot",16,"16","octagon",116,"116","octagon-open",216,"216","octagon-dot",316,"316","octagon-open-dot",17,"17","star",117,"117","star-open",217,"217","star-dot",317,"317","star-open-dot",18,"18","hexagram",118,"118","hexagram-open",218,"218","hexagram-dot",318,"318","hexagram-open-dot",19,"19","star-triangle-up",119,"119","star-triangle-up-open",219,"219","star-triangle-up-dot",319,"319","star-triangle-up-open-dot",20,"20","star-triangle-down",120,"120","star-triangle-down-open",220,"220","star-triangle-down-dot",320,"320","star-triangle-down-open-dot",21,"21","star-square",121,"121","star-square-open",221,"221","star-square-dot",321,"321","star-square-open-dot",22,"22","star-diamond",122,"122","star-diamond-open",222,"222","star-diamond-dot",322,"322","star-diamond-open-dot",23,"23","diamond-tall",123,"123","diamond-tall-open",223,"223","diamond-tall-dot",323,"323","diamond-tall-open-dot",24,"24","diamond-wide",124,"124","diamond-wide-open",224,"224","diamond-wide-dot",324,"324","diamond-wide-open-dot",25,"25","hourglass",125,"125","hourglass-open",26,"26","bowtie",126,"126","bowtie-open",27,"27","circle-cross",127,"127","circle-cross-open",28,"28","circle-x",128,"128","circle-x-open",29,"29","square-cross",129,"129","square-cross-open",30,"30","square-x",130,"130","square-x-open",31,"31","diamond-cross",131,"131","diamond-cross-open",32,"32","diamond-x",132,"132","diamond-x-open",33,"33","cross-thin",133,"133","cross-thin-open",34,"34","x-thin",134,"134","x-thin-open",35,"35","asterisk",135,"135","asterisk-open",36,"36","hash",136,"136","hash-open",236,"236","hash-dot",336,"336","hash-open-dot",37,"37","y-up",137,"137","y-up-open",38,"38","y-down",138,"138","y-down-open",39,"39","y-left",139,"139","y-left-open",40,"40","y-right",140,"140","y-right-open",41,"41","line-ew",141,"141","line-ew-open",42,"42","line-ns",142,"142","line-ns-open",43,"43","line-ne",143,"143","line-ne-open",44,"44","line-nw",144,"144","line-nw-open",45,"45","arrow-up",145,"145","arrow-up-open",46,"46","arrow-down",146,"146","arrow-down-open",47,"47","arrow-left",147,"147","arrow-left-open",48,"48","arrow-right",148,"148","arrow-right-open",49,"49","arrow-bar-up",149,"149","arrow-bar-up-open",50,"50","arrow-bar-down",150,"150","arrow-bar-down-open",51,"51","arrow-bar-left",151,"151","arrow-bar-left-open",52,"52","arrow-bar-right",152,"152","arrow-bar-right-open"],"default":"circle"}}]},"opacity":{"description":"Area traces are deprecated! Please switch to the *barpolar* trace type. Sets the marker opacity.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":1},{"type":"array","items":{"type":"number","minimum":0,"maximum":1}}]},"colorsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  color .","type":"string"},{"$ref":"#/$defs/query-string"}]},"sizesrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  size .","type":"string"},{"$ref":"#/$defs/query-string"}]},"symbolsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  symbol .","type":"string"},{"$ref":"#/$defs/query-string"}]},"opacitysrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  opacity .","type":"string"},{"$ref":"#/$defs/query-string"}]}}},"idssrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  ids .","type":"string"},{"$ref":"#/$defs/query-string"}]},"customdatasrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  customdata .","type":"string"},{"$ref":"#/$defs/query-string"}]},"metasrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  meta .","type":"string"},{"$ref":"#/$defs/query-string"}]},"hoverinfosrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  hoverinfo .","type":"string"},{"$ref":"#/$defs/query-string"}]},"rsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  r .","type":"string"},{"$ref":"#/$defs/query-string"}]},"tsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  t .","type":"string"},{"$ref":"#/$defs/query-string"}]}}'),i=["type"],s=!1,d={$schema:e,$id:t,description:r,$defs:o,type:n,properties:a,required:i,additionalProperties:s};export{o as $defs,t as $id,e as $schema,s as additionalProperties,d as default,r as description,a as properties,i as required,n as type};
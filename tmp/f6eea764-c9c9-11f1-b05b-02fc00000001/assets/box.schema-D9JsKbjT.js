@@ -0,0 +1 @@
+const e="https://json-schema.org/draft/2020-12/schema",t="https://visivo.io/trace-properties/schema",r="A schema to validate plotly trace properties",o={color:{type:"string",description:"A valid color in hex, rgb, rgba, hsl, hsv, or named CSS color",oneOf:[{pattern:"^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})$",description:"Hex color (e.g., #d3d3d3 or #fff)"},{pattern:"^rgb\\(\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*\\)$",description:"RGB color (e.g., rgb(255, 0, 0))"},{pattern:"^rgba\\(\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(0|1|0?\\.\\d+)\\s*\\)$",description:"RGBA color (e.g., rgba(255, 0, 0, 0.5))"},{pattern:"^hsl\\(\\s*\\d{1,3}\\s*,\\s*\\d{1,3}%\\s*,\\s*\\d{1,3}%\\s*\\)$",description:"HSL color (e.g., hsl(0, 100%, 50%))"},{pattern:"^hsv\\(\\s*\\d{1,3}\\s*,\\s*\\d{1,3}%\\s*,\\s*\\d{1,3}%\\s*\\)$",description:"HSV color (e.g., hsv(0, 100%, 100%))"},{pattern:"^(aliceblue|antiquewhite|aqua|aquamarine|azure|beige|bisque|black|blanchedalmond|blue|blueviolet|brown|burlywood|cadetblue|chartreuse|chocolate|coral|cornflowerblue|cornsilk|crimson|cyan|darkblue|darkcyan|darkgoldenrod|darkgray|darkgreen|darkgrey|darkkhaki|darkmagenta|darkolivegreen|darkorange|darkorchid|darkred|darksalmon|darkseagreen|darkslateblue|darkslategray|darkslategrey|darkturquoise|darkviolet|deeppink|deepskyblue|dimgray|dimgrey|dodgerblue|firebrick|floralwhite|forestgreen|fuchsia|gainsboro|ghostwhite|gold|goldenrod|gray|green|greenyellow|grey|honeydew|hotpink|indianred|indigo|ivory|khaki|lavender|lavenderblush|lawngreen|lemonchiffon|lightblue|lightcoral|lightcyan|lightgoldenrodyellow|lightgray|lightgreen|lightgrey|lightpink|lightsalmon|lightseagreen|lightskyblue|lightslategray|lightslategrey|lightsteelblue|lightyellow|lime|limegreen|linen|magenta|maroon|mediumaquamarine|mediumblue|mediumorchid|mediumpurple|mediumseagreen|mediumslateblue|mediumspringgreen|mediumturquoise|mediumvioletred|midnightblue|mintcream|mistyrose|moccasin|navajowhite|navy|oldlace|olive|olivedrab|orange|orangered|orchid|palegoldenrod|palegreen|paleturquoise|palevioletred|papayawhip|peachpuff|peru|pink|plum|powderblue|purple|rebeccapurple|red|rosybrown|royalblue|saddlebrown|salmon|sandybrown|seagreen|seashell|sienna|silver|skyblue|slateblue|slategray|slategrey|snow|springgreen|steelblue|tan|teal|thistle|tomato|turquoise|violet|wheat|white|whitesmoke|yellow|yellowgreen)$",description:"Named CSS color"}]},colorscale:{description:"A Plotly colorscale either by name or a custom array of [value, color] pairs.",oneOf:[{type:"string",enum:["Greys","YlGnBu","Greens","YlOrRd","Bluered","RdBu","Reds","Blues","Picnic","Rainbow","Portland","Jet","Hot","Blackbody","Earth","Electric","Viridis","Cividis"],description:"Predefined Plotly colorscale name"},{type:"array",items:{type:"array",minItems:2,maxItems:2,items:{oneOf:[{type:"number",minimum:0,maximum:1},{$ref:"#/$defs/color"}]}},description:"Custom colorscale as an array of [value, color] pairs"}]},"query-string":{type:"string",description:"A string that pulls the value from a model's query results or injects an input value. Supports an optional indexing or slicing suffix that selects a scalar or sub-array from the resolved column at runtime.",oneOf:[{pattern:"^\\?\\{.*\\}(?:\\[(?:-?\\d+|-?\\d*:-?\\d*(?::-?\\d+)?|-?\\d+(?:\\s*,\\s*-?\\d+)+)\\])?$",description:"String in the format ?{ expr }, ?{ expr }[N], ?{ expr }[a:b], ?{ expr }[a:b:c], or ?{ expr }[a,b,c]. The bracket suffix selects a scalar (single index, e.g. [0] or [-1]) or sub-array (slice / multi-index)."},{pattern:"^query\\(.*\\)$",description:"String in the format query( x ) where x can be anything"},{pattern:"^column\\(.*\\)(?:\\[-?\\d+\\])?$",description:"String in the format column( x ) or column( x )[n] where x can be anything and n is a positive or negative number"},{pattern:"^\\$\\{.*\\}$",description:"String in the format ${ x } for input references like ${ref(input).value} or ${input.value}"}]}},n="object",i=JSON.parse('{"type":{"const":"box"},"alignmentgroup":{"default":"","description":"Set several traces linked to the same position axis or matching axes to the same alignmentgroup. This controls whether bars compute their positional range dependently or independently.","type":"string"},"boxmean":{"description":"If *true*, the mean of the box(es)\' underlying distribution is drawn as a dashed line inside the box(es). If *sd* the standard deviation is also drawn. Defaults to *true* when `mean` is set. Defaults to *sd* when `sd` is set Otherwise defaults to *false*.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":[true,"sd",false]}]},"boxpoints":{"description":"If *outliers*, only the sample points lying outside the whiskers are shown If *suspectedoutliers*, the outlier points are shown and points either less than 4*Q1-3*Q3 or greater than 4*Q3-3*Q1 are highlighted (see `outliercolor`) If *all*, all sample points are shown If *false*, only the box(es) are shown with no sample points Defaults to *suspectedoutliers* when `marker.outliercolor` or `marker.line.outliercolor` is set. Defaults to *all* under the q1/median/q3 signature. Otherwise defaults to *outliers*.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["all","outliers","suspectedoutliers",false]}]},"customdata":{"description":"Assigns extra data each datum. This may be useful when listening to hover, click and selection events. Note that, *scatter* traces also appends customdata items in the markers DOM elements","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"customdatasrc":{"description":"Sets the source reference on Chart Studio Cloud for `customdata`.","type":"string"},"dx":{"description":"Sets the x coordinate step for multi-box traces set using q1/median/q3.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"}]},"dy":{"description":"Sets the y coordinate step for multi-box traces set using q1/median/q3.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"}]},"fillcolor":{"description":"Sets the fill color. Defaults to a half-transparent variant of the line color, marker color, or marker line color, whichever is available.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"hoverinfo":{"description":"Determines which trace information appear on hover. If `none` or `skip` are set, no information is displayed upon hovering. But, if `none` is set, click and hover events are still fired.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["all","none","skip"]},{"type":"string","pattern":"^(x|y|z|text|name)(\\\\+(x|y|z|text|name))*$"}],"default":"all"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["all","none","skip"]},{"type":"string","pattern":"^(x|y|z|text|name)(\\\\+(x|y|z|text|name))*$"}],"default":"all"}]}}]},"hoverinfosrc":{"description":"Sets the source reference on Chart Studio Cloud for `hoverinfo`.","type":"string"},"hoverlabel":{"type":"object","properties":{"align":{"description":"Sets the horizontal alignment of the text content within hover label box. Has an effect only if the hover label text spans more two or more lines","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["left","right","auto"],"default":"auto"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["left","right","auto"],"default":"auto"}]}}]},"alignsrc":{"description":"Sets the source reference on Chart Studio Cloud for `align`.","type":"string"},"bgcolor":{"description":"Sets the background color of the hover labels for this trace","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]}}]},"bgcolorsrc":{"description":"Sets the source reference on Chart Studio Cloud for `bgcolor`.","type":"string"},"bordercolor":{"description":"Sets the border color of the hover labels for this trace.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]}}]},"bordercolorsrc":{"description":"Sets the source reference on Chart Studio Cloud for `bordercolor`.","type":"string"},"font":{"type":"object","properties":{"color":{"oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]}}]},"colorsrc":{"description":"Sets the source reference on Chart Studio Cloud for `color`.","type":"string"},"family":{"description":"HTML font family - the typeface that will be applied by the web browser. The web browser can only apply a font if it is available on the system where it runs. Provide multiple font families, separated by commas, to indicate the order in which to apply fonts if they aren\'t available.","oneOf":[{"pattern":".*\\\\S.*$","type":"string"},{"type":"array","items":{"pattern":".*\\\\S.*$","type":"string"}},{"$ref":"#/$defs/query-string"}]},"familysrc":{"description":"Sets the source reference on Chart Studio Cloud for `family`.","type":"string"},"lineposition":{"description":"Sets the kind of decoration line(s) with text, such as an *under*, *over* or *through* as well as combinations e.g. *under+over*, etc.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["none"]},{"type":"string","pattern":"^(under|over|through)(\\\\+(under|over|through))*$"}],"default":"none"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["none"]},{"type":"string","pattern":"^(under|over|through)(\\\\+(under|over|through))*$"}],"default":"none"}]}}]},"linepositionsrc":{"description":"Sets the source reference on Chart Studio Cloud for `lineposition`.","type":"string"},"shadow":{"description":"Sets the shape and color of the shadow behind text. *auto* places minimal shadow and applies contrast text font color. See https://developer.mozilla.org/en-US/docs/Web/CSS/text-shadow for additional options.","oneOf":[{"default":"none","type":"string"},{"type":"array","items":{"default":"none","type":"string"}}]},"shadowsrc":{"description":"Sets the source reference on Chart Studio Cloud for `shadow`.","type":"string"},"size":{"oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":1}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":1}]}}]},"sizesrc":{"description":"Sets the source reference on Chart Studio Cloud for `size`.","type":"string"},"style":{"description":"Sets whether a font should be styled with a normal or italic face from its family.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","italic"],"default":"normal"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","italic"],"default":"normal"}]}}]},"stylesrc":{"description":"Sets the source reference on Chart Studio Cloud for `style`.","type":"string"},"textcase":{"description":"Sets capitalization of text. It can be used to make text appear in all-uppercase or all-lowercase, or with each word capitalized.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","word caps","upper","lower"],"default":"normal"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","word caps","upper","lower"],"default":"normal"}]}}]},"textcasesrc":{"description":"Sets the source reference on Chart Studio Cloud for `textcase`.","type":"string"},"variant":{"description":"Sets the variant of the font.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","small-caps","all-small-caps","all-petite-caps","petite-caps","unicase"],"default":"normal"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","small-caps","all-small-caps","all-petite-caps","petite-caps","unicase"],"default":"normal"}]}}]},"variantsrc":{"description":"Sets the source reference on Chart Studio Cloud for `variant`.","type":"string"},"weight":{"description":"Sets the weight (or boldness) of the font.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"maximum":1000,"default":"normal"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"maximum":1000,"default":"normal"}]}}]},"weightsrc":{"description":"Sets the source reference on Chart Studio Cloud for `weight`.","type":"string"}},"additionalProperties":false},"namelength":{"description":"Sets the default length (in number of characters) of the trace name in the hover labels for all traces. -1 shows the whole name regardless of length. 0-3 shows the first 0-3 characters, and an integer >3 will show the whole name if it is less than that many characters, but if it is longer, will truncate to `namelength - 3` characters and add an ellipsis.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":-1,"default":15}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":-1,"default":15}]}}]},"namelengthsrc":{"description":"Sets the source reference on Chart Studio Cloud for `namelength`.","type":"string"}},"additionalProperties":false},"hoveron":{"description":"Do the hover effects highlight individual boxes  or sample points or both?","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"string","pattern":"^(boxes|points)(\\\\+(boxes|points))*$","default":"boxes+points"}]},"hovertemplate":{"description":"Template string used for rendering the information that appear on hover box. Note that this will override `hoverinfo`. Variables are inserted using %{variable}, for example \\"y: %{y}\\" as well as %{xother}, {%_xother}, {%_xother_}, {%xother_}. When showing info for several points, *xother* will be added to those with different x positions from the first point. An underscore before or after *(x|y)other* will add a space on that side, only when this field is shown. Numbers are formatted using d3-format\'s syntax %{variable:d3-format}, for example \\"Price: %{y:$.2f}\\". https://github.com/d3/d3-format/tree/v1.4.5#d3-format for details on the formatting syntax. Dates are formatted using d3-time-format\'s syntax %{variable|d3-time-format}, for example \\"Day: %{2019-01-01|%A}\\". https://github.com/d3/d3-time-format/tree/v2.2.3#locale_format for details on the date formatting syntax. The variables available in `hovertemplate` are the ones emitted as event data described at this link https://plotly.com/javascript/plotlyjs-events/#event-data. Additionally, every attributes that can be specified per-point (the ones that are `arrayOk: true`) are available.  Anything contained in tag `<extra>` is displayed in the secondary box, for example \\"<extra>{fullData.name}</extra>\\". To hide the secondary box completely, use an empty tag `<extra></extra>`.","oneOf":[{"default":"","type":"string"},{"type":"array","items":{"default":"","type":"string"}}]},"hovertemplatesrc":{"description":"Sets the source reference on Chart Studio Cloud for `hovertemplate`.","type":"string"},"hovertext":{"description":"Same as `text`.","oneOf":[{"default":"","type":"string"},{"type":"array","items":{"default":"","type":"string"}}]},"hovertextsrc":{"description":"Sets the source reference on Chart Studio Cloud for `hovertext`.","type":"string"},"ids":{"description":"Assigns id labels to each datum. These ids for object constancy of data points during animation. Should be an array of strings, not numbers or any other type.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"idssrc":{"description":"Sets the source reference on Chart Studio Cloud for `ids`.","type":"string"},"jitter":{"description":"Sets the amount of jitter in the sample points drawn. If *0*, the sample points align along the distribution axis. If *1*, the sample points are drawn in a random jitter of width equal to the width of the box(es).","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":1}]},"legend":{"description":"Sets the reference to a legend to show this trace in. References to these legends are *legend*, *legend2*, *legend3*, etc. Settings for these legends are set in the layout, under `layout.legend`, `layout.legend2`, etc.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"string","default":"legend","pattern":"^legend([2-9]|[1-9][0-9]+)?$"}]},"legendgroup":{"default":"","description":"Sets the legend group for this trace. Traces and shapes part of the same legend group hide/show at the same time when toggling legend items.","type":"string"},"legendgrouptitle":{"type":"object","properties":{"font":{"type":"object","properties":{"color":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"family":{"pattern":".*\\\\S.*$","description":"HTML font family - the typeface that will be applied by the web browser. The web browser can only apply a font if it is available on the system where it runs. Provide multiple font families, separated by commas, to indicate the order in which to apply fonts if they aren\'t available.","type":"string"},"lineposition":{"description":"Sets the kind of decoration line(s) with text, such as an *under*, *over* or *through* as well as combinations e.g. *under+over*, etc.","oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["none"]},{"type":"string","pattern":"^(under|over|through)(\\\\+(under|over|through))*$"}],"default":"none"}]},"shadow":{"default":"none","description":"Sets the shape and color of the shadow behind text. *auto* places minimal shadow and applies contrast text font color. See https://developer.mozilla.org/en-US/docs/Web/CSS/text-shadow for additional options.","type":"string"},"size":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":1}]},"style":{"description":"Sets whether a font should be styled with a normal or italic face from its family.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","italic"],"default":"normal"}]},"textcase":{"description":"Sets capitalization of text. It can be used to make text appear in all-uppercase or all-lowercase, or with each word capitalized.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","word caps","upper","lower"],"default":"normal"}]},"variant":{"description":"Sets the variant of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","small-caps","all-small-caps","all-petite-caps","petite-caps","unicase"],"default":"normal"}]},"weight":{"description":"Sets the weight (or boldness) of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"maximum":1000,"default":"normal"}]}},"additionalProperties":false},"text":{"default":"","description":"Sets the title of the legend group.","type":"string"}},"additionalProperties":false},"legendrank":{"description":"Sets the legend rank for this trace. Items and groups with smaller ranks are presented on top/left side while with *reversed* `legend.traceorder` they are on bottom/right side. The default legendrank is 1000, so that you can use ranks less than 1000 to place certain items before all unranked items, and ranks greater than 1000 to go after all unranked items. When having unranked or equal rank items shapes would be displayed after traces i.e. according to their order in data and layout.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":1000}]},"legendwidth":{"description":"Sets the width (in px or fraction) of the legend for this trace.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0}]},"line":{"type":"object","properties":{"color":{"description":"Sets the color of line bounding the box(es).","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"width":{"description":"Sets the width (in px) of line bounding the box(es).","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":2}]}},"additionalProperties":false},"lowerfence":{"description":"Sets the lower fence values. There should be as many items as the number of boxes desired. This attribute has effect only under the q1/median/q3 signature. If `lowerfence` is not provided but a sample (in `y` or `x`) is set, we compute the lower as the last sample point below 1.5 times the IQR.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"lowerfencesrc":{"description":"Sets the source reference on Chart Studio Cloud for `lowerfence`.","type":"string"},"marker":{"type":"object","properties":{"angle":{"description":"Sets the marker angle in respect to `angleref`.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":-180,"maximum":180,"default":0}]},"color":{"description":"Sets the marker color. It accepts either a specific color or an array of numbers that are mapped to the colorscale relative to the max and min values of the array or relative to `marker.cmin` and `marker.cmax` if set.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"line":{"type":"object","properties":{"color":{"description":"Sets the marker.line color. It accepts either a specific color or an array of numbers that are mapped to the colorscale relative to the max and min values of the array or relative to `marker.line.cmin` and `marker.line.cmax` if set.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"outliercolor":{"description":"Sets the border line color of the outlier sample points. Defaults to marker.color","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"outlierwidth":{"description":"Sets the border line width (in px) of the outlier sample points.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":1}]},"width":{"description":"Sets the width (in px) of the lines bounding the marker points.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":0}]}},"additionalProperties":false},"opacity":{"description":"Sets the marker opacity.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":1,"default":1}]},"outliercolor":{"description":"Sets the color of the outlier sample points.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"size":{"description":"Sets the marker size (in px).","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":6}]},"symbol":{"description":"Sets the marker symbol type. Adding 100 is equivalent to appending *-open* to a symbol name. Adding 200 is equivalent to appending *-dot* to a symbol name. Adding 300 is equivalent to appending *-open-dot* or *dot-open* to a symbol name.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":[0,"0","circle",100,"100","circle-open",200,"200","circle-dot",300,"300","circle-open-dot",1,"1","square",101,"101","square-open",201,"201","square-dot",301,"301","square-open-dot",2,"2","diamond",102,"102","diamond-open",202,"202","diamond-dot",302,"302","diamond-open-dot",3,"3","cross",103,"103","cross-open",203,"203","cross-dot",303,"303","cross-open-dot",4,"4","x",104,"104","x-open",204,"204","x-dot",304,"304","x-open-dot",5,"5","triangle-up",105,"105","triangle-up-open",205,"205","triangle-up-dot",305,"305","triangle-up-open-dot",6,"6","triangle-down",106,"106","triangle-down-open",206,"206","triangle-down-dot",306,"306","triangle-down-open-dot",7,"7","triangle-left",107,"107","triangle-left-open",207,"207","triangle-left-dot",307,"307","triangle-left-open-dot",8,"8","triangle-right",108,"108","triangle-right-open",208,"208","triangle-right-dot",308,"308","triangle-right-open-dot",9,"9","triangle-ne",109,"109","triangle-ne-open",209,"209","triangle-ne-dot",309,"309","triangle-ne-open-dot",10,"10","triangle-se",110,"110","triangle-se-open",210,"210","triangle-se-dot",310,"310","triangle-se-open-dot",11,"11","triangle-sw",111,"111","triangle-sw-open",211,"211","triangle-sw-dot",311,"311","triangle-sw-open-dot",12,"12","triangle-nw",112,"112","triangle-nw-open",212,"212","triangle-nw-dot",312,"312","triangle-nw-open-dot",13,"13","pentagon",113,"113","pentagon-open",213,"213","pentagon-dot",313,"313","pentagon-open-dot",14,"14","hexagon",114,"114","hexagon-open",214,"214","hexagon-dot",314,"314","hexagon-open-dot",15,"15","hexagon2",115,"115","hexagon2-open",215,"215","hexagon2-dot",315,"315","hexagon2-open-dot",16,"16","octagon",116,"116","octagon-open",216,"216","octagon-dot",316,"316","octagon-open-dot",17,"17","star",117,"117","star-open",217,"217","star-dot",317,"317","star-open-dot",18,"18","hexagram",118,"118","hexagram-open",218,"218","hexagram-dot",318,"318","hexagram-open-dot",19,"19","star-triangle-up",119,"119","star-triangle-up-open",219,"219","star-triangle-up-dot",319,"319","star-triangle-up-open-dot",20,"20","star-triangle-down",120,"120","star-triangle-down-open",220,"220","star-triangle-down-dot",320,"320","star-triangle-down-open-dot",21,"21","star-square",121,"121","star-square-open",221,"221","star-square-dot",321,"321","star-square-open-dot",22,"22","star-diamond",122,"122","star-diamond-open",222,"222","star-diamond-dot",322,"322","star-diamond-open-dot",23,"23","diamond-tall",123,"123","diamond-tall-open",223,"223","diamond-tall-dot",323,"323","diamond-tall-open-dot",24,"24","diamond-wide",124,"124","diamond-wide-open",224,"224","diamond-wide-dot",324,"324","diamond-wide-open-dot",25,"25","hourglass",125,"125","hourglass-open",26,"26","bowtie",126,"126","bowtie-open",27,"27","circle-cross",127,"127","circle-cross-open",28,"28","circle-x",128,"128","circle-x-open",29,"29","square-cross",129,"129","square-cross-open",30,"30","square-x",130,"130","square-x-open",31,"31","diamond-cross",131,"131","diamond-cross-open",32,"32","diamond-x",132,"132","diamond-x-open",33,"33","cross-thin",133,"133","cross-thin-open",34,"34","x-thin",134,"134","x-thin-open",35,"35","asterisk",135,"135","asterisk-open",36,"36","hash",136,"136","hash-open",236,"236","hash-dot",336,"336","hash-open-dot",37,"37","y-up",137,"137","y-up-open",38,"38","y-down",138,"138","y-down-open",39,"39","y-left",139,"139","y-left-open",40,"40","y-right",140,"140","y-right-open",41,"41","line-ew",141,"141","line-ew-open",42,"42","line-ns",142,"142","line-ns-open",43,"43","line-ne",143,"143","line-ne-open",44,"44","line-nw",144,"144","line-nw-open",45,"45","arrow-up",145,"145","arrow-up-open",46,"46","arrow-down",146,"146","arrow-down-open",47,"47","arrow-left",147,"147","arrow-left-open",48,"48","arrow-right",148,"148","arrow-right-open",49,"49","arrow-bar-up",149,"149","arrow-bar-up-open",50,"50","arrow-bar-down",150,"150","arrow-bar-down-open",51,"51","arrow-bar-left",151,"151","arrow-bar-left-open",52,"52","arrow-bar-right",152,"152","arrow-bar-right-open",53,"53","arrow",153,"153","arrow-open",54,"54","arrow-wide",154,"154","arrow-wide-open"],"default":"circle"}]}},"additionalProperties":false},"mean":{"description":"Sets the mean values. There should be as many items as the number of boxes desired. This attribute has effect only under the q1/median/q3 signature. If `mean` is not provided but a sample (in `y` or `x`) is set, we compute the mean for each box using the sample values.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"meansrc":{"description":"Sets the source reference on Chart Studio Cloud for `mean`.","type":"string"},"median":{"description":"Sets the median values. There should be as many items as the number of boxes desired.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"mediansrc":{"description":"Sets the source reference on Chart Studio Cloud for `median`.","type":"string"},"metasrc":{"description":"Sets the source reference on Chart Studio Cloud for `meta`.","type":"string"},"name":{"description":"Sets the trace name. The trace name appears as the legend item and on hover. For box traces, the name will also be used for the position coordinate, if `x` and `x0` (`y` and `y0` if horizontal) are missing and the position axis is categorical","type":"string"},"notched":{"description":"Determines whether or not notches are drawn. Notches displays a confidence interval around the median. We compute the confidence interval as median +/- 1.57 * IQR / sqrt(N), where IQR is the interquartile range and N is the sample size. If two boxes\' notches do not overlap there is 95% confidence their medians differ. See https://sites.google.com/site/davidsstatistics/home/notched-box-plots for more info. Defaults to *false* unless `notchwidth` or `notchspan` is set.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean"}]},"notchspan":{"description":"Sets the notch span from the boxes\' `median` values. There should be as many items as the number of boxes desired. This attribute has effect only under the q1/median/q3 signature. If `notchspan` is not provided but a sample (in `y` or `x`) is set, we compute it as 1.57 * IQR / sqrt(N), where N is the sample size.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"notchspansrc":{"description":"Sets the source reference on Chart Studio Cloud for `notchspan`.","type":"string"},"notchwidth":{"description":"Sets the width of the notches relative to the box\' width. For example, with 0, the notches are as wide as the box(es).","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":0.5,"default":0.25}]},"offsetgroup":{"default":"","description":"Set several traces linked to the same position axis or matching axes to the same offsetgroup where bars of the same position coordinate will line up.","type":"string"},"opacity":{"description":"Sets the opacity of the trace.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":1,"default":1}]},"orientation":{"description":"Sets the orientation of the box(es). If *v* (*h*), the distribution is visualized along the vertical (horizontal).","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["v","h"]}]},"pointpos":{"description":"Sets the position of the sample points in relation to the box(es). If *0*, the sample points are places over the center of the box(es). Positive (negative) values correspond to positions to the right (left) for vertical boxes and above (below) for horizontal boxes","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":-2,"maximum":2}]},"q1":{"description":"Sets the Quartile 1 values. There should be as many items as the number of boxes desired.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"q1src":{"description":"Sets the source reference on Chart Studio Cloud for `q1`.","type":"string"},"q3":{"description":"Sets the Quartile 3 values. There should be as many items as the number of boxes desired.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"q3src":{"description":"Sets the source reference on Chart Studio Cloud for `q3`.","type":"string"},"quartilemethod":{"description":"Sets the method used to compute the sample\'s Q1 and Q3 quartiles. The *linear* method uses the 25th percentile for Q1 and 75th percentile for Q3 as computed using method #10 (listed on http://jse.amstat.org/v14n3/langford.html). The *exclusive* method uses the median to divide the ordered dataset into two halves if the sample is odd, it does not include the median in either half - Q1 is then the median of the lower half and Q3 the median of the upper half. The *inclusive* method also uses the median to divide the ordered dataset into two halves but if the sample is odd, it includes the median in both halves - Q1 is then the median of the lower half and Q3 the median of the upper half.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["linear","exclusive","inclusive"],"default":"linear"}]},"sd":{"description":"Sets the standard deviation values. There should be as many items as the number of boxes desired. This attribute has effect only under the q1/median/q3 signature. If `sd` is not provided but a sample (in `y` or `x`) is set, we compute the standard deviation for each box using the sample values.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"sdmultiple":{"description":"Scales the box size when sizemode=sd Allowing boxes to be drawn across any stddev range For example 1-stddev, 3-stddev, 5-stddev","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":1}]},"sdsrc":{"description":"Sets the source reference on Chart Studio Cloud for `sd`.","type":"string"},"selected":{"type":"object","properties":{"marker":{"type":"object","properties":{"color":{"description":"Sets the marker color of selected points.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"opacity":{"description":"Sets the marker opacity of selected points.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":1}]},"size":{"description":"Sets the marker size of selected points.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0}]}},"additionalProperties":false}},"additionalProperties":false},"selectedpoints":{"description":"Array containing integer indices of selected points. Has an effect only for traces that support selections. Note that an empty array means an empty selection where the `unselected` are turned on for all points, whereas, any other non-array values means no selection all where the `selected` and `unselected` styles have no effect."},"showlegend":{"description":"Determines whether or not an item corresponding to this trace is shown in the legend.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean","default":true}]},"showwhiskers":{"description":"Determines whether or not whiskers are visible. Defaults to true for `sizemode` *quartiles*, false for *sd*.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean"}]},"sizemode":{"description":"Sets the upper and lower bound for the boxes quartiles means box is drawn between Q1 and Q3 SD means the box is drawn between Mean +- Standard Deviation Argument sdmultiple (default 1) to scale the box size So it could be drawn 1-stddev, 3-stddev etc","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["quartiles","sd"],"default":"quartiles"}]},"stream":{"type":"object","properties":{"maxpoints":{"description":"Sets the maximum number of points to keep on the plots from an incoming stream. If `maxpoints` is set to *50*, only the newest 50 points will be displayed on the plot.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":10000,"default":500}]},"token":{"pattern":".*\\\\S.*$","description":"The stream id number links a data trace on a plot with a stream. See https://chart-studio.plotly.com/settings for more details.","type":"string"}},"additionalProperties":false},"text":{"description":"Sets the text elements associated with each sample value. If a single string, the same string appears over all the data points. If an array of string, the items are mapped in order to the this trace\'s (x,y) coordinates. To be seen, trace `hoverinfo` must contain a *text* flag.","oneOf":[{"default":"","type":"string"},{"type":"array","items":{"default":"","type":"string"}}]},"textsrc":{"description":"Sets the source reference on Chart Studio Cloud for `text`.","type":"string"},"uid":{"description":"Assign an id to this trace, Use this to provide object constancy between traces during animations and transitions.","type":"string"},"uirevision":{"description":"Controls persistence of some user-driven changes to the trace: `constraintrange` in `parcoords` traces, as well as some `editable: true` modifications such as `name` and `colorbar.title`. Defaults to `layout.uirevision`. Note that other user-driven trace attribute changes are controlled by `layout` attributes: `trace.visible` is controlled by `layout.legend.uirevision`, `selectedpoints` is controlled by `layout.selectionrevision`, and `colorbar.(x|y)` (accessible with `config: {editable: true}`) is controlled by `layout.editrevision`. Trace changes are tracked by `uid`, which only falls back on trace index if no `uid` is provided. So if your app can add/remove traces before the end of the `data` array, such that the same trace has a different index, you can still preserve user-driven changes if you give each trace a `uid` that stays with it as it moves."},"unselected":{"type":"object","properties":{"marker":{"type":"object","properties":{"color":{"description":"Sets the marker color of unselected points, applied only when a selection exists.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"opacity":{"description":"Sets the marker opacity of unselected points, applied only when a selection exists.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":1}]},"size":{"description":"Sets the marker size of unselected points, applied only when a selection exists.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0}]}},"additionalProperties":false}},"additionalProperties":false},"upperfence":{"description":"Sets the upper fence values. There should be as many items as the number of boxes desired. This attribute has effect only under the q1/median/q3 signature. If `upperfence` is not provided but a sample (in `y` or `x`) is set, we compute the upper as the last sample point above 1.5 times the IQR.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"upperfencesrc":{"description":"Sets the source reference on Chart Studio Cloud for `upperfence`.","type":"string"},"visible":{"description":"Determines whether or not this trace is visible. If *legendonly*, the trace is not drawn, but can appear as a legend item (provided that the legend itself is visible).","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":[true,false,"legendonly"],"default":true}]},"whiskerwidth":{"description":"Sets the width of the whiskers relative to the box\' width. For example, with 1, the whiskers are as wide as the box(es).","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":1,"default":0.5}]},"width":{"description":"Sets the width of the box in data coordinate If *0* (default value) the width is automatically selected based on the positions of other box traces in the same subplot.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":0}]},"x":{"description":"Sets the x sample data or coordinates. See overview for more info.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"x0":{"description":"Sets the x coordinate for single-box traces or the starting coordinate for multi-box traces set using q1/median/q3. See overview for more info."},"xaxis":{"description":"Sets a reference between this trace\'s x coordinates and a 2D cartesian x axis. If *x* (the default value), the x coordinates refer to `layout.xaxis`. If *x2*, the x coordinates refer to `layout.xaxis2`, and so on.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"string","default":"x","pattern":"^x([2-9]|[1-9][0-9]+)?$"}]},"xcalendar":{"description":"Sets the calendar system to use with `x` date data.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["chinese","coptic","discworld","ethiopian","gregorian","hebrew","islamic","jalali","julian","mayan","nanakshahi","nepali","persian","taiwan","thai","ummalqura"],"default":"gregorian"}]},"xhoverformat":{"default":"","description":"Sets the hover text formatting rulefor `x`  using d3 formatting mini-languages which are very similar to those in Python. For numbers, see: https://github.com/d3/d3-format/tree/v1.4.5#d3-format. And for dates see: https://github.com/d3/d3-time-format/tree/v2.2.3#locale_format. We add two items to d3\'s date formatter: *%h* for half of the year as a decimal number as well as *%{n}f* for fractional seconds with n digits. For example, *2016-10-13 09:15:23.456* with tickformat *%H~%M~%S.%2f* would display *09~15~23.46*By default the values are formatted using `xaxis.hoverformat`.","type":"string"},"xperiod":{"default":0,"description":"Only relevant when the axis `type` is *date*. Sets the period positioning in milliseconds or *M<n>* on the x axis. Special values in the form of *M<n>* could be used to declare the number of months. In this case `n` must be a positive integer."},"xperiod0":{"description":"Only relevant when the axis `type` is *date*. Sets the base for period positioning in milliseconds or date string on the x0 axis. When `x0period` is round number of weeks, the `x0period0` by default would be on a Sunday i.e. 2000-01-02, otherwise it would be at 2000-01-01."},"xperiodalignment":{"description":"Only relevant when the axis `type` is *date*. Sets the alignment of data points on the x axis.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["start","middle","end"],"default":"middle"}]},"xsrc":{"description":"Sets the source reference on Chart Studio Cloud for `x`.","type":"string"},"y":{"description":"Sets the y sample data or coordinates. See overview for more info.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"y0":{"description":"Sets the y coordinate for single-box traces or the starting coordinate for multi-box traces set using q1/median/q3. See overview for more info."},"yaxis":{"description":"Sets a reference between this trace\'s y coordinates and a 2D cartesian y axis. If *y* (the default value), the y coordinates refer to `layout.yaxis`. If *y2*, the y coordinates refer to `layout.yaxis2`, and so on.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"string","default":"y","pattern":"^y([2-9]|[1-9][0-9]+)?$"}]},"ycalendar":{"description":"Sets the calendar system to use with `y` date data.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["chinese","coptic","discworld","ethiopian","gregorian","hebrew","islamic","jalali","julian","mayan","nanakshahi","nepali","persian","taiwan","thai","ummalqura"],"default":"gregorian"}]},"yhoverformat":{"default":"","description":"Sets the hover text formatting rulefor `y`  using d3 formatting mini-languages which are very similar to those in Python. For numbers, see: https://github.com/d3/d3-format/tree/v1.4.5#d3-format. And for dates see: https://github.com/d3/d3-time-format/tree/v2.2.3#locale_format. We add two items to d3\'s date formatter: *%h* for half of the year as a decimal number as well as *%{n}f* for fractional seconds with n digits. For example, *2016-10-13 09:15:23.456* with tickformat *%H~%M~%S.%2f* would display *09~15~23.46*By default the values are formatted using `yaxis.hoverformat`.","type":"string"},"yperiod":{"default":0,"description":"Only relevant when the axis `type` is *date*. Sets the period positioning in milliseconds or *M<n>* on the y axis. Special values in the form of *M<n>* could be used to declare the number of months. In this case `n` must be a positive integer."},"yperiod0":{"description":"Only relevant when the axis `type` is *date*. Sets the base for period positioning in milliseconds or date string on the y0 axis. When `y0period` is round number of weeks, the `y0period0` by default would be on a Sunday i.e. 2000-01-02, otherwise it would be at 2000-01-01."},"yperiodalignment":{"description":"Only relevant when the axis `type` is *date*. Sets the alignment of data points on the y axis.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["start","middle","end"],"default":"middle"}]},"ysrc":{"description":"Sets the source reference on Chart Studio Cloud for `y`.","type":"string"},"zorder":{"description":"Sets the layer on which this trace is displayed, relative to other SVG traces on the same subplot. SVG traces with higher `zorder` appear in front of those with lower `zorder`.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","default":0}]}}'),s=["type"],a=!1,d={$schema:e,$id:t,description:r,$defs:o,type:n,properties:i,required:s,additionalProperties:a};export{o as $defs,t as $id,e as $schema,a as additionalProperties,d as default,r as description,i as properties,s as required,n as type};
@@ -0,0 +1 @@
+const e="https://json-schema.org/draft/2020-12/schema",t="https://visivo.io/trace-properties/schema",r="A schema to validate plotly trace properties",o={color:{type:"string",description:"A valid color in hex, rgb, rgba, hsl, hsv, or named CSS color",oneOf:[{pattern:"^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})$",description:"Hex color (e.g., #d3d3d3 or #fff)"},{pattern:"^rgb\\(\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*\\)$",description:"RGB color (e.g., rgb(255, 0, 0))"},{pattern:"^rgba\\(\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(0|1|0?\\.\\d+)\\s*\\)$",description:"RGBA color (e.g., rgba(255, 0, 0, 0.5))"},{pattern:"^hsl\\(\\s*\\d{1,3}\\s*,\\s*\\d{1,3}%\\s*,\\s*\\d{1,3}%\\s*\\)$",description:"HSL color (e.g., hsl(0, 100%, 50%))"},{pattern:"^hsv\\(\\s*\\d{1,3}\\s*,\\s*\\d{1,3}%\\s*,\\s*\\d{1,3}%\\s*\\)$",description:"HSV color (e.g., hsv(0, 100%, 100%))"},{pattern:"^(aliceblue|antiquewhite|aqua|aquamarine|azure|beige|bisque|black|blanchedalmond|blue|blueviolet|brown|burlywood|cadetblue|chartreuse|chocolate|coral|cornflowerblue|cornsilk|crimson|cyan|darkblue|darkcyan|darkgoldenrod|darkgray|darkgreen|darkgrey|darkkhaki|darkmagenta|darkolivegreen|darkorange|darkorchid|darkred|darksalmon|darkseagreen|darkslateblue|darkslategray|darkslategrey|darkturquoise|darkviolet|deeppink|deepskyblue|dimgray|dimgrey|dodgerblue|firebrick|floralwhite|forestgreen|fuchsia|gainsboro|ghostwhite|gold|goldenrod|gray|green|greenyellow|grey|honeydew|hotpink|indianred|indigo|ivory|khaki|lavender|lavenderblush|lawngreen|lemonchiffon|lightblue|lightcoral|lightcyan|lightgoldenrodyellow|lightgray|lightgreen|lightgrey|lightpink|lightsalmon|lightseagreen|lightskyblue|lightslategray|lightslategrey|lightsteelblue|lightyellow|lime|limegreen|linen|magenta|maroon|mediumaquamarine|mediumblue|mediumorchid|mediumpurple|mediumseagreen|mediumslateblue|mediumspringgreen|mediumturquoise|mediumvioletred|midnightblue|mintcream|mistyrose|moccasin|navajowhite|navy|oldlace|olive|olivedrab|orange|orangered|orchid|palegoldenrod|palegreen|paleturquoise|palevioletred|papayawhip|peachpuff|peru|pink|plum|powderblue|purple|rebeccapurple|red|rosybrown|royalblue|saddlebrown|salmon|sandybrown|seagreen|seashell|sienna|silver|skyblue|slateblue|slategray|slategrey|snow|springgreen|steelblue|tan|teal|thistle|tomato|turquoise|violet|wheat|white|whitesmoke|yellow|yellowgreen)$",description:"Named CSS color"}]},colorscale:{description:"A Plotly colorscale either by name or a custom array of [value, color] pairs.",oneOf:[{type:"string",enum:["Greys","YlGnBu","Greens","YlOrRd","Bluered","RdBu","Reds","Blues","Picnic","Rainbow","Portland","Jet","Hot","Blackbody","Earth","Electric","Viridis","Cividis"],description:"Predefined Plotly colorscale name"},{type:"array",items:{type:"array",minItems:2,maxItems:2,items:{oneOf:[{type:"number",minimum:0,maximum:1},{$ref:"#/$defs/color"}]}},description:"Custom colorscale as an array of [value, color] pairs"}]},"query-string":{type:"string",description:"A string that pulls the value from a model's query results or injects an input value. Supports an optional indexing or slicing suffix that selects a scalar or sub-array from the resolved column at runtime.",oneOf:[{pattern:"^\\?\\{.*\\}(?:\\[(?:-?\\d+|-?\\d*:-?\\d*(?::-?\\d+)?|-?\\d+(?:\\s*,\\s*-?\\d+)+)\\])?$",description:"String in the format ?{ expr }, ?{ expr }[N], ?{ expr }[a:b], ?{ expr }[a:b:c], or ?{ expr }[a,b,c]. The bracket suffix selects a scalar (single index, e.g. [0] or [-1]) or sub-array (slice / multi-index)."},{pattern:"^query\\(.*\\)$",description:"String in the format query( x ) where x can be anything"},{pattern:"^column\\(.*\\)(?:\\[-?\\d+\\])?$",description:"String in the format column( x ) or column( x )[n] where x can be anything and n is a positive or negative number"},{pattern:"^\\$\\{.*\\}$",description:"String in the format ${ x } for input references like ${ref(input).value} or ${input.value}"}]}},i="object",n=JSON.parse('{"type":{"const":"candlestick"},"close":{"description":"Sets the close values.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"closesrc":{"description":"Sets the source reference on Chart Studio Cloud for `close`.","type":"string"},"customdata":{"description":"Assigns extra data each datum. This may be useful when listening to hover, click and selection events. Note that, *scatter* traces also appends customdata items in the markers DOM elements","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"customdatasrc":{"description":"Sets the source reference on Chart Studio Cloud for `customdata`.","type":"string"},"decreasing":{"type":"object","properties":{"fillcolor":{"description":"Sets the fill color. Defaults to a half-transparent variant of the line color, marker color, or marker line color, whichever is available.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"line":{"type":"object","properties":{"color":{"description":"Sets the color of line bounding the box(es).","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"width":{"description":"Sets the width (in px) of line bounding the box(es).","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":2}]}},"additionalProperties":false}},"additionalProperties":false},"high":{"description":"Sets the high values.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"highsrc":{"description":"Sets the source reference on Chart Studio Cloud for `high`.","type":"string"},"hoverinfo":{"description":"Determines which trace information appear on hover. If `none` or `skip` are set, no information is displayed upon hovering. But, if `none` is set, click and hover events are still fired.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["all","none","skip"]},{"type":"string","pattern":"^(x|y|z|text|name)(\\\\+(x|y|z|text|name))*$"}],"default":"all"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["all","none","skip"]},{"type":"string","pattern":"^(x|y|z|text|name)(\\\\+(x|y|z|text|name))*$"}],"default":"all"}]}}]},"hoverinfosrc":{"description":"Sets the source reference on Chart Studio Cloud for `hoverinfo`.","type":"string"},"hoverlabel":{"type":"object","properties":{"align":{"description":"Sets the horizontal alignment of the text content within hover label box. Has an effect only if the hover label text spans more two or more lines","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["left","right","auto"],"default":"auto"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["left","right","auto"],"default":"auto"}]}}]},"alignsrc":{"description":"Sets the source reference on Chart Studio Cloud for `align`.","type":"string"},"bgcolor":{"description":"Sets the background color of the hover labels for this trace","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]}}]},"bgcolorsrc":{"description":"Sets the source reference on Chart Studio Cloud for `bgcolor`.","type":"string"},"bordercolor":{"description":"Sets the border color of the hover labels for this trace.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]}}]},"bordercolorsrc":{"description":"Sets the source reference on Chart Studio Cloud for `bordercolor`.","type":"string"},"font":{"type":"object","properties":{"color":{"oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]}}]},"colorsrc":{"description":"Sets the source reference on Chart Studio Cloud for `color`.","type":"string"},"family":{"description":"HTML font family - the typeface that will be applied by the web browser. The web browser can only apply a font if it is available on the system where it runs. Provide multiple font families, separated by commas, to indicate the order in which to apply fonts if they aren\'t available.","oneOf":[{"pattern":".*\\\\S.*$","type":"string"},{"type":"array","items":{"pattern":".*\\\\S.*$","type":"string"}},{"$ref":"#/$defs/query-string"}]},"familysrc":{"description":"Sets the source reference on Chart Studio Cloud for `family`.","type":"string"},"lineposition":{"description":"Sets the kind of decoration line(s) with text, such as an *under*, *over* or *through* as well as combinations e.g. *under+over*, etc.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["none"]},{"type":"string","pattern":"^(under|over|through)(\\\\+(under|over|through))*$"}],"default":"none"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["none"]},{"type":"string","pattern":"^(under|over|through)(\\\\+(under|over|through))*$"}],"default":"none"}]}}]},"linepositionsrc":{"description":"Sets the source reference on Chart Studio Cloud for `lineposition`.","type":"string"},"shadow":{"description":"Sets the shape and color of the shadow behind text. *auto* places minimal shadow and applies contrast text font color. See https://developer.mozilla.org/en-US/docs/Web/CSS/text-shadow for additional options.","oneOf":[{"default":"none","type":"string"},{"type":"array","items":{"default":"none","type":"string"}}]},"shadowsrc":{"description":"Sets the source reference on Chart Studio Cloud for `shadow`.","type":"string"},"size":{"oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":1}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":1}]}}]},"sizesrc":{"description":"Sets the source reference on Chart Studio Cloud for `size`.","type":"string"},"style":{"description":"Sets whether a font should be styled with a normal or italic face from its family.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","italic"],"default":"normal"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","italic"],"default":"normal"}]}}]},"stylesrc":{"description":"Sets the source reference on Chart Studio Cloud for `style`.","type":"string"},"textcase":{"description":"Sets capitalization of text. It can be used to make text appear in all-uppercase or all-lowercase, or with each word capitalized.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","word caps","upper","lower"],"default":"normal"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","word caps","upper","lower"],"default":"normal"}]}}]},"textcasesrc":{"description":"Sets the source reference on Chart Studio Cloud for `textcase`.","type":"string"},"variant":{"description":"Sets the variant of the font.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","small-caps","all-small-caps","all-petite-caps","petite-caps","unicase"],"default":"normal"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","small-caps","all-small-caps","all-petite-caps","petite-caps","unicase"],"default":"normal"}]}}]},"variantsrc":{"description":"Sets the source reference on Chart Studio Cloud for `variant`.","type":"string"},"weight":{"description":"Sets the weight (or boldness) of the font.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"maximum":1000,"default":"normal"}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"maximum":1000,"default":"normal"}]}}]},"weightsrc":{"description":"Sets the source reference on Chart Studio Cloud for `weight`.","type":"string"}},"additionalProperties":false},"namelength":{"description":"Sets the default length (in number of characters) of the trace name in the hover labels for all traces. -1 shows the whole name regardless of length. 0-3 shows the first 0-3 characters, and an integer >3 will show the whole name if it is less than that many characters, but if it is longer, will truncate to `namelength - 3` characters and add an ellipsis.","oneOf":[{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":-1,"default":15}]},{"type":"array","items":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":-1,"default":15}]}}]},"namelengthsrc":{"description":"Sets the source reference on Chart Studio Cloud for `namelength`.","type":"string"},"split":{"description":"Show hover information (open, close, high, low) in separate labels.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean","default":false}]}},"additionalProperties":false},"hovertext":{"description":"Same as `text`.","oneOf":[{"default":"","type":"string"},{"type":"array","items":{"default":"","type":"string"}}]},"hovertextsrc":{"description":"Sets the source reference on Chart Studio Cloud for `hovertext`.","type":"string"},"ids":{"description":"Assigns id labels to each datum. These ids for object constancy of data points during animation. Should be an array of strings, not numbers or any other type.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"idssrc":{"description":"Sets the source reference on Chart Studio Cloud for `ids`.","type":"string"},"increasing":{"type":"object","properties":{"fillcolor":{"description":"Sets the fill color. Defaults to a half-transparent variant of the line color, marker color, or marker line color, whichever is available.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"line":{"type":"object","properties":{"color":{"description":"Sets the color of line bounding the box(es).","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"width":{"description":"Sets the width (in px) of line bounding the box(es).","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":2}]}},"additionalProperties":false}},"additionalProperties":false},"legend":{"description":"Sets the reference to a legend to show this trace in. References to these legends are *legend*, *legend2*, *legend3*, etc. Settings for these legends are set in the layout, under `layout.legend`, `layout.legend2`, etc.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"string","default":"legend","pattern":"^legend([2-9]|[1-9][0-9]+)?$"}]},"legendgroup":{"default":"","description":"Sets the legend group for this trace. Traces and shapes part of the same legend group hide/show at the same time when toggling legend items.","type":"string"},"legendgrouptitle":{"type":"object","properties":{"font":{"type":"object","properties":{"color":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"family":{"pattern":".*\\\\S.*$","description":"HTML font family - the typeface that will be applied by the web browser. The web browser can only apply a font if it is available on the system where it runs. Provide multiple font families, separated by commas, to indicate the order in which to apply fonts if they aren\'t available.","type":"string"},"lineposition":{"description":"Sets the kind of decoration line(s) with text, such as an *under*, *over* or *through* as well as combinations e.g. *under+over*, etc.","oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["none"]},{"type":"string","pattern":"^(under|over|through)(\\\\+(under|over|through))*$"}],"default":"none"}]},"shadow":{"default":"none","description":"Sets the shape and color of the shadow behind text. *auto* places minimal shadow and applies contrast text font color. See https://developer.mozilla.org/en-US/docs/Web/CSS/text-shadow for additional options.","type":"string"},"size":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":1}]},"style":{"description":"Sets whether a font should be styled with a normal or italic face from its family.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","italic"],"default":"normal"}]},"textcase":{"description":"Sets capitalization of text. It can be used to make text appear in all-uppercase or all-lowercase, or with each word capitalized.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","word caps","upper","lower"],"default":"normal"}]},"variant":{"description":"Sets the variant of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","small-caps","all-small-caps","all-petite-caps","petite-caps","unicase"],"default":"normal"}]},"weight":{"description":"Sets the weight (or boldness) of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"maximum":1000,"default":"normal"}]}},"additionalProperties":false},"text":{"default":"","description":"Sets the title of the legend group.","type":"string"}},"additionalProperties":false},"legendrank":{"description":"Sets the legend rank for this trace. Items and groups with smaller ranks are presented on top/left side while with *reversed* `legend.traceorder` they are on bottom/right side. The default legendrank is 1000, so that you can use ranks less than 1000 to place certain items before all unranked items, and ranks greater than 1000 to go after all unranked items. When having unranked or equal rank items shapes would be displayed after traces i.e. according to their order in data and layout.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":1000}]},"legendwidth":{"description":"Sets the width (in px or fraction) of the legend for this trace.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0}]},"line":{"type":"object","properties":{"width":{"description":"Sets the width (in px) of line bounding the box(es). Note that this style setting can also be set per direction via `increasing.line.width` and `decreasing.line.width`.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":2}]}},"additionalProperties":false},"low":{"description":"Sets the low values.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"lowsrc":{"description":"Sets the source reference on Chart Studio Cloud for `low`.","type":"string"},"metasrc":{"description":"Sets the source reference on Chart Studio Cloud for `meta`.","type":"string"},"name":{"description":"Sets the trace name. The trace name appears as the legend item and on hover.","type":"string"},"opacity":{"description":"Sets the opacity of the trace.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":1,"default":1}]},"open":{"description":"Sets the open values.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"opensrc":{"description":"Sets the source reference on Chart Studio Cloud for `open`.","type":"string"},"selectedpoints":{"description":"Array containing integer indices of selected points. Has an effect only for traces that support selections. Note that an empty array means an empty selection where the `unselected` are turned on for all points, whereas, any other non-array values means no selection all where the `selected` and `unselected` styles have no effect."},"showlegend":{"description":"Determines whether or not an item corresponding to this trace is shown in the legend.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean","default":true}]},"stream":{"type":"object","properties":{"maxpoints":{"description":"Sets the maximum number of points to keep on the plots from an incoming stream. If `maxpoints` is set to *50*, only the newest 50 points will be displayed on the plot.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":10000,"default":500}]},"token":{"pattern":".*\\\\S.*$","description":"The stream id number links a data trace on a plot with a stream. See https://chart-studio.plotly.com/settings for more details.","type":"string"}},"additionalProperties":false},"text":{"description":"Sets hover text elements associated with each sample point. If a single string, the same string appears over all the data points. If an array of string, the items are mapped in order to this trace\'s sample points.","oneOf":[{"default":"","type":"string"},{"type":"array","items":{"default":"","type":"string"}}]},"textsrc":{"description":"Sets the source reference on Chart Studio Cloud for `text`.","type":"string"},"uid":{"description":"Assign an id to this trace, Use this to provide object constancy between traces during animations and transitions.","type":"string"},"uirevision":{"description":"Controls persistence of some user-driven changes to the trace: `constraintrange` in `parcoords` traces, as well as some `editable: true` modifications such as `name` and `colorbar.title`. Defaults to `layout.uirevision`. Note that other user-driven trace attribute changes are controlled by `layout` attributes: `trace.visible` is controlled by `layout.legend.uirevision`, `selectedpoints` is controlled by `layout.selectionrevision`, and `colorbar.(x|y)` (accessible with `config: {editable: true}`) is controlled by `layout.editrevision`. Trace changes are tracked by `uid`, which only falls back on trace index if no `uid` is provided. So if your app can add/remove traces before the end of the `data` array, such that the same trace has a different index, you can still preserve user-driven changes if you give each trace a `uid` that stays with it as it moves."},"visible":{"description":"Determines whether or not this trace is visible. If *legendonly*, the trace is not drawn, but can appear as a legend item (provided that the legend itself is visible).","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":[true,false,"legendonly"],"default":true}]},"whiskerwidth":{"description":"Sets the width of the whiskers relative to the box\' width. For example, with 1, the whiskers are as wide as the box(es).","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":1,"default":0}]},"x":{"description":"Sets the x coordinates. If absent, linear coordinate will be generated.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"xaxis":{"description":"Sets a reference between this trace\'s x coordinates and a 2D cartesian x axis. If *x* (the default value), the x coordinates refer to `layout.xaxis`. If *x2*, the x coordinates refer to `layout.xaxis2`, and so on.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"string","default":"x","pattern":"^x([2-9]|[1-9][0-9]+)?$"}]},"xcalendar":{"description":"Sets the calendar system to use with `x` date data.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["chinese","coptic","discworld","ethiopian","gregorian","hebrew","islamic","jalali","julian","mayan","nanakshahi","nepali","persian","taiwan","thai","ummalqura"],"default":"gregorian"}]},"xhoverformat":{"default":"","description":"Sets the hover text formatting rulefor `x`  using d3 formatting mini-languages which are very similar to those in Python. For numbers, see: https://github.com/d3/d3-format/tree/v1.4.5#d3-format. And for dates see: https://github.com/d3/d3-time-format/tree/v2.2.3#locale_format. We add two items to d3\'s date formatter: *%h* for half of the year as a decimal number as well as *%{n}f* for fractional seconds with n digits. For example, *2016-10-13 09:15:23.456* with tickformat *%H~%M~%S.%2f* would display *09~15~23.46*By default the values are formatted using `xaxis.hoverformat`.","type":"string"},"xperiod":{"default":0,"description":"Only relevant when the axis `type` is *date*. Sets the period positioning in milliseconds or *M<n>* on the x axis. Special values in the form of *M<n>* could be used to declare the number of months. In this case `n` must be a positive integer."},"xperiod0":{"description":"Only relevant when the axis `type` is *date*. Sets the base for period positioning in milliseconds or date string on the x0 axis. When `x0period` is round number of weeks, the `x0period0` by default would be on a Sunday i.e. 2000-01-02, otherwise it would be at 2000-01-01."},"xperiodalignment":{"description":"Only relevant when the axis `type` is *date*. Sets the alignment of data points on the x axis.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["start","middle","end"],"default":"middle"}]},"xsrc":{"description":"Sets the source reference on Chart Studio Cloud for `x`.","type":"string"},"yaxis":{"description":"Sets a reference between this trace\'s y coordinates and a 2D cartesian y axis. If *y* (the default value), the y coordinates refer to `layout.yaxis`. If *y2*, the y coordinates refer to `layout.yaxis2`, and so on.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"string","default":"y","pattern":"^y([2-9]|[1-9][0-9]+)?$"}]},"yhoverformat":{"default":"","description":"Sets the hover text formatting rulefor `y`  using d3 formatting mini-languages which are very similar to those in Python. For numbers, see: https://github.com/d3/d3-format/tree/v1.4.5#d3-format. And for dates see: https://github.com/d3/d3-time-format/tree/v2.2.3#locale_format. We add two items to d3\'s date formatter: *%h* for half of the year as a decimal number as well as *%{n}f* for fractional seconds with n digits. For example, *2016-10-13 09:15:23.456* with tickformat *%H~%M~%S.%2f* would display *09~15~23.46*By default the values are formatted using `yaxis.hoverformat`.","type":"string"},"zorder":{"description":"Sets the layer on which this trace is displayed, relative to other SVG traces on the same subplot. SVG traces with higher `zorder` appear in front of those with lower `zorder`.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","default":0}]}}'),s=["type"],a=!1,l={$schema:e,$id:t,description:r,$defs:o,type:i,properties:n,required:s,additionalProperties:a};export{o as $defs,t as $id,e as $schema,a as additionalProperties,l as default,r as description,n as properties,s as required,i as type};
@@ -0,0 +1 @@
+const e="https://json-schema.org/draft/2020-12/schema",t="https://visivo.io/trace-properties/schema",i="A schema to validate plotly trace properties",r={color:{type:"string",description:"A valid color in hex, rgb, rgba, hsl, hsv, or named CSS color",oneOf:[{pattern:"^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})$",description:"Hex color (e.g., #d3d3d3 or #fff)"},{pattern:"^rgb\\(\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*\\)$",description:"RGB color (e.g., rgb(255, 0, 0))"},{pattern:"^rgba\\(\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(0|1|0?\\.\\d+)\\s*\\)$",description:"RGBA color (e.g., rgba(255, 0, 0, 0.5))"},{pattern:"^hsl\\(\\s*\\d{1,3}\\s*,\\s*\\d{1,3}%\\s*,\\s*\\d{1,3}%\\s*\\)$",description:"HSL color (e.g., hsl(0, 100%, 50%))"},{pattern:"^hsv\\(\\s*\\d{1,3}\\s*,\\s*\\d{1,3}%\\s*,\\s*\\d{1,3}%\\s*\\)$",description:"HSV color (e.g., hsv(0, 100%, 100%))"},{pattern:"^(aliceblue|antiquewhite|aqua|aquamarine|azure|beige|bisque|black|blanchedalmond|blue|blueviolet|brown|burlywood|cadetblue|chartreuse|chocolate|coral|cornflowerblue|cornsilk|crimson|cyan|darkblue|darkcyan|darkgoldenrod|darkgray|darkgreen|darkgrey|darkkhaki|darkmagenta|darkolivegreen|darkorange|darkorchid|darkred|darksalmon|darkseagreen|darkslateblue|darkslategray|darkslategrey|darkturquoise|darkviolet|deeppink|deepskyblue|dimgray|dimgrey|dodgerblue|firebrick|floralwhite|forestgreen|fuchsia|gainsboro|ghostwhite|gold|goldenrod|gray|green|greenyellow|grey|honeydew|hotpink|indianred|indigo|ivory|khaki|lavender|lavenderblush|lawngreen|lemonchiffon|lightblue|lightcoral|lightcyan|lightgoldenrodyellow|lightgray|lightgreen|lightgrey|lightpink|lightsalmon|lightseagreen|lightskyblue|lightslategray|lightslategrey|lightsteelblue|lightyellow|lime|limegreen|linen|magenta|maroon|mediumaquamarine|mediumblue|mediumorchid|mediumpurple|mediumseagreen|mediumslateblue|mediumspringgreen|mediumturquoise|mediumvioletred|midnightblue|mintcream|mistyrose|moccasin|navajowhite|navy|oldlace|olive|olivedrab|orange|orangered|orchid|palegoldenrod|palegreen|paleturquoise|palevioletred|papayawhip|peachpuff|peru|pink|plum|powderblue|purple|rebeccapurple|red|rosybrown|royalblue|saddlebrown|salmon|sandybrown|seagreen|seashell|sienna|silver|skyblue|slateblue|slategray|slategrey|snow|springgreen|steelblue|tan|teal|thistle|tomato|turquoise|violet|wheat|white|whitesmoke|yellow|yellowgreen)$",description:"Named CSS color"}]},colorscale:{description:"A Plotly colorscale either by name or a custom array of [value, color] pairs.",oneOf:[{type:"string",enum:["Greys","YlGnBu","Greens","YlOrRd","Bluered","RdBu","Reds","Blues","Picnic","Rainbow","Portland","Jet","Hot","Blackbody","Earth","Electric","Viridis","Cividis"],description:"Predefined Plotly colorscale name"},{type:"array",items:{type:"array",minItems:2,maxItems:2,items:{oneOf:[{type:"number",minimum:0,maximum:1},{$ref:"#/$defs/color"}]}},description:"Custom colorscale as an array of [value, color] pairs"}]},"query-string":{type:"string",description:"A string that pulls the value from a model's query results or injects an input value. Supports an optional indexing or slicing suffix that selects a scalar or sub-array from the resolved column at runtime.",oneOf:[{pattern:"^\\?\\{.*\\}(?:\\[(?:-?\\d+|-?\\d*:-?\\d*(?::-?\\d+)?|-?\\d+(?:\\s*,\\s*-?\\d+)+)\\])?$",description:"String in the format ?{ expr }, ?{ expr }[N], ?{ expr }[a:b], ?{ expr }[a:b:c], or ?{ expr }[a,b,c]. The bracket suffix selects a scalar (single index, e.g. [0] or [-1]) or sub-array (slice / multi-index)."},{pattern:"^query\\(.*\\)$",description:"String in the format query( x ) where x can be anything"},{pattern:"^column\\(.*\\)(?:\\[-?\\d+\\])?$",description:"String in the format column( x ) or column( x )[n] where x can be anything and n is a positive or negative number"},{pattern:"^\\$\\{.*\\}$",description:"String in the format ${ x } for input references like ${ref(input).value} or ${input.value}"}]}},n="object",a=JSON.parse('{"type":{"const":"carpet"},"a":{"description":"An array containing values of the first parameter value","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"a0":{"description":"Alternate to `a`. Builds a linear space of a coordinates. Use with `da` where `a0` is the starting coordinate and `da` the step.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":0}]},"aaxis":{"type":"object","properties":{"arraydtick":{"description":"The stride between grid lines along the axis","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"default":1}]},"arraytick0":{"description":"The starting index of grid lines along the axis","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":0,"default":0}]},"autorange":{"description":"Determines whether or not the range of this axis is computed in relation to the input data. See `rangemode` for more info. If `range` is provided, then `autorange` is set to *false*.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":[true,false,"reversed"],"default":true}]},"autotypenumbers":{"description":"Using *strict* a numeric string in trace data is not converted to a number. Using *convert types* a numeric string in trace data may be treated as a number during automatic axis `type` detection. Defaults to layout.autotypenumbers.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["convert types","strict"],"default":"convert types"}]},"categoryarray":{"description":"Sets the order in which categories on this axis appear. Only has an effect if `categoryorder` is set to *array*. Used with `categoryorder`.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"categoryarraysrc":{"description":"Sets the source reference on Chart Studio Cloud for `categoryarray`.","type":"string"},"categoryorder":{"description":"Specifies the ordering logic for the case of categorical variables. By default, plotly uses *trace*, which specifies the order that is present in the data supplied. Set `categoryorder` to *category ascending* or *category descending* if order should be determined by the alphanumerical order of the category names. Set `categoryorder` to *array* to derive the ordering from the attribute `categoryarray`. If a category is not found in the `categoryarray` array, the sorting behavior for that attribute will be identical to the *trace* mode. The unspecified categories will follow the categories in `categoryarray`.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["trace","category ascending","category descending","array"],"default":"trace"}]},"cheatertype":{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["index","value"],"default":"value"}]},"color":{"description":"Sets default for all colors associated with this axis all at once: line, font, tick, and grid colors. Grid color is lightened by blending this with the plot background Individual pieces can override this.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"dtick":{"description":"The stride between grid lines along the axis","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":1}]},"endline":{"description":"Determines whether or not a line is drawn at along the final value of this axis. If *true*, the end line is drawn on top of the grid lines.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean"}]},"endlinecolor":{"description":"Sets the line color of the end line.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"endlinewidth":{"description":"Sets the width (in px) of the end line.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":1}]},"exponentformat":{"description":"Determines a formatting rule for the tick exponents. For example, consider the number 1,000,000,000. If *none*, it appears as 1,000,000,000. If *e*, 1e+9. If *E*, 1E+9. If *power*, 1x10^9 (with 9 in a super script). If *SI*, 1G. If *B*, 1B.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["none","e","E","power","SI","B"],"default":"B"}]},"fixedrange":{"description":"Determines whether or not this axis is zoom-able. If true, then zoom is disabled.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean","default":false}]},"gridcolor":{"description":"Sets the axis line color.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"griddash":{"default":"solid","description":"Sets the dash style of lines. Set to a dash type string (*solid*, *dot*, *dash*, *longdash*, *dashdot*, or *longdashdot*) or a dash length list in px (eg *5px,10px,2px,2px*).","type":"string"},"gridwidth":{"description":"Sets the width (in px) of the axis line.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":1}]},"labelalias":{"default":false,"description":"Replacement text for specific tick or hover labels. For example using {US: \'USA\', CA: \'Canada\'} changes US to USA and CA to Canada. The labels we would have shown must match the keys exactly, after adding any tickprefix or ticksuffix. For negative numbers the minus sign symbol used (U+2212) is wider than the regular ascii dash. That means you need to use −1 instead of -1. labelalias can be used with any axis type, and both keys (if needed) and values (if desired) can include html-like tags or MathJax."},"labelpadding":{"description":"Extra padding between label and the axis","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","default":10}]},"labelprefix":{"description":"Sets a axis label prefix.","type":"string"},"labelsuffix":{"default":"","description":"Sets a axis label suffix.","type":"string"},"linecolor":{"description":"Sets the axis line color.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"linewidth":{"description":"Sets the width (in px) of the axis line.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":1}]},"minexponent":{"description":"Hide SI prefix for 10^n if |n| is below this number","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":3}]},"minorgridcolor":{"description":"Sets the color of the grid lines.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"minorgridcount":{"description":"Sets the number of minor grid ticks per major grid tick","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":0,"default":0}]},"minorgriddash":{"default":"solid","description":"Sets the dash style of lines. Set to a dash type string (*solid*, *dot*, *dash*, *longdash*, *dashdot*, or *longdashdot*) or a dash length list in px (eg *5px,10px,2px,2px*).","type":"string"},"minorgridwidth":{"description":"Sets the width (in px) of the grid lines.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":1}]},"nticks":{"description":"Specifies the maximum number of ticks for the particular axis. The actual number of ticks will be chosen automatically to be less than or equal to `nticks`. Has an effect only if `tickmode` is set to *auto*.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":0,"default":0}]},"range":{"description":"Sets the range of this axis. If the axis `type` is *log*, then you must take the log of your desired range (e.g. to set the range from 1 to 100, set the range from 0 to 2). If the axis `type` is *date*, it should be date strings, like date data, though Date objects and unix milliseconds will be accepted and converted to strings. If the axis `type` is *category*, it should be numbers, using the scale where each category is assigned a serial number from zero in the order it appears.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"array","items":{},"minItems":2,"maxItems":2}]},"rangemode":{"description":"If *normal*, the range is computed in relation to the extrema of the input data. If *tozero*`, the range extends to 0, regardless of the input data If *nonnegative*, the range is non-negative, regardless of the input data.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","tozero","nonnegative"],"default":"normal"}]},"separatethousands":{"description":"If \\"true\\", even 4-digit integers are separated","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean","default":false}]},"showexponent":{"description":"If *all*, all exponents are shown besides their significands. If *first*, only the exponent of the first tick is shown. If *last*, only the exponent of the last tick is shown. If *none*, no exponents appear.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["all","first","last","none"],"default":"all"}]},"showgrid":{"description":"Determines whether or not grid lines are drawn. If *true*, the grid lines are drawn at every tick mark.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean","default":true}]},"showline":{"description":"Determines whether or not a line bounding this axis is drawn.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean","default":false}]},"showticklabels":{"description":"Determines whether axis labels are drawn on the low side, the high side, both, or neither side of the axis.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["start","end","both","none"],"default":"start"}]},"showtickprefix":{"description":"If *all*, all tick labels are displayed with a prefix. If *first*, only the first tick is displayed with a prefix. If *last*, only the last tick is displayed with a suffix. If *none*, tick prefixes are hidden.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["all","first","last","none"],"default":"all"}]},"showticksuffix":{"description":"Same as `showtickprefix` but for tick suffixes.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["all","first","last","none"],"default":"all"}]},"smoothing":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":1.3,"default":1}]},"startline":{"description":"Determines whether or not a line is drawn at along the starting value of this axis. If *true*, the start line is drawn on top of the grid lines.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean"}]},"startlinecolor":{"description":"Sets the line color of the start line.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"startlinewidth":{"description":"Sets the width (in px) of the start line.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":1}]},"tick0":{"description":"The starting index of grid lines along the axis","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":0}]},"tickangle":{"description":"Sets the angle of the tick labels with respect to the horizontal. For example, a `tickangle` of -90 draws the tick labels vertically.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":-180,"maximum":180,"default":"auto"}]},"tickfont":{"type":"object","properties":{"color":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"family":{"pattern":".*\\\\S.*$","description":"HTML font family - the typeface that will be applied by the web browser. The web browser can only apply a font if it is available on the system where it runs. Provide multiple font families, separated by commas, to indicate the order in which to apply fonts if they aren\'t available.","type":"string"},"lineposition":{"description":"Sets the kind of decoration line(s) with text, such as an *under*, *over* or *through* as well as combinations e.g. *under+over*, etc.","oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["none"]},{"type":"string","pattern":"^(under|over|through)(\\\\+(under|over|through))*$"}],"default":"none"}]},"shadow":{"default":"none","description":"Sets the shape and color of the shadow behind text. *auto* places minimal shadow and applies contrast text font color. See https://developer.mozilla.org/en-US/docs/Web/CSS/text-shadow for additional options.","type":"string"},"size":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":1}]},"style":{"description":"Sets whether a font should be styled with a normal or italic face from its family.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","italic"],"default":"normal"}]},"textcase":{"description":"Sets capitalization of text. It can be used to make text appear in all-uppercase or all-lowercase, or with each word capitalized.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","word caps","upper","lower"],"default":"normal"}]},"variant":{"description":"Sets the variant of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","small-caps","all-small-caps","all-petite-caps","petite-caps","unicase"],"default":"normal"}]},"weight":{"description":"Sets the weight (or boldness) of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"maximum":1000,"default":"normal"}]}},"additionalProperties":false},"tickformat":{"default":"","description":"Sets the tick label formatting rule using d3 formatting mini-languages which are very similar to those in Python. For numbers, see: https://github.com/d3/d3-format/tree/v1.4.5#d3-format. And for dates see: https://github.com/d3/d3-time-format/tree/v2.2.3#locale_format. We add two items to d3\'s date formatter: *%h* for half of the year as a decimal number as well as *%{n}f* for fractional seconds with n digits. For example, *2016-10-13 09:15:23.456* with tickformat *%H~%M~%S.%2f* would display *09~15~23.46*","type":"string"},"tickformatstops":{"type":"array","items":{"type":"object","properties":{"dtickrange":{"description":"range [*min*, *max*], where *min*, *max* - dtick values which describe some zoom level, it is possible to omit *min* or *max* value by passing *null*","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"array","items":{},"minItems":2,"maxItems":2}]},"enabled":{"description":"Determines whether or not this stop is used. If `false`, this stop is ignored even within its `dtickrange`.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean","default":true}]},"name":{"description":"When used in a template, named items are created in the output figure in addition to any items the figure already has in this array. You can modify these items in the output figure by making your own item with `templateitemname` matching this `name` alongside your modifications (including `visible: false` or `enabled: false` to hide it). Has no effect outside of a template.","type":"string"},"templateitemname":{"description":"Used to refer to a named item in this array in the template. Named items from the template will be created even without a matching item in the input figure, but you can modify one by making an item with `templateitemname` matching its `name`, alongside your modifications (including `visible: false` or `enabled: false` to hide it). If there is no template or no matching item, this item will be hidden unless you explicitly show it with `visible: true`.","type":"string"},"value":{"default":"","description":"string - dtickformat for described zoom level, the same as *tickformat*","type":"string"}},"additionalProperties":false},"minItems":1},"tickmode":{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["linear","array"],"default":"array"}]},"tickprefix":{"default":"","description":"Sets a tick label prefix.","type":"string"},"ticksuffix":{"default":"","description":"Sets a tick label suffix.","type":"string"},"ticktext":{"description":"Sets the text displayed at the ticks position via `tickvals`. Only has an effect if `tickmode` is set to *array*. Used with `tickvals`.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"ticktextsrc":{"description":"Sets the source reference on Chart Studio Cloud for `ticktext`.","type":"string"},"tickvals":{"description":"Sets the values at which ticks on this axis appear. Only has an effect if `tickmode` is set to *array*. Used with `ticktext`.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"tickvalssrc":{"description":"Sets the source reference on Chart Studio Cloud for `tickvals`.","type":"string"},"title":{"type":"object","properties":{"font":{"type":"object","properties":{"color":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"family":{"pattern":".*\\\\S.*$","description":"HTML font family - the typeface that will be applied by the web browser. The web browser can only apply a font if it is available on the system where it runs. Provide multiple font families, separated by commas, to indicate the order in which to apply fonts if they aren\'t available.","type":"string"},"lineposition":{"description":"Sets the kind of decoration line(s) with text, such as an *under*, *over* or *through* as well as combinations e.g. *under+over*, etc.","oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["none"]},{"type":"string","pattern":"^(under|over|through)(\\\\+(under|over|through))*$"}],"default":"none"}]},"shadow":{"default":"none","description":"Sets the shape and color of the shadow behind text. *auto* places minimal shadow and applies contrast text font color. See https://developer.mozilla.org/en-US/docs/Web/CSS/text-shadow for additional options.","type":"string"},"size":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":1}]},"style":{"description":"Sets whether a font should be styled with a normal or italic face from its family.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","italic"],"default":"normal"}]},"textcase":{"description":"Sets capitalization of text. It can be used to make text appear in all-uppercase or all-lowercase, or with each word capitalized.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","word caps","upper","lower"],"default":"normal"}]},"variant":{"description":"Sets the variant of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","small-caps","all-small-caps","all-petite-caps","petite-caps","unicase"],"default":"normal"}]},"weight":{"description":"Sets the weight (or boldness) of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"maximum":1000,"default":"normal"}]}},"additionalProperties":false},"offset":{"description":"An additional amount by which to offset the title from the tick labels, given in pixels.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":10}]},"text":{"default":"","description":"Sets the title of this axis.","type":"string"}},"additionalProperties":false},"type":{"description":"Sets the axis type. By default, plotly attempts to determined the axis type by looking into the data of the traces that referenced the axis in question.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["-","linear","date","category"],"default":"-"}]}},"additionalProperties":false},"asrc":{"description":"Sets the source reference on Chart Studio Cloud for `a`.","type":"string"},"b":{"description":"A two dimensional array of y coordinates at each carpet point.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"b0":{"description":"Alternate to `b`. Builds a linear space of a coordinates. Use with `db` where `b0` is the starting coordinate and `db` the step.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":0}]},"baxis":{"type":"object","properties":{"arraydtick":{"description":"The stride between grid lines along the axis","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"default":1}]},"arraytick0":{"description":"The starting index of grid lines along the axis","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":0,"default":0}]},"autorange":{"description":"Determines whether or not the range of this axis is computed in relation to the input data. See `rangemode` for more info. If `range` is provided, then `autorange` is set to *false*.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":[true,false,"reversed"],"default":true}]},"autotypenumbers":{"description":"Using *strict* a numeric string in trace data is not converted to a number. Using *convert types* a numeric string in trace data may be treated as a number during automatic axis `type` detection. Defaults to layout.autotypenumbers.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["convert types","strict"],"default":"convert types"}]},"categoryarray":{"description":"Sets the order in which categories on this axis appear. Only has an effect if `categoryorder` is set to *array*. Used with `categoryorder`.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"categoryarraysrc":{"description":"Sets the source reference on Chart Studio Cloud for `categoryarray`.","type":"string"},"categoryorder":{"description":"Specifies the ordering logic for the case of categorical variables. By default, plotly uses *trace*, which specifies the order that is present in the data supplied. Set `categoryorder` to *category ascending* or *category descending* if order should be determined by the alphanumerical order of the category names. Set `categoryorder` to *array* to derive the ordering from the attribute `categoryarray`. If a category is not found in the `categoryarray` array, the sorting behavior for that attribute will be identical to the *trace* mode. The unspecified categories will follow the categories in `categoryarray`.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["trace","category ascending","category descending","array"],"default":"trace"}]},"cheatertype":{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["index","value"],"default":"value"}]},"color":{"description":"Sets default for all colors associated with this axis all at once: line, font, tick, and grid colors. Grid color is lightened by blending this with the plot background Individual pieces can override this.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"dtick":{"description":"The stride between grid lines along the axis","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":1}]},"endline":{"description":"Determines whether or not a line is drawn at along the final value of this axis. If *true*, the end line is drawn on top of the grid lines.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean"}]},"endlinecolor":{"description":"Sets the line color of the end line.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"endlinewidth":{"description":"Sets the width (in px) of the end line.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":1}]},"exponentformat":{"description":"Determines a formatting rule for the tick exponents. For example, consider the number 1,000,000,000. If *none*, it appears as 1,000,000,000. If *e*, 1e+9. If *E*, 1E+9. If *power*, 1x10^9 (with 9 in a super script). If *SI*, 1G. If *B*, 1B.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["none","e","E","power","SI","B"],"default":"B"}]},"fixedrange":{"description":"Determines whether or not this axis is zoom-able. If true, then zoom is disabled.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean","default":false}]},"gridcolor":{"description":"Sets the axis line color.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"griddash":{"default":"solid","description":"Sets the dash style of lines. Set to a dash type string (*solid*, *dot*, *dash*, *longdash*, *dashdot*, or *longdashdot*) or a dash length list in px (eg *5px,10px,2px,2px*).","type":"string"},"gridwidth":{"description":"Sets the width (in px) of the axis line.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":1}]},"labelalias":{"default":false,"description":"Replacement text for specific tick or hover labels. For example using {US: \'USA\', CA: \'Canada\'} changes US to USA and CA to Canada. The labels we would have shown must match the keys exactly, after adding any tickprefix or ticksuffix. For negative numbers the minus sign symbol used (U+2212) is wider than the regular ascii dash. That means you need to use −1 instead of -1. labelalias can be used with any axis type, and both keys (if needed) and values (if desired) can include html-like tags or MathJax."},"labelpadding":{"description":"Extra padding between label and the axis","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","default":10}]},"labelprefix":{"description":"Sets a axis label prefix.","type":"string"},"labelsuffix":{"default":"","description":"Sets a axis label suffix.","type":"string"},"linecolor":{"description":"Sets the axis line color.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"linewidth":{"description":"Sets the width (in px) of the axis line.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":1}]},"minexponent":{"description":"Hide SI prefix for 10^n if |n| is below this number","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":3}]},"minorgridcolor":{"description":"Sets the color of the grid lines.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"minorgridcount":{"description":"Sets the number of minor grid ticks per major grid tick","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":0,"default":0}]},"minorgriddash":{"default":"solid","description":"Sets the dash style of lines. Set to a dash type string (*solid*, *dot*, *dash*, *longdash*, *dashdot*, or *longdashdot*) or a dash length list in px (eg *5px,10px,2px,2px*).","type":"string"},"minorgridwidth":{"description":"Sets the width (in px) of the grid lines.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":1}]},"nticks":{"description":"Specifies the maximum number of ticks for the particular axis. The actual number of ticks will be chosen automatically to be less than or equal to `nticks`. Has an effect only if `tickmode` is set to *auto*.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":0,"default":0}]},"range":{"description":"Sets the range of this axis. If the axis `type` is *log*, then you must take the log of your desired range (e.g. to set the range from 1 to 100, set the range from 0 to 2). If the axis `type` is *date*, it should be date strings, like date data, though Date objects and unix milliseconds will be accepted and converted to strings. If the axis `type` is *category*, it should be numbers, using the scale where each category is assigned a serial number from zero in the order it appears.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"array","items":{},"minItems":2,"maxItems":2}]},"rangemode":{"description":"If *normal*, the range is computed in relation to the extrema of the input data. If *tozero*`, the range extends to 0, regardless of the input data If *nonnegative*, the range is non-negative, regardless of the input data.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","tozero","nonnegative"],"default":"normal"}]},"separatethousands":{"description":"If \\"true\\", even 4-digit integers are separated","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean","default":false}]},"showexponent":{"description":"If *all*, all exponents are shown besides their significands. If *first*, only the exponent of the first tick is shown. If *last*, only the exponent of the last tick is shown. If *none*, no exponents appear.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["all","first","last","none"],"default":"all"}]},"showgrid":{"description":"Determines whether or not grid lines are drawn. If *true*, the grid lines are drawn at every tick mark.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean","default":true}]},"showline":{"description":"Determines whether or not a line bounding this axis is drawn.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean","default":false}]},"showticklabels":{"description":"Determines whether axis labels are drawn on the low side, the high side, both, or neither side of the axis.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["start","end","both","none"],"default":"start"}]},"showtickprefix":{"description":"If *all*, all tick labels are displayed with a prefix. If *first*, only the first tick is displayed with a prefix. If *last*, only the last tick is displayed with a suffix. If *none*, tick prefixes are hidden.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["all","first","last","none"],"default":"all"}]},"showticksuffix":{"description":"Same as `showtickprefix` but for tick suffixes.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["all","first","last","none"],"default":"all"}]},"smoothing":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":1.3,"default":1}]},"startline":{"description":"Determines whether or not a line is drawn at along the starting value of this axis. If *true*, the start line is drawn on top of the grid lines.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean"}]},"startlinecolor":{"description":"Sets the line color of the start line.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"startlinewidth":{"description":"Sets the width (in px) of the start line.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":1}]},"tick0":{"description":"The starting index of grid lines along the axis","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"default":0}]},"tickangle":{"description":"Sets the angle of the tick labels with respect to the horizontal. For example, a `tickangle` of -90 draws the tick labels vertically.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":-180,"maximum":180,"default":"auto"}]},"tickfont":{"type":"object","properties":{"color":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"family":{"pattern":".*\\\\S.*$","description":"HTML font family - the typeface that will be applied by the web browser. The web browser can only apply a font if it is available on the system where it runs. Provide multiple font families, separated by commas, to indicate the order in which to apply fonts if they aren\'t available.","type":"string"},"lineposition":{"description":"Sets the kind of decoration line(s) with text, such as an *under*, *over* or *through* as well as combinations e.g. *under+over*, etc.","oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["none"]},{"type":"string","pattern":"^(under|over|through)(\\\\+(under|over|through))*$"}],"default":"none"}]},"shadow":{"default":"none","description":"Sets the shape and color of the shadow behind text. *auto* places minimal shadow and applies contrast text font color. See https://developer.mozilla.org/en-US/docs/Web/CSS/text-shadow for additional options.","type":"string"},"size":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":1}]},"style":{"description":"Sets whether a font should be styled with a normal or italic face from its family.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","italic"],"default":"normal"}]},"textcase":{"description":"Sets capitalization of text. It can be used to make text appear in all-uppercase or all-lowercase, or with each word capitalized.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","word caps","upper","lower"],"default":"normal"}]},"variant":{"description":"Sets the variant of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","small-caps","all-small-caps","all-petite-caps","petite-caps","unicase"],"default":"normal"}]},"weight":{"description":"Sets the weight (or boldness) of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"maximum":1000,"default":"normal"}]}},"additionalProperties":false},"tickformat":{"default":"","description":"Sets the tick label formatting rule using d3 formatting mini-languages which are very similar to those in Python. For numbers, see: https://github.com/d3/d3-format/tree/v1.4.5#d3-format. And for dates see: https://github.com/d3/d3-time-format/tree/v2.2.3#locale_format. We add two items to d3\'s date formatter: *%h* for half of the year as a decimal number as well as *%{n}f* for fractional seconds with n digits. For example, *2016-10-13 09:15:23.456* with tickformat *%H~%M~%S.%2f* would display *09~15~23.46*","type":"string"},"tickformatstops":{"type":"array","items":{"type":"object","properties":{"dtickrange":{"description":"range [*min*, *max*], where *min*, *max* - dtick values which describe some zoom level, it is possible to omit *min* or *max* value by passing *null*","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"array","items":{},"minItems":2,"maxItems":2}]},"enabled":{"description":"Determines whether or not this stop is used. If `false`, this stop is ignored even within its `dtickrange`.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"boolean","default":true}]},"name":{"description":"When used in a template, named items are created in the output figure in addition to any items the figure already has in this array. You can modify these items in the output figure by making your own item with `templateitemname` matching this `name` alongside your modifications (including `visible: false` or `enabled: false` to hide it). Has no effect outside of a template.","type":"string"},"templateitemname":{"description":"Used to refer to a named item in this array in the template. Named items from the template will be created even without a matching item in the input figure, but you can modify one by making an item with `templateitemname` matching its `name`, alongside your modifications (including `visible: false` or `enabled: false` to hide it). If there is no template or no matching item, this item will be hidden unless you explicitly show it with `visible: true`.","type":"string"},"value":{"default":"","description":"string - dtickformat for described zoom level, the same as *tickformat*","type":"string"}},"additionalProperties":false},"minItems":1},"tickmode":{"oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["linear","array"],"default":"array"}]},"tickprefix":{"default":"","description":"Sets a tick label prefix.","type":"string"},"ticksuffix":{"default":"","description":"Sets a tick label suffix.","type":"string"},"ticktext":{"description":"Sets the text displayed at the ticks position via `tickvals`. Only has an effect if `tickmode` is set to *array*. Used with `tickvals`.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"ticktextsrc":{"description":"Sets the source reference on Chart Studio Cloud for `ticktext`.","type":"string"},"tickvals":{"description":"Sets the values at which ticks on this axis appear. Only has an effect if `tickmode` is set to *array*. Used with `ticktext`.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"tickvalssrc":{"description":"Sets the source reference on Chart Studio Cloud for `tickvals`.","type":"string"},"title":{"type":"object","properties":{"font":{"type":"object","properties":{"color":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"family":{"pattern":".*\\\\S.*$","description":"HTML font family - the typeface that will be applied by the web browser. The web browser can only apply a font if it is available on the system where it runs. Provide multiple font families, separated by commas, to indicate the order in which to apply fonts if they aren\'t available.","type":"string"},"lineposition":{"description":"Sets the kind of decoration line(s) with text, such as an *under*, *over* or *through* as well as combinations e.g. *under+over*, etc.","oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["none"]},{"type":"string","pattern":"^(under|over|through)(\\\\+(under|over|through))*$"}],"default":"none"}]},"shadow":{"default":"none","description":"Sets the shape and color of the shadow behind text. *auto* places minimal shadow and applies contrast text font color. See https://developer.mozilla.org/en-US/docs/Web/CSS/text-shadow for additional options.","type":"string"},"size":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":1}]},"style":{"description":"Sets whether a font should be styled with a normal or italic face from its family.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","italic"],"default":"normal"}]},"textcase":{"description":"Sets capitalization of text. It can be used to make text appear in all-uppercase or all-lowercase, or with each word capitalized.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","word caps","upper","lower"],"default":"normal"}]},"variant":{"description":"Sets the variant of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","small-caps","all-small-caps","all-petite-caps","petite-caps","unicase"],"default":"normal"}]},"weight":{"description":"Sets the weight (or boldness) of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"maximum":1000,"default":"normal"}]}},"additionalProperties":false},"offset":{"description":"An additional amount by which to offset the title from the tick labels, given in pixels.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":10}]},"text":{"default":"","description":"Sets the title of this axis.","type":"string"}},"additionalProperties":false},"type":{"description":"Sets the axis type. By default, plotly attempts to determined the axis type by looking into the data of the traces that referenced the axis in question.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["-","linear","date","category"],"default":"-"}]}},"additionalProperties":false},"bsrc":{"description":"Sets the source reference on Chart Studio Cloud for `b`.","type":"string"},"carpet":{"description":"An identifier for this carpet, so that `scattercarpet` and `contourcarpet` traces can specify a carpet plot on which they lie","type":"string"},"cheaterslope":{"description":"The shift applied to each successive row of data in creating a cheater plot. Only used if `x` is been omitted.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":1}]},"color":{"description":"Sets default for all colors associated with this axis all at once: line, font, tick, and grid colors. Grid color is lightened by blending this with the plot background Individual pieces can override this.","oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"customdata":{"description":"Assigns extra data each datum. This may be useful when listening to hover, click and selection events. Note that, *scatter* traces also appends customdata items in the markers DOM elements","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"customdatasrc":{"description":"Sets the source reference on Chart Studio Cloud for `customdata`.","type":"string"},"da":{"description":"Sets the a coordinate step. See `a0` for more info.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":1}]},"db":{"description":"Sets the b coordinate step. See `b0` for more info.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":1}]},"font":{"type":"object","properties":{"color":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"family":{"default":"\\"Open Sans\\", verdana, arial, sans-serif","pattern":".*\\\\S.*$","description":"HTML font family - the typeface that will be applied by the web browser. The web browser can only apply a font if it is available on the system where it runs. Provide multiple font families, separated by commas, to indicate the order in which to apply fonts if they aren\'t available.","type":"string"},"lineposition":{"description":"Sets the kind of decoration line(s) with text, such as an *under*, *over* or *through* as well as combinations e.g. *under+over*, etc.","oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["none"]},{"type":"string","pattern":"^(under|over|through)(\\\\+(under|over|through))*$"}],"default":"none"}]},"shadow":{"default":"none","description":"Sets the shape and color of the shadow behind text. *auto* places minimal shadow and applies contrast text font color. See https://developer.mozilla.org/en-US/docs/Web/CSS/text-shadow for additional options.","type":"string"},"size":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":1,"default":12}]},"style":{"description":"Sets whether a font should be styled with a normal or italic face from its family.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","italic"],"default":"normal"}]},"textcase":{"description":"Sets capitalization of text. It can be used to make text appear in all-uppercase or all-lowercase, or with each word capitalized.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","word caps","upper","lower"],"default":"normal"}]},"variant":{"description":"Sets the variant of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","small-caps","all-small-caps","all-petite-caps","petite-caps","unicase"],"default":"normal"}]},"weight":{"description":"Sets the weight (or boldness) of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"maximum":1000,"default":"normal"}]}},"additionalProperties":false},"ids":{"description":"Assigns id labels to each datum. These ids for object constancy of data points during animation. Should be an array of strings, not numbers or any other type.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"idssrc":{"description":"Sets the source reference on Chart Studio Cloud for `ids`.","type":"string"},"legend":{"description":"Sets the reference to a legend to show this trace in. References to these legends are *legend*, *legend2*, *legend3*, etc. Settings for these legends are set in the layout, under `layout.legend`, `layout.legend2`, etc.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"string","default":"legend","pattern":"^legend([2-9]|[1-9][0-9]+)?$"}]},"legendgrouptitle":{"type":"object","properties":{"font":{"type":"object","properties":{"color":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color"}]},"family":{"pattern":".*\\\\S.*$","description":"HTML font family - the typeface that will be applied by the web browser. The web browser can only apply a font if it is available on the system where it runs. Provide multiple font families, separated by commas, to indicate the order in which to apply fonts if they aren\'t available.","type":"string"},"lineposition":{"description":"Sets the kind of decoration line(s) with text, such as an *under*, *over* or *through* as well as combinations e.g. *under+over*, etc.","oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["none"]},{"type":"string","pattern":"^(under|over|through)(\\\\+(under|over|through))*$"}],"default":"none"}]},"shadow":{"default":"none","description":"Sets the shape and color of the shadow behind text. *auto* places minimal shadow and applies contrast text font color. See https://developer.mozilla.org/en-US/docs/Web/CSS/text-shadow for additional options.","type":"string"},"size":{"oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":1}]},"style":{"description":"Sets whether a font should be styled with a normal or italic face from its family.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","italic"],"default":"normal"}]},"textcase":{"description":"Sets capitalization of text. It can be used to make text appear in all-uppercase or all-lowercase, or with each word capitalized.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","word caps","upper","lower"],"default":"normal"}]},"variant":{"description":"Sets the variant of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["normal","small-caps","all-small-caps","all-petite-caps","petite-caps","unicase"],"default":"normal"}]},"weight":{"description":"Sets the weight (or boldness) of the font.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":1,"maximum":1000,"default":"normal"}]}},"additionalProperties":false},"text":{"default":"","description":"Sets the title of the legend group.","type":"string"}},"additionalProperties":false},"legendrank":{"description":"Sets the legend rank for this trace. Items and groups with smaller ranks are presented on top/left side while with *reversed* `legend.traceorder` they are on bottom/right side. The default legendrank is 1000, so that you can use ranks less than 1000 to place certain items before all unranked items, and ranks greater than 1000 to go after all unranked items. When having unranked or equal rank items shapes would be displayed after traces i.e. according to their order in data and layout.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","default":1000}]},"legendwidth":{"description":"Sets the width (in px or fraction) of the legend for this trace.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0}]},"metasrc":{"description":"Sets the source reference on Chart Studio Cloud for `meta`.","type":"string"},"name":{"description":"Sets the trace name. The trace name appears as the legend item and on hover.","type":"string"},"opacity":{"description":"Sets the opacity of the trace.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":1,"default":1}]},"stream":{"type":"object","properties":{"maxpoints":{"description":"Sets the maximum number of points to keep on the plots from an incoming stream. If `maxpoints` is set to *50*, only the newest 50 points will be displayed on the plot.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number","minimum":0,"maximum":10000,"default":500}]},"token":{"pattern":".*\\\\S.*$","description":"The stream id number links a data trace on a plot with a stream. See https://chart-studio.plotly.com/settings for more details.","type":"string"}},"additionalProperties":false},"uid":{"description":"Assign an id to this trace, Use this to provide object constancy between traces during animations and transitions.","type":"string"},"uirevision":{"description":"Controls persistence of some user-driven changes to the trace: `constraintrange` in `parcoords` traces, as well as some `editable: true` modifications such as `name` and `colorbar.title`. Defaults to `layout.uirevision`. Note that other user-driven trace attribute changes are controlled by `layout` attributes: `trace.visible` is controlled by `layout.legend.uirevision`, `selectedpoints` is controlled by `layout.selectionrevision`, and `colorbar.(x|y)` (accessible with `config: {editable: true}`) is controlled by `layout.editrevision`. Trace changes are tracked by `uid`, which only falls back on trace index if no `uid` is provided. So if your app can add/remove traces before the end of the `data` array, such that the same trace has a different index, you can still preserve user-driven changes if you give each trace a `uid` that stays with it as it moves."},"visible":{"description":"Determines whether or not this trace is visible. If *legendonly*, the trace is not drawn, but can appear as a legend item (provided that the legend itself is visible).","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":[true,false,"legendonly"],"default":true}]},"x":{"description":"A two dimensional array of x coordinates at each carpet point. If omitted, the plot is a cheater plot and the xaxis is hidden by default.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"xaxis":{"description":"Sets a reference between this trace\'s x coordinates and a 2D cartesian x axis. If *x* (the default value), the x coordinates refer to `layout.xaxis`. If *x2*, the x coordinates refer to `layout.xaxis2`, and so on.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"string","default":"x","pattern":"^x([2-9]|[1-9][0-9]+)?$"}]},"xsrc":{"description":"Sets the source reference on Chart Studio Cloud for `x`.","type":"string"},"y":{"description":"A two dimensional array of y coordinates at each carpet point.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"number"},{"type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}}]},"yaxis":{"description":"Sets a reference between this trace\'s y coordinates and a 2D cartesian y axis. If *y* (the default value), the y coordinates refer to `layout.yaxis`. If *y2*, the y coordinates refer to `layout.yaxis2`, and so on.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"string","default":"y","pattern":"^y([2-9]|[1-9][0-9]+)?$"}]},"ysrc":{"description":"Sets the source reference on Chart Studio Cloud for `y`.","type":"string"},"zorder":{"description":"Sets the layer on which this trace is displayed, relative to other SVG traces on the same subplot. SVG traces with higher `zorder` appear in front of those with lower `zorder`.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","default":0}]}}'),s=["type"],o=!1,d={$schema:e,$id:t,description:i,$defs:r,type:n,properties:a,required:s,additionalProperties:o};export{r as $defs,t as $id,e as $schema,o as additionalProperties,d as default,i as description,a as properties,s as required,n as type};
@@ -0,0 +1,14 @@
+"use strict";var duckdb=(()=>{var ql=Object.create;var Fi=Object.defineProperty;var Xl=Object.getOwnPropertyDescriptor;var Ql=Object.getOwnPropertyNames;var Yl=Object.getPrototypeOf,Jl=Object.prototype.hasOwnProperty;var ya=(c,e)=>(e=Symbol[c])?e:Symbol.for("Symbol."+c);var Kl=(c,e,t)=>e in c?Fi(c,e,{enumerable:!0,configurable:!0,writable:!0,value:t}):c[e]=t;var xi=(c=>typeof require<"u"?require:typeof Proxy<"u"?new Proxy(c,{get:(e,t)=>(typeof require<"u"?require:e)[t]}):c)(function(c){if(typeof require<"u")return require.apply(this,arguments);throw Error('Dynamic require of "'+c+'" is not supported')});var pr=(c,e)=>()=>(e||c((e={exports:{}}).exports,e),e.exports),mr=(c,e)=>{for(var t in e)Fi(c,t,{get:e[t],enumerable:!0})},Io=(c,e,t,r)=>{if(e&&typeof e=="object"||typeof e=="function")for(let n of Ql(e))!Jl.call(c,n)&&n!==t&&Fi(c,n,{get:()=>e[n],enumerable:!(r=Xl(e,n))||r.enumerable});return c};var Bo=(c,e,t)=>(t=c!=null?ql(Yl(c)):{},Io(e||!c||!c.__esModule?Fi(t,"default",{value:c,enumerable:!0}):t,c)),Zl=c=>Io(Fi({},"__esModule",{value:!0}),c);var Qe=(c,e,t)=>(Kl(c,typeof e!="symbol"?e+"":e,t),t);var eu=function(c,e){this[0]=c,this[1]=e};var Pr=c=>{var e=c[ya("asyncIterator")],t=!1,r,n={};return e==null?(e=c[ya("iterator")](),r=a=>n[a]=o=>e[a](o)):(e=e.call(c),r=a=>n[a]=o=>{if(t){if(t=!1,a==="throw")throw o;return o}return t=!0,{done:!1,value:new eu(new Promise(l=>{var u=e[a](o);if(!(u instanceof Object))throw TypeError("Object expected");l(u)}),1)}}),n[ya("iterator")]=()=>n,r("next"),"throw"in e?r("throw"):n.throw=a=>{throw a},"return"in e&&r("return"),n};var ko=pr(()=>{});var Do=pr(()=>{});var Bl=pr(()=>{});var To=pr((DS,jl)=>{"use strict";jl.exports=function(){throw new Error("ws does not work in the browser. Browser clients must use the native WebSocket object")}});var Rl=pr((exports,module)=>{"use strict";var DuckDB=(()=>{var c;var _scriptName=typeof document<"u"?(c=document.currentScript)==null?void 0:c.src:void 0;return typeof __filename<"u"&&(_scriptName=_scriptName||__filename),function(moduleArg={}){var moduleRtn,Module=moduleArg,readyPromiseResolve,readyPromiseReject,readyPromise=new Promise((e,t)=>{readyPromiseResolve=e,readyPromiseReject=t}),ENVIRONMENT_IS_WEB=typeof window=="object",ENVIRONMENT_IS_WORKER=typeof WorkerGlobalScope<"u",ENVIRONMENT_IS_NODE=typeof process=="object"&&typeof process.versions=="object"&&typeof process.versions.node=="string"&&process.type!="renderer",ENVIRONMENT_IS_SHELL=!ENVIRONMENT_IS_WEB&&!ENVIRONMENT_IS_NODE&&!ENVIRONMENT_IS_WORKER,moduleOverrides=Object.assign({},Module),arguments_=[],thisProgram="./this.program",quit_=(e,t)=>{throw t},scriptDirectory="";function locateFile(e){return Module.locateFile?Module.locateFile(e,scriptDirectory):scriptDirectory+e}var readAsync,readBinary;if(ENVIRONMENT_IS_NODE){var fs=ko(),nodePath=Do();scriptDirectory=__dirname+"/",readBinary=e=>{e=isFileURI(e)?new URL(e):nodePath.normalize(e);var t=fs.readFileSync(e);return t},readAsync=(e,t=!0)=>(e=isFileURI(e)?new URL(e):nodePath.normalize(e),new Promise((r,n)=>{fs.readFile(e,t?void 0:"utf8",(a,o)=>{a?n(a):r(t?o.buffer:o)})})),!Module.thisProgram&&process.argv.length>1&&(thisProgram=process.argv[1].replace(/\\/g,"/")),arguments_=process.argv.slice(2),quit_=(e,t)=>{throw process.exitCode=e,t}}else(ENVIRONMENT_IS_WEB||ENVIRONMENT_IS_WORKER)&&(ENVIRONMENT_IS_WORKER?scriptDirectory=self.location.href:typeof document<"u"&&document.currentScript&&(scriptDirectory=document.currentScript.src),_scriptName&&(scriptDirectory=_scriptName),scriptDirectory.startsWith("blob:")?scriptDirectory="":scriptDirectory=scriptDirectory.substr(0,scriptDirectory.replace(/[?#].*/,"").lastIndexOf("/")+1),ENVIRONMENT_IS_WORKER&&(readBinary=e=>{var t=new XMLHttpRequest;return t.open("GET",e,!1),t.responseType="arraybuffer",t.send(null),new Uint8Array(t.response)}),readAsync=e=>fetch(e,{credentials:"same-origin"}).then(t=>t.ok?t.arrayBuffer():Promise.reject(new Error(t.status+" : "+t.url))));var out=Module.print||console.log.bind(console),err=Module.printErr||console.error.bind(console);Object.assign(Module,moduleOverrides),moduleOverrides=null,Module.arguments&&(arguments_=Module.arguments),Module.thisProgram&&(thisProgram=Module.thisProgram);var dynamicLibraries=Module.dynamicLibraries||[],wasmBinary=Module.wasmBinary,wasmMemory,ABORT=!1,EXITSTATUS;function assert(e,t){e||abort(t)}var HEAP,HEAP8,HEAPU8,HEAP16,HEAPU16,HEAP32,HEAPU32,HEAPF32,HEAPF64;function updateMemoryViews(){var e=wasmMemory.buffer;Module.HEAP8=HEAP8=new Int8Array(e),Module.HEAP16=HEAP16=new Int16Array(e),Module.HEAPU8=HEAPU8=new Uint8Array(e),Module.HEAPU16=HEAPU16=new Uint16Array(e),Module.HEAP32=HEAP32=new Int32Array(e),Module.HEAPU32=HEAPU32=new Uint32Array(e),Module.HEAPF32=HEAPF32=new Float32Array(e),Module.HEAPF64=HEAPF64=new Float64Array(e)}if(Module.wasmMemory)wasmMemory=Module.wasmMemory;else{var INITIAL_MEMORY=Module.INITIAL_MEMORY||16777216;wasmMemory=new WebAssembly.Memory({initial:INITIAL_MEMORY/65536,maximum:65536})}updateMemoryViews();var __ATPRERUN__=[],__ATINIT__=[],__ATMAIN__=[],__ATEXIT__=[],__ATPOSTRUN__=[],__RELOC_FUNCS__=[],runtimeInitialized=!1;function preRun(){if(Module.preRun)for(typeof Module.preRun=="function"&&(Module.preRun=[Module.preRun]);Module.preRun.length;)addOnPreRun(Module.preRun.shift());callRuntimeCallbacks(__ATPRERUN__)}function initRuntime(){runtimeInitialized=!0,callRuntimeCallbacks(__RELOC_FUNCS__),!Module.noFSInit&&!FS.initialized&&FS.init(),FS.ignorePermissions=!1,TTY.init(),SOCKFS.root=FS.mount(SOCKFS,{},null),PIPEFS.root=FS.mount(PIPEFS,{},null),callRuntimeCallbacks(__ATINIT__)}function preMain(){callRuntimeCallbacks(__ATMAIN__)}function postRun(){if(Module.postRun)for(typeof Module.postRun=="function"&&(Module.postRun=[Module.postRun]);Module.postRun.length;)addOnPostRun(Module.postRun.shift());callRuntimeCallbacks(__ATPOSTRUN__)}function addOnPreRun(e){__ATPRERUN__.unshift(e)}function addOnInit(e){__ATINIT__.unshift(e)}function addOnPreMain(e){__ATMAIN__.unshift(e)}function addOnExit(e){}function addOnPostRun(e){__ATPOSTRUN__.unshift(e)}var runDependencies=0,runDependencyWatcher=null,dependenciesFulfilled=null;function getUniqueRunDependency(e){return e}function addRunDependency(e){var t;runDependencies++,(t=Module.monitorRunDependencies)==null||t.call(Module,runDependencies)}function removeRunDependency(e){var r;if(runDependencies--,(r=Module.monitorRunDependencies)==null||r.call(Module,runDependencies),runDependencies==0&&(runDependencyWatcher!==null&&(clearInterval(runDependencyWatcher),runDependencyWatcher=null),dependenciesFulfilled)){var t=dependenciesFulfilled;dependenciesFulfilled=null,t()}}function abort(e){var r;(r=Module.onAbort)==null||r.call(Module,e),e="Aborted("+e+")",err(e),ABORT=!0,e+=". Build with -sASSERTIONS for more info.";var t=new WebAssembly.RuntimeError(e);throw readyPromiseReject(t),t}var dataURIPrefix="data:application/octet-stream;base64,",isDataURI=e=>e.startsWith(dataURIPrefix),isFileURI=e=>e.startsWith("file://");function findWasmBinary(){var e="./duckdb-mvp.wasm";return isDataURI(e)?e:locateFile(e)}var wasmBinaryFile;function getBinarySync(e){if(e==wasmBinaryFile&&wasmBinary)return new Uint8Array(wasmBinary);if(readBinary)return readBinary(e);throw"both async and sync fetching of the wasm failed"}function getBinaryPromise(e){return wasmBinary?Promise.resolve().then(()=>getBinarySync(e)):readAsync(e).then(t=>new Uint8Array(t),()=>getBinarySync(e))}function instantiateArrayBuffer(e,t,r){return getBinaryPromise(e).then(n=>WebAssembly.instantiate(n,t)).then(r,n=>{err("failed to asynchronously prepare wasm: ".concat(n)),abort(n)})}function instantiateAsync(e,t,r,n){return!e&&typeof WebAssembly.instantiateStreaming=="function"&&!isDataURI(t)&&!ENVIRONMENT_IS_NODE&&typeof fetch=="function"?fetch(t,{credentials:"same-origin"}).then(a=>{var o=WebAssembly.instantiateStreaming(a,r);return o.then(n,function(l){return err("wasm streaming compile failed: ".concat(l)),err("falling back to ArrayBuffer instantiation"),instantiateArrayBuffer(t,r,n)})}):instantiateArrayBuffer(t,r,n)}function getWasmImports(){return{env:wasmImports,wasi_snapshot_preview1:wasmImports,"GOT.mem":new Proxy(wasmImports,GOTHandler),"GOT.func":new Proxy(wasmImports,GOTHandler)}}function createWasm(){var e=getWasmImports();function t(n,a){wasmExports=n.exports,wasmExports=relocateExports(wasmExports,1024);var o=getDylinkMetadata(a);return o.neededDynlibs&&(dynamicLibraries=o.neededDynlibs.concat(dynamicLibraries)),mergeLibSymbols(wasmExports,"main"),LDSO.init(),loadDylibs(),wasmExports=applySignatureConversions(wasmExports),addOnInit(wasmExports.__wasm_call_ctors),__RELOC_FUNCS__.push(wasmExports.__wasm_apply_data_relocs),removeRunDependency("wasm-instantiate"),wasmExports}addRunDependency("wasm-instantiate");function r(n){t(n.instance,n.module)}if(Module.instantiateWasm)try{return Module.instantiateWasm(e,t)}catch(n){err("Module.instantiateWasm callback failed with error: ".concat(n)),readyPromiseReject(n)}return wasmBinaryFile!=null||(wasmBinaryFile=findWasmBinary()),instantiateAsync(wasmBinary,wasmBinaryFile,e,r).catch(readyPromiseReject),{}}var tempDouble,tempI64,ASM_CONSTS={2428856:(e,t,r,n)=>{var a=UTF8ToString(e);if(typeof XMLHttpRequest>"u")return 0;let o=new XMLHttpRequest;o.open(UTF8ToString(n),a,!1),o.responseType="arraybuffer";for(var l=0,p=t;l<p*2;){var u=HEAP32[r/4+l>>>0],_=HEAP32[r/4+l+1>>>0];try{var d=encodeURI(UTF8ToString(u));d==="Host"&&(d="X-Host-Override"),d==="User-Agent"&&(d="X-user-agent"),d==="Authorization"?o.setRequestHeader(d,UTF8ToString(_)):o.setRequestHeader(d,encodeURI(UTF8ToString(_)))}catch(y){console.warn("Error while performing XMLHttpRequest.setRequestHeader()",y)}l+=2}try{o.send(null)}catch(y){return 0}if(o.status>=400)return 0;for(var f=o.response,p=f.byteLength,m=_malloc(p+4),h=new Uint8Array(f),g=0;g<p;g++)Module.HEAPU8[g+m+4]=h[g];var v=new Uint8Array(4);return v[0]=p%256,p-=v[0],p/=256,v[1]=p%256,p-=v[1],p/=256,v[2]=p%256,p-=v[2],p/=256,v[3]=p%256,p-=v[3],p/=256,Module.HEAPU8.set(v,m),m},2430263:(e,t,r,n,a,o)=>{var l=UTF8ToString(e);if(typeof XMLHttpRequest>"u")return 0;let u=new XMLHttpRequest;u.open(UTF8ToString(n),l,!1),u.responseType="arraybuffer";for(var _=0,v=t;_<v*2;){var d=HEAP32[r/4+_>>>0],f=HEAP32[r/4+_+1>>>0];try{var p=encodeURI(UTF8ToString(d));p==="Host"&&(p="X-Host-Override"),p==="User-Agent"&&(p="X-user-agent"),p==="Authorization"?u.setRequestHeader(p,UTF8ToString(f)):u.setRequestHeader(p,encodeURI(UTF8ToString(f)))}catch(D){console.warn("Error while performing XMLHttpRequest.setRequestHeader()",D)}_+=2}try{for(var m=new Uint8Array(o),h=0;h<o;h++)m[h]=Module.HEAPU8[h+a];u.send(m)}catch(D){return 0}if(u.status>=400)return 0;for(var g=Uint8Array.from(Array.from(u.getResponseHeader("Etag")).map(D=>D.charCodeAt(0))),v=g.byteLength,y=_malloc(v+4),S=new Uint8Array(g),h=0;h<v;h++)Module.HEAPU8[h+y+4]=S[h];var w=new Uint8Array(4);return w[0]=v%256,v-=w[0],v/=256,w[1]=v%256,v-=w[1],v/=256,w[2]=v%256,v-=w[2],v/=256,w[3]=v%256,v-=w[3],v/=256,Module.HEAPU8.set(w,y),y},2431883:(e,t,r,n)=>{var a=UTF8ToString(e);if(typeof XMLHttpRequest>"u")return 0;let o=new XMLHttpRequest;o.open(UTF8ToString(n),a,!1),o.responseType="arraybuffer";for(var l=0,p=t;l<p*2;){var u=HEAP32[r/4+l>>>0],_=HEAP32[r/4+l+1>>>0];try{var d=encodeURI(UTF8ToString(u));d==="Host"&&(d="X-Host-Override"),d==="User-Agent"&&(d="X-user-agent"),d==="Authorization"?o.setRequestHeader(d,UTF8ToString(_)):o.setRequestHeader(d,encodeURI(UTF8ToString(_)))}catch(w){console.warn("Error while performing XMLHttpRequest.setRequestHeader()",w)}l+=2}try{o.send(null)}catch(w){return 0}if(o.status>=400)return 0;for(var f=o.response,p=f.byteLength,m=_malloc(p+8),h=new Uint8Array(f),g=0;g<p;g++)Module.HEAPU8[g+m+8]=h[g];var v=new Uint8Array(4);v[0]=p%256,p-=v[0],p/=256,v[1]=p%256,p-=v[1],p/=256,v[2]=p%256,p-=v[2],p/=256,v[3]=p%256,p-=v[3],p/=256,Module.HEAPU8.set(v,m+4);var y=Uint8Array.from(Array.from(o.getAllResponseHeaders()).map(w=>w.charCodeAt(0)));p=y.byteLength;for(var S=_malloc(p+8),g=0;g<p;g++)Module.HEAPU8[g+S+8]=y[g];return v=new Uint8Array(4),v[0]=p%256,p-=v[0],p/=256,v[1]=p%256,p-=v[1],p/=256,v[2]=p%256,p-=v[2],p/=256,v[3]=p%256,p-=v[3],p/=256,Module.HEAPU8.set(v,S+4),p=S,v=new Uint8Array(4),v[0]=p%256,p-=v[0],p/=256,v[1]=p%256,p-=v[1],p/=256,v[2]=p%256,p-=v[2],p/=256,v[3]=p%256,p-=v[3],p/=256,Module.HEAPU8.set(v,m),m},2434167:(e,t,r,n)=>{var a=UTF8ToString(e);if(typeof XMLHttpRequest>"u")return 0;let o=new XMLHttpRequest;o.open(UTF8ToString(n),a,!1),o.responseType="arraybuffer";for(var l=0,p=t;l<p*2;){var u=HEAP32[r/4+l>>>0],_=HEAP32[r/4+l+1>>>0];try{var d=encodeURI(UTF8ToString(u));d==="Host"&&(d="X-Host-Override"),d==="User-Agent"&&(d="X-user-agent"),d==="Authorization"?o.setRequestHeader(d,UTF8ToString(_)):o.setRequestHeader(d,encodeURI(UTF8ToString(_)))}catch(y){console.warn("Error while performing XMLHttpRequest.setRequestHeader()",y)}l+=2}try{o.send(null)}catch(y){return 0}if(o.status>=400)return 0;for(var f=o.response,p=f.byteLength,m=_malloc(p+4),h=new Uint8Array(f),g=0;g<p;g++)Module.HEAPU8[g+m+4]=h[g];var v=new Uint8Array(4);return v[0]=p%256,p-=v[0],p/=256,v[1]=p%256,p-=v[1],p/=256,v[2]=p%256,p-=v[2],p/=256,v[3]=p%256,p-=v[3],p/=256,Module.HEAPU8.set(v,m),m},2435574:(e,t,r,n,a,o)=>{var l=UTF8ToString(e);if(typeof XMLHttpRequest>"u")return 0;let u=new XMLHttpRequest;u.open(UTF8ToString(n),l,!1),u.responseType="arraybuffer";for(var _=0,v=t;_<v*2;){var d=HEAP32[r/4+_>>>0],f=HEAP32[r/4+_+1>>>0];try{var p=encodeURI(UTF8ToString(d));p==="Host"&&(p="X-Host-Override"),p==="User-Agent"&&(p="X-user-agent"),p==="Authorization"?u.setRequestHeader(p,UTF8ToString(f)):u.setRequestHeader(p,encodeURI(UTF8ToString(f)))}catch(D){console.warn("Error while performing XMLHttpRequest.setRequestHeader()",D)}_+=2}try{for(var m=new Uint8Array(o),h=0;h<o;h++)m[h]=Module.HEAPU8[h+a];u.send(m)}catch(D){return 0}if(u.status>=400)return 0;for(var g=u.response,v=g.byteLength,y=_malloc(v+4),S=new Uint8Array(g),h=0;h<v;h++)Module.HEAPU8[h+y+4]=S[h];var w=new Uint8Array(4);return w[0]=v%256,v-=w[0],v/=256,w[1]=v%256,v-=w[1],v/=256,w[2]=v%256,v-=w[2],v/=256,w[3]=v%256,v-=w[3],v/=256,Module.HEAPU8.set(w,y),y},2437112:(e,t)=>{var r=typeof runtime=="object"&&runtime&&typeof runtime.whereToLoad=="function"&&runtime.whereToLoad?runtime.whereToLoad(UTF8ToString(e)):UTF8ToString(t),n=lengthBytesUTF8(r)+1,a=_malloc(n);return stringToUTF8(r,a,n),a},2437478:(e,t)=>{var r=UTF8ToString(e);if(typeof XMLHttpRequest>"u"){let S=Bl(),w=Do(),D=ko();var n=r.split("/"),a=n.length,o=w.join(S.homedir(),".duckdb/extensions/"+n[a-4]+"/"+n[a-3]+"/"+n[a-2]+"/"),l=w.join(o,n[a-1]);try{if(D.existsSync(o)||D.mkdirSync(o,{recursive:!0}),D.existsSync(l))d=D.readFileSync(l);else{let F=new Int32Array(new SharedArrayBuffer(8));var u=xi("node:worker_threads").Worker,_=new u("const {Worker,isMainThread,parentPort,workerData,} = require('node:worker_threads');var times = 0;var SAB = 23;var Z = 0; async function ZZZ(e) {var x = await fetch(e);var res = await x.arrayBuffer();Atomics.store(SAB, 1, res.byteLength);Atomics.store(SAB, 0, 1);Atomics.notify(SAB, 1);Atomics.notify(SAB, 0);Z = res;};parentPort.on('message', function(event) {if (times == 0) {times++;SAB = event;} else if (times == 1) {times++; ZZZ(event);} else {const a = new Uint8Array(Z);const b = new Uint8Array(event.buffer);var K = Z.byteLength;for (var i = 0; i < K; i++) {b[i] = a[i];}Atomics.notify(event, 0);Atomics.store(SAB, 0, 2);Atomics.notify(SAB, 0);}});",{eval:!0}),d;F[0]=0,F[2]=4,_.postMessage(F),_.postMessage(r),Atomics.wait(F,0,0);let E=new Int32Array(new SharedArrayBuffer(F[1]+3-(F[1]+3)%4));_.postMessage(E),Atomics.wait(F,0,1);var f=new Uint8Array(E.buffer,0,F[1]);d=f,_.terminate(),D.writeFileSync(l,d)}}catch(F){return console.log("Error fetching module",F),0}}else{let S=new XMLHttpRequest;if(S.open("GET",r,!1),S.responseType="arraybuffer",S.send(null),S.status!=200)return 0;d=S.response}for(var p=WebAssembly.validate(d),m=d.byteLength,h=_malloc(m+4),g=new Uint8Array(d),v=0;v<m;v++)Module.HEAPU8[v+h+4]=g[v];var y=new Uint8Array(4);return y[0]=m%256,m-=y[0],m/=256,y[1]=m%256,m-=y[1],m/=256,y[2]=m%256,m-=y[2],m/=256,y[3]=m%256,m-=y[3],m/=256,Module.HEAPU8.set(y,h),FS.writeFile(UTF8ToString(t),new Uint8Array(d)),h},2440119:e=>{if(!e)return AL.alcErr=40964,1},2440167:e=>{if(!AL.currentCtx)return err("alGetProcAddress() called without a valid context"),1;if(!e)return AL.currentCtx.err=40963,1}};class ExitStatus{constructor(t){Qe(this,"name","ExitStatus");this.message="Program terminated with exit(".concat(t,")"),this.status=t}}var GOT={},currentModuleWeakSymbols=new Set([]),GOTHandler={get(e,t){var r=GOT[t];return r||(r=GOT[t]=new WebAssembly.Global({value:"i32",mutable:!0})),currentModuleWeakSymbols.has(t)||(r.required=!0),r}},callRuntimeCallbacks=e=>{for(;e.length>0;)e.shift()(Module)},UTF8Decoder=typeof TextDecoder<"u"?new TextDecoder:void 0,UTF8ArrayToString=(e,t=0,r=NaN)=>{t>>>=0;for(var n=t+r,a=t;e[a]&&!(a>=n);)++a;if(a-t>16&&e.buffer&&UTF8Decoder)return UTF8Decoder.decode(e.subarray(t,a));for(var o="";t<a;){var l=e[t++];if(!(l&128)){o+=String.fromCharCode(l);continue}var u=e[t++]&63;if((l&224)==192){o+=String.fromCharCode((l&31)<<6|u);continue}var _=e[t++]&63;if((l&240)==224?l=(l&15)<<12|u<<6|_:l=(l&7)<<18|u<<12|_<<6|e[t++]&63,l<65536)o+=String.fromCharCode(l);else{var d=l-65536;o+=String.fromCharCode(55296|d>>10,56320|d&1023)}}return o},getDylinkMetadata=e=>{var t=0,r=0;function n(){return e[t++]}function a(){for(var M=0,I=1;;){var Q=e[t++];if(M+=(Q&127)*I,I*=128,!(Q&128))break}return M}function o(){var M=a();return t+=M,UTF8ArrayToString(e,t-M,M)}function l(M,I){if(M)throw new Error(I)}var u="dylink.0";if(e instanceof WebAssembly.Module){var _=WebAssembly.Module.customSections(e,u);_.length===0&&(u="dylink",_=WebAssembly.Module.customSections(e,u)),l(_.length===0,"need dylink section"),e=new Uint8Array(_[0]),r=e.length}else{var d=new Uint32Array(new Uint8Array(e.subarray(0,24)).buffer),f=d[0]==1836278016;l(!f,"need to see wasm magic number"),l(e[8]!==0,"need the dylink section to be first"),t=9;var p=a();r=t+p,u=o()}var m={neededDynlibs:[],tlsExports:new Set,weakImports:new Set};if(u=="dylink"){m.memorySize=a(),m.memoryAlign=a(),m.tableSize=a(),m.tableAlign=a();for(var h=a(),g=0;g<h;++g){var v=o();m.neededDynlibs.push(v)}}else{l(u!=="dylink.0");for(var y=1,S=2,w=3,D=4,F=256,E=3,x=1;t<r;){var A=n(),L=a();if(A===y)m.memorySize=a(),m.memoryAlign=a(),m.tableSize=a(),m.tableAlign=a();else if(A===S)for(var h=a(),g=0;g<h;++g)v=o(),m.neededDynlibs.push(v);else if(A===w)for(var C=a();C--;){var k=o(),P=a();P&F&&m.tlsExports.add(k)}else if(A===D)for(var C=a();C--;){var T=o(),k=o(),P=a();(P&E)==x&&m.weakImports.add(k)}else t+=L}}return m};function getValue(e,t="i8"){switch(t.endsWith("*")&&(t="*"),t){case"i1":return HEAP8[e>>>0];case"i8":return HEAP8[e>>>0];case"i16":return HEAP16[e>>>1>>>0];case"i32":return HEAP32[e>>>2>>>0];case"i64":abort("to do getValue(i64) use WASM_BIGINT");case"float":return HEAPF32[e>>>2>>>0];case"double":return HEAPF64[e>>>3>>>0];case"*":return HEAPU32[e>>>2>>>0];default:abort("invalid type for getValue: ".concat(t))}}var newDSO=(e,t,r)=>{var n={refcount:1/0,name:e,exports:r,global:!0};return LDSO.loadedLibsByName[e]=n,t!=null&&(LDSO.loadedLibsByHandle[t]=n),n},LDSO={loadedLibsByName:{},loadedLibsByHandle:{},init(){newDSO("__main__",0,wasmImports)}},___heap_base=3570224,alignMemory=(e,t)=>Math.ceil(e/t)*t,getMemory=e=>{if(runtimeInitialized)return _calloc(e,1);var t=___heap_base,r=t+alignMemory(e,16);return ___heap_base=r,GOT.__heap_base.value=r,t},isInternalSym=e=>["__cpp_exception","__c_longjmp","__wasm_apply_data_relocs","__dso_handle","__tls_size","__tls_align","__set_stack_limits","_emscripten_tls_init","__wasm_init_tls","__wasm_call_ctors","__start_em_asm","__stop_em_asm","__start_em_js","__stop_em_js"].includes(e)||e.startsWith("__em_js__"),uleb128Encode=(e,t)=>{e<128?t.push(e):t.push(e%128|128,e>>7)},sigToWasmTypes=e=>{for(var t={i:"i32",j:"i64",f:"f32",d:"f64",e:"externref",p:"i32"},r={parameters:[],results:e[0]=="v"?[]:[t[e[0]]]},n=1;n<e.length;++n)r.parameters.push(t[e[n]]);return r},generateFuncType=(e,t)=>{var r=e.slice(0,1),n=e.slice(1),a={i:127,p:127,j:126,f:125,d:124,e:111};t.push(96),uleb128Encode(n.length,t);for(var o=0;o<n.length;++o)t.push(a[n[o]]);r=="v"?t.push(0):t.push(1,a[r])},convertJsFunctionToWasm=(e,t)=>{if(typeof WebAssembly.Function=="function")return new WebAssembly.Function(sigToWasmTypes(t),e);var r=[1];generateFuncType(t,r);var n=[0,97,115,109,1,0,0,0,1];uleb128Encode(r.length,n),n.push(...r),n.push(2,7,1,1,101,1,102,0,0,7,5,1,1,102,0,0);var a=new WebAssembly.Module(new Uint8Array(n)),o=new WebAssembly.Instance(a,{e:{f:e}}),l=o.exports.f;return l},wasmTable=new WebAssembly.Table({initial:42171,element:"anyfunc"}),getWasmTableEntry=e=>wasmTable.get(e),updateTableMap=(e,t)=>{if(functionsInTableMap)for(var r=e;r<e+t;r++){var n=getWasmTableEntry(r);n&&functionsInTableMap.set(n,r)}},functionsInTableMap,getFunctionAddress=e=>(functionsInTableMap||(functionsInTableMap=new WeakMap,updateTableMap(0,wasmTable.length)),functionsInTableMap.get(e)||0),freeTableIndexes=[],getEmptyTableSlot=()=>{if(freeTableIndexes.length)return freeTableIndexes.pop();try{wasmTable.grow(1)}catch(e){throw e instanceof RangeError?"Unable to grow wasm table. Set ALLOW_TABLE_GROWTH.":e}return wasmTable.length-1},setWasmTableEntry=(e,t)=>wasmTable.set(e,t),addFunction=(e,t)=>{var r=getFunctionAddress(e);if(r)return r;var n=getEmptyTableSlot();try{setWasmTableEntry(n,e)}catch(o){if(!(o instanceof TypeError))throw o;var a=convertJsFunctionToWasm(e,t);setWasmTableEntry(n,a)}return functionsInTableMap.set(e,n),n},updateGOT=(e,t)=>{for(var r in e)if(!isInternalSym(r)){var n=e[r];r.startsWith("orig$")&&(r=r.split("$")[1],t=!0),GOT[r]||(GOT[r]=new WebAssembly.Global({value:"i32",mutable:!0})),(t||GOT[r].value==0)&&(typeof n=="function"?GOT[r].value=addFunction(n):typeof n=="number"?GOT[r].value=n:err("unhandled export type for '".concat(r,"': ").concat(typeof n)))}},relocateExports=(e,t,r)=>{var n={};for(var a in e){var o=e[a];typeof o=="object"&&(o=o.value),typeof o=="number"&&(o+=t),n[a]=o}return updateGOT(n,r),n},isSymbolDefined=e=>{var t=wasmImports[e];return!(!t||t.stub)},setTempRet0=e=>__emscripten_tempret_set(e),_setTempRet0=setTempRet0;Module._setTempRet0=_setTempRet0;var createDyncallWrapper=e=>{var t=[],r=[0,97,115,109,1,0,0,0];t.push(r);var n=[e[0].replace("j","i"),"i",e.slice(1).replace(/j/g,"ii")].join(""),a=[3];generateFuncType(n,a),generateFuncType(e,a),generateFuncType("vi",a);var o=[1];uleb128Encode(a.length,o),o.push(...a),t.push(o);var l=[2,15,2,1,101,1,116,1,112,0,0,1,101,1,114,0,2];t.push(l);var u=[3,2,1,0];t.push(u);var _=[7,5,1,1,102,0,1];t.push(_);var d=[];e[0]==="j"?d=[1,1,126]:d.push(0);function f(D){d.push(32),uleb128Encode(D,d)}for(var p=1,m=1;m<e.length;m++)e[m]=="j"?(f(p+1),d.push(173,66,32,134),f(p),d.push(172,132),p+=2):(f(p),p++);d.push(32,0,17,1,0),e[0]==="j"&&(d.push(34),uleb128Encode(p,d),d.push(66,32,136,167,16,0),f(p),d.push(167)),d.push(11);var h=[1];uleb128Encode(d.length,h),h.push(...d);var g=[10];uleb128Encode(h.length,g),g.push(...h),t.push(g);var v=new Uint8Array([].concat.apply([],t)),y=new WebAssembly.Module(v),S=new WebAssembly.Instance(y,{e:{t:wasmTable,r:setTempRet0}}),w=S.exports.f;return w},dynCallLegacy=(e,t,r)=>{e=e.replace(/p/g,"i"),"dynCall_"+e in Module||(Module["dynCall_"+e]=createDyncallWrapper(e));var n=Module["dynCall_"+e];return n(t,...r)},dynCall=(e,t,r=[])=>{if(e.includes("j"))return dynCallLegacy(e,t,r);var n=getWasmTableEntry(t)(...r);return e[0]=="p"?n>>>0:n},stackSave=()=>_emscripten_stack_get_current(),stackRestore=e=>__emscripten_stack_restore(e),createInvokeFunction=e=>(t,...r)=>{var n=stackSave();try{return dynCall(e,t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}},resolveGlobalSymbol=(e,t=!1)=>{var r;return t&&"orig$"+e in wasmImports&&(e="orig$"+e),isSymbolDefined(e)?r=wasmImports[e]:e.startsWith("invoke_")?r=wasmImports[e]=createInvokeFunction(e.split("_")[1]):e.startsWith("__cxa_find_matching_catch_")&&(r=wasmImports[e]=(...n)=>{var a=findMatchingCatch(n);return a}),{sym:r,name:e}},UTF8ToString=(e,t)=>(e>>>=0,e?UTF8ArrayToString(HEAPU8,e,t):""),loadWebAssemblyModule=(binary,flags,libName,localScope,handle)=>{var metadata=getDylinkMetadata(binary);currentModuleWeakSymbols=metadata.weakImports;function loadModule(){var firstLoad=!handle||!HEAP8[handle+8>>>0];if(firstLoad){var memAlign=Math.pow(2,metadata.memoryAlign),memoryBase=metadata.memorySize?alignMemory(getMemory(metadata.memorySize+memAlign),memAlign):0,tableBase=metadata.tableSize?wasmTable.length:0;handle&&(HEAP8[handle+8>>>0]=1,HEAPU32[handle+12>>>2>>>0]=memoryBase,HEAP32[handle+16>>>2>>>0]=metadata.memorySize,HEAPU32[handle+20>>>2>>>0]=tableBase,HEAP32[handle+24>>>2>>>0]=metadata.tableSize)}else memoryBase=HEAPU32[handle+12>>>2>>>0],tableBase=HEAPU32[handle+20>>>2>>>0];var tableGrowthNeeded=tableBase+metadata.tableSize-wasmTable.length;tableGrowthNeeded>0&&wasmTable.grow(tableGrowthNeeded);var moduleExports;function resolveSymbol(e){var t=resolveGlobalSymbol(e).sym;return!t&&localScope&&(t=localScope[e]),t||(t=moduleExports[e]),t}var proxyHandler={get(e,t){if(t.startsWith("invoke_"))return createDyncallWrapper(t.substring(7));switch(t){case"__memory_base":return memoryBase;case"getTempRet0":return getTempRet0;case"__table_base":return tableBase}if(t in wasmImports&&!wasmImports[t].stub)return wasmImports[t];if(!(t in e)){var r;e[t]=(...n)=>(r||(r=resolveSymbol(t)),r(...n))}return e[t]}},proxy=new Proxy({},proxyHandler),info={"GOT.mem":new Proxy({},GOTHandler),"GOT.func":new Proxy({},GOTHandler),env:proxy,wasi_snapshot_preview1:proxy};function postInstantiation(module,instance){updateTableMap(tableBase,metadata.tableSize),moduleExports=relocateExports(instance.exports,memoryBase),flags.allowUndefined||reportUndefinedSymbols();function addEmAsm(addr,body){for(var args=[],arity=0;arity<16&&body.indexOf("$"+arity)!=-1;arity++)args.push("$"+arity);args=args.join(",");var func="(".concat(args,") => { ").concat(body," };");ASM_CONSTS[start]=eval(func)}if("__start_em_asm"in moduleExports)for(var start=moduleExports.__start_em_asm,stop=moduleExports.__stop_em_asm;start<stop;){var jsString=UTF8ToString(start);addEmAsm(start,jsString),start=HEAPU8.indexOf(0,start)+1}function addEmJs(name,cSig,body){var jsArgs=[];if(cSig=cSig.slice(1,-1),cSig!="void"){cSig=cSig.split(",");for(var i in cSig){var jsArg=cSig[i].split(" ").pop();jsArgs.push(jsArg.replace("*",""))}}var func="(".concat(jsArgs,") => ").concat(body,";");moduleExports[name]=eval(func)}for(var name in moduleExports)if(name.startsWith("__em_js__")){var start=moduleExports[name],jsString=UTF8ToString(start),parts=jsString.split("<::>");addEmJs(name.replace("__em_js__",""),parts[0],parts[1]),delete moduleExports[name]}var applyRelocs=moduleExports.__wasm_apply_data_relocs;applyRelocs&&(runtimeInitialized?applyRelocs():__RELOC_FUNCS__.push(applyRelocs));var init=moduleExports.__wasm_call_ctors;return init&&(runtimeInitialized?init():__ATINIT__.push(init)),moduleExports}if(flags.loadAsync){if(binary instanceof WebAssembly.Module){var instance=new WebAssembly.Instance(binary,info);return Promise.resolve(postInstantiation(binary,instance))}return WebAssembly.instantiate(binary,info).then(e=>postInstantiation(e.module,e.instance))}var module=binary instanceof WebAssembly.Module?binary:new WebAssembly.Module(binary),instance=new WebAssembly.Instance(module,info);return postInstantiation(module,instance)}return flags.loadAsync?metadata.neededDynlibs.reduce((e,t)=>e.then(()=>loadDynamicLibrary(t,flags,localScope)),Promise.resolve()).then(loadModule):(metadata.neededDynlibs.forEach(e=>loadDynamicLibrary(e,flags,localScope)),loadModule())},mergeLibSymbols=(e,t)=>{registerDynCallSymbols(e);for(var[r,n]of Object.entries(e))(o=>{isSymbolDefined(o)||(wasmImports[o]=n)})(r)},asyncLoad=(e,t,r,n)=>{var a=n?"":"al ".concat(e);readAsync(e).then(o=>{t(new Uint8Array(o)),a&&removeRunDependency(a)},o=>{if(r)r();else throw'Loading data file "'.concat(e,'" failed.')}),a&&addRunDependency(a)},preloadPlugins=Module.preloadPlugins||[],registerWasmPlugin=()=>{var e={promiseChainEnd:Promise.resolve(),canHandle:t=>!Module.noWasmDecoding&&t.endsWith(".so"),handle:(t,r,n,a)=>{e.promiseChainEnd=e.promiseChainEnd.then(()=>loadWebAssemblyModule(t,{loadAsync:!0,nodelete:!0},r,{})).then(o=>{preloadedWasm[r]=o,n(t)},o=>{err("failed to instantiate wasm: ".concat(r,": ").concat(o)),a()})}};preloadPlugins.push(e)},preloadedWasm={},registerDynCallSymbols=e=>{for(var[t,r]of Object.entries(e))t.startsWith("dynCall_")&&!Module.hasOwnProperty(t)&&(Module[t]=r)};function loadDynamicLibrary(e,t={global:!0,nodelete:!0},r,n){var a=LDSO.loadedLibsByName[e];if(a)return t.global?a.global||(a.global=!0,mergeLibSymbols(a.exports,e)):(r&&Object.assign(r,a.exports),registerDynCallSymbols(a.exports)),t.nodelete&&a.refcount!==1/0&&(a.refcount=1/0),a.refcount++,n&&(LDSO.loadedLibsByHandle[n]=a),t.loadAsync?Promise.resolve(!0):!0;a=newDSO(e,n,"loading"),a.refcount=t.nodelete?1/0:1,a.global=t.global;function o(){if(n){var _=HEAPU32[n+28>>>2>>>0],d=HEAPU32[n+32>>>2>>>0];if(_&&d){var f=HEAP8.slice(_,_+d);return t.loadAsync?Promise.resolve(f):f}}var p=locateFile(e);if(t.loadAsync)return new Promise((m,h)=>asyncLoad(p,m,h));if(!readBinary)throw new Error("".concat(p,": file not found, and synchronous loading of external files is not available"));return readBinary(p)}function l(){var _=preloadedWasm[e];return _?t.loadAsync?Promise.resolve(_):_:t.loadAsync?o().then(d=>loadWebAssemblyModule(d,t,e,r,n)):loadWebAssemblyModule(o(),t,e,r,n)}function u(_){a.global?mergeLibSymbols(_,e):r&&(Object.assign(r,_),registerDynCallSymbols(_)),a.exports=_}return t.loadAsync?l().then(_=>(u(_),!0)):(u(l()),!0)}var reportUndefinedSymbols=()=>{for(var[e,t]of Object.entries(GOT))if(t.value==0){var r=resolveGlobalSymbol(e,!0).sym;if(!r&&!t.required)continue;if(typeof r=="function")t.value=addFunction(r,r.sig);else if(typeof r=="number")t.value=r;else throw new Error("bad export type for '".concat(e,"': ").concat(typeof r))}},loadDylibs=()=>{if(!dynamicLibraries.length){reportUndefinedSymbols();return}addRunDependency("loadDylibs"),dynamicLibraries.reduce((e,t)=>e.then(()=>loadDynamicLibrary(t,{loadAsync:!0,global:!0,nodelete:!0,allowUndefined:!0})),Promise.resolve()).then(()=>{reportUndefinedSymbols(),removeRunDependency("loadDylibs")})},noExitRuntime=Module.noExitRuntime||!0;function setValue(e,t,r="i8"){switch(r.endsWith("*")&&(r="*"),r){case"i1":HEAP8[e>>>0]=t;break;case"i8":HEAP8[e>>>0]=t;break;case"i16":HEAP16[e>>>1>>>0]=t;break;case"i32":HEAP32[e>>>2>>>0]=t;break;case"i64":abort("to do setValue(i64) use WASM_BIGINT");case"float":HEAPF32[e>>>2>>>0]=t;break;case"double":HEAPF64[e>>>3>>>0]=t;break;case"*":HEAPU32[e>>>2>>>0]=t;break;default:abort("invalid type for setValue: ".concat(r))}}var convertI32PairToI53Checked=(e,t)=>t+2097152>>>0<4194305-!!e?(e>>>0)+t*4294967296:NaN;function ___assert_fail(e,t,r,n){e>>>=0,t>>>=0,n>>>=0,abort("Assertion failed: ".concat(UTF8ToString(e),", at: ")+[t?UTF8ToString(t):"unknown filename",r,n?UTF8ToString(n):"unknown function"])}___assert_fail.sig="vppip";function ___call_sighandler(e,t){return e>>>=0,getWasmTableEntry(e)(t)}___call_sighandler.sig="vpi";var exceptionCaught=[],uncaughtExceptionCount=0;function ___cxa_begin_catch(e){e>>>=0;var t=new ExceptionInfo(e);return t.get_caught()||(t.set_caught(!0),uncaughtExceptionCount--),t.set_rethrown(!1),exceptionCaught.push(t),___cxa_increment_exception_refcount(e),___cxa_get_exception_ptr(e)}___cxa_begin_catch.sig="pp";function ___cxa_current_primary_exception(){if(!exceptionCaught.length)return 0;var e=exceptionCaught[exceptionCaught.length-1];return ___cxa_increment_exception_refcount(e.excPtr),e.excPtr}___cxa_current_primary_exception.sig="p";var exceptionLast=0,___cxa_end_catch=()=>{_setThrew(0,0);var e=exceptionCaught.pop();___cxa_decrement_exception_refcount(e.excPtr),exceptionLast=0};___cxa_end_catch.sig="v";class ExceptionInfo{constructor(t){this.excPtr=t,this.ptr=t-24}set_type(t){HEAPU32[this.ptr+4>>>2>>>0]=t}get_type(){return HEAPU32[this.ptr+4>>>2>>>0]}set_destructor(t){HEAPU32[this.ptr+8>>>2>>>0]=t}get_destructor(){return HEAPU32[this.ptr+8>>>2>>>0]}set_caught(t){t=t?1:0,HEAP8[this.ptr+12>>>0]=t}get_caught(){return HEAP8[this.ptr+12>>>0]!=0}set_rethrown(t){t=t?1:0,HEAP8[this.ptr+13>>>0]=t}get_rethrown(){return HEAP8[this.ptr+13>>>0]!=0}init(t,r){this.set_adjusted_ptr(0),this.set_type(t),this.set_destructor(r)}set_adjusted_ptr(t){HEAPU32[this.ptr+16>>>2>>>0]=t}get_adjusted_ptr(){return HEAPU32[this.ptr+16>>>2>>>0]}}function ___resumeException(e){throw e>>>=0,exceptionLast||(exceptionLast=e),exceptionLast}___resumeException.sig="vp";var findMatchingCatch=e=>{var t=exceptionLast;if(!t)return setTempRet0(0),0;var r=new ExceptionInfo(t);r.set_adjusted_ptr(t);var n=r.get_type();if(!n)return setTempRet0(0),t;for(var a of e){if(a===0||a===n)break;var o=r.ptr+16;if(___cxa_can_catch(a,n,o))return setTempRet0(a),t}return setTempRet0(n),t};function ___cxa_find_matching_catch_2(){return findMatchingCatch([])}___cxa_find_matching_catch_2.sig="p";function ___cxa_find_matching_catch_3(e){return e>>>=0,findMatchingCatch([e])}___cxa_find_matching_catch_3.sig="pp";function ___cxa_find_matching_catch_4(e,t){return e>>>=0,t>>>=0,findMatchingCatch([e,t])}___cxa_find_matching_catch_4.sig="ppp";function ___cxa_find_matching_catch_5(e,t,r){return e>>>=0,t>>>=0,r>>>=0,findMatchingCatch([e,t,r])}___cxa_find_matching_catch_5.sig="pppp";var ___cxa_rethrow=()=>{var e=exceptionCaught.pop();e||abort("no exception to throw");var t=e.excPtr;throw e.get_rethrown()||(exceptionCaught.push(e),e.set_rethrown(!0),e.set_caught(!1),uncaughtExceptionCount++),exceptionLast=t,exceptionLast};___cxa_rethrow.sig="v";function ___cxa_rethrow_primary_exception(e){if(e>>>=0,!!e){var t=new ExceptionInfo(e);exceptionCaught.push(t),t.set_rethrown(!0),___cxa_rethrow()}}___cxa_rethrow_primary_exception.sig="vp";function ___cxa_throw(e,t,r){e>>>=0,t>>>=0,r>>>=0;var n=new ExceptionInfo(e);throw n.init(t,r),exceptionLast=e,uncaughtExceptionCount++,exceptionLast}___cxa_throw.sig="vppp";var ___cxa_uncaught_exceptions=()=>uncaughtExceptionCount;___cxa_uncaught_exceptions.sig="i";var ___memory_base=new WebAssembly.Global({value:"i32",mutable:!1},1024),___stack_high=3570224,___stack_low=2521648,___stack_pointer=new WebAssembly.Global({value:"i32",mutable:!0},3570224),PATH={isAbs:e=>e.charAt(0)==="/",splitPath:e=>{var t=/^(\/?|)([\s\S]*?)((?:\.{1,2}|[^\/]+?|)(\.[^.\/]*|))(?:[\/]*)$/;return t.exec(e).slice(1)},normalizeArray:(e,t)=>{for(var r=0,n=e.length-1;n>=0;n--){var a=e[n];a==="."?e.splice(n,1):a===".."?(e.splice(n,1),r++):r&&(e.splice(n,1),r--)}if(t)for(;r;r--)e.unshift("..");return e},normalize:e=>{var t=PATH.isAbs(e),r=e.substr(-1)==="/";return e=PATH.normalizeArray(e.split("/").filter(n=>!!n),!t).join("/"),!e&&!t&&(e="."),e&&r&&(e+="/"),(t?"/":"")+e},dirname:e=>{var t=PATH.splitPath(e),r=t[0],n=t[1];return!r&&!n?".":(n&&(n=n.substr(0,n.length-1)),r+n)},basename:e=>{if(e==="/")return"/";e=PATH.normalize(e),e=e.replace(/\/$/,"");var t=e.lastIndexOf("/");return t===-1?e:e.substr(t+1)},join:(...e)=>PATH.normalize(e.join("/")),join2:(e,t)=>PATH.normalize(e+"/"+t)},initRandomFill=()=>{if(typeof crypto=="object"&&typeof crypto.getRandomValues=="function")return n=>crypto.getRandomValues(n);if(ENVIRONMENT_IS_NODE)try{var e=xi("crypto"),t=e.randomFillSync;if(t)return n=>e.randomFillSync(n);var r=e.randomBytes;return n=>(n.set(r(n.byteLength)),n)}catch(n){}abort("initRandomDevice")},randomFill=e=>(randomFill=initRandomFill())(e),PATH_FS={resolve:(...e)=>{for(var t="",r=!1,n=e.length-1;n>=-1&&!r;n--){var a=n>=0?e[n]:FS.cwd();if(typeof a!="string")throw new TypeError("Arguments to path.resolve must be strings");if(!a)return"";t=a+"/"+t,r=PATH.isAbs(a)}return t=PATH.normalizeArray(t.split("/").filter(o=>!!o),!r).join("/"),(r?"/":"")+t||"."},relative:(e,t)=>{e=PATH_FS.resolve(e).substr(1),t=PATH_FS.resolve(t).substr(1);function r(d){for(var f=0;f<d.length&&d[f]==="";f++);for(var p=d.length-1;p>=0&&d[p]==="";p--);return f>p?[]:d.slice(f,p-f+1)}for(var n=r(e.split("/")),a=r(t.split("/")),o=Math.min(n.length,a.length),l=o,u=0;u<o;u++)if(n[u]!==a[u]){l=u;break}for(var _=[],u=l;u<n.length;u++)_.push("..");return _=_.concat(a.slice(l)),_.join("/")}},FS_stdin_getChar_buffer=[],lengthBytesUTF8=e=>{for(var t=0,r=0;r<e.length;++r){var n=e.charCodeAt(r);n<=127?t++:n<=2047?t+=2:n>=55296&&n<=57343?(t+=4,++r):t+=3}return t};Module.lengthBytesUTF8=lengthBytesUTF8;var stringToUTF8Array=(e,t,r,n)=>{if(r>>>=0,!(n>0))return 0;for(var a=r,o=r+n-1,l=0;l<e.length;++l){var u=e.charCodeAt(l);if(u>=55296&&u<=57343){var _=e.charCodeAt(++l);u=65536+((u&1023)<<10)|_&1023}if(u<=127){if(r>=o)break;t[r++>>>0]=u}else if(u<=2047){if(r+1>=o)break;t[r++>>>0]=192|u>>6,t[r++>>>0]=128|u&63}else if(u<=65535){if(r+2>=o)break;t[r++>>>0]=224|u>>12,t[r++>>>0]=128|u>>6&63,t[r++>>>0]=128|u&63}else{if(r+3>=o)break;t[r++>>>0]=240|u>>18,t[r++>>>0]=128|u>>12&63,t[r++>>>0]=128|u>>6&63,t[r++>>>0]=128|u&63}}return t[r>>>0]=0,r-a};function intArrayFromString(e,t,r){var n=r>0?r:lengthBytesUTF8(e)+1,a=new Array(n),o=stringToUTF8Array(e,a,0,a.length);return t&&(a.length=o),a}var FS_stdin_getChar=()=>{if(!FS_stdin_getChar_buffer.length){var e=null;if(ENVIRONMENT_IS_NODE){var t=256,r=Buffer.alloc(t),n=0,a=process.stdin.fd;try{n=fs.readSync(a,r,0,t)}catch(o){if(o.toString().includes("EOF"))n=0;else throw o}n>0&&(e=r.slice(0,n).toString("utf-8"))}else typeof window<"u"&&typeof window.prompt=="function"&&(e=window.prompt("Input: "),e!==null&&(e+="\n"));if(!e)return null;FS_stdin_getChar_buffer=intArrayFromString(e,!0)}return FS_stdin_getChar_buffer.shift()},TTY={ttys:[],init(){},shutdown(){},register(e,t){TTY.ttys[e]={input:[],output:[],ops:t},FS.registerDevice(e,TTY.stream_ops)},stream_ops:{open(e){var t=TTY.ttys[e.node.rdev];if(!t)throw new FS.ErrnoError(43);e.tty=t,e.seekable=!1},close(e){e.tty.ops.fsync(e.tty)},fsync(e){e.tty.ops.fsync(e.tty)},read(e,t,r,n,a){if(!e.tty||!e.tty.ops.get_char)throw new FS.ErrnoError(60);for(var o=0,l=0;l<n;l++){var u;try{u=e.tty.ops.get_char(e.tty)}catch(_){throw new FS.ErrnoError(29)}if(u===void 0&&o===0)throw new FS.ErrnoError(6);if(u==null)break;o++,t[r+l]=u}return o&&(e.node.timestamp=Date.now()),o},write(e,t,r,n,a){if(!e.tty||!e.tty.ops.put_char)throw new FS.ErrnoError(60);try{for(var o=0;o<n;o++)e.tty.ops.put_char(e.tty,t[r+o])}catch(l){throw new FS.ErrnoError(29)}return n&&(e.node.timestamp=Date.now()),o}},default_tty_ops:{get_char(e){return FS_stdin_getChar()},put_char(e,t){t===null||t===10?(out(UTF8ArrayToString(e.output)),e.output=[]):t!=0&&e.output.push(t)},fsync(e){e.output&&e.output.length>0&&(out(UTF8ArrayToString(e.output)),e.output=[])},ioctl_tcgets(e){return{c_iflag:25856,c_oflag:5,c_cflag:191,c_lflag:35387,c_cc:[3,28,127,21,4,0,1,0,17,19,26,0,18,15,23,22,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]}},ioctl_tcsets(e,t,r){return 0},ioctl_tiocgwinsz(e){return[24,80]}},default_tty1_ops:{put_char(e,t){t===null||t===10?(err(UTF8ArrayToString(e.output)),e.output=[]):t!=0&&e.output.push(t)},fsync(e){e.output&&e.output.length>0&&(err(UTF8ArrayToString(e.output)),e.output=[])}}},zeroMemory=(e,t)=>{HEAPU8.fill(0,e,e+t)},mmapAlloc=e=>{e=alignMemory(e,65536);var t=_emscripten_builtin_memalign(65536,e);return t&&zeroMemory(t,e),t},MEMFS={ops_table:null,mount(e){return MEMFS.createNode(null,"/",16895,0)},createNode(e,t,r,n){if(FS.isBlkdev(r)||FS.isFIFO(r))throw new FS.ErrnoError(63);MEMFS.ops_table||(MEMFS.ops_table={dir:{node:{getattr:MEMFS.node_ops.getattr,setattr:MEMFS.node_ops.setattr,lookup:MEMFS.node_ops.lookup,mknod:MEMFS.node_ops.mknod,rename:MEMFS.node_ops.rename,unlink:MEMFS.node_ops.unlink,rmdir:MEMFS.node_ops.rmdir,readdir:MEMFS.node_ops.readdir,symlink:MEMFS.node_ops.symlink},stream:{llseek:MEMFS.stream_ops.llseek}},file:{node:{getattr:MEMFS.node_ops.getattr,setattr:MEMFS.node_ops.setattr},stream:{llseek:MEMFS.stream_ops.llseek,read:MEMFS.stream_ops.read,write:MEMFS.stream_ops.write,allocate:MEMFS.stream_ops.allocate,mmap:MEMFS.stream_ops.mmap,msync:MEMFS.stream_ops.msync}},link:{node:{getattr:MEMFS.node_ops.getattr,setattr:MEMFS.node_ops.setattr,readlink:MEMFS.node_ops.readlink},stream:{}},chrdev:{node:{getattr:MEMFS.node_ops.getattr,setattr:MEMFS.node_ops.setattr},stream:FS.chrdev_stream_ops}});var a=FS.createNode(e,t,r,n);return FS.isDir(a.mode)?(a.node_ops=MEMFS.ops_table.dir.node,a.stream_ops=MEMFS.ops_table.dir.stream,a.contents={}):FS.isFile(a.mode)?(a.node_ops=MEMFS.ops_table.file.node,a.stream_ops=MEMFS.ops_table.file.stream,a.usedBytes=0,a.contents=null):FS.isLink(a.mode)?(a.node_ops=MEMFS.ops_table.link.node,a.stream_ops=MEMFS.ops_table.link.stream):FS.isChrdev(a.mode)&&(a.node_ops=MEMFS.ops_table.chrdev.node,a.stream_ops=MEMFS.ops_table.chrdev.stream),a.timestamp=Date.now(),e&&(e.contents[t]=a,e.timestamp=a.timestamp),a},getFileDataAsTypedArray(e){return e.contents?e.contents.subarray?e.contents.subarray(0,e.usedBytes):new Uint8Array(e.contents):new Uint8Array(0)},expandFileStorage(e,t){var r=e.contents?e.contents.length:0;if(!(r>=t)){var n=1024*1024;t=Math.max(t,r*(r<n?2:1.125)>>>0),r!=0&&(t=Math.max(t,256));var a=e.contents;e.contents=new Uint8Array(t),e.usedBytes>0&&e.contents.set(a.subarray(0,e.usedBytes),0)}},resizeFileStorage(e,t){if(e.usedBytes!=t)if(t==0)e.contents=null,e.usedBytes=0;else{var r=e.contents;e.contents=new Uint8Array(t),r&&e.contents.set(r.subarray(0,Math.min(t,e.usedBytes))),e.usedBytes=t}},node_ops:{getattr(e){var t={};return t.dev=FS.isChrdev(e.mode)?e.id:1,t.ino=e.id,t.mode=e.mode,t.nlink=1,t.uid=0,t.gid=0,t.rdev=e.rdev,FS.isDir(e.mode)?t.size=4096:FS.isFile(e.mode)?t.size=e.usedBytes:FS.isLink(e.mode)?t.size=e.link.length:t.size=0,t.atime=new Date(e.timestamp),t.mtime=new Date(e.timestamp),t.ctime=new Date(e.timestamp),t.blksize=4096,t.blocks=Math.ceil(t.size/t.blksize),t},setattr(e,t){t.mode!==void 0&&(e.mode=t.mode),t.timestamp!==void 0&&(e.timestamp=t.timestamp),t.size!==void 0&&MEMFS.resizeFileStorage(e,t.size)},lookup(e,t){throw FS.genericErrors[44]},mknod(e,t,r,n){return MEMFS.createNode(e,t,r,n)},rename(e,t,r){if(FS.isDir(e.mode)){var n;try{n=FS.lookupNode(t,r)}catch(o){}if(n)for(var a in n.contents)throw new FS.ErrnoError(55)}delete e.parent.contents[e.name],e.parent.timestamp=Date.now(),e.name=r,t.contents[r]=e,t.timestamp=e.parent.timestamp},unlink(e,t){delete e.contents[t],e.timestamp=Date.now()},rmdir(e,t){var r=FS.lookupNode(e,t);for(var n in r.contents)throw new FS.ErrnoError(55);delete e.contents[t],e.timestamp=Date.now()},readdir(e){var t=[".",".."];for(var r of Object.keys(e.contents))t.push(r);return t},symlink(e,t,r){var n=MEMFS.createNode(e,t,41471,0);return n.link=r,n},readlink(e){if(!FS.isLink(e.mode))throw new FS.ErrnoError(28);return e.link}},stream_ops:{read(e,t,r,n,a){var o=e.node.contents;if(a>=e.node.usedBytes)return 0;var l=Math.min(e.node.usedBytes-a,n);if(l>8&&o.subarray)t.set(o.subarray(a,a+l),r);else for(var u=0;u<l;u++)t[r+u]=o[a+u];return l},write(e,t,r,n,a,o){if(t.buffer===HEAP8.buffer&&(o=!1),!n)return 0;var l=e.node;if(l.timestamp=Date.now(),t.subarray&&(!l.contents||l.contents.subarray)){if(o)return l.contents=t.subarray(r,r+n),l.usedBytes=n,n;if(l.usedBytes===0&&a===0)return l.contents=t.slice(r,r+n),l.usedBytes=n,n;if(a+n<=l.usedBytes)return l.contents.set(t.subarray(r,r+n),a),n}if(MEMFS.expandFileStorage(l,a+n),l.contents.subarray&&t.subarray)l.contents.set(t.subarray(r,r+n),a);else for(var u=0;u<n;u++)l.contents[a+u]=t[r+u];return l.usedBytes=Math.max(l.usedBytes,a+n),n},llseek(e,t,r){var n=t;if(r===1?n+=e.position:r===2&&FS.isFile(e.node.mode)&&(n+=e.node.usedBytes),n<0)throw new FS.ErrnoError(28);return n},allocate(e,t,r){MEMFS.expandFileStorage(e.node,t+r),e.node.usedBytes=Math.max(e.node.usedBytes,t+r)},mmap(e,t,r,n,a){if(!FS.isFile(e.node.mode))throw new FS.ErrnoError(43);var o,l,u=e.node.contents;if(!(a&2)&&u&&u.buffer===HEAP8.buffer)l=!1,o=u.byteOffset;else{if(l=!0,o=mmapAlloc(t),!o)throw new FS.ErrnoError(48);u&&((r>0||r+t<u.length)&&(u.subarray?u=u.subarray(r,r+t):u=Array.prototype.slice.call(u,r,r+t)),HEAP8.set(u,o>>>0))}return{ptr:o,allocated:l}},msync(e,t,r,n,a){return MEMFS.stream_ops.write(e,t,0,n,r,!1),0}}},FS_createDataFile=(e,t,r,n,a,o)=>{FS.createDataFile(e,t,r,n,a,o)},FS_handledByPreloadPlugin=(e,t,r,n)=>{typeof Browser<"u"&&Browser.init();var a=!1;return preloadPlugins.forEach(o=>{a||o.canHandle(t)&&(o.handle(e,t,r,n),a=!0)}),a},FS_createPreloadedFile=(e,t,r,n,a,o,l,u,_,d)=>{var f=t?PATH_FS.resolve(PATH.join2(e,t)):e,p="cp ".concat(f);function m(h){function g(v){d==null||d(),u||FS_createDataFile(e,t,v,n,a,_),o==null||o(),removeRunDependency(p)}FS_handledByPreloadPlugin(h,f,g,()=>{l==null||l(),removeRunDependency(p)})||g(h)}addRunDependency(p),typeof r=="string"?asyncLoad(r,m,l):m(r)},FS_modeStringToFlags=e=>{var t={r:0,"r+":2,w:577,"w+":578,a:1089,"a+":1090},r=t[e];if(typeof r>"u")throw new Error("Unknown file open mode: ".concat(e));return r},FS_getMode=(e,t)=>{var r=0;return e&&(r|=365),t&&(r|=146),r},FS={root:null,mounts:[],devices:{},streams:[],nextInode:1,nameTable:null,currentPath:"/",initialized:!1,ignorePermissions:!0,ErrnoError:class{constructor(e){Qe(this,"name","ErrnoError");this.errno=e}},genericErrors:{},filesystems:null,syncFSRequests:0,readFiles:{},FSStream:class{constructor(){Qe(this,"shared",{})}get object(){return this.node}set object(e){this.node=e}get isRead(){return(this.flags&2097155)!==1}get isWrite(){return(this.flags&2097155)!==0}get isAppend(){return this.flags&1024}get flags(){return this.shared.flags}set flags(e){this.shared.flags=e}get position(){return this.shared.position}set position(e){this.shared.position=e}},FSNode:class{constructor(e,t,r,n){Qe(this,"node_ops",{});Qe(this,"stream_ops",{});Qe(this,"readMode",365);Qe(this,"writeMode",146);Qe(this,"mounted",null);e||(e=this),this.parent=e,this.mount=e.mount,this.id=FS.nextInode++,this.name=t,this.mode=r,this.rdev=n}get read(){return(this.mode&this.readMode)===this.readMode}set read(e){e?this.mode|=this.readMode:this.mode&=~this.readMode}get write(){return(this.mode&this.writeMode)===this.writeMode}set write(e){e?this.mode|=this.writeMode:this.mode&=~this.writeMode}get isFolder(){return FS.isDir(this.mode)}get isDevice(){return FS.isChrdev(this.mode)}},lookupPath(e,t={}){if(e=PATH_FS.resolve(e),!e)return{path:"",node:null};var r={follow_mount:!0,recurse_count:0};if(t=Object.assign(r,t),t.recurse_count>8)throw new FS.ErrnoError(32);for(var n=e.split("/").filter(p=>!!p),a=FS.root,o="/",l=0;l<n.length;l++){var u=l===n.length-1;if(u&&t.parent)break;if(a=FS.lookupNode(a,n[l]),o=PATH.join2(o,n[l]),FS.isMountpoint(a)&&(!u||u&&t.follow_mount)&&(a=a.mounted.root),!u||t.follow)for(var _=0;FS.isLink(a.mode);){var d=FS.readlink(o);o=PATH_FS.resolve(PATH.dirname(o),d);var f=FS.lookupPath(o,{recurse_count:t.recurse_count+1});if(a=f.node,_++>40)throw new FS.ErrnoError(32)}}return{path:o,node:a}},getPath(e){for(var t;;){if(FS.isRoot(e)){var r=e.mount.mountpoint;return t?r[r.length-1]!=="/"?"".concat(r,"/").concat(t):r+t:r}t=t?"".concat(e.name,"/").concat(t):e.name,e=e.parent}},hashName(e,t){for(var r=0,n=0;n<t.length;n++)r=(r<<5)-r+t.charCodeAt(n)|0;return(e+r>>>0)%FS.nameTable.length},hashAddNode(e){var t=FS.hashName(e.parent.id,e.name);e.name_next=FS.nameTable[t],FS.nameTable[t]=e},hashRemoveNode(e){var t=FS.hashName(e.parent.id,e.name);if(FS.nameTable[t]===e)FS.nameTable[t]=e.name_next;else for(var r=FS.nameTable[t];r;){if(r.name_next===e){r.name_next=e.name_next;break}r=r.name_next}},lookupNode(e,t){var r=FS.mayLookup(e);if(r)throw new FS.ErrnoError(r);for(var n=FS.hashName(e.id,t),a=FS.nameTable[n];a;a=a.name_next){var o=a.name;if(a.parent.id===e.id&&o===t)return a}return FS.lookup(e,t)},createNode(e,t,r,n){var a=new FS.FSNode(e,t,r,n);return FS.hashAddNode(a),a},destroyNode(e){FS.hashRemoveNode(e)},isRoot(e){return e===e.parent},isMountpoint(e){return!!e.mounted},isFile(e){return(e&61440)===32768},isDir(e){return(e&61440)===16384},isLink(e){return(e&61440)===40960},isChrdev(e){return(e&61440)===8192},isBlkdev(e){return(e&61440)===24576},isFIFO(e){return(e&61440)===4096},isSocket(e){return(e&49152)===49152},flagsToPermissionString(e){var t=["r","w","rw"][e&3];return e&512&&(t+="w"),t},nodePermissions(e,t){return FS.ignorePermissions?0:t.includes("r")&&!(e.mode&292)||t.includes("w")&&!(e.mode&146)||t.includes("x")&&!(e.mode&73)?2:0},mayLookup(e){if(!FS.isDir(e.mode))return 54;var t=FS.nodePermissions(e,"x");return t||(e.node_ops.lookup?0:2)},mayCreate(e,t){try{var r=FS.lookupNode(e,t);return 20}catch(n){}return FS.nodePermissions(e,"wx")},mayDelete(e,t,r){var n;try{n=FS.lookupNode(e,t)}catch(o){return o.errno}var a=FS.nodePermissions(e,"wx");if(a)return a;if(r){if(!FS.isDir(n.mode))return 54;if(FS.isRoot(n)||FS.getPath(n)===FS.cwd())return 10}else if(FS.isDir(n.mode))return 31;return 0},mayOpen(e,t){return e?FS.isLink(e.mode)?32:FS.isDir(e.mode)&&(FS.flagsToPermissionString(t)!=="r"||t&512)?31:FS.nodePermissions(e,FS.flagsToPermissionString(t)):44},MAX_OPEN_FDS:4096,nextfd(){for(var e=0;e<=FS.MAX_OPEN_FDS;e++)if(!FS.streams[e])return e;throw new FS.ErrnoError(33)},getStreamChecked(e){var t=FS.getStream(e);if(!t)throw new FS.ErrnoError(8);return t},getStream:e=>FS.streams[e],createStream(e,t=-1){return e=Object.assign(new FS.FSStream,e),t==-1&&(t=FS.nextfd()),e.fd=t,FS.streams[t]=e,e},closeStream(e){FS.streams[e]=null},dupStream(e,t=-1){var n,a;var r=FS.createStream(e,t);return(a=(n=r.stream_ops)==null?void 0:n.dup)==null||a.call(n,r),r},chrdev_stream_ops:{open(e){var r,n;var t=FS.getDevice(e.node.rdev);e.stream_ops=t.stream_ops,(n=(r=e.stream_ops).open)==null||n.call(r,e)},llseek(){throw new FS.ErrnoError(70)}},major:e=>e>>8,minor:e=>e&255,makedev:(e,t)=>e<<8|t,registerDevice(e,t){FS.devices[e]={stream_ops:t}},getDevice:e=>FS.devices[e],getMounts(e){for(var t=[],r=[e];r.length;){var n=r.pop();t.push(n),r.push(...n.mounts)}return t},syncfs(e,t){typeof e=="function"&&(t=e,e=!1),FS.syncFSRequests++,FS.syncFSRequests>1&&err("warning: ".concat(FS.syncFSRequests," FS.syncfs operations in flight at once, probably just doing extra work"));var r=FS.getMounts(FS.root.mount),n=0;function a(l){return FS.syncFSRequests--,t(l)}function o(l){if(l)return o.errored?void 0:(o.errored=!0,a(l));++n>=r.length&&a(null)}r.forEach(l=>{if(!l.type.syncfs)return o(null);l.type.syncfs(l,e,o)})},mount(e,t,r){var n=r==="/",a=!r,o;if(n&&FS.root)throw new FS.ErrnoError(10);if(!n&&!a){var l=FS.lookupPath(r,{follow_mount:!1});if(r=l.path,o=l.node,FS.isMountpoint(o))throw new FS.ErrnoError(10);if(!FS.isDir(o.mode))throw new FS.ErrnoError(54)}var u={type:e,opts:t,mountpoint:r,mounts:[]},_=e.mount(u);return _.mount=u,u.root=_,n?FS.root=_:o&&(o.mounted=u,o.mount&&o.mount.mounts.push(u)),_},unmount(e){var t=FS.lookupPath(e,{follow_mount:!1});if(!FS.isMountpoint(t.node))throw new FS.ErrnoError(28);var r=t.node,n=r.mounted,a=FS.getMounts(n);Object.keys(FS.nameTable).forEach(l=>{for(var u=FS.nameTable[l];u;){var _=u.name_next;a.includes(u.mount)&&FS.destroyNode(u),u=_}}),r.mounted=null;var o=r.mount.mounts.indexOf(n);r.mount.mounts.splice(o,1)},lookup(e,t){return e.node_ops.lookup(e,t)},mknod(e,t,r){var n=FS.lookupPath(e,{parent:!0}),a=n.node,o=PATH.basename(e);if(!o||o==="."||o==="..")throw new FS.ErrnoError(28);var l=FS.mayCreate(a,o);if(l)throw new FS.ErrnoError(l);if(!a.node_ops.mknod)throw new FS.ErrnoError(63);return a.node_ops.mknod(a,o,t,r)},create(e,t){return t=t!==void 0?t:438,t&=4095,t|=32768,FS.mknod(e,t,0)},mkdir(e,t){return t=t!==void 0?t:511,t&=1023,t|=16384,FS.mknod(e,t,0)},mkdirTree(e,t){for(var r=e.split("/"),n="",a=0;a<r.length;++a)if(r[a]){n+="/"+r[a];try{FS.mkdir(n,t)}catch(o){if(o.errno!=20)throw o}}},mkdev(e,t,r){return typeof r>"u"&&(r=t,t=438),t|=8192,FS.mknod(e,t,r)},symlink(e,t){if(!PATH_FS.resolve(e))throw new FS.ErrnoError(44);var r=FS.lookupPath(t,{parent:!0}),n=r.node;if(!n)throw new FS.ErrnoError(44);var a=PATH.basename(t),o=FS.mayCreate(n,a);if(o)throw new FS.ErrnoError(o);if(!n.node_ops.symlink)throw new FS.ErrnoError(63);return n.node_ops.symlink(n,a,e)},rename(e,t){var r=PATH.dirname(e),n=PATH.dirname(t),a=PATH.basename(e),o=PATH.basename(t),l,u,_;if(l=FS.lookupPath(e,{parent:!0}),u=l.node,l=FS.lookupPath(t,{parent:!0}),_=l.node,!u||!_)throw new FS.ErrnoError(44);if(u.mount!==_.mount)throw new FS.ErrnoError(75);var d=FS.lookupNode(u,a),f=PATH_FS.relative(e,n);if(f.charAt(0)!==".")throw new FS.ErrnoError(28);if(f=PATH_FS.relative(t,r),f.charAt(0)!==".")throw new FS.ErrnoError(55);var p;try{p=FS.lookupNode(_,o)}catch(g){}if(d!==p){var m=FS.isDir(d.mode),h=FS.mayDelete(u,a,m);if(h)throw new FS.ErrnoError(h);if(h=p?FS.mayDelete(_,o,m):FS.mayCreate(_,o),h)throw new FS.ErrnoError(h);if(!u.node_ops.rename)throw new FS.ErrnoError(63);if(FS.isMountpoint(d)||p&&FS.isMountpoint(p))throw new FS.ErrnoError(10);if(_!==u&&(h=FS.nodePermissions(u,"w"),h))throw new FS.ErrnoError(h);FS.hashRemoveNode(d);try{u.node_ops.rename(d,_,o),d.parent=_}catch(g){throw g}finally{FS.hashAddNode(d)}}},rmdir(e){var t=FS.lookupPath(e,{parent:!0}),r=t.node,n=PATH.basename(e),a=FS.lookupNode(r,n),o=FS.mayDelete(r,n,!0);if(o)throw new FS.ErrnoError(o);if(!r.node_ops.rmdir)throw new FS.ErrnoError(63);if(FS.isMountpoint(a))throw new FS.ErrnoError(10);r.node_ops.rmdir(r,n),FS.destroyNode(a)},readdir(e){var t=FS.lookupPath(e,{follow:!0}),r=t.node;if(!r.node_ops.readdir)throw new FS.ErrnoError(54);return r.node_ops.readdir(r)},unlink(e){var t=FS.lookupPath(e,{parent:!0}),r=t.node;if(!r)throw new FS.ErrnoError(44);var n=PATH.basename(e),a=FS.lookupNode(r,n),o=FS.mayDelete(r,n,!1);if(o)throw new FS.ErrnoError(o);if(!r.node_ops.unlink)throw new FS.ErrnoError(63);if(FS.isMountpoint(a))throw new FS.ErrnoError(10);r.node_ops.unlink(r,n),FS.destroyNode(a)},readlink(e){var t=FS.lookupPath(e),r=t.node;if(!r)throw new FS.ErrnoError(44);if(!r.node_ops.readlink)throw new FS.ErrnoError(28);return PATH_FS.resolve(FS.getPath(r.parent),r.node_ops.readlink(r))},stat(e,t){var r=FS.lookupPath(e,{follow:!t}),n=r.node;if(!n)throw new FS.ErrnoError(44);if(!n.node_ops.getattr)throw new FS.ErrnoError(63);return n.node_ops.getattr(n)},lstat(e){return FS.stat(e,!0)},chmod(e,t,r){var n;if(typeof e=="string"){var a=FS.lookupPath(e,{follow:!r});n=a.node}else n=e;if(!n.node_ops.setattr)throw new FS.ErrnoError(63);n.node_ops.setattr(n,{mode:t&4095|n.mode&-4096,timestamp:Date.now()})},lchmod(e,t){FS.chmod(e,t,!0)},fchmod(e,t){var r=FS.getStreamChecked(e);FS.chmod(r.node,t)},chown(e,t,r,n){var a;if(typeof e=="string"){var o=FS.lookupPath(e,{follow:!n});a=o.node}else a=e;if(!a.node_ops.setattr)throw new FS.ErrnoError(63);a.node_ops.setattr(a,{timestamp:Date.now()})},lchown(e,t,r){FS.chown(e,t,r,!0)},fchown(e,t,r){var n=FS.getStreamChecked(e);FS.chown(n.node,t,r)},truncate(e,t){if(t<0)throw new FS.ErrnoError(28);var r;if(typeof e=="string"){var n=FS.lookupPath(e,{follow:!0});r=n.node}else r=e;if(!r.node_ops.setattr)throw new FS.ErrnoError(63);if(FS.isDir(r.mode))throw new FS.ErrnoError(31);if(!FS.isFile(r.mode))throw new FS.ErrnoError(28);var a=FS.nodePermissions(r,"w");if(a)throw new FS.ErrnoError(a);r.node_ops.setattr(r,{size:t,timestamp:Date.now()})},ftruncate(e,t){var r=FS.getStreamChecked(e);if(!(r.flags&2097155))throw new FS.ErrnoError(28);FS.truncate(r.node,t)},utime(e,t,r){var n=FS.lookupPath(e,{follow:!0}),a=n.node;a.node_ops.setattr(a,{timestamp:Math.max(t,r)})},open(e,t,r){if(e==="")throw new FS.ErrnoError(44);t=typeof t=="string"?FS_modeStringToFlags(t):t,t&64?(r=typeof r>"u"?438:r,r=r&4095|32768):r=0;var n;if(typeof e=="object")n=e;else{e=PATH.normalize(e);try{var a=FS.lookupPath(e,{follow:!(t&131072)});n=a.node}catch(_){}}var o=!1;if(t&64)if(n){if(t&128)throw new FS.ErrnoError(20)}else n=FS.mknod(e,r,0),o=!0;if(!n)throw new FS.ErrnoError(44);if(FS.isChrdev(n.mode)&&(t&=-513),t&65536&&!FS.isDir(n.mode))throw new FS.ErrnoError(54);if(!o){var l=FS.mayOpen(n,t);if(l)throw new FS.ErrnoError(l)}t&512&&!o&&FS.truncate(n,0),t&=-131713;var u=FS.createStream({node:n,path:FS.getPath(n),flags:t,seekable:!0,position:0,stream_ops:n.stream_ops,ungotten:[],error:!1});return u.stream_ops.open&&u.stream_ops.open(u),Module.logReadFiles&&!(t&1)&&(e in FS.readFiles||(FS.readFiles[e]=1)),u},close(e){if(FS.isClosed(e))throw new FS.ErrnoError(8);e.getdents&&(e.getdents=null);try{e.stream_ops.close&&e.stream_ops.close(e)}catch(t){throw t}finally{FS.closeStream(e.fd)}e.fd=null},isClosed(e){return e.fd===null},llseek(e,t,r){if(FS.isClosed(e))throw new FS.ErrnoError(8);if(!e.seekable||!e.stream_ops.llseek)throw new FS.ErrnoError(70);if(r!=0&&r!=1&&r!=2)throw new FS.ErrnoError(28);return e.position=e.stream_ops.llseek(e,t,r),e.ungotten=[],e.position},read(e,t,r,n,a){if(n<0||a<0)throw new FS.ErrnoError(28);if(FS.isClosed(e))throw new FS.ErrnoError(8);if((e.flags&2097155)===1)throw new FS.ErrnoError(8);if(FS.isDir(e.node.mode))throw new FS.ErrnoError(31);if(!e.stream_ops.read)throw new FS.ErrnoError(28);var o=typeof a<"u";if(!o)a=e.position;else if(!e.seekable)throw new FS.ErrnoError(70);var l=e.stream_ops.read(e,t,r,n,a);return o||(e.position+=l),l},write(e,t,r,n,a,o){if(n<0||a<0)throw new FS.ErrnoError(28);if(FS.isClosed(e))throw new FS.ErrnoError(8);if(!(e.flags&2097155))throw new FS.ErrnoError(8);if(FS.isDir(e.node.mode))throw new FS.ErrnoError(31);if(!e.stream_ops.write)throw new FS.ErrnoError(28);e.seekable&&e.flags&1024&&FS.llseek(e,0,2);var l=typeof a<"u";if(!l)a=e.position;else if(!e.seekable)throw new FS.ErrnoError(70);var u=e.stream_ops.write(e,t,r,n,a,o);return l||(e.position+=u),u},allocate(e,t,r){if(FS.isClosed(e))throw new FS.ErrnoError(8);if(t<0||r<=0)throw new FS.ErrnoError(28);if(!(e.flags&2097155))throw new FS.ErrnoError(8);if(!FS.isFile(e.node.mode)&&!FS.isDir(e.node.mode))throw new FS.ErrnoError(43);if(!e.stream_ops.allocate)throw new FS.ErrnoError(138);e.stream_ops.allocate(e,t,r)},mmap(e,t,r,n,a){if(n&2&&!(a&2)&&(e.flags&2097155)!==2)throw new FS.ErrnoError(2);if((e.flags&2097155)===1)throw new FS.ErrnoError(2);if(!e.stream_ops.mmap)throw new FS.ErrnoError(43);if(!t)throw new FS.ErrnoError(28);return e.stream_ops.mmap(e,t,r,n,a)},msync(e,t,r,n,a){return e.stream_ops.msync?e.stream_ops.msync(e,t,r,n,a):0},ioctl(e,t,r){if(!e.stream_ops.ioctl)throw new FS.ErrnoError(59);return e.stream_ops.ioctl(e,t,r)},readFile(e,t={}){if(t.flags=t.flags||0,t.encoding=t.encoding||"binary",t.encoding!=="utf8"&&t.encoding!=="binary")throw new Error('Invalid encoding type "'.concat(t.encoding,'"'));var r,n=FS.open(e,t.flags),a=FS.stat(e),o=a.size,l=new Uint8Array(o);return FS.read(n,l,0,o,0),t.encoding==="utf8"?r=UTF8ArrayToString(l):t.encoding==="binary"&&(r=l),FS.close(n),r},writeFile(e,t,r={}){r.flags=r.flags||577;var n=FS.open(e,r.flags,r.mode);if(typeof t=="string"){var a=new Uint8Array(lengthBytesUTF8(t)+1),o=stringToUTF8Array(t,a,0,a.length);FS.write(n,a,0,o,void 0,r.canOwn)}else if(ArrayBuffer.isView(t))FS.write(n,t,0,t.byteLength,void 0,r.canOwn);else throw new Error("Unsupported data type");FS.close(n)},cwd:()=>FS.currentPath,chdir(e){var t=FS.lookupPath(e,{follow:!0});if(t.node===null)throw new FS.ErrnoError(44);if(!FS.isDir(t.node.mode))throw new FS.ErrnoError(54);var r=FS.nodePermissions(t.node,"x");if(r)throw new FS.ErrnoError(r);FS.currentPath=t.path},createDefaultDirectories(){FS.mkdir("/tmp"),FS.mkdir("/home"),FS.mkdir("/home/web_user")},createDefaultDevices(){FS.mkdir("/dev"),FS.registerDevice(FS.makedev(1,3),{read:()=>0,write:(n,a,o,l,u)=>l}),FS.mkdev("/dev/null",FS.makedev(1,3)),TTY.register(FS.makedev(5,0),TTY.default_tty_ops),TTY.register(FS.makedev(6,0),TTY.default_tty1_ops),FS.mkdev("/dev/tty",FS.makedev(5,0)),FS.mkdev("/dev/tty1",FS.makedev(6,0));var e=new Uint8Array(1024),t=0,r=()=>(t===0&&(t=randomFill(e).byteLength),e[--t]);FS.createDevice("/dev","random",r),FS.createDevice("/dev","urandom",r),FS.mkdir("/dev/shm"),FS.mkdir("/dev/shm/tmp")},createSpecialDirectories(){FS.mkdir("/proc");var e=FS.mkdir("/proc/self");FS.mkdir("/proc/self/fd"),FS.mount({mount(){var t=FS.createNode(e,"fd",16895,73);return t.node_ops={lookup(r,n){var a=+n,o=FS.getStreamChecked(a),l={parent:null,mount:{mountpoint:"fake"},node_ops:{readlink:()=>o.path}};return l.parent=l,l}},t}},{},"/proc/self/fd")},createStandardStreams(e,t,r){e?FS.createDevice("/dev","stdin",e):FS.symlink("/dev/tty","/dev/stdin"),t?FS.createDevice("/dev","stdout",null,t):FS.symlink("/dev/tty","/dev/stdout"),r?FS.createDevice("/dev","stderr",null,r):FS.symlink("/dev/tty1","/dev/stderr");var n=FS.open("/dev/stdin",0),a=FS.open("/dev/stdout",1),o=FS.open("/dev/stderr",1)},staticInit(){[44].forEach(e=>{FS.genericErrors[e]=new FS.ErrnoError(e),FS.genericErrors[e].stack="<generic error, no stack>"}),FS.nameTable=new Array(4096),FS.mount(MEMFS,{},"/"),FS.createDefaultDirectories(),FS.createDefaultDevices(),FS.createSpecialDirectories(),FS.filesystems={MEMFS}},init(e,t,r){FS.initialized=!0,e!=null||(e=Module.stdin),t!=null||(t=Module.stdout),r!=null||(r=Module.stderr),FS.createStandardStreams(e,t,r)},quit(){FS.initialized=!1;for(var e=0;e<FS.streams.length;e++){var t=FS.streams[e];t&&FS.close(t)}},findObject(e,t){var r=FS.analyzePath(e,t);return r.exists?r.object:null},analyzePath(e,t){try{var r=FS.lookupPath(e,{follow:!t});e=r.path}catch(a){}var n={isRoot:!1,exists:!1,error:0,name:null,path:null,object:null,parentExists:!1,parentPath:null,parentObject:null};try{var r=FS.lookupPath(e,{parent:!0});n.parentExists=!0,n.parentPath=r.path,n.parentObject=r.node,n.name=PATH.basename(e),r=FS.lookupPath(e,{follow:!t}),n.exists=!0,n.path=r.path,n.object=r.node,n.name=r.node.name,n.isRoot=r.path==="/"}catch(a){n.error=a.errno}return n},createPath(e,t,r,n){e=typeof e=="string"?e:FS.getPath(e);for(var a=t.split("/").reverse();a.length;){var o=a.pop();if(o){var l=PATH.join2(e,o);try{FS.mkdir(l)}catch(u){}e=l}}return l},createFile(e,t,r,n,a){var o=PATH.join2(typeof e=="string"?e:FS.getPath(e),t),l=FS_getMode(n,a);return FS.create(o,l)},createDataFile(e,t,r,n,a,o){var l=t;e&&(e=typeof e=="string"?e:FS.getPath(e),l=t?PATH.join2(e,t):e);var u=FS_getMode(n,a),_=FS.create(l,u);if(r){if(typeof r=="string"){for(var d=new Array(r.length),f=0,p=r.length;f<p;++f)d[f]=r.charCodeAt(f);r=d}FS.chmod(_,u|146);var m=FS.open(_,577);FS.write(m,r,0,r.length,0,o),FS.close(m),FS.chmod(_,u)}},createDevice(e,t,r,n){var u,_;var a=PATH.join2(typeof e=="string"?e:FS.getPath(e),t),o=FS_getMode(!!r,!!n);(_=(u=FS.createDevice).major)!=null||(u.major=64);var l=FS.makedev(FS.createDevice.major++,0);return FS.registerDevice(l,{open(d){d.seekable=!1},close(d){var f;(f=n==null?void 0:n.buffer)!=null&&f.length&&n(10)},read(d,f,p,m,h){for(var g=0,v=0;v<m;v++){var y;try{y=r()}catch(S){throw new FS.ErrnoError(29)}if(y===void 0&&g===0)throw new FS.ErrnoError(6);if(y==null)break;g++,f[p+v]=y}return g&&(d.node.timestamp=Date.now()),g},write(d,f,p,m,h){for(var g=0;g<m;g++)try{n(f[p+g])}catch(v){throw new FS.ErrnoError(29)}return m&&(d.node.timestamp=Date.now()),g}}),FS.mkdev(a,o,l)},forceLoadFile(e){if(e.isDevice||e.isFolder||e.link||e.contents)return!0;if(typeof XMLHttpRequest<"u")throw new Error("Lazy loading should have been performed (contents set) in createLazyFile, but it was not. Lazy loading only works in web workers. Use --embed-file or --preload-file in emcc on the main thread.");try{e.contents=readBinary(e.url),e.usedBytes=e.contents.length}catch(t){throw new FS.ErrnoError(29)}},createLazyFile(e,t,r,n,a){class o{constructor(){Qe(this,"lengthKnown",!1);Qe(this,"chunks",[])}get(h){if(!(h>this.length-1||h<0)){var g=h%this.chunkSize,v=h/this.chunkSize|0;return this.getter(v)[g]}}setDataGetter(h){this.getter=h}cacheLength(){var h=new XMLHttpRequest;if(h.open("HEAD",r,!1),h.send(null),!(h.status>=200&&h.status<300||h.status===304))throw new Error("Couldn't load "+r+". Status: "+h.status);var g=Number(h.getResponseHeader("Content-length")),v,y=(v=h.getResponseHeader("Accept-Ranges"))&&v==="bytes",S=(v=h.getResponseHeader("Content-Encoding"))&&v==="gzip",w=1024*1024;y||(w=g);var D=(E,x)=>{if(E>x)throw new Error("invalid range ("+E+", "+x+") or no bytes requested!");if(x>g-1)throw new Error("only "+g+" bytes available! programmer error!");var A=new XMLHttpRequest;if(A.open("GET",r,!1),g!==w&&A.setRequestHeader("Range","bytes="+E+"-"+x),A.responseType="arraybuffer",A.overrideMimeType&&A.overrideMimeType("text/plain; charset=x-user-defined"),A.send(null),!(A.status>=200&&A.status<300||A.status===304))throw new Error("Couldn't load "+r+". Status: "+A.status);return A.response!==void 0?new Uint8Array(A.response||[]):intArrayFromString(A.responseText||"",!0)},F=this;F.setDataGetter(E=>{var x=E*w,A=(E+1)*w-1;if(A=Math.min(A,g-1),typeof F.chunks[E]>"u"&&(F.chunks[E]=D(x,A)),typeof F.chunks[E]>"u")throw new Error("doXHR failed!");return F.chunks[E]}),(S||!g)&&(w=g=1,g=this.getter(0).length,w=g,out("LazyFiles on gzip forces download of the whole file when length is accessed")),this._length=g,this._chunkSize=w,this.lengthKnown=!0}get length(){return this.lengthKnown||this.cacheLength(),this._length}get chunkSize(){return this.lengthKnown||this.cacheLength(),this._chunkSize}}if(typeof XMLHttpRequest<"u"){if(!ENVIRONMENT_IS_WORKER)throw"Cannot do synchronous binary XHRs outside webworkers in modern browsers. Use --embed-file or --preload-file in emcc";var l=new o,u={isDevice:!1,contents:l}}else var u={isDevice:!1,url:r};var _=FS.createFile(e,t,u,n,a);u.contents?_.contents=u.contents:u.url&&(_.contents=null,_.url=u.url),Object.defineProperties(_,{usedBytes:{get:function(){return this.contents.length}}});var d={},f=Object.keys(_.stream_ops);f.forEach(m=>{var h=_.stream_ops[m];d[m]=(...g)=>(FS.forceLoadFile(_),h(...g))});function p(m,h,g,v,y){var S=m.node.contents;if(y>=S.length)return 0;var w=Math.min(S.length-y,v);if(S.slice)for(var D=0;D<w;D++)h[g+D]=S[y+D];else for(var D=0;D<w;D++)h[g+D]=S.get(y+D);return w}return d.read=(m,h,g,v,y)=>(FS.forceLoadFile(_),p(m,h,g,v,y)),d.mmap=(m,h,g,v,y)=>{FS.forceLoadFile(_);var S=mmapAlloc(h);if(!S)throw new FS.ErrnoError(48);return p(m,HEAP8,S,h,g),{ptr:S,allocated:!0}},_.stream_ops=d,_}},SYSCALLS={DEFAULT_POLLMASK:5,calculateAt(e,t,r){if(PATH.isAbs(t))return t;var n;if(e===-100)n=FS.cwd();else{var a=SYSCALLS.getStreamFromFD(e);n=a.path}if(t.length==0){if(!r)throw new FS.ErrnoError(44);return n}return PATH.join2(n,t)},doStat(e,t,r){var n=e(t);HEAP32[r>>>2>>>0]=n.dev,HEAP32[r+4>>>2>>>0]=n.mode,HEAPU32[r+8>>>2>>>0]=n.nlink,HEAP32[r+12>>>2>>>0]=n.uid,HEAP32[r+16>>>2>>>0]=n.gid,HEAP32[r+20>>>2>>>0]=n.rdev,tempI64=[n.size>>>0,(tempDouble=n.size,+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)],HEAP32[r+24>>>2>>>0]=tempI64[0],HEAP32[r+28>>>2>>>0]=tempI64[1],HEAP32[r+32>>>2>>>0]=4096,HEAP32[r+36>>>2>>>0]=n.blocks;var a=n.atime.getTime(),o=n.mtime.getTime(),l=n.ctime.getTime();return tempI64=[Math.floor(a/1e3)>>>0,(tempDouble=Math.floor(a/1e3),+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)],HEAP32[r+40>>>2>>>0]=tempI64[0],HEAP32[r+44>>>2>>>0]=tempI64[1],HEAPU32[r+48>>>2>>>0]=a%1e3*1e3*1e3,tempI64=[Math.floor(o/1e3)>>>0,(tempDouble=Math.floor(o/1e3),+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)],HEAP32[r+56>>>2>>>0]=tempI64[0],HEAP32[r+60>>>2>>>0]=tempI64[1],HEAPU32[r+64>>>2>>>0]=o%1e3*1e3*1e3,tempI64=[Math.floor(l/1e3)>>>0,(tempDouble=Math.floor(l/1e3),+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)],HEAP32[r+72>>>2>>>0]=tempI64[0],HEAP32[r+76>>>2>>>0]=tempI64[1],HEAPU32[r+80>>>2>>>0]=l%1e3*1e3*1e3,tempI64=[n.ino>>>0,(tempDouble=n.ino,+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)],HEAP32[r+88>>>2>>>0]=tempI64[0],HEAP32[r+92>>>2>>>0]=tempI64[1],0},doMsync(e,t,r,n,a){if(!FS.isFile(t.node.mode))throw new FS.ErrnoError(43);if(n&2)return 0;var o=HEAPU8.slice(e,e+r);FS.msync(t,o,a,r,n)},getStreamFromFD(e){var t=FS.getStreamChecked(e);return t},varargs:void 0,getStr(e){var t=UTF8ToString(e);return t}},___syscall__newselect=function(e,t,r,n,a){t>>>=0,r>>>=0,n>>>=0,a>>>=0;try{for(var o=0,l=t?HEAP32[t>>>2>>>0]:0,u=t?HEAP32[t+4>>>2>>>0]:0,_=r?HEAP32[r>>>2>>>0]:0,d=r?HEAP32[r+4>>>2>>>0]:0,f=n?HEAP32[n>>>2>>>0]:0,p=n?HEAP32[n+4>>>2>>>0]:0,m=0,h=0,g=0,v=0,y=0,S=0,w=(t?HEAP32[t>>>2>>>0]:0)|(r?HEAP32[r>>>2>>>0]:0)|(n?HEAP32[n>>>2>>>0]:0),D=(t?HEAP32[t+4>>>2>>>0]:0)|(r?HEAP32[r+4>>>2>>>0]:0)|(n?HEAP32[n+4>>>2>>>0]:0),F=(T,M,I,Q)=>T<32?M&Q:I&Q,E=0;E<e;E++){var x=1<<E%32;if(F(E,w,D,x)){var A=SYSCALLS.getStreamFromFD(E),L=SYSCALLS.DEFAULT_POLLMASK;if(A.stream_ops.poll){var C=-1;if(a){var k=t?HEAP32[a>>>2>>>0]:0,P=t?HEAP32[a+4>>>2>>>0]:0;C=(k+P/1e6)*1e3}L=A.stream_ops.poll(A,C)}L&1&&F(E,l,u,x)&&(E<32?m=m|x:h=h|x,o++),L&4&&F(E,_,d,x)&&(E<32?g=g|x:v=v|x,o++),L&2&&F(E,f,p,x)&&(E<32?y=y|x:S=S|x,o++)}}return t&&(HEAP32[t>>>2>>>0]=m,HEAP32[t+4>>>2>>>0]=h),r&&(HEAP32[r>>>2>>>0]=g,HEAP32[r+4>>>2>>>0]=v),n&&(HEAP32[n>>>2>>>0]=y,HEAP32[n+4>>>2>>>0]=S),o}catch(T){if(typeof FS>"u"||T.name!=="ErrnoError")throw T;return-T.errno}};___syscall__newselect.sig="iipppp";var SOCKFS={websocketArgs:{},callbacks:{},on(e,t){SOCKFS.callbacks[e]=t},emit(e,t){var r,n;(n=(r=SOCKFS.callbacks)[e])==null||n.call(r,t)},mount(e){var t;return SOCKFS.websocketArgs=Module.websocket||{},((t=Module.websocket)!=null?t:Module.websocket={}).on=SOCKFS.on,FS.createNode(null,"/",16895,0)},createSocket(e,t,r){t&=-526337;var n=t==1;if(n&&r&&r!=6)throw new FS.ErrnoError(66);var a={family:e,type:t,protocol:r,server:null,error:null,peers:{},pending:[],recv_queue:[],sock_ops:SOCKFS.websocket_sock_ops},o=SOCKFS.nextname(),l=FS.createNode(SOCKFS.root,o,49152,0);l.sock=a;var u=FS.createStream({path:o,node:l,flags:2,seekable:!1,stream_ops:SOCKFS.stream_ops});return a.stream=u,a},getSocket(e){var t=FS.getStream(e);return!t||!FS.isSocket(t.node.mode)?null:t.node.sock},stream_ops:{poll(e){var t=e.node.sock;return t.sock_ops.poll(t)},ioctl(e,t,r){var n=e.node.sock;return n.sock_ops.ioctl(n,t,r)},read(e,t,r,n,a){var o=e.node.sock,l=o.sock_ops.recvmsg(o,n);return l?(t.set(l.buffer,r),l.buffer.length):0},write(e,t,r,n,a){var o=e.node.sock;return o.sock_ops.sendmsg(o,t,r,n)},close(e){var t=e.node.sock;t.sock_ops.close(t)}},nextname(){return SOCKFS.nextname.current||(SOCKFS.nextname.current=0),"socket["+SOCKFS.nextname.current+++"]"},websocket_sock_ops:{createPeer(e,t,r){var n;if(typeof t=="object"&&(n=t,t=null,r=null),n)if(n._socket)t=n._socket.remoteAddress,r=n._socket.remotePort;else{var a=/ws[s]?:\/\/([^:]+):(\d+)/.exec(n.url);if(!a)throw new Error("WebSocket URL must be in the format ws(s)://address:port");t=a[1],r=parseInt(a[2],10)}else try{var o="ws:#".replace("#","//"),l="binary",u=void 0;if(SOCKFS.websocketArgs.url&&(o=SOCKFS.websocketArgs.url),SOCKFS.websocketArgs.subprotocol?l=SOCKFS.websocketArgs.subprotocol:SOCKFS.websocketArgs.subprotocol===null&&(l="null"),o==="ws://"||o==="wss://"){var _=t.split("/");o=o+_[0]+":"+r+"/"+_.slice(1).join("/")}l!=="null"&&(l=l.replace(/^ +| +$/g,"").split(/ *, */),u=l);var d;ENVIRONMENT_IS_NODE?d=To():d=WebSocket,n=new d(o,u),n.binaryType="arraybuffer"}catch(p){throw new FS.ErrnoError(23)}var f={addr:t,port:r,socket:n,msg_send_queue:[]};return SOCKFS.websocket_sock_ops.addPeer(e,f),SOCKFS.websocket_sock_ops.handlePeerEvents(e,f),e.type===2&&typeof e.sport<"u"&&f.msg_send_queue.push(new Uint8Array([255,255,255,255,112,111,114,116,(e.sport&65280)>>8,e.sport&255])),f},getPeer(e,t,r){return e.peers[t+":"+r]},addPeer(e,t){e.peers[t.addr+":"+t.port]=t},removePeer(e,t){delete e.peers[t.addr+":"+t.port]},handlePeerEvents(e,t){var r=!0,n=function(){e.connecting=!1,SOCKFS.emit("open",e.stream.fd);try{for(var o=t.msg_send_queue.shift();o;)t.socket.send(o),o=t.msg_send_queue.shift()}catch(l){t.socket.close()}};function a(o){if(typeof o=="string"){var l=new TextEncoder;o=l.encode(o)}else{if(assert(o.byteLength!==void 0),o.byteLength==0)return;o=new Uint8Array(o)}var u=r;if(r=!1,u&&o.length===10&&o[0]===255&&o[1]===255&&o[2]===255&&o[3]===255&&o[4]===112&&o[5]===111&&o[6]===114&&o[7]===116){var _=o[8]<<8|o[9];SOCKFS.websocket_sock_ops.removePeer(e,t),t.port=_,SOCKFS.websocket_sock_ops.addPeer(e,t);return}e.recv_queue.push({addr:t.addr,port:t.port,data:o}),SOCKFS.emit("message",e.stream.fd)}ENVIRONMENT_IS_NODE?(t.socket.on("open",n),t.socket.on("message",function(o,l){l&&a(new Uint8Array(o).buffer)}),t.socket.on("close",function(){SOCKFS.emit("close",e.stream.fd)}),t.socket.on("error",function(o){e.error=14,SOCKFS.emit("error",[e.stream.fd,e.error,"ECONNREFUSED: Connection refused"])})):(t.socket.onopen=n,t.socket.onclose=function(){SOCKFS.emit("close",e.stream.fd)},t.socket.onmessage=function(l){a(l.data)},t.socket.onerror=function(o){e.error=14,SOCKFS.emit("error",[e.stream.fd,e.error,"ECONNREFUSED: Connection refused"])})},poll(e){if(e.type===1&&e.server)return e.pending.length?65:0;var t=0,r=e.type===1?SOCKFS.websocket_sock_ops.getPeer(e,e.daddr,e.dport):null;return(e.recv_queue.length||!r||r&&r.socket.readyState===r.socket.CLOSING||r&&r.socket.readyState===r.socket.CLOSED)&&(t|=65),(!r||r&&r.socket.readyState===r.socket.OPEN)&&(t|=4),(r&&r.socket.readyState===r.socket.CLOSING||r&&r.socket.readyState===r.socket.CLOSED)&&(e.connecting?t|=4:t|=16),t},ioctl(e,t,r){switch(t){case 21531:var n=0;return e.recv_queue.length&&(n=e.recv_queue[0].data.length),HEAP32[r>>>2>>>0]=n,0;default:return 28}},close(e){if(e.server){try{e.server.close()}catch(a){}e.server=null}for(var t=Object.keys(e.peers),r=0;r<t.length;r++){var n=e.peers[t[r]];try{n.socket.close()}catch(a){}SOCKFS.websocket_sock_ops.removePeer(e,n)}return 0},bind(e,t,r){if(typeof e.saddr<"u"||typeof e.sport<"u")throw new FS.ErrnoError(28);if(e.saddr=t,e.sport=r,e.type===2){e.server&&(e.server.close(),e.server=null);try{e.sock_ops.listen(e,0)}catch(n){if(n.name!=="ErrnoError"||n.errno!==138)throw n}}},connect(e,t,r){if(e.server)throw new FS.ErrnoError(138);if(typeof e.daddr<"u"&&typeof e.dport<"u"){var n=SOCKFS.websocket_sock_ops.getPeer(e,e.daddr,e.dport);if(n)throw n.socket.readyState===n.socket.CONNECTING?new FS.ErrnoError(7):new FS.ErrnoError(30)}var a=SOCKFS.websocket_sock_ops.createPeer(e,t,r);e.daddr=a.addr,e.dport=a.port,e.connecting=!0},listen(e,t){if(!ENVIRONMENT_IS_NODE)throw new FS.ErrnoError(138);if(e.server)throw new FS.ErrnoError(28);var r=To().Server,n=e.saddr;e.server=new r({host:n,port:e.sport}),SOCKFS.emit("listen",e.stream.fd),e.server.on("connection",function(a){if(e.type===1){var o=SOCKFS.createSocket(e.family,e.type,e.protocol),l=SOCKFS.websocket_sock_ops.createPeer(o,a);o.daddr=l.addr,o.dport=l.port,e.pending.push(o),SOCKFS.emit("connection",o.stream.fd)}else SOCKFS.websocket_sock_ops.createPeer(e,a),SOCKFS.emit("connection",e.stream.fd)}),e.server.on("close",function(){SOCKFS.emit("close",e.stream.fd),e.server=null}),e.server.on("error",function(a){e.error=23,SOCKFS.emit("error",[e.stream.fd,e.error,"EHOSTUNREACH: Host is unreachable"])})},accept(e){if(!e.server||!e.pending.length)throw new FS.ErrnoError(28);var t=e.pending.shift();return t.stream.flags=e.stream.flags,t},getname(e,t){var r,n;if(t){if(e.daddr===void 0||e.dport===void 0)throw new FS.ErrnoError(53);r=e.daddr,n=e.dport}else r=e.saddr||0,n=e.sport||0;return{addr:r,port:n}},sendmsg(e,t,r,n,a,o){if(e.type===2){if((a===void 0||o===void 0)&&(a=e.daddr,o=e.dport),a===void 0||o===void 0)throw new FS.ErrnoError(17)}else a=e.daddr,o=e.dport;var l=SOCKFS.websocket_sock_ops.getPeer(e,a,o);if(e.type===1&&(!l||l.socket.readyState===l.socket.CLOSING||l.socket.readyState===l.socket.CLOSED))throw new FS.ErrnoError(53);ArrayBuffer.isView(t)&&(r+=t.byteOffset,t=t.buffer);var u;if(u=t.slice(r,r+n),!l||l.socket.readyState!==l.socket.OPEN)return e.type===2&&(!l||l.socket.readyState===l.socket.CLOSING||l.socket.readyState===l.socket.CLOSED)&&(l=SOCKFS.websocket_sock_ops.createPeer(e,a,o)),l.msg_send_queue.push(u),n;try{return l.socket.send(u),n}catch(_){throw new FS.ErrnoError(28)}},recvmsg(e,t){if(e.type===1&&e.server)throw new FS.ErrnoError(53);var r=e.recv_queue.shift();if(!r){if(e.type===1){var n=SOCKFS.websocket_sock_ops.getPeer(e,e.daddr,e.dport);if(!n)throw new FS.ErrnoError(53);if(n.socket.readyState===n.socket.CLOSING||n.socket.readyState===n.socket.CLOSED)return null;throw new FS.ErrnoError(6)}throw new FS.ErrnoError(6)}var a=r.data.byteLength||r.data.length,o=r.data.byteOffset||0,l=r.data.buffer||r.data,u=Math.min(t,a),_={buffer:new Uint8Array(l,o,u),addr:r.addr,port:r.port};if(e.type===1&&u<a){var d=a-u;r.data=new Uint8Array(l,o+u,d),e.recv_queue.unshift(r)}return _}}},getSocketFromFD=e=>{var t=SOCKFS.getSocket(e);if(!t)throw new FS.ErrnoError(8);return t},Sockets={BUFFER_SIZE:10240,MAX_BUFFER_SIZE:10485760,nextFd:1,fds:{},nextport:1,maxport:65535,peer:null,connections:{},portmap:{},localAddr:4261412874,addrPool:[33554442,50331658,67108874,83886090,100663306,117440522,134217738,150994954,167772170,184549386,201326602,218103818,234881034]},inetPton4=e=>{for(var t=e.split("."),r=0;r<4;r++){var n=Number(t[r]);if(isNaN(n))return null;t[r]=n}return(t[0]|t[1]<<8|t[2]<<16|t[3]<<24)>>>0},jstoi_q=e=>parseInt(e),inetPton6=e=>{var t,r,n,a,o,l=/^((?=.*::)(?!.*::.+::)(::)?([\dA-F]{1,4}:(:|\b)|){5}|([\dA-F]{1,4}:){6})((([\dA-F]{1,4}((?!\3)::|:\b|$))|(?!\2\3)){2}|(((2[0-4]|1\d|[1-9])?\d|25[0-5])\.?\b){4})$/i,u=[];if(!l.test(e))return null;if(e==="::")return[0,0,0,0,0,0,0,0];for(e.startsWith("::")?e=e.replace("::","Z:"):e=e.replace("::",":Z:"),e.indexOf(".")>0?(e=e.replace(new RegExp("[.]","g"),":"),t=e.split(":"),t[t.length-4]=jstoi_q(t[t.length-4])+jstoi_q(t[t.length-3])*256,t[t.length-3]=jstoi_q(t[t.length-2])+jstoi_q(t[t.length-1])*256,t=t.slice(0,t.length-2)):t=e.split(":"),n=0,a=0,r=0;r<t.length;r++)if(typeof t[r]=="string")if(t[r]==="Z"){for(a=0;a<8-t.length+1;a++)u[r+a]=0;n=a-1}else u[r+n]=_htons(parseInt(t[r],16));else u[r+n]=t[r];return[u[1]<<16|u[0],u[3]<<16|u[2],u[5]<<16|u[4],u[7]<<16|u[6]]},writeSockaddr=(e,t,r,n,a)=>{switch(t){case 2:r=inetPton4(r),zeroMemory(e,16),a&&(HEAP32[a>>>2>>>0]=16),HEAP16[e>>>1>>>0]=t,HEAP32[e+4>>>2>>>0]=r,HEAP16[e+2>>>1>>>0]=_htons(n);break;case 10:r=inetPton6(r),zeroMemory(e,28),a&&(HEAP32[a>>>2>>>0]=28),HEAP32[e>>>2>>>0]=t,HEAP32[e+8>>>2>>>0]=r[0],HEAP32[e+12>>>2>>>0]=r[1],HEAP32[e+16>>>2>>>0]=r[2],HEAP32[e+20>>>2>>>0]=r[3],HEAP16[e+2>>>1>>>0]=_htons(n);break;default:return 5}return 0},DNS={address_map:{id:1,addrs:{},names:{}},lookup_name(e){var t=inetPton4(e);if(t!==null||(t=inetPton6(e),t!==null))return e;var r;if(DNS.address_map.addrs[e])r=DNS.address_map.addrs[e];else{var n=DNS.address_map.id++;assert(n<65535,"exceeded max address mappings of 65535"),r="172.29."+(n&255)+"."+(n&65280),DNS.address_map.names[r]=e,DNS.address_map.addrs[e]=r}return r},lookup_addr(e){return DNS.address_map.names[e]?DNS.address_map.names[e]:null}};function ___syscall_accept4(e,t,r,n,a,o){t>>>=0,r>>>=0;try{var l=getSocketFromFD(e),u=l.sock_ops.accept(l);if(t)var _=writeSockaddr(t,u.family,DNS.lookup_name(u.daddr),u.dport,r);return u.stream.fd}catch(d){if(typeof FS>"u"||d.name!=="ErrnoError")throw d;return-d.errno}}___syscall_accept4.sig="iippiii";var inetNtop4=e=>(e&255)+"."+(e>>8&255)+"."+(e>>16&255)+"."+(e>>24&255),inetNtop6=e=>{var t="",r=0,n=0,a=0,o=0,l=0,u=0,_=[e[0]&65535,e[0]>>16,e[1]&65535,e[1]>>16,e[2]&65535,e[2]>>16,e[3]&65535,e[3]>>16],d=!0,f="";for(u=0;u<5;u++)if(_[u]!==0){d=!1;break}if(d){if(f=inetNtop4(_[6]|_[7]<<16),_[5]===-1)return t="::ffff:",t+=f,t;if(_[5]===0)return t="::",f==="0.0.0.0"&&(f=""),f==="0.0.0.1"&&(f="1"),t+=f,t}for(r=0;r<8;r++)_[r]===0&&(r-a>1&&(l=0),a=r,l++),l>n&&(n=l,o=r-n+1);for(r=0;r<8;r++){if(n>1&&_[r]===0&&r>=o&&r<o+n){r===o&&(t+=":",o===0&&(t+=":"));continue}t+=Number(_ntohs(_[r]&65535)).toString(16),t+=r<7?":":""}return t},readSockaddr=(e,t)=>{var r=HEAP16[e>>>1>>>0],n=_ntohs(HEAPU16[e+2>>>1>>>0]),a;switch(r){case 2:if(t!==16)return{errno:28};a=HEAP32[e+4>>>2>>>0],a=inetNtop4(a);break;case 10:if(t!==28)return{errno:28};a=[HEAP32[e+8>>>2>>>0],HEAP32[e+12>>>2>>>0],HEAP32[e+16>>>2>>>0],HEAP32[e+20>>>2>>>0]],a=inetNtop6(a);break;default:return{errno:5}}return{family:r,addr:a,port:n}},getSocketAddress=(e,t)=>{var r=readSockaddr(e,t);if(r.errno)throw new FS.ErrnoError(r.errno);return r.addr=DNS.lookup_addr(r.addr)||r.addr,r};function ___syscall_bind(e,t,r,n,a,o){t>>>=0,r>>>=0;try{var l=getSocketFromFD(e),u=getSocketAddress(t,r);return l.sock_ops.bind(l,u.addr,u.port),0}catch(_){if(typeof FS>"u"||_.name!=="ErrnoError")throw _;return-_.errno}}___syscall_bind.sig="iippiii";function ___syscall_chdir(e){e>>>=0;try{return e=SYSCALLS.getStr(e),FS.chdir(e),0}catch(t){if(typeof FS>"u"||t.name!=="ErrnoError")throw t;return-t.errno}}___syscall_chdir.sig="ip";function ___syscall_chmod(e,t){e>>>=0;try{return e=SYSCALLS.getStr(e),FS.chmod(e,t),0}catch(r){if(typeof FS>"u"||r.name!=="ErrnoError")throw r;return-r.errno}}___syscall_chmod.sig="ipi";function ___syscall_connect(e,t,r,n,a,o){t>>>=0,r>>>=0;try{var l=getSocketFromFD(e),u=getSocketAddress(t,r);return l.sock_ops.connect(l,u.addr,u.port),0}catch(_){if(typeof FS>"u"||_.name!=="ErrnoError")throw _;return-_.errno}}___syscall_connect.sig="iippiii";function ___syscall_dup(e){try{var t=SYSCALLS.getStreamFromFD(e);return FS.dupStream(t).fd}catch(r){if(typeof FS>"u"||r.name!=="ErrnoError")throw r;return-r.errno}}___syscall_dup.sig="ii";function ___syscall_dup3(e,t,r){try{var n=SYSCALLS.getStreamFromFD(e);if(n.fd===t)return-28;if(t<0||t>=FS.MAX_OPEN_FDS)return-8;var a=FS.getStream(t);return a&&FS.close(a),FS.dupStream(n,t).fd}catch(o){if(typeof FS>"u"||o.name!=="ErrnoError")throw o;return-o.errno}}___syscall_dup3.sig="iiii";function ___syscall_faccessat(e,t,r,n){t>>>=0;try{if(t=SYSCALLS.getStr(t),t=SYSCALLS.calculateAt(e,t),r&-8)return-28;var a=FS.lookupPath(t,{follow:!0}),o=a.node;if(!o)return-44;var l="";return r&4&&(l+="r"),r&2&&(l+="w"),r&1&&(l+="x"),l&&FS.nodePermissions(o,l)?-2:0}catch(u){if(typeof FS>"u"||u.name!=="ErrnoError")throw u;return-u.errno}}___syscall_faccessat.sig="iipii";var ___syscall_fadvise64=(e,t,r,n)=>0;___syscall_fadvise64.sig="iiiiiii";function ___syscall_fallocate(e,t,r,n,a,o){var l=convertI32PairToI53Checked(r,n),u=convertI32PairToI53Checked(a,o);try{if(isNaN(l))return 61;var _=SYSCALLS.getStreamFromFD(e);return FS.allocate(_,l,u),0}catch(d){if(typeof FS>"u"||d.name!=="ErrnoError")throw d;return-d.errno}}___syscall_fallocate.sig="iiiiiii";function ___syscall_fchdir(e){try{var t=SYSCALLS.getStreamFromFD(e);return FS.chdir(t.path),0}catch(r){if(typeof FS>"u"||r.name!=="ErrnoError")throw r;return-r.errno}}___syscall_fchdir.sig="ii";function ___syscall_fchmod(e,t){try{return FS.fchmod(e,t),0}catch(r){if(typeof FS>"u"||r.name!=="ErrnoError")throw r;return-r.errno}}___syscall_fchmod.sig="iii";function ___syscall_fchmodat2(e,t,r,n){t>>>=0;try{var a=n&256;return t=SYSCALLS.getStr(t),t=SYSCALLS.calculateAt(e,t),FS.chmod(t,r,a),0}catch(o){if(typeof FS>"u"||o.name!=="ErrnoError")throw o;return-o.errno}}___syscall_fchmodat2.sig="iipii";function ___syscall_fchown32(e,t,r){try{return FS.fchown(e,t,r),0}catch(n){if(typeof FS>"u"||n.name!=="ErrnoError")throw n;return-n.errno}}___syscall_fchown32.sig="iiii";function ___syscall_fchownat(e,t,r,n,a){t>>>=0;try{t=SYSCALLS.getStr(t);var o=a&256;return a=a&-257,t=SYSCALLS.calculateAt(e,t),(o?FS.lchown:FS.chown)(t,r,n),0}catch(l){if(typeof FS>"u"||l.name!=="ErrnoError")throw l;return-l.errno}}___syscall_fchownat.sig="iipiii";var syscallGetVarargI=()=>{var e=HEAP32[+SYSCALLS.varargs>>>2>>>0];return SYSCALLS.varargs+=4,e},syscallGetVarargP=syscallGetVarargI;function ___syscall_fcntl64(e,t,r){r>>>=0,SYSCALLS.varargs=r;try{var n=SYSCALLS.getStreamFromFD(e);switch(t){case 0:{var a=syscallGetVarargI();if(a<0)return-28;for(;FS.streams[a];)a++;var o;return o=FS.dupStream(n,a),o.fd}case 1:case 2:return 0;case 3:return n.flags;case 4:{var a=syscallGetVarargI();return n.flags|=a,0}case 12:{var a=syscallGetVarargP(),l=0;return HEAP16[a+l>>>1>>>0]=2,0}case 13:case 14:return 0}return-28}catch(u){if(typeof FS>"u"||u.name!=="ErrnoError")throw u;return-u.errno}}___syscall_fcntl64.sig="iiip";function ___syscall_fdatasync(e){try{var t=SYSCALLS.getStreamFromFD(e);return 0}catch(r){if(typeof FS>"u"||r.name!=="ErrnoError")throw r;return-r.errno}}___syscall_fdatasync.sig="ii";function ___syscall_fstat64(e,t){t>>>=0;try{var r=SYSCALLS.getStreamFromFD(e);return SYSCALLS.doStat(FS.stat,r.path,t)}catch(n){if(typeof FS>"u"||n.name!=="ErrnoError")throw n;return-n.errno}}___syscall_fstat64.sig="iip";function ___syscall_statfs64(e,t,r){e>>>=0,t>>>=0,r>>>=0;try{return e=SYSCALLS.getStr(e),HEAP32[r+4>>>2>>>0]=4096,HEAP32[r+40>>>2>>>0]=4096,HEAP32[r+8>>>2>>>0]=1e6,HEAP32[r+12>>>2>>>0]=5e5,HEAP32[r+16>>>2>>>0]=5e5,HEAP32[r+20>>>2>>>0]=FS.nextInode,HEAP32[r+24>>>2>>>0]=1e6,HEAP32[r+28>>>2>>>0]=42,HEAP32[r+44>>>2>>>0]=2,HEAP32[r+36>>>2>>>0]=255,0}catch(n){if(typeof FS>"u"||n.name!=="ErrnoError")throw n;return-n.errno}}___syscall_statfs64.sig="ippp";function ___syscall_fstatfs64(e,t,r){t>>>=0,r>>>=0;try{var n=SYSCALLS.getStreamFromFD(e);return ___syscall_statfs64(0,t,r)}catch(a){if(typeof FS>"u"||a.name!=="ErrnoError")throw a;return-a.errno}}___syscall_fstatfs64.sig="iipp";function ___syscall_ftruncate64(e,t,r){var n=convertI32PairToI53Checked(t,r);try{return isNaN(n)?61:(FS.ftruncate(e,n),0)}catch(a){if(typeof FS>"u"||a.name!=="ErrnoError")throw a;return-a.errno}}___syscall_ftruncate64.sig="iiii";var stringToUTF8=(e,t,r)=>stringToUTF8Array(e,HEAPU8,t,r);Module.stringToUTF8=stringToUTF8;function ___syscall_getcwd(e,t){e>>>=0,t>>>=0;try{if(t===0)return-28;var r=FS.cwd(),n=lengthBytesUTF8(r)+1;return t<n?-68:(stringToUTF8(r,e,t),n)}catch(a){if(typeof FS>"u"||a.name!=="ErrnoError")throw a;return-a.errno}}___syscall_getcwd.sig="ipp";function ___syscall_getdents64(e,t,r){t>>>=0,r>>>=0;try{var n=SYSCALLS.getStreamFromFD(e);n.getdents||(n.getdents=FS.readdir(n.path));for(var a=280,o=0,l=FS.llseek(n,0,1),u=Math.floor(l/a);u<n.getdents.length&&o+a<=r;){var _,d,f=n.getdents[u];if(f===".")_=n.node.id,d=4;else if(f===".."){var p=FS.lookupPath(n.path,{parent:!0});_=p.node.id,d=4}else{var m=FS.lookupNode(n.node,f);_=m.id,d=FS.isChrdev(m.mode)?2:FS.isDir(m.mode)?4:FS.isLink(m.mode)?10:8}tempI64=[_>>>0,(tempDouble=_,+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)],HEAP32[t+o>>>2>>>0]=tempI64[0],HEAP32[t+o+4>>>2>>>0]=tempI64[1],tempI64=[(u+1)*a>>>0,(tempDouble=(u+1)*a,+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)],HEAP32[t+o+8>>>2>>>0]=tempI64[0],HEAP32[t+o+12>>>2>>>0]=tempI64[1],HEAP16[t+o+16>>>1>>>0]=280,HEAP8[t+o+18>>>0]=d,stringToUTF8(f,t+o+19,256),o+=a,u+=1}return FS.llseek(n,u*a,0),o}catch(h){if(typeof FS>"u"||h.name!=="ErrnoError")throw h;return-h.errno}}___syscall_getdents64.sig="iipp";function ___syscall_getpeername(e,t,r,n,a,o){t>>>=0,r>>>=0;try{var l=getSocketFromFD(e);if(!l.daddr)return-53;var u=writeSockaddr(t,l.family,DNS.lookup_name(l.daddr),l.dport,r);return 0}catch(_){if(typeof FS>"u"||_.name!=="ErrnoError")throw _;return-_.errno}}___syscall_getpeername.sig="iippiii";function ___syscall_getsockname(e,t,r,n,a,o){t>>>=0,r>>>=0;try{var l=getSocketFromFD(e),u=writeSockaddr(t,l.family,DNS.lookup_name(l.saddr||"0.0.0.0"),l.sport,r);return 0}catch(_){if(typeof FS>"u"||_.name!=="ErrnoError")throw _;return-_.errno}}___syscall_getsockname.sig="iippiii";function ___syscall_getsockopt(e,t,r,n,a,o){n>>>=0,a>>>=0;try{var l=getSocketFromFD(e);return t===1&&r===4?(HEAP32[n>>>2>>>0]=l.error,HEAP32[a>>>2>>>0]=4,l.error=null,0):-50}catch(u){if(typeof FS>"u"||u.name!=="ErrnoError")throw u;return-u.errno}}___syscall_getsockopt.sig="iiiippi";function ___syscall_ioctl(e,t,r){r>>>=0,SYSCALLS.varargs=r;try{var n=SYSCALLS.getStreamFromFD(e);switch(t){case 21509:return n.tty?0:-59;case 21505:{if(!n.tty)return-59;if(n.tty.ops.ioctl_tcgets){var a=n.tty.ops.ioctl_tcgets(n),o=syscallGetVarargP();HEAP32[o>>>2>>>0]=a.c_iflag||0,HEAP32[o+4>>>2>>>0]=a.c_oflag||0,HEAP32[o+8>>>2>>>0]=a.c_cflag||0,HEAP32[o+12>>>2>>>0]=a.c_lflag||0;for(var l=0;l<32;l++)HEAP8[o+l+17>>>0]=a.c_cc[l]||0;return 0}return 0}case 21510:case 21511:case 21512:return n.tty?0:-59;case 21506:case 21507:case 21508:{if(!n.tty)return-59;if(n.tty.ops.ioctl_tcsets){for(var o=syscallGetVarargP(),u=HEAP32[o>>>2>>>0],_=HEAP32[o+4>>>2>>>0],d=HEAP32[o+8>>>2>>>0],f=HEAP32[o+12>>>2>>>0],p=[],l=0;l<32;l++)p.push(HEAP8[o+l+17>>>0]);return n.tty.ops.ioctl_tcsets(n.tty,t,{c_iflag:u,c_oflag:_,c_cflag:d,c_lflag:f,c_cc:p})}return 0}case 21519:{if(!n.tty)return-59;var o=syscallGetVarargP();return HEAP32[o>>>2>>>0]=0,0}case 21520:return n.tty?-28:-59;case 21531:{var o=syscallGetVarargP();return FS.ioctl(n,t,o)}case 21523:{if(!n.tty)return-59;if(n.tty.ops.ioctl_tiocgwinsz){var m=n.tty.ops.ioctl_tiocgwinsz(n.tty),o=syscallGetVarargP();HEAP16[o>>>1>>>0]=m[0],HEAP16[o+2>>>1>>>0]=m[1]}return 0}case 21524:return n.tty?0:-59;case 21515:return n.tty?0:-59;default:return-28}}catch(h){if(typeof FS>"u"||h.name!=="ErrnoError")throw h;return-h.errno}}___syscall_ioctl.sig="iiip";function ___syscall_listen(e,t){try{var r=getSocketFromFD(e);return r.sock_ops.listen(r,t),0}catch(n){if(typeof FS>"u"||n.name!=="ErrnoError")throw n;return-n.errno}}___syscall_listen.sig="iiiiiii";function ___syscall_lstat64(e,t){e>>>=0,t>>>=0;try{return e=SYSCALLS.getStr(e),SYSCALLS.doStat(FS.lstat,e,t)}catch(r){if(typeof FS>"u"||r.name!=="ErrnoError")throw r;return-r.errno}}___syscall_lstat64.sig="ipp";function ___syscall_mkdirat(e,t,r){t>>>=0;try{return t=SYSCALLS.getStr(t),t=SYSCALLS.calculateAt(e,t),t=PATH.normalize(t),t[t.length-1]==="/"&&(t=t.substr(0,t.length-1)),FS.mkdir(t,r,0),0}catch(n){if(typeof FS>"u"||n.name!=="ErrnoError")throw n;return-n.errno}}___syscall_mkdirat.sig="iipi";function ___syscall_mknodat(e,t,r,n){t>>>=0;try{switch(t=SYSCALLS.getStr(t),t=SYSCALLS.calculateAt(e,t),r&61440){case 32768:case 8192:case 24576:case 4096:case 49152:break;default:return-28}return FS.mknod(t,r,n),0}catch(a){if(typeof FS>"u"||a.name!=="ErrnoError")throw a;return-a.errno}}___syscall_mknodat.sig="iipii";function ___syscall_newfstatat(e,t,r,n){t>>>=0,r>>>=0;try{t=SYSCALLS.getStr(t);var a=n&256,o=n&4096;return n=n&-6401,t=SYSCALLS.calculateAt(e,t,o),SYSCALLS.doStat(a?FS.lstat:FS.stat,t,r)}catch(l){if(typeof FS>"u"||l.name!=="ErrnoError")throw l;return-l.errno}}___syscall_newfstatat.sig="iippi";function ___syscall_openat(e,t,r,n){t>>>=0,n>>>=0,SYSCALLS.varargs=n;try{t=SYSCALLS.getStr(t),t=SYSCALLS.calculateAt(e,t);var a=n?syscallGetVarargI():0;return FS.open(t,r,a).fd}catch(o){if(typeof FS>"u"||o.name!=="ErrnoError")throw o;return-o.errno}}___syscall_openat.sig="iipip";var PIPEFS={BUCKET_BUFFER_SIZE:8192,mount(e){return FS.createNode(null,"/",16895,0)},createPipe(){var e={buckets:[],refcnt:2};e.buckets.push({buffer:new Uint8Array(PIPEFS.BUCKET_BUFFER_SIZE),offset:0,roffset:0});var t=PIPEFS.nextname(),r=PIPEFS.nextname(),n=FS.createNode(PIPEFS.root,t,4096,0),a=FS.createNode(PIPEFS.root,r,4096,0);n.pipe=e,a.pipe=e;var o=FS.createStream({path:t,node:n,flags:0,seekable:!1,stream_ops:PIPEFS.stream_ops});n.stream=o;var l=FS.createStream({path:r,node:a,flags:1,seekable:!1,stream_ops:PIPEFS.stream_ops});return a.stream=l,{readable_fd:o.fd,writable_fd:l.fd}},stream_ops:{poll(e){var t=e.node.pipe;if((e.flags&2097155)===1)return 260;if(t.buckets.length>0)for(var r=0;r<t.buckets.length;r++){var n=t.buckets[r];if(n.offset-n.roffset>0)return 65}return 0},ioctl(e,t,r){return 28},fsync(e){return 28},read(e,t,r,n,a){for(var o=e.node.pipe,l=0,u=0;u<o.buckets.length;u++){var _=o.buckets[u];l+=_.offset-_.roffset}var d=t.subarray(r,r+n);if(n<=0)return 0;if(l==0)throw new FS.ErrnoError(6);for(var f=Math.min(l,n),p=f,m=0,u=0;u<o.buckets.length;u++){var h=o.buckets[u],g=h.offset-h.roffset;if(f<=g){var v=h.buffer.subarray(h.roffset,h.offset);f<g?(v=v.subarray(0,f),h.roffset+=f):m++,d.set(v);break}else{var v=h.buffer.subarray(h.roffset,h.offset);d.set(v),d=d.subarray(v.byteLength),f-=v.byteLength,m++}}return m&&m==o.buckets.length&&(m--,o.buckets[m].offset=0,o.buckets[m].roffset=0),o.buckets.splice(0,m),p},write(e,t,r,n,a){var o=e.node.pipe,l=t.subarray(r,r+n),u=l.byteLength;if(u<=0)return 0;var _=null;o.buckets.length==0?(_={buffer:new Uint8Array(PIPEFS.BUCKET_BUFFER_SIZE),offset:0,roffset:0},o.buckets.push(_)):_=o.buckets[o.buckets.length-1],assert(_.offset<=PIPEFS.BUCKET_BUFFER_SIZE);var d=PIPEFS.BUCKET_BUFFER_SIZE-_.offset;if(d>=u)return _.buffer.set(l,_.offset),_.offset+=u,u;d>0&&(_.buffer.set(l.subarray(0,d),_.offset),_.offset+=d,l=l.subarray(d,l.byteLength));for(var f=l.byteLength/PIPEFS.BUCKET_BUFFER_SIZE|0,p=l.byteLength%PIPEFS.BUCKET_BUFFER_SIZE,m=0;m<f;m++){var h={buffer:new Uint8Array(PIPEFS.BUCKET_BUFFER_SIZE),offset:PIPEFS.BUCKET_BUFFER_SIZE,roffset:0};o.buckets.push(h),h.buffer.set(l.subarray(0,PIPEFS.BUCKET_BUFFER_SIZE)),l=l.subarray(PIPEFS.BUCKET_BUFFER_SIZE,l.byteLength)}if(p>0){var h={buffer:new Uint8Array(PIPEFS.BUCKET_BUFFER_SIZE),offset:l.byteLength,roffset:0};o.buckets.push(h),h.buffer.set(l)}return u},close(e){var t=e.node.pipe;t.refcnt--,t.refcnt===0&&(t.buckets=null)}},nextname(){return PIPEFS.nextname.current||(PIPEFS.nextname.current=0),"pipe["+PIPEFS.nextname.current+++"]"}};function ___syscall_pipe(e){e>>>=0;try{if(e==0)throw new FS.ErrnoError(21);var t=PIPEFS.createPipe();return HEAP32[e>>>2>>>0]=t.readable_fd,HEAP32[e+4>>>2>>>0]=t.writable_fd,0}catch(r){if(typeof FS>"u"||r.name!=="ErrnoError")throw r;return-r.errno}}___syscall_pipe.sig="ip";function ___syscall_poll(e,t,r){e>>>=0;try{for(var n=0,a=0;a<t;a++){var o=e+8*a,l=HEAP32[o>>>2>>>0],u=HEAP16[o+4>>>1>>>0],_=32,d=FS.getStream(l);d&&(_=SYSCALLS.DEFAULT_POLLMASK,d.stream_ops.poll&&(_=d.stream_ops.poll(d,-1))),_&=u|8|16,_&&n++,HEAP16[o+6>>>1>>>0]=_}return n}catch(f){if(typeof FS>"u"||f.name!=="ErrnoError")throw f;return-f.errno}}___syscall_poll.sig="ipii";function ___syscall_readlinkat(e,t,r,n){t>>>=0,r>>>=0,n>>>=0;try{if(t=SYSCALLS.getStr(t),t=SYSCALLS.calculateAt(e,t),n<=0)return-28;var a=FS.readlink(t),o=Math.min(n,lengthBytesUTF8(a)),l=HEAP8[r+o>>>0];return stringToUTF8(a,r,n+1),HEAP8[r+o>>>0]=l,o}catch(u){if(typeof FS>"u"||u.name!=="ErrnoError")throw u;return-u.errno}}___syscall_readlinkat.sig="iippp";function ___syscall_recvfrom(e,t,r,n,a,o){t>>>=0,r>>>=0,a>>>=0,o>>>=0;try{var l=getSocketFromFD(e),u=l.sock_ops.recvmsg(l,r);if(!u)return 0;if(a)var _=writeSockaddr(a,l.family,DNS.lookup_name(u.addr),u.port,o);return HEAPU8.set(u.buffer,t>>>0),u.buffer.byteLength}catch(d){if(typeof FS>"u"||d.name!=="ErrnoError")throw d;return-d.errno}}___syscall_recvfrom.sig="iippipp";function ___syscall_recvmsg(e,t,r,n,a,o){t>>>=0;try{for(var l=getSocketFromFD(e),u=HEAPU32[t+8>>>2>>>0],_=HEAP32[t+12>>>2>>>0],d=0,f=0;f<_;f++)d+=HEAP32[u+(8*f+4)>>>2>>>0];var p=l.sock_ops.recvmsg(l,d);if(!p)return 0;var m=HEAPU32[t>>>2>>>0];if(m)var h=writeSockaddr(m,l.family,DNS.lookup_name(p.addr),p.port);for(var g=0,v=p.buffer.byteLength,f=0;v>0&&f<_;f++){var y=HEAPU32[u+(8*f+0)>>>2>>>0],S=HEAP32[u+(8*f+4)>>>2>>>0];if(S){var w=Math.min(S,v),D=p.buffer.subarray(g,g+w);HEAPU8.set(D,y+g>>>0),g+=w,v-=w}}return g}catch(F){if(typeof FS>"u"||F.name!=="ErrnoError")throw F;return-F.errno}}___syscall_recvmsg.sig="iipiiii";function ___syscall_renameat(e,t,r,n){t>>>=0,n>>>=0;try{return t=SYSCALLS.getStr(t),n=SYSCALLS.getStr(n),t=SYSCALLS.calculateAt(e,t),n=SYSCALLS.calculateAt(r,n),FS.rename(t,n),0}catch(a){if(typeof FS>"u"||a.name!=="ErrnoError")throw a;return-a.errno}}___syscall_renameat.sig="iipip";function ___syscall_rmdir(e){e>>>=0;try{return e=SYSCALLS.getStr(e),FS.rmdir(e),0}catch(t){if(typeof FS>"u"||t.name!=="ErrnoError")throw t;return-t.errno}}___syscall_rmdir.sig="ip";function ___syscall_sendmsg(e,t,r,n,a,o){t>>>=0,n>>>=0,a>>>=0;try{var l=getSocketFromFD(e),u=HEAPU32[t+8>>>2>>>0],_=HEAP32[t+12>>>2>>>0],d,f,p=HEAPU32[t>>>2>>>0],m=HEAP32[t+4>>>2>>>0];if(p){var h=getSocketAddress(p,m);f=h.port,d=h.addr}for(var g=0,v=0;v<_;v++)g+=HEAP32[u+(8*v+4)>>>2>>>0];for(var y=new Uint8Array(g),S=0,v=0;v<_;v++)for(var w=HEAPU32[u+(8*v+0)>>>2>>>0],D=HEAP32[u+(8*v+4)>>>2>>>0],F=0;F<D;F++)y[S++]=HEAP8[w+F>>>0];return l.sock_ops.sendmsg(l,y,0,g,d,f)}catch(E){if(typeof FS>"u"||E.name!=="ErrnoError")throw E;return-E.errno}}___syscall_sendmsg.sig="iipippi";function ___syscall_sendto(e,t,r,n,a,o){t>>>=0,r>>>=0,a>>>=0,o>>>=0;try{var l=getSocketFromFD(e);if(!a)return FS.write(l.stream,HEAP8,t,r);var u=getSocketAddress(a,o);return l.sock_ops.sendmsg(l,HEAP8,t,r,u.addr,u.port)}catch(_){if(typeof FS>"u"||_.name!=="ErrnoError")throw _;return-_.errno}}___syscall_sendto.sig="iippipp";function ___syscall_socket(e,t,r){try{var n=SOCKFS.createSocket(e,t,r);return n.stream.fd}catch(a){if(typeof FS>"u"||a.name!=="ErrnoError")throw a;return-a.errno}}___syscall_socket.sig="iiiiiii";function ___syscall_stat64(e,t){e>>>=0,t>>>=0;try{return e=SYSCALLS.getStr(e),SYSCALLS.doStat(FS.stat,e,t)}catch(r){if(typeof FS>"u"||r.name!=="ErrnoError")throw r;return-r.errno}}___syscall_stat64.sig="ipp";function ___syscall_symlink(e,t){e>>>=0,t>>>=0;try{return e=SYSCALLS.getStr(e),t=SYSCALLS.getStr(t),FS.symlink(e,t),0}catch(r){if(typeof FS>"u"||r.name!=="ErrnoError")throw r;return-r.errno}}___syscall_symlink.sig="ipp";function ___syscall_symlinkat(e,t,r){e>>>=0,r>>>=0;try{return r=SYSCALLS.calculateAt(t,r),FS.symlink(e,r),0}catch(n){if(typeof FS>"u"||n.name!=="ErrnoError")throw n;return-n.errno}}___syscall_symlinkat.sig="ipip";function ___syscall_truncate64(e,t,r){e>>>=0;var n=convertI32PairToI53Checked(t,r);try{return isNaN(n)?61:(e=SYSCALLS.getStr(e),FS.truncate(e,n),0)}catch(a){if(typeof FS>"u"||a.name!=="ErrnoError")throw a;return-a.errno}}___syscall_truncate64.sig="ipii";function ___syscall_unlinkat(e,t,r){t>>>=0;try{return t=SYSCALLS.getStr(t),t=SYSCALLS.calculateAt(e,t),r===0?FS.unlink(t):r===512?FS.rmdir(t):abort("Invalid flags passed to unlinkat"),0}catch(n){if(typeof FS>"u"||n.name!=="ErrnoError")throw n;return-n.errno}}___syscall_unlinkat.sig="iipi";var readI53FromI64=e=>HEAPU32[e>>>2>>>0]+HEAP32[e+4>>>2>>>0]*4294967296;function ___syscall_utimensat(e,t,r,n){t>>>=0,r>>>=0;try{t=SYSCALLS.getStr(t),t=SYSCALLS.calculateAt(e,t,!0);var a=Date.now(),o,l;if(!r)o=a,l=a;else{var u=readI53FromI64(r),_=HEAP32[r+8>>>2>>>0];_==1073741823?o=a:_==1073741822?o=-1:o=u*1e3+_/1e6,r+=16,u=readI53FromI64(r),_=HEAP32[r+8>>>2>>>0],_==1073741823?l=a:_==1073741822?l=-1:l=u*1e3+_/1e6}return(l!=-1||o!=-1)&&FS.utime(t,o,l),0}catch(d){if(typeof FS>"u"||d.name!=="ErrnoError")throw d;return-d.errno}}___syscall_utimensat.sig="iippi";var ___table_base=new WebAssembly.Global({value:"i32",mutable:!1},1),__abort_js=()=>{abort("")};__abort_js.sig="v";var ENV={},stackAlloc=e=>__emscripten_stack_alloc(e);Module.stackAlloc=stackAlloc;var stringToUTF8OnStack=e=>{var t=lengthBytesUTF8(e)+1,r=stackAlloc(t);return stringToUTF8(e,r,t),r},dlSetError=e=>{var t=stackSave(),r=stringToUTF8OnStack(e);___dl_seterr(r,0),stackRestore(t)},dlopenInternal=(e,t)=>{var r=UTF8ToString(e+36),n=HEAP32[e+4>>>2>>>0];r=PATH.normalize(r);var a=[],o=!!(n&256),l=o?null:{},u={global:o,nodelete:!!(n&4096),loadAsync:t.loadAsync};if(t.loadAsync)return loadDynamicLibrary(r,u,l,e);try{return loadDynamicLibrary(r,u,l,e)}catch(_){return dlSetError("Could not load dynamic lib: ".concat(r,"\n").concat(_)),0}};function __dlopen_js(e){return e>>>=0,dlopenInternal(e,{loadAsync:!1})}__dlopen_js.sig="pp";function __dlsym_js(e,t,r){e>>>=0,t>>>=0,r>>>=0,t=UTF8ToString(t);var n,a,o=LDSO.loadedLibsByHandle[e];if(!o.exports.hasOwnProperty(t)||o.exports[t].stub)return dlSetError('Tried to lookup unknown symbol "'.concat(t,'" in dynamic lib: ').concat(o.name)),0;a=Object.keys(o.exports).indexOf(t);var l="orig$"+t;if(n=o.exports[l],n?a=Object.keys(o.exports).indexOf(l):n=o.exports[t],typeof n=="function"){var u=getFunctionAddress(n);u?n=u:(n=addFunction(n,n.sig),HEAPU32[r>>>2>>>0]=a)}return n}__dlsym_js.sig="pppp";function __embind_register_bigint(e,t,r,n,a){e>>>=0,t>>>=0,r>>>=0}__embind_register_bigint.sig="vpppiiii";var embind_init_charCodes=()=>{for(var e=new Array(256),t=0;t<256;++t)e[t]=String.fromCharCode(t);embind_charCodes=e},embind_charCodes,readLatin1String=e=>{for(var t="",r=e;HEAPU8[r>>>0];)t+=embind_charCodes[HEAPU8[r++>>>0]];return t},awaitingDependencies={},registeredTypes={},typeDependencies={},BindingError,throwBindingError=e=>{throw new BindingError(e)},InternalError,throwInternalError=e=>{throw new InternalError(e)},whenDependentTypesAreResolved=(e,t,r)=>{e.forEach(u=>typeDependencies[u]=t);function n(u){var _=r(u);_.length!==e.length&&throwInternalError("Mismatched type converter count");for(var d=0;d<e.length;++d)registerType(e[d],_[d])}var a=new Array(t.length),o=[],l=0;t.forEach((u,_)=>{registeredTypes.hasOwnProperty(u)?a[_]=registeredTypes[u]:(o.push(u),awaitingDependencies.hasOwnProperty(u)||(awaitingDependencies[u]=[]),awaitingDependencies[u].push(()=>{a[_]=registeredTypes[u],++l,l===o.length&&n(a)}))}),o.length===0&&n(a)};function sharedRegisterType(e,t,r={}){var n=t.name;if(e||throwBindingError('type "'.concat(n,'" must have a positive integer typeid pointer')),registeredTypes.hasOwnProperty(e)){if(r.ignoreDuplicateRegistrations)return;throwBindingError("Cannot register type '".concat(n,"' twice"))}if(registeredTypes[e]=t,delete typeDependencies[e],awaitingDependencies.hasOwnProperty(e)){var a=awaitingDependencies[e];delete awaitingDependencies[e],a.forEach(o=>o())}}function registerType(e,t,r={}){return sharedRegisterType(e,t,r)}var GenericWireTypeSize=8;function __embind_register_bool(e,t,r,n){e>>>=0,t>>>=0,t=readLatin1String(t),registerType(e,{name:t,fromWireType:function(a){return!!a},toWireType:function(a,o){return o?r:n},argPackAdvance:GenericWireTypeSize,readValueFromPointer:function(a){return this.fromWireType(HEAPU8[a>>>0])},destructorFunction:null})}__embind_register_bool.sig="vppii";var emval_freelist=[],emval_handles=[];function __emval_decref(e){e>>>=0,e>9&&--emval_handles[e+1]===0&&(emval_handles[e]=void 0,emval_freelist.push(e))}__emval_decref.sig="vp";var count_emval_handles=()=>emval_handles.length/2-5-emval_freelist.length,init_emval=()=>{emval_handles.push(0,1,void 0,1,null,1,!0,1,!1,1),Module.count_emval_handles=count_emval_handles},Emval={toValue:e=>(e||throwBindingError("Cannot use deleted val. handle = "+e),emval_handles[e]),toHandle:e=>{switch(e){case void 0:return 2;case null:return 4;case!0:return 6;case!1:return 8;default:{let t=emval_freelist.pop()||emval_handles.length;return emval_handles[t]=e,emval_handles[t+1]=1,t}}}};function readPointer(e){return this.fromWireType(HEAPU32[e>>>2>>>0])}var EmValType={name:"emscripten::val",fromWireType:e=>{var t=Emval.toValue(e);return __emval_decref(e),t},toWireType:(e,t)=>Emval.toHandle(t),argPackAdvance:GenericWireTypeSize,readValueFromPointer:readPointer,destructorFunction:null};function __embind_register_emval(e){return e>>>=0,registerType(e,EmValType)}__embind_register_emval.sig="vp";var embindRepr=e=>{if(e===null)return"null";var t=typeof e;return t==="object"||t==="array"||t==="function"?e.toString():""+e},floatReadValueFromPointer=(e,t)=>{switch(t){case 4:return function(r){return this.fromWireType(HEAPF32[r>>>2>>>0])};case 8:return function(r){return this.fromWireType(HEAPF64[r>>>3>>>0])};default:throw new TypeError("invalid float width (".concat(t,"): ").concat(e))}},__embind_register_float=function(e,t,r){e>>>=0,t>>>=0,r>>>=0,t=readLatin1String(t),registerType(e,{name:t,fromWireType:n=>n,toWireType:(n,a)=>a,argPackAdvance:GenericWireTypeSize,readValueFromPointer:floatReadValueFromPointer(t,r),destructorFunction:null})};__embind_register_float.sig="vppp";var integerReadValueFromPointer=(e,t,r)=>{switch(t){case 1:return r?n=>HEAP8[n>>>0]:n=>HEAPU8[n>>>0];case 2:return r?n=>HEAP16[n>>>1>>>0]:n=>HEAPU16[n>>>1>>>0];case 4:return r?n=>HEAP32[n>>>2>>>0]:n=>HEAPU32[n>>>2>>>0];default:throw new TypeError("invalid integer width (".concat(t,"): ").concat(e))}};function __embind_register_integer(e,t,r,n,a){e>>>=0,t>>>=0,r>>>=0,t=readLatin1String(t),a===-1&&(a=4294967295);var o=f=>f;if(n===0){var l=32-8*r;o=f=>f<<l>>>l}var u=t.includes("unsigned"),_=(f,p)=>{},d;u?d=function(f,p){return _(p,this.name),p>>>0}:d=function(f,p){return _(p,this.name),p},registerType(e,{name:t,fromWireType:o,toWireType:d,argPackAdvance:GenericWireTypeSize,readValueFromPointer:integerReadValueFromPointer(t,r,n!==0),destructorFunction:null})}__embind_register_integer.sig="vpppii";function __embind_register_memory_view(e,t,r){e>>>=0,r>>>=0;var n=[Int8Array,Uint8Array,Int16Array,Uint16Array,Int32Array,Uint32Array,Float32Array,Float64Array],a=n[t];function o(l){var u=HEAPU32[l>>>2>>>0],_=HEAPU32[l+4>>>2>>>0];return new a(HEAP8.buffer,_,u)}r=readLatin1String(r),registerType(e,{name:r,fromWireType:o,argPackAdvance:GenericWireTypeSize,readValueFromPointer:o},{ignoreDuplicateRegistrations:!0})}__embind_register_memory_view.sig="vpip";function __embind_register_std_string(e,t){e>>>=0,t>>>=0,t=readLatin1String(t);var r=t==="std::string";registerType(e,{name:t,fromWireType(n){var a=HEAPU32[n>>>2>>>0],o=n+4,l;if(r)for(var u=o,_=0;_<=a;++_){var d=o+_;if(_==a||HEAPU8[d>>>0]==0){var f=d-u,p=UTF8ToString(u,f);l===void 0?l=p:(l+="\0",l+=p),u=d+1}}else{for(var m=new Array(a),_=0;_<a;++_)m[_]=String.fromCharCode(HEAPU8[o+_>>>0]);l=m.join("")}return _free(n),l},toWireType(n,a){a instanceof ArrayBuffer&&(a=new Uint8Array(a));var o,l=typeof a=="string";l||a instanceof Uint8Array||a instanceof Uint8ClampedArray||a instanceof Int8Array||throwBindingError("Cannot pass non-string to std::string"),r&&l?o=lengthBytesUTF8(a):o=a.length;var u=_malloc(4+o+1),_=u+4;if(HEAPU32[u>>>2>>>0]=o,r&&l)stringToUTF8(a,_,o+1);else if(l)for(var d=0;d<o;++d){var f=a.charCodeAt(d);f>255&&(_free(_),throwBindingError("String has UTF-16 code units that do not fit in 8 bits")),HEAPU8[_+d>>>0]=f}else for(var d=0;d<o;++d)HEAPU8[_+d>>>0]=a[d];return n!==null&&n.push(_free,u),u},argPackAdvance:GenericWireTypeSize,readValueFromPointer:readPointer,destructorFunction(n){_free(n)}})}__embind_register_std_string.sig="vpp";var UTF16Decoder=typeof TextDecoder<"u"?new TextDecoder("utf-16le"):void 0,UTF16ToString=(e,t)=>{for(var r=e,n=r>>1,a=n+t/2;!(n>=a)&&HEAPU16[n>>>0];)++n;if(r=n<<1,r-e>32&&UTF16Decoder)return UTF16Decoder.decode(HEAPU8.subarray(e>>>0,r>>>0));for(var o="",l=0;!(l>=t/2);++l){var u=HEAP16[e+l*2>>>1>>>0];if(u==0)break;o+=String.fromCharCode(u)}return o},stringToUTF16=(e,t,r)=>{if(r!=null||(r=2147483647),r<2)return 0;r-=2;for(var n=t,a=r<e.length*2?r/2:e.length,o=0;o<a;++o){var l=e.charCodeAt(o);HEAP16[t>>>1>>>0]=l,t+=2}return HEAP16[t>>>1>>>0]=0,t-n},lengthBytesUTF16=e=>e.length*2,UTF32ToString=(e,t)=>{for(var r=0,n="";!(r>=t/4);){var a=HEAP32[e+r*4>>>2>>>0];if(a==0)break;if(++r,a>=65536){var o=a-65536;n+=String.fromCharCode(55296|o>>10,56320|o&1023)}else n+=String.fromCharCode(a)}return n},stringToUTF32=(e,t,r)=>{if(t>>>=0,r!=null||(r=2147483647),r<4)return 0;for(var n=t,a=n+r-4,o=0;o<e.length;++o){var l=e.charCodeAt(o);if(l>=55296&&l<=57343){var u=e.charCodeAt(++o);l=65536+((l&1023)<<10)|u&1023}if(HEAP32[t>>>2>>>0]=l,t+=4,t+4>a)break}return HEAP32[t>>>2>>>0]=0,t-n},lengthBytesUTF32=e=>{for(var t=0,r=0;r<e.length;++r){var n=e.charCodeAt(r);n>=55296&&n<=57343&&++r,t+=4}return t},__embind_register_std_wstring=function(e,t,r){e>>>=0,t>>>=0,r>>>=0,r=readLatin1String(r);var n,a,o,l;t===2?(n=UTF16ToString,a=stringToUTF16,l=lengthBytesUTF16,o=u=>HEAPU16[u>>>1>>>0]):t===4&&(n=UTF32ToString,a=stringToUTF32,l=lengthBytesUTF32,o=u=>HEAPU32[u>>>2>>>0]),registerType(e,{name:r,fromWireType:u=>{for(var _=HEAPU32[u>>>2>>>0],d,f=u+4,p=0;p<=_;++p){var m=u+4+p*t;if(p==_||o(m)==0){var h=m-f,g=n(f,h);d===void 0?d=g:(d+="\0",d+=g),f=m+t}}return _free(u),d},toWireType:(u,_)=>{typeof _!="string"&&throwBindingError("Cannot pass non-string to C++ string type ".concat(r));var d=l(_),f=_malloc(4+d+t);return HEAPU32[f>>>2>>>0]=d/t,a(_,f+4,d+t),u!==null&&u.push(_free,f),f},argPackAdvance:GenericWireTypeSize,readValueFromPointer:readPointer,destructorFunction(u){_free(u)}})};__embind_register_std_wstring.sig="vppp";var __embind_register_void=function(e,t){e>>>=0,t>>>=0,t=readLatin1String(t),registerType(e,{isVoid:!0,name:t,argPackAdvance:0,fromWireType:()=>{},toWireType:(r,n)=>{}})};__embind_register_void.sig="vpp";var handleException=e=>{if(e instanceof ExitStatus||e=="unwind")return EXITSTATUS;quit_(1,e)},runtimeKeepaliveCounter=0,keepRuntimeAlive=()=>noExitRuntime||runtimeKeepaliveCounter>0,_proc_exit=e=>{var t;EXITSTATUS=e,keepRuntimeAlive()||((t=Module.onExit)==null||t.call(Module,e),ABORT=!0),quit_(e,new ExitStatus(e))};_proc_exit.sig="vi";var exitJS=(e,t)=>{EXITSTATUS=e,_proc_exit(e)},_exit=exitJS;_exit.sig="vi";var maybeExit=()=>{if(!keepRuntimeAlive())try{_exit(EXITSTATUS)}catch(e){handleException(e)}},callUserCallback=e=>{if(!ABORT)try{e(),maybeExit()}catch(t){handleException(t)}};function __emscripten_dlopen_js(e,t,r,n){e>>>=0,t>>>=0,r>>>=0,n>>>=0;function a(u){var _=UTF8ToString(e+36);dlSetError("'Could not load dynamic lib: ".concat(_,"\n").concat(u)),callUserCallback(()=>getWasmTableEntry(r)(e,n))}function o(){callUserCallback(()=>getWasmTableEntry(t)(e,n))}var l=dlopenInternal(e,{loadAsync:!0});l?l.then(o,a):a()}__emscripten_dlopen_js.sig="vpppp";var nowIsMonotonic=1,__emscripten_get_now_is_monotonic=()=>nowIsMonotonic;__emscripten_get_now_is_monotonic.sig="i";var getExecutableName=()=>thisProgram||"./this.program";function __emscripten_get_progname(e,t){e>>>=0,stringToUTF8(getExecutableName(),e,t)}__emscripten_get_progname.sig="vpi";function __emscripten_lookup_name(e){e>>>=0;var t=UTF8ToString(e);return inetPton4(DNS.lookup_name(t))}__emscripten_lookup_name.sig="ip";function __emscripten_memcpy_js(e,t,r){return e>>>=0,t>>>=0,r>>>=0,HEAPU8.copyWithin(e>>>0,t>>>0,t+r>>>0)}__emscripten_memcpy_js.sig="vppp";var __emscripten_runtime_keepalive_clear=()=>{noExitRuntime=!1,runtimeKeepaliveCounter=0};__emscripten_runtime_keepalive_clear.sig="v";function __emscripten_set_offscreencanvas_size(e,t,r){return e>>>=0,-1}__emscripten_set_offscreencanvas_size.sig="ipii";function __emscripten_system(e){if(e>>>=0,ENVIRONMENT_IS_NODE){if(!e)return 1;var t=UTF8ToString(e);if(!t.length)return 0;var r=["child_process"].map(xi),n=r.spawnSync(t,[],{shell:!0,stdio:"inherit"}),a=(l,u)=>l<<8|u;if(n.status===null){var o=l=>{switch(l){case"SIGHUP":return 1;case"SIGQUIT":return 3;case"SIGFPE":return 8;case"SIGKILL":return 9;case"SIGALRM":return 14;case"SIGTERM":return 15;default:return 2}};return a(0,o(n.signal))}return a(n.status,0)}return e?-52:0}__emscripten_system.sig="ip";var __emscripten_throw_longjmp=()=>{throw 1/0};__emscripten_throw_longjmp.sig="v";var emval_symbols={},getStringOrSymbol=e=>{var t=emval_symbols[e];return t===void 0?readLatin1String(e):t},emval_methodCallers=[];function __emval_call_method(e,t,r,n,a){return e>>>=0,t>>>=0,r>>>=0,n>>>=0,a>>>=0,e=emval_methodCallers[e],t=Emval.toValue(t),r=getStringOrSymbol(r),e(t,t[r],n,a)}__emval_call_method.sig="dppppp";var emval_get_global=()=>typeof globalThis=="object"?globalThis:function(){return Function}()("return this")();function __emval_get_global(e){return e>>>=0,e===0?Emval.toHandle(emval_get_global()):(e=getStringOrSymbol(e),Emval.toHandle(emval_get_global()[e]))}__emval_get_global.sig="pp";var emval_addMethodCaller=e=>{var t=emval_methodCallers.length;return emval_methodCallers.push(e),t},getTypeName=e=>{var t=___getTypeName(e),r=readLatin1String(t);return _free(t),r},requireRegisteredType=(e,t)=>{var r=registeredTypes[e];return r===void 0&&throwBindingError("".concat(t," has unknown type ").concat(getTypeName(e))),r},emval_lookupTypes=(e,t)=>{for(var r=new Array(e),n=0;n<e;++n)r[n]=requireRegisteredType(HEAPU32[t+n*4>>>2>>>0],"parameter "+n);return r},createNamedFunction=(e,t)=>Object.defineProperty(t,"name",{value:e}),reflectConstruct=Reflect.construct,emval_returnValue=(e,t,r)=>{var n=[],a=e.toWireType(n,r);return n.length&&(HEAPU32[t>>>2>>>0]=Emval.toHandle(n)),a};function newFunc(e,t){if(!(e instanceof Function))throw new TypeError("new_ called with constructor type ".concat(typeof e," which is not a function"));var r=createNamedFunction(e.name||"unknownFunctionName",function(){});r.prototype=e.prototype;var n=new r,a=e.apply(n,t);return a instanceof Object?a:n}function __emval_get_method_caller(e,t,r){t>>>=0;var n=emval_lookupTypes(e,t),a=n.shift();e--;var o="return function (obj, func, destructorsRef, args) {\n",l=0,u=[];r===0&&u.push("obj");for(var _=["retType"],d=[a],f=0;f<e;++f)u.push("arg"+f),_.push("argType"+f),d.push(n[f]),o+="  var arg".concat(f," = argType").concat(f,".readValueFromPointer(args").concat(l?"+"+l:"",");\n"),l+=n[f].argPackAdvance;var p=r===1?"new func":"func.call";o+="  var rv = ".concat(p,"(").concat(u.join(", "),");\n"),a.isVoid||(_.push("emval_returnValue"),d.push(emval_returnValue),o+="  return emval_returnValue(retType, destructorsRef, rv);\n"),o+="};\n",_.push(o);var m=newFunc(Function,_)(...d),h="methodCaller<(".concat(n.map(g=>g.name).join(", "),") => ").concat(a.name,">");return emval_addMethodCaller(createNamedFunction(h,m))}__emval_get_method_caller.sig="pipi";var runDestructors=e=>{for(;e.length;){var t=e.pop(),r=e.pop();r(t)}};function __emval_run_destructors(e){e>>>=0;var t=Emval.toValue(e);runDestructors(t),__emval_decref(e)}__emval_run_destructors.sig="vp";function __gmtime_js(e,t,r){var n=convertI32PairToI53Checked(e,t);r>>>=0;var a=new Date(n*1e3);HEAP32[r>>>2>>>0]=a.getUTCSeconds(),HEAP32[r+4>>>2>>>0]=a.getUTCMinutes(),HEAP32[r+8>>>2>>>0]=a.getUTCHours(),HEAP32[r+12>>>2>>>0]=a.getUTCDate(),HEAP32[r+16>>>2>>>0]=a.getUTCMonth(),HEAP32[r+20>>>2>>>0]=a.getUTCFullYear()-1900,HEAP32[r+24>>>2>>>0]=a.getUTCDay();var o=Date.UTC(a.getUTCFullYear(),0,1,0,0,0,0),l=(a.getTime()-o)/(1e3*60*60*24)|0;HEAP32[r+28>>>2>>>0]=l}__gmtime_js.sig="viip";var isLeapYear=e=>e%4===0&&(e%100!==0||e%400===0),MONTH_DAYS_LEAP_CUMULATIVE=[0,31,60,91,121,152,182,213,244,274,305,335],MONTH_DAYS_REGULAR_CUMULATIVE=[0,31,59,90,120,151,181,212,243,273,304,334],ydayFromDate=e=>{var t=isLeapYear(e.getFullYear()),r=t?MONTH_DAYS_LEAP_CUMULATIVE:MONTH_DAYS_REGULAR_CUMULATIVE,n=r[e.getMonth()]+e.getDate()-1;return n};function __localtime_js(e,t,r){var n=convertI32PairToI53Checked(e,t);r>>>=0;var a=new Date(n*1e3);HEAP32[r>>>2>>>0]=a.getSeconds(),HEAP32[r+4>>>2>>>0]=a.getMinutes(),HEAP32[r+8>>>2>>>0]=a.getHours(),HEAP32[r+12>>>2>>>0]=a.getDate(),HEAP32[r+16>>>2>>>0]=a.getMonth(),HEAP32[r+20>>>2>>>0]=a.getFullYear()-1900,HEAP32[r+24>>>2>>>0]=a.getDay();var o=ydayFromDate(a)|0;HEAP32[r+28>>>2>>>0]=o,HEAP32[r+36>>>2>>>0]=-(a.getTimezoneOffset()*60);var l=new Date(a.getFullYear(),0,1),u=new Date(a.getFullYear(),6,1).getTimezoneOffset(),_=l.getTimezoneOffset(),d=(u!=_&&a.getTimezoneOffset()==Math.min(_,u))|0;HEAP32[r+32>>>2>>>0]=d}__localtime_js.sig="viip";var __mktime_js=function(e){e>>>=0;var t=(()=>{var r=new Date(HEAP32[e+20>>>2>>>0]+1900,HEAP32[e+16>>>2>>>0],HEAP32[e+12>>>2>>>0],HEAP32[e+8>>>2>>>0],HEAP32[e+4>>>2>>>0],HEAP32[e>>>2>>>0],0),n=HEAP32[e+32>>>2>>>0],a=r.getTimezoneOffset(),o=new Date(r.getFullYear(),0,1),l=new Date(r.getFullYear(),6,1).getTimezoneOffset(),u=o.getTimezoneOffset(),_=Math.min(u,l);if(n<0)HEAP32[e+32>>>2>>>0]=+(l!=u&&_==a);else if(n>0!=(_==a)){var d=Math.max(u,l),f=n>0?_:d;r.setTime(r.getTime()+(f-a)*6e4)}HEAP32[e+24>>>2>>>0]=r.getDay();var p=ydayFromDate(r)|0;HEAP32[e+28>>>2>>>0]=p,HEAP32[e>>>2>>>0]=r.getSeconds(),HEAP32[e+4>>>2>>>0]=r.getMinutes(),HEAP32[e+8>>>2>>>0]=r.getHours(),HEAP32[e+12>>>2>>>0]=r.getDate(),HEAP32[e+16>>>2>>>0]=r.getMonth(),HEAP32[e+20>>>2>>>0]=r.getYear();var m=r.getTime();return isNaN(m)?-1:m/1e3})();return setTempRet0((tempDouble=t,+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)),t>>>0};__mktime_js.sig="ip";function __mmap_js(e,t,r,n,a,o,l,u){e>>>=0;var _=convertI32PairToI53Checked(a,o);l>>>=0,u>>>=0;try{if(isNaN(_))return 61;var d=SYSCALLS.getStreamFromFD(n),f=FS.mmap(d,e,_,t,r),p=f.ptr;return HEAP32[l>>>2>>>0]=f.allocated,HEAPU32[u>>>2>>>0]=p,0}catch(m){if(typeof FS>"u"||m.name!=="ErrnoError")throw m;return-m.errno}}__mmap_js.sig="ipiiiiipp";function __msync_js(e,t,r,n,a,o,l){e>>>=0,t>>>=0;var u=convertI32PairToI53Checked(o,l);try{return isNaN(u)?61:(SYSCALLS.doMsync(e,SYSCALLS.getStreamFromFD(a),t,n,u),0)}catch(_){if(typeof FS>"u"||_.name!=="ErrnoError")throw _;return-_.errno}}__msync_js.sig="ippiiiii";function __munmap_js(e,t,r,n,a,o,l){e>>>=0,t>>>=0;var u=convertI32PairToI53Checked(o,l);try{var _=SYSCALLS.getStreamFromFD(a);r&2&&SYSCALLS.doMsync(e,_,t,n,u)}catch(d){if(typeof FS>"u"||d.name!=="ErrnoError")throw d;return-d.errno}}__munmap_js.sig="ippiiiii";var timers={},_emscripten_get_now=()=>performance.now();_emscripten_get_now.sig="d";var __setitimer_js=(e,t)=>{if(timers[e]&&(clearTimeout(timers[e].id),delete timers[e]),!t)return 0;var r=setTimeout(()=>{delete timers[e],callUserCallback(()=>__emscripten_timeout(e,_emscripten_get_now()))},t);return timers[e]={id:r,timeout_ms:t},0};__setitimer_js.sig="iid";var __timegm_js=function(e){e>>>=0;var t=(()=>{var r=Date.UTC(HEAP32[e+20>>>2>>>0]+1900,HEAP32[e+16>>>2>>>0],HEAP32[e+12>>>2>>>0],HEAP32[e+8>>>2>>>0],HEAP32[e+4>>>2>>>0],HEAP32[e>>>2>>>0],0),n=new Date(r);HEAP32[e+24>>>2>>>0]=n.getUTCDay();var a=Date.UTC(n.getUTCFullYear(),0,1,0,0,0,0),o=(n.getTime()-a)/(1e3*60*60*24)|0;return HEAP32[e+28>>>2>>>0]=o,n.getTime()/1e3})();return setTempRet0((tempDouble=t,+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)),t>>>0};__timegm_js.sig="ip";var __tzset_js=function(e,t,r,n){e>>>=0,t>>>=0,r>>>=0,n>>>=0;var a=new Date().getFullYear(),o=new Date(a,0,1),l=new Date(a,6,1),u=o.getTimezoneOffset(),_=l.getTimezoneOffset(),d=Math.max(u,_);HEAPU32[e>>>2>>>0]=d*60,HEAP32[t>>>2>>>0]=+(u!=_);var f=h=>{var g=h>=0?"-":"+",v=Math.abs(h),y=String(Math.floor(v/60)).padStart(2,"0"),S=String(v%60).padStart(2,"0");return"UTC".concat(g).concat(y).concat(S)},p=f(u),m=f(_);_<u?(stringToUTF8(p,r,17),stringToUTF8(m,n,17)):(stringToUTF8(p,n,17),stringToUTF8(m,r,17))};__tzset_js.sig="vpppp";var _emscripten_set_main_loop_timing=(e,t)=>{if(MainLoop.timingMode=e,MainLoop.timingValue=t,!MainLoop.func)return 1;if(MainLoop.running||(MainLoop.running=!0),e==0)MainLoop.scheduler=function(){var l=Math.max(0,MainLoop.tickStartTime+t-_emscripten_get_now())|0;setTimeout(MainLoop.runner,l)},MainLoop.method="timeout";else if(e==1)MainLoop.scheduler=function(){MainLoop.requestAnimationFrame(MainLoop.runner)},MainLoop.method="rAF";else if(e==2){if(typeof MainLoop.setImmediate>"u")if(typeof setImmediate>"u"){var r=[],n="setimmediate",a=o=>{(o.data===n||o.data.target===n)&&(o.stopPropagation(),r.shift()())};addEventListener("message",a,!0),MainLoop.setImmediate=o=>{var l;r.push(o),ENVIRONMENT_IS_WORKER?((l=Module.setImmediates)!=null||(Module.setImmediates=[]),Module.setImmediates.push(o),postMessage({target:n})):postMessage(n,"*")}}else MainLoop.setImmediate=setImmediate;MainLoop.scheduler=function(){MainLoop.setImmediate(MainLoop.runner)},MainLoop.method="immediate"}return 0};_emscripten_set_main_loop_timing.sig="iii";var setMainLoop=(e,t,r,n,a)=>{MainLoop.func=e,MainLoop.arg=n;var o=MainLoop.currentlyRunningMainloop;function l(){return o<MainLoop.currentlyRunningMainloop?(maybeExit(),!1):!0}if(MainLoop.running=!1,MainLoop.runner=function(){if(!ABORT){if(MainLoop.queue.length>0){var _=Date.now(),d=MainLoop.queue.shift();if(d.func(d.arg),MainLoop.remainingBlockers){var f=MainLoop.remainingBlockers,p=f%1==0?f-1:Math.floor(f);d.counted?MainLoop.remainingBlockers=p:(p=p+.5,MainLoop.remainingBlockers=(8*f+p)/9)}if(MainLoop.updateStatus(),!l())return;setTimeout(MainLoop.runner,0);return}if(l()){if(MainLoop.currentFrameNumber=MainLoop.currentFrameNumber+1|0,MainLoop.timingMode==1&&MainLoop.timingValue>1&&MainLoop.currentFrameNumber%MainLoop.timingValue!=0){MainLoop.scheduler();return}else MainLoop.timingMode==0&&(MainLoop.tickStartTime=_emscripten_get_now());MainLoop.runIter(e),l()&&MainLoop.scheduler()}}},a||(t&&t>0?_emscripten_set_main_loop_timing(0,1e3/t):_emscripten_set_main_loop_timing(1,1),MainLoop.scheduler()),r)throw"unwind"},MainLoop={running:!1,scheduler:null,method:"",currentlyRunningMainloop:0,func:null,arg:0,timingMode:0,timingValue:0,currentFrameNumber:0,queue:[],preMainLoop:[],postMainLoop:[],pause(){MainLoop.scheduler=null,MainLoop.currentlyRunningMainloop++},resume(){MainLoop.currentlyRunningMainloop++;var e=MainLoop.timingMode,t=MainLoop.timingValue,r=MainLoop.func;MainLoop.func=null,setMainLoop(r,0,!1,MainLoop.arg,!0),_emscripten_set_main_loop_timing(e,t),MainLoop.scheduler()},updateStatus(){var n,a;if(Module.setStatus){var e=Module.statusMessage||"Please wait...",t=(n=MainLoop.remainingBlockers)!=null?n:0,r=(a=MainLoop.expectedBlockers)!=null?a:0;t?t<r?Module.setStatus("{message} ({expected - remaining}/{expected})"):Module.setStatus(e):Module.setStatus("")}},init(){Module.preMainLoop&&MainLoop.preMainLoop.push(Module.preMainLoop),Module.postMainLoop&&MainLoop.postMainLoop.push(Module.postMainLoop)},runIter(e){if(!ABORT){for(var t of MainLoop.preMainLoop)if(t()===!1)return;callUserCallback(e);for(var r of MainLoop.postMainLoop)r()}},nextRAF:0,fakeRequestAnimationFrame(e){var t=Date.now();if(MainLoop.nextRAF===0)MainLoop.nextRAF=t+1e3/60;else for(;t+2>=MainLoop.nextRAF;)MainLoop.nextRAF+=1e3/60;var r=Math.max(MainLoop.nextRAF-t,0);setTimeout(e,r)},requestAnimationFrame(e){if(typeof requestAnimationFrame=="function"){requestAnimationFrame(e);return}var t=MainLoop.fakeRequestAnimationFrame;t(e)}},AL={QUEUE_INTERVAL:25,QUEUE_LOOKAHEAD:.1,DEVICE_NAME:"Emscripten OpenAL",CAPTURE_DEVICE_NAME:"Emscripten OpenAL capture",ALC_EXTENSIONS:{ALC_SOFT_pause_device:!0,ALC_SOFT_HRTF:!0},AL_EXTENSIONS:{AL_EXT_float32:!0,AL_SOFT_loop_points:!0,AL_SOFT_source_length:!0,AL_EXT_source_distance_model:!0,AL_SOFT_source_spatialize:!0},_alcErr:0,alcErr:0,deviceRefCounts:{},alcStringCache:{},paused:!1,stringCache:{},contexts:{},currentCtx:null,buffers:{0:{id:0,refCount:0,audioBuf:null,frequency:0,bytesPerSample:2,channels:1,length:0}},paramArray:[],_nextId:1,newId:()=>AL.freeIds.length>0?AL.freeIds.pop():AL._nextId++,freeIds:[],scheduleContextAudio:e=>{if(!(MainLoop.timingMode===1&&document.visibilityState!="visible"))for(var t in e.sources)AL.scheduleSourceAudio(e.sources[t])},scheduleSourceAudio:(e,t)=>{if(!(MainLoop.timingMode===1&&document.visibilityState!="visible")&&e.state===4114){for(var r=AL.updateSourceTime(e),n=e.bufStartTime,a=e.bufOffset,o=e.bufsProcessed,l=0;l<e.audioQueue.length;l++){var u=e.audioQueue[l];n=u._startTime+u._duration,a=0,o+=u._skipCount+1}t||(t=AL.QUEUE_LOOKAHEAD);for(var _=r+t,d=0;n<_;){if(o>=e.bufQueue.length)if(e.looping)o%=e.bufQueue.length;else break;var f=e.bufQueue[o%e.bufQueue.length];if(f.length===0){if(d++,d===e.bufQueue.length)break}else{var u=e.context.audioCtx.createBufferSource();u.buffer=f.audioBuf,u.playbackRate.value=e.playbackRate,(f.audioBuf._loopStart||f.audioBuf._loopEnd)&&(u.loopStart=f.audioBuf._loopStart,u.loopEnd=f.audioBuf._loopEnd);var p=0;e.type===4136&&e.looping?(p=Number.POSITIVE_INFINITY,u.loop=!0,f.audioBuf._loopStart&&(u.loopStart=f.audioBuf._loopStart),f.audioBuf._loopEnd&&(u.loopEnd=f.audioBuf._loopEnd)):p=(f.audioBuf.duration-a)/e.playbackRate,u._startOffset=a,u._duration=p,u._skipCount=d,d=0,u.connect(e.gain),typeof u.start<"u"?(n=Math.max(n,e.context.audioCtx.currentTime),u.start(n,a)):typeof u.noteOn<"u"&&(n=Math.max(n,e.context.audioCtx.currentTime),u.noteOn(n)),u._startTime=n,e.audioQueue.push(u),n+=p}a=0,o++}}},updateSourceTime:e=>{var t=e.context.audioCtx.currentTime;if(e.state!==4114)return t;isFinite(e.bufStartTime)||(e.bufStartTime=t-e.bufOffset/e.playbackRate,e.bufOffset=0);for(var r=0;e.audioQueue.length;){var n=e.audioQueue[0];if(e.bufsProcessed+=n._skipCount,r=n._startTime+n._duration,t<r)break;e.audioQueue.shift(),e.bufStartTime=r,e.bufOffset=0,e.bufsProcessed++}if(e.bufsProcessed>=e.bufQueue.length&&!e.looping)AL.setSourceState(e,4116);else if(e.type===4136&&e.looping){var a=e.bufQueue[0];if(a.length===0)e.bufOffset=0;else{var o=(t-e.bufStartTime)*e.playbackRate,l=a.audioBuf._loopStart||0,u=a.audioBuf._loopEnd||a.audioBuf.duration;u<=l&&(u=a.audioBuf.duration),o<u?e.bufOffset=o:e.bufOffset=l+(o-l)%(u-l)}}else if(e.audioQueue[0])e.bufOffset=(t-e.audioQueue[0]._startTime)*e.playbackRate;else{if(e.type!==4136&&e.looping){var _=AL.sourceDuration(e)/e.playbackRate;_>0&&(e.bufStartTime+=Math.floor((t-e.bufStartTime)/_)*_)}for(var d=0;d<e.bufQueue.length;d++){if(e.bufsProcessed>=e.bufQueue.length)if(e.looping)e.bufsProcessed%=e.bufQueue.length;else{AL.setSourceState(e,4116);break}var a=e.bufQueue[e.bufsProcessed];if(a.length>0){if(r=e.bufStartTime+a.audioBuf.duration/e.playbackRate,t<r){e.bufOffset=(t-e.bufStartTime)*e.playbackRate;break}e.bufStartTime=r}e.bufOffset=0,e.bufsProcessed++}}return t},cancelPendingSourceAudio:e=>{AL.updateSourceTime(e);for(var t=1;t<e.audioQueue.length;t++){var r=e.audioQueue[t];r.stop()}e.audioQueue.length>1&&(e.audioQueue.length=1)},stopSourceAudio:e=>{for(var t=0;t<e.audioQueue.length;t++)e.audioQueue[t].stop();e.audioQueue.length=0},setSourceState:(e,t)=>{t===4114?((e.state===4114||e.state==4116)&&(e.bufsProcessed=0,e.bufOffset=0),AL.stopSourceAudio(e),e.state=4114,e.bufStartTime=Number.NEGATIVE_INFINITY,AL.scheduleSourceAudio(e)):t===4115?e.state===4114&&(AL.updateSourceTime(e),AL.stopSourceAudio(e),e.state=4115):t===4116?e.state!==4113&&(e.state=4116,e.bufsProcessed=e.bufQueue.length,e.bufStartTime=Number.NEGATIVE_INFINITY,e.bufOffset=0,AL.stopSourceAudio(e)):t===4113&&e.state!==4113&&(e.state=4113,e.bufsProcessed=0,e.bufStartTime=Number.NEGATIVE_INFINITY,e.bufOffset=0,AL.stopSourceAudio(e))},initSourcePanner:e=>{if(e.type!==4144){for(var t=AL.buffers[0],r=0;r<e.bufQueue.length;r++)if(e.bufQueue[r].id!==0){t=e.bufQueue[r];break}if(e.spatialize===1||e.spatialize===2&&t.channels===1){if(e.panner)return;e.panner=e.context.audioCtx.createPanner(),AL.updateSourceGlobal(e),AL.updateSourceSpace(e),e.panner.connect(e.context.gain),e.gain.disconnect(),e.gain.connect(e.panner)}else{if(!e.panner)return;e.panner.disconnect(),e.gain.disconnect(),e.gain.connect(e.context.gain),e.panner=null}}},updateContextGlobal:e=>{for(var t in e.sources)AL.updateSourceGlobal(e.sources[t])},updateSourceGlobal:e=>{var t=e.panner;if(t){t.refDistance=e.refDistance,t.maxDistance=e.maxDistance,t.rolloffFactor=e.rolloffFactor,t.panningModel=e.context.hrtf?"HRTF":"equalpower";var r=e.context.sourceDistanceModel?e.distanceModel:e.context.distanceModel;switch(r){case 0:t.distanceModel="inverse",t.refDistance=340282e33;break;case 53249:case 53250:t.distanceModel="inverse";break;case 53251:case 53252:t.distanceModel="linear";break;case 53253:case 53254:t.distanceModel="exponential";break}}},updateListenerSpace:e=>{var t=e.audioCtx.listener;t.positionX?(t.positionX.value=e.listener.position[0],t.positionY.value=e.listener.position[1],t.positionZ.value=e.listener.position[2]):t.setPosition(e.listener.position[0],e.listener.position[1],e.listener.position[2]),t.forwardX?(t.forwardX.value=e.listener.direction[0],t.forwardY.value=e.listener.direction[1],t.forwardZ.value=e.listener.direction[2],t.upX.value=e.listener.up[0],t.upY.value=e.listener.up[1],t.upZ.value=e.listener.up[2]):t.setOrientation(e.listener.direction[0],e.listener.direction[1],e.listener.direction[2],e.listener.up[0],e.listener.up[1],e.listener.up[2]);for(var r in e.sources)AL.updateSourceSpace(e.sources[r])},updateSourceSpace:e=>{if(e.panner){var t=e.panner,r=e.position[0],n=e.position[1],a=e.position[2],o=e.direction[0],l=e.direction[1],u=e.direction[2],_=e.context.listener,d=_.position[0],f=_.position[1],p=_.position[2];if(e.relative){var m=-_.direction[0],h=-_.direction[1],g=-_.direction[2],v=_.up[0],y=_.up[1],S=_.up[2],w=(xo,Co,Mo)=>{var Po=Math.sqrt(xo*xo+Co*Co+Mo*Mo);return Po<Number.EPSILON?0:1/Po},D=w(m,h,g);m*=D,h*=D,g*=D,D=w(v,y,S),v*=D,y*=D,S*=D;var F=y*g-S*h,E=S*m-v*g,x=v*h-y*m;D=w(F,E,x),F*=D,E*=D,x*=D,v=h*x-g*E,y=g*F-m*x,S=m*E-h*F;var A=o,L=l,C=u;o=A*F+L*v+C*m,l=A*E+L*y+C*h,u=A*x+L*S+C*g,A=r,L=n,C=a,r=A*F+L*v+C*m,n=A*E+L*y+C*h,a=A*x+L*S+C*g,r+=d,n+=f,a+=p}t.positionX?(r!=t.positionX.value&&(t.positionX.value=r),n!=t.positionY.value&&(t.positionY.value=n),a!=t.positionZ.value&&(t.positionZ.value=a)):t.setPosition(r,n,a),t.orientationX?(o!=t.orientationX.value&&(t.orientationX.value=o),l!=t.orientationY.value&&(t.orientationY.value=l),u!=t.orientationZ.value&&(t.orientationZ.value=u)):t.setOrientation(o,l,u);var k=e.dopplerShift,P=e.velocity[0],T=e.velocity[1],M=e.velocity[2],I=_.velocity[0],Q=_.velocity[1],ee=_.velocity[2];if(r===d&&n===f&&a===p||P===I&&T===Q&&M===ee)e.dopplerShift=1;else{var ce=e.context.speedOfSound,Y=e.context.dopplerFactor,Ie=d-r,we=f-n,De=p-a,ei=Math.sqrt(Ie*Ie+we*we+De*De),Mr=(Ie*I+we*Q+De*ee)/ei,fr=(Ie*P+we*T+De*M)/ei;Mr=Math.min(Mr,ce/Y),fr=Math.min(fr,ce/Y),e.dopplerShift=(ce-Y*Mr)/(ce-Y*fr)}e.dopplerShift!==k&&AL.updateSourceRate(e)}},updateSourceRate:e=>{if(e.state===4114){AL.cancelPendingSourceAudio(e);var t=e.audioQueue[0];if(!t)return;var r;e.type===4136&&e.looping?r=Number.POSITIVE_INFINITY:r=(t.buffer.duration-t._startOffset)/e.playbackRate,t._duration=r,t.playbackRate.value=e.playbackRate,AL.scheduleSourceAudio(e)}},sourceDuration:e=>{for(var t=0,r=0;r<e.bufQueue.length;r++){var n=e.bufQueue[r].audioBuf;t+=n?n.duration:0}return t},sourceTell:e=>{AL.updateSourceTime(e);for(var t=0,r=0;r<e.bufsProcessed;r++)e.bufQueue[r].audioBuf&&(t+=e.bufQueue[r].audioBuf.duration);return t+=e.bufOffset,t},sourceSeek:(e,t)=>{var r=e.state==4114;if(r&&AL.setSourceState(e,4113),e.bufQueue[e.bufsProcessed].audioBuf!==null){for(e.bufsProcessed=0;t>e.bufQueue[e.bufsProcessed].audioBuf.duration;)t-=e.bufQueue[e.bufsProcessed].audioBuf.duration,e.bufsProcessed++;e.bufOffset=t}r&&AL.setSourceState(e,4114)},getGlobalParam:(e,t)=>{if(!AL.currentCtx)return null;switch(t){case 49152:return AL.currentCtx.dopplerFactor;case 49155:return AL.currentCtx.speedOfSound;case 53248:return AL.currentCtx.distanceModel;default:return AL.currentCtx.err=40962,null}},setGlobalParam:(e,t,r)=>{if(AL.currentCtx)switch(t){case 49152:if(!Number.isFinite(r)||r<0){AL.currentCtx.err=40963;return}AL.currentCtx.dopplerFactor=r,AL.updateListenerSpace(AL.currentCtx);break;case 49155:if(!Number.isFinite(r)||r<=0){AL.currentCtx.err=40963;return}AL.currentCtx.speedOfSound=r,AL.updateListenerSpace(AL.currentCtx);break;case 53248:switch(r){case 0:case 53249:case 53250:case 53251:case 53252:case 53253:case 53254:AL.currentCtx.distanceModel=r,AL.updateContextGlobal(AL.currentCtx);break;default:AL.currentCtx.err=40963;return}break;default:AL.currentCtx.err=40962;return}},getListenerParam:(e,t)=>{if(!AL.currentCtx)return null;switch(t){case 4100:return AL.currentCtx.listener.position;case 4102:return AL.currentCtx.listener.velocity;case 4111:return AL.currentCtx.listener.direction.concat(AL.currentCtx.listener.up);case 4106:return AL.currentCtx.gain.gain.value;default:return AL.currentCtx.err=40962,null}},setListenerParam:(e,t,r)=>{if(AL.currentCtx){if(r===null){AL.currentCtx.err=40962;return}var n=AL.currentCtx.listener;switch(t){case 4100:if(!Number.isFinite(r[0])||!Number.isFinite(r[1])||!Number.isFinite(r[2])){AL.currentCtx.err=40963;return}n.position[0]=r[0],n.position[1]=r[1],n.position[2]=r[2],AL.updateListenerSpace(AL.currentCtx);break;case 4102:if(!Number.isFinite(r[0])||!Number.isFinite(r[1])||!Number.isFinite(r[2])){AL.currentCtx.err=40963;return}n.velocity[0]=r[0],n.velocity[1]=r[1],n.velocity[2]=r[2],AL.updateListenerSpace(AL.currentCtx);break;case 4106:if(!Number.isFinite(r)||r<0){AL.currentCtx.err=40963;return}AL.currentCtx.gain.gain.value=r;break;case 4111:if(!Number.isFinite(r[0])||!Number.isFinite(r[1])||!Number.isFinite(r[2])||!Number.isFinite(r[3])||!Number.isFinite(r[4])||!Number.isFinite(r[5])){AL.currentCtx.err=40963;return}n.direction[0]=r[0],n.direction[1]=r[1],n.direction[2]=r[2],n.up[0]=r[3],n.up[1]=r[4],n.up[2]=r[5],AL.updateListenerSpace(AL.currentCtx);break;default:AL.currentCtx.err=40962;return}}},getBufferParam:(e,t,r)=>{if(AL.currentCtx){var n=AL.buffers[t];if(!n||t===0){AL.currentCtx.err=40961;return}switch(r){case 8193:return n.frequency;case 8194:return n.bytesPerSample*8;case 8195:return n.channels;case 8196:return n.length*n.bytesPerSample*n.channels;case 8213:return n.length===0?[0,0]:[(n.audioBuf._loopStart||0)*n.frequency,(n.audioBuf._loopEnd||n.length)*n.frequency];default:return AL.currentCtx.err=40962,null}}},setBufferParam:(e,t,r,n)=>{if(AL.currentCtx){var a=AL.buffers[t];if(!a||t===0){AL.currentCtx.err=40961;return}if(n===null){AL.currentCtx.err=40962;return}switch(r){case 8196:if(n!==0){AL.currentCtx.err=40963;return}break;case 8213:if(n[0]<0||n[0]>a.length||n[1]<0||n[1]>a.Length||n[0]>=n[1]){AL.currentCtx.err=40963;return}if(a.refCount>0){AL.currentCtx.err=40964;return}a.audioBuf&&(a.audioBuf._loopStart=n[0]/a.frequency,a.audioBuf._loopEnd=n[1]/a.frequency);break;default:AL.currentCtx.err=40962;return}}},getSourceParam:(e,t,r)=>{if(!AL.currentCtx)return null;var n=AL.currentCtx.sources[t];if(!n)return AL.currentCtx.err=40961,null;switch(r){case 514:return n.relative;case 4097:return n.coneInnerAngle;case 4098:return n.coneOuterAngle;case 4099:return n.pitch;case 4100:return n.position;case 4101:return n.direction;case 4102:return n.velocity;case 4103:return n.looping;case 4105:return n.type===4136?n.bufQueue[0].id:0;case 4106:return n.gain.gain.value;case 4109:return n.minGain;case 4110:return n.maxGain;case 4112:return n.state;case 4117:return n.bufQueue.length===1&&n.bufQueue[0].id===0?0:n.bufQueue.length;case 4118:return n.bufQueue.length===1&&n.bufQueue[0].id===0||n.looping?0:n.bufsProcessed;case 4128:return n.refDistance;case 4129:return n.rolloffFactor;case 4130:return n.coneOuterGain;case 4131:return n.maxDistance;case 4132:return AL.sourceTell(n);case 4133:var a=AL.sourceTell(n);return a>0&&(a*=n.bufQueue[0].frequency),a;case 4134:var a=AL.sourceTell(n);return a>0&&(a*=n.bufQueue[0].frequency*n.bufQueue[0].bytesPerSample),a;case 4135:return n.type;case 4628:return n.spatialize;case 8201:for(var u=0,o=0,l=0;l<n.bufQueue.length;l++)u+=n.bufQueue[l].length,n.bufQueue[l].id!==0&&(o=n.bufQueue[l].bytesPerSample*n.bufQueue[l].channels);return u*o;case 8202:for(var u=0,l=0;l<n.bufQueue.length;l++)u+=n.bufQueue[l].length;return u;case 8203:return AL.sourceDuration(n);case 53248:return n.distanceModel;default:return AL.currentCtx.err=40962,null}},setSourceParam:(e,t,r,n)=>{if(AL.currentCtx){var a=AL.currentCtx.sources[t];if(!a){AL.currentCtx.err=40961;return}if(n===null){AL.currentCtx.err=40962;return}switch(r){case 514:if(n===1)a.relative=!0,AL.updateSourceSpace(a);else if(n===0)a.relative=!1,AL.updateSourceSpace(a);else{AL.currentCtx.err=40963;return}break;case 4097:if(!Number.isFinite(n)){AL.currentCtx.err=40963;return}a.coneInnerAngle=n,a.panner&&(a.panner.coneInnerAngle=n%360);break;case 4098:if(!Number.isFinite(n)){AL.currentCtx.err=40963;return}a.coneOuterAngle=n,a.panner&&(a.panner.coneOuterAngle=n%360);break;case 4099:if(!Number.isFinite(n)||n<=0){AL.currentCtx.err=40963;return}if(a.pitch===n)break;a.pitch=n,AL.updateSourceRate(a);break;case 4100:if(!Number.isFinite(n[0])||!Number.isFinite(n[1])||!Number.isFinite(n[2])){AL.currentCtx.err=40963;return}a.position[0]=n[0],a.position[1]=n[1],a.position[2]=n[2],AL.updateSourceSpace(a);break;case 4101:if(!Number.isFinite(n[0])||!Number.isFinite(n[1])||!Number.isFinite(n[2])){AL.currentCtx.err=40963;return}a.direction[0]=n[0],a.direction[1]=n[1],a.direction[2]=n[2],AL.updateSourceSpace(a);break;case 4102:if(!Number.isFinite(n[0])||!Number.isFinite(n[1])||!Number.isFinite(n[2])){AL.currentCtx.err=40963;return}a.velocity[0]=n[0],a.velocity[1]=n[1],a.velocity[2]=n[2],AL.updateSourceSpace(a);break;case 4103:if(n===1){if(a.looping=!0,AL.updateSourceTime(a),a.type===4136&&a.audioQueue.length>0){var o=a.audioQueue[0];o.loop=!0,o._duration=Number.POSITIVE_INFINITY}}else if(n===0){a.looping=!1;var l=AL.updateSourceTime(a);if(a.type===4136&&a.audioQueue.length>0){var o=a.audioQueue[0];o.loop=!1,o._duration=a.bufQueue[0].audioBuf.duration/a.playbackRate,o._startTime=l-a.bufOffset/a.playbackRate}}else{AL.currentCtx.err=40963;return}break;case 4105:if(a.state===4114||a.state===4115){AL.currentCtx.err=40964;return}if(n===0){for(var u in a.bufQueue)a.bufQueue[u].refCount--;a.bufQueue.length=1,a.bufQueue[0]=AL.buffers[0],a.bufsProcessed=0,a.type=4144}else{var _=AL.buffers[n];if(!_){AL.currentCtx.err=40963;return}for(var u in a.bufQueue)a.bufQueue[u].refCount--;a.bufQueue.length=0,_.refCount++,a.bufQueue=[_],a.bufsProcessed=0,a.type=4136}AL.initSourcePanner(a),AL.scheduleSourceAudio(a);break;case 4106:if(!Number.isFinite(n)||n<0){AL.currentCtx.err=40963;return}a.gain.gain.value=n;break;case 4109:if(!Number.isFinite(n)||n<0||n>Math.min(a.maxGain,1)){AL.currentCtx.err=40963;return}a.minGain=n;break;case 4110:if(!Number.isFinite(n)||n<Math.max(0,a.minGain)||n>1){AL.currentCtx.err=40963;return}a.maxGain=n;break;case 4128:if(!Number.isFinite(n)||n<0){AL.currentCtx.err=40963;return}a.refDistance=n,a.panner&&(a.panner.refDistance=n);break;case 4129:if(!Number.isFinite(n)||n<0){AL.currentCtx.err=40963;return}a.rolloffFactor=n,a.panner&&(a.panner.rolloffFactor=n);break;case 4130:if(!Number.isFinite(n)||n<0||n>1){AL.currentCtx.err=40963;return}a.coneOuterGain=n,a.panner&&(a.panner.coneOuterGain=n);break;case 4131:if(!Number.isFinite(n)||n<0){AL.currentCtx.err=40963;return}a.maxDistance=n,a.panner&&(a.panner.maxDistance=n);break;case 4132:if(n<0||n>AL.sourceDuration(a)){AL.currentCtx.err=40963;return}AL.sourceSeek(a,n);break;case 4133:var p=AL.sourceDuration(a);if(p>0){var d;for(var f in a.bufQueue)if(f){d=a.bufQueue[f].frequency;break}n/=d}if(n<0||n>p){AL.currentCtx.err=40963;return}AL.sourceSeek(a,n);break;case 4134:var p=AL.sourceDuration(a);if(p>0){var m;for(var f in a.bufQueue)if(f){var _=a.bufQueue[f];m=_.frequency*_.bytesPerSample*_.channels;break}n/=m}if(n<0||n>p){AL.currentCtx.err=40963;return}AL.sourceSeek(a,n);break;case 4628:if(n!==0&&n!==1&&n!==2){AL.currentCtx.err=40963;return}a.spatialize=n,AL.initSourcePanner(a);break;case 8201:case 8202:case 8203:AL.currentCtx.err=40964;break;case 53248:switch(n){case 0:case 53249:case 53250:case 53251:case 53252:case 53253:case 53254:a.distanceModel=n,AL.currentCtx.sourceDistanceModel&&AL.updateContextGlobal(AL.currentCtx);break;default:AL.currentCtx.err=40963;return}break;default:AL.currentCtx.err=40962;return}}},captures:{},sharedCaptureAudioCtx:null,requireValidCaptureDevice:(e,t)=>{if(e===0)return AL.alcErr=40961,null;var r=AL.captures[e];if(!r)return AL.alcErr=40961,null;var n=r.mediaStreamError;return n?(AL.alcErr=40961,null):r}},_alBuffer3f=(e,t,r,n,a)=>{AL.setBufferParam("alBuffer3f",e,t,null)};_alBuffer3f.sig="viifff";var _alBuffer3i=(e,t,r,n,a)=>{AL.setBufferParam("alBuffer3i",e,t,null)};_alBuffer3i.sig="viiiii";function _alBufferData(e,t,r,n,a){if(r>>>=0,!!AL.currentCtx){var o=AL.buffers[e];if(!o){AL.currentCtx.err=40963;return}if(a<=0){AL.currentCtx.err=40963;return}var l=null;try{switch(t){case 4352:if(n>0){l=AL.currentCtx.audioCtx.createBuffer(1,n,a);for(var u=l.getChannelData(0),_=0;_<n;++_)u[_]=HEAPU8[r++>>>0]*.0078125-1}o.bytesPerSample=1,o.channels=1,o.length=n;break;case 4353:if(n>0){l=AL.currentCtx.audioCtx.createBuffer(1,n>>1,a);var u=l.getChannelData(0);r>>=1;for(var _=0;_<n>>1;++_)u[_]=HEAP16[r++>>>0]*30517578125e-15}o.bytesPerSample=2,o.channels=1,o.length=n>>1;break;case 4354:if(n>0){l=AL.currentCtx.audioCtx.createBuffer(2,n>>1,a);for(var u=l.getChannelData(0),d=l.getChannelData(1),_=0;_<n>>1;++_)u[_]=HEAPU8[r++>>>0]*.0078125-1,d[_]=HEAPU8[r++>>>0]*.0078125-1}o.bytesPerSample=1,o.channels=2,o.length=n>>1;break;case 4355:if(n>0){l=AL.currentCtx.audioCtx.createBuffer(2,n>>2,a);var u=l.getChannelData(0),d=l.getChannelData(1);r>>=1;for(var _=0;_<n>>2;++_)u[_]=HEAP16[r++>>>0]*30517578125e-15,d[_]=HEAP16[r++>>>0]*30517578125e-15}o.bytesPerSample=2,o.channels=2,o.length=n>>2;break;case 65552:if(n>0){l=AL.currentCtx.audioCtx.createBuffer(1,n>>2,a);var u=l.getChannelData(0);r>>=2;for(var _=0;_<n>>2;++_)u[_]=HEAPF32[r++>>>0]}o.bytesPerSample=4,o.channels=1,o.length=n>>2;break;case 65553:if(n>0){l=AL.currentCtx.audioCtx.createBuffer(2,n>>3,a);var u=l.getChannelData(0),d=l.getChannelData(1);r>>=2;for(var _=0;_<n>>3;++_)u[_]=HEAPF32[r++>>>0],d[_]=HEAPF32[r++>>>0]}o.bytesPerSample=4,o.channels=2,o.length=n>>3;break;default:AL.currentCtx.err=40963;return}o.frequency=a,o.audioBuf=l}catch(f){AL.currentCtx.err=40963;return}}}_alBufferData.sig="viipii";var _alBufferf=(e,t,r)=>{AL.setBufferParam("alBufferf",e,t,null)};_alBufferf.sig="viif";function _alBufferfv(e,t,r){if(r>>>=0,!!AL.currentCtx){if(!r){AL.currentCtx.err=40963;return}AL.setBufferParam("alBufferfv",e,t,null)}}_alBufferfv.sig="viip";var _alBufferi=(e,t,r)=>{AL.setBufferParam("alBufferi",e,t,null)};_alBufferi.sig="viii";function _alBufferiv(e,t,r){if(r>>>=0,!!AL.currentCtx){if(!r){AL.currentCtx.err=40963;return}switch(t){case 8213:AL.paramArray[0]=HEAP32[r>>>2>>>0],AL.paramArray[1]=HEAP32[r+4>>>2>>>0],AL.setBufferParam("alBufferiv",e,t,AL.paramArray);break;default:AL.setBufferParam("alBufferiv",e,t,null);break}}}_alBufferiv.sig="viip";function _alDeleteBuffers(e,t){if(t>>>=0,!!AL.currentCtx){for(var r=0;r<e;++r){var n=HEAP32[t+r*4>>>2>>>0];if(n!==0){if(!AL.buffers[n]){AL.currentCtx.err=40961;return}if(AL.buffers[n].refCount){AL.currentCtx.err=40964;return}}}for(var r=0;r<e;++r){var n=HEAP32[t+r*4>>>2>>>0];n!==0&&(AL.deviceRefCounts[AL.buffers[n].deviceId]--,delete AL.buffers[n],AL.freeIds.push(n))}}}_alDeleteBuffers.sig="vip";var _alSourcei=(e,t,r)=>{switch(t){case 514:case 4097:case 4098:case 4103:case 4105:case 4128:case 4129:case 4131:case 4132:case 4133:case 4134:case 4628:case 8201:case 8202:case 53248:AL.setSourceParam("alSourcei",e,t,r);break;default:AL.setSourceParam("alSourcei",e,t,null);break}};_alSourcei.sig="viii";function _alDeleteSources(e,t){if(t>>>=0,!!AL.currentCtx){for(var r=0;r<e;++r){var n=HEAP32[t+r*4>>>2>>>0];if(!AL.currentCtx.sources[n]){AL.currentCtx.err=40961;return}}for(var r=0;r<e;++r){var n=HEAP32[t+r*4>>>2>>>0];AL.setSourceState(AL.currentCtx.sources[n],4116),_alSourcei(n,4105,0),delete AL.currentCtx.sources[n],AL.freeIds.push(n)}}}_alDeleteSources.sig="vip";var _alDisable=e=>{if(AL.currentCtx)switch(e){case 512:AL.currentCtx.sourceDistanceModel=!1,AL.updateContextGlobal(AL.currentCtx);break;default:AL.currentCtx.err=40962;return}};_alDisable.sig="vi";var _alDistanceModel=e=>{AL.setGlobalParam("alDistanceModel",53248,e)};_alDistanceModel.sig="vi";var _alDopplerFactor=e=>{AL.setGlobalParam("alDopplerFactor",49152,e)};_alDopplerFactor.sig="vf";var _alDopplerVelocity=e=>{if(warnOnce("alDopplerVelocity() is deprecated, and only kept for compatibility with OpenAL 1.0. Use alSpeedOfSound() instead."),!!AL.currentCtx&&e<=0){AL.currentCtx.err=40963;return}};_alDopplerVelocity.sig="vf";var _alEnable=e=>{if(AL.currentCtx)switch(e){case 512:AL.currentCtx.sourceDistanceModel=!0,AL.updateContextGlobal(AL.currentCtx);break;default:AL.currentCtx.err=40962;return}};_alEnable.sig="vi";function _alGenBuffers(e,t){if(t>>>=0,!!AL.currentCtx)for(var r=0;r<e;++r){var n={deviceId:AL.currentCtx.deviceId,id:AL.newId(),refCount:0,audioBuf:null,frequency:0,bytesPerSample:2,channels:1,length:0};AL.deviceRefCounts[n.deviceId]++,AL.buffers[n.id]=n,HEAP32[t+r*4>>>2>>>0]=n.id}}_alGenBuffers.sig="vip";function _alGenSources(e,t){if(t>>>=0,!!AL.currentCtx)for(var r=0;r<e;++r){var n=AL.currentCtx.audioCtx.createGain();n.connect(AL.currentCtx.gain);var a={context:AL.currentCtx,id:AL.newId(),type:4144,state:4113,bufQueue:[AL.buffers[0]],audioQueue:[],looping:!1,pitch:1,dopplerShift:1,gain:n,minGain:0,maxGain:1,panner:null,bufsProcessed:0,bufStartTime:Number.NEGATIVE_INFINITY,bufOffset:0,relative:!1,refDistance:1,maxDistance:340282e33,rolloffFactor:1,position:[0,0,0],velocity:[0,0,0],direction:[0,0,0],coneOuterGain:0,coneInnerAngle:360,coneOuterAngle:360,distanceModel:53250,spatialize:2,get playbackRate(){return this.pitch*this.dopplerShift}};AL.currentCtx.sources[a.id]=a,HEAP32[t+r*4>>>2>>>0]=a.id}}_alGenSources.sig="vip";var _alGetBoolean=e=>{var t=AL.getGlobalParam("alGetBoolean",e);if(t===null)return 0;switch(e){case 49152:case 49155:case 53248:return t!==0?1:0;default:return AL.currentCtx.err=40962,0}};_alGetBoolean.sig="ii";function _alGetBooleanv(e,t){t>>>=0;var r=AL.getGlobalParam("alGetBooleanv",e);if(!(r===null||!t))switch(e){case 49152:case 49155:case 53248:HEAP8[t>>>0]=r;break;default:AL.currentCtx.err=40962;return}}_alGetBooleanv.sig="vip";function _alGetBuffer3f(e,t,r,n,a){r>>>=0,n>>>=0,a>>>=0;var o=AL.getBufferParam("alGetBuffer3f",e,t);if(o!==null){if(!r||!n||!a){AL.currentCtx.err=40963;return}AL.currentCtx.err=40962}}_alGetBuffer3f.sig="viippp";function _alGetBuffer3i(e,t,r,n,a){r>>>=0,n>>>=0,a>>>=0;var o=AL.getBufferParam("alGetBuffer3i",e,t);if(o!==null){if(!r||!n||!a){AL.currentCtx.err=40963;return}AL.currentCtx.err=40962}}_alGetBuffer3i.sig="viippp";function _alGetBufferf(e,t,r){r>>>=0;var n=AL.getBufferParam("alGetBufferf",e,t);if(n!==null){if(!r){AL.currentCtx.err=40963;return}AL.currentCtx.err=40962}}_alGetBufferf.sig="viip";function _alGetBufferfv(e,t,r){r>>>=0;var n=AL.getBufferParam("alGetBufferfv",e,t);if(n!==null){if(!r){AL.currentCtx.err=40963;return}AL.currentCtx.err=40962}}_alGetBufferfv.sig="viip";function _alGetBufferi(e,t,r){r>>>=0;var n=AL.getBufferParam("alGetBufferi",e,t);if(n!==null){if(!r){AL.currentCtx.err=40963;return}switch(t){case 8193:case 8194:case 8195:case 8196:HEAP32[r>>>2>>>0]=n;break;default:AL.currentCtx.err=40962;return}}}_alGetBufferi.sig="viip";function _alGetBufferiv(e,t,r){r>>>=0;var n=AL.getBufferParam("alGetBufferiv",e,t);if(n!==null){if(!r){AL.currentCtx.err=40963;return}switch(t){case 8193:case 8194:case 8195:case 8196:HEAP32[r>>>2>>>0]=n;break;case 8213:HEAP32[r>>>2>>>0]=n[0],HEAP32[r+4>>>2>>>0]=n[1];break;default:AL.currentCtx.err=40962;return}}}_alGetBufferiv.sig="viip";var _alGetDouble=e=>{var t=AL.getGlobalParam("alGetDouble",e);if(t===null)return 0;switch(e){case 49152:case 49155:case 53248:return t;default:return AL.currentCtx.err=40962,0}};_alGetDouble.sig="di";function _alGetDoublev(e,t){t>>>=0;var r=AL.getGlobalParam("alGetDoublev",e);if(!(r===null||!t))switch(e){case 49152:case 49155:case 53248:HEAPF64[t>>>3>>>0]=r;break;default:AL.currentCtx.err=40962;return}}_alGetDoublev.sig="vip";function _alGetEnumValue(e){if(e>>>=0,!AL.currentCtx)return 0;if(!e)return AL.currentCtx.err=40963,0;var t=UTF8ToString(e);switch(t){case"AL_BITS":return 8194;case"AL_BUFFER":return 4105;case"AL_BUFFERS_PROCESSED":return 4118;case"AL_BUFFERS_QUEUED":return 4117;case"AL_BYTE_OFFSET":return 4134;case"AL_CHANNELS":return 8195;case"AL_CONE_INNER_ANGLE":return 4097;case"AL_CONE_OUTER_ANGLE":return 4098;case"AL_CONE_OUTER_GAIN":return 4130;case"AL_DIRECTION":return 4101;case"AL_DISTANCE_MODEL":return 53248;case"AL_DOPPLER_FACTOR":return 49152;case"AL_DOPPLER_VELOCITY":return 49153;case"AL_EXPONENT_DISTANCE":return 53253;case"AL_EXPONENT_DISTANCE_CLAMPED":return 53254;case"AL_EXTENSIONS":return 45060;case"AL_FORMAT_MONO16":return 4353;case"AL_FORMAT_MONO8":return 4352;case"AL_FORMAT_STEREO16":return 4355;case"AL_FORMAT_STEREO8":return 4354;case"AL_FREQUENCY":return 8193;case"AL_GAIN":return 4106;case"AL_INITIAL":return 4113;case"AL_INVALID":return-1;case"AL_ILLEGAL_ENUM":case"AL_INVALID_ENUM":return 40962;case"AL_INVALID_NAME":return 40961;case"AL_ILLEGAL_COMMAND":case"AL_INVALID_OPERATION":return 40964;case"AL_INVALID_VALUE":return 40963;case"AL_INVERSE_DISTANCE":return 53249;case"AL_INVERSE_DISTANCE_CLAMPED":return 53250;case"AL_LINEAR_DISTANCE":return 53251;case"AL_LINEAR_DISTANCE_CLAMPED":return 53252;case"AL_LOOPING":return 4103;case"AL_MAX_DISTANCE":return 4131;case"AL_MAX_GAIN":return 4110;case"AL_MIN_GAIN":return 4109;case"AL_NONE":return 0;case"AL_NO_ERROR":return 0;case"AL_ORIENTATION":return 4111;case"AL_OUT_OF_MEMORY":return 40965;case"AL_PAUSED":return 4115;case"AL_PENDING":return 8209;case"AL_PITCH":return 4099;case"AL_PLAYING":return 4114;case"AL_POSITION":return 4100;case"AL_PROCESSED":return 8210;case"AL_REFERENCE_DISTANCE":return 4128;case"AL_RENDERER":return 45059;case"AL_ROLLOFF_FACTOR":return 4129;case"AL_SAMPLE_OFFSET":return 4133;case"AL_SEC_OFFSET":return 4132;case"AL_SIZE":return 8196;case"AL_SOURCE_RELATIVE":return 514;case"AL_SOURCE_STATE":return 4112;case"AL_SOURCE_TYPE":return 4135;case"AL_SPEED_OF_SOUND":return 49155;case"AL_STATIC":return 4136;case"AL_STOPPED":return 4116;case"AL_STREAMING":return 4137;case"AL_UNDETERMINED":return 4144;case"AL_UNUSED":return 8208;case"AL_VELOCITY":return 4102;case"AL_VENDOR":return 45057;case"AL_VERSION":return 45058;case"AL_AUTO_SOFT":return 2;case"AL_SOURCE_DISTANCE_MODEL":return 512;case"AL_SOURCE_SPATIALIZE_SOFT":return 4628;case"AL_LOOP_POINTS_SOFT":return 8213;case"AL_BYTE_LENGTH_SOFT":return 8201;case"AL_SAMPLE_LENGTH_SOFT":return 8202;case"AL_SEC_LENGTH_SOFT":return 8203;case"AL_FORMAT_MONO_FLOAT32":return 65552;case"AL_FORMAT_STEREO_FLOAT32":return 65553;default:return AL.currentCtx.err=40963,0}}_alGetEnumValue.sig="ip";var _alGetError=()=>{if(!AL.currentCtx)return 40964;var e=AL.currentCtx.err;return AL.currentCtx.err=0,e};_alGetError.sig="i";var _alGetFloat=e=>{var t=AL.getGlobalParam("alGetFloat",e);if(t===null)return 0;switch(e){case 49152:case 49155:case 53248:return t;default:return 0}};_alGetFloat.sig="fi";function _alGetFloatv(e,t){t>>>=0;var r=AL.getGlobalParam("alGetFloatv",e);if(!(r===null||!t))switch(e){case 49152:case 49155:case 53248:HEAPF32[t>>>2>>>0]=r;break;default:AL.currentCtx.err=40962;return}}_alGetFloatv.sig="vip";var _alGetInteger=e=>{var t=AL.getGlobalParam("alGetInteger",e);if(t===null)return 0;switch(e){case 49152:case 49155:case 53248:return t;default:return AL.currentCtx.err=40962,0}};_alGetInteger.sig="ii";function _alGetIntegerv(e,t){t>>>=0;var r=AL.getGlobalParam("alGetIntegerv",e);if(!(r===null||!t))switch(e){case 49152:case 49155:case 53248:HEAP32[t>>>2>>>0]=r;break;default:AL.currentCtx.err=40962;return}}_alGetIntegerv.sig="vip";function _alGetListener3f(e,t,r,n){t>>>=0,r>>>=0,n>>>=0;var a=AL.getListenerParam("alGetListener3f",e);if(a!==null){if(!t||!r||!n){AL.currentCtx.err=40963;return}switch(e){case 4100:case 4102:HEAPF32[t>>>2>>>0]=a[0],HEAPF32[r>>>2>>>0]=a[1],HEAPF32[n>>>2>>>0]=a[2];break;default:AL.currentCtx.err=40962;return}}}_alGetListener3f.sig="vippp";function _alGetListener3i(e,t,r,n){t>>>=0,r>>>=0,n>>>=0;var a=AL.getListenerParam("alGetListener3i",e);if(a!==null){if(!t||!r||!n){AL.currentCtx.err=40963;return}switch(e){case 4100:case 4102:HEAP32[t>>>2>>>0]=a[0],HEAP32[r>>>2>>>0]=a[1],HEAP32[n>>>2>>>0]=a[2];break;default:AL.currentCtx.err=40962;return}}}_alGetListener3i.sig="vippp";function _alGetListenerf(e,t){t>>>=0;var r=AL.getListenerParam("alGetListenerf",e);if(r!==null){if(!t){AL.currentCtx.err=40963;return}switch(e){case 4106:HEAPF32[t>>>2>>>0]=r;break;default:AL.currentCtx.err=40962;return}}}_alGetListenerf.sig="vip";function _alGetListenerfv(e,t){t>>>=0;var r=AL.getListenerParam("alGetListenerfv",e);if(r!==null){if(!t){AL.currentCtx.err=40963;return}switch(e){case 4100:case 4102:HEAPF32[t>>>2>>>0]=r[0],HEAPF32[t+4>>>2>>>0]=r[1],HEAPF32[t+8>>>2>>>0]=r[2];break;case 4111:HEAPF32[t>>>2>>>0]=r[0],HEAPF32[t+4>>>2>>>0]=r[1],HEAPF32[t+8>>>2>>>0]=r[2],HEAPF32[t+12>>>2>>>0]=r[3],HEAPF32[t+16>>>2>>>0]=r[4],HEAPF32[t+20>>>2>>>0]=r[5];break;default:AL.currentCtx.err=40962;return}}}_alGetListenerfv.sig="vip";function _alGetListeneri(e,t){t>>>=0;var r=AL.getListenerParam("alGetListeneri",e);if(r!==null){if(!t){AL.currentCtx.err=40963;return}AL.currentCtx.err=40962}}_alGetListeneri.sig="vip";function _alGetListeneriv(e,t){t>>>=0;var r=AL.getListenerParam("alGetListeneriv",e);if(r!==null){if(!t){AL.currentCtx.err=40963;return}switch(e){case 4100:case 4102:HEAP32[t>>>2>>>0]=r[0],HEAP32[t+4>>>2>>>0]=r[1],HEAP32[t+8>>>2>>>0]=r[2];break;case 4111:HEAP32[t>>>2>>>0]=r[0],HEAP32[t+4>>>2>>>0]=r[1],HEAP32[t+8>>>2>>>0]=r[2],HEAP32[t+12>>>2>>>0]=r[3],HEAP32[t+16>>>2>>>0]=r[4],HEAP32[t+20>>>2>>>0]=r[5];break;default:AL.currentCtx.err=40962;return}}}_alGetListeneriv.sig="vip";function _alGetSource3f(e,t,r,n,a){r>>>=0,n>>>=0,a>>>=0;var o=AL.getSourceParam("alGetSource3f",e,t);if(o!==null){if(!r||!n||!a){AL.currentCtx.err=40963;return}switch(t){case 4100:case 4101:case 4102:HEAPF32[r>>>2>>>0]=o[0],HEAPF32[n>>>2>>>0]=o[1],HEAPF32[a>>>2>>>0]=o[2];break;default:AL.currentCtx.err=40962;return}}}_alGetSource3f.sig="viippp";function _alGetSource3i(e,t,r,n,a){r>>>=0,n>>>=0,a>>>=0;var o=AL.getSourceParam("alGetSource3i",e,t);if(o!==null){if(!r||!n||!a){AL.currentCtx.err=40963;return}switch(t){case 4100:case 4101:case 4102:HEAP32[r>>>2>>>0]=o[0],HEAP32[n>>>2>>>0]=o[1],HEAP32[a>>>2>>>0]=o[2];break;default:AL.currentCtx.err=40962;return}}}_alGetSource3i.sig="viippp";function _alGetSourcef(e,t,r){r>>>=0;var n=AL.getSourceParam("alGetSourcef",e,t);if(n!==null){if(!r){AL.currentCtx.err=40963;return}switch(t){case 4097:case 4098:case 4099:case 4106:case 4109:case 4110:case 4128:case 4129:case 4130:case 4131:case 4132:case 4133:case 4134:case 8203:HEAPF32[r>>>2>>>0]=n;break;default:AL.currentCtx.err=40962;return}}}_alGetSourcef.sig="viip";function _alGetSourcefv(e,t,r){r>>>=0;var n=AL.getSourceParam("alGetSourcefv",e,t);if(n!==null){if(!r){AL.currentCtx.err=40963;return}switch(t){case 4097:case 4098:case 4099:case 4106:case 4109:case 4110:case 4128:case 4129:case 4130:case 4131:case 4132:case 4133:case 4134:case 8203:HEAPF32[r>>>2>>>0]=n[0];break;case 4100:case 4101:case 4102:HEAPF32[r>>>2>>>0]=n[0],HEAPF32[r+4>>>2>>>0]=n[1],HEAPF32[r+8>>>2>>>0]=n[2];break;default:AL.currentCtx.err=40962;return}}}_alGetSourcefv.sig="viip";function _alGetSourcei(e,t,r){r>>>=0;var n=AL.getSourceParam("alGetSourcei",e,t);if(n!==null){if(!r){AL.currentCtx.err=40963;return}switch(t){case 514:case 4097:case 4098:case 4103:case 4105:case 4112:case 4117:case 4118:case 4128:case 4129:case 4131:case 4132:case 4133:case 4134:case 4135:case 4628:case 8201:case 8202:case 53248:HEAP32[r>>>2>>>0]=n;break;default:AL.currentCtx.err=40962;return}}}_alGetSourcei.sig="viip";function _alGetSourceiv(e,t,r){r>>>=0;var n=AL.getSourceParam("alGetSourceiv",e,t);if(n!==null){if(!r){AL.currentCtx.err=40963;return}switch(t){case 514:case 4097:case 4098:case 4103:case 4105:case 4112:case 4117:case 4118:case 4128:case 4129:case 4131:case 4132:case 4133:case 4134:case 4135:case 4628:case 8201:case 8202:case 53248:HEAP32[r>>>2>>>0]=n;break;case 4100:case 4101:case 4102:HEAP32[r>>>2>>>0]=n[0],HEAP32[r+4>>>2>>>0]=n[1],HEAP32[r+8>>>2>>>0]=n[2];break;default:AL.currentCtx.err=40962;return}}}_alGetSourceiv.sig="viip";var stringToNewUTF8=e=>{var t=lengthBytesUTF8(e)+1,r=_malloc(t);return r&&stringToUTF8(e,r,t),r};function _alGetString(e){if(AL.stringCache[e])return AL.stringCache[e];var t;switch(e){case 0:t="No Error";break;case 40961:t="Invalid Name";break;case 40962:t="Invalid Enum";break;case 40963:t="Invalid Value";break;case 40964:t="Invalid Operation";break;case 40965:t="Out of Memory";break;case 45057:t="Emscripten";break;case 45058:t="1.1";break;case 45059:t="WebAudio";break;case 45060:t=Object.keys(AL.AL_EXTENSIONS).join(" ");break;default:return AL.currentCtx&&(AL.currentCtx.err=40962),0}return t=stringToNewUTF8(t),AL.stringCache[e]=t,t}_alGetString.sig="pi";var _alIsBuffer=e=>!(!AL.currentCtx||e>AL.buffers.length||!AL.buffers[e]);_alIsBuffer.sig="ii";var _alIsEnabled=e=>{if(!AL.currentCtx)return 0;switch(e){case 512:return AL.currentCtx.sourceDistanceModel?0:1;default:return AL.currentCtx.err=40962,0}};_alIsEnabled.sig="ii";function _alIsExtensionPresent(e){e>>>=0;var t=UTF8ToString(e);return AL.AL_EXTENSIONS[t]?1:0}_alIsExtensionPresent.sig="ip";var _alIsSource=e=>!(!AL.currentCtx||!AL.currentCtx.sources[e]);_alIsSource.sig="ii";var _alListener3f=(e,t,r,n)=>{switch(e){case 4100:case 4102:AL.paramArray[0]=t,AL.paramArray[1]=r,AL.paramArray[2]=n,AL.setListenerParam("alListener3f",e,AL.paramArray);break;default:AL.setListenerParam("alListener3f",e,null);break}};_alListener3f.sig="vifff";var _alListener3i=(e,t,r,n)=>{switch(e){case 4100:case 4102:AL.paramArray[0]=t,AL.paramArray[1]=r,AL.paramArray[2]=n,AL.setListenerParam("alListener3i",e,AL.paramArray);break;default:AL.setListenerParam("alListener3i",e,null);break}};_alListener3i.sig="viiii";var _alListenerf=(e,t)=>{switch(e){case 4106:AL.setListenerParam("alListenerf",e,t);break;default:AL.setListenerParam("alListenerf",e,null);break}};_alListenerf.sig="vif";function _alListenerfv(e,t){if(t>>>=0,!!AL.currentCtx){if(!t){AL.currentCtx.err=40963;return}switch(e){case 4100:case 4102:AL.paramArray[0]=HEAPF32[t>>>2>>>0],AL.paramArray[1]=HEAPF32[t+4>>>2>>>0],AL.paramArray[2]=HEAPF32[t+8>>>2>>>0],AL.setListenerParam("alListenerfv",e,AL.paramArray);break;case 4111:AL.paramArray[0]=HEAPF32[t>>>2>>>0],AL.paramArray[1]=HEAPF32[t+4>>>2>>>0],AL.paramArray[2]=HEAPF32[t+8>>>2>>>0],AL.paramArray[3]=HEAPF32[t+12>>>2>>>0],AL.paramArray[4]=HEAPF32[t+16>>>2>>>0],AL.paramArray[5]=HEAPF32[t+20>>>2>>>0],AL.setListenerParam("alListenerfv",e,AL.paramArray);break;default:AL.setListenerParam("alListenerfv",e,null);break}}}_alListenerfv.sig="vip";var _alListeneri=(e,t)=>{AL.setListenerParam("alListeneri",e,null)};_alListeneri.sig="vii";function _alListeneriv(e,t){if(t>>>=0,!!AL.currentCtx){if(!t){AL.currentCtx.err=40963;return}switch(e){case 4100:case 4102:AL.paramArray[0]=HEAP32[t>>>2>>>0],AL.paramArray[1]=HEAP32[t+4>>>2>>>0],AL.paramArray[2]=HEAP32[t+8>>>2>>>0],AL.setListenerParam("alListeneriv",e,AL.paramArray);break;case 4111:AL.paramArray[0]=HEAP32[t>>>2>>>0],AL.paramArray[1]=HEAP32[t+4>>>2>>>0],AL.paramArray[2]=HEAP32[t+8>>>2>>>0],AL.paramArray[3]=HEAP32[t+12>>>2>>>0],AL.paramArray[4]=HEAP32[t+16>>>2>>>0],AL.paramArray[5]=HEAP32[t+20>>>2>>>0],AL.setListenerParam("alListeneriv",e,AL.paramArray);break;default:AL.setListenerParam("alListeneriv",e,null);break}}}_alListeneriv.sig="vip";var _alSource3f=(e,t,r,n,a)=>{switch(t){case 4100:case 4101:case 4102:AL.paramArray[0]=r,AL.paramArray[1]=n,AL.paramArray[2]=a,AL.setSourceParam("alSource3f",e,t,AL.paramArray);break;default:AL.setSourceParam("alSource3f",e,t,null);break}};_alSource3f.sig="viifff";var _alSource3i=(e,t,r,n,a)=>{switch(t){case 4100:case 4101:case 4102:AL.paramArray[0]=r,AL.paramArray[1]=n,AL.paramArray[2]=a,AL.setSourceParam("alSource3i",e,t,AL.paramArray);break;default:AL.setSourceParam("alSource3i",e,t,null);break}};_alSource3i.sig="viiiii";var _alSourcePause=e=>{if(AL.currentCtx){var t=AL.currentCtx.sources[e];if(!t){AL.currentCtx.err=40961;return}AL.setSourceState(t,4115)}};_alSourcePause.sig="vi";function _alSourcePausev(e,t){if(t>>>=0,!!AL.currentCtx){t||(AL.currentCtx.err=40963);for(var r=0;r<e;++r)if(!AL.currentCtx.sources[HEAP32[t+r*4>>>2>>>0]]){AL.currentCtx.err=40961;return}for(var r=0;r<e;++r){var n=HEAP32[t+r*4>>>2>>>0];AL.setSourceState(AL.currentCtx.sources[n],4115)}}}_alSourcePausev.sig="vip";var _alSourcePlay=e=>{if(AL.currentCtx){var t=AL.currentCtx.sources[e];if(!t){AL.currentCtx.err=40961;return}AL.setSourceState(t,4114)}};_alSourcePlay.sig="vi";function _alSourcePlayv(e,t){if(t>>>=0,!!AL.currentCtx){t||(AL.currentCtx.err=40963);for(var r=0;r<e;++r)if(!AL.currentCtx.sources[HEAP32[t+r*4>>>2>>>0]]){AL.currentCtx.err=40961;return}for(var r=0;r<e;++r){var n=HEAP32[t+r*4>>>2>>>0];AL.setSourceState(AL.currentCtx.sources[n],4114)}}}_alSourcePlayv.sig="vip";function _alSourceQueueBuffers(e,t,r){if(r>>>=0,!!AL.currentCtx){var n=AL.currentCtx.sources[e];if(!n){AL.currentCtx.err=40961;return}if(n.type===4136){AL.currentCtx.err=40964;return}if(t!==0){for(var a=AL.buffers[0],o=0;o<n.bufQueue.length;o++)if(n.bufQueue[o].id!==0){a=n.bufQueue[o];break}for(var o=0;o<t;++o){var l=HEAP32[r+o*4>>>2>>>0],u=AL.buffers[l];if(!u){AL.currentCtx.err=40961;return}a.id!==0&&(u.frequency!==a.frequency||u.bytesPerSample!==a.bytesPerSample||u.channels!==a.channels)&&(AL.currentCtx.err=40964)}n.bufQueue.length===1&&n.bufQueue[0].id===0&&(n.bufQueue.length=0),n.type=4137;for(var o=0;o<t;++o){var l=HEAP32[r+o*4>>>2>>>0],u=AL.buffers[l];u.refCount++,n.bufQueue.push(u)}n.looping&&AL.cancelPendingSourceAudio(n),AL.initSourcePanner(n),AL.scheduleSourceAudio(n)}}}_alSourceQueueBuffers.sig="viip";var _alSourceRewind=e=>{if(AL.currentCtx){var t=AL.currentCtx.sources[e];if(!t){AL.currentCtx.err=40961;return}AL.setSourceState(t,4116),AL.setSourceState(t,4113)}};_alSourceRewind.sig="vi";function _alSourceRewindv(e,t){if(t>>>=0,!!AL.currentCtx){t||(AL.currentCtx.err=40963);for(var r=0;r<e;++r)if(!AL.currentCtx.sources[HEAP32[t+r*4>>>2>>>0]]){AL.currentCtx.err=40961;return}for(var r=0;r<e;++r){var n=HEAP32[t+r*4>>>2>>>0];AL.setSourceState(AL.currentCtx.sources[n],4113)}}}_alSourceRewindv.sig="vip";var _alSourceStop=e=>{if(AL.currentCtx){var t=AL.currentCtx.sources[e];if(!t){AL.currentCtx.err=40961;return}AL.setSourceState(t,4116)}};_alSourceStop.sig="vi";function _alSourceStopv(e,t){if(t>>>=0,!!AL.currentCtx){t||(AL.currentCtx.err=40963);for(var r=0;r<e;++r)if(!AL.currentCtx.sources[HEAP32[t+r*4>>>2>>>0]]){AL.currentCtx.err=40961;return}for(var r=0;r<e;++r){var n=HEAP32[t+r*4>>>2>>>0];AL.setSourceState(AL.currentCtx.sources[n],4116)}}}_alSourceStopv.sig="vip";function _alSourceUnqueueBuffers(e,t,r){if(r>>>=0,!!AL.currentCtx){var n=AL.currentCtx.sources[e];if(!n){AL.currentCtx.err=40961;return}if(t>(n.bufQueue.length===1&&n.bufQueue[0].id===0?0:n.bufsProcessed)){AL.currentCtx.err=40963;return}if(t!==0){for(var a=0;a<t;a++){var o=n.bufQueue.shift();o.refCount--,HEAP32[r+a*4>>>2>>>0]=o.id,n.bufsProcessed--}n.bufQueue.length===0&&n.bufQueue.push(AL.buffers[0]),AL.initSourcePanner(n),AL.scheduleSourceAudio(n)}}}_alSourceUnqueueBuffers.sig="viip";var _alSourcef=(e,t,r)=>{switch(t){case 4097:case 4098:case 4099:case 4106:case 4109:case 4110:case 4128:case 4129:case 4130:case 4131:case 4132:case 4133:case 4134:case 8203:AL.setSourceParam("alSourcef",e,t,r);break;default:AL.setSourceParam("alSourcef",e,t,null);break}};_alSourcef.sig="viif";function _alSourcefv(e,t,r){if(r>>>=0,!!AL.currentCtx){if(!r){AL.currentCtx.err=40963;return}switch(t){case 4097:case 4098:case 4099:case 4106:case 4109:case 4110:case 4128:case 4129:case 4130:case 4131:case 4132:case 4133:case 4134:case 8203:var n=HEAPF32[r>>>2>>>0];AL.setSourceParam("alSourcefv",e,t,n);break;case 4100:case 4101:case 4102:AL.paramArray[0]=HEAPF32[r>>>2>>>0],AL.paramArray[1]=HEAPF32[r+4>>>2>>>0],AL.paramArray[2]=HEAPF32[r+8>>>2>>>0],AL.setSourceParam("alSourcefv",e,t,AL.paramArray);break;default:AL.setSourceParam("alSourcefv",e,t,null);break}}}_alSourcefv.sig="viip";function _alSourceiv(e,t,r){if(r>>>=0,!!AL.currentCtx){if(!r){AL.currentCtx.err=40963;return}switch(t){case 514:case 4097:case 4098:case 4103:case 4105:case 4128:case 4129:case 4131:case 4132:case 4133:case 4134:case 4628:case 8201:case 8202:case 53248:var n=HEAP32[r>>>2>>>0];AL.setSourceParam("alSourceiv",e,t,n);break;case 4100:case 4101:case 4102:AL.paramArray[0]=HEAP32[r>>>2>>>0],AL.paramArray[1]=HEAP32[r+4>>>2>>>0],AL.paramArray[2]=HEAP32[r+8>>>2>>>0],AL.setSourceParam("alSourceiv",e,t,AL.paramArray);break;default:AL.setSourceParam("alSourceiv",e,t,null);break}}}_alSourceiv.sig="viip";var _alSpeedOfSound=e=>{AL.setGlobalParam("alSpeedOfSound",49155,e)};_alSpeedOfSound.sig="vf";var _alcCaptureCloseDevice=function(e){var r,n,a,o;e>>>=0;var t=AL.requireValidCaptureDevice(e,"alcCaptureCloseDevice");return t?(delete AL.captures[e],AL.freeIds.push(e),(r=t.mediaStreamSourceNode)==null||r.disconnect(),(n=t.mergerNode)==null||n.disconnect(),(a=t.splitterNode)==null||a.disconnect(),(o=t.scriptProcessorNode)==null||o.disconnect(),t.mediaStream&&t.mediaStream.getTracks().forEach(l=>l.stop()),delete t.buffers,t.capturedFrameCount=0,t.isCapturing=!1,!0):!1};_alcCaptureCloseDevice.sig="ip";var listenOnce=(e,t,r)=>{e.addEventListener(t,r,{once:!0})},autoResumeAudioContext=(e,t)=>{t||(t=[document,document.getElementById("canvas")]),["keydown","mousedown","touchstart"].forEach(r=>{t.forEach(n=>{n&&listenOnce(n,r,()=>{e.state==="suspended"&&e.resume()})})})};function _alcCaptureOpenDevice(e,t,r,n){var D;e>>>=0;var a=AL.CAPTURE_DEVICE_NAME;if(e!==0&&(a=UTF8ToString(e),a!==AL.CAPTURE_DEVICE_NAME))return AL.alcErr=40965,0;if(n<0)return AL.alcErr=40964,0;navigator.getUserMedia=navigator.getUserMedia||navigator.webkitGetUserMedia||navigator.mozGetUserMedia||navigator.msGetUserMedia;var o=navigator.getUserMedia||navigator.mediaDevices&&navigator.mediaDevices.getUserMedia;if(!o)return AL.alcErr=40965,0;var l=window.AudioContext||window.webkitAudioContext;if(!AL.sharedCaptureAudioCtx)try{AL.sharedCaptureAudioCtx=new l}catch(F){return AL.alcErr=40965,0}autoResumeAudioContext(AL.sharedCaptureAudioCtx);var u;switch(r){case 65552:case 4353:case 4352:u=1;break;case 65553:case 4355:case 4354:u=2;break;default:return AL.alcErr=40964,0}function _(F){return new Float32Array(F)}function d(F){return new Int16Array(F)}function f(F){return new Uint8Array(F)}var p,m;switch(r){case 65552:case 65553:p="f32",m=_;break;case 4353:case 4355:p="i16",m=d;break;case 4352:case 4354:p="u8",m=f;break}var h=[];try{for(var g=0;g<u;++g)h[g]=m(n)}catch(F){return AL.alcErr=40965,0}var v={audioCtx:AL.sharedCaptureAudioCtx,deviceName:a,requestedSampleRate:t,requestedSampleType:p,outputChannelCount:u,inputChannelCount:null,mediaStreamError:null,mediaStreamSourceNode:null,mediaStream:null,mergerNode:null,splitterNode:null,scriptProcessorNode:null,isCapturing:!1,buffers:h,get bufferFrameCapacity(){return h[0].length},capturePlayhead:0,captureReadhead:0,capturedFrameCount:0},y=F=>{v.mediaStreamError=F},S=F=>{v.mediaStreamSourceNode=v.audioCtx.createMediaStreamSource(F),v.mediaStream=F;var E=1;switch(v.mediaStreamSourceNode.channelCountMode){case"max":E=u;break;case"clamped-max":E=Math.min(u,v.mediaStreamSourceNode.channelCount);break;case"explicit":E=v.mediaStreamSourceNode.channelCount;break}v.inputChannelCount=E;var x=512;v.scriptProcessorNode=v.audioCtx.createScriptProcessor(x,E,u),E>u?(v.mergerNode=v.audioCtx.createChannelMerger(E),v.mediaStreamSourceNode.connect(v.mergerNode),v.mergerNode.connect(v.scriptProcessorNode)):E<u?(v.splitterNode=v.audioCtx.createChannelSplitter(u),v.mediaStreamSourceNode.connect(v.splitterNode),v.splitterNode.connect(v.scriptProcessorNode)):v.mediaStreamSourceNode.connect(v.scriptProcessorNode),v.scriptProcessorNode.connect(v.audioCtx.destination),v.scriptProcessorNode.onaudioprocess=A=>{if(v.isCapturing){var L=v,C=A.inputBuffer;switch(r){case 65552:for(var T=C.getChannelData(0),k=0;k<C.length;++k){var P=(L.capturePlayhead+k)%L.bufferFrameCapacity;L.buffers[0][P]=T[k]}break;case 65553:for(var T=C.getChannelData(0),M=C.getChannelData(1),k=0;k<C.length;++k){var P=(L.capturePlayhead+k)%L.bufferFrameCapacity;L.buffers[0][P]=T[k],L.buffers[1][P]=M[k]}break;case 4353:for(var T=C.getChannelData(0),k=0;k<C.length;++k){var P=(L.capturePlayhead+k)%L.bufferFrameCapacity;L.buffers[0][P]=T[k]*32767}break;case 4355:for(var T=C.getChannelData(0),M=C.getChannelData(1),k=0;k<C.length;++k){var P=(L.capturePlayhead+k)%L.bufferFrameCapacity;L.buffers[0][P]=T[k]*32767,L.buffers[1][P]=M[k]*32767}break;case 4352:for(var T=C.getChannelData(0),k=0;k<C.length;++k){var P=(L.capturePlayhead+k)%L.bufferFrameCapacity;L.buffers[0][P]=(T[k]+1)*127}break;case 4354:for(var T=C.getChannelData(0),M=C.getChannelData(1),k=0;k<C.length;++k){var P=(L.capturePlayhead+k)%L.bufferFrameCapacity;L.buffers[0][P]=(T[k]+1)*127,L.buffers[1][P]=(M[k]+1)*127}break}L.capturePlayhead+=C.length,L.capturePlayhead%=L.bufferFrameCapacity,L.capturedFrameCount+=C.length,L.capturedFrameCount=Math.min(L.capturedFrameCount,L.bufferFrameCapacity)}}};(D=navigator.mediaDevices)!=null&&D.getUserMedia?navigator.mediaDevices.getUserMedia({audio:!0}).then(S).catch(y):navigator.getUserMedia({audio:!0},S,y);var w=AL.newId();return AL.captures[w]=v,w}_alcCaptureOpenDevice.sig="ppiii";function _alcCaptureSamples(e,t,r){e>>>=0,t>>>=0;var n=AL.requireValidCaptureDevice(e,"alcCaptureSamples");if(!n)return;var a=n.requestedSampleRate,o=n.audioCtx.sampleRate,l=o/a;if(r<0||r>n.capturedFrameCount/l){AL.alcErr=40964;return}function u(D,F){HEAPF32[t+4*D>>>2>>>0]=F}function _(D,F){HEAP16[t+2*D>>>1>>>0]=F}function d(D,F){HEAP8[t+D>>>0]=F}var f;switch(n.requestedSampleType){case"f32":f=u;break;case"i16":f=_;break;case"u8":f=d;break;default:return}if(Math.floor(l)==l)for(var p=0,m=0;m<r;++m){for(var h=0;h<n.buffers.length;++h,++p)f(p,n.buffers[h][n.captureReadhead]);n.captureReadhead=(l+n.captureReadhead)%n.bufferFrameCapacity}else for(var p=0,m=0;m<r;++m){for(var g=Math.floor(n.captureReadhead),v=Math.ceil(n.captureReadhead),y=n.captureReadhead-g,h=0;h<n.buffers.length;++h,++p){var S=n.buffers[h][g],w=n.buffers[h][v];f(p,(1-y)*S+y*w)}n.captureReadhead=(n.captureReadhead+l)%n.bufferFrameCapacity}n.capturedFrameCount=0}_alcCaptureSamples.sig="vppi";function _alcCaptureStart(e){e>>>=0;var t=AL.requireValidCaptureDevice(e,"alcCaptureStart");t&&(t.isCapturing||(t.isCapturing=!0,t.capturedFrameCount=0,t.capturePlayhead=0))}_alcCaptureStart.sig="vp";function _alcCaptureStop(e){e>>>=0;var t=AL.requireValidCaptureDevice(e,"alcCaptureStop");t&&(t.isCapturing=!1)}_alcCaptureStop.sig="vp";function _alcCloseDevice(e){return e>>>=0,!(e in AL.deviceRefCounts)||AL.deviceRefCounts[e]>0?0:(delete AL.deviceRefCounts[e],AL.freeIds.push(e),1)}_alcCloseDevice.sig="ip";function _alcCreateContext(e,t){if(e>>>=0,t>>>=0,!(e in AL.deviceRefCounts))return AL.alcErr=40961,0;var r=null,n=[],a=null;if(t>>=2,t)for(var o=0,l=0;o=HEAP32[t++>>>0],n.push(o),o!==0;)switch(l=HEAP32[t++>>>0],n.push(l),o){case 4103:r||(r={}),r.sampleRate=l;break;case 4112:case 4113:break;case 6546:switch(l){case 0:a=!1;break;case 1:a=!0;break;case 2:break;default:return AL.alcErr=40964,0}break;case 6550:if(l!==0)return AL.alcErr=40964,0;break;default:return AL.alcErr=40964,0}var u=window.AudioContext||window.webkitAudioContext,_=null;try{r?_=new u(r):_=new u}catch(h){return h.name==="NotSupportedError"?AL.alcErr=40964:AL.alcErr=40961,0}autoResumeAudioContext(_),typeof _.createGain>"u"&&(_.createGain=_.createGainNode);var d=_.createGain();d.connect(_.destination);var f={deviceId:e,id:AL.newId(),attrs:n,audioCtx:_,listener:{position:[0,0,0],velocity:[0,0,0],direction:[0,0,0],up:[0,0,0]},sources:[],interval:setInterval(()=>AL.scheduleContextAudio(f),AL.QUEUE_INTERVAL),gain:d,distanceModel:53250,speedOfSound:343.3,dopplerFactor:1,sourceDistanceModel:!1,hrtf:a||!1,_err:0,get err(){return this._err},set err(h){(this._err===0||h===0)&&(this._err=h)}};if(AL.deviceRefCounts[e]++,AL.contexts[f.id]=f,a!==null)for(var p in AL.contexts){var m=AL.contexts[p];m.deviceId===e&&(m.hrtf=a,AL.updateContextGlobal(m))}return f.id}_alcCreateContext.sig="ppp";function _alcDestroyContext(e){e>>>=0;var t=AL.contexts[e];if(AL.currentCtx===t){AL.alcErr=40962;return}AL.contexts[e].interval&&clearInterval(AL.contexts[e].interval),AL.deviceRefCounts[t.deviceId]--,delete AL.contexts[e],AL.freeIds.push(e)}_alcDestroyContext.sig="vp";function _alcGetContextsDevice(e){return e>>>=0,e in AL.contexts?AL.contexts[e].deviceId:0}_alcGetContextsDevice.sig="pp";function _alcGetCurrentContext(){return AL.currentCtx!==null?AL.currentCtx.id:0}_alcGetCurrentContext.sig="p";function _alcGetEnumValue(e,t){if(e>>>=0,t>>>=0,e!==0&&!(e in AL.deviceRefCounts))return 0;if(!t)return AL.alcErr=40964,0;var r=UTF8ToString(t);switch(r){case"ALC_NO_ERROR":return 0;case"ALC_INVALID_DEVICE":return 40961;case"ALC_INVALID_CONTEXT":return 40962;case"ALC_INVALID_ENUM":return 40963;case"ALC_INVALID_VALUE":return 40964;case"ALC_OUT_OF_MEMORY":return 40965;case"ALC_MAJOR_VERSION":return 4096;case"ALC_MINOR_VERSION":return 4097;case"ALC_ATTRIBUTES_SIZE":return 4098;case"ALC_ALL_ATTRIBUTES":return 4099;case"ALC_DEFAULT_DEVICE_SPECIFIER":return 4100;case"ALC_DEVICE_SPECIFIER":return 4101;case"ALC_EXTENSIONS":return 4102;case"ALC_FREQUENCY":return 4103;case"ALC_REFRESH":return 4104;case"ALC_SYNC":return 4105;case"ALC_MONO_SOURCES":return 4112;case"ALC_STEREO_SOURCES":return 4113;case"ALC_CAPTURE_DEVICE_SPECIFIER":return 784;case"ALC_CAPTURE_DEFAULT_DEVICE_SPECIFIER":return 785;case"ALC_CAPTURE_SAMPLES":return 786;case"ALC_HRTF_SOFT":return 6546;case"ALC_HRTF_ID_SOFT":return 6550;case"ALC_DONT_CARE_SOFT":return 2;case"ALC_HRTF_STATUS_SOFT":return 6547;case"ALC_NUM_HRTF_SPECIFIERS_SOFT":return 6548;case"ALC_HRTF_SPECIFIER_SOFT":return 6549;case"ALC_HRTF_DISABLED_SOFT":return 0;case"ALC_HRTF_ENABLED_SOFT":return 1;case"ALC_HRTF_DENIED_SOFT":return 2;case"ALC_HRTF_REQUIRED_SOFT":return 3;case"ALC_HRTF_HEADPHONES_DETECTED_SOFT":return 4;case"ALC_HRTF_UNSUPPORTED_FORMAT_SOFT":return 5;default:return AL.alcErr=40964,0}}_alcGetEnumValue.sig="ipp";function _alcGetError(e){e>>>=0;var t=AL.alcErr;return AL.alcErr=0,t}_alcGetError.sig="ip";function _alcGetIntegerv(e,t,r,n){if(e>>>=0,n>>>=0,!(r===0||!n))switch(t){case 4096:HEAP32[n>>>2>>>0]=1;break;case 4097:HEAP32[n>>>2>>>0]=1;break;case 4098:if(!(e in AL.deviceRefCounts)){AL.alcErr=40961;return}if(!AL.currentCtx){AL.alcErr=40962;return}HEAP32[n>>>2>>>0]=AL.currentCtx.attrs.length;break;case 4099:if(!(e in AL.deviceRefCounts)){AL.alcErr=40961;return}if(!AL.currentCtx){AL.alcErr=40962;return}for(var a=0;a<AL.currentCtx.attrs.length;a++)HEAP32[n+a*4>>>2>>>0]=AL.currentCtx.attrs[a];break;case 4103:if(!(e in AL.deviceRefCounts)){AL.alcErr=40961;return}if(!AL.currentCtx){AL.alcErr=40962;return}HEAP32[n>>>2>>>0]=AL.currentCtx.audioCtx.sampleRate;break;case 4112:case 4113:if(!(e in AL.deviceRefCounts)){AL.alcErr=40961;return}if(!AL.currentCtx){AL.alcErr=40962;return}HEAP32[n>>>2>>>0]=2147483647;break;case 6546:case 6547:if(!(e in AL.deviceRefCounts)){AL.alcErr=40961;return}var o=0;for(var l in AL.contexts){var u=AL.contexts[l];u.deviceId===e&&(o=u.hrtf?1:0)}HEAP32[n>>>2>>>0]=o;break;case 6548:if(!(e in AL.deviceRefCounts)){AL.alcErr=40961;return}HEAP32[n>>>2>>>0]=1;break;case 131075:if(!(e in AL.deviceRefCounts)){AL.alcErr=40961;return}if(!AL.currentCtx){AL.alcErr=40962;return}HEAP32[n>>>2>>>0]=1;case 786:var _=AL.requireValidCaptureDevice(e,"alcGetIntegerv");if(!_)return;var d=_.capturedFrameCount,f=_.requestedSampleRate,p=_.audioCtx.sampleRate,m=Math.floor(d*(f/p));HEAP32[n>>>2>>>0]=m;break;default:AL.alcErr=40963;return}}_alcGetIntegerv.sig="vpiip";function _alcGetString(e,t){if(e>>>=0,AL.alcStringCache[t])return AL.alcStringCache[t];var r;switch(t){case 0:r="No Error";break;case 40961:r="Invalid Device";break;case 40962:r="Invalid Context";break;case 40963:r="Invalid Enum";break;case 40964:r="Invalid Value";break;case 40965:r="Out of Memory";break;case 4100:if(typeof AudioContext<"u"||typeof webkitAudioContext<"u")r=AL.DEVICE_NAME;else return 0;break;case 4101:typeof AudioContext<"u"||typeof webkitAudioContext<"u"?r=AL.DEVICE_NAME+"\0":r="\0";break;case 785:r=AL.CAPTURE_DEVICE_NAME;break;case 784:if(e===0)r=AL.CAPTURE_DEVICE_NAME+"\0";else{var n=AL.requireValidCaptureDevice(e,"alcGetString");if(!n)return 0;r=n.deviceName}break;case 4102:if(!e)return AL.alcErr=40961,0;r=Object.keys(AL.ALC_EXTENSIONS).join(" ");break;default:return AL.alcErr=40963,0}return r=stringToNewUTF8(r),AL.alcStringCache[t]=r,r}_alcGetString.sig="ppi";function _alcIsExtensionPresent(e,t){e>>>=0,t>>>=0;var r=UTF8ToString(t);return AL.ALC_EXTENSIONS[r]?1:0}_alcIsExtensionPresent.sig="ipp";function _alcMakeContextCurrent(e){return e>>>=0,e===0?AL.currentCtx=null:AL.currentCtx=AL.contexts[e],1}_alcMakeContextCurrent.sig="ip";function _alcOpenDevice(e){if(e>>>=0,e){var t=UTF8ToString(e);if(t!==AL.DEVICE_NAME)return 0}if(typeof AudioContext<"u"||typeof webkitAudioContext<"u"){var r=AL.newId();return AL.deviceRefCounts[r]=0,r}return 0}_alcOpenDevice.sig="pp";function _alcProcessContext(e){e>>>=0}_alcProcessContext.sig="vp";function _alcSuspendContext(e){e>>>=0}_alcSuspendContext.sig="vp";function _duckdb_web_fs_directory_create(e,t){return e>>>=0,globalThis.DUCKDB_RUNTIME.createDirectory(Module,e,t)}_duckdb_web_fs_directory_create.sig="vpi";function _duckdb_web_fs_directory_exists(e,t){return e>>>=0,globalThis.DUCKDB_RUNTIME.checkDirectory(Module,e,t)}_duckdb_web_fs_directory_exists.sig="ipi";function _duckdb_web_fs_directory_list_files(e,t){return e>>>=0,globalThis.DUCKDB_RUNTIME.listDirectoryEntries(Module,e,t)}_duckdb_web_fs_directory_list_files.sig="ipi";function _duckdb_web_fs_directory_remove(e,t){return e>>>=0,globalThis.DUCKDB_RUNTIME.removeDirectory(Module,e,t)}_duckdb_web_fs_directory_remove.sig="vpi";function _duckdb_web_fs_file_close(e){return globalThis.DUCKDB_RUNTIME.closeFile(Module,e)}_duckdb_web_fs_file_close.sig="vi";function _duckdb_web_fs_file_drop_file(e,t){return e>>>=0,globalThis.DUCKDB_RUNTIME.dropFile(Module,e,t)}_duckdb_web_fs_file_drop_file.sig="vpi";function _duckdb_web_fs_file_exists(e,t){return e>>>=0,globalThis.DUCKDB_RUNTIME.checkFile(Module,e,t)}_duckdb_web_fs_file_exists.sig="ipi";function _duckdb_web_fs_file_move(e,t,r,n){return e>>>=0,r>>>=0,globalThis.DUCKDB_RUNTIME.moveFile(Module,e,t,r,n)}_duckdb_web_fs_file_move.sig="vpipi";function _duckdb_web_fs_file_open(e,t){return globalThis.DUCKDB_RUNTIME.openFile(Module,e,t)}_duckdb_web_fs_file_open.sig="pii";function _duckdb_web_fs_file_read(e,t,r,n){return t>>>=0,globalThis.DUCKDB_RUNTIME.readFile(Module,e,t,r,n)}_duckdb_web_fs_file_read.sig="iipid";function _duckdb_web_fs_file_truncate(e,t){return globalThis.DUCKDB_RUNTIME.truncateFile(Module,e,t)}_duckdb_web_fs_file_truncate.sig="vid";function _duckdb_web_fs_file_write(e,t,r,n){return t>>>=0,globalThis.DUCKDB_RUNTIME.writeFile(Module,e,t,r,n)}_duckdb_web_fs_file_write.sig="iipid";function _duckdb_web_fs_get_default_data_protocol(e){return globalThis.DUCKDB_RUNTIME.getDefaultDataProtocol(e)}_duckdb_web_fs_get_default_data_protocol.sig="i";function _duckdb_web_fs_glob(e,t){return e>>>=0,globalThis.DUCKDB_RUNTIME.glob(Module,e,t)}_duckdb_web_fs_glob.sig="vpi";function _duckdb_web_test_platform_feature(e){return globalThis.DUCKDB_RUNTIME.testPlatformFeature(Module,e)}_duckdb_web_test_platform_feature.sig="ii";function _duckdb_web_udf_scalar_call(e,t,r,n,a,o){return e>>>=0,r>>>=0,a>>>=0,globalThis.DUCKDB_RUNTIME.callScalarUDF(Module,e,t,r,n,a,o)}_duckdb_web_udf_scalar_call.sig="vpipipi";var _emscripten_alcDevicePauseSOFT=e=>{if(!(e in AL.deviceRefCounts)){AL.alcErr=40961;return}if(!AL.paused){AL.paused=!0;for(var t in AL.contexts){var r=AL.contexts[t];r.deviceId===e&&(r.audioCtx.suspend(),clearInterval(r.interval),r.interval=null)}}};_emscripten_alcDevicePauseSOFT.sig="vi";var _emscripten_alcDeviceResumeSOFT=e=>{if(!(e in AL.deviceRefCounts)){AL.alcErr=40961;return}if(AL.paused){AL.paused=!1;for(var t in AL.contexts){var r=AL.contexts[t];r.deviceId===e&&(r.interval=setInterval(()=>AL.scheduleContextAudio(r),AL.QUEUE_INTERVAL),r.audioCtx.resume())}}};_emscripten_alcDeviceResumeSOFT.sig="vi";var _emscripten_alcGetStringiSOFT=(e,t,r)=>{if(!(e in AL.deviceRefCounts))return AL.alcErr=40961,0;if(AL.alcStringCache[t])return AL.alcStringCache[t];var n;switch(t){case 6549:if(r===0)n="Web Audio HRTF";else return AL.alcErr=40964,0;break;default:return r!==0?(AL.alcErr=40963,0):_alcGetString(e,t)}return n=stringToNewUTF8(n),AL.alcStringCache[t]=n,n};_emscripten_alcGetStringiSOFT.sig="iiii";var _emscripten_alcResetDeviceSOFT=(e,t)=>{if(!(e in AL.deviceRefCounts))return AL.alcErr=40961,0;var r=null;if(t>>=2,t)for(var n=0,a=0;n=HEAP32[t++>>>0],n!==0;)switch(a=HEAP32[t++>>>0],n){case 6546:a===1?r=!0:a===0&&(r=!1);break}if(r!==null)for(var o in AL.contexts){var l=AL.contexts[o];l.deviceId===e&&(l.hrtf=r,AL.updateContextGlobal(l))}return 1};_emscripten_alcResetDeviceSOFT.sig="iii";var readEmAsmArgsArray=[],readEmAsmArgs=(e,t)=>{readEmAsmArgsArray.length=0;for(var r;r=HEAPU8[e++>>>0];){var n=r!=105;n&=r!=112,t+=n&&t%8?4:0,readEmAsmArgsArray.push(r==112?HEAPU32[t>>>2>>>0]:r==105?HEAP32[t>>>2>>>0]:HEAPF64[t>>>3>>>0]),t+=n?8:4}return readEmAsmArgsArray},runEmAsmFunction=(e,t,r)=>{var n=readEmAsmArgs(t,r);return ASM_CONSTS[e](...n)};function _emscripten_asm_const_int(e,t,r){return e>>>=0,t>>>=0,r>>>=0,runEmAsmFunction(e,t,r)}_emscripten_asm_const_int.sig="ippp";function _emscripten_asm_const_ptr(e,t,r){return e>>>=0,t>>>=0,r>>>=0,runEmAsmFunction(e,t,r)}_emscripten_asm_const_ptr.sig="pppp";function _emscripten_console_error(e){e>>>=0,console.error(UTF8ToString(e))}_emscripten_console_error.sig="vp";function _emscripten_console_log(e){e>>>=0,console.log(UTF8ToString(e))}_emscripten_console_log.sig="vp";function _emscripten_console_trace(e){e>>>=0,console.trace(UTF8ToString(e))}_emscripten_console_trace.sig="vp";function _emscripten_console_warn(e){e>>>=0,console.warn(UTF8ToString(e))}_emscripten_console_warn.sig="vp";var _emscripten_date_now=()=>Date.now();_emscripten_date_now.sig="d";function _emscripten_err(e){return e>>>=0,err(UTF8ToString(e))}_emscripten_err.sig="vp";var getHeapMax=()=>4294901760;function _emscripten_get_heap_max(){return getHeapMax()}_emscripten_get_heap_max.sig="p";var _emscripten_get_now_res=()=>ENVIRONMENT_IS_NODE?1:1e3;_emscripten_get_now_res.sig="d";var GLctx,webgl_enable_ANGLE_instanced_arrays=e=>{var t=e.getExtension("ANGLE_instanced_arrays");if(t)return e.vertexAttribDivisor=(r,n)=>t.vertexAttribDivisorANGLE(r,n),e.drawArraysInstanced=(r,n,a,o)=>t.drawArraysInstancedANGLE(r,n,a,o),e.drawElementsInstanced=(r,n,a,o,l)=>t.drawElementsInstancedANGLE(r,n,a,o,l),1},webgl_enable_OES_vertex_array_object=e=>{var t=e.getExtension("OES_vertex_array_object");if(t)return e.createVertexArray=()=>t.createVertexArrayOES(),e.deleteVertexArray=r=>t.deleteVertexArrayOES(r),e.bindVertexArray=r=>t.bindVertexArrayOES(r),e.isVertexArray=r=>t.isVertexArrayOES(r),1},webgl_enable_WEBGL_draw_buffers=e=>{var t=e.getExtension("WEBGL_draw_buffers");if(t)return e.drawBuffers=(r,n)=>t.drawBuffersWEBGL(r,n),1},webgl_enable_EXT_polygon_offset_clamp=e=>!!(e.extPolygonOffsetClamp=e.getExtension("EXT_polygon_offset_clamp")),webgl_enable_EXT_clip_control=e=>!!(e.extClipControl=e.getExtension("EXT_clip_control")),webgl_enable_WEBGL_polygon_mode=e=>!!(e.webglPolygonMode=e.getExtension("WEBGL_polygon_mode")),webgl_enable_WEBGL_multi_draw=e=>!!(e.multiDrawWebgl=e.getExtension("WEBGL_multi_draw")),getEmscriptenSupportedExtensions=e=>{var t=["ANGLE_instanced_arrays","EXT_blend_minmax","EXT_disjoint_timer_query","EXT_frag_depth","EXT_shader_texture_lod","EXT_sRGB","OES_element_index_uint","OES_fbo_render_mipmap","OES_standard_derivatives","OES_texture_float","OES_texture_half_float","OES_texture_half_float_linear","OES_vertex_array_object","WEBGL_color_buffer_float","WEBGL_depth_texture","WEBGL_draw_buffers","EXT_clip_control","EXT_color_buffer_half_float","EXT_depth_clamp","EXT_float_blend","EXT_polygon_offset_clamp","EXT_texture_compression_bptc","EXT_texture_compression_rgtc","EXT_texture_filter_anisotropic","KHR_parallel_shader_compile","OES_texture_float_linear","WEBGL_blend_func_extended","WEBGL_compressed_texture_astc","WEBGL_compressed_texture_etc","WEBGL_compressed_texture_etc1","WEBGL_compressed_texture_s3tc","WEBGL_compressed_texture_s3tc_srgb","WEBGL_debug_renderer_info","WEBGL_debug_shaders","WEBGL_lose_context","WEBGL_multi_draw","WEBGL_polygon_mode"];return(e.getSupportedExtensions()||[]).filter(r=>t.includes(r))},GL={counter:1,buffers:[],programs:[],framebuffers:[],renderbuffers:[],textures:[],shaders:[],vaos:[],contexts:[],offscreenCanvases:{},queries:[],stringCache:{},unpackAlignment:4,unpackRowLength:0,recordError:e=>{GL.lastError||(GL.lastError=e)},getNewId:e=>{for(var t=GL.counter++,r=e.length;r<t;r++)e[r]=null;return t},genObject:(e,t,r,n)=>{for(var a=0;a<e;a++){var o=GLctx[r](),l=o&&GL.getNewId(n);o?(o.name=l,n[l]=o):GL.recordError(1282),HEAP32[t+a*4>>>2>>>0]=l}},getSource:(e,t,r,n)=>{for(var a="",o=0;o<t;++o){var l=n?HEAPU32[n+o*4>>>2>>>0]:void 0;a+=UTF8ToString(HEAPU32[r+o*4>>>2>>>0],l)}return a},createContext:(e,t)=>{if(!e.getContextSafariWebGL2Fixed){let o=function(l,u){var _=e.getContextSafariWebGL2Fixed(l,u);return l=="webgl"==_ instanceof WebGLRenderingContext?_:null};var a=o;e.getContextSafariWebGL2Fixed=e.getContext,e.getContext=o}var r=e.getContext("webgl",t);if(!r)return 0;var n=GL.registerContext(r,t);return n},registerContext:(e,t)=>{var r=GL.getNewId(GL.contexts),n={handle:r,attributes:t,version:t.majorVersion,GLctx:e};return e.canvas&&(e.canvas.GLctxObject=n),GL.contexts[r]=n,(typeof t.enableExtensionsByDefault>"u"||t.enableExtensionsByDefault)&&GL.initExtensions(n),r},makeContextCurrent:e=>{var t;return GL.currentContext=GL.contexts[e],Module.ctx=GLctx=(t=GL.currentContext)==null?void 0:t.GLctx,!(e&&!GLctx)},getContext:e=>GL.contexts[e],deleteContext:e=>{GL.currentContext===GL.contexts[e]&&(GL.currentContext=null),typeof JSEvents=="object"&&JSEvents.removeAllHandlersOnTarget(GL.contexts[e].GLctx.canvas),GL.contexts[e]&&GL.contexts[e].GLctx.canvas&&(GL.contexts[e].GLctx.canvas.GLctxObject=void 0),GL.contexts[e]=null},initExtensions:e=>{if(e||(e=GL.currentContext),!e.initExtensionsDone){e.initExtensionsDone=!0;var t=e.GLctx;webgl_enable_WEBGL_multi_draw(t),webgl_enable_EXT_polygon_offset_clamp(t),webgl_enable_EXT_clip_control(t),webgl_enable_WEBGL_polygon_mode(t),webgl_enable_ANGLE_instanced_arrays(t),webgl_enable_OES_vertex_array_object(t),webgl_enable_WEBGL_draw_buffers(t),t.disjointTimerQueryExt=t.getExtension("EXT_disjoint_timer_query"),getEmscriptenSupportedExtensions(t).forEach(r=>{!r.includes("lose_context")&&!r.includes("debug")&&t.getExtension(r)})}}},_glActiveTexture=e=>GLctx.activeTexture(e);_glActiveTexture.sig="vi";var _emscripten_glActiveTexture=_glActiveTexture;_emscripten_glActiveTexture.sig="vi";var _glAttachShader=(e,t)=>{GLctx.attachShader(GL.programs[e],GL.shaders[t])};_glAttachShader.sig="vii";var _emscripten_glAttachShader=_glAttachShader;_emscripten_glAttachShader.sig="vii";var _glBeginQueryEXT=(e,t)=>{GLctx.disjointTimerQueryExt.beginQueryEXT(e,GL.queries[t])};_glBeginQueryEXT.sig="vii";var _emscripten_glBeginQueryEXT=_glBeginQueryEXT;function _glBindAttribLocation(e,t,r){r>>>=0,GLctx.bindAttribLocation(GL.programs[e],t,UTF8ToString(r))}_glBindAttribLocation.sig="viip";var _emscripten_glBindAttribLocation=_glBindAttribLocation;_emscripten_glBindAttribLocation.sig="viip";var _glBindBuffer=(e,t)=>{GLctx.bindBuffer(e,GL.buffers[t])};_glBindBuffer.sig="vii";var _emscripten_glBindBuffer=_glBindBuffer;_emscripten_glBindBuffer.sig="vii";var _glBindFramebuffer=(e,t)=>{GLctx.bindFramebuffer(e,GL.framebuffers[t])};_glBindFramebuffer.sig="vii";var _emscripten_glBindFramebuffer=_glBindFramebuffer;_emscripten_glBindFramebuffer.sig="vii";var _glBindRenderbuffer=(e,t)=>{GLctx.bindRenderbuffer(e,GL.renderbuffers[t])};_glBindRenderbuffer.sig="vii";var _emscripten_glBindRenderbuffer=_glBindRenderbuffer;_emscripten_glBindRenderbuffer.sig="vii";var _glBindTexture=(e,t)=>{GLctx.bindTexture(e,GL.textures[t])};_glBindTexture.sig="vii";var _emscripten_glBindTexture=_glBindTexture;_emscripten_glBindTexture.sig="vii";var _glBindVertexArray=e=>{GLctx.bindVertexArray(GL.vaos[e])};_glBindVertexArray.sig="vi";var _glBindVertexArrayOES=_glBindVertexArray;_glBindVertexArrayOES.sig="vi";var _emscripten_glBindVertexArrayOES=_glBindVertexArrayOES;_emscripten_glBindVertexArrayOES.sig="vi";var _glBlendColor=(e,t,r,n)=>GLctx.blendColor(e,t,r,n);_glBlendColor.sig="vffff";var _emscripten_glBlendColor=_glBlendColor;_emscripten_glBlendColor.sig="vffff";var _glBlendEquation=e=>GLctx.blendEquation(e);_glBlendEquation.sig="vi";var _emscripten_glBlendEquation=_glBlendEquation;_emscripten_glBlendEquation.sig="vi";var _glBlendEquationSeparate=(e,t)=>GLctx.blendEquationSeparate(e,t);_glBlendEquationSeparate.sig="vii";var _emscripten_glBlendEquationSeparate=_glBlendEquationSeparate;_emscripten_glBlendEquationSeparate.sig="vii";var _glBlendFunc=(e,t)=>GLctx.blendFunc(e,t);_glBlendFunc.sig="vii";var _emscripten_glBlendFunc=_glBlendFunc;_emscripten_glBlendFunc.sig="vii";var _glBlendFuncSeparate=(e,t,r,n)=>GLctx.blendFuncSeparate(e,t,r,n);_glBlendFuncSeparate.sig="viiii";var _emscripten_glBlendFuncSeparate=_glBlendFuncSeparate;_emscripten_glBlendFuncSeparate.sig="viiii";function _glBufferData(e,t,r,n){t>>>=0,r>>>=0,GLctx.bufferData(e,r?HEAPU8.subarray(r>>>0,r+t>>>0):t,n)}_glBufferData.sig="vippi";var _emscripten_glBufferData=_glBufferData;_emscripten_glBufferData.sig="vippi";function _glBufferSubData(e,t,r,n){t>>>=0,r>>>=0,n>>>=0,GLctx.bufferSubData(e,t,HEAPU8.subarray(n>>>0,n+r>>>0))}_glBufferSubData.sig="vippp";var _emscripten_glBufferSubData=_glBufferSubData;_emscripten_glBufferSubData.sig="vippp";var _glCheckFramebufferStatus=e=>GLctx.checkFramebufferStatus(e);_glCheckFramebufferStatus.sig="ii";var _emscripten_glCheckFramebufferStatus=_glCheckFramebufferStatus;_emscripten_glCheckFramebufferStatus.sig="ii";var _glClear=e=>GLctx.clear(e);_glClear.sig="vi";var _emscripten_glClear=_glClear;_emscripten_glClear.sig="vi";var _glClearColor=(e,t,r,n)=>GLctx.clearColor(e,t,r,n);_glClearColor.sig="vffff";var _emscripten_glClearColor=_glClearColor;_emscripten_glClearColor.sig="vffff";var _glClearDepthf=e=>GLctx.clearDepth(e);_glClearDepthf.sig="vf";var _emscripten_glClearDepthf=_glClearDepthf;_emscripten_glClearDepthf.sig="vf";var _glClearStencil=e=>GLctx.clearStencil(e);_glClearStencil.sig="vi";var _emscripten_glClearStencil=_glClearStencil;_emscripten_glClearStencil.sig="vi";var _glClipControlEXT=(e,t)=>{GLctx.extClipControl.clipControlEXT(e,t)};_glClipControlEXT.sig="vii";var _emscripten_glClipControlEXT=_glClipControlEXT,_glColorMask=(e,t,r,n)=>{GLctx.colorMask(!!e,!!t,!!r,!!n)};_glColorMask.sig="viiii";var _emscripten_glColorMask=_glColorMask;_emscripten_glColorMask.sig="viiii";var _glCompileShader=e=>{GLctx.compileShader(GL.shaders[e])};_glCompileShader.sig="vi";var _emscripten_glCompileShader=_glCompileShader;_emscripten_glCompileShader.sig="vi";function _glCompressedTexImage2D(e,t,r,n,a,o,l,u){u>>>=0,GLctx.compressedTexImage2D(e,t,r,n,a,o,HEAPU8.subarray(u>>>0,u+l>>>0))}_glCompressedTexImage2D.sig="viiiiiiip";var _emscripten_glCompressedTexImage2D=_glCompressedTexImage2D;_emscripten_glCompressedTexImage2D.sig="viiiiiiip";function _glCompressedTexSubImage2D(e,t,r,n,a,o,l,u,_){_>>>=0,GLctx.compressedTexSubImage2D(e,t,r,n,a,o,l,HEAPU8.subarray(_>>>0,_+u>>>0))}_glCompressedTexSubImage2D.sig="viiiiiiiip";var _emscripten_glCompressedTexSubImage2D=_glCompressedTexSubImage2D;_emscripten_glCompressedTexSubImage2D.sig="viiiiiiiip";var _glCopyTexImage2D=(e,t,r,n,a,o,l,u)=>GLctx.copyTexImage2D(e,t,r,n,a,o,l,u);_glCopyTexImage2D.sig="viiiiiiii";var _emscripten_glCopyTexImage2D=_glCopyTexImage2D;_emscripten_glCopyTexImage2D.sig="viiiiiiii";var _glCopyTexSubImage2D=(e,t,r,n,a,o,l,u)=>GLctx.copyTexSubImage2D(e,t,r,n,a,o,l,u);_glCopyTexSubImage2D.sig="viiiiiiii";var _emscripten_glCopyTexSubImage2D=_glCopyTexSubImage2D;_emscripten_glCopyTexSubImage2D.sig="viiiiiiii";var _glCreateProgram=()=>{var e=GL.getNewId(GL.programs),t=GLctx.createProgram();return t.name=e,t.maxUniformLength=t.maxAttributeLength=t.maxUniformBlockNameLength=0,t.uniformIdCounter=1,GL.programs[e]=t,e};_glCreateProgram.sig="i";var _emscripten_glCreateProgram=_glCreateProgram;_emscripten_glCreateProgram.sig="i";var _glCreateShader=e=>{var t=GL.getNewId(GL.shaders);return GL.shaders[t]=GLctx.createShader(e),t};_glCreateShader.sig="ii";var _emscripten_glCreateShader=_glCreateShader;_emscripten_glCreateShader.sig="ii";var _glCullFace=e=>GLctx.cullFace(e);_glCullFace.sig="vi";var _emscripten_glCullFace=_glCullFace;_emscripten_glCullFace.sig="vi";function _glDeleteBuffers(e,t){t>>>=0;for(var r=0;r<e;r++){var n=HEAP32[t+r*4>>>2>>>0],a=GL.buffers[n];a&&(GLctx.deleteBuffer(a),a.name=0,GL.buffers[n]=null)}}_glDeleteBuffers.sig="vip";var _emscripten_glDeleteBuffers=_glDeleteBuffers;_emscripten_glDeleteBuffers.sig="vip";function _glDeleteFramebuffers(e,t){t>>>=0;for(var r=0;r<e;++r){var n=HEAP32[t+r*4>>>2>>>0],a=GL.framebuffers[n];a&&(GLctx.deleteFramebuffer(a),a.name=0,GL.framebuffers[n]=null)}}_glDeleteFramebuffers.sig="vip";var _emscripten_glDeleteFramebuffers=_glDeleteFramebuffers;_emscripten_glDeleteFramebuffers.sig="vip";var _glDeleteProgram=e=>{if(e){var t=GL.programs[e];if(!t){GL.recordError(1281);return}GLctx.deleteProgram(t),t.name=0,GL.programs[e]=null}};_glDeleteProgram.sig="vi";var _emscripten_glDeleteProgram=_glDeleteProgram;_emscripten_glDeleteProgram.sig="vi";function _glDeleteQueriesEXT(e,t){t>>>=0;for(var r=0;r<e;r++){var n=HEAP32[t+r*4>>>2>>>0],a=GL.queries[n];a&&(GLctx.disjointTimerQueryExt.deleteQueryEXT(a),GL.queries[n]=null)}}_glDeleteQueriesEXT.sig="vip";var _emscripten_glDeleteQueriesEXT=_glDeleteQueriesEXT;function _glDeleteRenderbuffers(e,t){t>>>=0;for(var r=0;r<e;r++){var n=HEAP32[t+r*4>>>2>>>0],a=GL.renderbuffers[n];a&&(GLctx.deleteRenderbuffer(a),a.name=0,GL.renderbuffers[n]=null)}}_glDeleteRenderbuffers.sig="vip";var _emscripten_glDeleteRenderbuffers=_glDeleteRenderbuffers;_emscripten_glDeleteRenderbuffers.sig="vip";var _glDeleteShader=e=>{if(e){var t=GL.shaders[e];if(!t){GL.recordError(1281);return}GLctx.deleteShader(t),GL.shaders[e]=null}};_glDeleteShader.sig="vi";var _emscripten_glDeleteShader=_glDeleteShader;_emscripten_glDeleteShader.sig="vi";function _glDeleteTextures(e,t){t>>>=0;for(var r=0;r<e;r++){var n=HEAP32[t+r*4>>>2>>>0],a=GL.textures[n];a&&(GLctx.deleteTexture(a),a.name=0,GL.textures[n]=null)}}_glDeleteTextures.sig="vip";var _emscripten_glDeleteTextures=_glDeleteTextures;_emscripten_glDeleteTextures.sig="vip";function _glDeleteVertexArrays(e,t){t>>>=0;for(var r=0;r<e;r++){var n=HEAP32[t+r*4>>>2>>>0];GLctx.deleteVertexArray(GL.vaos[n]),GL.vaos[n]=null}}_glDeleteVertexArrays.sig="vip";var _glDeleteVertexArraysOES=_glDeleteVertexArrays;_glDeleteVertexArraysOES.sig="vip";var _emscripten_glDeleteVertexArraysOES=_glDeleteVertexArraysOES;_emscripten_glDeleteVertexArraysOES.sig="vip";var _glDepthFunc=e=>GLctx.depthFunc(e);_glDepthFunc.sig="vi";var _emscripten_glDepthFunc=_glDepthFunc;_emscripten_glDepthFunc.sig="vi";var _glDepthMask=e=>{GLctx.depthMask(!!e)};_glDepthMask.sig="vi";var _emscripten_glDepthMask=_glDepthMask;_emscripten_glDepthMask.sig="vi";var _glDepthRangef=(e,t)=>GLctx.depthRange(e,t);_glDepthRangef.sig="vff";var _emscripten_glDepthRangef=_glDepthRangef;_emscripten_glDepthRangef.sig="vff";var _glDetachShader=(e,t)=>{GLctx.detachShader(GL.programs[e],GL.shaders[t])};_glDetachShader.sig="vii";var _emscripten_glDetachShader=_glDetachShader;_emscripten_glDetachShader.sig="vii";var _glDisable=e=>GLctx.disable(e);_glDisable.sig="vi";var _emscripten_glDisable=_glDisable;_emscripten_glDisable.sig="vi";var _glDisableVertexAttribArray=e=>{GLctx.disableVertexAttribArray(e)};_glDisableVertexAttribArray.sig="vi";var _emscripten_glDisableVertexAttribArray=_glDisableVertexAttribArray;_emscripten_glDisableVertexAttribArray.sig="vi";var _glDrawArrays=(e,t,r)=>{GLctx.drawArrays(e,t,r)};_glDrawArrays.sig="viii";var _emscripten_glDrawArrays=_glDrawArrays;_emscripten_glDrawArrays.sig="viii";var _glDrawArraysInstanced=(e,t,r,n)=>{GLctx.drawArraysInstanced(e,t,r,n)};_glDrawArraysInstanced.sig="viiii";var _glDrawArraysInstancedANGLE=_glDrawArraysInstanced,_emscripten_glDrawArraysInstancedANGLE=_glDrawArraysInstancedANGLE,tempFixedLengthArray=[];function _glDrawBuffers(e,t){t>>>=0;for(var r=tempFixedLengthArray[e],n=0;n<e;n++)r[n]=HEAP32[t+n*4>>>2>>>0];GLctx.drawBuffers(r)}_glDrawBuffers.sig="vip";var _glDrawBuffersWEBGL=_glDrawBuffers,_emscripten_glDrawBuffersWEBGL=_glDrawBuffersWEBGL;function _glDrawElements(e,t,r,n){n>>>=0,GLctx.drawElements(e,t,r,n)}_glDrawElements.sig="viiip";var _emscripten_glDrawElements=_glDrawElements;_emscripten_glDrawElements.sig="viiip";function _glDrawElementsInstanced(e,t,r,n,a){n>>>=0,GLctx.drawElementsInstanced(e,t,r,n,a)}_glDrawElementsInstanced.sig="viiipi";var _glDrawElementsInstancedANGLE=_glDrawElementsInstanced,_emscripten_glDrawElementsInstancedANGLE=_glDrawElementsInstancedANGLE,_glEnable=e=>GLctx.enable(e);_glEnable.sig="vi";var _emscripten_glEnable=_glEnable;_emscripten_glEnable.sig="vi";var _glEnableVertexAttribArray=e=>{GLctx.enableVertexAttribArray(e)};_glEnableVertexAttribArray.sig="vi";var _emscripten_glEnableVertexAttribArray=_glEnableVertexAttribArray;_emscripten_glEnableVertexAttribArray.sig="vi";var _glEndQueryEXT=e=>{GLctx.disjointTimerQueryExt.endQueryEXT(e)};_glEndQueryEXT.sig="vi";var _emscripten_glEndQueryEXT=_glEndQueryEXT,_glFinish=()=>GLctx.finish();_glFinish.sig="v";var _emscripten_glFinish=_glFinish;_emscripten_glFinish.sig="v";var _glFlush=()=>GLctx.flush();_glFlush.sig="v";var _emscripten_glFlush=_glFlush;_emscripten_glFlush.sig="v";var _glFramebufferRenderbuffer=(e,t,r,n)=>{GLctx.framebufferRenderbuffer(e,t,r,GL.renderbuffers[n])};_glFramebufferRenderbuffer.sig="viiii";var _emscripten_glFramebufferRenderbuffer=_glFramebufferRenderbuffer;_emscripten_glFramebufferRenderbuffer.sig="viiii";var _glFramebufferTexture2D=(e,t,r,n,a)=>{GLctx.framebufferTexture2D(e,t,r,GL.textures[n],a)};_glFramebufferTexture2D.sig="viiiii";var _emscripten_glFramebufferTexture2D=_glFramebufferTexture2D;_emscripten_glFramebufferTexture2D.sig="viiiii";var _glFrontFace=e=>GLctx.frontFace(e);_glFrontFace.sig="vi";var _emscripten_glFrontFace=_glFrontFace;_emscripten_glFrontFace.sig="vi";function _glGenBuffers(e,t){t>>>=0,GL.genObject(e,t,"createBuffer",GL.buffers)}_glGenBuffers.sig="vip";var _emscripten_glGenBuffers=_glGenBuffers;_emscripten_glGenBuffers.sig="vip";function _glGenFramebuffers(e,t){t>>>=0,GL.genObject(e,t,"createFramebuffer",GL.framebuffers)}_glGenFramebuffers.sig="vip";var _emscripten_glGenFramebuffers=_glGenFramebuffers;_emscripten_glGenFramebuffers.sig="vip";function _glGenQueriesEXT(e,t){t>>>=0;for(var r=0;r<e;r++){var n=GLctx.disjointTimerQueryExt.createQueryEXT();if(!n){for(GL.recordError(1282);r<e;)HEAP32[t+r++*4>>>2>>>0]=0;return}var a=GL.getNewId(GL.queries);n.name=a,GL.queries[a]=n,HEAP32[t+r*4>>>2>>>0]=a}}_glGenQueriesEXT.sig="vip";var _emscripten_glGenQueriesEXT=_glGenQueriesEXT;function _glGenRenderbuffers(e,t){t>>>=0,GL.genObject(e,t,"createRenderbuffer",GL.renderbuffers)}_glGenRenderbuffers.sig="vip";var _emscripten_glGenRenderbuffers=_glGenRenderbuffers;_emscripten_glGenRenderbuffers.sig="vip";function _glGenTextures(e,t){t>>>=0,GL.genObject(e,t,"createTexture",GL.textures)}_glGenTextures.sig="vip";var _emscripten_glGenTextures=_glGenTextures;_emscripten_glGenTextures.sig="vip";function _glGenVertexArrays(e,t){t>>>=0,GL.genObject(e,t,"createVertexArray",GL.vaos)}_glGenVertexArrays.sig="vip";var _glGenVertexArraysOES=_glGenVertexArrays;_glGenVertexArraysOES.sig="vip";var _emscripten_glGenVertexArraysOES=_glGenVertexArraysOES;_emscripten_glGenVertexArraysOES.sig="vip";var _glGenerateMipmap=e=>GLctx.generateMipmap(e);_glGenerateMipmap.sig="vi";var _emscripten_glGenerateMipmap=_glGenerateMipmap;_emscripten_glGenerateMipmap.sig="vi";var __glGetActiveAttribOrUniform=(e,t,r,n,a,o,l,u)=>{t=GL.programs[t];var _=GLctx[e](t,r);if(_){var d=u&&stringToUTF8(_.name,u,n);a&&(HEAP32[a>>>2>>>0]=d),o&&(HEAP32[o>>>2>>>0]=_.size),l&&(HEAP32[l>>>2>>>0]=_.type)}};function _glGetActiveAttrib(e,t,r,n,a,o,l){n>>>=0,a>>>=0,o>>>=0,l>>>=0,__glGetActiveAttribOrUniform("getActiveAttrib",e,t,r,n,a,o,l)}_glGetActiveAttrib.sig="viiipppp";var _emscripten_glGetActiveAttrib=_glGetActiveAttrib;_emscripten_glGetActiveAttrib.sig="viiipppp";function _glGetActiveUniform(e,t,r,n,a,o,l){n>>>=0,a>>>=0,o>>>=0,l>>>=0,__glGetActiveAttribOrUniform("getActiveUniform",e,t,r,n,a,o,l)}_glGetActiveUniform.sig="viiipppp";var _emscripten_glGetActiveUniform=_glGetActiveUniform;_emscripten_glGetActiveUniform.sig="viiipppp";function _glGetAttachedShaders(e,t,r,n){r>>>=0,n>>>=0;var a=GLctx.getAttachedShaders(GL.programs[e]),o=a.length;o>t&&(o=t),HEAP32[r>>>2>>>0]=o;for(var l=0;l<o;++l){var u=GL.shaders.indexOf(a[l]);HEAP32[n+l*4>>>2>>>0]=u}}_glGetAttachedShaders.sig="viipp";var _emscripten_glGetAttachedShaders=_glGetAttachedShaders;_emscripten_glGetAttachedShaders.sig="viipp";function _glGetAttribLocation(e,t){return t>>>=0,GLctx.getAttribLocation(GL.programs[e],UTF8ToString(t))}_glGetAttribLocation.sig="iip";var _emscripten_glGetAttribLocation=_glGetAttribLocation;_emscripten_glGetAttribLocation.sig="iip";var writeI53ToI64=(e,t)=>{HEAPU32[e>>>2>>>0]=t;var r=HEAPU32[e>>>2>>>0];HEAPU32[e+4>>>2>>>0]=(t-r)/4294967296},emscriptenWebGLGet=(e,t,r)=>{if(!t){GL.recordError(1281);return}var n=void 0;switch(e){case 36346:n=1;break;case 36344:r!=0&&r!=1&&GL.recordError(1280);return;case 36345:n=0;break;case 34466:var a=GLctx.getParameter(34467);n=a?a.length:0;break}if(n===void 0){var o=GLctx.getParameter(e);switch(typeof o){case"number":n=o;break;case"boolean":n=o?1:0;break;case"string":GL.recordError(1280);return;case"object":if(o===null)switch(e){case 34964:case 35725:case 34965:case 36006:case 36007:case 32873:case 34229:case 34068:{n=0;break}default:{GL.recordError(1280);return}}else if(o instanceof Float32Array||o instanceof Uint32Array||o instanceof Int32Array||o instanceof Array){for(var l=0;l<o.length;++l)switch(r){case 0:HEAP32[t+l*4>>>2>>>0]=o[l];break;case 2:HEAPF32[t+l*4>>>2>>>0]=o[l];break;case 4:HEAP8[t+l>>>0]=o[l]?1:0;break}return}else try{n=o.name|0}catch(u){GL.recordError(1280),err("GL_INVALID_ENUM in glGet".concat(r,"v: Unknown object returned from WebGL getParameter(").concat(e,")! (error: ").concat(u,")"));return}break;default:GL.recordError(1280),err("GL_INVALID_ENUM in glGet".concat(r,"v: Native code calling glGet").concat(r,"v(").concat(e,") and it returns ").concat(o," of type ").concat(typeof o,"!"));return}}switch(r){case 1:writeI53ToI64(t,n);break;case 0:HEAP32[t>>>2>>>0]=n;break;case 2:HEAPF32[t>>>2>>>0]=n;break;case 4:HEAP8[t>>>0]=n?1:0;break}};function _glGetBooleanv(e,t){return t>>>=0,emscriptenWebGLGet(e,t,4)}_glGetBooleanv.sig="vip";var _emscripten_glGetBooleanv=_glGetBooleanv;_emscripten_glGetBooleanv.sig="vip";function _glGetBufferParameteriv(e,t,r){if(r>>>=0,!r){GL.recordError(1281);return}HEAP32[r>>>2>>>0]=GLctx.getBufferParameter(e,t)}_glGetBufferParameteriv.sig="viip";var _emscripten_glGetBufferParameteriv=_glGetBufferParameteriv;_emscripten_glGetBufferParameteriv.sig="viip";var _glGetError=()=>{var e=GLctx.getError()||GL.lastError;return GL.lastError=0,e};_glGetError.sig="i";var _emscripten_glGetError=_glGetError;_emscripten_glGetError.sig="i";function _glGetFloatv(e,t){return t>>>=0,emscriptenWebGLGet(e,t,2)}_glGetFloatv.sig="vip";var _emscripten_glGetFloatv=_glGetFloatv;_emscripten_glGetFloatv.sig="vip";function _glGetFramebufferAttachmentParameteriv(e,t,r,n){n>>>=0;var a=GLctx.getFramebufferAttachmentParameter(e,t,r);(a instanceof WebGLRenderbuffer||a instanceof WebGLTexture)&&(a=a.name|0),HEAP32[n>>>2>>>0]=a}_glGetFramebufferAttachmentParameteriv.sig="viiip";var _emscripten_glGetFramebufferAttachmentParameteriv=_glGetFramebufferAttachmentParameteriv;_emscripten_glGetFramebufferAttachmentParameteriv.sig="viiip";function _glGetIntegerv(e,t){return t>>>=0,emscriptenWebGLGet(e,t,0)}_glGetIntegerv.sig="vip";var _emscripten_glGetIntegerv=_glGetIntegerv;_emscripten_glGetIntegerv.sig="vip";function _glGetProgramInfoLog(e,t,r,n){r>>>=0,n>>>=0;var a=GLctx.getProgramInfoLog(GL.programs[e]);a===null&&(a="(unknown error)");var o=t>0&&n?stringToUTF8(a,n,t):0;r&&(HEAP32[r>>>2>>>0]=o)}_glGetProgramInfoLog.sig="viipp";var _emscripten_glGetProgramInfoLog=_glGetProgramInfoLog;_emscripten_glGetProgramInfoLog.sig="viipp";function _glGetProgramiv(e,t,r){if(r>>>=0,!r){GL.recordError(1281);return}if(e>=GL.counter){GL.recordError(1281);return}if(e=GL.programs[e],t==35716){var n=GLctx.getProgramInfoLog(e);n===null&&(n="(unknown error)"),HEAP32[r>>>2>>>0]=n.length+1}else if(t==35719){if(!e.maxUniformLength)for(var a=GLctx.getProgramParameter(e,35718),o=0;o<a;++o)e.maxUniformLength=Math.max(e.maxUniformLength,GLctx.getActiveUniform(e,o).name.length+1);HEAP32[r>>>2>>>0]=e.maxUniformLength}else if(t==35722){if(!e.maxAttributeLength)for(var l=GLctx.getProgramParameter(e,35721),o=0;o<l;++o)e.maxAttributeLength=Math.max(e.maxAttributeLength,GLctx.getActiveAttrib(e,o).name.length+1);HEAP32[r>>>2>>>0]=e.maxAttributeLength}else if(t==35381){if(!e.maxUniformBlockNameLength)for(var u=GLctx.getProgramParameter(e,35382),o=0;o<u;++o)e.maxUniformBlockNameLength=Math.max(e.maxUniformBlockNameLength,GLctx.getActiveUniformBlockName(e,o).length+1);HEAP32[r>>>2>>>0]=e.maxUniformBlockNameLength}else HEAP32[r>>>2>>>0]=GLctx.getProgramParameter(e,t)}_glGetProgramiv.sig="viip";var _emscripten_glGetProgramiv=_glGetProgramiv;_emscripten_glGetProgramiv.sig="viip";function _glGetQueryObjecti64vEXT(e,t,r){if(r>>>=0,!r){GL.recordError(1281);return}var n=GL.queries[e],a;a=GLctx.disjointTimerQueryExt.getQueryObjectEXT(n,t);var o;typeof a=="boolean"?o=a?1:0:o=a,writeI53ToI64(r,o)}_glGetQueryObjecti64vEXT.sig="viip";var _emscripten_glGetQueryObjecti64vEXT=_glGetQueryObjecti64vEXT;function _glGetQueryObjectivEXT(e,t,r){if(r>>>=0,!r){GL.recordError(1281);return}var n=GL.queries[e],a=GLctx.disjointTimerQueryExt.getQueryObjectEXT(n,t),o;typeof a=="boolean"?o=a?1:0:o=a,HEAP32[r>>>2>>>0]=o}_glGetQueryObjectivEXT.sig="viip";var _emscripten_glGetQueryObjectivEXT=_glGetQueryObjectivEXT,_glGetQueryObjectui64vEXT=_glGetQueryObjecti64vEXT,_emscripten_glGetQueryObjectui64vEXT=_glGetQueryObjectui64vEXT,_glGetQueryObjectuivEXT=_glGetQueryObjectivEXT,_emscripten_glGetQueryObjectuivEXT=_glGetQueryObjectuivEXT;function _glGetQueryivEXT(e,t,r){if(r>>>=0,!r){GL.recordError(1281);return}HEAP32[r>>>2>>>0]=GLctx.disjointTimerQueryExt.getQueryEXT(e,t)}_glGetQueryivEXT.sig="viip";var _emscripten_glGetQueryivEXT=_glGetQueryivEXT;function _glGetRenderbufferParameteriv(e,t,r){if(r>>>=0,!r){GL.recordError(1281);return}HEAP32[r>>>2>>>0]=GLctx.getRenderbufferParameter(e,t)}_glGetRenderbufferParameteriv.sig="viip";var _emscripten_glGetRenderbufferParameteriv=_glGetRenderbufferParameteriv;_emscripten_glGetRenderbufferParameteriv.sig="viip";function _glGetShaderInfoLog(e,t,r,n){r>>>=0,n>>>=0;var a=GLctx.getShaderInfoLog(GL.shaders[e]);a===null&&(a="(unknown error)");var o=t>0&&n?stringToUTF8(a,n,t):0;r&&(HEAP32[r>>>2>>>0]=o)}_glGetShaderInfoLog.sig="viipp";var _emscripten_glGetShaderInfoLog=_glGetShaderInfoLog;_emscripten_glGetShaderInfoLog.sig="viipp";function _glGetShaderPrecisionFormat(e,t,r,n){r>>>=0,n>>>=0;var a=GLctx.getShaderPrecisionFormat(e,t);HEAP32[r>>>2>>>0]=a.rangeMin,HEAP32[r+4>>>2>>>0]=a.rangeMax,HEAP32[n>>>2>>>0]=a.precision}_glGetShaderPrecisionFormat.sig="viipp";var _emscripten_glGetShaderPrecisionFormat=_glGetShaderPrecisionFormat;_emscripten_glGetShaderPrecisionFormat.sig="viipp";function _glGetShaderSource(e,t,r,n){r>>>=0,n>>>=0;var a=GLctx.getShaderSource(GL.shaders[e]);if(a){var o=t>0&&n?stringToUTF8(a,n,t):0;r&&(HEAP32[r>>>2>>>0]=o)}}_glGetShaderSource.sig="viipp";var _emscripten_glGetShaderSource=_glGetShaderSource;_emscripten_glGetShaderSource.sig="viipp";function _glGetShaderiv(e,t,r){if(r>>>=0,!r){GL.recordError(1281);return}if(t==35716){var n=GLctx.getShaderInfoLog(GL.shaders[e]);n===null&&(n="(unknown error)");var a=n?n.length+1:0;HEAP32[r>>>2>>>0]=a}else if(t==35720){var o=GLctx.getShaderSource(GL.shaders[e]),l=o?o.length+1:0;HEAP32[r>>>2>>>0]=l}else HEAP32[r>>>2>>>0]=GLctx.getShaderParameter(GL.shaders[e],t)}_glGetShaderiv.sig="viip";var _emscripten_glGetShaderiv=_glGetShaderiv;_emscripten_glGetShaderiv.sig="viip";var webglGetExtensions=function e(){var t=getEmscriptenSupportedExtensions(GLctx);return t=t.concat(t.map(r=>"GL_"+r)),t};function _glGetString(e){var t=GL.stringCache[e];if(!t){switch(e){case 7939:t=stringToNewUTF8(webglGetExtensions().join(" "));break;case 7936:case 7937:case 37445:case 37446:var r=GLctx.getParameter(e);r||GL.recordError(1280),t=r?stringToNewUTF8(r):0;break;case 7938:var n=GLctx.getParameter(7938),a="OpenGL ES 2.0 (".concat(n,")");t=stringToNewUTF8(a);break;case 35724:var o=GLctx.getParameter(35724),l=/^WebGL GLSL ES ([0-9]\.[0-9][0-9]?)(?:$| .*)/,u=o.match(l);u!==null&&(u[1].length==3&&(u[1]=u[1]+"0"),o="OpenGL ES GLSL ES ".concat(u[1]," (").concat(o,")")),t=stringToNewUTF8(o);break;default:GL.recordError(1280)}GL.stringCache[e]=t}return t}_glGetString.sig="pi";var _emscripten_glGetString=_glGetString;_emscripten_glGetString.sig="pi";function _glGetTexParameterfv(e,t,r){if(r>>>=0,!r){GL.recordError(1281);return}HEAPF32[r>>>2>>>0]=GLctx.getTexParameter(e,t)}_glGetTexParameterfv.sig="viip";var _emscripten_glGetTexParameterfv=_glGetTexParameterfv;_emscripten_glGetTexParameterfv.sig="viip";function _glGetTexParameteriv(e,t,r){if(r>>>=0,!r){GL.recordError(1281);return}HEAP32[r>>>2>>>0]=GLctx.getTexParameter(e,t)}_glGetTexParameteriv.sig="viip";var _emscripten_glGetTexParameteriv=_glGetTexParameteriv;_emscripten_glGetTexParameteriv.sig="viip";var webglGetLeftBracePos=e=>e.slice(-1)=="]"&&e.lastIndexOf("["),webglPrepareUniformLocationsBeforeFirstUse=e=>{var t=e.uniformLocsById,r=e.uniformSizeAndIdsByName,n,a;if(!t){e.uniformLocsById=t={},e.uniformArrayNamesById={};var o=GLctx.getProgramParameter(e,35718);for(n=0;n<o;++n){var l=GLctx.getActiveUniform(e,n),u=l.name,_=l.size,d=webglGetLeftBracePos(u),f=d>0?u.slice(0,d):u,p=e.uniformIdCounter;for(e.uniformIdCounter+=_,r[f]=[_,p],a=0;a<_;++a)t[p]=a,e.uniformArrayNamesById[p++]=f}}};function _glGetUniformLocation(e,t){if(t>>>=0,t=UTF8ToString(t),e=GL.programs[e]){webglPrepareUniformLocationsBeforeFirstUse(e);var r=e.uniformLocsById,n=0,a=t,o=webglGetLeftBracePos(t);o>0&&(n=jstoi_q(t.slice(o+1))>>>0,a=t.slice(0,o));var l=e.uniformSizeAndIdsByName[a];if(l&&n<l[0]&&(n+=l[1],r[n]=r[n]||GLctx.getUniformLocation(e,t)))return n}else GL.recordError(1281);return-1}_glGetUniformLocation.sig="iip";var _emscripten_glGetUniformLocation=_glGetUniformLocation;_emscripten_glGetUniformLocation.sig="iip";var webglGetUniformLocation=e=>{var t=GLctx.currentProgram;if(t){var r=t.uniformLocsById[e];return typeof r=="number"&&(t.uniformLocsById[e]=r=GLctx.getUniformLocation(t,t.uniformArrayNamesById[e]+(r>0?"[".concat(r,"]"):""))),r}else GL.recordError(1282)},emscriptenWebGLGetUniform=(e,t,r,n)=>{if(!r){GL.recordError(1281);return}e=GL.programs[e],webglPrepareUniformLocationsBeforeFirstUse(e);var a=GLctx.getUniform(e,webglGetUniformLocation(t));if(typeof a=="number"||typeof a=="boolean")switch(n){case 0:HEAP32[r>>>2>>>0]=a;break;case 2:HEAPF32[r>>>2>>>0]=a;break}else for(var o=0;o<a.length;o++)switch(n){case 0:HEAP32[r+o*4>>>2>>>0]=a[o];break;case 2:HEAPF32[r+o*4>>>2>>>0]=a[o];break}};function _glGetUniformfv(e,t,r){r>>>=0,emscriptenWebGLGetUniform(e,t,r,2)}_glGetUniformfv.sig="viip";var _emscripten_glGetUniformfv=_glGetUniformfv;_emscripten_glGetUniformfv.sig="viip";function _glGetUniformiv(e,t,r){r>>>=0,emscriptenWebGLGetUniform(e,t,r,0)}_glGetUniformiv.sig="viip";var _emscripten_glGetUniformiv=_glGetUniformiv;_emscripten_glGetUniformiv.sig="viip";function _glGetVertexAttribPointerv(e,t,r){if(r>>>=0,!r){GL.recordError(1281);return}HEAP32[r>>>2>>>0]=GLctx.getVertexAttribOffset(e,t)}_glGetVertexAttribPointerv.sig="viip";var _emscripten_glGetVertexAttribPointerv=_glGetVertexAttribPointerv;_emscripten_glGetVertexAttribPointerv.sig="viip";var emscriptenWebGLGetVertexAttrib=(e,t,r,n)=>{if(!r){GL.recordError(1281);return}var a=GLctx.getVertexAttrib(e,t);if(t==34975)HEAP32[r>>>2>>>0]=a&&a.name;else if(typeof a=="number"||typeof a=="boolean")switch(n){case 0:HEAP32[r>>>2>>>0]=a;break;case 2:HEAPF32[r>>>2>>>0]=a;break;case 5:HEAP32[r>>>2>>>0]=Math.fround(a);break}else for(var o=0;o<a.length;o++)switch(n){case 0:HEAP32[r+o*4>>>2>>>0]=a[o];break;case 2:HEAPF32[r+o*4>>>2>>>0]=a[o];break;case 5:HEAP32[r+o*4>>>2>>>0]=Math.fround(a[o]);break}};function _glGetVertexAttribfv(e,t,r){r>>>=0,emscriptenWebGLGetVertexAttrib(e,t,r,2)}_glGetVertexAttribfv.sig="viip";var _emscripten_glGetVertexAttribfv=_glGetVertexAttribfv;_emscripten_glGetVertexAttribfv.sig="viip";function _glGetVertexAttribiv(e,t,r){r>>>=0,emscriptenWebGLGetVertexAttrib(e,t,r,5)}_glGetVertexAttribiv.sig="viip";var _emscripten_glGetVertexAttribiv=_glGetVertexAttribiv;_emscripten_glGetVertexAttribiv.sig="viip";var _glHint=(e,t)=>GLctx.hint(e,t);_glHint.sig="vii";var _emscripten_glHint=_glHint;_emscripten_glHint.sig="vii";var _glIsBuffer=e=>{var t=GL.buffers[e];return t?GLctx.isBuffer(t):0};_glIsBuffer.sig="ii";var _emscripten_glIsBuffer=_glIsBuffer;_emscripten_glIsBuffer.sig="ii";var _glIsEnabled=e=>GLctx.isEnabled(e);_glIsEnabled.sig="ii";var _emscripten_glIsEnabled=_glIsEnabled;_emscripten_glIsEnabled.sig="ii";var _glIsFramebuffer=e=>{var t=GL.framebuffers[e];return t?GLctx.isFramebuffer(t):0};_glIsFramebuffer.sig="ii";var _emscripten_glIsFramebuffer=_glIsFramebuffer;_emscripten_glIsFramebuffer.sig="ii";var _glIsProgram=e=>(e=GL.programs[e],e?GLctx.isProgram(e):0);_glIsProgram.sig="ii";var _emscripten_glIsProgram=_glIsProgram;_emscripten_glIsProgram.sig="ii";var _glIsQueryEXT=e=>{var t=GL.queries[e];return t?GLctx.disjointTimerQueryExt.isQueryEXT(t):0};_glIsQueryEXT.sig="ii";var _emscripten_glIsQueryEXT=_glIsQueryEXT,_glIsRenderbuffer=e=>{var t=GL.renderbuffers[e];return t?GLctx.isRenderbuffer(t):0};_glIsRenderbuffer.sig="ii";var _emscripten_glIsRenderbuffer=_glIsRenderbuffer;_emscripten_glIsRenderbuffer.sig="ii";var _glIsShader=e=>{var t=GL.shaders[e];return t?GLctx.isShader(t):0};_glIsShader.sig="ii";var _emscripten_glIsShader=_glIsShader;_emscripten_glIsShader.sig="ii";var _glIsTexture=e=>{var t=GL.textures[e];return t?GLctx.isTexture(t):0};_glIsTexture.sig="ii";var _emscripten_glIsTexture=_glIsTexture;_emscripten_glIsTexture.sig="ii";var _glIsVertexArray=e=>{var t=GL.vaos[e];return t?GLctx.isVertexArray(t):0};_glIsVertexArray.sig="ii";var _glIsVertexArrayOES=_glIsVertexArray;_glIsVertexArrayOES.sig="ii";var _emscripten_glIsVertexArrayOES=_glIsVertexArrayOES;_emscripten_glIsVertexArrayOES.sig="ii";var _glLineWidth=e=>GLctx.lineWidth(e);_glLineWidth.sig="vf";var _emscripten_glLineWidth=_glLineWidth;_emscripten_glLineWidth.sig="vf";var _glLinkProgram=e=>{e=GL.programs[e],GLctx.linkProgram(e),e.uniformLocsById=0,e.uniformSizeAndIdsByName={}};_glLinkProgram.sig="vi";var _emscripten_glLinkProgram=_glLinkProgram;_emscripten_glLinkProgram.sig="vi";var _glPixelStorei=(e,t)=>{e==3317?GL.unpackAlignment=t:e==3314&&(GL.unpackRowLength=t),GLctx.pixelStorei(e,t)};_glPixelStorei.sig="vii";var _emscripten_glPixelStorei=_glPixelStorei;_emscripten_glPixelStorei.sig="vii";var _glPolygonModeWEBGL=(e,t)=>{GLctx.webglPolygonMode.polygonModeWEBGL(e,t)};_glPolygonModeWEBGL.sig="vii";var _emscripten_glPolygonModeWEBGL=_glPolygonModeWEBGL,_glPolygonOffset=(e,t)=>GLctx.polygonOffset(e,t);_glPolygonOffset.sig="vff";var _emscripten_glPolygonOffset=_glPolygonOffset;_emscripten_glPolygonOffset.sig="vff";var _glPolygonOffsetClampEXT=(e,t,r)=>{GLctx.extPolygonOffsetClamp.polygonOffsetClampEXT(e,t,r)};_glPolygonOffsetClampEXT.sig="vfff";var _emscripten_glPolygonOffsetClampEXT=_glPolygonOffsetClampEXT,_glQueryCounterEXT=(e,t)=>{GLctx.disjointTimerQueryExt.queryCounterEXT(GL.queries[e],t)};_glQueryCounterEXT.sig="vii";var _emscripten_glQueryCounterEXT=_glQueryCounterEXT,computeUnpackAlignedImageSize=(e,t,r)=>{function n(l,u){return l+u-1&-u}var a=(GL.unpackRowLength||e)*r,o=n(a,GL.unpackAlignment);return t*o},colorChannelsInGlTextureFormat=e=>{var t={5:3,6:4,8:2,29502:3,29504:4};return t[e-6402]||1},heapObjectForWebGLType=e=>(e-=5120,e==1?HEAPU8:e==4?HEAP32:e==6?HEAPF32:e==5||e==28922?HEAPU32:HEAPU16),toTypedArrayIndex=(e,t)=>e>>>31-Math.clz32(t.BYTES_PER_ELEMENT),emscriptenWebGLGetTexPixelData=(e,t,r,n,a,o)=>{var l=heapObjectForWebGLType(e),u=colorChannelsInGlTextureFormat(t)*l.BYTES_PER_ELEMENT,_=computeUnpackAlignedImageSize(r,n,u);return l.subarray(toTypedArrayIndex(a,l)>>>0,toTypedArrayIndex(a+_,l)>>>0)};function _glReadPixels(e,t,r,n,a,o,l){l>>>=0;var u=emscriptenWebGLGetTexPixelData(o,a,r,n,l,a);if(!u){GL.recordError(1280);return}GLctx.readPixels(e,t,r,n,a,o,u)}_glReadPixels.sig="viiiiiip";var _emscripten_glReadPixels=_glReadPixels;_emscripten_glReadPixels.sig="viiiiiip";var _glReleaseShaderCompiler=()=>{};_glReleaseShaderCompiler.sig="v";var _emscripten_glReleaseShaderCompiler=_glReleaseShaderCompiler;_emscripten_glReleaseShaderCompiler.sig="v";var _glRenderbufferStorage=(e,t,r,n)=>GLctx.renderbufferStorage(e,t,r,n);_glRenderbufferStorage.sig="viiii";var _emscripten_glRenderbufferStorage=_glRenderbufferStorage;_emscripten_glRenderbufferStorage.sig="viiii";var _glSampleCoverage=(e,t)=>{GLctx.sampleCoverage(e,!!t)};_glSampleCoverage.sig="vfi";var _emscripten_glSampleCoverage=_glSampleCoverage;_emscripten_glSampleCoverage.sig="vfi";var _glScissor=(e,t,r,n)=>GLctx.scissor(e,t,r,n);_glScissor.sig="viiii";var _emscripten_glScissor=_glScissor;_emscripten_glScissor.sig="viiii";function _glShaderBinary(e,t,r,n,a){t>>>=0,n>>>=0,GL.recordError(1280)}_glShaderBinary.sig="vipipi";var _emscripten_glShaderBinary=_glShaderBinary;_emscripten_glShaderBinary.sig="vipipi";function _glShaderSource(e,t,r,n){r>>>=0,n>>>=0;var a=GL.getSource(e,t,r,n);GLctx.shaderSource(GL.shaders[e],a)}_glShaderSource.sig="viipp";var _emscripten_glShaderSource=_glShaderSource;_emscripten_glShaderSource.sig="viipp";var _glStencilFunc=(e,t,r)=>GLctx.stencilFunc(e,t,r);_glStencilFunc.sig="viii";var _emscripten_glStencilFunc=_glStencilFunc;_emscripten_glStencilFunc.sig="viii";var _glStencilFuncSeparate=(e,t,r,n)=>GLctx.stencilFuncSeparate(e,t,r,n);_glStencilFuncSeparate.sig="viiii";var _emscripten_glStencilFuncSeparate=_glStencilFuncSeparate;_emscripten_glStencilFuncSeparate.sig="viiii";var _glStencilMask=e=>GLctx.stencilMask(e);_glStencilMask.sig="vi";var _emscripten_glStencilMask=_glStencilMask;_emscripten_glStencilMask.sig="vi";var _glStencilMaskSeparate=(e,t)=>GLctx.stencilMaskSeparate(e,t);_glStencilMaskSeparate.sig="vii";var _emscripten_glStencilMaskSeparate=_glStencilMaskSeparate;_emscripten_glStencilMaskSeparate.sig="vii";var _glStencilOp=(e,t,r)=>GLctx.stencilOp(e,t,r);_glStencilOp.sig="viii";var _emscripten_glStencilOp=_glStencilOp;_emscripten_glStencilOp.sig="viii";var _glStencilOpSeparate=(e,t,r,n)=>GLctx.stencilOpSeparate(e,t,r,n);_glStencilOpSeparate.sig="viiii";var _emscripten_glStencilOpSeparate=_glStencilOpSeparate;_emscripten_glStencilOpSeparate.sig="viiii";function _glTexImage2D(e,t,r,n,a,o,l,u,_){_>>>=0;var d=_?emscriptenWebGLGetTexPixelData(u,l,n,a,_,r):null;GLctx.texImage2D(e,t,r,n,a,o,l,u,d)}_glTexImage2D.sig="viiiiiiiip";var _emscripten_glTexImage2D=_glTexImage2D;_emscripten_glTexImage2D.sig="viiiiiiiip";var _glTexParameterf=(e,t,r)=>GLctx.texParameterf(e,t,r);_glTexParameterf.sig="viif";var _emscripten_glTexParameterf=_glTexParameterf;_emscripten_glTexParameterf.sig="viif";function _glTexParameterfv(e,t,r){r>>>=0;var n=HEAPF32[r>>>2>>>0];GLctx.texParameterf(e,t,n)}_glTexParameterfv.sig="viip";var _emscripten_glTexParameterfv=_glTexParameterfv;_emscripten_glTexParameterfv.sig="viip";var _glTexParameteri=(e,t,r)=>GLctx.texParameteri(e,t,r);_glTexParameteri.sig="viii";var _emscripten_glTexParameteri=_glTexParameteri;_emscripten_glTexParameteri.sig="viii";function _glTexParameteriv(e,t,r){r>>>=0;var n=HEAP32[r>>>2>>>0];GLctx.texParameteri(e,t,n)}_glTexParameteriv.sig="viip";var _emscripten_glTexParameteriv=_glTexParameteriv;_emscripten_glTexParameteriv.sig="viip";function _glTexSubImage2D(e,t,r,n,a,o,l,u,_){_>>>=0;var d=_?emscriptenWebGLGetTexPixelData(u,l,a,o,_,0):null;GLctx.texSubImage2D(e,t,r,n,a,o,l,u,d)}_glTexSubImage2D.sig="viiiiiiiip";var _emscripten_glTexSubImage2D=_glTexSubImage2D;_emscripten_glTexSubImage2D.sig="viiiiiiiip";var _glUniform1f=(e,t)=>{GLctx.uniform1f(webglGetUniformLocation(e),t)};_glUniform1f.sig="vif";var _emscripten_glUniform1f=_glUniform1f;_emscripten_glUniform1f.sig="vif";var miniTempWebGLFloatBuffers=[];function _glUniform1fv(e,t,r){if(r>>>=0,t<=288)for(var n=miniTempWebGLFloatBuffers[t],a=0;a<t;++a)n[a]=HEAPF32[r+4*a>>>2>>>0];else var n=HEAPF32.subarray(r>>>2>>>0,r+t*4>>>2>>>0);GLctx.uniform1fv(webglGetUniformLocation(e),n)}_glUniform1fv.sig="viip";var _emscripten_glUniform1fv=_glUniform1fv;_emscripten_glUniform1fv.sig="viip";var _glUniform1i=(e,t)=>{GLctx.uniform1i(webglGetUniformLocation(e),t)};_glUniform1i.sig="vii";var _emscripten_glUniform1i=_glUniform1i;_emscripten_glUniform1i.sig="vii";var miniTempWebGLIntBuffers=[];function _glUniform1iv(e,t,r){if(r>>>=0,t<=288)for(var n=miniTempWebGLIntBuffers[t],a=0;a<t;++a)n[a]=HEAP32[r+4*a>>>2>>>0];else var n=HEAP32.subarray(r>>>2>>>0,r+t*4>>>2>>>0);GLctx.uniform1iv(webglGetUniformLocation(e),n)}_glUniform1iv.sig="viip";var _emscripten_glUniform1iv=_glUniform1iv;_emscripten_glUniform1iv.sig="viip";var _glUniform2f=(e,t,r)=>{GLctx.uniform2f(webglGetUniformLocation(e),t,r)};_glUniform2f.sig="viff";var _emscripten_glUniform2f=_glUniform2f;_emscripten_glUniform2f.sig="viff";function _glUniform2fv(e,t,r){if(r>>>=0,t<=144){t*=2;for(var n=miniTempWebGLFloatBuffers[t],a=0;a<t;a+=2)n[a]=HEAPF32[r+4*a>>>2>>>0],n[a+1]=HEAPF32[r+(4*a+4)>>>2>>>0]}else var n=HEAPF32.subarray(r>>>2>>>0,r+t*8>>>2>>>0);GLctx.uniform2fv(webglGetUniformLocation(e),n)}_glUniform2fv.sig="viip";var _emscripten_glUniform2fv=_glUniform2fv;_emscripten_glUniform2fv.sig="viip";var _glUniform2i=(e,t,r)=>{GLctx.uniform2i(webglGetUniformLocation(e),t,r)};_glUniform2i.sig="viii";var _emscripten_glUniform2i=_glUniform2i;_emscripten_glUniform2i.sig="viii";function _glUniform2iv(e,t,r){if(r>>>=0,t<=144){t*=2;for(var n=miniTempWebGLIntBuffers[t],a=0;a<t;a+=2)n[a]=HEAP32[r+4*a>>>2>>>0],n[a+1]=HEAP32[r+(4*a+4)>>>2>>>0]}else var n=HEAP32.subarray(r>>>2>>>0,r+t*8>>>2>>>0);GLctx.uniform2iv(webglGetUniformLocation(e),n)}_glUniform2iv.sig="viip";var _emscripten_glUniform2iv=_glUniform2iv;_emscripten_glUniform2iv.sig="viip";var _glUniform3f=(e,t,r,n)=>{GLctx.uniform3f(webglGetUniformLocation(e),t,r,n)};_glUniform3f.sig="vifff";var _emscripten_glUniform3f=_glUniform3f;_emscripten_glUniform3f.sig="vifff";function _glUniform3fv(e,t,r){if(r>>>=0,t<=96){t*=3;for(var n=miniTempWebGLFloatBuffers[t],a=0;a<t;a+=3)n[a]=HEAPF32[r+4*a>>>2>>>0],n[a+1]=HEAPF32[r+(4*a+4)>>>2>>>0],n[a+2]=HEAPF32[r+(4*a+8)>>>2>>>0]}else var n=HEAPF32.subarray(r>>>2>>>0,r+t*12>>>2>>>0);GLctx.uniform3fv(webglGetUniformLocation(e),n)}_glUniform3fv.sig="viip";var _emscripten_glUniform3fv=_glUniform3fv;_emscripten_glUniform3fv.sig="viip";var _glUniform3i=(e,t,r,n)=>{GLctx.uniform3i(webglGetUniformLocation(e),t,r,n)};_glUniform3i.sig="viiii";var _emscripten_glUniform3i=_glUniform3i;_emscripten_glUniform3i.sig="viiii";function _glUniform3iv(e,t,r){if(r>>>=0,t<=96){t*=3;for(var n=miniTempWebGLIntBuffers[t],a=0;a<t;a+=3)n[a]=HEAP32[r+4*a>>>2>>>0],n[a+1]=HEAP32[r+(4*a+4)>>>2>>>0],n[a+2]=HEAP32[r+(4*a+8)>>>2>>>0]}else var n=HEAP32.subarray(r>>>2>>>0,r+t*12>>>2>>>0);GLctx.uniform3iv(webglGetUniformLocation(e),n)}_glUniform3iv.sig="viip";var _emscripten_glUniform3iv=_glUniform3iv;_emscripten_glUniform3iv.sig="viip";var _glUniform4f=(e,t,r,n,a)=>{GLctx.uniform4f(webglGetUniformLocation(e),t,r,n,a)};_glUniform4f.sig="viffff";var _emscripten_glUniform4f=_glUniform4f;_emscripten_glUniform4f.sig="viffff";function _glUniform4fv(e,t,r){if(r>>>=0,t<=72){var n=miniTempWebGLFloatBuffers[4*t],a=HEAPF32;r=r>>>2,t*=4;for(var o=0;o<t;o+=4){var l=r+o;n[o]=a[l>>>0],n[o+1]=a[l+1>>>0],n[o+2]=a[l+2>>>0],n[o+3]=a[l+3>>>0]}}else var n=HEAPF32.subarray(r>>>2>>>0,r+t*16>>>2>>>0);GLctx.uniform4fv(webglGetUniformLocation(e),n)}_glUniform4fv.sig="viip";var _emscripten_glUniform4fv=_glUniform4fv;_emscripten_glUniform4fv.sig="viip";var _glUniform4i=(e,t,r,n,a)=>{GLctx.uniform4i(webglGetUniformLocation(e),t,r,n,a)};_glUniform4i.sig="viiiii";var _emscripten_glUniform4i=_glUniform4i;_emscripten_glUniform4i.sig="viiiii";function _glUniform4iv(e,t,r){if(r>>>=0,t<=72){t*=4;for(var n=miniTempWebGLIntBuffers[t],a=0;a<t;a+=4)n[a]=HEAP32[r+4*a>>>2>>>0],n[a+1]=HEAP32[r+(4*a+4)>>>2>>>0],n[a+2]=HEAP32[r+(4*a+8)>>>2>>>0],n[a+3]=HEAP32[r+(4*a+12)>>>2>>>0]}else var n=HEAP32.subarray(r>>>2>>>0,r+t*16>>>2>>>0);GLctx.uniform4iv(webglGetUniformLocation(e),n)}_glUniform4iv.sig="viip";var _emscripten_glUniform4iv=_glUniform4iv;_emscripten_glUniform4iv.sig="viip";function _glUniformMatrix2fv(e,t,r,n){if(n>>>=0,t<=72){t*=4;for(var a=miniTempWebGLFloatBuffers[t],o=0;o<t;o+=4)a[o]=HEAPF32[n+4*o>>>2>>>0],a[o+1]=HEAPF32[n+(4*o+4)>>>2>>>0],a[o+2]=HEAPF32[n+(4*o+8)>>>2>>>0],a[o+3]=HEAPF32[n+(4*o+12)>>>2>>>0]}else var a=HEAPF32.subarray(n>>>2>>>0,n+t*16>>>2>>>0);GLctx.uniformMatrix2fv(webglGetUniformLocation(e),!!r,a)}_glUniformMatrix2fv.sig="viiip";var _emscripten_glUniformMatrix2fv=_glUniformMatrix2fv;_emscripten_glUniformMatrix2fv.sig="viiip";function _glUniformMatrix3fv(e,t,r,n){if(n>>>=0,t<=32){t*=9;for(var a=miniTempWebGLFloatBuffers[t],o=0;o<t;o+=9)a[o]=HEAPF32[n+4*o>>>2>>>0],a[o+1]=HEAPF32[n+(4*o+4)>>>2>>>0],a[o+2]=HEAPF32[n+(4*o+8)>>>2>>>0],a[o+3]=HEAPF32[n+(4*o+12)>>>2>>>0],a[o+4]=HEAPF32[n+(4*o+16)>>>2>>>0],a[o+5]=HEAPF32[n+(4*o+20)>>>2>>>0],a[o+6]=HEAPF32[n+(4*o+24)>>>2>>>0],a[o+7]=HEAPF32[n+(4*o+28)>>>2>>>0],a[o+8]=HEAPF32[n+(4*o+32)>>>2>>>0]}else var a=HEAPF32.subarray(n>>>2>>>0,n+t*36>>>2>>>0);GLctx.uniformMatrix3fv(webglGetUniformLocation(e),!!r,a)}_glUniformMatrix3fv.sig="viiip";var _emscripten_glUniformMatrix3fv=_glUniformMatrix3fv;_emscripten_glUniformMatrix3fv.sig="viiip";function _glUniformMatrix4fv(e,t,r,n){if(n>>>=0,t<=18){var a=miniTempWebGLFloatBuffers[16*t],o=HEAPF32;n=n>>>2,t*=16;for(var l=0;l<t;l+=16){var u=n+l;a[l]=o[u>>>0],a[l+1]=o[u+1>>>0],a[l+2]=o[u+2>>>0],a[l+3]=o[u+3>>>0],a[l+4]=o[u+4>>>0],a[l+5]=o[u+5>>>0],a[l+6]=o[u+6>>>0],a[l+7]=o[u+7>>>0],a[l+8]=o[u+8>>>0],a[l+9]=o[u+9>>>0],a[l+10]=o[u+10>>>0],a[l+11]=o[u+11>>>0],a[l+12]=o[u+12>>>0],a[l+13]=o[u+13>>>0],a[l+14]=o[u+14>>>0],a[l+15]=o[u+15>>>0]}}else var a=HEAPF32.subarray(n>>>2>>>0,n+t*64>>>2>>>0);GLctx.uniformMatrix4fv(webglGetUniformLocation(e),!!r,a)}_glUniformMatrix4fv.sig="viiip";var _emscripten_glUniformMatrix4fv=_glUniformMatrix4fv;_emscripten_glUniformMatrix4fv.sig="viiip";var _glUseProgram=e=>{e=GL.programs[e],GLctx.useProgram(e),GLctx.currentProgram=e};_glUseProgram.sig="vi";var _emscripten_glUseProgram=_glUseProgram;_emscripten_glUseProgram.sig="vi";var _glValidateProgram=e=>{GLctx.validateProgram(GL.programs[e])};_glValidateProgram.sig="vi";var _emscripten_glValidateProgram=_glValidateProgram;_emscripten_glValidateProgram.sig="vi";var _glVertexAttrib1f=(e,t)=>GLctx.vertexAttrib1f(e,t);_glVertexAttrib1f.sig="vif";var _emscripten_glVertexAttrib1f=_glVertexAttrib1f;_emscripten_glVertexAttrib1f.sig="vif";function _glVertexAttrib1fv(e,t){t>>>=0,GLctx.vertexAttrib1f(e,HEAPF32[t>>>2])}_glVertexAttrib1fv.sig="vip";var _emscripten_glVertexAttrib1fv=_glVertexAttrib1fv;_emscripten_glVertexAttrib1fv.sig="vip";var _glVertexAttrib2f=(e,t,r)=>GLctx.vertexAttrib2f(e,t,r);_glVertexAttrib2f.sig="viff";var _emscripten_glVertexAttrib2f=_glVertexAttrib2f;_emscripten_glVertexAttrib2f.sig="viff";function _glVertexAttrib2fv(e,t){t>>>=0,GLctx.vertexAttrib2f(e,HEAPF32[t>>>2],HEAPF32[t+4>>>2])}_glVertexAttrib2fv.sig="vip";var _emscripten_glVertexAttrib2fv=_glVertexAttrib2fv;_emscripten_glVertexAttrib2fv.sig="vip";var _glVertexAttrib3f=(e,t,r,n)=>GLctx.vertexAttrib3f(e,t,r,n);_glVertexAttrib3f.sig="vifff";var _emscripten_glVertexAttrib3f=_glVertexAttrib3f;_emscripten_glVertexAttrib3f.sig="vifff";function _glVertexAttrib3fv(e,t){t>>>=0,GLctx.vertexAttrib3f(e,HEAPF32[t>>>2],HEAPF32[t+4>>>2],HEAPF32[t+8>>>2])}_glVertexAttrib3fv.sig="vip";var _emscripten_glVertexAttrib3fv=_glVertexAttrib3fv;_emscripten_glVertexAttrib3fv.sig="vip";var _glVertexAttrib4f=(e,t,r,n,a)=>GLctx.vertexAttrib4f(e,t,r,n,a);_glVertexAttrib4f.sig="viffff";var _emscripten_glVertexAttrib4f=_glVertexAttrib4f;_emscripten_glVertexAttrib4f.sig="viffff";function _glVertexAttrib4fv(e,t){t>>>=0,GLctx.vertexAttrib4f(e,HEAPF32[t>>>2],HEAPF32[t+4>>>2],HEAPF32[t+8>>>2],HEAPF32[t+12>>>2])}_glVertexAttrib4fv.sig="vip";var _emscripten_glVertexAttrib4fv=_glVertexAttrib4fv;_emscripten_glVertexAttrib4fv.sig="vip";var _glVertexAttribDivisor=(e,t)=>{GLctx.vertexAttribDivisor(e,t)};_glVertexAttribDivisor.sig="vii";var _glVertexAttribDivisorANGLE=_glVertexAttribDivisor,_emscripten_glVertexAttribDivisorANGLE=_glVertexAttribDivisorANGLE;function _glVertexAttribPointer(e,t,r,n,a,o){o>>>=0,GLctx.vertexAttribPointer(e,t,r,!!n,a,o)}_glVertexAttribPointer.sig="viiiiip";var _emscripten_glVertexAttribPointer=_glVertexAttribPointer;_emscripten_glVertexAttribPointer.sig="viiiiip";var _glViewport=(e,t,r,n)=>GLctx.viewport(e,t,r,n);_glViewport.sig="viiii";var _emscripten_glViewport=_glViewport;_emscripten_glViewport.sig="viiii";function _emscripten_out(e){return e>>>=0,out(UTF8ToString(e))}_emscripten_out.sig="vp";class HandleAllocator{constructor(){Qe(this,"allocated",[void 0]);Qe(this,"freelist",[])}get(t){return this.allocated[t]}has(t){return this.allocated[t]!==void 0}allocate(t){var r=this.freelist.pop()||this.allocated.length;return this.allocated[r]=t,r}free(t){this.allocated[t]=void 0,this.freelist.push(t)}}var promiseMap=new HandleAllocator,makePromise=()=>{var e={};return e.promise=new Promise((t,r)=>{e.reject=r,e.resolve=t}),e.id=promiseMap.allocate(e),e};function _emscripten_promise_create(){return makePromise().id}_emscripten_promise_create.sig="p";function _emscripten_promise_destroy(e){e>>>=0,promiseMap.free(e)}_emscripten_promise_destroy.sig="vp";var getPromise=e=>promiseMap.get(e).promise;function _emscripten_promise_resolve(e,t,r){e>>>=0,r>>>=0;var n=promiseMap.get(e);switch(t){case 0:n.resolve(r);return;case 1:n.resolve(getPromise(r));return;case 2:n.resolve(getPromise(r)),_emscripten_promise_destroy(r);return;case 3:n.reject(r);return}}_emscripten_promise_resolve.sig="vpip";var growMemory=e=>{var t=wasmMemory.buffer,r=(e-t.byteLength+65535)/65536|0;try{return wasmMemory.grow(r),updateMemoryViews(),1}catch(n){}};function _emscripten_resize_heap(e){e>>>=0;var t=HEAPU8.length,r=getHeapMax();if(e>r)return!1;for(var n=1;n<=4;n*=2){var a=t*(1+.2/n);a=Math.min(a,e+100663296);var o=Math.min(r,alignMemory(Math.max(e,a),65536)),l=growMemory(o);if(l)return!0}return!1}_emscripten_resize_heap.sig="ip";function _emscripten_wget_data(e,t,r,n){throw e>>>=0,t>>>=0,r>>>=0,n>>>=0,"Please compile your program with async support in order to use asynchronous operations like emscripten_wget_data"}_emscripten_wget_data.sig="vpppp";var getEnvStrings=()=>{if(!getEnvStrings.strings){var e=(typeof navigator=="object"&&navigator.languages&&navigator.languages[0]||"C").replace("-","_")+".UTF-8",t={USER:"web_user",LOGNAME:"web_user",PATH:"/",PWD:"/",HOME:"/home/web_user",LANG:e,_:getExecutableName()};for(var r in ENV)ENV[r]===void 0?delete t[r]:t[r]=ENV[r];var n=[];for(var r in t)n.push("".concat(r,"=").concat(t[r]));getEnvStrings.strings=n}return getEnvStrings.strings},stringToAscii=(e,t)=>{for(var r=0;r<e.length;++r)HEAP8[t++>>>0]=e.charCodeAt(r);HEAP8[t>>>0]=0},_environ_get=function(e,t){e>>>=0,t>>>=0;var r=0;return getEnvStrings().forEach((n,a)=>{var o=t+r;HEAPU32[e+a*4>>>2>>>0]=o,stringToAscii(n,o),r+=n.length+1}),0};_environ_get.sig="ipp";var _environ_sizes_get=function(e,t){e>>>=0,t>>>=0;var r=getEnvStrings();HEAPU32[e>>>2>>>0]=r.length;var n=0;return r.forEach(a=>n+=a.length+1),HEAPU32[t>>>2>>>0]=n,0};_environ_sizes_get.sig="ipp";function _fd_close(e){try{var t=SYSCALLS.getStreamFromFD(e);return FS.close(t),0}catch(r){if(typeof FS>"u"||r.name!=="ErrnoError")throw r;return r.errno}}_fd_close.sig="ii";function _fd_fdstat_get(e,t){t>>>=0;try{var r=0,n=0,a=0,o=SYSCALLS.getStreamFromFD(e),l=o.tty?2:FS.isDir(o.mode)?3:FS.isLink(o.mode)?7:4;return HEAP8[t>>>0]=l,HEAP16[t+2>>>1>>>0]=a,tempI64=[r>>>0,(tempDouble=r,+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)],HEAP32[t+8>>>2>>>0]=tempI64[0],HEAP32[t+12>>>2>>>0]=tempI64[1],tempI64=[n>>>0,(tempDouble=n,+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)],HEAP32[t+16>>>2>>>0]=tempI64[0],HEAP32[t+20>>>2>>>0]=tempI64[1],0}catch(u){if(typeof FS>"u"||u.name!=="ErrnoError")throw u;return u.errno}}_fd_fdstat_get.sig="iip";var doReadv=(e,t,r,n)=>{for(var a=0,o=0;o<r;o++){var l=HEAPU32[t>>>2>>>0],u=HEAPU32[t+4>>>2>>>0];t+=8;var _=FS.read(e,HEAP8,l,u,n);if(_<0)return-1;if(a+=_,_<u)break;typeof n<"u"&&(n+=_)}return a};function _fd_pread(e,t,r,n,a,o){t>>>=0,r>>>=0;var l=convertI32PairToI53Checked(n,a);o>>>=0;try{if(isNaN(l))return 61;var u=SYSCALLS.getStreamFromFD(e),_=doReadv(u,t,r,l);return HEAPU32[o>>>2>>>0]=_,0}catch(d){if(typeof FS>"u"||d.name!=="ErrnoError")throw d;return d.errno}}_fd_pread.sig="iippiip";var doWritev=(e,t,r,n)=>{for(var a=0,o=0;o<r;o++){var l=HEAPU32[t>>>2>>>0],u=HEAPU32[t+4>>>2>>>0];t+=8;var _=FS.write(e,HEAP8,l,u,n);if(_<0)return-1;if(a+=_,_<u)break;typeof n<"u"&&(n+=_)}return a};function _fd_pwrite(e,t,r,n,a,o){t>>>=0,r>>>=0;var l=convertI32PairToI53Checked(n,a);o>>>=0;try{if(isNaN(l))return 61;var u=SYSCALLS.getStreamFromFD(e),_=doWritev(u,t,r,l);return HEAPU32[o>>>2>>>0]=_,0}catch(d){if(typeof FS>"u"||d.name!=="ErrnoError")throw d;return d.errno}}_fd_pwrite.sig="iippiip";function _fd_read(e,t,r,n){t>>>=0,r>>>=0,n>>>=0;try{var a=SYSCALLS.getStreamFromFD(e),o=doReadv(a,t,r);return HEAPU32[n>>>2>>>0]=o,0}catch(l){if(typeof FS>"u"||l.name!=="ErrnoError")throw l;return l.errno}}_fd_read.sig="iippp";function _fd_seek(e,t,r,n,a){var o=convertI32PairToI53Checked(t,r);a>>>=0;try{if(isNaN(o))return 61;var l=SYSCALLS.getStreamFromFD(e);return FS.llseek(l,o,n),tempI64=[l.position>>>0,(tempDouble=l.position,+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)],HEAP32[a>>>2>>>0]=tempI64[0],HEAP32[a+4>>>2>>>0]=tempI64[1],l.getdents&&o===0&&n===0&&(l.getdents=null),0}catch(u){if(typeof FS>"u"||u.name!=="ErrnoError")throw u;return u.errno}}_fd_seek.sig="iiiiip";function _fd_sync(e){var r;try{var t=SYSCALLS.getStreamFromFD(e);return(r=t.stream_ops)!=null&&r.fsync?t.stream_ops.fsync(t):0}catch(n){if(typeof FS>"u"||n.name!=="ErrnoError")throw n;return n.errno}}_fd_sync.sig="ii";function _fd_write(e,t,r,n){t>>>=0,r>>>=0,n>>>=0;try{var a=SYSCALLS.getStreamFromFD(e),o=doWritev(a,t,r);return HEAPU32[n>>>2>>>0]=o,0}catch(l){if(typeof FS>"u"||l.name!=="ErrnoError")throw l;return l.errno}}_fd_write.sig="iippp";function _getaddrinfo(e,t,r,n){e>>>=0,t>>>=0,r>>>=0,n>>>=0;var a=[],o=null,l=0,u=0,_=0,d=0,f=0,p=0,m,h;function g(v,y,S,w,D,F){var E,x,A,L;return x=v===10?28:16,D=v===10?inetNtop6(D):inetNtop4(D),E=_malloc(x),L=writeSockaddr(E,v,D,F),assert(!L),A=_malloc(32),HEAP32[A+4>>>2>>>0]=v,HEAP32[A+8>>>2>>>0]=y,HEAP32[A+12>>>2>>>0]=S,HEAPU32[A+24>>>2>>>0]=w,HEAPU32[A+20>>>2>>>0]=E,v===10?HEAP32[A+16>>>2>>>0]=28:HEAP32[A+16>>>2>>>0]=16,HEAP32[A+28>>>2>>>0]=0,A}if(r&&(_=HEAP32[r>>>2>>>0],d=HEAP32[r+4>>>2>>>0],f=HEAP32[r+8>>>2>>>0],p=HEAP32[r+12>>>2>>>0]),f&&!p&&(p=f===2?17:6),!f&&p&&(f=p===17?2:1),p===0&&(p=6),f===0&&(f=1),!e&&!t)return-2;if(_&-1088||r!==0&&HEAP32[r>>>2>>>0]&2&&!e)return-1;if(_&32)return-2;if(f!==0&&f!==1&&f!==2)return-7;if(d!==0&&d!==2&&d!==10)return-6;if(t&&(t=UTF8ToString(t),u=parseInt(t,10),isNaN(u)))return _&1024?-2:-8;if(!e)return d===0&&(d=2),_&1||(d===2?l=_htonl(2130706433):l=[0,0,0,_htonl(1)]),m=g(d,f,p,null,l,u),HEAPU32[n>>>2>>>0]=m,0;if(e=UTF8ToString(e),l=inetPton4(e),l!==null)if(d===0||d===2)d=2;else if(d===10&&_&8)l=[0,0,_htonl(65535),l],d=10;else return-2;else if(l=inetPton6(e),l!==null)if(d===0||d===10)d=10;else return-2;return l!=null?(m=g(d,f,p,e,l,u),HEAPU32[n>>>2>>>0]=m,0):_&4?-2:(e=DNS.lookup_name(e),l=inetPton4(e),d===0?d=2:d===10&&(l=[0,0,_htonl(65535),l]),m=g(d,f,p,null,l,u),HEAPU32[n>>>2>>>0]=m,0)}_getaddrinfo.sig="ipppp";function _getnameinfo(e,t,r,n,a,o,l){e>>>=0,r>>>=0,a>>>=0;var u=readSockaddr(e,t);if(u.errno)return-6;var _=u.port,d=u.addr,f=!1;if(r&&n){var p;if(l&1||!(p=DNS.lookup_addr(d))){if(l&8)return-2}else d=p;var m=stringToUTF8(d,r,n);m+1>=n&&(f=!0)}if(a&&o){_=""+_;var m=stringToUTF8(_,a,o);m+1>=o&&(f=!0)}return f?-12:0}_getnameinfo.sig="ipipipii";function _llvm_eh_typeid_for(e){return e>>>=0,e}_llvm_eh_typeid_for.sig="vp";function _pthread_kill(...e){return wasmImports.pthread_kill(...e)}_pthread_kill.stub=!0;function _random_get(e,t){e>>>=0,t>>>=0;try{return randomFill(HEAPU8.subarray(e>>>0,e+t>>>0)),0}catch(r){if(typeof FS>"u"||r.name!=="ErrnoError")throw r;return r.errno}}_random_get.sig="ipp";var arraySum=(e,t)=>{for(var r=0,n=0;n<=t;r+=e[n++]);return r},MONTH_DAYS_LEAP=[31,29,31,30,31,30,31,31,30,31,30,31],MONTH_DAYS_REGULAR=[31,28,31,30,31,30,31,31,30,31,30,31],addDays=(e,t)=>{for(var r=new Date(e.getTime());t>0;){var n=isLeapYear(r.getFullYear()),a=r.getMonth(),o=(n?MONTH_DAYS_LEAP:MONTH_DAYS_REGULAR)[a];if(t>o-r.getDate())t-=o-r.getDate()+1,r.setDate(1),a<11?r.setMonth(a+1):(r.setMonth(0),r.setFullYear(r.getFullYear()+1));else return r.setDate(r.getDate()+t),r}return r};function _strptime(e,t,r){e>>>=0,t>>>=0,r>>>=0;for(var n=UTF8ToString(t),a="\\!@#$^&*()+=-[]/{}|:<>?,.",o=0,l=a.length;o<l;++o)n=n.replace(new RegExp("\\"+a[o],"g"),"\\"+a[o]);var u={A:"%a",B:"%b",c:"%a %b %d %H:%M:%S %Y",D:"%m\\/%d\\/%y",e:"%d",F:"%Y-%m-%d",h:"%b",R:"%H\\:%M",r:"%I\\:%M\\:%S\\s%p",T:"%H\\:%M\\:%S",x:"%m\\/%d\\/(?:%y|%Y)",X:"%H\\:%M\\:%S"},_={a:"(?:Sun(?:day)?)|(?:Mon(?:day)?)|(?:Tue(?:sday)?)|(?:Wed(?:nesday)?)|(?:Thu(?:rsday)?)|(?:Fri(?:day)?)|(?:Sat(?:urday)?)",b:"(?:Jan(?:uary)?)|(?:Feb(?:ruary)?)|(?:Mar(?:ch)?)|(?:Apr(?:il)?)|May|(?:Jun(?:e)?)|(?:Jul(?:y)?)|(?:Aug(?:ust)?)|(?:Sep(?:tember)?)|(?:Oct(?:ober)?)|(?:Nov(?:ember)?)|(?:Dec(?:ember)?)",C:"\\d\\d",d:"0[1-9]|[1-9](?!\\d)|1\\d|2\\d|30|31",H:"\\d(?!\\d)|[0,1]\\d|20|21|22|23",I:"\\d(?!\\d)|0\\d|10|11|12",j:"00[1-9]|0?[1-9](?!\\d)|0?[1-9]\\d(?!\\d)|[1,2]\\d\\d|3[0-6]\\d",m:"0[1-9]|[1-9](?!\\d)|10|11|12",M:"0\\d|\\d(?!\\d)|[1-5]\\d",n:" ",p:"AM|am|PM|pm|A\\.M\\.|a\\.m\\.|P\\.M\\.|p\\.m\\.",S:"0\\d|\\d(?!\\d)|[1-5]\\d|60",U:"0\\d|\\d(?!\\d)|[1-4]\\d|50|51|52|53",W:"0\\d|\\d(?!\\d)|[1-4]\\d|50|51|52|53",w:"[0-6]",y:"\\d\\d",Y:"\\d\\d\\d\\d",t:" ",z:"Z|(?:[\\+\\-]\\d\\d:?(?:\\d\\d)?)"},d={JAN:0,FEB:1,MAR:2,APR:3,MAY:4,JUN:5,JUL:6,AUG:7,SEP:8,OCT:9,NOV:10,DEC:11},f={SUN:0,MON:1,TUE:2,WED:3,THU:4,FRI:5,SAT:6},p={MON:0,TUE:1,WED:2,THU:3,FRI:4,SAT:5,SUN:6},m=[],h=n.replace(/%(.)/g,(ee,ce)=>u[ce]||ee).replace(/%(.)/g,(ee,ce)=>{let Y=_[ce];return Y?(m.push(ce),"(".concat(Y,")")):ce}).replace(/\s+/g,"\\s*"),g=new RegExp("^"+h,"i").exec(UTF8ToString(e));function v(){function ee(ce,Y,Ie){return typeof ce!="number"||isNaN(ce)?Y:ce>=Y?ce<=Ie?ce:Ie:Y}return{year:ee(HEAP32[r+20>>>2>>>0]+1900,1970,9999),month:ee(HEAP32[r+16>>>2>>>0],0,11),day:ee(HEAP32[r+12>>>2>>>0],1,31),hour:ee(HEAP32[r+8>>>2>>>0],0,23),min:ee(HEAP32[r+4>>>2>>>0],0,59),sec:ee(HEAP32[r>>>2>>>0],0,59),gmtoff:0}}if(g){var y=v(),S,w=ee=>{var ce=m.indexOf(ee);if(ce>=0)return g[ce+1]};if((S=w("S"))&&(y.sec=jstoi_q(S)),(S=w("M"))&&(y.min=jstoi_q(S)),S=w("H"))y.hour=jstoi_q(S);else if(S=w("I")){var D=jstoi_q(S);(S=w("p"))&&(D+=S.toUpperCase()[0]==="P"?12:0),y.hour=D}if(S=w("Y"))y.year=jstoi_q(S);else if(S=w("y")){var F=jstoi_q(S);(S=w("C"))?F+=jstoi_q(S)*100:F+=F<69?2e3:1900,y.year=F}if((S=w("m"))?y.month=jstoi_q(S)-1:(S=w("b"))&&(y.month=d[S.substring(0,3).toUpperCase()]||0),S=w("d"))y.day=jstoi_q(S);else if(S=w("j"))for(var E=jstoi_q(S),x=isLeapYear(y.year),A=0;A<12;++A){var L=arraySum(x?MONTH_DAYS_LEAP:MONTH_DAYS_REGULAR,A-1);E<=L+(x?MONTH_DAYS_LEAP:MONTH_DAYS_REGULAR)[A]&&(y.day=E-L)}else if(S=w("a")){var C=S.substring(0,3).toUpperCase();if(S=w("U")){var k=f[C],P=jstoi_q(S),T=new Date(y.year,0,1),M;T.getDay()===0?M=addDays(T,k+7*(P-1)):M=addDays(T,7-T.getDay()+k+7*(P-1)),y.day=M.getDate(),y.month=M.getMonth()}else if(S=w("W")){var k=p[C],P=jstoi_q(S),T=new Date(y.year,0,1),M;T.getDay()===1?M=addDays(T,k+7*(P-1)):M=addDays(T,7-T.getDay()+1+k+7*(P-1)),y.day=M.getDate(),y.month=M.getMonth()}}if(S=w("z"))if(S.toLowerCase()==="z")y.gmtoff=0;else{var I=S.match(/^((?:\-|\+)\d\d):?(\d\d)?/);y.gmtoff=I[1]*3600,I[2]&&(y.gmtoff+=y.gmtoff>0?I[2]*60:-I[2]*60)}var Q=new Date(y.year,y.month,y.day,y.hour,y.min,y.sec,0);return HEAP32[r>>>2>>>0]=Q.getSeconds(),HEAP32[r+4>>>2>>>0]=Q.getMinutes(),HEAP32[r+8>>>2>>>0]=Q.getHours(),HEAP32[r+12>>>2>>>0]=Q.getDate(),HEAP32[r+16>>>2>>>0]=Q.getMonth(),HEAP32[r+20>>>2>>>0]=Q.getFullYear()-1900,HEAP32[r+24>>>2>>>0]=Q.getDay(),HEAP32[r+28>>>2>>>0]=arraySum(isLeapYear(Q.getFullYear())?MONTH_DAYS_LEAP:MONTH_DAYS_REGULAR,Q.getMonth()-1)+Q.getDate()-1,HEAP32[r+32>>>2>>>0]=0,HEAP32[r+36>>>2>>>0]=y.gmtoff,e+intArrayFromString(g[0]).length-1}return 0}_strptime.sig="pppp";var getCFunc=e=>{var t=Module["_"+e];return t},writeArrayToMemory=(e,t)=>{HEAP8.set(e,t>>>0)},ccall=(e,t,r,n,a)=>{var o={string:g=>{var v=0;return g!=null&&g!==0&&(v=stringToUTF8OnStack(g)),v},array:g=>{var v=stackAlloc(g.length);return writeArrayToMemory(g,v),v}};function l(g){return t==="string"?UTF8ToString(g):t==="boolean"?!!g:g}var u=getCFunc(e),_=[],d=0;if(n)for(var f=0;f<n.length;f++){var p=o[r[f]];p?(d===0&&(d=stackSave()),_[f]=p(n[f])):_[f]=n[f]}var m=u(..._);function h(g){return d!==0&&stackRestore(d),l(g)}return m=h(m),m},getTempRet0=e=>__emscripten_tempret_get(),writeI53ToI64Clamped=(e,t)=>{t>9223372036854776e3?(HEAPU32[e>>>2>>>0]=4294967295,HEAPU32[e+4>>>2>>>0]=2147483647):t<-9223372036854776e3?(HEAPU32[e>>>2>>>0]=0,HEAPU32[e+4>>>2>>>0]=2147483648):writeI53ToI64(e,t)},writeI53ToI64Signaling=(e,t)=>{if(t>9223372036854776e3||t<-9223372036854776e3)throw"RangeError: ".concat(t);writeI53ToI64(e,t)},writeI53ToU64Clamped=(e,t)=>{t>18446744073709552e3?(HEAPU32[e>>>2>>>0]=4294967295,HEAPU32[e+4>>>2>>>0]=4294967295):t<0?(HEAPU32[e>>>2>>>0]=0,HEAPU32[e+4>>>2>>>0]=0):writeI53ToI64(e,t)},writeI53ToU64Signaling=(e,t)=>{if(t<0||t>18446744073709552e3)throw"RangeError: ".concat(t);writeI53ToI64(e,t)},readI53FromU64=e=>HEAPU32[e>>>2>>>0]+HEAPU32[e+4>>>2>>>0]*4294967296,convertI32PairToI53=(e,t)=>(e>>>0)+t*4294967296,convertU32PairToI53=(e,t)=>(e>>>0)+(t>>>0)*4294967296,_stackAlloc=stackAlloc,_stackSave=stackSave,_stackRestore=stackSave,_getTempRet0=getTempRet0;Module._getTempRet0=_getTempRet0;var ptrToString=e=>"0x"+e.toString(16).padStart(8,"0");function _emscripten_notify_memory_growth(e){e>>>=0,updateMemoryViews()}_emscripten_notify_memory_growth.sig="vp";var withStackSave=e=>{var t=stackSave(),r=e();return stackRestore(t),r},ERRNO_CODES={EPERM:63,ENOENT:44,ESRCH:71,EINTR:27,EIO:29,ENXIO:60,E2BIG:1,ENOEXEC:45,EBADF:8,ECHILD:12,EAGAIN:6,EWOULDBLOCK:6,ENOMEM:48,EACCES:2,EFAULT:21,ENOTBLK:105,EBUSY:10,EEXIST:20,EXDEV:75,ENODEV:43,ENOTDIR:54,EISDIR:31,EINVAL:28,ENFILE:41,EMFILE:33,ENOTTY:59,ETXTBSY:74,EFBIG:22,ENOSPC:51,ESPIPE:70,EROFS:69,EMLINK:34,EPIPE:64,EDOM:18,ERANGE:68,ENOMSG:49,EIDRM:24,ECHRNG:106,EL2NSYNC:156,EL3HLT:107,EL3RST:108,ELNRNG:109,EUNATCH:110,ENOCSI:111,EL2HLT:112,EDEADLK:16,ENOLCK:46,EBADE:113,EBADR:114,EXFULL:115,ENOANO:104,EBADRQC:103,EBADSLT:102,EDEADLOCK:16,EBFONT:101,ENOSTR:100,ENODATA:116,ETIME:117,ENOSR:118,ENONET:119,ENOPKG:120,EREMOTE:121,ENOLINK:47,EADV:122,ESRMNT:123,ECOMM:124,EPROTO:65,EMULTIHOP:36,EDOTDOT:125,EBADMSG:9,ENOTUNIQ:126,EBADFD:127,EREMCHG:128,ELIBACC:129,ELIBBAD:130,ELIBSCN:131,ELIBMAX:132,ELIBEXEC:133,ENOSYS:52,ENOTEMPTY:55,ENAMETOOLONG:37,ELOOP:32,EOPNOTSUPP:138,EPFNOSUPPORT:139,ECONNRESET:15,ENOBUFS:42,EAFNOSUPPORT:5,EPROTOTYPE:67,ENOTSOCK:57,ENOPROTOOPT:50,ESHUTDOWN:140,ECONNREFUSED:14,EADDRINUSE:3,ECONNABORTED:13,ENETUNREACH:40,ENETDOWN:38,ETIMEDOUT:73,EHOSTDOWN:142,EHOSTUNREACH:23,EINPROGRESS:26,EALREADY:7,EDESTADDRREQ:17,EMSGSIZE:35,EPROTONOSUPPORT:66,ESOCKTNOSUPPORT:137,EADDRNOTAVAIL:4,ENETRESET:39,EISCONN:30,ENOTCONN:53,ETOOMANYREFS:141,EUSERS:136,EDQUOT:19,ESTALE:72,ENOTSUP:138,ENOMEDIUM:148,EILSEQ:25,EOVERFLOW:61,ECANCELED:11,ENOTRECOVERABLE:56,EOWNERDEAD:62,ESTRPIPE:135},strError=e=>UTF8ToString(_strerror(e)),Protocols={list:[],map:{}},_setprotoent=e=>{function t(o,l,u){var _=_malloc(o.length+1);stringToAscii(o,_);for(var d=0,f=u.length,p=_malloc((f+1)*4),m=0;m<f;m++,d+=4){var h=u[m],g=_malloc(h.length+1);stringToAscii(h,g),HEAPU32[p+d>>>2>>>0]=g}HEAPU32[p+d>>>2>>>0]=0;var v=_malloc(12);return HEAPU32[v>>>2>>>0]=_,HEAPU32[v+4>>>2>>>0]=p,HEAP32[v+8>>>2>>>0]=l,v}var r=Protocols.list,n=Protocols.map;if(r.length===0){var a=t("tcp",6,["TCP"]);r.push(a),n.tcp=n[6]=a,a=t("udp",17,["UDP"]),r.push(a),n.udp=n[17]=a}_setprotoent.index=0};_setprotoent.sig="vi";var _endprotoent=()=>{};_endprotoent.sig="v";function _getprotoent(e){if(_setprotoent.index===Protocols.list.length)return 0;var t=Protocols.list[_setprotoent.index++];return t}_getprotoent.sig="p";function _getprotobyname(e){e>>>=0,e=UTF8ToString(e),_setprotoent(!0);var t=Protocols.map[e];return t}_getprotobyname.sig="pp";function _getprotobynumber(e){_setprotoent(!0);var t=Protocols.map[e];return t}_getprotobynumber.sig="pi";function _emscripten_run_script(ptr){ptr>>>=0,eval(UTF8ToString(ptr))}_emscripten_run_script.sig="vp";function _emscripten_run_script_int(ptr){return ptr>>>=0,eval(UTF8ToString(ptr))|0}_emscripten_run_script_int.sig="ip";function _emscripten_run_script_string(ptr){ptr>>>=0;var s=eval(UTF8ToString(ptr));if(s==null)return 0;s+="";var me=_emscripten_run_script_string,len=lengthBytesUTF8(s);return(!me.bufferSize||me.bufferSize<len+1)&&(me.bufferSize&&_free(me.buffer),me.bufferSize=len+1,me.buffer=_malloc(me.bufferSize)),stringToUTF8(s,me.buffer,me.bufferSize),me.buffer}_emscripten_run_script_string.sig="pp";var _emscripten_random=()=>Math.random();_emscripten_random.sig="f";var warnOnce=e=>{warnOnce.shown||(warnOnce.shown={}),warnOnce.shown[e]||(warnOnce.shown[e]=1,ENVIRONMENT_IS_NODE&&(e="warning: "+e),err(e))},jsStackTrace=()=>new Error().stack.toString(),getCallstack=e=>{var t=jsStackTrace(),r=t.lastIndexOf("_emscripten_log"),n=t.lastIndexOf("_emscripten_get_callstack"),a=t.indexOf("\n",Math.max(r,n))+1;t=t.slice(a),e&8&&typeof emscripten_source_map>"u"&&(warnOnce('Source map information is not available, emscripten_log with EM_LOG_C_STACK will be ignored. Build with "--pre-js $EMSCRIPTEN/src/emscripten-source-map.min.js" linker flag to add source map loading to code.'),e^=8,e|=16);var o=t.split("\n");t="";var l=new RegExp("\\s*(.*?)@(.*?):([0-9]+):([0-9]+)"),u=new RegExp("\\s*(.*?)@(.*):(.*)(:(.*))?"),_=new RegExp("\\s*at (.*?) \\((.*):(.*):(.*)\\)");for(var d in o){var f=o[d],p="",m="",h=0,g=0,v=_.exec(f);if(v&&v.length==5)p=v[1],m=v[2],h=v[3],g=v[4];else if(v=l.exec(f)||u.exec(f),v&&v.length>=4)p=v[1],m=v[2],h=v[3],g=v[4]|0;else{t+=f+"\n";continue}var y=!1;if(e&8){var S=emscripten_source_map.originalPositionFor({line:h,column:g});y=S==null?void 0:S.source,y&&(e&64&&(S.source=S.source.substring(S.source.replace(/\\/g,"/").lastIndexOf("/")+1)),t+="    at ".concat(p," (").concat(S.source,":").concat(S.line,":").concat(S.column,")\n"))}(e&16||!y)&&(e&64&&(m=m.substring(m.replace(/\\/g,"/").lastIndexOf("/")+1)),t+=(y?"     = ".concat(p):"    at ".concat(p))+" (".concat(m,":").concat(h,":").concat(g,")\n"))}return t=t.replace(/\s+$/,""),t},emscriptenLog=(e,t)=>{e&24&&(t=t.replace(/\s+$/,""),t+=(t.length>0?"\n":"")+getCallstack(e)),e&1?e&4?console.error(t):e&2?console.warn(t):e&512?console.info(t):e&256?console.debug(t):console.log(t):e&6?err(t):out(t)},reallyNegative=e=>e<0||e===0&&1/e===-1/0,reSign=(e,t)=>{if(e<=0)return e;var r=t<=32?Math.abs(1<<t-1):Math.pow(2,t-1);return e>=r&&(t<=32||e>r)&&(e=-2*r+e),e},unSign=(e,t)=>e>=0?e:t<=32?2*Math.abs(1<<t-1)+e:Math.pow(2,t)+e,strLen=e=>{for(var t=e;HEAPU8[t>>>0];)++t;return t-e},formatString=(e,t)=>{var r=e,n=t;function a(we,De){return(De==="double"||De==="i64")&&we&7&&(we+=4),we}function o(we){var De;return n=a(n,we),we==="double"?(De=HEAPF64[n>>>3>>>0],n+=8):we=="i64"?(De=[HEAP32[n>>>2>>>0],HEAP32[n+4>>>2>>>0]],n+=8):(we="i32",De=HEAP32[n>>>2>>>0],n+=4),De}for(var l=[],u,_,d;;){var f=r;if(u=HEAP8[r>>>0],u===0)break;if(_=HEAP8[r+1>>>0],u==37){var p=!1,m=!1,h=!1,g=!1,v=!1;e:for(;;){switch(_){case 43:p=!0;break;case 45:m=!0;break;case 35:h=!0;break;case 48:if(g)break e;g=!0;break;case 32:v=!0;break;default:break e}r++,_=HEAP8[r+1>>>0]}var y=0;if(_==42)y=o("i32"),r++,_=HEAP8[r+1>>>0];else for(;_>=48&&_<=57;)y=y*10+(_-48),r++,_=HEAP8[r+1>>>0];var S=!1,w=-1;if(_==46){if(w=0,S=!0,r++,_=HEAP8[r+1>>>0],_==42)w=o("i32"),r++;else for(;;){var D=HEAP8[r+1>>>0];if(D<48||D>57)break;w=w*10+(D-48),r++}_=HEAP8[r+1>>>0]}w<0&&(w=6,S=!1);var F;switch(String.fromCharCode(_)){case"h":var E=HEAP8[r+2>>>0];E==104?(r++,F=1):F=2;break;case"l":var E=HEAP8[r+2>>>0];E==108?(r++,F=8):F=4;break;case"L":case"q":case"j":F=8;break;case"z":case"t":case"I":F=4;break;default:F=null}switch(F&&r++,_=HEAP8[r+1>>>0],String.fromCharCode(_)){case"d":case"i":case"u":case"o":case"x":case"X":case"p":{var x=_==100||_==105;F=F||4,d=o("i"+F*8);var A;if(F==8&&(d=_==117?convertU32PairToI53(d[0],d[1]):convertI32PairToI53(d[0],d[1])),F<=4){var L=Math.pow(256,F)-1;d=(x?reSign:unSign)(d&L,F*8)}var C=Math.abs(d),k="";if(_==100||_==105)A=reSign(d,8*F).toString(10);else if(_==117)A=unSign(d,8*F).toString(10),d=Math.abs(d);else if(_==111)A=(h?"0":"")+C.toString(8);else if(_==120||_==88){if(k=h&&d!=0?"0x":"",d<0){d=-d,A=(C-1).toString(16);for(var P=[],T=0;T<A.length;T++)P.push((15-parseInt(A[T],16)).toString(16));for(A=P.join("");A.length<F*2;)A="f"+A}else A=C.toString(16);_==88&&(k=k.toUpperCase(),A=A.toUpperCase())}else _==112&&(C===0?A="(nil)":(k="0x",A=C.toString(16)));if(S)for(;A.length<w;)A="0"+A;for(d>=0&&(p?k="+"+k:v&&(k=" "+k)),A.charAt(0)=="-"&&(k="-"+k,A=A.substr(1));k.length+A.length<y;)m?A+=" ":g?A="0"+A:k=" "+k;A=k+A,A.split("").forEach(we=>l.push(we.charCodeAt(0)));break}case"f":case"F":case"e":case"E":case"g":case"G":{d=o("double");var A;if(isNaN(d))A="nan",g=!1;else if(!isFinite(d))A=(d<0?"-":"")+"inf",g=!1;else{var M=!1,I=Math.min(w,20);if(_==103||_==71){M=!0,w=w||1;var Q=parseInt(d.toExponential(I).split("e")[1],10);w>Q&&Q>=-4?(_=(_==103?"f":"F").charCodeAt(0),w-=Q+1):(_=(_==103?"e":"E").charCodeAt(0),w--),I=Math.min(w,20)}_==101||_==69?(A=d.toExponential(I),/[eE][-+]\d$/.test(A)&&(A=A.slice(0,-1)+"0"+A.slice(-1))):(_==102||_==70)&&(A=d.toFixed(I),d===0&&reallyNegative(d)&&(A="-"+A));var ee=A.split("e");if(M&&!h)for(;ee[0].length>1&&ee[0].includes(".")&&(ee[0].slice(-1)=="0"||ee[0].slice(-1)==".");)ee[0]=ee[0].slice(0,-1);else for(h&&A.indexOf(".")==-1&&(ee[0]+=".");w>I++;)ee[0]+="0";A=ee[0]+(ee.length>1?"e"+ee[1]:""),_==69&&(A=A.toUpperCase()),d>=0&&(p?A="+"+A:v&&(A=" "+A))}for(;A.length<y;)m?A+=" ":g&&(A[0]=="-"||A[0]=="+")?A=A[0]+"0"+A.slice(1):A=(g?"0":" ")+A;_<97&&(A=A.toUpperCase()),A.split("").forEach(De=>l.push(De.charCodeAt(0)));break}case"s":{var ce=o("i8*"),Y=ce?strLen(ce):6;if(S&&(Y=Math.min(Y,w)),!m)for(;Y<y--;)l.push(32);if(ce)for(var T=0;T<Y;T++)l.push(HEAPU8[ce++>>>0]);else l=l.concat(intArrayFromString("(null)".substr(0,Y),!0));if(m)for(;Y<y--;)l.push(32);break}case"c":{for(m&&l.push(o("i8"));--y>0;)l.push(32);m||l.push(o("i8"));break}case"n":{var Ie=o("i32*");HEAP32[Ie>>>2>>>0]=l.length;break}case"%":{l.push(u);break}default:for(var T=f;T<r+2;T++)l.push(HEAP8[T>>>0])}r+=2}else l.push(u),r+=1}return l};function _emscripten_log(e,t,r){t>>>=0,r>>>=0;var n=formatString(t,r),a=UTF8ArrayToString(n);emscriptenLog(e,a)}_emscripten_log.sig="vipp";function _emscripten_get_compiler_setting(e){throw e>>>=0,"You must build with -sRETAIN_COMPILER_SETTINGS for getCompilerSetting or emscripten_get_compiler_setting to work"}_emscripten_get_compiler_setting.sig="pp";var _emscripten_has_asyncify=()=>0;_emscripten_has_asyncify.sig="i";var _emscripten_debugger=()=>{debugger};_emscripten_debugger.sig="v";function _emscripten_print_double(e,t,r){t>>>=0;var n=e+"";return t?stringToUTF8(n,t,r):lengthBytesUTF8(n)}_emscripten_print_double.sig="idpi";function _emscripten_asm_const_double(e,t,r){return e>>>=0,t>>>=0,r>>>=0,runEmAsmFunction(e,t,r)}_emscripten_asm_const_double.sig="dppp";var runMainThreadEmAsm=(e,t,r,n)=>{var a=readEmAsmArgs(t,r);return ASM_CONSTS[e](...a)};function _emscripten_asm_const_int_sync_on_main_thread(e,t,r){return e>>>=0,t>>>=0,r>>>=0,runMainThreadEmAsm(e,t,r,1)}_emscripten_asm_const_int_sync_on_main_thread.sig="ippp";function _emscripten_asm_const_ptr_sync_on_main_thread(e,t,r){return e>>>=0,t>>>=0,r>>>=0,runMainThreadEmAsm(e,t,r,1)}_emscripten_asm_const_ptr_sync_on_main_thread.sig="pppp";var _emscripten_asm_const_double_sync_on_main_thread=_emscripten_asm_const_int_sync_on_main_thread;_emscripten_asm_const_double_sync_on_main_thread.sig="dppp";function _emscripten_asm_const_async_on_main_thread(e,t,r){return e>>>=0,t>>>=0,r>>>=0,runMainThreadEmAsm(e,t,r,0)}_emscripten_asm_const_async_on_main_thread.sig="vppp";var jstoi_s=Number;function __Unwind_Backtrace(e,t){e>>>=0,t>>>=0;for(var r=getCallstack(),n=r.split("\n"),a=0;a<n.length;a++){var o=getWasmTableEntry(e)(0,t);if(o!==0)return}}__Unwind_Backtrace.sig="ipp";function __Unwind_GetIPInfo(e,t){return e>>>=0,t>>>=0,abort("Unwind_GetIPInfo")}__Unwind_GetIPInfo.sig="ppp";function __Unwind_FindEnclosingFunction(e){return e>>>=0,0}__Unwind_FindEnclosingFunction.sig="pp";function __Unwind_RaiseException(e){return e>>>=0,err("Warning: _Unwind_RaiseException is not correctly implemented"),___cxa_throw(e,0,0)}__Unwind_RaiseException.sig="ip";function __Unwind_DeleteException(e){e>>>=0,err("TODO: Unwind_DeleteException")}__Unwind_DeleteException.sig="vp";var getDynCaller=(e,t)=>(...r)=>dynCall(e,t,r),_emscripten_exit_with_live_runtime=()=>{throw"unwind"};_emscripten_exit_with_live_runtime.sig="v";var _emscripten_force_exit=e=>{__emscripten_runtime_keepalive_clear(),_exit(e)};_emscripten_force_exit.sig="vi";function _emscripten_outn(e,t){return e>>>=0,t>>>=0,out(UTF8ToString(e,t))}_emscripten_outn.sig="vpp";function _emscripten_errn(e,t){return e>>>=0,t>>>=0,err(UTF8ToString(e,t))}_emscripten_errn.sig="vpp";var _emscripten_throw_number=e=>{throw e};_emscripten_throw_number.sig="vd";function _emscripten_throw_string(e){throw e>>>=0,UTF8ToString(e)}_emscripten_throw_string.sig="vp";var runtimeKeepalivePush=()=>{runtimeKeepaliveCounter+=1};runtimeKeepalivePush.sig="v";var runtimeKeepalivePop=()=>{runtimeKeepaliveCounter-=1};runtimeKeepalivePop.sig="v";var _emscripten_runtime_keepalive_push=runtimeKeepalivePush;_emscripten_runtime_keepalive_push.sig="v";var _emscripten_runtime_keepalive_pop=runtimeKeepalivePop;_emscripten_runtime_keepalive_pop.sig="v";var _emscripten_runtime_keepalive_check=keepRuntimeAlive;_emscripten_runtime_keepalive_check.sig="i";var asmjsMangle=e=>(e=="__main_argc_argv"&&(e="main"),e.startsWith("dynCall_")?e:"_"+e),___global_base=1024;function __emscripten_fs_load_embedded_files(e){e>>>=0;do{var t=HEAPU32[e>>>2>>>0];e+=4;var r=HEAPU32[e>>>2>>>0];e+=4;var n=HEAPU32[e>>>2>>>0];e+=4;var a=UTF8ToString(t);FS.createPath("/",PATH.dirname(a),!0,!0),FS.createDataFile(a,null,HEAP8.subarray(n>>>0,n+r>>>0),!0,!0,!0)}while(HEAPU32[e>>>2>>>0])}__emscripten_fs_load_embedded_files.sig="vp";var POINTER_SIZE=4;function getNativeTypeSize(e){switch(e){case"i1":case"i8":case"u8":return 1;case"i16":case"u16":return 2;case"i32":case"u32":return 4;case"i64":case"u64":return 8;case"float":return 4;case"double":return 8;default:{if(e[e.length-1]==="*")return POINTER_SIZE;if(e[0]==="i"){let t=Number(e.substr(1));return assert(t%8===0,"getNativeTypeSize invalid bits ".concat(t,", ").concat(e," type")),t/8}return 0}}}var STACK_SIZE=1048576,STACK_ALIGN=16,ASSERTIONS=0,cwrap=(e,t,r,n)=>{var a=!r||r.every(l=>l==="number"||l==="boolean"),o=t!=="string";return o&&a&&!n?getCFunc(e):(...l)=>ccall(e,t,r,l,n)},removeFunction=e=>{functionsInTableMap.delete(getWasmTableEntry(e)),setWasmTableEntry(e,null),freeTableIndexes.push(e)},_emscripten_math_cbrt=Math.cbrt;_emscripten_math_cbrt.sig="dd";var _emscripten_math_pow=Math.pow;_emscripten_math_pow.sig="ddd";var _emscripten_math_random=Math.random;_emscripten_math_random.sig="d";var _emscripten_math_sign=Math.sign;_emscripten_math_sign.sig="dd";var _emscripten_math_sqrt=Math.sqrt;_emscripten_math_sqrt.sig="dd";var _emscripten_math_exp=Math.exp;_emscripten_math_exp.sig="dd";var _emscripten_math_expm1=Math.expm1;_emscripten_math_expm1.sig="dd";var _emscripten_math_fmod=(e,t)=>e%t;_emscripten_math_fmod.sig="ddd";var _emscripten_math_log=Math.log;_emscripten_math_log.sig="dd";var _emscripten_math_log1p=Math.log1p;_emscripten_math_log1p.sig="dd";var _emscripten_math_log10=Math.log10;_emscripten_math_log10.sig="dd";var _emscripten_math_log2=Math.log2;_emscripten_math_log2.sig="dd";var _emscripten_math_round=Math.round;_emscripten_math_round.sig="dd";var _emscripten_math_acos=Math.acos;_emscripten_math_acos.sig="dd";var _emscripten_math_acosh=Math.acosh;_emscripten_math_acosh.sig="dd";var _emscripten_math_asin=Math.asin;_emscripten_math_asin.sig="dd";var _emscripten_math_asinh=Math.asinh;_emscripten_math_asinh.sig="dd";var _emscripten_math_atan=Math.atan;_emscripten_math_atan.sig="dd";var _emscripten_math_atanh=Math.atanh;_emscripten_math_atanh.sig="dd";var _emscripten_math_atan2=Math.atan2;_emscripten_math_atan2.sig="ddd";var _emscripten_math_cos=Math.cos;_emscripten_math_cos.sig="dd";var _emscripten_math_cosh=Math.cosh;_emscripten_math_cosh.sig="dd";function _emscripten_math_hypot(e,t){t>>>=0;for(var r=[],n=0;n<e;++n)r.push(HEAPF64[t+n*8>>>3>>>0]);return Math.hypot(...r)}_emscripten_math_hypot.sig="dip";var _emscripten_math_sin=Math.sin;_emscripten_math_sin.sig="dd";var _emscripten_math_sinh=Math.sinh;_emscripten_math_sinh.sig="dd";var _emscripten_math_tan=Math.tan;_emscripten_math_tan.sig="dd";var _emscripten_math_tanh=Math.tanh;_emscripten_math_tanh.sig="dd";function intArrayToString(e){for(var t=[],r=0;r<e.length;r++){var n=e[r];n>255&&(n&=255),t.push(String.fromCharCode(n))}return t.join("")}var AsciiToString=e=>{e>>>=0;for(var t="";;){var r=HEAPU8[e++>>>0];if(!r)return t;t+=String.fromCharCode(r)}},JSEvents={removeAllEventListeners(){for(;JSEvents.eventHandlers.length;)JSEvents._removeHandler(JSEvents.eventHandlers.length-1);JSEvents.deferredCalls=[]},inEventHandler:0,deferredCalls:[],deferCall(e,t,r){function n(o,l){if(o.length!=l.length)return!1;for(var u in o)if(o[u]!=l[u])return!1;return!0}for(var a of JSEvents.deferredCalls)if(a.targetFunction==e&&n(a.argsList,r))return;JSEvents.deferredCalls.push({targetFunction:e,precedence:t,argsList:r}),JSEvents.deferredCalls.sort((o,l)=>o.precedence<l.precedence)},removeDeferredCalls(e){JSEvents.deferredCalls=JSEvents.deferredCalls.filter(t=>t.targetFunction!=e)},canPerformEventHandlerRequests(){return navigator.userActivation?navigator.userActivation.isActive:JSEvents.inEventHandler&&JSEvents.currentEventHandler.allowsDeferredCalls},runDeferredCalls(){if(JSEvents.canPerformEventHandlerRequests()){var e=JSEvents.deferredCalls;JSEvents.deferredCalls=[];for(var t of e)t.targetFunction(...t.argsList)}},eventHandlers:[],removeAllHandlersOnTarget:(e,t)=>{for(var r=0;r<JSEvents.eventHandlers.length;++r)JSEvents.eventHandlers[r].target==e&&(!t||t==JSEvents.eventHandlers[r].eventTypeString)&&JSEvents._removeHandler(r--)},_removeHandler(e){var t=JSEvents.eventHandlers[e];t.target.removeEventListener(t.eventTypeString,t.eventListenerFunc,t.useCapture),JSEvents.eventHandlers.splice(e,1)},registerOrRemoveHandler(e){if(!e.target)return-4;if(e.callbackfunc)e.eventListenerFunc=function(r){++JSEvents.inEventHandler,JSEvents.currentEventHandler=e,JSEvents.runDeferredCalls(),e.handlerFunc(r),JSEvents.runDeferredCalls(),--JSEvents.inEventHandler},e.target.addEventListener(e.eventTypeString,e.eventListenerFunc,e.useCapture),JSEvents.eventHandlers.push(e);else for(var t=0;t<JSEvents.eventHandlers.length;++t)JSEvents.eventHandlers[t].target==e.target&&JSEvents.eventHandlers[t].eventTypeString==e.eventTypeString&&JSEvents._removeHandler(t--);return 0},getNodeNameForTarget(e){return e?e==window?"#window":e==screen?"#screen":(e==null?void 0:e.nodeName)||"":""},fullscreenEnabled(){return document.fullscreenEnabled||document.webkitFullscreenEnabled}},maybeCStringToJsString=e=>e>2?UTF8ToString(e):e,specialHTMLTargets=[0,typeof document<"u"?document:0,typeof window<"u"?window:0],findEventTarget=e=>{e=maybeCStringToJsString(e);var t=specialHTMLTargets[e]||(typeof document<"u"?document.querySelector(e):void 0);return t},registerKeyEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.keyEvent||(JSEvents.keyEvent=_malloc(160));var u=d=>{var f=JSEvents.keyEvent;HEAPF64[f>>>3>>>0]=d.timeStamp;var p=f>>>2;HEAP32[p+2>>>0]=d.location,HEAP8[f+12>>>0]=d.ctrlKey,HEAP8[f+13>>>0]=d.shiftKey,HEAP8[f+14>>>0]=d.altKey,HEAP8[f+15>>>0]=d.metaKey,HEAP8[f+16>>>0]=d.repeat,HEAP32[p+5>>>0]=d.charCode,HEAP32[p+6>>>0]=d.keyCode,HEAP32[p+7>>>0]=d.which,stringToUTF8(d.key||"",f+32,32),stringToUTF8(d.code||"",f+64,32),stringToUTF8(d.char||"",f+96,32),stringToUTF8(d.locale||"",f+128,32),getWasmTableEntry(n)(a,f,t)&&d.preventDefault()},_={target:findEventTarget(e),eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)},findCanvasEventTarget=findEventTarget;function _emscripten_set_keypress_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerKeyEventCallback(e,t,r,n,1,"keypress",a)}_emscripten_set_keypress_callback_on_thread.sig="ippipp";function _emscripten_set_keydown_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerKeyEventCallback(e,t,r,n,2,"keydown",a)}_emscripten_set_keydown_callback_on_thread.sig="ippipp";function _emscripten_set_keyup_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerKeyEventCallback(e,t,r,n,3,"keyup",a)}_emscripten_set_keyup_callback_on_thread.sig="ippipp";var getBoundingClientRect=e=>specialHTMLTargets.indexOf(e)<0?e.getBoundingClientRect():{left:0,top:0},fillMouseEventData=(e,t,r)=>{HEAPF64[e>>>3>>>0]=t.timeStamp;var n=e>>>2;HEAP32[n+2>>>0]=t.screenX,HEAP32[n+3>>>0]=t.screenY,HEAP32[n+4>>>0]=t.clientX,HEAP32[n+5>>>0]=t.clientY,HEAP8[e+24>>>0]=t.ctrlKey,HEAP8[e+25>>>0]=t.shiftKey,HEAP8[e+26>>>0]=t.altKey,HEAP8[e+27>>>0]=t.metaKey,HEAP16[n*2+14>>>0]=t.button,HEAP16[n*2+15>>>0]=t.buttons,HEAP32[n+8>>>0]=t.movementX,HEAP32[n+9>>>0]=t.movementY;var a=getBoundingClientRect(r);HEAP32[n+10>>>0]=t.clientX-(a.left|0),HEAP32[n+11>>>0]=t.clientY-(a.top|0)},registerMouseEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.mouseEvent||(JSEvents.mouseEvent=_malloc(64)),e=findEventTarget(e);var u=(d=event)=>{fillMouseEventData(JSEvents.mouseEvent,d,e),getWasmTableEntry(n)(a,JSEvents.mouseEvent,t)&&d.preventDefault()},_={target:e,allowsDeferredCalls:o!="mousemove"&&o!="mouseenter"&&o!="mouseleave",eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_click_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerMouseEventCallback(e,t,r,n,4,"click",a)}_emscripten_set_click_callback_on_thread.sig="ippipp";function _emscripten_set_mousedown_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerMouseEventCallback(e,t,r,n,5,"mousedown",a)}_emscripten_set_mousedown_callback_on_thread.sig="ippipp";function _emscripten_set_mouseup_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerMouseEventCallback(e,t,r,n,6,"mouseup",a)}_emscripten_set_mouseup_callback_on_thread.sig="ippipp";function _emscripten_set_dblclick_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerMouseEventCallback(e,t,r,n,7,"dblclick",a)}_emscripten_set_dblclick_callback_on_thread.sig="ippipp";function _emscripten_set_mousemove_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerMouseEventCallback(e,t,r,n,8,"mousemove",a)}_emscripten_set_mousemove_callback_on_thread.sig="ippipp";function _emscripten_set_mouseenter_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerMouseEventCallback(e,t,r,n,33,"mouseenter",a)}_emscripten_set_mouseenter_callback_on_thread.sig="ippipp";function _emscripten_set_mouseleave_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerMouseEventCallback(e,t,r,n,34,"mouseleave",a)}_emscripten_set_mouseleave_callback_on_thread.sig="ippipp";function _emscripten_set_mouseover_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerMouseEventCallback(e,t,r,n,35,"mouseover",a)}_emscripten_set_mouseover_callback_on_thread.sig="ippipp";function _emscripten_set_mouseout_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerMouseEventCallback(e,t,r,n,36,"mouseout",a)}_emscripten_set_mouseout_callback_on_thread.sig="ippipp";function _emscripten_get_mouse_status(e){return e>>>=0,JSEvents.mouseEvent?(HEAP8.set(HEAP8.subarray(JSEvents.mouseEvent>>>0,JSEvents.mouseEvent+64>>>0),e>>>0),0):-7}_emscripten_get_mouse_status.sig="ip";var registerWheelEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.wheelEvent||(JSEvents.wheelEvent=_malloc(96));var u=(d=event)=>{var f=JSEvents.wheelEvent;fillMouseEventData(f,d,e),HEAPF64[f+64>>>3>>>0]=d.deltaX,HEAPF64[f+72>>>3>>>0]=d.deltaY,HEAPF64[f+80>>>3>>>0]=d.deltaZ,HEAP32[f+88>>>2>>>0]=d.deltaMode,getWasmTableEntry(n)(a,f,t)&&d.preventDefault()},_={target:e,allowsDeferredCalls:!0,eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_wheel_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,e=findEventTarget(e),e?typeof e.onwheel<"u"?registerWheelEventCallback(e,t,r,n,9,"wheel",a):-1:-4}_emscripten_set_wheel_callback_on_thread.sig="ippipp";var registerUiEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.uiEvent||(JSEvents.uiEvent=_malloc(36)),e=findEventTarget(e);var u=(d=event)=>{if(d.target==e){var f=document.body;if(f){var p=JSEvents.uiEvent;HEAP32[p>>>2>>>0]=0,HEAP32[p+4>>>2>>>0]=f.clientWidth,HEAP32[p+8>>>2>>>0]=f.clientHeight,HEAP32[p+12>>>2>>>0]=innerWidth,HEAP32[p+16>>>2>>>0]=innerHeight,HEAP32[p+20>>>2>>>0]=outerWidth,HEAP32[p+24>>>2>>>0]=outerHeight,HEAP32[p+28>>>2>>>0]=pageXOffset|0,HEAP32[p+32>>>2>>>0]=pageYOffset|0,getWasmTableEntry(n)(a,p,t)&&d.preventDefault()}}},_={target:e,eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_resize_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerUiEventCallback(e,t,r,n,10,"resize",a)}_emscripten_set_resize_callback_on_thread.sig="ippipp";function _emscripten_set_scroll_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerUiEventCallback(e,t,r,n,11,"scroll",a)}_emscripten_set_scroll_callback_on_thread.sig="ippipp";var registerFocusEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.focusEvent||(JSEvents.focusEvent=_malloc(256));var u=(d=event)=>{var f=JSEvents.getNodeNameForTarget(d.target),p=d.target.id?d.target.id:"",m=JSEvents.focusEvent;stringToUTF8(f,m+0,128),stringToUTF8(p,m+128,128),getWasmTableEntry(n)(a,m,t)&&d.preventDefault()},_={target:findEventTarget(e),eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_blur_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerFocusEventCallback(e,t,r,n,12,"blur",a)}_emscripten_set_blur_callback_on_thread.sig="ippipp";function _emscripten_set_focus_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerFocusEventCallback(e,t,r,n,13,"focus",a)}_emscripten_set_focus_callback_on_thread.sig="ippipp";function _emscripten_set_focusin_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerFocusEventCallback(e,t,r,n,14,"focusin",a)}_emscripten_set_focusin_callback_on_thread.sig="ippipp";function _emscripten_set_focusout_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerFocusEventCallback(e,t,r,n,15,"focusout",a)}_emscripten_set_focusout_callback_on_thread.sig="ippipp";var fillDeviceOrientationEventData=(e,t,r)=>{HEAPF64[e>>>3>>>0]=t.alpha,HEAPF64[e+8>>>3>>>0]=t.beta,HEAPF64[e+16>>>3>>>0]=t.gamma,HEAP8[e+24>>>0]=t.absolute},registerDeviceOrientationEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.deviceOrientationEvent||(JSEvents.deviceOrientationEvent=_malloc(32));var u=(d=event)=>{fillDeviceOrientationEventData(JSEvents.deviceOrientationEvent,d,e),getWasmTableEntry(n)(a,JSEvents.deviceOrientationEvent,t)&&d.preventDefault()},_={target:findEventTarget(e),eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_deviceorientation_callback_on_thread(e,t,r,n){return e>>>=0,r>>>=0,n>>>=0,registerDeviceOrientationEventCallback(2,e,t,r,16,"deviceorientation",n)}_emscripten_set_deviceorientation_callback_on_thread.sig="ipipp";function _emscripten_get_deviceorientation_status(e){return e>>>=0,JSEvents.deviceOrientationEvent?(HEAP32.set(HEAP32.subarray(JSEvents.deviceOrientationEvent>>>0,32),e>>>0),0):-7}_emscripten_get_deviceorientation_status.sig="ip";var fillDeviceMotionEventData=(e,t,r)=>{var n=0,a=t.acceleration;n|=a&&1;var o=t.accelerationIncludingGravity;n|=o&&2;var l=t.rotationRate;n|=l&&4,a=a||{},o=o||{},l=l||{},HEAPF64[e>>>3>>>0]=a.x,HEAPF64[e+8>>>3>>>0]=a.y,HEAPF64[e+16>>>3>>>0]=a.z,HEAPF64[e+24>>>3>>>0]=o.x,HEAPF64[e+32>>>3>>>0]=o.y,HEAPF64[e+40>>>3>>>0]=o.z,HEAPF64[e+48>>>3>>>0]=l.alpha,HEAPF64[e+56>>>3>>>0]=l.beta,HEAPF64[e+64>>>3>>>0]=l.gamma},registerDeviceMotionEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.deviceMotionEvent||(JSEvents.deviceMotionEvent=_malloc(80));var u=(d=event)=>{fillDeviceMotionEventData(JSEvents.deviceMotionEvent,d,e),getWasmTableEntry(n)(a,JSEvents.deviceMotionEvent,t)&&d.preventDefault()},_={target:findEventTarget(e),eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_devicemotion_callback_on_thread(e,t,r,n){return e>>>=0,r>>>=0,n>>>=0,registerDeviceMotionEventCallback(2,e,t,r,17,"devicemotion",n)}_emscripten_set_devicemotion_callback_on_thread.sig="ipipp";function _emscripten_get_devicemotion_status(e){return e>>>=0,JSEvents.deviceMotionEvent?(HEAP32.set(HEAP32.subarray(JSEvents.deviceMotionEvent>>>0,80),e>>>0),0):-7}_emscripten_get_devicemotion_status.sig="ip";var screenOrientation=()=>{if(window.screen)return screen.orientation||screen.mozOrientation||screen.webkitOrientation},fillOrientationChangeEventData=e=>{var t=["portrait-primary","portrait-secondary","landscape-primary","landscape-secondary"],r=["portrait","portrait","landscape","landscape"],n=0,a=0,o=screenOrientation();typeof o=="object"?(n=t.indexOf(o.type),n<0&&(n=r.indexOf(o.type)),n>=0&&(n=1<<n),a=o.angle):a=window.orientation,HEAP32[e>>>2>>>0]=n,HEAP32[e+4>>>2>>>0]=a},registerOrientationChangeEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.orientationChangeEvent||(JSEvents.orientationChangeEvent=_malloc(8));var u=(d=event)=>{var f=JSEvents.orientationChangeEvent;fillOrientationChangeEventData(f),getWasmTableEntry(n)(a,f,t)&&d.preventDefault()},_={target:e,eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_orientationchange_callback_on_thread(e,t,r,n){return e>>>=0,r>>>=0,n>>>=0,!window.screen||!screen.orientation?-1:registerOrientationChangeEventCallback(screen.orientation,e,t,r,18,"change",n)}_emscripten_set_orientationchange_callback_on_thread.sig="ipipp";function _emscripten_get_orientation_status(e){return e>>>=0,!screenOrientation()&&typeof orientation>"u"?-1:(fillOrientationChangeEventData(e),0)}_emscripten_get_orientation_status.sig="ip";var _emscripten_lock_orientation=e=>{var t=[];e&1&&t.push("portrait-primary"),e&2&&t.push("portrait-secondary"),e&4&&t.push("landscape-primary"),e&8&&t.push("landscape-secondary");var r;if(screen.lockOrientation)r=screen.lockOrientation(t);else if(screen.mozLockOrientation)r=screen.mozLockOrientation(t);else if(screen.webkitLockOrientation)r=screen.webkitLockOrientation(t);else return-1;return r?0:-6};_emscripten_lock_orientation.sig="ii";var _emscripten_unlock_orientation=()=>{if(screen.unlockOrientation)screen.unlockOrientation();else if(screen.mozUnlockOrientation)screen.mozUnlockOrientation();else if(screen.webkitUnlockOrientation)screen.webkitUnlockOrientation();else return-1;return 0};_emscripten_unlock_orientation.sig="i";var fillFullscreenChangeEventData=e=>{var t=document.fullscreenElement||document.mozFullScreenElement||document.webkitFullscreenElement||document.msFullscreenElement,r=!!t;HEAP8[e>>>0]=r,HEAP8[e+1>>>0]=JSEvents.fullscreenEnabled();var n=r?t:JSEvents.previousFullscreenElement,a=JSEvents.getNodeNameForTarget(n),o=(n==null?void 0:n.id)||"";stringToUTF8(a,e+2,128),stringToUTF8(o,e+130,128),HEAP32[e+260>>>2>>>0]=n?n.clientWidth:0,HEAP32[e+264>>>2>>>0]=n?n.clientHeight:0,HEAP32[e+268>>>2>>>0]=screen.width,HEAP32[e+272>>>2>>>0]=screen.height,r&&(JSEvents.previousFullscreenElement=t)},registerFullscreenChangeEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.fullscreenChangeEvent||(JSEvents.fullscreenChangeEvent=_malloc(276));var u=(d=event)=>{var f=JSEvents.fullscreenChangeEvent;fillFullscreenChangeEventData(f),getWasmTableEntry(n)(a,f,t)&&d.preventDefault()},_={target:e,eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_fullscreenchange_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,JSEvents.fullscreenEnabled()?(e=findEventTarget(e),e?(registerFullscreenChangeEventCallback(e,t,r,n,19,"webkitfullscreenchange",a),registerFullscreenChangeEventCallback(e,t,r,n,19,"fullscreenchange",a)):-4):-1}_emscripten_set_fullscreenchange_callback_on_thread.sig="ippipp";function _emscripten_get_fullscreen_status(e){return e>>>=0,JSEvents.fullscreenEnabled()?(fillFullscreenChangeEventData(e),0):-1}_emscripten_get_fullscreen_status.sig="ip";function _emscripten_get_canvas_element_size(e,t,r){e>>>=0,t>>>=0,r>>>=0;var n=findCanvasEventTarget(e);if(!n)return-4;HEAP32[t>>>2>>>0]=n.width,HEAP32[r>>>2>>>0]=n.height}_emscripten_get_canvas_element_size.sig="ippp";var getCanvasElementSize=e=>{var t=stackSave(),r=stackAlloc(8),n=r+4,a=stringToUTF8OnStack(e.id),o=_emscripten_get_canvas_element_size(a,r,n),l=[HEAP32[r>>>2>>>0],HEAP32[n>>>2>>>0]];return stackRestore(t),l};function _emscripten_set_canvas_element_size(e,t,r){e>>>=0;var n=findCanvasEventTarget(e);return n?(n.width=t,n.height=r,0):-4}_emscripten_set_canvas_element_size.sig="ipii";var setCanvasElementSize=(e,t,r)=>{if(!e.controlTransferredOffscreen)e.width=t,e.height=r;else{var n=stackSave(),a=stringToUTF8OnStack(e.id);_emscripten_set_canvas_element_size(a,t,r),stackRestore(n)}},registerRestoreOldStyle=e=>{var t=getCanvasElementSize(e),r=t[0],n=t[1],a=e.style.width,o=e.style.height,l=e.style.backgroundColor,u=document.body.style.backgroundColor,_=e.style.paddingLeft,d=e.style.paddingRight,f=e.style.paddingTop,p=e.style.paddingBottom,m=e.style.marginLeft,h=e.style.marginRight,g=e.style.marginTop,v=e.style.marginBottom,y=document.body.style.margin,S=document.documentElement.style.overflow,w=document.body.scroll,D=e.style.imageRendering;function F(){var E=document.fullscreenElement||document.webkitFullscreenElement;E||(document.removeEventListener("fullscreenchange",F),document.removeEventListener("webkitfullscreenchange",F),setCanvasElementSize(e,r,n),e.style.width=a,e.style.height=o,e.style.backgroundColor=l,u||(document.body.style.backgroundColor="white"),document.body.style.backgroundColor=u,e.style.paddingLeft=_,e.style.paddingRight=d,e.style.paddingTop=f,e.style.paddingBottom=p,e.style.marginLeft=m,e.style.marginRight=h,e.style.marginTop=g,e.style.marginBottom=v,document.body.style.margin=y,document.documentElement.style.overflow=S,document.body.scroll=w,e.style.imageRendering=D,e.GLctxObject&&e.GLctxObject.GLctx.viewport(0,0,r,n),currentFullscreenStrategy.canvasResizedCallback&&getWasmTableEntry(currentFullscreenStrategy.canvasResizedCallback)(37,0,currentFullscreenStrategy.canvasResizedCallbackUserData))}return document.addEventListener("fullscreenchange",F),document.addEventListener("webkitfullscreenchange",F),F},setLetterbox=(e,t,r)=>{e.style.paddingLeft=e.style.paddingRight=r+"px",e.style.paddingTop=e.style.paddingBottom=t+"px"},JSEvents_resizeCanvasForFullscreen=(e,t)=>{var y,S;var r=registerRestoreOldStyle(e),n=t.softFullscreen?innerWidth:screen.width,a=t.softFullscreen?innerHeight:screen.height,o=getBoundingClientRect(e),l=o.width,u=o.height,_=getCanvasElementSize(e),d=_[0],f=_[1];if(t.scaleMode==3)setLetterbox(e,(a-u)/2,(n-l)/2),n=l,a=u;else if(t.scaleMode==2)if(n*f<d*a){var p=f*n/d;setLetterbox(e,(a-p)/2,0),a=p}else{var m=d*a/f;setLetterbox(e,0,(n-m)/2),n=m}(y=e.style).backgroundColor||(y.backgroundColor="black"),(S=document.body.style).backgroundColor||(S.backgroundColor="black"),e.style.width=n+"px",e.style.height=a+"px",t.filteringMode==1&&(e.style.imageRendering="optimizeSpeed",e.style.imageRendering="-moz-crisp-edges",e.style.imageRendering="-o-crisp-edges",e.style.imageRendering="-webkit-optimize-contrast",e.style.imageRendering="optimize-contrast",e.style.imageRendering="crisp-edges",e.style.imageRendering="pixelated");var h=t.canvasResolutionScaleMode==2?devicePixelRatio:1;if(t.canvasResolutionScaleMode!=0){var g=n*h|0,v=a*h|0;setCanvasElementSize(e,g,v),e.GLctxObject&&e.GLctxObject.GLctx.viewport(0,0,g,v)}return r},JSEvents_requestFullscreen=(e,t)=>{if((t.scaleMode!=0||t.canvasResolutionScaleMode!=0)&&JSEvents_resizeCanvasForFullscreen(e,t),e.requestFullscreen)e.requestFullscreen();else if(e.webkitRequestFullscreen)e.webkitRequestFullscreen(Element.ALLOW_KEYBOARD_INPUT);else return JSEvents.fullscreenEnabled()?-3:-1;return currentFullscreenStrategy=t,t.canvasResizedCallback&&getWasmTableEntry(t.canvasResizedCallback)(37,0,t.canvasResizedCallbackUserData),0},hideEverythingExceptGivenElement=e=>{for(var t=e,r=t.parentNode,n=[];t!=document.body;){for(var a=r.children,o=0;o<a.length;++o)a[o]!=t&&(n.push({node:a[o],displayState:a[o].style.display}),a[o].style.display="none");t=r,r=r.parentNode}return n},restoreHiddenElements=e=>{for(var t of e)t.node.style.display=t.displayState},currentFullscreenStrategy={},restoreOldWindowedStyle=null,softFullscreenResizeWebGLRenderTarget=()=>{var e=devicePixelRatio,t=currentFullscreenStrategy.canvasResolutionScaleMode==2,r=currentFullscreenStrategy.scaleMode==2,n=currentFullscreenStrategy.canvasResolutionScaleMode!=0,a=currentFullscreenStrategy.scaleMode==3,o=t?Math.round(innerWidth*e):innerWidth,l=t?Math.round(innerHeight*e):innerHeight,u=o,_=l,d=currentFullscreenStrategy.target,f=getCanvasElementSize(d),p=f[0],m=f[1],h;if(r&&(u*m<p*_?_=u*m/p|0:u*m>p*_&&(u=_*p/m|0),h=(l-_)/2|0),n&&(setCanvasElementSize(d,u,_),d.GLctxObject&&d.GLctxObject.GLctx.viewport(0,0,u,_)),t&&(h/=e,u/=e,_/=e,u=Math.round(u*1e4)/1e4,_=Math.round(_*1e4)/1e4,h=Math.round(h*1e4)/1e4),a){var g=(innerHeight-jstoi_q(d.style.height))/2,v=(innerWidth-jstoi_q(d.style.width))/2;setLetterbox(d,g,v)}else{d.style.width=u+"px",d.style.height=_+"px";var v=(innerWidth-u)/2;setLetterbox(d,h,v)}!a&&currentFullscreenStrategy.canvasResizedCallback&&getWasmTableEntry(currentFullscreenStrategy.canvasResizedCallback)(37,0,currentFullscreenStrategy.canvasResizedCallbackUserData)},doRequestFullscreen=(e,t)=>JSEvents.fullscreenEnabled()?(e=findEventTarget(e),e?!e.requestFullscreen&&!e.webkitRequestFullscreen?-3:JSEvents.canPerformEventHandlerRequests()?JSEvents_requestFullscreen(e,t):t.deferUntilInEventHandler?(JSEvents.deferCall(JSEvents_requestFullscreen,1,[e,t]),1):-2:-4):-1;function _emscripten_request_fullscreen(e,t){e>>>=0;var r={scaleMode:0,canvasResolutionScaleMode:0,filteringMode:0,deferUntilInEventHandler:t,canvasResizedCallbackTargetThread:2};return doRequestFullscreen(e,r)}_emscripten_request_fullscreen.sig="ipi";function _emscripten_request_fullscreen_strategy(e,t,r){e>>>=0,r>>>=0;var n={scaleMode:HEAP32[r>>>2>>>0],canvasResolutionScaleMode:HEAP32[r+4>>>2>>>0],filteringMode:HEAP32[r+8>>>2>>>0],deferUntilInEventHandler:t,canvasResizedCallback:HEAP32[r+12>>>2>>>0],canvasResizedCallbackUserData:HEAP32[r+16>>>2>>>0]};return doRequestFullscreen(e,n)}_emscripten_request_fullscreen_strategy.sig="ipip";function _emscripten_enter_soft_fullscreen(e,t){if(e>>>=0,t>>>=0,e=findEventTarget(e),!e)return-4;var r={scaleMode:HEAP32[t>>>2>>>0],canvasResolutionScaleMode:HEAP32[t+4>>>2>>>0],filteringMode:HEAP32[t+8>>>2>>>0],canvasResizedCallback:HEAP32[t+12>>>2>>>0],canvasResizedCallbackUserData:HEAP32[t+16>>>2>>>0],target:e,softFullscreen:!0},n=JSEvents_resizeCanvasForFullscreen(e,r);document.documentElement.style.overflow="hidden",document.body.scroll="no",document.body.style.margin="0px";var a=hideEverythingExceptGivenElement(e);function o(){n(),restoreHiddenElements(a),removeEventListener("resize",softFullscreenResizeWebGLRenderTarget),r.canvasResizedCallback&&getWasmTableEntry(r.canvasResizedCallback)(37,0,r.canvasResizedCallbackUserData),currentFullscreenStrategy=0}return restoreOldWindowedStyle=o,currentFullscreenStrategy=r,addEventListener("resize",softFullscreenResizeWebGLRenderTarget),r.canvasResizedCallback&&getWasmTableEntry(r.canvasResizedCallback)(37,0,r.canvasResizedCallbackUserData),0}_emscripten_enter_soft_fullscreen.sig="ipp";var _emscripten_exit_soft_fullscreen=()=>(restoreOldWindowedStyle==null||restoreOldWindowedStyle(),restoreOldWindowedStyle=null,0);_emscripten_exit_soft_fullscreen.sig="i";var _emscripten_exit_fullscreen=()=>{if(!JSEvents.fullscreenEnabled())return-1;JSEvents.removeDeferredCalls(JSEvents_requestFullscreen);var e=specialHTMLTargets[1];if(e.exitFullscreen)e.fullscreenElement&&e.exitFullscreen();else if(e.webkitExitFullscreen)e.webkitFullscreenElement&&e.webkitExitFullscreen();else return-1;return 0};_emscripten_exit_fullscreen.sig="i";var fillPointerlockChangeEventData=e=>{var t=document.pointerLockElement||document.mozPointerLockElement||document.webkitPointerLockElement||document.msPointerLockElement,r=!!t;HEAP8[e>>>0]=r;var n=JSEvents.getNodeNameForTarget(t),a=(t==null?void 0:t.id)||"";stringToUTF8(n,e+1,128),stringToUTF8(a,e+129,128)},registerPointerlockChangeEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.pointerlockChangeEvent||(JSEvents.pointerlockChangeEvent=_malloc(257));var u=(d=event)=>{var f=JSEvents.pointerlockChangeEvent;fillPointerlockChangeEventData(f),getWasmTableEntry(n)(a,f,t)&&d.preventDefault()},_={target:e,eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_pointerlockchange_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,!document||!document.body||!document.body.requestPointerLock&&!document.body.mozRequestPointerLock&&!document.body.webkitRequestPointerLock&&!document.body.msRequestPointerLock?-1:(e=findEventTarget(e),e?(registerPointerlockChangeEventCallback(e,t,r,n,20,"mozpointerlockchange",a),registerPointerlockChangeEventCallback(e,t,r,n,20,"webkitpointerlockchange",a),registerPointerlockChangeEventCallback(e,t,r,n,20,"mspointerlockchange",a),registerPointerlockChangeEventCallback(e,t,r,n,20,"pointerlockchange",a)):-4)}_emscripten_set_pointerlockchange_callback_on_thread.sig="ippipp";var registerPointerlockErrorEventCallback=(e,t,r,n,a,o,l)=>{var u=(d=event)=>{getWasmTableEntry(n)(a,0,t)&&d.preventDefault()},_={target:e,eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_pointerlockerror_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,!document||!document.body.requestPointerLock&&!document.body.mozRequestPointerLock&&!document.body.webkitRequestPointerLock&&!document.body.msRequestPointerLock?-1:(e=findEventTarget(e),e?(registerPointerlockErrorEventCallback(e,t,r,n,38,"mozpointerlockerror",a),registerPointerlockErrorEventCallback(e,t,r,n,38,"webkitpointerlockerror",a),registerPointerlockErrorEventCallback(e,t,r,n,38,"mspointerlockerror",a),registerPointerlockErrorEventCallback(e,t,r,n,38,"pointerlockerror",a)):-4)}_emscripten_set_pointerlockerror_callback_on_thread.sig="ippipp";function _emscripten_get_pointerlock_status(e){return e>>>=0,e&&fillPointerlockChangeEventData(e),!document.body||!document.body.requestPointerLock&&!document.body.mozRequestPointerLock&&!document.body.webkitRequestPointerLock&&!document.body.msRequestPointerLock?-1:0}_emscripten_get_pointerlock_status.sig="ip";var requestPointerLock=e=>{if(e.requestPointerLock)e.requestPointerLock();else return document.body.requestPointerLock?-3:-1;return 0};function _emscripten_request_pointerlock(e,t){return e>>>=0,e=findEventTarget(e),e?e.requestPointerLock?JSEvents.canPerformEventHandlerRequests()?requestPointerLock(e):t?(JSEvents.deferCall(requestPointerLock,2,[e]),1):-2:-1:-4}_emscripten_request_pointerlock.sig="ipi";var _emscripten_exit_pointerlock=()=>{if(JSEvents.removeDeferredCalls(requestPointerLock),document.exitPointerLock)document.exitPointerLock();else return-1;return 0};_emscripten_exit_pointerlock.sig="i";var _emscripten_vibrate=e=>navigator.vibrate?(navigator.vibrate(e),0):-1;_emscripten_vibrate.sig="ii";function _emscripten_vibrate_pattern(e,t){if(e>>>=0,!navigator.vibrate)return-1;for(var r=[],n=0;n<t;++n){var a=HEAP32[e+n*4>>>2>>>0];r.push(a)}return navigator.vibrate(r),0}_emscripten_vibrate_pattern.sig="ipi";var fillVisibilityChangeEventData=e=>{var t=["hidden","visible","prerender","unloaded"],r=t.indexOf(document.visibilityState);HEAP8[e>>>0]=document.hidden,HEAP32[e+4>>>2>>>0]=r},registerVisibilityChangeEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.visibilityChangeEvent||(JSEvents.visibilityChangeEvent=_malloc(8));var u=(d=event)=>{var f=JSEvents.visibilityChangeEvent;fillVisibilityChangeEventData(f),getWasmTableEntry(n)(a,f,t)&&d.preventDefault()},_={target:e,eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_visibilitychange_callback_on_thread(e,t,r,n){return e>>>=0,r>>>=0,n>>>=0,specialHTMLTargets[1]?registerVisibilityChangeEventCallback(specialHTMLTargets[1],e,t,r,21,"visibilitychange",n):-4}_emscripten_set_visibilitychange_callback_on_thread.sig="ipipp";function _emscripten_get_visibility_status(e){return e>>>=0,typeof document.visibilityState>"u"&&typeof document.hidden>"u"?-1:(fillVisibilityChangeEventData(e),0)}_emscripten_get_visibility_status.sig="ip";var registerTouchEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.touchEvent||(JSEvents.touchEvent=_malloc(1552)),e=findEventTarget(e);var u=d=>{var f,p={},m=d.touches;for(let w of m)w.isChanged=w.onTarget=0,p[w.identifier]=w;for(let w of d.changedTouches)w.isChanged=1,p[w.identifier]=w;for(let w of d.targetTouches)p[w.identifier].onTarget=1;var h=JSEvents.touchEvent;HEAPF64[h>>>3>>>0]=d.timeStamp,HEAP8[h+12>>>0]=d.ctrlKey,HEAP8[h+13>>>0]=d.shiftKey,HEAP8[h+14>>>0]=d.altKey,HEAP8[h+15>>>0]=d.metaKey;var g=h+16,v=getBoundingClientRect(e),y=0;for(let w of Object.values(p)){var S=g>>>2;if(HEAP32[S+0>>>0]=w.identifier,HEAP32[S+1>>>0]=w.screenX,HEAP32[S+2>>>0]=w.screenY,HEAP32[S+3>>>0]=w.clientX,HEAP32[S+4>>>0]=w.clientY,HEAP32[S+5>>>0]=w.pageX,HEAP32[S+6>>>0]=w.pageY,HEAP8[g+28>>>0]=w.isChanged,HEAP8[g+29>>>0]=w.onTarget,HEAP32[S+8>>>0]=w.clientX-(v.left|0),HEAP32[S+9>>>0]=w.clientY-(v.top|0),g+=48,++y>31)break}HEAP32[h+8>>>2>>>0]=y,getWasmTableEntry(n)(a,h,t)&&d.preventDefault()},_={target:e,allowsDeferredCalls:o=="touchstart"||o=="touchend",eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_touchstart_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerTouchEventCallback(e,t,r,n,22,"touchstart",a)}_emscripten_set_touchstart_callback_on_thread.sig="ippipp";function _emscripten_set_touchend_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerTouchEventCallback(e,t,r,n,23,"touchend",a)}_emscripten_set_touchend_callback_on_thread.sig="ippipp";function _emscripten_set_touchmove_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerTouchEventCallback(e,t,r,n,24,"touchmove",a)}_emscripten_set_touchmove_callback_on_thread.sig="ippipp";function _emscripten_set_touchcancel_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerTouchEventCallback(e,t,r,n,25,"touchcancel",a)}_emscripten_set_touchcancel_callback_on_thread.sig="ippipp";var fillGamepadEventData=(e,t)=>{HEAPF64[e>>>3>>>0]=t.timestamp;for(var r=0;r<t.axes.length;++r)HEAPF64[e+r*8+16>>>3>>>0]=t.axes[r];for(var r=0;r<t.buttons.length;++r)typeof t.buttons[r]=="object"?HEAPF64[e+r*8+528>>>3>>>0]=t.buttons[r].value:HEAPF64[e+r*8+528>>>3>>>0]=t.buttons[r];for(var r=0;r<t.buttons.length;++r)typeof t.buttons[r]=="object"?HEAP8[e+r+1040>>>0]=t.buttons[r].pressed:HEAP8[e+r+1040>>>0]=t.buttons[r]==1;HEAP8[e+1104>>>0]=t.connected,HEAP32[e+1108>>>2>>>0]=t.index,HEAP32[e+8>>>2>>>0]=t.axes.length,HEAP32[e+12>>>2>>>0]=t.buttons.length,stringToUTF8(t.id,e+1112,64),stringToUTF8(t.mapping,e+1176,64)},registerGamepadEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.gamepadEvent||(JSEvents.gamepadEvent=_malloc(1240));var u=(d=event)=>{var f=JSEvents.gamepadEvent;fillGamepadEventData(f,d.gamepad),getWasmTableEntry(n)(a,f,t)&&d.preventDefault()},_={target:findEventTarget(e),allowsDeferredCalls:!0,eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)},_emscripten_sample_gamepad_data=()=>{try{if(navigator.getGamepads)return(JSEvents.lastGamepadState=navigator.getGamepads())?0:-1}catch(e){navigator.getGamepads=null}return-1};_emscripten_sample_gamepad_data.sig="i";function _emscripten_set_gamepadconnected_callback_on_thread(e,t,r,n){return e>>>=0,r>>>=0,n>>>=0,_emscripten_sample_gamepad_data()?-1:registerGamepadEventCallback(2,e,t,r,26,"gamepadconnected",n)}_emscripten_set_gamepadconnected_callback_on_thread.sig="ipipp";function _emscripten_set_gamepaddisconnected_callback_on_thread(e,t,r,n){return e>>>=0,r>>>=0,n>>>=0,_emscripten_sample_gamepad_data()?-1:registerGamepadEventCallback(2,e,t,r,27,"gamepaddisconnected",n)}_emscripten_set_gamepaddisconnected_callback_on_thread.sig="ipipp";var _emscripten_get_num_gamepads=()=>JSEvents.lastGamepadState.length;_emscripten_get_num_gamepads.sig="i";function _emscripten_get_gamepad_status(e,t){return t>>>=0,e<0||e>=JSEvents.lastGamepadState.length?-5:JSEvents.lastGamepadState[e]?(fillGamepadEventData(t,JSEvents.lastGamepadState[e]),0):-7}_emscripten_get_gamepad_status.sig="iip";var registerBeforeUnloadEventCallback=(e,t,r,n,a,o)=>{var l=(_=event)=>{var d=getWasmTableEntry(n)(a,0,t);if(d&&(d=UTF8ToString(d)),d)return _.preventDefault(),_.returnValue=d,d},u={target:findEventTarget(e),eventTypeString:o,callbackfunc:n,handlerFunc:l,useCapture:r};return JSEvents.registerOrRemoveHandler(u)};function _emscripten_set_beforeunload_callback_on_thread(e,t,r){return e>>>=0,t>>>=0,r>>>=0,typeof onbeforeunload>"u"?-1:r!==1?-5:registerBeforeUnloadEventCallback(2,e,!0,t,28,"beforeunload")}_emscripten_set_beforeunload_callback_on_thread.sig="ippp";var fillBatteryEventData=(e,t)=>{HEAPF64[e>>>3>>>0]=t.chargingTime,HEAPF64[e+8>>>3>>>0]=t.dischargingTime,HEAPF64[e+16>>>3>>>0]=t.level,HEAP8[e+24>>>0]=t.charging},battery=()=>navigator.battery||navigator.mozBattery||navigator.webkitBattery,registerBatteryEventCallback=(e,t,r,n,a,o,l)=>{JSEvents.batteryEvent||(JSEvents.batteryEvent=_malloc(32));var u=(d=event)=>{var f=JSEvents.batteryEvent;fillBatteryEventData(f,battery()),getWasmTableEntry(n)(a,f,t)&&d.preventDefault()},_={target:findEventTarget(e),eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};return JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_batterychargingchange_callback_on_thread(e,t,r){return e>>>=0,t>>>=0,r>>>=0,battery()?registerBatteryEventCallback(battery(),e,!0,t,29,"chargingchange",r):-1}_emscripten_set_batterychargingchange_callback_on_thread.sig="ippp";function _emscripten_set_batterylevelchange_callback_on_thread(e,t,r){return e>>>=0,t>>>=0,r>>>=0,battery()?registerBatteryEventCallback(battery(),e,!0,t,30,"levelchange",r):-1}_emscripten_set_batterylevelchange_callback_on_thread.sig="ippp";function _emscripten_get_battery_status(e){return e>>>=0,battery()?(fillBatteryEventData(e,battery()),0):-1}_emscripten_get_battery_status.sig="ip";function _emscripten_set_element_css_size(e,t,r){return e>>>=0,e=findEventTarget(e),e?(e.style.width=t+"px",e.style.height=r+"px",0):-4}_emscripten_set_element_css_size.sig="ipdd";function _emscripten_get_element_css_size(e,t,r){if(e>>>=0,t>>>=0,r>>>=0,e=findEventTarget(e),!e)return-4;var n=getBoundingClientRect(e);return HEAPF64[t>>>3>>>0]=n.width,HEAPF64[r>>>3>>>0]=n.height,0}_emscripten_get_element_css_size.sig="ippp";var _emscripten_html5_remove_all_event_listeners=()=>JSEvents.removeAllEventListeners();_emscripten_html5_remove_all_event_listeners.sig="v";var _emscripten_request_animation_frame=function(e,t){return e>>>=0,t>>>=0,requestAnimationFrame(r=>getWasmTableEntry(e)(r,t))};_emscripten_request_animation_frame.sig="ipp";var _emscripten_cancel_animation_frame=e=>cancelAnimationFrame(e);_emscripten_cancel_animation_frame.sig="vi";function _emscripten_request_animation_frame_loop(e,t){e>>>=0,t>>>=0;function r(n){getWasmTableEntry(e)(n,t)&&requestAnimationFrame(r)}return requestAnimationFrame(r)}_emscripten_request_animation_frame_loop.sig="vpp";var _emscripten_performance_now=()=>performance.now();_emscripten_performance_now.sig="d";var _emscripten_get_device_pixel_ratio=()=>typeof devicePixelRatio=="number"&&devicePixelRatio||1;_emscripten_get_device_pixel_ratio.sig="d";function _emscripten_get_callstack(e,t,r){t>>>=0;var n=getCallstack(e);if(!t||r<=0)return lengthBytesUTF8(n)+1;var a=stringToUTF8(n,t,r);return a+1}_emscripten_get_callstack.sig="iipi";var convertFrameToPC=e=>(abort("Cannot use convertFrameToPC (needed by __builtin_return_address) without -sUSE_OFFSET_CONVERTER"),0);function _emscripten_return_address(e){var t=jsStackTrace().split("\n");t[0]=="Error"&&t.shift();var r=t[e+3];return convertFrameToPC(r)}_emscripten_return_address.sig="pi";var UNWIND_CACHE={},saveInUnwindCache=e=>{e.forEach(t=>{var r=convertFrameToPC(t);r&&(UNWIND_CACHE[r]=t)})};function _emscripten_stack_snapshot(){var e=jsStackTrace().split("\n");return e[0]=="Error"&&e.shift(),saveInUnwindCache(e),UNWIND_CACHE.last_addr=convertFrameToPC(e[3]),UNWIND_CACHE.last_stack=e,UNWIND_CACHE.last_addr}_emscripten_stack_snapshot.sig="p";function _emscripten_stack_unwind_buffer(e,t,r){e>>>=0,t>>>=0;var n;UNWIND_CACHE.last_addr==e?n=UNWIND_CACHE.last_stack:(n=jsStackTrace().split("\n"),n[0]=="Error"&&n.shift(),saveInUnwindCache(n));for(var a=3;n[a]&&convertFrameToPC(n[a])!=e;)++a;for(var o=0;o<r&&n[o+a];++o)HEAP32[t+o*4>>>2>>>0]=convertFrameToPC(n[o+a]);return o}_emscripten_stack_unwind_buffer.sig="ippi";function _emscripten_pc_get_function(e){return e>>>=0,abort("Cannot use emscripten_pc_get_function without -sUSE_OFFSET_CONVERTER"),0}_emscripten_pc_get_function.sig="pp";var convertPCtoSourceLocation=e=>{if(UNWIND_CACHE.last_get_source_pc==e)return UNWIND_CACHE.last_source;var t,r;if(!r){var n=UNWIND_CACHE[e];if(!n)return null;(t=/\((.*):(\d+):(\d+)\)$/.exec(n))?r={file:t[1],line:t[2],column:t[3]}:(t=/@(.*):(\d+):(\d+)/.exec(n))&&(r={file:t[1],line:t[2],column:t[3]})}return UNWIND_CACHE.last_get_source_pc=e,UNWIND_CACHE.last_source=r,r};function _emscripten_pc_get_file(e){e>>>=0;var t=convertPCtoSourceLocation(e);return t?(_emscripten_pc_get_file.ret&&_free(_emscripten_pc_get_file.ret),_emscripten_pc_get_file.ret=stringToNewUTF8(t.file),_emscripten_pc_get_file.ret):0}_emscripten_pc_get_file.sig="pp";function _emscripten_pc_get_line(e){e>>>=0;var t=convertPCtoSourceLocation(e);return t?t.line:0}_emscripten_pc_get_line.sig="ip";function _emscripten_pc_get_column(e){e>>>=0;var t=convertPCtoSourceLocation(e);return t&&t.column||0}_emscripten_pc_get_column.sig="ip";var _sched_yield=()=>0;Module._sched_yield=_sched_yield,_sched_yield.sig="i";var checkWasiClock=e=>e==0||e==1||e==2||e==3;function _clock_time_get(e,t,r,n){var a=convertI32PairToI53Checked(t,r);if(n>>>=0,!checkWasiClock(e))return 28;var o;if(e===0)o=Date.now();else if(nowIsMonotonic)o=_emscripten_get_now();else return 52;var l=Math.round(o*1e3*1e3);return HEAP32[n>>>2>>>0]=l>>>0,HEAP32[n+4>>>2>>>0]=l/Math.pow(2,32)>>>0,0}_clock_time_get.sig="iiiip";function _clock_res_get(e,t){if(t>>>=0,!checkWasiClock(e))return 28;var r;if(e===0)r=1e6;else if(nowIsMonotonic)r=_emscripten_get_now_res();else return 52;return HEAP32[t>>>2>>>0]=r>>>0,HEAP32[t+4>>>2>>>0]=r/Math.pow(2,32)>>>0,0}_clock_res_get.sig="iip";var wasiRightsToMuslOFlags=e=>{if(e&2&&e&64)return 2;if(e&2)return 0;if(e&64)return 1;throw new FS.ErrnoError(28)},wasiOFlagsToMuslOFlags=e=>{var t=0;return e&1&&(t|=64),e&8&&(t|=512),e&2&&(t|=65536),e&4&&(t|=128),t},_emscripten_unwind_to_js_event_loop=()=>{throw"unwind"};_emscripten_unwind_to_js_event_loop.sig="v";var safeSetTimeout=(e,t)=>setTimeout(()=>{callUserCallback(e)},t),setImmediateWrapped=e=>{setImmediateWrapped.mapping||(setImmediateWrapped.mapping=[]);var t=setImmediateWrapped.mapping.length;return setImmediateWrapped.mapping[t]=setImmediate(()=>{setImmediateWrapped.mapping[t]=void 0,e()}),t},clearImmediateWrapped=e=>{clearImmediate(setImmediateWrapped.mapping[e]),setImmediateWrapped.mapping[e]=void 0},polyfillSetImmediate=()=>{},_emscripten_set_immediate=function(e,t){return e>>>=0,t>>>=0,emSetImmediate(()=>{callUserCallback(()=>getWasmTableEntry(e)(t))})};_emscripten_set_immediate.sig="ipp";var _emscripten_clear_immediate=e=>{emClearImmediate(e)};_emscripten_clear_immediate.sig="vi";var _emscripten_set_immediate_loop=function(e,t){e>>>=0,t>>>=0;function r(){callUserCallback(()=>{getWasmTableEntry(e)(t)&&emSetImmediate(r)})}emSetImmediate(r)};_emscripten_set_immediate_loop.sig="vpp";var _emscripten_set_timeout=function(e,t,r){return e>>>=0,r>>>=0,safeSetTimeout(()=>getWasmTableEntry(e)(r),t)};_emscripten_set_timeout.sig="ipdp";var _emscripten_clear_timeout=clearTimeout;_emscripten_clear_timeout.sig="vi";var _emscripten_set_timeout_loop=function(e,t,r){e>>>=0,r>>>=0;function n(){var a=_emscripten_get_now(),o=a+t;callUserCallback(()=>{getWasmTableEntry(e)(a,r)&&setTimeout(n,o-_emscripten_get_now())})}return setTimeout(n,0)};_emscripten_set_timeout_loop.sig="vpdp";var _emscripten_set_interval=function(e,t,r){return e>>>=0,r>>>=0,setInterval(()=>{callUserCallback(()=>getWasmTableEntry(e)(r))},t)};_emscripten_set_interval.sig="ipdp";var _emscripten_clear_interval=e=>{clearInterval(e)};_emscripten_clear_interval.sig="vi";var registerPostMainLoop=e=>{typeof MainLoop<"u"&&MainLoop.postMainLoop.push(e)},registerPreMainLoop=e=>{typeof MainLoop<"u"&&MainLoop.preMainLoop.push(e)};function _emscripten_get_main_loop_timing(e,t){e>>>=0,t>>>=0,e&&(HEAP32[e>>>2>>>0]=MainLoop.timingMode),t&&(HEAP32[t>>>2>>>0]=MainLoop.timingValue)}_emscripten_get_main_loop_timing.sig="vpp";function _emscripten_set_main_loop(e,t,r){e>>>=0;var n=getWasmTableEntry(e);setMainLoop(n,t,r)}_emscripten_set_main_loop.sig="vpii";var _emscripten_set_main_loop_arg=function(e,t,r,n){e>>>=0,t>>>=0;var a=()=>getWasmTableEntry(e)(t);setMainLoop(a,r,n,t)};_emscripten_set_main_loop_arg.sig="vppii";var _emscripten_cancel_main_loop=()=>{MainLoop.pause(),MainLoop.func=null};_emscripten_cancel_main_loop.sig="v";var _emscripten_pause_main_loop=()=>{MainLoop.pause()};_emscripten_pause_main_loop.sig="v";var _emscripten_resume_main_loop=()=>{MainLoop.resume()};_emscripten_resume_main_loop.sig="v";var __emscripten_push_main_loop_blocker=function(e,t,r){e>>>=0,t>>>=0,r>>>=0,MainLoop.queue.push({func:()=>{getWasmTableEntry(e)(t)},name:UTF8ToString(r),counted:!0}),MainLoop.updateStatus()};__emscripten_push_main_loop_blocker.sig="vppp";var __emscripten_push_uncounted_main_loop_blocker=function(e,t,r){e>>>=0,t>>>=0,r>>>=0,MainLoop.queue.push({func:()=>{getWasmTableEntry(e)(t)},name:UTF8ToString(r),counted:!1}),MainLoop.updateStatus()};__emscripten_push_uncounted_main_loop_blocker.sig="vppp";var _emscripten_set_main_loop_expected_blockers=e=>{MainLoop.expectedBlockers=e,MainLoop.remainingBlockers=e,MainLoop.updateStatus()};_emscripten_set_main_loop_expected_blockers.sig="vi";var idsToPromises=(e,t)=>{for(var r=[],n=0;n<t;n++){var a=HEAP32[e+n*4>>>2>>>0];r[n]=getPromise(a)}return r},makePromiseCallback=(e,t)=>r=>{var n=stackSave(),a=stackAlloc(POINTER_SIZE);HEAPU32[a>>>2>>>0]=0;try{var o=getWasmTableEntry(e)(a,t,r),l=HEAPU32[a>>>2>>>0]}catch(_){throw typeof _!="number"?0:_}finally{stackRestore(n)}switch(o){case 0:return l;case 1:return getPromise(l);case 2:var u=getPromise(l);return _emscripten_promise_destroy(l),u;case 3:throw l}};function _emscripten_promise_then(e,t,r,n){e>>>=0,t>>>=0,r>>>=0,n>>>=0;var a=getPromise(e),o=promiseMap.allocate({promise:a.then(makePromiseCallback(t,n),makePromiseCallback(r,n))});return o}_emscripten_promise_then.sig="ppppp";var _emscripten_promise_all=function(e,t,r){e>>>=0,t>>>=0,r>>>=0;var n=idsToPromises(e,r),a=promiseMap.allocate({promise:Promise.all(n).then(o=>{if(t)for(var l=0;l<r;l++){var u=o[l];HEAPU32[t+l*4>>>2>>>0]=u}return t})});return a};_emscripten_promise_all.sig="pppp";var setPromiseResult=(e,t,r)=>{var n=t?0:3;HEAP32[e>>>2>>>0]=n,HEAPU32[e+4>>>2>>>0]=r},_emscripten_promise_all_settled=function(e,t,r){e>>>=0,t>>>=0,r>>>=0;var n=idsToPromises(e,r),a=promiseMap.allocate({promise:Promise.allSettled(n).then(o=>{if(t)for(var l=t,u=0;u<r;u++,l+=8)o[u].status==="fulfilled"?setPromiseResult(l,!0,o[u].value):setPromiseResult(l,!1,o[u].reason);return t})});return a};_emscripten_promise_all_settled.sig="pppp";var _emscripten_promise_any=function(e,t,r){e>>>=0,t>>>=0,r>>>=0;var n=idsToPromises(e,r),a=promiseMap.allocate({promise:Promise.any(n).catch(o=>{if(t)for(var l=0;l<r;l++)HEAPU32[t+l*4>>>2>>>0]=o.errors[l];throw t})});return a};_emscripten_promise_any.sig="pppp";function _emscripten_promise_race(e,t){e>>>=0,t>>>=0;var r=idsToPromises(e,t),n=promiseMap.allocate({promise:Promise.race(r)});return n}_emscripten_promise_race.sig="ppp";function _emscripten_promise_await(e,t){e>>>=0,t>>>=0,abort("emscripten_promise_await is only available with ASYNCIFY")}_emscripten_promise_await.sig="vpp";function ___cxa_call_unexpected(e){return e>>>=0,abort("Unexpected exception thrown, this is not properly supported - aborting")}___cxa_call_unexpected.sig="vp";var getExceptionMessageCommon=e=>{var t=stackSave(),r=stackAlloc(4),n=stackAlloc(4);___get_exception_message(e,r,n);var a=HEAPU32[r>>>2>>>0],o=HEAPU32[n>>>2>>>0],l=UTF8ToString(a);_free(a);var u;return o&&(u=UTF8ToString(o),_free(o)),stackRestore(t),[l,u]},incrementExceptionRefcount=e=>___cxa_increment_exception_refcount(e),decrementExceptionRefcount=e=>___cxa_decrement_exception_refcount(e),getExceptionMessage=e=>getExceptionMessageCommon(e),Browser={useWebGL:!1,isFullscreen:!1,pointerLock:!1,moduleContextCreatedCallbacks:[],workers:[],init(){if(Browser.initted)return;Browser.initted=!0;var e={};e.canHandle=function(o){return!Module.noImageDecoding&&/\.(jpg|jpeg|png|bmp|webp)$/i.test(o)},e.handle=function(o,l,u,_){var d=new Blob([o],{type:Browser.getMimetype(l)});d.size!==o.length&&(d=new Blob([new Uint8Array(o).buffer],{type:Browser.getMimetype(l)}));var f=URL.createObjectURL(d),p=new Image;p.onload=()=>{var m=document.createElement("canvas");m.width=p.width,m.height=p.height;var h=m.getContext("2d");h.drawImage(p,0,0),preloadedImages[l]=m,URL.revokeObjectURL(f),u==null||u(o)},p.onerror=m=>{err("Image ".concat(f," could not be decoded")),_==null||_()},p.src=f},preloadPlugins.push(e);var t={};t.canHandle=function(o){return!Module.noAudioDecoding&&o.substr(-4)in{".ogg":1,".wav":1,".mp3":1}},t.handle=function(o,l,u,_){var d=!1;function f(v){d||(d=!0,preloadedAudios[l]=v,u==null||u(o))}function p(){d||(d=!0,preloadedAudios[l]=new Audio,_==null||_())}var m=new Blob([o],{type:Browser.getMimetype(l)}),h=URL.createObjectURL(m),g=new Audio;g.addEventListener("canplaythrough",()=>f(g),!1),g.onerror=function(y){if(d)return;err("warning: browser could not fully decode audio ".concat(l,", trying slower base64 approach"));function S(w){for(var D="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",F="=",E="",x=0,A=0,L=0;L<w.length;L++)for(x=x<<8|w[L],A+=8;A>=6;){var C=x>>A-6&63;A-=6,E+=D[C]}return A==2?(E+=D[(x&3)<<4],E+=F+F):A==4&&(E+=D[(x&15)<<2],E+=F),E}g.src="data:audio/x-"+l.substr(-3)+";base64,"+S(o),f(g)},g.src=h,safeSetTimeout(()=>{f(g)},1e4)},preloadPlugins.push(t);function r(){Browser.pointerLock=document.pointerLockElement===Module.canvas||document.mozPointerLockElement===Module.canvas||document.webkitPointerLockElement===Module.canvas||document.msPointerLockElement===Module.canvas}var n=Module.canvas;n&&(n.requestPointerLock=n.requestPointerLock||n.mozRequestPointerLock||n.webkitRequestPointerLock||n.msRequestPointerLock||(()=>{}),n.exitPointerLock=document.exitPointerLock||document.mozExitPointerLock||document.webkitExitPointerLock||document.msExitPointerLock||(()=>{}),n.exitPointerLock=n.exitPointerLock.bind(document),document.addEventListener("pointerlockchange",r,!1),document.addEventListener("mozpointerlockchange",r,!1),document.addEventListener("webkitpointerlockchange",r,!1),document.addEventListener("mspointerlockchange",r,!1),Module.elementPointerLock&&n.addEventListener("click",a=>{!Browser.pointerLock&&Module.canvas.requestPointerLock&&(Module.canvas.requestPointerLock(),a.preventDefault())},!1))},createContext(e,t,r,n){if(t&&Module.ctx&&e==Module.canvas)return Module.ctx;var a,o;if(t){var l={antialias:!1,alpha:!1,majorVersion:1};if(n)for(var u in n)l[u]=n[u];typeof GL<"u"&&(o=GL.createContext(e,l),o&&(a=GL.getContext(o).GLctx))}else a=e.getContext("2d");return a?(r&&(Module.ctx=a,t&&GL.makeContextCurrent(o),Browser.useWebGL=t,Browser.moduleContextCreatedCallbacks.forEach(_=>_()),Browser.init()),a):null},fullscreenHandlersInstalled:!1,lockPointer:void 0,resizeCanvas:void 0,requestFullscreen(e,t){Browser.lockPointer=e,Browser.resizeCanvas=t,typeof Browser.lockPointer>"u"&&(Browser.lockPointer=!0),typeof Browser.resizeCanvas>"u"&&(Browser.resizeCanvas=!1);var r=Module.canvas;function n(){var l,u;Browser.isFullscreen=!1;var o=r.parentNode;(document.fullscreenElement||document.mozFullScreenElement||document.msFullscreenElement||document.webkitFullscreenElement||document.webkitCurrentFullScreenElement)===o?(r.exitFullscreen=Browser.exitFullscreen,Browser.lockPointer&&r.requestPointerLock(),Browser.isFullscreen=!0,Browser.resizeCanvas?Browser.setFullscreenCanvasSize():Browser.updateCanvasDimensions(r)):(o.parentNode.insertBefore(r,o),o.parentNode.removeChild(o),Browser.resizeCanvas?Browser.setWindowedCanvasSize():Browser.updateCanvasDimensions(r)),(l=Module.onFullScreen)==null||l.call(Module,Browser.isFullscreen),(u=Module.onFullscreen)==null||u.call(Module,Browser.isFullscreen)}Browser.fullscreenHandlersInstalled||(Browser.fullscreenHandlersInstalled=!0,document.addEventListener("fullscreenchange",n,!1),document.addEventListener("mozfullscreenchange",n,!1),document.addEventListener("webkitfullscreenchange",n,!1),document.addEventListener("MSFullscreenChange",n,!1));var a=document.createElement("div");r.parentNode.insertBefore(a,r),a.appendChild(r),a.requestFullscreen=a.requestFullscreen||a.mozRequestFullScreen||a.msRequestFullscreen||(a.webkitRequestFullscreen?()=>a.webkitRequestFullscreen(Element.ALLOW_KEYBOARD_INPUT):null)||(a.webkitRequestFullScreen?()=>a.webkitRequestFullScreen(Element.ALLOW_KEYBOARD_INPUT):null),a.requestFullscreen()},exitFullscreen(){if(!Browser.isFullscreen)return!1;var e=document.exitFullscreen||document.cancelFullScreen||document.mozCancelFullScreen||document.msExitFullscreen||document.webkitCancelFullScreen||(()=>{});return e.apply(document,[]),!0},safeSetTimeout(e,t){return safeSetTimeout(e,t)},getMimetype(e){return{jpg:"image/jpeg",jpeg:"image/jpeg",png:"image/png",bmp:"image/bmp",ogg:"audio/ogg",wav:"audio/wav",mp3:"audio/mpeg"}[e.substr(e.lastIndexOf(".")+1)]},getUserMedia(e){window.getUserMedia||(window.getUserMedia=navigator.getUserMedia||navigator.mozGetUserMedia),window.getUserMedia(e)},getMovementX(e){return e.movementX||e.mozMovementX||e.webkitMovementX||0},getMovementY(e){return e.movementY||e.mozMovementY||e.webkitMovementY||0},getMouseWheelDelta(e){var t=0;switch(e.type){case"DOMMouseScroll":t=e.detail/3;break;case"mousewheel":t=e.wheelDelta/120;break;case"wheel":switch(t=e.deltaY,e.deltaMode){case 0:t/=100;break;case 1:t/=3;break;case 2:t*=80;break;default:throw"unrecognized mouse wheel delta mode: "+e.deltaMode}break;default:throw"unrecognized mouse wheel event: "+e.type}return t},mouseX:0,mouseY:0,mouseMovementX:0,mouseMovementY:0,touches:{},lastTouches:{},calculateMouseCoords(e,t){var r=Module.canvas.getBoundingClientRect(),n=Module.canvas.width,a=Module.canvas.height,o=typeof window.scrollX<"u"?window.scrollX:window.pageXOffset,l=typeof window.scrollY<"u"?window.scrollY:window.pageYOffset,u=e-(o+r.left),_=t-(l+r.top);return u=u*(n/r.width),_=_*(a/r.height),{x:u,y:_}},setMouseCoords(e,t){let{x:r,y:n}=Browser.calculateMouseCoords(e,t);Browser.mouseMovementX=r-Browser.mouseX,Browser.mouseMovementY=n-Browser.mouseY,Browser.mouseX=r,Browser.mouseY=n},calculateMouseEvent(e){if(Browser.pointerLock)e.type!="mousemove"&&"mozMovementX"in e?Browser.mouseMovementX=Browser.mouseMovementY=0:(Browser.mouseMovementX=Browser.getMovementX(e),Browser.mouseMovementY=Browser.getMovementY(e)),Browser.mouseX+=Browser.mouseMovementX,Browser.mouseY+=Browser.mouseMovementY;else{if(e.type==="touchstart"||e.type==="touchend"||e.type==="touchmove"){var t=e.touch;if(t===void 0)return;var r=Browser.calculateMouseCoords(t.pageX,t.pageY);if(e.type==="touchstart")Browser.lastTouches[t.identifier]=r,Browser.touches[t.identifier]=r;else if(e.type==="touchend"||e.type==="touchmove"){var n=Browser.touches[t.identifier];n||(n=r),Browser.lastTouches[t.identifier]=n,Browser.touches[t.identifier]=r}return}Browser.setMouseCoords(e.pageX,e.pageY)}},resizeListeners:[],updateResizeListeners(){var e=Module.canvas;Browser.resizeListeners.forEach(t=>t(e.width,e.height))},setCanvasSize(e,t,r){var n=Module.canvas;Browser.updateCanvasDimensions(n,e,t),r||Browser.updateResizeListeners()},windowedWidth:0,windowedHeight:0,setFullscreenCanvasSize(){if(typeof SDL<"u"){var e=HEAPU32[SDL.screen>>>2>>>0];e=e|8388608,HEAP32[SDL.screen>>>2>>>0]=e}Browser.updateCanvasDimensions(Module.canvas),Browser.updateResizeListeners()},setWindowedCanvasSize(){if(typeof SDL<"u"){var e=HEAPU32[SDL.screen>>>2>>>0];e=e&-8388609,HEAP32[SDL.screen>>>2>>>0]=e}Browser.updateCanvasDimensions(Module.canvas),Browser.updateResizeListeners()},updateCanvasDimensions(e,t,r){t&&r?(e.widthNative=t,e.heightNative=r):(t=e.widthNative,r=e.heightNative);var n=t,a=r;if(Module.forcedAspectRatio&&Module.forcedAspectRatio>0&&(n/a<Module.forcedAspectRatio?n=Math.round(a*Module.forcedAspectRatio):a=Math.round(n/Module.forcedAspectRatio)),(document.fullscreenElement||document.mozFullScreenElement||document.msFullscreenElement||document.webkitFullscreenElement||document.webkitCurrentFullScreenElement)===e.parentNode&&typeof screen<"u"){var o=Math.min(screen.width/n,screen.height/a);n=Math.round(n*o),a=Math.round(a*o)}Browser.resizeCanvas?(e.width!=n&&(e.width=n),e.height!=a&&(e.height=a),typeof e.style<"u"&&(e.style.removeProperty("width"),e.style.removeProperty("height"))):(e.width!=t&&(e.width=t),e.height!=r&&(e.height=r),typeof e.style<"u"&&(n!=t||a!=r?(e.style.setProperty("width",n+"px","important"),e.style.setProperty("height",a+"px","important")):(e.style.removeProperty("width"),e.style.removeProperty("height"))))}},_emscripten_run_preload_plugins=function(e,t,r){e>>>=0,t>>>=0,r>>>=0;var n=UTF8ToString(e),a=FS.analyzePath(n);return a.exists?(FS.createPreloadedFile(PATH.dirname(n),PATH.basename(n),new Uint8Array(a.object.contents),!0,!0,()=>{t&&getWasmTableEntry(t)(e)},()=>{r&&getWasmTableEntry(r)(e)},!0),0):-1};_emscripten_run_preload_plugins.sig="ippp";var Browser_asyncPrepareDataCounter=0,_emscripten_run_preload_plugins_data=function(e,t,r,n,a,o){e>>>=0,r>>>=0,n>>>=0,a>>>=0,o>>>=0;var l=UTF8ToString(r),u="prepare_data_"+Browser_asyncPrepareDataCounter+++"."+l,_=stringToNewUTF8(u);FS.createPreloadedFile("/",u,HEAPU8.subarray(e>>>0,e+t>>>0),!0,!0,()=>{a&&getWasmTableEntry(a)(n,_)},()=>{o&&getWasmTableEntry(o)(n)},!0)};_emscripten_run_preload_plugins_data.sig="vpipppp";var _emscripten_async_run_script=function(e,t){e>>>=0,safeSetTimeout(()=>_emscripten_run_script(e),t)};_emscripten_async_run_script.sig="vpi";var _emscripten_async_load_script=function(url,onload,onerror){url>>>=0,onload>>>=0,onerror>>>=0,url=UTF8ToString(url);var loadDone=()=>{if(onload){var e=()=>callUserCallback(getWasmTableEntry(onload));runDependencies>0?dependenciesFulfilled=e:e()}},loadError=()=>{onerror&&callUserCallback(getWasmTableEntry(onerror))};if(ENVIRONMENT_IS_NODE){readAsync(url,!1).then(data=>{eval(data),loadDone()},loadError);return}var script=document.createElement("script");script.onload=loadDone,script.onerror=loadError,script.src=url,document.body.appendChild(script)};_emscripten_async_load_script.sig="vppp";var safeRequestAnimationFrame=e=>MainLoop.requestAnimationFrame(()=>{callUserCallback(e)});function _emscripten_async_call(e,t,r){e>>>=0,t>>>=0;function n(){getWasmTableEntry(e)(t)}r>=0||ENVIRONMENT_IS_NODE?safeSetTimeout(n,r):safeRequestAnimationFrame(n)}_emscripten_async_call.sig="vppi";function _emscripten_get_window_title(){var e=256;return _emscripten_get_window_title.buffer||(_emscripten_get_window_title.buffer=_malloc(e)),stringToUTF8(document.title,_emscripten_get_window_title.buffer,e),_emscripten_get_window_title.buffer}_emscripten_get_window_title.sig="p";function _emscripten_set_window_title(e){return e>>>=0,document.title=UTF8ToString(e)}_emscripten_set_window_title.sig="vp";function _emscripten_get_screen_size(e,t){e>>>=0,t>>>=0,HEAP32[e>>>2>>>0]=screen.width,HEAP32[t>>>2>>>0]=screen.height}_emscripten_get_screen_size.sig="vpp";var _emscripten_hide_mouse=()=>{for(var e=document.styleSheets[0],t=e.cssRules,r=0;r<t.length;r++)t[r].cssText.substr(0,6)=="canvas"&&(e.deleteRule(r),r--);e.insertRule("canvas.emscripten { border: 1px solid black; cursor: none; }",0)};_emscripten_hide_mouse.sig="v";var _emscripten_set_canvas_size=(e,t)=>{Browser.setCanvasSize(e,t)};_emscripten_set_canvas_size.sig="vii";function _emscripten_get_canvas_size(e,t,r){e>>>=0,t>>>=0,r>>>=0;var n=Module.canvas;HEAP32[e>>>2>>>0]=n.width,HEAP32[t>>>2>>>0]=n.height,HEAP32[r>>>2>>>0]=Browser.isFullscreen?1:0}_emscripten_get_canvas_size.sig="vppp";function _emscripten_create_worker(e){e>>>=0,e=UTF8ToString(e);var t=Browser.workers.length,r={worker:new Worker(e),callbacks:[],awaited:0,buffer:0,bufferSize:0};return r.worker.onmessage=function(a){if(!ABORT){var o=Browser.workers[t];if(o){var l=a.data.callbackId,u=o.callbacks[l];if(u){a.data.finalResponse&&(o.awaited--,o.callbacks[l]=null);var _=a.data.data;_?(_.byteLength||(_=new Uint8Array(_)),(!o.buffer||o.bufferSize<_.length)&&(o.buffer&&_free(o.buffer),o.bufferSize=_.length,o.buffer=_malloc(_.length)),HEAPU8.set(_,o.buffer>>>0),u.func(o.buffer,_.length,u.arg)):u.func(0,0,u.arg)}}}},Browser.workers.push(r),t}_emscripten_create_worker.sig="ip";var _emscripten_destroy_worker=e=>{var t=Browser.workers[e];t.worker.terminate(),t.buffer&&_free(t.buffer),Browser.workers[e]=null};_emscripten_destroy_worker.sig="vi";function _emscripten_call_worker(e,t,r,n,a,o){t>>>=0,r>>>=0,a>>>=0,o>>>=0,t=UTF8ToString(t);var l=Browser.workers[e],u=-1;a&&(u=l.callbacks.length,l.callbacks.push({func:getWasmTableEntry(a),arg:o}),l.awaited++);var _={funcName:t,callbackId:u,data:r?new Uint8Array(HEAPU8.subarray(r>>>0,r+n>>>0)):0};r?l.worker.postMessage(_,[_.data.buffer]):l.worker.postMessage(_)}_emscripten_call_worker.sig="vippipp";var _emscripten_get_worker_queue_size=e=>{var t=Browser.workers[e];return t?t.awaited:-1};_emscripten_get_worker_queue_size.sig="ii";var getPreloadedImageData=(e,t,r)=>{e=PATH_FS.resolve(e);var n=preloadedImages[e];if(!n)return 0;var a=n.getContext("2d"),o=a.getImageData(0,0,n.width,n.height),l=_malloc(n.width*n.height*4);return HEAPU8.set(o.data,l>>>0),HEAP32[t>>>2>>>0]=n.width,HEAP32[r>>>2>>>0]=n.height,l};function _emscripten_get_preloaded_image_data(e,t,r){return e>>>=0,t>>>=0,r>>>=0,getPreloadedImageData(UTF8ToString(e),t,r)}_emscripten_get_preloaded_image_data.sig="pppp";var getPreloadedImageData__data=["$PATH_FS","malloc"];function _emscripten_get_preloaded_image_data_from_FILE(e,t,r){e>>>=0,t>>>=0,r>>>=0;var n=_fileno(e),a=FS.getStream(n);return a?getPreloadedImageData(a.path,t,r):0}_emscripten_get_preloaded_image_data_from_FILE.sig="pppp";var wget={wgetRequests:{},nextWgetRequestHandle:0,getNextWgetRequestHandle(){var e=wget.nextWgetRequestHandle;return wget.nextWgetRequestHandle++,e}},FS_mkdirTree=(e,t)=>FS.mkdirTree(e,t),FS_unlink=e=>FS.unlink(e),_emscripten_async_wget=function(e,t,r,n){e>>>=0,t>>>=0,r>>>=0,n>>>=0;var a=UTF8ToString(e),o=UTF8ToString(t);o=PATH_FS.resolve(o);function l(_){_&&callUserCallback(()=>{var d=stackSave();getWasmTableEntry(_)(stringToUTF8OnStack(o)),stackRestore(d)})}var u=PATH.dirname(o);FS_createPreloadedFile(u,PATH.basename(o),a,!0,!0,()=>l(r),()=>l(n),!1,!1,()=>{try{FS_unlink(o)}catch(_){}FS_mkdirTree(u)})};_emscripten_async_wget.sig="vpppp";var _emscripten_async_wget_data=function(e,t,r,n){e>>>=0,t>>>=0,r>>>=0,n>>>=0,asyncLoad(UTF8ToString(e),a=>{callUserCallback(()=>{var o=_malloc(a.length);HEAPU8.set(a,o>>>0),getWasmTableEntry(r)(t,o,a.length),_free(o)})},()=>{n&&callUserCallback(()=>{getWasmTableEntry(n)(t)})},!0)};_emscripten_async_wget_data.sig="vpppp";var _emscripten_async_wget2=function(e,t,r,n,a,o,l,u){e>>>=0,t>>>=0,r>>>=0,n>>>=0,a>>>=0,o>>>=0,l>>>=0,u>>>=0;var _=UTF8ToString(e),d=UTF8ToString(t);d=PATH_FS.resolve(d);var f=UTF8ToString(r),p=UTF8ToString(n),m=d.lastIndexOf("/"),h=new XMLHttpRequest;h.open(f,_,!0),h.responseType="arraybuffer";var g=wget.getNextWgetRequestHandle(),v=PATH.dirname(d);return h.onload=y=>{if(h.status>=200&&h.status<300){try{FS.unlink(d)}catch(w){}if(FS.mkdirTree(v),FS.createDataFile(d.substr(0,m),d.substr(m+1),new Uint8Array(h.response),!0,!0,!1),o){var S=stackSave();getWasmTableEntry(o)(g,a,stringToUTF8OnStack(d)),stackRestore(S)}}else l&&getWasmTableEntry(l)(g,a,h.status);delete wget.wgetRequests[g]},h.onerror=y=>{l&&getWasmTableEntry(l)(g,a,h.status),delete wget.wgetRequests[g]},h.onprogress=y=>{if(y.lengthComputable||y.lengthComputable===void 0&&y.total!=0){var S=y.loaded/y.total*100;u&&getWasmTableEntry(u)(g,a,S)}},h.onabort=y=>{delete wget.wgetRequests[g]},f=="POST"?(h.setRequestHeader("Content-type","application/x-www-form-urlencoded"),h.send(p)):h.send(null),wget.wgetRequests[g]=h,g};_emscripten_async_wget2.sig="ipppppppp";function _emscripten_async_wget2_data(e,t,r,n,a,o,l,u){e>>>=0,t>>>=0,r>>>=0,n>>>=0,o>>>=0,l>>>=0,u>>>=0;var _=UTF8ToString(e),d=UTF8ToString(t),f=UTF8ToString(r),p=new XMLHttpRequest;p.open(d,_,!0),p.responseType="arraybuffer";var m=wget.getNextWgetRequestHandle();function h(){if(l){var g=stackSave(),v=0;p.statusText&&(v=stringToUTF8OnStack(p.statusText)),getWasmTableEntry(l)(m,n,p.status,v),stackRestore(g)}}return p.onload=g=>{if(p.status>=200&&p.status<300||p.status===0&&_.substr(0,4).toLowerCase()!="http"){var v=new Uint8Array(p.response),y=_malloc(v.length);HEAPU8.set(v,y>>>0),o&&getWasmTableEntry(o)(m,n,y,v.length),a&&_free(y)}else h();delete wget.wgetRequests[m]},p.onerror=g=>{h(),delete wget.wgetRequests[m]},p.onprogress=g=>{u&&getWasmTableEntry(u)(m,n,g.loaded,g.lengthComputable||g.lengthComputable===void 0?g.total:0)},p.onabort=g=>{delete wget.wgetRequests[m]},d=="POST"?(p.setRequestHeader("Content-type","application/x-www-form-urlencoded"),p.send(f)):p.send(null),wget.wgetRequests[m]=p,m}_emscripten_async_wget2_data.sig="ippppippp";var _emscripten_async_wget2_abort=e=>{var t=wget.wgetRequests[e];t==null||t.abort()};_emscripten_async_wget2_abort.sig="vi";function ___asctime_r(e,t){e>>>=0,t>>>=0;var r={tm_sec:HEAP32[e>>>2>>>0],tm_min:HEAP32[e+4>>>2>>>0],tm_hour:HEAP32[e+8>>>2>>>0],tm_mday:HEAP32[e+12>>>2>>>0],tm_mon:HEAP32[e+16>>>2>>>0],tm_year:HEAP32[e+20>>>2>>>0],tm_wday:HEAP32[e+24>>>2>>>0]},n=["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],a=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],o=n[r.tm_wday]+" "+a[r.tm_mon]+(r.tm_mday<10?"  ":" ")+r.tm_mday+(r.tm_hour<10?" 0":" ")+r.tm_hour+(r.tm_min<10?":0":":")+r.tm_min+(r.tm_sec<10?":0":":")+r.tm_sec+" "+(1900+r.tm_year)+"\n";return stringToUTF8(o,t,26),t}___asctime_r.sig="ppp";function _strptime_l(e,t,r,n){return e>>>=0,t>>>=0,r>>>=0,n>>>=0,_strptime(e,t,r)}_strptime_l.sig="ppppp";function ___syscall_shutdown(e,t){try{return getSocketFromFD(e),-52}catch(r){if(typeof FS>"u"||r.name!=="ErrnoError")throw r;return-r.errno}}Module.___syscall_shutdown=___syscall_shutdown,___syscall_shutdown.sig="iiiiiii";function __dlsym_catchup_js(e,t){e>>>=0;var r=LDSO.loadedLibsByHandle[e],n=r.exports,a=Object.keys(n)[t],o=n[a],l=addFunction(o,o.sig);return l}__dlsym_catchup_js.sig="ppi";var FS_createPath=FS.createPath,FS_createDevice=FS.createDevice,FS_readFile=FS.readFile,FS_createLazyFile=FS.createLazyFile,_setNetworkCallback=(e,t,r)=>{function n(a){try{if(e==="error"){var o=stackSave(),l=stringToUTF8OnStack(a[2]);getWasmTableEntry(r)(a[0],a[1],l,t),stackRestore(o)}else getWasmTableEntry(r)(a,t)}catch(u){if(!(u instanceof ExitStatus))throw u&&typeof u=="object"&&u.stack&&err("exception thrown: "+[u,u.stack]),u}}SOCKFS.on(e,r?n:null)};function _emscripten_set_socket_error_callback(e,t){e>>>=0,t>>>=0,_setNetworkCallback("error",e,t)}_emscripten_set_socket_error_callback.sig="vpp";function _emscripten_set_socket_open_callback(e,t){e>>>=0,t>>>=0,_setNetworkCallback("open",e,t)}_emscripten_set_socket_open_callback.sig="vpp";function _emscripten_set_socket_listen_callback(e,t){e>>>=0,t>>>=0,_setNetworkCallback("listen",e,t)}_emscripten_set_socket_listen_callback.sig="vpp";function _emscripten_set_socket_connection_callback(e,t){e>>>=0,t>>>=0,_setNetworkCallback("connection",e,t)}_emscripten_set_socket_connection_callback.sig="vpp";function _emscripten_set_socket_message_callback(e,t){e>>>=0,t>>>=0,_setNetworkCallback("message",e,t)}_emscripten_set_socket_message_callback.sig="vpp";function _emscripten_set_socket_close_callback(e,t){e>>>=0,t>>>=0,_setNetworkCallback("close",e,t)}_emscripten_set_socket_close_callback.sig="vpp";function _emscripten_webgl_enable_ANGLE_instanced_arrays(e){return e>>>=0,webgl_enable_ANGLE_instanced_arrays(GL.contexts[e].GLctx)}_emscripten_webgl_enable_ANGLE_instanced_arrays.sig="ip";function _emscripten_webgl_enable_OES_vertex_array_object(e){return e>>>=0,webgl_enable_OES_vertex_array_object(GL.contexts[e].GLctx)}_emscripten_webgl_enable_OES_vertex_array_object.sig="ip";function _emscripten_webgl_enable_WEBGL_draw_buffers(e){return e>>>=0,webgl_enable_WEBGL_draw_buffers(GL.contexts[e].GLctx)}_emscripten_webgl_enable_WEBGL_draw_buffers.sig="ip";function _emscripten_webgl_enable_WEBGL_multi_draw(e){return e>>>=0,webgl_enable_WEBGL_multi_draw(GL.contexts[e].GLctx)}_emscripten_webgl_enable_WEBGL_multi_draw.sig="ip";function _emscripten_webgl_enable_EXT_polygon_offset_clamp(e){return e>>>=0,webgl_enable_EXT_polygon_offset_clamp(GL.contexts[e].GLctx)}_emscripten_webgl_enable_EXT_polygon_offset_clamp.sig="ip";function _emscripten_webgl_enable_EXT_clip_control(e){return e>>>=0,webgl_enable_EXT_clip_control(GL.contexts[e].GLctx)}_emscripten_webgl_enable_EXT_clip_control.sig="ip";function _emscripten_webgl_enable_WEBGL_polygon_mode(e){return e>>>=0,webgl_enable_WEBGL_polygon_mode(GL.contexts[e].GLctx)}_emscripten_webgl_enable_WEBGL_polygon_mode.sig="ip";function _glVertexPointer(e,t,r,n){throw n>>>=0,"Legacy GL function (glVertexPointer) called. If you want legacy GL emulation, you need to compile with -sLEGACY_GL_EMULATION to enable legacy GL emulation."}_glVertexPointer.sig="viiip";var _glMatrixMode=()=>{throw"Legacy GL function (glMatrixMode) called. If you want legacy GL emulation, you need to compile with -sLEGACY_GL_EMULATION to enable legacy GL emulation."};_glMatrixMode.sig="vi";var _glBegin=()=>{throw"Legacy GL function (glBegin) called. If you want legacy GL emulation, you need to compile with -sLEGACY_GL_EMULATION to enable legacy GL emulation."};_glBegin.sig="vi";var _glLoadIdentity=()=>{throw"Legacy GL function (glLoadIdentity) called. If you want legacy GL emulation, you need to compile with -sLEGACY_GL_EMULATION to enable legacy GL emulation."};_glLoadIdentity.sig="v";var _glVertexAttribDivisorNV=_glVertexAttribDivisor,_glDrawArraysInstancedNV=_glDrawArraysInstanced,_glDrawElementsInstancedNV=_glDrawElementsInstanced,_glVertexAttribDivisorEXT=_glVertexAttribDivisor,_glDrawArraysInstancedEXT=_glDrawArraysInstanced,_glDrawElementsInstancedEXT=_glDrawElementsInstanced,_glVertexAttribDivisorARB=_glVertexAttribDivisor,_glDrawArraysInstancedARB=_glDrawArraysInstanced,_glDrawElementsInstancedARB=_glDrawElementsInstanced,_glDrawBuffersEXT=_glDrawBuffers;function _glMultiDrawArraysWEBGL(e,t,r,n){t>>>=0,r>>>=0,GLctx.multiDrawWebgl.multiDrawArraysWEBGL(e,HEAP32,t>>>2,HEAP32,r>>>2,n)}_glMultiDrawArraysWEBGL.sig="vippi";var _glMultiDrawArrays=_glMultiDrawArraysWEBGL;_glMultiDrawArrays.sig="vippi";var _glMultiDrawArraysANGLE=_glMultiDrawArraysWEBGL;function _glMultiDrawArraysInstancedWEBGL(e,t,r,n,a){t>>>=0,r>>>=0,n>>>=0,GLctx.multiDrawWebgl.multiDrawArraysInstancedWEBGL(e,HEAP32,t>>>2,HEAP32,r>>>2,HEAP32,n>>>2,a)}_glMultiDrawArraysInstancedWEBGL.sig="vipppi";var _glMultiDrawArraysInstancedANGLE=_glMultiDrawArraysInstancedWEBGL;function _glMultiDrawElementsWEBGL(e,t,r,n,a){t>>>=0,n>>>=0,GLctx.multiDrawWebgl.multiDrawElementsWEBGL(e,HEAP32,t>>>2,r,HEAP32,n>>>2,a)}_glMultiDrawElementsWEBGL.sig="vipipi";var _glMultiDrawElements=_glMultiDrawElementsWEBGL;_glMultiDrawElements.sig="vipipi";var _glMultiDrawElementsANGLE=_glMultiDrawElementsWEBGL;function _glMultiDrawElementsInstancedWEBGL(e,t,r,n,a,o){t>>>=0,n>>>=0,a>>>=0,GLctx.multiDrawWebgl.multiDrawElementsInstancedWEBGL(e,HEAP32,t>>>2,r,HEAP32,n>>>2,HEAP32,a>>>2,o)}_glMultiDrawElementsInstancedWEBGL.sig="vipippi";var _glMultiDrawElementsInstancedANGLE=_glMultiDrawElementsInstancedWEBGL,_glClearDepth=e=>GLctx.clearDepth(e);_glClearDepth.sig="vd";var _glDepthRange=(e,t)=>GLctx.depthRange(e,t);_glDepthRange.sig="vdd";var _emscripten_glGenVertexArrays=_glGenVertexArrays;_emscripten_glGenVertexArrays.sig="vip";var _emscripten_glDeleteVertexArrays=_glDeleteVertexArrays;_emscripten_glDeleteVertexArrays.sig="vip";var _emscripten_glBindVertexArray=_glBindVertexArray;_emscripten_glBindVertexArray.sig="vi";var _emscripten_glIsVertexArray=_glIsVertexArray;_emscripten_glIsVertexArray.sig="ii";var _emscripten_glVertexPointer=_glVertexPointer;_emscripten_glVertexPointer.sig="viiip";var _emscripten_glMatrixMode=_glMatrixMode;_emscripten_glMatrixMode.sig="vi";var _emscripten_glBegin=_glBegin;_emscripten_glBegin.sig="vi";var _emscripten_glLoadIdentity=_glLoadIdentity;_emscripten_glLoadIdentity.sig="v";var _emscripten_glVertexAttribDivisor=_glVertexAttribDivisor;_emscripten_glVertexAttribDivisor.sig="vii";var _emscripten_glDrawArraysInstanced=_glDrawArraysInstanced;_emscripten_glDrawArraysInstanced.sig="viiii";var _emscripten_glDrawElementsInstanced=_glDrawElementsInstanced;_emscripten_glDrawElementsInstanced.sig="viiipi";var _emscripten_glVertexAttribDivisorNV=_glVertexAttribDivisorNV,_emscripten_glDrawArraysInstancedNV=_glDrawArraysInstancedNV,_emscripten_glDrawElementsInstancedNV=_glDrawElementsInstancedNV,_emscripten_glVertexAttribDivisorEXT=_glVertexAttribDivisorEXT,_emscripten_glDrawArraysInstancedEXT=_glDrawArraysInstancedEXT,_emscripten_glDrawElementsInstancedEXT=_glDrawElementsInstancedEXT,_emscripten_glVertexAttribDivisorARB=_glVertexAttribDivisorARB,_emscripten_glDrawArraysInstancedARB=_glDrawArraysInstancedARB,_emscripten_glDrawElementsInstancedARB=_glDrawElementsInstancedARB,_emscripten_glDrawBuffers=_glDrawBuffers;_emscripten_glDrawBuffers.sig="vip";var _emscripten_glDrawBuffersEXT=_glDrawBuffersEXT,_emscripten_glMultiDrawArrays=_glMultiDrawArrays;_emscripten_glMultiDrawArrays.sig="vippi";var _emscripten_glMultiDrawArraysANGLE=_glMultiDrawArraysANGLE,_emscripten_glMultiDrawArraysWEBGL=_glMultiDrawArraysWEBGL,_emscripten_glMultiDrawArraysInstancedANGLE=_glMultiDrawArraysInstancedANGLE,_emscripten_glMultiDrawArraysInstancedWEBGL=_glMultiDrawArraysInstancedWEBGL,_emscripten_glMultiDrawElements=_glMultiDrawElements;_emscripten_glMultiDrawElements.sig="vipipi";var _emscripten_glMultiDrawElementsANGLE=_glMultiDrawElementsANGLE,_emscripten_glMultiDrawElementsWEBGL=_glMultiDrawElementsWEBGL,_emscripten_glMultiDrawElementsInstancedANGLE=_glMultiDrawElementsInstancedANGLE,_emscripten_glMultiDrawElementsInstancedWEBGL=_glMultiDrawElementsInstancedWEBGL,_emscripten_glClearDepth=_glClearDepth;_emscripten_glClearDepth.sig="vd";var _emscripten_glDepthRange=_glDepthRange;_emscripten_glDepthRange.sig="vdd";var writeGLArray=(e,t,r,n)=>{var a=e.length,o=r<a?r:a,l=n?HEAPF32:HEAP32;t=t>>>2;for(var u=0;u<o;++u)l[t+u>>>0]=e[u];return a},webglPowerPreferences=["default","low-power","high-performance"];function _emscripten_webgl_do_create_context(e,t){e>>>=0,t>>>=0;var r=t>>>2,n=HEAP32[r+2>>>0],a={alpha:!!HEAP8[t+0>>>0],depth:!!HEAP8[t+1>>>0],stencil:!!HEAP8[t+2>>>0],antialias:!!HEAP8[t+3>>>0],premultipliedAlpha:!!HEAP8[t+4>>>0],preserveDrawingBuffer:!!HEAP8[t+5>>>0],powerPreference:webglPowerPreferences[n],failIfMajorPerformanceCaveat:!!HEAP8[t+12>>>0],majorVersion:HEAP32[r+4>>>0],minorVersion:HEAP32[r+5>>>0],enableExtensionsByDefault:HEAP8[t+24>>>0],explicitSwapControl:HEAP8[t+25>>>0],proxyContextToMainThread:HEAP32[r+7>>>0],renderViaOffscreenBackBuffer:HEAP8[t+32>>>0]},o=findCanvasEventTarget(e);if(!o||a.explicitSwapControl)return 0;var l=GL.createContext(o,a);return l}_emscripten_webgl_do_create_context.sig="ppp";var _emscripten_webgl_create_context=_emscripten_webgl_do_create_context;_emscripten_webgl_create_context.sig="ppp";function _emscripten_webgl_do_get_current_context(){return GL.currentContext?GL.currentContext.handle:0}_emscripten_webgl_do_get_current_context.sig="p";var _emscripten_webgl_get_current_context=_emscripten_webgl_do_get_current_context;_emscripten_webgl_get_current_context.sig="p";var _emscripten_webgl_do_commit_frame=()=>!GL.currentContext||!GL.currentContext.GLctx||!GL.currentContext.attributes.explicitSwapControl?-3:0;_emscripten_webgl_do_commit_frame.sig="i";var _emscripten_webgl_commit_frame=_emscripten_webgl_do_commit_frame;_emscripten_webgl_commit_frame.sig="i";function _emscripten_webgl_make_context_current(e){e>>>=0;var t=GL.makeContextCurrent(e);return t?0:-5}_emscripten_webgl_make_context_current.sig="ip";function _emscripten_webgl_get_drawing_buffer_size(e,t,r){e>>>=0,t>>>=0,r>>>=0;var n=GL.getContext(e);return!n||!n.GLctx||!t||!r?-5:(HEAP32[t>>>2>>>0]=n.GLctx.drawingBufferWidth,HEAP32[r>>>2>>>0]=n.GLctx.drawingBufferHeight,0)}_emscripten_webgl_get_drawing_buffer_size.sig="ippp";function _emscripten_webgl_get_context_attributes(e,t){if(e>>>=0,t>>>=0,!t)return-5;if(e=GL.contexts[e],!e)return-3;var r=e.GLctx;if(!r)return-3;r=r.getContextAttributes(),HEAP8[t>>>0]=r.alpha,HEAP8[t+1>>>0]=r.depth,HEAP8[t+2>>>0]=r.stencil,HEAP8[t+3>>>0]=r.antialias,HEAP8[t+4>>>0]=r.premultipliedAlpha,HEAP8[t+5>>>0]=r.preserveDrawingBuffer;var n=r.powerPreference&&webglPowerPreferences.indexOf(r.powerPreference);return HEAP32[t+8>>>2>>>0]=n,HEAP8[t+12>>>0]=r.failIfMajorPerformanceCaveat,HEAP32[t+16>>>2>>>0]=e.version,HEAP32[t+20>>>2>>>0]=0,HEAP8[t+24>>>0]=e.attributes.enableExtensionsByDefault,0}_emscripten_webgl_get_context_attributes.sig="ipp";function _emscripten_webgl_destroy_context(e){e>>>=0,GL.currentContext==e&&(GL.currentContext=0),GL.deleteContext(e)}_emscripten_webgl_destroy_context.sig="ip";function _emscripten_webgl_enable_extension(e,t){e>>>=0,t>>>=0;var r=GL.getContext(e),n=UTF8ToString(t);n.startsWith("GL_")&&(n=n.substr(3)),n=="ANGLE_instanced_arrays"&&webgl_enable_ANGLE_instanced_arrays(GLctx),n=="OES_vertex_array_object"&&webgl_enable_OES_vertex_array_object(GLctx),n=="WEBGL_draw_buffers"&&webgl_enable_WEBGL_draw_buffers(GLctx),n=="WEBGL_multi_draw"&&webgl_enable_WEBGL_multi_draw(GLctx),n=="EXT_polygon_offset_clamp"&&webgl_enable_EXT_polygon_offset_clamp(GLctx),n=="EXT_clip_control"&&webgl_enable_EXT_clip_control(GLctx),n=="WEBGL_polygon_mode"&&webgl_enable_WEBGL_polygon_mode(GLctx);var a=r.GLctx.getExtension(n);return!!a}_emscripten_webgl_enable_extension.sig="ipp";var _emscripten_supports_offscreencanvas=()=>0;_emscripten_supports_offscreencanvas.sig="i";var registerWebGlEventCallback=(e,t,r,n,a,o,l)=>{var u=(d=event)=>{getWasmTableEntry(n)(a,0,t)&&d.preventDefault()},_={target:findEventTarget(e),eventTypeString:o,callbackfunc:n,handlerFunc:u,useCapture:r};JSEvents.registerOrRemoveHandler(_)};function _emscripten_set_webglcontextlost_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerWebGlEventCallback(e,t,r,n,31,"webglcontextlost",a),0}_emscripten_set_webglcontextlost_callback_on_thread.sig="ippipp";function _emscripten_set_webglcontextrestored_callback_on_thread(e,t,r,n,a){return e>>>=0,t>>>=0,n>>>=0,a>>>=0,registerWebGlEventCallback(e,t,r,n,32,"webglcontextrestored",a),0}_emscripten_set_webglcontextrestored_callback_on_thread.sig="ippipp";function _emscripten_is_webgl_context_lost(e){return e>>>=0,!GL.contexts[e]||GL.contexts[e].GLctx.isContextLost()}_emscripten_is_webgl_context_lost.sig="ip";function _emscripten_webgl_get_supported_extensions(){return stringToNewUTF8(GLctx.getSupportedExtensions().join(" "))}_emscripten_webgl_get_supported_extensions.sig="p";var _emscripten_webgl_get_program_parameter_d=(e,t)=>GLctx.getProgramParameter(GL.programs[e],t);_emscripten_webgl_get_program_parameter_d.sig="dii";function _emscripten_webgl_get_program_info_log_utf8(e){return stringToNewUTF8(GLctx.getProgramInfoLog(GL.programs[e]))}_emscripten_webgl_get_program_info_log_utf8.sig="pi";var _emscripten_webgl_get_shader_parameter_d=(e,t)=>GLctx.getShaderParameter(GL.shaders[e],t);_emscripten_webgl_get_shader_parameter_d.sig="dii";function _emscripten_webgl_get_shader_info_log_utf8(e){return stringToNewUTF8(GLctx.getShaderInfoLog(GL.shaders[e]))}_emscripten_webgl_get_shader_info_log_utf8.sig="pi";function _emscripten_webgl_get_shader_source_utf8(e){return stringToNewUTF8(GLctx.getShaderSource(GL.shaders[e]))}_emscripten_webgl_get_shader_source_utf8.sig="pi";var _emscripten_webgl_get_vertex_attrib_d=(e,t)=>GLctx.getVertexAttrib(e,t);_emscripten_webgl_get_vertex_attrib_d.sig="dii";var _emscripten_webgl_get_vertex_attrib_o=(e,t)=>{var r=GLctx.getVertexAttrib(e,t);return r==null?void 0:r.name};_emscripten_webgl_get_vertex_attrib_o.sig="iii";function _emscripten_webgl_get_vertex_attrib_v(e,t,r,n,a){return r>>>=0,writeGLArray(GLctx.getVertexAttrib(e,t),r,n,a)}_emscripten_webgl_get_vertex_attrib_v.sig="iiipii";var _emscripten_webgl_get_uniform_d=(e,t)=>GLctx.getUniform(GL.programs[e],webglGetUniformLocation(t));_emscripten_webgl_get_uniform_d.sig="dii";function _emscripten_webgl_get_uniform_v(e,t,r,n,a){return r>>>=0,writeGLArray(GLctx.getUniform(GL.programs[e],webglGetUniformLocation(t)),r,n,a)}_emscripten_webgl_get_uniform_v.sig="iiipii";function _emscripten_webgl_get_parameter_v(e,t,r,n){return t>>>=0,writeGLArray(GLctx.getParameter(e),t,r,n)}_emscripten_webgl_get_parameter_v.sig="iipii";var _emscripten_webgl_get_parameter_d=e=>GLctx.getParameter(e);_emscripten_webgl_get_parameter_d.sig="di";var _emscripten_webgl_get_parameter_o=e=>{var t=GLctx.getParameter(e);return t==null?void 0:t.name};_emscripten_webgl_get_parameter_o.sig="ii";function _emscripten_webgl_get_parameter_utf8(e){return stringToNewUTF8(GLctx.getParameter(e))}_emscripten_webgl_get_parameter_utf8.sig="pi";function _emscripten_webgl_get_parameter_i64v(e,t){return t>>>=0,writeI53ToI64(t,GLctx.getParameter(e))}_emscripten_webgl_get_parameter_i64v.sig="vip";var _glutPostRedisplay=()=>{GLUT.displayFunc&&!GLUT.requestedAnimationFrame&&(GLUT.requestedAnimationFrame=!0,MainLoop.requestAnimationFrame(()=>{GLUT.requestedAnimationFrame=!1,MainLoop.runIter(()=>getWasmTableEntry(GLUT.displayFunc)())}))};_glutPostRedisplay.sig="v";var GLUT={initTime:null,idleFunc:null,displayFunc:null,keyboardFunc:null,keyboardUpFunc:null,specialFunc:null,specialUpFunc:null,reshapeFunc:null,motionFunc:null,passiveMotionFunc:null,mouseFunc:null,buttons:0,modifiers:0,initWindowWidth:256,initWindowHeight:256,initDisplayMode:18,windowX:0,windowY:0,windowWidth:0,windowHeight:0,requestedAnimationFrame:!1,saveModifiers:e=>{GLUT.modifiers=0,e.shiftKey&&(GLUT.modifiers+=1),e.ctrlKey&&(GLUT.modifiers+=2),e.altKey&&(GLUT.modifiers+=4)},onMousemove:e=>{var t=Browser.mouseX,r=Browser.mouseY;Browser.calculateMouseEvent(e);var n=Browser.mouseX,a=Browser.mouseY;n==t&&a==r||(GLUT.buttons==0&&e.target==Module.canvas&&GLUT.passiveMotionFunc?(e.preventDefault(),GLUT.saveModifiers(e),getWasmTableEntry(GLUT.passiveMotionFunc)(t,r)):GLUT.buttons!=0&&GLUT.motionFunc&&(e.preventDefault(),GLUT.saveModifiers(e),getWasmTableEntry(GLUT.motionFunc)(t,r)))},getSpecialKey:e=>{var t=null;switch(e){case 8:t=120;break;case 46:t=111;break;case 112:t=1;break;case 113:t=2;break;case 114:t=3;break;case 115:t=4;break;case 116:t=5;break;case 117:t=6;break;case 118:t=7;break;case 119:t=8;break;case 120:t=9;break;case 121:t=10;break;case 122:t=11;break;case 123:t=12;break;case 37:t=100;break;case 38:t=101;break;case 39:t=102;break;case 40:t=103;break;case 33:t=104;break;case 34:t=105;break;case 36:t=106;break;case 35:t=107;break;case 45:t=108;break;case 16:case 5:t=112;break;case 6:t=113;break;case 17:case 3:t=114;break;case 4:t=115;break;case 18:case 2:t=116;break;case 1:t=117;break}return t},getASCIIKey:e=>{if(e.ctrlKey||e.altKey||e.metaKey)return null;var t=e.keyCode;if(48<=t&&t<=57)return t;if(65<=t&&t<=90)return e.shiftKey?t:t+32;if(96<=t&&t<=105)return t-48;if(106<=t&&t<=111)return t-106+42;switch(t){case 9:case 13:case 27:case 32:case 61:return t}var r=e.shiftKey;switch(t){case 186:return r?58:59;case 187:return r?43:61;case 188:return r?60:44;case 189:return r?95:45;case 190:return r?62:46;case 191:return r?63:47;case 219:return r?123:91;case 220:return r?124:47;case 221:return r?125:93;case 222:return r?34:39}return null},onKeydown:e=>{if(GLUT.specialFunc||GLUT.keyboardFunc){var t=GLUT.getSpecialKey(e.keyCode);t!==null?GLUT.specialFunc&&(e.preventDefault(),GLUT.saveModifiers(e),getWasmTableEntry(GLUT.specialFunc)(t,Browser.mouseX,Browser.mouseY)):(t=GLUT.getASCIIKey(e),t!==null&&GLUT.keyboardFunc&&(e.preventDefault(),GLUT.saveModifiers(e),getWasmTableEntry(GLUT.keyboardFunc)(t,Browser.mouseX,Browser.mouseY)))}},onKeyup:e=>{if(GLUT.specialUpFunc||GLUT.keyboardUpFunc){var t=GLUT.getSpecialKey(e.keyCode);t!==null?GLUT.specialUpFunc&&(e.preventDefault(),GLUT.saveModifiers(e),getWasmTableEntry(GLUT.specialUpFunc)(t,Browser.mouseX,Browser.mouseY)):(t=GLUT.getASCIIKey(e),t!==null&&GLUT.keyboardUpFunc&&(e.preventDefault(),GLUT.saveModifiers(e),getWasmTableEntry(GLUT.keyboardUpFunc)(t,Browser.mouseX,Browser.mouseY)))}},touchHandler:e=>{if(e.target==Module.canvas){var t=e.changedTouches,r=t[0],n="";switch(e.type){case"touchstart":n="mousedown";break;case"touchmove":n="mousemove";break;case"touchend":n="mouseup";break;default:return}var a=document.createEvent("MouseEvent");a.initMouseEvent(n,!0,!0,window,1,r.screenX,r.screenY,r.clientX,r.clientY,!1,!1,!1,!1,0,null),r.target.dispatchEvent(a),e.preventDefault()}},onMouseButtonDown:e=>{if(Browser.calculateMouseEvent(e),GLUT.buttons|=1<<e.button,e.target==Module.canvas&&GLUT.mouseFunc){try{e.target.setCapture()}catch(t){}e.preventDefault(),GLUT.saveModifiers(e),getWasmTableEntry(GLUT.mouseFunc)(e.button,0,Browser.mouseX,Browser.mouseY)}},onMouseButtonUp:e=>{Browser.calculateMouseEvent(e),GLUT.buttons&=~(1<<e.button),GLUT.mouseFunc&&(e.preventDefault(),GLUT.saveModifiers(e),getWasmTableEntry(GLUT.mouseFunc)(e.button,1,Browser.mouseX,Browser.mouseY))},onMouseWheel:e=>{Browser.calculateMouseEvent(e);var t=window.event||e,r=-Browser.getMouseWheelDelta(e);r=r==0?0:r>0?Math.max(r,1):Math.min(r,-1);var n=3;r<0&&(n=4),GLUT.mouseFunc&&(e.preventDefault(),GLUT.saveModifiers(e),getWasmTableEntry(GLUT.mouseFunc)(n,0,Browser.mouseX,Browser.mouseY))},onFullscreenEventChange:e=>{var t,r;document.fullscreen||document.fullScreen||document.mozFullScreen||document.webkitIsFullScreen?(t=screen.width,r=screen.height):(t=GLUT.windowWidth,r=GLUT.windowHeight,document.removeEventListener("fullscreenchange",GLUT.onFullscreenEventChange,!0),document.removeEventListener("mozfullscreenchange",GLUT.onFullscreenEventChange,!0),document.removeEventListener("webkitfullscreenchange",GLUT.onFullscreenEventChange,!0)),Browser.setCanvasSize(t,r,!0),GLUT.reshapeFunc&&getWasmTableEntry(GLUT.reshapeFunc)(t,r),_glutPostRedisplay()}},_glutGetModifiers=()=>GLUT.modifiers;_glutGetModifiers.sig="i";function _glutInit(e,t){e>>>=0,t>>>=0,GLUT.initTime=Date.now();var r="ontouchstart"in document.documentElement;r&&(window.addEventListener("touchmove",GLUT.touchHandler,!0),window.addEventListener("touchstart",GLUT.touchHandler,!0),window.addEventListener("touchend",GLUT.touchHandler,!0)),window.addEventListener("keydown",GLUT.onKeydown,!0),window.addEventListener("keyup",GLUT.onKeyup,!0),window.addEventListener("mousemove",GLUT.onMousemove,!0),window.addEventListener("mousedown",GLUT.onMouseButtonDown,!0),window.addEventListener("mouseup",GLUT.onMouseButtonUp,!0),window.addEventListener("mousewheel",GLUT.onMouseWheel,!0),window.addEventListener("DOMMouseScroll",GLUT.onMouseWheel,!0),Browser.resizeListeners.push((n,a)=>{GLUT.reshapeFunc&&getWasmTableEntry(GLUT.reshapeFunc)(n,a)}),__ATEXIT__.push(()=>{r&&(window.removeEventListener("touchmove",GLUT.touchHandler,!0),window.removeEventListener("touchstart",GLUT.touchHandler,!0),window.removeEventListener("touchend",GLUT.touchHandler,!0)),window.removeEventListener("keydown",GLUT.onKeydown,!0),window.removeEventListener("keyup",GLUT.onKeyup,!0),window.removeEventListener("mousemove",GLUT.onMousemove,!0),window.removeEventListener("mousedown",GLUT.onMouseButtonDown,!0),window.removeEventListener("mouseup",GLUT.onMouseButtonUp,!0),window.removeEventListener("mousewheel",GLUT.onMouseWheel,!0),window.removeEventListener("DOMMouseScroll",GLUT.onMouseWheel,!0),Module.canvas.width=Module.canvas.height=1})}_glutInit.sig="vpp";var _glutInitWindowSize=(e,t)=>{Browser.setCanvasSize(GLUT.initWindowWidth=e,GLUT.initWindowHeight=t)};_glutInitWindowSize.sig="vii";var _glutInitWindowPosition=(e,t)=>{};_glutInitWindowPosition.sig="vii";var _glutGet=e=>{switch(e){case 100:return 0;case 101:return 0;case 102:return Module.canvas.width;case 103:return Module.canvas.height;case 200:return Module.canvas.width;case 201:return Module.canvas.height;case 500:return 0;case 501:return 0;case 502:return GLUT.initWindowWidth;case 503:return GLUT.initWindowHeight;case 700:var t=Date.now();return t-GLUT.initTime;case 105:return Module.ctx.getContextAttributes().stencil?8:0;case 106:return Module.ctx.getContextAttributes().depth?8:0;case 110:return Module.ctx.getContextAttributes().alpha?8:0;case 120:return Module.ctx.getContextAttributes().antialias?1:0;default:throw"glutGet("+e+") not implemented yet"}};_glutGet.sig="ii";function _glutIdleFunc(e){e>>>=0;function t(){GLUT.idleFunc&&(getWasmTableEntry(GLUT.idleFunc)(),safeSetTimeout(t,4))}GLUT.idleFunc||safeSetTimeout(t,0),GLUT.idleFunc=e}_glutIdleFunc.sig="vp";var _glutTimerFunc=function(e,t,r){return t>>>=0,safeSetTimeout(()=>getWasmTableEntry(t)(r),e)};_glutTimerFunc.sig="vipi";function _glutDisplayFunc(e){e>>>=0,GLUT.displayFunc=e}_glutDisplayFunc.sig="vp";function _glutKeyboardFunc(e){e>>>=0,GLUT.keyboardFunc=e}_glutKeyboardFunc.sig="vp";function _glutKeyboardUpFunc(e){e>>>=0,GLUT.keyboardUpFunc=e}_glutKeyboardUpFunc.sig="vp";function _glutSpecialFunc(e){e>>>=0,GLUT.specialFunc=e}_glutSpecialFunc.sig="vp";function _glutSpecialUpFunc(e){e>>>=0,GLUT.specialUpFunc=e}_glutSpecialUpFunc.sig="vp";function _glutReshapeFunc(e){e>>>=0,GLUT.reshapeFunc=e}_glutReshapeFunc.sig="vp";function _glutMotionFunc(e){e>>>=0,GLUT.motionFunc=e}_glutMotionFunc.sig="vp";function _glutPassiveMotionFunc(e){e>>>=0,GLUT.passiveMotionFunc=e}_glutPassiveMotionFunc.sig="vp";function _glutMouseFunc(e){e>>>=0,GLUT.mouseFunc=e}_glutMouseFunc.sig="vp";var _glutSetCursor=e=>{var t="auto";switch(e){case 0:break;case 1:break;case 2:t="pointer";break;case 3:break;case 4:t="help";break;case 5:break;case 6:break;case 7:t="wait";break;case 8:t="text";break;case 9:case 102:t="crosshair";break;case 10:t="ns-resize";break;case 11:t="ew-resize";break;case 12:t="n-resize";break;case 13:t="s-resize";break;case 14:t="w-resize";break;case 15:t="e-resize";break;case 16:t="nw-resize";break;case 17:t="ne-resize";break;case 18:t="se-resize";break;case 19:t="sw-resize";break;case 100:break;case 101:t="none";break;default:throw"glutSetCursor: Unknown cursor type: "+e}Module.canvas.style.cursor=t};_glutSetCursor.sig="vi";function _glutCreateWindow(e){e>>>=0;var t={antialias:(GLUT.initDisplayMode&128)!=0,depth:(GLUT.initDisplayMode&16)!=0,stencil:(GLUT.initDisplayMode&32)!=0,alpha:(GLUT.initDisplayMode&8)!=0};return Module.ctx=Browser.createContext(Module.canvas,!0,!0,t),Module.ctx?1:0}_glutCreateWindow.sig="ip";var _glutDestroyWindow=e=>(delete Module.ctx,1);_glutDestroyWindow.sig="vi";var _glutReshapeWindow=(e,t)=>{Browser.exitFullscreen(),Browser.setCanvasSize(e,t,!0),GLUT.reshapeFunc&&getWasmTableEntry(GLUT.reshapeFunc)(e,t),_glutPostRedisplay()};_glutReshapeWindow.sig="vii";var _glutPositionWindow=(e,t)=>{Browser.exitFullscreen(),_glutPostRedisplay()};_glutPositionWindow.sig="vii";var _glutFullScreen=()=>{GLUT.windowX=0,GLUT.windowY=0,GLUT.windowWidth=Module.canvas.width,GLUT.windowHeight=Module.canvas.height,document.addEventListener("fullscreenchange",GLUT.onFullscreenEventChange,!0),document.addEventListener("mozfullscreenchange",GLUT.onFullscreenEventChange,!0),document.addEventListener("webkitfullscreenchange",GLUT.onFullscreenEventChange,!0),Browser.requestFullscreen(!1,!1)};_glutFullScreen.sig="v";var _glutInitDisplayMode=e=>GLUT.initDisplayMode=e;_glutInitDisplayMode.sig="vi";var _glutSwapBuffers=()=>{};_glutSwapBuffers.sig="v";var _glutMainLoop=()=>{throw _glutReshapeWindow(Module.canvas.width,Module.canvas.height),_glutPostRedisplay(),"unwind"};_glutMainLoop.sig="v";function _XOpenDisplay(e){return e>>>=0,1}_XOpenDisplay.sig="pp";function _XCreateWindow(e,t,r,n,a,o,l,u,_,d,f,p){return e>>>=0,t>>>=0,d>>>=0,f>>>=0,p>>>=0,Browser.setCanvasSize(a,o),2}_XCreateWindow.sig="pppiiiiiiippp";function _XChangeWindowAttributes(e,t,r,n){e>>>=0,t>>>=0,r>>>=0,n>>>=0}_XChangeWindowAttributes.sig="ipppp";function _XSetWMHints(e,t,r){e>>>=0,t>>>=0,r>>>=0}_XSetWMHints.sig="ippp";function _XMapWindow(e,t){e>>>=0,t>>>=0}_XMapWindow.sig="ipp";function _XStoreName(e,t,r){e>>>=0,t>>>=0,r>>>=0}_XStoreName.sig="ippp";function _XInternAtom(e,t,r){return e>>>=0,t>>>=0,0}_XInternAtom.sig="pppi";function _XSendEvent(e,t,r,n,a){e>>>=0,t>>>=0,n>>>=0,a>>>=0}_XSendEvent.sig="ippipp";function _XPending(e){return e>>>=0,0}_XPending.sig="ip";var EGL={errorCode:12288,defaultDisplayInitialized:!1,currentContext:0,currentReadSurface:0,currentDrawSurface:0,contextAttributes:{alpha:!1,depth:!1,stencil:!1,antialias:!1},stringCache:{},setErrorCode(e){EGL.errorCode=e},chooseConfig(e,t,r,n,a){if(e!=62e3)return EGL.setErrorCode(12296),0;if(t)for(;;){var o=HEAP32[t>>>2>>>0];if(o==12321){var l=HEAP32[t+4>>>2>>>0];EGL.contextAttributes.alpha=l>0}else if(o==12325){var u=HEAP32[t+4>>>2>>>0];EGL.contextAttributes.depth=u>0}else if(o==12326){var _=HEAP32[t+4>>>2>>>0];EGL.contextAttributes.stencil=_>0}else if(o==12337){var d=HEAP32[t+4>>>2>>>0];EGL.contextAttributes.antialias=d>0}else if(o==12338){var d=HEAP32[t+4>>>2>>>0];EGL.contextAttributes.antialias=d==1}else if(o==12544){var f=HEAP32[t+4>>>2>>>0];EGL.contextAttributes.lowLatency=f!=12547}else if(o==12344)break;t+=8}return(!r||!n)&&!a?(EGL.setErrorCode(12300),0):(a&&(HEAP32[a>>>2>>>0]=1),r&&n>0&&(HEAPU32[r>>>2>>>0]=62002),EGL.setErrorCode(12288),1)}};function _eglGetDisplay(e){return e>>>=0,EGL.setErrorCode(12288),e!=0&&e!=1?0:62e3}_eglGetDisplay.sig="pp";function _eglInitialize(e,t,r){return e>>>=0,t>>>=0,r>>>=0,e!=62e3?(EGL.setErrorCode(12296),0):(t&&(HEAP32[t>>>2>>>0]=1),r&&(HEAP32[r>>>2>>>0]=4),EGL.defaultDisplayInitialized=!0,EGL.setErrorCode(12288),1)}_eglInitialize.sig="ippp";function _eglTerminate(e){return e>>>=0,e!=62e3?(EGL.setErrorCode(12296),0):(EGL.currentContext=0,EGL.currentReadSurface=0,EGL.currentDrawSurface=0,EGL.defaultDisplayInitialized=!1,EGL.setErrorCode(12288),1)}_eglTerminate.sig="ip";function _eglGetConfigs(e,t,r,n){return e>>>=0,t>>>=0,n>>>=0,EGL.chooseConfig(e,0,t,r,n)}_eglGetConfigs.sig="ippip";function _eglChooseConfig(e,t,r,n,a){return e>>>=0,t>>>=0,r>>>=0,a>>>=0,EGL.chooseConfig(e,t,r,n,a)}_eglChooseConfig.sig="ipppip";function _eglGetConfigAttrib(e,t,r,n){if(e>>>=0,t>>>=0,n>>>=0,e!=62e3)return EGL.setErrorCode(12296),0;if(t!=62002)return EGL.setErrorCode(12293),0;if(!n)return EGL.setErrorCode(12300),0;switch(EGL.setErrorCode(12288),r){case 12320:return HEAP32[n>>>2>>>0]=EGL.contextAttributes.alpha?32:24,1;case 12321:return HEAP32[n>>>2>>>0]=EGL.contextAttributes.alpha?8:0,1;case 12322:return HEAP32[n>>>2>>>0]=8,1;case 12323:return HEAP32[n>>>2>>>0]=8,1;case 12324:return HEAP32[n>>>2>>>0]=8,1;case 12325:return HEAP32[n>>>2>>>0]=EGL.contextAttributes.depth?24:0,1;case 12326:return HEAP32[n>>>2>>>0]=EGL.contextAttributes.stencil?8:0,1;case 12327:return HEAP32[n>>>2>>>0]=12344,1;case 12328:return HEAP32[n>>>2>>>0]=62002,1;case 12329:return HEAP32[n>>>2>>>0]=0,1;case 12330:return HEAP32[n>>>2>>>0]=4096,1;case 12331:return HEAP32[n>>>2>>>0]=16777216,1;case 12332:return HEAP32[n>>>2>>>0]=4096,1;case 12333:return HEAP32[n>>>2>>>0]=0,1;case 12334:return HEAP32[n>>>2>>>0]=0,1;case 12335:return HEAP32[n>>>2>>>0]=12344,1;case 12337:return HEAP32[n>>>2>>>0]=EGL.contextAttributes.antialias?4:0,1;case 12338:return HEAP32[n>>>2>>>0]=EGL.contextAttributes.antialias?1:0,1;case 12339:return HEAP32[n>>>2>>>0]=4,1;case 12340:return HEAP32[n>>>2>>>0]=12344,1;case 12341:case 12342:case 12343:return HEAP32[n>>>2>>>0]=-1,1;case 12345:case 12346:return HEAP32[n>>>2>>>0]=0,1;case 12347:return HEAP32[n>>>2>>>0]=0,1;case 12348:return HEAP32[n>>>2>>>0]=1,1;case 12349:case 12350:return HEAP32[n>>>2>>>0]=0,1;case 12351:return HEAP32[n>>>2>>>0]=12430,1;case 12352:return HEAP32[n>>>2>>>0]=4,1;case 12354:return HEAP32[n>>>2>>>0]=0,1;default:return EGL.setErrorCode(12292),0}}_eglGetConfigAttrib.sig="ippip";function _eglCreateWindowSurface(e,t,r,n){return e>>>=0,t>>>=0,n>>>=0,e!=62e3?(EGL.setErrorCode(12296),0):t!=62002?(EGL.setErrorCode(12293),0):(EGL.setErrorCode(12288),62006)}_eglCreateWindowSurface.sig="pppip";function _eglDestroySurface(e,t){return e>>>=0,t>>>=0,e!=62e3?(EGL.setErrorCode(12296),0):t!=62006?(EGL.setErrorCode(12301),1):(EGL.currentReadSurface==t&&(EGL.currentReadSurface=0),EGL.currentDrawSurface==t&&(EGL.currentDrawSurface=0),EGL.setErrorCode(12288),1)}_eglDestroySurface.sig="ipp";function _eglCreateContext(e,t,r,n){if(e>>>=0,t>>>=0,r>>>=0,n>>>=0,e!=62e3)return EGL.setErrorCode(12296),0;for(var a=1;;){var o=HEAP32[n>>>2>>>0];if(o==12440)a=HEAP32[n+4>>>2>>>0];else{if(o==12344)break;return EGL.setErrorCode(12292),0}n+=8}return a!=2?(EGL.setErrorCode(12293),0):(EGL.contextAttributes.majorVersion=a-1,EGL.contextAttributes.minorVersion=0,EGL.context=GL.createContext(Module.canvas,EGL.contextAttributes),EGL.context!=0?(EGL.setErrorCode(12288),GL.makeContextCurrent(EGL.context),Browser.useWebGL=!0,Browser.moduleContextCreatedCallbacks.forEach(l=>l()),GL.makeContextCurrent(null),62004):(EGL.setErrorCode(12297),0))}_eglCreateContext.sig="ppppp";function _eglDestroyContext(e,t){return e>>>=0,t>>>=0,e!=62e3?(EGL.setErrorCode(12296),0):t!=62004?(EGL.setErrorCode(12294),0):(GL.deleteContext(EGL.context),EGL.setErrorCode(12288),EGL.currentContext==t&&(EGL.currentContext=0),1)}_eglDestroyContext.sig="ipp";function _eglQuerySurface(e,t,r,n){if(e>>>=0,t>>>=0,n>>>=0,e!=62e3)return EGL.setErrorCode(12296),0;if(t!=62006)return EGL.setErrorCode(12301),0;if(!n)return EGL.setErrorCode(12300),0;switch(EGL.setErrorCode(12288),r){case 12328:return HEAP32[n>>>2>>>0]=62002,1;case 12376:return 1;case 12375:return HEAP32[n>>>2>>>0]=Module.canvas.width,1;case 12374:return HEAP32[n>>>2>>>0]=Module.canvas.height,1;case 12432:return HEAP32[n>>>2>>>0]=-1,1;case 12433:return HEAP32[n>>>2>>>0]=-1,1;case 12434:return HEAP32[n>>>2>>>0]=-1,1;case 12422:return HEAP32[n>>>2>>>0]=12420,1;case 12441:return HEAP32[n>>>2>>>0]=12442,1;case 12435:return HEAP32[n>>>2>>>0]=12437,1;case 12416:case 12417:case 12418:case 12419:return 1;default:return EGL.setErrorCode(12292),0}}_eglQuerySurface.sig="ippip";function _eglQueryContext(e,t,r,n){if(e>>>=0,t>>>=0,n>>>=0,e!=62e3)return EGL.setErrorCode(12296),0;if(t!=62004)return EGL.setErrorCode(12294),0;if(!n)return EGL.setErrorCode(12300),0;switch(EGL.setErrorCode(12288),r){case 12328:return HEAP32[n>>>2>>>0]=62002,1;case 12439:return HEAP32[n>>>2>>>0]=12448,1;case 12440:return HEAP32[n>>>2>>>0]=EGL.contextAttributes.majorVersion+1,1;case 12422:return HEAP32[n>>>2>>>0]=12420,1;default:return EGL.setErrorCode(12292),0}}_eglQueryContext.sig="ippip";var _eglGetError=()=>EGL.errorCode;_eglGetError.sig="i";function _eglQueryString(e,t){if(e>>>=0,e!=62e3)return EGL.setErrorCode(12296),0;if(EGL.setErrorCode(12288),EGL.stringCache[t])return EGL.stringCache[t];var r;switch(t){case 12371:r=stringToNewUTF8("Emscripten");break;case 12372:r=stringToNewUTF8("1.4 Emscripten EGL");break;case 12373:r=stringToNewUTF8("");break;case 12429:r=stringToNewUTF8("OpenGL_ES");break;default:return EGL.setErrorCode(12300),0}return EGL.stringCache[t]=r,r}_eglQueryString.sig="ppi";var _eglBindAPI=e=>e==12448?(EGL.setErrorCode(12288),1):(EGL.setErrorCode(12300),0);_eglBindAPI.sig="ii";var _eglQueryAPI=()=>(EGL.setErrorCode(12288),12448);_eglQueryAPI.sig="i";var _eglWaitClient=()=>(EGL.setErrorCode(12288),1);_eglWaitClient.sig="i";var _eglWaitNative=e=>(EGL.setErrorCode(12288),1);_eglWaitNative.sig="ii";var _eglWaitGL=_eglWaitClient;_eglWaitGL.sig="i";function _eglSwapInterval(e,t){return e>>>=0,e!=62e3?(EGL.setErrorCode(12296),0):(t==0?_emscripten_set_main_loop_timing(0,0):_emscripten_set_main_loop_timing(1,t),EGL.setErrorCode(12288),1)}_eglSwapInterval.sig="ipi";function _eglMakeCurrent(e,t,r,n){return e>>>=0,t>>>=0,r>>>=0,n>>>=0,e!=62e3?(EGL.setErrorCode(12296),0):n!=0&&n!=62004?(EGL.setErrorCode(12294),0):r!=0&&r!=62006||t!=0&&t!=62006?(EGL.setErrorCode(12301),0):(GL.makeContextCurrent(n?EGL.context:null),EGL.currentContext=n,EGL.currentDrawSurface=t,EGL.currentReadSurface=r,EGL.setErrorCode(12288),1)}_eglMakeCurrent.sig="ipppp";function _eglGetCurrentContext(){return EGL.currentContext}_eglGetCurrentContext.sig="p";function _eglGetCurrentSurface(e){return e==12378?EGL.currentReadSurface:e==12377?EGL.currentDrawSurface:(EGL.setErrorCode(12300),0)}_eglGetCurrentSurface.sig="pi";function _eglGetCurrentDisplay(){return EGL.currentContext?62e3:0}_eglGetCurrentDisplay.sig="p";function _eglSwapBuffers(e,t){if(e>>>=0,t>>>=0,!EGL.defaultDisplayInitialized)EGL.setErrorCode(12289);else if(!Module.ctx)EGL.setErrorCode(12290);else if(Module.ctx.isContextLost())EGL.setErrorCode(12302);else return EGL.setErrorCode(12288),1;return 0}_eglSwapBuffers.sig="ipp";var _eglReleaseThread=()=>(EGL.currentContext=0,EGL.currentReadSurface=0,EGL.currentDrawSurface=0,EGL.setErrorCode(12288),1);_eglReleaseThread.sig="i";function _uuid_clear(e){return e>>>=0,zeroMemory(e,16)}_uuid_clear.sig="vp";function _uuid_compare(e,t){return e>>>=0,t>>>=0,_memcmp(e,t,16)}_uuid_compare.sig="ipp";function _uuid_copy(e,t){return e>>>=0,t>>>=0,_memcpy(e,t,16)}_uuid_copy.sig="vpp";function _uuid_generate(e){e>>>=0;var t=null;if(ENVIRONMENT_IS_NODE)try{var r=xi("crypto").randomBytes;t=r(16)}catch(l){}else ENVIRONMENT_IS_WEB&&typeof window.crypto<"u"&&typeof window.crypto.getRandomValues<"u"&&(t=new Uint8Array(16),window.crypto.getRandomValues(t));if(!t){t=new Array(16);for(var n=new Date().getTime(),a=0;a<16;a++){var o=(n+Math.random()*256)%256|0;n=n/256|0,t[a]=o}}t[6]=t[6]&15|64,t[8]=t[8]&63|128,writeArrayToMemory(t,e)}_uuid_generate.sig="vp";function _uuid_is_null(e){e>>>=0;for(var t=0;t<4;t++,e=e+4|0){var r=HEAP32[e>>>2>>>0];if(r)return 0}return 1}_uuid_is_null.sig="ip";function _uuid_parse(e,t){if(e>>>=0,t>>>=0,e=UTF8ToString(e),e.length===36){var r=0,n=new Array(16);return e.toLowerCase().replace(/[0-9a-f]{2}/g,function(a){r<16&&(n[r++]=parseInt(a,16))}),r<16?-1:(writeArrayToMemory(n,t),0)}return-1}_uuid_parse.sig="ipp";function _uuid_unparse(e,t,r){e>>>=0,t>>>=0;var n=0,a="xxxx-xx-xx-xx-xxxxxx".replace(/[x]/g,function(o){var l=r?HEAPU8[e+n>>>0].toString(16).toUpperCase():HEAPU8[e+n>>>0].toString(16);return l=l.length===1?"0"+l:l,n++,l});stringToUTF8(a,t,37)}_uuid_unparse.sig="vpp";function _uuid_unparse_lower(e,t){e>>>=0,t>>>=0,_uuid_unparse(e,t)}_uuid_unparse_lower.sig="vpp";function _uuid_unparse_upper(e,t){e>>>=0,t>>>=0,_uuid_unparse(e,t,!0)}_uuid_unparse_upper.sig="vpp";function _uuid_type(e){return e>>>=0,4}_uuid_type.sig="ip";function _uuid_variant(e){return e>>>=0,1}_uuid_variant.sig="ip";var GLEW={isLinaroFork:1,extensions:null,error:{0:null,1:null,2:null,3:null,4:null,5:null,6:null,7:null,8:null},version:{1:null,2:null,3:null,4:null},errorStringConstantFromCode(e){if(GLEW.isLinaroFork)switch(e){case 4:return"OpenGL ES lib expected, found OpenGL lib";case 5:return"OpenGL lib expected, found OpenGL ES lib";case 6:return"Missing EGL version";case 7:return"EGL 1.1 and up are supported";default:break}switch(e){case 0:return"No error";case 1:return"Missing GL version";case 2:return"GL 1.1 and up are supported";case 3:return"GLX 1.2 and up are supported";default:return null}},errorString(e){if(!GLEW.error[e]){var t=GLEW.errorStringConstantFromCode(e);t||(t="Unknown error",e=8),GLEW.error[e]=stringToNewUTF8(t)}return GLEW.error[e]},versionStringConstantFromCode(e){switch(e){case 1:return"1.10.0";case 2:return"1";case 3:return"10";case 4:return"0";default:return null}},versionString(e){if(!GLEW.version[e]){var t=GLEW.versionStringConstantFromCode(e);if(!t)return 0;GLEW.version[e]=stringToNewUTF8(t)}return GLEW.version[e]},extensionIsSupported(e){return GLEW.extensions||(GLEW.extensions=webglGetExtensions()),GLEW.extensions.includes(e)?1:GLEW.extensions.includes("GL_"+e)}},_glewInit=()=>0;_glewInit.sig="i";function _glewIsSupported(e){e>>>=0;for(var t=UTF8ToString(e).split(" "),r=0;r<t.length;++r)if(!GLEW.extensionIsSupported(t[r]))return 0;return 1}_glewIsSupported.sig="ip";function _glewGetExtension(e){return e>>>=0,GLEW.extensionIsSupported(UTF8ToString(e))}_glewGetExtension.sig="ip";function _glewGetErrorString(e){return GLEW.errorString(e)}_glewGetErrorString.sig="pi";function _glewGetString(e){return GLEW.versionString(e)}_glewGetString.sig="pi";var IDBStore={indexedDB(){if(typeof indexedDB<"u")return indexedDB;var e=null;return typeof window=="object"&&(e=window.indexedDB||window.mozIndexedDB||window.webkitIndexedDB||window.msIndexedDB),assert(e,"IDBStore used, but indexedDB not supported"),e},DB_VERSION:22,DB_STORE_NAME:"FILE_DATA",dbs:{},blobs:[0],getDB(e,t){var r=IDBStore.dbs[e];if(r)return t(null,r);var n;try{n=IDBStore.indexedDB().open(e,IDBStore.DB_VERSION)}catch(a){return t(a)}n.onupgradeneeded=a=>{var o=a.target.result,l=a.target.transaction,u;o.objectStoreNames.contains(IDBStore.DB_STORE_NAME)?u=l.objectStore(IDBStore.DB_STORE_NAME):u=o.createObjectStore(IDBStore.DB_STORE_NAME)},n.onsuccess=()=>{r=n.result,IDBStore.dbs[e]=r,t(null,r)},n.onerror=function(a){t(a.target.error||"unknown error"),a.preventDefault()}},getStore(e,t,r){IDBStore.getDB(e,(n,a)=>{if(n)return r(n);var o=a.transaction([IDBStore.DB_STORE_NAME],t);o.onerror=u=>{r(u.target.error||"unknown error"),u.preventDefault()};var l=o.objectStore(IDBStore.DB_STORE_NAME);r(null,l)})},getFile(e,t,r){IDBStore.getStore(e,"readonly",(n,a)=>{if(n)return r(n);var o=a.get(t);o.onsuccess=l=>{var u=l.target.result;return u?r(null,u):r("file ".concat(t," not found"))},o.onerror=r})},setFile(e,t,r,n){IDBStore.getStore(e,"readwrite",(a,o)=>{if(a)return n(a);var l=o.put(r,t);l.onsuccess=u=>n(),l.onerror=n})},deleteFile(e,t,r){IDBStore.getStore(e,"readwrite",(n,a)=>{if(n)return r(n);var o=a.delete(t);o.onsuccess=l=>r(),o.onerror=r})},existsFile(e,t,r){IDBStore.getStore(e,"readonly",(n,a)=>{if(n)return r(n);var o=a.count(t);o.onsuccess=l=>r(null,l.target.result>0),o.onerror=r})},clearStore(e,t){IDBStore.getStore(e,"readwrite",(r,n)=>{if(r)return t(r);var a=n.clear();a.onsuccess=o=>t(),a.onerror=t})}},_emscripten_idb_async_load=function(e,t,r,n,a){e>>>=0,t>>>=0,r>>>=0,n>>>=0,a>>>=0,IDBStore.getFile(UTF8ToString(e),UTF8ToString(t),(o,l)=>{callUserCallback(()=>{if(o){a&&getWasmTableEntry(a)(r);return}var u=_malloc(l.length);HEAPU8.set(l,u>>>0),getWasmTableEntry(n)(r,u,l.length),_free(u)})})};_emscripten_idb_async_load.sig="vppppp";var _emscripten_idb_async_store=function(e,t,r,n,a,o,l){e>>>=0,t>>>=0,r>>>=0,a>>>=0,o>>>=0,l>>>=0,IDBStore.setFile(UTF8ToString(e),UTF8ToString(t),new Uint8Array(HEAPU8.subarray(r>>>0,r+n>>>0)),u=>{callUserCallback(()=>{if(u){l&&getWasmTableEntry(l)(a);return}o&&getWasmTableEntry(o)(a)})})};_emscripten_idb_async_store.sig="vpppippp";var _emscripten_idb_async_delete=function(e,t,r,n,a){e>>>=0,t>>>=0,r>>>=0,n>>>=0,a>>>=0,IDBStore.deleteFile(UTF8ToString(e),UTF8ToString(t),o=>{callUserCallback(()=>{if(o){a&&getWasmTableEntry(a)(r);return}n&&getWasmTableEntry(n)(r)})})};_emscripten_idb_async_delete.sig="vppppp";var _emscripten_idb_async_exists=function(e,t,r,n,a){e>>>=0,t>>>=0,r>>>=0,n>>>=0,a>>>=0,IDBStore.existsFile(UTF8ToString(e),UTF8ToString(t),(o,l)=>{callUserCallback(()=>{if(o){a&&getWasmTableEntry(a)(r);return}n&&getWasmTableEntry(n)(r,l)})})};_emscripten_idb_async_exists.sig="vppppp";var _emscripten_idb_async_clear=function(e,t,r,n){e>>>=0,t>>>=0,r>>>=0,n>>>=0,IDBStore.clearStore(UTF8ToString(e),a=>{callUserCallback(()=>{if(a){n&&getWasmTableEntry(n)(t);return}r&&getWasmTableEntry(r)(t)})})};_emscripten_idb_async_clear.sig="vpppp";function _emscripten_idb_load(e,t,r,n,a){throw e>>>=0,t>>>=0,r>>>=0,n>>>=0,a>>>=0,"Please compile your program with async support in order to use synchronous operations like emscripten_idb_load, etc."}_emscripten_idb_load.sig="vppppp";function _emscripten_idb_store(e,t,r,n,a){throw e>>>=0,t>>>=0,r>>>=0,a>>>=0,"Please compile your program with async support in order to use synchronous operations like emscripten_idb_store, etc."}_emscripten_idb_store.sig="vpppip";function _emscripten_idb_delete(e,t,r){throw e>>>=0,t>>>=0,r>>>=0,"Please compile your program with async support in order to use synchronous operations like emscripten_idb_delete, etc."}_emscripten_idb_delete.sig="vppp";function _emscripten_idb_exists(e,t,r,n){throw e>>>=0,t>>>=0,r>>>=0,n>>>=0,"Please compile your program with async support in order to use synchronous operations like emscripten_idb_exists, etc."}_emscripten_idb_exists.sig="vpppp";function _emscripten_idb_clear(e,t){throw e>>>=0,t>>>=0,"Please compile your program with async support in order to use synchronous operations like emscripten_idb_clear, etc."}_emscripten_idb_clear.sig="vpp";var runAndAbortIfError=e=>{try{return e()}catch(t){abort(t)}},_emscripten_sleep=()=>{throw"Please compile your program with async support in order to use asynchronous operations like emscripten_sleep"};_emscripten_sleep.sig="vi";function _emscripten_wget(e,t){throw e>>>=0,t>>>=0,"Please compile your program with async support in order to use asynchronous operations like emscripten_wget"}Module._emscripten_wget=_emscripten_wget,_emscripten_wget.sig="ipp";function _emscripten_scan_registers(e){throw e>>>=0,"Please compile your program with async support in order to use asynchronous operations like emscripten_scan_registers"}_emscripten_scan_registers.sig="vp";function _emscripten_fiber_swap(e,t){throw e>>>=0,t>>>=0,"Please compile your program with async support in order to use asynchronous operations like emscripten_fiber_swap"}_emscripten_fiber_swap.sig="vpp";var _SDL_GetTicks=()=>Date.now()-SDL.startTime|0;_SDL_GetTicks.sig="i";function _SDL_LockSurface(e){e>>>=0;var t=SDL.surfaces[e];if(t.locked++,t.locked>1||(t.buffer||(t.buffer=_malloc(t.width*t.height*4),HEAPU32[e+20>>>2>>>0]=t.buffer),HEAPU32[e+20>>>2>>>0]=t.buffer,e==SDL.screen&&Module.screenIsReadOnly&&t.image))return 0;if(SDL.defaults.discardOnLock){if(t.image||(t.image=t.ctx.createImageData(t.width,t.height)),!SDL.defaults.opaqueFrontBuffer)return}else t.image=t.ctx.getImageData(0,0,t.width,t.height);if(e==SDL.screen&&SDL.defaults.opaqueFrontBuffer)for(var r=t.image.data,n=r.length,a=0;a<n/4;a++)r[a*4+3]=255;if(SDL.defaults.copyOnLock&&!SDL.defaults.discardOnLock){if(t.isFlagSet(2097152))throw"CopyOnLock is not supported for SDL_LockSurface with SDL_HWPALETTE flag set"+new Error().stack;HEAPU8.set(t.image.data,t.buffer>>>0)}return 0}_SDL_LockSurface.sig="ip";var SDL={defaults:{width:320,height:200,copyOnLock:!0,discardOnLock:!1,opaqueFrontBuffer:!0},version:null,surfaces:{},canvasPool:[],events:[],fonts:[null],audios:[null],rwops:[null],music:{audio:null,volume:1},mixerFrequency:22050,mixerFormat:32784,mixerNumChannels:2,mixerChunkSize:1024,channelMinimumNumber:0,GL:!1,glAttributes:{0:3,1:3,2:2,3:0,4:0,5:1,6:16,7:0,8:0,9:0,10:0,11:0,12:0,13:0,14:0,15:1,16:0,17:0,18:0},keyboardState:null,keyboardMap:{},canRequestFullscreen:!1,isRequestingFullscreen:!1,textInput:!1,unicode:!1,ttfContext:null,audio:null,startTime:null,initFlags:0,buttonState:0,modState:0,DOMButtons:[0,0,0],DOMEventToSDLEvent:{},TOUCH_DEFAULT_ID:0,eventHandler:null,eventHandlerContext:null,eventHandlerTemp:0,keyCodes:{16:1249,17:1248,18:1250,20:1081,33:1099,34:1102,35:1101,36:1098,37:1104,38:1106,39:1103,40:1105,44:316,45:1097,46:127,91:1251,93:1125,96:1122,97:1113,98:1114,99:1115,100:1116,101:1117,102:1118,103:1119,104:1120,105:1121,106:1109,107:1111,109:1110,110:1123,111:1108,112:1082,113:1083,114:1084,115:1085,116:1086,117:1087,118:1088,119:1089,120:1090,121:1091,122:1092,123:1093,124:1128,125:1129,126:1130,127:1131,128:1132,129:1133,130:1134,131:1135,132:1136,133:1137,134:1138,135:1139,144:1107,160:94,161:33,162:34,163:35,164:36,165:37,166:38,167:95,168:40,169:41,170:42,171:43,172:124,173:45,174:123,175:125,176:126,181:127,182:129,183:128,188:44,190:46,191:47,192:96,219:91,220:92,221:93,222:39,224:1251},scanCodes:{8:42,9:43,13:40,27:41,32:44,35:204,39:53,44:54,46:55,47:56,48:39,49:30,50:31,51:32,52:33,53:34,54:35,55:36,56:37,57:38,58:203,59:51,61:46,91:47,92:49,93:48,96:52,97:4,98:5,99:6,100:7,101:8,102:9,103:10,104:11,105:12,106:13,107:14,108:15,109:16,110:17,111:18,112:19,113:20,114:21,115:22,116:23,117:24,118:25,119:26,120:27,121:28,122:29,127:76,305:224,308:226,316:70},loadRect(e){return{x:HEAP32[e>>>2>>>0],y:HEAP32[e+4>>>2>>>0],w:HEAP32[e+8>>>2>>>0],h:HEAP32[e+12>>>2>>>0]}},updateRect(e,t){HEAP32[e>>>2>>>0]=t.x,HEAP32[e+4>>>2>>>0]=t.y,HEAP32[e+8>>>2>>>0]=t.w,HEAP32[e+12>>>2>>>0]=t.h},intersectionOfRects(e,t){var r=Math.max(e.x,t.x),n=Math.max(e.y,t.y),a=Math.min(e.x+e.w,t.x+t.w),o=Math.min(e.y+e.h,t.y+t.h);return{x:r,y:n,w:Math.max(r,a)-r,h:Math.max(n,o)-n}},checkPixelFormat(e){},loadColorToCSSRGB(e){var t=HEAP32[e>>>2>>>0];return"rgb("+(t&255)+","+(t>>8&255)+","+(t>>16&255)+")"},loadColorToCSSRGBA(e){var t=HEAP32[e>>>2>>>0];return"rgba("+(t&255)+","+(t>>8&255)+","+(t>>16&255)+","+(t>>24&255)/255+")"},translateColorToCSSRGBA:e=>"rgba("+(e&255)+","+(e>>8&255)+","+(e>>16&255)+","+(e>>>24)/255+")",translateRGBAToCSSRGBA:(e,t,r,n)=>"rgba("+(e&255)+","+(t&255)+","+(r&255)+","+(n&255)/255+")",translateRGBAToColor:(e,t,r,n)=>e|t<<8|r<<16|n<<24,makeSurface(e,t,r,n,a,o,l,u,_){var d=r&1,f=r&2097152,p=r&67108864,m=_malloc(60),h=_malloc(44),g=f?1:4,v=0;!d&&!p&&(v=_malloc(e*t*4)),HEAP32[m>>>2>>>0]=r,HEAPU32[m+4>>>2>>>0]=h,HEAP32[m+8>>>2>>>0]=e,HEAP32[m+12>>>2>>>0]=t,HEAP32[m+16>>>2>>>0]=e*g,HEAPU32[m+20>>>2>>>0]=v,HEAP32[m+36>>>2>>>0]=0,HEAP32[m+40>>>2>>>0]=0,HEAP32[m+44>>>2>>>0]=Module.canvas.width,HEAP32[m+48>>>2>>>0]=Module.canvas.height,HEAP32[m+56>>>2>>>0]=1,HEAP32[h>>>2>>>0]=-2042224636,HEAP32[h+4>>>2>>>0]=0,HEAP8[h+8>>>0]=g*8,HEAP8[h+9>>>0]=g,HEAP32[h+12>>>2>>>0]=o||255,HEAP32[h+16>>>2>>>0]=l||65280,HEAP32[h+20>>>2>>>0]=u||16711680,HEAP32[h+24>>>2>>>0]=_||4278190080,SDL.GL=SDL.GL||p;var y;n?y=Module.canvas:(SDL.canvasPool.length>0?y=SDL.canvasPool.pop():y=document.createElement("canvas"),y.width=e,y.height=t);var S={antialias:SDL.glAttributes[13]!=0&&SDL.glAttributes[14]>1,depth:SDL.glAttributes[6]>0,stencil:SDL.glAttributes[7]>0,alpha:SDL.glAttributes[3]>0},w=Browser.createContext(y,p,n,S);return SDL.surfaces[m]={width:e,height:t,canvas:y,ctx:w,surf:m,buffer:v,pixelFormat:h,alpha:255,flags:r,locked:0,usePageCanvas:n,source:a,isFlagSet:D=>r&D},m},copyIndexedColorData(e,t,r,n,a){if(e.colors){var o=Module.canvas.width,l=Module.canvas.height,u=t||0,_=r||0,d=(n||o-u)+u,f=(a||l-_)+_,p=e.buffer;e.image.data32||(e.image.data32=new Uint32Array(e.image.data.buffer));for(var m=e.image.data32,h=e.colors32,g=_;g<f;++g)for(var v=g*o,y=u;y<d;++y)m[v+y]=h[HEAPU8[p+(v+y)>>>0]]}},freeSurface(e){var t=e+56,r=HEAP32[t>>>2>>>0];if(r>1){HEAP32[t>>>2>>>0]=r-1;return}var n=SDL.surfaces[e];!n.usePageCanvas&&n.canvas&&SDL.canvasPool.push(n.canvas),n.buffer&&_free(n.buffer),_free(n.pixelFormat),_free(e),SDL.surfaces[e]=null,e===SDL.screen&&(SDL.screen=null)},blitSurface(e,t,r,n,a){var o=SDL.surfaces[e],l=SDL.surfaces[r],u,_;if(t?u=SDL.loadRect(t):u={x:0,y:0,w:o.width,h:o.height},n?_=SDL.loadRect(n):_={x:0,y:0,w:o.width,h:o.height},l.clipRect){var d=!a||u.w===0?1:u.w/_.w,f=!a||u.h===0?1:u.h/_.h;_=SDL.intersectionOfRects(l.clipRect,_),u.w=_.w*d,u.h=_.h*f,n&&SDL.updateRect(n,_)}var p,m;if(a?(p=_.w,m=_.h):(p=u.w,m=u.h),u.w===0||u.h===0||p===0||m===0)return 0;var h=l.ctx.globalAlpha;return l.ctx.globalAlpha=o.alpha/255,l.ctx.drawImage(o.canvas,u.x,u.y,u.w,u.h,_.x,_.y,p,m),l.ctx.globalAlpha=h,r!=SDL.screen&&(warnOnce("WARNING: copying canvas data to memory for compatibility"),_SDL_LockSurface(r),l.locked--),0},downFingers:{},savedKeydown:null,receiveEvent(e){function t(){for(var f in SDL.keyboardMap)SDL.events.push({type:"keyup",keyCode:SDL.keyboardMap[f]})}switch(e.type){case"touchstart":case"touchmove":{e.preventDefault();var r=[];if(e.type==="touchstart")for(var n=0;n<e.touches.length;n++){var a=e.touches[n];SDL.downFingers[a.identifier]!=!0&&(SDL.downFingers[a.identifier]=!0,r.push(a))}else r=e.touches;var o=r[0];if(o){e.type=="touchstart"&&(SDL.DOMButtons[0]=1);var l;switch(e.type){case"touchstart":l="mousedown";break;case"touchmove":l="mousemove";break}var u={type:l,button:0,pageX:o.clientX,pageY:o.clientY};SDL.events.push(u)}for(var n=0;n<r.length;n++){var a=r[n];SDL.events.push({type:e.type,touch:a})}break}case"touchend":{e.preventDefault();for(var n=0;n<e.changedTouches.length;n++){var a=e.changedTouches[n];SDL.downFingers[a.identifier]===!0&&delete SDL.downFingers[a.identifier]}var u={type:"mouseup",button:0,pageX:e.changedTouches[0].clientX,pageY:e.changedTouches[0].clientY};SDL.DOMButtons[0]=0,SDL.events.push(u);for(var n=0;n<e.changedTouches.length;n++){var a=e.changedTouches[n];SDL.events.push({type:"touchend",touch:a})}break}case"DOMMouseScroll":case"mousewheel":case"wheel":var _=-Browser.getMouseWheelDelta(e);_=_==0?0:_>0?Math.max(_,1):Math.min(_,-1);var d=_>0?3:4;SDL.events.push({type:"mousedown",button:d,pageX:e.pageX,pageY:e.pageY}),SDL.events.push({type:"mouseup",button:d,pageX:e.pageX,pageY:e.pageY}),SDL.events.push({type:"wheel",deltaX:0,deltaY:_}),e.preventDefault();break;case"mousemove":if(SDL.DOMButtons[0]===1&&SDL.events.push({type:"touchmove",touch:{identifier:0,deviceID:-1,pageX:e.pageX,pageY:e.pageY}}),Browser.pointerLock&&("mozMovementX"in e&&(e.movementX=e.mozMovementX,e.movementY=e.mozMovementY),e.movementX==0&&e.movementY==0)){e.preventDefault();return}case"keydown":case"keyup":case"keypress":case"mousedown":case"mouseup":if((e.type!=="keydown"||!SDL.unicode&&!SDL.textInput||e.keyCode===8||e.keyCode===9)&&e.preventDefault(),e.type=="mousedown")SDL.DOMButtons[e.button]=1,SDL.events.push({type:"touchstart",touch:{identifier:0,deviceID:-1,pageX:e.pageX,pageY:e.pageY}});else if(e.type=="mouseup"){if(!SDL.DOMButtons[e.button])return;SDL.events.push({type:"touchend",touch:{identifier:0,deviceID:-1,pageX:e.pageX,pageY:e.pageY}}),SDL.DOMButtons[e.button]=0}e.type==="keydown"||e.type==="mousedown"?SDL.canRequestFullscreen=!0:(e.type==="keyup"||e.type==="mouseup")&&(SDL.isRequestingFullscreen&&(Module.requestFullscreen(!0,!0),SDL.isRequestingFullscreen=!1),SDL.canRequestFullscreen=!1),e.type==="keypress"&&SDL.savedKeydown?(SDL.savedKeydown.keypressCharCode=e.charCode,SDL.savedKeydown=null):e.type==="keydown"&&(SDL.savedKeydown=e),(e.type!=="keypress"||SDL.textInput)&&SDL.events.push(e);break;case"mouseout":for(var n=0;n<3;n++)SDL.DOMButtons[n]&&(SDL.events.push({type:"mouseup",button:n,pageX:e.pageX,pageY:e.pageY}),SDL.DOMButtons[n]=0);e.preventDefault();break;case"focus":SDL.events.push(e),e.preventDefault();break;case"blur":SDL.events.push(e),t(),e.preventDefault();break;case"visibilitychange":SDL.events.push({type:"visibilitychange",visible:!document.hidden}),t(),e.preventDefault();break;case"unload":MainLoop.runner&&(SDL.events.push(e),MainLoop.runner());return;case"resize":SDL.events.push(e),e.preventDefault&&e.preventDefault();break}SDL.events.length>=1e4&&(err("SDL event queue full, dropping events"),SDL.events=SDL.events.slice(0,1e4)),SDL.flushEventsToHandler()},lookupKeyCodeForEvent(e){var t=e.keyCode;return t>=65&&t<=90?t+=32:(t=SDL.keyCodes[e.keyCode]||e.keyCode,e.location===2&&t>=1248&&t<=1251&&(t+=4)),t},handleEvent(e){if(!e.handled)switch(e.handled=!0,e.type){case"touchstart":case"touchend":case"touchmove":{Browser.calculateMouseEvent(e);break}case"keydown":case"keyup":{var t=e.type==="keydown",r=SDL.lookupKeyCodeForEvent(e);HEAP8[SDL.keyboardState+r>>>0]=t,SDL.modState=(HEAP8[SDL.keyboardState+1248>>>0]?64:0)|(HEAP8[SDL.keyboardState+1249>>>0]?1:0)|(HEAP8[SDL.keyboardState+1250>>>0]?256:0)|(HEAP8[SDL.keyboardState+1252>>>0]?128:0)|(HEAP8[SDL.keyboardState+1253>>>0]?2:0)|(HEAP8[SDL.keyboardState+1254>>>0]?512:0),t?SDL.keyboardMap[r]=e.keyCode:delete SDL.keyboardMap[r];break}case"mousedown":case"mouseup":e.type=="mousedown"?SDL.buttonState|=1<<e.button:e.type=="mouseup"&&(SDL.buttonState&=~(1<<e.button));case"mousemove":{Browser.calculateMouseEvent(e);break}}},flushEventsToHandler(){if(SDL.eventHandler)for(;SDL.pollEvent(SDL.eventHandlerTemp);)getWasmTableEntry(SDL.eventHandler)(SDL.eventHandlerContext,SDL.eventHandlerTemp)},pollEvent(e){if(SDL.initFlags&512&&SDL.joystickEventState&&SDL.queryJoysticks(),e){for(;SDL.events.length>0;)if(SDL.makeCEvent(SDL.events.shift(),e)!==!1)return 1;return 0}return SDL.events.length>0},makeCEvent(e,t){if(typeof e=="number"){_memcpy(t,e,28),_free(e);return}switch(SDL.handleEvent(e),e.type){case"keydown":case"keyup":{var r=e.type==="keydown",n=SDL.lookupKeyCodeForEvent(e),a;n>=1024?a=n-1024:a=SDL.scanCodes[n]||n,HEAP32[t>>>2>>>0]=SDL.DOMEventToSDLEvent[e.type],HEAP8[t+8>>>0]=r?1:0,HEAP8[t+9>>>0]=0,HEAP32[t+12>>>2>>>0]=a,HEAP32[t+16>>>2>>>0]=n,HEAP16[t+20>>>1>>>0]=SDL.modState,HEAP32[t+24>>>2>>>0]=e.keypressCharCode||n;break}case"keypress":{HEAP32[t>>>2>>>0]=SDL.DOMEventToSDLEvent[e.type];for(var o=intArrayFromString(String.fromCharCode(e.charCode)),l=0;l<o.length;++l)HEAP8[t+(8+l)>>>0]=o[l];break}case"mousedown":case"mouseup":case"mousemove":{if(e.type!="mousemove"){var r=e.type==="mousedown";HEAP32[t>>>2>>>0]=SDL.DOMEventToSDLEvent[e.type],HEAP32[t+4>>>2>>>0]=0,HEAP32[t+8>>>2>>>0]=0,HEAP32[t+12>>>2>>>0]=0,HEAP8[t+16>>>0]=e.button+1,HEAP8[t+17>>>0]=r?1:0,HEAP32[t+20>>>2>>>0]=Browser.mouseX,HEAP32[t+24>>>2>>>0]=Browser.mouseY}else HEAP32[t>>>2>>>0]=SDL.DOMEventToSDLEvent[e.type],HEAP32[t+4>>>2>>>0]=0,HEAP32[t+8>>>2>>>0]=0,HEAP32[t+12>>>2>>>0]=0,HEAP32[t+16>>>2>>>0]=SDL.buttonState,HEAP32[t+20>>>2>>>0]=Browser.mouseX,HEAP32[t+24>>>2>>>0]=Browser.mouseY,HEAP32[t+28>>>2>>>0]=Browser.mouseMovementX,HEAP32[t+32>>>2>>>0]=Browser.mouseMovementY;break}case"wheel":{HEAP32[t>>>2>>>0]=SDL.DOMEventToSDLEvent[e.type],HEAP32[t+16>>>2>>>0]=e.deltaX,HEAP32[t+20>>>2>>>0]=e.deltaY;break}case"touchstart":case"touchend":case"touchmove":{var u=e.touch;if(!Browser.touches[u.identifier])break;var _=Module.canvas.width,d=Module.canvas.height,f=Browser.touches[u.identifier].x/_,p=Browser.touches[u.identifier].y/d,m=Browser.lastTouches[u.identifier].x/_,h=Browser.lastTouches[u.identifier].y/d,g=f-m,v=p-h;if(u.deviceID===void 0&&(u.deviceID=SDL.TOUCH_DEFAULT_ID),g===0&&v===0&&e.type==="touchmove")return!1;HEAP32[t>>>2>>>0]=SDL.DOMEventToSDLEvent[e.type],HEAP32[t+4>>>2>>>0]=_SDL_GetTicks(),tempI64=[u.deviceID>>>0,(tempDouble=u.deviceID,+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)],HEAP32[t+8>>>2>>>0]=tempI64[0],HEAP32[t+12>>>2>>>0]=tempI64[1],tempI64=[u.identifier>>>0,(tempDouble=u.identifier,+Math.abs(tempDouble)>=1?tempDouble>0?+Math.floor(tempDouble/4294967296)>>>0:~~+Math.ceil((tempDouble-+(~~tempDouble>>>0))/4294967296)>>>0:0)],HEAP32[t+16>>>2>>>0]=tempI64[0],HEAP32[t+20>>>2>>>0]=tempI64[1],HEAPF32[t+24>>>2>>>0]=f,HEAPF32[t+28>>>2>>>0]=p,HEAPF32[t+32>>>2>>>0]=g,HEAPF32[t+36>>>2>>>0]=v,u.force!==void 0?HEAPF32[t+40>>>2>>>0]=u.force:HEAPF32[t+40>>>2>>>0]=e.type=="touchend"?0:1;break}case"unload":{HEAP32[t>>>2>>>0]=SDL.DOMEventToSDLEvent[e.type];break}case"resize":{HEAP32[t>>>2>>>0]=SDL.DOMEventToSDLEvent[e.type],HEAP32[t+4>>>2>>>0]=e.w,HEAP32[t+8>>>2>>>0]=e.h;break}case"joystick_button_up":case"joystick_button_down":{var y=e.type==="joystick_button_up"?0:1;HEAP32[t>>>2>>>0]=SDL.DOMEventToSDLEvent[e.type],HEAP8[t+4>>>0]=e.index,HEAP8[t+5>>>0]=e.button,HEAP8[t+6>>>0]=y;break}case"joystick_axis_motion":{HEAP32[t>>>2>>>0]=SDL.DOMEventToSDLEvent[e.type],HEAP8[t+4>>>0]=e.index,HEAP8[t+5>>>0]=e.axis,HEAP32[t+8>>>2>>>0]=SDL.joystickAxisValueConversion(e.value);break}case"focus":{var S=12;HEAP32[t>>>2>>>0]=SDL.DOMEventToSDLEvent[e.type],HEAP32[t+4>>>2>>>0]=0,HEAP8[t+8>>>0]=S;break}case"blur":{var w=13;HEAP32[t>>>2>>>0]=SDL.DOMEventToSDLEvent[e.type],HEAP32[t+4>>>2>>>0]=0,HEAP8[t+8>>>0]=w;break}case"visibilitychange":{var D=1,F=2,E=e.visible?D:F;HEAP32[t>>>2>>>0]=SDL.DOMEventToSDLEvent[e.type],HEAP32[t+4>>>2>>>0]=0,HEAP8[t+8>>>0]=E;break}default:throw"Unhandled SDL event: "+e.type}},makeFontString(e,t){return t.charAt(0)!="'"&&t.charAt(0)!='"'&&(t='"'+t+'"'),e+"px "+t+", serif"},estimateTextWidth(e,t){var r=e.size,n=SDL.makeFontString(r,e.name),a=SDL.ttfContext;a.font=n;var o=a.measureText(t).width|0;return o},allocateChannels(e){if(!(SDL.numChannels&&SDL.numChannels>=e&&e!=0)){SDL.numChannels=e,SDL.channels=[];for(var t=0;t<e;t++)SDL.channels[t]={audio:null,volume:1}}},setGetVolume(e,t){if(!e)return 0;var r=e.volume*128;if(t!=-1&&(e.volume=Math.min(Math.max(t,0),128)/128,e.audio))try{e.audio.volume=e.volume,e.audio.webAudioGainNode&&(e.audio.webAudioGainNode.gain.value=e.volume)}catch(n){err("setGetVolume failed to set audio volume: ".concat(n))}return r},setPannerPosition(e,t,r,n){e&&e.audio&&e.audio.webAudioPannerNode&&e.audio.webAudioPannerNode.setPosition(t,r,n)},playWebAudio(e){if(e&&!e.webAudioNode&&SDL.webAudioAvailable())try{var t=e.resource.webAudio;if(e.paused=!1,!t.decodedBuffer){t.onDecodeComplete===void 0&&abort("Cannot play back audio object that was not loaded"),t.onDecodeComplete.push(()=>{e.paused||SDL.playWebAudio(e)});return}e.webAudioNode=SDL.audioContext.createBufferSource(),e.webAudioNode.buffer=t.decodedBuffer,e.webAudioNode.loop=e.loop,e.webAudioNode.onended=e.onended,e.webAudioPannerNode=SDL.audioContext.createPanner(),e.webAudioPannerNode.setPosition(0,0,-.5),e.webAudioPannerNode.panningModel="equalpower",e.webAudioGainNode=SDL.audioContext.createGain(),e.webAudioGainNode.gain.value=e.volume,e.webAudioNode.connect(e.webAudioPannerNode),e.webAudioPannerNode.connect(e.webAudioGainNode),e.webAudioGainNode.connect(SDL.audioContext.destination),e.webAudioNode.start(0,e.currentPosition),e.startTime=SDL.audioContext.currentTime-e.currentPosition}catch(r){err("playWebAudio failed: ".concat(r))}},pauseWebAudio(e){if(e){if(e.webAudioNode)try{e.currentPosition=(SDL.audioContext.currentTime-e.startTime)%e.resource.webAudio.decodedBuffer.duration,e.webAudioNode.onended=void 0,e.webAudioNode.stop(0),e.webAudioNode=void 0}catch(t){err("pauseWebAudio failed: ".concat(t))}e.paused=!0}},openAudioContext(){SDL.audioContext||(typeof AudioContext<"u"?SDL.audioContext=new AudioContext:typeof webkitAudioContext<"u"&&(SDL.audioContext=new webkitAudioContext))},webAudioAvailable:()=>!!SDL.audioContext,fillWebAudioBufferFromHeap(e,t,r){for(var n=SDL.audio,a=n.channels,o=0;o<a;++o){var l=r.getChannelData(o);if(l.length!=t)throw"Web Audio output buffer length mismatch! Destination size: "+l.length+" samples vs expected "+t+" samples!";if(n.format==32784)for(var u=0;u<t;++u)l[u]=HEAP16[e+(u*a+o)*2>>>1>>>0]/32768;else if(n.format==8)for(var u=0;u<t;++u){var _=HEAP8[e+(u*a+o)>>>0];l[u]=(_>=0?_-128:_+128)/128}else if(n.format==33056)for(var u=0;u<t;++u)l[u]=HEAPF32[e+(u*a+o)*4>>>2>>>0];else throw"Invalid SDL audio format "+n.format+"!"}},joystickEventState:1,lastJoystickState:{},joystickNamePool:{},recordJoystickState(e,t){for(var r=new Array(t.buttons.length),n=0;n<t.buttons.length;n++)r[n]=SDL.getJoystickButtonState(t.buttons[n]);SDL.lastJoystickState[e]={buttons:r,axes:t.axes.slice(0),timestamp:t.timestamp,index:t.index,id:t.id}},getJoystickButtonState(e){return typeof e=="object"?e.pressed:e>0},queryJoysticks(){for(var e in SDL.lastJoystickState){var t=SDL.getGamepad(e-1),r=SDL.lastJoystickState[e];if(typeof t>"u"||t===null)return;if(typeof t.timestamp!="number"||t.timestamp!=r.timestamp||!t.timestamp){var n;for(n=0;n<t.buttons.length;n++){var a=SDL.getJoystickButtonState(t.buttons[n]);a!==r.buttons[n]&&SDL.events.push({type:a?"joystick_button_down":"joystick_button_up",joystick:e,index:e-1,button:n})}for(n=0;n<t.axes.length;n++)t.axes[n]!==r.axes[n]&&SDL.events.push({type:"joystick_axis_motion",joystick:e,index:e-1,axis:n,value:t.axes[n]});SDL.recordJoystickState(e,t)}}},joystickAxisValueConversion(e){return e=Math.min(1,Math.max(e,-1)),Math.ceil((e+1)*32767.5-32768)},getGamepads(){var e=navigator.getGamepads||navigator.webkitGamepads||navigator.mozGamepads||navigator.gamepads||navigator.webkitGetGamepads;return e!==void 0?e.apply(navigator):[]},getGamepad(e){var t=SDL.getGamepads();return t.length>e&&e>=0?t[e]:null}};function _SDL_Linked_Version(){return SDL.version===null&&(SDL.version=_malloc(3),HEAP8[SDL.version>>>0]=1,HEAP8[SDL.version+1>>>0]=3,HEAP8[SDL.version+2>>>0]=0),SDL.version}_SDL_Linked_Version.sig="p";var _SDL_Init=e=>{if(SDL.startTime=Date.now(),SDL.initFlags=e,!Module.doNotCaptureKeyboard){var t=Module.keyboardListeningElement||document;t.addEventListener("keydown",SDL.receiveEvent),t.addEventListener("keyup",SDL.receiveEvent),t.addEventListener("keypress",SDL.receiveEvent),window.addEventListener("focus",SDL.receiveEvent),window.addEventListener("blur",SDL.receiveEvent),document.addEventListener("visibilitychange",SDL.receiveEvent)}return window.addEventListener("unload",SDL.receiveEvent),SDL.keyboardState=_calloc(65536,1),SDL.DOMEventToSDLEvent.keydown=768,SDL.DOMEventToSDLEvent.keyup=769,SDL.DOMEventToSDLEvent.keypress=771,SDL.DOMEventToSDLEvent.mousedown=1025,SDL.DOMEventToSDLEvent.mouseup=1026,SDL.DOMEventToSDLEvent.mousemove=1024,SDL.DOMEventToSDLEvent.wheel=1027,SDL.DOMEventToSDLEvent.touchstart=1792,SDL.DOMEventToSDLEvent.touchend=1793,SDL.DOMEventToSDLEvent.touchmove=1794,SDL.DOMEventToSDLEvent.unload=256,SDL.DOMEventToSDLEvent.resize=28673,SDL.DOMEventToSDLEvent.visibilitychange=512,SDL.DOMEventToSDLEvent.focus=512,SDL.DOMEventToSDLEvent.blur=512,SDL.DOMEventToSDLEvent.joystick_axis_motion=1536,SDL.DOMEventToSDLEvent.joystick_button_down=1539,SDL.DOMEventToSDLEvent.joystick_button_up=1540,0};_SDL_Init.sig="ii";var _SDL_WasInit=e=>(SDL.startTime===null&&_SDL_Init(0),1);_SDL_WasInit.sig="ii";function _SDL_GetVideoInfo(){var e=_calloc(20,1);return HEAP32[e+12>>>2>>>0]=Module.canvas.width,HEAP32[e+16>>>2>>>0]=Module.canvas.height,e}_SDL_GetVideoInfo.sig="p";function _SDL_ListModes(e,t){return e>>>=0,-1}_SDL_ListModes.sig="ppi";var _SDL_VideoModeOK=(e,t,r,n)=>r;_SDL_VideoModeOK.sig="iiiii";function _SDL_VideoDriverName(e,t){if(e>>>=0,SDL.startTime===null)return 0;var r=[101,109,115,99,114,105,112,116,101,110,95,115,100,108,95,100,114,105,118,101,114],n=0,a=r.length;for(t<=a&&(a=t-1);n<a;){var o=r[n];HEAP8[e+n>>>0]=o,n++}return HEAP8[e+n>>>0]=0,e}_SDL_VideoDriverName.sig="ppi";var _SDL_AudioDriverName=_SDL_VideoDriverName;_SDL_AudioDriverName.sig="ppi";var _SDL_SetVideoMode=function(e,t,r,n){["touchstart","touchend","touchmove","mousedown","mouseup","mousemove","mousewheel","wheel","mouseout","DOMMouseScroll"].forEach(o=>Module.canvas.addEventListener(o,SDL.receiveEvent,!0));var a=Module.canvas;return e==0&&t==0&&(e=a.width,t=a.height),SDL.addedResizeListener||(SDL.addedResizeListener=!0,Browser.resizeListeners.push((o,l)=>{SDL.settingVideoMode||SDL.receiveEvent({type:"resize",w:o,h:l})})),SDL.settingVideoMode=!0,Browser.setCanvasSize(e,t),SDL.settingVideoMode=!1,SDL.screen&&(SDL.freeSurface(SDL.screen),assert(!SDL.screen)),SDL.GL&&(n=n|67108864),SDL.screen=SDL.makeSurface(e,t,n,!0,"screen"),SDL.screen};_SDL_SetVideoMode.sig="piiii";function _SDL_GetVideoSurface(){return SDL.screen}_SDL_GetVideoSurface.sig="p";var _SDL_AudioQuit=()=>{for(var e=0;e<SDL.numChannels;++e){var t=SDL.channels[e];t.audio&&(t.audio.pause(),t.audio=void 0)}var r=SDL.music.audio;r==null||r.pause(),SDL.music.audio=void 0};_SDL_AudioQuit.sig="v";var _SDL_VideoQuit=()=>out("SDL_VideoQuit called (and ignored)");_SDL_VideoQuit.sig="v";var _SDL_QuitSubSystem=e=>out("SDL_QuitSubSystem called (and ignored)");_SDL_QuitSubSystem.sig="vi";var _SDL_Quit=()=>{_SDL_AudioQuit(),out("SDL_Quit called (and ignored)")};_SDL_Quit.sig="v";function _SDL_UnlockSurface(e){e>>>=0,assert(!SDL.GL);var t=SDL.surfaces[e];if(!(!t.locked||--t.locked>0)){if(t.isFlagSet(2097152))SDL.copyIndexedColorData(t);else if(t.colors)for(var h=Module.canvas.width,g=Module.canvas.height,v=t.buffer,r=t.image.data,y=t.colors,S=0;S<g;S++){for(var w=S*h*4,D=0;D<h;D++){var _=HEAPU8[v++>>>0]*4,F=w+D*4;r[F]=y[_],r[F+1]=y[_+1],r[F+2]=y[_+2]}v+=h*3}else{var r=t.image.data,n=t.buffer;assert(n%4==0,"Invalid buffer offset: "+n);var a=n>>>2,o=0,l=e==SDL.screen,u;if(typeof CanvasPixelArray<"u"&&r instanceof CanvasPixelArray)for(u=r.length;o<u;){var _=HEAP32[a>>>0];r[o]=_&255,r[o+1]=_>>8&255,r[o+2]=_>>16&255,r[o+3]=l?255:_>>24&255,a++,o+=4}else{var d=new Uint32Array(r.buffer);if(l&&SDL.defaults.opaqueFrontBuffer){u=d.length,d.set(HEAP32.subarray(a>>>0,a+u>>>0));var f=new Uint8Array(r.buffer),p=3,m=p+4*u;if(u%8==0)for(;p<m;)f[p]=255,p=p+4|0,f[p]=255,p=p+4|0,f[p]=255,p=p+4|0,f[p]=255,p=p+4|0,f[p]=255,p=p+4|0,f[p]=255,p=p+4|0,f[p]=255,p=p+4|0,f[p]=255,p=p+4|0;else for(;p<m;)f[p]=255,p=p+4|0}else d.set(HEAP32.subarray(a>>>0,a+d.length>>>0))}}t.ctx.putImageData(t.image,0,0)}}_SDL_UnlockSurface.sig="vp";function _SDL_Flip(e){e>>>=0}_SDL_Flip.sig="ip";function _SDL_UpdateRect(e,t,r,n,a){e>>>=0}_SDL_UpdateRect.sig="vpiiii";function _SDL_UpdateRects(e,t,r){e>>>=0,r>>>=0}_SDL_UpdateRects.sig="vpip";var _SDL_Delay=e=>{ENVIRONMENT_IS_WORKER||abort("SDL_Delay called on the main thread! Potential infinite loop, quitting. (consider building with async support like ASYNCIFY)");for(var t=Date.now();Date.now()-t<e;);};_SDL_Delay.sig="vi";function _SDL_WM_SetCaption(e,t){e>>>=0,t>>>=0,e&&_emscripten_set_window_title(e),t&&(t=UTF8ToString(t))}_SDL_WM_SetCaption.sig="vpp";var _SDL_EnableKeyRepeat=(e,t)=>{};_SDL_EnableKeyRepeat.sig="iii";function _SDL_GetKeyboardState(e){return e>>>=0,e&&(HEAP32[e>>>2>>>0]=65536),SDL.keyboardState}_SDL_GetKeyboardState.sig="pp";var _SDL_GetKeyState=()=>_SDL_GetKeyboardState(0);function _SDL_GetKeyName(e){return SDL.keyName||(SDL.keyName=stringToNewUTF8("unknown key")),SDL.keyName}_SDL_GetKeyName.sig="pi";var _SDL_GetModState=()=>SDL.modState;_SDL_GetModState.sig="i";function _SDL_GetMouseState(e,t){return e>>>=0,t>>>=0,e&&(HEAP32[e>>>2>>>0]=Browser.mouseX),t&&(HEAP32[t>>>2>>>0]=Browser.mouseY),SDL.buttonState}_SDL_GetMouseState.sig="ipp";var _SDL_WarpMouse=(e,t)=>{};_SDL_WarpMouse.sig="vii";var _SDL_ShowCursor=e=>{switch(e){case 0:return Browser.isFullscreen?(Module.canvas.requestPointerLock(),0):1;case 1:return Module.canvas.exitPointerLock(),1;case-1:return!Browser.pointerLock;default:err("SDL_ShowCursor called with unknown toggle parameter value: ".concat(e));break}};_SDL_ShowCursor.sig="ii";function _SDL_GetError(){return SDL.errorMessage||(SDL.errorMessage=stringToNewUTF8("unknown SDL-emscripten error")),SDL.errorMessage}_SDL_GetError.sig="p";function _SDL_SetError(e,t){e>>>=0,t>>>=0}_SDL_SetError.sig="vpp";function _SDL_CreateRGBSurface(e,t,r,n,a,o,l,u){return SDL.makeSurface(t,r,e,!1,"CreateRGBSurface",a,o,l,u)}_SDL_CreateRGBSurface.sig="piiiiiiii";function _SDL_CreateRGBSurfaceFrom(e,t,r,n,a,o,l,u,_){e>>>=0;var d=SDL.makeSurface(t,r,0,!1,"CreateRGBSurfaceFrom",o,l,u,_);if(n!==32)return err("TODO: Partially unimplemented SDL_CreateRGBSurfaceFrom called!"),d;for(var f=SDL.surfaces[d],p=f.ctx.createImageData(t,r),m=t*4,h=0;h<r;++h)for(var g=h*a,v=h*m,y=0;y<t*4;++y)p.data[v+y]=HEAPU8[e+(v+y)>>>0];return f.ctx.putImageData(p,0,0),d}_SDL_CreateRGBSurfaceFrom.sig="ppiiiiiiii";function _SDL_ConvertSurface(e,t,r){e>>>=0,t>>>=0,t&&SDL.checkPixelFormat(t);var n=SDL.surfaces[e],a=SDL.makeSurface(n.width,n.height,n.flags,!1,"copy:"+n.source),o=SDL.surfaces[a];return o.ctx.globalCompositeOperation="copy",o.ctx.drawImage(n.canvas,0,0),o.ctx.globalCompositeOperation=n.ctx.globalCompositeOperation,a}_SDL_ConvertSurface.sig="pppi";function _SDL_DisplayFormatAlpha(e){return e>>>=0,_SDL_ConvertSurface(e,0,0)}_SDL_DisplayFormatAlpha.sig="pp";function _SDL_FreeSurface(e){e>>>=0,e&&SDL.freeSurface(e)}_SDL_FreeSurface.sig="vp";function _SDL_UpperBlit(e,t,r,n){return e>>>=0,t>>>=0,r>>>=0,n>>>=0,SDL.blitSurface(e,t,r,n,!1)}_SDL_UpperBlit.sig="ipppp";function _SDL_UpperBlitScaled(e,t,r,n){return e>>>=0,t>>>=0,r>>>=0,n>>>=0,SDL.blitSurface(e,t,r,n,!0)}_SDL_UpperBlitScaled.sig="ipppp";var _SDL_LowerBlit=_SDL_UpperBlit;_SDL_LowerBlit.sig="ipppp";var _SDL_LowerBlitScaled=_SDL_UpperBlitScaled;_SDL_LowerBlitScaled.sig="ipppp";function _SDL_GetClipRect(e,t){e>>>=0,t>>>=0,assert(t);var r=SDL.surfaces[e],n=r.clipRect||{x:0,y:0,w:r.width,h:r.height};SDL.updateRect(t,n)}_SDL_GetClipRect.sig="vpp";function _SDL_SetClipRect(e,t){e>>>=0,t>>>=0;var r=SDL.surfaces[e];t?r.clipRect=SDL.intersectionOfRects({x:0,y:0,w:r.width,h:r.height},SDL.loadRect(t)):delete r.clipRect}_SDL_SetClipRect.sig="ipp";function _SDL_FillRect(e,t,r){e>>>=0,t>>>=0;var n=SDL.surfaces[e];assert(!n.locked),n.isFlagSet(2097152)&&(r=n.colors32[r]);var a=t?SDL.loadRect(t):{x:0,y:0,w:n.width,h:n.height};return n.clipRect&&(a=SDL.intersectionOfRects(n.clipRect,a),t&&SDL.updateRect(t,a)),n.ctx.save(),n.ctx.fillStyle=SDL.translateColorToCSSRGBA(r),n.ctx.fillRect(a.x,a.y,a.w,a.h),n.ctx.restore(),0}_SDL_FillRect.sig="ippi";function _zoomSurface(e,t,r,n){e>>>=0;var a=SDL.surfaces[e],o=a.width*t,l=a.height*r,u=SDL.makeSurface(Math.abs(o),Math.abs(l),a.flags,!1,"zoomSurface"),_=SDL.surfaces[u];return t>=0&&r>=0?_.ctx.drawImage(a.canvas,0,0,o,l):(_.ctx.save(),_.ctx.scale(t<0?-1:1,r<0?-1:1),_.ctx.drawImage(a.canvas,o<0?o:0,l<0?l:0,Math.abs(o),Math.abs(l)),_.ctx.restore()),u}_zoomSurface.sig="ppddi";function _rotozoomSurface(e,t,r,n){if(e>>>=0,t%360===0)return _zoomSurface(e,r,r,n);var a=SDL.surfaces[e],o=a.width*r,l=a.height*r,u=Math.ceil(Math.sqrt(Math.pow(o,2)+Math.pow(l,2))),_=SDL.makeSurface(u,u,a.flags,!1,"rotozoomSurface"),d=SDL.surfaces[_];return d.ctx.translate(u/2,u/2),d.ctx.rotate(-t*Math.PI/180),d.ctx.drawImage(a.canvas,-o/2,-l/2,o,l),_}_rotozoomSurface.sig="ppddi";function _SDL_SetAlpha(e,t,r){e>>>=0;var n=SDL.surfaces[e];n.alpha=r,t&65536||(n.alpha=255)}_SDL_SetAlpha.sig="ipii";function _SDL_SetColorKey(e,t,r){return e>>>=0,warnOnce("SDL_SetColorKey is a no-op for performance reasons"),0}_SDL_SetColorKey.sig="ipii";function _SDL_PollEvent(e){return e>>>=0,SDL.pollEvent(e)}_SDL_PollEvent.sig="ip";function _SDL_PushEvent(e){e>>>=0;var t=_malloc(28);return _memcpy(t,e,28),SDL.events.push(t),0}_SDL_PushEvent.sig="ip";function _SDL_PeepEvents(e,t,r,n,a){switch(e>>>=0,r){case 2:{assert(t==1);for(var o=0,l=0;o<SDL.events.length&&l<t;){var u=SDL.events[o],_=SDL.DOMEventToSDLEvent[u.type];n<=_&&_<=a?SDL.makeCEvent(u,e)===!1?o++:(SDL.events.splice(o,1),l++):o++}return l}default:throw"SDL_PeepEvents does not yet support that action: "+r}}_SDL_PeepEvents.sig="ipiiii";var _SDL_PumpEvents=()=>SDL.events.forEach(SDL.handleEvent);_SDL_PumpEvents.sig="v";function _emscripten_SDL_SetEventHandler(e,t){e>>>=0,t>>>=0,SDL.eventHandler=e,SDL.eventHandlerContext=t,SDL.eventHandlerTemp||(SDL.eventHandlerTemp=_malloc(28))}_emscripten_SDL_SetEventHandler.sig="vpp";function _SDL_SetColors(e,t,r,n){e>>>=0,t>>>=0;var a=SDL.surfaces[e];if(!a.colors){var o=new ArrayBuffer(1024);a.colors=new Uint8Array(o),a.colors32=new Uint32Array(o)}for(var l=0;l<n;++l){var u=(r+l)*4;a.colors[u]=HEAPU8[t+l*4>>>0],a.colors[u+1]=HEAPU8[t+(l*4+1)>>>0],a.colors[u+2]=HEAPU8[t+(l*4+2)>>>0],a.colors[u+3]=255}return 1}_SDL_SetColors.sig="ippii";function _SDL_SetPalette(e,t,r,n,a){return e>>>=0,r>>>=0,_SDL_SetColors(e,r,n,a)}_SDL_SetPalette.sig="ipipii";function _SDL_MapRGB(e,t,r,n){return e>>>=0,SDL.checkPixelFormat(e),t&255|(r&255)<<8|(n&255)<<16|4278190080}_SDL_MapRGB.sig="ipiii";function _SDL_MapRGBA(e,t,r,n,a){return e>>>=0,SDL.checkPixelFormat(e),t&255|(r&255)<<8|(n&255)<<16|(a&255)<<24}_SDL_MapRGBA.sig="ipiiii";function _SDL_GetRGB(e,t,r,n,a){t>>>=0,r>>>=0,n>>>=0,a>>>=0,SDL.checkPixelFormat(t),r&&(HEAP8[r>>>0]=e&255),n&&(HEAP8[n>>>0]=e>>8&255),a&&(HEAP8[a>>>0]=e>>16&255)}_SDL_GetRGB.sig="vipppp";function _SDL_GetRGBA(e,t,r,n,a,o){t>>>=0,r>>>=0,n>>>=0,a>>>=0,o>>>=0,SDL.checkPixelFormat(t),r&&(HEAP8[r>>>0]=e&255),n&&(HEAP8[n>>>0]=e>>8&255),a&&(HEAP8[a>>>0]=e>>16&255),o&&(HEAP8[o>>>0]=e>>24&255)}_SDL_GetRGBA.sig="vippppp";var _SDL_GetAppState=()=>{var e=0;return Browser.pointerLock&&(e|=1),document.hasFocus()&&(e|=2),e|=4,e};_SDL_GetAppState.sig="i";var _SDL_WM_GrabInput=()=>{};_SDL_WM_GrabInput.sig="ii";function _SDL_WM_ToggleFullScreen(e){return e>>>=0,Browser.exitFullscreen()?1:SDL.canRequestFullscreen?(SDL.isRequestingFullscreen=!0,1):0}_SDL_WM_ToggleFullScreen.sig="ip";var _IMG_Init=e=>e;_IMG_Init.sig="ii";function _SDL_FreeRW(e){for(e>>>=0,SDL.rwops[e]=null;SDL.rwops.length>0&&SDL.rwops[SDL.rwops.length-1]===null;)SDL.rwops.pop()}_SDL_FreeRW.sig="vp";var _IMG_Load_RW=function(e,t){e>>>=0;var r=stackSave();try{var n=()=>{stackRestore(r),l&&t&&_SDL_FreeRW(e)},a=F=>{var E=n;n=()=>{E(),F()}},o=(F,E)=>{var x=stackAlloc(4),A=stackAlloc(4),L=stackAlloc(4),C=Module["_"+F](...E,x,A,L,0);return C?(a(()=>Module._stbi_image_free(C)),{rawData:!0,data:C,width:HEAP32[x>>>2>>>0],height:HEAP32[A>>>2>>>0],size:HEAP32[x>>>2>>>0]*HEAP32[A>>>2>>>0]*HEAP32[L>>>2>>>0],bpp:HEAP32[L>>>2>>>0]}):null},l=SDL.rwops[e];if(l===void 0)return 0;var u,_=l.filename;if(_===void 0)return warnOnce("Only file names that have been preloaded are supported for IMG_Load_RW. Consider using STB_IMAGE=1 if you want synchronous image decoding (see settings.js), or package files with --use-preload-plugins"),0;if(!u)if(_=PATH_FS.resolve(_),u=preloadedImages[_],u)Module.freePreloadedMediaOnUse&&(preloadedImages[_]=null);else return u===null&&err("Trying to reuse preloaded image, but freePreloadedMediaOnUse is set!"),warnOnce("Cannot find preloaded image "+_),warnOnce("Cannot find preloaded image "+_+". Consider using STB_IMAGE=1 if you want synchronous image decoding (see settings.js), or package files with --use-preload-plugins"),0;var d=SDL.makeSurface(u.width,u.height,0,!1,"load:"+_),f=SDL.surfaces[d];if(f.ctx.globalCompositeOperation="copy",!u.rawData)f.ctx.drawImage(u,0,0,u.width,u.height,0,0,u.width,u.height);else{var p=f.ctx.getImageData(0,0,f.width,f.height);if(u.bpp==4)p.data.set(HEAPU8.subarray(u.data>>>0,u.data+u.size>>>0));else if(u.bpp==3)for(var m=u.size/3,h=p.data,g=u.data,v=0,y=0;y<m;y++)h[v++]=HEAPU8[g++>>>0],h[v++]=HEAPU8[g++>>>0],h[v++]=HEAPU8[g++>>>0],h[v++]=255;else if(u.bpp==2)for(var m=u.size,h=p.data,g=u.data,v=0,y=0;y<m;y++){var S=HEAPU8[g++>>>0],w=HEAPU8[g++>>>0];h[v++]=S,h[v++]=S,h[v++]=S,h[v++]=w}else if(u.bpp==1)for(var m=u.size,h=p.data,g=u.data,v=0,y=0;y<m;y++){var D=HEAPU8[g++>>>0];h[v++]=D,h[v++]=D,h[v++]=D,h[v++]=255}else return err("cannot handle bpp ".concat(u.bpp)),0;f.ctx.putImageData(p,0,0)}return f.ctx.globalCompositeOperation="source-over",_SDL_LockSurface(d),f.locked--,SDL.GL&&(f.canvas=f.ctx=null),d}finally{n()}};_IMG_Load_RW.sig="ppi";var _SDL_LoadBMP_RW=_IMG_Load_RW;_SDL_LoadBMP_RW.sig="ppi";function _SDL_RWFromFile(e,t){e>>>=0,t>>>=0;var r=SDL.rwops.length,n=UTF8ToString(e);return SDL.rwops.push({filename:n,mimetype:Browser.getMimetype(n)}),r}_SDL_RWFromFile.sig="ppp";function _IMG_Load(e){e>>>=0;var t=_SDL_RWFromFile(e,0),r=_IMG_Load_RW(t,1);return r}_IMG_Load.sig="pp";var _IMG_Quit=()=>out("IMG_Quit called (and ignored)");_IMG_Quit.sig="v";function _SDL_OpenAudio(e,t){e>>>=0,t>>>=0;try{if(SDL.audio={freq:HEAPU32[e>>>2>>>0],format:HEAPU16[e+4>>>1>>>0],channels:HEAPU8[e+6>>>0],samples:HEAPU16[e+8>>>1>>>0],callback:HEAPU32[e+16>>>2>>>0],userdata:HEAPU32[e+20>>>2>>>0],paused:!0,timer:null},SDL.audio.format==8)SDL.audio.silence=128;else if(SDL.audio.format==32784)SDL.audio.silence=0;else if(SDL.audio.format==33056)SDL.audio.silence=0;else throw"Invalid SDL audio format "+SDL.audio.format+"!";if(SDL.audio.freq<=0)throw"Unsupported sound frequency "+SDL.audio.freq+"!";if(SDL.audio.freq<=22050)SDL.audio.freq=22050;else if(SDL.audio.freq<=32e3)SDL.audio.freq=32e3;else if(SDL.audio.freq<=44100)SDL.audio.freq=44100;else if(SDL.audio.freq<=48e3)SDL.audio.freq=48e3;else if(SDL.audio.freq<=96e3)SDL.audio.freq=96e3;else throw"Unsupported sound frequency ".concat(SDL.audio.freq,"!");if(SDL.audio.channels==0)SDL.audio.channels=1;else{if(SDL.audio.channels<0||SDL.audio.channels>32)throw"Unsupported number of audio channels for SDL audio: ".concat(SDL.audio.channels,"!");SDL.audio.channels!=1&&SDL.audio.channels!=2&&out("Warning: Using untested number of audio channels ".concat(SDL.audio.channels))}if(SDL.audio.samples<128||SDL.audio.samples>524288)throw"Unsupported audio callback buffer size ".concat(SDL.audio.samples,"!");if(SDL.audio.samples&SDL.audio.samples-1)throw"Audio callback buffer size ".concat(SDL.audio.samples," must be a power-of-two!");var r=SDL.audio.samples*SDL.audio.channels;if(SDL.audio.format==8)SDL.audio.bytesPerSample=1;else if(SDL.audio.format==32784)SDL.audio.bytesPerSample=2;else if(SDL.audio.format==33056)SDL.audio.bytesPerSample=4;else throw"Invalid SDL audio format ".concat(SDL.audio.format,"!");if(SDL.audio.bufferSize=r*SDL.audio.bytesPerSample,SDL.audio.bufferDurationSecs=SDL.audio.bufferSize/SDL.audio.bytesPerSample/SDL.audio.channels/SDL.audio.freq,SDL.audio.bufferingDelay=.05,SDL.audio.buffer=_malloc(SDL.audio.bufferSize),SDL.audio.numSimultaneouslyQueuedBuffers=Module.SDL_numSimultaneouslyQueuedBuffers||5,SDL.audio.queueNewAudioData=()=>{if(SDL.audio)for(var n=0;n<SDL.audio.numSimultaneouslyQueuedBuffers;++n){var a=SDL.audio.nextPlayTime-SDL.audioContext.currentTime;if(a>=SDL.audio.bufferingDelay+SDL.audio.bufferDurationSecs*SDL.audio.numSimultaneouslyQueuedBuffers)return;getWasmTableEntry(SDL.audio.callback)(SDL.audio.userdata,SDL.audio.buffer,SDL.audio.bufferSize),SDL.audio.pushAudio(SDL.audio.buffer,SDL.audio.bufferSize)}},SDL.audio.caller=()=>{if(SDL.audio){--SDL.audio.numAudioTimersPending,SDL.audio.queueNewAudioData();var n=SDL.audio.nextPlayTime-SDL.audioContext.currentTime,a=SDL.audio.bufferDurationSecs/2;SDL.audio.numAudioTimersPending<SDL.audio.numSimultaneouslyQueuedBuffers&&(++SDL.audio.numAudioTimersPending,SDL.audio.timer=safeSetTimeout(SDL.audio.caller,Math.max(0,1e3*(n-a))),SDL.audio.numAudioTimersPending<SDL.audio.numSimultaneouslyQueuedBuffers&&(++SDL.audio.numAudioTimersPending,safeSetTimeout(SDL.audio.caller,1)))}},SDL.audio.audioOutput=new Audio,SDL.openAudioContext(),!SDL.audioContext)throw"Web Audio API is not available!";autoResumeAudioContext(SDL.audioContext),SDL.audio.nextPlayTime=0,SDL.audio.pushAudio=(n,a)=>{try{if(SDL.audio.paused)return;var o=a/SDL.audio.bytesPerSample,l=o/SDL.audio.channels;if(l!=SDL.audio.samples)throw"Received mismatching audio buffer size!";var u=SDL.audioContext.createBufferSource(),_=SDL.audioContext.createBuffer(SDL.audio.channels,l,SDL.audio.freq);u.connect(SDL.audioContext.destination),SDL.fillWebAudioBufferFromHeap(n,l,_),u.buffer=_;var d=SDL.audioContext.currentTime,f=Math.max(d+SDL.audio.bufferingDelay,SDL.audio.nextPlayTime);typeof u.start<"u"?u.start(f):typeof u.noteOn<"u"&&u.noteOn(f),SDL.audio.nextPlayTime=f+SDL.audio.bufferDurationSecs}catch(p){err("Web Audio API error playing back audio: ".concat(p.toString()))}},t&&(HEAP32[t>>>2>>>0]=SDL.audio.freq,HEAP16[t+4>>>1>>>0]=SDL.audio.format,HEAP8[t+6>>>0]=SDL.audio.channels,HEAP8[t+7>>>0]=SDL.audio.silence,HEAP16[t+8>>>1>>>0]=SDL.audio.samples,HEAPU32[t+16>>>2>>>0]=SDL.audio.callback,HEAPU32[t+20>>>2>>>0]=SDL.audio.userdata),SDL.allocateChannels(32)}catch(n){err('Initializing SDL audio threw an exception: "'.concat(n.toString(),'"! Continuing without audio')),SDL.audio=null,SDL.allocateChannels(0),t&&(HEAP32[t>>>2>>>0]=0,HEAP16[t+4>>>1>>>0]=0,HEAP8[t+6>>>0]=0,HEAP8[t+7>>>0]=0,HEAP16[t+8>>>1>>>0]=0,HEAPU32[t+16>>>2>>>0]=0,HEAPU32[t+20>>>2>>>0]=0)}return SDL.audio?0:-1}_SDL_OpenAudio.sig="ipp";var _SDL_PauseAudio=e=>{SDL.audio&&(e?SDL.audio.timer!==void 0&&(clearTimeout(SDL.audio.timer),SDL.audio.numAudioTimersPending=0,SDL.audio.timer=void 0):SDL.audio.timer||(SDL.audio.numAudioTimersPending=1,SDL.audio.timer=safeSetTimeout(SDL.audio.caller,1)),SDL.audio.paused=e)};_SDL_PauseAudio.sig="vi";var _SDL_CloseAudio=()=>{SDL.audio&&(SDL.audio.callbackRemover&&(SDL.audio.callbackRemover(),SDL.audio.callbackRemover=null),_SDL_PauseAudio(1),_free(SDL.audio.buffer),SDL.audio=null,SDL.allocateChannels(0))};_SDL_CloseAudio.sig="v";var _SDL_LockAudio=()=>{};_SDL_LockAudio.sig="v";var _SDL_UnlockAudio=()=>{};_SDL_UnlockAudio.sig="v";function _SDL_CreateMutex(){return 0}_SDL_CreateMutex.sig="p";function _SDL_mutexP(e){return e>>>=0,0}_SDL_mutexP.sig="ip";function _SDL_mutexV(e){return e>>>=0,0}_SDL_mutexV.sig="ip";function _SDL_DestroyMutex(e){e>>>=0}_SDL_DestroyMutex.sig="vp";function _SDL_CreateCond(){return 0}_SDL_CreateCond.sig="p";function _SDL_CondSignal(e){e>>>=0}_SDL_CondSignal.sig="ip";function _SDL_CondWait(e,t){e>>>=0,t>>>=0}_SDL_CondWait.sig="ipp";function _SDL_DestroyCond(e){e>>>=0}_SDL_DestroyCond.sig="vp";var _SDL_StartTextInput=()=>{SDL.textInput=!0};_SDL_StartTextInput.sig="v";var _SDL_StopTextInput=()=>{SDL.textInput=!1};_SDL_StopTextInput.sig="v";var _Mix_Init=e=>e?8:0;_Mix_Init.sig="ii";var _Mix_Quit=()=>{};_Mix_Quit.sig="v";var _Mix_OpenAudio=(e,t,r,n)=>(SDL.openAudioContext(),autoResumeAudioContext(SDL.audioContext),SDL.allocateChannels(32),SDL.mixerFrequency=e,SDL.mixerFormat=t,SDL.mixerNumChannels=r,SDL.mixerChunkSize=n,0);_Mix_OpenAudio.sig="iiiii";var _Mix_CloseAudio=_SDL_CloseAudio;_Mix_CloseAudio.sig="v";var _Mix_AllocateChannels=e=>(SDL.allocateChannels(e),e);_Mix_AllocateChannels.sig="ii";function _Mix_ChannelFinished(e){e>>>=0,SDL.channelFinished=e}_Mix_ChannelFinished.sig="vp";var _Mix_Volume=(e,t)=>{if(e==-1){for(var r=0;r<SDL.numChannels-1;r++)_Mix_Volume(r,t);return _Mix_Volume(SDL.numChannels-1,t)}return SDL.setGetVolume(SDL.channels[e],t)};_Mix_Volume.sig="iii";var _Mix_SetPanning=(e,t,r)=>(t/=255,r/=255,SDL.setPannerPosition(SDL.channels[e],r-t,0,.1),1);_Mix_SetPanning.sig="iiii";function _Mix_LoadWAV_RW(e,t){e>>>=0;var r=SDL.rwops[e];if(r===void 0)return 0;var n="",a,o,l;if(r.filename!==void 0){n=PATH_FS.resolve(r.filename);var u=preloadedAudios[n];if(!u){u===null&&err("Trying to reuse preloaded audio, but freePreloadedMediaOnUse is set!"),Module.noAudioDecoding||warnOnce("Cannot find preloaded audio "+n);try{l=FS.readFile(n)}catch(g){return err("Couldn't find file for: ".concat(n)),0}}Module.freePreloadedMediaOnUse&&(preloadedAudios[n]=null),a=u}else if(r.bytes!==void 0)SDL.webAudioAvailable()?l=HEAPU8.buffer.slice(r.bytes,r.bytes+r.count):l=HEAPU8.subarray(r.bytes>>>0,r.bytes+r.count>>>0);else return 0;var _=l&&(l.buffer||l),d=Module.SDL_canPlayWithWebAudio===void 0||Module.SDL_canPlayWithWebAudio(n,_);if(l!==void 0&&SDL.webAudioAvailable()&&d){a=void 0,o={},o.onDecodeComplete=[];var f=g=>{o.decodedBuffer=g,o.onDecodeComplete.forEach(v=>v()),o.onDecodeComplete=void 0};SDL.audioContext.decodeAudioData(_,f)}else if(a===void 0&&l){var p=new Blob([l],{type:r.mimetype}),m=URL.createObjectURL(p);a=new Audio,a.src=m,a.mozAudioChannelType="content"}var h=SDL.audios.length;return SDL.audios.push({source:n,audio:a,webAudio:o}),h}_Mix_LoadWAV_RW.sig="ppi";function _Mix_LoadWAV(e){e>>>=0;var t=_SDL_RWFromFile(e,0),r=_Mix_LoadWAV_RW(t,0);return _SDL_FreeRW(t),r}_Mix_LoadWAV.sig="pp";function _Mix_QuickLoad_RAW(e,t){e>>>=0;for(var r,n,a=t>>1,o=new Float32Array(a),l=0;l<a;++l)o[l]=HEAP16[e+l*2>>>1>>>0]/32768;SDL.webAudioAvailable()?(n={},n.decodedBuffer=o):(r=new Audio,r.mozAudioChannelType="content",r.numChannels=SDL.mixerNumChannels,r.frequency=SDL.mixerFrequency);var u=SDL.audios.length;return SDL.audios.push({source:"",audio:r,webAudio:n,buffer:o}),u}_Mix_QuickLoad_RAW.sig="ppi";function _Mix_FreeChunk(e){e>>>=0,SDL.audios[e]=null}_Mix_FreeChunk.sig="vp";var _Mix_ReserveChannels=e=>{SDL.channelMinimumNumber=e};_Mix_ReserveChannels.sig="ii";var _Mix_HaltChannel=e=>{function t(n){var a=SDL.channels[n];a.audio&&(a.audio.pause(),a.audio=null),SDL.channelFinished&&getWasmTableEntry(SDL.channelFinished)(n)}if(e!=-1)t(e);else for(var r=0;r<SDL.channels.length;++r)t(r);return 0};_Mix_HaltChannel.sig="ii";function _Mix_PlayChannelTimed(e,t,r,n){t>>>=0,assert(n==-1);var a=SDL.audios[t];if(!a||!a.audio&&!a.webAudio)return-1;if(e==-1){for(var o=SDL.channelMinimumNumber;o<SDL.numChannels;o++)if(!SDL.channels[o].audio){e=o;break}if(e==-1)return err("All ".concat(SDL.numChannels,"  channels in use!")),-1}var l=SDL.channels[e],u;return a.webAudio?(u={},u.resource=a,u.paused=!1,u.currentPosition=0,u.play=function(){SDL.playWebAudio(this)},u.pause=function(){SDL.pauseWebAudio(this)}):(u=a.audio.cloneNode(!0),u.numChannels=a.audio.numChannels,u.frequency=a.audio.frequency),u.onended=function(){(l.audio===this||l.audio.webAudioNode===this)&&(l.audio.paused=!0,l.audio=null),SDL.channelFinished&&getWasmTableEntry(SDL.channelFinished)(e)},l.audio&&_Mix_HaltChannel(e),l.audio=u,u.loop=r!=0,u.volume=l.volume,u.play(),e}_Mix_PlayChannelTimed.sig="iipii";var _Mix_FadingChannel=e=>0;_Mix_FadingChannel.sig="ii";var _Mix_HaltMusic=()=>{var e=SDL.music.audio;return e&&(e.src=e.src,e.currentPosition=0,e.pause()),SDL.music.audio=null,SDL.hookMusicFinished&&getWasmTableEntry(SDL.hookMusicFinished)(),0};_Mix_HaltMusic.sig="i";function _Mix_HookMusicFinished(e){e>>>=0,SDL.hookMusicFinished=e,SDL.music.audio&&(SDL.music.audio.onended=_Mix_HaltMusic)}_Mix_HookMusicFinished.sig="vp";var _Mix_VolumeMusic=e=>SDL.setGetVolume(SDL.music,e);_Mix_VolumeMusic.sig="ii";function _Mix_LoadMUS_RW(e){return e>>>=0,_Mix_LoadWAV_RW(e,0)}_Mix_LoadMUS_RW.sig="pp";function _Mix_LoadMUS(e){e>>>=0;var t=_SDL_RWFromFile(e,0),r=_Mix_LoadMUS_RW(t);return _SDL_FreeRW(t),r}_Mix_LoadMUS.sig="pp";var _Mix_FreeMusic=_Mix_FreeChunk;_Mix_FreeMusic.sig="vp";function _Mix_PlayMusic(e,t){e>>>=0,SDL.music.audio&&(SDL.music.audio.paused||err("Music is already playing. ".concat(SDL.music.source)),SDL.music.audio.pause());var r=SDL.audios[e],n;return r.webAudio?(n={},n.resource=r,n.paused=!1,n.currentPosition=0,n.play=function(){SDL.playWebAudio(this)},n.pause=function(){SDL.pauseWebAudio(this)}):r.audio&&(n=r.audio),n.onended=function(){var a;(SDL.music.audio===this||((a=SDL.music.audio)==null?void 0:a.webAudioNode)===this)&&_Mix_HaltMusic()},n.loop=t!=0&&t!=1,n.volume=SDL.music.volume,SDL.music.audio=n,n.play(),0}_Mix_PlayMusic.sig="ipi";var _Mix_PauseMusic=()=>{var e=SDL.music.audio;e==null||e.pause()};_Mix_PauseMusic.sig="v";var _Mix_ResumeMusic=()=>{var e=SDL.music.audio;e==null||e.play()};_Mix_ResumeMusic.sig="v";var _Mix_FadeInMusicPos=_Mix_PlayMusic;_Mix_FadeInMusicPos.sig="ipiid";var _Mix_FadeOutMusic=_Mix_HaltMusic;_Mix_FadeOutMusic.sig="ii";var _Mix_PlayingMusic=()=>SDL.music.audio&&!SDL.music.audio.paused?1:0;_Mix_PlayingMusic.sig="i";var _Mix_Playing=e=>{if(e===-1){for(var t=0,r=0;r<SDL.channels.length;r++)t+=_Mix_Playing(r);return t}var n=SDL.channels[e];return n!=null&&n.audio&&!n.audio.paused?1:0};_Mix_Playing.sig="ii";var _Mix_Pause=e=>{if(e===-1){for(var t=0;t<SDL.channels.length;t++)_Mix_Pause(t);return}var r=SDL.channels[e];r!=null&&r.audio&&r.audio.pause()};_Mix_Pause.sig="vi";var _Mix_Paused=e=>{var a;if(e===-1){for(var t=0,r=0;r<SDL.channels.length;r++)t+=_Mix_Paused(r);return t}var n=SDL.channels[e];return(a=n==null?void 0:n.audio)!=null&&a.paused?1:0};_Mix_Paused.sig="ii";var _Mix_PausedMusic=()=>{var e;return(e=SDL.music.audio)!=null&&e.paused?1:0};_Mix_PausedMusic.sig="i";var _Mix_Resume=e=>{if(e===-1){for(var t=0;t<SDL.channels.length;t++)_Mix_Resume(t);return}var r=SDL.channels[e];r!=null&&r.audio&&r.audio.play()};_Mix_Resume.sig="vi";var _TTF_Init=()=>{try{var e=new OffscreenCanvas(0,0);if(SDL.ttfContext=e.getContext("2d"),typeof SDL.ttfContext.measureText!="function")throw"bad context"}catch(r){var t=document.createElement("canvas");SDL.ttfContext=t.getContext("2d")}return 0};_TTF_Init.sig="i";function _TTF_OpenFont(e,t){e>>>=0,e=PATH.normalize(UTF8ToString(e));var r=SDL.fonts.length;return SDL.fonts.push({name:e,size:t}),r}_TTF_OpenFont.sig="ppi";function _TTF_CloseFont(e){e>>>=0,SDL.fonts[e]=null}_TTF_CloseFont.sig="vp";function _TTF_RenderText_Solid(e,t,r){e>>>=0,t>>>=0,r>>>=0,t=UTF8ToString(t)||" ";var n=SDL.fonts[e],a=SDL.estimateTextWidth(n,t),o=n.size;r=SDL.loadColorToCSSRGB(r);var l=SDL.makeFontString(o,n.name),u=SDL.makeSurface(a,o,0,!1,"text:"+t),_=SDL.surfaces[u];return _.ctx.save(),_.ctx.fillStyle=r,_.ctx.font=l,_.ctx.textBaseline="bottom",_.ctx.fillText(t,0,o|0),_.ctx.restore(),u}_TTF_RenderText_Solid.sig="pppp";var _TTF_RenderText_Blended=_TTF_RenderText_Solid;_TTF_RenderText_Blended.sig="pppp";var _TTF_RenderText_Shaded=_TTF_RenderText_Solid;_TTF_RenderText_Shaded.sig="ppppp";var _TTF_RenderUTF8_Solid=_TTF_RenderText_Solid;_TTF_RenderUTF8_Solid.sig="pppp";function _TTF_SizeText(e,t,r,n){e>>>=0,t>>>=0,r>>>=0,n>>>=0;var a=SDL.fonts[e];return r&&(HEAP32[r>>>2>>>0]=SDL.estimateTextWidth(a,UTF8ToString(t))),n&&(HEAP32[n>>>2>>>0]=a.size),0}_TTF_SizeText.sig="ipppp";var _TTF_SizeUTF8=_TTF_SizeText;_TTF_SizeUTF8.sig="ipppp";function _TTF_GlyphMetrics(e,t,r,n,a,o,l){e>>>=0,r>>>=0,n>>>=0,a>>>=0,o>>>=0,l>>>=0;var u=SDL.fonts[e],_=SDL.estimateTextWidth(u,String.fromCharCode(t));l&&(HEAP32[l>>>2>>>0]=_),r&&(HEAP32[r>>>2>>>0]=0),n&&(HEAP32[n>>>2>>>0]=_),a&&(HEAP32[a>>>2>>>0]=0),o&&(HEAP32[o>>>2>>>0]=u.size)}_TTF_GlyphMetrics.sig="ipippppp";function _TTF_FontAscent(e){e>>>=0;var t=SDL.fonts[e];return t.size*.98|0}_TTF_FontAscent.sig="ip";function _TTF_FontDescent(e){e>>>=0;var t=SDL.fonts[e];return t.size*.02|0}_TTF_FontDescent.sig="ip";function _TTF_FontHeight(e){e>>>=0;var t=SDL.fonts[e];return t.size}_TTF_FontHeight.sig="ip";var _TTF_FontLineSkip=_TTF_FontHeight;_TTF_FontLineSkip.sig="ip";var _TTF_Quit=()=>out("TTF_Quit called (and ignored)");_TTF_Quit.sig="v";var SDL_gfx={drawRectangle:(e,t,r,n,a,o,l)=>{t=t<<16>>16,r=r<<16>>16,n=n<<16>>16,a=a<<16>>16;var u=SDL.surfaces[e];assert(!u.locked);var _=t<n?t:n,d=r<a?r:a,f=Math.abs(n-t),p=Math.abs(a-r);u.ctx.save(),u.ctx[o+"Style"]=l,u.ctx[o+"Rect"](_,d,f,p),u.ctx.restore()},drawLine:(e,t,r,n,a,o)=>{t=t<<16>>16,r=r<<16>>16,n=n<<16>>16,a=a<<16>>16;var l=SDL.surfaces[e];assert(!l.locked),l.ctx.save(),l.ctx.strokeStyle=o,l.ctx.beginPath(),l.ctx.moveTo(t,r),l.ctx.lineTo(n,a),l.ctx.stroke(),l.ctx.restore()},drawEllipse:(e,t,r,n,a,o,l)=>{t=t<<16>>16,r=r<<16>>16,n=n<<16>>16,a=a<<16>>16;var u=SDL.surfaces[e];assert(!u.locked),u.ctx.save(),u.ctx.beginPath(),u.ctx.translate(t,r),u.ctx.scale(n,a),u.ctx.arc(0,0,1,0,2*Math.PI),u.ctx.restore(),u.ctx.save(),u.ctx[o+"Style"]=l,u.ctx[o](),u.ctx.restore()},translateColorToCSSRGBA:e=>"rgba(".concat(e>>>24,",").concat(e>>16&255,",").concat(e>>8&255,",").concat(e&255,")")};function _boxColor(e,t,r,n,a,o){return e>>>=0,SDL_gfx.drawRectangle(e,t,r,n,a,"fill",SDL_gfx.translateColorToCSSRGBA(o))}_boxColor.sig="ipiiiii";function _boxRGBA(e,t,r,n,a,o,l,u,_){return e>>>=0,SDL_gfx.drawRectangle(e,t,r,n,a,"fill",SDL.translateRGBAToCSSRGBA(o,l,u,_))}_boxRGBA.sig="ipiiiiiiii";function _rectangleColor(e,t,r,n,a,o){return e>>>=0,SDL_gfx.drawRectangle(e,t,r,n,a,"stroke",SDL_gfx.translateColorToCSSRGBA(o))}_rectangleColor.sig="ipiiiii";function _rectangleRGBA(e,t,r,n,a,o,l,u,_){return e>>>=0,SDL_gfx.drawRectangle(e,t,r,n,a,"stroke",SDL.translateRGBAToCSSRGBA(o,l,u,_))}_rectangleRGBA.sig="ipiiiiiiii";function _ellipseColor(e,t,r,n,a,o){return e>>>=0,SDL_gfx.drawEllipse(e,t,r,n,a,"stroke",SDL_gfx.translateColorToCSSRGBA(o))}_ellipseColor.sig="ipiiiii";function _ellipseRGBA(e,t,r,n,a,o,l,u,_){return e>>>=0,SDL_gfx.drawEllipse(e,t,r,n,a,"stroke",SDL.translateRGBAToCSSRGBA(o,l,u,_))}_ellipseRGBA.sig="ipiiiiiiii";function _filledEllipseColor(e,t,r,n,a,o){return e>>>=0,SDL_gfx.drawEllipse(e,t,r,n,a,"fill",SDL_gfx.translateColorToCSSRGBA(o))}_filledEllipseColor.sig="ipiiiii";function _filledEllipseRGBA(e,t,r,n,a,o,l,u,_){return e>>>=0,SDL_gfx.drawEllipse(e,t,r,n,a,"fill",SDL.translateRGBAToCSSRGBA(o,l,u,_))}_filledEllipseRGBA.sig="ipiiiiiiii";function _lineColor(e,t,r,n,a,o){return e>>>=0,SDL_gfx.drawLine(e,t,r,n,a,SDL_gfx.translateColorToCSSRGBA(o))}_lineColor.sig="ipiiiii";function _lineRGBA(e,t,r,n,a,o,l,u,_){return e>>>=0,SDL_gfx.drawLine(e,t,r,n,a,SDL.translateRGBAToCSSRGBA(o,l,u,_))}_lineRGBA.sig="ipiiiiiiii";function _pixelRGBA(e,t,r,n,a,o,l){return e>>>=0,_boxRGBA(e,t,r,t,r,n,a,o,l)}_pixelRGBA.sig="ipiiiiii";var _SDL_GL_SetAttribute=(e,t)=>{e in SDL.glAttributes||abort("Unknown SDL GL attribute ("+e+"). Please check if your SDL version is supported."),SDL.glAttributes[e]=t};_SDL_GL_SetAttribute.sig="iii";function _SDL_GL_GetAttribute(e,t){return t>>>=0,e in SDL.glAttributes||abort("Unknown SDL GL attribute ("+e+"). Please check if your SDL version is supported."),t&&(HEAP32[t>>>2>>>0]=SDL.glAttributes[e]),0}_SDL_GL_GetAttribute.sig="iip";var _SDL_GL_SwapBuffers=()=>{var e;(e=Browser.doSwapBuffers)==null||e.call(Browser)};_SDL_GL_SwapBuffers.sig="v";function _SDL_GL_ExtensionSupported(e){return e>>>=0,Module.ctx.getExtension(e)|0}_SDL_GL_ExtensionSupported.sig="ip";function _SDL_DestroyWindow(e){e>>>=0}_SDL_DestroyWindow.sig="vp";function _SDL_DestroyRenderer(e){e>>>=0}_SDL_DestroyRenderer.sig="vp";function _SDL_GetWindowFlags(e){return e>>>=0,Browser.isFullscreen?1:0}_SDL_GetWindowFlags.sig="ip";function _SDL_GL_SwapWindow(e){e>>>=0}_SDL_GL_SwapWindow.sig="vp";function _SDL_GL_MakeCurrent(e,t){e>>>=0,t>>>=0}_SDL_GL_MakeCurrent.sig="ipp";function _SDL_GL_DeleteContext(e){e>>>=0}_SDL_GL_DeleteContext.sig="vp";var _SDL_GL_GetSwapInterval=()=>MainLoop.timingMode==1?MainLoop.timingValue:0;_SDL_GL_GetSwapInterval.sig="i";var _SDL_GL_SetSwapInterval=e=>{_emscripten_set_main_loop_timing(1,e)};_SDL_GL_SetSwapInterval.sig="ii";function _SDL_SetWindowTitle(e,t){e>>>=0,t>>>=0,t&&(document.title=UTF8ToString(t))}_SDL_SetWindowTitle.sig="vpp";function _SDL_GetWindowSize(e,t,r){e>>>=0,t>>>=0,r>>>=0;var n=Module.canvas.width,a=Module.canvas.height;t&&(HEAP32[t>>>2>>>0]=n),r&&(HEAP32[r>>>2>>>0]=a)}_SDL_GetWindowSize.sig="vppp";function _SDL_LogSetOutputFunction(e,t){e>>>=0,t>>>=0}_SDL_LogSetOutputFunction.sig="vpp";function _SDL_SetWindowFullscreen(e,t){return e>>>=0,Browser.isFullscreen?(Module.canvas.exitFullscreen(),1):0}_SDL_SetWindowFullscreen.sig="ipi";var _SDL_ClearError=()=>{};_SDL_ClearError.sig="v";var _SDL_SetGamma=(e,t,r)=>-1;_SDL_SetGamma.sig="ifff";function _SDL_SetGammaRamp(e,t,r){return e>>>=0,t>>>=0,r>>>=0,-1}_SDL_SetGammaRamp.sig="ippp";var _SDL_NumJoysticks=()=>{for(var e=0,t=SDL.getGamepads(),r=0;r<t.length;r++)t[r]!==void 0&&e++;return e};_SDL_NumJoysticks.sig="i";function _SDL_JoystickName(e){var t=SDL.getGamepad(e);if(t){var r=t.id;return SDL.joystickNamePool.hasOwnProperty(r)?SDL.joystickNamePool[r]:SDL.joystickNamePool[r]=stringToNewUTF8(r)}return 0}_SDL_JoystickName.sig="pi";function _SDL_JoystickOpen(e){var t=SDL.getGamepad(e);if(t){var r=e+1;return SDL.recordJoystickState(r,t),r}return 0}_SDL_JoystickOpen.sig="pi";var _SDL_JoystickOpened=e=>SDL.lastJoystickState.hasOwnProperty(e+1)?1:0;_SDL_JoystickOpened.sig="ii";function _SDL_JoystickIndex(e){return e>>>=0,e-1}_SDL_JoystickIndex.sig="ip";function _SDL_JoystickNumAxes(e){e>>>=0;var t=SDL.getGamepad(e-1);return t?t.axes.length:0}_SDL_JoystickNumAxes.sig="ip";function _SDL_JoystickNumBalls(e){return e>>>=0,0}_SDL_JoystickNumBalls.sig="ip";function _SDL_JoystickNumHats(e){return e>>>=0,0}_SDL_JoystickNumHats.sig="ip";function _SDL_JoystickNumButtons(e){e>>>=0;var t=SDL.getGamepad(e-1);return t?t.buttons.length:0}_SDL_JoystickNumButtons.sig="ip";var _SDL_JoystickUpdate=()=>SDL.queryJoysticks();_SDL_JoystickUpdate.sig="v";var _SDL_JoystickEventState=e=>e<0?SDL.joystickEventState:SDL.joystickEventState=e;_SDL_JoystickEventState.sig="ii";function _SDL_JoystickGetAxis(e,t){e>>>=0;var r=SDL.getGamepad(e-1);return r&&r.axes.length>t?SDL.joystickAxisValueConversion(r.axes[t]):0}_SDL_JoystickGetAxis.sig="ipi";function _SDL_JoystickGetHat(e,t){return e>>>=0,0}_SDL_JoystickGetHat.sig="ipi";function _SDL_JoystickGetBall(e,t,r,n){return e>>>=0,r>>>=0,n>>>=0,-1}_SDL_JoystickGetBall.sig="ipipp";function _SDL_JoystickGetButton(e,t){e>>>=0;var r=SDL.getGamepad(e-1);return r&&r.buttons.length>t&&SDL.getJoystickButtonState(r.buttons[t])?1:0}_SDL_JoystickGetButton.sig="ipi";function _SDL_JoystickClose(e){e>>>=0,delete SDL.lastJoystickState[e]}_SDL_JoystickClose.sig="vp";var _SDL_InitSubSystem=e=>0;_SDL_InitSubSystem.sig="ii";function _SDL_RWFromConstMem(e,t){e>>>=0;var r=SDL.rwops.length;return SDL.rwops.push({bytes:e,count:t}),r}_SDL_RWFromConstMem.sig="ppi";var _SDL_RWFromMem=_SDL_RWFromConstMem;_SDL_RWFromMem.sig="ppi";var _SDL_GetNumAudioDrivers=()=>1;_SDL_GetNumAudioDrivers.sig="i";function _SDL_GetCurrentAudioDriver(){return stringToNewUTF8("Emscripten Audio")}_SDL_GetCurrentAudioDriver.sig="p";var _SDL_GetScancodeFromKey=e=>SDL.scanCodes[e];_SDL_GetScancodeFromKey.sig="ii";function _SDL_GetAudioDriver(e){return _SDL_GetCurrentAudioDriver()}_SDL_GetAudioDriver.sig="pi";var _SDL_EnableUNICODE=e=>{var t=SDL.unicode||0;return SDL.unicode=e,t};_SDL_EnableUNICODE.sig="ii";var _SDL_AddTimer=function(e,t,r){return t>>>=0,r>>>=0,safeSetTimeout(()=>getWasmTableEntry(t)(e,r),e)};_SDL_AddTimer.sig="iipp";var _SDL_RemoveTimer=e=>(clearTimeout(e),!0);_SDL_RemoveTimer.sig="ii";function _SDL_CreateThread(e,t,r,n){throw e>>>=0,t>>>=0,"SDL threads cannot be supported in the web platform because they assume shared state. See emscripten_create_worker etc. for a message-passing concurrency model that does let you run code in another thread."}_SDL_CreateThread.sig="ppp";function _SDL_WaitThread(e,t){throw e>>>=0,t>>>=0,"SDL_WaitThread"}_SDL_WaitThread.sig="vpp";function _SDL_GetThreadID(e){throw e>>>=0,"SDL_GetThreadID"}_SDL_GetThreadID.sig="pp";function _SDL_ThreadID(){return 0}_SDL_ThreadID.sig="p";function _SDL_AllocRW(){throw"SDL_AllocRW: TODO"}_SDL_AllocRW.sig="p";function _SDL_CondBroadcast(e){throw e>>>=0,"SDL_CondBroadcast: TODO"}_SDL_CondBroadcast.sig="ip";function _SDL_CondWaitTimeout(e,t,r){throw e>>>=0,t>>>=0,"SDL_CondWaitTimeout: TODO"}_SDL_CondWaitTimeout.sig="ippi";var _SDL_WM_IconifyWindow=()=>{throw"SDL_WM_IconifyWindow TODO"};_SDL_WM_IconifyWindow.sig="i";function _Mix_SetPostMix(e,t){return e>>>=0,t>>>=0,warnOnce("Mix_SetPostMix: TODO")}_Mix_SetPostMix.sig="vpp";function _Mix_VolumeChunk(e,t){throw e>>>=0,"Mix_VolumeChunk: TODO"}_Mix_VolumeChunk.sig="ipi";var _Mix_SetPosition=(e,t,r)=>{throw"Mix_SetPosition: TODO"};_Mix_SetPosition.sig="iiii";function _Mix_QuerySpec(e,t,r){throw e>>>=0,t>>>=0,r>>>=0,"Mix_QuerySpec: TODO"}_Mix_QuerySpec.sig="ippp";function _Mix_FadeInChannelTimed(e,t,r,n,a){throw t>>>=0,"Mix_FadeInChannelTimed"}_Mix_FadeInChannelTimed.sig="iipiii";var _Mix_FadeOutChannel=()=>{throw"Mix_FadeOutChannel"};_Mix_FadeOutChannel.sig="iii";function _Mix_Linked_Version(){throw"Mix_Linked_Version: TODO"}_Mix_Linked_Version.sig="p";function _SDL_SaveBMP_RW(e,t,r){throw e>>>=0,t>>>=0,"SDL_SaveBMP_RW: TODO"}_SDL_SaveBMP_RW.sig="ippi";function _SDL_WM_SetIcon(e,t){e>>>=0,t>>>=0}_SDL_WM_SetIcon.sig="vpp";var _SDL_HasRDTSC=()=>0;_SDL_HasRDTSC.sig="i";var _SDL_HasMMX=()=>0;_SDL_HasMMX.sig="i";var _SDL_HasMMXExt=()=>0;_SDL_HasMMXExt.sig="i";var _SDL_Has3DNow=()=>0;_SDL_Has3DNow.sig="i";var _SDL_Has3DNowExt=()=>0;_SDL_Has3DNowExt.sig="i";var _SDL_HasSSE=()=>0;_SDL_HasSSE.sig="i";var _SDL_HasSSE2=()=>0;_SDL_HasSSE2.sig="i";var _SDL_HasAltiVec=()=>0;_SDL_HasAltiVec.sig="i";var ALLOC_NORMAL=0,ALLOC_STACK=1,allocate=(e,t)=>{var r;return t==ALLOC_STACK?r=stackAlloc(e.length):r=_malloc(e.length),!e.subarray&&!e.slice&&(e=new Uint8Array(e)),HEAPU8.set(e,r>>>0),r},writeStringToMemory=(e,t,r)=>{warnOnce("writeStringToMemory is deprecated and should not be called! Use stringToUTF8() instead!");var n,a;r&&(a=t+lengthBytesUTF8(e),n=HEAP8[a>>>0]),stringToUTF8(e,t,1/0),r&&(HEAP8[a>>>0]=n)},writeAsciiToMemory=(e,t,r)=>{for(var n=0;n<e.length;++n)HEAP8[t++>>>0]=e.charCodeAt(n);r||(HEAP8[t>>>0]=0)},allocateUTF8=stringToNewUTF8,allocateUTF8OnStack=stringToUTF8OnStack,setErrNo=e=>(HEAP32[___errno_location()>>>2>>>0]=e,e),demangle=e=>(demangle.recursionGuard=(demangle.recursionGuard|0)+1,demangle.recursionGuard>1?e:withStackSave(()=>{try{var t=e;t.startsWith("__Z")&&(t=t.substr(1));var r=stringToUTF8OnStack(t),n=stackAlloc(4),a=___cxa_demangle(r,0,0,n);if(HEAP32[n>>>2>>>0]===0&&a)return UTF8ToString(a)}catch(o){}finally{_free(a),demangle.recursionGuard<2&&--demangle.recursionGuard}return e})),stackTrace=()=>{var e=jsStackTrace();return Module.extraStackTrace&&(e+="\n"+Module.extraStackTrace()),e},print=out,printErr=err,_emscripten_is_main_browser_thread=()=>!ENVIRONMENT_IS_WORKER,tupleRegistrations={},structRegistrations={},getFunctionName=e=>{e=e.trim();let t=e.indexOf("(");return t!==-1?e.substr(0,t):e},getFunctionArgsName=e=>{e=e.trim();let t=e.indexOf("(")+1;return t!==0?e.substr(t,e.length-t-1).replaceAll(" ","").split(",").filter(r=>r.length):[]},heap32VectorToArray=(e,t)=>{for(var r=[],n=0;n<e;n++)r.push(HEAPU32[t+n*4>>>2>>>0]);return r};function usesDestructorStack(e){for(var t=1;t<e.length;++t)if(e[t]!==null&&e[t].destructorFunction===void 0)return!0;return!1}function createJsInvokerSignature(e,t,r,n){let a=[t?"t":"f",r?"t":"f",n?"t":"f"];for(let o=t?1:2;o<e.length;++o){let l=e[o],u="";l.destructorFunction===void 0?u="u":l.destructorFunction===null?u="n":u="t",a.push(u)}return a.join("")}function checkArgCount(e,t,r,n,a){if(e<t||e>r){var o=t==r?t:"".concat(t," to ").concat(r);a("function ".concat(n," called with ").concat(e," arguments, expected ").concat(o))}}function getRequiredArgCount(e){for(var t=e.length-2,r=e.length-1;r>=2&&e[r].optional;--r)t--;return t}function createJsInvoker(e,t,r,n){var a=usesDestructorStack(e),o=e.length-2,l=[],u=["fn"];t&&u.push("thisWired");for(var _=0;_<o;++_)l.push("arg".concat(_)),u.push("arg".concat(_,"Wired"));l=l.join(","),u=u.join(",");var d="return function (".concat(l,") {\n");a&&(d+="var destructors = [];\n");var f=a?"destructors":"null",p=["humanName","throwBindingError","invoker","fn","runDestructors","retType","classParam"];t&&(d+="var thisWired = classParam['toWireType'](".concat(f,", this);\n"));for(var _=0;_<o;++_)d+="var arg".concat(_,"Wired = argType").concat(_,"['toWireType'](").concat(f,", arg").concat(_,");\n"),p.push("argType".concat(_));d+=(r||n?"var rv = ":"")+"invoker(".concat(u,");\n");var m=r?"rv":"";if(a)d+="runDestructors(destructors);\n";else for(var _=t?1:2;_<e.length;++_){var h=_===1?"thisWired":"arg"+(_-2)+"Wired";e[_].destructorFunction!==null&&(d+="".concat(h,"_dtor(").concat(h,");\n"),p.push("".concat(h,"_dtor")))}return r&&(d+="var ret = retType['fromWireType'](rv);\nreturn ret;\n"),d+="}\n",[p,d]}var extendError=(e,t)=>{var r=createNamedFunction(t,function(n){this.name=t,this.message=n;var a=new Error(n).stack;a!==void 0&&(this.stack=this.toString()+"\n"+a.replace(/^Error(:[^\n]*)?\n/,""))});return r.prototype=Object.create(e.prototype),r.prototype.constructor=r,r.prototype.toString=function(){return this.message===void 0?this.name:"".concat(this.name,": ").concat(this.message)},r},UnboundTypeError,PureVirtualError,EmValOptionalType=Object.assign({optional:!0},EmValType),throwUnboundTypeError=(e,t)=>{var r=[],n={};function a(o){if(!n[o]&&!registeredTypes[o]){if(typeDependencies[o]){typeDependencies[o].forEach(a);return}r.push(o),n[o]=!0}}throw t.forEach(a),new UnboundTypeError("".concat(e,": ")+r.map(getTypeName).join([", "]))},ensureOverloadTable=(e,t,r)=>{if(e[t].overloadTable===void 0){var n=e[t];e[t]=function(...a){return e[t].overloadTable.hasOwnProperty(a.length)||throwBindingError("Function '".concat(r,"' called with an invalid number of arguments (").concat(a.length,") - expects one of (").concat(e[t].overloadTable,")!")),e[t].overloadTable[a.length].apply(this,a)},e[t].overloadTable=[],e[t].overloadTable[n.argCount]=n}},exposePublicSymbol=(e,t,r)=>{Module.hasOwnProperty(e)?((r===void 0||Module[e].overloadTable!==void 0&&Module[e].overloadTable[r]!==void 0)&&throwBindingError("Cannot register public name '".concat(e,"' twice")),ensureOverloadTable(Module,e,e),Module[e].overloadTable.hasOwnProperty(r)&&throwBindingError("Cannot register multiple overloads of a function with the same number of arguments (".concat(r,")!")),Module[e].overloadTable[r]=t):(Module[e]=t,Module[e].argCount=r)},replacePublicSymbol=(e,t,r)=>{Module.hasOwnProperty(e)||throwInternalError("Replacing nonexistent public symbol"),Module[e].overloadTable!==void 0&&r!==void 0?Module[e].overloadTable[r]=t:(Module[e]=t,Module[e].argCount=r)},registeredInstances={},getBasestPointer=(e,t)=>{for(t===void 0&&throwBindingError("ptr should not be undefined");e.baseClass;)t=e.upcast(t),e=e.baseClass;return t},registerInheritedInstance=(e,t,r)=>{t=getBasestPointer(e,t),registeredInstances.hasOwnProperty(t)?throwBindingError("Tried to register registered instance: ".concat(t)):registeredInstances[t]=r},unregisterInheritedInstance=(e,t)=>{t=getBasestPointer(e,t),registeredInstances.hasOwnProperty(t)?delete registeredInstances[t]:throwBindingError("Tried to unregister unregistered instance: ".concat(t))},getInheritedInstance=(e,t)=>(t=getBasestPointer(e,t),registeredInstances[t]),getInheritedInstanceCount=()=>Object.keys(registeredInstances).length,getLiveInheritedInstances=()=>{var e=[];for(var t in registeredInstances)registeredInstances.hasOwnProperty(t)&&e.push(registeredInstances[t]);return e},registeredPointers={},enumReadValueFromPointer=(e,t,r)=>{switch(t){case 1:return r?function(n){return this.fromWireType(HEAP8[n>>>0])}:function(n){return this.fromWireType(HEAPU8[n>>>0])};case 2:return r?function(n){return this.fromWireType(HEAP16[n>>>1>>>0])}:function(n){return this.fromWireType(HEAPU16[n>>>1>>>0])};case 4:return r?function(n){return this.fromWireType(HEAP32[n>>>2>>>0])}:function(n){return this.fromWireType(HEAPU32[n>>>2>>>0])};default:throw new TypeError("invalid integer width (".concat(t,"): ").concat(e))}};function __embind_register_user_type(e,t){e>>>=0,t>>>=0,__embind_register_emval(e)}__embind_register_user_type.sig="vpp";function __embind_register_optional(e,t){e>>>=0,t>>>=0,registerType(e,EmValOptionalType)}__embind_register_optional.sig="vpp";function craftInvokerFunction(e,t,r,n,a,o){var l=t.length;l<2&&throwBindingError("argTypes array size mismatch! Must at least get return value and 'this' types!");for(var u=t[1]!==null&&r!==null,_=usesDestructorStack(t),d=t[0].name!=="void",f=l-2,p=[e,throwBindingError,n,a,runDestructors,t[0],t[1]],m=0;m<l-2;++m)p.push(t[m+2]);if(!_)for(var m=u?1:2;m<t.length;++m)t[m].destructorFunction!==null&&p.push(t[m].destructorFunction);let[h,g]=createJsInvoker(t,u,d,o);h.push(g);var v=newFunc(Function,h)(...p);return createNamedFunction(e,v)}var embind__requireFunction=(e,t)=>{e=readLatin1String(e);function r(){return e.includes("j")||e.includes("p")?getDynCaller(e,t):getWasmTableEntry(t)}var n=r();return typeof n!="function"&&throwBindingError("unknown function pointer with signature ".concat(e,": ").concat(t)),n};function __embind_register_function(e,t,r,n,a,o,l,u){e>>>=0,r>>>=0,n>>>=0,a>>>=0,o>>>=0;var _=heap32VectorToArray(t,r);e=readLatin1String(e),e=getFunctionName(e),a=embind__requireFunction(n,a),exposePublicSymbol(e,function(){throwUnboundTypeError("Cannot call ".concat(e," due to unbound types"),_)},t-1),whenDependentTypesAreResolved([],_,d=>{var f=[d[0],null].concat(d.slice(1));return replacePublicSymbol(e,craftInvokerFunction(e,f,null,a,o,l),t-1),[]})}__embind_register_function.sig="vpippppii";function __embind_register_value_array(e,t,r,n,a,o){e>>>=0,t>>>=0,r>>>=0,n>>>=0,a>>>=0,o>>>=0,tupleRegistrations[e]={name:readLatin1String(t),rawConstructor:embind__requireFunction(r,n),rawDestructor:embind__requireFunction(a,o),elements:[]}}__embind_register_value_array.sig="vpppppp";function __embind_register_value_array_element(e,t,r,n,a,o,l,u,_){e>>>=0,t>>>=0,r>>>=0,n>>>=0,a>>>=0,o>>>=0,l>>>=0,u>>>=0,_>>>=0,tupleRegistrations[e].elements.push({getterReturnType:t,getter:embind__requireFunction(r,n),getterContext:a,setterArgumentType:o,setter:embind__requireFunction(l,u),setterContext:_})}__embind_register_value_array_element.sig="vppppppppp";var __embind_finalize_value_array=function(e){e>>>=0;var t=tupleRegistrations[e];delete tupleRegistrations[e];var r=t.elements,n=r.length,a=r.map(u=>u.getterReturnType).concat(r.map(u=>u.setterArgumentType)),o=t.rawConstructor,l=t.rawDestructor;whenDependentTypesAreResolved([e],a,u=>(r.forEach((_,d)=>{var f=u[d],p=_.getter,m=_.getterContext,h=u[d+n],g=_.setter,v=_.setterContext;_.read=y=>f.fromWireType(p(m,y)),_.write=(y,S)=>{var w=[];g(v,y,h.toWireType(w,S)),runDestructors(w)}}),[{name:t.name,fromWireType:_=>{for(var d=new Array(n),f=0;f<n;++f)d[f]=r[f].read(_);return l(_),d},toWireType:(_,d)=>{if(n!==d.length)throw new TypeError("Incorrect number of tuple elements for ".concat(t.name,": expected=").concat(n,", actual=").concat(d.length));for(var f=o(),p=0;p<n;++p)r[p].write(f,d[p]);return _!==null&&_.push(l,f),f},argPackAdvance:GenericWireTypeSize,readValueFromPointer:readPointer,destructorFunction:l}]))};__embind_finalize_value_array.sig="vp";function __embind_register_value_object(e,t,r,n,a,o){e>>>=0,t>>>=0,r>>>=0,n>>>=0,a>>>=0,o>>>=0,structRegistrations[e]={name:readLatin1String(t),rawConstructor:embind__requireFunction(r,n),rawDestructor:embind__requireFunction(a,o),fields:[]}}__embind_register_value_object.sig="vpppppp";function __embind_register_value_object_field(e,t,r,n,a,o,l,u,_,d){e>>>=0,t>>>=0,r>>>=0,n>>>=0,a>>>=0,o>>>=0,l>>>=0,u>>>=0,_>>>=0,d>>>=0,structRegistrations[e].fields.push({fieldName:readLatin1String(t),getterReturnType:r,getter:embind__requireFunction(n,a),getterContext:o,setterArgumentType:l,setter:embind__requireFunction(u,_),setterContext:d})}__embind_register_value_object_field.sig="vpppppppppp";var __embind_finalize_value_object=function(e){e>>>=0;var t=structRegistrations[e];delete structRegistrations[e];var r=t.rawConstructor,n=t.rawDestructor,a=t.fields,o=a.map(l=>l.getterReturnType).concat(a.map(l=>l.setterArgumentType));whenDependentTypesAreResolved([e],o,l=>{var u={};return a.forEach((_,d)=>{var f=_.fieldName,p=l[d],m=_.getter,h=_.getterContext,g=l[d+a.length],v=_.setter,y=_.setterContext;u[f]={read:S=>p.fromWireType(m(h,S)),write:(S,w)=>{var D=[];v(y,S,g.toWireType(D,w)),runDestructors(D)}}}),[{name:t.name,fromWireType:_=>{var d={};for(var f in u)d[f]=u[f].read(_);return n(_),d},toWireType:(_,d)=>{for(var f in u)if(!(f in d))throw new TypeError('Missing field: "'.concat(f,'"'));var p=r();for(f in u)u[f].write(p,d[f]);return _!==null&&_.push(n,p),p},argPackAdvance:GenericWireTypeSize,readValueFromPointer:readPointer,destructorFunction:n}]})};__embind_finalize_value_object.sig="vp";var upcastPointer=(e,t,r)=>{for(;t!==r;)t.upcast||throwBindingError("Expected null or instance of ".concat(r.name,", got an instance of ").concat(t.name)),e=t.upcast(e),t=t.baseClass;return e};function genericPointerToWireType(e,t){var r;if(t===null)return this.isReference&&throwBindingError("null is not a valid ".concat(this.name)),this.isSmartPointer?(r=this.rawConstructor(),e!==null&&e.push(this.rawDestructor,r),r):0;(!t||!t.$$)&&throwBindingError('Cannot pass "'.concat(embindRepr(t),'" as a ').concat(this.name)),t.$$.ptr||throwBindingError("Cannot pass deleted object as a pointer of type ".concat(this.name)),!this.isConst&&t.$$.ptrType.isConst&&throwBindingError("Cannot convert argument of type ".concat(t.$$.smartPtrType?t.$$.smartPtrType.name:t.$$.ptrType.name," to parameter type ").concat(this.name));var n=t.$$.ptrType.registeredClass;if(r=upcastPointer(t.$$.ptr,n,this.registeredClass),this.isSmartPointer)switch(t.$$.smartPtr===void 0&&throwBindingError("Passing raw pointer to smart pointer is illegal"),this.sharingPolicy){case 0:t.$$.smartPtrType===this?r=t.$$.smartPtr:throwBindingError("Cannot convert argument of type ".concat(t.$$.smartPtrType?t.$$.smartPtrType.name:t.$$.ptrType.name," to parameter type ").concat(this.name));break;case 1:r=t.$$.smartPtr;break;case 2:if(t.$$.smartPtrType===this)r=t.$$.smartPtr;else{var a=t.clone();r=this.rawShare(r,Emval.toHandle(()=>a.delete())),e!==null&&e.push(this.rawDestructor,r)}break;default:throwBindingError("Unsupporting sharing policy")}return r}function constNoSmartPtrRawPointerToWireType(e,t){if(t===null)return this.isReference&&throwBindingError("null is not a valid ".concat(this.name)),0;t.$$||throwBindingError('Cannot pass "'.concat(embindRepr(t),'" as a ').concat(this.name)),t.$$.ptr||throwBindingError("Cannot pass deleted object as a pointer of type ".concat(this.name));var r=t.$$.ptrType.registeredClass,n=upcastPointer(t.$$.ptr,r,this.registeredClass);return n}function nonConstNoSmartPtrRawPointerToWireType(e,t){if(t===null)return this.isReference&&throwBindingError("null is not a valid ".concat(this.name)),0;t.$$||throwBindingError('Cannot pass "'.concat(embindRepr(t),'" as a ').concat(this.name)),t.$$.ptr||throwBindingError("Cannot pass deleted object as a pointer of type ".concat(this.name)),t.$$.ptrType.isConst&&throwBindingError("Cannot convert argument of type ".concat(t.$$.ptrType.name," to parameter type ").concat(this.name));var r=t.$$.ptrType.registeredClass,n=upcastPointer(t.$$.ptr,r,this.registeredClass);return n}function RegisteredPointer(e,t,r,n,a,o,l,u,_,d,f){this.name=e,this.registeredClass=t,this.isReference=r,this.isConst=n,this.isSmartPointer=a,this.pointeeType=o,this.sharingPolicy=l,this.rawGetPointee=u,this.rawConstructor=_,this.rawShare=d,this.rawDestructor=f,!a&&t.baseClass===void 0?n?(this.toWireType=constNoSmartPtrRawPointerToWireType,this.destructorFunction=null):(this.toWireType=nonConstNoSmartPtrRawPointerToWireType,this.destructorFunction=null):this.toWireType=genericPointerToWireType}var downcastPointer=(e,t,r)=>{if(t===r)return e;if(r.baseClass===void 0)return null;var n=downcastPointer(e,t,r.baseClass);return n===null?null:r.downcast(n)},finalizationRegistry=!1,detachFinalizer=e=>{},runDestructor=e=>{e.smartPtr?e.smartPtrType.rawDestructor(e.smartPtr):e.ptrType.registeredClass.rawDestructor(e.ptr)},releaseClassHandle=e=>{e.count.value-=1;var t=e.count.value===0;t&&runDestructor(e)},attachFinalizer=e=>typeof FinalizationRegistry>"u"?(attachFinalizer=t=>t,e):(finalizationRegistry=new FinalizationRegistry(t=>{releaseClassHandle(t.$$)}),attachFinalizer=t=>{var r=t.$$,n=!!r.smartPtr;if(n){var a={$$:r};finalizationRegistry.register(t,a,t)}return t},detachFinalizer=t=>finalizationRegistry.unregister(t),attachFinalizer(e)),makeClassHandle=(e,t)=>{(!t.ptrType||!t.ptr)&&throwInternalError("makeClassHandle requires ptr and ptrType");var r=!!t.smartPtrType,n=!!t.smartPtr;return r!==n&&throwInternalError("Both smartPtrType and smartPtr must be specified"),t.count={value:1},attachFinalizer(Object.create(e,{$$:{value:t,writable:!0}}))};function RegisteredPointer_fromWireType(e){var t=this.getPointee(e);if(!t)return this.destructor(e),null;var r=getInheritedInstance(this.registeredClass,t);if(r!==void 0){if(r.$$.count.value===0)return r.$$.ptr=t,r.$$.smartPtr=e,r.clone();var n=r.clone();return this.destructor(e),n}function a(){return this.isSmartPointer?makeClassHandle(this.registeredClass.instancePrototype,{ptrType:this.pointeeType,ptr:t,smartPtrType:this,smartPtr:e}):makeClassHandle(this.registeredClass.instancePrototype,{ptrType:this,ptr:e})}var o=this.registeredClass.getActualType(t),l=registeredPointers[o];if(!l)return a.call(this);var u;this.isConst?u=l.constPointerType:u=l.pointerType;var _=downcastPointer(t,this.registeredClass,u.registeredClass);return _===null?a.call(this):this.isSmartPointer?makeClassHandle(u.registeredClass.instancePrototype,{ptrType:u,ptr:_,smartPtrType:this,smartPtr:e}):makeClassHandle(u.registeredClass.instancePrototype,{ptrType:u,ptr:_})}var init_RegisteredPointer=()=>{Object.assign(RegisteredPointer.prototype,{getPointee(e){return this.rawGetPointee&&(e=this.rawGetPointee(e)),e},destructor(e){var t;(t=this.rawDestructor)==null||t.call(this,e)},argPackAdvance:GenericWireTypeSize,readValueFromPointer:readPointer,fromWireType:RegisteredPointer_fromWireType})},detachFinalizer_deps=["$finalizationRegistry"];function ClassHandle(){}var shallowCopyInternalPointer=e=>({count:e.count,deleteScheduled:e.deleteScheduled,preservePointerOnDelete:e.preservePointerOnDelete,ptr:e.ptr,ptrType:e.ptrType,smartPtr:e.smartPtr,smartPtrType:e.smartPtrType}),throwInstanceAlreadyDeleted=e=>{function t(r){return r.$$.ptrType.registeredClass.name}throwBindingError(t(e)+" instance already deleted")},deletionQueue=[],flushPendingDeletes=()=>{for(;deletionQueue.length;){var e=deletionQueue.pop();e.$$.deleteScheduled=!1,e.delete()}},delayFunction,init_ClassHandle=()=>{Object.assign(ClassHandle.prototype,{isAliasOf(e){if(!(this instanceof ClassHandle)||!(e instanceof ClassHandle))return!1;var t=this.$$.ptrType.registeredClass,r=this.$$.ptr;e.$$=e.$$;for(var n=e.$$.ptrType.registeredClass,a=e.$$.ptr;t.baseClass;)r=t.upcast(r),t=t.baseClass;for(;n.baseClass;)a=n.upcast(a),n=n.baseClass;return t===n&&r===a},clone(){if(this.$$.ptr||throwInstanceAlreadyDeleted(this),this.$$.preservePointerOnDelete)return this.$$.count.value+=1,this;var e=attachFinalizer(Object.create(Object.getPrototypeOf(this),{$$:{value:shallowCopyInternalPointer(this.$$)}}));return e.$$.count.value+=1,e.$$.deleteScheduled=!1,e},delete(){this.$$.ptr||throwInstanceAlreadyDeleted(this),this.$$.deleteScheduled&&!this.$$.preservePointerOnDelete&&throwBindingError("Object already scheduled for deletion"),detachFinalizer(this),releaseClassHandle(this.$$),this.$$.preservePointerOnDelete||(this.$$.smartPtr=void 0,this.$$.ptr=void 0)},isDeleted(){return!this.$$.ptr},deleteLater(){return this.$$.ptr||throwInstanceAlreadyDeleted(this),this.$$.deleteScheduled&&!this.$$.preservePointerOnDelete&&throwBindingError("Object already scheduled for deletion"),deletionQueue.push(this),deletionQueue.length===1&&delayFunction&&delayFunction(flushPendingDeletes),this.$$.deleteScheduled=!0,this}})},setDelayFunction=e=>{delayFunction=e,deletionQueue.length&&delayFunction&&delayFunction(flushPendingDeletes)};function RegisteredClass(e,t,r,n,a,o,l,u){this.name=e,this.constructor=t,this.instancePrototype=r,this.rawDestructor=n,this.baseClass=a,this.getActualType=o,this.upcast=l,this.downcast=u,this.pureVirtualFunctions=[]}var char_0=48,char_9=57,makeLegalFunctionName=e=>{e=e.replace(/[^a-zA-Z0-9_]/g,"$");var t=e.charCodeAt(0);return t>=char_0&&t<=char_9?"_".concat(e):e};function __embind_register_class(e,t,r,n,a,o,l,u,_,d,f,p,m){e>>>=0,t>>>=0,r>>>=0,n>>>=0,a>>>=0,o>>>=0,l>>>=0,u>>>=0,_>>>=0,d>>>=0,f>>>=0,p>>>=0,m>>>=0,f=readLatin1String(f),o=embind__requireFunction(a,o),u&&(u=embind__requireFunction(l,u)),d&&(d=embind__requireFunction(_,d)),m=embind__requireFunction(p,m);var h=makeLegalFunctionName(f);exposePublicSymbol(h,function(){throwUnboundTypeError("Cannot construct ".concat(f," due to unbound types"),[n])}),whenDependentTypesAreResolved([e,t,r],n?[n]:[],g=>{var A,L;g=g[0];var v,y;n?(v=g.registeredClass,y=v.instancePrototype):y=ClassHandle.prototype;var S=createNamedFunction(f,function(...C){if(Object.getPrototypeOf(this)!==w)throw new BindingError("Use 'new' to construct "+f);if(D.constructor_body===void 0)throw new BindingError(f+" has no accessible constructor");var k=D.constructor_body[C.length];if(k===void 0)throw new BindingError("Tried to invoke ctor of ".concat(f," with invalid number of parameters (").concat(C.length,") - expected (").concat(Object.keys(D.constructor_body).toString(),") parameters instead!"));return k.apply(this,C)}),w=Object.create(y,{constructor:{value:S}});S.prototype=w;var D=new RegisteredClass(f,S,w,m,v,o,u,d);D.baseClass&&((L=(A=D.baseClass).__derivedClasses)!=null||(A.__derivedClasses=[]),D.baseClass.__derivedClasses.push(D));var F=new RegisteredPointer(f,D,!0,!1,!1),E=new RegisteredPointer(f+"*",D,!1,!1,!1),x=new RegisteredPointer(f+" const*",D,!1,!0,!1);return registeredPointers[e]={pointerType:E,constPointerType:x},replacePublicSymbol(h,S),[F,E,x]})}__embind_register_class.sig="vppppppppppppp";var __embind_register_class_constructor=function(e,t,r,n,a,o){e>>>=0,r>>>=0,n>>>=0,a>>>=0,o>>>=0;var l=heap32VectorToArray(t,r);a=embind__requireFunction(n,a);var u=[o],_=[];whenDependentTypesAreResolved([],[e],d=>{d=d[0];var f="constructor ".concat(d.name);if(d.registeredClass.constructor_body===void 0&&(d.registeredClass.constructor_body=[]),d.registeredClass.constructor_body[t-1]!==void 0)throw new BindingError("Cannot register multiple constructors with identical number of parameters (".concat(t-1,") for class '").concat(d.name,"'! Overload resolution is currently only performed using the parameter count, not actual type info!"));return d.registeredClass.constructor_body[t-1]=()=>{throwUnboundTypeError("Cannot construct ".concat(d.name," due to unbound types"),l)},whenDependentTypesAreResolved([],l,p=>(p.splice(1,0,null),d.registeredClass.constructor_body[t-1]=craftInvokerFunction(f,p,null,a,o),[])),[]})};__embind_register_class_constructor.sig="vpipppp";var validateThis=(e,t,r)=>(e instanceof Object||throwBindingError("".concat(r,' with invalid "this": ').concat(e)),e instanceof t.registeredClass.constructor||throwBindingError("".concat(r,' incompatible with "this" of type ').concat(e.constructor.name)),e.$$.ptr||throwBindingError("cannot call emscripten binding method ".concat(r," on deleted object")),upcastPointer(e.$$.ptr,e.$$.ptrType.registeredClass,t.registeredClass)),__embind_register_class_function=function(e,t,r,n,a,o,l,u,_,d){e>>>=0,t>>>=0,n>>>=0,a>>>=0,o>>>=0,l>>>=0;var f=heap32VectorToArray(r,n);t=readLatin1String(t),t=getFunctionName(t),o=embind__requireFunction(a,o),whenDependentTypesAreResolved([],[e],p=>{p=p[0];var m="".concat(p.name,".").concat(t);t.startsWith("@@")&&(t=Symbol[t.substring(2)]),u&&p.registeredClass.pureVirtualFunctions.push(t);function h(){throwUnboundTypeError("Cannot call ".concat(m," due to unbound types"),f)}var g=p.registeredClass.instancePrototype,v=g[t];return v===void 0||v.overloadTable===void 0&&v.className!==p.name&&v.argCount===r-2?(h.argCount=r-2,h.className=p.name,g[t]=h):(ensureOverloadTable(g,t,m),g[t].overloadTable[r-2]=h),whenDependentTypesAreResolved([],f,y=>{var S=craftInvokerFunction(m,y,p,o,l,_);return g[t].overloadTable===void 0?(S.argCount=r-2,g[t]=S):g[t].overloadTable[r-2]=S,[]}),[]})};__embind_register_class_function.sig="vppippppiii";var __embind_register_class_property=function(e,t,r,n,a,o,l,u,_,d){e>>>=0,t>>>=0,r>>>=0,n>>>=0,a>>>=0,o>>>=0,l>>>=0,u>>>=0,_>>>=0,d>>>=0,t=readLatin1String(t),a=embind__requireFunction(n,a),whenDependentTypesAreResolved([],[e],f=>{f=f[0];var p="".concat(f.name,".").concat(t),m={get(){throwUnboundTypeError("Cannot access ".concat(p," due to unbound types"),[r,l])},enumerable:!0,configurable:!0};return _?m.set=()=>throwUnboundTypeError("Cannot access ".concat(p," due to unbound types"),[r,l]):m.set=h=>throwBindingError(p+" is a read-only property"),Object.defineProperty(f.registeredClass.instancePrototype,t,m),whenDependentTypesAreResolved([],_?[r,l]:[r],h=>{var g=h[0],v={get(){var S=validateThis(this,f,p+" getter");return g.fromWireType(a(o,S))},enumerable:!0};if(_){_=embind__requireFunction(u,_);var y=h[1];v.set=function(S){var w=validateThis(this,f,p+" setter"),D=[];_(d,w,y.toWireType(D,S)),runDestructors(D)}}return Object.defineProperty(f.registeredClass.instancePrototype,t,v),[]}),[]})};__embind_register_class_property.sig="vpppppppppp";var __embind_register_class_class_function=function(e,t,r,n,a,o,l,u,_){e>>>=0,t>>>=0,n>>>=0,a>>>=0,o>>>=0,l>>>=0;var d=heap32VectorToArray(r,n);t=readLatin1String(t),t=getFunctionName(t),o=embind__requireFunction(a,o),whenDependentTypesAreResolved([],[e],f=>{f=f[0];var p="".concat(f.name,".").concat(t);function m(){throwUnboundTypeError("Cannot call ".concat(p," due to unbound types"),d)}t.startsWith("@@")&&(t=Symbol[t.substring(2)]);var h=f.registeredClass.constructor;return h[t]===void 0?(m.argCount=r-1,h[t]=m):(ensureOverloadTable(h,t,p),h[t].overloadTable[r-1]=m),whenDependentTypesAreResolved([],d,g=>{var v=[g[0],null].concat(g.slice(1)),y=craftInvokerFunction(p,v,null,o,l,u);if(h[t].overloadTable===void 0?(y.argCount=r-1,h[t]=y):h[t].overloadTable[r-1]=y,f.registeredClass.__derivedClasses)for(let S of f.registeredClass.__derivedClasses)S.constructor.hasOwnProperty(t)||(S.constructor[t]=y);return[]}),[]})};__embind_register_class_class_function.sig="vppippppii";var __embind_register_class_class_property=function(e,t,r,n,a,o,l,u){e>>>=0,t>>>=0,r>>>=0,n>>>=0,a>>>=0,o>>>=0,l>>>=0,u>>>=0,t=readLatin1String(t),o=embind__requireFunction(a,o),whenDependentTypesAreResolved([],[e],_=>{_=_[0];var d="".concat(_.name,".").concat(t),f={get(){throwUnboundTypeError("Cannot access ".concat(d," due to unbound types"),[r])},enumerable:!0,configurable:!0};return u?f.set=()=>{throwUnboundTypeError("Cannot access ".concat(d," due to unbound types"),[r])}:f.set=p=>{throwBindingError("".concat(d," is a read-only property"))},Object.defineProperty(_.registeredClass.constructor,t,f),whenDependentTypesAreResolved([],[r],p=>{p=p[0];var m={get(){return p.fromWireType(o(n))},enumerable:!0};return u&&(u=embind__requireFunction(l,u),m.set=h=>{var g=[];u(n,p.toWireType(g,h)),runDestructors(g)}),Object.defineProperty(_.registeredClass.constructor,t,m),[]}),[]})};__embind_register_class_class_property.sig="vpppppppp";function __embind_create_inheriting_constructor(e,t,r){e>>>=0,t>>>=0,r>>>=0,e=readLatin1String(e),t=requireRegisteredType(t,"wrapper"),r=Emval.toValue(r);var n=t.registeredClass,a=n.instancePrototype,o=n.baseClass,l=o.instancePrototype,u=n.baseClass.constructor,_=createNamedFunction(e,function(...d){n.baseClass.pureVirtualFunctions.forEach((function(f){if(this[f]===l[f])throw new PureVirtualError("Pure virtual function ".concat(f," must be implemented in JavaScript"))}).bind(this)),Object.defineProperty(this,"__parent",{value:a}),this.__construct(...d)});return a.__construct=function(...f){this===a&&throwBindingError("Pass correct 'this' to __construct");var p=u.implement(this,...f);detachFinalizer(p);var m=p.$$;p.notifyOnDestruction(),m.preservePointerOnDelete=!0,Object.defineProperties(this,{$$:{value:m}}),attachFinalizer(this),registerInheritedInstance(n,m.ptr,this)},a.__destruct=function(){this===a&&throwBindingError("Pass correct 'this' to __destruct"),detachFinalizer(this),unregisterInheritedInstance(n,this.$$.ptr)},_.prototype=Object.create(a),Object.assign(_.prototype,r),Emval.toHandle(_)}__embind_create_inheriting_constructor.sig="pppp";var __embind_register_smart_ptr=function(e,t,r,n,a,o,l,u,_,d,f,p){e>>>=0,t>>>=0,r>>>=0,a>>>=0,o>>>=0,l>>>=0,u>>>=0,_>>>=0,d>>>=0,f>>>=0,p>>>=0,r=readLatin1String(r),o=embind__requireFunction(a,o),u=embind__requireFunction(l,u),d=embind__requireFunction(_,d),p=embind__requireFunction(f,p),whenDependentTypesAreResolved([e],[t],m=>{m=m[0];var h=new RegisteredPointer(r,m.registeredClass,!1,!1,!0,m,n,o,u,d,p);return[h]})};__embind_register_smart_ptr.sig="vpppipppppppp";function __embind_register_enum(e,t,r,n){e>>>=0,t>>>=0,r>>>=0,t=readLatin1String(t);function a(){}a.values={},registerType(e,{name:t,constructor:a,fromWireType:function(o){return this.constructor.values[o]},toWireType:(o,l)=>l.value,argPackAdvance:GenericWireTypeSize,readValueFromPointer:enumReadValueFromPointer(t,r,n),destructorFunction:null}),exposePublicSymbol(t,a)}__embind_register_enum.sig="vpppi";function __embind_register_enum_value(e,t,r){e>>>=0,t>>>=0;var n=requireRegisteredType(e,"enum");t=readLatin1String(t);var a=n.constructor,o=Object.create(n.constructor.prototype,{value:{value:r},constructor:{value:createNamedFunction("".concat(n.name,"_").concat(t),function(){})}});a.values[r]=o,a[t]=o}__embind_register_enum_value.sig="vppi";var __embind_register_constant=function(e,t,r){e>>>=0,t>>>=0,e=readLatin1String(e),whenDependentTypesAreResolved([],[t],n=>(n=n[0],Module[e]=n.fromWireType(r),[]))};__embind_register_constant.sig="vppd";function __emval_register_symbol(e){e>>>=0,emval_symbols[e]=readLatin1String(e)}__emval_register_symbol.sig="vp";function __emval_incref(e){e>>>=0,e>9&&(emval_handles[e+1]+=1)}__emval_incref.sig="vp";function __emval_new_array(){return Emval.toHandle([])}__emval_new_array.sig="p";function __emval_new_array_from_memory_view(e){e>>>=0,e=Emval.toValue(e);for(var t=new Array(e.length),r=0;r<e.length;r++)t[r]=e[r];return Emval.toHandle(t)}__emval_new_array_from_memory_view.sig="pp";function __emval_new_object(){return Emval.toHandle({})}__emval_new_object.sig="p";function __emval_new_cstring(e){return e>>>=0,Emval.toHandle(getStringOrSymbol(e))}__emval_new_cstring.sig="pp";function __emval_new_u8string(e){return e>>>=0,Emval.toHandle(UTF8ToString(e))}__emval_new_u8string.sig="pp";function __emval_new_u16string(e){return e>>>=0,Emval.toHandle(UTF16ToString(e))}__emval_new_u16string.sig="pp";function __emval_take_value(e,t){e>>>=0,t>>>=0,e=requireRegisteredType(e,"_emval_take_value");var r=e.readValueFromPointer(t);return Emval.toHandle(r)}__emval_take_value.sig="ppp";function __emval_get_module_property(e){return e>>>=0,e=getStringOrSymbol(e),Emval.toHandle(Module[e])}__emval_get_module_property.sig="pp";function __emval_get_property(e,t){return e>>>=0,t>>>=0,e=Emval.toValue(e),t=Emval.toValue(t),Emval.toHandle(e[t])}__emval_get_property.sig="ppp";function __emval_set_property(e,t,r){e>>>=0,t>>>=0,r>>>=0,e=Emval.toValue(e),t=Emval.toValue(t),r=Emval.toValue(r),e[t]=r}__emval_set_property.sig="vppp";function __emval_as(e,t,r){return e>>>=0,t>>>=0,r>>>=0,e=Emval.toValue(e),t=requireRegisteredType(t,"emval::as"),emval_returnValue(t,r,e)}__emval_as.sig="dppp";function __emval_as_int64(e,t){return e>>>=0,t>>>=0,e=Emval.toValue(e),t=requireRegisteredType(t,"emval::as"),t.toWireType(null,e)}__emval_as_int64.sig="ipp";function __emval_as_uint64(e,t){return e>>>=0,t>>>=0,e=Emval.toValue(e),t=requireRegisteredType(t,"emval::as"),t.toWireType(null,e)}__emval_as_uint64.sig="ipp";function __emval_equals(e,t){return e>>>=0,t>>>=0,e=Emval.toValue(e),t=Emval.toValue(t),e==t}__emval_equals.sig="ipp";function __emval_strictly_equals(e,t){return e>>>=0,t>>>=0,e=Emval.toValue(e),t=Emval.toValue(t),e===t}__emval_strictly_equals.sig="ipp";function __emval_greater_than(e,t){return e>>>=0,t>>>=0,e=Emval.toValue(e),t=Emval.toValue(t),e>t}__emval_greater_than.sig="ipp";function __emval_less_than(e,t){return e>>>=0,t>>>=0,e=Emval.toValue(e),t=Emval.toValue(t),e<t}__emval_less_than.sig="ipp";function __emval_not(e){return e>>>=0,e=Emval.toValue(e),!e}__emval_not.sig="ip";function __emval_call(e,t,r,n){return e>>>=0,t>>>=0,r>>>=0,n>>>=0,e=emval_methodCallers[e],t=Emval.toValue(t),e(null,t,r,n)}__emval_call.sig="dpppp";function __emval_typeof(e){return e>>>=0,e=Emval.toValue(e),Emval.toHandle(typeof e)}__emval_typeof.sig="pp";function __emval_instanceof(e,t){return e>>>=0,t>>>=0,e=Emval.toValue(e),t=Emval.toValue(t),e instanceof t}__emval_instanceof.sig="ipp";function __emval_is_number(e){return e>>>=0,e=Emval.toValue(e),typeof e=="number"}__emval_is_number.sig="ip";function __emval_is_string(e){return e>>>=0,e=Emval.toValue(e),typeof e=="string"}__emval_is_string.sig="ip";function __emval_in(e,t){return e>>>=0,t>>>=0,e=Emval.toValue(e),t=Emval.toValue(t),e in t}__emval_in.sig="ipp";function __emval_delete(e,t){return e>>>=0,t>>>=0,e=Emval.toValue(e),t=Emval.toValue(t),delete e[t]}__emval_delete.sig="ipp";function __emval_throw(e){throw e>>>=0,e=Emval.toValue(e),e}__emval_throw.sig="ip";function __emval_iter_begin(e){return e>>>=0,e=Emval.toValue(e),Emval.toHandle(e[Symbol.iterator]())}__emval_iter_begin.sig="pp";function __emval_iter_next(e){e>>>=0,e=Emval.toValue(e);var t=e.next();return t.done?0:Emval.toHandle(t.value)}__emval_iter_next.sig="pp";var __emval_coro_suspend=function(e,t){e>>>=0,t>>>=0,Emval.toValue(e).then(r=>{__emval_coro_resume(t,Emval.toHandle(r))})};__emval_coro_suspend.sig="vpp";var __emval_coro_make_promise=function(e,t){return e>>>=0,t>>>=0,Emval.toHandle(new Promise((r,n)=>{let a=()=>{try{___cxa_rethrow()}catch(o){n(o)}};HEAPU32[e>>>2>>>0]=Emval.toHandle(r),HEAPU32[t>>>2>>>0]=Emval.toHandle(a)}))};__emval_coro_make_promise.sig="ppp";function _duckdb_web_fs_file_sync(e){return globalThis.DUCKDB_RUNTIME.syncFile(Module,e)}_duckdb_web_fs_file_sync.sig="vi";function _duckdb_web_fs_file_get_last_modified_time(e){return globalThis.DUCKDB_RUNTIME.getLastFileModificationTime(Module,e)}_duckdb_web_fs_file_get_last_modified_time.sig="di";function _duckdb_web_fs_file_remove(e,t){return globalThis.DUCKDB_RUNTIME.removeFile(Module,e,t)}registerWasmPlugin(),FS.createPreloadedFile=FS_createPreloadedFile,FS.staticInit(),embind_init_charCodes(),BindingError=Module.BindingError=class extends Error{constructor(t){super(t),this.name="BindingError"}},InternalError=Module.InternalError=class extends Error{constructor(t){super(t),this.name="InternalError"}},init_emval(),Module.requestAnimationFrame=MainLoop.requestAnimationFrame,Module.pauseMainLoop=MainLoop.pause,Module.resumeMainLoop=MainLoop.resume,MainLoop.init();for(var i=0;i<32;++i)tempFixedLengthArray.push(new Array(i));for(var miniTempWebGLFloatBuffersStorage=new Float32Array(288),i=0;i<=288;++i)miniTempWebGLFloatBuffers[i]=miniTempWebGLFloatBuffersStorage.subarray(0,i);for(var miniTempWebGLIntBuffersStorage=new Int32Array(288),i=0;i<=288;++i)miniTempWebGLIntBuffers[i]=miniTempWebGLIntBuffersStorage.subarray(0,i);var emSetImmediate,emClearImmediate;if(typeof setImmediate<"u")emSetImmediate=setImmediateWrapped,emClearImmediate=clearImmediateWrapped;else if(typeof addEventListener=="function"){var __setImmediate_id_counter=0,__setImmediate_queue=[],__setImmediate_message_id="_si",__setImmediate_cb=e=>{e.data===__setImmediate_message_id&&(e.stopPropagation(),__setImmediate_queue.shift()(),++__setImmediate_id_counter)};addEventListener("message",__setImmediate_cb,!0),emSetImmediate=e=>(postMessage(__setImmediate_message_id,"*"),__setImmediate_id_counter+__setImmediate_queue.push(e)-1),emClearImmediate=e=>{var t=e-__setImmediate_id_counter;t>=0&&t<__setImmediate_queue.length&&(__setImmediate_queue[t]=()=>{})}}Module.requestFullscreen=Browser.requestFullscreen,Module.setCanvasSize=Browser.setCanvasSize,Module.getUserMedia=Browser.getUserMedia,Module.createContext=Browser.createContext;var preloadedImages={},preloadedAudios={};registerPostMainLoop(()=>{var e,t;return(t=(e=SDL.audio)==null?void 0:e.queueNewAudioData)==null?void 0:t.call(e)}),UnboundTypeError=Module.UnboundTypeError=extendError(Error,"UnboundTypeError"),PureVirtualError=Module.PureVirtualError=extendError(Error,"PureVirtualError"),init_RegisteredPointer(),init_ClassHandle();var wasmImports={IMG_Init:_IMG_Init,IMG_Load:_IMG_Load,IMG_Load_RW:_IMG_Load_RW,IMG_Quit:_IMG_Quit,Mix_AllocateChannels:_Mix_AllocateChannels,Mix_ChannelFinished:_Mix_ChannelFinished,Mix_CloseAudio:_Mix_CloseAudio,Mix_FadeInChannelTimed:_Mix_FadeInChannelTimed,Mix_FadeInMusicPos:_Mix_FadeInMusicPos,Mix_FadeOutChannel:_Mix_FadeOutChannel,Mix_FadeOutMusic:_Mix_FadeOutMusic,Mix_FadingChannel:_Mix_FadingChannel,Mix_FreeChunk:_Mix_FreeChunk,Mix_FreeMusic:_Mix_FreeMusic,Mix_HaltChannel:_Mix_HaltChannel,Mix_HaltMusic:_Mix_HaltMusic,Mix_HookMusicFinished:_Mix_HookMusicFinished,Mix_Init:_Mix_Init,Mix_Linked_Version:_Mix_Linked_Version,Mix_LoadMUS:_Mix_LoadMUS,Mix_LoadMUS_RW:_Mix_LoadMUS_RW,Mix_LoadWAV:_Mix_LoadWAV,Mix_LoadWAV_RW:_Mix_LoadWAV_RW,Mix_OpenAudio:_Mix_OpenAudio,Mix_Pause:_Mix_Pause,Mix_PauseMusic:_Mix_PauseMusic,Mix_Paused:_Mix_Paused,Mix_PausedMusic:_Mix_PausedMusic,Mix_PlayChannelTimed:_Mix_PlayChannelTimed,Mix_PlayMusic:_Mix_PlayMusic,Mix_Playing:_Mix_Playing,Mix_PlayingMusic:_Mix_PlayingMusic,Mix_QuerySpec:_Mix_QuerySpec,Mix_QuickLoad_RAW:_Mix_QuickLoad_RAW,Mix_Quit:_Mix_Quit,Mix_ReserveChannels:_Mix_ReserveChannels,Mix_Resume:_Mix_Resume,Mix_ResumeMusic:_Mix_ResumeMusic,Mix_SetPanning:_Mix_SetPanning,Mix_SetPosition:_Mix_SetPosition,Mix_SetPostMix:_Mix_SetPostMix,Mix_Volume:_Mix_Volume,Mix_VolumeChunk:_Mix_VolumeChunk,Mix_VolumeMusic:_Mix_VolumeMusic,SDL_AddTimer:_SDL_AddTimer,SDL_AllocRW:_SDL_AllocRW,SDL_AudioDriverName:_SDL_AudioDriverName,SDL_AudioQuit:_SDL_AudioQuit,SDL_ClearError:_SDL_ClearError,SDL_CloseAudio:_SDL_CloseAudio,SDL_CondBroadcast:_SDL_CondBroadcast,SDL_CondSignal:_SDL_CondSignal,SDL_CondWait:_SDL_CondWait,SDL_CondWaitTimeout:_SDL_CondWaitTimeout,SDL_ConvertSurface:_SDL_ConvertSurface,SDL_CreateCond:_SDL_CreateCond,SDL_CreateMutex:_SDL_CreateMutex,SDL_CreateRGBSurface:_SDL_CreateRGBSurface,SDL_CreateRGBSurfaceFrom:_SDL_CreateRGBSurfaceFrom,SDL_CreateThread:_SDL_CreateThread,SDL_Delay:_SDL_Delay,SDL_DestroyCond:_SDL_DestroyCond,SDL_DestroyMutex:_SDL_DestroyMutex,SDL_DestroyRenderer:_SDL_DestroyRenderer,SDL_DestroyWindow:_SDL_DestroyWindow,SDL_DisplayFormatAlpha:_SDL_DisplayFormatAlpha,SDL_EnableKeyRepeat:_SDL_EnableKeyRepeat,SDL_EnableUNICODE:_SDL_EnableUNICODE,SDL_FillRect:_SDL_FillRect,SDL_Flip:_SDL_Flip,SDL_FreeRW:_SDL_FreeRW,SDL_FreeSurface:_SDL_FreeSurface,SDL_GL_DeleteContext:_SDL_GL_DeleteContext,SDL_GL_ExtensionSupported:_SDL_GL_ExtensionSupported,SDL_GL_GetAttribute:_SDL_GL_GetAttribute,SDL_GL_GetSwapInterval:_SDL_GL_GetSwapInterval,SDL_GL_MakeCurrent:_SDL_GL_MakeCurrent,SDL_GL_SetAttribute:_SDL_GL_SetAttribute,SDL_GL_SetSwapInterval:_SDL_GL_SetSwapInterval,SDL_GL_SwapBuffers:_SDL_GL_SwapBuffers,SDL_GL_SwapWindow:_SDL_GL_SwapWindow,SDL_GetAppState:_SDL_GetAppState,SDL_GetAudioDriver:_SDL_GetAudioDriver,SDL_GetClipRect:_SDL_GetClipRect,SDL_GetCurrentAudioDriver:_SDL_GetCurrentAudioDriver,SDL_GetError:_SDL_GetError,SDL_GetKeyName:_SDL_GetKeyName,SDL_GetKeyState:_SDL_GetKeyState,SDL_GetKeyboardState:_SDL_GetKeyboardState,SDL_GetModState:_SDL_GetModState,SDL_GetMouseState:_SDL_GetMouseState,SDL_GetNumAudioDrivers:_SDL_GetNumAudioDrivers,SDL_GetRGB:_SDL_GetRGB,SDL_GetRGBA:_SDL_GetRGBA,SDL_GetScancodeFromKey:_SDL_GetScancodeFromKey,SDL_GetThreadID:_SDL_GetThreadID,SDL_GetTicks:_SDL_GetTicks,SDL_GetVideoInfo:_SDL_GetVideoInfo,SDL_GetVideoSurface:_SDL_GetVideoSurface,SDL_GetWindowFlags:_SDL_GetWindowFlags,SDL_GetWindowSize:_SDL_GetWindowSize,SDL_Has3DNow:_SDL_Has3DNow,SDL_Has3DNowExt:_SDL_Has3DNowExt,SDL_HasAltiVec:_SDL_HasAltiVec,SDL_HasMMX:_SDL_HasMMX,SDL_HasMMXExt:_SDL_HasMMXExt,SDL_HasRDTSC:_SDL_HasRDTSC,SDL_HasSSE:_SDL_HasSSE,SDL_HasSSE2:_SDL_HasSSE2,SDL_Init:_SDL_Init,SDL_InitSubSystem:_SDL_InitSubSystem,SDL_JoystickClose:_SDL_JoystickClose,SDL_JoystickEventState:_SDL_JoystickEventState,SDL_JoystickGetAxis:_SDL_JoystickGetAxis,SDL_JoystickGetBall:_SDL_JoystickGetBall,SDL_JoystickGetButton:_SDL_JoystickGetButton,SDL_JoystickGetHat:_SDL_JoystickGetHat,SDL_JoystickIndex:_SDL_JoystickIndex,SDL_JoystickName:_SDL_JoystickName,SDL_JoystickNumAxes:_SDL_JoystickNumAxes,SDL_JoystickNumBalls:_SDL_JoystickNumBalls,SDL_JoystickNumButtons:_SDL_JoystickNumButtons,SDL_JoystickNumHats:_SDL_JoystickNumHats,SDL_JoystickOpen:_SDL_JoystickOpen,SDL_JoystickOpened:_SDL_JoystickOpened,SDL_JoystickUpdate:_SDL_JoystickUpdate,SDL_Linked_Version:_SDL_Linked_Version,SDL_ListModes:_SDL_ListModes,SDL_LoadBMP_RW:_SDL_LoadBMP_RW,SDL_LockAudio:_SDL_LockAudio,SDL_LockSurface:_SDL_LockSurface,SDL_LogSetOutputFunction:_SDL_LogSetOutputFunction,SDL_LowerBlit:_SDL_LowerBlit,SDL_LowerBlitScaled:_SDL_LowerBlitScaled,SDL_MapRGB:_SDL_MapRGB,SDL_MapRGBA:_SDL_MapRGBA,SDL_NumJoysticks:_SDL_NumJoysticks,SDL_OpenAudio:_SDL_OpenAudio,SDL_PauseAudio:_SDL_PauseAudio,SDL_PeepEvents:_SDL_PeepEvents,SDL_PollEvent:_SDL_PollEvent,SDL_PumpEvents:_SDL_PumpEvents,SDL_PushEvent:_SDL_PushEvent,SDL_Quit:_SDL_Quit,SDL_QuitSubSystem:_SDL_QuitSubSystem,SDL_RWFromConstMem:_SDL_RWFromConstMem,SDL_RWFromFile:_SDL_RWFromFile,SDL_RWFromMem:_SDL_RWFromMem,SDL_RemoveTimer:_SDL_RemoveTimer,SDL_SaveBMP_RW:_SDL_SaveBMP_RW,SDL_SetAlpha:_SDL_SetAlpha,SDL_SetClipRect:_SDL_SetClipRect,SDL_SetColorKey:_SDL_SetColorKey,SDL_SetColors:_SDL_SetColors,SDL_SetError:_SDL_SetError,SDL_SetGamma:_SDL_SetGamma,SDL_SetGammaRamp:_SDL_SetGammaRamp,SDL_SetPalette:_SDL_SetPalette,SDL_SetVideoMode:_SDL_SetVideoMode,SDL_SetWindowFullscreen:_SDL_SetWindowFullscreen,SDL_SetWindowTitle:_SDL_SetWindowTitle,SDL_ShowCursor:_SDL_ShowCursor,SDL_StartTextInput:_SDL_StartTextInput,SDL_StopTextInput:_SDL_StopTextInput,SDL_ThreadID:_SDL_ThreadID,SDL_UnlockAudio:_SDL_UnlockAudio,SDL_UnlockSurface:_SDL_UnlockSurface,SDL_UpdateRect:_SDL_UpdateRect,SDL_UpdateRects:_SDL_UpdateRects,SDL_UpperBlit:_SDL_UpperBlit,SDL_UpperBlitScaled:_SDL_UpperBlitScaled,SDL_VideoDriverName:_SDL_VideoDriverName,SDL_VideoModeOK:_SDL_VideoModeOK,SDL_VideoQuit:_SDL_VideoQuit,SDL_WM_GrabInput:_SDL_WM_GrabInput,SDL_WM_IconifyWindow:_SDL_WM_IconifyWindow,SDL_WM_SetCaption:_SDL_WM_SetCaption,SDL_WM_SetIcon:_SDL_WM_SetIcon,SDL_WM_ToggleFullScreen:_SDL_WM_ToggleFullScreen,SDL_WaitThread:_SDL_WaitThread,SDL_WarpMouse:_SDL_WarpMouse,SDL_WasInit:_SDL_WasInit,SDL_mutexP:_SDL_mutexP,SDL_mutexV:_SDL_mutexV,TTF_CloseFont:_TTF_CloseFont,TTF_FontAscent:_TTF_FontAscent,TTF_FontDescent:_TTF_FontDescent,TTF_FontHeight:_TTF_FontHeight,TTF_FontLineSkip:_TTF_FontLineSkip,TTF_GlyphMetrics:_TTF_GlyphMetrics,TTF_Init:_TTF_Init,TTF_OpenFont:_TTF_OpenFont,TTF_Quit:_TTF_Quit,TTF_RenderText_Blended:_TTF_RenderText_Blended,TTF_RenderText_Shaded:_TTF_RenderText_Shaded,TTF_RenderText_Solid:_TTF_RenderText_Solid,TTF_RenderUTF8_Solid:_TTF_RenderUTF8_Solid,TTF_SizeText:_TTF_SizeText,TTF_SizeUTF8:_TTF_SizeUTF8,XChangeWindowAttributes:_XChangeWindowAttributes,XCreateWindow:_XCreateWindow,XInternAtom:_XInternAtom,XMapWindow:_XMapWindow,XOpenDisplay:_XOpenDisplay,XPending:_XPending,XSendEvent:_XSendEvent,XSetWMHints:_XSetWMHints,XStoreName:_XStoreName,_Unwind_Backtrace:__Unwind_Backtrace,_Unwind_DeleteException:__Unwind_DeleteException,_Unwind_FindEnclosingFunction:__Unwind_FindEnclosingFunction,_Unwind_GetIPInfo:__Unwind_GetIPInfo,_Unwind_RaiseException:__Unwind_RaiseException,__asctime_r:___asctime_r,__assert_fail:___assert_fail,__call_sighandler:___call_sighandler,__cxa_begin_catch:___cxa_begin_catch,__cxa_call_unexpected:___cxa_call_unexpected,__cxa_current_primary_exception:___cxa_current_primary_exception,__cxa_end_catch:___cxa_end_catch,__cxa_find_matching_catch_2:___cxa_find_matching_catch_2,__cxa_find_matching_catch_3:___cxa_find_matching_catch_3,__cxa_find_matching_catch_4:___cxa_find_matching_catch_4,__cxa_find_matching_catch_5:___cxa_find_matching_catch_5,__cxa_rethrow:___cxa_rethrow,__cxa_rethrow_primary_exception:___cxa_rethrow_primary_exception,__cxa_throw:___cxa_throw,__cxa_uncaught_exceptions:___cxa_uncaught_exceptions,__global_base:___global_base,__heap_base:___heap_base,__indirect_function_table:wasmTable,__memory_base:___memory_base,__resumeException:___resumeException,__stack_high:___stack_high,__stack_low:___stack_low,__stack_pointer:___stack_pointer,__syscall__newselect:___syscall__newselect,__syscall_accept4:___syscall_accept4,__syscall_bind:___syscall_bind,__syscall_chdir:___syscall_chdir,__syscall_chmod:___syscall_chmod,__syscall_connect:___syscall_connect,__syscall_dup:___syscall_dup,__syscall_dup3:___syscall_dup3,__syscall_faccessat:___syscall_faccessat,__syscall_fadvise64:___syscall_fadvise64,__syscall_fallocate:___syscall_fallocate,__syscall_fchdir:___syscall_fchdir,__syscall_fchmod:___syscall_fchmod,__syscall_fchmodat2:___syscall_fchmodat2,__syscall_fchown32:___syscall_fchown32,__syscall_fchownat:___syscall_fchownat,__syscall_fcntl64:___syscall_fcntl64,__syscall_fdatasync:___syscall_fdatasync,__syscall_fstat64:___syscall_fstat64,__syscall_fstatfs64:___syscall_fstatfs64,__syscall_ftruncate64:___syscall_ftruncate64,__syscall_getcwd:___syscall_getcwd,__syscall_getdents64:___syscall_getdents64,__syscall_getpeername:___syscall_getpeername,__syscall_getsockname:___syscall_getsockname,__syscall_getsockopt:___syscall_getsockopt,__syscall_ioctl:___syscall_ioctl,__syscall_listen:___syscall_listen,__syscall_lstat64:___syscall_lstat64,__syscall_mkdirat:___syscall_mkdirat,__syscall_mknodat:___syscall_mknodat,__syscall_newfstatat:___syscall_newfstatat,__syscall_openat:___syscall_openat,__syscall_pipe:___syscall_pipe,__syscall_poll:___syscall_poll,__syscall_readlinkat:___syscall_readlinkat,__syscall_recvfrom:___syscall_recvfrom,__syscall_recvmsg:___syscall_recvmsg,__syscall_renameat:___syscall_renameat,__syscall_rmdir:___syscall_rmdir,__syscall_sendmsg:___syscall_sendmsg,__syscall_sendto:___syscall_sendto,__syscall_socket:___syscall_socket,__syscall_stat64:___syscall_stat64,__syscall_statfs64:___syscall_statfs64,__syscall_symlink:___syscall_symlink,__syscall_symlinkat:___syscall_symlinkat,__syscall_truncate64:___syscall_truncate64,__syscall_unlinkat:___syscall_unlinkat,__syscall_utimensat:___syscall_utimensat,__table_base:___table_base,_abort_js:__abort_js,_dlopen_js:__dlopen_js,_dlsym_catchup_js:__dlsym_catchup_js,_dlsym_js:__dlsym_js,_embind_create_inheriting_constructor:__embind_create_inheriting_constructor,_embind_finalize_value_array:__embind_finalize_value_array,_embind_finalize_value_object:__embind_finalize_value_object,_embind_register_bigint:__embind_register_bigint,_embind_register_bool:__embind_register_bool,_embind_register_class:__embind_register_class,_embind_register_class_class_function:__embind_register_class_class_function,_embind_register_class_class_property:__embind_register_class_class_property,_embind_register_class_constructor:__embind_register_class_constructor,_embind_register_class_function:__embind_register_class_function,_embind_register_class_property:__embind_register_class_property,_embind_register_constant:__embind_register_constant,_embind_register_emval:__embind_register_emval,_embind_register_enum:__embind_register_enum,_embind_register_enum_value:__embind_register_enum_value,_embind_register_float:__embind_register_float,_embind_register_function:__embind_register_function,_embind_register_integer:__embind_register_integer,_embind_register_memory_view:__embind_register_memory_view,_embind_register_optional:__embind_register_optional,_embind_register_smart_ptr:__embind_register_smart_ptr,_embind_register_std_string:__embind_register_std_string,_embind_register_std_wstring:__embind_register_std_wstring,_embind_register_user_type:__embind_register_user_type,_embind_register_value_array:__embind_register_value_array,_embind_register_value_array_element:__embind_register_value_array_element,_embind_register_value_object:__embind_register_value_object,_embind_register_value_object_field:__embind_register_value_object_field,_embind_register_void:__embind_register_void,_emscripten_dlopen_js:__emscripten_dlopen_js,_emscripten_fs_load_embedded_files:__emscripten_fs_load_embedded_files,_emscripten_get_now_is_monotonic:__emscripten_get_now_is_monotonic,_emscripten_get_progname:__emscripten_get_progname,_emscripten_lookup_name:__emscripten_lookup_name,_emscripten_memcpy_js:__emscripten_memcpy_js,_emscripten_push_main_loop_blocker:__emscripten_push_main_loop_blocker,_emscripten_push_uncounted_main_loop_blocker:__emscripten_push_uncounted_main_loop_blocker,_emscripten_runtime_keepalive_clear:__emscripten_runtime_keepalive_clear,_emscripten_set_offscreencanvas_size:__emscripten_set_offscreencanvas_size,_emscripten_system:__emscripten_system,_emscripten_throw_longjmp:__emscripten_throw_longjmp,_emval_as:__emval_as,_emval_as_int64:__emval_as_int64,_emval_as_uint64:__emval_as_uint64,_emval_call:__emval_call,_emval_call_method:__emval_call_method,_emval_coro_make_promise:__emval_coro_make_promise,_emval_coro_suspend:__emval_coro_suspend,_emval_decref:__emval_decref,_emval_delete:__emval_delete,_emval_equals:__emval_equals,_emval_get_global:__emval_get_global,_emval_get_method_caller:__emval_get_method_caller,_emval_get_module_property:__emval_get_module_property,_emval_get_property:__emval_get_property,_emval_greater_than:__emval_greater_than,_emval_in:__emval_in,_emval_incref:__emval_incref,_emval_instanceof:__emval_instanceof,_emval_is_number:__emval_is_number,_emval_is_string:__emval_is_string,_emval_iter_begin:__emval_iter_begin,_emval_iter_next:__emval_iter_next,_emval_less_than:__emval_less_than,_emval_new_array:__emval_new_array,_emval_new_array_from_memory_view:__emval_new_array_from_memory_view,_emval_new_cstring:__emval_new_cstring,_emval_new_object:__emval_new_object,_emval_new_u16string:__emval_new_u16string,_emval_new_u8string:__emval_new_u8string,_emval_not:__emval_not,_emval_register_symbol:__emval_register_symbol,_emval_run_destructors:__emval_run_destructors,_emval_set_property:__emval_set_property,_emval_strictly_equals:__emval_strictly_equals,_emval_take_value:__emval_take_value,_emval_throw:__emval_throw,_emval_typeof:__emval_typeof,_glGetActiveAttribOrUniform:__glGetActiveAttribOrUniform,_gmtime_js:__gmtime_js,_localtime_js:__localtime_js,_mktime_js:__mktime_js,_mmap_js:__mmap_js,_msync_js:__msync_js,_munmap_js:__munmap_js,_setitimer_js:__setitimer_js,_timegm_js:__timegm_js,_tzset_js:__tzset_js,alBuffer3f:_alBuffer3f,alBuffer3i:_alBuffer3i,alBufferData:_alBufferData,alBufferf:_alBufferf,alBufferfv:_alBufferfv,alBufferi:_alBufferi,alBufferiv:_alBufferiv,alDeleteBuffers:_alDeleteBuffers,alDeleteSources:_alDeleteSources,alDisable:_alDisable,alDistanceModel:_alDistanceModel,alDopplerFactor:_alDopplerFactor,alDopplerVelocity:_alDopplerVelocity,alEnable:_alEnable,alGenBuffers:_alGenBuffers,alGenSources:_alGenSources,alGetBoolean:_alGetBoolean,alGetBooleanv:_alGetBooleanv,alGetBuffer3f:_alGetBuffer3f,alGetBuffer3i:_alGetBuffer3i,alGetBufferf:_alGetBufferf,alGetBufferfv:_alGetBufferfv,alGetBufferi:_alGetBufferi,alGetBufferiv:_alGetBufferiv,alGetDouble:_alGetDouble,alGetDoublev:_alGetDoublev,alGetEnumValue:_alGetEnumValue,alGetError:_alGetError,alGetFloat:_alGetFloat,alGetFloatv:_alGetFloatv,alGetInteger:_alGetInteger,alGetIntegerv:_alGetIntegerv,alGetListener3f:_alGetListener3f,alGetListener3i:_alGetListener3i,alGetListenerf:_alGetListenerf,alGetListenerfv:_alGetListenerfv,alGetListeneri:_alGetListeneri,alGetListeneriv:_alGetListeneriv,alGetSource3f:_alGetSource3f,alGetSource3i:_alGetSource3i,alGetSourcef:_alGetSourcef,alGetSourcefv:_alGetSourcefv,alGetSourcei:_alGetSourcei,alGetSourceiv:_alGetSourceiv,alGetString:_alGetString,alIsBuffer:_alIsBuffer,alIsEnabled:_alIsEnabled,alIsExtensionPresent:_alIsExtensionPresent,alIsSource:_alIsSource,alListener3f:_alListener3f,alListener3i:_alListener3i,alListenerf:_alListenerf,alListenerfv:_alListenerfv,alListeneri:_alListeneri,alListeneriv:_alListeneriv,alSource3f:_alSource3f,alSource3i:_alSource3i,alSourcePause:_alSourcePause,alSourcePausev:_alSourcePausev,alSourcePlay:_alSourcePlay,alSourcePlayv:_alSourcePlayv,alSourceQueueBuffers:_alSourceQueueBuffers,alSourceRewind:_alSourceRewind,alSourceRewindv:_alSourceRewindv,alSourceStop:_alSourceStop,alSourceStopv:_alSourceStopv,alSourceUnqueueBuffers:_alSourceUnqueueBuffers,alSourcef:_alSourcef,alSourcefv:_alSourcefv,alSourcei:_alSourcei,alSourceiv:_alSourceiv,alSpeedOfSound:_alSpeedOfSound,alcCaptureCloseDevice:_alcCaptureCloseDevice,alcCaptureOpenDevice:_alcCaptureOpenDevice,alcCaptureSamples:_alcCaptureSamples,alcCaptureStart:_alcCaptureStart,alcCaptureStop:_alcCaptureStop,alcCloseDevice:_alcCloseDevice,alcCreateContext:_alcCreateContext,alcDestroyContext:_alcDestroyContext,alcGetContextsDevice:_alcGetContextsDevice,alcGetCurrentContext:_alcGetCurrentContext,alcGetEnumValue:_alcGetEnumValue,alcGetError:_alcGetError,alcGetIntegerv:_alcGetIntegerv,alcGetString:_alcGetString,alcIsExtensionPresent:_alcIsExtensionPresent,alcMakeContextCurrent:_alcMakeContextCurrent,alcOpenDevice:_alcOpenDevice,alcProcessContext:_alcProcessContext,alcSuspendContext:_alcSuspendContext,boxColor:_boxColor,boxRGBA:_boxRGBA,clock_res_get:_clock_res_get,clock_time_get:_clock_time_get,duckdb_web_fs_directory_create:_duckdb_web_fs_directory_create,duckdb_web_fs_directory_exists:_duckdb_web_fs_directory_exists,duckdb_web_fs_directory_list_files:_duckdb_web_fs_directory_list_files,duckdb_web_fs_directory_remove:_duckdb_web_fs_directory_remove,duckdb_web_fs_file_close:_duckdb_web_fs_file_close,duckdb_web_fs_file_drop_file:_duckdb_web_fs_file_drop_file,duckdb_web_fs_file_exists:_duckdb_web_fs_file_exists,duckdb_web_fs_file_get_last_modified_time:_duckdb_web_fs_file_get_last_modified_time,duckdb_web_fs_file_move:_duckdb_web_fs_file_move,duckdb_web_fs_file_open:_duckdb_web_fs_file_open,duckdb_web_fs_file_read:_duckdb_web_fs_file_read,duckdb_web_fs_file_remove:_duckdb_web_fs_file_remove,duckdb_web_fs_file_sync:_duckdb_web_fs_file_sync,duckdb_web_fs_file_truncate:_duckdb_web_fs_file_truncate,duckdb_web_fs_file_write:_duckdb_web_fs_file_write,duckdb_web_fs_get_default_data_protocol:_duckdb_web_fs_get_default_data_protocol,duckdb_web_fs_glob:_duckdb_web_fs_glob,duckdb_web_test_platform_feature:_duckdb_web_test_platform_feature,duckdb_web_udf_scalar_call:_duckdb_web_udf_scalar_call,eglBindAPI:_eglBindAPI,eglChooseConfig:_eglChooseConfig,eglCreateContext:_eglCreateContext,eglCreateWindowSurface:_eglCreateWindowSurface,eglDestroyContext:_eglDestroyContext,eglDestroySurface:_eglDestroySurface,eglGetConfigAttrib:_eglGetConfigAttrib,eglGetConfigs:_eglGetConfigs,eglGetCurrentContext:_eglGetCurrentContext,eglGetCurrentDisplay:_eglGetCurrentDisplay,eglGetCurrentSurface:_eglGetCurrentSurface,eglGetDisplay:_eglGetDisplay,eglGetError:_eglGetError,eglInitialize:_eglInitialize,eglMakeCurrent:_eglMakeCurrent,eglQueryAPI:_eglQueryAPI,eglQueryContext:_eglQueryContext,eglQueryString:_eglQueryString,eglQuerySurface:_eglQuerySurface,eglReleaseThread:_eglReleaseThread,eglSwapBuffers:_eglSwapBuffers,eglSwapInterval:_eglSwapInterval,eglTerminate:_eglTerminate,eglWaitClient:_eglWaitClient,eglWaitGL:_eglWaitGL,eglWaitNative:_eglWaitNative,ellipseColor:_ellipseColor,ellipseRGBA:_ellipseRGBA,emscripten_SDL_SetEventHandler:_emscripten_SDL_SetEventHandler,emscripten_alcDevicePauseSOFT:_emscripten_alcDevicePauseSOFT,emscripten_alcDeviceResumeSOFT:_emscripten_alcDeviceResumeSOFT,emscripten_alcGetStringiSOFT:_emscripten_alcGetStringiSOFT,emscripten_alcResetDeviceSOFT:_emscripten_alcResetDeviceSOFT,emscripten_asm_const_async_on_main_thread:_emscripten_asm_const_async_on_main_thread,emscripten_asm_const_double:_emscripten_asm_const_double,emscripten_asm_const_double_sync_on_main_thread:_emscripten_asm_const_double_sync_on_main_thread,emscripten_asm_const_int:_emscripten_asm_const_int,emscripten_asm_const_int_sync_on_main_thread:_emscripten_asm_const_int_sync_on_main_thread,emscripten_asm_const_ptr:_emscripten_asm_const_ptr,emscripten_asm_const_ptr_sync_on_main_thread:_emscripten_asm_const_ptr_sync_on_main_thread,emscripten_async_call:_emscripten_async_call,emscripten_async_load_script:_emscripten_async_load_script,emscripten_async_run_script:_emscripten_async_run_script,emscripten_async_wget:_emscripten_async_wget,emscripten_async_wget2:_emscripten_async_wget2,emscripten_async_wget2_abort:_emscripten_async_wget2_abort,emscripten_async_wget2_data:_emscripten_async_wget2_data,emscripten_async_wget_data:_emscripten_async_wget_data,emscripten_call_worker:_emscripten_call_worker,emscripten_cancel_animation_frame:_emscripten_cancel_animation_frame,emscripten_cancel_main_loop:_emscripten_cancel_main_loop,emscripten_clear_immediate:_emscripten_clear_immediate,emscripten_clear_interval:_emscripten_clear_interval,emscripten_clear_timeout:_emscripten_clear_timeout,emscripten_console_error:_emscripten_console_error,emscripten_console_log:_emscripten_console_log,emscripten_console_trace:_emscripten_console_trace,emscripten_console_warn:_emscripten_console_warn,emscripten_create_worker:_emscripten_create_worker,emscripten_date_now:_emscripten_date_now,emscripten_debugger:_emscripten_debugger,emscripten_destroy_worker:_emscripten_destroy_worker,emscripten_enter_soft_fullscreen:_emscripten_enter_soft_fullscreen,emscripten_err:_emscripten_err,emscripten_errn:_emscripten_errn,emscripten_exit_fullscreen:_emscripten_exit_fullscreen,emscripten_exit_pointerlock:_emscripten_exit_pointerlock,emscripten_exit_soft_fullscreen:_emscripten_exit_soft_fullscreen,emscripten_exit_with_live_runtime:_emscripten_exit_with_live_runtime,emscripten_fiber_swap:_emscripten_fiber_swap,emscripten_force_exit:_emscripten_force_exit,emscripten_get_battery_status:_emscripten_get_battery_status,emscripten_get_callstack:_emscripten_get_callstack,emscripten_get_canvas_element_size:_emscripten_get_canvas_element_size,emscripten_get_canvas_size:_emscripten_get_canvas_size,emscripten_get_compiler_setting:_emscripten_get_compiler_setting,emscripten_get_device_pixel_ratio:_emscripten_get_device_pixel_ratio,emscripten_get_devicemotion_status:_emscripten_get_devicemotion_status,emscripten_get_deviceorientation_status:_emscripten_get_deviceorientation_status,emscripten_get_element_css_size:_emscripten_get_element_css_size,emscripten_get_fullscreen_status:_emscripten_get_fullscreen_status,emscripten_get_gamepad_status:_emscripten_get_gamepad_status,emscripten_get_heap_max:_emscripten_get_heap_max,emscripten_get_main_loop_timing:_emscripten_get_main_loop_timing,emscripten_get_mouse_status:_emscripten_get_mouse_status,emscripten_get_now:_emscripten_get_now,emscripten_get_now_res:_emscripten_get_now_res,emscripten_get_num_gamepads:_emscripten_get_num_gamepads,emscripten_get_orientation_status:_emscripten_get_orientation_status,emscripten_get_pointerlock_status:_emscripten_get_pointerlock_status,emscripten_get_preloaded_image_data:_emscripten_get_preloaded_image_data,emscripten_get_preloaded_image_data_from_FILE:_emscripten_get_preloaded_image_data_from_FILE,emscripten_get_screen_size:_emscripten_get_screen_size,emscripten_get_visibility_status:_emscripten_get_visibility_status,emscripten_get_window_title:_emscripten_get_window_title,emscripten_get_worker_queue_size:_emscripten_get_worker_queue_size,emscripten_glActiveTexture:_emscripten_glActiveTexture,emscripten_glAttachShader:_emscripten_glAttachShader,emscripten_glBegin:_emscripten_glBegin,emscripten_glBeginQueryEXT:_emscripten_glBeginQueryEXT,emscripten_glBindAttribLocation:_emscripten_glBindAttribLocation,emscripten_glBindBuffer:_emscripten_glBindBuffer,emscripten_glBindFramebuffer:_emscripten_glBindFramebuffer,emscripten_glBindRenderbuffer:_emscripten_glBindRenderbuffer,emscripten_glBindTexture:_emscripten_glBindTexture,emscripten_glBindVertexArray:_emscripten_glBindVertexArray,emscripten_glBindVertexArrayOES:_emscripten_glBindVertexArrayOES,emscripten_glBlendColor:_emscripten_glBlendColor,emscripten_glBlendEquation:_emscripten_glBlendEquation,emscripten_glBlendEquationSeparate:_emscripten_glBlendEquationSeparate,emscripten_glBlendFunc:_emscripten_glBlendFunc,emscripten_glBlendFuncSeparate:_emscripten_glBlendFuncSeparate,emscripten_glBufferData:_emscripten_glBufferData,emscripten_glBufferSubData:_emscripten_glBufferSubData,emscripten_glCheckFramebufferStatus:_emscripten_glCheckFramebufferStatus,emscripten_glClear:_emscripten_glClear,emscripten_glClearColor:_emscripten_glClearColor,emscripten_glClearDepth:_emscripten_glClearDepth,emscripten_glClearDepthf:_emscripten_glClearDepthf,emscripten_glClearStencil:_emscripten_glClearStencil,emscripten_glClipControlEXT:_emscripten_glClipControlEXT,emscripten_glColorMask:_emscripten_glColorMask,emscripten_glCompileShader:_emscripten_glCompileShader,emscripten_glCompressedTexImage2D:_emscripten_glCompressedTexImage2D,emscripten_glCompressedTexSubImage2D:_emscripten_glCompressedTexSubImage2D,emscripten_glCopyTexImage2D:_emscripten_glCopyTexImage2D,emscripten_glCopyTexSubImage2D:_emscripten_glCopyTexSubImage2D,emscripten_glCreateProgram:_emscripten_glCreateProgram,emscripten_glCreateShader:_emscripten_glCreateShader,emscripten_glCullFace:_emscripten_glCullFace,emscripten_glDeleteBuffers:_emscripten_glDeleteBuffers,emscripten_glDeleteFramebuffers:_emscripten_glDeleteFramebuffers,emscripten_glDeleteProgram:_emscripten_glDeleteProgram,emscripten_glDeleteQueriesEXT:_emscripten_glDeleteQueriesEXT,emscripten_glDeleteRenderbuffers:_emscripten_glDeleteRenderbuffers,emscripten_glDeleteShader:_emscripten_glDeleteShader,emscripten_glDeleteTextures:_emscripten_glDeleteTextures,emscripten_glDeleteVertexArrays:_emscripten_glDeleteVertexArrays,emscripten_glDeleteVertexArraysOES:_emscripten_glDeleteVertexArraysOES,emscripten_glDepthFunc:_emscripten_glDepthFunc,emscripten_glDepthMask:_emscripten_glDepthMask,emscripten_glDepthRange:_emscripten_glDepthRange,emscripten_glDepthRangef:_emscripten_glDepthRangef,emscripten_glDetachShader:_emscripten_glDetachShader,emscripten_glDisable:_emscripten_glDisable,emscripten_glDisableVertexAttribArray:_emscripten_glDisableVertexAttribArray,emscripten_glDrawArrays:_emscripten_glDrawArrays,emscripten_glDrawArraysInstanced:_emscripten_glDrawArraysInstanced,emscripten_glDrawArraysInstancedANGLE:_emscripten_glDrawArraysInstancedANGLE,emscripten_glDrawArraysInstancedARB:_emscripten_glDrawArraysInstancedARB,emscripten_glDrawArraysInstancedEXT:_emscripten_glDrawArraysInstancedEXT,emscripten_glDrawArraysInstancedNV:_emscripten_glDrawArraysInstancedNV,emscripten_glDrawBuffers:_emscripten_glDrawBuffers,emscripten_glDrawBuffersEXT:_emscripten_glDrawBuffersEXT,emscripten_glDrawBuffersWEBGL:_emscripten_glDrawBuffersWEBGL,emscripten_glDrawElements:_emscripten_glDrawElements,emscripten_glDrawElementsInstanced:_emscripten_glDrawElementsInstanced,emscripten_glDrawElementsInstancedANGLE:_emscripten_glDrawElementsInstancedANGLE,emscripten_glDrawElementsInstancedARB:_emscripten_glDrawElementsInstancedARB,emscripten_glDrawElementsInstancedEXT:_emscripten_glDrawElementsInstancedEXT,emscripten_glDrawElementsInstancedNV:_emscripten_glDrawElementsInstancedNV,emscripten_glEnable:_emscripten_glEnable,emscripten_glEnableVertexAttribArray:_emscripten_glEnableVertexAttribArray,emscripten_glEndQueryEXT:_emscripten_glEndQueryEXT,emscripten_glFinish:_emscripten_glFinish,emscripten_glFlush:_emscripten_glFlush,emscripten_glFramebufferRenderbuffer:_emscripten_glFramebufferRenderbuffer,emscripten_glFramebufferTexture2D:_emscripten_glFramebufferTexture2D,emscripten_glFrontFace:_emscripten_glFrontFace,emscripten_glGenBuffers:_emscripten_glGenBuffers,emscripten_glGenFramebuffers:_emscripten_glGenFramebuffers,emscripten_glGenQueriesEXT:_emscripten_glGenQueriesEXT,emscripten_glGenRenderbuffers:_emscripten_glGenRenderbuffers,emscripten_glGenTextures:_emscripten_glGenTextures,emscripten_glGenVertexArrays:_emscripten_glGenVertexArrays,emscripten_glGenVertexArraysOES:_emscripten_glGenVertexArraysOES,emscripten_glGenerateMipmap:_emscripten_glGenerateMipmap,emscripten_glGetActiveAttrib:_emscripten_glGetActiveAttrib,emscripten_glGetActiveUniform:_emscripten_glGetActiveUniform,emscripten_glGetAttachedShaders:_emscripten_glGetAttachedShaders,emscripten_glGetAttribLocation:_emscripten_glGetAttribLocation,emscripten_glGetBooleanv:_emscripten_glGetBooleanv,emscripten_glGetBufferParameteriv:_emscripten_glGetBufferParameteriv,emscripten_glGetError:_emscripten_glGetError,emscripten_glGetFloatv:_emscripten_glGetFloatv,emscripten_glGetFramebufferAttachmentParameteriv:_emscripten_glGetFramebufferAttachmentParameteriv,emscripten_glGetIntegerv:_emscripten_glGetIntegerv,emscripten_glGetProgramInfoLog:_emscripten_glGetProgramInfoLog,emscripten_glGetProgramiv:_emscripten_glGetProgramiv,emscripten_glGetQueryObjecti64vEXT:_emscripten_glGetQueryObjecti64vEXT,emscripten_glGetQueryObjectivEXT:_emscripten_glGetQueryObjectivEXT,emscripten_glGetQueryObjectui64vEXT:_emscripten_glGetQueryObjectui64vEXT,emscripten_glGetQueryObjectuivEXT:_emscripten_glGetQueryObjectuivEXT,emscripten_glGetQueryivEXT:_emscripten_glGetQueryivEXT,emscripten_glGetRenderbufferParameteriv:_emscripten_glGetRenderbufferParameteriv,emscripten_glGetShaderInfoLog:_emscripten_glGetShaderInfoLog,emscripten_glGetShaderPrecisionFormat:_emscripten_glGetShaderPrecisionFormat,emscripten_glGetShaderSource:_emscripten_glGetShaderSource,emscripten_glGetShaderiv:_emscripten_glGetShaderiv,emscripten_glGetString:_emscripten_glGetString,emscripten_glGetTexParameterfv:_emscripten_glGetTexParameterfv,emscripten_glGetTexParameteriv:_emscripten_glGetTexParameteriv,emscripten_glGetUniformLocation:_emscripten_glGetUniformLocation,emscripten_glGetUniformfv:_emscripten_glGetUniformfv,emscripten_glGetUniformiv:_emscripten_glGetUniformiv,emscripten_glGetVertexAttribPointerv:_emscripten_glGetVertexAttribPointerv,emscripten_glGetVertexAttribfv:_emscripten_glGetVertexAttribfv,emscripten_glGetVertexAttribiv:_emscripten_glGetVertexAttribiv,emscripten_glHint:_emscripten_glHint,emscripten_glIsBuffer:_emscripten_glIsBuffer,emscripten_glIsEnabled:_emscripten_glIsEnabled,emscripten_glIsFramebuffer:_emscripten_glIsFramebuffer,emscripten_glIsProgram:_emscripten_glIsProgram,emscripten_glIsQueryEXT:_emscripten_glIsQueryEXT,emscripten_glIsRenderbuffer:_emscripten_glIsRenderbuffer,emscripten_glIsShader:_emscripten_glIsShader,emscripten_glIsTexture:_emscripten_glIsTexture,emscripten_glIsVertexArray:_emscripten_glIsVertexArray,emscripten_glIsVertexArrayOES:_emscripten_glIsVertexArrayOES,emscripten_glLineWidth:_emscripten_glLineWidth,emscripten_glLinkProgram:_emscripten_glLinkProgram,emscripten_glLoadIdentity:_emscripten_glLoadIdentity,emscripten_glMatrixMode:_emscripten_glMatrixMode,emscripten_glMultiDrawArrays:_emscripten_glMultiDrawArrays,emscripten_glMultiDrawArraysANGLE:_emscripten_glMultiDrawArraysANGLE,emscripten_glMultiDrawArraysInstancedANGLE:_emscripten_glMultiDrawArraysInstancedANGLE,emscripten_glMultiDrawArraysInstancedWEBGL:_emscripten_glMultiDrawArraysInstancedWEBGL,emscripten_glMultiDrawArraysWEBGL:_emscripten_glMultiDrawArraysWEBGL,emscripten_glMultiDrawElements:_emscripten_glMultiDrawElements,emscripten_glMultiDrawElementsANGLE:_emscripten_glMultiDrawElementsANGLE,emscripten_glMultiDrawElementsInstancedANGLE:_emscripten_glMultiDrawElementsInstancedANGLE,emscripten_glMultiDrawElementsInstancedWEBGL:_emscripten_glMultiDrawElementsInstancedWEBGL,emscripten_glMultiDrawElementsWEBGL:_emscripten_glMultiDrawElementsWEBGL,emscripten_glPixelStorei:_emscripten_glPixelStorei,emscripten_glPolygonModeWEBGL:_emscripten_glPolygonModeWEBGL,emscripten_glPolygonOffset:_emscripten_glPolygonOffset,emscripten_glPolygonOffsetClampEXT:_emscripten_glPolygonOffsetClampEXT,emscripten_glQueryCounterEXT:_emscripten_glQueryCounterEXT,emscripten_glReadPixels:_emscripten_glReadPixels,emscripten_glReleaseShaderCompiler:_emscripten_glReleaseShaderCompiler,emscripten_glRenderbufferStorage:_emscripten_glRenderbufferStorage,emscripten_glSampleCoverage:_emscripten_glSampleCoverage,emscripten_glScissor:_emscripten_glScissor,emscripten_glShaderBinary:_emscripten_glShaderBinary,emscripten_glShaderSource:_emscripten_glShaderSource,emscripten_glStencilFunc:_emscripten_glStencilFunc,emscripten_glStencilFuncSeparate:_emscripten_glStencilFuncSeparate,emscripten_glStencilMask:_emscripten_glStencilMask,emscripten_glStencilMaskSeparate:_emscripten_glStencilMaskSeparate,emscripten_glStencilOp:_emscripten_glStencilOp,emscripten_glStencilOpSeparate:_emscripten_glStencilOpSeparate,emscripten_glTexImage2D:_emscripten_glTexImage2D,emscripten_glTexParameterf:_emscripten_glTexParameterf,emscripten_glTexParameterfv:_emscripten_glTexParameterfv,emscripten_glTexParameteri:_emscripten_glTexParameteri,emscripten_glTexParameteriv:_emscripten_glTexParameteriv,emscripten_glTexSubImage2D:_emscripten_glTexSubImage2D,emscripten_glUniform1f:_emscripten_glUniform1f,emscripten_glUniform1fv:_emscripten_glUniform1fv,emscripten_glUniform1i:_emscripten_glUniform1i,emscripten_glUniform1iv:_emscripten_glUniform1iv,emscripten_glUniform2f:_emscripten_glUniform2f,emscripten_glUniform2fv:_emscripten_glUniform2fv,emscripten_glUniform2i:_emscripten_glUniform2i,emscripten_glUniform2iv:_emscripten_glUniform2iv,emscripten_glUniform3f:_emscripten_glUniform3f,emscripten_glUniform3fv:_emscripten_glUniform3fv,emscripten_glUniform3i:_emscripten_glUniform3i,emscripten_glUniform3iv:_emscripten_glUniform3iv,emscripten_glUniform4f:_emscripten_glUniform4f,emscripten_glUniform4fv:_emscripten_glUniform4fv,emscripten_glUniform4i:_emscripten_glUniform4i,emscripten_glUniform4iv:_emscripten_glUniform4iv,emscripten_glUniformMatrix2fv:_emscripten_glUniformMatrix2fv,emscripten_glUniformMatrix3fv:_emscripten_glUniformMatrix3fv,emscripten_glUniformMatrix4fv:_emscripten_glUniformMatrix4fv,emscripten_glUseProgram:_emscripten_glUseProgram,emscripten_glValidateProgram:_emscripten_glValidateProgram,emscripten_glVertexAttrib1f:_emscripten_glVertexAttrib1f,emscripten_glVertexAttrib1fv:_emscripten_glVertexAttrib1fv,emscripten_glVertexAttrib2f:_emscripten_glVertexAttrib2f,emscripten_glVertexAttrib2fv:_emscripten_glVertexAttrib2fv,emscripten_glVertexAttrib3f:_emscripten_glVertexAttrib3f,emscripten_glVertexAttrib3fv:_emscripten_glVertexAttrib3fv,emscripten_glVertexAttrib4f:_emscripten_glVertexAttrib4f,emscripten_glVertexAttrib4fv:_emscripten_glVertexAttrib4fv,emscripten_glVertexAttribDivisor:_emscripten_glVertexAttribDivisor,emscripten_glVertexAttribDivisorANGLE:_emscripten_glVertexAttribDivisorANGLE,emscripten_glVertexAttribDivisorARB:_emscripten_glVertexAttribDivisorARB,emscripten_glVertexAttribDivisorEXT:_emscripten_glVertexAttribDivisorEXT,emscripten_glVertexAttribDivisorNV:_emscripten_glVertexAttribDivisorNV,emscripten_glVertexAttribPointer:_emscripten_glVertexAttribPointer,emscripten_glVertexPointer:_emscripten_glVertexPointer,emscripten_glViewport:_emscripten_glViewport,emscripten_has_asyncify:_emscripten_has_asyncify,emscripten_hide_mouse:_emscripten_hide_mouse,emscripten_html5_remove_all_event_listeners:_emscripten_html5_remove_all_event_listeners,emscripten_idb_async_clear:_emscripten_idb_async_clear,emscripten_idb_async_delete:_emscripten_idb_async_delete,emscripten_idb_async_exists:_emscripten_idb_async_exists,emscripten_idb_async_load:_emscripten_idb_async_load,emscripten_idb_async_store:_emscripten_idb_async_store,emscripten_idb_clear:_emscripten_idb_clear,emscripten_idb_delete:_emscripten_idb_delete,emscripten_idb_exists:_emscripten_idb_exists,emscripten_idb_load:_emscripten_idb_load,emscripten_idb_store:_emscripten_idb_store,emscripten_is_main_browser_thread:_emscripten_is_main_browser_thread,emscripten_is_webgl_context_lost:_emscripten_is_webgl_context_lost,emscripten_lock_orientation:_emscripten_lock_orientation,emscripten_log:_emscripten_log,emscripten_math_acos:_emscripten_math_acos,emscripten_math_acosh:_emscripten_math_acosh,emscripten_math_asin:_emscripten_math_asin,emscripten_math_asinh:_emscripten_math_asinh,emscripten_math_atan:_emscripten_math_atan,emscripten_math_atan2:_emscripten_math_atan2,emscripten_math_atanh:_emscripten_math_atanh,emscripten_math_cbrt:_emscripten_math_cbrt,emscripten_math_cos:_emscripten_math_cos,emscripten_math_cosh:_emscripten_math_cosh,emscripten_math_exp:_emscripten_math_exp,emscripten_math_expm1:_emscripten_math_expm1,emscripten_math_fmod:_emscripten_math_fmod,emscripten_math_hypot:_emscripten_math_hypot,emscripten_math_log:_emscripten_math_log,emscripten_math_log10:_emscripten_math_log10,emscripten_math_log1p:_emscripten_math_log1p,emscripten_math_log2:_emscripten_math_log2,emscripten_math_pow:_emscripten_math_pow,emscripten_math_random:_emscripten_math_random,emscripten_math_round:_emscripten_math_round,emscripten_math_sign:_emscripten_math_sign,emscripten_math_sin:_emscripten_math_sin,emscripten_math_sinh:_emscripten_math_sinh,emscripten_math_sqrt:_emscripten_math_sqrt,emscripten_math_tan:_emscripten_math_tan,emscripten_math_tanh:_emscripten_math_tanh,emscripten_notify_memory_growth:_emscripten_notify_memory_growth,emscripten_out:_emscripten_out,emscripten_outn:_emscripten_outn,emscripten_pause_main_loop:_emscripten_pause_main_loop,emscripten_pc_get_column:_emscripten_pc_get_column,emscripten_pc_get_file:_emscripten_pc_get_file,emscripten_pc_get_function:_emscripten_pc_get_function,emscripten_pc_get_line:_emscripten_pc_get_line,emscripten_performance_now:_emscripten_performance_now,emscripten_print_double:_emscripten_print_double,emscripten_promise_all:_emscripten_promise_all,emscripten_promise_all_settled:_emscripten_promise_all_settled,emscripten_promise_any:_emscripten_promise_any,emscripten_promise_await:_emscripten_promise_await,emscripten_promise_create:_emscripten_promise_create,emscripten_promise_destroy:_emscripten_promise_destroy,emscripten_promise_race:_emscripten_promise_race,emscripten_promise_resolve:_emscripten_promise_resolve,emscripten_promise_then:_emscripten_promise_then,emscripten_random:_emscripten_random,emscripten_request_animation_frame:_emscripten_request_animation_frame,emscripten_request_animation_frame_loop:_emscripten_request_animation_frame_loop,emscripten_request_fullscreen:_emscripten_request_fullscreen,emscripten_request_fullscreen_strategy:_emscripten_request_fullscreen_strategy,emscripten_request_pointerlock:_emscripten_request_pointerlock,emscripten_resize_heap:_emscripten_resize_heap,emscripten_resume_main_loop:_emscripten_resume_main_loop,emscripten_return_address:_emscripten_return_address,emscripten_run_preload_plugins:_emscripten_run_preload_plugins,emscripten_run_preload_plugins_data:_emscripten_run_preload_plugins_data,emscripten_run_script:_emscripten_run_script,emscripten_run_script_int:_emscripten_run_script_int,emscripten_run_script_string:_emscripten_run_script_string,emscripten_runtime_keepalive_check:_emscripten_runtime_keepalive_check,emscripten_runtime_keepalive_pop:_emscripten_runtime_keepalive_pop,emscripten_runtime_keepalive_push:_emscripten_runtime_keepalive_push,emscripten_sample_gamepad_data:_emscripten_sample_gamepad_data,emscripten_scan_registers:_emscripten_scan_registers,emscripten_set_batterychargingchange_callback_on_thread:_emscripten_set_batterychargingchange_callback_on_thread,emscripten_set_batterylevelchange_callback_on_thread:_emscripten_set_batterylevelchange_callback_on_thread,emscripten_set_beforeunload_callback_on_thread:_emscripten_set_beforeunload_callback_on_thread,emscripten_set_blur_callback_on_thread:_emscripten_set_blur_callback_on_thread,emscripten_set_canvas_element_size:_emscripten_set_canvas_element_size,emscripten_set_canvas_size:_emscripten_set_canvas_size,emscripten_set_click_callback_on_thread:_emscripten_set_click_callback_on_thread,emscripten_set_dblclick_callback_on_thread:_emscripten_set_dblclick_callback_on_thread,emscripten_set_devicemotion_callback_on_thread:_emscripten_set_devicemotion_callback_on_thread,emscripten_set_deviceorientation_callback_on_thread:_emscripten_set_deviceorientation_callback_on_thread,emscripten_set_element_css_size:_emscripten_set_element_css_size,emscripten_set_focus_callback_on_thread:_emscripten_set_focus_callback_on_thread,emscripten_set_focusin_callback_on_thread:_emscripten_set_focusin_callback_on_thread,emscripten_set_focusout_callback_on_thread:_emscripten_set_focusout_callback_on_thread,emscripten_set_fullscreenchange_callback_on_thread:_emscripten_set_fullscreenchange_callback_on_thread,emscripten_set_gamepadconnected_callback_on_thread:_emscripten_set_gamepadconnected_callback_on_thread,emscripten_set_gamepaddisconnected_callback_on_thread:_emscripten_set_gamepaddisconnected_callback_on_thread,emscripten_set_immediate:_emscripten_set_immediate,emscripten_set_immediate_loop:_emscripten_set_immediate_loop,emscripten_set_interval:_emscripten_set_interval,emscripten_set_keydown_callback_on_thread:_emscripten_set_keydown_callback_on_thread,emscripten_set_keypress_callback_on_thread:_emscripten_set_keypress_callback_on_thread,emscripten_set_keyup_callback_on_thread:_emscripten_set_keyup_callback_on_thread,emscripten_set_main_loop:_emscripten_set_main_loop,emscripten_set_main_loop_arg:_emscripten_set_main_loop_arg,emscripten_set_main_loop_expected_blockers:_emscripten_set_main_loop_expected_blockers,emscripten_set_main_loop_timing:_emscripten_set_main_loop_timing,emscripten_set_mousedown_callback_on_thread:_emscripten_set_mousedown_callback_on_thread,emscripten_set_mouseenter_callback_on_thread:_emscripten_set_mouseenter_callback_on_thread,emscripten_set_mouseleave_callback_on_thread:_emscripten_set_mouseleave_callback_on_thread,emscripten_set_mousemove_callback_on_thread:_emscripten_set_mousemove_callback_on_thread,emscripten_set_mouseout_callback_on_thread:_emscripten_set_mouseout_callback_on_thread,emscripten_set_mouseover_callback_on_thread:_emscripten_set_mouseover_callback_on_thread,emscripten_set_mouseup_callback_on_thread:_emscripten_set_mouseup_callback_on_thread,emscripten_set_orientationchange_callback_on_thread:_emscripten_set_orientationchange_callback_on_thread,emscripten_set_pointerlockchange_callback_on_thread:_emscripten_set_pointerlockchange_callback_on_thread,emscripten_set_pointerlockerror_callback_on_thread:_emscripten_set_pointerlockerror_callback_on_thread,emscripten_set_resize_callback_on_thread:_emscripten_set_resize_callback_on_thread,emscripten_set_scroll_callback_on_thread:_emscripten_set_scroll_callback_on_thread,emscripten_set_socket_close_callback:_emscripten_set_socket_close_callback,emscripten_set_socket_connection_callback:_emscripten_set_socket_connection_callback,emscripten_set_socket_error_callback:_emscripten_set_socket_error_callback,emscripten_set_socket_listen_callback:_emscripten_set_socket_listen_callback,emscripten_set_socket_message_callback:_emscripten_set_socket_message_callback,emscripten_set_socket_open_callback:_emscripten_set_socket_open_callback,emscripten_set_timeout:_emscripten_set_timeout,emscripten_set_timeout_loop:_emscripten_set_timeout_loop,emscripten_set_touchcancel_callback_on_thread:_emscripten_set_touchcancel_callback_on_thread,emscripten_set_touchend_callback_on_thread:_emscripten_set_touchend_callback_on_thread,emscripten_set_touchmove_callback_on_thread:_emscripten_set_touchmove_callback_on_thread,emscripten_set_touchstart_callback_on_thread:_emscripten_set_touchstart_callback_on_thread,emscripten_set_visibilitychange_callback_on_thread:_emscripten_set_visibilitychange_callback_on_thread,emscripten_set_webglcontextlost_callback_on_thread:_emscripten_set_webglcontextlost_callback_on_thread,emscripten_set_webglcontextrestored_callback_on_thread:_emscripten_set_webglcontextrestored_callback_on_thread,emscripten_set_wheel_callback_on_thread:_emscripten_set_wheel_callback_on_thread,emscripten_set_window_title:_emscripten_set_window_title,emscripten_sleep:_emscripten_sleep,emscripten_stack_snapshot:_emscripten_stack_snapshot,emscripten_stack_unwind_buffer:_emscripten_stack_unwind_buffer,emscripten_supports_offscreencanvas:_emscripten_supports_offscreencanvas,emscripten_throw_number:_emscripten_throw_number,emscripten_throw_string:_emscripten_throw_string,emscripten_unlock_orientation:_emscripten_unlock_orientation,emscripten_unwind_to_js_event_loop:_emscripten_unwind_to_js_event_loop,emscripten_vibrate:_emscripten_vibrate,emscripten_vibrate_pattern:_emscripten_vibrate_pattern,emscripten_webgl_commit_frame:_emscripten_webgl_commit_frame,emscripten_webgl_create_context:_emscripten_webgl_create_context,emscripten_webgl_destroy_context:_emscripten_webgl_destroy_context,emscripten_webgl_do_commit_frame:_emscripten_webgl_do_commit_frame,emscripten_webgl_do_create_context:_emscripten_webgl_do_create_context,emscripten_webgl_do_get_current_context:_emscripten_webgl_do_get_current_context,emscripten_webgl_enable_ANGLE_instanced_arrays:_emscripten_webgl_enable_ANGLE_instanced_arrays,emscripten_webgl_enable_EXT_clip_control:_emscripten_webgl_enable_EXT_clip_control,emscripten_webgl_enable_EXT_polygon_offset_clamp:_emscripten_webgl_enable_EXT_polygon_offset_clamp,emscripten_webgl_enable_OES_vertex_array_object:_emscripten_webgl_enable_OES_vertex_array_object,emscripten_webgl_enable_WEBGL_draw_buffers:_emscripten_webgl_enable_WEBGL_draw_buffers,emscripten_webgl_enable_WEBGL_multi_draw:_emscripten_webgl_enable_WEBGL_multi_draw,emscripten_webgl_enable_WEBGL_polygon_mode:_emscripten_webgl_enable_WEBGL_polygon_mode,emscripten_webgl_enable_extension:_emscripten_webgl_enable_extension,emscripten_webgl_get_context_attributes:_emscripten_webgl_get_context_attributes,emscripten_webgl_get_current_context:_emscripten_webgl_get_current_context,emscripten_webgl_get_drawing_buffer_size:_emscripten_webgl_get_drawing_buffer_size,emscripten_webgl_get_parameter_d:_emscripten_webgl_get_parameter_d,emscripten_webgl_get_parameter_i64v:_emscripten_webgl_get_parameter_i64v,emscripten_webgl_get_parameter_o:_emscripten_webgl_get_parameter_o,emscripten_webgl_get_parameter_utf8:_emscripten_webgl_get_parameter_utf8,emscripten_webgl_get_parameter_v:_emscripten_webgl_get_parameter_v,emscripten_webgl_get_program_info_log_utf8:_emscripten_webgl_get_program_info_log_utf8,emscripten_webgl_get_program_parameter_d:_emscripten_webgl_get_program_parameter_d,emscripten_webgl_get_shader_info_log_utf8:_emscripten_webgl_get_shader_info_log_utf8,emscripten_webgl_get_shader_parameter_d:_emscripten_webgl_get_shader_parameter_d,emscripten_webgl_get_shader_source_utf8:_emscripten_webgl_get_shader_source_utf8,emscripten_webgl_get_supported_extensions:_emscripten_webgl_get_supported_extensions,emscripten_webgl_get_uniform_d:_emscripten_webgl_get_uniform_d,emscripten_webgl_get_uniform_v:_emscripten_webgl_get_uniform_v,emscripten_webgl_get_vertex_attrib_d:_emscripten_webgl_get_vertex_attrib_d,emscripten_webgl_get_vertex_attrib_o:_emscripten_webgl_get_vertex_attrib_o,emscripten_webgl_get_vertex_attrib_v:_emscripten_webgl_get_vertex_attrib_v,emscripten_webgl_make_context_current:_emscripten_webgl_make_context_current,emscripten_wget_data:_emscripten_wget_data,endprotoent:_endprotoent,environ_get:_environ_get,environ_sizes_get:_environ_sizes_get,exit:_exit,fd_close:_fd_close,fd_fdstat_get:_fd_fdstat_get,fd_pread:_fd_pread,fd_pwrite:_fd_pwrite,fd_read:_fd_read,fd_seek:_fd_seek,fd_sync:_fd_sync,fd_write:_fd_write,filledEllipseColor:_filledEllipseColor,filledEllipseRGBA:_filledEllipseRGBA,getaddrinfo:_getaddrinfo,getnameinfo:_getnameinfo,getprotobyname:_getprotobyname,getprotobynumber:_getprotobynumber,getprotoent:_getprotoent,glActiveTexture:_glActiveTexture,glAttachShader:_glAttachShader,glBegin:_glBegin,glBeginQueryEXT:_glBeginQueryEXT,glBindAttribLocation:_glBindAttribLocation,glBindBuffer:_glBindBuffer,glBindFramebuffer:_glBindFramebuffer,glBindRenderbuffer:_glBindRenderbuffer,glBindTexture:_glBindTexture,glBindVertexArray:_glBindVertexArray,glBindVertexArrayOES:_glBindVertexArrayOES,glBlendColor:_glBlendColor,glBlendEquation:_glBlendEquation,glBlendEquationSeparate:_glBlendEquationSeparate,glBlendFunc:_glBlendFunc,glBlendFuncSeparate:_glBlendFuncSeparate,glBufferData:_glBufferData,glBufferSubData:_glBufferSubData,glCheckFramebufferStatus:_glCheckFramebufferStatus,glClear:_glClear,glClearColor:_glClearColor,glClearDepth:_glClearDepth,glClearDepthf:_glClearDepthf,glClearStencil:_glClearStencil,glClipControlEXT:_glClipControlEXT,glColorMask:_glColorMask,glCompileShader:_glCompileShader,glCompressedTexImage2D:_glCompressedTexImage2D,glCompressedTexSubImage2D:_glCompressedTexSubImage2D,glCopyTexImage2D:_glCopyTexImage2D,glCopyTexSubImage2D:_glCopyTexSubImage2D,glCreateProgram:_glCreateProgram,glCreateShader:_glCreateShader,glCullFace:_glCullFace,glDeleteBuffers:_glDeleteBuffers,glDeleteFramebuffers:_glDeleteFramebuffers,glDeleteProgram:_glDeleteProgram,glDeleteQueriesEXT:_glDeleteQueriesEXT,glDeleteRenderbuffers:_glDeleteRenderbuffers,glDeleteShader:_glDeleteShader,glDeleteTextures:_glDeleteTextures,glDeleteVertexArrays:_glDeleteVertexArrays,glDeleteVertexArraysOES:_glDeleteVertexArraysOES,glDepthFunc:_glDepthFunc,glDepthMask:_glDepthMask,glDepthRange:_glDepthRange,glDepthRangef:_glDepthRangef,glDetachShader:_glDetachShader,glDisable:_glDisable,glDisableVertexAttribArray:_glDisableVertexAttribArray,glDrawArrays:_glDrawArrays,glDrawArraysInstanced:_glDrawArraysInstanced,glDrawArraysInstancedANGLE:_glDrawArraysInstancedANGLE,glDrawArraysInstancedARB:_glDrawArraysInstancedARB,glDrawArraysInstancedEXT:_glDrawArraysInstancedEXT,glDrawArraysInstancedNV:_glDrawArraysInstancedNV,glDrawBuffers:_glDrawBuffers,glDrawBuffersEXT:_glDrawBuffersEXT,glDrawBuffersWEBGL:_glDrawBuffersWEBGL,glDrawElements:_glDrawElements,glDrawElementsInstanced:_glDrawElementsInstanced,glDrawElementsInstancedANGLE:_glDrawElementsInstancedANGLE,glDrawElementsInstancedARB:_glDrawElementsInstancedARB,glDrawElementsInstancedEXT:_glDrawElementsInstancedEXT,glDrawElementsInstancedNV:_glDrawElementsInstancedNV,glEnable:_glEnable,glEnableVertexAttribArray:_glEnableVertexAttribArray,glEndQueryEXT:_glEndQueryEXT,glFinish:_glFinish,glFlush:_glFlush,glFramebufferRenderbuffer:_glFramebufferRenderbuffer,glFramebufferTexture2D:_glFramebufferTexture2D,glFrontFace:_glFrontFace,glGenBuffers:_glGenBuffers,glGenFramebuffers:_glGenFramebuffers,glGenQueriesEXT:_glGenQueriesEXT,glGenRenderbuffers:_glGenRenderbuffers,glGenTextures:_glGenTextures,glGenVertexArrays:_glGenVertexArrays,glGenVertexArraysOES:_glGenVertexArraysOES,glGenerateMipmap:_glGenerateMipmap,glGetActiveAttrib:_glGetActiveAttrib,glGetActiveUniform:_glGetActiveUniform,glGetAttachedShaders:_glGetAttachedShaders,glGetAttribLocation:_glGetAttribLocation,glGetBooleanv:_glGetBooleanv,glGetBufferParameteriv:_glGetBufferParameteriv,glGetError:_glGetError,glGetFloatv:_glGetFloatv,glGetFramebufferAttachmentParameteriv:_glGetFramebufferAttachmentParameteriv,glGetIntegerv:_glGetIntegerv,glGetProgramInfoLog:_glGetProgramInfoLog,glGetProgramiv:_glGetProgramiv,glGetQueryObjecti64vEXT:_glGetQueryObjecti64vEXT,glGetQueryObjectivEXT:_glGetQueryObjectivEXT,glGetQueryObjectui64vEXT:_glGetQueryObjectui64vEXT,glGetQueryObjectuivEXT:_glGetQueryObjectuivEXT,glGetQueryivEXT:_glGetQueryivEXT,glGetRenderbufferParameteriv:_glGetRenderbufferParameteriv,glGetShaderInfoLog:_glGetShaderInfoLog,glGetShaderPrecisionFormat:_glGetShaderPrecisionFormat,glGetShaderSource:_glGetShaderSource,glGetShaderiv:_glGetShaderiv,glGetString:_glGetString,glGetTexParameterfv:_glGetTexParameterfv,glGetTexParameteriv:_glGetTexParameteriv,glGetUniformLocation:_glGetUniformLocation,glGetUniformfv:_glGetUniformfv,glGetUniformiv:_glGetUniformiv,glGetVertexAttribPointerv:_glGetVertexAttribPointerv,glGetVertexAttribfv:_glGetVertexAttribfv,glGetVertexAttribiv:_glGetVertexAttribiv,glHint:_glHint,glIsBuffer:_glIsBuffer,glIsEnabled:_glIsEnabled,glIsFramebuffer:_glIsFramebuffer,glIsProgram:_glIsProgram,glIsQueryEXT:_glIsQueryEXT,glIsRenderbuffer:_glIsRenderbuffer,glIsShader:_glIsShader,glIsTexture:_glIsTexture,glIsVertexArray:_glIsVertexArray,glIsVertexArrayOES:_glIsVertexArrayOES,glLineWidth:_glLineWidth,glLinkProgram:_glLinkProgram,glLoadIdentity:_glLoadIdentity,glMatrixMode:_glMatrixMode,glMultiDrawArrays:_glMultiDrawArrays,glMultiDrawArraysANGLE:_glMultiDrawArraysANGLE,glMultiDrawArraysInstancedANGLE:_glMultiDrawArraysInstancedANGLE,glMultiDrawArraysInstancedWEBGL:_glMultiDrawArraysInstancedWEBGL,glMultiDrawArraysWEBGL:_glMultiDrawArraysWEBGL,glMultiDrawElements:_glMultiDrawElements,glMultiDrawElementsANGLE:_glMultiDrawElementsANGLE,glMultiDrawElementsInstancedANGLE:_glMultiDrawElementsInstancedANGLE,glMultiDrawElementsInstancedWEBGL:_glMultiDrawElementsInstancedWEBGL,glMultiDrawElementsWEBGL:_glMultiDrawElementsWEBGL,glPixelStorei:_glPixelStorei,glPolygonModeWEBGL:_glPolygonModeWEBGL,glPolygonOffset:_glPolygonOffset,glPolygonOffsetClampEXT:_glPolygonOffsetClampEXT,glQueryCounterEXT:_glQueryCounterEXT,glReadPixels:_glReadPixels,glReleaseShaderCompiler:_glReleaseShaderCompiler,glRenderbufferStorage:_glRenderbufferStorage,glSampleCoverage:_glSampleCoverage,glScissor:_glScissor,glShaderBinary:_glShaderBinary,glShaderSource:_glShaderSource,glStencilFunc:_glStencilFunc,glStencilFuncSeparate:_glStencilFuncSeparate,glStencilMask:_glStencilMask,glStencilMaskSeparate:_glStencilMaskSeparate,glStencilOp:_glStencilOp,glStencilOpSeparate:_glStencilOpSeparate,glTexImage2D:_glTexImage2D,glTexParameterf:_glTexParameterf,glTexParameterfv:_glTexParameterfv,glTexParameteri:_glTexParameteri,glTexParameteriv:_glTexParameteriv,glTexSubImage2D:_glTexSubImage2D,glUniform1f:_glUniform1f,glUniform1fv:_glUniform1fv,glUniform1i:_glUniform1i,glUniform1iv:_glUniform1iv,glUniform2f:_glUniform2f,glUniform2fv:_glUniform2fv,glUniform2i:_glUniform2i,glUniform2iv:_glUniform2iv,glUniform3f:_glUniform3f,glUniform3fv:_glUniform3fv,glUniform3i:_glUniform3i,glUniform3iv:_glUniform3iv,glUniform4f:_glUniform4f,glUniform4fv:_glUniform4fv,glUniform4i:_glUniform4i,glUniform4iv:_glUniform4iv,glUniformMatrix2fv:_glUniformMatrix2fv,glUniformMatrix3fv:_glUniformMatrix3fv,glUniformMatrix4fv:_glUniformMatrix4fv,glUseProgram:_glUseProgram,glValidateProgram:_glValidateProgram,glVertexAttrib1f:_glVertexAttrib1f,glVertexAttrib1fv:_glVertexAttrib1fv,glVertexAttrib2f:_glVertexAttrib2f,glVertexAttrib2fv:_glVertexAttrib2fv,glVertexAttrib3f:_glVertexAttrib3f,glVertexAttrib3fv:_glVertexAttrib3fv,glVertexAttrib4f:_glVertexAttrib4f,glVertexAttrib4fv:_glVertexAttrib4fv,glVertexAttribDivisor:_glVertexAttribDivisor,glVertexAttribDivisorANGLE:_glVertexAttribDivisorANGLE,glVertexAttribDivisorARB:_glVertexAttribDivisorARB,glVertexAttribDivisorEXT:_glVertexAttribDivisorEXT,glVertexAttribDivisorNV:_glVertexAttribDivisorNV,glVertexAttribPointer:_glVertexAttribPointer,glVertexPointer:_glVertexPointer,glViewport:_glViewport,glewGetErrorString:_glewGetErrorString,glewGetExtension:_glewGetExtension,glewGetString:_glewGetString,glewInit:_glewInit,glewIsSupported:_glewIsSupported,glutCreateWindow:_glutCreateWindow,glutDestroyWindow:_glutDestroyWindow,glutDisplayFunc:_glutDisplayFunc,glutFullScreen:_glutFullScreen,glutGet:_glutGet,glutGetModifiers:_glutGetModifiers,glutIdleFunc:_glutIdleFunc,glutInit:_glutInit,glutInitDisplayMode:_glutInitDisplayMode,glutInitWindowPosition:_glutInitWindowPosition,glutInitWindowSize:_glutInitWindowSize,glutKeyboardFunc:_glutKeyboardFunc,glutKeyboardUpFunc:_glutKeyboardUpFunc,glutMainLoop:_glutMainLoop,glutMotionFunc:_glutMotionFunc,glutMouseFunc:_glutMouseFunc,glutPassiveMotionFunc:_glutPassiveMotionFunc,glutPositionWindow:_glutPositionWindow,glutPostRedisplay:_glutPostRedisplay,glutReshapeFunc:_glutReshapeFunc,glutReshapeWindow:_glutReshapeWindow,glutSetCursor:_glutSetCursor,glutSpecialFunc:_glutSpecialFunc,glutSpecialUpFunc:_glutSpecialUpFunc,glutSwapBuffers:_glutSwapBuffers,glutTimerFunc:_glutTimerFunc,invoke_dd,invoke_ddd,invoke_di,invoke_didd,invoke_dii,invoke_diii,invoke_diiii,invoke_diiiid,invoke_diiiiid,invoke_diij,invoke_diiji,invoke_dij,invoke_dijjj,invoke_dijjjj,invoke_dijjjjij,invoke_dj,invoke_djij,invoke_fi,invoke_fiii,invoke_fiiii,invoke_fiiji,invoke_fijjjj,invoke_fijjjjij,invoke_i,invoke_id,invoke_idd,invoke_idi,invoke_idii,invoke_idiii,invoke_idiiii,invoke_if,invoke_iff,invoke_ifi,invoke_ifii,invoke_ii,invoke_iid,invoke_iidi,invoke_iidii,invoke_iidiii,invoke_iidiiii,invoke_iidj,invoke_iif,invoke_iifii,invoke_iii,invoke_iiid,invoke_iiidi,invoke_iiidj,invoke_iiii,invoke_iiiid,invoke_iiiii,invoke_iiiiid,invoke_iiiiii,invoke_iiiiiid,invoke_iiiiiii,invoke_iiiiiiii,invoke_iiiiiiiii,invoke_iiiiiiiiii,invoke_iiiiiiiiiii,invoke_iiiiiiiiiiii,invoke_iiiiiiiiiiiii,invoke_iiiiiiiiiiiiii,invoke_iiiiiiiiiiiiiiiii,invoke_iiiiiiiiiiiiiiiiii,invoke_iiiiiiiiiiiji,invoke_iiiiiiiiiiijiii,invoke_iiiiiiiiiiji,invoke_iiiiiiiiij,invoke_iiiiiiiiiji,invoke_iiiiiiiiijii,invoke_iiiiiiiiijiiiiiiii,invoke_iiiiiiiij,invoke_iiiiiiiiji,invoke_iiiiiiiijii,invoke_iiiiiiiijj,invoke_iiiiiiij,invoke_iiiiiiiji,invoke_iiiiiiijji,invoke_iiiiiiijjjjjjii,invoke_iiiiiij,invoke_iiiiiiji,invoke_iiiiiijii,invoke_iiiiiijji,invoke_iiiiiijjiiiiiiiji,invoke_iiiiiijjiijjji,invoke_iiiiij,invoke_iiiiiji,invoke_iiiiijii,invoke_iiiiijiii,invoke_iiiiijiiii,invoke_iiiiijiiiii,invoke_iiiiijij,invoke_iiiiijj,invoke_iiiiijjii,invoke_iiiiijjij,invoke_iiiiijjj,invoke_iiiij,invoke_iiiiji,invoke_iiiijii,invoke_iiiijiii,invoke_iiiijiiiij,invoke_iiiijiiij,invoke_iiiijiijjiii,invoke_iiiijj,invoke_iiiijji,invoke_iiiijjii,invoke_iiiijjiii,invoke_iiiijjj,invoke_iiiijjjj,invoke_iiij,invoke_iiiji,invoke_iiijii,invoke_iiijiii,invoke_iiijiiii,invoke_iiijiiiii,invoke_iiijiiiijj,invoke_iiijiiij,invoke_iiijiiiji,invoke_iiijiiijj,invoke_iiijiij,invoke_iiijiijj,invoke_iiijij,invoke_iiijijj,invoke_iiijj,invoke_iiijji,invoke_iiijjii,invoke_iiijjiii,invoke_iiijjijj,invoke_iiijjijjiii,invoke_iiijjj,invoke_iiijjji,invoke_iiijjjijj,invoke_iiijjjj,invoke_iiijjjjj,invoke_iiijjjjjiiiii,invoke_iij,invoke_iiji,invoke_iijii,invoke_iijiii,invoke_iijiiii,invoke_iijiiiii,invoke_iijiiiiiij,invoke_iijiiijj,invoke_iijiijj,invoke_iijij,invoke_iijiji,invoke_iijj,invoke_iijji,invoke_iijjii,invoke_iijjiiii,invoke_iijjiiiii,invoke_iijjj,invoke_iijjji,invoke_iijjjii,invoke_iijjjj,invoke_ij,invoke_iji,invoke_ijii,invoke_ijij,invoke_ijji,invoke_ijjiii,invoke_ijjj,invoke_j,invoke_jd,invoke_jf,invoke_ji,invoke_jii,invoke_jiii,invoke_jiiii,invoke_jiiiii,invoke_jiiiiii,invoke_jiiiiiii,invoke_jiiiiiiii,invoke_jiiiiiji,invoke_jiiiiijiiii,invoke_jiiiij,invoke_jiiiiji,invoke_jiiiijii,invoke_jiiiijiii,invoke_jiiiijji,invoke_jiiij,invoke_jiiiji,invoke_jiiijii,invoke_jiiijiii,invoke_jiiijiijiii,invoke_jiiijij,invoke_jiiijj,invoke_jiiijjj,invoke_jiij,invoke_jiiji,invoke_jiijii,invoke_jiijiii,invoke_jiijiiii,invoke_jiijiiiii,invoke_jiijiij,invoke_jiijj,invoke_jiijjiii,invoke_jij,invoke_jiji,invoke_jijij,invoke_jijj,invoke_jijjij,invoke_jijjj,invoke_jijjjj,invoke_jj,invoke_jji,invoke_jjij,invoke_jjj,invoke_jjjii,invoke_jjjij,invoke_jjjji,invoke_jjjjjjd,invoke_v,invoke_vi,invoke_vid,invoke_viddddi,invoke_vidi,invoke_vidii,invoke_vif,invoke_vifi,invoke_vifii,invoke_vii,invoke_viid,invoke_viif,invoke_viii,invoke_viiid,invoke_viiidi,invoke_viiidii,invoke_viiifi,invoke_viiifii,invoke_viiii,invoke_viiiii,invoke_viiiiii,invoke_viiiiiii,invoke_viiiiiiii,invoke_viiiiiiiii,invoke_viiiiiiiiii,invoke_viiiiiiiiiii,invoke_viiiiiiiiiiii,invoke_viiiiiiiiiiiii,invoke_viiiiiiiiiiiiiii,invoke_viiiiiiiijjjji,invoke_viiiiiiij,invoke_viiiiiiijij,invoke_viiiiiij,invoke_viiiiiiji,invoke_viiiiiijii,invoke_viiiiiijij,invoke_viiiiiijj,invoke_viiiiij,invoke_viiiiiji,invoke_viiiiijii,invoke_viiiiijiiii,invoke_viiiiijiijii,invoke_viiiiijij,invoke_viiiiijj,invoke_viiiiijjii,invoke_viiiiijjji,invoke_viiiij,invoke_viiiiji,invoke_viiiijii,invoke_viiiijiii,invoke_viiiijiiii,invoke_viiiijiiiii,invoke_viiiijiiiiiiii,invoke_viiiijiijjii,invoke_viiiijij,invoke_viiiijijji,invoke_viiiijj,invoke_viiiijji,invoke_viiiijjii,invoke_viiiijjij,invoke_viiiijjjii,invoke_viiij,invoke_viiijd,invoke_viiiji,invoke_viiijii,invoke_viiijiii,invoke_viiijiiii,invoke_viiijiiiii,invoke_viiijiiiijjj,invoke_viiijiiijii,invoke_viiijiij,invoke_viiijiiji,invoke_viiijij,invoke_viiijiji,invoke_viiijijj,invoke_viiijijjj,invoke_viiijj,invoke_viiijji,invoke_viiijjii,invoke_viiijjiii,invoke_viiijjiiiii,invoke_viiijjij,invoke_viiijjijj,invoke_viiijjj,invoke_viiijjji,invoke_viiijjjiiiii,invoke_viiijjjijj,invoke_viiijjjj,invoke_viiijjjjii,invoke_viiijjjjiiiii,invoke_viiijjjjj,invoke_viiijjjjjiiiii,invoke_viij,invoke_viijd,invoke_viiji,invoke_viijii,invoke_viijiii,invoke_viijiiii,invoke_viijiiiii,invoke_viijiiiiii,invoke_viijiiiij,invoke_viijiiij,invoke_viijiiijj,invoke_viijiij,invoke_viijiijj,invoke_viijiijji,invoke_viijij,invoke_viijiji,invoke_viijijiiii,invoke_viijijiiiijjj,invoke_viijijij,invoke_viijijijij,invoke_viijijijiji,invoke_viijijj,invoke_viijj,invoke_viijji,invoke_viijjii,invoke_viijjiiij,invoke_viijjj,invoke_viijjji,invoke_viijjjji,invoke_viijjjjjiiiii,invoke_vij,invoke_viji,invoke_vijii,invoke_vijiii,invoke_vijiiii,invoke_vijiiiii,invoke_vijiiiiii,invoke_vijiiiiji,invoke_vijiiiji,invoke_vijiij,invoke_vijiiji,invoke_vijij,invoke_vijiji,invoke_vijijiiiijjj,invoke_vijijiij,invoke_vijijj,invoke_vijijjd,invoke_vijijjji,invoke_vijj,invoke_vijji,invoke_vijjiii,invoke_vijjij,invoke_vijjj,invoke_vijjji,invoke_vijjjiiji,invoke_vijjjj,invoke_vj,invoke_vji,invoke_vjii,invoke_vjiii,invoke_vjiiii,invoke_vjiiij,invoke_vjij,invoke_vjj,invoke_vjjii,invoke_vjjijij,lineColor:_lineColor,lineRGBA:_lineRGBA,llvm_eh_typeid_for:_llvm_eh_typeid_for,memory:wasmMemory,pixelRGBA:_pixelRGBA,proc_exit:_proc_exit,pthread_kill:_pthread_kill,random_get:_random_get,rectangleColor:_rectangleColor,rectangleRGBA:_rectangleRGBA,rotozoomSurface:_rotozoomSurface,setNetworkCallback:_setNetworkCallback,setprotoent:_setprotoent,stackAlloc:_stackAlloc,stackRestore:_stackRestore,stackSave:_stackSave,strptime:_strptime,strptime_l:_strptime_l,uuid_clear:_uuid_clear,uuid_compare:_uuid_compare,uuid_copy:_uuid_copy,uuid_generate:_uuid_generate,uuid_is_null:_uuid_is_null,uuid_parse:_uuid_parse,uuid_type:_uuid_type,uuid_unparse:_uuid_unparse,uuid_unparse_lower:_uuid_unparse_lower,uuid_unparse_upper:_uuid_unparse_upper,uuid_variant:_uuid_variant,zoomSurface:_zoomSurface},wasmExports=createWasm(),__emval_coro_resume=(e,t)=>(__emval_coro_resume=wasmExports._emval_coro_resume)(e,t),_main=Module._main=(e,t)=>(_main=Module._main=wasmExports.main)(e,t),_duckdb_web_fs_glob_add_path=Module._duckdb_web_fs_glob_add_path=e=>(_duckdb_web_fs_glob_add_path=Module._duckdb_web_fs_glob_add_path=wasmExports.duckdb_web_fs_glob_add_path)(e),_duckdb_web_clear_response=Module._duckdb_web_clear_response=()=>(_duckdb_web_clear_response=Module._duckdb_web_clear_response=wasmExports.duckdb_web_clear_response)(),_duckdb_web_fail_with=Module._duckdb_web_fail_with=e=>(_duckdb_web_fail_with=Module._duckdb_web_fail_with=wasmExports.duckdb_web_fail_with)(e),_duckdb_web_reset=Module._duckdb_web_reset=e=>(_duckdb_web_reset=Module._duckdb_web_reset=wasmExports.duckdb_web_reset)(e),_duckdb_web_connect=Module._duckdb_web_connect=()=>(_duckdb_web_connect=Module._duckdb_web_connect=wasmExports.duckdb_web_connect)(),_duckdb_web_disconnect=Module._duckdb_web_disconnect=e=>(_duckdb_web_disconnect=Module._duckdb_web_disconnect=wasmExports.duckdb_web_disconnect)(e),_duckdb_web_flush_files=Module._duckdb_web_flush_files=()=>(_duckdb_web_flush_files=Module._duckdb_web_flush_files=wasmExports.duckdb_web_flush_files)(),_duckdb_web_flush_file=Module._duckdb_web_flush_file=e=>(_duckdb_web_flush_file=Module._duckdb_web_flush_file=wasmExports.duckdb_web_flush_file)(e),_duckdb_web_open=Module._duckdb_web_open=(e,t)=>(_duckdb_web_open=Module._duckdb_web_open=wasmExports.duckdb_web_open)(e,t),_duckdb_web_get_global_file_info=Module._duckdb_web_get_global_file_info=(e,t)=>(_duckdb_web_get_global_file_info=Module._duckdb_web_get_global_file_info=wasmExports.duckdb_web_get_global_file_info)(e,t),_duckdb_web_collect_file_stats=Module._duckdb_web_collect_file_stats=(e,t,r)=>(_duckdb_web_collect_file_stats=Module._duckdb_web_collect_file_stats=wasmExports.duckdb_web_collect_file_stats)(e,t,r),_duckdb_web_export_file_stats=Module._duckdb_web_export_file_stats=(e,t)=>(_duckdb_web_export_file_stats=Module._duckdb_web_export_file_stats=wasmExports.duckdb_web_export_file_stats)(e,t),_duckdb_web_fs_drop_file=Module._duckdb_web_fs_drop_file=(e,t)=>(_duckdb_web_fs_drop_file=Module._duckdb_web_fs_drop_file=wasmExports.duckdb_web_fs_drop_file)(e,t),_duckdb_web_fs_drop_files=Module._duckdb_web_fs_drop_files=(e,t,r)=>(_duckdb_web_fs_drop_files=Module._duckdb_web_fs_drop_files=wasmExports.duckdb_web_fs_drop_files)(e,t,r),_duckdb_web_fs_glob_file_infos=Module._duckdb_web_fs_glob_file_infos=(e,t)=>(_duckdb_web_fs_glob_file_infos=Module._duckdb_web_fs_glob_file_infos=wasmExports.duckdb_web_fs_glob_file_infos)(e,t),_duckdb_web_fs_get_file_info_by_id=Module._duckdb_web_fs_get_file_info_by_id=(e,t,r)=>(_duckdb_web_fs_get_file_info_by_id=Module._duckdb_web_fs_get_file_info_by_id=wasmExports.duckdb_web_fs_get_file_info_by_id)(e,t,r),_duckdb_web_fs_get_file_info_by_name=Module._duckdb_web_fs_get_file_info_by_name=(e,t,r)=>(_duckdb_web_fs_get_file_info_by_name=Module._duckdb_web_fs_get_file_info_by_name=wasmExports.duckdb_web_fs_get_file_info_by_name)(e,t,r),_duckdb_web_fs_register_file_url=Module._duckdb_web_fs_register_file_url=(e,t,r,n,a)=>(_duckdb_web_fs_register_file_url=Module._duckdb_web_fs_register_file_url=wasmExports.duckdb_web_fs_register_file_url)(e,t,r,n,a),_duckdb_web_fs_register_file_buffer=Module._duckdb_web_fs_register_file_buffer=(e,t,r,n)=>(_duckdb_web_fs_register_file_buffer=Module._duckdb_web_fs_register_file_buffer=wasmExports.duckdb_web_fs_register_file_buffer)(e,t,r,n),_duckdb_web_copy_file_to_buffer=Module._duckdb_web_copy_file_to_buffer=(e,t)=>(_duckdb_web_copy_file_to_buffer=Module._duckdb_web_copy_file_to_buffer=wasmExports.duckdb_web_copy_file_to_buffer)(e,t),_duckdb_web_copy_file_to_path=Module._duckdb_web_copy_file_to_path=(e,t,r)=>(_duckdb_web_copy_file_to_path=Module._duckdb_web_copy_file_to_path=wasmExports.duckdb_web_copy_file_to_path)(e,t,r),_duckdb_web_get_version=Module._duckdb_web_get_version=e=>(_duckdb_web_get_version=Module._duckdb_web_get_version=wasmExports.duckdb_web_get_version)(e),_duckdb_web_get_feature_flags=Module._duckdb_web_get_feature_flags=()=>(_duckdb_web_get_feature_flags=Module._duckdb_web_get_feature_flags=wasmExports.duckdb_web_get_feature_flags)(),_duckdb_web_tokenize=Module._duckdb_web_tokenize=(e,t)=>(_duckdb_web_tokenize=Module._duckdb_web_tokenize=wasmExports.duckdb_web_tokenize)(e,t),_duckdb_web_tokenize_buffer=Module._duckdb_web_tokenize_buffer=(e,t,r)=>(_duckdb_web_tokenize_buffer=Module._duckdb_web_tokenize_buffer=wasmExports.duckdb_web_tokenize_buffer)(e,t,r),_duckdb_web_udf_scalar_create=Module._duckdb_web_udf_scalar_create=(e,t,r)=>(_duckdb_web_udf_scalar_create=Module._duckdb_web_udf_scalar_create=wasmExports.duckdb_web_udf_scalar_create)(e,t,r),_duckdb_web_prepared_create=Module._duckdb_web_prepared_create=(e,t,r)=>(_duckdb_web_prepared_create=Module._duckdb_web_prepared_create=wasmExports.duckdb_web_prepared_create)(e,t,r),_duckdb_web_prepared_create_buffer=Module._duckdb_web_prepared_create_buffer=(e,t,r,n)=>(_duckdb_web_prepared_create_buffer=Module._duckdb_web_prepared_create_buffer=wasmExports.duckdb_web_prepared_create_buffer)(e,t,r,n),_duckdb_web_prepared_close=Module._duckdb_web_prepared_close=(e,t,r)=>(_duckdb_web_prepared_close=Module._duckdb_web_prepared_close=wasmExports.duckdb_web_prepared_close)(e,t,r),_duckdb_web_prepared_run=Module._duckdb_web_prepared_run=(e,t,r,n)=>(_duckdb_web_prepared_run=Module._duckdb_web_prepared_run=wasmExports.duckdb_web_prepared_run)(e,t,r,n),_duckdb_web_prepared_send=Module._duckdb_web_prepared_send=(e,t,r,n)=>(_duckdb_web_prepared_send=Module._duckdb_web_prepared_send=wasmExports.duckdb_web_prepared_send)(e,t,r,n),_duckdb_web_query_run=Module._duckdb_web_query_run=(e,t,r)=>(_duckdb_web_query_run=Module._duckdb_web_query_run=wasmExports.duckdb_web_query_run)(e,t,r),_duckdb_web_query_run_buffer=Module._duckdb_web_query_run_buffer=(e,t,r,n)=>(_duckdb_web_query_run_buffer=Module._duckdb_web_query_run_buffer=wasmExports.duckdb_web_query_run_buffer)(e,t,r,n),_duckdb_web_pending_query_start=Module._duckdb_web_pending_query_start=(e,t,r,n)=>(_duckdb_web_pending_query_start=Module._duckdb_web_pending_query_start=wasmExports.duckdb_web_pending_query_start)(e,t,r,n),_duckdb_web_pending_query_start_buffer=Module._duckdb_web_pending_query_start_buffer=(e,t,r,n,a)=>(_duckdb_web_pending_query_start_buffer=Module._duckdb_web_pending_query_start_buffer=wasmExports.duckdb_web_pending_query_start_buffer)(e,t,r,n,a),_duckdb_web_pending_query_poll=Module._duckdb_web_pending_query_poll=(e,t,r)=>(_duckdb_web_pending_query_poll=Module._duckdb_web_pending_query_poll=wasmExports.duckdb_web_pending_query_poll)(e,t,r),_duckdb_web_pending_query_cancel=Module._duckdb_web_pending_query_cancel=(e,t)=>(_duckdb_web_pending_query_cancel=Module._duckdb_web_pending_query_cancel=wasmExports.duckdb_web_pending_query_cancel)(e,t),_duckdb_web_query_fetch_results=Module._duckdb_web_query_fetch_results=(e,t)=>(_duckdb_web_query_fetch_results=Module._duckdb_web_query_fetch_results=wasmExports.duckdb_web_query_fetch_results)(e,t),_duckdb_web_get_tablenames=Module._duckdb_web_get_tablenames=(e,t,r)=>(_duckdb_web_get_tablenames=Module._duckdb_web_get_tablenames=wasmExports.duckdb_web_get_tablenames)(e,t,r),_duckdb_web_get_tablenames_buffer=Module._duckdb_web_get_tablenames_buffer=(e,t,r,n)=>(_duckdb_web_get_tablenames_buffer=Module._duckdb_web_get_tablenames_buffer=wasmExports.duckdb_web_get_tablenames_buffer)(e,t,r,n),_duckdb_web_insert_arrow_from_ipc_stream=Module._duckdb_web_insert_arrow_from_ipc_stream=(e,t,r,n,a)=>(_duckdb_web_insert_arrow_from_ipc_stream=Module._duckdb_web_insert_arrow_from_ipc_stream=wasmExports.duckdb_web_insert_arrow_from_ipc_stream)(e,t,r,n,a),_duckdb_web_insert_csv_from_path=Module._duckdb_web_insert_csv_from_path=(e,t,r,n)=>(_duckdb_web_insert_csv_from_path=Module._duckdb_web_insert_csv_from_path=wasmExports.duckdb_web_insert_csv_from_path)(e,t,r,n),_duckdb_web_insert_json_from_path=Module._duckdb_web_insert_json_from_path=(e,t,r,n)=>(_duckdb_web_insert_json_from_path=Module._duckdb_web_insert_json_from_path=wasmExports.duckdb_web_insert_json_from_path)(e,t,r,n),___dl_seterr=(e,t)=>(___dl_seterr=wasmExports.__dl_seterr)(e,t),__emscripten_timeout=(e,t)=>(__emscripten_timeout=wasmExports._emscripten_timeout)(e,t),_malloc=Module._malloc=e=>(_malloc=Module._malloc=wasmExports.malloc)(e),_free=Module._free=e=>(_free=Module._free=wasmExports.free)(e),_calloc=Module._calloc=(e,t)=>(_calloc=Module._calloc=wasmExports.calloc)(e,t),_emscripten_builtin_memalign=(e,t)=>(_emscripten_builtin_memalign=wasmExports.emscripten_builtin_memalign)(e,t),__emscripten_tempret_set=e=>(__emscripten_tempret_set=wasmExports._emscripten_tempret_set)(e),__emscripten_tempret_get=()=>(__emscripten_tempret_get=wasmExports._emscripten_tempret_get)(),__emscripten_stack_restore=e=>(__emscripten_stack_restore=wasmExports._emscripten_stack_restore)(e),__emscripten_stack_alloc=e=>(__emscripten_stack_alloc=wasmExports._emscripten_stack_alloc)(e),_emscripten_stack_get_current=()=>(_emscripten_stack_get_current=wasmExports.emscripten_stack_get_current)();function invoke_ii(e,t){var r=stackSave();try{return getWasmTableEntry(e)(t)}catch(n){if(stackRestore(r),n!==n+0)throw n;_setThrew(1,0)}}function invoke_vii(e,t,r){var n=stackSave();try{getWasmTableEntry(e)(t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_viii(e,t,r,n){var a=stackSave();try{getWasmTableEntry(e)(t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_viiii(e,t,r,n,a){var o=stackSave();try{getWasmTableEntry(e)(t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_iii(e,t,r){var n=stackSave();try{return getWasmTableEntry(e)(t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_viiiiii(e,t,r,n,a,o,l){var u=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_dii(e,t,r){var n=stackSave();try{return getWasmTableEntry(e)(t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_viiiiiii(e,t,r,n,a,o,l,u){var _=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_vi(e,t){var r=stackSave();try{getWasmTableEntry(e)(t)}catch(n){if(stackRestore(r),n!==n+0)throw n;_setThrew(1,0)}}function invoke_iiiii(e,t,r,n,a){var o=stackSave();try{return getWasmTableEntry(e)(t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_viiiii(e,t,r,n,a,o){var l=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_iiiiiii(e,t,r,n,a,o,l){var u=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_iiiiiiii(e,t,r,n,a,o,l,u){var _=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_viiiiiiii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iiii(e,t,r,n){var a=stackSave();try{return getWasmTableEntry(e)(t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_v(e){var t=stackSave();try{getWasmTableEntry(e)()}catch(r){if(stackRestore(t),r!==r+0)throw r;_setThrew(1,0)}}function invoke_i(e){var t=stackSave();try{return getWasmTableEntry(e)()}catch(r){if(stackRestore(t),r!==r+0)throw r;_setThrew(1,0)}}function invoke_iiiiii(e,t,r,n,a,o){var l=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_iiiiiiiii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_viif(e,t,r,n){var a=stackSave();try{getWasmTableEntry(e)(t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_viid(e,t,r,n){var a=stackSave();try{getWasmTableEntry(e)(t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_iid(e,t,r){var n=stackSave();try{return getWasmTableEntry(e)(t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_diiii(e,t,r,n,a){var o=stackSave();try{return getWasmTableEntry(e)(t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_iiiiiid(e,t,r,n,a,o,l){var u=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_viiiiiiiiii(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_viiiiiiiiiii(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_iiiiiiiiiii(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_di(e,t){var r=stackSave();try{return getWasmTableEntry(e)(t)}catch(n){if(stackRestore(r),n!==n+0)throw n;_setThrew(1,0)}}function invoke_id(e,t){var r=stackSave();try{return getWasmTableEntry(e)(t)}catch(n){if(stackRestore(r),n!==n+0)throw n;_setThrew(1,0)}}function invoke_vid(e,t,r){var n=stackSave();try{getWasmTableEntry(e)(t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_vif(e,t,r){var n=stackSave();try{getWasmTableEntry(e)(t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_iiiiiiiiii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_iiid(e,t,r,n){var a=stackSave();try{return getWasmTableEntry(e)(t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_viiid(e,t,r,n,a){var o=stackSave();try{getWasmTableEntry(e)(t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_iiiiiiiiiiiiiiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S){var w=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S)}catch(D){if(stackRestore(w),D!==D+0)throw D;_setThrew(1,0)}}function invoke_iiiiiiiiiiiiiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y){var S=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y)}catch(w){if(stackRestore(S),w!==w+0)throw w;_setThrew(1,0)}}function invoke_iiiiiiiiiiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h){var g=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o,l,u,_,d,f,p,m,h)}catch(v){if(stackRestore(g),v!==v+0)throw v;_setThrew(1,0)}}function invoke_iiiiiiiiiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_iidii(e,t,r,n,a){var o=stackSave();try{return getWasmTableEntry(e)(t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_viiiiiiiii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_iiidi(e,t,r,n,a){var o=stackSave();try{return getWasmTableEntry(e)(t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_viiifii(e,t,r,n,a,o,l){var u=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_vifi(e,t,r,n){var a=stackSave();try{getWasmTableEntry(e)(t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_viiidii(e,t,r,n,a,o,l){var u=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_vidi(e,t,r,n){var a=stackSave();try{getWasmTableEntry(e)(t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_idiii(e,t,r,n,a){var o=stackSave();try{return getWasmTableEntry(e)(t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_viiiiiiiiiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h){var g=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o,l,u,_,d,f,p,m,h)}catch(v){if(stackRestore(g),v!==v+0)throw v;_setThrew(1,0)}}function invoke_fi(e,t){var r=stackSave();try{return getWasmTableEntry(e)(t)}catch(n){if(stackRestore(r),n!==n+0)throw n;_setThrew(1,0)}}function invoke_iff(e,t,r){var n=stackSave();try{return getWasmTableEntry(e)(t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_idd(e,t,r){var n=stackSave();try{return getWasmTableEntry(e)(t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_diiiid(e,t,r,n,a,o){var l=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_viiiiiiiiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_iiiiiiiiiiii(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_if(e,t){var r=stackSave();try{return getWasmTableEntry(e)(t)}catch(n){if(stackRestore(r),n!==n+0)throw n;_setThrew(1,0)}}function invoke_didd(e,t,r,n){var a=stackSave();try{return getWasmTableEntry(e)(t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_ifii(e,t,r,n){var a=stackSave();try{return getWasmTableEntry(e)(t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_idii(e,t,r,n){var a=stackSave();try{return getWasmTableEntry(e)(t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_ifi(e,t,r){var n=stackSave();try{return getWasmTableEntry(e)(t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_idi(e,t,r){var n=stackSave();try{return getWasmTableEntry(e)(t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_idiiii(e,t,r,n,a,o){var l=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_dd(e,t){var r=stackSave();try{return getWasmTableEntry(e)(t)}catch(n){if(stackRestore(r),n!==n+0)throw n;_setThrew(1,0)}}function invoke_ddd(e,t,r){var n=stackSave();try{return getWasmTableEntry(e)(t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_viddddi(e,t,r,n,a,o,l){var u=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_diiiiid(e,t,r,n,a,o,l){var u=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_iiiid(e,t,r,n,a){var o=stackSave();try{return getWasmTableEntry(e)(t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_iifii(e,t,r,n,a){var o=stackSave();try{return getWasmTableEntry(e)(t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_iidiii(e,t,r,n,a,o){var l=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_iidiiii(e,t,r,n,a,o,l){var u=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_iidi(e,t,r,n){var a=stackSave();try{return getWasmTableEntry(e)(t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_vifii(e,t,r,n,a){var o=stackSave();try{getWasmTableEntry(e)(t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_vidii(e,t,r,n,a){var o=stackSave();try{getWasmTableEntry(e)(t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_iif(e,t,r){var n=stackSave();try{return getWasmTableEntry(e)(t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_fiiii(e,t,r,n,a){var o=stackSave();try{return getWasmTableEntry(e)(t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_diii(e,t,r,n){var a=stackSave();try{return getWasmTableEntry(e)(t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_viiifi(e,t,r,n,a,o){var l=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_viiidi(e,t,r,n,a,o){var l=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_iiiiid(e,t,r,n,a,o){var l=stackSave();try{return getWasmTableEntry(e)(t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_fiii(e,t,r,n){var a=stackSave();try{return getWasmTableEntry(e)(t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_viiiiiiiiiiiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v){var y=stackSave();try{getWasmTableEntry(e)(t,r,n,a,o,l,u,_,d,f,p,m,h,g,v)}catch(S){if(stackRestore(y),S!==S+0)throw S;_setThrew(1,0)}}function invoke_viji(e,t,r,n,a){var o=stackSave();try{Module.dynCall_viji(e,t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_ji(e,t){var r=stackSave();try{return Module.dynCall_ji(e,t)}catch(n){if(stackRestore(r),n!==n+0)throw n;_setThrew(1,0)}}function invoke_viijii(e,t,r,n,a,o,l){var u=stackSave();try{Module.dynCall_viijii(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_iij(e,t,r,n){var a=stackSave();try{return Module.dynCall_iij(e,t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_iiijiijj(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return Module.dynCall_iiijiijj(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iiij(e,t,r,n,a){var o=stackSave();try{return Module.dynCall_iiij(e,t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_vij(e,t,r,n){var a=stackSave();try{Module.dynCall_vij(e,t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_iiijj(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_iiijj(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_viiijj(e,t,r,n,a,o,l,u){var _=stackSave();try{Module.dynCall_viiijj(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_jii(e,t,r){var n=stackSave();try{return Module.dynCall_jii(e,t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_iiijii(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_iiijii(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_viij(e,t,r,n,a){var o=stackSave();try{Module.dynCall_viij(e,t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_viiij(e,t,r,n,a,o){var l=stackSave();try{Module.dynCall_viiij(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_viiji(e,t,r,n,a,o){var l=stackSave();try{Module.dynCall_viiji(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_viijijj(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viijijj(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_viijiijj(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viijiijj(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iiiij(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_iiiij(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_viijiii(e,t,r,n,a,o,l,u){var _=stackSave();try{Module.dynCall_viijiii(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_iiiji(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_iiiji(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_iiji(e,t,r,n,a){var o=stackSave();try{return Module.dynCall_iiji(e,t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_jiiij(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_jiiij(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_viiiji(e,t,r,n,a,o,l){var u=stackSave();try{Module.dynCall_viiiji(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_iijji(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_iijji(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_jjjii(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_jjjii(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_iiiiij(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_iiiiij(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_jj(e,t,r){var n=stackSave();try{return Module.dynCall_jj(e,t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_iiijjj(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_iiijjj(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_viiijjj(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viiijjj(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_iiiiiij(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_iiiiiij(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_jiiiii(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_jiiiii(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_iijiii(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_iijiii(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_dij(e,t,r,n){var a=stackSave();try{return Module.dynCall_dij(e,t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_iijii(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_iijii(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_iiiiji(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_iiiiji(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_vijji(e,t,r,n,a,o,l){var u=stackSave();try{Module.dynCall_vijji(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_iijiiiii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_iijiiiii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iiiiijj(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_iiiiijj(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_viiiij(e,t,r,n,a,o,l){var u=stackSave();try{Module.dynCall_viiiij(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_viiijii(e,t,r,n,a,o,l,u){var _=stackSave();try{Module.dynCall_viiijii(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_viiiiiiij(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viiiiiiij(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_viiiiji(e,t,r,n,a,o,l,u){var _=stackSave();try{Module.dynCall_viiiiji(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_iiiijii(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_iiiijii(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_viiiijii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_viiiijii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_jij(e,t,r,n){var a=stackSave();try{return Module.dynCall_jij(e,t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_iiiijj(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_iiiijj(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_iiiiijii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_iiiiijii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iijiiii(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_iijiiii(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_vijiii(e,t,r,n,a,o,l){var u=stackSave();try{Module.dynCall_vijiii(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_vijiiii(e,t,r,n,a,o,l,u){var _=stackSave();try{Module.dynCall_vijiiii(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_iijjiiiii(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return Module.dynCall_iijjiiiii(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iiijjiii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iiijjiii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_vjjii(e,t,r,n,a,o,l){var u=stackSave();try{Module.dynCall_vjjii(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_viiiiijii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viiiiijii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_viiijd(e,t,r,n,a,o,l){var u=stackSave();try{Module.dynCall_viiijd(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_jiii(e,t,r,n){var a=stackSave();try{return Module.dynCall_jiii(e,t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_iiiiijiiiii(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return Module.dynCall_iiiiijiiiii(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_vijiiiiii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_vijiiiiii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_viiiijj(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_viiiijj(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_vijiiiii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_vijiiiii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iijjiiii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iijjiiii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_ij(e,t,r){var n=stackSave();try{return Module.dynCall_ij(e,t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_vijj(e,t,r,n,a,o){var l=stackSave();try{Module.dynCall_vijj(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_ijji(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_ijji(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_viijd(e,t,r,n,a,o){var l=stackSave();try{Module.dynCall_viijd(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_iiiiiiiji(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iiiiiiiji(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_iiiiiji(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_iiiiiji(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_vj(e,t,r){var n=stackSave();try{Module.dynCall_vj(e,t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_vijii(e,t,r,n,a,o){var l=stackSave();try{Module.dynCall_vijii(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_viiiiij(e,t,r,n,a,o,l,u){var _=stackSave();try{Module.dynCall_viiiiij(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_viijj(e,t,r,n,a,o,l){var u=stackSave();try{Module.dynCall_viijj(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_viijij(e,t,r,n,a,o,l,u){var _=stackSave();try{Module.dynCall_viijij(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_iiiijjj(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iiiijjj(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_iiijiii(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_iiijiii(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_viiiijjjii(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{Module.dynCall_viiiijjjii(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_viiijiij(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viiijiij(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_vijiiji(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_vijiiji(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_jiiii(e,t,r,n,a){var o=stackSave();try{return Module.dynCall_jiiii(e,t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_viijjj(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_viijjj(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_vijjj(e,t,r,n,a,o,l,u){var _=stackSave();try{Module.dynCall_vijjj(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_iijij(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_iijij(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_iiiiiijii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iiiiiijii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_viijiiiii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viijiiiii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_jiiji(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_jiiji(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_fiiji(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_fiiji(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_diiji(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_diiji(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_jiijii(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_jiijii(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_jiiiij(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_jiiiij(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_viiiiijiiii(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{Module.dynCall_viiiiijiiii(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_jjjij(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_jjjij(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_jji(e,t,r,n){var a=stackSave();try{return Module.dynCall_jji(e,t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_iijiji(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_iijiji(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_viiiijiiiiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g){var v=stackSave();try{Module.dynCall_viiiijiiiiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g)}catch(y){if(stackRestore(v),y!==y+0)throw y;_setThrew(1,0)}}function invoke_vjiiii(e,t,r,n,a,o,l){var u=stackSave();try{Module.dynCall_vjiiii(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_viiiiiij(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_viiiiiij(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_vijjji(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_vijjji(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_j(e){var t=stackSave();try{return Module.dynCall_j(e)}catch(r){if(stackRestore(t),r!==r+0)throw r;_setThrew(1,0)}}function invoke_vjiiij(e,t,r,n,a,o,l,u){var _=stackSave();try{Module.dynCall_vjiiij(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_viijijijiji(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g){var v=stackSave();try{Module.dynCall_viijijijiji(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g)}catch(y){if(stackRestore(v),y!==y+0)throw y;_setThrew(1,0)}}function invoke_viiijjjjii(e,t,r,n,a,o,l,u,_,d,f,p,m,h){var g=stackSave();try{Module.dynCall_viiijjjjii(e,t,r,n,a,o,l,u,_,d,f,p,m,h)}catch(v){if(stackRestore(g),v!==v+0)throw v;_setThrew(1,0)}}function invoke_viijjjji(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{Module.dynCall_viijjjji(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_viijijijij(e,t,r,n,a,o,l,u,_,d,f,p,m,h){var g=stackSave();try{Module.dynCall_viijijijij(e,t,r,n,a,o,l,u,_,d,f,p,m,h)}catch(v){if(stackRestore(g),v!==v+0)throw v;_setThrew(1,0)}}function invoke_viiijij(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_viiijij(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_jiij(e,t,r,n,a){var o=stackSave();try{return Module.dynCall_jiij(e,t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_vjii(e,t,r,n,a){var o=stackSave();try{Module.dynCall_vjii(e,t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_viiiiiji(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_viiiiiji(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_jiiijii(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_jiiijii(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_viijjji(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viijjji(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_viiijiji(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viiijiji(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_iji(e,t,r,n){var a=stackSave();try{return Module.dynCall_iji(e,t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_jijjj(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_jijjj(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_dijjj(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_dijjj(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_vijijjd(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_vijijjd(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_jiiiiiiii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_jiiiiiiii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iiiijiii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_iiiijiii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iiijiiii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_iiijiiii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iiiiiiiij(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iiiiiiiij(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_iiiiiiij(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_iiiiiiij(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_viijji(e,t,r,n,a,o,l,u){var _=stackSave();try{Module.dynCall_viijji(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_ijjiii(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_ijjiii(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_viiijiii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_viiijiii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iijj(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_iijj(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_viiijjij(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viiijjij(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_vijijiij(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_vijijiij(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_viijiiiij(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viijiiiij(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_viiijiiiijjj(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v){var y=stackSave();try{Module.dynCall_viiijiiiijjj(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v)}catch(S){if(stackRestore(y),S!==S+0)throw S;_setThrew(1,0)}}function invoke_viijijiiiijjj(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S){var w=stackSave();try{Module.dynCall_viijijiiiijjj(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S)}catch(D){if(stackRestore(w),D!==D+0)throw D;_setThrew(1,0)}}function invoke_jiiijiijiii(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{return Module.dynCall_jiiijiijiii(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_viijijiiii(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{Module.dynCall_viijijiiii(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_jiiijiii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_jiiijiii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iijjj(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_iijjj(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_iiijji(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_iiijji(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_vijijiiiijjj(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y){var S=stackSave();try{Module.dynCall_vijijiiiijjj(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y)}catch(w){if(stackRestore(S),w!==w+0)throw w;_setThrew(1,0)}}function invoke_viiiijjii(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viiiijjii(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_viiiiijj(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viiiiijj(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_jiiiiji(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_jiiiiji(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_viiiijijji(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{Module.dynCall_viiiijijji(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_viiiijjij(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{Module.dynCall_viiiijjij(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_viiijiiijii(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{Module.dynCall_viiijiiijii(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_iiiiijiii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iiiiijiii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_vijijj(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_vijijj(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_viiijjjj(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{Module.dynCall_viiijjjj(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_jf(e,t){var r=stackSave();try{return Module.dynCall_jf(e,t)}catch(n){if(stackRestore(r),n!==n+0)throw n;_setThrew(1,0)}}function invoke_jd(e,t){var r=stackSave();try{return Module.dynCall_jd(e,t)}catch(n){if(stackRestore(r),n!==n+0)throw n;_setThrew(1,0)}}function invoke_viiiiijjii(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{Module.dynCall_viiiiijjii(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_viiiiiijii(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viiiiiijii(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_viiiiiiiijjjji(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S){var w=stackSave();try{Module.dynCall_viiiiiiiijjjji(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S)}catch(D){if(stackRestore(w),D!==D+0)throw D;_setThrew(1,0)}}function invoke_viijijij(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viijijij(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iiijij(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_iiijij(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_vji(e,t,r,n){var a=stackSave();try{Module.dynCall_vji(e,t,r,n)}catch(o){if(stackRestore(a),o!==o+0)throw o;_setThrew(1,0)}}function invoke_jiijj(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_jiijj(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_jiijiiiii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_jiijiiiii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_jiijiii(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_jiijiii(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_viiiiiijj(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viiiiiijj(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_jiiiijii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_jiiiijii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_jiijiiii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_jiijiiii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_jiiiiijiiii(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return Module.dynCall_jiiiiijiiii(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_viijjii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_viijjii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iiiijjiii(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return Module.dynCall_iiiijjiii(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iiiiiiiiijii(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{return Module.dynCall_iiiiiiiiijii(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_iiijijj(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iiijijj(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_viiijijj(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viiijijj(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iijiiiiiij(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return Module.dynCall_iijiiiiiij(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_viijiijji(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{Module.dynCall_viijiijji(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_viiiijiijjii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g){var v=stackSave();try{Module.dynCall_viiiijiijjii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g)}catch(y){if(stackRestore(v),y!==y+0)throw y;_setThrew(1,0)}}function invoke_iiiiiijjiiiiiiiji(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S,w,D){var F=stackSave();try{return Module.dynCall_iiiiiijjiiiiiiiji(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S,w,D)}catch(E){if(stackRestore(F),E!==E+0)throw E;_setThrew(1,0)}}function invoke_viijiiii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_viijiiii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_ijii(e,t,r,n,a){var o=stackSave();try{return Module.dynCall_ijii(e,t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_viijjiiij(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{Module.dynCall_viijjiiij(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_iiiijiijjiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g){var v=stackSave();try{return Module.dynCall_iiiijiijjiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g)}catch(y){if(stackRestore(v),y!==y+0)throw y;_setThrew(1,0)}}function invoke_iiidj(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_iiidj(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_iiiiiiiijj(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return Module.dynCall_iiiiiiiijj(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_iiiiiiiiiiiji(e,t,r,n,a,o,l,u,_,d,f,p,m,h){var g=stackSave();try{return Module.dynCall_iiiiiiiiiiiji(e,t,r,n,a,o,l,u,_,d,f,p,m,h)}catch(v){if(stackRestore(g),v!==v+0)throw v;_setThrew(1,0)}}function invoke_iiiiiiijji(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return Module.dynCall_iiiiiiijji(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_iiiijji(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_iiiijji(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_viiijjiii(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viiijjiii(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iiiiiiiiiji(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return Module.dynCall_iiiiiiiiiji(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_iiiiiiiiji(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return Module.dynCall_iiiiiiiiji(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_jiiijjj(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_jiiijjj(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_iiiiijij(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iiiiijij(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_jiiiiiii(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_jiiiiiii(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_jiiiiii(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_jiiiiii(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_iiiiiiiiij(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return Module.dynCall_iiiiiiiiij(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iiiiiiji(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_iiiiiiji(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iiiiiiiiiiijiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v){var y=stackSave();try{return Module.dynCall_iiiiiiiiiiijiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v)}catch(S){if(stackRestore(y),S!==S+0)throw S;_setThrew(1,0)}}function invoke_iiiiiiiiijiiiiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S,w){var D=stackSave();try{return Module.dynCall_iiiiiiiiijiiiiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S,w)}catch(F){if(stackRestore(D),F!==F+0)throw F;_setThrew(1,0)}}function invoke_iiiiiiiiiiji(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{return Module.dynCall_iiiiiiiiiiji(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_iiiiijjii(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return Module.dynCall_iiiiijjii(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iiiiijjij(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return Module.dynCall_iiiiijjij(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_iiiijiiiij(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return Module.dynCall_iiiijiiiij(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_iiiijiiij(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return Module.dynCall_iiiijiiij(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iiiiijiiii(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return Module.dynCall_iiiiijiiii(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iiiiiiiijii(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return Module.dynCall_iiiiiiiijii(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_jiiiijiii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_jiiiijiii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_iiiijjii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iiiijjii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_viiijjii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viiijjii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_viiijji(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_viiijji(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_viiijiiii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viiijiiii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_jiijjiii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_jiijjiii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_viiiijji(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viiiijji(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_ijjj(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_ijjj(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_iiiiiiijjjjjjii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S,w,D,F){var E=stackSave();try{return Module.dynCall_iiiiiiijjjjjjii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S,w,D,F)}catch(x){if(stackRestore(E),x!==x+0)throw x;_setThrew(1,0)}}function invoke_iiijjijj(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return Module.dynCall_iiijjijj(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_viiijjijj(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{Module.dynCall_viiijjijj(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_vjiii(e,t,r,n,a,o){var l=stackSave();try{Module.dynCall_vjiii(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_jijj(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_jijj(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_iijjjii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iijjjii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_iijjji(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_iijjji(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iiijjjijj(e,t,r,n,a,o,l,u,_,d,f,p,m,h){var g=stackSave();try{return Module.dynCall_iiijjjijj(e,t,r,n,a,o,l,u,_,d,f,p,m,h)}catch(v){if(stackRestore(g),v!==v+0)throw v;_setThrew(1,0)}}function invoke_iiijjjjj(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{return Module.dynCall_iiijjjjj(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_iiiiiijji(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return Module.dynCall_iiiiiijji(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_viiijjjijj(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g){var v=stackSave();try{Module.dynCall_viiijjjijj(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g)}catch(y){if(stackRestore(v),y!==y+0)throw y;_setThrew(1,0)}}function invoke_viiijjjjj(e,t,r,n,a,o,l,u,_,d,f,p,m,h){var g=stackSave();try{Module.dynCall_viiijjjjj(e,t,r,n,a,o,l,u,_,d,f,p,m,h)}catch(v){if(stackRestore(g),v!==v+0)throw v;_setThrew(1,0)}}function invoke_jiiijj(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_jiiijj(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_jiiiiiji(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_jiiiiiji(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iidj(e,t,r,n,a){var o=stackSave();try{return Module.dynCall_iidj(e,t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_viiiiiiijij(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{Module.dynCall_viiiiiiijij(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_viiiiijij(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viiiiijij(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iiijjjjjiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S){var w=stackSave();try{return Module.dynCall_iiijjjjjiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S)}catch(D){if(stackRestore(w),D!==D+0)throw D;_setThrew(1,0)}}function invoke_viijjjjjiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S){var w=stackSave();try{Module.dynCall_viijjjjjiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S)}catch(D){if(stackRestore(w),D!==D+0)throw D;_setThrew(1,0)}}function invoke_vjjijij(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_vjjijij(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_viiijiiji(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viiijiiji(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_jiiiji(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_jiiiji(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_jiijiij(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_jiijiij(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_jiiijij(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_jiiijij(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iiiiiijjiijjji(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S,w){var D=stackSave();try{return Module.dynCall_iiiiiijjiijjji(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S,w)}catch(F){if(stackRestore(D),F!==F+0)throw F;_setThrew(1,0)}}function invoke_iiijjijjiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g){var v=stackSave();try{return Module.dynCall_iiijjijjiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g)}catch(y){if(stackRestore(v),y!==y+0)throw y;_setThrew(1,0)}}function invoke_iiijjii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_iiijjii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iiijjjj(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return Module.dynCall_iiijjjj(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_viijiiiiii(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viijiiiiii(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_viijiiij(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viijiiij(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_vijiiiji(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_vijiiiji(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_jijjij(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_jijjij(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_jijij(e,t,r,n,a,o,l){var u=stackSave();try{return Module.dynCall_jijij(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_iiiiijjj(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return Module.dynCall_iiiiijjj(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_viiiiiijij(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{Module.dynCall_viiiiiijij(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_viiiijij(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viiiijij(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_viiijjjjjiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S,w){var D=stackSave();try{Module.dynCall_viiijjjjjiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y,S,w)}catch(F){if(stackRestore(D),F!==F+0)throw F;_setThrew(1,0)}}function invoke_viiijjjjiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y){var S=stackSave();try{Module.dynCall_viiijjjjiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g,v,y)}catch(w){if(stackRestore(S),w!==w+0)throw w;_setThrew(1,0)}}function invoke_viiijjjiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g){var v=stackSave();try{Module.dynCall_viiijjjiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m,h,g)}catch(y){if(stackRestore(v),y!==y+0)throw y;_setThrew(1,0)}}function invoke_viiijjiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{Module.dynCall_viiijjiiiii(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_viiijiiiii(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viiijiiiii(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_jiiiijji(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_jiiiijji(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_jiji(e,t,r,n,a){var o=stackSave();try{return Module.dynCall_jiji(e,t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_viiiiiiji(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viiiiiiji(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_iijjii(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_iijjii(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_iiijiiiji(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return Module.dynCall_iiijiiiji(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iiijjji(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iiijjji(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_vjj(e,t,r,n,a){var o=stackSave();try{Module.dynCall_vjj(e,t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_viiijjji(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viiijjji(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_viiiijiiiii(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{Module.dynCall_viiiijiiiii(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_viiiijiiii(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_viiiijiiii(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_vijiji(e,t,r,n,a,o,l,u){var _=stackSave();try{Module.dynCall_vijiji(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_vijjij(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_vijjij(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_jjij(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_jjij(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_ijij(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_ijij(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_vijij(e,t,r,n,a,o,l){var u=stackSave();try{Module.dynCall_vijij(e,t,r,n,a,o,l)}catch(_){if(stackRestore(u),_!==_+0)throw _;_setThrew(1,0)}}function invoke_diij(e,t,r,n,a){var o=stackSave();try{return Module.dynCall_diij(e,t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_djij(e,t,r,n,a,o){var l=stackSave();try{return Module.dynCall_djij(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_dj(e,t,r){var n=stackSave();try{return Module.dynCall_dj(e,t,r)}catch(a){if(stackRestore(n),a!==a+0)throw a;_setThrew(1,0)}}function invoke_jjj(e,t,r,n,a){var o=stackSave();try{return Module.dynCall_jjj(e,t,r,n,a)}catch(l){if(stackRestore(o),l!==l+0)throw l;_setThrew(1,0)}}function invoke_vjij(e,t,r,n,a,o){var l=stackSave();try{Module.dynCall_vjij(e,t,r,n,a,o)}catch(u){if(stackRestore(l),u!==u+0)throw u;_setThrew(1,0)}}function invoke_jjjjjjd(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return Module.dynCall_jjjjjjd(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_jjjji(e,t,r,n,a,o,l,u){var _=stackSave();try{return Module.dynCall_jjjji(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_iijjjj(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iijjjj(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_fijjjj(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_fijjjj(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_dijjjj(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_dijjjj(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_fijjjjij(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{return Module.dynCall_fijjjjij(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_dijjjjij(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{return Module.dynCall_dijjjjij(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_iijiijj(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iijiijj(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_vijjjj(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_vijjjj(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_viiiiijiijii(e,t,r,n,a,o,l,u,_,d,f,p,m,h){var g=stackSave();try{Module.dynCall_viiiiijiijii(e,t,r,n,a,o,l,u,_,d,f,p,m,h)}catch(v){if(stackRestore(g),v!==v+0)throw v;_setThrew(1,0)}}function invoke_viiiiijjji(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{Module.dynCall_viiiiijjji(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_iiijiiijj(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return Module.dynCall_iiijiiijj(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_viiijijjj(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{Module.dynCall_viiijijjj(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_vijijjji(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{Module.dynCall_vijijjji(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_iiijiij(e,t,r,n,a,o,l,u,_){var d=stackSave();try{return Module.dynCall_iiijiij(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_viijiij(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_viijiij(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_vijiij(e,t,r,n,a,o,l,u){var _=stackSave();try{Module.dynCall_vijiij(e,t,r,n,a,o,l,u)}catch(d){if(stackRestore(_),d!==d+0)throw d;_setThrew(1,0)}}function invoke_jijjjj(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_jijjjj(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_iiijiiiijj(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{return Module.dynCall_iiijiiiijj(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_iijiiijj(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{return Module.dynCall_iijiiijj(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_iiijiiij(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iiijiiij(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_iiijiiiii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{return Module.dynCall_iiijiiiii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_vijjjiiji(e,t,r,n,a,o,l,u,_,d,f,p,m){var h=stackSave();try{Module.dynCall_vijjjiiji(e,t,r,n,a,o,l,u,_,d,f,p,m)}catch(g){if(stackRestore(h),g!==g+0)throw g;_setThrew(1,0)}}function invoke_viijiji(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_viijiji(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_iiiijjjj(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{return Module.dynCall_iiiijjjj(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function invoke_vijiiiiji(e,t,r,n,a,o,l,u,_,d,f){var p=stackSave();try{Module.dynCall_vijiiiiji(e,t,r,n,a,o,l,u,_,d,f)}catch(m){if(stackRestore(p),m!==m+0)throw m;_setThrew(1,0)}}function invoke_viiiijiii(e,t,r,n,a,o,l,u,_,d){var f=stackSave();try{Module.dynCall_viiiijiii(e,t,r,n,a,o,l,u,_,d)}catch(p){if(stackRestore(f),p!==p+0)throw p;_setThrew(1,0)}}function invoke_vijjiii(e,t,r,n,a,o,l,u,_){var d=stackSave();try{Module.dynCall_vijjiii(e,t,r,n,a,o,l,u,_)}catch(f){if(stackRestore(d),f!==f+0)throw f;_setThrew(1,0)}}function invoke_viijiiijj(e,t,r,n,a,o,l,u,_,d,f,p){var m=stackSave();try{Module.dynCall_viijiiijj(e,t,r,n,a,o,l,u,_,d,f,p)}catch(h){if(stackRestore(m),h!==h+0)throw h;_setThrew(1,0)}}function applySignatureConversions(e){e=Object.assign({},e);var t=u=>_=>u(_)>>>0,r=u=>()=>u()>>>0,n=u=>(_,d,f)=>u(_,d,f)>>>0,a=u=>(_,d)=>u(_,d)>>>0,o=u=>_=>u(_)>>>0,l=u=>_=>u(_)>>>0;return e.__getTypeName=t(e.__getTypeName),e.pthread_self=r(e.pthread_self),e.memcpy=n(e.memcpy),e.malloc=t(e.malloc),e.calloc=a(e.calloc),e.__errno_location=r(e.__errno_location),e.strerror=o(e.strerror),e.emscripten_builtin_malloc=t(e.emscripten_builtin_malloc),e.emscripten_stack_get_base=r(e.emscripten_stack_get_base),e.emscripten_stack_get_end=r(e.emscripten_stack_get_end),e.emscripten_builtin_memalign=a(e.emscripten_builtin_memalign),e.emscripten_stack_get_current=r(e.emscripten_stack_get_current),e.emscripten_main_runtime_thread_id=r(e.emscripten_main_runtime_thread_id),e.sbrk=l(e.sbrk),e.memalign=a(e.memalign),e.emscripten_builtin_calloc=a(e.emscripten_builtin_calloc),e._emscripten_stack_alloc=t(e._emscripten_stack_alloc),e.__cxa_get_exception_ptr=t(e.__cxa_get_exception_ptr),e}Module.stackSave=stackSave,Module.stackRestore=stackRestore,Module.stackAlloc=stackAlloc,Module.getTempRet0=getTempRet0,Module.setTempRet0=setTempRet0,Module.ccall=ccall,Module.createDyncallWrapper=createDyncallWrapper;var calledRun;dependenciesFulfilled=function e(){calledRun||run(),calledRun||(dependenciesFulfilled=e)};function callMain(e=[]){var t=resolveGlobalSymbol("main").sym;if(t){e.unshift(thisProgram);var r=e.length,n=stackAlloc((r+1)*4),a=n;e.forEach(l=>{HEAPU32[a>>>2>>>0]=stringToUTF8OnStack(l),a+=4}),HEAPU32[a>>>2>>>0]=0;try{var o=t(r,n);return exitJS(o,!0),o}catch(l){return handleException(l)}}}function run(e=arguments_){if(runDependencies>0||(preRun(),runDependencies>0))return;function t(){var r;calledRun||(calledRun=!0,Module.calledRun=!0,!ABORT&&(initRuntime(),preMain(),readyPromiseResolve(Module),(r=Module.onRuntimeInitialized)==null||r.call(Module),shouldRunNow&&callMain(e),postRun()))}Module.setStatus?(Module.setStatus("Running..."),setTimeout(()=>{setTimeout(()=>Module.setStatus(""),1),t()},1)):t()}if(Module.preInit)for(typeof Module.preInit=="function"&&(Module.preInit=[Module.preInit]);Module.preInit.length>0;)Module.preInit.pop()();var shouldRunNow=!0;return Module.noInitialRun&&(shouldRunNow=!1),run(),moduleRtn=readyPromise,moduleRtn}})();typeof exports=="object"&&typeof module=="object"?module.exports=DuckDB:typeof define=="function"&&define.amd&&define([],()=>DuckDB)});var Gl=pr(()=>{});var Ol=pr(()=>{});var Hl=pr((WS,va)=>{(function(){"use strict";var c="input is invalid type",e=typeof window=="object",t=e?window:{};t.JS_SHA256_NO_WINDOW&&(e=!1);var r=!e&&typeof self=="object",n=!t.JS_SHA256_NO_NODE_JS&&typeof process=="object"&&process.versions&&process.versions.node&&process.type!="renderer";n?t=global:r&&(t=self);var a=!t.JS_SHA256_NO_COMMON_JS&&typeof va=="object"&&va.exports,o=typeof define=="function"&&define.amd,l=!t.JS_SHA256_NO_ARRAY_BUFFER&&typeof ArrayBuffer<"u",u="0123456789abcdef".split(""),_=[-2147483648,8388608,32768,128],d=[24,16,8,0],f=[1116352408,1899447441,3049323471,3921009573,961987163,1508970993,2453635748,2870763221,3624381080,310598401,607225278,1426881987,1925078388,2162078206,2614888103,3248222580,3835390401,4022224774,264347078,604807628,770255983,1249150122,1555081692,1996064986,2554220882,2821834349,2952996808,3210313671,3336571891,3584528711,113926993,338241895,666307205,773529912,1294757372,1396182291,1695183700,1986661051,2177026350,2456956037,2730485921,2820302411,3259730800,3345764771,3516065817,3600352804,4094571909,275423344,430227734,506948616,659060556,883997877,958139571,1322822218,1537002063,1747873779,1955562222,2024104815,2227730452,2361852424,2428436474,2756734187,3204031479,3329325298],p=["hex","array","digest","arrayBuffer"],m=[];(t.JS_SHA256_NO_NODE_JS||!Array.isArray)&&(Array.isArray=function(E){return Object.prototype.toString.call(E)==="[object Array]"}),l&&(t.JS_SHA256_NO_ARRAY_BUFFER_IS_VIEW||!ArrayBuffer.isView)&&(ArrayBuffer.isView=function(E){return typeof E=="object"&&E.buffer&&E.buffer.constructor===ArrayBuffer});var h=function(E,x){return function(A){return new w(x,!0).update(A)[E]()}},g=function(E){var x=h("hex",E);n&&(x=v(x,E)),x.create=function(){return new w(E)},x.update=function(C){return x.create().update(C)};for(var A=0;A<p.length;++A){var L=p[A];x[L]=h(L,E)}return x},v=function(E,x){var A=Gl(),L=Ol().Buffer,C=x?"sha224":"sha256",k;L.from&&!t.JS_SHA256_NO_BUFFER_FROM?k=L.from:k=function(T){return new L(T)};var P=function(T){if(typeof T=="string")return A.createHash(C).update(T,"utf8").digest("hex");if(T==null)throw new Error(c);return T.constructor===ArrayBuffer&&(T=new Uint8Array(T)),Array.isArray(T)||ArrayBuffer.isView(T)||T.constructor===L?A.createHash(C).update(k(T)).digest("hex"):E(T)};return P},y=function(E,x){return function(A,L){return new D(A,x,!0).update(L)[E]()}},S=function(E){var x=y("hex",E);x.create=function(C){return new D(C,E)},x.update=function(C,k){return x.create(C).update(k)};for(var A=0;A<p.length;++A){var L=p[A];x[L]=y(L,E)}return x};function w(E,x){x?(m[0]=m[16]=m[1]=m[2]=m[3]=m[4]=m[5]=m[6]=m[7]=m[8]=m[9]=m[10]=m[11]=m[12]=m[13]=m[14]=m[15]=0,this.blocks=m):this.blocks=[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],E?(this.h0=3238371032,this.h1=914150663,this.h2=812702999,this.h3=4144912697,this.h4=4290775857,this.h5=1750603025,this.h6=1694076839,this.h7=3204075428):(this.h0=1779033703,this.h1=3144134277,this.h2=1013904242,this.h3=2773480762,this.h4=1359893119,this.h5=2600822924,this.h6=528734635,this.h7=1541459225),this.block=this.start=this.bytes=this.hBytes=0,this.finalized=this.hashed=!1,this.first=!0,this.is224=E}w.prototype.update=function(E){if(!this.finalized){var x,A=typeof E;if(A!=="string"){if(A==="object"){if(E===null)throw new Error(c);if(l&&E.constructor===ArrayBuffer)E=new Uint8Array(E);else if(!Array.isArray(E)&&(!l||!ArrayBuffer.isView(E)))throw new Error(c)}else throw new Error(c);x=!0}for(var L,C=0,k,P=E.length,T=this.blocks;C<P;){if(this.hashed&&(this.hashed=!1,T[0]=this.block,this.block=T[16]=T[1]=T[2]=T[3]=T[4]=T[5]=T[6]=T[7]=T[8]=T[9]=T[10]=T[11]=T[12]=T[13]=T[14]=T[15]=0),x)for(k=this.start;C<P&&k<64;++C)T[k>>>2]|=E[C]<<d[k++&3];else for(k=this.start;C<P&&k<64;++C)L=E.charCodeAt(C),L<128?T[k>>>2]|=L<<d[k++&3]:L<2048?(T[k>>>2]|=(192|L>>>6)<<d[k++&3],T[k>>>2]|=(128|L&63)<<d[k++&3]):L<55296||L>=57344?(T[k>>>2]|=(224|L>>>12)<<d[k++&3],T[k>>>2]|=(128|L>>>6&63)<<d[k++&3],T[k>>>2]|=(128|L&63)<<d[k++&3]):(L=65536+((L&1023)<<10|E.charCodeAt(++C)&1023),T[k>>>2]|=(240|L>>>18)<<d[k++&3],T[k>>>2]|=(128|L>>>12&63)<<d[k++&3],T[k>>>2]|=(128|L>>>6&63)<<d[k++&3],T[k>>>2]|=(128|L&63)<<d[k++&3]);this.lastByteIndex=k,this.bytes+=k-this.start,k>=64?(this.block=T[16],this.start=k-64,this.hash(),this.hashed=!0):this.start=k}return this.bytes>4294967295&&(this.hBytes+=this.bytes/4294967296<<0,this.bytes=this.bytes%4294967296),this}},w.prototype.finalize=function(){if(!this.finalized){this.finalized=!0;var E=this.blocks,x=this.lastByteIndex;E[16]=this.block,E[x>>>2]|=_[x&3],this.block=E[16],x>=56&&(this.hashed||this.hash(),E[0]=this.block,E[16]=E[1]=E[2]=E[3]=E[4]=E[5]=E[6]=E[7]=E[8]=E[9]=E[10]=E[11]=E[12]=E[13]=E[14]=E[15]=0),E[14]=this.hBytes<<3|this.bytes>>>29,E[15]=this.bytes<<3,this.hash()}},w.prototype.hash=function(){var E=this.h0,x=this.h1,A=this.h2,L=this.h3,C=this.h4,k=this.h5,P=this.h6,T=this.h7,M=this.blocks,I,Q,ee,ce,Y,Ie,we,De,ei,Mr,fr;for(I=16;I<64;++I)Y=M[I-15],Q=(Y>>>7|Y<<25)^(Y>>>18|Y<<14)^Y>>>3,Y=M[I-2],ee=(Y>>>17|Y<<15)^(Y>>>19|Y<<13)^Y>>>10,M[I]=M[I-16]+Q+M[I-7]+ee<<0;for(fr=x&A,I=0;I<64;I+=4)this.first?(this.is224?(De=300032,Y=M[0]-1413257819,T=Y-150054599<<0,L=Y+24177077<<0):(De=704751109,Y=M[0]-210244248,T=Y-1521486534<<0,L=Y+143694565<<0),this.first=!1):(Q=(E>>>2|E<<30)^(E>>>13|E<<19)^(E>>>22|E<<10),ee=(C>>>6|C<<26)^(C>>>11|C<<21)^(C>>>25|C<<7),De=E&x,ce=De^E&A^fr,we=C&k^~C&P,Y=T+ee+we+f[I]+M[I],Ie=Q+ce,T=L+Y<<0,L=Y+Ie<<0),Q=(L>>>2|L<<30)^(L>>>13|L<<19)^(L>>>22|L<<10),ee=(T>>>6|T<<26)^(T>>>11|T<<21)^(T>>>25|T<<7),ei=L&E,ce=ei^L&x^De,we=T&C^~T&k,Y=P+ee+we+f[I+1]+M[I+1],Ie=Q+ce,P=A+Y<<0,A=Y+Ie<<0,Q=(A>>>2|A<<30)^(A>>>13|A<<19)^(A>>>22|A<<10),ee=(P>>>6|P<<26)^(P>>>11|P<<21)^(P>>>25|P<<7),Mr=A&L,ce=Mr^A&E^ei,we=P&T^~P&C,Y=k+ee+we+f[I+2]+M[I+2],Ie=Q+ce,k=x+Y<<0,x=Y+Ie<<0,Q=(x>>>2|x<<30)^(x>>>13|x<<19)^(x>>>22|x<<10),ee=(k>>>6|k<<26)^(k>>>11|k<<21)^(k>>>25|k<<7),fr=x&A,ce=fr^x&L^Mr,we=k&P^~k&T,Y=C+ee+we+f[I+3]+M[I+3],Ie=Q+ce,C=E+Y<<0,E=Y+Ie<<0,this.chromeBugWorkAround=!0;this.h0=this.h0+E<<0,this.h1=this.h1+x<<0,this.h2=this.h2+A<<0,this.h3=this.h3+L<<0,this.h4=this.h4+C<<0,this.h5=this.h5+k<<0,this.h6=this.h6+P<<0,this.h7=this.h7+T<<0},w.prototype.hex=function(){this.finalize();var E=this.h0,x=this.h1,A=this.h2,L=this.h3,C=this.h4,k=this.h5,P=this.h6,T=this.h7,M=u[E>>>28&15]+u[E>>>24&15]+u[E>>>20&15]+u[E>>>16&15]+u[E>>>12&15]+u[E>>>8&15]+u[E>>>4&15]+u[E&15]+u[x>>>28&15]+u[x>>>24&15]+u[x>>>20&15]+u[x>>>16&15]+u[x>>>12&15]+u[x>>>8&15]+u[x>>>4&15]+u[x&15]+u[A>>>28&15]+u[A>>>24&15]+u[A>>>20&15]+u[A>>>16&15]+u[A>>>12&15]+u[A>>>8&15]+u[A>>>4&15]+u[A&15]+u[L>>>28&15]+u[L>>>24&15]+u[L>>>20&15]+u[L>>>16&15]+u[L>>>12&15]+u[L>>>8&15]+u[L>>>4&15]+u[L&15]+u[C>>>28&15]+u[C>>>24&15]+u[C>>>20&15]+u[C>>>16&15]+u[C>>>12&15]+u[C>>>8&15]+u[C>>>4&15]+u[C&15]+u[k>>>28&15]+u[k>>>24&15]+u[k>>>20&15]+u[k>>>16&15]+u[k>>>12&15]+u[k>>>8&15]+u[k>>>4&15]+u[k&15]+u[P>>>28&15]+u[P>>>24&15]+u[P>>>20&15]+u[P>>>16&15]+u[P>>>12&15]+u[P>>>8&15]+u[P>>>4&15]+u[P&15];return this.is224||(M+=u[T>>>28&15]+u[T>>>24&15]+u[T>>>20&15]+u[T>>>16&15]+u[T>>>12&15]+u[T>>>8&15]+u[T>>>4&15]+u[T&15]),M},w.prototype.toString=w.prototype.hex,w.prototype.digest=function(){this.finalize();var E=this.h0,x=this.h1,A=this.h2,L=this.h3,C=this.h4,k=this.h5,P=this.h6,T=this.h7,M=[E>>>24&255,E>>>16&255,E>>>8&255,E&255,x>>>24&255,x>>>16&255,x>>>8&255,x&255,A>>>24&255,A>>>16&255,A>>>8&255,A&255,L>>>24&255,L>>>16&255,L>>>8&255,L&255,C>>>24&255,C>>>16&255,C>>>8&255,C&255,k>>>24&255,k>>>16&255,k>>>8&255,k&255,P>>>24&255,P>>>16&255,P>>>8&255,P&255];return this.is224||M.push(T>>>24&255,T>>>16&255,T>>>8&255,T&255),M},w.prototype.array=w.prototype.digest,w.prototype.arrayBuffer=function(){this.finalize();var E=new ArrayBuffer(this.is224?28:32),x=new DataView(E);return x.setUint32(0,this.h0),x.setUint32(4,this.h1),x.setUint32(8,this.h2),x.setUint32(12,this.h3),x.setUint32(16,this.h4),x.setUint32(20,this.h5),x.setUint32(24,this.h6),this.is224||x.setUint32(28,this.h7),E};function D(E,x,A){var L,C=typeof E;if(C==="string"){var k=[],P=E.length,T=0,M;for(L=0;L<P;++L)M=E.charCodeAt(L),M<128?k[T++]=M:M<2048?(k[T++]=192|M>>>6,k[T++]=128|M&63):M<55296||M>=57344?(k[T++]=224|M>>>12,k[T++]=128|M>>>6&63,k[T++]=128|M&63):(M=65536+((M&1023)<<10|E.charCodeAt(++L)&1023),k[T++]=240|M>>>18,k[T++]=128|M>>>12&63,k[T++]=128|M>>>6&63,k[T++]=128|M&63);E=k}else if(C==="object"){if(E===null)throw new Error(c);if(l&&E.constructor===ArrayBuffer)E=new Uint8Array(E);else if(!Array.isArray(E)&&(!l||!ArrayBuffer.isView(E)))throw new Error(c)}else throw new Error(c);E.length>64&&(E=new w(x,!0).update(E).array());var I=[],Q=[];for(L=0;L<64;++L){var ee=E[L]||0;I[L]=92^ee,Q[L]=54^ee}w.call(this,x,A),this.update(Q),this.oKeyPad=I,this.inner=!0,this.sharedMemory=A}D.prototype=new w,D.prototype.finalize=function(){if(w.prototype.finalize.call(this),this.inner){this.inner=!1;var E=this.array();w.call(this,this.is224,this.sharedMemory),this.update(this.oKeyPad),this.update(E),w.prototype.finalize.call(this)}};var F=g();F.sha256=F,F.sha224=g(!0),F.sha256.hmac=S(),F.sha224.hmac=S(!0),a?va.exports=F:(t.sha256=F.sha256,t.sha224=F.sha224,o&&define(function(){return F}))})()});var Fd={};mr(Fd,{registerWorker:()=>$l});function Ro(c,e){var t={};for(var r in c)Object.prototype.hasOwnProperty.call(c,r)&&e.indexOf(r)<0&&(t[r]=c[r]);if(c!=null&&typeof Object.getOwnPropertySymbols=="function")for(var n=0,r=Object.getOwnPropertySymbols(c);n<r.length;n++)e.indexOf(r[n])<0&&Object.prototype.propertyIsEnumerable.call(c,r[n])&&(t[r[n]]=c[r[n]]);return t}function B(c,e,t,r){function n(a){return a instanceof t?a:new t(function(o){o(a)})}return new(t||(t=Promise))(function(a,o){function l(d){try{_(r.next(d))}catch(f){o(f)}}function u(d){try{_(r.throw(d))}catch(f){o(f)}}function _(d){d.done?a(d.value):n(d.value).then(l,u)}_((r=r.apply(c,e||[])).next())})}function jo(c){var e=typeof Symbol=="function"&&Symbol.iterator,t=e&&c[e],r=0;if(t)return t.call(c);if(c&&typeof c.length=="number")return{next:function(){return c&&r>=c.length&&(c=void 0),{value:c&&c[r++],done:!c}}};throw new TypeError(e?"Object is not iterable.":"Symbol.iterator is not defined.")}function re(c){return this instanceof re?(this.v=c,this):new re(c)}function Ye(c,e,t){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var r=t.apply(c,e||[]),n,a=[];return n={},o("next"),o("throw"),o("return"),n[Symbol.asyncIterator]=function(){return this},n;function o(p){r[p]&&(n[p]=function(m){return new Promise(function(h,g){a.push([p,m,h,g])>1||l(p,m)})})}function l(p,m){try{u(r[p](m))}catch(h){f(a[0][3],h)}}function u(p){p.value instanceof re?Promise.resolve(p.value.v).then(_,d):f(a[0][2],p)}function _(p){l("next",p)}function d(p){l("throw",p)}function f(p,m){p(m),a.shift(),a.length&&l(a[0][0],a[0][1])}}function ti(c){var e,t;return e={},r("next"),r("throw",function(n){throw n}),r("return"),e[Symbol.iterator]=function(){return this},e;function r(n,a){e[n]=c[n]?function(o){return(t=!t)?{value:re(c[n](o)),done:!1}:a?a(o):o}:a}}function ut(c){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var e=c[Symbol.asyncIterator],t;return e?e.call(c):(c=typeof jo=="function"?jo(c):c[Symbol.iterator](),t={},r("next"),r("throw"),r("return"),t[Symbol.asyncIterator]=function(){return this},t);function r(a){t[a]=c[a]&&function(o){return new Promise(function(l,u){o=c[a](o),n(l,u,o.done,o.value)})}}function n(a,o,l,u){Promise.resolve(u).then(function(_){a({value:_,done:l})},o)}}var La={};mr(La,{compareArrayLike:()=>Aa,joinUint8Arrays:()=>Je,memcpy:()=>Pi,rebaseValueOffsets:()=>Un,toArrayBufferView:()=>ie,toArrayBufferViewAsyncIterator:()=>ft,toArrayBufferViewIterator:()=>Ct,toBigInt64Array:()=>Rn,toBigUint64Array:()=>lu,toFloat32Array:()=>uu,toFloat32ArrayAsyncIterator:()=>ku,toFloat32ArrayIterator:()=>vu,toFloat64Array:()=>_u,toFloat64ArrayAsyncIterator:()=>Du,toFloat64ArrayIterator:()=>yu,toInt16Array:()=>au,toInt16ArrayAsyncIterator:()=>wu,toInt16ArrayIterator:()=>pu,toInt32Array:()=>Ir,toInt32ArrayAsyncIterator:()=>Eu,toInt32ArrayIterator:()=>mu,toInt8Array:()=>su,toInt8ArrayAsyncIterator:()=>Su,toInt8ArrayIterator:()=>fu,toUint16Array:()=>ou,toUint16ArrayAsyncIterator:()=>Au,toUint16ArrayIterator:()=>hu,toUint32Array:()=>cu,toUint32ArrayAsyncIterator:()=>Lu,toUint32ArrayIterator:()=>gu,toUint8Array:()=>z,toUint8ArrayAsyncIterator:()=>Ea,toUint8ArrayIterator:()=>wa,toUint8ClampedArray:()=>du,toUint8ClampedArrayAsyncIterator:()=>Tu,toUint8ClampedArrayIterator:()=>bu});var tu=new TextDecoder("utf-8"),Ci=c=>tu.decode(c),ru=new TextEncoder,xt=c=>ru.encode(c);var iu=c=>typeof c=="number",Uo=c=>typeof c=="boolean",xe=c=>typeof c=="function",Oe=c=>c!=null&&Object(c)===c,_t=c=>Oe(c)&&xe(c.then);var dt=c=>Oe(c)&&xe(c[Symbol.iterator]),it=c=>Oe(c)&&xe(c[Symbol.asyncIterator]),Cn=c=>Oe(c)&&Oe(c.schema);var Mn=c=>Oe(c)&&"done"in c&&"value"in c;var Pn=c=>Oe(c)&&xe(c.stat)&&iu(c.fd);var In=c=>Oe(c)&&Mi(c.body),Bn=c=>"_getDOMStream"in c&&"_getNodeStream"in c,Go=c=>Oe(c)&&xe(c.abort)&&xe(c.getWriter)&&!Bn(c),Mi=c=>Oe(c)&&xe(c.cancel)&&xe(c.getReader)&&!Bn(c),Oo=c=>Oe(c)&&xe(c.end)&&xe(c.write)&&Uo(c.writable)&&!Bn(c),jn=c=>Oe(c)&&xe(c.read)&&xe(c.pipe)&&Uo(c.readable)&&!Bn(c),Ho=c=>Oe(c)&&xe(c.clear)&&xe(c.bytes)&&xe(c.position)&&xe(c.setPosition)&&xe(c.capacity)&&xe(c.getBufferIdentifier)&&xe(c.createLong);var Sa=typeof SharedArrayBuffer<"u"?SharedArrayBuffer:ArrayBuffer;function nu(c){let e=c[0]?[c[0]]:[],t,r,n,a;for(let o,l,u=0,_=0,d=c.length;++u<d;){if(o=e[_],l=c[u],!o||!l||o.buffer!==l.buffer||l.byteOffset<o.byteOffset){l&&(e[++_]=l);continue}if({byteOffset:t,byteLength:n}=o,{byteOffset:r,byteLength:a}=l,t+n<r||r+a<t){l&&(e[++_]=l);continue}e[_]=new Uint8Array(o.buffer,t,r-t+a)}return e}function Pi(c,e,t=0,r=e.byteLength){let n=c.byteLength,a=new Uint8Array(c.buffer,c.byteOffset,n),o=new Uint8Array(e.buffer,e.byteOffset,Math.min(r,n));return a.set(o,t),c}function Je(c,e){let t=nu(c),r=t.reduce((d,f)=>d+f.byteLength,0),n,a,o,l=0,u=-1,_=Math.min(e||Number.POSITIVE_INFINITY,r);for(let d=t.length;++u<d;){if(n=t[u],a=n.subarray(0,Math.min(n.length,_-l)),_<=l+a.length){a.length<n.length?t[u]=n.subarray(a.length):a.length===n.length&&u++,o?Pi(o,a,l):o=a;break}Pi(o||(o=new Uint8Array(_)),a,l),l+=a.length}return[o||new Uint8Array(0),t.slice(u),r-(o?o.byteLength:0)]}function ie(c,e){let t=Mn(e)?e.value:e;return t instanceof c?c===Uint8Array?new c(t.buffer,t.byteOffset,t.byteLength):t:t?(typeof t=="string"&&(t=xt(t)),t instanceof ArrayBuffer?new c(t):t instanceof Sa?new c(t):Ho(t)?ie(c,t.bytes()):ArrayBuffer.isView(t)?t.byteLength<=0?new c(0):new c(t.buffer,t.byteOffset,t.byteLength/c.BYTES_PER_ELEMENT):c.from(t)):new c(0)}var su=c=>ie(Int8Array,c),au=c=>ie(Int16Array,c),Ir=c=>ie(Int32Array,c),Rn=c=>ie(BigInt64Array,c),z=c=>ie(Uint8Array,c),ou=c=>ie(Uint16Array,c),cu=c=>ie(Uint32Array,c),lu=c=>ie(BigUint64Array,c),uu=c=>ie(Float32Array,c),_u=c=>ie(Float64Array,c),du=c=>ie(Uint8ClampedArray,c),ba=c=>(c.next(),c);function*Ct(c,e){let t=function*(n){yield n},r=typeof e=="string"||ArrayBuffer.isView(e)||e instanceof ArrayBuffer||e instanceof Sa?t(e):dt(e)?e:t(e);return yield*Pr(ba(function*(n){let a=null;do a=n.next(yield ie(c,a));while(!a.done)}(r[Symbol.iterator]()))),new c}var fu=c=>Ct(Int8Array,c),pu=c=>Ct(Int16Array,c),mu=c=>Ct(Int32Array,c),wa=c=>Ct(Uint8Array,c),hu=c=>Ct(Uint16Array,c),gu=c=>Ct(Uint32Array,c),vu=c=>Ct(Float32Array,c),yu=c=>Ct(Float64Array,c),bu=c=>Ct(Uint8ClampedArray,c);function ft(c,e){return Ye(this,arguments,function*(){if(_t(e))return yield re(yield re(yield*Pr(ti(ut(ft(c,yield re(e)))))));let r=function(o){return Ye(this,arguments,function*(){yield yield re(yield re(o))})},n=function(o){return Ye(this,arguments,function*(){yield re(yield*Pr(ti(ut(ba(function*(l){let u=null;do u=l.next(yield u==null?void 0:u.value);while(!u.done)}(o[Symbol.iterator]()))))))})},a=typeof e=="string"||ArrayBuffer.isView(e)||e instanceof ArrayBuffer||e instanceof Sa?r(e):dt(e)?n(e):it(e)?e:r(e);return yield re(yield*Pr(ti(ut(ba(function(o){return Ye(this,arguments,function*(){let l=null;do l=yield re(o.next(yield yield re(ie(c,l))));while(!l.done)})}(a[Symbol.asyncIterator]())))))),yield re(new c)})}var Su=c=>ft(Int8Array,c),wu=c=>ft(Int16Array,c),Eu=c=>ft(Int32Array,c),Ea=c=>ft(Uint8Array,c),Au=c=>ft(Uint16Array,c),Lu=c=>ft(Uint32Array,c),ku=c=>ft(Float32Array,c),Du=c=>ft(Float64Array,c),Tu=c=>ft(Uint8ClampedArray,c);function Un(c,e,t){if(c!==0){t=t.slice(0,e);for(let r=-1,n=t.length;++r<n;)t[r]+=c}return t.subarray(0,e)}function Aa(c,e){let t=0,r=c.length;if(r!==e.length)return!1;if(r>0)do if(c[t]!==e[t])return!1;while(++t<r);return!0}var Be={fromIterable(c){return Gn(Fu(c))},fromAsyncIterable(c){return Gn(xu(c))},fromDOMStream(c){return Gn(Cu(c))},fromNodeStream(c){return Gn(Mu(c))},toDOMStream(c,e){throw new Error('"toDOMStream" not available in this environment')},toNodeStream(c,e){throw new Error('"toNodeStream" not available in this environment')}},Gn=c=>(c.next(),c);function*Fu(c){let e,t=!1,r=[],n,a,o,l=0;function u(){return a==="peek"?Je(r,o)[0]:([n,r,l]=Je(r,o),n)}({cmd:a,size:o}=(yield null)||{cmd:"read",size:0});let _=wa(c)[Symbol.iterator]();try{do if({done:e,value:n}=Number.isNaN(o-l)?_.next():_.next(o-l),!e&&n.byteLength>0&&(r.push(n),l+=n.byteLength),e||o<=l)do({cmd:a,size:o}=yield u());while(o<l);while(!e)}catch(d){(t=!0)&&typeof _.throw=="function"&&_.throw(d)}finally{t===!1&&typeof _.return=="function"&&_.return(null)}return null}function xu(c){return Ye(this,arguments,function*(){let t,r=!1,n=[],a,o,l,u=0;function _(){return o==="peek"?Je(n,l)[0]:([a,n,u]=Je(n,l),a)}({cmd:o,size:l}=(yield yield re(null))||{cmd:"read",size:0});let d=Ea(c)[Symbol.asyncIterator]();try{do if({done:t,value:a}=Number.isNaN(l-u)?yield re(d.next()):yield re(d.next(l-u)),!t&&a.byteLength>0&&(n.push(a),u+=a.byteLength),t||l<=u)do({cmd:o,size:l}=yield yield re(_()));while(l<u);while(!t)}catch(f){(r=!0)&&typeof d.throw=="function"&&(yield re(d.throw(f)))}finally{r===!1&&typeof d.return=="function"&&(yield re(d.return(new Uint8Array(0))))}return yield re(null)})}function Cu(c){return Ye(this,arguments,function*(){let t=!1,r=!1,n=[],a,o,l,u=0;function _(){return o==="peek"?Je(n,l)[0]:([a,n,u]=Je(n,l),a)}({cmd:o,size:l}=(yield yield re(null))||{cmd:"read",size:0});let d=new Da(c);try{do if({done:t,value:a}=Number.isNaN(l-u)?yield re(d.read()):yield re(d.read(l-u)),!t&&a.byteLength>0&&(n.push(z(a)),u+=a.byteLength),t||l<=u)do({cmd:o,size:l}=yield yield re(_()));while(l<u);while(!t)}catch(f){(r=!0)&&(yield re(d.cancel(f)))}finally{r===!1?yield re(d.cancel()):c.locked&&d.releaseLock()}return yield re(null)})}var Da=class{constructor(e){this.source=e,this.reader=null,this.reader=this.source.getReader(),this.reader.closed.catch(()=>{})}get closed(){return this.reader?this.reader.closed.catch(()=>{}):Promise.resolve()}releaseLock(){this.reader&&this.reader.releaseLock(),this.reader=null}cancel(e){return B(this,void 0,void 0,function*(){let{reader:t,source:r}=this;t&&(yield t.cancel(e).catch(()=>{})),r&&r.locked&&this.releaseLock()})}read(e){return B(this,void 0,void 0,function*(){if(e===0)return{done:this.reader==null,value:new Uint8Array(0)};let t=yield this.reader.read();return!t.done&&(t.value=z(t)),t})}},ka=(c,e)=>{let t=n=>r([e,n]),r;return[e,t,new Promise(n=>(r=n)&&c.once(e,t))]};function Mu(c){return Ye(this,arguments,function*(){let t=[],r="error",n=!1,a=null,o,l,u=0,_=[],d;function f(){return o==="peek"?Je(_,l)[0]:([d,_,u]=Je(_,l),d)}if({cmd:o,size:l}=(yield yield re(null))||{cmd:"read",size:0},c.isTTY)return yield yield re(new Uint8Array(0)),yield re(null);try{t[0]=ka(c,"end"),t[1]=ka(c,"error");do{if(t[2]=ka(c,"readable"),[r,a]=yield re(Promise.race(t.map(m=>m[2]))),r==="error")break;if((n=r==="end")||(Number.isFinite(l-u)?(d=z(c.read(l-u)),d.byteLength<l-u&&(d=z(c.read()))):d=z(c.read()),d.byteLength>0&&(_.push(d),u+=d.byteLength)),n||l<=u)do({cmd:o,size:l}=yield yield re(f()));while(l<u)}while(!n)}finally{yield re(p(t,r==="error"?a:null))}return yield re(null);function p(m,h){return d=_=null,new Promise((g,v)=>{for(let[y,S]of m)c.off(y,S);try{let y=c.destroy;y&&y.call(c,h),h=void 0}catch(y){h=y||h}finally{h!=null?v(h):g()}})}})}var ue;(function(c){c[c.V1=0]="V1",c[c.V2=1]="V2",c[c.V3=2]="V3",c[c.V4=3]="V4",c[c.V5=4]="V5"})(ue||(ue={}));var he;(function(c){c[c.Sparse=0]="Sparse",c[c.Dense=1]="Dense"})(he||(he={}));var pe;(function(c){c[c.HALF=0]="HALF",c[c.SINGLE=1]="SINGLE",c[c.DOUBLE=2]="DOUBLE"})(pe||(pe={}));var Le;(function(c){c[c.DAY=0]="DAY",c[c.MILLISECOND=1]="MILLISECOND"})(Le||(Le={}));var R;(function(c){c[c.SECOND=0]="SECOND",c[c.MILLISECOND=1]="MILLISECOND",c[c.MICROSECOND=2]="MICROSECOND",c[c.NANOSECOND=3]="NANOSECOND"})(R||(R={}));var Ce;(function(c){c[c.YEAR_MONTH=0]="YEAR_MONTH",c[c.DAY_TIME=1]="DAY_TIME",c[c.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"})(Ce||(Ce={}));var Mt=new Int32Array(2),On=new Float32Array(Mt.buffer),Hn=new Float64Array(Mt.buffer),ri=new Uint16Array(new Uint8Array([1,0]).buffer)[0]===1;var Ii;(function(c){c[c.UTF8_BYTES=1]="UTF8_BYTES",c[c.UTF16_STRING=2]="UTF16_STRING"})(Ii||(Ii={}));var Ke=class c{constructor(e){this.bytes_=e,this.position_=0,this.text_decoder_=new TextDecoder}static allocate(e){return new c(new Uint8Array(e))}clear(){this.position_=0}bytes(){return this.bytes_}position(){return this.position_}setPosition(e){this.position_=e}capacity(){return this.bytes_.length}readInt8(e){return this.readUint8(e)<<24>>24}readUint8(e){return this.bytes_[e]}readInt16(e){return this.readUint16(e)<<16>>16}readUint16(e){return this.bytes_[e]|this.bytes_[e+1]<<8}readInt32(e){return this.bytes_[e]|this.bytes_[e+1]<<8|this.bytes_[e+2]<<16|this.bytes_[e+3]<<24}readUint32(e){return this.readInt32(e)>>>0}readInt64(e){return BigInt.asIntN(64,BigInt(this.readUint32(e))+(BigInt(this.readUint32(e+4))<<BigInt(32)))}readUint64(e){return BigInt.asUintN(64,BigInt(this.readUint32(e))+(BigInt(this.readUint32(e+4))<<BigInt(32)))}readFloat32(e){return Mt[0]=this.readInt32(e),On[0]}readFloat64(e){return Mt[ri?0:1]=this.readInt32(e),Mt[ri?1:0]=this.readInt32(e+4),Hn[0]}writeInt8(e,t){this.bytes_[e]=t}writeUint8(e,t){this.bytes_[e]=t}writeInt16(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8}writeUint16(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8}writeInt32(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8,this.bytes_[e+2]=t>>16,this.bytes_[e+3]=t>>24}writeUint32(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8,this.bytes_[e+2]=t>>16,this.bytes_[e+3]=t>>24}writeInt64(e,t){this.writeInt32(e,Number(BigInt.asIntN(32,t))),this.writeInt32(e+4,Number(BigInt.asIntN(32,t>>BigInt(32))))}writeUint64(e,t){this.writeUint32(e,Number(BigInt.asUintN(32,t))),this.writeUint32(e+4,Number(BigInt.asUintN(32,t>>BigInt(32))))}writeFloat32(e,t){On[0]=t,this.writeInt32(e,Mt[0])}writeFloat64(e,t){Hn[0]=t,this.writeInt32(e,Mt[ri?0:1]),this.writeInt32(e+4,Mt[ri?1:0])}getBufferIdentifier(){if(this.bytes_.length<this.position_+4+4)throw new Error("FlatBuffers: ByteBuffer is too short to contain an identifier.");let e="";for(let t=0;t<4;t++)e+=String.fromCharCode(this.readInt8(this.position_+4+t));return e}__offset(e,t){let r=e-this.readInt32(e);return t<this.readInt16(r)?this.readInt16(r+t):0}__union(e,t){return e.bb_pos=t+this.readInt32(t),e.bb=this,e}__string(e,t){e+=this.readInt32(e);let r=this.readInt32(e);e+=4;let n=this.bytes_.subarray(e,e+r);return t===Ii.UTF8_BYTES?n:this.text_decoder_.decode(n)}__union_with_string(e,t){return typeof e=="string"?this.__string(t):this.__union(e,t)}__indirect(e){return e+this.readInt32(e)}__vector(e){return e+this.readInt32(e)+4}__vector_len(e){return this.readInt32(e+this.readInt32(e))}__has_identifier(e){if(e.length!=4)throw new Error("FlatBuffers: file identifier must be length "+4);for(let t=0;t<4;t++)if(e.charCodeAt(t)!=this.readInt8(this.position()+4+t))return!1;return!0}createScalarList(e,t){let r=[];for(let n=0;n<t;++n){let a=e(n);a!==null&&r.push(a)}return r}createObjList(e,t){let r=[];for(let n=0;n<t;++n){let a=e(n);a!==null&&r.push(a.unpack())}return r}};var Br=class c{constructor(e){this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null,this.text_encoder=new TextEncoder;let t;e?t=e:t=1024,this.bb=Ke.allocate(t),this.space=t}clear(){this.bb.clear(),this.space=this.bb.capacity(),this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1,this.string_maps=null}forceDefaults(e){this.force_defaults=e}dataBuffer(){return this.bb}asUint8Array(){return this.bb.bytes().subarray(this.bb.position(),this.bb.position()+this.offset())}prep(e,t){e>this.minalign&&(this.minalign=e);let r=~(this.bb.capacity()-this.space+t)+1&e-1;for(;this.space<r+e+t;){let n=this.bb.capacity();this.bb=c.growByteBuffer(this.bb),this.space+=this.bb.capacity()-n}this.pad(r)}pad(e){for(let t=0;t<e;t++)this.bb.writeInt8(--this.space,0)}writeInt8(e){this.bb.writeInt8(this.space-=1,e)}writeInt16(e){this.bb.writeInt16(this.space-=2,e)}writeInt32(e){this.bb.writeInt32(this.space-=4,e)}writeInt64(e){this.bb.writeInt64(this.space-=8,e)}writeFloat32(e){this.bb.writeFloat32(this.space-=4,e)}writeFloat64(e){this.bb.writeFloat64(this.space-=8,e)}addInt8(e){this.prep(1,0),this.writeInt8(e)}addInt16(e){this.prep(2,0),this.writeInt16(e)}addInt32(e){this.prep(4,0),this.writeInt32(e)}addInt64(e){this.prep(8,0),this.writeInt64(e)}addFloat32(e){this.prep(4,0),this.writeFloat32(e)}addFloat64(e){this.prep(8,0),this.writeFloat64(e)}addFieldInt8(e,t,r){(this.force_defaults||t!=r)&&(this.addInt8(t),this.slot(e))}addFieldInt16(e,t,r){(this.force_defaults||t!=r)&&(this.addInt16(t),this.slot(e))}addFieldInt32(e,t,r){(this.force_defaults||t!=r)&&(this.addInt32(t),this.slot(e))}addFieldInt64(e,t,r){(this.force_defaults||t!==r)&&(this.addInt64(t),this.slot(e))}addFieldFloat32(e,t,r){(this.force_defaults||t!=r)&&(this.addFloat32(t),this.slot(e))}addFieldFloat64(e,t,r){(this.force_defaults||t!=r)&&(this.addFloat64(t),this.slot(e))}addFieldOffset(e,t,r){(this.force_defaults||t!=r)&&(this.addOffset(t),this.slot(e))}addFieldStruct(e,t,r){t!=r&&(this.nested(t),this.slot(e))}nested(e){if(e!=this.offset())throw new TypeError("FlatBuffers: struct must be serialized inline.")}notNested(){if(this.isNested)throw new TypeError("FlatBuffers: object serialization must not be nested.")}slot(e){this.vtable!==null&&(this.vtable[e]=this.offset())}offset(){return this.bb.capacity()-this.space}static growByteBuffer(e){let t=e.capacity();if(t&3221225472)throw new Error("FlatBuffers: cannot grow buffer beyond 2 gigabytes.");let r=t<<1,n=Ke.allocate(r);return n.setPosition(r-t),n.bytes().set(e.bytes(),r-t),n}addOffset(e){this.prep(4,0),this.writeInt32(this.offset()-e+4)}startObject(e){this.notNested(),this.vtable==null&&(this.vtable=[]),this.vtable_in_use=e;for(let t=0;t<e;t++)this.vtable[t]=0;this.isNested=!0,this.object_start=this.offset()}endObject(){if(this.vtable==null||!this.isNested)throw new Error("FlatBuffers: endObject called without startObject");this.addInt32(0);let e=this.offset(),t=this.vtable_in_use-1;for(;t>=0&&this.vtable[t]==0;t--);let r=t+1;for(;t>=0;t--)this.addInt16(this.vtable[t]!=0?e-this.vtable[t]:0);let n=2;this.addInt16(e-this.object_start);let a=(r+n)*2;this.addInt16(a);let o=0,l=this.space;e:for(t=0;t<this.vtables.length;t++){let u=this.bb.capacity()-this.vtables[t];if(a==this.bb.readInt16(u)){for(let _=2;_<a;_+=2)if(this.bb.readInt16(l+_)!=this.bb.readInt16(u+_))continue e;o=this.vtables[t];break}}return o?(this.space=this.bb.capacity()-e,this.bb.writeInt32(this.space,o-e)):(this.vtables.push(this.offset()),this.bb.writeInt32(this.bb.capacity()-e,this.offset()-e)),this.isNested=!1,e}finish(e,t,r){let n=r?4:0;if(t){let a=t;if(this.prep(this.minalign,8+n),a.length!=4)throw new TypeError("FlatBuffers: file identifier must be length "+4);for(let o=3;o>=0;o--)this.writeInt8(a.charCodeAt(o))}this.prep(this.minalign,4+n),this.addOffset(e),n&&this.addInt32(this.bb.capacity()-this.space),this.bb.setPosition(this.space)}finishSizePrefixed(e,t){this.finish(e,t,!0)}requiredField(e,t){let r=this.bb.capacity()-e,n=r-this.bb.readInt32(r);if(!(t<this.bb.readInt16(n)&&this.bb.readInt16(n+t)!=0))throw new TypeError("FlatBuffers: field "+t+" must be set")}startVector(e,t,r){this.notNested(),this.vector_num_elems=t,this.prep(4,e*t),this.prep(r,e*t)}endVector(){return this.writeInt32(this.vector_num_elems),this.offset()}createSharedString(e){if(!e)return 0;if(this.string_maps||(this.string_maps=new Map),this.string_maps.has(e))return this.string_maps.get(e);let t=this.createString(e);return this.string_maps.set(e,t),t}createString(e){if(e==null)return 0;let t;return e instanceof Uint8Array?t=e:t=this.text_encoder.encode(e),this.addInt8(0),this.startVector(1,t.length,1),this.bb.setPosition(this.space-=t.length),this.bb.bytes().set(t,this.space),this.endVector()}createByteVector(e){return e==null?0:(this.startVector(1,e.length,1),this.bb.setPosition(this.space-=e.length),this.bb.bytes().set(e,this.space),this.endVector())}createObjectOffset(e){return e===null?0:typeof e=="string"?this.createString(e):e.pack(this)}createObjectOffsetList(e){let t=[];for(let r=0;r<e.length;++r){let n=e[r];if(n!==null)t.push(this.createObjectOffset(n));else throw new TypeError("FlatBuffers: Argument for createObjectOffsetList cannot contain null.")}return t}createStructOffsetList(e,t){return t(this,e.length),this.createObjectOffsetList(e.slice().reverse()),this.endVector()}};var Bi;(function(c){c[c.BUFFER=0]="BUFFER"})(Bi||(Bi={}));var ji;(function(c){c[c.LZ4_FRAME=0]="LZ4_FRAME",c[c.ZSTD=1]="ZSTD"})(ji||(ji={}));var Wn=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsBodyCompression(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsBodyCompression(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}codec(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt8(this.bb_pos+e):ji.LZ4_FRAME}method(){let e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt8(this.bb_pos+e):Bi.BUFFER}static startBodyCompression(e){e.startObject(2)}static addCodec(e,t){e.addFieldInt8(0,t,ji.LZ4_FRAME)}static addMethod(e,t){e.addFieldInt8(1,t,Bi.BUFFER)}static endBodyCompression(e){return e.endObject()}static createBodyCompression(e,t,r){return c.startBodyCompression(e),c.addCodec(e,t),c.addMethod(e,r),c.endBodyCompression(e)}};var ii=class{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}offset(){return this.bb.readInt64(this.bb_pos)}length(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createBuffer(e,t,r){return e.prep(8,16),e.writeInt64(BigInt(r!=null?r:0)),e.writeInt64(BigInt(t!=null?t:0)),e.offset()}};var ni=class{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}length(){return this.bb.readInt64(this.bb_pos)}nullCount(){return this.bb.readInt64(this.bb_pos+8)}static sizeOf(){return 16}static createFieldNode(e,t,r){return e.prep(8,16),e.writeInt64(BigInt(r!=null?r:0)),e.writeInt64(BigInt(t!=null?t:0)),e.offset()}};var Ze=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsRecordBatch(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsRecordBatch(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}length(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):BigInt("0")}nodes(e,t){let r=this.bb.__offset(this.bb_pos,6);return r?(t||new ni).__init(this.bb.__vector(this.bb_pos+r)+e*16,this.bb):null}nodesLength(){let e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}buffers(e,t){let r=this.bb.__offset(this.bb_pos,8);return r?(t||new ii).__init(this.bb.__vector(this.bb_pos+r)+e*16,this.bb):null}buffersLength(){let e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}compression(e){let t=this.bb.__offset(this.bb_pos,10);return t?(e||new Wn).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}static startRecordBatch(e){e.startObject(4)}static addLength(e,t){e.addFieldInt64(0,t,BigInt("0"))}static addNodes(e,t){e.addFieldOffset(1,t,0)}static startNodesVector(e,t){e.startVector(16,t,8)}static addBuffers(e,t){e.addFieldOffset(2,t,0)}static startBuffersVector(e,t){e.startVector(16,t,8)}static addCompression(e,t){e.addFieldOffset(3,t,0)}static endRecordBatch(e){return e.endObject()}};var Ht=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDictionaryBatch(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDictionaryBatch(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}id(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):BigInt("0")}data(e){let t=this.bb.__offset(this.bb_pos,6);return t?(e||new Ze).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}isDelta(){let e=this.bb.__offset(this.bb_pos,8);return e?!!this.bb.readInt8(this.bb_pos+e):!1}static startDictionaryBatch(e){e.startObject(3)}static addId(e,t){e.addFieldInt64(0,t,BigInt("0"))}static addData(e,t){e.addFieldOffset(1,t,0)}static addIsDelta(e,t){e.addFieldInt8(2,+t,0)}static endDictionaryBatch(e){return e.endObject()}};var hr;(function(c){c[c.Little=0]="Little",c[c.Big=1]="Big"})(hr||(hr={}));var Ri;(function(c){c[c.DenseArray=0]="DenseArray"})(Ri||(Ri={}));var mt=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsInt(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsInt(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}bitWidth(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}isSigned(){let e=this.bb.__offset(this.bb_pos,6);return e?!!this.bb.readInt8(this.bb_pos+e):!1}static startInt(e){e.startObject(2)}static addBitWidth(e,t){e.addFieldInt32(0,t,0)}static addIsSigned(e,t){e.addFieldInt8(1,+t,0)}static endInt(e){return e.endObject()}static createInt(e,t,r){return c.startInt(e),c.addBitWidth(e,t),c.addIsSigned(e,r),c.endInt(e)}};var Pt=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDictionaryEncoding(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDictionaryEncoding(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}id(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):BigInt("0")}indexType(e){let t=this.bb.__offset(this.bb_pos,6);return t?(e||new mt).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}isOrdered(){let e=this.bb.__offset(this.bb_pos,8);return e?!!this.bb.readInt8(this.bb_pos+e):!1}dictionaryKind(){let e=this.bb.__offset(this.bb_pos,10);return e?this.bb.readInt16(this.bb_pos+e):Ri.DenseArray}static startDictionaryEncoding(e){e.startObject(4)}static addId(e,t){e.addFieldInt64(0,t,BigInt("0"))}static addIndexType(e,t){e.addFieldOffset(1,t,0)}static addIsOrdered(e,t){e.addFieldInt8(2,+t,0)}static addDictionaryKind(e,t){e.addFieldInt16(3,t,Ri.DenseArray)}static endDictionaryEncoding(e){return e.endObject()}};var Me=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsKeyValue(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsKeyValue(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}key(e){let t=this.bb.__offset(this.bb_pos,4);return t?this.bb.__string(this.bb_pos+t,e):null}value(e){let t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__string(this.bb_pos+t,e):null}static startKeyValue(e){e.startObject(2)}static addKey(e,t){e.addFieldOffset(0,t,0)}static addValue(e,t){e.addFieldOffset(1,t,0)}static endKeyValue(e){return e.endObject()}static createKeyValue(e,t,r){return c.startKeyValue(e),c.addKey(e,t),c.addValue(e,r),c.endKeyValue(e)}};var Ui=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsBinary(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsBinary(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static startBinary(e){e.startObject(0)}static endBinary(e){return e.endObject()}static createBinary(e){return c.startBinary(e),c.endBinary(e)}};var Gi=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsBool(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsBool(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static startBool(e){e.startObject(0)}static endBool(e){return e.endObject()}static createBool(e){return c.startBool(e),c.endBool(e)}};var gr=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDate(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDate(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}unit(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Le.MILLISECOND}static startDate(e){e.startObject(1)}static addUnit(e,t){e.addFieldInt16(0,t,Le.MILLISECOND)}static endDate(e){return e.endObject()}static createDate(e,t){return c.startDate(e),c.addUnit(e,t),c.endDate(e)}};var It=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDecimal(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDecimal(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}precision(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}scale(){let e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb_pos+e):0}bitWidth(){let e=this.bb.__offset(this.bb_pos,8);return e?this.bb.readInt32(this.bb_pos+e):128}static startDecimal(e){e.startObject(3)}static addPrecision(e,t){e.addFieldInt32(0,t,0)}static addScale(e,t){e.addFieldInt32(1,t,0)}static addBitWidth(e,t){e.addFieldInt32(2,t,128)}static endDecimal(e){return e.endObject()}static createDecimal(e,t,r,n){return c.startDecimal(e),c.addPrecision(e,t),c.addScale(e,r),c.addBitWidth(e,n),c.endDecimal(e)}};var vr=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsDuration(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsDuration(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}unit(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):R.MILLISECOND}static startDuration(e){e.startObject(1)}static addUnit(e,t){e.addFieldInt16(0,t,R.MILLISECOND)}static endDuration(e){return e.endObject()}static createDuration(e,t){return c.startDuration(e),c.addUnit(e,t),c.endDuration(e)}};var yr=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFixedSizeBinary(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFixedSizeBinary(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}byteWidth(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}static startFixedSizeBinary(e){e.startObject(1)}static addByteWidth(e,t){e.addFieldInt32(0,t,0)}static endFixedSizeBinary(e){return e.endObject()}static createFixedSizeBinary(e,t){return c.startFixedSizeBinary(e),c.addByteWidth(e,t),c.endFixedSizeBinary(e)}};var br=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFixedSizeList(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFixedSizeList(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}listSize(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}static startFixedSizeList(e){e.startObject(1)}static addListSize(e,t){e.addFieldInt32(0,t,0)}static endFixedSizeList(e){return e.endObject()}static createFixedSizeList(e,t){return c.startFixedSizeList(e),c.addListSize(e,t),c.endFixedSizeList(e)}};var Sr=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFloatingPoint(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFloatingPoint(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}precision(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):pe.HALF}static startFloatingPoint(e){e.startObject(1)}static addPrecision(e,t){e.addFieldInt16(0,t,pe.HALF)}static endFloatingPoint(e){return e.endObject()}static createFloatingPoint(e,t){return c.startFloatingPoint(e),c.addPrecision(e,t),c.endFloatingPoint(e)}};var wr=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsInterval(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsInterval(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}unit(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Ce.YEAR_MONTH}static startInterval(e){e.startObject(1)}static addUnit(e,t){e.addFieldInt16(0,t,Ce.YEAR_MONTH)}static endInterval(e){return e.endObject()}static createInterval(e,t){return c.startInterval(e),c.addUnit(e,t),c.endInterval(e)}};var Oi=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsLargeBinary(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsLargeBinary(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static startLargeBinary(e){e.startObject(0)}static endLargeBinary(e){return e.endObject()}static createLargeBinary(e){return c.startLargeBinary(e),c.endLargeBinary(e)}};var Hi=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsLargeUtf8(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsLargeUtf8(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static startLargeUtf8(e){e.startObject(0)}static endLargeUtf8(e){return e.endObject()}static createLargeUtf8(e){return c.startLargeUtf8(e),c.endLargeUtf8(e)}};var Ni=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsList(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsList(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static startList(e){e.startObject(0)}static endList(e){return e.endObject()}static createList(e){return c.startList(e),c.endList(e)}};var Er=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsMap(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsMap(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}keysSorted(){let e=this.bb.__offset(this.bb_pos,4);return e?!!this.bb.readInt8(this.bb_pos+e):!1}static startMap(e){e.startObject(1)}static addKeysSorted(e,t){e.addFieldInt8(0,+t,0)}static endMap(e){return e.endObject()}static createMap(e,t){return c.startMap(e),c.addKeysSorted(e,t),c.endMap(e)}};var Wi=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsNull(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsNull(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static startNull(e){e.startObject(0)}static endNull(e){return e.endObject()}static createNull(e){return c.startNull(e),c.endNull(e)}};var Vi=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsStruct_(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsStruct_(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static startStruct_(e){e.startObject(0)}static endStruct_(e){return e.endObject()}static createStruct_(e){return c.startStruct_(e),c.endStruct_(e)}};var Nt=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsTime(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsTime(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}unit(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):R.MILLISECOND}bitWidth(){let e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb_pos+e):32}static startTime(e){e.startObject(2)}static addUnit(e,t){e.addFieldInt16(0,t,R.MILLISECOND)}static addBitWidth(e,t){e.addFieldInt32(1,t,32)}static endTime(e){return e.endObject()}static createTime(e,t,r){return c.startTime(e),c.addUnit(e,t),c.addBitWidth(e,r),c.endTime(e)}};var Wt=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsTimestamp(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsTimestamp(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}unit(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):R.SECOND}timezone(e){let t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__string(this.bb_pos+t,e):null}static startTimestamp(e){e.startObject(2)}static addUnit(e,t){e.addFieldInt16(0,t,R.SECOND)}static addTimezone(e,t){e.addFieldOffset(1,t,0)}static endTimestamp(e){return e.endObject()}static createTimestamp(e,t,r){return c.startTimestamp(e),c.addUnit(e,t),c.addTimezone(e,r),c.endTimestamp(e)}};var ht=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsUnion(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsUnion(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}mode(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):he.Sparse}typeIds(e){let t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt32(this.bb.__vector(this.bb_pos+t)+e*4):0}typeIdsLength(){let e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}typeIdsArray(){let e=this.bb.__offset(this.bb_pos,6);return e?new Int32Array(this.bb.bytes().buffer,this.bb.bytes().byteOffset+this.bb.__vector(this.bb_pos+e),this.bb.__vector_len(this.bb_pos+e)):null}static startUnion(e){e.startObject(2)}static addMode(e,t){e.addFieldInt16(0,t,he.Sparse)}static addTypeIds(e,t){e.addFieldOffset(1,t,0)}static createTypeIdsVector(e,t){e.startVector(4,t.length,4);for(let r=t.length-1;r>=0;r--)e.addInt32(t[r]);return e.endVector()}static startTypeIdsVector(e,t){e.startVector(4,t,4)}static endUnion(e){return e.endObject()}static createUnion(e,t,r){return c.startUnion(e),c.addMode(e,t),c.addTypeIds(e,r),c.endUnion(e)}};var zi=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsUtf8(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsUtf8(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static startUtf8(e){e.startObject(0)}static endUtf8(e){return e.endObject()}static createUtf8(e){return c.startUtf8(e),c.endUtf8(e)}};var ge;(function(c){c[c.NONE=0]="NONE",c[c.Null=1]="Null",c[c.Int=2]="Int",c[c.FloatingPoint=3]="FloatingPoint",c[c.Binary=4]="Binary",c[c.Utf8=5]="Utf8",c[c.Bool=6]="Bool",c[c.Decimal=7]="Decimal",c[c.Date=8]="Date",c[c.Time=9]="Time",c[c.Timestamp=10]="Timestamp",c[c.Interval=11]="Interval",c[c.List=12]="List",c[c.Struct_=13]="Struct_",c[c.Union=14]="Union",c[c.FixedSizeBinary=15]="FixedSizeBinary",c[c.FixedSizeList=16]="FixedSizeList",c[c.Map=17]="Map",c[c.Duration=18]="Duration",c[c.LargeBinary=19]="LargeBinary",c[c.LargeUtf8=20]="LargeUtf8",c[c.LargeList=21]="LargeList",c[c.RunEndEncoded=22]="RunEndEncoded"})(ge||(ge={}));var Ge=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsField(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsField(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}name(e){let t=this.bb.__offset(this.bb_pos,4);return t?this.bb.__string(this.bb_pos+t,e):null}nullable(){let e=this.bb.__offset(this.bb_pos,6);return e?!!this.bb.readInt8(this.bb_pos+e):!1}typeType(){let e=this.bb.__offset(this.bb_pos,8);return e?this.bb.readUint8(this.bb_pos+e):ge.NONE}type(e){let t=this.bb.__offset(this.bb_pos,10);return t?this.bb.__union(e,this.bb_pos+t):null}dictionary(e){let t=this.bb.__offset(this.bb_pos,12);return t?(e||new Pt).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}children(e,t){let r=this.bb.__offset(this.bb_pos,14);return r?(t||new c).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+r)+e*4),this.bb):null}childrenLength(){let e=this.bb.__offset(this.bb_pos,14);return e?this.bb.__vector_len(this.bb_pos+e):0}customMetadata(e,t){let r=this.bb.__offset(this.bb_pos,16);return r?(t||new Me).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+r)+e*4),this.bb):null}customMetadataLength(){let e=this.bb.__offset(this.bb_pos,16);return e?this.bb.__vector_len(this.bb_pos+e):0}static startField(e){e.startObject(7)}static addName(e,t){e.addFieldOffset(0,t,0)}static addNullable(e,t){e.addFieldInt8(1,+t,0)}static addTypeType(e,t){e.addFieldInt8(2,t,ge.NONE)}static addType(e,t){e.addFieldOffset(3,t,0)}static addDictionary(e,t){e.addFieldOffset(4,t,0)}static addChildren(e,t){e.addFieldOffset(5,t,0)}static createChildrenVector(e,t){e.startVector(4,t.length,4);for(let r=t.length-1;r>=0;r--)e.addOffset(t[r]);return e.endVector()}static startChildrenVector(e,t){e.startVector(4,t,4)}static addCustomMetadata(e,t){e.addFieldOffset(6,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let r=t.length-1;r>=0;r--)e.addOffset(t[r]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static endField(e){return e.endObject()}};var Ve=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsSchema(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsSchema(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}endianness(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):hr.Little}fields(e,t){let r=this.bb.__offset(this.bb_pos,6);return r?(t||new Ge).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+r)+e*4),this.bb):null}fieldsLength(){let e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}customMetadata(e,t){let r=this.bb.__offset(this.bb_pos,8);return r?(t||new Me).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+r)+e*4),this.bb):null}customMetadataLength(){let e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}features(e){let t=this.bb.__offset(this.bb_pos,10);return t?this.bb.readInt64(this.bb.__vector(this.bb_pos+t)+e*8):BigInt(0)}featuresLength(){let e=this.bb.__offset(this.bb_pos,10);return e?this.bb.__vector_len(this.bb_pos+e):0}static startSchema(e){e.startObject(4)}static addEndianness(e,t){e.addFieldInt16(0,t,hr.Little)}static addFields(e,t){e.addFieldOffset(1,t,0)}static createFieldsVector(e,t){e.startVector(4,t.length,4);for(let r=t.length-1;r>=0;r--)e.addOffset(t[r]);return e.endVector()}static startFieldsVector(e,t){e.startVector(4,t,4)}static addCustomMetadata(e,t){e.addFieldOffset(2,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let r=t.length-1;r>=0;r--)e.addOffset(t[r]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static addFeatures(e,t){e.addFieldOffset(3,t,0)}static createFeaturesVector(e,t){e.startVector(8,t.length,8);for(let r=t.length-1;r>=0;r--)e.addInt64(t[r]);return e.endVector()}static startFeaturesVector(e,t){e.startVector(8,t,8)}static endSchema(e){return e.endObject()}static finishSchemaBuffer(e,t){e.finish(t)}static finishSizePrefixedSchemaBuffer(e,t){e.finish(t,void 0,!0)}static createSchema(e,t,r,n,a){return c.startSchema(e),c.addEndianness(e,t),c.addFields(e,r),c.addCustomMetadata(e,n),c.addFeatures(e,a),c.endSchema(e)}};var se;(function(c){c[c.NONE=0]="NONE",c[c.Schema=1]="Schema",c[c.DictionaryBatch=2]="DictionaryBatch",c[c.RecordBatch=3]="RecordBatch",c[c.Tensor=4]="Tensor",c[c.SparseTensor=5]="SparseTensor"})(se||(se={}));var b;(function(c){c[c.NONE=0]="NONE",c[c.Null=1]="Null",c[c.Int=2]="Int",c[c.Float=3]="Float",c[c.Binary=4]="Binary",c[c.Utf8=5]="Utf8",c[c.Bool=6]="Bool",c[c.Decimal=7]="Decimal",c[c.Date=8]="Date",c[c.Time=9]="Time",c[c.Timestamp=10]="Timestamp",c[c.Interval=11]="Interval",c[c.List=12]="List",c[c.Struct=13]="Struct",c[c.Union=14]="Union",c[c.FixedSizeBinary=15]="FixedSizeBinary",c[c.FixedSizeList=16]="FixedSizeList",c[c.Map=17]="Map",c[c.Duration=18]="Duration",c[c.LargeBinary=19]="LargeBinary",c[c.LargeUtf8=20]="LargeUtf8",c[c.Dictionary=-1]="Dictionary",c[c.Int8=-2]="Int8",c[c.Int16=-3]="Int16",c[c.Int32=-4]="Int32",c[c.Int64=-5]="Int64",c[c.Uint8=-6]="Uint8",c[c.Uint16=-7]="Uint16",c[c.Uint32=-8]="Uint32",c[c.Uint64=-9]="Uint64",c[c.Float16=-10]="Float16",c[c.Float32=-11]="Float32",c[c.Float64=-12]="Float64",c[c.DateDay=-13]="DateDay",c[c.DateMillisecond=-14]="DateMillisecond",c[c.TimestampSecond=-15]="TimestampSecond",c[c.TimestampMillisecond=-16]="TimestampMillisecond",c[c.TimestampMicrosecond=-17]="TimestampMicrosecond",c[c.TimestampNanosecond=-18]="TimestampNanosecond",c[c.TimeSecond=-19]="TimeSecond",c[c.TimeMillisecond=-20]="TimeMillisecond",c[c.TimeMicrosecond=-21]="TimeMicrosecond",c[c.TimeNanosecond=-22]="TimeNanosecond",c[c.DenseUnion=-23]="DenseUnion",c[c.SparseUnion=-24]="SparseUnion",c[c.IntervalDayTime=-25]="IntervalDayTime",c[c.IntervalYearMonth=-26]="IntervalYearMonth",c[c.DurationSecond=-27]="DurationSecond",c[c.DurationMillisecond=-28]="DurationMillisecond",c[c.DurationMicrosecond=-29]="DurationMicrosecond",c[c.DurationNanosecond=-30]="DurationNanosecond"})(b||(b={}));var st;(function(c){c[c.OFFSET=0]="OFFSET",c[c.DATA=1]="DATA",c[c.VALIDITY=2]="VALIDITY",c[c.TYPE=3]="TYPE"})(st||(st={}));var qa={};mr(qa,{clampRange:()=>Qi,createElementComparator:()=>Dr,wrapIndex:()=>jr});var Ta={};mr(Ta,{valueToString:()=>gt});function gt(c){if(c===null)return"null";if(c===void 0)return"undefined";switch(typeof c){case"number":return"".concat(c);case"bigint":return"".concat(c);case"string":return'"'.concat(c,'"')}return typeof c[Symbol.toPrimitive]=="function"?c[Symbol.toPrimitive]("string"):ArrayBuffer.isView(c)?c instanceof BigInt64Array||c instanceof BigUint64Array?"[".concat([...c].map(e=>gt(e)),"]"):"[".concat(c,"]"):ArrayBuffer.isView(c)?"[".concat(c,"]"):JSON.stringify(c,(e,t)=>typeof t=="bigint"?"".concat(t):t)}var Ma={};mr(Ma,{BN:()=>qi,bigNumToBigInt:()=>Wo,bigNumToNumber:()=>Ca,bigNumToString:()=>oi,isArrowBigNumSymbol:()=>No});function oe(c){if(typeof c=="bigint"&&(c<Number.MIN_SAFE_INTEGER||c>Number.MAX_SAFE_INTEGER))throw new TypeError("".concat(c," is not safe to convert to a number."));return Number(c)}function Fa(c,e){return oe(c/e)+oe(c%e)/oe(e)}var No=Symbol.for("isArrowBigNum");function vt(c,...e){return e.length===0?Object.setPrototypeOf(ie(this.TypedArray,c),this.constructor.prototype):Object.setPrototypeOf(new this.TypedArray(c,...e),this.constructor.prototype)}vt.prototype[No]=!0;vt.prototype.toJSON=function(){return'"'.concat(oi(this),'"')};vt.prototype.valueOf=function(c){return Ca(this,c)};vt.prototype.toString=function(){return oi(this)};vt.prototype[Symbol.toPrimitive]=function(c="default"){switch(c){case"number":return Ca(this);case"string":return oi(this);case"default":return Wo(this)}return oi(this)};function si(...c){return vt.apply(this,c)}function ai(...c){return vt.apply(this,c)}function $i(...c){return vt.apply(this,c)}Object.setPrototypeOf(si.prototype,Object.create(Int32Array.prototype));Object.setPrototypeOf(ai.prototype,Object.create(Uint32Array.prototype));Object.setPrototypeOf($i.prototype,Object.create(Uint32Array.prototype));Object.assign(si.prototype,vt.prototype,{constructor:si,signed:!0,TypedArray:Int32Array,BigIntArray:BigInt64Array});Object.assign(ai.prototype,vt.prototype,{constructor:ai,signed:!1,TypedArray:Uint32Array,BigIntArray:BigUint64Array});Object.assign($i.prototype,vt.prototype,{constructor:$i,signed:!0,TypedArray:Uint32Array,BigIntArray:BigUint64Array});var Pu=BigInt(4294967296)*BigInt(4294967296),Iu=Pu-BigInt(1);function Ca(c,e){let{buffer:t,byteOffset:r,byteLength:n,signed:a}=c,o=new BigUint64Array(t,r,n/8),l=a&&o.at(-1)&BigInt(1)<<BigInt(63),u=BigInt(0),_=0;if(l){for(let d of o)u|=(d^Iu)*(BigInt(1)<<BigInt(64*_++));u*=BigInt(-1),u-=BigInt(1)}else for(let d of o)u|=d*(BigInt(1)<<BigInt(64*_++));if(typeof e=="number"){let d=BigInt(Math.pow(10,e)),f=u/d,p=u%d;return oe(f)+oe(p)/oe(d)}return oe(u)}function oi(c){if(c.byteLength===8){let a=new c.BigIntArray(c.buffer,c.byteOffset,1);return"".concat(a[0])}if(!c.signed)return xa(c);let e=new Uint16Array(c.buffer,c.byteOffset,c.byteLength/2);if(new Int16Array([e.at(-1)])[0]>=0)return xa(c);e=e.slice();let r=1;for(let a=0;a<e.length;a++){let o=e[a],l=~o+r;e[a]=l,r&=o===0?1:0}let n=xa(e);return"-".concat(n)}function Wo(c){return c.byteLength===8?new c.BigIntArray(c.buffer,c.byteOffset,1)[0]:oi(c)}function xa(c){let e="",t=new Uint32Array(2),r=new Uint16Array(c.buffer,c.byteOffset,c.byteLength/2),n=new Uint32Array((r=new Uint16Array(r).reverse()).buffer),a=-1,o=r.length-1;do{for(t[0]=r[a=0];a<o;)r[a++]=t[1]=t[0]/10,t[0]=(t[0]-t[1]*10<<16)+r[a];r[a]=t[1]=t[0]/10,t[0]=t[0]-t[1]*10,e="".concat(t[0]).concat(e)}while(n[0]||n[1]||n[2]||n[3]);return e!=null?e:"0"}var qi=class c{static new(e,t){switch(t){case!0:return new si(e);case!1:return new ai(e)}switch(e.constructor){case Int8Array:case Int16Array:case Int32Array:case BigInt64Array:return new si(e)}return e.byteLength===16?new $i(e):new ai(e)}static signed(e){return new si(e)}static unsigned(e){return new ai(e)}static decimal(e){return new $i(e)}constructor(e,t){return c.new(e,t)}};var Vo,zo,$o,qo,Xo,Qo,Yo,Jo,Ko,Zo,ec,tc,rc,ic,nc,sc,ac,oc,cc,lc,uc,_c,j=class c{static isNull(e){return(e==null?void 0:e.typeId)===b.Null}static isInt(e){return(e==null?void 0:e.typeId)===b.Int}static isFloat(e){return(e==null?void 0:e.typeId)===b.Float}static isBinary(e){return(e==null?void 0:e.typeId)===b.Binary}static isLargeBinary(e){return(e==null?void 0:e.typeId)===b.LargeBinary}static isUtf8(e){return(e==null?void 0:e.typeId)===b.Utf8}static isLargeUtf8(e){return(e==null?void 0:e.typeId)===b.LargeUtf8}static isBool(e){return(e==null?void 0:e.typeId)===b.Bool}static isDecimal(e){return(e==null?void 0:e.typeId)===b.Decimal}static isDate(e){return(e==null?void 0:e.typeId)===b.Date}static isTime(e){return(e==null?void 0:e.typeId)===b.Time}static isTimestamp(e){return(e==null?void 0:e.typeId)===b.Timestamp}static isInterval(e){return(e==null?void 0:e.typeId)===b.Interval}static isDuration(e){return(e==null?void 0:e.typeId)===b.Duration}static isList(e){return(e==null?void 0:e.typeId)===b.List}static isStruct(e){return(e==null?void 0:e.typeId)===b.Struct}static isUnion(e){return(e==null?void 0:e.typeId)===b.Union}static isFixedSizeBinary(e){return(e==null?void 0:e.typeId)===b.FixedSizeBinary}static isFixedSizeList(e){return(e==null?void 0:e.typeId)===b.FixedSizeList}static isMap(e){return(e==null?void 0:e.typeId)===b.Map}static isDictionary(e){return(e==null?void 0:e.typeId)===b.Dictionary}static isDenseUnion(e){return c.isUnion(e)&&e.mode===he.Dense}static isSparseUnion(e){return c.isUnion(e)&&e.mode===he.Sparse}constructor(e){this.typeId=e}};Vo=Symbol.toStringTag;j[Vo]=(c=>(c.children=null,c.ArrayType=Array,c.OffsetArrayType=Int32Array,c[Symbol.toStringTag]="DataType"))(j.prototype);var He=class extends j{constructor(){super(b.Null)}toString(){return"Null"}};zo=Symbol.toStringTag;He[zo]=(c=>c[Symbol.toStringTag]="Null")(He.prototype);var Pe=class extends j{constructor(e,t){super(b.Int),this.isSigned=e,this.bitWidth=t}get ArrayType(){switch(this.bitWidth){case 8:return this.isSigned?Int8Array:Uint8Array;case 16:return this.isSigned?Int16Array:Uint16Array;case 32:return this.isSigned?Int32Array:Uint32Array;case 64:return this.isSigned?BigInt64Array:BigUint64Array}throw new Error("Unrecognized ".concat(this[Symbol.toStringTag]," type"))}toString(){return"".concat(this.isSigned?"I":"Ui","nt").concat(this.bitWidth)}};$o=Symbol.toStringTag;Pe[$o]=(c=>(c.isSigned=null,c.bitWidth=null,c[Symbol.toStringTag]="Int"))(Pe.prototype);var Vn=class extends Pe{constructor(){super(!0,8)}get ArrayType(){return Int8Array}},zn=class extends Pe{constructor(){super(!0,16)}get ArrayType(){return Int16Array}},Bt=class extends Pe{constructor(){super(!0,32)}get ArrayType(){return Int32Array}},$n=class extends Pe{constructor(){super(!0,64)}get ArrayType(){return BigInt64Array}},qn=class extends Pe{constructor(){super(!1,8)}get ArrayType(){return Uint8Array}},Xn=class extends Pe{constructor(){super(!1,16)}get ArrayType(){return Uint16Array}},Qn=class extends Pe{constructor(){super(!1,32)}get ArrayType(){return Uint32Array}},Yn=class extends Pe{constructor(){super(!1,64)}get ArrayType(){return BigUint64Array}};Object.defineProperty(Vn.prototype,"ArrayType",{value:Int8Array});Object.defineProperty(zn.prototype,"ArrayType",{value:Int16Array});Object.defineProperty(Bt.prototype,"ArrayType",{value:Int32Array});Object.defineProperty($n.prototype,"ArrayType",{value:BigInt64Array});Object.defineProperty(qn.prototype,"ArrayType",{value:Uint8Array});Object.defineProperty(Xn.prototype,"ArrayType",{value:Uint16Array});Object.defineProperty(Qn.prototype,"ArrayType",{value:Uint32Array});Object.defineProperty(Yn.prototype,"ArrayType",{value:BigUint64Array});var at=class extends j{constructor(e){super(b.Float),this.precision=e}get ArrayType(){switch(this.precision){case pe.HALF:return Uint16Array;case pe.SINGLE:return Float32Array;case pe.DOUBLE:return Float64Array}throw new Error("Unrecognized ".concat(this[Symbol.toStringTag]," type"))}toString(){return"Float".concat(this.precision<<5||16)}};qo=Symbol.toStringTag;at[qo]=(c=>(c.precision=null,c[Symbol.toStringTag]="Float"))(at.prototype);var Jn=class extends at{constructor(){super(pe.HALF)}},Kn=class extends at{constructor(){super(pe.SINGLE)}},Zn=class extends at{constructor(){super(pe.DOUBLE)}};Object.defineProperty(Jn.prototype,"ArrayType",{value:Uint16Array});Object.defineProperty(Kn.prototype,"ArrayType",{value:Float32Array});Object.defineProperty(Zn.prototype,"ArrayType",{value:Float64Array});var Vt=class extends j{constructor(){super(b.Binary)}toString(){return"Binary"}};Xo=Symbol.toStringTag;Vt[Xo]=(c=>(c.ArrayType=Uint8Array,c[Symbol.toStringTag]="Binary"))(Vt.prototype);var zt=class extends j{constructor(){super(b.LargeBinary)}toString(){return"LargeBinary"}};Qo=Symbol.toStringTag;zt[Qo]=(c=>(c.ArrayType=Uint8Array,c.OffsetArrayType=BigInt64Array,c[Symbol.toStringTag]="LargeBinary"))(zt.prototype);var $t=class extends j{constructor(){super(b.Utf8)}toString(){return"Utf8"}};Yo=Symbol.toStringTag;$t[Yo]=(c=>(c.ArrayType=Uint8Array,c[Symbol.toStringTag]="Utf8"))($t.prototype);var qt=class extends j{constructor(){super(b.LargeUtf8)}toString(){return"LargeUtf8"}};Jo=Symbol.toStringTag;qt[Jo]=(c=>(c.ArrayType=Uint8Array,c.OffsetArrayType=BigInt64Array,c[Symbol.toStringTag]="LargeUtf8"))(qt.prototype);var Xt=class extends j{constructor(){super(b.Bool)}toString(){return"Bool"}};Ko=Symbol.toStringTag;Xt[Ko]=(c=>(c.ArrayType=Uint8Array,c[Symbol.toStringTag]="Bool"))(Xt.prototype);var Qt=class extends j{constructor(e,t,r=128){super(b.Decimal),this.scale=e,this.precision=t,this.bitWidth=r}toString(){return"Decimal[".concat(this.precision,"e").concat(this.scale>0?"+":"").concat(this.scale,"]")}};Zo=Symbol.toStringTag;Qt[Zo]=(c=>(c.scale=null,c.precision=null,c.ArrayType=Uint32Array,c[Symbol.toStringTag]="Decimal"))(Qt.prototype);var Yt=class extends j{constructor(e){super(b.Date),this.unit=e}toString(){return"Date".concat((this.unit+1)*32,"<").concat(Le[this.unit],">")}get ArrayType(){return this.unit===Le.DAY?Int32Array:BigInt64Array}};ec=Symbol.toStringTag;Yt[ec]=(c=>(c.unit=null,c[Symbol.toStringTag]="Date"))(Yt.prototype);var Jt=class extends j{constructor(e,t){super(b.Time),this.unit=e,this.bitWidth=t}toString(){return"Time".concat(this.bitWidth,"<").concat(R[this.unit],">")}get ArrayType(){switch(this.bitWidth){case 32:return Int32Array;case 64:return BigInt64Array}throw new Error("Unrecognized ".concat(this[Symbol.toStringTag]," type"))}};tc=Symbol.toStringTag;Jt[tc]=(c=>(c.unit=null,c.bitWidth=null,c[Symbol.toStringTag]="Time"))(Jt.prototype);var Kt=class extends j{constructor(e,t){super(b.Timestamp),this.unit=e,this.timezone=t}toString(){return"Timestamp<".concat(R[this.unit]).concat(this.timezone?", ".concat(this.timezone):"",">")}};rc=Symbol.toStringTag;Kt[rc]=(c=>(c.unit=null,c.timezone=null,c.ArrayType=BigInt64Array,c[Symbol.toStringTag]="Timestamp"))(Kt.prototype);var Zt=class extends j{constructor(e){super(b.Interval),this.unit=e}toString(){return"Interval<".concat(Ce[this.unit],">")}};ic=Symbol.toStringTag;Zt[ic]=(c=>(c.unit=null,c.ArrayType=Int32Array,c[Symbol.toStringTag]="Interval"))(Zt.prototype);var er=class extends j{constructor(e){super(b.Duration),this.unit=e}toString(){return"Duration<".concat(R[this.unit],">")}};nc=Symbol.toStringTag;er[nc]=(c=>(c.unit=null,c.ArrayType=BigInt64Array,c[Symbol.toStringTag]="Duration"))(er.prototype);var yt=class extends j{constructor(e){super(b.List),this.children=[e]}toString(){return"List<".concat(this.valueType,">")}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}};sc=Symbol.toStringTag;yt[sc]=(c=>(c.children=null,c[Symbol.toStringTag]="List"))(yt.prototype);var ye=class extends j{constructor(e){super(b.Struct),this.children=e}toString(){return"Struct<{".concat(this.children.map(e=>"".concat(e.name,":").concat(e.type)).join(", "),"}>")}};ac=Symbol.toStringTag;ye[ac]=(c=>(c.children=null,c[Symbol.toStringTag]="Struct"))(ye.prototype);var bt=class extends j{constructor(e,t,r){super(b.Union),this.mode=e,this.children=r,this.typeIds=t=Int32Array.from(t),this.typeIdToChildIndex=t.reduce((n,a,o)=>(n[a]=o)&&n||n,Object.create(null))}toString(){return"".concat(this[Symbol.toStringTag],"<").concat(this.children.map(e=>"".concat(e.type)).join(" | "),">")}};oc=Symbol.toStringTag;bt[oc]=(c=>(c.mode=null,c.typeIds=null,c.children=null,c.typeIdToChildIndex=null,c.ArrayType=Int8Array,c[Symbol.toStringTag]="Union"))(bt.prototype);var tr=class extends j{constructor(e){super(b.FixedSizeBinary),this.byteWidth=e}toString(){return"FixedSizeBinary[".concat(this.byteWidth,"]")}};cc=Symbol.toStringTag;tr[cc]=(c=>(c.byteWidth=null,c.ArrayType=Uint8Array,c[Symbol.toStringTag]="FixedSizeBinary"))(tr.prototype);var St=class extends j{constructor(e,t){super(b.FixedSizeList),this.listSize=e,this.children=[t]}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}toString(){return"FixedSizeList[".concat(this.listSize,"]<").concat(this.valueType,">")}};lc=Symbol.toStringTag;St[lc]=(c=>(c.children=null,c.listSize=null,c[Symbol.toStringTag]="FixedSizeList"))(St.prototype);var wt=class extends j{constructor(e,t=!1){var r,n,a;if(super(b.Map),this.children=[e],this.keysSorted=t,e&&(e.name="entries",!((r=e==null?void 0:e.type)===null||r===void 0)&&r.children)){let o=(n=e==null?void 0:e.type)===null||n===void 0?void 0:n.children[0];o&&(o.name="key");let l=(a=e==null?void 0:e.type)===null||a===void 0?void 0:a.children[1];l&&(l.name="value")}}get keyType(){return this.children[0].type.children[0].type}get valueType(){return this.children[0].type.children[1].type}get childType(){return this.children[0].type}toString(){return"Map<{".concat(this.children[0].type.children.map(e=>"".concat(e.name,":").concat(e.type)).join(", "),"}>")}};uc=Symbol.toStringTag;wt[uc]=(c=>(c.children=null,c.keysSorted=null,c[Symbol.toStringTag]="Map_"))(wt.prototype);var Bu=(c=>()=>++c)(-1),et=class extends j{constructor(e,t,r,n){super(b.Dictionary),this.indices=t,this.dictionary=e,this.isOrdered=n||!1,this.id=r==null?Bu():oe(r)}get children(){return this.dictionary.children}get valueType(){return this.dictionary}get ArrayType(){return this.dictionary.ArrayType}toString(){return"Dictionary<".concat(this.indices,", ").concat(this.dictionary,">")}};_c=Symbol.toStringTag;et[_c]=(c=>(c.id=null,c.indices=null,c.isOrdered=null,c.dictionary=null,c[Symbol.toStringTag]="Dictionary"))(et.prototype);function tt(c){let e=c;switch(c.typeId){case b.Decimal:return c.bitWidth/32;case b.Interval:return 1+e.unit;case b.FixedSizeList:return e.listSize;case b.FixedSizeBinary:return e.byteWidth;default:return 1}}var G=class{visitMany(e,...t){return e.map((r,n)=>this.visit(r,...t.map(a=>a[n])))}visit(...e){return this.getVisitFn(e[0],!1).apply(this,e)}getVisitFn(e,t=!0){return ju(this,e,t)}getVisitFnByTypeId(e,t=!0){return ci(this,e,t)}visitNull(e,...t){return null}visitBool(e,...t){return null}visitInt(e,...t){return null}visitFloat(e,...t){return null}visitUtf8(e,...t){return null}visitLargeUtf8(e,...t){return null}visitBinary(e,...t){return null}visitLargeBinary(e,...t){return null}visitFixedSizeBinary(e,...t){return null}visitDate(e,...t){return null}visitTimestamp(e,...t){return null}visitTime(e,...t){return null}visitDecimal(e,...t){return null}visitList(e,...t){return null}visitStruct(e,...t){return null}visitUnion(e,...t){return null}visitDictionary(e,...t){return null}visitInterval(e,...t){return null}visitDuration(e,...t){return null}visitFixedSizeList(e,...t){return null}visitMap(e,...t){return null}};function ju(c,e,t=!0){return typeof e=="number"?ci(c,e,t):typeof e=="string"&&e in b?ci(c,b[e],t):e&&e instanceof j?ci(c,dc(e),t):e!=null&&e.type&&e.type instanceof j?ci(c,dc(e.type),t):ci(c,b.NONE,t)}function ci(c,e,t=!0){let r=null;switch(e){case b.Null:r=c.visitNull;break;case b.Bool:r=c.visitBool;break;case b.Int:r=c.visitInt;break;case b.Int8:r=c.visitInt8||c.visitInt;break;case b.Int16:r=c.visitInt16||c.visitInt;break;case b.Int32:r=c.visitInt32||c.visitInt;break;case b.Int64:r=c.visitInt64||c.visitInt;break;case b.Uint8:r=c.visitUint8||c.visitInt;break;case b.Uint16:r=c.visitUint16||c.visitInt;break;case b.Uint32:r=c.visitUint32||c.visitInt;break;case b.Uint64:r=c.visitUint64||c.visitInt;break;case b.Float:r=c.visitFloat;break;case b.Float16:r=c.visitFloat16||c.visitFloat;break;case b.Float32:r=c.visitFloat32||c.visitFloat;break;case b.Float64:r=c.visitFloat64||c.visitFloat;break;case b.Utf8:r=c.visitUtf8;break;case b.LargeUtf8:r=c.visitLargeUtf8;break;case b.Binary:r=c.visitBinary;break;case b.LargeBinary:r=c.visitLargeBinary;break;case b.FixedSizeBinary:r=c.visitFixedSizeBinary;break;case b.Date:r=c.visitDate;break;case b.DateDay:r=c.visitDateDay||c.visitDate;break;case b.DateMillisecond:r=c.visitDateMillisecond||c.visitDate;break;case b.Timestamp:r=c.visitTimestamp;break;case b.TimestampSecond:r=c.visitTimestampSecond||c.visitTimestamp;break;case b.TimestampMillisecond:r=c.visitTimestampMillisecond||c.visitTimestamp;break;case b.TimestampMicrosecond:r=c.visitTimestampMicrosecond||c.visitTimestamp;break;case b.TimestampNanosecond:r=c.visitTimestampNanosecond||c.visitTimestamp;break;case b.Time:r=c.visitTime;break;case b.TimeSecond:r=c.visitTimeSecond||c.visitTime;break;case b.TimeMillisecond:r=c.visitTimeMillisecond||c.visitTime;break;case b.TimeMicrosecond:r=c.visitTimeMicrosecond||c.visitTime;break;case b.TimeNanosecond:r=c.visitTimeNanosecond||c.visitTime;break;case b.Decimal:r=c.visitDecimal;break;case b.List:r=c.visitList;break;case b.Struct:r=c.visitStruct;break;case b.Union:r=c.visitUnion;break;case b.DenseUnion:r=c.visitDenseUnion||c.visitUnion;break;case b.SparseUnion:r=c.visitSparseUnion||c.visitUnion;break;case b.Dictionary:r=c.visitDictionary;break;case b.Interval:r=c.visitInterval;break;case b.IntervalDayTime:r=c.visitIntervalDayTime||c.visitInterval;break;case b.IntervalYearMonth:r=c.visitIntervalYearMonth||c.visitInterval;break;case b.Duration:r=c.visitDuration;break;case b.DurationSecond:r=c.visitDurationSecond||c.visitDuration;break;case b.DurationMillisecond:r=c.visitDurationMillisecond||c.visitDuration;break;case b.DurationMicrosecond:r=c.visitDurationMicrosecond||c.visitDuration;break;case b.DurationNanosecond:r=c.visitDurationNanosecond||c.visitDuration;break;case b.FixedSizeList:r=c.visitFixedSizeList;break;case b.Map:r=c.visitMap;break}if(typeof r=="function")return r;if(!t)return()=>null;throw new Error("Unrecognized type '".concat(b[e],"'"))}function dc(c){switch(c.typeId){case b.Null:return b.Null;case b.Int:{let{bitWidth:e,isSigned:t}=c;switch(e){case 8:return t?b.Int8:b.Uint8;case 16:return t?b.Int16:b.Uint16;case 32:return t?b.Int32:b.Uint32;case 64:return t?b.Int64:b.Uint64}return b.Int}case b.Float:switch(c.precision){case pe.HALF:return b.Float16;case pe.SINGLE:return b.Float32;case pe.DOUBLE:return b.Float64}return b.Float;case b.Binary:return b.Binary;case b.LargeBinary:return b.LargeBinary;case b.Utf8:return b.Utf8;case b.LargeUtf8:return b.LargeUtf8;case b.Bool:return b.Bool;case b.Decimal:return b.Decimal;case b.Time:switch(c.unit){case R.SECOND:return b.TimeSecond;case R.MILLISECOND:return b.TimeMillisecond;case R.MICROSECOND:return b.TimeMicrosecond;case R.NANOSECOND:return b.TimeNanosecond}return b.Time;case b.Timestamp:switch(c.unit){case R.SECOND:return b.TimestampSecond;case R.MILLISECOND:return b.TimestampMillisecond;case R.MICROSECOND:return b.TimestampMicrosecond;case R.NANOSECOND:return b.TimestampNanosecond}return b.Timestamp;case b.Date:switch(c.unit){case Le.DAY:return b.DateDay;case Le.MILLISECOND:return b.DateMillisecond}return b.Date;case b.Interval:switch(c.unit){case Ce.DAY_TIME:return b.IntervalDayTime;case Ce.YEAR_MONTH:return b.IntervalYearMonth}return b.Interval;case b.Duration:switch(c.unit){case R.SECOND:return b.DurationSecond;case R.MILLISECOND:return b.DurationMillisecond;case R.MICROSECOND:return b.DurationMicrosecond;case R.NANOSECOND:return b.DurationNanosecond}return b.Duration;case b.Map:return b.Map;case b.List:return b.List;case b.Struct:return b.Struct;case b.Union:switch(c.mode){case he.Dense:return b.DenseUnion;case he.Sparse:return b.SparseUnion}return b.Union;case b.FixedSizeBinary:return b.FixedSizeBinary;case b.FixedSizeList:return b.FixedSizeList;case b.Dictionary:return b.Dictionary}throw new Error("Unrecognized type '".concat(b[c.typeId],"'"))}G.prototype.visitInt8=null;G.prototype.visitInt16=null;G.prototype.visitInt32=null;G.prototype.visitInt64=null;G.prototype.visitUint8=null;G.prototype.visitUint16=null;G.prototype.visitUint32=null;G.prototype.visitUint64=null;G.prototype.visitFloat16=null;G.prototype.visitFloat32=null;G.prototype.visitFloat64=null;G.prototype.visitDateDay=null;G.prototype.visitDateMillisecond=null;G.prototype.visitTimestampSecond=null;G.prototype.visitTimestampMillisecond=null;G.prototype.visitTimestampMicrosecond=null;G.prototype.visitTimestampNanosecond=null;G.prototype.visitTimeSecond=null;G.prototype.visitTimeMillisecond=null;G.prototype.visitTimeMicrosecond=null;G.prototype.visitTimeNanosecond=null;G.prototype.visitDenseUnion=null;G.prototype.visitSparseUnion=null;G.prototype.visitIntervalDayTime=null;G.prototype.visitIntervalYearMonth=null;G.prototype.visitDuration=null;G.prototype.visitDurationSecond=null;G.prototype.visitDurationMillisecond=null;G.prototype.visitDurationMicrosecond=null;G.prototype.visitDurationNanosecond=null;var Pa={};mr(Pa,{float64ToUint16:()=>Xi,uint16ToFloat64:()=>es});var fc=new Float64Array(1),li=new Uint32Array(fc.buffer);function es(c){let e=(c&31744)>>10,t=(c&1023)/1024,r=Math.pow(-1,(c&32768)>>15);switch(e){case 31:return r*(t?Number.NaN:1/0);case 0:return r*(t?6103515625e-14*t:0)}return r*Math.pow(2,e-15)*(1+t)}function Xi(c){if(c!==c)return 32256;fc[0]=c;let e=(li[1]&2147483648)>>16&65535,t=li[1]&2146435072,r=0;return t>=1089470464?li[0]>0?t=31744:(t=(t&2080374784)>>16,r=(li[1]&1048575)>>10):t<=1056964608?(r=1048576+(li[1]&1048575),r=1048576+(r<<(t>>20)-998)>>21,t=0):(t=t-1056964608>>10,r=(li[1]&1048575)+512>>10),e|t|r&65535}var V=class extends G{};function J(c){return(e,t,r)=>{if(e.setValid(t,r!=null))return c(e,t,r)}}var Ru=(c,e,t)=>{c[e]=Math.floor(t/864e5)},pc=(c,e,t,r)=>{if(t+1<e.length){let n=oe(e[t]),a=oe(e[t+1]);c.set(r.subarray(0,a-n),n)}},Uu=({offset:c,values:e},t,r)=>{let n=c+t;r?e[n>>3]|=1<<n%8:e[n>>3]&=~(1<<n%8)},rr=({values:c},e,t)=>{c[e]=t},Ia=({values:c},e,t)=>{c[e]=t},mc=({values:c},e,t)=>{c[e]=Xi(t)},Gu=(c,e,t)=>{switch(c.type.precision){case pe.HALF:return mc(c,e,t);case pe.SINGLE:case pe.DOUBLE:return Ia(c,e,t)}},ts=({values:c},e,t)=>{Ru(c,e,t.valueOf())},rs=({values:c},e,t)=>{c[e]=BigInt(t)},Ba=({stride:c,values:e},t,r)=>{e.set(r.subarray(0,c),c*t)},hc=({values:c,valueOffsets:e},t,r)=>pc(c,e,t,r),gc=({values:c,valueOffsets:e},t,r)=>pc(c,e,t,xt(r)),ja=(c,e,t)=>{c.type.unit===Le.DAY?ts(c,e,t):rs(c,e,t)},is=({values:c},e,t)=>{c[e]=BigInt(t/1e3)},ns=({values:c},e,t)=>{c[e]=BigInt(t)},ss=({values:c},e,t)=>{c[e]=BigInt(t*1e3)},as=({values:c},e,t)=>{c[e]=BigInt(t*1e6)},Ra=(c,e,t)=>{switch(c.type.unit){case R.SECOND:return is(c,e,t);case R.MILLISECOND:return ns(c,e,t);case R.MICROSECOND:return ss(c,e,t);case R.NANOSECOND:return as(c,e,t)}},os=({values:c},e,t)=>{c[e]=t},cs=({values:c},e,t)=>{c[e]=t},ls=({values:c},e,t)=>{c[e]=t},us=({values:c},e,t)=>{c[e]=t},Ua=(c,e,t)=>{switch(c.type.unit){case R.SECOND:return os(c,e,t);case R.MILLISECOND:return cs(c,e,t);case R.MICROSECOND:return ls(c,e,t);case R.NANOSECOND:return us(c,e,t)}},Ga=({values:c,stride:e},t,r)=>{c.set(r.subarray(0,e),e*t)},Ou=(c,e,t)=>{let r=c.children[0],n=c.valueOffsets,a=je.getVisitFn(r);if(Array.isArray(t))for(let o=-1,l=n[e],u=n[e+1];l<u;)a(r,l++,t[++o]);else for(let o=-1,l=n[e],u=n[e+1];l<u;)a(r,l++,t.get(++o))},Hu=(c,e,t)=>{let r=c.children[0],{valueOffsets:n}=c,a=je.getVisitFn(r),{[e]:o,[e+1]:l}=n,u=t instanceof Map?t.entries():Object.entries(t);for(let _ of u)if(a(r,o,_),++o>=l)break},Nu=(c,e)=>(t,r,n,a)=>r&&t(r,c,e[a]),Wu=(c,e)=>(t,r,n,a)=>r&&t(r,c,e.get(a)),Vu=(c,e)=>(t,r,n,a)=>r&&t(r,c,e.get(n.name)),zu=(c,e)=>(t,r,n,a)=>r&&t(r,c,e[n.name]),$u=(c,e,t)=>{let r=c.type.children.map(a=>je.getVisitFn(a.type)),n=t instanceof Map?Vu(e,t):t instanceof ae?Wu(e,t):Array.isArray(t)?Nu(e,t):zu(e,t);c.type.children.forEach((a,o)=>n(r[o],c.children[o],a,o))},qu=(c,e,t)=>{c.type.mode===he.Dense?vc(c,e,t):yc(c,e,t)},vc=(c,e,t)=>{let r=c.type.typeIdToChildIndex[c.typeIds[e]],n=c.children[r];je.visit(n,c.valueOffsets[e],t)},yc=(c,e,t)=>{let r=c.type.typeIdToChildIndex[c.typeIds[e]],n=c.children[r];je.visit(n,e,t)},Xu=(c,e,t)=>{var r;(r=c.dictionary)===null||r===void 0||r.set(c.values[e],t)},Oa=(c,e,t)=>{c.type.unit===Ce.DAY_TIME?_s(c,e,t):ds(c,e,t)},_s=({values:c},e,t)=>{c.set(t.subarray(0,2),2*e)},ds=({values:c},e,t)=>{c[e]=t[0]*12+t[1]%12},ps=({values:c},e,t)=>{c[e]=t},ms=({values:c},e,t)=>{c[e]=t},hs=({values:c},e,t)=>{c[e]=t},gs=({values:c},e,t)=>{c[e]=t},Ha=(c,e,t)=>{switch(c.type.unit){case R.SECOND:return ps(c,e,t);case R.MILLISECOND:return ms(c,e,t);case R.MICROSECOND:return hs(c,e,t);case R.NANOSECOND:return gs(c,e,t)}},Qu=(c,e,t)=>{let{stride:r}=c,n=c.children[0],a=je.getVisitFn(n);if(Array.isArray(t))for(let o=-1,l=e*r;++o<r;)a(n,l+o,t[o]);else for(let o=-1,l=e*r;++o<r;)a(n,l+o,t.get(o))};V.prototype.visitBool=J(Uu);V.prototype.visitInt=J(rr);V.prototype.visitInt8=J(rr);V.prototype.visitInt16=J(rr);V.prototype.visitInt32=J(rr);V.prototype.visitInt64=J(rr);V.prototype.visitUint8=J(rr);V.prototype.visitUint16=J(rr);V.prototype.visitUint32=J(rr);V.prototype.visitUint64=J(rr);V.prototype.visitFloat=J(Gu);V.prototype.visitFloat16=J(mc);V.prototype.visitFloat32=J(Ia);V.prototype.visitFloat64=J(Ia);V.prototype.visitUtf8=J(gc);V.prototype.visitLargeUtf8=J(gc);V.prototype.visitBinary=J(hc);V.prototype.visitLargeBinary=J(hc);V.prototype.visitFixedSizeBinary=J(Ba);V.prototype.visitDate=J(ja);V.prototype.visitDateDay=J(ts);V.prototype.visitDateMillisecond=J(rs);V.prototype.visitTimestamp=J(Ra);V.prototype.visitTimestampSecond=J(is);V.prototype.visitTimestampMillisecond=J(ns);V.prototype.visitTimestampMicrosecond=J(ss);V.prototype.visitTimestampNanosecond=J(as);V.prototype.visitTime=J(Ua);V.prototype.visitTimeSecond=J(os);V.prototype.visitTimeMillisecond=J(cs);V.prototype.visitTimeMicrosecond=J(ls);V.prototype.visitTimeNanosecond=J(us);V.prototype.visitDecimal=J(Ga);V.prototype.visitList=J(Ou);V.prototype.visitStruct=J($u);V.prototype.visitUnion=J(qu);V.prototype.visitDenseUnion=J(vc);V.prototype.visitSparseUnion=J(yc);V.prototype.visitDictionary=J(Xu);V.prototype.visitInterval=J(Oa);V.prototype.visitIntervalDayTime=J(_s);V.prototype.visitIntervalYearMonth=J(ds);V.prototype.visitDuration=J(Ha);V.prototype.visitDurationSecond=J(ps);V.prototype.visitDurationMillisecond=J(ms);V.prototype.visitDurationMicrosecond=J(hs);V.prototype.visitDurationNanosecond=J(gs);V.prototype.visitFixedSizeList=J(Qu);V.prototype.visitMap=J(Hu);var je=new V;var Et=Symbol.for("parent"),ui=Symbol.for("rowIndex"),Ar=class{constructor(e,t){return this[Et]=e,this[ui]=t,new Proxy(this,new Wa)}toArray(){return Object.values(this.toJSON())}toJSON(){let e=this[ui],t=this[Et],r=t.type.children,n={};for(let a=-1,o=r.length;++a<o;)n[r[a].name]=Te.visit(t.children[a],e);return n}toString(){return"{".concat([...this].map(([e,t])=>"".concat(gt(e),": ").concat(gt(t))).join(", "),"}")}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}[Symbol.iterator](){return new Na(this[Et],this[ui])}},Na=class{constructor(e,t){this.childIndex=0,this.children=e.children,this.rowIndex=t,this.childFields=e.type.children,this.numChildren=this.childFields.length}[Symbol.iterator](){return this}next(){let e=this.childIndex;return e<this.numChildren?(this.childIndex=e+1,{done:!1,value:[this.childFields[e].name,Te.visit(this.children[e],this.rowIndex)]}):{done:!0,value:null}}};Object.defineProperties(Ar.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[Et]:{writable:!0,enumerable:!1,configurable:!1,value:null},[ui]:{writable:!0,enumerable:!1,configurable:!1,value:-1}});var Wa=class{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(e){return e[Et].type.children.map(t=>t.name)}has(e,t){return e[Et].type.children.findIndex(r=>r.name===t)!==-1}getOwnPropertyDescriptor(e,t){if(e[Et].type.children.findIndex(r=>r.name===t)!==-1)return{writable:!0,enumerable:!0,configurable:!0}}get(e,t){if(Reflect.has(e,t))return e[t];let r=e[Et].type.children.findIndex(n=>n.name===t);if(r!==-1){let n=Te.visit(e[Et].children[r],e[ui]);return Reflect.set(e,t,n),n}}set(e,t,r){let n=e[Et].type.children.findIndex(a=>a.name===t);return n!==-1?(je.visit(e[Et].children[n],e[ui],r),Reflect.set(e,t,r)):Reflect.has(e,t)||typeof t=="symbol"?Reflect.set(e,t,r):!1}};var O=class extends G{};function $(c){return(e,t)=>e.getValid(t)?c(e,t):null}var Yu=(c,e)=>864e5*c[e],Ju=(c,e)=>null,bc=(c,e,t)=>{if(t+1>=e.length)return null;let r=oe(e[t]),n=oe(e[t+1]);return c.subarray(r,n)},Ku=({offset:c,values:e},t)=>{let r=c+t;return(e[r>>3]&1<<r%8)!==0},Sc=({values:c},e)=>Yu(c,e),wc=({values:c},e)=>oe(c[e]),Lr=({stride:c,values:e},t)=>e[c*t],Zu=({stride:c,values:e},t)=>es(e[c*t]),Ec=({values:c},e)=>c[e],e_=({stride:c,values:e},t)=>e.subarray(c*t,c*(t+1)),Ac=({values:c,valueOffsets:e},t)=>bc(c,e,t),Lc=({values:c,valueOffsets:e},t)=>{let r=bc(c,e,t);return r!==null?Ci(r):null},t_=({values:c},e)=>c[e],r_=({type:c,values:e},t)=>c.precision!==pe.HALF?e[t]:es(e[t]),i_=(c,e)=>c.type.unit===Le.DAY?Sc(c,e):wc(c,e),kc=({values:c},e)=>1e3*oe(c[e]),Dc=({values:c},e)=>oe(c[e]),Tc=({values:c},e)=>Fa(c[e],BigInt(1e3)),Fc=({values:c},e)=>Fa(c[e],BigInt(1e6)),n_=(c,e)=>{switch(c.type.unit){case R.SECOND:return kc(c,e);case R.MILLISECOND:return Dc(c,e);case R.MICROSECOND:return Tc(c,e);case R.NANOSECOND:return Fc(c,e)}},xc=({values:c},e)=>c[e],Cc=({values:c},e)=>c[e],Mc=({values:c},e)=>c[e],Pc=({values:c},e)=>c[e],s_=(c,e)=>{switch(c.type.unit){case R.SECOND:return xc(c,e);case R.MILLISECOND:return Cc(c,e);case R.MICROSECOND:return Mc(c,e);case R.NANOSECOND:return Pc(c,e)}},a_=({values:c,stride:e},t)=>qi.decimal(c.subarray(e*t,e*(t+1))),o_=(c,e)=>{let{valueOffsets:t,stride:r,children:n}=c,{[e*r]:a,[e*r+1]:o}=t,u=n[0].slice(a,o-a);return new ae([u])},c_=(c,e)=>{let{valueOffsets:t,children:r}=c,{[e]:n,[e+1]:a}=t,o=r[0];return new jt(o.slice(n,a-n))},l_=(c,e)=>new Ar(c,e),u_=(c,e)=>c.type.mode===he.Dense?Ic(c,e):Bc(c,e),Ic=(c,e)=>{let t=c.type.typeIdToChildIndex[c.typeIds[e]],r=c.children[t];return Te.visit(r,c.valueOffsets[e])},Bc=(c,e)=>{let t=c.type.typeIdToChildIndex[c.typeIds[e]],r=c.children[t];return Te.visit(r,e)},__=(c,e)=>{var t;return(t=c.dictionary)===null||t===void 0?void 0:t.get(c.values[e])},d_=(c,e)=>c.type.unit===Ce.DAY_TIME?jc(c,e):Rc(c,e),jc=({values:c},e)=>c.subarray(2*e,2*(e+1)),Rc=({values:c},e)=>{let t=c[e],r=new Int32Array(2);return r[0]=Math.trunc(t/12),r[1]=Math.trunc(t%12),r},Uc=({values:c},e)=>c[e],Gc=({values:c},e)=>c[e],Oc=({values:c},e)=>c[e],Hc=({values:c},e)=>c[e],f_=(c,e)=>{switch(c.type.unit){case R.SECOND:return Uc(c,e);case R.MILLISECOND:return Gc(c,e);case R.MICROSECOND:return Oc(c,e);case R.NANOSECOND:return Hc(c,e)}},p_=(c,e)=>{let{stride:t,children:r}=c,a=r[0].slice(e*t,t);return new ae([a])};O.prototype.visitNull=$(Ju);O.prototype.visitBool=$(Ku);O.prototype.visitInt=$(t_);O.prototype.visitInt8=$(Lr);O.prototype.visitInt16=$(Lr);O.prototype.visitInt32=$(Lr);O.prototype.visitInt64=$(Ec);O.prototype.visitUint8=$(Lr);O.prototype.visitUint16=$(Lr);O.prototype.visitUint32=$(Lr);O.prototype.visitUint64=$(Ec);O.prototype.visitFloat=$(r_);O.prototype.visitFloat16=$(Zu);O.prototype.visitFloat32=$(Lr);O.prototype.visitFloat64=$(Lr);O.prototype.visitUtf8=$(Lc);O.prototype.visitLargeUtf8=$(Lc);O.prototype.visitBinary=$(Ac);O.prototype.visitLargeBinary=$(Ac);O.prototype.visitFixedSizeBinary=$(e_);O.prototype.visitDate=$(i_);O.prototype.visitDateDay=$(Sc);O.prototype.visitDateMillisecond=$(wc);O.prototype.visitTimestamp=$(n_);O.prototype.visitTimestampSecond=$(kc);O.prototype.visitTimestampMillisecond=$(Dc);O.prototype.visitTimestampMicrosecond=$(Tc);O.prototype.visitTimestampNanosecond=$(Fc);O.prototype.visitTime=$(s_);O.prototype.visitTimeSecond=$(xc);O.prototype.visitTimeMillisecond=$(Cc);O.prototype.visitTimeMicrosecond=$(Mc);O.prototype.visitTimeNanosecond=$(Pc);O.prototype.visitDecimal=$(a_);O.prototype.visitList=$(o_);O.prototype.visitStruct=$(l_);O.prototype.visitUnion=$(u_);O.prototype.visitDenseUnion=$(Ic);O.prototype.visitSparseUnion=$(Bc);O.prototype.visitDictionary=$(__);O.prototype.visitInterval=$(d_);O.prototype.visitIntervalDayTime=$(jc);O.prototype.visitIntervalYearMonth=$(Rc);O.prototype.visitDuration=$(f_);O.prototype.visitDurationSecond=$(Uc);O.prototype.visitDurationMillisecond=$(Gc);O.prototype.visitDurationMicrosecond=$(Oc);O.prototype.visitDurationNanosecond=$(Hc);O.prototype.visitFixedSizeList=$(p_);O.prototype.visitMap=$(c_);var Te=new O;var kr=Symbol.for("keys"),di=Symbol.for("vals"),_i=Symbol.for("kKeysAsStrings"),Va=Symbol.for("_kKeysAsStrings"),jt=class{constructor(e){return this[kr]=new ae([e.children[0]]).memoize(),this[di]=e.children[1],new Proxy(this,new $a)}get[_i](){return this[Va]||(this[Va]=Array.from(this[kr].toArray(),String))}[Symbol.iterator](){return new za(this[kr],this[di])}get size(){return this[kr].length}toArray(){return Object.values(this.toJSON())}toJSON(){let e=this[kr],t=this[di],r={};for(let n=-1,a=e.length;++n<a;)r[e.get(n)]=Te.visit(t,n);return r}toString(){return"{".concat([...this].map(([e,t])=>"".concat(gt(e),": ").concat(gt(t))).join(", "),"}")}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}},za=class{constructor(e,t){this.keys=e,this.vals=t,this.keyIndex=0,this.numKeys=e.length}[Symbol.iterator](){return this}next(){let e=this.keyIndex;return e===this.numKeys?{done:!0,value:null}:(this.keyIndex++,{done:!1,value:[this.keys.get(e),Te.visit(this.vals,e)]})}},$a=class{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(e){return e[_i]}has(e,t){return e[_i].includes(t)}getOwnPropertyDescriptor(e,t){if(e[_i].indexOf(t)!==-1)return{writable:!0,enumerable:!0,configurable:!0}}get(e,t){if(Reflect.has(e,t))return e[t];let r=e[_i].indexOf(t);if(r!==-1){let n=Te.visit(Reflect.get(e,di),r);return Reflect.set(e,t,n),n}}set(e,t,r){let n=e[_i].indexOf(t);return n!==-1?(je.visit(Reflect.get(e,di),n,r),Reflect.set(e,t,r)):Reflect.has(e,t)?Reflect.set(e,t,r):!1}};Object.defineProperties(jt.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[kr]:{writable:!0,enumerable:!1,configurable:!1,value:null},[di]:{writable:!0,enumerable:!1,configurable:!1,value:null},[Va]:{writable:!0,enumerable:!1,configurable:!1,value:null}});var Nc;function Qi(c,e,t,r){let{length:n=0}=c,a=typeof e!="number"?0:e,o=typeof t!="number"?n:t;return a<0&&(a=(a%n+n)%n),o<0&&(o=(o%n+n)%n),o<a&&(Nc=a,a=o,o=Nc),o>n&&(o=n),r?r(c,a,o):[a,o]}var jr=(c,e)=>c<0?e+c:c,Wc=c=>c!==c;function Dr(c){if(typeof c!=="object"||c===null)return Wc(c)?Wc:t=>t===c;if(c instanceof Date){let t=c.valueOf();return r=>r instanceof Date?r.valueOf()===t:!1}return ArrayBuffer.isView(c)?t=>t?Aa(c,t):!1:c instanceof Map?h_(c):Array.isArray(c)?m_(c):c instanceof ae?g_(c):v_(c,!0)}function m_(c){let e=[];for(let t=-1,r=c.length;++t<r;)e[t]=Dr(c[t]);return vs(e)}function h_(c){let e=-1,t=[];for(let r of c.values())t[++e]=Dr(r);return vs(t)}function g_(c){let e=[];for(let t=-1,r=c.length;++t<r;)e[t]=Dr(c.get(t));return vs(e)}function v_(c,e=!1){let t=Object.keys(c);if(!e&&t.length===0)return()=>!1;let r=[];for(let n=-1,a=t.length;++n<a;)r[n]=Dr(c[t[n]]);return vs(r,t)}function vs(c,e){return t=>{if(!t||typeof t!="object")return!1;switch(t.constructor){case Array:return y_(c,t);case Map:return Vc(c,t,t.keys());case jt:case Ar:case Object:case void 0:return Vc(c,t,e||Object.keys(t))}return t instanceof ae?b_(c,t):!1}}function y_(c,e){let t=c.length;if(e.length!==t)return!1;for(let r=-1;++r<t;)if(!c[r](e[r]))return!1;return!0}function b_(c,e){let t=c.length;if(e.length!==t)return!1;for(let r=-1;++r<t;)if(!c[r](e.get(r)))return!1;return!0}function Vc(c,e,t){let r=t[Symbol.iterator](),n=e instanceof Map?e.keys():Object.keys(e)[Symbol.iterator](),a=e instanceof Map?e.values():Object.values(e)[Symbol.iterator](),o=0,l=c.length,u=a.next(),_=r.next(),d=n.next();for(;o<l&&!_.done&&!d.done&&!u.done&&!(_.value!==d.value||!c[o](u.value));++o,_=r.next(),d=n.next(),u=a.next());return o===l&&_.done&&d.done&&u.done?!0:(r.return&&r.return(),n.return&&n.return(),a.return&&a.return(),!1)}var Xa={};mr(Xa,{BitIterator:()=>Rr,getBit:()=>zc,getBool:()=>bs,packBools:()=>Gr,popcnt_array:()=>$c,popcnt_bit_range:()=>Yi,popcnt_uint32:()=>ys,setBool:()=>S_,truncateBitmap:()=>Ur});function bs(c,e,t,r){return(t&1<<r)!==0}function zc(c,e,t,r){return(t&1<<r)>>r}function S_(c,e,t){return t?!!(c[e>>3]|=1<<e%8)||!0:!(c[e>>3]&=~(1<<e%8))&&!1}function Ur(c,e,t){let r=t.byteLength+7&-8;if(c>0||t.byteLength<r){let n=new Uint8Array(r);return n.set(c%8===0?t.subarray(c>>3):Gr(new Rr(t,c,e,null,bs)).subarray(0,r)),n}return t}function Gr(c){let e=[],t=0,r=0,n=0;for(let o of c)o&&(n|=1<<r),++r===8&&(e[t++]=n,n=r=0);(t===0||r>0)&&(e[t++]=n);let a=new Uint8Array(e.length+7&-8);return a.set(e),a}var Rr=class{constructor(e,t,r,n,a){this.bytes=e,this.length=r,this.context=n,this.get=a,this.bit=t%8,this.byteIndex=t>>3,this.byte=e[this.byteIndex++],this.index=0}next(){return this.index<this.length?(this.bit===8&&(this.bit=0,this.byte=this.bytes[this.byteIndex++]),{value:this.get(this.context,this.index++,this.byte,this.bit++)}):{done:!0,value:null}}[Symbol.iterator](){return this}};function Yi(c,e,t){if(t-e<=0)return 0;if(t-e<8){let a=0;for(let o of new Rr(c,e,t-e,c,zc))a+=o;return a}let r=t>>3<<3,n=e+(e%8===0?0:8-e%8);return Yi(c,e,n)+Yi(c,r,t)+$c(c,n>>3,r-n>>3)}function $c(c,e,t){let r=0,n=Math.trunc(e),a=new DataView(c.buffer,c.byteOffset,c.byteLength),o=t===void 0?c.byteLength:n+t;for(;o-n>=4;)r+=ys(a.getUint32(n)),n+=4;for(;o-n>=2;)r+=ys(a.getUint16(n)),n+=2;for(;o-n>=1;)r+=ys(a.getUint8(n)),n+=1;return r}function ys(c){let e=Math.trunc(c);return e=e-(e>>>1&1431655765),e=(e&858993459)+(e>>>2&858993459),(e+(e>>>4)&252645135)*16843009>>>24}var w_=-1,le=class c{get typeId(){return this.type.typeId}get ArrayType(){return this.type.ArrayType}get buffers(){return[this.valueOffsets,this.values,this.nullBitmap,this.typeIds]}get nullable(){if(this._nullCount!==0){let{type:e}=this;return j.isSparseUnion(e)?this.children.some(t=>t.nullable):j.isDenseUnion(e)?this.children.some(t=>t.nullable):this.nullBitmap&&this.nullBitmap.byteLength>0}return!0}get byteLength(){let e=0,{valueOffsets:t,values:r,nullBitmap:n,typeIds:a}=this;return t&&(e+=t.byteLength),r&&(e+=r.byteLength),n&&(e+=n.byteLength),a&&(e+=a.byteLength),this.children.reduce((o,l)=>o+l.byteLength,e)}get nullCount(){if(j.isUnion(this.type))return this.children.reduce((r,n)=>r+n.nullCount,0);let e=this._nullCount,t;return e<=w_&&(t=this.nullBitmap)&&(this._nullCount=e=t.length===0?0:this.length-Yi(t,this.offset,this.offset+this.length)),e}constructor(e,t,r,n,a,o=[],l){this.type=e,this.children=o,this.dictionary=l,this.offset=Math.floor(Math.max(t||0,0)),this.length=Math.floor(Math.max(r||0,0)),this._nullCount=Math.floor(Math.max(n||0,-1));let u;a instanceof c?(this.stride=a.stride,this.values=a.values,this.typeIds=a.typeIds,this.nullBitmap=a.nullBitmap,this.valueOffsets=a.valueOffsets):(this.stride=tt(e),a&&((u=a[0])&&(this.valueOffsets=u),(u=a[1])&&(this.values=u),(u=a[2])&&(this.nullBitmap=u),(u=a[3])&&(this.typeIds=u)))}getValid(e){let{type:t}=this;if(j.isUnion(t)){let r=t,n=this.children[r.typeIdToChildIndex[this.typeIds[e]]],a=r.mode===he.Dense?this.valueOffsets[e]:e;return n.getValid(a)}if(this.nullable&&this.nullCount>0){let r=this.offset+e;return(this.nullBitmap[r>>3]&1<<r%8)!==0}return!0}setValid(e,t){let r,{type:n}=this;if(j.isUnion(n)){let a=n,o=this.children[a.typeIdToChildIndex[this.typeIds[e]]],l=a.mode===he.Dense?this.valueOffsets[e]:e;r=o.getValid(l),o.setValid(l,t)}else{let{nullBitmap:a}=this,{offset:o,length:l}=this,u=o+e,_=1<<u%8,d=u>>3;(!a||a.byteLength<=d)&&(a=new Uint8Array((o+l+63&-64)>>3).fill(255),this.nullCount>0?(a.set(Ur(o,l,this.nullBitmap),0),Object.assign(this,{nullBitmap:a})):Object.assign(this,{nullBitmap:a,_nullCount:0}));let f=a[d];r=(f&_)!==0,a[d]=t?f|_:f&~_}return r!==!!t&&(this._nullCount=this.nullCount+(t?-1:1)),t}clone(e=this.type,t=this.offset,r=this.length,n=this._nullCount,a=this,o=this.children){return new c(e,t,r,n,a,o,this.dictionary)}slice(e,t){let{stride:r,typeId:n,children:a}=this,o=+(this._nullCount===0)-1,l=n===16?r:1,u=this._sliceBuffers(e,t,r,n);return this.clone(this.type,this.offset+e,t,o,u,a.length===0||this.valueOffsets?a:this._sliceChildren(a,l*e,l*t))}_changeLengthAndBackfillNullBitmap(e){if(this.typeId===b.Null)return this.clone(this.type,0,e,0);let{length:t,nullCount:r}=this,n=new Uint8Array((e+63&-64)>>3).fill(255,0,t>>3);n[t>>3]=(1<<t-(t&-8))-1,r>0&&n.set(Ur(this.offset,t,this.nullBitmap),0);let a=this.buffers;return a[st.VALIDITY]=n,this.clone(this.type,0,e,r+(e-t),a)}_sliceBuffers(e,t,r,n){let a,{buffers:o}=this;return(a=o[st.TYPE])&&(o[st.TYPE]=a.subarray(e,e+t)),(a=o[st.OFFSET])&&(o[st.OFFSET]=a.subarray(e,e+t+1))||(a=o[st.DATA])&&(o[st.DATA]=n===6?a:a.subarray(r*e,r*(e+t))),o}_sliceChildren(e,t,r){return e.map(n=>n.slice(t,r))}};le.prototype.children=Object.freeze([]);var Qa=class c extends G{visit(e){return this.getVisitFn(e.type).call(this,e)}visitNull(e){let{["type"]:t,["offset"]:r=0,["length"]:n=0}=e;return new le(t,r,n,n)}visitBool(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.nullBitmap),a=ie(t.ArrayType,e.data),{["length"]:o=a.length>>3,["nullCount"]:l=e.nullBitmap?-1:0}=e;return new le(t,r,o,l,[void 0,a,n])}visitInt(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.nullBitmap),a=ie(t.ArrayType,e.data),{["length"]:o=a.length,["nullCount"]:l=e.nullBitmap?-1:0}=e;return new le(t,r,o,l,[void 0,a,n])}visitFloat(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.nullBitmap),a=ie(t.ArrayType,e.data),{["length"]:o=a.length,["nullCount"]:l=e.nullBitmap?-1:0}=e;return new le(t,r,o,l,[void 0,a,n])}visitUtf8(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.data),a=z(e.nullBitmap),o=Ir(e.valueOffsets),{["length"]:l=o.length-1,["nullCount"]:u=e.nullBitmap?-1:0}=e;return new le(t,r,l,u,[o,n,a])}visitLargeUtf8(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.data),a=z(e.nullBitmap),o=Rn(e.valueOffsets),{["length"]:l=o.length-1,["nullCount"]:u=e.nullBitmap?-1:0}=e;return new le(t,r,l,u,[o,n,a])}visitBinary(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.data),a=z(e.nullBitmap),o=Ir(e.valueOffsets),{["length"]:l=o.length-1,["nullCount"]:u=e.nullBitmap?-1:0}=e;return new le(t,r,l,u,[o,n,a])}visitLargeBinary(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.data),a=z(e.nullBitmap),o=Rn(e.valueOffsets),{["length"]:l=o.length-1,["nullCount"]:u=e.nullBitmap?-1:0}=e;return new le(t,r,l,u,[o,n,a])}visitFixedSizeBinary(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.nullBitmap),a=ie(t.ArrayType,e.data),{["length"]:o=a.length/tt(t),["nullCount"]:l=e.nullBitmap?-1:0}=e;return new le(t,r,o,l,[void 0,a,n])}visitDate(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.nullBitmap),a=ie(t.ArrayType,e.data),{["length"]:o=a.length/tt(t),["nullCount"]:l=e.nullBitmap?-1:0}=e;return new le(t,r,o,l,[void 0,a,n])}visitTimestamp(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.nullBitmap),a=ie(t.ArrayType,e.data),{["length"]:o=a.length/tt(t),["nullCount"]:l=e.nullBitmap?-1:0}=e;return new le(t,r,o,l,[void 0,a,n])}visitTime(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.nullBitmap),a=ie(t.ArrayType,e.data),{["length"]:o=a.length/tt(t),["nullCount"]:l=e.nullBitmap?-1:0}=e;return new le(t,r,o,l,[void 0,a,n])}visitDecimal(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.nullBitmap),a=ie(t.ArrayType,e.data),{["length"]:o=a.length/tt(t),["nullCount"]:l=e.nullBitmap?-1:0}=e;return new le(t,r,o,l,[void 0,a,n])}visitList(e){let{["type"]:t,["offset"]:r=0,["child"]:n}=e,a=z(e.nullBitmap),o=Ir(e.valueOffsets),{["length"]:l=o.length-1,["nullCount"]:u=e.nullBitmap?-1:0}=e;return new le(t,r,l,u,[o,void 0,a],[n])}visitStruct(e){let{["type"]:t,["offset"]:r=0,["children"]:n=[]}=e,a=z(e.nullBitmap),{length:o=n.reduce((u,{length:_})=>Math.max(u,_),0),nullCount:l=e.nullBitmap?-1:0}=e;return new le(t,r,o,l,[void 0,void 0,a],n)}visitUnion(e){let{["type"]:t,["offset"]:r=0,["children"]:n=[]}=e,a=ie(t.ArrayType,e.typeIds),{["length"]:o=a.length,["nullCount"]:l=-1}=e;if(j.isSparseUnion(t))return new le(t,r,o,l,[void 0,void 0,void 0,a],n);let u=Ir(e.valueOffsets);return new le(t,r,o,l,[u,void 0,void 0,a],n)}visitDictionary(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.nullBitmap),a=ie(t.indices.ArrayType,e.data),{["dictionary"]:o=new ae([new c().visit({type:t.dictionary})])}=e,{["length"]:l=a.length,["nullCount"]:u=e.nullBitmap?-1:0}=e;return new le(t,r,l,u,[void 0,a,n],[],o)}visitInterval(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.nullBitmap),a=ie(t.ArrayType,e.data),{["length"]:o=a.length/tt(t),["nullCount"]:l=e.nullBitmap?-1:0}=e;return new le(t,r,o,l,[void 0,a,n])}visitDuration(e){let{["type"]:t,["offset"]:r=0}=e,n=z(e.nullBitmap),a=ie(t.ArrayType,e.data),{["length"]:o=a.length,["nullCount"]:l=e.nullBitmap?-1:0}=e;return new le(t,r,o,l,[void 0,a,n])}visitFixedSizeList(e){let{["type"]:t,["offset"]:r=0,["child"]:n=new c().visit({type:t.valueType})}=e,a=z(e.nullBitmap),{["length"]:o=n.length/tt(t),["nullCount"]:l=e.nullBitmap?-1:0}=e;return new le(t,r,o,l,[void 0,void 0,a],[n])}visitMap(e){let{["type"]:t,["offset"]:r=0,["child"]:n=new c().visit({type:t.childType})}=e,a=z(e.nullBitmap),o=Ir(e.valueOffsets),{["length"]:l=o.length-1,["nullCount"]:u=e.nullBitmap?-1:0}=e;return new le(t,r,l,u,[o,void 0,a],[n])}},E_=new Qa;function K(c){return E_.visit(c)}var Ji=class{constructor(e=0,t){this.numChunks=e,this.getChunkIterator=t,this.chunkIndex=0,this.chunkIterator=this.getChunkIterator(0)}next(){for(;this.chunkIndex<this.numChunks;){let e=this.chunkIterator.next();if(!e.done)return e;++this.chunkIndex<this.numChunks&&(this.chunkIterator=this.getChunkIterator(this.chunkIndex))}return{done:!0,value:null}}[Symbol.iterator](){return this}};function qc(c){return c.some(e=>e.nullable)}function Ss(c){return c.reduce((e,t)=>e+t.nullCount,0)}function ws(c){return c.reduce((e,t,r)=>(e[r+1]=e[r]+t.length,e),new Uint32Array(c.length+1))}function Es(c,e,t,r){let n=[];for(let a=-1,o=c.length;++a<o;){let l=c[a],u=e[a],{length:_}=l;if(u>=r)break;if(t>=u+_)continue;if(u>=t&&u+_<=r){n.push(l);continue}let d=Math.max(0,t-u),f=Math.min(r-u,_);n.push(l.slice(d,f-d))}return n.length===0&&n.push(c[0].slice(0,0)),n}function Ya(c,e,t,r){let n=0,a=0,o=e.length-1;do{if(n>=o-1)return t<e[o]?r(c,n,t-e[n]):null;a=n+Math.trunc((o-n)*.5),t<e[a]?o=a:n=a}while(n<o)}function Ki(c,e){return c.getValid(e)}function fi(c){function e(t,r,n){return c(t[r],n)}return function(t){let r=this.data;return Ya(r,this._offsets,t,e)}}function As(c){let e;function t(r,n,a){return c(r[n],a,e)}return function(r,n){let a=this.data;e=n;let o=Ya(a,this._offsets,r,t);return e=void 0,o}}function Ls(c){let e;function t(r,n,a){let o=a,l=0,u=0;for(let _=n-1,d=r.length;++_<d;){let f=r[_];if(~(l=c(f,e,o)))return u+l;o=0,u+=f.length}return-1}return function(r,n){e=r;let a=this.data,o=typeof n!="number"?t(a,0,0):Ya(a,this._offsets,n,t);return e=void 0,o}}var H=class extends G{};function A_(c,e){return e===null&&c.length>0?0:-1}function L_(c,e){let{nullBitmap:t}=c;if(!t||c.nullCount<=0)return-1;let r=0;for(let n of new Rr(t,c.offset+(e||0),c.length,t,bs)){if(!n)return r;++r}return-1}function Z(c,e,t){if(e===void 0)return-1;if(e===null)switch(c.typeId){case b.Union:break;case b.Dictionary:break;default:return L_(c,t)}let r=Te.getVisitFn(c),n=Dr(e);for(let a=(t||0)-1,o=c.length;++a<o;)if(n(r(c,a)))return a;return-1}function Xc(c,e,t){let r=Te.getVisitFn(c),n=Dr(e);for(let a=(t||0)-1,o=c.length;++a<o;)if(n(r(c,a)))return a;return-1}H.prototype.visitNull=A_;H.prototype.visitBool=Z;H.prototype.visitInt=Z;H.prototype.visitInt8=Z;H.prototype.visitInt16=Z;H.prototype.visitInt32=Z;H.prototype.visitInt64=Z;H.prototype.visitUint8=Z;H.prototype.visitUint16=Z;H.prototype.visitUint32=Z;H.prototype.visitUint64=Z;H.prototype.visitFloat=Z;H.prototype.visitFloat16=Z;H.prototype.visitFloat32=Z;H.prototype.visitFloat64=Z;H.prototype.visitUtf8=Z;H.prototype.visitLargeUtf8=Z;H.prototype.visitBinary=Z;H.prototype.visitLargeBinary=Z;H.prototype.visitFixedSizeBinary=Z;H.prototype.visitDate=Z;H.prototype.visitDateDay=Z;H.prototype.visitDateMillisecond=Z;H.prototype.visitTimestamp=Z;H.prototype.visitTimestampSecond=Z;H.prototype.visitTimestampMillisecond=Z;H.prototype.visitTimestampMicrosecond=Z;H.prototype.visitTimestampNanosecond=Z;H.prototype.visitTime=Z;H.prototype.visitTimeSecond=Z;H.prototype.visitTimeMillisecond=Z;H.prototype.visitTimeMicrosecond=Z;H.prototype.visitTimeNanosecond=Z;H.prototype.visitDecimal=Z;H.prototype.visitList=Z;H.prototype.visitStruct=Z;H.prototype.visitUnion=Z;H.prototype.visitDenseUnion=Xc;H.prototype.visitSparseUnion=Xc;H.prototype.visitDictionary=Z;H.prototype.visitInterval=Z;H.prototype.visitIntervalDayTime=Z;H.prototype.visitIntervalYearMonth=Z;H.prototype.visitDuration=Z;H.prototype.visitDurationSecond=Z;H.prototype.visitDurationMillisecond=Z;H.prototype.visitDurationMicrosecond=Z;H.prototype.visitDurationNanosecond=Z;H.prototype.visitFixedSizeList=Z;H.prototype.visitMap=Z;var Or=new H;var N=class extends G{};function q(c){let{type:e}=c;if(c.nullCount===0&&c.stride===1&&(j.isInt(e)&&e.bitWidth!==64||j.isTime(e)&&e.bitWidth!==64||j.isFloat(e)&&e.precision!==pe.HALF))return new Ji(c.data.length,r=>{let n=c.data[r];return n.values.subarray(0,n.length)[Symbol.iterator]()});let t=0;return new Ji(c.data.length,r=>{let a=c.data[r].length,o=c.slice(t,t+a);return t+=a,new Ja(o)})}var Ja=class{constructor(e){this.vector=e,this.index=0}next(){return this.index<this.vector.length?{value:this.vector.get(this.index++)}:{done:!0,value:null}}[Symbol.iterator](){return this}};N.prototype.visitNull=q;N.prototype.visitBool=q;N.prototype.visitInt=q;N.prototype.visitInt8=q;N.prototype.visitInt16=q;N.prototype.visitInt32=q;N.prototype.visitInt64=q;N.prototype.visitUint8=q;N.prototype.visitUint16=q;N.prototype.visitUint32=q;N.prototype.visitUint64=q;N.prototype.visitFloat=q;N.prototype.visitFloat16=q;N.prototype.visitFloat32=q;N.prototype.visitFloat64=q;N.prototype.visitUtf8=q;N.prototype.visitLargeUtf8=q;N.prototype.visitBinary=q;N.prototype.visitLargeBinary=q;N.prototype.visitFixedSizeBinary=q;N.prototype.visitDate=q;N.prototype.visitDateDay=q;N.prototype.visitDateMillisecond=q;N.prototype.visitTimestamp=q;N.prototype.visitTimestampSecond=q;N.prototype.visitTimestampMillisecond=q;N.prototype.visitTimestampMicrosecond=q;N.prototype.visitTimestampNanosecond=q;N.prototype.visitTime=q;N.prototype.visitTimeSecond=q;N.prototype.visitTimeMillisecond=q;N.prototype.visitTimeMicrosecond=q;N.prototype.visitTimeNanosecond=q;N.prototype.visitDecimal=q;N.prototype.visitList=q;N.prototype.visitStruct=q;N.prototype.visitUnion=q;N.prototype.visitDenseUnion=q;N.prototype.visitSparseUnion=q;N.prototype.visitDictionary=q;N.prototype.visitInterval=q;N.prototype.visitIntervalDayTime=q;N.prototype.visitIntervalYearMonth=q;N.prototype.visitDuration=q;N.prototype.visitDurationSecond=q;N.prototype.visitDurationMillisecond=q;N.prototype.visitDurationMicrosecond=q;N.prototype.visitDurationNanosecond=q;N.prototype.visitFixedSizeList=q;N.prototype.visitMap=q;var pi=new N;var Qc,Yc={},Jc={},ae=class c{constructor(e){var t,r,n;let a=e[0]instanceof c?e.flatMap(l=>l.data):e;if(a.length===0||a.some(l=>!(l instanceof le)))throw new TypeError("Vector constructor expects an Array of Data instances.");let o=(t=a[0])===null||t===void 0?void 0:t.type;switch(a.length){case 0:this._offsets=[0];break;case 1:{let{get:l,set:u,indexOf:_}=Yc[o.typeId],d=a[0];this.isValid=f=>Ki(d,f),this.get=f=>l(d,f),this.set=(f,p)=>u(d,f,p),this.indexOf=f=>_(d,f),this._offsets=[0,d.length];break}default:Object.setPrototypeOf(this,Jc[o.typeId]),this._offsets=ws(a);break}this.data=a,this.type=o,this.stride=tt(o),this.numChildren=(n=(r=o.children)===null||r===void 0?void 0:r.length)!==null&&n!==void 0?n:0,this.length=this._offsets.at(-1)}get byteLength(){return this.data.reduce((e,t)=>e+t.byteLength,0)}get nullable(){return qc(this.data)}get nullCount(){return Ss(this.data)}get ArrayType(){return this.type.ArrayType}get[Symbol.toStringTag](){return"".concat(this.VectorName,"<").concat(this.type[Symbol.toStringTag],">")}get VectorName(){return"".concat(b[this.type.typeId],"Vector")}isValid(e){return!1}get(e){return null}at(e){return this.get(jr(e,this.length))}set(e,t){}indexOf(e,t){return-1}includes(e,t){return this.indexOf(e,t)>-1}[Symbol.iterator](){return pi.visit(this)}concat(...e){return new c(this.data.concat(e.flatMap(t=>t.data).flat(Number.POSITIVE_INFINITY)))}slice(e,t){return new c(Qi(this,e,t,({data:r,_offsets:n},a,o)=>Es(r,n,a,o)))}toJSON(){return[...this]}toArray(){let{type:e,data:t,length:r,stride:n,ArrayType:a}=this;switch(e.typeId){case b.Int:case b.Float:case b.Decimal:case b.Time:case b.Timestamp:switch(t.length){case 0:return new a;case 1:return t[0].values.subarray(0,r*n);default:return t.reduce((o,{values:l,length:u})=>(o.array.set(l.subarray(0,u*n),o.offset),o.offset+=u*n,o),{array:new a(r*n),offset:0}).array}}return[...this]}toString(){return"[".concat([...this].join(","),"]")}getChild(e){var t;return this.getChildAt((t=this.type.children)===null||t===void 0?void 0:t.findIndex(r=>r.name===e))}getChildAt(e){return e>-1&&e<this.numChildren?new c(this.data.map(({children:t})=>t[e])):null}get isMemoized(){return j.isDictionary(this.type)?this.data[0].dictionary.isMemoized:!1}memoize(){if(j.isDictionary(this.type)){let e=new ks(this.data[0].dictionary),t=this.data.map(r=>{let n=r.clone();return n.dictionary=e,n});return new c(t)}return new ks(this)}unmemoize(){if(j.isDictionary(this.type)&&this.isMemoized){let e=this.data[0].dictionary.unmemoize(),t=this.data.map(r=>{let n=r.clone();return n.dictionary=e,n});return new c(t)}return this}};Qc=Symbol.toStringTag;ae[Qc]=(c=>{c.type=j.prototype,c.data=[],c.length=0,c.stride=1,c.numChildren=0,c._offsets=new Uint32Array([0]),c[Symbol.isConcatSpreadable]=!0;let e=Object.keys(b).map(t=>b[t]).filter(t=>typeof t=="number"&&t!==b.NONE);for(let t of e){let r=Te.getVisitFnByTypeId(t),n=je.getVisitFnByTypeId(t),a=Or.getVisitFnByTypeId(t);Yc[t]={get:r,set:n,indexOf:a},Jc[t]=Object.create(c,{isValid:{value:fi(Ki)},get:{value:fi(Te.getVisitFnByTypeId(t))},set:{value:As(je.getVisitFnByTypeId(t))},indexOf:{value:Ls(Or.getVisitFnByTypeId(t))}})}return"Vector"})(ae.prototype);var ks=class c extends ae{constructor(e){super(e.data);let t=this.get,r=this.set,n=this.slice,a=new Array(this.length);Object.defineProperty(this,"get",{value(o){let l=a[o];if(l!==void 0)return l;let u=t.call(this,o);return a[o]=u,u}}),Object.defineProperty(this,"set",{value(o,l){r.call(this,o,l),a[o]=l}}),Object.defineProperty(this,"slice",{value:(o,l)=>new c(n.call(this,o,l))}),Object.defineProperty(this,"isMemoized",{value:!0}),Object.defineProperty(this,"unmemoize",{value:()=>new ae(this.data)}),Object.defineProperty(this,"memoize",{value:()=>this})}};function Kc(c){if(!c||c.length<=0)return function(n){return!0};let e="",t=c.filter(r=>r===r);return t.length>0&&(e="\n    switch (x) {".concat(t.map(r=>"\n        case ".concat(k_(r),":")).join(""),"\n            return false;\n    }")),c.length!==t.length&&(e="if (x !== x) return false;\n".concat(e)),new Function("x","".concat(e,"\nreturn true;"))}function k_(c){return typeof c!="bigint"?gt(c):"".concat(gt(c),"n")}function Ka(c,e){let t=Math.ceil(c)*e-1;return(t-t%64+64||64)/e}function Zc(c,e=0){return c.length>=e?c.subarray(0,e):Pi(new c.constructor(e),c,0)}var At=class{constructor(e,t=0,r=1){this.length=Math.ceil(t/r),this.buffer=new e(this.length),this.stride=r,this.BYTES_PER_ELEMENT=e.BYTES_PER_ELEMENT,this.ArrayType=e}get byteLength(){return Math.ceil(this.length*this.stride)*this.BYTES_PER_ELEMENT}get reservedLength(){return this.buffer.length/this.stride}get reservedByteLength(){return this.buffer.byteLength}set(e,t){return this}append(e){return this.set(this.length,e)}reserve(e){if(e>0){this.length+=e;let t=this.stride,r=this.length*t,n=this.buffer.length;r>=n&&this._resize(n===0?Ka(r*1,this.BYTES_PER_ELEMENT):Ka(r*2,this.BYTES_PER_ELEMENT))}return this}flush(e=this.length){e=Ka(e*this.stride,this.BYTES_PER_ELEMENT);let t=Zc(this.buffer,e);return this.clear(),t}clear(){return this.length=0,this.buffer=new this.ArrayType,this}_resize(e){return this.buffer=Zc(this.buffer,e)}},ir=class extends At{last(){return this.get(this.length-1)}get(e){return this.buffer[e]}set(e,t){return this.reserve(e-this.length+1),this.buffer[e*this.stride]=t,this}},mi=class extends ir{constructor(){super(Uint8Array,0,1/8),this.numValid=0}get numInvalid(){return this.length-this.numValid}get(e){return this.buffer[e>>3]>>e%8&1}set(e,t){let{buffer:r}=this.reserve(e-this.length+1),n=e>>3,a=e%8,o=r[n]>>a&1;return t?o===0&&(r[n]|=1<<a,++this.numValid):o===1&&(r[n]&=~(1<<a),--this.numValid),this}clear(){return this.numValid=0,super.clear()}},hi=class extends ir{constructor(e){super(e.OffsetArrayType,1,1)}append(e){return this.set(this.length-1,e)}set(e,t){let r=this.length-1,n=this.reserve(e-r+1).buffer;return r<e++&&r>=0&&n.fill(n[r],r,e),n[e]=n[e-1]+t,this}flush(e=this.length-1){return e>this.length&&this.set(e-1,this.BYTES_PER_ELEMENT>4?BigInt(0):0),super.flush(e+1)}};var Se=class{static throughNode(e){throw new Error('"throughNode" not available in this environment')}static throughDOM(e){throw new Error('"throughDOM" not available in this environment')}constructor({type:e,nullValues:t}){this.length=0,this.finished=!1,this.type=e,this.children=[],this.nullValues=t,this.stride=tt(e),this._nulls=new mi,t&&t.length>0&&(this._isValid=Kc(t))}toVector(){return new ae([this.flush()])}get ArrayType(){return this.type.ArrayType}get nullCount(){return this._nulls.numInvalid}get numChildren(){return this.children.length}get byteLength(){let e=0,{_offsets:t,_values:r,_nulls:n,_typeIds:a,children:o}=this;return t&&(e+=t.byteLength),r&&(e+=r.byteLength),n&&(e+=n.byteLength),a&&(e+=a.byteLength),o.reduce((l,u)=>l+u.byteLength,e)}get reservedLength(){return this._nulls.reservedLength}get reservedByteLength(){let e=0;return this._offsets&&(e+=this._offsets.reservedByteLength),this._values&&(e+=this._values.reservedByteLength),this._nulls&&(e+=this._nulls.reservedByteLength),this._typeIds&&(e+=this._typeIds.reservedByteLength),this.children.reduce((t,r)=>t+r.reservedByteLength,e)}get valueOffsets(){return this._offsets?this._offsets.buffer:null}get values(){return this._values?this._values.buffer:null}get nullBitmap(){return this._nulls?this._nulls.buffer:null}get typeIds(){return this._typeIds?this._typeIds.buffer:null}append(e){return this.set(this.length,e)}isValid(e){return this._isValid(e)}set(e,t){return this.setValid(e,this.isValid(t))&&this.setValue(e,t),this}setValue(e,t){this._setValue(this,e,t)}setValid(e,t){return this.length=this._nulls.set(e,+t).length,t}addChild(e,t="".concat(this.numChildren)){throw new Error('Cannot append children to non-nested type "'.concat(this.type,'"'))}getChildAt(e){return this.children[e]||null}flush(){let e,t,r,n,{type:a,length:o,nullCount:l,_typeIds:u,_offsets:_,_values:d,_nulls:f}=this;(t=u==null?void 0:u.flush(o))?n=_==null?void 0:_.flush(o):(n=_==null?void 0:_.flush(o))?e=d==null?void 0:d.flush(_.last()):e=d==null?void 0:d.flush(o),l>0&&(r=f==null?void 0:f.flush(o));let p=this.children.map(m=>m.flush());return this.clear(),K({type:a,length:o,nullCount:l,children:p,child:p[0],data:e,typeIds:t,nullBitmap:r,valueOffsets:n})}finish(){this.finished=!0;for(let e of this.children)e.finish();return this}clear(){var e,t,r,n;this.length=0,(e=this._nulls)===null||e===void 0||e.clear(),(t=this._values)===null||t===void 0||t.clear(),(r=this._offsets)===null||r===void 0||r.clear(),(n=this._typeIds)===null||n===void 0||n.clear();for(let a of this.children)a.clear();return this}};Se.prototype.length=1;Se.prototype.stride=1;Se.prototype.children=null;Se.prototype.finished=!1;Se.prototype.nullValues=null;Se.prototype._isValid=()=>!0;var Fe=class extends Se{constructor(e){super(e),this._values=new ir(this.ArrayType,0,this.stride)}setValue(e,t){let r=this._values;return r.reserve(e-r.length+1),super.setValue(e,t)}},ze=class extends Se{constructor(e){super(e),this._pendingLength=0,this._offsets=new hi(e.type)}setValue(e,t){let r=this._pending||(this._pending=new Map),n=r.get(e);n&&(this._pendingLength-=n.length),this._pendingLength+=t instanceof jt?t[kr].length:t.length,r.set(e,t)}setValid(e,t){return super.setValid(e,t)?!0:((this._pending||(this._pending=new Map)).set(e,void 0),!1)}clear(){return this._pendingLength=0,this._pending=void 0,super.clear()}flush(){return this._flush(),super.flush()}finish(){return this._flush(),super.finish()}_flush(){let e=this._pending,t=this._pendingLength;return this._pendingLength=0,this._pending=void 0,e&&e.size>0&&this._flushPending(e,t),this}};var Hr=class{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}offset(){return this.bb.readInt64(this.bb_pos)}metaDataLength(){return this.bb.readInt32(this.bb_pos+8)}bodyLength(){return this.bb.readInt64(this.bb_pos+16)}static sizeOf(){return 24}static createBlock(e,t,r,n){return e.prep(8,24),e.writeInt64(BigInt(n!=null?n:0)),e.pad(4),e.writeInt32(r),e.writeInt64(BigInt(t!=null?t:0)),e.offset()}};var rt=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsFooter(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsFooter(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}version(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):ue.V1}schema(e){let t=this.bb.__offset(this.bb_pos,6);return t?(e||new Ve).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}dictionaries(e,t){let r=this.bb.__offset(this.bb_pos,8);return r?(t||new Hr).__init(this.bb.__vector(this.bb_pos+r)+e*24,this.bb):null}dictionariesLength(){let e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}recordBatches(e,t){let r=this.bb.__offset(this.bb_pos,10);return r?(t||new Hr).__init(this.bb.__vector(this.bb_pos+r)+e*24,this.bb):null}recordBatchesLength(){let e=this.bb.__offset(this.bb_pos,10);return e?this.bb.__vector_len(this.bb_pos+e):0}customMetadata(e,t){let r=this.bb.__offset(this.bb_pos,12);return r?(t||new Me).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+r)+e*4),this.bb):null}customMetadataLength(){let e=this.bb.__offset(this.bb_pos,12);return e?this.bb.__vector_len(this.bb_pos+e):0}static startFooter(e){e.startObject(5)}static addVersion(e,t){e.addFieldInt16(0,t,ue.V1)}static addSchema(e,t){e.addFieldOffset(1,t,0)}static addDictionaries(e,t){e.addFieldOffset(2,t,0)}static startDictionariesVector(e,t){e.startVector(24,t,8)}static addRecordBatches(e,t){e.addFieldOffset(3,t,0)}static startRecordBatchesVector(e,t){e.startVector(24,t,8)}static addCustomMetadata(e,t){e.addFieldOffset(4,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let r=t.length-1;r>=0;r--)e.addOffset(t[r]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static endFooter(e){return e.endObject()}static finishFooterBuffer(e,t){e.finish(t)}static finishSizePrefixedFooterBuffer(e,t){e.finish(t,void 0,!0)}};var de=class c{constructor(e=[],t,r,n=ue.V5){this.fields=e||[],this.metadata=t||new Map,r||(r=Za(this.fields)),this.dictionaries=r,this.metadataVersion=n}get[Symbol.toStringTag](){return"Schema"}get names(){return this.fields.map(e=>e.name)}toString(){return"Schema<{ ".concat(this.fields.map((e,t)=>"".concat(t,": ").concat(e)).join(", ")," }>")}select(e){let t=new Set(e),r=this.fields.filter(n=>t.has(n.name));return new c(r,this.metadata)}selectAt(e){let t=e.map(r=>this.fields[r]).filter(Boolean);return new c(t,this.metadata)}assign(...e){let t=e[0]instanceof c?e[0]:Array.isArray(e[0])?new c(e[0]):new c(e),r=[...this.fields],n=Ds(Ds(new Map,this.metadata),t.metadata),a=t.fields.filter(l=>{let u=r.findIndex(_=>_.name===l.name);return~u?(r[u]=l.clone({metadata:Ds(Ds(new Map,r[u].metadata),l.metadata)}))&&!1:!0}),o=Za(a,new Map);return new c([...r,...a],n,new Map([...this.dictionaries,...o]))}};de.prototype.fields=null;de.prototype.metadata=null;de.prototype.dictionaries=null;var ne=class c{static new(...e){let[t,r,n,a]=e;return e[0]&&typeof e[0]=="object"&&({name:t}=e[0],r===void 0&&(r=e[0].type),n===void 0&&(n=e[0].nullable),a===void 0&&(a=e[0].metadata)),new c("".concat(t),r,n,a)}constructor(e,t,r=!1,n){this.name=e,this.type=t,this.nullable=r,this.metadata=n||new Map}get typeId(){return this.type.typeId}get[Symbol.toStringTag](){return"Field"}toString(){return"".concat(this.name,": ").concat(this.type)}clone(...e){let[t,r,n,a]=e;return!e[0]||typeof e[0]!="object"?[t=this.name,r=this.type,n=this.nullable,a=this.metadata]=e:{name:t=this.name,type:r=this.type,nullable:n=this.nullable,metadata:a=this.metadata}=e[0],c.new(t,r,n,a)}};ne.prototype.type=null;ne.prototype.name=null;ne.prototype.nullable=null;ne.prototype.metadata=null;function Ds(c,e){return new Map([...c||new Map,...e||new Map])}function Za(c,e=new Map){for(let t=-1,r=c.length;++t<r;){let a=c[t].type;if(j.isDictionary(a)){if(!e.has(a.id))e.set(a.id,a.dictionary);else if(e.get(a.id)!==a.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}a.children&&a.children.length>0&&Za(a.children,e)}return e}var D_=Br,T_=Ke,nr=class{static decode(e){e=new T_(z(e));let t=rt.getRootAsFooter(e),r=de.decode(t.schema(),new Map,t.version());return new eo(r,t)}static encode(e){let t=new D_,r=de.encode(t,e.schema);rt.startRecordBatchesVector(t,e.numRecordBatches);for(let o of[...e.recordBatches()].slice().reverse())sr.encode(t,o);let n=t.endVector();rt.startDictionariesVector(t,e.numDictionaries);for(let o of[...e.dictionaryBatches()].slice().reverse())sr.encode(t,o);let a=t.endVector();return rt.startFooter(t),rt.addSchema(t,r),rt.addVersion(t,ue.V5),rt.addRecordBatches(t,n),rt.addDictionaries(t,a),rt.finishFooterBuffer(t,rt.endFooter(t)),t.asUint8Array()}get numRecordBatches(){return this._recordBatches.length}get numDictionaries(){return this._dictionaryBatches.length}constructor(e,t=ue.V5,r,n){this.schema=e,this.version=t,r&&(this._recordBatches=r),n&&(this._dictionaryBatches=n)}*recordBatches(){for(let e,t=-1,r=this.numRecordBatches;++t<r;)(e=this.getRecordBatch(t))&&(yield e)}*dictionaryBatches(){for(let e,t=-1,r=this.numDictionaries;++t<r;)(e=this.getDictionaryBatch(t))&&(yield e)}getRecordBatch(e){return e>=0&&e<this.numRecordBatches&&this._recordBatches[e]||null}getDictionaryBatch(e){return e>=0&&e<this.numDictionaries&&this._dictionaryBatches[e]||null}};var eo=class extends nr{get numRecordBatches(){return this._footer.recordBatchesLength()}get numDictionaries(){return this._footer.dictionariesLength()}constructor(e,t){super(e,t.version()),this._footer=t}getRecordBatch(e){if(e>=0&&e<this.numRecordBatches){let t=this._footer.recordBatches(e);if(t)return sr.decode(t)}return null}getDictionaryBatch(e){if(e>=0&&e<this.numDictionaries){let t=this._footer.dictionaries(e);if(t)return sr.decode(t)}return null}},sr=class c{static decode(e){return new c(e.metaDataLength(),e.bodyLength(),e.offset())}static encode(e,t){let{metaDataLength:r}=t,n=BigInt(t.offset),a=BigInt(t.bodyLength);return Hr.createBlock(e,n,r,a)}constructor(e,t,r){this.metaDataLength=e,this.offset=oe(r),this.bodyLength=oe(t)}};var be=Object.freeze({done:!0,value:void 0}),Zi=class{constructor(e){this._json=e}get schema(){return this._json.schema}get batches(){return this._json.batches||[]}get dictionaries(){return this._json.dictionaries||[]}},Nr=class{tee(){return this._getDOMStream().tee()}pipe(e,t){return this._getNodeStream().pipe(e,t)}pipeTo(e,t){return this._getDOMStream().pipeTo(e,t)}pipeThrough(e,t){return this._getDOMStream().pipeThrough(e,t)}_getDOMStream(){return this._DOMStream||(this._DOMStream=this.toDOMStream())}_getNodeStream(){return this._nodeStream||(this._nodeStream=this.toNodeStream())}},Ts=class extends Nr{constructor(){super(),this._values=[],this.resolvers=[],this._closedPromise=new Promise(e=>this._closedPromiseResolve=e)}get closed(){return this._closedPromise}cancel(e){return B(this,void 0,void 0,function*(){yield this.return(e)})}write(e){this._ensureOpen()&&(this.resolvers.length<=0?this._values.push(e):this.resolvers.shift().resolve({done:!1,value:e}))}abort(e){this._closedPromiseResolve&&(this.resolvers.length<=0?this._error={error:e}:this.resolvers.shift().reject({done:!0,value:e}))}close(){if(this._closedPromiseResolve){let{resolvers:e}=this;for(;e.length>0;)e.shift().resolve(be);this._closedPromiseResolve(),this._closedPromiseResolve=void 0}}[Symbol.asyncIterator](){return this}toDOMStream(e){return Be.toDOMStream(this._closedPromiseResolve||this._error?this:this._values,e)}toNodeStream(e){return Be.toNodeStream(this._closedPromiseResolve||this._error?this:this._values,e)}throw(e){return B(this,void 0,void 0,function*(){return yield this.abort(e),be})}return(e){return B(this,void 0,void 0,function*(){return yield this.close(),be})}read(e){return B(this,void 0,void 0,function*(){return(yield this.next(e,"read")).value})}peek(e){return B(this,void 0,void 0,function*(){return(yield this.next(e,"peek")).value})}next(...e){return this._values.length>0?Promise.resolve({done:!1,value:this._values.shift()}):this._error?Promise.reject({done:!0,value:this._error.error}):this._closedPromiseResolve?new Promise((t,r)=>{this.resolvers.push({resolve:t,reject:r})}):Promise.resolve(be)}_ensureOpen(){if(this._closedPromiseResolve)return!0;throw new Error("AsyncQueue is closed")}};var Rt=class extends Ts{write(e){if((e=z(e)).byteLength>0)return super.write(e)}toString(e=!1){return e?Ci(this.toUint8Array(!0)):this.toUint8Array(!1).then(Ci)}toUint8Array(e=!1){return e?Je(this._values)[0]:B(this,void 0,void 0,function*(){var t,r,n,a;let o=[],l=0;try{for(var u=!0,_=ut(this),d;d=yield _.next(),t=d.done,!t;u=!0){a=d.value,u=!1;let f=a;o.push(f),l+=f.byteLength}}catch(f){r={error:f}}finally{try{!u&&!t&&(n=_.return)&&(yield n.call(_))}finally{if(r)throw r.error}}return Je(o,l)[0]})}},Ut=class{constructor(e){e&&(this.source=new to(Be.fromIterable(e)))}[Symbol.iterator](){return this}next(e){return this.source.next(e)}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}peek(e){return this.source.peek(e)}read(e){return this.source.read(e)}},ot=class c{constructor(e){e instanceof c?this.source=e.source:e instanceof Rt?this.source=new ar(Be.fromAsyncIterable(e)):jn(e)?this.source=new ar(Be.fromNodeStream(e)):Mi(e)?this.source=new ar(Be.fromDOMStream(e)):In(e)?this.source=new ar(Be.fromDOMStream(e.body)):dt(e)?this.source=new ar(Be.fromIterable(e)):_t(e)?this.source=new ar(Be.fromAsyncIterable(e)):it(e)&&(this.source=new ar(Be.fromAsyncIterable(e)))}[Symbol.asyncIterator](){return this}next(e){return this.source.next(e)}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}get closed(){return this.source.closed}cancel(e){return this.source.cancel(e)}peek(e){return this.source.peek(e)}read(e){return this.source.read(e)}},to=class{constructor(e){this.source=e}cancel(e){this.return(e)}peek(e){return this.next(e,"peek").value}read(e){return this.next(e,"read").value}next(e,t="read"){return this.source.next({cmd:t,size:e})}throw(e){return Object.create(this.source.throw&&this.source.throw(e)||be)}return(e){return Object.create(this.source.return&&this.source.return(e)||be)}},ar=class{constructor(e){this.source=e,this._closedPromise=new Promise(t=>this._closedPromiseResolve=t)}cancel(e){return B(this,void 0,void 0,function*(){yield this.return(e)})}get closed(){return this._closedPromise}read(e){return B(this,void 0,void 0,function*(){return(yield this.next(e,"read")).value})}peek(e){return B(this,void 0,void 0,function*(){return(yield this.next(e,"peek")).value})}next(e){return B(this,arguments,void 0,function*(t,r="read"){return yield this.source.next({cmd:r,size:t})})}throw(e){return B(this,void 0,void 0,function*(){let t=this.source.throw&&(yield this.source.throw(e))||be;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(t)})}return(e){return B(this,void 0,void 0,function*(){let t=this.source.return&&(yield this.source.return(e))||be;return this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,Object.create(t)})}};var en=class extends Ut{constructor(e,t){super(),this.position=0,this.buffer=z(e),this.size=t===void 0?this.buffer.byteLength:t}readInt32(e){let{buffer:t,byteOffset:r}=this.readAt(e,4);return new DataView(t,r).getInt32(0,!0)}seek(e){return this.position=Math.min(e,this.size),e<this.size}read(e){let{buffer:t,size:r,position:n}=this;return t&&n<r?(typeof e!="number"&&(e=Number.POSITIVE_INFINITY),this.position=Math.min(r,n+Math.min(r-n,e)),t.subarray(n,this.position)):null}readAt(e,t){let r=this.buffer,n=Math.min(this.size,e+t);return r?r.subarray(e,n):new Uint8Array(t)}close(){this.buffer&&(this.buffer=null)}throw(e){return this.close(),{done:!0,value:e}}return(e){return this.close(),{done:!0,value:e}}},Tr=class extends ot{constructor(e,t){super(),this.position=0,this._handle=e,typeof t=="number"?this.size=t:this._pending=B(this,void 0,void 0,function*(){this.size=(yield e.stat()).size,delete this._pending})}readInt32(e){return B(this,void 0,void 0,function*(){let{buffer:t,byteOffset:r}=yield this.readAt(e,4);return new DataView(t,r).getInt32(0,!0)})}seek(e){return B(this,void 0,void 0,function*(){return this._pending&&(yield this._pending),this.position=Math.min(e,this.size),e<this.size})}read(e){return B(this,void 0,void 0,function*(){this._pending&&(yield this._pending);let{_handle:t,size:r,position:n}=this;if(t&&n<r){typeof e!="number"&&(e=Number.POSITIVE_INFINITY);let a=n,o=0,l=0,u=Math.min(r,a+Math.min(r-a,e)),_=new Uint8Array(Math.max(0,(this.position=u)-a));for(;(a+=l)<u&&(o+=l)<_.byteLength;)({bytesRead:l}=yield t.read(_,o,_.byteLength-o,a));return _}return null})}readAt(e,t){return B(this,void 0,void 0,function*(){this._pending&&(yield this._pending);let{_handle:r,size:n}=this;if(r&&e+t<n){let a=Math.min(n,e+t),o=new Uint8Array(a-e);return(yield r.read(o,0,t,e)).buffer}return new Uint8Array(t)})}close(){return B(this,void 0,void 0,function*(){let e=this._handle;this._handle=null,e&&(yield e.close())})}throw(e){return B(this,void 0,void 0,function*(){return yield this.close(),{done:!0,value:e}})}return(e){return B(this,void 0,void 0,function*(){return yield this.close(),{done:!0,value:e}})}};var io={};mr(io,{BaseInt64:()=>tn,Int128:()=>rn,Int64:()=>or,Uint64:()=>Ae});function gi(c){return c<0&&(c=4294967295+c+1),"0x".concat(c.toString(16))}var vi=8,ro=[1,10,100,1e3,1e4,1e5,1e6,1e7,1e8],tn=class{constructor(e){this.buffer=e}high(){return this.buffer[1]}low(){return this.buffer[0]}_times(e){let t=new Uint32Array([this.buffer[1]>>>16,this.buffer[1]&65535,this.buffer[0]>>>16,this.buffer[0]&65535]),r=new Uint32Array([e.buffer[1]>>>16,e.buffer[1]&65535,e.buffer[0]>>>16,e.buffer[0]&65535]),n=t[3]*r[3];this.buffer[0]=n&65535;let a=n>>>16;return n=t[2]*r[3],a+=n,n=t[3]*r[2]>>>0,a+=n,this.buffer[0]+=a<<16,this.buffer[1]=a>>>0<n?65536:0,this.buffer[1]+=a>>>16,this.buffer[1]+=t[1]*r[3]+t[2]*r[2]+t[3]*r[1],this.buffer[1]+=t[0]*r[3]+t[1]*r[2]+t[2]*r[1]+t[3]*r[0]<<16,this}_plus(e){let t=this.buffer[0]+e.buffer[0]>>>0;this.buffer[1]+=e.buffer[1],t<this.buffer[0]>>>0&&++this.buffer[1],this.buffer[0]=t}lessThan(e){return this.buffer[1]<e.buffer[1]||this.buffer[1]===e.buffer[1]&&this.buffer[0]<e.buffer[0]}equals(e){return this.buffer[1]===e.buffer[1]&&this.buffer[0]==e.buffer[0]}greaterThan(e){return e.lessThan(this)}hex(){return"".concat(gi(this.buffer[1])," ").concat(gi(this.buffer[0]))}},Ae=class c extends tn{times(e){return this._times(e),this}plus(e){return this._plus(e),this}static from(e,t=new Uint32Array(2)){return c.fromString(typeof e=="string"?e:e.toString(),t)}static fromNumber(e,t=new Uint32Array(2)){return c.fromString(e.toString(),t)}static fromString(e,t=new Uint32Array(2)){let r=e.length,n=new c(t);for(let a=0;a<r;){let o=vi<r-a?vi:r-a,l=new c(new Uint32Array([Number.parseInt(e.slice(a,a+o),10),0])),u=new c(new Uint32Array([ro[o],0]));n.times(u),n.plus(l),a+=o}return n}static convertArray(e){let t=new Uint32Array(e.length*2);for(let r=-1,n=e.length;++r<n;)c.from(e[r],new Uint32Array(t.buffer,t.byteOffset+2*r*4,2));return t}static multiply(e,t){return new c(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new c(new Uint32Array(e.buffer)).plus(t)}},or=class c extends tn{negate(){return this.buffer[0]=~this.buffer[0]+1,this.buffer[1]=~this.buffer[1],this.buffer[0]==0&&++this.buffer[1],this}times(e){return this._times(e),this}plus(e){return this._plus(e),this}lessThan(e){let t=this.buffer[1]<<0,r=e.buffer[1]<<0;return t<r||t===r&&this.buffer[0]<e.buffer[0]}static from(e,t=new Uint32Array(2)){return c.fromString(typeof e=="string"?e:e.toString(),t)}static fromNumber(e,t=new Uint32Array(2)){return c.fromString(e.toString(),t)}static fromString(e,t=new Uint32Array(2)){let r=e.startsWith("-"),n=e.length,a=new c(t);for(let o=r?1:0;o<n;){let l=vi<n-o?vi:n-o,u=new c(new Uint32Array([Number.parseInt(e.slice(o,o+l),10),0])),_=new c(new Uint32Array([ro[l],0]));a.times(_),a.plus(u),o+=l}return r?a.negate():a}static convertArray(e){let t=new Uint32Array(e.length*2);for(let r=-1,n=e.length;++r<n;)c.from(e[r],new Uint32Array(t.buffer,t.byteOffset+2*r*4,2));return t}static multiply(e,t){return new c(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new c(new Uint32Array(e.buffer)).plus(t)}},rn=class c{constructor(e){this.buffer=e}high(){return new or(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2))}low(){return new or(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset,2))}negate(){return this.buffer[0]=~this.buffer[0]+1,this.buffer[1]=~this.buffer[1],this.buffer[2]=~this.buffer[2],this.buffer[3]=~this.buffer[3],this.buffer[0]==0&&++this.buffer[1],this.buffer[1]==0&&++this.buffer[2],this.buffer[2]==0&&++this.buffer[3],this}times(e){let t=new Ae(new Uint32Array([this.buffer[3],0])),r=new Ae(new Uint32Array([this.buffer[2],0])),n=new Ae(new Uint32Array([this.buffer[1],0])),a=new Ae(new Uint32Array([this.buffer[0],0])),o=new Ae(new Uint32Array([e.buffer[3],0])),l=new Ae(new Uint32Array([e.buffer[2],0])),u=new Ae(new Uint32Array([e.buffer[1],0])),_=new Ae(new Uint32Array([e.buffer[0],0])),d=Ae.multiply(a,_);this.buffer[0]=d.low();let f=new Ae(new Uint32Array([d.high(),0]));return d=Ae.multiply(n,_),f.plus(d),d=Ae.multiply(a,u),f.plus(d),this.buffer[1]=f.low(),this.buffer[3]=f.lessThan(d)?1:0,this.buffer[2]=f.high(),new Ae(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2)).plus(Ae.multiply(r,_)).plus(Ae.multiply(n,u)).plus(Ae.multiply(a,l)),this.buffer[3]+=Ae.multiply(t,_).plus(Ae.multiply(r,u)).plus(Ae.multiply(n,l)).plus(Ae.multiply(a,o)).low(),this}plus(e){let t=new Uint32Array(4);return t[3]=this.buffer[3]+e.buffer[3]>>>0,t[2]=this.buffer[2]+e.buffer[2]>>>0,t[1]=this.buffer[1]+e.buffer[1]>>>0,t[0]=this.buffer[0]+e.buffer[0]>>>0,t[0]<this.buffer[0]>>>0&&++t[1],t[1]<this.buffer[1]>>>0&&++t[2],t[2]<this.buffer[2]>>>0&&++t[3],this.buffer[3]=t[3],this.buffer[2]=t[2],this.buffer[1]=t[1],this.buffer[0]=t[0],this}hex(){return"".concat(gi(this.buffer[3])," ").concat(gi(this.buffer[2])," ").concat(gi(this.buffer[1])," ").concat(gi(this.buffer[0]))}static multiply(e,t){return new c(new Uint32Array(e.buffer)).times(t)}static add(e,t){return new c(new Uint32Array(e.buffer)).plus(t)}static from(e,t=new Uint32Array(4)){return c.fromString(typeof e=="string"?e:e.toString(),t)}static fromNumber(e,t=new Uint32Array(4)){return c.fromString(e.toString(),t)}static fromString(e,t=new Uint32Array(4)){let r=e.startsWith("-"),n=e.length,a=new c(t);for(let o=r?1:0;o<n;){let l=vi<n-o?vi:n-o,u=new c(new Uint32Array([Number.parseInt(e.slice(o,o+l),10),0,0,0])),_=new c(new Uint32Array([ro[l],0,0,0]));a.times(_),a.plus(u),o+=l}return r?a.negate():a}static convertArray(e){let t=new Uint32Array(e.length*4);for(let r=-1,n=e.length;++r<n;)c.from(e[r],new Uint32Array(t.buffer,t.byteOffset+4*4*r,4));return t}};var nn=class extends G{constructor(e,t,r,n,a=ue.V5){super(),this.nodesIndex=-1,this.buffersIndex=-1,this.bytes=e,this.nodes=t,this.buffers=r,this.dictionaries=n,this.metadataVersion=a}visit(e){return super.visit(e instanceof ne?e.type:e)}visitNull(e,{length:t}=this.nextFieldNode()){return K({type:e,length:t})}visitBool(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),data:this.readData(e)})}visitInt(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),data:this.readData(e)})}visitFloat(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),data:this.readData(e)})}visitUtf8(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),valueOffsets:this.readOffsets(e),data:this.readData(e)})}visitLargeUtf8(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),valueOffsets:this.readOffsets(e),data:this.readData(e)})}visitBinary(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),valueOffsets:this.readOffsets(e),data:this.readData(e)})}visitLargeBinary(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),valueOffsets:this.readOffsets(e),data:this.readData(e)})}visitFixedSizeBinary(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),data:this.readData(e)})}visitDate(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),data:this.readData(e)})}visitTimestamp(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),data:this.readData(e)})}visitTime(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),data:this.readData(e)})}visitDecimal(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),data:this.readData(e)})}visitList(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),valueOffsets:this.readOffsets(e),child:this.visit(e.children[0])})}visitStruct(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),children:this.visitMany(e.children)})}visitUnion(e,{length:t,nullCount:r}=this.nextFieldNode()){return this.metadataVersion<ue.V5&&this.readNullBitmap(e,r),e.mode===he.Sparse?this.visitSparseUnion(e,{length:t,nullCount:r}):this.visitDenseUnion(e,{length:t,nullCount:r})}visitDenseUnion(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,typeIds:this.readTypeIds(e),valueOffsets:this.readOffsets(e),children:this.visitMany(e.children)})}visitSparseUnion(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,typeIds:this.readTypeIds(e),children:this.visitMany(e.children)})}visitDictionary(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),data:this.readData(e.indices),dictionary:this.readDictionary(e)})}visitInterval(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),data:this.readData(e)})}visitDuration(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),data:this.readData(e)})}visitFixedSizeList(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),child:this.visit(e.children[0])})}visitMap(e,{length:t,nullCount:r}=this.nextFieldNode()){return K({type:e,length:t,nullCount:r,nullBitmap:this.readNullBitmap(e,r),valueOffsets:this.readOffsets(e),child:this.visit(e.children[0])})}nextFieldNode(){return this.nodes[++this.nodesIndex]}nextBufferRange(){return this.buffers[++this.buffersIndex]}readNullBitmap(e,t,r=this.nextBufferRange()){return t>0&&this.readData(e,r)||new Uint8Array(0)}readOffsets(e,t){return this.readData(e,t)}readTypeIds(e,t){return this.readData(e,t)}readData(e,{length:t,offset:r}=this.nextBufferRange()){return this.bytes.subarray(r,r+t)}readDictionary(e){return this.dictionaries.get(e.id)}},Fs=class extends nn{constructor(e,t,r,n,a){super(new Uint8Array(0),t,r,n,a),this.sources=e}readNullBitmap(e,t,{offset:r}=this.nextBufferRange()){return t<=0?new Uint8Array(0):Gr(this.sources[r])}readOffsets(e,{offset:t}=this.nextBufferRange()){return ie(Uint8Array,ie(e.OffsetArrayType,this.sources[t]))}readTypeIds(e,{offset:t}=this.nextBufferRange()){return ie(Uint8Array,ie(e.ArrayType,this.sources[t]))}readData(e,{offset:t}=this.nextBufferRange()){let{sources:r}=this;return j.isTimestamp(e)?ie(Uint8Array,or.convertArray(r[t])):(j.isInt(e)||j.isTime(e))&&e.bitWidth===64||j.isDuration(e)?ie(Uint8Array,or.convertArray(r[t])):j.isDate(e)&&e.unit===Le.MILLISECOND?ie(Uint8Array,or.convertArray(r[t])):j.isDecimal(e)?ie(Uint8Array,rn.convertArray(r[t])):j.isBinary(e)||j.isLargeBinary(e)||j.isFixedSizeBinary(e)?F_(r[t]):j.isBool(e)?Gr(r[t]):j.isUtf8(e)||j.isLargeUtf8(e)?xt(r[t].join("")):ie(Uint8Array,ie(e.ArrayType,r[t].map(n=>+n)))}};function F_(c){let e=c.join(""),t=new Uint8Array(e.length/2);for(let r=0;r<e.length;r+=2)t[r>>1]=Number.parseInt(e.slice(r,r+2),16);return t}var yi=class extends ze{constructor(e){super(e),this._values=new At(Uint8Array)}get byteLength(){let e=this._pendingLength+this.length*4;return this._offsets&&(e+=this._offsets.byteLength),this._values&&(e+=this._values.byteLength),this._nulls&&(e+=this._nulls.byteLength),e}setValue(e,t){return super.setValue(e,z(t))}_flushPending(e,t){let r=this._offsets,n=this._values.reserve(t).buffer,a=0;for(let[o,l]of e)if(l===void 0)r.set(o,0);else{let u=l.length;n.set(l,a),r.set(o,u),a+=u}}};var bi=class extends ze{constructor(e){super(e),this._values=new At(Uint8Array)}get byteLength(){let e=this._pendingLength+this.length*4;return this._offsets&&(e+=this._offsets.byteLength),this._values&&(e+=this._values.byteLength),this._nulls&&(e+=this._nulls.byteLength),e}setValue(e,t){return super.setValue(e,z(t))}_flushPending(e,t){let r=this._offsets,n=this._values.reserve(t).buffer,a=0;for(let[o,l]of e)if(l===void 0)r.set(o,BigInt(0));else{let u=l.length;n.set(l,a),r.set(o,BigInt(u)),a+=u}}};var xs=class extends Se{constructor(e){super(e),this._values=new mi}setValue(e,t){this._values.set(e,+t)}};var Wr=class extends Fe{};Wr.prototype._setValue=ja;var sn=class extends Wr{};sn.prototype._setValue=ts;var an=class extends Wr{};an.prototype._setValue=rs;var on=class extends Fe{};on.prototype._setValue=Ga;var Cs=class extends Se{constructor({type:e,nullValues:t,dictionaryHashFunction:r}){super({type:new et(e.dictionary,e.indices,e.id,e.isOrdered)}),this._nulls=null,this._dictionaryOffset=0,this._keysToIndices=Object.create(null),this.indices=Vr({type:this.type.indices,nullValues:t}),this.dictionary=Vr({type:this.type.dictionary,nullValues:null}),typeof r=="function"&&(this.valueToKey=r)}get values(){return this.indices.values}get nullCount(){return this.indices.nullCount}get nullBitmap(){return this.indices.nullBitmap}get byteLength(){return this.indices.byteLength+this.dictionary.byteLength}get reservedLength(){return this.indices.reservedLength+this.dictionary.reservedLength}get reservedByteLength(){return this.indices.reservedByteLength+this.dictionary.reservedByteLength}isValid(e){return this.indices.isValid(e)}setValid(e,t){let r=this.indices;return t=r.setValid(e,t),this.length=r.length,t}setValue(e,t){let r=this._keysToIndices,n=this.valueToKey(t),a=r[n];return a===void 0&&(r[n]=a=this._dictionaryOffset+this.dictionary.append(t).length-1),this.indices.setValue(e,a)}flush(){let e=this.type,t=this._dictionary,r=this.dictionary.toVector(),n=this.indices.flush().clone(e);return n.dictionary=t?t.concat(r):r,this.finished||(this._dictionaryOffset+=r.length),this._dictionary=n.dictionary,this.clear(),n}finish(){return this.indices.finish(),this.dictionary.finish(),this._dictionaryOffset=0,this._keysToIndices=Object.create(null),super.finish()}clear(){return this.indices.clear(),this.dictionary.clear(),super.clear()}valueToKey(e){return typeof e=="string"?e:"".concat(e)}};var cn=class extends Fe{};cn.prototype._setValue=Ba;var Ms=class extends Se{setValue(e,t){let[r]=this.children,n=e*this.stride;for(let a=-1,o=t.length;++a<o;)r.set(n+a,t[a])}addChild(e,t="0"){if(this.numChildren>0)throw new Error("FixedSizeListBuilder can only have one child.");let r=this.children.push(e);return this.type=new St(this.type.listSize,new ne(t,e.type,!0)),r}};var zr=class extends Fe{setValue(e,t){this._values.set(e,t)}},Ps=class extends zr{setValue(e,t){super.setValue(e,Xi(t))}},Is=class extends zr{},Bs=class extends zr{};var $r=class extends Fe{};$r.prototype._setValue=Oa;var ln=class extends $r{};ln.prototype._setValue=_s;var un=class extends $r{};un.prototype._setValue=ds;var cr=class extends Fe{};cr.prototype._setValue=Ha;var _n=class extends cr{};_n.prototype._setValue=ps;var dn=class extends cr{};dn.prototype._setValue=ms;var fn=class extends cr{};fn.prototype._setValue=hs;var pn=class extends cr{};pn.prototype._setValue=gs;var ct=class extends Fe{setValue(e,t){this._values.set(e,t)}},js=class extends ct{},Rs=class extends ct{},Us=class extends ct{},Gs=class extends ct{},Os=class extends ct{},Hs=class extends ct{},Ns=class extends ct{},Ws=class extends ct{};var Vs=class extends ze{constructor(e){super(e),this._offsets=new hi(e.type)}addChild(e,t="0"){if(this.numChildren>0)throw new Error("ListBuilder can only have one child.");return this.children[this.numChildren]=e,this.type=new yt(new ne(t,e.type,!0)),this.numChildren-1}_flushPending(e){let t=this._offsets,[r]=this.children;for(let[n,a]of e)if(typeof a>"u")t.set(n,0);else{let o=a,l=o.length,u=t.set(n,l).buffer[n];for(let _=-1;++_<l;)r.set(u+_,o[_])}}};var zs=class extends ze{set(e,t){return super.set(e,t)}setValue(e,t){let r=t instanceof Map?t:new Map(Object.entries(t)),n=this._pending||(this._pending=new Map),a=n.get(e);a&&(this._pendingLength-=a.size),this._pendingLength+=r.size,n.set(e,r)}addChild(e,t="".concat(this.numChildren)){if(this.numChildren>0)throw new Error("ListBuilder can only have one child.");return this.children[this.numChildren]=e,this.type=new wt(new ne(t,e.type,!0),this.type.keysSorted),this.numChildren-1}_flushPending(e){let t=this._offsets,[r]=this.children;for(let[n,a]of e)if(a===void 0)t.set(n,0);else{let{[n]:o,[n+1]:l}=t.set(n,a.size).buffer;for(let u of a.entries())if(r.set(o,u),++o>=l)break}}};var $s=class extends Se{setValue(e,t){}setValid(e,t){return this.length=Math.max(e+1,this.length),t}};var qs=class extends Se{setValue(e,t){let{children:r,type:n}=this;switch(Array.isArray(t)||t.constructor){case!0:return n.children.forEach((a,o)=>r[o].set(e,t[o]));case Map:return n.children.forEach((a,o)=>r[o].set(e,t.get(a.name)));default:return n.children.forEach((a,o)=>r[o].set(e,t[a.name]))}}setValid(e,t){return super.setValid(e,t)||this.children.forEach(r=>r.setValid(e,t)),t}addChild(e,t="".concat(this.numChildren)){let r=this.children.push(e);return this.type=new ye([...this.type.children,new ne(t,e.type,!0)]),r}};var lr=class extends Fe{};lr.prototype._setValue=Ra;var mn=class extends lr{};mn.prototype._setValue=is;var hn=class extends lr{};hn.prototype._setValue=ns;var gn=class extends lr{};gn.prototype._setValue=ss;var vn=class extends lr{};vn.prototype._setValue=as;var ur=class extends Fe{};ur.prototype._setValue=Ua;var yn=class extends ur{};yn.prototype._setValue=os;var bn=class extends ur{};bn.prototype._setValue=cs;var Sn=class extends ur{};Sn.prototype._setValue=ls;var wn=class extends ur{};wn.prototype._setValue=us;var Si=class extends Se{constructor(e){super(e),this._typeIds=new ir(Int8Array,0,1),typeof e.valueToChildTypeId=="function"&&(this._valueToChildTypeId=e.valueToChildTypeId)}get typeIdToChildIndex(){return this.type.typeIdToChildIndex}append(e,t){return this.set(this.length,e,t)}set(e,t,r){return r===void 0&&(r=this._valueToChildTypeId(this,t,e)),this.setValue(e,t,r),this}setValue(e,t,r){this._typeIds.set(e,r);let n=this.type.typeIdToChildIndex[r],a=this.children[n];a==null||a.set(e,t)}addChild(e,t="".concat(this.children.length)){let r=this.children.push(e),{type:{children:n,mode:a,typeIds:o}}=this,l=[...n,new ne(t,e.type)];return this.type=new bt(a,[...o,r],l),r}_valueToChildTypeId(e,t,r){throw new Error("Cannot map UnionBuilder value to child typeId. Pass the `childTypeId` as the second argument to unionBuilder.append(), or supply a `valueToChildTypeId` function as part of the UnionBuilder constructor options.")}},Xs=class extends Si{},Qs=class extends Si{constructor(e){super(e),this._offsets=new ir(Int32Array)}setValue(e,t,r){let n=this._typeIds.set(e,r).buffer[e],a=this.getChildAt(this.type.typeIdToChildIndex[n]),o=this._offsets.set(e,a.length).buffer[e];a==null||a.set(o,t)}};var En=class extends ze{constructor(e){super(e),this._values=new At(Uint8Array)}get byteLength(){let e=this._pendingLength+this.length*4;return this._offsets&&(e+=this._offsets.byteLength),this._values&&(e+=this._values.byteLength),this._nulls&&(e+=this._nulls.byteLength),e}setValue(e,t){return super.setValue(e,xt(t))}_flushPending(e,t){}};En.prototype._flushPending=yi.prototype._flushPending;var An=class extends ze{constructor(e){super(e),this._values=new At(Uint8Array)}get byteLength(){let e=this._pendingLength+this.length*4;return this._offsets&&(e+=this._offsets.byteLength),this._values&&(e+=this._values.byteLength),this._nulls&&(e+=this._nulls.byteLength),e}setValue(e,t){return super.setValue(e,xt(t))}_flushPending(e,t){}};An.prototype._flushPending=bi.prototype._flushPending;var no=class extends G{visitNull(){return $s}visitBool(){return xs}visitInt(){return ct}visitInt8(){return js}visitInt16(){return Rs}visitInt32(){return Us}visitInt64(){return Gs}visitUint8(){return Os}visitUint16(){return Hs}visitUint32(){return Ns}visitUint64(){return Ws}visitFloat(){return zr}visitFloat16(){return Ps}visitFloat32(){return Is}visitFloat64(){return Bs}visitUtf8(){return En}visitLargeUtf8(){return An}visitBinary(){return yi}visitLargeBinary(){return bi}visitFixedSizeBinary(){return cn}visitDate(){return Wr}visitDateDay(){return sn}visitDateMillisecond(){return an}visitTimestamp(){return lr}visitTimestampSecond(){return mn}visitTimestampMillisecond(){return hn}visitTimestampMicrosecond(){return gn}visitTimestampNanosecond(){return vn}visitTime(){return ur}visitTimeSecond(){return yn}visitTimeMillisecond(){return bn}visitTimeMicrosecond(){return Sn}visitTimeNanosecond(){return wn}visitDecimal(){return on}visitList(){return Vs}visitStruct(){return qs}visitUnion(){return Si}visitDenseUnion(){return Qs}visitSparseUnion(){return Xs}visitDictionary(){return Cs}visitInterval(){return $r}visitIntervalDayTime(){return ln}visitIntervalYearMonth(){return un}visitDuration(){return cr}visitDurationSecond(){return _n}visitDurationMillisecond(){return dn}visitDurationMicrosecond(){return fn}visitDurationNanosecond(){return pn}visitFixedSizeList(){return Ms}visitMap(){return zs}},el=new no;var W=class extends G{compareSchemas(e,t){return e===t||t instanceof e.constructor&&this.compareManyFields(e.fields,t.fields)}compareManyFields(e,t){return e===t||Array.isArray(e)&&Array.isArray(t)&&e.length===t.length&&e.every((r,n)=>this.compareFields(r,t[n]))}compareFields(e,t){return e===t||t instanceof e.constructor&&e.name===t.name&&e.nullable===t.nullable&&this.visit(e.type,t.type)}};function Ne(c,e){return e instanceof c.constructor}function qr(c,e){return c===e||Ne(c,e)}function _r(c,e){return c===e||Ne(c,e)&&c.bitWidth===e.bitWidth&&c.isSigned===e.isSigned}function Ys(c,e){return c===e||Ne(c,e)&&c.precision===e.precision}function x_(c,e){return c===e||Ne(c,e)&&c.byteWidth===e.byteWidth}function so(c,e){return c===e||Ne(c,e)&&c.unit===e.unit}function Ln(c,e){return c===e||Ne(c,e)&&c.unit===e.unit&&c.timezone===e.timezone}function kn(c,e){return c===e||Ne(c,e)&&c.unit===e.unit&&c.bitWidth===e.bitWidth}function C_(c,e){return c===e||Ne(c,e)&&c.children.length===e.children.length&&Gt.compareManyFields(c.children,e.children)}function M_(c,e){return c===e||Ne(c,e)&&c.children.length===e.children.length&&Gt.compareManyFields(c.children,e.children)}function ao(c,e){return c===e||Ne(c,e)&&c.mode===e.mode&&c.typeIds.every((t,r)=>t===e.typeIds[r])&&Gt.compareManyFields(c.children,e.children)}function P_(c,e){return c===e||Ne(c,e)&&c.id===e.id&&c.isOrdered===e.isOrdered&&Gt.visit(c.indices,e.indices)&&Gt.visit(c.dictionary,e.dictionary)}function oo(c,e){return c===e||Ne(c,e)&&c.unit===e.unit}function Dn(c,e){return c===e||Ne(c,e)&&c.unit===e.unit}function I_(c,e){return c===e||Ne(c,e)&&c.listSize===e.listSize&&c.children.length===e.children.length&&Gt.compareManyFields(c.children,e.children)}function B_(c,e){return c===e||Ne(c,e)&&c.keysSorted===e.keysSorted&&c.children.length===e.children.length&&Gt.compareManyFields(c.children,e.children)}W.prototype.visitNull=qr;W.prototype.visitBool=qr;W.prototype.visitInt=_r;W.prototype.visitInt8=_r;W.prototype.visitInt16=_r;W.prototype.visitInt32=_r;W.prototype.visitInt64=_r;W.prototype.visitUint8=_r;W.prototype.visitUint16=_r;W.prototype.visitUint32=_r;W.prototype.visitUint64=_r;W.prototype.visitFloat=Ys;W.prototype.visitFloat16=Ys;W.prototype.visitFloat32=Ys;W.prototype.visitFloat64=Ys;W.prototype.visitUtf8=qr;W.prototype.visitLargeUtf8=qr;W.prototype.visitBinary=qr;W.prototype.visitLargeBinary=qr;W.prototype.visitFixedSizeBinary=x_;W.prototype.visitDate=so;W.prototype.visitDateDay=so;W.prototype.visitDateMillisecond=so;W.prototype.visitTimestamp=Ln;W.prototype.visitTimestampSecond=Ln;W.prototype.visitTimestampMillisecond=Ln;W.prototype.visitTimestampMicrosecond=Ln;W.prototype.visitTimestampNanosecond=Ln;W.prototype.visitTime=kn;W.prototype.visitTimeSecond=kn;W.prototype.visitTimeMillisecond=kn;W.prototype.visitTimeMicrosecond=kn;W.prototype.visitTimeNanosecond=kn;W.prototype.visitDecimal=qr;W.prototype.visitList=C_;W.prototype.visitStruct=M_;W.prototype.visitUnion=ao;W.prototype.visitDenseUnion=ao;W.prototype.visitSparseUnion=ao;W.prototype.visitDictionary=P_;W.prototype.visitInterval=oo;W.prototype.visitIntervalDayTime=oo;W.prototype.visitIntervalYearMonth=oo;W.prototype.visitDuration=Dn;W.prototype.visitDurationSecond=Dn;W.prototype.visitDurationMillisecond=Dn;W.prototype.visitDurationMicrosecond=Dn;W.prototype.visitDurationNanosecond=Dn;W.prototype.visitFixedSizeList=I_;W.prototype.visitMap=B_;var Gt=new W;function Xr(c,e){return Gt.compareSchemas(c,e)}function tl(c,e){return Gt.compareFields(c,e)}function rl(c,e){return Gt.visit(c,e)}function Vr(c){let e=c.type,t=new(el.getVisitFn(e)())(c);if(e.children&&e.children.length>0){let r=c.children||[],n={nullValues:c.nullValues},a=Array.isArray(r)?(o,l)=>r[l]||n:({name:o})=>r[o]||n;for(let[o,l]of e.children.entries()){let{type:u}=l,_=a(l,o);t.children.push(Vr(Object.assign(Object.assign({},_),{type:u})))}}return t}function Js(c,e){return j_(c,e.map(t=>t.data.concat()))}function j_(c,e){let t=[...c.fields],r=[],n={numBatches:e.reduce((f,p)=>Math.max(f,p.length),0)},a=0,o=0,l=-1,u=e.length,_,d=[];for(;n.numBatches-- >0;){for(o=Number.POSITIVE_INFINITY,l=-1;++l<u;)d[l]=_=e[l].shift(),o=Math.min(o,_?_.length:o);Number.isFinite(o)&&(d=R_(t,o,d,e,n),o>0&&(r[a++]=K({type:new ye(t),length:o,nullCount:0,children:d.slice()})))}return[c=c.assign(t),r.map(f=>new ke(c,f))]}function R_(c,e,t,r,n){var a;let o=(e+63&-64)>>3;for(let l=-1,u=r.length;++l<u;){let _=t[l],d=_==null?void 0:_.length;if(d>=e)d===e?t[l]=_:(t[l]=_.slice(0,e),n.numBatches=Math.max(n.numBatches,r[l].unshift(_.slice(e,d-e))));else{let f=c[l];c[l]=f.clone({nullable:!0}),t[l]=(a=_==null?void 0:_._changeLengthAndBackfillNullBitmap(e))!==null&&a!==void 0?a:K({type:f.type,length:e,nullCount:e,nullBitmap:new Uint8Array(o)})}}return t}var il,We=class c{constructor(...e){var t,r;if(e.length===0)return this.batches=[],this.schema=new de([]),this._offsets=[0],this;let n,a;e[0]instanceof de&&(n=e.shift()),e.at(-1)instanceof Uint32Array&&(a=e.pop());let o=u=>{if(u){if(u instanceof ke)return[u];if(u instanceof c)return u.batches;if(u instanceof le){if(u.type instanceof ye)return[new ke(new de(u.type.children),u)]}else{if(Array.isArray(u))return u.flatMap(_=>o(_));if(typeof u[Symbol.iterator]=="function")return[...u].flatMap(_=>o(_));if(typeof u=="object"){let _=Object.keys(u),d=_.map(m=>new ae([u[m]])),f=n!=null?n:new de(_.map((m,h)=>new ne(String(m),d[h].type,d[h].nullable))),[,p]=Js(f,d);return p.length===0?[new ke(u)]:p}}}return[]},l=e.flatMap(u=>o(u));if(n=(r=n!=null?n:(t=l[0])===null||t===void 0?void 0:t.schema)!==null&&r!==void 0?r:new de([]),!(n instanceof de))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");for(let u of l){if(!(u instanceof ke))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");if(!Xr(n,u.schema))throw new TypeError("Table and inner RecordBatch schemas must be equivalent.")}this.schema=n,this.batches=l,this._offsets=a!=null?a:ws(this.data)}get data(){return this.batches.map(({data:e})=>e)}get numCols(){return this.schema.fields.length}get numRows(){return this.data.reduce((e,t)=>e+t.length,0)}get nullCount(){return this._nullCount===-1&&(this._nullCount=Ss(this.data)),this._nullCount}isValid(e){return!1}get(e){return null}at(e){return this.get(jr(e,this.numRows))}set(e,t){}indexOf(e,t){return-1}[Symbol.iterator](){return this.batches.length>0?pi.visit(new ae(this.data)):new Array(0)[Symbol.iterator]()}toArray(){return[...this]}toString(){return"[\n  ".concat(this.toArray().join(",\n  "),"\n]")}concat(...e){let t=this.schema,r=this.data.concat(e.flatMap(({data:n})=>n));return new c(t,r.map(n=>new ke(t,n)))}slice(e,t){let r=this.schema;[e,t]=Qi({length:this.numRows},e,t);let n=Es(this.data,this._offsets,e,t);return new c(r,n.map(a=>new ke(r,a)))}getChild(e){return this.getChildAt(this.schema.fields.findIndex(t=>t.name===e))}getChildAt(e){if(e>-1&&e<this.schema.fields.length){let t=this.data.map(r=>r.children[e]);if(t.length===0){let{type:r}=this.schema.fields[e],n=K({type:r,length:0,nullCount:0});t.push(n._changeLengthAndBackfillNullBitmap(this.numRows))}return new ae(t)}return null}setChild(e,t){var r;return this.setChildAt((r=this.schema.fields)===null||r===void 0?void 0:r.findIndex(n=>n.name===e),t)}setChildAt(e,t){let r=this.schema,n=[...this.batches];if(e>-1&&e<this.numCols){t||(t=new ae([K({type:new He,length:this.numRows})]));let a=r.fields.slice(),o=a[e].clone({type:t.type}),l=this.schema.fields.map((u,_)=>this.getChildAt(_));[a[e],l[e]]=[o,t],[r,n]=Js(r,l)}return new c(r,n)}select(e){let t=this.schema.fields.reduce((r,n,a)=>r.set(n.name,a),new Map);return this.selectAt(e.map(r=>t.get(r)).filter(r=>r>-1))}selectAt(e){let t=this.schema.selectAt(e),r=this.batches.map(n=>n.selectAt(e));return new c(t,r)}assign(e){let t=this.schema.fields,[r,n]=e.schema.fields.reduce((l,u,_)=>{let[d,f]=l,p=t.findIndex(m=>m.name===u.name);return~p?f[p]=_:d.push(_),l},[[],[]]),a=this.schema.assign(e.schema),o=[...t.map((l,u)=>[u,n[u]]).map(([l,u])=>u===void 0?this.getChildAt(l):e.getChildAt(u)),...r.map(l=>e.getChildAt(l))].filter(Boolean);return new c(...Js(a,o))}};il=Symbol.toStringTag;We[il]=(c=>(c.schema=null,c.batches=[],c._offsets=new Uint32Array([0]),c._nullCount=-1,c[Symbol.isConcatSpreadable]=!0,c.isValid=fi(Ki),c.get=fi(Te.getVisitFn(b.Struct)),c.set=As(je.getVisitFn(b.Struct)),c.indexOf=Ls(Or.getVisitFn(b.Struct)),"Table"))(We.prototype);var sl,ke=class c{constructor(...e){switch(e.length){case 2:{if([this.schema]=e,!(this.schema instanceof de))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");if([,this.data=K({nullCount:0,type:new ye(this.schema.fields),children:this.schema.fields.map(t=>K({type:t.type,nullCount:0}))})]=e,!(this.data instanceof le))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");[this.schema,this.data]=nl(this.schema,this.data.children);break}case 1:{let[t]=e,{fields:r,children:n,length:a}=Object.keys(t).reduce((u,_,d)=>(u.children[d]=t[_],u.length=Math.max(u.length,t[_].length),u.fields[d]=ne.new({name:_,type:t[_].type,nullable:!0}),u),{length:0,fields:new Array,children:new Array}),o=new de(r),l=K({type:new ye(r),length:a,children:n,nullCount:0});[this.schema,this.data]=nl(o,l.children,a);break}default:throw new TypeError("RecordBatch constructor expects an Object mapping names to child Data, or a [Schema, Data] pair.")}}get dictionaries(){return this._dictionaries||(this._dictionaries=al(this.schema.fields,this.data.children))}get numCols(){return this.schema.fields.length}get numRows(){return this.data.length}get nullCount(){return this.data.nullCount}isValid(e){return this.data.getValid(e)}get(e){return Te.visit(this.data,e)}at(e){return this.get(jr(e,this.numRows))}set(e,t){return je.visit(this.data,e,t)}indexOf(e,t){return Or.visit(this.data,e,t)}[Symbol.iterator](){return pi.visit(new ae([this.data]))}toArray(){return[...this]}concat(...e){return new We(this.schema,[this,...e])}slice(e,t){let[r]=new ae([this.data]).slice(e,t).data;return new c(this.schema,r)}getChild(e){var t;return this.getChildAt((t=this.schema.fields)===null||t===void 0?void 0:t.findIndex(r=>r.name===e))}getChildAt(e){return e>-1&&e<this.schema.fields.length?new ae([this.data.children[e]]):null}setChild(e,t){var r;return this.setChildAt((r=this.schema.fields)===null||r===void 0?void 0:r.findIndex(n=>n.name===e),t)}setChildAt(e,t){let r=this.schema,n=this.data;if(e>-1&&e<this.numCols){t||(t=new ae([K({type:new He,length:this.numRows})]));let a=r.fields.slice(),o=n.children.slice(),l=a[e].clone({type:t.type});[a[e],o[e]]=[l,t.data[0]],r=new de(a,new Map(this.schema.metadata)),n=K({type:new ye(a),children:o})}return new c(r,n)}select(e){let t=this.schema.select(e),r=new ye(t.fields),n=[];for(let a of e){let o=this.schema.fields.findIndex(l=>l.name===a);~o&&(n[o]=this.data.children[o])}return new c(t,K({type:r,length:this.numRows,children:n}))}selectAt(e){let t=this.schema.selectAt(e),r=e.map(a=>this.data.children[a]).filter(Boolean),n=K({type:new ye(t.fields),length:this.numRows,children:r});return new c(t,n)}};sl=Symbol.toStringTag;ke[sl]=(c=>(c._nullCount=-1,c[Symbol.isConcatSpreadable]=!0,"RecordBatch"))(ke.prototype);function nl(c,e,t=e.reduce((r,n)=>Math.max(r,n.length),0)){var r;let n=[...c.fields],a=[...e],o=(t+63&-64)>>3;for(let[l,u]of c.fields.entries()){let _=e[l];(!_||_.length!==t)&&(n[l]=u.clone({nullable:!0}),a[l]=(r=_==null?void 0:_._changeLengthAndBackfillNullBitmap(t))!==null&&r!==void 0?r:K({type:u.type,length:t,nullCount:t,nullBitmap:new Uint8Array(o)}))}return[c.assign(n),K({type:new ye(n),length:t,children:a})]}function al(c,e,t=new Map){var r,n;if(((r=c==null?void 0:c.length)!==null&&r!==void 0?r:0)>0&&(c==null?void 0:c.length)===(e==null?void 0:e.length))for(let a=-1,o=c.length;++a<o;){let{type:l}=c[a],u=e[a];for(let _ of[u,...((n=u==null?void 0:u.dictionary)===null||n===void 0?void 0:n.data)||[]])al(l.children,_==null?void 0:_.children,t);if(j.isDictionary(l)){let{id:_}=l;if(!t.has(_))u!=null&&u.dictionary&&t.set(_,u.dictionary);else if(t.get(_)!==u.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}}return t}var Qr=class extends ke{constructor(e){let t=e.fields.map(n=>K({type:n.type})),r=K({type:new ye(e.fields),nullCount:0,children:t});super(e,r)}};var Lt=class c{constructor(){this.bb=null,this.bb_pos=0}__init(e,t){return this.bb_pos=e,this.bb=t,this}static getRootAsMessage(e,t){return(t||new c).__init(e.readInt32(e.position())+e.position(),e)}static getSizePrefixedRootAsMessage(e,t){return e.setPosition(e.position()+4),(t||new c).__init(e.readInt32(e.position())+e.position(),e)}version(){let e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):ue.V1}headerType(){let e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readUint8(this.bb_pos+e):se.NONE}header(e){let t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__union(e,this.bb_pos+t):null}bodyLength(){let e=this.bb.__offset(this.bb_pos,10);return e?this.bb.readInt64(this.bb_pos+e):BigInt("0")}customMetadata(e,t){let r=this.bb.__offset(this.bb_pos,12);return r?(t||new Me).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+r)+e*4),this.bb):null}customMetadataLength(){let e=this.bb.__offset(this.bb_pos,12);return e?this.bb.__vector_len(this.bb_pos+e):0}static startMessage(e){e.startObject(5)}static addVersion(e,t){e.addFieldInt16(0,t,ue.V1)}static addHeaderType(e,t){e.addFieldInt8(1,t,se.NONE)}static addHeader(e,t){e.addFieldOffset(2,t,0)}static addBodyLength(e,t){e.addFieldInt64(3,t,BigInt("0"))}static addCustomMetadata(e,t){e.addFieldOffset(4,t,0)}static createCustomMetadataVector(e,t){e.startVector(4,t.length,4);for(let r=t.length-1;r>=0;r--)e.addOffset(t[r]);return e.endVector()}static startCustomMetadataVector(e,t){e.startVector(4,t,4)}static endMessage(e){return e.endObject()}static finishMessageBuffer(e,t){e.finish(t)}static finishSizePrefixedMessageBuffer(e,t){e.finish(t,void 0,!0)}static createMessage(e,t,r,n,a,o){return c.startMessage(e),c.addVersion(e,t),c.addHeaderType(e,r),c.addHeader(e,n),c.addBodyLength(e,a),c.addCustomMetadata(e,o),c.endMessage(e)}};var co=class extends G{visit(e,t){return e==null||t==null?void 0:super.visit(e,t)}visitNull(e,t){return Wi.startNull(t),Wi.endNull(t)}visitInt(e,t){return mt.startInt(t),mt.addBitWidth(t,e.bitWidth),mt.addIsSigned(t,e.isSigned),mt.endInt(t)}visitFloat(e,t){return Sr.startFloatingPoint(t),Sr.addPrecision(t,e.precision),Sr.endFloatingPoint(t)}visitBinary(e,t){return Ui.startBinary(t),Ui.endBinary(t)}visitLargeBinary(e,t){return Oi.startLargeBinary(t),Oi.endLargeBinary(t)}visitBool(e,t){return Gi.startBool(t),Gi.endBool(t)}visitUtf8(e,t){return zi.startUtf8(t),zi.endUtf8(t)}visitLargeUtf8(e,t){return Hi.startLargeUtf8(t),Hi.endLargeUtf8(t)}visitDecimal(e,t){return It.startDecimal(t),It.addScale(t,e.scale),It.addPrecision(t,e.precision),It.addBitWidth(t,e.bitWidth),It.endDecimal(t)}visitDate(e,t){return gr.startDate(t),gr.addUnit(t,e.unit),gr.endDate(t)}visitTime(e,t){return Nt.startTime(t),Nt.addUnit(t,e.unit),Nt.addBitWidth(t,e.bitWidth),Nt.endTime(t)}visitTimestamp(e,t){let r=e.timezone&&t.createString(e.timezone)||void 0;return Wt.startTimestamp(t),Wt.addUnit(t,e.unit),r!==void 0&&Wt.addTimezone(t,r),Wt.endTimestamp(t)}visitInterval(e,t){return wr.startInterval(t),wr.addUnit(t,e.unit),wr.endInterval(t)}visitDuration(e,t){return vr.startDuration(t),vr.addUnit(t,e.unit),vr.endDuration(t)}visitList(e,t){return Ni.startList(t),Ni.endList(t)}visitStruct(e,t){return Vi.startStruct_(t),Vi.endStruct_(t)}visitUnion(e,t){ht.startTypeIdsVector(t,e.typeIds.length);let r=ht.createTypeIdsVector(t,e.typeIds);return ht.startUnion(t),ht.addMode(t,e.mode),ht.addTypeIds(t,r),ht.endUnion(t)}visitDictionary(e,t){let r=this.visit(e.indices,t);return Pt.startDictionaryEncoding(t),Pt.addId(t,BigInt(e.id)),Pt.addIsOrdered(t,e.isOrdered),r!==void 0&&Pt.addIndexType(t,r),Pt.endDictionaryEncoding(t)}visitFixedSizeBinary(e,t){return yr.startFixedSizeBinary(t),yr.addByteWidth(t,e.byteWidth),yr.endFixedSizeBinary(t)}visitFixedSizeList(e,t){return br.startFixedSizeList(t),br.addListSize(t,e.listSize),br.endFixedSizeList(t)}visitMap(e,t){return Er.startMap(t),Er.addKeysSorted(t,e.keysSorted),Er.endMap(t)}},Ks=new co;function ul(c,e=new Map){return new de(G_(c,e),Zs(c.metadata),e)}function lo(c){return new Re(c.count,dl(c.columns),fl(c.columns))}function _l(c){return new qe(lo(c.data),c.id,c.isDelta)}function G_(c,e){return(c.fields||[]).filter(Boolean).map(t=>ne.fromJSON(t,e))}function ol(c,e){return(c.children||[]).filter(Boolean).map(t=>ne.fromJSON(t,e))}function dl(c){return(c||[]).reduce((e,t)=>[...e,new lt(t.count,O_(t.VALIDITY)),...dl(t.children)],[])}function fl(c,e=[]){for(let t=-1,r=(c||[]).length;++t<r;){let n=c[t];n.VALIDITY&&e.push(new $e(e.length,n.VALIDITY.length)),n.TYPE_ID&&e.push(new $e(e.length,n.TYPE_ID.length)),n.OFFSET&&e.push(new $e(e.length,n.OFFSET.length)),n.DATA&&e.push(new $e(e.length,n.DATA.length)),e=fl(n.children,e)}return e}function O_(c){return(c||[]).reduce((e,t)=>e+ +(t===0),0)}function pl(c,e){let t,r,n,a,o,l;return!e||!(a=c.dictionary)?(o=ll(c,ol(c,e)),n=new ne(c.name,o,c.nullable,Zs(c.metadata))):e.has(t=a.id)?(r=(r=a.indexType)?cl(r):new Bt,l=new et(e.get(t),r,t,a.isOrdered),n=new ne(c.name,l,c.nullable,Zs(c.metadata))):(r=(r=a.indexType)?cl(r):new Bt,e.set(t,o=ll(c,ol(c,e))),l=new et(o,r,t,a.isOrdered),n=new ne(c.name,l,c.nullable,Zs(c.metadata))),n||null}function Zs(c=[]){return new Map(c.map(({key:e,value:t})=>[e,t]))}function cl(c){return new Pe(c.isSigned,c.bitWidth)}function ll(c,e){let t=c.type.name;switch(t){case"NONE":return new He;case"null":return new He;case"binary":return new Vt;case"largebinary":return new zt;case"utf8":return new $t;case"largeutf8":return new qt;case"bool":return new Xt;case"list":return new yt((e||[])[0]);case"struct":return new ye(e||[]);case"struct_":return new ye(e||[])}switch(t){case"int":{let r=c.type;return new Pe(r.isSigned,r.bitWidth)}case"floatingpoint":{let r=c.type;return new at(pe[r.precision])}case"decimal":{let r=c.type;return new Qt(r.scale,r.precision,r.bitWidth)}case"date":{let r=c.type;return new Yt(Le[r.unit])}case"time":{let r=c.type;return new Jt(R[r.unit],r.bitWidth)}case"timestamp":{let r=c.type;return new Kt(R[r.unit],r.timezone)}case"interval":{let r=c.type;return new Zt(Ce[r.unit])}case"duration":{let r=c.type;return new er(R[r.unit])}case"union":{let r=c.type,[n,...a]=(r.mode+"").toLowerCase(),o=n.toUpperCase()+a.join("");return new bt(he[o],r.typeIds||[],e||[])}case"fixedsizebinary":{let r=c.type;return new tr(r.byteWidth)}case"fixedsizelist":{let r=c.type;return new St(r.listSize,(e||[])[0])}case"map":{let r=c.type;return new wt((e||[])[0],r.keysSorted)}}throw new Error('Unrecognized type: "'.concat(t,'"'))}var H_=Br,N_=Ke,Xe=class c{static fromJSON(e,t){let r=new c(0,ue.V5,t);return r._createHeader=W_(e,t),r}static decode(e){e=new N_(z(e));let t=Lt.getRootAsMessage(e),r=t.bodyLength(),n=t.version(),a=t.headerType(),o=new c(r,n,a);return o._createHeader=V_(t,a),o}static encode(e){let t=new H_,r=-1;return e.isSchema()?r=de.encode(t,e.header()):e.isRecordBatch()?r=Re.encode(t,e.header()):e.isDictionaryBatch()&&(r=qe.encode(t,e.header())),Lt.startMessage(t),Lt.addVersion(t,ue.V5),Lt.addHeader(t,r),Lt.addHeaderType(t,e.headerType),Lt.addBodyLength(t,BigInt(e.bodyLength)),Lt.finishMessageBuffer(t,Lt.endMessage(t)),t.asUint8Array()}static from(e,t=0){if(e instanceof de)return new c(0,ue.V5,se.Schema,e);if(e instanceof Re)return new c(t,ue.V5,se.RecordBatch,e);if(e instanceof qe)return new c(t,ue.V5,se.DictionaryBatch,e);throw new Error("Unrecognized Message header: ".concat(e))}get type(){return this.headerType}get version(){return this._version}get headerType(){return this._headerType}get bodyLength(){return this._bodyLength}header(){return this._createHeader()}isSchema(){return this.headerType===se.Schema}isRecordBatch(){return this.headerType===se.RecordBatch}isDictionaryBatch(){return this.headerType===se.DictionaryBatch}constructor(e,t,r,n){this._version=t,this._headerType=r,this.body=new Uint8Array(0),n&&(this._createHeader=()=>n),this._bodyLength=oe(e)}},Re=class{get nodes(){return this._nodes}get length(){return this._length}get buffers(){return this._buffers}constructor(e,t,r){this._nodes=t,this._buffers=r,this._length=oe(e)}},qe=class{get id(){return this._id}get data(){return this._data}get isDelta(){return this._isDelta}get length(){return this.data.length}get nodes(){return this.data.nodes}get buffers(){return this.data.buffers}constructor(e,t,r=!1){this._data=e,this._isDelta=r,this._id=oe(t)}},$e=class{constructor(e,t){this.offset=oe(e),this.length=oe(t)}},lt=class{constructor(e,t){this.length=oe(e),this.nullCount=oe(t)}};function W_(c,e){return()=>{switch(e){case se.Schema:return de.fromJSON(c);case se.RecordBatch:return Re.fromJSON(c);case se.DictionaryBatch:return qe.fromJSON(c)}throw new Error("Unrecognized Message type: { name: ".concat(se[e],", type: ").concat(e," }"))}}function V_(c,e){return()=>{switch(e){case se.Schema:return de.decode(c.header(new Ve),new Map,c.version());case se.RecordBatch:return Re.decode(c.header(new Ze),c.version());case se.DictionaryBatch:return qe.decode(c.header(new Ht),c.version())}throw new Error("Unrecognized Message type: { name: ".concat(se[e],", type: ").concat(e," }"))}}ne.encode=td;ne.decode=Z_;ne.fromJSON=pl;de.encode=ed;de.decode=z_;de.fromJSON=ul;Re.encode=rd;Re.decode=$_;Re.fromJSON=lo;qe.encode=id;qe.decode=q_;qe.fromJSON=_l;lt.encode=nd;lt.decode=Q_;$e.encode=sd;$e.decode=X_;function z_(c,e=new Map,t=ue.V5){let r=K_(c,e);return new de(r,ea(c),e,t)}function $_(c,e=ue.V5){if(c.compression()!==null)throw new Error("Record batch compression not implemented");return new Re(c.length(),Y_(c),J_(c,e))}function q_(c,e=ue.V5){return new qe(Re.decode(c.data(),e),c.id(),c.isDelta())}function X_(c){return new $e(c.offset(),c.length())}function Q_(c){return new lt(c.length(),c.nullCount())}function Y_(c){let e=[];for(let t,r=-1,n=-1,a=c.nodesLength();++r<a;)(t=c.nodes(r))&&(e[++n]=lt.decode(t));return e}function J_(c,e){let t=[];for(let r,n=-1,a=-1,o=c.buffersLength();++n<o;)(r=c.buffers(n))&&(e<ue.V4&&(r.bb_pos+=8*(n+1)),t[++a]=$e.decode(r));return t}function K_(c,e){let t=[];for(let r,n=-1,a=-1,o=c.fieldsLength();++n<o;)(r=c.fields(n))&&(t[++a]=ne.decode(r,e));return t}function ml(c,e){let t=[];for(let r,n=-1,a=-1,o=c.childrenLength();++n<o;)(r=c.children(n))&&(t[++a]=ne.decode(r,e));return t}function Z_(c,e){let t,r,n,a,o,l;return!e||!(l=c.dictionary())?(n=gl(c,ml(c,e)),r=new ne(c.name(),n,c.nullable(),ea(c))):e.has(t=oe(l.id()))?(a=(a=l.indexType())?hl(a):new Bt,o=new et(e.get(t),a,t,l.isOrdered()),r=new ne(c.name(),o,c.nullable(),ea(c))):(a=(a=l.indexType())?hl(a):new Bt,e.set(t,n=gl(c,ml(c,e))),o=new et(n,a,t,l.isOrdered()),r=new ne(c.name(),o,c.nullable(),ea(c))),r||null}function ea(c){let e=new Map;if(c)for(let t,r,n=-1,a=Math.trunc(c.customMetadataLength());++n<a;)(t=c.customMetadata(n))&&(r=t.key())!=null&&e.set(r,t.value());return e}function hl(c){return new Pe(c.isSigned(),c.bitWidth())}function gl(c,e){let t=c.typeType();switch(t){case ge.NONE:return new He;case ge.Null:return new He;case ge.Binary:return new Vt;case ge.LargeBinary:return new zt;case ge.Utf8:return new $t;case ge.LargeUtf8:return new qt;case ge.Bool:return new Xt;case ge.List:return new yt((e||[])[0]);case ge.Struct_:return new ye(e||[])}switch(t){case ge.Int:{let r=c.type(new mt);return new Pe(r.isSigned(),r.bitWidth())}case ge.FloatingPoint:{let r=c.type(new Sr);return new at(r.precision())}case ge.Decimal:{let r=c.type(new It);return new Qt(r.scale(),r.precision(),r.bitWidth())}case ge.Date:{let r=c.type(new gr);return new Yt(r.unit())}case ge.Time:{let r=c.type(new Nt);return new Jt(r.unit(),r.bitWidth())}case ge.Timestamp:{let r=c.type(new Wt);return new Kt(r.unit(),r.timezone())}case ge.Interval:{let r=c.type(new wr);return new Zt(r.unit())}case ge.Duration:{let r=c.type(new vr);return new er(r.unit())}case ge.Union:{let r=c.type(new ht);return new bt(r.mode(),r.typeIdsArray()||[],e||[])}case ge.FixedSizeBinary:{let r=c.type(new yr);return new tr(r.byteWidth())}case ge.FixedSizeList:{let r=c.type(new br);return new St(r.listSize(),(e||[])[0])}case ge.Map:{let r=c.type(new Er);return new wt((e||[])[0],r.keysSorted())}}throw new Error('Unrecognized type: "'.concat(ge[t],'" (').concat(t,")"))}function ed(c,e){let t=e.fields.map(a=>ne.encode(c,a));Ve.startFieldsVector(c,t.length);let r=Ve.createFieldsVector(c,t),n=e.metadata&&e.metadata.size>0?Ve.createCustomMetadataVector(c,[...e.metadata].map(([a,o])=>{let l=c.createString("".concat(a)),u=c.createString("".concat(o));return Me.startKeyValue(c),Me.addKey(c,l),Me.addValue(c,u),Me.endKeyValue(c)})):-1;return Ve.startSchema(c),Ve.addFields(c,r),Ve.addEndianness(c,ad?hr.Little:hr.Big),n!==-1&&Ve.addCustomMetadata(c,n),Ve.endSchema(c)}function td(c,e){let t=-1,r=-1,n=-1,a=e.type,o=e.typeId;j.isDictionary(a)?(o=a.dictionary.typeId,n=Ks.visit(a,c),r=Ks.visit(a.dictionary,c)):r=Ks.visit(a,c);let l=(a.children||[]).map(d=>ne.encode(c,d)),u=Ge.createChildrenVector(c,l),_=e.metadata&&e.metadata.size>0?Ge.createCustomMetadataVector(c,[...e.metadata].map(([d,f])=>{let p=c.createString("".concat(d)),m=c.createString("".concat(f));return Me.startKeyValue(c),Me.addKey(c,p),Me.addValue(c,m),Me.endKeyValue(c)})):-1;return e.name&&(t=c.createString(e.name)),Ge.startField(c),Ge.addType(c,r),Ge.addTypeType(c,o),Ge.addChildren(c,u),Ge.addNullable(c,!!e.nullable),t!==-1&&Ge.addName(c,t),n!==-1&&Ge.addDictionary(c,n),_!==-1&&Ge.addCustomMetadata(c,_),Ge.endField(c)}function rd(c,e){let t=e.nodes||[],r=e.buffers||[];Ze.startNodesVector(c,t.length);for(let o of t.slice().reverse())lt.encode(c,o);let n=c.endVector();Ze.startBuffersVector(c,r.length);for(let o of r.slice().reverse())$e.encode(c,o);let a=c.endVector();return Ze.startRecordBatch(c),Ze.addLength(c,BigInt(e.length)),Ze.addNodes(c,n),Ze.addBuffers(c,a),Ze.endRecordBatch(c)}function id(c,e){let t=Re.encode(c,e.data);return Ht.startDictionaryBatch(c),Ht.addId(c,BigInt(e.id)),Ht.addIsDelta(c,e.isDelta),Ht.addData(c,t),Ht.endDictionaryBatch(c)}function nd(c,e){return ni.createFieldNode(c,BigInt(e.length),BigInt(e.nullCount))}function sd(c,e){return ii.createBuffer(c,BigInt(e.offset),BigInt(e.length))}var ad=(()=>{let c=new ArrayBuffer(2);return new DataView(c).setInt16(0,256,!0),new Int16Array(c)[0]===256})();var _o=c=>"Expected ".concat(se[c]," Message in stream, but was null or length 0."),fo=c=>"Header pointer of flatbuffer-encoded ".concat(se[c]," Message is null or length 0."),vl=(c,e)=>"Expected to read ".concat(c," metadata bytes, but only read ").concat(e,"."),yl=(c,e)=>"Expected to read ".concat(c," bytes for message body, but only read ").concat(e,"."),wi=class{constructor(e){this.source=e instanceof Ut?e:new Ut(e)}[Symbol.iterator](){return this}next(){let e;return(e=this.readMetadataLength()).done?be:e.value===-1&&(e=this.readMetadataLength()).done?be:(e=this.readMetadata(e.value)).done?be:e}throw(e){return this.source.throw(e)}return(e){return this.source.return(e)}readMessage(e){let t;if((t=this.next()).done)return null;if(e!=null&&t.value.headerType!==e)throw new Error(_o(e));return t.value}readMessageBody(e){if(e<=0)return new Uint8Array(0);let t=z(this.source.read(e));if(t.byteLength<e)throw new Error(yl(e,t.byteLength));return t.byteOffset%8===0&&t.byteOffset+t.byteLength<=t.buffer.byteLength?t:t.slice()}readSchema(e=!1){let t=se.Schema,r=this.readMessage(t),n=r==null?void 0:r.header();if(e&&!n)throw new Error(fo(t));return n}readMetadataLength(){let e=this.source.read(ta),t=e&&new Ke(e),r=(t==null?void 0:t.readInt32(0))||0;return{done:r===0,value:r}}readMetadata(e){let t=this.source.read(e);if(!t)return be;if(t.byteLength<e)throw new Error(vl(e,t.byteLength));return{done:!1,value:Xe.decode(t)}}},Tn=class{constructor(e,t){this.source=e instanceof ot?e:Pn(e)?new Tr(e,t):new ot(e)}[Symbol.asyncIterator](){return this}next(){return B(this,void 0,void 0,function*(){let e;return(e=yield this.readMetadataLength()).done?be:e.value===-1&&(e=yield this.readMetadataLength()).done?be:(e=yield this.readMetadata(e.value)).done?be:e})}throw(e){return B(this,void 0,void 0,function*(){return yield this.source.throw(e)})}return(e){return B(this,void 0,void 0,function*(){return yield this.source.return(e)})}readMessage(e){return B(this,void 0,void 0,function*(){let t;if((t=yield this.next()).done)return null;if(e!=null&&t.value.headerType!==e)throw new Error(_o(e));return t.value})}readMessageBody(e){return B(this,void 0,void 0,function*(){if(e<=0)return new Uint8Array(0);let t=z(yield this.source.read(e));if(t.byteLength<e)throw new Error(yl(e,t.byteLength));return t.byteOffset%8===0&&t.byteOffset+t.byteLength<=t.buffer.byteLength?t:t.slice()})}readSchema(){return B(this,arguments,void 0,function*(e=!1){let t=se.Schema,r=yield this.readMessage(t),n=r==null?void 0:r.header();if(e&&!n)throw new Error(fo(t));return n})}readMetadataLength(){return B(this,void 0,void 0,function*(){let e=yield this.source.read(ta),t=e&&new Ke(e),r=(t==null?void 0:t.readInt32(0))||0;return{done:r===0,value:r}})}readMetadata(e){return B(this,void 0,void 0,function*(){let t=yield this.source.read(e);if(!t)return be;if(t.byteLength<e)throw new Error(vl(e,t.byteLength));return{done:!1,value:Xe.decode(t)}})}},Fn=class extends wi{constructor(e){super(new Uint8Array(0)),this._schema=!1,this._body=[],this._batchIndex=0,this._dictionaryIndex=0,this._json=e instanceof Zi?e:new Zi(e)}next(){let{_json:e}=this;if(!this._schema)return this._schema=!0,{done:!1,value:Xe.fromJSON(e.schema,se.Schema)};if(this._dictionaryIndex<e.dictionaries.length){let t=e.dictionaries[this._dictionaryIndex++];return this._body=t.data.columns,{done:!1,value:Xe.fromJSON(t,se.DictionaryBatch)}}if(this._batchIndex<e.batches.length){let t=e.batches[this._batchIndex++];return this._body=t.columns,{done:!1,value:Xe.fromJSON(t,se.RecordBatch)}}return this._body=[],be}readMessageBody(e){return t(this._body);function t(r){return(r||[]).reduce((n,a)=>[...n,...a.VALIDITY&&[a.VALIDITY]||[],...a.TYPE_ID&&[a.TYPE_ID]||[],...a.OFFSET&&[a.OFFSET]||[],...a.DATA&&[a.DATA]||[],...t(a.children)],[])}}readMessage(e){let t;if((t=this.next()).done)return null;if(e!=null&&t.value.headerType!==e)throw new Error(_o(e));return t.value}readSchema(){let e=se.Schema,t=this.readMessage(e),r=t==null?void 0:t.header();if(!t||!r)throw new Error(fo(e));return r}},ta=4,uo="ARROW1",Ei=new Uint8Array(uo.length);for(let c=0;c<uo.length;c+=1)Ei[c]=uo.codePointAt(c);function ra(c,e=0){for(let t=-1,r=Ei.length;++t<r;)if(Ei[t]!==c[e+t])return!1;return!0}var Ai=Ei.length,po=Ai+ta,bl=Ai*2+ta;var Ue=class c extends Nr{constructor(e){super(),this._impl=e}get closed(){return this._impl.closed}get schema(){return this._impl.schema}get autoDestroy(){return this._impl.autoDestroy}get dictionaries(){return this._impl.dictionaries}get numDictionaries(){return this._impl.numDictionaries}get numRecordBatches(){return this._impl.numRecordBatches}get footer(){return this._impl.isFile()?this._impl.footer:null}isSync(){return this._impl.isSync()}isAsync(){return this._impl.isAsync()}isFile(){return this._impl.isFile()}isStream(){return this._impl.isStream()}next(){return this._impl.next()}throw(e){return this._impl.throw(e)}return(e){return this._impl.return(e)}cancel(){return this._impl.cancel()}reset(e){return this._impl.reset(e),this._DOMStream=void 0,this._nodeStream=void 0,this}open(e){let t=this._impl.open(e);return _t(t)?t.then(()=>this):this}readRecordBatch(e){return this._impl.isFile()?this._impl.readRecordBatch(e):null}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}toDOMStream(){return Be.toDOMStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this})}toNodeStream(){return Be.toNodeStream(this.isSync()?{[Symbol.iterator]:()=>this}:{[Symbol.asyncIterator]:()=>this},{objectMode:!0})}static throughNode(e){throw new Error('"throughNode" not available in this environment')}static throughDOM(e,t){throw new Error('"throughDOM" not available in this environment')}static from(e){return e instanceof c?e:Cn(e)?cd(e):Pn(e)?_d(e):_t(e)?B(this,void 0,void 0,function*(){return yield c.from(yield e)}):In(e)||Mi(e)||jn(e)||it(e)?ud(new ot(e)):ld(new Ut(e))}static readAll(e){return e instanceof c?e.isSync()?Sl(e):wl(e):Cn(e)||ArrayBuffer.isView(e)||dt(e)||Mn(e)?Sl(e):wl(e)}},Ot=class extends Ue{constructor(e){super(e),this._impl=e}readAll(){return[...this]}[Symbol.iterator](){return this._impl[Symbol.iterator]()}[Symbol.asyncIterator](){return Ye(this,arguments,function*(){yield re(yield*Pr(ti(ut(this[Symbol.iterator]()))))})}},Fr=class extends Ue{constructor(e){super(e),this._impl=e}readAll(){return B(this,void 0,void 0,function*(){var e,t,r,n;let a=new Array;try{for(var o=!0,l=ut(this),u;u=yield l.next(),e=u.done,!e;o=!0){n=u.value,o=!1;let _=n;a.push(_)}}catch(_){t={error:_}}finally{try{!o&&!e&&(r=l.return)&&(yield r.call(l))}finally{if(t)throw t.error}}return a})}[Symbol.iterator](){throw new Error("AsyncRecordBatchStreamReader is not Iterable")}[Symbol.asyncIterator](){return this._impl[Symbol.asyncIterator]()}},xr=class extends Ot{constructor(e){super(e),this._impl=e}},xn=class extends Fr{constructor(e){super(e),this._impl=e}},ia=class{get numDictionaries(){return this._dictionaryIndex}get numRecordBatches(){return this._recordBatchIndex}constructor(e=new Map){this.closed=!1,this.autoDestroy=!0,this._dictionaryIndex=0,this._recordBatchIndex=0,this.dictionaries=e}isSync(){return!1}isAsync(){return!1}isFile(){return!1}isStream(){return!1}reset(e){return this._dictionaryIndex=0,this._recordBatchIndex=0,this.schema=e,this.dictionaries=new Map,this}_loadRecordBatch(e,t){let r=this._loadVectors(e,t,this.schema.fields),n=K({type:new ye(this.schema.fields),length:e.length,children:r});return new ke(this.schema,n)}_loadDictionaryBatch(e,t){let{id:r,isDelta:n}=e,{dictionaries:a,schema:o}=this,l=a.get(r),u=o.dictionaries.get(r),_=this._loadVectors(e.data,t,[u]);return(l&&n?l.concat(new ae(_)):new ae(_)).memoize()}_loadVectors(e,t,r){return new nn(t,e.nodes,e.buffers,this.dictionaries,this.schema.metadataVersion).visitMany(r)}},Li=class extends ia{constructor(e,t){super(t),this._reader=Cn(e)?new Fn(this._handle=e):new wi(this._handle=e)}isSync(){return!0}isStream(){return!0}[Symbol.iterator](){return this}cancel(){!this.closed&&(this.closed=!0)&&(this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}open(e){return this.closed||(this.autoDestroy=El(this,e),this.schema||(this.schema=this._reader.readSchema())||this.cancel()),this}throw(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.throw(e):be}return(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.return(e):be}next(){if(this.closed)return be;let e,{_reader:t}=this;for(;e=this._readNextMessageAndValidate();)if(e.isSchema())this.reset(e.header());else if(e.isRecordBatch()){this._recordBatchIndex++;let r=e.header(),n=t.readMessageBody(e.bodyLength);return{done:!1,value:this._loadRecordBatch(r,n)}}else if(e.isDictionaryBatch()){this._dictionaryIndex++;let r=e.header(),n=t.readMessageBody(e.bodyLength),a=this._loadDictionaryBatch(r,n);this.dictionaries.set(r.id,a)}return this.schema&&this._recordBatchIndex===0?(this._recordBatchIndex++,{done:!1,value:new Qr(this.schema)}):this.return()}_readNextMessageAndValidate(e){return this._reader.readMessage(e)}},ki=class extends ia{constructor(e,t){super(t),this._reader=new Tn(this._handle=e)}isAsync(){return!0}isStream(){return!0}[Symbol.asyncIterator](){return this}cancel(){return B(this,void 0,void 0,function*(){!this.closed&&(this.closed=!0)&&(yield this.reset()._reader.return(),this._reader=null,this.dictionaries=null)})}open(e){return B(this,void 0,void 0,function*(){return this.closed||(this.autoDestroy=El(this,e),this.schema||(this.schema=yield this._reader.readSchema())||(yield this.cancel())),this})}throw(e){return B(this,void 0,void 0,function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.throw(e):be})}return(e){return B(this,void 0,void 0,function*(){return!this.closed&&this.autoDestroy&&(this.closed=!0)?yield this.reset()._reader.return(e):be})}next(){return B(this,void 0,void 0,function*(){if(this.closed)return be;let e,{_reader:t}=this;for(;e=yield this._readNextMessageAndValidate();)if(e.isSchema())yield this.reset(e.header());else if(e.isRecordBatch()){this._recordBatchIndex++;let r=e.header(),n=yield t.readMessageBody(e.bodyLength);return{done:!1,value:this._loadRecordBatch(r,n)}}else if(e.isDictionaryBatch()){this._dictionaryIndex++;let r=e.header(),n=yield t.readMessageBody(e.bodyLength),a=this._loadDictionaryBatch(r,n);this.dictionaries.set(r.id,a)}return this.schema&&this._recordBatchIndex===0?(this._recordBatchIndex++,{done:!1,value:new Qr(this.schema)}):yield this.return()})}_readNextMessageAndValidate(e){return B(this,void 0,void 0,function*(){return yield this._reader.readMessage(e)})}},na=class extends Li{get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}constructor(e,t){super(e instanceof en?e:new en(e),t)}isSync(){return!0}isFile(){return!0}open(e){if(!this.closed&&!this._footer){this.schema=(this._footer=this._readFooter()).schema;for(let t of this._footer.dictionaryBatches())t&&this._readDictionaryBatch(this._dictionaryIndex++)}return super.open(e)}readRecordBatch(e){var t;if(this.closed)return null;this._footer||this.open();let r=(t=this._footer)===null||t===void 0?void 0:t.getRecordBatch(e);if(r&&this._handle.seek(r.offset)){let n=this._reader.readMessage(se.RecordBatch);if(n!=null&&n.isRecordBatch()){let a=n.header(),o=this._reader.readMessageBody(n.bodyLength);return this._loadRecordBatch(a,o)}}return null}_readDictionaryBatch(e){var t;let r=(t=this._footer)===null||t===void 0?void 0:t.getDictionaryBatch(e);if(r&&this._handle.seek(r.offset)){let n=this._reader.readMessage(se.DictionaryBatch);if(n!=null&&n.isDictionaryBatch()){let a=n.header(),o=this._reader.readMessageBody(n.bodyLength),l=this._loadDictionaryBatch(a,o);this.dictionaries.set(a.id,l)}}}_readFooter(){let{_handle:e}=this,t=e.size-po,r=e.readInt32(t),n=e.readAt(t-r,r);return nr.decode(n)}_readNextMessageAndValidate(e){var t;if(this._footer||this.open(),this._footer&&this._recordBatchIndex<this.numRecordBatches){let r=(t=this._footer)===null||t===void 0?void 0:t.getRecordBatch(this._recordBatchIndex);if(r&&this._handle.seek(r.offset))return this._reader.readMessage(e)}return null}},mo=class extends ki{get footer(){return this._footer}get numDictionaries(){return this._footer?this._footer.numDictionaries:0}get numRecordBatches(){return this._footer?this._footer.numRecordBatches:0}constructor(e,...t){let r=typeof t[0]!="number"?t.shift():void 0,n=t[0]instanceof Map?t.shift():void 0;super(e instanceof Tr?e:new Tr(e,r),n)}isFile(){return!0}isAsync(){return!0}open(e){let t=Object.create(null,{open:{get:()=>super.open}});return B(this,void 0,void 0,function*(){if(!this.closed&&!this._footer){this.schema=(this._footer=yield this._readFooter()).schema;for(let r of this._footer.dictionaryBatches())r&&(yield this._readDictionaryBatch(this._dictionaryIndex++))}return yield t.open.call(this,e)})}readRecordBatch(e){return B(this,void 0,void 0,function*(){var t;if(this.closed)return null;this._footer||(yield this.open());let r=(t=this._footer)===null||t===void 0?void 0:t.getRecordBatch(e);if(r&&(yield this._handle.seek(r.offset))){let n=yield this._reader.readMessage(se.RecordBatch);if(n!=null&&n.isRecordBatch()){let a=n.header(),o=yield this._reader.readMessageBody(n.bodyLength);return this._loadRecordBatch(a,o)}}return null})}_readDictionaryBatch(e){return B(this,void 0,void 0,function*(){var t;let r=(t=this._footer)===null||t===void 0?void 0:t.getDictionaryBatch(e);if(r&&(yield this._handle.seek(r.offset))){let n=yield this._reader.readMessage(se.DictionaryBatch);if(n!=null&&n.isDictionaryBatch()){let a=n.header(),o=yield this._reader.readMessageBody(n.bodyLength),l=this._loadDictionaryBatch(a,o);this.dictionaries.set(a.id,l)}}})}_readFooter(){return B(this,void 0,void 0,function*(){let{_handle:e}=this;e._pending&&(yield e._pending);let t=e.size-po,r=yield e.readInt32(t),n=yield e.readAt(t-r,r);return nr.decode(n)})}_readNextMessageAndValidate(e){return B(this,void 0,void 0,function*(){if(this._footer||(yield this.open()),this._footer&&this._recordBatchIndex<this.numRecordBatches){let t=this._footer.getRecordBatch(this._recordBatchIndex);if(t&&(yield this._handle.seek(t.offset)))return yield this._reader.readMessage(e)}return null})}},ho=class extends Li{constructor(e,t){super(e,t)}_loadVectors(e,t,r){return new Fs(t,e.nodes,e.buffers,this.dictionaries,this.schema.metadataVersion).visitMany(r)}};function El(c,e){return e&&typeof e.autoDestroy=="boolean"?e.autoDestroy:c.autoDestroy}function*Sl(c){let e=Ue.from(c);try{if(!e.open({autoDestroy:!1}).closed)do yield e;while(!e.reset().open().closed)}finally{e.cancel()}}function wl(c){return Ye(this,arguments,function*(){let t=yield re(Ue.from(c));try{if(!(yield re(t.open({autoDestroy:!1}))).closed)do yield yield re(t);while(!(yield re(t.reset().open())).closed)}finally{yield re(t.cancel())}})}function cd(c){return new Ot(new ho(c))}function ld(c){let e=c.peek(Ai+7&-8);return e&&e.byteLength>=4?ra(e)?new xr(new na(c.read())):new Ot(new Li(c)):new Ot(new Li(function*(){}()))}function ud(c){return B(this,void 0,void 0,function*(){let e=yield c.peek(Ai+7&-8);return e&&e.byteLength>=4?ra(e)?new xr(new na(yield c.read())):new Fr(new ki(c)):new Fr(new ki(function(){return Ye(this,arguments,function*(){})}()))})}function _d(c){return B(this,void 0,void 0,function*(){let{size:e}=yield c.stat(),t=new Tr(c,e);return e>=bl&&ra(yield t.readAt(0,Ai+7&-8))?new xn(new mo(t)):new Fr(new ki(t))})}var Ee=class c extends G{static assemble(...e){let t=n=>n.flatMap(a=>Array.isArray(a)?t(a):a instanceof ke?a.data.children:a.data),r=new c;return r.visitMany(t(e)),r}constructor(){super(),this._byteLength=0,this._nodes=[],this._buffers=[],this._bufferRegions=[]}visit(e){if(e instanceof ae)return this.visitMany(e.data),this;let{type:t}=e;if(!j.isDictionary(t)){let{length:r}=e;if(r>2147483647)throw new RangeError("Cannot write arrays larger than 2^31 - 1 in length");if(j.isUnion(t))this.nodes.push(new lt(r,0));else{let{nullCount:n}=e;j.isNull(t)||kt.call(this,n<=0?new Uint8Array(0):Ur(e.offset,r,e.nullBitmap)),this.nodes.push(new lt(r,n))}}return super.visit(e)}visitNull(e){return this}visitDictionary(e){return this.visit(e.clone(e.type.indices))}get nodes(){return this._nodes}get buffers(){return this._buffers}get byteLength(){return this._byteLength}get bufferRegions(){return this._bufferRegions}};function kt(c){let e=c.byteLength+7&-8;return this.buffers.push(c),this.bufferRegions.push(new $e(this._byteLength,e)),this._byteLength+=e,this}function dd(c){var e;let{type:t,length:r,typeIds:n,valueOffsets:a}=c;if(kt.call(this,n),t.mode===he.Sparse)return go.call(this,c);if(t.mode===he.Dense){if(c.offset<=0)return kt.call(this,a),go.call(this,c);{let o=new Int32Array(r),l=Object.create(null),u=Object.create(null);for(let _,d,f=-1;++f<r;)(_=n[f])!==void 0&&((d=l[_])===void 0&&(d=l[_]=a[f]),o[f]=a[f]-d,u[_]=((e=u[_])!==null&&e!==void 0?e:0)+1);kt.call(this,o),this.visitMany(c.children.map((_,d)=>{let f=t.typeIds[d],p=l[f],m=u[f];return _.slice(p,Math.min(r,m))}))}}return this}function fd(c){let e;return c.nullCount>=c.length?kt.call(this,new Uint8Array(0)):(e=c.values)instanceof Uint8Array?kt.call(this,Ur(c.offset,c.length,e)):kt.call(this,Gr(c.values))}function dr(c){return kt.call(this,c.values.subarray(0,c.length*c.stride))}function sa(c){let{length:e,values:t,valueOffsets:r}=c,n=oe(r[0]),a=oe(r[e]),o=Math.min(a-n,t.byteLength-n);return kt.call(this,Un(-n,e+1,r)),kt.call(this,t.subarray(n,n+o)),this}function vo(c){let{length:e,valueOffsets:t}=c;if(t){let{[0]:r,[e]:n}=t;return kt.call(this,Un(-r,e+1,t)),this.visit(c.children[0].slice(r,n-r))}return this.visit(c.children[0])}function go(c){return this.visitMany(c.type.children.map((e,t)=>c.children[t]).filter(Boolean))[0]}Ee.prototype.visitBool=fd;Ee.prototype.visitInt=dr;Ee.prototype.visitFloat=dr;Ee.prototype.visitUtf8=sa;Ee.prototype.visitLargeUtf8=sa;Ee.prototype.visitBinary=sa;Ee.prototype.visitLargeBinary=sa;Ee.prototype.visitFixedSizeBinary=dr;Ee.prototype.visitDate=dr;Ee.prototype.visitTimestamp=dr;Ee.prototype.visitTime=dr;Ee.prototype.visitDecimal=dr;Ee.prototype.visitList=vo;Ee.prototype.visitStruct=go;Ee.prototype.visitUnion=dd;Ee.prototype.visitInterval=dr;Ee.prototype.visitDuration=dr;Ee.prototype.visitFixedSizeList=vo;Ee.prototype.visitMap=vo;var Yr=class extends Nr{static throughNode(e){throw new Error('"throughNode" not available in this environment')}static throughDOM(e,t){throw new Error('"throughDOM" not available in this environment')}constructor(e){super(),this._position=0,this._started=!1,this._sink=new Rt,this._schema=null,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._seenDictionaries=new Map,this._dictionaryDeltaOffsets=new Map,Oe(e)||(e={autoDestroy:!0,writeLegacyIpcFormat:!1}),this._autoDestroy=typeof e.autoDestroy=="boolean"?e.autoDestroy:!0,this._writeLegacyIpcFormat=typeof e.writeLegacyIpcFormat=="boolean"?e.writeLegacyIpcFormat:!1}toString(e=!1){return this._sink.toString(e)}toUint8Array(e=!1){return this._sink.toUint8Array(e)}writeAll(e){return _t(e)?e.then(t=>this.writeAll(t)):it(e)?bo(this,e):yo(this,e)}get closed(){return this._sink.closed}[Symbol.asyncIterator](){return this._sink[Symbol.asyncIterator]()}toDOMStream(e){return this._sink.toDOMStream(e)}toNodeStream(e){return this._sink.toNodeStream(e)}close(){return this.reset()._sink.close()}abort(e){return this.reset()._sink.abort(e)}finish(){return this._autoDestroy?this.close():this.reset(this._sink,this._schema),this}reset(e=this._sink,t=null){return e===this._sink||e instanceof Rt?this._sink=e:(this._sink=new Rt,e&&Go(e)?this.toDOMStream({type:"bytes"}).pipeTo(e):e&&Oo(e)&&this.toNodeStream({objectMode:!1}).pipe(e)),this._started&&this._schema&&this._writeFooter(this._schema),this._started=!1,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._seenDictionaries=new Map,this._dictionaryDeltaOffsets=new Map,(!t||!Xr(t,this._schema))&&(t==null?(this._position=0,this._schema=null):(this._started=!0,this._schema=t,this._writeSchema(t))),this}write(e){let t=null;if(this._sink){if(e==null)return this.finish()&&void 0;if(e instanceof We&&!(t=e.schema))return this.finish()&&void 0;if(e instanceof ke&&!(t=e.schema))return this.finish()&&void 0}else throw new Error("RecordBatchWriter is closed");if(t&&!Xr(t,this._schema)){if(this._started&&this._autoDestroy)return this.close();this.reset(this._sink,t)}e instanceof ke?e instanceof Qr||this._writeRecordBatch(e):e instanceof We?this.writeAll(e.batches):dt(e)&&this.writeAll(e)}_writeMessage(e,t=8){let r=t-1,n=Xe.encode(e),a=n.byteLength,o=this._writeLegacyIpcFormat?4:8,l=a+o+r&~r,u=l-a-o;return e.headerType===se.RecordBatch?this._recordBatchBlocks.push(new sr(l,e.bodyLength,this._position)):e.headerType===se.DictionaryBatch&&this._dictionaryBlocks.push(new sr(l,e.bodyLength,this._position)),this._writeLegacyIpcFormat||this._write(Int32Array.of(-1)),this._write(Int32Array.of(l-o)),a>0&&this._write(n),this._writePadding(u)}_write(e){if(this._started){let t=z(e);t&&t.byteLength>0&&(this._sink.write(t),this._position+=t.byteLength)}return this}_writeSchema(e){return this._writeMessage(Xe.from(e))}_writeFooter(e){return this._writeLegacyIpcFormat?this._write(Int32Array.of(0)):this._write(Int32Array.of(-1,0))}_writeMagic(){return this._write(Ei)}_writePadding(e){return e>0?this._write(new Uint8Array(e)):this}_writeRecordBatch(e){let{byteLength:t,nodes:r,bufferRegions:n,buffers:a}=Ee.assemble(e),o=new Re(e.numRows,r,n),l=Xe.from(o,t);return this._writeDictionaries(e)._writeMessage(l)._writeBodyBuffers(a)}_writeDictionaryBatch(e,t,r=!1){let{byteLength:n,nodes:a,bufferRegions:o,buffers:l}=Ee.assemble(new ae([e])),u=new Re(e.length,a,o),_=new qe(u,t,r),d=Xe.from(_,n);return this._writeMessage(d)._writeBodyBuffers(l)}_writeBodyBuffers(e){let t,r,n;for(let a=-1,o=e.length;++a<o;)(t=e[a])&&(r=t.byteLength)>0&&(this._write(t),(n=(r+7&-8)-r)>0&&this._writePadding(n));return this}_writeDictionaries(e){var t,r;for(let[n,a]of e.dictionaries){let o=(t=a==null?void 0:a.data)!==null&&t!==void 0?t:[],l=this._seenDictionaries.get(n),u=(r=this._dictionaryDeltaOffsets.get(n))!==null&&r!==void 0?r:0;if(!l||l.data[0]!==o[0])for(let[_,d]of o.entries())this._writeDictionaryBatch(d,n,_>0);else if(u<o.length)for(let _ of o.slice(u))this._writeDictionaryBatch(_,n,!0);this._seenDictionaries.set(n,a),this._dictionaryDeltaOffsets.set(n,o.length)}return this}},Jr=class c extends Yr{static writeAll(e,t){let r=new c(t);return _t(e)?e.then(n=>r.writeAll(n)):it(e)?bo(r,e):yo(r,e)}},Kr=class c extends Yr{static writeAll(e){let t=new c;return _t(e)?e.then(r=>t.writeAll(r)):it(e)?bo(t,e):yo(t,e)}constructor(){super(),this._autoDestroy=!0}_writeSchema(e){return this._writeMagic()._writePadding(2)}_writeDictionaryBatch(e,t,r=!1){if(!r&&this._seenDictionaries.has(t))throw new Error("The Arrow File format does not support replacement dictionaries. ");return super._writeDictionaryBatch(e,t,r)}_writeFooter(e){let t=nr.encode(new nr(e,ue.V5,this._recordBatchBlocks,this._dictionaryBlocks));return super._writeFooter(e)._write(t)._write(Int32Array.of(t.byteLength))._writeMagic()}};function yo(c,e){let t=e;e instanceof We&&(t=e.batches,c.reset(void 0,e.schema));for(let r of t)c.write(r);return c.finish()}function bo(c,e){return B(this,void 0,void 0,function*(){var t,r,n,a,o,l,u;try{for(t=!0,r=ut(e);n=yield r.next(),a=n.done,!a;t=!0){u=n.value,t=!1;let _=u;c.write(_)}}catch(_){o={error:_}}finally{try{!t&&!a&&(l=r.return)&&(yield l.call(r))}finally{if(o)throw o.error}}return c.finish()})}function Al(c,e){if(it(c))return md(c,e);if(dt(c))return pd(c,e);throw new Error("toDOMStream() must be called with an Iterable or AsyncIterable")}function pd(c,e){let t=null,r=(e==null?void 0:e.type)==="bytes"||!1,n=(e==null?void 0:e.highWaterMark)||Math.pow(2,24);return new ReadableStream(Object.assign(Object.assign({},e),{start(o){a(o,t||(t=c[Symbol.iterator]()))},pull(o){t?a(o,t):o.close()},cancel(){(t!=null&&t.return&&t.return()||!0)&&(t=null)}}),Object.assign({highWaterMark:r?n:void 0},e));function a(o,l){let u,_=null,d=o.desiredSize||null;for(;!(_=l.next(r?d:null)).done;)if(ArrayBuffer.isView(_.value)&&(u=z(_.value))&&(d!=null&&r&&(d=d-u.byteLength+1),_.value=u),o.enqueue(_.value),d!=null&&--d<=0)return;o.close()}}function md(c,e){let t=null,r=(e==null?void 0:e.type)==="bytes"||!1,n=(e==null?void 0:e.highWaterMark)||Math.pow(2,24);return new ReadableStream(Object.assign(Object.assign({},e),{start(o){return B(this,void 0,void 0,function*(){yield a(o,t||(t=c[Symbol.asyncIterator]()))})},pull(o){return B(this,void 0,void 0,function*(){t?yield a(o,t):o.close()})},cancel(){return B(this,void 0,void 0,function*(){(t!=null&&t.return&&(yield t.return())||!0)&&(t=null)})}}),Object.assign({highWaterMark:r?n:void 0},e));function a(o,l){return B(this,void 0,void 0,function*(){let u,_=null,d=o.desiredSize||null;for(;!(_=yield l.next(r?d:null)).done;)if(ArrayBuffer.isView(_.value)&&(u=z(_.value))&&(d!=null&&r&&(d=d-u.byteLength+1),_.value=u),o.enqueue(_.value),d!=null&&--d<=0)return;o.close()})}}function Dl(c){return new So(c)}var So=class{constructor(e){this._numChunks=0,this._finished=!1,this._bufferedSize=0;let{["readableStrategy"]:t,["writableStrategy"]:r,["queueingStrategy"]:n="count"}=e,a=Ro(e,["readableStrategy","writableStrategy","queueingStrategy"]);this._controller=null,this._builder=Vr(a),this._getSize=n!=="bytes"?Ll:kl;let{["highWaterMark"]:o=n==="bytes"?Math.pow(2,14):1e3}=Object.assign({},t),{["highWaterMark"]:l=n==="bytes"?Math.pow(2,14):1e3}=Object.assign({},r);this.readable=new ReadableStream({cancel:()=>{this._builder.clear()},pull:u=>{this._maybeFlush(this._builder,this._controller=u)},start:u=>{this._maybeFlush(this._builder,this._controller=u)}},{highWaterMark:o,size:n!=="bytes"?Ll:kl}),this.writable=new WritableStream({abort:()=>{this._builder.clear()},write:()=>{this._maybeFlush(this._builder,this._controller)},close:()=>{this._maybeFlush(this._builder.finish(),this._controller)}},{highWaterMark:l,size:u=>this._writeValueAndReturnChunkSize(u)})}_writeValueAndReturnChunkSize(e){let t=this._bufferedSize;return this._bufferedSize=this._getSize(this._builder.append(e)),this._bufferedSize-t}_maybeFlush(e,t){t!=null&&(this._bufferedSize>=t.desiredSize&&++this._numChunks&&this._enqueue(t,e.toVector()),e.finished&&((e.length>0||this._numChunks===0)&&++this._numChunks&&this._enqueue(t,e.toVector()),!this._finished&&(this._finished=!0)&&this._enqueue(t,null)))}_enqueue(e,t){this._bufferedSize=0,this._controller=null,t==null?e.close():e.enqueue(t)}},Ll=c=>{var e;return(e=c==null?void 0:c.length)!==null&&e!==void 0?e:0},kl=c=>{var e;return(e=c==null?void 0:c.byteLength)!==null&&e!==void 0?e:0};function aa(c,e){let t=new Rt,r=null,n=new ReadableStream({cancel(){return B(this,void 0,void 0,function*(){yield t.close()})},start(l){return B(this,void 0,void 0,function*(){yield o(l,r||(r=yield a()))})},pull(l){return B(this,void 0,void 0,function*(){r?yield o(l,r):l.close()})}});return{writable:new WritableStream(t,Object.assign({highWaterMark:Math.pow(2,14)},c)),readable:n};function a(){return B(this,void 0,void 0,function*(){return yield(yield Ue.from(t)).open(e)})}function o(l,u){return B(this,void 0,void 0,function*(){let _=l.desiredSize,d=null;for(;!(d=yield u.next()).done;)if(l.enqueue(d.value),_!=null&&--_<=0)return;l.close()})}}function oa(c,e){let t=new this(c),r=new ot(t),n=new ReadableStream({cancel(){return B(this,void 0,void 0,function*(){yield r.cancel()})},pull(o){return B(this,void 0,void 0,function*(){yield a(o)})},start(o){return B(this,void 0,void 0,function*(){yield a(o)})}},Object.assign({highWaterMark:Math.pow(2,14)},e));return{writable:new WritableStream(t,c),readable:n};function a(o){return B(this,void 0,void 0,function*(){let l=null,u=o.desiredSize;for(;l=yield r.read(u||null);)if(o.enqueue(l),u!=null&&(u-=l.byteLength)<=0)return;o.close()})}}function ca(c,e="stream"){return(e==="stream"?Jr:Kr).writeAll(c).toUint8Array(!0)}var yd=Object.assign(Object.assign(Object.assign(Object.assign(Object.assign(Object.assign(Object.assign(Object.assign({},Ma),io),Xa),Pa),La),qa),Ta),{compareSchemas:Xr,compareFields:tl,compareTypes:rl});Be.toDOMStream=Al;Se.throughDOM=Dl;Ue.throughDOM=aa;xr.throughDOM=aa;Ot.throughDOM=aa;Yr.throughDOM=oa;Kr.throughDOM=oa;Jr.throughDOM=oa;function Di(c){switch(c.typeId){case b.Binary:return{sqlType:"binary"};case b.Bool:return{sqlType:"bool"};case b.Date:return{sqlType:"date"};case b.DateDay:return{sqlType:"date32[d]"};case b.DateMillisecond:return{sqlType:"date64[ms]"};case b.Decimal:{let e=c;return{sqlType:"decimal",precision:e.precision,scale:e.scale}}case b.Float:return{sqlType:"float"};case b.Float16:return{sqlType:"float16"};case b.Float32:return{sqlType:"float32"};case b.Float64:return{sqlType:"float64"};case b.Int:return{sqlType:"int32"};case b.Int16:return{sqlType:"int16"};case b.Int32:return{sqlType:"int32"};case b.Int64:return{sqlType:"int64"};case b.Uint16:return{sqlType:"uint16"};case b.Uint32:return{sqlType:"uint32"};case b.Uint64:return{sqlType:"uint64"};case b.Uint8:return{sqlType:"uint8"};case b.IntervalDayTime:return{sqlType:"interval[dt]"};case b.IntervalYearMonth:return{sqlType:"interval[m]"};case b.List:return{sqlType:"list",valueType:Di(c.valueType)};case b.FixedSizeBinary:return{sqlType:"fixedsizebinary",byteWidth:c.byteWidth};case b.Null:return{sqlType:"null"};case b.Utf8:return{sqlType:"utf8"};case b.Struct:return{sqlType:"struct",fields:c.children.map(t=>la(t.name,t.type))};case b.Map:{let e=c;return{sqlType:"map",keyType:Di(e.keyType),valueType:Di(e.valueType)}}case b.Time:return{sqlType:"time[s]"};case b.TimeMicrosecond:return{sqlType:"time[us]"};case b.TimeMillisecond:return{sqlType:"time[ms]"};case b.TimeNanosecond:return{sqlType:"time[ns]"};case b.TimeSecond:return{sqlType:"time[s]"};case b.Timestamp:return{sqlType:"timestamp",timezone:c.timezone||void 0};case b.TimestampSecond:return{sqlType:"timestamp[s]",timezone:c.timezone||void 0};case b.TimestampMicrosecond:return{sqlType:"timestamp[us]",timezone:c.timezone||void 0};case b.TimestampNanosecond:return{sqlType:"timestamp[ns]",timezone:c.timezone||void 0};case b.TimestampMillisecond:return{sqlType:"timestamp[ms]",timezone:c.timezone||void 0}}throw new Error("unsupported arrow type: ".concat(c.toString()))}function la(c,e){let t=Di(e);return t.name=c,t}var ua=class{constructor(e,t){this._bindings=e,this._conn=t}close(){this._bindings.disconnect(this._conn)}useUnsafe(e){return e(this._bindings,this._conn)}query(e){let t=this._bindings.runQuery(this._conn,e),r=Ue.from(t);return console.assert(r.isSync()),console.assert(r.isFile()),new We(r)}async send(e,t=!1){let r=this._bindings.startPendingQuery(this._conn,e,t);for(;r==null;)r=await new Promise((o,l)=>{try{o(this._bindings.pollPendingQuery(this._conn))}catch(u){console.log(u),u.message.includes("worker is not set!")?l(new Error("Worker has been terminated")):l(u)}});let n=new _a(this._bindings,this._conn,r),a=Ue.from(n);return console.assert(a.isSync()),console.assert(a.isStream()),a}cancelSent(){return this._bindings.cancelPendingQuery(this._conn)}getTableNames(e){return this._bindings.getTableNames(this._conn,e)}prepare(e){let t=this._bindings.createPrepared(this._conn,e);return new wo(this._bindings,this._conn,t)}createScalarFunction(e,t,r){this._bindings.createScalarFunction(this._conn,e,t,r)}insertArrowTable(e,t){let r=ca(e,"stream");this.insertArrowFromIPCStream(r,t)}insertArrowFromIPCStream(e,t){this._bindings.insertArrowFromIPCStream(this._conn,e,t)}insertCSVFromPath(e,t){this._bindings.insertCSVFromPath(this._conn,e,t)}insertJSONFromPath(e,t){this._bindings.insertJSONFromPath(this._conn,e,t)}},_a=class{constructor(e,t,r){this.bindings=e;this.conn=t;this.header=r;this._first=!0,this._depleted=!1}next(){if(this._first)return this._first=!1,{done:!1,value:this.header};if(this._depleted)return{done:!0,value:null};let e=null;do e=this.bindings.fetchQueryResults(this.conn);while(e==null);return this._depleted=e.length==0,{done:this._depleted,value:e}}[Symbol.iterator](){return this}},wo=class{constructor(e,t,r){this.bindings=e,this.connectionId=t,this.statementId=r}close(){this.bindings.closePrepared(this.connectionId,this.statementId)}query(...e){let t=this.bindings.runPrepared(this.connectionId,this.statementId,e),r=Ue.from(t);return console.assert(r.isSync()),console.assert(r.isFile()),new We(r)}send(...e){let t=this.bindings.sendPrepared(this.connectionId,this.statementId,e),r=new _a(this.bindings,this.connectionId,t),n=Ue.from(r);return console.assert(n.isSync()),console.assert(n.isStream()),n}};function Fl(c){return c<=255}function xl(c){return c===256}var Pl=new TextEncoder,Cl=new TextDecoder("utf-8");function Eo(c,e,t){let r=Pl.encode(t),n=c._malloc(r.byteLength),a=c.HEAPU8.subarray(n,n+r.byteLength);a.set(r),c.HEAPF64[(e>>3)+0]=1,c.HEAPF64[(e>>3)+1]=n,c.HEAPF64[(e>>3)+2]=a.byteLength}function Lo(c){switch(c){case"UINT8":case"INT8":return 1;case"INT32":case"FLOAT":return 4;case"INT64":case"UINT64":case"DOUBLE":case"VARCHAR":return 8;default:return 0}}function Ao(c,e,t,r){let n=c.HEAPU8.subarray(e,e+r*Lo(t));switch(t){case"UINT8":return new Uint8Array(n.buffer,n.byteOffset,r);case"INT8":return new Int8Array(n.buffer,n.byteOffset,r);case"INT32":return new Int32Array(n.buffer,n.byteOffset,r);case"FLOAT":return new Float32Array(n.buffer,n.byteOffset,r);case"DOUBLE":return new Float64Array(n.buffer,n.byteOffset,r);case"VARCHAR":return new Float64Array(n.buffer,n.byteOffset,r);default:return new Array(0)}}function Ml(c,e,t){let r=c.HEAPU8.subarray(e,e+t);return new Uint8Array(r.buffer,r.byteOffset,t)}function da(c,e,t){let r=c.HEAPU8.subarray(e,e+t*8);return new Float64Array(r.buffer,r.byteOffset,t)}function Il(c,e,t,r,n,a,o,l){try{let u=c._udfFunctions.get(r);if(!u){Eo(e,t,"Unknown UDF with id: "+r);return}let _=Cl.decode(e.HEAPU8.subarray(n,n+a)),d=JSON.parse(_),f=da(e,o,l/8),p=L=>{var k;let C=null;switch(L.validityBuffer!==void 0&&(C=Ml(e,f[L.validityBuffer],d.rows)),L.physicalType){case"VARCHAR":{if(L.dataBuffer===null||L.dataBuffer===void 0)throw new Error("malformed data view, expected data buffer for VARCHAR argument");if(L.lengthBuffer===null||L.lengthBuffer===void 0)throw new Error("malformed data view, expected data length buffer for VARCHAR argument");let P=Ao(e,f[L.dataBuffer],L.physicalType,d.rows),T=[],M=da(e,f[L.lengthBuffer],d.rows);for(let I=0;I<d.rows;++I){if(C!=null&&!C[I]){T.push(null);continue}let Q=e.HEAPU8.subarray(P[I],P[I]+M[I]),ee=Cl.decode(Q);T.push(ee)}return I=>T[I]}case"STRUCT":{let P={},T=[];for(let M=0;M<(((k=L.children)==null?void 0:k.length)||0);++M){let I=L.children[M],Q=p(I);T.push(ee=>{P[I.name]=Q(ee)})}return C!=null?M=>{if(!C[M])return null;for(let I of T)I(M);return P}:M=>{for(let I of T)I(M);return P}}default:{if(L.dataBuffer===void 0)throw new Error("malformed data view, expected data buffer for argument of type: "+L.physicalType);let P=Ao(e,f[L.dataBuffer],L.physicalType,d.rows);return C!=null?T=>C[T]?P[T]:null:T=>P[T]}}},m=[];for(let L=0;L<d.args.length;++L)m.push(p(d.args[L]));let h=d.rows*Lo(d.ret.physicalType),g=e._malloc(h),v=Ao(e,g,d.ret.physicalType,d.rows),y=e._malloc(d.rows),S=Ml(e,y,d.rows);if(v.length==0||S.length==0){Eo(e,t,"Can't create physical arrays for result");return}let w=v;d.ret.physicalType=="VARCHAR"&&(w=new Array(d.rows));let D=[];for(let L=0;L<d.args.length;++L)D.push(null);for(let L=0;L<d.rows;++L){for(let k=0;k<d.args.length;++k)D[k]=m[k](L);let C=u.func(...D);w[L]=C,S[L]=C==null?0:1}let F=0;switch(d.ret.physicalType){case"VARCHAR":{let L=new Array(0);F=e._malloc(d.rows*Lo("DOUBLE"));let C=da(e,F,d.rows),k=0;for(let I=0;I<d.rows;++I){let Q=Pl.encode(w[I]||"");L.push(Q),C[I]=Q.length,k+=Q.length}let P=e._malloc(k),T=e.HEAPU8.subarray(P,P+k),M=0;for(let I=0;I<d.rows;++I){v[I]=M;let Q=L[I];T.subarray(M,M+Q.length).set(Q),M+=Q.length}}}let E=3*8,x=e._malloc(E),A=da(e,x,3);A[0]=g,A[1]=y,A[2]=F,e.HEAPF64[(t>>3)+0]=0,e.HEAPF64[(t>>3)+1]=x,e.HEAPF64[(t>>3)+2]=0}catch(u){Eo(e,t,u.toString())}}function Sd(){let c=new TextDecoder;return e=>(typeof SharedArrayBuffer<"u"&&e.buffer instanceof SharedArrayBuffer&&(e=new Uint8Array(e)),c.decode(e))}var wd=Sd();function Dt(c,e){console.error("FAIL WITH: ".concat(e)),c.ccall("duckdb_web_fail_with",null,["string"],[e])}function Zr(c,e,t){let r=c.HEAPU8.subarray(e,e+t),n=new Uint8Array(new ArrayBuffer(r.byteLength));return n.set(r),n}function te(c,e,t){return wd(c.HEAPU8.subarray(e,e+t))}function fe(c,e,t,r){let n=c.stackSave(),a=c.stackAlloc(3*8);t.unshift("number"),r.unshift(a),c.ccall(e,null,t,r);let o=c.HEAPF64[(a>>3)+0],l=c.HEAPF64[(a>>3)+1],u=c.HEAPF64[(a>>3)+2];return c.stackRestore(n),[o,l,u]}function ve(c){c.ccall("duckdb_web_clear_response",null,[],[])}var fa=class{constructor(e){let t=new Float64Array(e.buffer,e.byteOffset,e.byteLength/8),r=new Uint8Array(new ArrayBuffer(e.byteLength));r.set(e.subarray(7*8)),this.totalFileReadsCold=t[0],this.totalFileReadsAhead=t[1],this.totalFileReadsCached=t[2],this.totalFileWrites=t[3],this.totalPageAccesses=t[4],this.totalPageLoads=t[5],this.blockSize=t[6],this.blockStats=r}getBlockStats(e,t){return t=t||{file_reads_cold:0,file_reads_ahead:0,file_reads_cached:0,file_writes:0,page_accesses:0,page_loads:0},t.file_writes=this.blockStats[e*3+0]&15,t.file_reads_cold=this.blockStats[e*3+0]>>4,t.file_reads_ahead=this.blockStats[e*3+1]&15,t.file_reads_cached=this.blockStats[e*3+1]>>4,t.page_accesses=this.blockStats[e*3+1]&15,t.page_loads=this.blockStats[e*3+1]>>4,t}};var Ti=new TextEncoder;var pa=class{constructor(e,t){this._instance=null;this._initPromise=null;this._initPromiseResolver=()=>{};this.onInstantiationProgress=[];this._logger=e,this._runtime=t,this._nextUDFId=1}get logger(){return this._logger}get mod(){return this._instance}get pthread(){return this.mod.PThread||null}async instantiate(e=t=>{}){return this._instance!=null?this:(this._initPromise!=null&&(this.onInstantiationProgress.push(e),await this._initPromise),this._initPromise=new Promise(t=>{this._initPromiseResolver=t}),this.onInstantiationProgress=[e],this._instance=await this.instantiateImpl({print:console.log.bind(console),printErr:console.log.bind(console),onRuntimeInitialized:this._initPromiseResolver}),await this._initPromise,this._initPromise=null,this.onInstantiationProgress=this.onInstantiationProgress.filter(t=>t!=e),globalThis.DUCKDB_BINDINGS=this,this)}open(e){let[t,r,n]=fe(this.mod,"duckdb_web_open",["string"],[JSON.stringify(e)]);if(t!==0)throw new Error(te(this.mod,r,n));ve(this.mod)}reset(){let[e,t,r]=fe(this.mod,"duckdb_web_reset",[],[]);if(e!==0)throw new Error(te(this.mod,t,r));ve(this.mod)}getVersion(){let[e,t,r]=fe(this.mod,"duckdb_web_get_version",[],[]);if(e!==0)throw new Error(te(this.mod,t,r));let n=te(this.mod,t,r);return ve(this.mod),n}getFeatureFlags(){return this.mod.ccall("duckdb_web_get_feature_flags","number",[],[])}tokenize(e){let t=Ti.encode(e),r=this.mod._malloc(t.length);this.mod.HEAPU8.subarray(r,r+t.length).set(t);let[a,o,l]=fe(this.mod,"duckdb_web_tokenize_buffer",["number","number"],[r,t.length]);if(this.mod._free(r),a!==0)throw new Error(te(this.mod,o,l));let u=te(this.mod,o,l);return ve(this.mod),JSON.parse(u)}connect(){let e=this.mod.ccall("duckdb_web_connect","number",[],[]);return new ua(this,e)}disconnect(e){if(this.mod.ccall("duckdb_web_disconnect",null,["number"],[e]),this.pthread)for(let t of[...this.pthread.runningWorkers,...this.pthread.unusedWorkers])t.postMessage({cmd:"dropUDFFunctions",connectionId:e})}runQuery(e,t){let r=Ti.encode(t),n=this.mod._malloc(r.length);this.mod.HEAPU8.subarray(n,n+r.length).set(r);let[o,l,u]=fe(this.mod,"duckdb_web_query_run_buffer",["number","number","number"],[e,n,r.length]);if(this.mod._free(n),o!==0)throw new Error(te(this.mod,l,u));let _=Zr(this.mod,l,u);return ve(this.mod),_}startPendingQuery(e,t,r=!1){let n=Ti.encode(t),a=this.mod._malloc(n.length);this.mod.HEAPU8.subarray(a,a+n.length).set(n);let[l,u,_]=fe(this.mod,"duckdb_web_pending_query_start_buffer",["number","number","number","boolean"],[e,a,n.length,r]);if(this.mod._free(a),l!==0)throw new Error(te(this.mod,u,_));if(u==0)return null;let d=Zr(this.mod,u,_);return ve(this.mod),d}pollPendingQuery(e){let[t,r,n]=fe(this.mod,"duckdb_web_pending_query_poll",["number"],[e]);if(t!==0)throw new Error(te(this.mod,r,n));if(r==0)return null;let a=Zr(this.mod,r,n);return ve(this.mod),a}cancelPendingQuery(e){return this.mod.ccall("duckdb_web_pending_query_cancel","boolean",["number"],[e])}fetchQueryResults(e){let[t,r,n]=fe(this.mod,"duckdb_web_query_fetch_results",["number"],[e]);if(xl(t))return ve(this.mod),null;if(!Fl(t))throw new Error("Unexpected StatusCode from duckdb_web_query_fetch_results ("+t+") and with self reported error as"+te(this.mod,r,n));if(t!==0)throw new Error(te(this.mod,r,n));let a=Zr(this.mod,r,n);return ve(this.mod),a}getTableNames(e,t){let r=Ti.encode(t),n=this.mod._malloc(r.length);this.mod.HEAPU8.subarray(n,n+r.length).set(r);let[o,l,u]=fe(this.mod,"duckdb_web_get_tablenames_buffer",["number","number","number"],[e,n,r.length]);if(this.mod._free(n),o!==0)throw new Error(te(this.mod,l,u));let _=te(this.mod,l,u);return ve(this.mod),JSON.parse(_)}createScalarFunction(e,t,r,n){let a={functionId:this._nextUDFId,name:t,returnType:Di(r)},o={functionId:a.functionId,connectionId:e,name:t,returnType:r,func:n};this._nextUDFId+=1;let[l,u,_]=fe(this.mod,"duckdb_web_udf_scalar_create",["number","string"],[e,JSON.stringify(a)]);if(l!==0)throw new Error(te(this.mod,u,_));if(ve(this.mod),globalThis.DUCKDB_RUNTIME._udfFunctions=(globalThis.DUCKDB_RUNTIME._udfFunctions||new Map).set(o.functionId,o),this.pthread)for(let d of[...this.pthread.runningWorkers,...this.pthread.unusedWorkers])d.postMessage({cmd:"registerUDFFunction",udf:o})}createPrepared(e,t){let r=Ti.encode(t),n=this.mod._malloc(r.length);this.mod.HEAPU8.subarray(n,n+r.length).set(r);let[o,l,u]=fe(this.mod,"duckdb_web_prepared_create_buffer",["number","number","number"],[e,n,r.length]);if(this.mod._free(n),o!==0)throw new Error(te(this.mod,l,u));return ve(this.mod),l}closePrepared(e,t){let[r,n,a]=fe(this.mod,"duckdb_web_prepared_close",["number","number"],[e,t]);if(r!==0)throw new Error(te(this.mod,n,a));ve(this.mod)}runPrepared(e,t,r){let[n,a,o]=fe(this.mod,"duckdb_web_prepared_run",["number","number","string"],[e,t,JSON.stringify(r)]);if(n!==0)throw new Error(te(this.mod,a,o));let l=Zr(this.mod,a,o);return ve(this.mod),l}sendPrepared(e,t,r){let[n,a,o]=fe(this.mod,"duckdb_web_prepared_send",["number","number","string"],[e,t,JSON.stringify(r)]);if(n!==0)throw new Error(te(this.mod,a,o));let l=Zr(this.mod,a,o);return ve(this.mod),l}insertArrowFromIPCStream(e,t,r){if(t.length==0)return;let n=this.mod._malloc(t.length);this.mod.HEAPU8.subarray(n,n+t.length).set(t);let o=r?JSON.stringify(r):"",[l,u,_]=fe(this.mod,"duckdb_web_insert_arrow_from_ipc_stream",["number","number","number","string"],[e,n,t.length,o]);if(this.mod._free(n),l!==0)throw new Error(te(this.mod,u,_))}insertCSVFromPath(e,t,r){if(r.columns!==void 0){r.columnsFlat=[];for(let _ in r.columns)r.columnsFlat.push(la(_,r.columns[_]))}let n={...r};n.columns=n.columnsFlat,delete n.columnsFlat;let a=JSON.stringify(n),[o,l,u]=fe(this.mod,"duckdb_web_insert_csv_from_path",["number","string","string"],[e,t,a]);if(o!==0)throw new Error(te(this.mod,l,u))}insertJSONFromPath(e,t,r){if(r.columns!==void 0){r.columnsFlat=[];for(let _ in r.columns)r.columnsFlat.push(la(_,r.columns[_]))}let n={...r};n.columns=n.columnsFlat,delete n.columnsFlat;let a=JSON.stringify(n),[o,l,u]=fe(this.mod,"duckdb_web_insert_json_from_path",["number","string","string"],[e,t,a]);if(o!==0)throw new Error(te(this.mod,l,u))}globFiles(e){let[t,r,n]=fe(this.mod,"duckdb_web_fs_glob_file_infos",["string"],[e]);if(t!==0)throw new Error(te(this.mod,r,n));let a=te(this.mod,r,n);ve(this.mod);let o=JSON.parse(a);return o==null?[]:o}registerFileURL(e,t,r,n=!1){t===void 0&&(t=e);let[a,o,l]=fe(this.mod,"duckdb_web_fs_register_file_url",["string","string"],[e,t,r,n]);if(a!==0)throw new Error(te(this.mod,o,l));ve(this.mod)}registerFileText(e,t){let r=Ti.encode(t);this.registerFileBuffer(e,r)}registerFileBuffer(e,t){let r=this.mod._malloc(t.length);this.mod.HEAPU8.subarray(r,r+t.length).set(t);let[a,o,l]=fe(this.mod,"duckdb_web_fs_register_file_buffer",["string","number","number"],[e,r,t.length]);if(a!==0)throw new Error(te(this.mod,o,l));ve(this.mod)}async prepareFileHandle(e,t){if(t===3&&this._runtime.prepareFileHandles){let r=await this._runtime.prepareFileHandles([e],3);for(let n of r){let{handle:a,path:o,fromCached:l}=n;!l&&a.getSize()&&await this.registerFileHandleAsync(o,a,3,!0)}return}throw new Error("prepareFileHandle: unsupported protocol ".concat(t))}async prepareDBFileHandle(e,t){if(t===3&&this._runtime.prepareDBFileHandle){let r=await this._runtime.prepareDBFileHandle(e,3);for(let n of r){let{handle:a,path:o,fromCached:l}=n;!l&&a.getSize()&&await this.registerFileHandleAsync(o,a,3,!0)}return}throw new Error("prepareDBFileHandle: unsupported protocol ".concat(t))}async prepareFileHandleAsync(e,t,r,n){if(r===3&&!(t instanceof FileSystemSyncAccessHandle)){if(t instanceof FileSystemFileHandle){let a=t;try{t=await a.createSyncAccessHandle()}catch(o){throw new Error(o.message+":"+e)}}else if(e!=null)try{t=await(await(await navigator.storage.getDirectory()).getFileHandle(e)).createSyncAccessHandle()}catch(a){throw new Error(a.message+":"+e)}}return t}async registerFileHandleAsync(e,t,r,n){let a=await this.prepareFileHandleAsync(e,t,r,n);this.registerFileHandle(e,a,r,n)}registerFileHandle(e,t,r,n){var u;let[a,o,l]=fe(this.mod,"duckdb_web_fs_register_file_url",["string","string","number","boolean"],[e,e,r,n]);if(a!==0)throw new Error(te(this.mod,o,l));if(ve(this.mod),globalThis.DUCKDB_RUNTIME._files=(globalThis.DUCKDB_RUNTIME._files||new Map).set(e,t),(u=globalThis.DUCKDB_RUNTIME._preparedHandles)!=null&&u[e]&&delete globalThis.DUCKDB_RUNTIME._preparedHandles[e],this.pthread){for(let _ of this.pthread.runningWorkers)_.postMessage({cmd:"registerFileHandle",fileName:e,fileHandle:t});for(let _ of this.pthread.unusedWorkers)_.postMessage({cmd:"dropFileHandle",fileName:e})}}dropFile(e){let[t,r,n]=fe(this.mod,"duckdb_web_fs_drop_file",["string"],[e]);if(t!==0)throw new Error(te(this.mod,r,n));ve(this.mod)}dropFiles(e){let t=[],r=-1;try{for(let l of e!=null?e:[])if(l!=null&&l.length>0){let u=this.mod.lengthBytesUTF8(l)+1,_=this.mod._malloc(u);if(!_)throw new Error("Failed to allocate memory for string: ".concat(l));this.mod.stringToUTF8(l,_,u),t.push(_)}if(r=this.mod._malloc(t.length*4),!r)throw new Error("Failed to allocate memory for pointers array");for(let l=0;l<t.length;l++)this.mod.HEAP32[(r>>2)+l]=t[l];let[n,a,o]=fe(this.mod,"duckdb_web_fs_drop_files",["number","number"],[r,t.length]);if(n!==0)throw new Error(te(this.mod,a,o));ve(this.mod)}finally{for(let n of t)this.mod._free(n);r>0&&this.mod._free(r)}}flushFiles(){this.mod.ccall("duckdb_web_flush_files",null,[],[])}copyFileToPath(e,t){let[r,n,a]=fe(this.mod,"duckdb_web_copy_file_to_path",["string","string"],[e,t]);if(r!==0)throw new Error(te(this.mod,n,a));ve(this.mod)}copyFileToBuffer(e){let[t,r,n]=fe(this.mod,"duckdb_web_copy_file_to_buffer",["string"],[e]);if(t!==0)throw new Error(te(this.mod,r,n));let a=this.mod.HEAPU8.subarray(r,r+n),o=new Uint8Array(a.length);return o.set(a),ve(this.mod),o}async registerOPFSFileName(e){if(e.startsWith("opfs://"))return this.prepareFileHandle(e,3);throw new Error("Not an OPFS file name: "+e)}collectFileStatistics(e,t){let[r,n,a]=fe(this.mod,"duckdb_web_collect_file_stats",["string","boolean"],[e,t]);if(r!==0)throw new Error(te(this.mod,n,a))}exportFileStatistics(e){let[t,r,n]=fe(this.mod,"duckdb_web_export_file_stats",["string"],[e]);if(t!==0)throw new Error(te(this.mod,r,n));return new fa(this.mod.HEAPU8.subarray(r,r+n))}};var ma=class{constructor(){this._bindings=null;this._nextMessageId=0}log(e){this.postMessage({messageId:this._nextMessageId++,requestId:0,type:"LOG",data:e},[])}sendOK(e){this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"OK",data:null},[])}failWith(e,t){let r={name:t.name,message:t.message,stack:t.stack||void 0};this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"ERROR",data:r},[])}async onMessage(e){switch(e.type){case"PING":this.sendOK(e);return;case"INSTANTIATE":this._bindings!=null&&this.failWith(e,new Error("duckdb already initialized"));try{this._bindings=await this.instantiate(e.data[0],e.data[1],t=>{this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"INSTANTIATE_PROGRESS",data:t},[])}),this.sendOK(e)}catch(t){console.log(t),this._bindings=null,this.failWith(e,t)}return;default:break}if(!this._bindings)return this.failWith(e,new Error("duckdb is not initialized"));try{switch(e.type){case"GET_VERSION":this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"VERSION_STRING",data:this._bindings.getVersion()},[]);break;case"GET_FEATURE_FLAGS":this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"FEATURE_FLAGS",data:this._bindings.getFeatureFlags()},[]);break;case"RESET":this._bindings.reset(),this.sendOK(e);break;case"OPEN":{let t=e.data.path;t!=null&&t.startsWith("opfs://")&&(await this._bindings.prepareDBFileHandle(t,3),e.data.useDirectIO=!0),this._bindings.open(e.data),this.sendOK(e);break}case"DROP_FILE":this._bindings.dropFile(e.data),this.sendOK(e);break;case"DROP_FILES":this._bindings.dropFiles(e.data),this.sendOK(e);break;case"FLUSH_FILES":this._bindings.flushFiles(),this.sendOK(e);break;case"CONNECT":{let t=this._bindings.connect();this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"CONNECTION_INFO",data:t.useUnsafe((r,n)=>n)},[]);break}case"DISCONNECT":this._bindings.disconnect(e.data),this.sendOK(e);break;case"CREATE_PREPARED":{let t=this._bindings.createPrepared(e.data[0],e.data[1]);this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"PREPARED_STATEMENT_ID",data:t},[]);break}case"CLOSE_PREPARED":{this._bindings.closePrepared(e.data[0],e.data[1]),this.sendOK(e);break}case"RUN_PREPARED":{let t=this._bindings.runPrepared(e.data[0],e.data[1],e.data[2]);this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"QUERY_RESULT",data:t},[t.buffer]);break}case"RUN_QUERY":{let t=this._bindings.runQuery(e.data[0],e.data[1]);this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"QUERY_RESULT",data:t},[t.buffer]);break}case"SEND_PREPARED":{let t=this._bindings.sendPrepared(e.data[0],e.data[1],e.data[2]);this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"QUERY_RESULT_HEADER",data:t},[t.buffer]);break}case"START_PENDING_QUERY":{let t=this._bindings.startPendingQuery(e.data[0],e.data[1],e.data[2]),r=[];t&&r.push(t.buffer),this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"QUERY_RESULT_HEADER_OR_NULL",data:t},r);break}case"POLL_PENDING_QUERY":{let t=this._bindings.pollPendingQuery(e.data),r=[];t&&r.push(t.buffer),this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"QUERY_RESULT_HEADER_OR_NULL",data:t},r);break}case"CANCEL_PENDING_QUERY":{let t=this._bindings.cancelPendingQuery(e.data);this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"SUCCESS",data:t},[]);break}case"FETCH_QUERY_RESULTS":{let t=this._bindings.fetchQueryResults(e.data),r=t?[t.buffer]:[];this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"QUERY_RESULT_CHUNK",data:t},r);break}case"GET_TABLE_NAMES":{let t=this._bindings.getTableNames(e.data[0],e.data[1]);this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"TABLE_NAMES",data:t},[]);break}case"GLOB_FILE_INFOS":{let t=this._bindings.globFiles(e.data);this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"FILE_INFOS",data:t},[]);break}case"REGISTER_FILE_URL":this._bindings.registerFileURL(e.data[0],e.data[1],e.data[2],e.data[3]),this.sendOK(e);break;case"REGISTER_FILE_BUFFER":this._bindings.registerFileBuffer(e.data[0],e.data[1]),this.sendOK(e);break;case"REGISTER_FILE_HANDLE":await this._bindings.registerFileHandleAsync(e.data[0],e.data[1],e.data[2],e.data[3]),this.sendOK(e);break;case"COPY_FILE_TO_PATH":this._bindings.copyFileToPath(e.data[0],e.data[1]),this.sendOK(e);break;case"COPY_FILE_TO_BUFFER":{let t=this._bindings.copyFileToBuffer(e.data);this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"FILE_BUFFER",data:t},[]);break}case"COLLECT_FILE_STATISTICS":this._bindings.collectFileStatistics(e.data[0],e.data[1]),this.sendOK(e);break;case"REGISTER_OPFS_FILE_NAME":await this._bindings.registerOPFSFileName(e.data[0]),this.sendOK(e);break;case"EXPORT_FILE_STATISTICS":{this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"FILE_STATISTICS",data:this._bindings.exportFileStatistics(e.data)},[]);break}case"INSERT_ARROW_FROM_IPC_STREAM":{this._bindings.insertArrowFromIPCStream(e.data[0],e.data[1],e.data[2]),this.sendOK(e);break}case"IMPORT_CSV_FROM_PATH":{this._bindings.insertCSVFromPath(e.data[0],e.data[1],e.data[2]),this.sendOK(e);break}case"IMPORT_JSON_FROM_PATH":{this._bindings.insertJSONFromPath(e.data[0],e.data[1],e.data[2]),this.sendOK(e);break}case"TOKENIZE":{let t=this._bindings.tokenize(e.data);this.postMessage({messageId:this._nextMessageId++,requestId:e.messageId,type:"SCRIPT_TOKENS",data:t},[]);break}}}catch(t){return console.log(t),this.failWith(e,t)}}};var Ul=Bo(Rl());var ha=class extends pa{constructor(e,t,r,n){super(e,t),this.mainModuleURL=r,this.pthreadWorkerURL=n}locateFile(e,t){if(e.endsWith(".wasm"))return this.mainModuleURL;if(e.endsWith(".worker.js")){if(!this.pthreadWorkerURL)throw new Error("Missing DuckDB worker URL!");return this.pthreadWorkerURL}throw new Error("WASM instantiation requested unexpected file: prefix=".concat(t," path=").concat(e))}instantiateWasm(e,t){globalThis.DUCKDB_RUNTIME=this._runtime;let r=this.onInstantiationProgress;if(WebAssembly.instantiateStreaming)if(typeof TransformStream=="function"){let a=(async()=>{var h;let o=new Request(this.mainModuleURL),l=await fetch(o),u=l.headers.get("content-length"),_=u&&parseInt(u,10)||0,d=new Date,f={startedAt:d,updatedAt:d,bytesTotal:_||0,bytesLoaded:0},p={transform(g,v){f.bytesLoaded+=g.byteLength;let y=new Date;if(y.getTime()-f.updatedAt.getTime()<20){f.updatedAt=y,v.enqueue(g);return}for(let S of r)S(f);v.enqueue(g)}},m=new TransformStream(p);return new Response((h=l.body)==null?void 0:h.pipeThrough(m),l)})();WebAssembly.instantiateStreaming(a,e).then(o=>{t(o.instance,o.module)})}else{console.warn("instantiating without progress handler since transform streams are unavailable");let n=new Request(this.mainModuleURL);WebAssembly.instantiateStreaming(fetch(n),e).then(a=>{t(a.instance,a.module)})}else if(typeof XMLHttpRequest=="function"){let n=new XMLHttpRequest,a=this.mainModuleURL,o=new Date,l={startedAt:o,updatedAt:o,bytesTotal:0,bytesLoaded:0};n.open("GET",a),n.responseType="arraybuffer",n.onerror=u=>{throw this.logger.log({timestamp:new Date,level:4,origin:3,topic:5,event:2,value:"Failed to load WASM: "+u}),new Error(u.toString())},n.onprogress=u=>{l.bytesTotal=u.total,l.bytesLoaded=u.loaded;let _=new Date;if(_.getTime()-l.updatedAt.getTime()<20){l.updatedAt=_;return}for(let d of r)d(l)},n.onload=()=>{WebAssembly.instantiate(n.response,e).then(u=>{t(u.instance,u.module)}).catch(u=>{throw this.logger.log({timestamp:new Date,level:4,origin:3,topic:5,event:2,value:"Failed to instantiate WASM: "+u}),new Error(u)})},n.send()}else console.warn("instantiating with manual fetch since streaming instantiation and xhrs are unavailable"),(async()=>{let a=new Request(this.mainModuleURL),l=await(await fetch(a)).arrayBuffer();WebAssembly.instantiate(l,e).then(u=>{t(u.instance,u.module)})})();return[]}};var ga=class extends ha{constructor(e,t,r,n=null){super(e,t,r,n)}instantiateImpl(e){return(0,Ul.default)({...e,instantiateWasm:this.instantiateWasm.bind(this),locateFile:this.locateFile.bind(this)})}};var Cr=Bo(Hl()),Nl=function(c,e,t){var r;return(r=c==null?void 0:c.endpoint)!=null&&r.startsWith("http")?new URL(c.endpoint).host:c!=null&&c.endpoint?"".concat(t,".").concat(c==null?void 0:c.endpoint):"".concat(t,".s3.amazonaws.com")};function Ad(c,e,t){var a,o,l,u;let r=Wl(e),n=r.path;if(Vl(c)){let _="";if(c!=null&&c.endpoint){let d=new URL(c.endpoint);d.pathname!=="/"&&(_=d.pathname)}n="".concat(_,"/").concat(r.bucket).concat(n)}return{url:n,query:"",host:Nl(c,e,r.bucket),region:(a=c==null?void 0:c.region)!=null?a:"",service:"s3",method:t,accessKeyId:(o=c==null?void 0:c.accessKeyId)!=null?o:"",secretAccessKey:(l=c==null?void 0:c.secretAccessKey)!=null?l:"",sessionToken:(u=c==null?void 0:c.sessionToken)!=null?u:"",dateNow:new Date().toISOString().replace(/-/g,"").split("T")[0],datetimeNow:new Date().toISOString().replace(/-/g,"").replace(/:/g,"").split(".")[0]+"Z"}}function Ld(c,e=!1){let t="0123456789ABCDEF",r="";for(let n=0;n<c.length;n++){let a=c[n];a>="A"&&a<="Z"||a>="a"&&a<="z"||a>="0"&&a<="9"||a=="_"||a=="-"||a=="~"||a=="."?r+=a:a=="/"?e?r+="%2F":r+=a:(r+="%",r+=t[a.charCodeAt(0)>>4],r+=t[a.charCodeAt(0)&15])}return r}function kd(c,e=null){var h;let t=(h=e==null?void 0:e.contentHash)!=null?h:"e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",r=new Map;r.set("x-amz-date",c.datetimeNow),r.set("x-amz-content-sha256",t),c.sessionToken&&r.set("x-amz-security-token",c.sessionToken);let n="";e!=null&&e.contentType&&(n+="content-type;"),n+="host;x-amz-content-sha256;x-amz-date",c.sessionToken&&(n+=";x-amz-security-token");let a=c.method+"\n"+Ld(c.url)+"\n"+c.query;e!=null&&e.contentType&&(a+="\ncontent-type:"+(e==null?void 0:e.contentType)),a+="\nhost:"+c.host+"\nx-amz-content-sha256:"+t+"\nx-amz-date:"+c.datetimeNow,c.sessionToken&&c.sessionToken.length>0&&(a+="\nx-amz-security-token:"+c.sessionToken),a+="\n\n"+n+"\n"+t;let o=(0,Cr.sha256)(a),l="AWS4-HMAC-SHA256\n"+c.datetimeNow+"\n"+c.dateNow+"/"+c.region+"/"+c.service+"/aws4_request\n"+o,u="AWS4"+c.secretAccessKey,_=Cr.sha256.hmac.arrayBuffer(u,c.dateNow),d=Cr.sha256.hmac.arrayBuffer(_,c.region),f=Cr.sha256.hmac.arrayBuffer(d,c.service),p=Cr.sha256.hmac.arrayBuffer(f,"aws4_request"),m=Cr.sha256.hmac(p,l);return r.set("Authorization","AWS4-HMAC-SHA256 Credential="+c.accessKeyId+"/"+c.dateNow+"/"+c.region+"/"+c.service+"/aws4_request, SignedHeaders="+n+", Signature="+m),r}var Dd=function(c,e,t,r=null,n=null){let a=Ad(c,e,t),o={contentType:r,contentHash:n?Cr.sha256.hex(n):null};return kd(a,o)};function Tt(c,e,t,r,n=null,a=null){(e!=null&&e.accessKeyId||e!=null&&e.sessionToken)&&(Dd(e,t,r,n,a).forEach((l,u)=>{c.setRequestHeader(u,l)}),n&&c.setRequestHeader("content-type",n))}function Wl(c){if(c.indexOf("s3://")!=0)throw new Error("URL needs to start with s3://");let e=c.indexOf("/",5);if(e==-1)throw new Error("URL needs to contain a '/' after the host");let t=c.substring(5,e);if(!t)throw new Error("URL needs to contain a bucket name");let r=c.substring(e);if(!r)throw new Error("URL needs to contain key");return{bucket:t,path:r}}function Vl(c){var e;return!!((e=c==null?void 0:c.endpoint)!=null&&e.startsWith("http"))}function Ft(c,e){let t=Wl(e);return Vl(c)?"".concat(c==null?void 0:c.endpoint,"/").concat(t.bucket)+t.path:"https://"+Nl(c,e,t.bucket)+t.path}var Td=7,zl=/\/|\\/,X={_files:new Map,_fileInfoCache:new Map,_udfFunctions:new Map,_globalFileInfo:null,_preparedHandles:{},_opfsRoot:null,getFileInfo(c,e){try{let t=X._fileInfoCache.get(e),[r,n,a]=fe(c,"duckdb_web_fs_get_file_info_by_id",["number","number"],[e,(t==null?void 0:t.cacheEpoch)||0]);if(r!==0)return null;if(a===0)return t;let o=te(c,n,a);ve(c);try{let l=JSON.parse(o);if(l==null)return null;let u={...l,blob:null};return X._fileInfoCache.set(e,u),!X._files.has(u.fileName)&&X._preparedHandles[u.fileName]&&(X._files.set(u.fileName,X._preparedHandles[u.fileName]),delete X._preparedHandles[u.fileName]),u}catch(l){return console.warn(l),null}}catch(t){return console.log(t),null}},getGlobalFileInfo(c){var e;try{let[t,r,n]=fe(c,"duckdb_web_get_global_file_info",["number"],[((e=X._globalFileInfo)==null?void 0:e.cacheEpoch)||0]);if(t!==0)return null;if(n===0)return X._globalFileInfo;let a=te(c,r,n);ve(c);let o=JSON.parse(a);return o==null?null:(X._globalFileInfo={...o,blob:null},X._globalFileInfo)}catch(t){return console.log(t),null}},async assignOPFSRoot(){X._opfsRoot||(X._opfsRoot=await navigator.storage.getDirectory())},async prepareFileHandles(c,e){if(e===3){await X.assignOPFSRoot();let t=async n=>{if(X._files.has(n))return{path:n,handle:X._files.get(n),fromCached:!0};let o=X._opfsRoot,l=n.slice(Td),u=l;if(zl.test(l)){let d=l.split(zl);if(d.length===0)throw new Error("Invalid path ".concat(l));if(u=d[d.length-1],!u)throw new Error("Invalid path ".concat(l,". File Not Found."));d.pop();for(let f of d)o=await o.getDirectoryHandle(f,{create:!0})}let _=await o.getFileHandle(u,{create:!1}).catch(d=>{if((d==null?void 0:d.name)==="NotFoundError")return console.debug("File ".concat(n," does not exists yet, creating...")),o.getFileHandle(u,{create:!0});throw d});try{let d=await _.createSyncAccessHandle();return X._preparedHandles[n]=d,{path:n,handle:d,fromCached:!1}}catch(d){throw new Error(d.message+":"+name)}},r=[];for(let n of c){let a=await t(n);r.push(a)}return r}throw new Error("Unsupported protocol ".concat(e," for paths ").concat(c," with protocol ").concat(e))},async prepareDBFileHandle(c,e){if(e===3&&this.prepareFileHandles){let t=[c,"".concat(c,".wal")];return this.prepareFileHandles(t,e)}throw new Error("Unsupported protocol ".concat(e," for path ").concat(c," with protocol ").concat(e))},testPlatformFeature:(c,e)=>{switch(e){case 1:return typeof BigInt64Array<"u";default:return console.warn("test for unknown feature: ".concat(e)),!1}},getDefaultDataProtocol(c){return 2},openFile:(c,e,t)=>{var r,n,a,o,l,u;try{X._fileInfoCache.delete(e);let _=X.getFileInfo(c,e);switch(_==null?void 0:_.dataProtocol){case 4:case 5:{if(t&1&&t&2)throw new Error("Opening file ".concat(_.fileName," failed: cannot open file with both read and write flags set"));if(t&32)throw new Error("Opening file ".concat(_.fileName," failed: appending to HTTP/S3 files is not supported"));if(t&2){let p=new XMLHttpRequest;if(_.dataProtocol==5?(p.open("HEAD",Ft(_.s3Config,_.dataUrl),!1),Tt(p,_.s3Config,_.dataUrl,"HEAD")):p.open("HEAD",_.dataUrl,!1),p.send(null),p.status!=200&&p.status!=404)throw new Error("Opening file ".concat(_.fileName," failed: Unexpected return status from server (").concat(p.status,")"));if(p.status==404&&!(t&8||t&16))throw new Error("Opening file ".concat(_.fileName," failed: Cannot write to non-existent file without FILE_FLAGS_FILE_CREATE or FILE_FLAGS_FILE_CREATE_NEW flag."));let m=c._malloc(1),h=new Uint8Array;c.HEAPU8.set(h,m);let g=c._malloc(3*8);return c.HEAPF64[(g>>3)+0]=1,c.HEAPF64[(g>>3)+1]=m,c.HEAPF64[(g>>3)+2]=new Date().getTime()/1e3,g}else if(!(t&1))throw new Error("Opening file ".concat(_.fileName," failed: unsupported file flags: ").concat(t));let d=null,f=null;if(!_.forceFullHttpReads&&(_.reliableHeadRequests||!_.allowFullHttpReads))try{let p=new XMLHttpRequest;_.dataProtocol==5?(p.open("HEAD",Ft(_.s3Config,_.dataUrl),!1),Tt(p,_.s3Config,_.dataUrl,"HEAD")):p.open("HEAD",_.dataUrl,!1),p.setRequestHeader("Range","bytes=0-"),p.send(null),d=null;try{d=p.getResponseHeader("Content-Length")}catch(m){console.warn("Failed to get Content-Length on request")}if(d!==null&&p.status==206){let m=c._malloc(24);c.HEAPF64[(m>>3)+0]=+d,c.HEAPF64[(m>>3)+1]=0;let h=0;try{h=new Date((r=p.getResponseHeader("Last-Modified"))!=null?r:"").getTime()/1e3}catch(g){console.warn("Failed to get Last-Modified on request")}return c.HEAPF64[(m>>3)+2]=+h,m}}catch(p){f=p,console.warn("HEAD request with range header failed: ".concat(p))}if(_.allowFullHttpReads){if(!_.forceFullHttpReads){let m=new XMLHttpRequest;_.dataProtocol==5?(m.open("GET",Ft(_.s3Config,_.dataUrl),!1),Tt(m,_.s3Config,_.dataUrl,"GET")):m.open("GET",_.dataUrl,!1),m.responseType="arraybuffer",m.setRequestHeader("Range","bytes=0-0"),m.send(null);let h=null;try{h=m.getResponseHeader("Content-Length")}catch(S){console.warn("Failed to get Content-Length on request")}let g=h==null?void 0:h.split("/")[1],v=h,y=null;if(g!==void 0)y=g;else if(!_.reliableHeadRequests){let S=new XMLHttpRequest;_.dataProtocol==5?(S.open("HEAD",Ft(_.s3Config,_.dataUrl),!1),Tt(S,_.s3Config,_.dataUrl,"HEAD")):S.open("HEAD",_.dataUrl,!1),S.setRequestHeader("Range","bytes=0-"),S.send(null),d=null;try{d=S.getResponseHeader("Content-Length")}catch(w){console.warn("Failed to get Content-Length on request")}d!==null&&+d>1&&(y=d)}if(m.status==206&&v!==null&&+v==1&&y!==null){let S=c._malloc(24);c.HEAPF64[(S>>3)+0]=+y,c.HEAPF64[(S>>3)+1]=0;let w=0;try{w=new Date((n=m.getResponseHeader("Last-Modified"))!=null?n:"").getTime()/1e3}catch(D){console.warn("Failed to get Last-Modified on request")}return c.HEAPF64[(S>>3)+2]=+w,S}if(m.status==200&&v!==null&&d!==null&&+v==+d){console.warn("fall back to full HTTP read for: ".concat(_.dataUrl));let S=c._malloc(m.response.byteLength),w=new Uint8Array(m.response,0,m.response.byteLength);c.HEAPU8.set(w,S);let D=c._malloc(3*8);c.HEAPF64[(D>>3)+0]=m.response.byteLength,c.HEAPF64[(D>>3)+1]=S;let F=0;try{F=new Date((a=m.getResponseHeader("Last-Modified"))!=null?a:"").getTime()/1e3}catch(E){console.warn("Failed to get Last-Modified on request")}return c.HEAPF64[(D>>3)+2]=+F,D}console.warn("falling back to full HTTP read for: ".concat(_.dataUrl))}let p=new XMLHttpRequest;if(_.dataProtocol==5?(p.open("GET",Ft(_.s3Config,_.dataUrl),!1),Tt(p,_.s3Config,_.dataUrl,"GET")):p.open("GET",_.dataUrl,!1),p.responseType="arraybuffer",p.send(null),p.status==200){let m=c._malloc(p.response.byteLength),h=new Uint8Array(p.response,0,p.response.byteLength);c.HEAPU8.set(h,m);let g=c._malloc(3*8);c.HEAPF64[(g>>3)+0]=p.response.byteLength,c.HEAPF64[(g>>3)+1]=m;let v=0;try{v=new Date((o=p.getResponseHeader("Last-Modified"))!=null?o:"").getTime()/1e3}catch(y){console.warn("Failed to get Last-Modified on request")}return c.HEAPF64[(g>>3)+2]=+v,g}}if(f!=null)throw new Error("Reading file ".concat(_.fileName," failed with error: ").concat(f));return 0}case 2:{let d=(l=X._files)==null?void 0:l.get(_.fileName);if(d){let m=c._malloc(24);return c.HEAPF64[(m>>3)+0]=d.size,c.HEAPF64[(m>>3)+1]=0,c.HEAPF64[(m>>3)+2]=0,m}if(t&128)return 0;console.warn("Buffering missing file: ".concat(_.fileName));let f=c._malloc(3*8),p=c._malloc(1);return c.HEAPF64[(f>>3)+0]=1,c.HEAPF64[(f>>3)+1]=p,c.HEAPF64[(f>>3)+2]=0,f}case 3:{let d=(u=X._files)==null?void 0:u.get(_.fileName);if(!d)throw new Error("No OPFS access handle registered with name: ".concat(_.fileName));t&16&&d.truncate(0);let f=c._malloc(3*8),p=d.getSize();return c.HEAPF64[(f>>3)+0]=p,c.HEAPF64[(f>>3)+1]=0,c.HEAPF64[(f>>3)+2]=0,f}}}catch(_){console.error(_.toString()),Dt(c,_.toString())}return 0},glob:(c,e,t)=>{var r;try{let n=te(c,e,t);if(n.startsWith("http")||n.startsWith("s3://")){let a=new XMLHttpRequest;if(n.startsWith("s3://")){let o=X.getGlobalFileInfo(c);a.open("HEAD",Ft(o==null?void 0:o.s3Config,n),!1),Tt(a,o==null?void 0:o.s3Config,n,"HEAD")}else a.open("HEAD",n,!1);if(a.send(null),a.status!=200&&a.status!==206){if(!((r=X.getGlobalFileInfo(c))!=null&&r.allowFullHttpReads))return console.log("HEAD request failed: ".concat(n,", with full http reads are disabled")),0;let o=new XMLHttpRequest;if(n.startsWith("s3://")){let u=X.getGlobalFileInfo(c);o.open("GET",Ft(u==null?void 0:u.s3Config,n),!1),Tt(o,u==null?void 0:u.s3Config,n,"HEAD")}else o.open("GET",n,!1);if(o.setRequestHeader("Range","bytes=0-0"),o.send(null),o.status!=200&&o.status!==206)return console.log("HEAD and GET requests failed: ".concat(n)),0;let l=null;try{l=o.getResponseHeader("Content-Length")}catch(u){console.warn("Failed to get Content-Length on request")}l&&+l>1&&console.warn("Range request for ".concat(n," did not return a partial response: ").concat(o.status,' "').concat(o.statusText,'"'))}c.ccall("duckdb_web_fs_glob_add_path",null,["string"],[n])}else for(let[a]of X._files.entries()||[])a.startsWith(n)&&c.ccall("duckdb_web_fs_glob_add_path",null,["string"],[a])}catch(n){return console.log(n),Dt(c,n.toString()),0}},checkFile:(c,e,t)=>{try{let r=te(c,e,t);if(r.startsWith("http")||r.startsWith("s3://")){let n=new XMLHttpRequest;if(r.startsWith("s3://")){let a=X.getGlobalFileInfo(c);n.open("HEAD",Ft(a==null?void 0:a.s3Config,r),!1),Tt(n,a==null?void 0:a.s3Config,r,"HEAD")}else n.open("HEAD",r,!1);return n.send(null),n.status==206||n.status==200}else return X._files.has(r)}catch(r){return console.log(r),!1}return!1},syncFile:(c,e)=>{},closeFile:(c,e)=>{var r;let t=X.getFileInfo(c,e);X._fileInfoCache.delete(e);try{switch(t==null?void 0:t.dataProtocol){case 0:case 4:case 5:break;case 1:case 2:return;case 3:{let n=(r=X._files)==null?void 0:r.get(t.fileName);if(!n)throw new Error("No OPFS access handle registered with name: ".concat(t.fileName));return n.flush()}}}catch(n){console.log(n),Dt(c,n.toString())}},dropFile:(c,e,t)=>{var a;let r=te(c,e,t),n=(a=X._files)==null?void 0:a.get(r);if(n){if(X._files.delete(r),n instanceof FileSystemSyncAccessHandle)try{n.flush(),n.close()}catch(o){throw new Error("Cannot drop file with name: ".concat(r))}n instanceof Blob}},truncateFile:(c,e,t)=>{var n;let r=X.getFileInfo(c,e);switch(r==null?void 0:r.dataProtocol){case 4:Dt(c,"Cannot truncate a http file");return;case 5:Dt(c,"Cannot truncate an s3 file");return;case 0:case 1:case 2:Dt(c,"truncateFile not implemented");return;case 3:{let a=(n=X._files)==null?void 0:n.get(r.fileName);if(!a)throw new Error("No OPFS access handle registered with name: ".concat(r.fileName));return a.truncate(t)}}return 0},readFile(c,e,t,r,n){var a;if(r==0)return 0;try{let o=X.getFileInfo(c,e);switch(o==null?void 0:o.dataProtocol){case 4:case 5:{if(!o.dataUrl)throw new Error("Missing data URL for file ".concat(e));try{let l=new XMLHttpRequest;if(o.dataProtocol==5?(l.open("GET",Ft(o==null?void 0:o.s3Config,o.dataUrl),!1),Tt(l,o==null?void 0:o.s3Config,o.dataUrl,"GET")):l.open("GET",o.dataUrl,!1),l.responseType="arraybuffer",l.setRequestHeader("Range","bytes=".concat(n,"-").concat(n+r-1)),l.send(null),l.status==206||l.status==200&&r==l.response.byteLength&&n==0){let u=new Uint8Array(l.response,0,Math.min(l.response.byteLength,r));return c.HEAPU8.set(u,t),u.byteLength}else if(l.status==200){console.warn("Range request for ".concat(o.dataUrl," did not return a partial response: ").concat(l.status,' "').concat(l.statusText,'"'));let u=new Uint8Array(l.response,n,Math.min(l.response.byteLength-n,r));return c.HEAPU8.set(u,t),u.byteLength}else throw new Error("Range request for ".concat(o.dataUrl," did returned non-success status: ").concat(l.status,' "').concat(l.statusText,'"'))}catch(l){throw console.log(l),new Error("Range request for ".concat(o.dataUrl," failed with error: ").concat(l,'"'))}}case 2:{let l=(a=X._files)==null?void 0:a.get(o.fileName);if(!l)throw new Error("No HTML5 file registered with name: ".concat(o.fileName));let u=l.slice(n,n+r),_=new Uint8Array(new FileReaderSync().readAsArrayBuffer(u));return c.HEAPU8.set(_,t),_.byteLength}case 3:{let l=X._files.get(o.fileName);if(!l)throw new Error("No OPFS access handle registered with name: ".concat(o.fileName));let u=c.HEAPU8.subarray(t,t+r);return l.read(u,{at:n})}}return 0}catch(o){return console.log(o),Dt(c,o.toString()),0}},writeFile:(c,e,t,r,n)=>{var o;let a=X.getFileInfo(c,e);switch(a==null?void 0:a.dataProtocol){case 4:return Dt(c,"Cannot write to HTTP file"),0;case 5:{let l=c.HEAPU8.subarray(t,t+r),u=new XMLHttpRequest;return u.open("PUT",Ft(a==null?void 0:a.s3Config,a.dataUrl),!1),Tt(u,a==null?void 0:a.s3Config,a.dataUrl,"PUT","",l),u.send(l),u.status!==200?(Dt(c,"Failed writing file: HTTP "+u.status),0):r}case 2:return Dt(c,"cannot write using the html5 file reader api"),0;case 3:{let l=(o=X._files)==null?void 0:o.get(a.fileName);if(!l)throw new Error("No OPFS access handle registered with name: ".concat(a.fileName));let u=c.HEAPU8.subarray(t,t+r);return l.write(u,{at:n})}}return 0},getLastFileModificationTime:(c,e)=>{var r;let t=X.getFileInfo(c,e);switch(t==null?void 0:t.dataProtocol){case 2:{if(!((r=X._files)==null?void 0:r.get(t.fileName)))throw Error("No handle available for file: ".concat(t.fileName));return 0}case 4:case 5:return new Date().getTime()/1e3}return 0},progressUpdate:(c,e,t)=>{postMessage&&postMessage({requestId:0,type:"PROGRESS_UPDATE",data:{status:c?"completed":"in-progress",percentage:e,repetitions:t}})},checkDirectory:(c,e,t)=>{let r=te(c,e,t);return console.log("checkDirectory: ".concat(r)),!1},createDirectory:(c,e,t)=>{let r=te(c,e,t);console.log("createDirectory: ".concat(r))},removeDirectory:(c,e,t)=>{let r=te(c,e,t);console.log("removeDirectory: ".concat(r))},listDirectoryEntries:(c,e,t)=>{let r=te(c,e,t);return console.log("listDirectoryEntries: ".concat(r)),!1},moveFile:(c,e,t,r,n)=>{var u,_;let a=te(c,e,t),o=te(c,r,n),l=(u=X._files)==null?void 0:u.get(a);l!==void 0&&(X._files.delete(l),X._files.set(o,l));for(let[d,f]of((_=X._fileInfoCache)==null?void 0:_.entries())||[])if(f.dataUrl==a){X._fileInfoCache.delete(d);break}return!0},removeFile:(c,e,t)=>{},callScalarUDF:(c,e,t,r,n,a,o)=>{Il(X,c,e,t,r,n,a,o)}};var Fo=class extends ma{postMessage(e,t){globalThis.postMessage(e,t)}async instantiate(e,t,r){return await new ga(this,X,e,t).instantiate(r)}};function $l(){let c=new Fo;globalThis.onmessage=async e=>{await c.onMessage(e.data)}}$l();return Zl(Fd);})();
+/*! Bundled license information:
+
+js-sha256/src/sha256.js:
+  (**
+   * [js-sha256]{@link https://github.com/emn178/js-sha256}
+   *
+   * @version 0.11.1
+   * @author Chen, Yi-Cyuan [emn178@gmail.com]
+   * @copyright Chen, Yi-Cyuan 2014-2025
+   * @license MIT
+   *)
+*/
+//# sourceMappingURL=duckdb-browser-mvp.worker.js.map
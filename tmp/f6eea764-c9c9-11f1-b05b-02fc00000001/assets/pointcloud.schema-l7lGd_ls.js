@@ -0,0 +1 @@
+const e="https://json-schema.org/draft/2020-12/schema",t="https://visivo.io/trace-properties/schema",r="A schema to validate plotly trace properties",n={color:{type:"string",oneOf:[{pattern:"^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})$",description:"Hex color (e.g., #d3d3d3 or #fff)"},{pattern:"^rgb\\(\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*\\)$",description:"RGB color (e.g., rgb(255, 0, 0))"},{pattern:"^rgba\\(\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(\\d{1,3})\\s*,\\s*(0|1|0?\\.\\d+)\\s*\\)$",description:"RGBA color (e.g., rgba(255, 0, 0, 0.5))"},{pattern:"^hsl\\(\\s*\\d{1,3}\\s*,\\s*\\d{1,3}%\\s*,\\s*\\d{1,3}%\\s*\\)$",description:"HSL color (e.g., hsl(0, 100%, 50%))"},{pattern:"^hsv\\(\\s*\\d{1,3}\\s*,\\s*\\d{1,3}%\\s*,\\s*\\d{1,3}%\\s*\\)$",description:"HSV color (e.g., hsv(0, 100%, 100%))"},{pattern:"^(aliceblue|antiquewhite|aqua|aquamarine|azure|beige|bisque|black|blanchedalmond|blue|blueviolet|brown|burlywood|cadetblue|chartreuse|chocolate|coral|cornflowerblue|cornsilk|crimson|cyan|darkblue|darkcyan|darkgoldenrod|darkgray|darkgreen|darkgrey|darkkhaki|darkmagenta|darkolivegreen|darkorange|darkorchid|darkred|darksalmon|darkseagreen|darkslateblue|darkslategray|darkslategrey|darkturquoise|darkviolet|deeppink|deepskyblue|dimgray|dimgrey|dodgerblue|firebrick|floralwhite|forestgreen|fuchsia|gainsboro|ghostwhite|gold|goldenrod|gray|green|greenyellow|grey|honeydew|hotpink|indianred|indigo|ivory|khaki|lavender|lavenderblush|lawngreen|lemonchiffon|lightblue|lightcoral|lightcyan|lightgoldenrodyellow|lightgray|lightgreen|lightgrey|lightpink|lightsalmon|lightseagreen|lightskyblue|lightslategray|lightslategrey|lightsteelblue|lightyellow|lime|limegreen|linen|magenta|maroon|mediumaquamarine|mediumblue|mediumorchid|mediumpurple|mediumseagreen|mediumslateblue|mediumspringgreen|mediumturquoise|mediumvioletred|midnightblue|mintcream|mistyrose|moccasin|navajowhite|navy|oldlace|olive|olivedrab|orange|orangered|orchid|palegoldenrod|palegreen|paleturquoise|palevioletred|papayawhip|peachpuff|peru|pink|plum|powderblue|purple|rebeccapurple|red|rosybrown|royalblue|saddlebrown|salmon|sandybrown|seagreen|seashell|sienna|silver|skyblue|slateblue|slategray|slategrey|snow|springgreen|steelblue|tan|teal|thistle|tomato|turquoise|violet|wheat|white|whitesmoke|yellow|yellowgreen)$",description:"Named CSS color"}]},colorscale:{description:"A Plotly colorscale either by name or a custom array of [value, color] pairs.",oneOf:[{type:"string",enum:["Greys","YlGnBu","Greens","YlOrRd","Bluered","RdBu","Reds","Blues","Picnic","Rainbow","Portland","Jet","Hot","Blackbody","Earth","Electric","Viridis","Cividis"],description:"Predefined Plotly colorscale name"},{type:"array",items:{type:"array",minItems:2,maxItems:2,items:{oneOf:[{type:"number",minimum:0,maximum:1},{$ref:"#/$defs/color"}]}},description:"Custom colorscale as an array of [value, color] pairs"}]},"query-string":{type:"string",description:"A string that will pull the value from the traces query results.",oneOf:[{pattern:"^\\?\\{.*\\}$",description:"String in the format ?{ x } where x can be anything"},{pattern:"^query\\(.*\\)$",description:"String in the format query( x ) where x can be anything"},{pattern:"^column\\(.*\\)(?:\\[\\d+\\])?$",description:"String in the format column( x ) or column( x )[n] where x can be anything and n is a number"}]}},s="object",i=JSON.parse('{"type":{"oneOf":[{"const":"pointcloud"},{"$ref":"#/$defs/query-string"}]},"visible":{"oneOf":[{"description":"Determines whether or not this trace is visible. If *legendonly*, the trace is not drawn, but can appear as a legend item (provided that the legend itself is visible).","enum":[true,false,"legendonly"],"default":true},{"$ref":"#/$defs/query-string"}]},"showlegend":{"oneOf":[{"description":"Determines whether or not an item corresponding to this trace is shown in the legend.","type":"boolean","default":true},{"$ref":"#/$defs/query-string"}]},"legendgroup":{"oneOf":[{"description":"Sets the legend group for this trace. Traces part of the same legend group hide/show at the same time when toggling legend items.","type":"string","default":""},{"$ref":"#/$defs/query-string"}]},"opacity":{"oneOf":[{"description":"Sets the opacity of the trace.","type":"number","minimum":0,"maximum":1,"default":1},{"$ref":"#/$defs/query-string"}]},"name":{"oneOf":[{"description":"Sets the trace name. The trace name appear as the legend item and on hover.","type":"string"},{"$ref":"#/$defs/query-string"}]},"uid":{"oneOf":[{"description":"Assign an id to this trace, Use this to provide object constancy between traces during animations and transitions.","type":"string"},{"$ref":"#/$defs/query-string"}]},"ids":{"oneOf":[{"description":"Assigns id labels to each datum. These ids for object constancy of data points during animation. Should be an array of strings, not numbers or any other type.","type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}},{"$ref":"#/$defs/query-string"}]},"customdata":{"oneOf":[{"description":"Assigns extra data each datum. This may be useful when listening to hover, click and selection events. Note that, *scatter* traces also appends customdata items in the markers DOM elements","type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}},{"$ref":"#/$defs/query-string"}]},"hoverinfo":{"description":"Determines which trace information appear on hover. If `none` or `skip` are set, no information is displayed upon hovering. But, if `none` is set, click and hover events are still fired.","oneOf":[{"$ref":"#/$defs/query-string"},{"oneOf":[{"type":"string","enum":["all","none","skip"]},{"type":"string","pattern":"^(x|y|z|text|name)(\\\\+(x|y|z|text|name))*$"}],"default":"all"},{"type":"array","items":{"oneOf":[{"type":"string","enum":["all","none","skip"]},{"type":"string","pattern":"^(x|y|z|text|name)(\\\\+(x|y|z|text|name))*$"}],"default":"all"}}]},"hoverlabel":{"type":"object","properties":{"bgcolor":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color","default":"#444"},{"type":"array","items":{"$ref":"#/$defs/color","default":"#444"}}]},"bordercolor":{"oneOf":[{"$ref":"#/$defs/query-string"},{"$ref":"#/$defs/color","default":"#444"},{"type":"array","items":{"$ref":"#/$defs/color","default":"#444"}}]},"align":{"description":"Sets the horizontal alignment of the text content within hover label box. Has an effect only if the hover label text spans more two or more lines","oneOf":[{"$ref":"#/$defs/query-string"},{"enum":["left","right","auto"],"default":"auto"},{"type":"array","items":{"enum":["left","right","auto"],"default":"auto"}}]},"namelength":{"description":"Sets the default length (in number of characters) of the trace name in the hover labels for all traces. -1 shows the whole name regardless of length. 0-3 shows the first 0-3 characters, and an integer >3 will show the whole name if it is less than that many characters, but if it is longer, will truncate to `namelength - 3` characters and add an ellipsis.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"integer","minimum":-1,"default":15},{"type":"array","items":{"type":"integer","minimum":-1,"default":15}}]},"bgcolorsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  bgcolor .","type":"string"},{"$ref":"#/$defs/query-string"}]},"bordercolorsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  bordercolor .","type":"string"},{"$ref":"#/$defs/query-string"}]},"alignsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  align .","type":"string"},{"$ref":"#/$defs/query-string"}]},"namelengthsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  namelength .","type":"string"},{"$ref":"#/$defs/query-string"}]}}},"stream":{"type":"object","properties":{"token":{"oneOf":[{"description":"The stream id number links a data trace on a plot with a stream. See https://chart-studio.plotly.com/settings for more details.","type":"string","pattern":".*\\\\S.*$"},{"$ref":"#/$defs/query-string"}]},"maxpoints":{"oneOf":[{"description":"Sets the maximum number of points to keep on the plots from an incoming stream. If `maxpoints` is set to *50*, only the newest 50 points will be displayed on the plot.","type":"number","minimum":0,"maximum":10000,"default":500},{"$ref":"#/$defs/query-string"}]}}},"uirevision":{"description":"Controls persistence of some user-driven changes to the trace: `constraintrange` in `parcoords` traces, as well as some `editable: true` modifications such as `name` and `colorbar.title`. Defaults to `layout.uirevision`. Note that other user-driven trace attribute changes are controlled by `layout` attributes: `trace.visible` is controlled by `layout.legend.uirevision`, `selectedpoints` is controlled by `layout.selectionrevision`, and `colorbar.(x|y)` (accessible with `config: {editable: true}`) is controlled by `layout.editrevision`. Trace changes are tracked by `uid`, which only falls back on trace index if no `uid` is provided. So if your app can add/remove traces before the end of the `data` array, such that the same trace has a different index, you can still preserve user-driven changes if you give each trace a `uid` that stays with it as it moves."},"x":{"oneOf":[{"description":"Sets the x coordinates.","type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}},{"$ref":"#/$defs/query-string"}]},"y":{"oneOf":[{"description":"Sets the y coordinates.","type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}},{"$ref":"#/$defs/query-string"}]},"xy":{"oneOf":[{"description":"Faster alternative to specifying `x` and `y` separately. If supplied, it must be a typed `Float32Array` array that represents points such that `xy[i * 2] = x[i]` and `xy[i * 2 + 1] = y[i]`","type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}},{"$ref":"#/$defs/query-string"}]},"indices":{"oneOf":[{"description":"A sequential value, 0..n, supply it to avoid creating this array inside plotting. If specified, it must be a typed `Int32Array` array. Its length must be equal to or greater than the number of points. For the best performance and memory use, create one large `indices` typed array that is guaranteed to be at least as long as the largest number of points during use, and reuse it on each `Plotly.restyle()` call.","type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}},{"$ref":"#/$defs/query-string"}]},"xbounds":{"oneOf":[{"description":"Specify `xbounds` in the shape of `[xMin, xMax] to avoid looping through the `xy` typed array. Use it in conjunction with `xy` and `ybounds` for the performance benefits.","type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}},{"$ref":"#/$defs/query-string"}]},"ybounds":{"oneOf":[{"description":"Specify `ybounds` in the shape of `[yMin, yMax] to avoid looping through the `xy` typed array. Use it in conjunction with `xy` and `xbounds` for the performance benefits.","type":"array","items":{"oneOf":[{"type":"number"},{"type":"string"}]}},{"$ref":"#/$defs/query-string"}]},"text":{"description":"Sets text elements associated with each (x,y) pair. If a single string, the same string appears over all the data points. If an array of string, the items are mapped in order to the this trace\'s (x,y) coordinates. If trace `hoverinfo` contains a *text* flag and *hovertext* is not set, these elements will be seen in the hover labels.","oneOf":[{"$ref":"#/$defs/query-string"},{"type":"string","default":""},{"type":"array","items":{"type":"string","default":""}}]},"marker":{"type":"object","properties":{"color":{"oneOf":[{"$ref":"#/$defs/color","default":"#444"},{"$ref":"#/$defs/query-string"}]},"opacity":{"oneOf":[{"description":"Sets the marker opacity. The default value is `1` (fully opaque). If the markers are not fully opaque and there are hundreds of thousands of points, it may cause slower zooming and panning. Opacity fades the color even if `blend` is left on `false` even if there is no translucency effect in that case.","type":"number","minimum":0,"maximum":1,"default":1},{"$ref":"#/$defs/query-string"}]},"blend":{"oneOf":[{"description":"Determines if colors are blended together for a translucency effect in case `opacity` is specified as a value less then `1`. Setting `blend` to `true` reduces zoom/pan speed if used with large numbers of points.","type":"boolean","default":null},{"$ref":"#/$defs/query-string"}]},"sizemin":{"oneOf":[{"description":"Sets the minimum size (in px) of the rendered marker points, effective when the `pointcloud` shows a million or more points.","type":"number","minimum":0.1,"maximum":2,"default":0.5},{"$ref":"#/$defs/query-string"}]},"sizemax":{"oneOf":[{"description":"Sets the maximum size (in px) of the rendered marker points. Effective when the `pointcloud` shows only few points.","type":"number","minimum":0.1,"default":20},{"$ref":"#/$defs/query-string"}]}}},"xaxis":{"oneOf":[{"description":"Sets a reference between this trace\'s x coordinates and a 2D cartesian x axis. If *x* (the default value), the x coordinates refer to `layout.xaxis`. If *x2*, the x coordinates refer to `layout.xaxis2`, and so on.","type":"string","pattern":"^x([2-9]|[1-9][0-9]+)?$","default":"x"},{"$ref":"#/$defs/query-string"}]},"yaxis":{"oneOf":[{"description":"Sets a reference between this trace\'s y coordinates and a 2D cartesian y axis. If *y* (the default value), the y coordinates refer to `layout.yaxis`. If *y2*, the y coordinates refer to `layout.yaxis2`, and so on.","type":"string","pattern":"^y([2-9]|[1-9][0-9]+)?$","default":"y"},{"$ref":"#/$defs/query-string"}]},"idssrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  ids .","type":"string"},{"$ref":"#/$defs/query-string"}]},"customdatasrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  customdata .","type":"string"},{"$ref":"#/$defs/query-string"}]},"metasrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  meta .","type":"string"},{"$ref":"#/$defs/query-string"}]},"hoverinfosrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  hoverinfo .","type":"string"},{"$ref":"#/$defs/query-string"}]},"xsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  x .","type":"string"},{"$ref":"#/$defs/query-string"}]},"ysrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  y .","type":"string"},{"$ref":"#/$defs/query-string"}]},"xysrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  xy .","type":"string"},{"$ref":"#/$defs/query-string"}]},"indicessrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  indices .","type":"string"},{"$ref":"#/$defs/query-string"}]},"xboundssrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  xbounds .","type":"string"},{"$ref":"#/$defs/query-string"}]},"yboundssrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  ybounds .","type":"string"},{"$ref":"#/$defs/query-string"}]},"textsrc":{"oneOf":[{"description":"Sets the source reference on Chart Studio Cloud for  text .","type":"string"},{"$ref":"#/$defs/query-string"}]}}'),o=["type"],a=!1,d={$schema:e,$id:t,description:r,$defs:n,type:s,properties:i,required:o,additionalProperties:a};export{n as $defs,t as $id,e as $schema,a as additionalProperties,d as default,r as description,i as properties,o as required,s as type};
@@ -6,33 +6,52 @@ from visivo.logger.logger import Logger, TypeEnum
 
 Logger.instance().info("Starting Visivo...")
 import click
+import importlib
 import os
-from dotenv import load_dotenv
-from pydantic import ValidationError
 import sys
 
-from visivo.parsers.line_validation_error import LineValidationError
-from visivo.telemetry import TelemetryClient, is_telemetry_enabled, get_telemetry_context
+from visivo.telemetry import is_telemetry_enabled, get_telemetry_context
 from visivo.telemetry.events import CLIEvent
-
-from visivo.commands.dbt import dbt
-from visivo.commands.deploy import deploy
-from visivo.commands.serve import serve
-from visivo.commands.run import run
-from visivo.commands.dist import dist
-from visivo.commands.compile import compile
-from visivo.commands.init import init
-from visivo.commands.create import create
-from visivo.commands.test import test
-from visivo.commands.aggregate import aggregate
-from visivo.commands.archive import archive
-from visivo.commands.authorize import authorize
-from visivo.commands.list import list
-from visivo.commands.migrate import migrate
 from visivo.version import VISIVO_VERSION
 
-
-@click.group()
+# Each command's module, imported only when the command is looked up: on
+# invocation, or for its help line under `visivo --help`. Command modules
+# import their phases inside the command, so none of them loads the project
+# models, the server or a warehouse driver at import.
+COMMAND_MODULES = {
+    "aggregate": "visivo.commands.aggregate",
+    "archive": "visivo.commands.archive",
+    "authorize": "visivo.commands.authorize",
+    "compile": "visivo.commands.compile",
+    "create": "visivo.commands.create",
+    "dbt": "visivo.commands.dbt",
+    "deploy": "visivo.commands.deploy",
+    "dist": "visivo.commands.dist",
+    "init": "visivo.commands.init",
+    "list": "visivo.commands.list",
+    "migrate": "visivo.commands.migrate",
+    "run": "visivo.commands.run",
+    "serve": "visivo.commands.serve",
+    "test": "visivo.commands.test",
+}
+
+
+class LazyGroup(click.Group):
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module = importlib.import_module(self.lazy_commands[cmd_name])
+            self.add_command(getattr(module, cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_commands=COMMAND_MODULES)
 @click.option("-p", "--profile", is_flag=True)
 @click.option("-e", "--env-file", default=".env")
 @click.version_option(version=VISIVO_VERSION)
@@ -62,28 +81,26 @@ def visivo(env_file, profile, verbose):
         atexit.register(exit)
 
 
-visivo.add_command(init)
-visivo.add_command(dbt)
-visivo.add_command(compile)
-visivo.add_command(run)
-visivo.add_command(serve)
-visivo.add_command(deploy)
-visivo.add_command(dist)
-visivo.add_command(test)
-visivo.add_command(aggregate)
-visivo.add_command(archive)
-visivo.add_command(authorize)
-visivo.add_command(create)
-visivo.add_command(list)
-visivo.add_command(migrate)
-
-
 def load_env(env_file):
     if os.path.isfile(env_file):
+        from dotenv import load_dotenv
+
         Logger.instance().debug(f"Loading env file: {env_file}")
         load_dotenv(env_file)
 
 
+def _is_validation_error(e) -> bool:
+    """Whether ``e`` is a Pydantic or project validation error, checked without
+    importing Pydantic for a command that never loaded it."""
+    pydantic = sys.modules.get("pydantic")
+    if pydantic is not None and isinstance(e, pydantic.ValidationError):
+        return True
+    line_validation_error = sys.modules.get("visivo.parsers.line_validation_error")
+    return line_validation_error is not None and isinstance(
+        e, line_validation_error.LineValidationError
+    )
+
+
 def print_issue_url():
     import traceback
     import urllib.parse
@@ -183,7 +200,11 @@ def safe_visivo():
 
     # Initialize telemetry client if enabled
     telemetry_enabled = is_telemetry_enabled()
-    telemetry_client = TelemetryClient(enabled=telemetry_enabled) if telemetry_enabled else None
+    telemetry_client = None
+    if telemetry_enabled:
+        from visivo.telemetry.client import TelemetryClient
+
+        telemetry_client = TelemetryClient(enabled=True)
 
     # Track command execution
     command_name, command_args = _sanitize_command_args(sys.argv)
@@ -200,10 +221,6 @@ def safe_visivo():
         # Track successful command
         _track_command_execution(telemetry_client, command_name, command_args, execution_time, True)
 
-    except (ValidationError, LineValidationError) as e:
-        error_type = type(e).__name__
-        Logger.instance().error(str(e))
-        sys.exit(1)
     except click.ClickException as e:
         # A ClickException is already a clean, user-facing error — e.g. a YAML
         # syntax error from load_yaml_file carrying file:line + the problem.
@@ -216,6 +233,9 @@ def safe_visivo():
         sys.exit(1)
     except Exception as e:
         error_type = type(e).__name__
+        if _is_validation_error(e):
+            Logger.instance().error(str(e))
+            sys.exit(1)
         if "STACKTRACE" in os.environ and os.environ["STACKTRACE"] == "true":
             raise e
         Logger.instance().error("An unexpected error has occurred")
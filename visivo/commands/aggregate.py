@@ -1,15 +1,23 @@
 import click
-from visivo.query.aggregator import Aggregator
+from visivo.query.aggregator import Aggregator, OUTPUT_FORMATS
 from visivo.commands.options import output_dir
 
 
 @click.command()
 @output_dir
 @click.option("-j", "--json-file", help="The file with the raw json results from the query")
-def aggregate(output_dir, json_file):
+@click.option(
+    "-f",
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="json",
+    help="Write indented JSON, JSON without whitespace, or an Arrow IPC file (data.arrow).",
+)
+def aggregate(output_dir, json_file, output_format):
     from visivo.logger.logger import Logger
 
     Logger.instance().info("Aggregating")
 
-    Aggregator.aggregate(trace_dir=output_dir, json_file=json_file)
+    Aggregator.aggregate(trace_dir=output_dir, json_file=json_file, output_format=output_format)
     Logger.instance().success("Done")
@@ -9,11 +9,6 @@ from visivo.tokens.token_functions import (
     get_existing_token,
 )
 from visivo.tokens.web_utils import open_url
-from visivo.tokens.server import (
-    run_flask_server,
-    token_received_event,
-    FLASK_PORT,
-)
 from visivo.telemetry.config import is_telemetry_enabled
 from visivo.telemetry.machine_id import get_machine_id
 
@@ -21,6 +16,13 @@ PROFILE_PATH = os.path.expanduser("~/.visivo/profile.yml")
 CALLBACK_RESPONSE_WAIT_TIME = 120
 
 
+def run_flask_server(base_url, port):
+    # The callback server imports Flask, so it is loaded only once authorizing
+    from visivo.tokens.server import run_flask_server
+
+    run_flask_server(base_url=base_url, port=port)
+
+
 @click.command()
 @host
 def authorize(host):
@@ -36,6 +38,8 @@ def authorize(host):
     The process will wait for up to CALLBACK_RESPONSE_WAIT_TIME seconds for the callback.
     If the callback is not received, you will be prompted to cancel or continue waiting.
     """
+    from visivo.tokens.server import token_received_event, FLASK_PORT
+
     Logger.instance().spinner.stop()
 
     existing_token = get_existing_token(host=host)
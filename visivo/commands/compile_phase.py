@@ -31,13 +31,19 @@ def compile_phase(
     dbt_target: str = None,
     no_deprecation_warnings: bool = False,
     project=None,
+    parsed_files=None,
 ):
     # Track parse project - skip if project already provided
     parse_start = time()
     if project is None:
         Logger.instance().debug("    Running parse project phase...")
         project = parse_project_phase(
-            working_dir, output_dir, default_source, dbt_profile, dbt_target
+            working_dir,
+            output_dir,
+            default_source,
+            dbt_profile,
+            dbt_target,
+            parsed_files=parsed_files,
         )
         parse_duration = round(time() - parse_start, 2)
         Logger.instance().debug(f"Project parsing completed in {parse_duration}s")
@@ -103,7 +103,7 @@ def _generate_models(manifest, dbt_profile, dbt_target, dbt_prefix):
     return models
 
 
-def dbt_phase(working_dir, output_dir, dbt_profile, dbt_target):
+def dbt_phase(working_dir, output_dir, dbt_profile, dbt_target, parsed_files=None):
     from visivo.logger.logger import Logger
     from visivo.parsers.parser_factory import ParserFactory
     from visivo.discovery.discover import Discover
@@ -111,8 +111,13 @@ def dbt_phase(working_dir, output_dir, dbt_profile, dbt_target):
     import os
     import click
 
-    discover = Discover(working_dir=working_dir, output_dir=output_dir)
-    parser = ParserFactory().build(project_file=discover.project_file, files=discover.files)
+    discover = Discover(working_dir=working_dir, output_dir=output_dir, parsed_files=parsed_files)
+    parser = ParserFactory().build(
+        project_file=discover.project_file,
+        files=discover.files,
+        loaded_files=discover.loaded_files,
+        parsed_files=parsed_files,
+    )
     data = parser.merge_data_files()
     if "dbt" in data and data["dbt"]:
         dbt = Dbt(**data["dbt"])
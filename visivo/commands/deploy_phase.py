@@ -989,11 +989,13 @@ def collect_static_insight_parquet(insights, dag, output_dir):
 
     Which is why it attaches to the existing InsightJob rather than creating a
     row of its own: the insight's files[] ref names the insight, so one record
-    carries both the envelope and the file.
+    carries both the envelope and the file. A dynamic insight with ``rollup``
+    set may have one too — its model pre-aggregated, written under the same
+    name and queried in place of the model.
     """
     files = []
     for insight in insights:
-        if insight.is_dynamic(dag):
+        if insight.is_dynamic(dag) and not insight.rollup:
             continue
         if os.path.exists(f"{output_dir}/insights/{insight.name}.parquet"):
             files.append(
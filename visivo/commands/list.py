@@ -1,7 +1,5 @@
 import click
 from visivo.commands.options import working_dir, output_dir, source
-from visivo.commands.parse_project_phase import parse_project_phase
-from visivo.commands.list_phase import list_phase
 
 
 @click.command()
@@ -14,6 +12,8 @@ def list(object_type, working_dir, output_dir, source):
     Lists all objects of a given type in the project.
     """
     from visivo.logger.logger import Logger
+    from visivo.commands.parse_project_phase import parse_project_phase
+    from visivo.commands.list_phase import list_phase
 
     Logger.instance().debug(f"Listing {object_type}")
 
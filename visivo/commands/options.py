@@ -2,8 +2,6 @@ import click
 import os
 import re
 
-from visivo.models.base.named_model import NAME_REGEX
-
 
 def working_dir(function):
     def callback(ctx, param, value):
@@ -97,6 +95,8 @@ def user_dir(function):
 
 
 def validate_stage(ctx, param, value):
+    from visivo.models.base.named_model import NAME_REGEX
+
     if value.strip() == "":
         raise click.BadParameter("Only whitespace is not permitted for stage name.")
 
@@ -149,6 +149,17 @@ def threads(function):
     return function
 
 
+def full_refresh(function):
+    click.option(
+        "-fr",
+        "--full-refresh",
+        help="Re-runs every job, including ones whose config, upstream dependencies and source files are unchanged since the last run.",
+        is_flag=True,
+        default=False,
+    )(function)
+    return function
+
+
 def skip_compile(function):
     click.option(
         "-sc",
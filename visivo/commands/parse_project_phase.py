@@ -1,5 +1,6 @@
 from visivo.discovery.discover import Discover
 from visivo.parsers.parser_factory import ParserFactory
+from visivo.parsers.project_cache import ProjectCache
 from visivo.models.project import Defaults, Project
 from visivo.logger.logger import Logger
 from visivo.commands.dbt_phase import dbt_phase
@@ -11,9 +12,16 @@ from time import time
 
 
 def parse_project_phase(
-    working_dir, output_dir, default_source, dbt_profile, dbt_target, new=False, project_dir=""
+    working_dir,
+    output_dir,
+    default_source,
+    dbt_profile,
+    dbt_target,
+    new=False,
+    project_dir="",
+    parsed_files=None,
 ):
-    discover = Discover(working_dir=working_dir, output_dir=output_dir)
+    discover = Discover(working_dir=working_dir, output_dir=output_dir, parsed_files=parsed_files)
     project = None
 
     if not os.path.exists(discover.project_file) or new:
@@ -33,27 +41,46 @@ def parse_project_phase(
         # Run and Track dbt phase
         dbt_start = time()
         Logger.instance().debug("    Running dbt phase...")
-        dbt_phase(working_dir, output_dir, dbt_profile, dbt_target)
+        dbt_phase(working_dir, output_dir, dbt_profile, dbt_target, parsed_files=parsed_files)
         dbt_duration = round(time() - dbt_start, 2)
         if os.environ.get("STACKTRACE"):
             Logger.instance().info(f"dbt phase completed in {dbt_duration}s")
 
-        parser = ParserFactory().build(
-            project_file=discover.project_file,
-            files=discover.files,
-            default_source=default_source,
-        )
-        try:
-            project = parser.parse()
-        except yaml.YAMLError as e:
-            message = "\n"
-            if hasattr(e, "problem_mark"):
-                mark = e.problem_mark
-                message = f"\n Error position: line:{mark.line+1} column:{mark.column+1}\n"
-            raise click.ClickException(f"There was an error parsing the yml file(s):{message} {e}")
+        project_cache = ProjectCache(output_dir)
+        project = project_cache.load(default_source=default_source)
+        if project is not None:
+            Logger.instance().debug("    Loaded unchanged project from the project cache")
+        else:
+            files = discover.files
+            parser = ParserFactory().build(
+                project_file=discover.project_file,
+                files=files,
+                default_source=default_source,
+                loaded_files=discover.loaded_files,
+                parsed_files=parsed_files,
+            )
+            try:
+                project = parser.parse()
+            except yaml.YAMLError as e:
+                message = "\n"
+                if hasattr(e, "problem_mark"):
+                    mark = e.problem_mark
+                    message = f"\n Error position: line:{mark.line+1} column:{mark.column+1}\n"
+                raise click.ClickException(
+                    f"There was an error parsing the yml file(s):{message} {e}"
+                )
+            project_cache.save(
+                project,
+                files=files,
+                watched=discover.watched_paths,
+                default_source=default_source,
+            )
 
     if not project.defaults:
         project.defaults = Defaults()
+    # Hashed once here, so a serve reload diffs the recompiled project against
+    # the served one by comparing stamps rather than re-serializing both
+    project.dag().stamp_content_hashes()
     # Ensure output directory exists
     os.makedirs(output_dir, exist_ok=True)
     # Ensure dashboard directory exists
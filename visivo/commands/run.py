@@ -8,6 +8,7 @@ from visivo.commands.options import (
     dbt_profile,
     dbt_target,
     skip_compile,
+    full_refresh,
     port,
     no_deprecation_warnings,
 )
@@ -22,6 +23,7 @@ from visivo.commands.options import (
 @dbt_profile
 @dbt_target
 @skip_compile
+@full_refresh
 @port
 @no_deprecation_warnings
 def run(
@@ -33,11 +35,12 @@ def run(
     dbt_profile,
     dbt_target,
     skip_compile,
+    full_refresh,
     port,
     no_deprecation_warnings,
 ):
     """
-    Compiles the project and then runs the model and insight queries to fetch the data that powers your dashboards. Writes all data to the output directory. Can skip the compile with the --skip-compile flag.
+    Compiles the project and then runs the model and insight queries to fetch the data that powers your dashboards. Writes all data to the output directory. Can skip the compile with the --skip-compile flag. Jobs that read only local file sources (DuckDB, SQLite, CSV, Excel) and whose config, upstream dependencies and source files are unchanged since the last run are skipped unless --full-refresh is passed; jobs on server sources always run.
     """
     from visivo.logger.logger import Logger
     from visivo.commands.parse_project_phase import parse_project_phase
@@ -67,6 +70,7 @@ def run(
         skip_compile=skip_compile,
         project=project,
         no_deprecation_warnings=no_deprecation_warnings,
+        incremental=not full_refresh,
     )
 
     Logger.instance().success("Done")
@@ -28,6 +28,7 @@ def run_phase(
     server_url: str = None,
     no_deprecation_warnings: bool = False,
     run_id: str = DEFAULT_RUN_ID,
+    incremental: bool = False,
 ):
     from visivo.logger.logger import Logger
     from visivo.jobs.filtered_runner import FilteredRunner
@@ -96,6 +97,7 @@ def run_phase(
         server_url=server_url,
         working_dir=working_dir,
         run_id=run_id,
+        incremental=incremental,
     )
     runner.run()
     return runner
@@ -17,12 +17,6 @@ from visivo.commands.options import (
     new,
     no_deprecation_warnings,
 )
-from visivo.discovery.discover import Discover
-from visivo.models.defaults import Defaults
-from visivo.models.project import Project
-from visivo.commands.serve_phase import serve_phase
-from visivo.commands.parse_project_phase import parse_project_phase
-from visivo.logger.logger import Logger
 
 
 @click.command()
@@ -54,6 +48,13 @@ def serve(
     pd,
     no_deprecation_warnings,
 ):
+    from visivo.discovery.discover import Discover
+    from visivo.models.defaults import Defaults
+    from visivo.models.project import Project
+    from visivo.commands.serve_phase import serve_phase
+    from visivo.commands.parse_project_phase import parse_project_phase
+    from visivo.logger.logger import Logger
+
     start_time = time()
     logger = Logger.instance()
     server_url = f"http://localhost:{port}"
@@ -1,6 +1,7 @@
 import webbrowser
 from visivo.commands.compile_phase import compile_phase
 from visivo.logger.logger import Logger
+from visivo.parsers.parsed_files import ParsedFiles
 
 from visivo.server.hot_reload_server import HotReloadServer
 from visivo.server.flask_app import FlaskApp
@@ -26,8 +27,10 @@ def serve_phase(
 
     app = FlaskApp(output_dir=output_dir, project=project, working_dir=working_dir)
     server = None  # Will be set later
+    # Kept across reloads, so a reload only parses the YAML files that changed
+    parsed_files = ParsedFiles()
 
-    def on_project_change(one_shot=False):
+    def on_project_change(one_shot=False, changed_paths=None):
         def emit_project_changed(drafts_dropped):
             # Soft-refresh signal for the Workspace SPA (VIS-808 / Q15): the
             # viewer refetches instead of hard-reloading, and shows the
@@ -43,11 +46,14 @@ def serve_phase(
             Logger.instance().info(
                 "Server has detected changes to the project. Re-running project..."
             )
+            if changed_paths:
+                parsed_files.invalidate(changed_paths)
             project = compile_phase(
                 default_source=default_source,
                 working_dir=working_dir,
                 output_dir=output_dir,
                 no_deprecation_warnings=no_deprecation_warnings,
+                parsed_files=parsed_files,
             )
 
             # Q15 last-write-wins: a genuine external YAML edit makes any
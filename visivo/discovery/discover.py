@@ -16,10 +16,19 @@ class Discover:
         working_dir: str,
         output_dir: str,
         home_dir=os.path.expanduser("~"),
+        parsed_files=None,
     ):
         self.working_dir = working_dir
         self.home_dir = home_dir
         self.output_dir = output_dir
+        # A ParsedFiles to load through, so files unchanged since the last
+        # discovery are not parsed again
+        self.parsed_files = parsed_files
+        # Filled in by ``files``: the YAML each file was parsed into while
+        # following includes, so the parser does not read it a second time,
+        # and the paths whose changes the file list depends on.
+        self.loaded_files = {}
+        self.watched_paths = []
 
     @property
     def project_file(self):
@@ -34,10 +43,13 @@ class Discover:
         if not os.path.exists(self.project_file):
             raise click.ClickException(f'Project file "{PROJECT_FILE_NAME}" not found')
         files = [self.project_file]
+        self.loaded_files = {}
+        self.watched_paths = []
 
         self.__add_includes(files=files, file=self.project_file)
 
         profile_file = get_profile_file(home_dir=self.home_dir)
+        self.watched_paths.append(profile_file)
         if os.path.exists(profile_file):
             files.append(profile_file)
 
@@ -113,6 +125,7 @@ class Discover:
         """Find YAML files in a directory with optional depth limit and exclusions."""
         yaml_files = []
         exclusions = exclusions or []
+        self.watched_paths.append(directory_path)
 
         if depth == 0:
             # Only search current directory
@@ -132,6 +145,8 @@ class Discover:
                     dirs[:] = []  # Don't go deeper
                     continue
 
+                self.watched_paths.append(root)
+
                 # Check files in current directory
                 for file in files:
                     if file.lower().endswith((".yml", ".yaml")):
@@ -153,7 +168,11 @@ class Discover:
     def __add_includes(self, files, file):
         from visivo.models.include import Include
 
-        data = load_yaml_file(file)
+        if self.parsed_files is not None:
+            data = self.parsed_files.load(file)
+        else:
+            data = load_yaml_file(file)
+        self.loaded_files[str(file)] = data
         base_path = os.path.dirname(file)
 
         output_file = self.__add_dbt(data=data)
@@ -7,20 +7,23 @@ from visivo.models.models.sql_model import SqlModel
 from visivo.models.project import Project
 from visivo.logger.logger import Logger
 from time import time
+from collections import deque
 from concurrent.futures import Future, ThreadPoolExecutor
-import queue
+from functools import partial
 import sys
 from visivo.models.sources.source import Source
 from visivo.models.inputs.input import Input
+from visivo.jobs.file_index import save_index
 from visivo.jobs.job import JobResult
+from visivo.jobs.run_manifest import RunManifest
 
 from visivo.jobs.run_insight_job import job as insight_job
 from visivo.jobs.run_source_schema_job import job as source_schema_job
 from visivo.jobs.run_sql_model_job import job as sql_model_job
 from visivo.jobs.run_input_job import job as input_job
-from visivo.jobs.job_tracker import JobTracker
+from visivo.query.compilation_cache import CompilationCache
 from visivo.query.source_schema_cache import SourceSchemaCache
-from threading import Lock
+from threading import Event, Lock
 
 warnings.filterwarnings("ignore")
 
@@ -36,6 +39,8 @@ class DagRunner:
         job_dag: Any,
         working_dir: str,
         run_id: str = None,
+        run_manifest: RunManifest = None,
+        incremental: bool = False,
     ):
         self.project = project
         self.output_dir = output_dir
@@ -45,34 +50,44 @@ class DagRunner:
         self.job_dag = job_dag
         self.working_dir = working_dir
         self.run_id = run_id
-        self.job_tracking_dag = job_dag.copy()
         self.project_dag = project.dag()
         self.failed_job_results = []
         self.successful_job_results = []
         self.lock = Lock()
         # Schema cache for SQL model jobs - builds DataTypes once per source
         self.schema_cache = SourceSchemaCache()
+        # Shares schemas, resolved refs and parsed model SQL across insight jobs
+        self.compilation_cache = CompilationCache()
+        # Streams model results to parquet in bounded batches when configured
+        self.max_batch_rows = project.defaults.max_batch_rows if project.defaults else None
+        # Records what each job built; with incremental, unchanged jobs are skipped
+        self.run_manifest = run_manifest
+        self.incremental = incremental and run_manifest is not None
+        self.skipped_job_count = 0
+        # Source schema jobs in the run, counted on first use
+        self.schema_job_count = None
 
     def run(self):
-        complete = False
-        job_tracker = JobTracker()
         start_time = time()
-        with ThreadPoolExecutor(max_workers=self.threads) as executor:
-            while True:
-                complete = self.update_job_queue(job_tracker)
-                if complete:
-                    break
-
-                try:
-                    job = job_tracker.get_next_job()
-                except queue.Empty:
-                    continue
-
-                if job.done() or job.running():
-                    pass
-                else:
-                    job.set_future(executor.submit(job.action, **job.kwargs))
-                    job.future.add_done_callback(self.job_callback)
+        self._prepare_schedule()
+        try:
+            with ThreadPoolExecutor(max_workers=self.threads) as executor:
+                self.executor = executor
+                with self.lock:
+                    jobs = self._release(
+                        [node for node, count in self.pending_counts.items() if count == 0]
+                    )
+                self._start(jobs)
+                self.all_done.wait()
+        finally:
+            # Every job has finished, so no model reads the schema stores any more
+            self.schema_cache.clear()
+        save_index()
+        if self.scheduler_error is not None:
+            raise self.scheduler_error
+        if self.run_manifest is not None:
+            self.run_manifest.save()
+        self.compilation_cache.log_stats()
 
         if len(self.failed_job_results) > 0:
             Logger.instance().info("")
@@ -84,59 +99,206 @@ class DagRunner:
                 Logger.instance().error(str(result.message))
             if not self.soft_failure:
                 sys.exit(1)
-        elif len(self.successful_job_results) == 0 and len(self.failed_job_results) == 0:
+        elif (
+            len(self.successful_job_results) == 0
+            and len(self.failed_job_results) == 0
+            and self.skipped_job_count == 0
+        ):
             Logger.instance().error(
                 f"\nNo jobs run. Ensure your filter contains nodes that are runnable."
             )
         else:
-            Logger.instance().info(f"\nRun finished in {round(time()-start_time, 2)}s")
+            skipped = (
+                f" ({self.skipped_job_count} unchanged job(s) skipped)"
+                if self.skipped_job_count
+                else ""
+            )
+            Logger.instance().info(f"\nRun finished in {round(time()-start_time, 2)}s{skipped}")
 
-    def job_callback(self, future: Future):
-        job_result: JobResult = future.result(timeout=30)
-        if job_result.success:
-            Logger.instance().success(str(job_result.message))
-            self.successful_job_results.append(job_result)
-        else:
-            Logger.instance().error(str(job_result.message))
-            self.failed_job_results.append(job_result)
+    def _prepare_schedule(self):
+        """Count each node's unfinished dependencies.
 
-    def update_job_queue(self, job_tracker: JobTracker):
-        from networkx import descendants as node_descendants
+        Edges in the job dag point from a node to what it depends on, so a
+        node's successors are its dependencies and its predecessors are the
+        nodes waiting on it. A node is ready once its count reaches zero.
+        """
+        self.pending_counts = {
+            node: self.job_dag.out_degree(node)
+            for node in self.job_dag.nodes()
+            if node != self.project
+        }
+        self.blocked = set()
+        # Jobs running and waiting per source, for ``max_concurrent_queries``
+        self.running_by_source = {}
+        self.waiting_by_source = {}
+        self.remaining = len(self.pending_counts)
+        self.all_done = Event()
+        self.scheduler_error = None
+        if self.remaining == 0:
+            self.all_done.set()
 
-        with self.lock:
-            terminal_nodes = [
-                n
-                for n in self.job_tracking_dag.nodes()
-                if self.job_tracking_dag.out_degree(n) == 0 and n != self.project
-            ]
-
-            for terminal_node in terminal_nodes:
-                descendants = node_descendants(self.job_dag, terminal_node)
-                if job_tracker.is_job_name_done(terminal_node.name):
-                    self.job_tracking_dag.remove_node(terminal_node)
-                    continue
-                elif any(
-                    job_tracker.is_job_name_failed(descendant.name) for descendant in descendants
-                ):
+    def _release(self, ready_nodes):
+        """Create jobs for every ready node, cascading through nodes that have no job.
+
+        Must be called with ``self.lock`` held; returns ``(node, job)`` pairs
+        for ``_start`` to submit once the lock is released. Nodes without a job
+        (charts, dashboards, ...) and nodes skipped for a failed dependency
+        complete immediately, which may make further nodes ready; those are
+        handled here too rather than by recursion, so long chains cannot
+        overflow the stack. A node whose job cannot be created fails like a
+        job that raised, blocking only its dependents.
+        """
+        ready = deque(ready_nodes)
+        jobs = []
+        try:
+            while ready:
+                node = ready.popleft()
+                if node in self.blocked:
                     Logger.instance().info(
-                        f"Skipping job for '{terminal_node.name}' because it has a failed dependency"
+                        f"Skipping job for '{node.name}' because it has a failed dependency"
                     )
-                    self.job_tracking_dag.remove_node(terminal_node)
+                    ready.extend(self._complete(node, failed=True))
                     continue
 
-                job = self.create_jobs_from_item(terminal_node)
+                try:
+                    job = self.create_jobs_from_item(node)
+                    unchanged = (
+                        job is not None
+                        and self.incremental
+                        and self.run_manifest.is_unchanged(node, job)
+                    )
+                except Exception as e:
+                    self._fail(node, f"Could not create job for '{node.name}': {e!r}")
+                    ready.extend(self._complete(node, failed=True))
+                    continue
                 if not job:
-                    self.job_tracking_dag.remove_node(terminal_node)
+                    ready.extend(self._complete(node, failed=False))
+                    continue
+
+                if unchanged:
+                    Logger.instance().info(f"Skipping unchanged job for '{node.name}'")
+                    self.skipped_job_count += 1
+                    ready.extend(self._complete(node, failed=False))
                     continue
-                if not job_tracker.is_job_name_enqueued(job.name):
-                    job_tracker.track_job(job)
 
-            return len(self.job_tracking_dag.nodes()) == 1
+                self._admit(node, job, jobs)
+        except Exception as e:
+            self.scheduler_error = e
+            self.all_done.set()
+        return jobs
+
+    def _source_limit(self, job):
+        source = job.source
+        limit = getattr(source, "max_concurrent_queries", None)
+        return (source.name, limit) if limit else (None, None)
+
+    def _admit(self, node, job, jobs):
+        """Queue ``job`` to start, unless its source is already running as many
+        jobs as its ``max_concurrent_queries`` allows; then it waits here, in the
+        scheduler, rather than on a worker thread. Called with ``self.lock`` held."""
+        source_name, limit = self._source_limit(job)
+        if source_name is None:
+            jobs.append((node, job))
+        elif self.running_by_source.get(source_name, 0) < limit:
+            self.running_by_source[source_name] = self.running_by_source.get(source_name, 0) + 1
+            jobs.append((node, job))
+        else:
+            self.waiting_by_source.setdefault(source_name, deque()).append((node, job))
+
+    def _finish_source_job(self, job):
+        """Free ``job``'s slot on its source and return the waiting job it lets start."""
+        source_name, _ = self._source_limit(job)
+        if source_name is None:
+            return []
+        waiting = self.waiting_by_source.get(source_name)
+        if waiting:
+            return [waiting.popleft()]
+        self.running_by_source[source_name] -= 1
+        return []
+
+    def _start(self, jobs):
+        """Submit jobs to the executor. Called without ``self.lock`` held, since
+        a future that is already done runs its callback immediately. A job that
+        cannot be submitted gets a future holding the error, so it fails
+        through ``job_callback`` like one that raised."""
+        for node, job in jobs:
+            if self.scheduler_error is not None:
+                return
+            try:
+                future = self.executor.submit(job.action, **job.kwargs)
+            except Exception as e:
+                future = Future()
+                future.set_exception(e)
+            job.set_future(future)
+            future.add_done_callback(partial(self.job_callback, node, job))
+
+    def _complete(self, node, failed: bool):
+        """Mark ``node`` finished and return the dependents it made ready."""
+        newly_ready = []
+        for dependent in self.job_dag.predecessors(node):
+            if dependent not in self.pending_counts:
+                continue
+            if failed:
+                self.blocked.add(dependent)
+            self.pending_counts[dependent] -= 1
+            if self.pending_counts[dependent] == 0:
+                newly_ready.append(dependent)
+        self.remaining -= 1
+        if self.remaining == 0:
+            self.all_done.set()
+        return newly_ready
+
+    def _fail(self, node, message: str):
+        """Record a failed result for ``node``. Called with ``self.lock`` held."""
+        self.failed_job_results.append(JobResult(item=node, success=False, message=message))
+        Logger.instance().error(message)
+
+    def job_callback(self, node, job, future: Future):
+        try:
+            job_result: JobResult = future.result()
+        except Exception as e:
+            job_result = JobResult(item=node, success=False, message=repr(e))
+
+        failed = not job_result.success
+        with self.lock:
+            # The node completes whatever the bookkeeping raises; otherwise
+            # its dependents never become ready and the run waits forever.
+            try:
+                if job_result.success:
+                    self.successful_job_results.append(job_result)
+                    Logger.instance().success(str(job_result.message))
+                    if self.run_manifest is not None:
+                        self.run_manifest.record(node, job)
+                else:
+                    self.failed_job_results.append(job_result)
+                    Logger.instance().error(str(job_result.message))
+                    if self.run_manifest is not None:
+                        self.run_manifest.forget(node)
+            except Exception as e:
+                # Not logged: the logger may be what raised
+                if job_result.success:
+                    self.successful_job_results.remove(job_result)
+                    self.failed_job_results.append(
+                        JobResult(
+                            item=node,
+                            success=False,
+                            message=f"Could not record the result of '{node.name}': {e!r}",
+                        )
+                    )
+                failed = True
+            finally:
+                jobs = self._finish_source_job(job)
+                jobs += self._release(self._complete(node, failed=failed))
+        self._start(jobs)
 
     def create_jobs_from_item(self, item: ParentModel):
         if isinstance(item, Insight):
             return insight_job(
-                insight=item, output_dir=self.output_dir, dag=self.project_dag, run_id=self.run_id
+                insight=item,
+                output_dir=self.output_dir,
+                dag=self.project_dag,
+                run_id=self.run_id,
+                compilation_cache=self.compilation_cache,
             )
         elif isinstance(item, Input):
             return input_job(
@@ -149,6 +311,7 @@ class DagRunner:
                 dag=self.project_dag,
                 run_id=self.run_id,
                 schema_cache=self.schema_cache,
+                max_batch_rows=self.max_batch_rows,
             )
         elif isinstance(item, Source):
             return source_schema_job(
@@ -156,5 +319,21 @@ class DagRunner:
                 output_dir=self.output_dir,
                 run_id=self.run_id,
                 working_dir=self.working_dir,
+                threads=self._schema_workers(item),
             )
         return None
+
+    def _schema_workers(self, source: Source) -> int:
+        """How many introspection queries ``source``'s schema job may run at once.
+
+        Source schema jobs have no dependencies, so they all start together:
+        each gets an even share of the run's threads rather than all of them,
+        and no more than the source's ``max_concurrent_queries``.
+        """
+        if self.schema_job_count is None:
+            self.schema_job_count = sum(
+                1 for node in self.job_dag.nodes() if isinstance(node, Source)
+            )
+        workers = max(1, self.threads // max(1, self.schema_job_count))
+        limit = getattr(source, "max_concurrent_queries", None)
+        return min(workers, limit) if limit else workers
@@ -0,0 +1,125 @@
+"""File index — the parquet files a run has written, by the hash the viewer asks for.
+
+The viewer fetches parquet as ``/api/files/<alpha_hash(name)>/<run_id>/``. The
+files are written under their clean names in ``models/``, ``insights/`` and
+``inputs/``, so without an index the server has to list those directories and
+hash every stem to find one. Jobs record each file as they write it; the
+entries are kept in memory and written to the index once, when the run ends
+(``save_index``), rather than rewriting the whole index for every file.
+
+Each entry holds the file's size and mtime at the time of writing, so a file
+changed by something that did not update the index is noticed. The server
+derives the ETag from the file's contents the first time it serves it (see
+``content_hash``): a file rewritten with the same data keeps its ETag, so a
+viewer that already has it gets a 304 instead of the file.
+
+Files written with a viewer layout (see ``visivo.jobs.parquet_io``) carry it
+in their entry, so the insights that read them can pass it on to the viewer.
+
+The index is kept per run id at ``{output_dir}/{run_id}/files_index.json``,
+beside the files it describes.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+from visivo.logger.logger import Logger
+from visivo.models.base.named_model import alpha_hash
+
+INDEX_FILE_NAME = "files_index.json"
+INDEX_VERSION = 1
+
+# Entries recorded but not yet saved, by run output dir. Jobs record files
+# from several threads at once.
+_pending: Dict[str, Dict[str, dict]] = {}
+_lock = threading.Lock()
+
+
+def index_path(run_output_dir: str) -> str:
+    return f"{run_output_dir}/{INDEX_FILE_NAME}"
+
+
+def content_hash(path: str) -> str:
+    """sha256 of the file at ``path``, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_index(run_output_dir: str) -> Dict[str, dict]:
+    try:
+        with open(index_path(run_output_dir)) as fp:
+            index = json.load(fp)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return {}
+    entries = index.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def load_index(run_output_dir: str) -> Dict[str, dict]:
+    """The entries of the run's index and those recorded since it was saved,
+    or ``{}`` when there are none or the index is unreadable."""
+    entries = _read_index(run_output_dir)
+    with _lock:
+        entries.update(_pending.get(run_output_dir, {}))
+    return entries
+
+
+def entry_is_current(entry: dict, path: str) -> bool:
+    """Whether the file at ``path`` is still the one ``entry`` describes."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
+
+
+def record_file(run_output_dir: str, path: str, layout: Optional[dict] = None) -> Optional[dict]:
+    """Record the parquet file at ``path``, written with ``layout``, for the run's index.
+
+    ``path`` must be inside ``run_output_dir``. The entry is keyed by
+    ``alpha_hash`` of the file's stem and written by the next ``save_index``.
+    Indexing is best effort: a failure leaves the file to be found by the
+    server's directory scan.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    entry = {
+        "path": os.path.relpath(path, run_output_dir),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    if layout is not None:
+        entry["layout"] = layout
+    stem = os.path.splitext(os.path.basename(path))[0]
+
+    with _lock:
+        _pending.setdefault(run_output_dir, {})[alpha_hash(stem)] = entry
+    return entry
+
+
+def save_index():
+    """Write every recorded entry to its run's index, one write per run."""
+    with _lock:
+        pending = dict(_pending)
+        _pending.clear()
+        for run_output_dir, recorded in pending.items():
+            entries = _read_index(run_output_dir)
+            entries.update(recorded)
+            target = index_path(run_output_dir)
+            partial_path = f"{target}.partial"
+            try:
+                with open(partial_path, "w") as fp:
+                    json.dump({"version": INDEX_VERSION, "entries": entries}, fp, sort_keys=True)
+                os.replace(partial_path, target)
+            except OSError as e:
+                Logger.instance().debug(f"File index not written for {run_output_dir}: {e}")
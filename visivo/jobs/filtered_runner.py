@@ -1,5 +1,7 @@
 from visivo.jobs.dag_runner import DagRunner
+from visivo.jobs.run_manifest import RunManifest
 from visivo.models.project import Project
+from visivo.models.sources.base_duckdb_source import duckdb_connection_cache
 
 
 class FilteredRunner:
@@ -13,6 +15,7 @@ class FilteredRunner:
         server_url: str = None,
         working_dir: str = None,
         run_id: str = None,
+        incremental: bool = False,
     ):
         self.project = project
         self.output_dir = output_dir
@@ -22,7 +25,16 @@ class FilteredRunner:
         self.server_url = server_url
         self.working_dir = working_dir
         self.run_id = run_id
+        self.incremental = incremental
         self.project_dag = project.dag()
+        # Every run records what it built, so a later incremental run never
+        # trusts outputs some other run has since overwritten.
+        self.run_manifest = RunManifest(
+            output_dir=output_dir,
+            dag=self.project_dag,
+            run_id=run_id,
+            working_dir=working_dir,
+        )
         # Aggregated per-job results across every filtered DAG iteration.
         # The preview executor reads these to surface the real upstream
         # error when a soft-failure run leaves an insight's JSON
@@ -31,6 +43,10 @@ class FilteredRunner:
         self.successful_job_results = []
 
     def run(self):
+        with duckdb_connection_cache(self.project_dag.nodes()):
+            self._run_filtered_dags()
+
+    def _run_filtered_dags(self):
         for job_dag in self.project_dag.filter_dag(self.dag_filter):
             dag_runner = DagRunner(
                 project=self.project,
@@ -41,6 +57,8 @@ class FilteredRunner:
                 job_dag=job_dag,
                 working_dir=self.working_dir,
                 run_id=self.run_id,
+                run_manifest=self.run_manifest,
+                incremental=self.incremental,
             )
             dag_runner.run()
             self.failed_job_results.extend(dag_runner.failed_job_results)
@@ -1,8 +1,8 @@
-"""Shared parquet-write helper for model and insight jobs.
+"""Shared parquet-write helpers for model, insight and input jobs.
 
-This module exists to give both ``run_model_data_job.py`` and
-``run_insight_job.py`` a single, robust implementation for writing
-list-of-dicts data to parquet. Two latent issues drove the extraction:
+This module exists to give ``run_model_data_job.py``, ``run_insight_job.py``
+and ``run_input_job.py`` a single, robust implementation for writing query
+results to parquet. Two latent issues drove the extraction:
 
 * **B12** — ``pl.DataFrame(data)`` with the polars default
   ``infer_schema_length=100`` produces wrong dtypes for null-heavy or
@@ -18,17 +18,99 @@ list-of-dicts data to parquet. Two latent issues drove the extraction:
   visualization path (Float64 has ~15 significant digits, more than any
   realistic dashboard metric needs).
 
+Files written whole are also laid out for the viewer, which reads them with
+DuckDB-WASM and skips any row group whose min/max statistics rule out a filter:
+rows are sorted by the columns insights split on or filter by an input, row
+groups are kept small enough to prune, string columns are dictionary encoded
+only when they repeat, and the zstd level is chosen by size. The layout used
+is returned so it can be recorded for the viewer.
+
 Diagnostic files:
 ``specs/plan/v1-final-bugfixes/B12-polars-infer-schema-length.md``
 ``specs/plan/v1-final-bugfixes/B14-arrow-decimal128-object-serialization.md``
 """
 
-from typing import List
+import os
+from typing import Iterable, List, Sequence
 
 import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+# Rows per row group. DuckDB-WASM fetches and skips whole row groups, so
+# smaller groups let a filter skip more of a sorted file; much smaller and the
+# per-group statistics and requests start to cost more than they save.
+ROW_GROUP_ROWS = 64 * 1024
+
+# A string column is dictionary encoded when it has at most this many distinct
+# values per row. Above that the dictionary costs more than it saves.
+DICTIONARY_MAX_DISTINCT_RATIO = 0.5
+
+# (upper bound on in-memory bytes, zstd level): small files are compressed
+# harder, since they are downloaded far more often than they are written.
+ZSTD_LEVELS = ((16 * 1024 * 1024, 9), (256 * 1024 * 1024, 6))
+DEFAULT_ZSTD_LEVEL = 3
+
+
+def zstd_level(num_bytes: int) -> int:
+    """The zstd level for a table of ``num_bytes`` in memory."""
+    for limit, level in ZSTD_LEVELS:
+        if num_bytes <= limit:
+            return level
+    return DEFAULT_ZSTD_LEVEL
 
 
-def write_dicts_to_parquet(data: List[dict], path: str) -> None:
+def _dictionary_columns(table: pa.Table) -> List[str]:
+    """Columns to dictionary encode: every non-string column, as the writer
+    would by default, and string columns whose values repeat."""
+    columns = []
+    limit = max(1, int(table.num_rows * DICTIONARY_MAX_DISTINCT_RATIO))
+    for field in table.schema:
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            if pc.count_distinct(table.column(field.name)).as_py() > limit:
+                continue
+        columns.append(field.name)
+    return columns
+
+
+def _write_table(table: pa.Table, path: str, sort_by: Sequence[str] = ()) -> dict:
+    """Write ``table`` with the viewer layout and return that layout.
+
+    ``sort_by`` names columns to sort by; any the table does not have are
+    ignored, since they are known before the query is run.
+    """
+    sort_columns = []
+    for column in sort_by:
+        if column in table.column_names and column not in sort_columns:
+            sort_columns.append(column)
+    if sort_columns and table.num_rows:
+        table = table.sort_by([(column, "ascending") for column in sort_columns])
+
+    level = zstd_level(table.nbytes)
+    dictionary_columns = _dictionary_columns(table)
+    pq.write_table(
+        table,
+        path,
+        compression="zstd",
+        compression_level=level,
+        row_group_size=ROW_GROUP_ROWS,
+        use_dictionary=dictionary_columns,
+        sorting_columns=[
+            pq.SortingColumn(table.column_names.index(column)) for column in sort_columns
+        ]
+        or None,
+    )
+    return {
+        "sort_by": sort_columns,
+        "row_group_rows": ROW_GROUP_ROWS,
+        "compression": "zstd",
+        "compression_level": level,
+        "dictionary_columns": dictionary_columns,
+    }
+
+
+def write_dicts_to_parquet(data: List[dict], path: str, sort_by: Sequence[str] = ()) -> dict:
     """Write a list-of-dicts to parquet at ``path``.
 
     The implementation is robust to two issues that affected the prior
@@ -45,6 +127,10 @@ def write_dicts_to_parquet(data: List[dict], path: str) -> None:
         data: list of row dicts (typically the output of
             ``Source.read_sql``).
         path: absolute or relative path to the destination parquet file.
+        sort_by: columns to sort the rows by, where the result has them.
+
+    Returns:
+        The layout the file was written with.
     """
     df = pl.DataFrame(data, infer_schema_length=None)
 
@@ -52,4 +138,139 @@ def write_dicts_to_parquet(data: List[dict], path: str) -> None:
     if decimal_cols:
         df = df.with_columns([pl.col(c).cast(pl.Float64) for c in decimal_cols])
 
-    df.write_parquet(path)
+    return _write_table(df.to_arrow(), path, sort_by)
+
+
+def cast_decimals_to_float(table: pa.Table) -> pa.Table:
+    """Cast every top-level Arrow decimal column to ``float64`` (B14)."""
+    for index, field in enumerate(table.schema):
+        if pa.types.is_decimal(field.type):
+            table = table.set_column(index, field.name, table.column(index).cast(pa.float64()))
+    return table
+
+
+def write_arrow_to_parquet(table: pa.Table, path: str, sort_by: Sequence[str] = ()) -> dict:
+    """Write an Arrow table (typically from ``Source.read_arrow``) to parquet.
+
+    The columnar counterpart of ``write_dicts_to_parquet``. The source already
+    typed every column, so there is no schema inference to get wrong (B12);
+    the decimal cast (B14) is done on the Arrow columns.
+
+    Args:
+        table: the query result.
+        path: absolute or relative path to the destination parquet file.
+        sort_by: columns to sort the rows by, where the result has them.
+
+    Returns:
+        The layout the file was written with.
+    """
+    return _write_table(cast_decimals_to_float(table), path, sort_by)
+
+
+def _conform_to_schema(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Cast a batch, or a row group read back, to the file's schema."""
+    if table.schema.equals(schema):
+        return table
+    columns = []
+    for field in schema:
+        column = table.column(field.name)
+        if column.type != field.type:
+            try:
+                column = column.cast(field.type)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as err:
+                raise ValueError(
+                    f"Column '{field.name}' changed type from {field.type} to {column.type} "
+                    f"part way through the result and cannot be streamed to parquet: {err}"
+                ) from err
+        columns.append(column)
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _file_schema(schema: pa.Schema) -> pa.Schema:
+    """``schema`` as parquet can store it: all-NULL columns become strings."""
+    return pa.schema(
+        [
+            field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+            for field in schema
+        ]
+    )
+
+
+def _widen(schema: pa.Schema, batch_schema: pa.Schema) -> pa.Schema:
+    """The schema of the result so far once ``batch_schema``'s batch is added.
+
+    NULL columns take the first real type they get and numbers widen (int to
+    float); types that do not unify keep ``schema``, and ``_conform_to_schema``
+    casts the batch to it or fails.
+    """
+    try:
+        return pa.unify_schemas([schema, batch_schema], promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return schema
+
+
+def _rewrite(writer: pq.ParquetWriter, path: str, schema: pa.Schema) -> pq.ParquetWriter:
+    """Close ``writer`` and copy the row groups it wrote to a new file with ``schema``,
+    one row group at a time. Returns the writer for the new file."""
+    writer.close()
+    previous_path = f"{path}.previous"
+    os.replace(path, previous_path)
+    new_writer = pq.ParquetWriter(path, schema, compression="zstd")
+    try:
+        previous = pq.ParquetFile(previous_path)
+        for index in range(previous.num_row_groups):
+            new_writer.write_table(_conform_to_schema(previous.read_row_group(index), schema))
+    except Exception:
+        new_writer.close()
+        raise
+    finally:
+        os.remove(previous_path)
+    return new_writer
+
+
+def write_arrow_batches_to_parquet(batches: Iterable[pa.RecordBatch], path: str) -> None:
+    """Stream record batches to parquet, one row group per batch.
+
+    Only the batch being written is held in memory, so peak memory is bounded
+    by the batch size rather than the result size. Sources that infer types
+    from row values can give a column a different type in each batch: one that
+    is all NULL in the first batch and integers in the next, or integers then
+    floats. The file's schema widens to cover each batch (``_widen``); when it
+    does, the row groups already written are copied into a file with the new
+    schema, once per change rather than per batch. A column that is NULL in
+    every batch is written as strings.
+
+    The file is written beside ``path`` and moved into place when complete,
+    so a query that fails part way leaves the previous parquet intact.
+
+    Args:
+        batches: record batches, typically from ``Source.iter_arrow_batches``.
+        path: absolute or relative path to the destination parquet file.
+    """
+    partial_path = f"{path}.partial"
+    writer = None
+    # The result's schema so far, with NULL for columns that have had no value
+    schema = None
+    try:
+        for batch in batches:
+            table = cast_decimals_to_float(pa.Table.from_batches([batch]))
+            if writer is None:
+                schema = table.schema
+                writer = pq.ParquetWriter(partial_path, _file_schema(schema), compression="zstd")
+            else:
+                widened = _widen(schema, table.schema)
+                if not widened.equals(schema):
+                    schema = widened
+                    writer = _rewrite(writer, partial_path, _file_schema(schema))
+            writer.write_table(_conform_to_schema(table, writer.schema))
+        if writer is None:
+            pq.write_table(pa.table({}), partial_path, compression="zstd")
+        else:
+            writer.close()
+            writer = None
+        os.replace(partial_path, path)
+    finally:
+        if writer is not None:
+            writer.close()
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
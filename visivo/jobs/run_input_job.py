@@ -20,7 +20,9 @@ import polars as pl
 from sqlglot import parse_one
 from sqlglot.optimizer import qualify
 
+from visivo.jobs.file_index import record_file
 from visivo.jobs.job import Job, JobResult, format_message_failure, format_message_success
+from visivo.jobs.parquet_io import write_arrow_to_parquet
 from visivo.jobs.utils import get_source_for_model
 from visivo.models.base.query_string import QueryString
 from visivo.models.inputs.types.single_select import SingleSelectInput
@@ -62,7 +64,9 @@ def _write_parquet_file(
     inputs_directory = f"{run_output_dir}/inputs"
     os.makedirs(inputs_directory, exist_ok=True)
     parquet_path = f"{inputs_directory}/{input_name}_{key}.parquet"
-    df.write_parquet(parquet_path)
+    # Options keep their query order, so the file is written unsorted
+    layout = write_arrow_to_parquet(df.to_arrow(), parquet_path)
+    record_file(run_output_dir, parquet_path, layout)
     return parquet_path
 
 
@@ -142,10 +146,7 @@ def _execute_query_for_options(
         pass
 
     # Execute query on source
-    data = source.read_sql(resolved_query)
-
-    # Convert to DataFrame
-    df = pl.DataFrame(data)
+    df = pl.from_arrow(source.read_arrow(resolved_query))
 
     # Validate not empty
     if df.shape[0] == 0:
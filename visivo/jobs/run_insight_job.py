@@ -16,7 +16,75 @@ import json
 import os
 
 
-def action(insight: Insight, dag: ProjectDag, output_dir, run_id=DEFAULT_RUN_ID):
+def _write_rollup(insight, model, post_query, run_output_dir, sort_by=()):
+    """Write ``insight``'s rollup of ``model`` and return the rewritten query and
+    its file entry, or ``None`` when the model is queried whole.
+
+    The rollup is the insight's own parquet, named and hashed like a static
+    insight's result, so it is served and shipped the same way.
+    """
+    import duckdb
+    import pyarrow.parquet as pq
+    from visivo.jobs.file_index import record_file
+    from visivo.jobs.parquet_io import write_arrow_to_parquet
+    from visivo.logger.logger import Logger
+    from visivo.models.sources.base_duckdb_source import _arrow_reader
+    from visivo.models.sources.arrow_utils import DEFAULT_ARROW_BATCH_ROWS
+    from visivo.query.insight.rollup import MAX_ROW_RATIO, plan_rollup
+
+    model_path = f"{run_output_dir}/models/{model.name}.parquet"
+    if not os.path.exists(model_path):
+        return None
+    plan = plan_rollup(post_query, model.name_hash(), insight.name_hash())
+    if plan is None:
+        Logger.instance().debug(
+            f"Insight {insight.name}: query is not decomposable, querying model {model.name}"
+        )
+        return None
+
+    conn = duckdb.connect(":memory:")
+    try:
+        escaped_path = model_path.replace("'", "''")
+        conn.execute(
+            f"CREATE VIEW \"{model.name_hash()}\" AS SELECT * FROM read_parquet('{escaped_path}')"
+        )
+        table = _arrow_reader(conn.execute(plan.rollup_sql), DEFAULT_ARROW_BATCH_ROWS).read_all()
+    except duckdb.Error as e:
+        Logger.instance().debug(f"Insight {insight.name}: rollup failed, querying model: {e}")
+        return None
+    finally:
+        conn.close()
+
+    model_rows = pq.ParquetFile(model_path).metadata.num_rows
+    if table.num_rows > model_rows * MAX_ROW_RATIO:
+        Logger.instance().debug(
+            f"Insight {insight.name}: rollup has {table.num_rows} of {model_rows} rows, "
+            f"querying model {model.name}"
+        )
+        return None
+
+    insights_directory = f"{run_output_dir}/insights"
+    os.makedirs(insights_directory, exist_ok=True)
+    parquet_path = f"{insights_directory}/{insight.name}.parquet"
+    layout = write_arrow_to_parquet(table, parquet_path, sort_by)
+    record_file(run_output_dir, parquet_path, layout)
+    return plan.query, {
+        "name_hash": insight.name_hash(),
+        "signed_data_file_url": parquet_path,
+        "layout": layout,
+        "rollup_of": model.name_hash(),
+    }
+
+
+def _model_sort_columns(dag, model):
+    if isinstance(dag, ProjectDag):
+        return dag.model_sort_columns().get(model.name, ())
+    return ()
+
+
+def action(
+    insight: Insight, dag: ProjectDag, output_dir, run_id=DEFAULT_RUN_ID, compilation_cache=None
+):
     """Execute insight job - tokenize insight and generate insight.json file
 
     Args:
@@ -24,6 +92,7 @@ def action(insight: Insight, dag: ProjectDag, output_dir, run_id=DEFAULT_RUN_ID)
         dag: Project DAG with dependencies
         output_dir: Output directory for files
         run_id: Run ID for this execution (default: "main" for standard runs)
+        compilation_cache: Optional CompilationCache shared by the run's insight jobs
     """
     # Organize files by run_id
     # Structure: {output_dir}/{run_id}/{models,insights}/ — parquet lives in
@@ -36,7 +105,9 @@ def action(insight: Insight, dag: ProjectDag, output_dir, run_id=DEFAULT_RUN_ID)
         model = all_descendants_of_type(type=Model, dag=dag, from_node=insight)[0]
         source = get_source_for_model(model, dag, run_output_dir)
 
-        insight_query_info = insight.get_query_info(dag, run_output_dir)
+        insight_query_info = insight.get_query_info(
+            dag, run_output_dir, compilation_cache=compilation_cache
+        )
 
         # Validate post_query with inputs if it has placeholders (Phase 3: SQLGlot validation)
         if insight_query_info.post_query:
@@ -70,32 +141,70 @@ def action(insight: Insight, dag: ProjectDag, output_dir, run_id=DEFAULT_RUN_ID)
         models_directory = f"{run_output_dir}/models"
         insights_directory = f"{run_output_dir}/insights"
 
+        post_query = insight_query_info.post_query
         if insight_query_info.pre_query:
-            from visivo.jobs.parquet_io import write_dicts_to_parquet
+            from visivo.jobs.file_index import record_file
+            from visivo.jobs.parquet_io import write_arrow_to_parquet
 
-            data = source.read_sql(insight_query_info.pre_query)
+            table = source.read_arrow(insight_query_info.pre_query)
             os.makedirs(insights_directory, exist_ok=True)
             # name_hash stays in the metadata as the DuckDB table identifier;
             # the file on disk uses the clean name for storage consistency.
             parquet_path = f"{insights_directory}/{insight.name}.parquet"
-            write_dicts_to_parquet(data, parquet_path)
-            files = [{"name_hash": insight.name_hash(), "signed_data_file_url": parquet_path}]
-        else:
-            models = insight.get_all_dependent_models(dag=dag)
+            # Not sorted: the pre_query's own row order is what the viewer shows
+            layout = write_arrow_to_parquet(table, parquet_path)
+            record_file(run_output_dir, parquet_path, layout)
             files = [
                 {
-                    "name_hash": model.name_hash(),
-                    "signed_data_file_url": f"{models_directory}/{model.name}.parquet",
+                    "name_hash": insight.name_hash(),
+                    "signed_data_file_url": parquet_path,
+                    "layout": layout,
                 }
-                for model in models
-                if os.path.exists(f"{models_directory}/{model.name}.parquet")
             ]
+        else:
+            from visivo.jobs.file_index import load_index
+
+            models = insight.get_all_dependent_models(dag=dag)
+            rollup = None
+            if insight.rollup and len(models) == 1:
+                (model,) = models
+                rollup = _write_rollup(
+                    insight,
+                    model,
+                    post_query,
+                    run_output_dir,
+                    sort_by=_model_sort_columns(dag, model),
+                )
+
+            if rollup is not None:
+                post_query, rollup_file = rollup
+                files = [rollup_file]
+            else:
+                # A dynamic insight only has a parquet of its own when it is a
+                # rollup; one left by an earlier run would be shipped unused
+                stale_rollup = f"{insights_directory}/{insight.name}.parquet"
+                if os.path.exists(stale_rollup):
+                    os.remove(stale_rollup)
+
+                # The layout each model's parquet was written with, so the viewer
+                # knows which columns its row groups are sorted (and prunable) by
+                file_index = load_index(run_output_dir)
+                files = []
+                for model in models:
+                    model_path = f"{models_directory}/{model.name}.parquet"
+                    if not os.path.exists(model_path):
+                        continue
+                    file = {"name_hash": model.name_hash(), "signed_data_file_url": model_path}
+                    layout = file_index.get(model.name_hash(), {}).get("layout")
+                    if layout:
+                        file["layout"] = layout
+                    files.append(file)
 
         # Store insight metadata with file references and post_query
         insight_data = {
             "name": insight.name,
             "files": files,
-            "query": insight_query_info.post_query,
+            "query": post_query,
             "props_mapping": insight_query_info.props_mapping,
             "static_props": insight_query_info.static_props,  # Non-query props (e.g., marker.color)
             # Per-prop slice suffix from authored ?{...}[N|a:b] forms; the
@@ -177,7 +286,7 @@ def _get_source(insight, dag, output_dir):
     return get_source_for_model(model, dag, output_dir)
 
 
-def job(dag, output_dir: str, insight: Insight, run_id: str = None):
+def job(dag, output_dir: str, insight: Insight, run_id: str = None, compilation_cache=None):
     """Create insight job for execution in the DAG runner
 
     Args:
@@ -185,6 +294,7 @@ def job(dag, output_dir: str, insight: Insight, run_id: str = None):
         output_dir: Output directory for files
         insight: Insight object to execute
         run_id: Optional run ID for preview runs (passed to action for custom file naming)
+        compilation_cache: Optional CompilationCache shared by the run's insight jobs
     """
     run_output_dir = f"{output_dir}/{run_id}" if run_id is not None else f"{output_dir}/main"
     source = _get_source(insight, dag, run_output_dir)
@@ -195,5 +305,7 @@ def job(dag, output_dir: str, insight: Insight, run_id: str = None):
     }
     if run_id is not None:
         kwargs["run_id"] = run_id
+    if compilation_cache is not None:
+        kwargs["compilation_cache"] = compilation_cache
 
     return Job(item=insight, source=source, action=action, **kwargs)
@@ -0,0 +1,224 @@
+"""Run manifest — what each job last built, so an unchanged job can be skipped.
+
+``visivo run`` used to re-execute every model, insight and input in the filter
+even when nothing it reads had changed. The manifest records, per job, a
+fingerprint of everything that determines its output and the action that
+produced it. On the next run a job is skipped when its fingerprint and action
+match and every file it wrote is still on disk.
+
+A fingerprint covers:
+
+* the item's own config (``model.sql``, insight props, input options, ...),
+  hashed whole through ``data_fingerprint`` — over-running is the safe
+  direction;
+* the fingerprints of everything it depends on, so a change anywhere upstream
+  (a source's connection, a model an insight reads) re-runs it;
+* the size and mtime of files a source reads (``database``/``file`` paths and
+  files named in seed args), so replacing a CSV or DuckDB file re-runs the
+  models on it.
+
+Data that changes inside a warehouse without any of the above changing is not
+visible here, so only jobs that read nothing but local files are skipped: every
+source they depend on must be a DuckDB, SQLite, CSV or Excel source, whose data
+is the files fingerprinted above. Jobs on Postgres, Snowflake, BigQuery and
+other server sources always run, as does anything on a MotherDuck database or
+a source with ``after_connect`` (which can attach files the fingerprint does
+not see). ``visivo run --full-refresh`` re-runs everything, for file edits
+that keep size and mtime.
+
+The manifest is kept per run id at ``{output_dir}/{run_id}/run_manifest.json``,
+beside the files it describes.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+from visivo.constants import DEFAULT_RUN_ID
+from visivo.models.inputs.input import Input
+from visivo.models.insight import Insight
+from visivo.models.models.sql_model import SqlModel
+from visivo.models.sources.csv_source import CSVFileSource
+from visivo.models.sources.duckdb_source import DuckdbSource
+from visivo.models.sources.excel_source import ExcelFileSource
+from visivo.models.sources.source import Source
+from visivo.models.sources.sqlite_source import SqliteSource
+from visivo.server.hash.data_fingerprint import data_fingerprint
+
+MANIFEST_FILE_NAME = "run_manifest.json"
+MANIFEST_VERSION = 1
+
+# Sources whose data lives in the local files the fingerprint covers
+FILE_SOURCE_TYPES = (DuckdbSource, SqliteSource, CSVFileSource, ExcelFileSource)
+
+
+class RunManifest:
+    def __init__(
+        self,
+        output_dir: str,
+        dag,
+        run_id: str = None,
+        working_dir: str = None,
+    ):
+        self.run_id = run_id or DEFAULT_RUN_ID
+        self.run_output_dir = f"{output_dir}/{self.run_id}"
+        self.path = f"{self.run_output_dir}/{MANIFEST_FILE_NAME}"
+        self.dag = dag
+        self.working_dir = working_dir
+        self.entries: Dict[str, dict] = self._load()
+        # Fingerprints are requested for every upstream node of every job, so
+        # each is computed once per run.
+        self._fingerprints = {}
+        self._tracks_data = {}
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.path) as fp:
+                manifest = json.load(fp)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        entries = manifest.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def save(self):
+        os.makedirs(self.run_output_dir, exist_ok=True)
+        partial_path = f"{self.path}.partial"
+        with open(partial_path, "w") as fp:
+            json.dump(
+                {"version": MANIFEST_VERSION, "entries": self.entries},
+                fp,
+                indent=2,
+                sort_keys=True,
+            )
+        os.replace(partial_path, self.path)
+
+    def fingerprint(self, node) -> str:
+        """Hash of the node's config, its dependencies' fingerprints and the
+        files its source reads."""
+        if node in self._fingerprints:
+            return self._fingerprints[node]
+        try:
+            config = node.model_dump(mode="json", exclude_none=True)
+        except Exception:
+            config = repr(node)
+        upstream = []
+        if node in self.dag:
+            upstream = sorted(
+                (type(dependency).__name__, getattr(dependency, "name", None) or "", fp)
+                for dependency in self.dag.successors(node)
+                for fp in [self.fingerprint(dependency)]
+            )
+        payload = {
+            "type": type(node).__name__,
+            "config": config,
+            "upstream": upstream,
+        }
+        if isinstance(node, Source):
+            payload["files"] = self._source_file_stats(node)
+        fingerprint = data_fingerprint("whole", payload)
+        self._fingerprints[node] = fingerprint
+        return fingerprint
+
+    def tracks_data(self, node) -> bool:
+        """Whether the fingerprint sees every change to the data ``node`` reads:
+        all sources it depends on keep their data in local files."""
+        if node in self._tracks_data:
+            return self._tracks_data[node]
+        if isinstance(node, Source):
+            database = str(getattr(node, "database", None) or "")
+            tracked = (
+                isinstance(node, FILE_SOURCE_TYPES)
+                and not getattr(node, "after_connect", None)
+                # MotherDuck databases live in the cloud, not in a local file
+                and not database.startswith(("md:", "motherduck:"))
+            )
+        else:
+            tracked = node not in self.dag or all(
+                self.tracks_data(dependency) for dependency in self.dag.successors(node)
+            )
+        self._tracks_data[node] = tracked
+        return tracked
+
+    def _source_file_stats(self, source: Source) -> List[list]:
+        candidates = [getattr(source, "database", None), getattr(source, "file", None)]
+        for attachment in getattr(source, "attach", None) or []:
+            candidates.append(getattr(getattr(attachment, "source", None), "database", None))
+        for seed in getattr(source, "seeds", None) or []:
+            candidates.extend(getattr(seed, "args", None) or [])
+        stats = []
+        for candidate in candidates:
+            path = self._existing_file(candidate)
+            if path is not None:
+                stat = os.stat(path)
+                stats.append([str(candidate), stat.st_size, stat.st_mtime_ns])
+        return stats
+
+    def _existing_file(self, value) -> Optional[str]:
+        if value is None:
+            return None
+        value = str(value)
+        if not value or "\n" in value:
+            return None
+        paths = [value]
+        if self.working_dir and not os.path.isabs(value):
+            paths.insert(0, os.path.join(self.working_dir, value))
+        for path in paths:
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def outputs(self, node, job) -> List[str]:
+        """Files a job for ``node`` writes; all must exist for it to be skipped."""
+        if isinstance(node, SqlModel):
+            outputs = [f"{self.run_output_dir}/schemas/{node.name}.json"]
+            if job.action.__name__ == "model_query_and_schema_action":
+                outputs.append(f"{self.run_output_dir}/models/{node.name}.parquet")
+            return outputs
+        if isinstance(node, Insight):
+            return self._with_referenced_files(f"{self.run_output_dir}/insights/{node.name}.json")
+        if isinstance(node, Input):
+            return self._with_referenced_files(f"{self.run_output_dir}/inputs/{node.name}.json")
+        return []
+
+    def _with_referenced_files(self, json_path: str) -> List[str]:
+        # Insight and input metadata point at the parquet they were built with.
+        try:
+            with open(json_path) as fp:
+                files = json.load(fp).get("files") or []
+        except (OSError, ValueError, AttributeError):
+            return [json_path]
+        return [json_path] + [f["signed_data_file_url"] for f in files if isinstance(f, dict)]
+
+    def _key(self, node) -> str:
+        return f"{type(node).__name__}:{node.name}"
+
+    def is_unchanged(self, node, job) -> bool:
+        """True when ``job`` would rebuild exactly what is already on disk."""
+        if not self.tracks_data(node):
+            return False
+        outputs = self.outputs(node, job)
+        if not outputs:
+            return False
+        entry = self.entries.get(self._key(node))
+        if not entry:
+            return False
+        if entry.get("fingerprint") != self.fingerprint(node):
+            return False
+        if entry.get("action") != job.action.__name__:
+            return False
+        return all(os.path.exists(path) for path in outputs)
+
+    def record(self, node, job):
+        """Remember a successful job's fingerprint."""
+        if not self.outputs(node, job):
+            return
+        self.entries[self._key(node)] = {
+            "fingerprint": self.fingerprint(node),
+            "action": job.action.__name__,
+        }
+
+    def forget(self, node):
+        """Drop a failed job's entry so the next run retries it."""
+        self.entries.pop(self._key(node), None)
@@ -9,10 +9,27 @@ Used by:
 
 import os
 from time import time
+from typing import Optional, Sequence
 
 from visivo.models.sources.source import Source
 from visivo.constants import DEFAULT_RUN_ID
-from visivo.jobs.parquet_io import write_dicts_to_parquet
+from visivo.jobs.file_index import record_file, save_index
+from visivo.query.result_cache import QueryResultCache, QueryRows, read_rows
+from visivo.jobs.parquet_io import (
+    write_arrow_batches_to_parquet,
+    write_arrow_to_parquet,
+    write_dicts_to_parquet,
+)
+
+
+def _model_parquet_path(output_dir: str, name: str, run_id: str) -> str:
+    # Parquet lives in the directory named for what produced it — models/,
+    # insights/, inputs/ — so the layout on disk says what each file IS. They
+    # all used to share files/, which meant nothing downstream could tell a
+    # model's data from a static insight's result without the dag (VIS-1128).
+    models_directory = f"{output_dir}/{run_id}/models"
+    os.makedirs(models_directory, exist_ok=True)
+    return f"{models_directory}/{name}.parquet"
 
 
 def write_parquet_from_data(
@@ -20,6 +37,7 @@ def write_parquet_from_data(
     output_dir: str,
     name: str,
     run_id: str = DEFAULT_RUN_ID,
+    sort_by: Sequence[str] = (),
 ) -> str:
     """Write row data to a parquet file.
 
@@ -28,18 +46,14 @@ def write_parquet_from_data(
         output_dir: Base output directory
         name: Clean model name (used as the parquet filename)
         run_id: Run ID for organizing output files
+        sort_by: Columns to sort the rows by, so the viewer can skip row groups
 
     Returns:
         Path to the written parquet file
     """
-    # Parquet lives in the directory named for what produced it — models/,
-    # insights/, inputs/ — so the layout on disk says what each file IS. They
-    # all used to share files/, which meant nothing downstream could tell a
-    # model's data from a static insight's result without the dag (VIS-1128).
-    models_directory = f"{output_dir}/{run_id}/models"
-    os.makedirs(models_directory, exist_ok=True)
-    parquet_path = f"{models_directory}/{name}.parquet"
-    write_dicts_to_parquet(data, parquet_path)
+    parquet_path = _model_parquet_path(output_dir, name, run_id)
+    layout = write_dicts_to_parquet(data, parquet_path, sort_by)
+    record_file(f"{output_dir}/{run_id}", parquet_path, layout)
     return parquet_path
 
 
@@ -49,6 +63,8 @@ def write_query_to_parquet(
     output_dir: str,
     name: str,
     run_id: str = DEFAULT_RUN_ID,
+    max_batch_rows: Optional[int] = None,
+    sort_by: Sequence[str] = (),
 ) -> str:
     """Execute SQL query and write results to parquet.
 
@@ -58,6 +74,10 @@ def write_query_to_parquet(
         output_dir: Base output directory
         name: Clean model name (used as the parquet filename)
         run_id: Run ID for organizing output files
+        max_batch_rows: When set, stream the result in batches of at most this
+            many rows, one parquet row group each, instead of reading it whole
+        sort_by: Columns to sort the rows by, so the viewer can skip row groups.
+            Not applied when streaming, which never holds the whole result
 
     Returns:
         Path to the written parquet file
@@ -65,8 +85,15 @@ def write_query_to_parquet(
     Raises:
         Exception if query execution or file writing fails
     """
-    data = source.read_sql(sql)
-    return write_parquet_from_data(data, output_dir, name, run_id)
+    parquet_path = _model_parquet_path(output_dir, name, run_id)
+    if max_batch_rows:
+        batches = source.iter_arrow_batches(sql, batch_rows=max_batch_rows)
+        write_arrow_batches_to_parquet(batches, parquet_path)
+        layout = None
+    else:
+        layout = write_arrow_to_parquet(source.read_arrow(sql), parquet_path, sort_by)
+    record_file(f"{output_dir}/{run_id}", parquet_path, layout)
+    return parquet_path
 
 
 def execute_and_get_result(
@@ -75,6 +102,9 @@ def execute_and_get_result(
     output_dir: str = None,
     name: str = None,
     run_id: str = DEFAULT_RUN_ID,
+    max_rows: Optional[int] = None,
+    result_cache: Optional[QueryResultCache] = None,
+    refresh: bool = False,
 ) -> dict:
     """Execute query and return result data directly.
 
@@ -87,26 +117,40 @@ def execute_and_get_result(
         output_dir: Base output directory (optional - if provided with name, writes parquet)
         name: Clean model name used as the parquet filename (optional)
         run_id: Run ID for organizing output files
+        max_rows: Most rows to return, pushed into the SQL where it can be.
+            Not applied when writing parquet
+        result_cache: Cache to answer the query from and store its result in.
+            Not used when writing parquet
+        refresh: Run the query even when ``result_cache`` holds its result,
+            and store the new one
 
     Returns:
-        Dict with columns, rows, row_count, execution_time_ms
+        Dict with columns, rows, row_count, execution_time_ms, is_truncated, cached
 
     Raises:
         Exception if query fails
     """
     start_time = time()
 
-    data = source.read_sql(sql)
+    writes_parquet = bool(output_dir and name)
+    if writes_parquet:
+        result = QueryRows(rows=source.read_sql(sql), is_truncated=False, cached=False)
+    else:
+        result = read_rows(source, sql, max_rows=max_rows, cache=result_cache, refresh=refresh)
+    data = result.rows
     execution_time_ms = int((time() - start_time) * 1000)
 
     columns = list(data[0].keys()) if data else []
 
-    if output_dir and name:
+    if writes_parquet:
         write_parquet_from_data(data, output_dir, name, run_id)
+        save_index()
 
     return {
         "columns": columns,
         "rows": data,
         "row_count": len(data),
         "execution_time_ms": execution_time_ms,
+        "is_truncated": result.is_truncated,
+        "cached": result.cached,
     }
@@ -14,8 +14,9 @@ from visivo.jobs.job import (
     start_message,
 )
 from visivo.query.schema_aggregator import SchemaAggregator
+from datetime import datetime
 from time import time
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 # A source whose account cannot reflect ANY table produces one warning per
 # table, so the full list can be as long as the schema. Enough to identify the
@@ -86,12 +87,65 @@ def run_seeds(source: Source, working_dir: str = None) -> int:
     return len(seeds)
 
 
+def _previous_schema(
+    source: Source, table_names: Optional[List[str]], output_dir: str, run_id: str
+) -> Optional[Dict[str, Any]]:
+    """The stored schema this run may build on, or ``None`` to introspect from scratch.
+
+    A schema stored with problems is never built on: the problem may have been
+    a transient permission or connection failure this run would not hit.
+    """
+    if table_names is not None or output_dir is None:
+        return None
+    stored = SchemaAggregator.load_source_schema(
+        source_name=source.name, output_dir=output_dir, run_id=run_id
+    )
+    if not stored or stored.get("source_type") != source.type:
+        return None
+    metadata = stored.get("metadata") or {}
+    if metadata.get("errors") or metadata.get("error"):
+        return None
+    return stored
+
+
+def _within_ttl(source: Source, stored: Dict[str, Any], seed_count: int) -> bool:
+    # Seeds may have just rewritten tables, so a seeded source is never skipped.
+    if not source.schema_cache_ttl or seed_count:
+        return False
+    try:
+        generated_at = datetime.fromisoformat(stored["generated_at"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return (datetime.now() - generated_at).total_seconds() < source.schema_cache_ttl
+
+
+def _reused_schema_result(
+    source: Source, stored: Dict[str, Any], seed_count: int, start_time: float, reason: str
+) -> JobResult:
+    metadata = stored.get("metadata", {})
+    seed_details = f"{seed_count} seeds, " if seed_count else ""
+    return JobResult(
+        item=source,
+        success=True,
+        message=format_message_success(
+            details=(
+                f"Reused schema for source \033[4m{source.name}\033[0m "
+                f"({seed_details}{metadata.get('total_tables', 0)} tables, "
+                f"{metadata.get('total_columns', 0)} columns, {reason})"
+            ),
+            start_time=start_time,
+            full_path=None,
+        ),
+    )
+
+
 def action(
     source_to_build: Source,
     table_names: Optional[List[str]] = None,
     output_dir: str = None,
     run_id: str = DEFAULT_RUN_ID,
     working_dir: str = None,
+    threads: int = 1,
 ):
     """
     Load the source's seeds, then build its schema and store it using SchemaAggregator.
@@ -102,6 +156,7 @@ def action(
         output_dir: Directory to store schema data
         run_id: Run identifier for schema storage location
         working_dir: Directory seed commands are run from
+        threads: Most introspection queries to run at once against the source
 
     Returns:
         JobResult indicating success or failure
@@ -114,8 +169,63 @@ def action(
         # Seeds must land before introspection so their tables appear in the schema
         seed_count = run_seeds(source_to_build, working_dir=working_dir)
 
-        # Build schema using source's get_schema method
-        schema_data = source_to_build.get_schema(table_names=table_names)
+        # Introspection is the slowest step of a run on a large warehouse, so
+        # skip or narrow it when the stored schema shows nothing has changed.
+        stored = _previous_schema(source_to_build, table_names, output_dir, run_id)
+        if stored is not None and _within_ttl(source_to_build, stored, seed_count):
+            return _reused_schema_result(
+                source_to_build, stored, seed_count, start_time, "within schema_cache_ttl"
+            )
+
+        source_fingerprint = table_fingerprints = None
+        if table_names is None:
+            source_fingerprint = source_to_build.schema_fingerprint()
+            table_fingerprints = source_to_build.table_fingerprints()
+        previous = (stored or {}).get("metadata", {})
+        if stored is not None and (
+            (
+                source_fingerprint is not None
+                and previous.get("source_fingerprint") == source_fingerprint
+            )
+            or (
+                table_fingerprints is not None
+                and previous.get("table_fingerprints") == table_fingerprints
+            )
+        ):
+            return _reused_schema_result(
+                source_to_build, stored, seed_count, start_time, "unchanged since last run"
+            )
+
+        retained = None
+        stored_table_fingerprints = previous.get("table_fingerprints")
+        if stored is not None and table_fingerprints is not None and stored_table_fingerprints:
+            # Describe only new or altered tables; keep the rest from the stored
+            # schema and drop tables that no longer exist.
+            changed = [
+                name
+                for name, fingerprint in table_fingerprints.items()
+                if stored_table_fingerprints.get(name) != fingerprint
+            ]
+            retained = SchemaAggregator.retain_tables(
+                stored, set(table_fingerprints) - set(changed)
+            )
+            Logger.instance().debug(
+                f"Source {source_to_build.name}: describing {len(changed)} changed of "
+                f"{len(table_fingerprints)} tables"
+            )
+            if changed:
+                schema_data = source_to_build.get_schema(table_names=changed, max_workers=threads)
+            else:
+                schema_data = {"tables": {}, "metadata": {}}
+        else:
+            # Build schema using source's get_schema method
+            schema_data = source_to_build.get_schema(table_names=table_names, max_workers=threads)
+
+        fingerprints = schema_data.setdefault("metadata", {})
+        if source_fingerprint is not None:
+            fingerprints["source_fingerprint"] = source_fingerprint
+        if table_fingerprints is not None:
+            fingerprints["table_fingerprints"] = table_fingerprints
 
         # Check if schema building was successful
         if "error" in schema_data.get("metadata", {}):
@@ -128,18 +238,22 @@ def action(
             )
             return JobResult(item=source_to_build, success=False, message=failure_message)
 
-        SchemaAggregator.aggregate_source_schema(
+        stored_schema = SchemaAggregator.aggregate_source_schema(
             source_name=source_to_build.name,
             source_type=source_to_build.type,
             schema_data=schema_data,
             output_dir=output_dir,
             run_id=run_id,
+            retained=retained,
         )
 
         # Create success message with schema statistics
         metadata = schema_data.get("metadata", {})
         total_tables = metadata.get("total_tables", 0)
         total_columns = metadata.get("total_columns", 0)
+        if retained is not None:
+            total_tables = stored_schema["metadata"]["total_tables"]
+            total_columns = stored_schema["metadata"]["total_columns"]
 
         seed_details = f"{seed_count} seeds, " if seed_count else ""
         details = (
@@ -242,6 +356,7 @@ def job(
     output_dir: str = None,
     run_id: str = None,
     working_dir: str = None,
+    threads: int = None,
 ):
     """
     Create a Job instance for seeding a source and building its schema.
@@ -252,6 +367,8 @@ def job(
         output_dir: Directory to store schema data
         run_id: Run identifier for schema storage location
         working_dir: Directory seed commands are run from
+        threads: Most introspection queries to run at once; the DagRunner gives
+            each source its share of the run's threads
 
     Returns:
         Job instance configured for seeding and schema building
@@ -268,4 +385,6 @@ def job(
         kwargs["run_id"] = run_id
     if working_dir is not None:
         kwargs["working_dir"] = working_dir
+    if threads is not None:
+        kwargs["threads"] = threads
     return Job(**kwargs)
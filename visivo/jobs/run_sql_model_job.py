@@ -1,7 +1,7 @@
 import os
 import json
 from time import time
-from typing import Optional
+from typing import Optional, Sequence
 from sqlglot import exp
 
 from visivo.jobs.job import (
@@ -76,17 +76,17 @@ def _build_and_write_schema(
             # If table extraction failed (e.g., due to Jinja templates), fall back to full schema
             # This is slower but ensures column resolution works
             if tables:
-                schema = provider.get_filtered_schema(tables, schema_refs)
                 Logger.instance().debug(
-                    f"Using filtered schema with {len(schema)} entries, "
+                    f"Using filtered schema for {len(tables)} table(s), "
                     f"default: {provider.default_schema}"
                 )
             else:
-                schema = provider.get_full_schema()
                 Logger.instance().debug(
                     f"Table extraction failed, using full schema with "
                     f"{provider.table_count} tables, default: {provider.default_schema}"
                 )
+            schema = provider.get_mapping_schema(tables, schema_refs)
+            schema_key = provider.mapping_schema_key(tables, schema_refs)
 
             default_schema = provider.default_schema
 
@@ -96,6 +96,7 @@ def _build_and_write_schema(
                 schema=schema,
                 model_hash=model_hash,
                 default_schema=default_schema,
+                schema_fingerprint=f"{provider.fingerprint}:{schema_key}",
             )
         else:
             # No cached provider, fall back to empty schema
@@ -163,6 +164,8 @@ def model_query_and_schema_action(
     output_dir,
     run_id=DEFAULT_RUN_ID,
     schema_cache: Optional[SourceSchemaCache] = None,
+    max_batch_rows: Optional[int] = None,
+    sort_by: Sequence[str] = (),
 ):
     """Execute the SQL model query and save result to parquet file.
 
@@ -172,6 +175,8 @@ def model_query_and_schema_action(
         output_dir: Directory to save output files
         run_id: Run ID for organizing output files
         schema_cache: Optional cache for schema providers (performance optimization)
+        max_batch_rows: Optional row ceiling per batch; streams the result to parquet
+        sort_by: Columns dynamic insights split on or filter by, to sort the parquet by
 
     Returns:
         JobResult indicating success or failure
@@ -189,6 +194,8 @@ def model_query_and_schema_action(
             output_dir=output_dir,
             name=sql_model.name,
             run_id=run_id,
+            max_batch_rows=max_batch_rows,
+            sort_by=sort_by,
         )
 
         success_message = format_message_success(
@@ -255,12 +262,26 @@ def schema_only_action(
         return JobResult(item=sql_model, success=False, message=failure_message)
 
 
+def _needs_data(sql_model, dag) -> bool:
+    for insight in all_descendants_of_type(type=Insight, dag=dag):
+        if insight.is_dynamic(dag) and sql_model in insight.get_all_dependent_models(dag):
+            return True
+
+    from visivo.models.table import Table
+
+    for table in all_descendants_of_type(type=Table, dag=dag):
+        if sql_model in all_descendants_of_type(type=Model, dag=dag, from_node=table):
+            return True
+    return False
+
+
 def job(
     dag,
     output_dir: str,
     sql_model: SqlModel,
     run_id: str = None,
     schema_cache: Optional[SourceSchemaCache] = None,
+    max_batch_rows: Optional[int] = None,
 ):
     """Create a Job for the SQL model if it's referenced by a dynamic insight.
 
@@ -270,13 +291,11 @@ def job(
         sql_model: The SqlModel to potentially create a job for
         run_id: Optional run ID for organizing output files
         schema_cache: Optional cache for schema providers (performance optimization)
+        max_batch_rows: Optional row ceiling per batch when writing model data
 
     Returns:
         Job object with appropriate action (parquet + schema or schema-only)
     """
-    # Find all insights in the project
-    insights = all_descendants_of_type(type=Insight, dag=dag)
-
     # Get source for the model
     source = get_source_for_model(sql_model, dag, output_dir)
 
@@ -294,24 +313,16 @@ def job(
     # Check if this model needs data (parquet) output:
     # 1. Referenced by a dynamic insight, or
     # 2. Referenced directly by a table (via 'data' or columns/rows/values)
-    needs_data = False
-
-    for insight in insights:
-        if insight.is_dynamic(dag) and sql_model in insight.get_all_dependent_models(dag):
-            needs_data = True
-            break
-
-    if not needs_data:
-        from visivo.models.table import Table
-
-        tables = all_descendants_of_type(type=Table, dag=dag)
-        for table in tables:
-            table_models = all_descendants_of_type(type=Model, dag=dag, from_node=table)
-            if sql_model in table_models:
-                needs_data = True
-                break
+    if isinstance(dag, ProjectDag):
+        needs_data = sql_model in dag.models_needing_data()
+    else:
+        needs_data = _needs_data(sql_model, dag)
 
     if needs_data:
+        if max_batch_rows is not None:
+            kwargs["max_batch_rows"] = max_batch_rows
+        if isinstance(dag, ProjectDag) and dag.model_sort_columns().get(sql_model.name):
+            kwargs["sort_by"] = dag.model_sort_columns()[sql_model.name]
         return Job(item=sql_model, source=source, action=model_query_and_schema_action, **kwargs)
 
     # Not referenced by any dynamic insight or table, run the schema-only action
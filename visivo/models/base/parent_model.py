@@ -50,6 +50,14 @@ class ParentModel(ABC):
         )
         return dag
 
+    def link_child(self, dag: ProjectDag, item):
+        """Add ``item`` to ``dag`` under this root, with its inline children,
+        and resolve its references against the nodes already in ``dag``."""
+        self.__build_dag(items=[item], parent_item=self, dag=dag, node_permit_list=None, root=self)
+        self.__dereference_items(
+            items=[item], parent_item=self, dag=dag, node_permit_list=None, root=self
+        )
+
     def __build_dag(self, items: List, parent_item, dag, node_permit_list, root):
         for item in items:
             if node_permit_list is None or item in node_permit_list:
@@ -144,7 +152,9 @@ class ParentModel(ABC):
 
     def __get_dereferenced_item_by_name(self, name, dag, root, item, parent_item):
         try:
-            return dag.get_descendant_by_name(name, from_node=root)
+            # Every node was added under root, so the name index answers this
+            # without walking the graph again after each linked reference
+            return dag.get_descendant_by_name(name)
         except ValueError as e:
             # If multiple items found, get them to provide detailed error
             if "Multiple nodes found" in str(e):
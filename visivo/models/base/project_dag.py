@@ -1,18 +1,246 @@
-from networkx import DiGraph, simple_cycles, is_directed_acyclic_graph
-import json
+from networkx import DiGraph, simple_cycles, is_directed_acyclic_graph, dfs_preorder_nodes
+import functools
+import hashlib
 from visivo.models.dag import all_descendants_with_name, parse_filter_str
-from typing import List, Optional
+from typing import List, NamedTuple, Optional, Set
+
+
+def _invalidating(method):
+    """Wrap a DiGraph method that changes the graph so it drops the lookup index."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._reset_index()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class DagDiff(NamedTuple):
+    """What changed between a served project and its recompiled replacement."""
+
+    # Names of the named nodes that are new or whose config changed
+    changed: List[str]
+    # The changed nodes and everything that depends on them: what ``dag_filter`` selects
+    nodes: Set
+
+    @property
+    def dag_filter(self) -> str:
+        return ",".join(f"{name}+" for name in self.changed)
 
 
 class ProjectDag(DiGraph):
     """
     Custom implementation of a DiGraph that adds additional methods for validation & data extraction.
     Supports both object-level and field-level lineage tracking.
+
+    Lookups by type, name and descendant set are memoized, since job planning
+    asks them once per model, insight and table; a project with hundreds of
+    each otherwise walks the whole graph hundreds of thousands of times.
     """
 
     def __init__(self, *args, **kwargs):
+        self._reset_index()
         super().__init__(*args, **kwargs)
         self._named_nodes_subgraph = None
+        self._content_hashes = {}
+
+    # Every DiGraph method that changes the graph invalidates the lookup index
+    add_node = _invalidating(DiGraph.add_node)
+    add_nodes_from = _invalidating(DiGraph.add_nodes_from)
+    remove_node = _invalidating(DiGraph.remove_node)
+    remove_nodes_from = _invalidating(DiGraph.remove_nodes_from)
+    add_edges_from = _invalidating(DiGraph.add_edges_from)
+    add_weighted_edges_from = _invalidating(DiGraph.add_weighted_edges_from)
+    remove_edge = _invalidating(DiGraph.remove_edge)
+    remove_edges_from = _invalidating(DiGraph.remove_edges_from)
+    update = _invalidating(DiGraph.update)
+    clear = _invalidating(DiGraph.clear)
+    clear_edges = _invalidating(DiGraph.clear_edges)
+
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        # Linking a reference adds an edge between two nodes already in the graph,
+        # once per reference; the name index stays valid for those
+        if u_of_edge in self._node and v_of_edge in self._node:
+            self._reset_edge_index()
+        else:
+            self._reset_index()
+        return super().add_edge(u_of_edge, v_of_edge, **attr)
+
+    def _reset_index(self):
+        self._nodes_by_name = None
+        self._reset_edge_index()
+
+    def _reset_edge_index(self):
+        self._ordered_descendants = {}
+        self._descendants_of_type = {}
+        self._models_needing_data = None
+        self._model_sort_columns = None
+
+    def ordered_descendants(self, from_node=None) -> tuple:
+        """``from_node`` and everything it depends on, in depth-first preorder.
+
+        Without ``from_node``, every node in the graph. Memoized per node.
+        """
+        if from_node not in self._ordered_descendants:
+            if from_node is None:
+                nodes = tuple(set(self.nodes()))
+            else:
+                nodes = tuple(dfs_preorder_nodes(self, from_node))
+            self._ordered_descendants[from_node] = nodes
+        return self._ordered_descendants[from_node]
+
+    def descendants_of_type(self, type, from_node=None) -> tuple:
+        """The nodes ``ordered_descendants`` returns that are instances of ``type``."""
+        key = (type, from_node)
+        if key not in self._descendants_of_type:
+            self._descendants_of_type[key] = tuple(
+                node for node in self.ordered_descendants(from_node) if isinstance(node, type)
+            )
+        return self._descendants_of_type[key]
+
+    def nodes_with_name(self, name) -> tuple:
+        """Every node named ``name``, from a name index built once."""
+        if self._nodes_by_name is None:
+            nodes_by_name = {}
+            for node in self.nodes():
+                node_name = getattr(node, "name", None)
+                if node_name is not None:
+                    nodes_by_name.setdefault(node_name, []).append(node)
+            self._nodes_by_name = {key: tuple(nodes) for key, nodes in nodes_by_name.items()}
+        return self._nodes_by_name.get(name, ())
+
+    def models_needing_data(self) -> set:
+        """Models whose query results must be written, not just their schema.
+
+        Those a dynamic insight queries at view time, and those a table reads
+        directly. Computed for the whole project once rather than per model.
+        """
+        if self._models_needing_data is None:
+            from visivo.models.insight import Insight
+            from visivo.models.models.model import Model
+            from visivo.models.table import Table
+
+            models = set()
+            for insight in self.descendants_of_type(Insight):
+                if insight.is_dynamic(self):
+                    models.update(insight.get_all_dependent_models(self))
+            for table in self.descendants_of_type(Table):
+                models.update(self.descendants_of_type(Model, from_node=table))
+            self._models_needing_data = models
+        return self._models_needing_data
+
+    def model_sort_columns(self) -> dict:
+        """Per model name, the fields its parquet should be sorted by, in order.
+
+        The viewer groups and filters a model's rows by the fields dynamic
+        insights split on or filter by an input, so sorting by them lets it
+        skip row groups. Sorting must not change what a chart draws, though:
+
+        - a model a table reads is not sorted, since the table shows its rows
+          in the order the model's SQL gives them;
+        - an insight that orders its own rows (``Insight.orders_own_rows``)
+          takes any order, so its filter fields are sort candidates too;
+        - an insight that does not only takes a sort by fields it splits on:
+          the sort is stable, so each series keeps its rows in model order.
+        """
+        if self._model_sort_columns is None:
+            from visivo.models.insight import Insight
+            from visivo.models.models.model import Model
+            from visivo.models.table import Table
+
+            read_by_tables = {
+                model.name
+                for table in self.descendants_of_type(Table)
+                for model in self.descendants_of_type(Model, from_node=table)
+            }
+            candidates, allowed = {}, {}
+            for insight in self.descendants_of_type(Insight):
+                if not insight.is_dynamic(self):
+                    continue
+                orders_own_rows = insight.orders_own_rows(self)
+                for model_name, field in insight.get_layout_columns(
+                    self, include_filters=orders_own_rows
+                ):
+                    model_columns = candidates.setdefault(model_name, [])
+                    if field not in model_columns:
+                        model_columns.append(field)
+                if orders_own_rows:
+                    continue
+                splits = {}
+                for model_name, field in insight.get_layout_columns(self, include_filters=False):
+                    splits.setdefault(model_name, set()).add(field)
+                for model in insight.get_all_dependent_models(self):
+                    fields = splits.get(model.name, set())
+                    allowed[model.name] = allowed.get(model.name, fields) & fields
+
+            columns = {}
+            for model_name, fields in candidates.items():
+                if model_name in read_by_tables:
+                    continue
+                if model_name in allowed:
+                    fields = [field for field in fields if field in allowed[model_name]]
+                if fields:
+                    columns[model_name] = fields
+            self._model_sort_columns = columns
+        return self._model_sort_columns
+
+    def stamp_content_hashes(self):
+        """Hash every named node's config once, for ``diff`` to compare against.
+
+        Called when the project is parsed; a node changed after that must be
+        re-stamped, since ``diff`` trusts the stamp over the node.
+        """
+        self._content_hashes = {
+            node: _hash_config(node)
+            for node in self.nodes()
+            if getattr(node, "name", None) is not None
+        }
+
+    def content_hash(self, node) -> str:
+        """The hash of ``node``'s config stamped at parse time, or computed now."""
+        content_hash = self._content_hashes.get(node)
+        if content_hash is None:
+            content_hash = _hash_config(node)
+        return content_hash
+
+    def patched(self, root, replacements) -> "ProjectDag":
+        """A copy of this DAG for ``root``, a copy of this DAG's project with
+        the ``(old, new)`` objects in ``replacements`` swapped in.
+
+        Only the replaced objects are linked again: ``old`` and the inline
+        objects only it held are removed, ``new`` is added under ``root`` with
+        its references resolved, and whatever referenced ``old`` now references
+        ``new``. ``old`` is ``None`` for an object the project did not have.
+        """
+        dag = self.copy()
+        old_root = self.get_project()
+        if old_root is not None and old_root is not root:
+            children = list(dag.successors(old_root))
+            dag.remove_node(old_root)
+            dag.add_node(root)
+            dag.add_edges_from((root, child) for child in children)
+
+        for old, new in replacements:
+            referrers = []
+            if old is not None and old in dag:
+                referrers = [node for node in dag.predecessors(old) if node is not root]
+                dag._remove_owned(old)
+            root.link_child(dag, new)
+            for referrer in referrers:
+                if referrer in dag:
+                    dag.add_edge(referrer, new)
+        return dag
+
+    def _remove_owned(self, node):
+        """Remove ``node`` and the descendants nothing else points to."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current not in self or (current is not node and self.in_degree(current) > 0):
+                continue
+            stack.extend(self.successors(current))
+            self.remove_node(current)
 
     def get_named_nodes_subgraph(self):
         """Creates the named nodes subgraph if it doesn't exist"""
@@ -60,10 +288,9 @@ class ProjectDag(DiGraph):
         raise ValueError(f"Item with path {path} not found.")
 
     def get_node_by_name(self, name):
-        for node in self.nodes():
-            if hasattr(node, "name"):
-                if node.name == name:
-                    return node
+        nodes = self.nodes_with_name(name)
+        if nodes:
+            return nodes[0]
         raise ValueError(f"Item with name {name} not found.")
 
     def get_descendant_by_name(self, name, from_node=None):
@@ -134,6 +361,7 @@ class ProjectDag(DiGraph):
         for node in self.nodes():
             if hasattr(node, "name") and node.name is not None:
                 named_nodes.append(node)
+        named_node_set = set(named_nodes)
 
         # Create new DAG
         named_dag = ProjectDag()
@@ -144,10 +372,10 @@ class ProjectDag(DiGraph):
             stack = [(source, child) for child in self.successors(source)]
             while stack:
                 current_parent, current = stack.pop()
-                if current in named_nodes and current != source:
+                if current in named_node_set and current != source:
                     # Found a named node, add edge from source to this node
                     named_dag.add_edge(source, current)
-                elif current not in named_nodes:
+                elif current not in named_node_set:
                     # If unnamed node, continue searching its children
                     for child in self.successors(current):
                         stack.append((current_parent, child))
@@ -256,33 +484,56 @@ class ProjectDag(DiGraph):
                 break
         return combined_dags
 
-    def get_diff_dag_filter(self, existing_project, existing_dag_filter):
+    def diff(self, existing_project, existing_dag_filter) -> DagDiff:
         """
         Compares this project DAG with the existing project's DAG filtered by the existing filter.
-        It identifies nodes that have changed or are new and returns a filter string that includes these nodes.
+
+        Nodes are matched by name and compared by ``content_hash``, so a reload
+        with mostly unchanged nodes only hashes what was not stamped at parse time.
 
         Parameters:
         - existing_project (Project): The existing project to compare with.
         - existing_dag_filter (str): The filter string used to filter the existing project's DAG.
 
         Returns:
-        - str: A comma-separated filter string that selects all nodes that are dependent on the changed nodes.
+        - DagDiff: The names of the changed or new nodes, and those nodes with their dependents.
         """
-        existing_dags = (
-            existing_project.dag().get_named_nodes_subgraph().filter_dag(existing_dag_filter)
-        )
-        existing_nodes = [node for dag in existing_dags for node in dag.nodes()]
-        new_dags = self.get_named_nodes_subgraph().filter_dag(existing_dag_filter)
-        new_nodes = [node for dag in new_dags for node in dag.nodes()]
-        changed_dag_filter = []
-        for new_node in new_nodes:
-            existing_node = next((n for n in existing_nodes if n.name == new_node.name), None)
-            if existing_node:
-                if json.dumps(existing_node.model_dump_json(), sort_keys=True) != json.dumps(
-                    new_node.model_dump_json(), sort_keys=True
-                ):
-                    changed_dag_filter.append(f"{new_node.name}+")
-            else:
-                changed_dag_filter.append(f"{new_node.name}+")
+        existing_dag = existing_project.dag()
+        existing_hashes = {
+            node.name: existing_dag.content_hash(node)
+            for dag in existing_dag.get_named_nodes_subgraph().filter_dag(existing_dag_filter)
+            for node in dag.nodes()
+        }
+        changed = []
+        changed_nodes = []
+        for dag in self.get_named_nodes_subgraph().filter_dag(existing_dag_filter):
+            for node in dag.nodes():
+                existing_hash = existing_hashes.get(node.name)
+                if existing_hash is None or existing_hash != self.content_hash(node):
+                    changed.append(node.name)
+                    changed_nodes.append(node)
+        return DagDiff(changed=changed, nodes=self._closure(changed_nodes))
+
+    def _closure(self, nodes) -> set:
+        """``nodes`` and every node that depends on them, short of the project root."""
+        project = self.get_project()
+        seen = set()
+        stack = [node for node in nodes if node in self]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.extend(parent for parent in self.predecessors(node) if parent is not project)
+        return seen
+
+    def get_diff_dag_filter(self, existing_project, existing_dag_filter):
+        """
+        Returns a comma-separated filter string that selects all nodes that are
+        dependent on the nodes ``diff`` finds changed or new.
+        """
+        return self.diff(existing_project, existing_dag_filter).dag_filter
+
 
-        return ",".join(changed_dag_filter)
+def _hash_config(node) -> str:
+    return hashlib.sha256(node.model_dump_json().encode()).hexdigest()
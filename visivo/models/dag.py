@@ -34,6 +34,9 @@ def all_descendants(dag, from_node=None, depth=None):
     if not from_node:
         return set(dag.nodes())
 
+    if not depth and hasattr(dag, "ordered_descendants"):
+        return set(dag.ordered_descendants(from_node))
+
     if not depth:
         descendants_list = list(descendants(dag, from_node))
         descendants_list.append(from_node)
@@ -47,6 +50,11 @@ def all_descendants_of_type(type, dag, from_node=None, depth=None):
     if not depth:
         depth = len(dag)
 
+    # A depth limit as long as the graph reaches every descendant, so the
+    # ProjectDag's memoized lookup gives the same nodes in the same order.
+    if depth >= len(dag) and hasattr(dag, "descendants_of_type"):
+        return list(dag.descendants_of_type(type, from_node or None))
+
     def find_type(item):
         return isinstance(item, type)
 
@@ -62,6 +70,11 @@ def all_descendants_with_name(name: str, dag, from_node=None):
     def find_name(item):
         return hasattr(item, "name") and item.name == name
 
+    if hasattr(dag, "nodes_with_name"):
+        if not from_node:
+            return list(dag.nodes_with_name(name))
+        return list(filter(find_name, dag.ordered_descendants(from_node)))
+
     return list(filter(find_name, all_descendants(dag=dag, from_node=from_node)))
 
 
@@ -57,6 +57,13 @@ class Defaults(BaseModel):
         8,
         description="The number of threads to use when running queries.",
     )
+    max_batch_rows: Optional[int] = Field(
+        None,
+        gt=0,
+        description="When set, model query results are streamed to parquet in batches of at most "
+        "this many rows instead of being held in memory whole, bounding the memory each model "
+        "job uses. Leave unset to read each result in one piece.",
+    )
     levels: List[Level] = Field(
         default_factory=list,
         description="Enables you to customize the project level view of your dashboards. Ordered list of dashboard levels with titles and descriptions",
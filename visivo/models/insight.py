@@ -83,6 +83,14 @@ class Insight(NamedModel, ParentModel):
         description="Leverage Inputs to create client-side interactions that will be applied to the insight data.",
     )
 
+    rollup: Optional[bool] = Field(
+        False,
+        description="For an insight that uses inputs, pre-aggregate its model into a smaller parquet "
+        "grouped by the columns its query groups and filters on, and query that in the viewer "
+        "instead of the whole model. Only used when every aggregate is a SUM, COUNT, MIN or MAX "
+        "of a column over a single model; otherwise the model is queried as before.",
+    )
+
     def child_items(self):
         """Return child items for DAG construction.
 
@@ -250,6 +258,44 @@ class Insight(NamedModel, ParentModel):
             return {}
         return self.props.extract_query_slices()
 
+    def get_layout_columns(self, dag, include_filters: bool = True) -> List[tuple]:
+        """Return ``(model name, field)`` pairs this insight splits on or
+        filters by an input, split fields first. The viewer groups and filters
+        a model's rows by these, so model parquet is written sorted by them."""
+        from visivo.query.patterns import INPUT_FRONTEND_PATTERN_COMPILED, extract_ref_components
+
+        splits, filters = [], []
+        for key, statement in self.get_all_query_statements(dag):
+            if key == "split":
+                target = splits
+            elif key == "filter" and INPUT_FRONTEND_PATTERN_COMPILED.search(statement):
+                target = filters
+            else:
+                continue
+            for model_name, field in extract_ref_components(statement):
+                if field and (model_name, field) not in target:
+                    target.append((model_name, field))
+        if not include_filters:
+            return splits
+        return splits + [pair for pair in filters if pair not in splits]
+
+    def orders_own_rows(self, dag) -> bool:
+        """Whether this insight's query sets its own row order: it has a sort
+        interaction, or aggregates (and so groups) in its props or filters.
+        Otherwise its chart draws the model's rows in the order stored."""
+        import re
+
+        from visivo.query.sqlglot_utils import has_aggregate_function, parse_expression
+
+        for key, statement in self.get_all_query_statements(dag):
+            if key == "sort":
+                return True
+            # Refs and input placeholders stand for single values here
+            expression = parse_expression(re.sub(r"\$\{[^}]*\}", "x", statement), "duckdb")
+            if expression is not None and has_aggregate_function(expression):
+                return True
+        return False
+
     def is_dynamic(self, dag) -> bool:
         from visivo.models.dag import all_descendants_of_type
         from visivo.models.inputs.input import Input
@@ -258,7 +304,12 @@ class Insight(NamedModel, ParentModel):
         return len(input_descendants) > 0
 
     def get_query_info(
-        self, dag: ProjectDag, output_dir, schema_overrides=None, force_dynamic=False
+        self,
+        dag: ProjectDag,
+        output_dir,
+        schema_overrides=None,
+        force_dynamic=False,
+        compilation_cache=None,
     ) -> InsightQueryInfo:
         """Resolve this insight's props/interactions into query text.
 
@@ -277,9 +328,17 @@ class Insight(NamedModel, ParentModel):
                 an Input (the Explore 2.0 compile-draft endpoint's need —
                 see `InsightQueryBuilder`'s docstring for why). ``False``
                 (every real run-pipeline caller) is unaffected.
+            compilation_cache: Optional run-scoped ``CompilationCache`` that
+                shares schemas, resolved refs, relation graphs and model SQL
+                ASTs with the other insights compiled in the same run.
         """
         builder = InsightQueryBuilder(
-            self, dag, output_dir, schema_overrides=schema_overrides, force_dynamic=force_dynamic
+            self,
+            dag,
+            output_dir,
+            schema_overrides=schema_overrides,
+            force_dynamic=force_dynamic,
+            compilation_cache=compilation_cache,
         )
         builder.resolve()
         return builder.build()
@@ -0,0 +1,116 @@
+"""Helpers for turning DBAPI row tuples into Arrow record batches.
+
+Sources whose drivers hand back Python tuples (SQLAlchemy dialects, the
+Redshift connector) use these to build Arrow data a ``fetchmany`` batch at a
+time, so a query result never exists as one Python ``dict`` per row. DuckDB
+based sources skip this entirely — DuckDB produces Arrow natively.
+
+pyarrow is imported where it is used, so loading a project that names these
+sources does not pay for it.
+"""
+
+import json
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Sequence
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Rows pulled per ``fetchmany`` call. Large enough that per-batch overhead is
+# noise, small enough that one batch of Python tuples stays a few MB.
+DEFAULT_ARROW_BATCH_ROWS = 10_000
+
+
+def _normalize_value(value):
+    # Complex values are stored as JSON strings, matching ``read_sql``.
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def _column_to_array(values: list) -> "pa.Array":
+    """Build one Arrow array, falling back to strings for mixed-type columns."""
+    import pyarrow as pa
+
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+
+def rows_to_record_batch(columns: Sequence[str], rows: Sequence[Sequence]) -> "pa.RecordBatch":
+    """Convert one batch of DBAPI row tuples into an Arrow ``RecordBatch``.
+
+    Duplicate column names keep the last occurrence, the same thing
+    ``dict(zip(columns, row))`` did in ``read_sql``.
+    """
+    import pyarrow as pa
+
+    index_by_name = {name: i for i, name in enumerate(columns)}
+    arrays = [
+        _column_to_array([_normalize_value(row[i]) for row in rows]) for i in index_by_name.values()
+    ]
+    return pa.RecordBatch.from_arrays(arrays, names=list(index_by_name))
+
+
+def empty_record_batch(columns: Sequence[str]) -> "pa.RecordBatch":
+    """A zero-row batch that still carries the result's column names."""
+    import pyarrow as pa
+
+    names = list(dict.fromkeys(columns))
+    return pa.RecordBatch.from_arrays([pa.array([], type=pa.null()) for _ in names], names=names)
+
+
+def iter_cursor_batches(
+    fetchmany: Callable[[int], Sequence[Sequence]],
+    columns: Sequence[str],
+    batch_rows: int = DEFAULT_ARROW_BATCH_ROWS,
+) -> Iterator["pa.RecordBatch"]:
+    """Yield one record batch per ``fetchmany(batch_rows)`` call.
+
+    Always yields at least one batch, so an empty result still tells the
+    caller what its columns were.
+    """
+    yielded = False
+    while True:
+        rows = fetchmany(batch_rows)
+        if not rows:
+            break
+        yielded = True
+        yield rows_to_record_batch(columns, rows)
+    if not yielded:
+        yield empty_record_batch(columns)
+
+
+def combine_record_batches(batches: Iterable["pa.RecordBatch"]) -> "pa.Table":
+    """Concatenate batches whose inferred types may differ into one table.
+
+    Types are inferred per batch, so a column that is all NULL in one batch is
+    ``null`` there and typed in the next; ``permissive`` promotion reconciles
+    those. Columns whose batches genuinely disagree (text in one, numbers in
+    another) are cast to strings rather than failing the whole query.
+    """
+    import pyarrow as pa
+
+    tables: List[pa.Table] = [pa.Table.from_batches([batch]) for batch in batches]
+    if not tables:
+        return pa.table({})
+    if len(tables) == 1:
+        return tables[0]
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        pass
+
+    conflicting = set()
+    for name in tables[0].column_names:
+        types = {table.schema.field(name).type for table in tables}
+        types.discard(pa.null())
+        if len(types) > 1:
+            conflicting.add(name)
+    stringified = []
+    for table in tables:
+        for name in conflicting:
+            index = table.schema.get_field_index(name)
+            table = table.set_column(index, name, table.column(name).cast(pa.string()))
+        stringified.append(table)
+    return pa.concat_tables(stringified, promote_options="permissive")
@@ -2,16 +2,31 @@
 Base class for sources that use DuckDB as their underlying engine.
 """
 
-from typing import Dict, List, Any, Optional, ClassVar, Set
+from typing import Dict, Iterable, List, Any, Optional, ClassVar, Set
 from abc import abstractmethod
-import duckdb
+from contextlib import contextmanager
+from threading import Condition, Lock
 import click
+from pydantic import PrivateAttr
 from visivo.models.sources.source import Source
+from visivo.models.sources.arrow_utils import DEFAULT_ARROW_BATCH_ROWS
+from visivo.models.sources.cancellation import interruptible
 from visivo.logger.logger import Logger
 from sqlglot.schema import MappingSchema
 from visivo.query.sqlglot_type_mapper import SqlglotTypeMapper
 
 
+def _arrow_reader(result, batch_rows: int):
+    """A ``RecordBatchReader`` over a DuckDB result.
+
+    DuckDB renamed ``fetch_record_batch`` to ``to_arrow_reader`` (1.5) and
+    deprecated the old name; use whichever the installed version has.
+    """
+    if hasattr(result, "to_arrow_reader"):
+        return result.to_arrow_reader(batch_rows)
+    return result.fetch_record_batch(batch_rows)
+
+
 class BaseDuckdbSource(Source):
     """
     Base class for sources that use DuckDB as their underlying database engine.
@@ -22,6 +37,8 @@ class BaseDuckdbSource(Source):
     - Excel files (via DuckDB's read_csv_auto after conversion)
     """
 
+    _connection_cache: Any = PrivateAttr(default=None)
+
     def get_dialect(self):
         """All DuckDB-based sources use the duckdb dialect."""
         return "duckdb"
@@ -39,27 +56,77 @@ class BaseDuckdbSource(Source):
         raise NotImplementedError(f"No get_connection method implemented for {self.type}")
 
     @abstractmethod
-    def _setup_connection(self, connection, **kwargs):
-        """Setup the DuckDB connection (create views, attach databases, etc.)."""
+    def _setup_connection(self, connection, materialize: bool = False, **kwargs):
+        """Setup the DuckDB connection (create views, attach databases, etc.).
+
+        ``materialize`` is set for a cached connection that serves many queries,
+        where loading file data once beats reading the file for every query.
+        """
         raise NotImplementedError(f"No _setup_connection method implemented for {self.type}")
 
     def read_sql(self, query: str, **kwargs):
         """Execute a SQL query against the DuckDB connection."""
         try:
             with self.connect(read_only=True, **kwargs) as connection:
-                result = connection.execute(query)
-                columns = [desc[0] for desc in result.description] if result.description else []
-                rows = result.fetchall()
+                with interruptible(connection.interrupt):
+                    result = connection.execute(query)
+                    columns = [desc[0] for desc in result.description] if result.description else []
+                    rows = result.fetchall()
                 return [dict(zip(columns, row)) for row in rows]
         except Exception as err:
             raise click.ClickException(
                 f"Error executing query on {self.type} source '{self.name}': {str(err)}"
             )
 
+    def read_arrow(self, query: str, **kwargs):
+        """Execute a SQL query and return DuckDB's native Arrow result."""
+        try:
+            with self.connect(read_only=True, **kwargs) as connection:
+                with interruptible(connection.interrupt):
+                    return _arrow_reader(
+                        connection.execute(query), DEFAULT_ARROW_BATCH_ROWS
+                    ).read_all()
+        except Exception as err:
+            raise click.ClickException(
+                f"Error executing query on {self.type} source '{self.name}': {str(err)}"
+            )
+
+    def iter_arrow_batches(self, query: str, batch_rows: int = DEFAULT_ARROW_BATCH_ROWS, **kwargs):
+        """Execute a SQL query and yield DuckDB's Arrow batches of at most ``batch_rows`` rows."""
+        import pyarrow as pa
+
+        try:
+            with (
+                self.connect(read_only=True, **kwargs) as connection,
+                interruptible(connection.interrupt),
+            ):
+                reader = _arrow_reader(connection.execute(query), batch_rows)
+                yielded = False
+                for batch in reader:
+                    yielded = True
+                    yield batch
+                if not yielded:
+                    yield pa.RecordBatch.from_pylist([], schema=reader.schema)
+        except Exception as err:
+            raise click.ClickException(
+                f"Error executing query on {self.type} source '{self.name}': {str(err)}"
+            )
+
     def connect(self, read_only: bool = False, **kwargs):
         """Return a context manager for DuckDB connections."""
         return DuckdbConnection(source=self, read_only=read_only, **kwargs)
 
+    def enable_connection_cache(self):
+        """Serve read-only queries from one set-up connection until
+        ``close_connection_cache``. See ``DuckdbConnectionCache``."""
+        if self._connection_cache is None:
+            self._connection_cache = DuckdbConnectionCache(self)
+
+    def close_connection_cache(self):
+        cache, self._connection_cache = self._connection_cache, None
+        if cache is not None:
+            cache.close()
+
     def write_dataframe(self, table_name: str, data_frame, replace: bool = True):
         """Write a Polars DataFrame to a table in this DuckDB database."""
         try:
@@ -99,7 +166,7 @@ class BaseDuckdbSource(Source):
         except Exception:
             return False
 
-    def get_schema(self, table_names: List[str] = None) -> Dict[str, Any]:
+    def get_schema(self, table_names: List[str] = None, max_workers: int = 1) -> Dict[str, Any]:
         """
         Build SQLGlot schema using DuckDB's introspection capabilities.
 
@@ -130,8 +197,12 @@ class BaseDuckdbSource(Source):
                     "metadata": {"source_type": self.type, "total_tables": 0, "total_columns": 0},
                 }
 
+                described = self._extract_table_schemas_from_duckdb(connection, available_tables)
+
                 for table_name in available_tables:
-                    table_info = self._extract_table_schema_from_duckdb(connection, table_name)
+                    table_info = described.get(table_name)
+                    if table_info is None:
+                        table_info = self._extract_table_schema_from_duckdb(connection, table_name)
                     if table_info:
                         result["tables"][table_name] = table_info
 
@@ -249,6 +320,40 @@ class BaseDuckdbSource(Source):
                 Logger.instance().debug(f"Fallback query also failed: {e2}")
                 return []
 
+    def _extract_table_schemas_from_duckdb(
+        self, connection, table_names: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Schema information for many tables from one ``duckdb_columns()`` query.
+
+        One query replaces a DESCRIBE per table. Only the connection's own
+        database is read, which is where an unqualified table name resolves; a
+        table missing from the result is left for the caller to DESCRIBE.
+        """
+        try:
+            rows = connection.execute("""
+                SELECT table_name, column_name, data_type, is_nullable
+                FROM duckdb_columns()
+                WHERE database_name = current_database()
+                AND schema_name = 'main'
+                AND NOT internal
+                ORDER BY table_name, column_index
+            """).fetchall()
+        except Exception as e:
+            Logger.instance().debug(f"Error reading duckdb_columns(): {e}")
+            return {}
+
+        wanted = set(table_names)
+        columns_by_table = {}
+        for table_name, column_name, data_type, is_nullable in rows:
+            if table_name in wanted:
+                columns_by_table.setdefault(table_name, []).append(
+                    (column_name, data_type, bool(is_nullable))
+                )
+        return {
+            table_name: self._table_schema_from_columns(table_name, columns)
+            for table_name, columns in columns_by_table.items()
+        }
+
     def _extract_table_schema_from_duckdb(
         self, connection, table_name: str
     ) -> Optional[Dict[str, Any]]:
@@ -263,35 +368,35 @@ class BaseDuckdbSource(Source):
             if not columns_info:
                 return None
 
-            # Process columns - DuckDB DESCRIBE returns: column_name, column_type, null, key, default, extra
-            table_schema = {
-                "columns": {},
-                "metadata": {"table_name": table_name, "column_count": len(columns_info)},
-            }
-
-            for col_info in columns_info:
-                col_name = col_info[0]  # column_name
-                col_type_str = col_info[1]  # column_type
-                is_nullable = col_info[2] == "YES"  # null
-
-                # Convert DuckDB type string to SQLGlot DataType
-                sqlglot_datatype = SqlglotTypeMapper._parse_type_string(
-                    col_type_str, dialect="duckdb"
-                )
-
-                table_schema["columns"][col_name] = {
-                    "type": col_type_str,
-                    "nullable": is_nullable,
-                    "sqlglot_datatype": sqlglot_datatype,
-                    "sqlglot_type_info": SqlglotTypeMapper.serialize_datatype(sqlglot_datatype),
-                }
-
-            return table_schema
+            # DuckDB DESCRIBE returns: column_name, column_type, null, key, default, extra
+            return self._table_schema_from_columns(
+                table_name, [(col[0], col[1], col[2] == "YES") for col in columns_info]
+            )
 
         except Exception as e:
             Logger.instance().debug(f"Error extracting schema for table {table_name}: {e}")
             return None
 
+    def _table_schema_from_columns(self, table_name: str, columns: list) -> Dict[str, Any]:
+        """Build a table's schema from ``(name, type, nullable)`` tuples."""
+        table_schema = {
+            "columns": {},
+            "metadata": {"table_name": table_name, "column_count": len(columns)},
+        }
+
+        for col_name, col_type_str, is_nullable in columns:
+            # Convert DuckDB type string to SQLGlot DataType
+            sqlglot_datatype = SqlglotTypeMapper._parse_type_string(col_type_str, dialect="duckdb")
+
+            table_schema["columns"][col_name] = {
+                "type": col_type_str,
+                "nullable": is_nullable,
+                "sqlglot_datatype": sqlglot_datatype,
+                "sqlglot_type_info": SqlglotTypeMapper.serialize_datatype(sqlglot_datatype),
+            }
+
+        return table_schema
+
     # --- Granular introspection methods ---
 
     SYSTEM_SCHEMAS: ClassVar[Set[str]] = {"information_schema", "pg_catalog"}
@@ -356,6 +461,96 @@ class BaseDuckdbSource(Source):
         return {"columns": columns, "rows": rows, "row_count": len(rows)}
 
 
+class DuckdbConnectionCache:
+    """One set-up DuckDB connection per source, shared by a run's read-only queries.
+
+    Without it every query opens a new connection and repeats the source's
+    setup: attaching databases and, for CSV and Excel sources, re-parsing the
+    whole file behind a view. Here setup runs once and CSV/Excel data is
+    loaded into an in-memory table. Each query then gets its own cursor, a
+    separate DuckDB connection to the same database, so threads never share
+    one and cursors see the attachments and tables.
+    """
+
+    def __init__(self, source: BaseDuckdbSource):
+        self.source = source
+        self.lock = Lock()
+        self.released = Condition(self.lock)
+        self.connection = None
+        self.cursors = 0
+        self.writing = False
+
+    def cursor(self):
+        with self.lock:
+            while self.writing:
+                self.released.wait()
+            if self.connection is None:
+                connection = self.source.get_connection(read_only=True)
+                try:
+                    self.source._setup_connection(connection, materialize=True)
+                except Exception:
+                    connection.close()
+                    raise
+                self.connection = connection
+            cursor = self.connection.cursor()
+            self.cursors += 1
+            return cursor
+
+    def release(self, cursor):
+        """Close a cursor ``cursor`` handed out."""
+        try:
+            cursor.close()
+        finally:
+            with self.lock:
+                self.cursors -= 1
+                self.released.notify_all()
+
+    def begin_write(self):
+        """Close the shared connection for a read-write connection, until ``end_write``.
+
+        DuckDB refuses a read-write connection to a file this process already
+        has open read-only, and cached reads must see the write. Waits for the
+        cursors other threads are reading with, and for any other writer, so
+        read-write connections open one at a time and never under a query.
+        """
+        with self.lock:
+            while self.writing or self.cursors:
+                self.released.wait()
+            self.writing = True
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def end_write(self):
+        with self.lock:
+            self.writing = False
+            self.released.notify_all()
+
+    def close(self):
+        """Close the shared connection; the next ``cursor`` opens a new one."""
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+
+@contextmanager
+def duckdb_connection_cache(sources: Iterable[Source]):
+    """Cache connections for the DuckDB-based ``sources`` for the duration of the block.
+
+    Scoped rather than permanent because an open read-only connection keeps
+    the database file locked against writers outside this process.
+    """
+    cached = [source for source in sources if isinstance(source, BaseDuckdbSource)]
+    for source in cached:
+        source.enable_connection_cache()
+    try:
+        yield
+    finally:
+        for source in cached:
+            source.close_connection_cache()
+
+
 class DuckdbConnection:
     """Context manager for DuckDB connections."""
 
@@ -364,14 +559,37 @@ class DuckdbConnection:
         self.read_only = read_only
         self.kwargs = kwargs
         self.connection = None
+        # The cache this connection's cursor, or write, is registered with
+        self.cache = None
 
     def __enter__(self):
-        self.connection = self.source.get_connection(read_only=self.read_only)
-        # Let the source set up the connection (create views, attach DBs, etc.)
-        self.source._setup_connection(self.connection, **self.kwargs)
+        cache = self.source._connection_cache
+        if cache is not None:
+            if self.read_only and not self.kwargs:
+                self.connection = cache.cursor()
+                self.cache = cache
+                return self.connection
+            if not self.read_only:
+                cache.begin_write()
+                self.cache = cache
+        try:
+            self.connection = self.source.get_connection(read_only=self.read_only)
+            # Let the source set up the connection (create views, attach DBs, etc.)
+            self.source._setup_connection(self.connection, **self.kwargs)
+        except Exception:
+            self.__exit__(None, None, None)
+            raise
         return self.connection
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        cache, self.cache = self.cache, None
+        connection, self.connection = self.connection, None
+        if cache is not None and self.read_only:
+            cache.release(connection)
+            return
+        try:
+            if connection:
+                connection.close()
+        finally:
+            if cache is not None:
+                cache.end_write()
@@ -0,0 +1,117 @@
+"""Cancelling a query while the source's driver is still running it.
+
+A server job runs under a ``CancellationToken`` (see ``cancellation_scope``).
+Sources wrap each query's execution in ``interruptible`` with the driver's own
+way of stopping it — ``interrupt()`` on a DuckDB or SQLite connection,
+``cancel()`` on a Postgres one — so cancelling the token stops the query in
+the warehouse rather than leaving it to finish with nobody waiting for it.
+
+Outside a scope, ``interruptible`` does nothing: CLI runs are unaffected.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+import click
+
+from visivo.logger.logger import Logger
+
+
+class QueryCancelled(click.ClickException):
+    """Raised for a query started after its token was cancelled."""
+
+
+class CancellationToken:
+    """Cancels the queries registered with it while it is active."""
+
+    def __init__(self):
+        self.reason: Optional[str] = None
+        self._interrupts = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.reason is not None
+
+    def cancel(self, reason: str = "Cancelled by user") -> bool:
+        """Interrupt the running queries. Returns False when already cancelled."""
+        with self._lock:
+            if self.reason is not None:
+                return False
+            self.reason = reason
+            interrupts = list(self._interrupts)
+        for interrupt in interrupts:
+            try:
+                interrupt()
+            except Exception as e:
+                Logger.instance().debug(f"Interrupting a query failed: {e}")
+        return True
+
+    def raise_if_cancelled(self):
+        if self.reason is not None:
+            raise QueryCancelled(self.reason)
+
+    @contextmanager
+    def interruptible(self, interrupt: Callable[[], None]):
+        with self._lock:
+            if self.reason is not None:
+                raise QueryCancelled(self.reason)
+            self._interrupts.append(interrupt)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._interrupts.remove(interrupt)
+
+
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar(
+    "visivo_cancellation_token", default=None
+)
+
+
+def current_token() -> Optional[CancellationToken]:
+    return _current_token.get()
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken):
+    """Make ``token`` cancel the queries run in this thread inside the block."""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+@contextmanager
+def interruptible(interrupt: Optional[Callable[[], None]]):
+    """Run the block's query so the current token can stop it with ``interrupt``.
+
+    ``interrupt`` is called from another thread. ``None`` means the driver has
+    no way to stop a query; the query then only fails to start once cancelled.
+    """
+    token = _current_token.get()
+    if token is None:
+        yield
+    elif interrupt is None:
+        token.raise_if_cancelled()
+        yield
+    else:
+        with token.interruptible(interrupt):
+            yield
+
+
+def dbapi_interrupt(dbapi_connection) -> Optional[Callable[[], None]]:
+    """The DBAPI connection's method for stopping its running query, if it has one.
+
+    psycopg and psycopg2 (Postgres) have ``cancel()``; sqlite3 and DuckDB have
+    ``interrupt()``. The Redshift connector has neither, so this returns
+    ``None`` for it and a Redshift query only refuses to start once cancelled.
+    """
+    for name in ("cancel", "interrupt"):
+        method = getattr(dbapi_connection, name, None)
+        if callable(method):
+            return method
+    return None
@@ -1,16 +1,22 @@
-from typing import Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 from visivo.models.sources.sqlalchemy_source import SqlalchemySource
 from visivo.models.sources.source import ServerSource
 from pydantic import Field
 
-# Import clickhouse_sqlalchemy to register the dialect with SQLAlchemy
-try:
-    import clickhouse_sqlalchemy  # noqa: F401
-except ImportError:
-    pass  # clickhouse_sqlalchemy not available
-
 ClickhouseType = Literal["clickhouse"]
 
+# Every column of every table in one database, from one system.columns query
+# instead of a DESCRIBE per table. The driver's type mapping is skipped: types
+# come back as ClickHouse's own spellings (``Nullable(String)``,
+# ``DateTime64(3)``), which SQLGlot parses, where the SQLAlchemy dialect turns
+# types it has no mapping for into NullType.
+_COLUMNS_FOR_DATABASE = """
+    SELECT table, name, type, default_expression
+    FROM system.columns
+    WHERE database = {database}
+    ORDER BY table, position
+"""
+
 
 class ClickhouseSource(ServerSource, SqlalchemySource):
     """
@@ -89,6 +95,14 @@ class ClickhouseSource(ServerSource, SqlalchemySource):
     def get_dialect(self):
         return "clickhouse"
 
+    def get_engine(self):
+        # Import clickhouse_sqlalchemy to register the dialect with SQLAlchemy
+        try:
+            import clickhouse_sqlalchemy  # noqa: F401
+        except ImportError:
+            pass  # clickhouse_sqlalchemy not available
+        return super().get_engine()
+
     def connect_args(self):
         """Return connection args for ClickHouse."""
         args = {}
@@ -96,6 +110,36 @@ class ClickhouseSource(ServerSource, SqlalchemySource):
             args["secure"] = True
         return args
 
+    def _columns_by_table(
+        self, inspector, schema, errors: List[str], max_workers: int = 1
+    ) -> Dict[str, Any]:
+        """``{table_name: [column_info, ...]}`` from one system.columns query."""
+        from sqlalchemy import text
+
+        query = _COLUMNS_FOR_DATABASE.format(database=":schema" if schema else "currentDatabase()")
+        try:
+            with inspector.engine.connect() as connection:
+                params = {"schema": schema} if schema else {}
+                rows = connection.execute(text(query), params).fetchall()
+        except Exception as e:
+            errors.append(
+                f"system.columns query failed for database {schema or 'default'} "
+                f"({self._concise_error(e)}); fell back to generic reflection"
+            )
+            return super()._columns_by_table(inspector, schema, errors, max_workers)
+
+        columns: Dict[str, Any] = {}
+        for table_name, column_name, column_type, default in rows:
+            columns.setdefault(table_name, []).append(
+                {
+                    "name": column_name,
+                    "type": column_type,
+                    "nullable": "Nullable(" in column_type,
+                    "default": default or None,
+                }
+            )
+        return columns
+
     def list_databases(self):
         """Return list of databases for ClickHouse server."""
         try:
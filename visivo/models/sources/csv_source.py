@@ -1,7 +1,7 @@
 from typing import Literal, Optional, Dict, List, Any
 from visivo.models.sources.base_duckdb_source import BaseDuckdbSource
+from visivo.models.sources.source import file_fingerprint
 from pydantic import Field
-import duckdb
 import click
 import os
 from visivo.logger.logger import Logger
@@ -41,6 +41,8 @@ class CSVFileSource(BaseDuckdbSource):
 
     def get_connection(self, read_only: bool = False):
         """Create an in-memory DuckDB connection with the CSV loaded as a view."""
+        import duckdb
+
         try:
             # Check if file exists
             if not os.path.exists(self.file):
@@ -53,16 +55,20 @@ class CSVFileSource(BaseDuckdbSource):
                 f"Error connecting to CSV source '{self.name}'. Full Error: {str(err)}"
             )
 
-    def _setup_connection(self, connection, **kwargs):
+    def _setup_connection(self, connection, materialize: bool = False, **kwargs):
         """Setup the DuckDB connection by creating a view from the CSV file."""
         try:
+            relation = "TABLE" if materialize else "VIEW"
             connection.execute(f"""
-                CREATE VIEW "{self.name}" AS
+                CREATE {relation} "{self.name}" AS
                 SELECT * FROM read_csv_auto('{self.file}', delim='{self.delimiter}', header={str(self.has_header).upper()})
                 """)
         except Exception as e:
             raise click.ClickException(f"Error setting up CSV view: {e}")
 
+    def schema_fingerprint(self):
+        return file_fingerprint([self.file])
+
     def description(self):
         """Return a description of this source for logging and error messages."""
         return f"{self.type} source '{self.name}' (file: {self.file})"
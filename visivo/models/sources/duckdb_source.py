@@ -2,10 +2,9 @@ from pathlib import Path
 from typing import Literal, Optional, List, Any
 from visivo.models.base.base_model import BaseModel
 from visivo.models.sources.base_duckdb_source import BaseDuckdbSource
-from visivo.models.sources.source import ServerSource
+from visivo.models.sources.source import ServerSource, file_fingerprint
 from pydantic import Field, PrivateAttr
 import click
-import duckdb
 import os
 from visivo.logger.logger import Logger
 from threading import Lock
@@ -76,6 +75,8 @@ class DuckdbSource(ServerSource, BaseDuckdbSource):
 
     def get_connection(self, read_only: bool = False, working_dir=None):
         """Return a DuckDBPyConnection using direct DuckDB connection with proper read_only support."""
+        import duckdb
+
         try:
             Logger.instance().debug(f"Getting connection for {self.name}, read_only={read_only}")
 
@@ -104,7 +105,7 @@ class DuckdbSource(ServerSource, BaseDuckdbSource):
                 f"Error connecting to source '{self.name}'. Ensure the database exists and the connection properties are correct. Full Error: {str(err)}"
             )
 
-    def _setup_connection(self, connection, **kwargs):
+    def _setup_connection(self, connection, materialize: bool = False, **kwargs):
         """Setup the DuckDB connection with after_connect commands and attachments."""
         try:
             # Execute after_connect if specified
@@ -129,6 +130,10 @@ class DuckdbSource(ServerSource, BaseDuckdbSource):
     def get_connection_dialect(self):
         return "duckdb"
 
+    def schema_fingerprint(self):
+        databases = [self.database] + [a.source.database for a in self.attach or []]
+        return file_fingerprint(p for db in map(str, databases) for p in (db, f"{db}.wal"))
+
     def description(self):
         """Return a description of this source for logging and error messages."""
         return f"{self.type} source '{self.name}' (database: {self.database})"
@@ -1,7 +1,7 @@
 from typing import Literal, Optional, Dict, List, Any
 from visivo.models.sources.base_duckdb_source import BaseDuckdbSource
+from visivo.models.sources.source import file_fingerprint
 from pydantic import Field
-import duckdb
 import click
 import os
 from visivo.logger.logger import Logger
@@ -39,6 +39,8 @@ class ExcelFileSource(BaseDuckdbSource):
 
     def get_connection(self, read_only: bool = False):
         """Create an in-memory DuckDB connection with the Excel file loaded as a view."""
+        import duckdb
+
         try:
             # Check if file exists
             if not os.path.exists(self.file):
@@ -51,19 +53,23 @@ class ExcelFileSource(BaseDuckdbSource):
                 f"Error connecting to Excel source '{self.name}'. Full Error: {str(err)}"
             )
 
-    def _setup_connection(self, connection, **kwargs):
+    def _setup_connection(self, connection, materialize: bool = False, **kwargs):
         """Setup the DuckDB connection by creating a view from the Excel file."""
         try:
             # For Excel files, we'll need to use the spatial extension or convert to CSV first
             # For now, let's try to use read_csv_auto assuming it's been converted
             # TODO: In the future, we could add Excel-specific handling here
+            relation = "TABLE" if materialize else "VIEW"
             connection.execute(f"""
-                CREATE VIEW "{self.name}" AS
+                CREATE {relation} "{self.name}" AS
                 SELECT * FROM read_csv_auto('{self.file}', delim='{self.delimiter}', header={str(self.has_header).upper()})
                 """)
         except Exception as e:
             raise click.ClickException(f"Error setting up Excel view: {e}")
 
+    def schema_fingerprint(self):
+        return file_fingerprint([self.file])
+
     def description(self):
         """Return a description of this source for logging and error messages."""
         return f"{self.type} source '{self.name}' (file: {self.file})"
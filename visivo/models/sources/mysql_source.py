@@ -1,4 +1,4 @@
-from typing import Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 from visivo.models.sources.sqlalchemy_source import SqlalchemySource
 from visivo.models.sources.source import ServerSource
 from pydantic import Field
@@ -13,6 +13,18 @@ except ImportError:
 
 MysqlType = Literal["mysql"]
 
+# Every column of every table and view in one schema. SQLAlchemy's MySQL
+# reflection runs SHOW CREATE TABLE once per table; information_schema answers
+# for the whole schema in one round trip. COLUMN_TYPE keeps length, precision
+# and ``unsigned`` (``varchar(100)``, ``bigint unsigned``), which SQLGlot parses
+# directly. None binds as NULL, so the connection's database is the default.
+_COLUMNS_FOR_SCHEMA = """
+    SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_DEFAULT
+    FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = COALESCE(:schema, DATABASE())
+    ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
 
 class MysqlSource(ServerSource, SqlalchemySource):
     """
@@ -45,9 +57,50 @@ class MysqlSource(ServerSource, SqlalchemySource):
     def get_connection_dialect(self):
         return "mysql+pymysql"
 
+    def query_interrupt(self, dbapi_connection):
+        # PyMySQL cannot stop its own query. KILL QUERY from another connection
+        # ends the statement and leaves the session open.
+        def kill_query():
+            with self.get_engine().connect() as connection:
+                connection.exec_driver_sql(f"KILL QUERY {int(dbapi_connection.thread_id())}")
+
+        return kill_query
+
     def get_dialect(self):
         return "mysql"
 
+    def _columns_by_table(
+        self, inspector, schema, errors: List[str], max_workers: int = 1
+    ) -> Dict[str, Any]:
+        """``{table_name: [column_info, ...]}`` from one information_schema query.
+
+        Types come back as ``COLUMN_TYPE`` strings, which ``_build_table_schema``
+        resolves through SQLGlot's MySQL dialect.
+        """
+        from sqlalchemy import text
+
+        try:
+            with inspector.engine.connect() as connection:
+                rows = connection.execute(text(_COLUMNS_FOR_SCHEMA), {"schema": schema}).fetchall()
+        except Exception as e:
+            errors.append(
+                f"information_schema column query failed for schema {schema or 'default'} "
+                f"({self._concise_error(e)}); fell back to generic reflection"
+            )
+            return super()._columns_by_table(inspector, schema, errors, max_workers)
+
+        columns: Dict[str, Any] = {}
+        for table_name, column_name, column_type, is_nullable, default in rows:
+            columns.setdefault(table_name, []).append(
+                {
+                    "name": column_name,
+                    "type": column_type,
+                    "nullable": str(is_nullable).upper() == "YES",
+                    "default": default,
+                }
+            )
+        return columns
+
     def list_databases(self):
         """Return list of databases for MySQL server."""
         try:
@@ -72,7 +72,9 @@ class PostgresqlSource(ServerSource, SqlalchemySource):
     def get_dialect(self):
         return "postgresql"
 
-    def _columns_by_table(self, inspector, schema, errors: List[str]) -> Dict[str, Any]:
+    def _columns_by_table(
+        self, inspector, schema, errors: List[str], max_workers: int = 1
+    ) -> Dict[str, Any]:
         """``{table_name: [column_info, ...]}`` from pg_catalog directly.
 
         Overrides the generic reflection because SQLAlchemy's batched
@@ -117,7 +119,7 @@ class PostgresqlSource(ServerSource, SqlalchemySource):
                 f"catalog column query failed for schema {schema or 'default'} "
                 f"({self._concise_error(e)}); fell back to generic reflection"
             )
-            return super()._columns_by_table(inspector, schema, errors)
+            return super()._columns_by_table(inspector, schema, errors, max_workers)
 
         columns: Dict[str, Any] = {}
         for table_name, column_name, data_type, is_nullable in rows:
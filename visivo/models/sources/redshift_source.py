@@ -1,8 +1,14 @@
 from typing import Literal, Optional, Any, Dict, List, ClassVar, Set
 from visivo.models.sources.source import ServerSource
+from visivo.models.sources.cancellation import dbapi_interrupt, interruptible
 from pydantic import Field, PrivateAttr
 from visivo.logger.logger import Logger
 from visivo.query.sqlglot_type_mapper import SqlglotTypeMapper
+from visivo.models.sources.arrow_utils import (
+    DEFAULT_ARROW_BATCH_ROWS,
+    combine_record_batches,
+    iter_cursor_batches,
+)
 import json
 
 RedshiftType = Literal["redshift"]
@@ -112,9 +118,10 @@ class RedshiftSource(ServerSource):
         with self.connect() as connection:
             cursor = connection.cursor()
             try:
-                cursor.execute(query)
-                columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchall()
+                with interruptible(dbapi_interrupt(connection)):
+                    cursor.execute(query)
+                    columns = [desc[0] for desc in cursor.description]
+                    rows = cursor.fetchall()
 
                 # Convert to list of dictionaries
                 result_data = []
@@ -132,6 +139,22 @@ class RedshiftSource(ServerSource):
             finally:
                 cursor.close()
 
+    def read_arrow(self, query: str, **kwargs):
+        """Execute a SQL query and build an Arrow table a ``fetchmany`` batch at a time."""
+        return combine_record_batches(self.iter_arrow_batches(query))
+
+    def iter_arrow_batches(self, query: str, batch_rows: int = DEFAULT_ARROW_BATCH_ROWS, **kwargs):
+        """Execute a SQL query and yield Arrow record batches of at most ``batch_rows`` rows."""
+        with self.connect() as connection:
+            cursor = connection.cursor()
+            try:
+                with interruptible(dbapi_interrupt(connection)):
+                    cursor.execute(query)
+                    columns = [desc[0] for desc in cursor.description]
+                    yield from iter_cursor_batches(cursor.fetchmany, columns, batch_rows)
+            finally:
+                cursor.close()
+
     def list_databases(self):
         """Return list of databases for Redshift cluster."""
         try:
@@ -183,39 +206,16 @@ class RedshiftSource(ServerSource):
                 cursor.execute(schema_query)
                 schemas = [row[0] for row in cursor.fetchall()]
 
-                for schema in schemas:
-                    tables_dict = {}
-
-                    # Get tables for this schema
-                    table_query = """
-                    SELECT table_name 
-                    FROM information_schema.tables 
-                    WHERE table_schema = %s AND table_type = 'BASE TABLE'
-                    ORDER BY table_name
-                    """
-
-                    cursor.execute(table_query, (schema,))
-                    tables = [row[0] for row in cursor.fetchall()]
-
-                    for table in tables:
-                        # Get columns for this table
-                        column_query = """
-                        SELECT column_name, data_type, is_nullable 
-                        FROM information_schema.columns 
-                        WHERE table_schema = %s AND table_name = %s
-                        ORDER BY ordinal_position
-                        """
-
-                        cursor.execute(column_query, (schema, table))
-                        columns = [
-                            {"name": row[0], "type": row[1], "nullable": row[2] == "YES"}
-                            for row in cursor.fetchall()
+                # Every column of every base table, in one query rather than
+                # one per table.
+                schemas_dict = {schema: {} for schema in schemas}
+                for (schema, table), columns in self._columns_by_table(cursor).items():
+                    if schema in schemas_dict:
+                        schemas_dict[schema][table] = [
+                            {"name": name, "type": data_type, "nullable": nullable}
+                            for name, data_type, nullable in columns
                         ]
 
-                        tables_dict[table] = columns
-
-                    schemas_dict[schema] = tables_dict
-
                 cursor.close()
 
         except Exception as e:
@@ -227,7 +227,7 @@ class RedshiftSource(ServerSource):
     def get_dialect(self):
         return "redshift"
 
-    def get_schema(self, table_names: List[str] = None) -> Dict[str, Any]:
+    def get_schema(self, table_names: List[str] = None, max_workers: int = 1) -> Dict[str, Any]:
         """
         Build SQLGlot schema for Redshift source.
 
@@ -257,23 +257,32 @@ class RedshiftSource(ServerSource):
                 },
             }
 
-            # Get available tables to process
-            available_tables = self._get_available_tables_for_schema(table_names)
+            with self.connect() as connection:
+                cursor = connection.cursor()
+                columns_by_table = self._columns_by_table(cursor, self.get_db_schema())
+                cursor.close()
 
-            # Process each table
-            for table_name in available_tables:
-                table_info = self._extract_table_schema_for_sqlglot(table_name)
-                if table_info:
-                    result["tables"][table_name] = table_info
+            # Without a db_schema a table name can exist in several schemas;
+            # the first schema alphabetically wins, as the schema is keyed by
+            # bare table name.
+            table_columns = {}
+            for (_schema, table_name), columns in columns_by_table.items():
+                if table_names and table_name not in table_names:
+                    continue
+                table_columns.setdefault(table_name, columns)
 
-                    # Add to SQLGlot schema
-                    columns_dict = {}
-                    for col_name, col_info in table_info["columns"].items():
-                        if "sqlglot_datatype" in col_info:
-                            columns_dict[col_name] = col_info["sqlglot_datatype"]
+            for table_name, columns in table_columns.items():
+                table_info = self._table_schema_for_sqlglot(table_name, columns)
+                result["tables"][table_name] = table_info
 
-                    if columns_dict:
-                        result["sqlglot_schema"].add_table(table_name, columns_dict)
+                # Add to SQLGlot schema
+                columns_dict = {}
+                for col_name, col_info in table_info["columns"].items():
+                    if "sqlglot_datatype" in col_info:
+                        columns_dict[col_name] = col_info["sqlglot_datatype"]
+
+                if columns_dict:
+                    result["sqlglot_schema"].add_table(table_name, columns_dict)
 
             # Update metadata
             result["metadata"]["total_tables"] = len(result["tables"])
@@ -296,106 +305,56 @@ class RedshiftSource(ServerSource):
                 "metadata": {"error": str(e), "total_tables": 0, "total_columns": 0},
             }
 
-    def _get_available_tables_for_schema(self, table_names: List[str] = None) -> List[str]:
-        """Get list of tables to process for schema building."""
-        try:
-            with self.connect() as connection:
-                cursor = connection.cursor()
+    def _columns_by_table(self, cursor, schema: Optional[str] = None) -> Dict[tuple, list]:
+        """``{(schema, table): [(column, data_type, nullable), ...]}`` for base tables.
 
-                # Get all tables from information schema
-                if hasattr(self, "db_schema") and self.db_schema:
-                    # Query specific schema
-                    query = """
-                    SELECT table_name
-                    FROM information_schema.tables
-                    WHERE table_schema = %s AND table_type = 'BASE TABLE'
-                    ORDER BY table_name
-                    """
-                    cursor.execute(query, (self.db_schema,))
-                else:
-                    # Query all schemas except system ones
-                    query = """
-                    SELECT table_name
-                    FROM information_schema.tables
-                    WHERE table_schema NOT IN ('information_schema', 'pg_catalog', 'pg_toast')
-                    AND table_type = 'BASE TABLE'
-                    ORDER BY table_name
-                    """
-                    cursor.execute(query)
-
-                all_tables = [row[0] for row in cursor.fetchall()]
-                cursor.close()
-
-                # Filter to requested tables if specified
-                if table_names:
-                    return [t for t in all_tables if t in table_names]
-
-                return all_tables
-
-        except Exception as e:
-            Logger.instance().debug(f"Error getting tables for Redshift schema: {e}")
-            return []
-
-    def _extract_table_schema_for_sqlglot(self, table_name: str) -> Optional[Dict[str, Any]]:
-        """Extract schema information for a single table for SQLGlot format."""
-        try:
-            with self.connect() as connection:
-                cursor = connection.cursor()
-
-                # Get columns for this table
-                if hasattr(self, "db_schema") and self.db_schema:
-                    column_query = """
-                    SELECT column_name, data_type, is_nullable
-                    FROM information_schema.columns
-                    WHERE table_schema = %s AND table_name = %s
-                    ORDER BY ordinal_position
-                    """
-                    cursor.execute(column_query, (self.db_schema, table_name))
-                else:
-                    # Try to find the table in any schema
-                    column_query = """
-                    SELECT column_name, data_type, is_nullable
-                    FROM information_schema.columns
-                    WHERE table_name = %s
-                    AND table_schema NOT IN ('information_schema', 'pg_catalog', 'pg_toast')
-                    ORDER BY ordinal_position
-                    """
-                    cursor.execute(column_query, (table_name,))
-
-                columns_info = cursor.fetchall()
-                cursor.close()
-
-                if not columns_info:
-                    return None
-
-                # Process columns
-                table_schema = {
-                    "columns": {},
-                    "metadata": {"table_name": table_name, "column_count": len(columns_info)},
-                }
-
-                for col_info in columns_info:
-                    col_name = col_info[0]  # column_name
-                    col_type_str = col_info[1]  # data_type
-                    is_nullable = col_info[2] == "YES"  # is_nullable
+        One information_schema query covers every table, where a query per
+        table cost a round trip each against the cluster.
+        """
+        query = """
+        SELECT c.table_schema, c.table_name, c.column_name, c.data_type, c.is_nullable
+        FROM information_schema.columns c
+        JOIN information_schema.tables t
+          ON t.table_schema = c.table_schema AND t.table_name = c.table_name
+        WHERE t.table_type = 'BASE TABLE'
+        """
+        if schema:
+            query += " AND c.table_schema = %s"
+            params = (schema,)
+        else:
+            query += " AND c.table_schema NOT IN ('information_schema', 'pg_catalog', 'pg_toast')"
+            params = ()
+        query += " ORDER BY c.table_schema, c.table_name, c.ordinal_position"
+        cursor.execute(query, params)
+
+        columns_by_table = {}
+        for table_schema, table_name, column_name, data_type, is_nullable in cursor.fetchall():
+            columns_by_table.setdefault((table_schema, table_name), []).append(
+                (column_name, data_type, is_nullable == "YES")
+            )
+        return columns_by_table
 
-                    # Convert Redshift type string to SQLGlot DataType
-                    sqlglot_datatype = SqlglotTypeMapper._parse_type_string(
-                        col_type_str, dialect="redshift"
-                    )
+    def _table_schema_for_sqlglot(self, table_name: str, columns: list) -> Dict[str, Any]:
+        """Schema information for a single table in SQLGlot format."""
+        table_schema = {
+            "columns": {},
+            "metadata": {"table_name": table_name, "column_count": len(columns)},
+        }
 
-                    table_schema["columns"][col_name] = {
-                        "type": col_type_str,
-                        "nullable": is_nullable,
-                        "sqlglot_datatype": sqlglot_datatype,
-                        "sqlglot_type_info": SqlglotTypeMapper.serialize_datatype(sqlglot_datatype),
-                    }
+        for col_name, col_type_str, is_nullable in columns:
+            # Convert Redshift type string to SQLGlot DataType
+            sqlglot_datatype = SqlglotTypeMapper._parse_type_string(
+                col_type_str, dialect="redshift"
+            )
 
-                return table_schema
+            table_schema["columns"][col_name] = {
+                "type": col_type_str,
+                "nullable": is_nullable,
+                "sqlglot_datatype": sqlglot_datatype,
+                "sqlglot_type_info": SqlglotTypeMapper.serialize_datatype(sqlglot_datatype),
+            }
 
-        except Exception as e:
-            Logger.instance().debug(f"Error extracting schema for Redshift table {table_name}: {e}")
-            return None
+        return table_schema
 
     # --- Granular introspection methods ---
 
@@ -138,6 +138,17 @@ class SnowflakeSource(ServerSource, SqlalchemySource):
     def get_connection_dialect(self):
         return "snowflake"
 
+    def query_interrupt(self, dbapi_connection):
+        # The connector only cancels through private methods; SYSTEM$CANCEL_ALL_QUERIES
+        # from another session ends the one statement the job's session runs.
+        def cancel_queries():
+            with self.get_engine().connect() as connection:
+                connection.exec_driver_sql(
+                    f"SELECT SYSTEM$CANCEL_ALL_QUERIES({int(dbapi_connection.session_id)})"
+                )
+
+        return cancel_queries
+
     def get_dialect(self):
         return "snowflake"
 
@@ -196,7 +207,7 @@ class SnowflakeSource(ServerSource, SqlalchemySource):
             # Re-raise to allow proper error handling in UI
             raise e
 
-    def get_schema(self, table_names: List[str] = None) -> Dict[str, Any]:
+    def get_schema(self, table_names: List[str] = None, max_workers: int = 1) -> Dict[str, Any]:
         """
         Build SQLGlot schema for Snowflake source using INFORMATION_SCHEMA.
 
@@ -304,6 +315,28 @@ class SnowflakeSource(ServerSource, SqlalchemySource):
                 "metadata": {"error": str(e), "total_tables": 0, "total_columns": 0},
             }
 
+    def table_fingerprints(self) -> Optional[Dict[str, str]]:
+        """``LAST_ALTERED`` per table, which Snowflake bumps on any DDL or DML.
+
+        Keyed ``SCHEMA.TABLE`` like ``get_schema``. One query against
+        INFORMATION_SCHEMA.TABLES, where describing every column of a 900-table
+        database is the slowest step of a run. ``None`` if the query fails, so
+        the schema is described in full.
+        """
+        try:
+            with self.get_connection() as connection:
+                from sqlalchemy import text
+
+                rows = connection.execute(text("""
+                    SELECT TABLE_SCHEMA, TABLE_NAME, LAST_ALTERED
+                    FROM INFORMATION_SCHEMA.TABLES
+                    WHERE TABLE_SCHEMA NOT IN ('INFORMATION_SCHEMA')
+                    """)).fetchall()
+        except Exception as e:
+            Logger.instance().debug(f"Could not read table fingerprints for {self.name}: {e}")
+            return None
+        return {f"{schema}.{table}": str(last_altered) for schema, table, last_altered in rows}
+
     def _extract_all_columns_from_information_schema(
         self, table_names: List[str] = None
     ) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
@@ -1,4 +1,5 @@
-from typing import Optional, Dict, List, Any
+import os
+from typing import Iterable, Optional, Dict, List, Any
 from visivo.models.base.named_model import NamedModel
 from visivo.models.base.base_model import StringOrEnvVar, SecretStrOrEnvVar
 from visivo.models.base.env_var_string import EnvVarString
@@ -11,7 +12,33 @@ class DefaultSource:
     pass
 
 
+def file_fingerprint(paths: Iterable[str]) -> str:
+    """``size:mtime`` of each file, for sources whose data lives in local files.
+
+    A missing file contributes ``-`` rather than failing, since optional
+    companions such as a write-ahead log come and go.
+    """
+    parts = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            parts.append(f"{path}={stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{path}=-")
+    return "|".join(parts)
+
+
 class Source(ABC, NamedModel):
+    max_concurrent_queries: Optional[int] = Field(
+        None,
+        gt=0,
+        description="The most jobs that query this source at once during a run. Jobs over the limit wait without holding a thread, so a slow source cannot starve jobs on other sources. Unlimited by default.",
+    )
+    schema_cache_ttl: Optional[int] = Field(
+        None,
+        gt=0,
+        description="Seconds a run reuses this source's stored schema without introspecting it again. Seeded sources are always introspected. Off by default.",
+    )
 
     @abstractmethod
     def get_connection(self):
@@ -21,12 +48,44 @@ class Source(ABC, NamedModel):
     def read_sql(self, query: str, **kwargs):
         raise NotImplementedError(f"No read sql method implemented for {self.type}")
 
+    def read_arrow(self, query: str, **kwargs):
+        """Execute a query and return the result as a ``pyarrow.Table``.
+
+        This is the path model, insight and input jobs use to persist results,
+        so a large result set is never held as one Python ``dict`` per row.
+        Sources override it with a columnar implementation; this default only
+        exists so a source without one still works, via ``read_sql``.
+        """
+        import polars as pl
+
+        return pl.DataFrame(self.read_sql(query, **kwargs), infer_schema_length=None).to_arrow()
+
+    def iter_arrow_batches(self, query: str, batch_rows: int = None, **kwargs):
+        """Execute a query and yield its result as Arrow record batches.
+
+        Used by streaming model materialization (``defaults.max_batch_rows``):
+        each batch becomes one parquet row group, so only one batch needs to be
+        in memory at a time. At least one batch is always yielded, so an empty
+        result still carries its schema. This default reads the whole result
+        with ``read_arrow`` first; sources override it to fetch incrementally.
+        """
+        table = self.read_arrow(query, **kwargs)
+        batches = table.to_batches(max_chunksize=batch_rows)
+        if not batches:
+            import pyarrow as pa
+
+            batches = [pa.RecordBatch.from_pylist([], schema=table.schema)]
+        yield from batches
+
     @abstractmethod
-    def get_schema(self, table_names: List[str] = None) -> Dict[str, Any]:
+    def get_schema(self, table_names: List[str] = None, max_workers: int = 1) -> Dict[str, Any]:
         """Extract table and column metadata and build SQLGlot schema.
 
         Args:
             table_names: Optional list of table names to include. If None, includes all tables.
+            max_workers: Most introspection queries to run at once. Only the
+                SQLAlchemy sources use it; DuckDB, Redshift and Snowflake
+                introspect on one connection and ignore it.
 
         Returns:
             Dictionary containing:
@@ -36,6 +95,24 @@ class Source(ABC, NamedModel):
         """
         raise NotImplementedError(f"No get_schema method implemented for {self.type}")
 
+    def schema_fingerprint(self) -> Optional[str]:
+        """A value that changes whenever the source's schema might have.
+
+        When it matches the one stored with the last schema, the schema job
+        reuses that schema instead of introspecting. ``None`` means the source
+        cannot tell, so it is always introspected.
+        """
+        return None
+
+    def table_fingerprints(self) -> Optional[Dict[str, str]]:
+        """``{table_name: fingerprint}`` for every table, from one cheap query.
+
+        Lets the schema job describe only tables that are new or changed since
+        the last run. Keys must match the table names ``get_schema`` returns.
+        ``None`` means the source cannot tell, so every table is described.
+        """
+        return None
+
     @abstractmethod
     def description(self):
         """Return a description of this source for logging and error messages."""
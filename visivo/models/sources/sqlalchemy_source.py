@@ -1,35 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Dict, List, ClassVar, Set
+from typing import Any, Callable, Optional, Dict, List, ClassVar, Set
 import click
-from pydantic import PrivateAttr
+from pydantic import Field, PrivateAttr
 from visivo.models.sources.source import Source
-from sqlalchemy import (
-    create_engine,
-    event,
-    text,
-    inspect,
-    Column,
-    MetaData,
-    Table,
-    BigInteger,
-    Boolean,
-    Date,
-    DateTime,
-    Float,
-    Numeric,
-    Text,
-    Time,
-)
-from sqlalchemy.pool import NullPool
+from visivo.models.sources.cancellation import dbapi_interrupt, interruptible
 from visivo.logger.logger import Logger
-import polars as pl
 from copy import deepcopy
-import pyarrow as pa
+import contextvars
 import json
 from datetime import datetime, date, time
 from decimal import Decimal
 from sqlglot.schema import MappingSchema
 from visivo.query.sqlglot_type_mapper import SqlglotTypeMapper
+from visivo.models.sources.arrow_utils import (
+    DEFAULT_ARROW_BATCH_ROWS,
+    combine_record_batches,
+    iter_cursor_batches,
+)
 
 # A driver error is one sentence followed by the whole failing statement; only
 # the sentence is actionable. Long enough for a real message, short enough that
@@ -40,12 +27,25 @@ _MAX_ERROR_CHARS = 200
 _MAX_SAMPLE_TABLES = 3
 
 
+def _map_in_context(executor, fn, items) -> list:
+    """``executor.map(fn, items)``, each call in a copy of the caller's context.
+
+    Pool threads start with an empty context, so without the copy a query run
+    on one would not see the job's cancellation token.
+    """
+    futures = [executor.submit(contextvars.copy_context().run, fn, item) for item in items]
+    return [future.result() for future in futures]
+
+
 def _sqlalchemy_type_for(polars_dtype):
     """Map a Polars dtype to the SQLAlchemy column type used when writing a seed table.
 
     Anything without a natural SQL equivalent is written as text — see
     ``_cast_unsupported_columns_to_string``, which stringifies the matching column.
     """
+    import polars as pl
+    from sqlalchemy import BigInteger, Boolean, Date, DateTime, Float, Numeric, Text, Time
+
     if polars_dtype == pl.Boolean:
         return Boolean
     if polars_dtype.is_integer():
@@ -70,6 +70,9 @@ def _cast_unsupported_columns_to_string(data_frame):
     ``map_elements`` instead — the alternative is the whole seed failing on one
     nested column.
     """
+    import polars as pl
+    from sqlalchemy import Text
+
     unsupported = [
         name
         for name, dtype in data_frame.schema.items()
@@ -93,6 +96,16 @@ class SqlalchemySource(Source, ABC):
 
     _engine: Any = PrivateAttr(default=None)
     after_connect: Optional[str] = None
+    max_overflow: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Connections opened beyond the pool size when every pooled connection is in use. They are closed once returned. Defaults to 10.",
+    )
+    pool_recycle: Optional[int] = Field(
+        None,
+        gt=0,
+        description="Seconds after which a pooled connection is replaced instead of reused. Set this below the database's idle connection timeout.",
+    )
 
     @abstractmethod
     def url(self):
@@ -105,6 +118,8 @@ class SqlalchemySource(Source, ABC):
         Built on SQLAlchemy Core rather than ``polars.write_database`` because polars'
         sqlalchemy engine requires pandas, which Visivo does not depend on.
         """
+        from sqlalchemy import Column, MetaData, Table
+
         try:
             data_frame = _cast_unsupported_columns_to_string(data_frame)
             metadata = MetaData()
@@ -138,18 +153,34 @@ class SqlalchemySource(Source, ABC):
         introspection sweep. Any failure (unreachable DB, missing schema) returns
         ``False`` so the seed conservatively re-runs rather than being wrongly skipped.
         """
+        from sqlalchemy import inspect
+
         try:
             schema = self.get_db_schema() if hasattr(self, "get_db_schema") else None
             return inspect(self.get_engine()).has_table(table_name, schema=schema)
         except Exception:
             return False
 
+    def query_interrupt(self, dbapi_connection) -> Optional[Callable[[], None]]:
+        """How to stop the query running on ``dbapi_connection`` from another thread.
+
+        Called when a server job is cancelled (see ``visivo.models.sources.cancellation``).
+        Sources whose driver cannot stop its own query override this.
+        """
+        return dbapi_interrupt(dbapi_connection)
+
+    def _interruptible(self, connection):
+        return interruptible(self.query_interrupt(connection.connection.dbapi_connection))
+
     def read_sql(self, query: str, **kwargs):
+        from sqlalchemy import text
+
         with self.connect() as connection:
             query = text(query)
-            results = connection.execute(query)
-            columns = list(results.keys())
-            data = results.fetchall()
+            with self._interruptible(connection):
+                results = connection.execute(query)
+                columns = list(results.keys())
+                data = results.fetchall()
             results.close()
 
         # Convert to list of dictionaries
@@ -166,40 +197,80 @@ class SqlalchemySource(Source, ABC):
 
         return result_data
 
+    def read_arrow(self, query: str, **kwargs):
+        """Execute a query and build an Arrow table a ``fetchmany`` batch at a time."""
+        return combine_record_batches(self.iter_arrow_batches(query))
+
+    def iter_arrow_batches(self, query: str, batch_rows: int = DEFAULT_ARROW_BATCH_ROWS, **kwargs):
+        """Execute a query and yield Arrow record batches of at most ``batch_rows`` rows.
+
+        ``stream_results`` asks for a server-side cursor on dialects that have
+        one (Postgres, MySQL), so the driver does not buffer the whole result
+        before the first batch is built. Other dialects ignore it.
+        """
+        from sqlalchemy import text
+
+        with self.connect() as connection, self._interruptible(connection):
+            results = connection.execution_options(stream_results=True).execute(text(query))
+            try:
+                yield from iter_cursor_batches(results.fetchmany, list(results.keys()), batch_rows)
+            finally:
+                results.close()
+
     def get_connection(self):
 
         try:
-            connection = (
-                self.get_engine().connect()
-            )  # I wonder if creating mutltiple engines is part of the problem.
-            if hasattr(self, "attach") and self.attach:
-                for attachment in self.attach:
-                    connection.execute(
-                        text(
-                            f"attach database '{attachment.source.database}' as {attachment.schema_name};"
-                        )
-                    )
-            return connection
+            return self.get_engine().connect()
         except Exception as err:
             raise click.ClickException(
                 f"Error connecting to source '{self.name}'. Ensure the database is running and the connection properties are correct. Full Error: {str(err)}"
             )
 
+    def pool_options(self) -> Dict[str, Any]:
+        """``create_engine`` pool arguments from the source's pool settings.
+
+        Connections are pooled per source so jobs reuse an open connection
+        instead of paying a new handshake each — on Snowflake, Redshift and
+        BigQuery that handshake costs more than most queries. A
+        ``connection_pool_size`` of 0 turns pooling off.
+        """
+        from sqlalchemy.pool import NullPool
+
+        pool_size = getattr(self, "connection_pool_size", None)
+        if pool_size == 0:
+            return {"poolclass": NullPool}
+        options = {}
+        if pool_size is not None:
+            options["pool_size"] = pool_size
+        if self.max_overflow is not None:
+            options["max_overflow"] = self.max_overflow
+        if self.pool_recycle is not None:
+            options["pool_recycle"] = self.pool_recycle
+        return options
+
     def get_engine(self):
 
+        from sqlalchemy import create_engine, event
+
         if not self._engine:
 
             Logger.instance().debug(f"Creating engine for Source: {self.name}")
             self._engine = create_engine(
-                self.url(), poolclass=NullPool, connect_args=self.connect_args()
+                self.url(), connect_args=self.connect_args(), **self.pool_options()
             )
 
+            # Runs once per new DBAPI connection rather than per checkout, since
+            # a pooled connection keeps its session state (and attachments).
             @event.listens_for(self._engine, "connect")
             def connect(dbapi_connection, connection_record):
+                cursor_obj = dbapi_connection.cursor()
                 if self.after_connect:
-                    cursor_obj = dbapi_connection.cursor()
                     cursor_obj.execute(self.after_connect)
-                    cursor_obj.close()
+                for attachment in getattr(self, "attach", None) or []:
+                    cursor_obj.execute(
+                        f"attach database '{attachment.source.database}' as {attachment.schema_name};"
+                    )
+                cursor_obj.close()
 
         return self._engine
 
@@ -265,6 +336,8 @@ class SqlalchemySource(Source, ABC):
 
     def _introspect_via_single_connection(self, engine, db_names):
         """Introspect multiple databases using a single connection."""
+        from sqlalchemy import text, inspect
+
         databases = []
         inspector = inspect(engine)
         dialect = engine.dialect.name
@@ -289,6 +362,8 @@ class SqlalchemySource(Source, ABC):
 
     def _introspect_via_multiple_connections(self, db_names):
         """Introspect databases that require separate connections (PostgreSQL)."""
+        from sqlalchemy import inspect
+
         databases = []
 
         for db_name in db_names:
@@ -329,52 +404,50 @@ class SqlalchemySource(Source, ABC):
         db_entry = {"name": db_name}
 
         if schemas:
-            db_entry["schemas"] = []
-            for schema in schemas:
-                try:
-                    tables = inspector.get_table_names(schema=schema)
-                except Exception:
-                    tables = []
-
-                table_entries = []
-                for table in tables:
-                    try:
-                        cols = [c["name"] for c in inspector.get_columns(table, schema=schema)]
-                    except Exception:
-                        cols = []
-                    table_entries.append(
-                        {
-                            "name": table,
-                            "columns": cols,
-                            "foreign_keys": self._introspect_foreign_keys(inspector, table, schema),
-                        }
-                    )
-
-                db_entry["schemas"].append({"name": schema, "tables": table_entries})
+            db_entry["schemas"] = [
+                {"name": schema, "tables": self._introspect_tables(inspector, schema)}
+                for schema in schemas
+            ]
         else:
             # No schemas, list tables directly
-            try:
-                tables = inspector.get_table_names()
-            except Exception:
-                tables = []
+            db_entry["tables"] = self._introspect_tables(inspector)
 
-            table_entries = []
-            for table in tables:
-                try:
-                    cols = [c["name"] for c in inspector.get_columns(table)]
-                except Exception:
-                    cols = []
-                table_entries.append(
-                    {
-                        "name": table,
-                        "columns": cols,
-                        "foreign_keys": self._introspect_foreign_keys(inspector, table),
-                    }
-                )
+        return db_entry
 
-            db_entry["tables"] = table_entries
+    def _introspect_tables(self, inspector, schema=None):
+        """Table entries for one schema, with columns and foreign keys fetched
+        for the whole schema at once rather than one round trip per table."""
+        try:
+            tables = inspector.get_table_names(schema=schema)
+        except Exception:
+            return []
 
-        return db_entry
+        columns = self._columns_by_table(inspector, schema, [])
+        foreign_keys = self._foreign_keys_by_table(inspector, schema)
+        return [
+            {
+                "name": table,
+                "columns": [c["name"] for c in columns.get(table, [])],
+                "foreign_keys": (
+                    foreign_keys.get(table, [])
+                    if foreign_keys is not None
+                    else self._introspect_foreign_keys(inspector, table, schema)
+                ),
+            }
+            for table in tables
+        ]
+
+    def _foreign_keys_by_table(self, inspector, schema=None) -> Optional[Dict[str, list]]:
+        """``{table_name: [foreign_key, ...]}`` from ``get_multi_foreign_keys``.
+
+        ``None`` when the batched call is unavailable, so the caller falls back
+        to asking per table.
+        """
+        try:
+            multi = inspector.get_multi_foreign_keys(schema=schema)
+        except Exception:
+            return None
+        return {table: self._compact_foreign_keys(raw) for (_schema, table), raw in multi.items()}
 
     def _introspect_foreign_keys(self, inspector, table, schema=None):
         """Return this table's foreign keys in a compact, viewer-friendly shape.
@@ -387,6 +460,10 @@ class SqlalchemySource(Source, ABC):
             raw = inspector.get_foreign_keys(table, schema=schema)
         except Exception:
             return []
+        return self._compact_foreign_keys(raw)
+
+    @staticmethod
+    def _compact_foreign_keys(raw) -> List[dict]:
         foreign_keys = []
         for fk in raw or []:
             columns = fk.get("constrained_columns") or []
@@ -408,12 +485,14 @@ class SqlalchemySource(Source, ABC):
 
         return get_sqlglot_dialect(self.get_dialect())
 
-    def get_schema(self, table_names: List[str] = None) -> Dict[str, Any]:
+    def get_schema(self, table_names: List[str] = None, max_workers: int = 1) -> Dict[str, Any]:
         """
         Build SQLGlot schema for this source.
 
         Args:
             table_names: Optional list of table names to include. If None, includes all tables.
+            max_workers: Most schemas (or, on the per-table fallback, tables)
+                reflected at once.
 
         Returns:
             Dictionary containing:
@@ -421,6 +500,8 @@ class SqlalchemySource(Source, ABC):
             - sqlglot_schema: SQLGlot MappingSchema for query optimization
             - metadata: Additional metadata about the schema
         """
+        from sqlalchemy import inspect
+
         try:
             # Use existing engine or create one
             engine = self.get_engine()
@@ -453,11 +534,11 @@ class SqlalchemySource(Source, ABC):
             except Exception as e:
                 errors.append(f"could not resolve default schema: {self._concise_error(e)}")
 
-            for schema in self._schemas_to_scan(inspector, errors):
+            schemas = self._schemas_to_scan(inspector, errors)
+            columns_by_schema = self._columns_by_schema(inspector, schemas, errors, max_workers)
+            for schema in schemas:
                 result["metadata"]["scanned_schemas"].append(schema)
-                for base_name, columns_info in self._columns_by_table(
-                    inspector, schema, errors
-                ).items():
+                for base_name, columns_info in columns_by_schema[schema].items():
                     # Preserve the historical key shape: bare name in the
                     # default schema, `schema.table` anywhere else.
                     qualified = (
@@ -574,7 +655,51 @@ class SqlalchemySource(Source, ABC):
             )
             return [None]
 
-    def _columns_by_table(self, inspector, schema, errors: List[str]) -> Dict[str, Any]:
+    def _columns_by_schema(
+        self, inspector, schemas: List[Optional[str]], errors: List[str], max_workers: int = 1
+    ) -> Dict[Optional[str], Dict[str, Any]]:
+        """``{schema: {table_name: [column_info, ...]}}`` for every scanned schema.
+
+        With several schemas and workers, schemas are reflected in parallel,
+        each on its own inspector and connection; a single schema hands the
+        workers to ``_columns_by_table`` for its per-table fallback instead.
+        Errors are appended in schema order either way.
+        """
+        from sqlalchemy import inspect
+
+        workers = min(max_workers, self._connection_capacity())
+        if workers <= 1 or len(schemas) <= 1:
+            return {
+                schema: self._columns_by_table(inspector, schema, errors, max_workers=workers)
+                for schema in schemas
+            }
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def reflect(schema):
+            schema_errors = []
+            columns = self._columns_by_table(inspect(inspector.engine), schema, schema_errors)
+            return columns, schema_errors
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(schemas))) as executor:
+            reflected = _map_in_context(executor, reflect, schemas)
+        columns_by_schema = {}
+        for schema, (columns, schema_errors) in zip(schemas, reflected):
+            columns_by_schema[schema] = columns
+            errors.extend(schema_errors)
+        return columns_by_schema
+
+    def _connection_capacity(self) -> float:
+        """Most connections this source should have open at once."""
+        limits = [self.max_concurrent_queries or float("inf")]
+        pool_size = getattr(self, "connection_pool_size", None)
+        if pool_size:
+            limits.append(pool_size + (self.max_overflow if self.max_overflow is not None else 10))
+        return min(limits)
+
+    def _columns_by_table(
+        self, inspector, schema, errors: List[str], max_workers: int = 1
+    ) -> Dict[str, Any]:
         """``{table_name: [column_info, ...]}`` for one schema.
 
         Prefers ``get_multi_columns`` — one round trip for the whole schema
@@ -591,6 +716,8 @@ class SqlalchemySource(Source, ABC):
         without this fallback turns "slow" into "broken" on exactly those
         servers.
         """
+        from sqlalchemy import inspect
+
         try:
             multi = inspector.get_multi_columns(schema=schema)
             return {table: cols for (_schema, table), cols in multi.items() if cols}
@@ -610,17 +737,33 @@ class SqlalchemySource(Source, ABC):
             )
             return columns
 
+        def reflect(table):
+            # A fresh inspector per table when tables are reflected in
+            # parallel: an Inspector caches into a plain dict and is not meant
+            # to be shared across threads.
+            table_inspector = inspector if max_workers <= 1 else inspect(inspector.engine)
+            try:
+                return table_inspector.get_columns(table, schema=schema), None
+            except Exception as e:
+                return None, e
+
+        if max_workers > 1 and len(table_names) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(table_names))) as executor:
+                reflected = _map_in_context(executor, reflect, table_names)
+        else:
+            reflected = [reflect(table) for table in table_names]
+
         # Grouped by reason rather than reported per table. When an account
         # cannot reflect ANY table — the usual cause, one missing catalog
         # grant — a per-table message repeats the same sentence once per
         # table: 186 identical lines for one schema, which is unreadable
         # wherever it lands.
         failures: Dict[str, List[str]] = {}
-        for table in table_names:
-            try:
-                cols = inspector.get_columns(table, schema=schema)
-            except Exception as e:
-                failures.setdefault(self._concise_error(e), []).append(table)
+        for table, (cols, error) in zip(table_names, reflected):
+            if error is not None:
+                failures.setdefault(self._concise_error(error), []).append(table)
                 continue
             if cols:
                 columns[table] = cols
@@ -794,6 +937,8 @@ class SqlalchemySource(Source, ABC):
 
     def get_schemas(self, database_name: str) -> List[str]:
         """Return list of schema names, filtering system schemas."""
+        from sqlalchemy import text, inspect
+
         with self.connect() as connection:
             dialect = connection.engine.dialect.name
 
@@ -811,6 +956,8 @@ class SqlalchemySource(Source, ABC):
         self, database_name: str, schema_name: Optional[str] = None
     ) -> List[Dict[str, str]]:
         """Return list of tables and views with type info."""
+        from sqlalchemy import text, inspect
+
         with self.connect() as connection:
             dialect = connection.engine.dialect.name
 
@@ -833,6 +980,8 @@ class SqlalchemySource(Source, ABC):
         self, database_name: str, table_name: str, schema_name: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Return list of columns with type and nullable info."""
+        from sqlalchemy import text, inspect
+
         with self.connect() as connection:
             dialect = connection.engine.dialect.name
 
@@ -1,7 +1,7 @@
 from typing import List, Literal, Optional, Any
 from visivo.models.base.base_model import BaseModel
 from visivo.models.sources.sqlalchemy_source import SqlalchemySource
-from visivo.models.sources.source import ServerSource
+from visivo.models.sources.source import ServerSource, file_fingerprint
 from pydantic import Field
 from visivo.logger.logger import Logger
 
@@ -72,6 +72,10 @@ class SqliteSource(ServerSource, SqlalchemySource):
     def get_dialect(self):
         return "sqlite"
 
+    def schema_fingerprint(self):
+        databases = [self.database] + [a.source.database for a in self.attach or []]
+        return file_fingerprint(p for db in map(str, databases) for p in (db, f"{db}-wal"))
+
     def list_databases(self):
         """List databases for SQLite source.
 
@@ -1,5 +1,5 @@
 from deepmerge import always_merger
-from typing import Dict, List
+from typing import Any, Dict, List
 from pathlib import Path
 from pydantic import ValidationError
 from visivo.parsers.line_validation_error import LineValidationError
@@ -9,10 +9,21 @@ from visivo.models.project import Project
 
 
 class CoreParser:
-    def __init__(self, project_file: Path, files: List[Path], default_source: str = None):
+    def __init__(
+        self,
+        project_file: Path,
+        files: List[Path],
+        default_source: str = None,
+        loaded_files: Dict[str, Any] = None,
+        parsed_files=None,
+    ):
         self.files = files
         self.project_file = project_file
         self.default_source = default_source
+        # YAML already parsed during discovery, keyed by path. Each entry is
+        # used once: merging mutates it, so a second parse reads the file again.
+        self.loaded_files = dict(loaded_files or {})
+        self.parsed_files = parsed_files
         setup_yaml_ordered_dict()
 
     def parse(self) -> Project:
@@ -22,7 +33,14 @@ class CoreParser:
         return self.__merged_project_data()
 
     def project_file_data(self):
-        return load_yaml_file(self.project_file)
+        return self.__load(self.project_file)
+
+    def __load(self, file):
+        if str(file) in self.loaded_files:
+            return self.loaded_files.pop(str(file))
+        if self.parsed_files is not None:
+            return self.parsed_files.load(file)
+        return load_yaml_file(file)
 
     def __build_project(self):
         data = self.__merged_project_data()
@@ -44,7 +62,7 @@ class CoreParser:
         for file in self.files:
             if file == self.project_file:
                 continue
-            data_files[file] = load_yaml_file(file)
+            data_files[file] = self.__load(file)
 
         return self.__merge_data_into_project(project_data=project_data, data_files=data_files)
 
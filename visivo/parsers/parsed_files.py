@@ -0,0 +1,49 @@
+"""Parsed YAML files kept between ``serve`` reloads.
+
+A reload used to read and parse every YAML file the project includes, though
+the watcher only saw one of them change. ``ParsedFiles`` keeps what each file
+parsed to, with the size and mtime it had; discovery and the parser load files
+through it, so a reload parses only the files that changed and deep-copies the
+rest (merging adds file paths to the loaded data, so it cannot be shared).
+
+The watcher's changed paths are dropped with ``invalidate`` before the reload,
+so an edit is picked up even when it leaves the size and mtime as they were.
+"""
+
+import copy
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from visivo.utils import load_yaml_file
+
+
+def _stat(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class ParsedFiles:
+    def __init__(self):
+        self._files: Dict[str, Tuple[List[int], object]] = {}
+        self.reads = 0
+
+    def load(self, file):
+        """What ``file`` parses to, read again only when it changed."""
+        path = os.path.abspath(str(file))
+        stat = _stat(path)
+        cached = self._files.get(path)
+        if cached is not None and stat is not None and cached[0] == stat:
+            return copy.deepcopy(cached[1])
+
+        data = load_yaml_file(file)
+        self.reads += 1
+        if stat is not None:
+            self._files[path] = (stat, copy.deepcopy(data))
+        return data
+
+    def invalidate(self, paths: Iterable[str]):
+        for path in paths:
+            self._files.pop(os.path.abspath(str(path)), None)
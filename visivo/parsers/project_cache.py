@@ -0,0 +1,120 @@
+"""Compiled-project cache — the validated ``Project`` from the last parse.
+
+Parsing reads every YAML file the project includes, deep-merges them and
+validates the whole ``Project`` with Pydantic, on every ``run``, ``dist`` and
+serve reload. When none of the inputs have changed the result is the same, so
+the validated project is pickled to ``{output_dir}/project_cache.pickle`` and
+loaded from there instead.
+
+The cache is valid while all of these match what they were when it was written:
+
+* the size and mtime of every project file (the project file, its includes,
+  the profile and any dbt output);
+* the mtime of every directory an include walked, which changes when a YAML
+  file is added to or removed from it;
+* the values of the ``${env.X}`` variables those files reference (stored as a
+  hash, never the values themselves);
+* the ``default_source`` passed on the command line and the Visivo version.
+
+Any mismatch, or a cache that cannot be read, means a full parse.
+"""
+
+import hashlib
+import os
+import pickle
+from typing import Dict, Iterable, List, Optional
+
+from visivo.logger.logger import Logger
+from visivo.parsers.env_var_resolver import extract_env_var_refs
+from visivo.version import VISIVO_VERSION
+
+CACHE_FILE_NAME = "project_cache.pickle"
+CACHE_VERSION = 1
+
+
+def _stat(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _env_hash(names: Iterable[str]) -> str:
+    digest = hashlib.sha256()
+    for name in sorted(names):
+        value = os.environ.get(name)
+        digest.update(f"{name}={'' if value is None else value}\0".encode())
+    return digest.hexdigest()
+
+
+class ProjectCache:
+    def __init__(self, output_dir: str):
+        self.path = f"{output_dir}/{CACHE_FILE_NAME}"
+
+    def load(self, default_source: str = None):
+        """The cached project, or ``None`` when any input has changed."""
+        try:
+            with open(self.path, "rb") as fp:
+                entry = pickle.load(fp)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            Logger.instance().debug(f"Ignoring unreadable project cache: {e}")
+            return None
+        if not isinstance(entry, dict) or entry.get("key") != self._static_key(default_source):
+            return None
+        if any(_stat(path) != stat for path, stat in entry["stats"].items()):
+            return None
+        if _env_hash(entry["env_vars"]) != entry["env_hash"]:
+            return None
+        try:
+            return pickle.loads(entry["project"])
+        except Exception as e:
+            Logger.instance().debug(f"Ignoring unreadable project cache: {e}")
+            return None
+
+    def save(self, project, files: List[str], watched: List[str], default_source: str = None):
+        """Store ``project``, parsed from ``files``, for the next parse to reuse.
+
+        ``watched`` are further paths whose size or mtime invalidate the cache:
+        include directories, and files that may appear later such as the profile.
+        """
+        paths = [str(path) for path in files] + [str(path) for path in watched]
+        env_vars = set()
+        for path in files:
+            try:
+                with open(path) as fp:
+                    env_vars |= extract_env_var_refs(fp.read())
+            except OSError:
+                continue
+
+        # The DAG is rebuilt on first use; its node sets hash models by name,
+        # which cannot be done while they are being unpickled.
+        snapshot = project.model_copy()
+        snapshot._cached_dag = None
+        try:
+            pickled = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            Logger.instance().debug(f"Project could not be cached: {e}")
+            return
+
+        entry = {
+            "key": self._static_key(default_source),
+            "stats": {path: _stat(path) for path in paths},
+            "env_vars": sorted(env_vars),
+            "env_hash": _env_hash(env_vars),
+            "project": pickled,
+        }
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        partial_path = f"{self.path}.partial"
+        with open(partial_path, "wb") as fp:
+            pickle.dump(entry, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(partial_path, self.path)
+
+    def _static_key(self, default_source: Optional[str]) -> Dict[str, object]:
+        return {
+            "version": CACHE_VERSION,
+            "visivo_version": VISIVO_VERSION,
+            "default_source": default_source,
+        }
@@ -4,8 +4,72 @@ import base64
 from collections import defaultdict
 from decimal import Decimal
 from datetime import datetime, date, time
+import click
 from visivo.logger.logger import Logger
 
+# How aggregated data is written: indented JSON (the default), JSON without
+# whitespace, or an Arrow IPC file with one row per cohort.
+OUTPUT_FORMATS = ("json", "compact-json", "arrow")
+
+_GROUP_SIZE_COLUMN = "__visivo_group_size"
+
+
+def json_default(obj):
+    """``json.dump`` hook for values JSON has no type for.
+
+    Gives the same results as ``Aggregator._make_json_serializable`` but is
+    only called for those values, instead of walking every value first.
+    """
+    if isinstance(obj, bytes):
+        return base64.b64encode(obj).decode("utf-8")
+    elif isinstance(obj, Decimal):
+        return float(obj)
+    elif isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def write_json(result, path: str, output_format: str = "json"):
+    # json.dumps runs entirely in the C encoder; json.dump to a file does not
+    if output_format == "compact-json":
+        contents = json.dumps(result, default=json_default, separators=(",", ":"))
+    else:
+        contents = json.dumps(result, default=json_default, indent=4)
+    with open(path, "w") as fp:
+        fp.write(contents)
+
+
+def uniform_column_types(rows: list, columns) -> bool:
+    """Whether each column holds one Python type, so a Polars frame built from
+    ``rows`` returns every value as it was given.
+
+    Polars coerces mixed columns - ints among floats become floats, numbers
+    among strings become strings - which would change the written values.
+    """
+    for column in columns:
+        types = {type(row[column]) for row in rows}
+        types.discard(type(None))
+        if len(types) > 1 or dict in types:
+            return False
+        if list in types:
+            inner = {type(value) for row in rows if row[column] for value in row[column]}
+            inner.discard(type(None))
+            if len(inner) > 1 or inner & {list, dict}:
+                return False
+        if datetime in types:
+            first = next(row[column] for row in rows if row[column] is not None)
+            if first.tzinfo is not None:
+                return False
+    return True
+
+
+def frame_from_rows(rows: list, columns):
+    """A Polars frame of ``rows``, built column by column, which is several
+    times faster than handing Polars the row dicts."""
+    import polars as pl
+
+    return pl.DataFrame({column: [row[column] for row in rows] for column in columns})
+
 
 class Aggregator:
     @staticmethod
@@ -35,24 +99,22 @@ class Aggregator:
             return str(obj)
 
     @classmethod
-    def aggregate(cls, json_file: str, trace_dir: str):
+    def aggregate(cls, json_file: str, trace_dir: str, output_format: str = "json"):
         # Read JSON file directly with Python instead of Polars
         with open(json_file, "r") as f:
             data = json.load(f)
 
-        # Convert column names (replace | with .)
-        for row in data:
-            renamed_row = {}
-            for key, value in row.items():
-                new_key = key.replace("|", ".")
-                renamed_row[new_key] = value
-            row.clear()
-            row.update(renamed_row)
-
-        cls.aggregate_data(data=data, trace_dir=trace_dir)
+        cls.aggregate_data_frame(data=data, trace_dir=trace_dir, output_format=output_format)
 
     @classmethod
-    def aggregate_data_frame(cls, data, trace_dir: str):
+    def aggregate_data_frame(cls, data, trace_dir: str, output_format: str = "json"):
+        frame = cls._to_frame(data)
+        if frame is not None:
+            # Convert column names (replace | with .) on the schema, not per row
+            frame = frame.rename({column: column.replace("|", ".") for column in frame.columns})
+            cls._write_frame(frame, trace_dir, output_format)
+            return
+
         for row in data:
             renamed_row = {}
             for key, value in row.items():
@@ -61,13 +123,95 @@ class Aggregator:
             row.clear()
             row.update(renamed_row)
 
-        cls.aggregate_data(data=data, trace_dir=trace_dir)
+        cls._write_rows(data, trace_dir, output_format)
 
     @classmethod
-    def aggregate_data(cls, data: list, trace_dir: str):
+    def aggregate_data(cls, data: list, trace_dir: str, output_format: str = "json"):
         """
-        Pure Python aggregation that groups by cohort_on and aggregates other columns into lists
+        Groups by cohort_on and aggregates other columns into lists.
+
+        Rows with the same columns, each holding one type, are grouped with
+        Polars; anything else is grouped row by row in Python.
         """
+        frame = cls._to_frame(data)
+        if frame is not None:
+            cls._write_frame(frame, trace_dir, output_format)
+        else:
+            cls._write_rows(data, trace_dir, output_format)
+
+    @classmethod
+    def _to_frame(cls, data: list):
+        """``data`` as a Polars frame, or ``None`` when it cannot be one without
+        changing a value."""
+        if not data:
+            return None
+        columns = data[0].keys()
+        if "cohort_on" not in columns or any(row.keys() != columns for row in data):
+            return None
+        if not uniform_column_types(data, columns):
+            return None
+        try:
+            return frame_from_rows(data, columns)
+        except Exception as e:
+            Logger.instance().debug(f"Aggregating row by row, rows do not form a frame: {e}")
+            return None
+
+    @classmethod
+    def _group_frame(cls, frame):
+        import polars as pl
+
+        # Vectorized conversions for types JSON has none for; the rest are
+        # converted by json_default as they are written
+        conversions = []
+        for column, dtype in frame.schema.items():
+            if column == "cohort_on":
+                continue
+            if isinstance(dtype, pl.Decimal):
+                conversions.append(pl.col(column).cast(pl.Float64))
+            elif dtype == pl.Binary:
+                conversions.append(pl.col(column).bin.encode("base64"))
+            elif dtype == pl.Date:
+                conversions.append(pl.col(column).dt.to_string("%Y-%m-%d"))
+        if conversions:
+            frame = frame.with_columns(conversions)
+
+        return (
+            frame.filter(pl.col("cohort_on").is_not_null())
+            .group_by("cohort_on", maintain_order=True)
+            .agg(pl.all(), pl.len().alias(_GROUP_SIZE_COLUMN))
+        )
+
+    @classmethod
+    def _write_frame(cls, frame, trace_dir: str, output_format: str):
+        import polars as pl
+
+        grouped = cls._group_frame(frame)
+        os.makedirs(trace_dir, exist_ok=True)
+        if output_format == "arrow":
+            grouped.drop(_GROUP_SIZE_COLUMN).write_ipc(f"{trace_dir}/data.arrow")
+            return
+
+        list_columns = {
+            column for column, dtype in frame.schema.items() if isinstance(dtype, pl.List)
+        }
+        result = {}
+        for row in grouped.iter_rows(named=True):
+            cohort = row.pop("cohort_on")
+            single = row.pop(_GROUP_SIZE_COLUMN) == 1
+            for column in list_columns:
+                # If there's only one value and it is a list, unwrap it from the list
+                if single and row[column][0] is not None:
+                    row[column] = row[column][0]
+            result[cohort] = row
+        write_json(result, f"{trace_dir}/data.json", output_format)
+
+    @classmethod
+    def _write_rows(cls, data: list, trace_dir: str, output_format: str):
+        if output_format == "arrow":
+            raise click.ClickException(
+                "Rows with differing columns or mixed value types cannot be written as Arrow IPC."
+            )
+
         # Group data by cohort_on
         grouped = defaultdict(list)
         for row in data:
@@ -103,10 +247,5 @@ class Aggregator:
 
             result[cohort] = aggregated_row
 
-        # Make result JSON-serializable (handles bytes, etc.)
-        json_safe_result = cls._make_json_serializable(result)
-
-        # Write result to JSON file
         os.makedirs(trace_dir, exist_ok=True)
-        with open(f"{trace_dir}/data.json", "w") as fp:
-            json.dump(json_safe_result, fp, indent=4)
+        write_json(result, f"{trace_dir}/data.json", output_format)
@@ -1,27 +1,45 @@
 """
 Cached schema provider for efficient SQLGlot schema operations.
 
-Builds DataType objects ONCE per source and provides filtered views,
-eliminating redundant DataType.build() calls across multiple model jobs.
+Builds each table's DataType objects the first time a model asks for it and
+provides filtered views, so a source's tables are built at most once per run
+and tables no model reads are never built.
 """
 
-from typing import Dict, Set, Optional, Any
+import hashlib
+import json
+from threading import Lock
+from typing import Dict, Iterable, List, Set, Optional, Any
 from sqlglot import exp
+from sqlglot.schema import MappingSchema
 
-from visivo.logger.logger import Logger
+from visivo.query.source_schema_store import SourceSchemaStore, TableRow, schema_tables
+from visivo.query.sqlglot_type_mapper import SqlglotTypeMapper
+
+
+def schema_fingerprint(stored_schema: Dict[str, Any]) -> str:
+    """Hash of a stored schema's ``sqlglot_schema`` block."""
+    return hashlib.sha256(
+        json.dumps(stored_schema.get("sqlglot_schema", {}), sort_keys=True).encode()
+    ).hexdigest()
 
 
 class CachedMappingSchemaProvider:
     """
-    Builds DataTypes ONCE from stored schema, provides filtered views.
+    Builds DataTypes once per table, on first use, and provides filtered views.
 
     Performance optimization: Instead of calling exp.DataType.build() for every
     column across every model (O(n*m) where n=models, m=columns), this class
-    builds all DataTypes once (O(m)) and provides O(t) filtered views where
-    t is typically 1-5 tables per query.
+    builds a table's DataTypes the first time it is asked for and provides O(t)
+    filtered views where t is typically 1-5 tables per query. Type strings are
+    parsed once per dialect (``SqlglotTypeMapper.build_type``).
+
+    Tables are read from the stored schema dict, or with ``from_store`` from
+    the source's indexed schema store, which reads only the tables asked for.
 
     Attributes:
         default_schema: Default schema name for unqualified table references
+        fingerprint: Hash of the stored schema, for caches keyed on its contents
     """
 
     def __init__(self, stored_schema: Dict[str, Any], dialect: Optional[str] = None):
@@ -32,100 +50,108 @@ class CachedMappingSchemaProvider:
             stored_schema: Schema data dict with "sqlglot_schema" and "metadata" keys
             dialect: SQLGlot dialect for parsing types (e.g., "snowflake")
         """
+        is_nested, rows = schema_tables(stored_schema.get("sqlglot_schema", {}))
+        self._rows_by_table: Dict[str, List[TableRow]] = {}
+        for row in rows:
+            self._rows_by_table.setdefault(row[1], []).append(row)
+        self._store: Optional[SourceSchemaStore] = None
+        self._setup(
+            dialect=dialect,
+            is_nested=is_nested,
+            default_schema=stored_schema.get("metadata", {}).get("default_schema"),
+            fingerprint=schema_fingerprint(stored_schema),
+            table_count=len(rows),
+            column_count=sum(len(columns) for _, _, columns in rows),
+        )
+
+    @classmethod
+    def from_store(
+        cls, store: SourceSchemaStore, dialect: Optional[str] = None
+    ) -> "CachedMappingSchemaProvider":
+        """A provider reading tables from ``store`` as models ask for them."""
+        provider = cls.__new__(cls)
+        provider._rows_by_table = {}
+        provider._store = store
+        provider._setup(
+            dialect=dialect,
+            is_nested=store.is_nested,
+            default_schema=store.default_schema,
+            fingerprint=store.fingerprint,
+            table_count=store.table_count,
+            column_count=store.column_count,
+        )
+        return provider
+
+    def _setup(
+        self,
+        dialect: Optional[str],
+        is_nested: bool,
+        default_schema: Optional[str],
+        fingerprint: str,
+        table_count: int,
+        column_count: int,
+    ) -> None:
         self._flat_schema: Dict[str, Dict[str, exp.DataType]] = {}
         self._nested_schema: Dict[str, Dict[str, Dict[str, exp.DataType]]] = {}
-        self._is_nested: bool = False
+        self._is_nested: bool = is_nested
         self._dialect = dialect
-
-        # Extract default schema from metadata
-        self.default_schema: Optional[str] = stored_schema.get("metadata", {}).get("default_schema")
-
-        # Build index from stored schema
-        self._build_index(stored_schema)
-
-    def _build_index(self, stored_schema: Dict[str, Any]) -> None:
-        """
-        Build DataType objects from stored schema.
-
-        Called ONCE per source, building all DataType objects upfront
-        so they can be reused across multiple model schema operations.
-
-        Args:
-            stored_schema: Schema data with "sqlglot_schema" key
-        """
-        sqlglot_schema_data = stored_schema.get("sqlglot_schema", {})
-
-        if not sqlglot_schema_data:
-            Logger.instance().debug("No sqlglot_schema data found in stored schema")
-            return
-
-        # Determine structure: nested {schema: {table: {col: type}}} or flat {table: {col: type}}
-        first_key = next(iter(sqlglot_schema_data.keys()), None)
-        if first_key is None:
+        self.default_schema: Optional[str] = default_schema
+        self.fingerprint: str = fingerprint
+        self._table_count = table_count
+        self._column_count = column_count
+
+        # Table names already looked up, found or not
+        self._loaded: Set[str] = set()
+        self._fully_loaded = False
+        self._load_lock = Lock()
+
+        # MappingSchemas normalize every identifier when built, so each one
+        # handed out is built once and shared by every model asking for it
+        self._mapping_schemas: Dict[tuple, MappingSchema] = {}
+        self._mapping_schemas_lock = Lock()
+
+    def _read_tables(self, table_names: Optional[List[str]]) -> Iterable[TableRow]:
+        """Rows of ``table_names``, or of every table when None."""
+        if self._store is not None:
+            if table_names is None:
+                return self._store.all_tables()
+            return self._store.tables(table_names)
+        if table_names is None:
+            return [row for rows in self._rows_by_table.values() for row in rows]
+        return [row for name in table_names for row in self._rows_by_table.get(name, ())]
+
+    def _load(self, table_names: Optional[Iterable[str]] = None) -> None:
+        """Build the DataTypes of ``table_names`` (every table when None) not built yet."""
+        if self._fully_loaded:
             return
-
-        first_value = sqlglot_schema_data.get(first_key)
-        if not isinstance(first_value, dict):
+        missing = None if table_names is None else [n for n in table_names if n not in self._loaded]
+        if missing == []:
             return
 
-        # Check if nested by examining first value's values
-        sample_val = next(iter(first_value.values()), None) if first_value else None
-
-        if isinstance(sample_val, dict):
-            # Nested structure: {schema_name: {table_name: {col_name: type_str}}}
-            self._is_nested = True
-            self._build_nested_index(sqlglot_schema_data)
-        else:
-            # Flat structure: {table_name: {col_name: type_str}}
-            self._is_nested = False
-            self._build_flat_index(sqlglot_schema_data)
-
-    def _build_flat_index(self, schema_data: Dict[str, Dict[str, str]]) -> None:
-        """Build index for flat schema structure."""
-        for table_name, columns in schema_data.items():
-            if not isinstance(columns, dict):
-                continue
-
-            self._flat_schema[table_name] = {}
-            for col_name, col_type_str in columns.items():
-                try:
-                    self._flat_schema[table_name][col_name] = exp.DataType.build(
-                        col_type_str, dialect=self._dialect
-                    )
-                except Exception as e:
-                    Logger.instance().debug(
-                        f"Error parsing type '{col_type_str}' for {table_name}.{col_name}, "
-                        f"using VARCHAR: {e}"
-                    )
-                    self._flat_schema[table_name][col_name] = exp.DataType.build("VARCHAR")
-
-    def _build_nested_index(self, schema_data: Dict[str, Dict[str, Dict[str, str]]]) -> None:
-        """Build index for nested schema structure."""
-        for schema_name, tables in schema_data.items():
-            if not isinstance(tables, dict):
-                continue
-
-            if schema_name not in self._nested_schema:
-                self._nested_schema[schema_name] = {}
-
-            for table_name, columns in tables.items():
-                if not isinstance(columns, dict):
+        with self._load_lock:
+            if self._fully_loaded:
+                return
+            if missing is not None:
+                missing = [name for name in missing if name not in self._loaded]
+                if not missing:
+                    return
+            for schema_name, table_name, columns in self._read_tables(missing):
+                tables = (
+                    self._flat_schema
+                    if schema_name is None
+                    else self._nested_schema.setdefault(schema_name, {})
+                )
+                if table_name in tables:
                     continue
-
-                self._nested_schema[schema_name][table_name] = {}
-                for col_name, col_type_str in columns.items():
-                    try:
-                        self._nested_schema[schema_name][table_name][col_name] = exp.DataType.build(
-                            col_type_str, dialect=self._dialect
-                        )
-                    except Exception as e:
-                        Logger.instance().debug(
-                            f"Error parsing type '{col_type_str}' for "
-                            f"{schema_name}.{table_name}.{col_name}, using VARCHAR: {e}"
-                        )
-                        self._nested_schema[schema_name][table_name][col_name] = exp.DataType.build(
-                            "VARCHAR"
-                        )
+                column_types = {
+                    col_name: SqlglotTypeMapper.build_type(col_type, dialect=self._dialect)
+                    for col_name, col_type in columns.items()
+                }
+                tables[table_name] = column_types
+            if missing is None:
+                self._fully_loaded = True
+            else:
+                self._loaded.update(missing)
 
     def get_filtered_schema(
         self, tables: Set[str], schema_names: Optional[Set[str]] = None
@@ -133,8 +159,8 @@ class CachedMappingSchemaProvider:
         """
         Return schema filtered to only requested tables.
 
-        O(t) operation where t is the number of requested tables (typically 1-5),
-        no DataType.build() calls - just reference copying.
+        O(t) operation where t is the number of requested tables (typically 1-5):
+        tables are built on their first request, later calls copy references.
 
         Args:
             tables: Set of table names to include (without schema prefix)
@@ -145,6 +171,7 @@ class CachedMappingSchemaProvider:
             - Flat: {table: {col: DataType}}
             - Nested: {schema: {table: {col: DataType}}}
         """
+        self._load(tables)
         if self._is_nested:
             return self._get_filtered_nested_schema(tables, schema_names)
         else:
@@ -186,6 +213,36 @@ class CachedMappingSchemaProvider:
 
         return result
 
+    def get_mapping_schema(
+        self, tables: Optional[Set[str]] = None, schema_names: Optional[Set[str]] = None
+    ) -> MappingSchema:
+        """
+        Return a prebuilt MappingSchema of ``get_filtered_schema(tables, schema_names)``,
+        or of the full schema when ``tables`` is empty.
+
+        Built on first request for a given table set and shared afterwards.
+        Callers must not add tables to it.
+        """
+        key = self.mapping_schema_key(tables, schema_names)
+        mapping_schema = self._mapping_schemas.get(key)
+        if mapping_schema is None:
+            if tables:
+                schema = self.get_filtered_schema(tables, schema_names)
+            else:
+                schema = self.get_full_schema()
+            mapping_schema = MappingSchema(schema=schema)
+            with self._mapping_schemas_lock:
+                mapping_schema = self._mapping_schemas.setdefault(key, mapping_schema)
+        return mapping_schema
+
+    def mapping_schema_key(
+        self, tables: Optional[Set[str]] = None, schema_names: Optional[Set[str]] = None
+    ) -> tuple:
+        """Identifies what ``get_mapping_schema`` returns for these arguments."""
+        if not tables:
+            return ()
+        return (tuple(sorted(tables)), tuple(sorted(schema_names or ())))
+
     def get_full_schema(self) -> Dict[str, Any]:
         """
         Return the complete cached schema.
@@ -195,6 +252,7 @@ class CachedMappingSchemaProvider:
         Returns:
             Complete schema dict with pre-built DataType objects
         """
+        self._load()
         if self._is_nested:
             return self._nested_schema
         else:
@@ -208,20 +266,14 @@ class CachedMappingSchemaProvider:
     @property
     def table_count(self) -> int:
         """Total number of tables in the schema."""
-        if self._is_nested:
-            return sum(len(tables) for tables in self._nested_schema.values())
-        else:
-            return len(self._flat_schema)
+        return self._table_count
 
     @property
     def column_count(self) -> int:
         """Total number of columns across all tables."""
-        count = 0
-        if self._is_nested:
-            for tables in self._nested_schema.values():
-                for columns in tables.values():
-                    count += len(columns)
-        else:
-            for columns in self._flat_schema.values():
-                count += len(columns)
-        return count
+        return self._column_count
+
+    def close(self) -> None:
+        """Close the schema store the provider reads tables from, if any."""
+        if self._store is not None:
+            self._store.close()
@@ -4,14 +4,15 @@ SQLGlot validation with input sampling for dynamic insights.
 Validates insight queries with real input values BEFORE runtime by:
 1. Loading input options from JSON files
 2. Generating combinations of input values (sampling if >96)
-3. Injecting values into SQL queries
-4. Validating each query variant with SQLGlot
+3. Grouping combinations whose values cannot change how the query parses
+4. Injecting one combination per group into the SQL query
+5. Validating each query variant with SQLGlot
 """
 
 import json
 import re
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple
 from itertools import product
 import random
 
@@ -32,6 +33,7 @@ from visivo.models.base.project_dag import ProjectDag
 from visivo.models.dag import all_descendants_of_type
 
 MAX_COMBINATIONS = 96
+NUMBER_PATTERN = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
 
 
 def get_input_options(input_obj: Input, output_dir: str) -> List[str]:
@@ -180,6 +182,57 @@ def generate_input_combinations(inputs: Dict[str, List[str]]) -> List[Dict[str,
     return combinations
 
 
+def multi_select_accessor_values(options: List[str]) -> Dict[str, str]:
+    """Values for a multi-select's accessors, which depend only on its options."""
+    # .values is a pre-quoted SQL list for use in IN clauses
+    # e.g., ["Category A", "Category B"] => "'Category A','Category B'"
+    # Single quotes in values are escaped by doubling (SQL standard)
+    sample_options = options[:2] if len(options) >= 2 else options
+    quoted_options = ["'" + str(opt).replace("'", "''") + "'" for opt in sample_options]
+
+    # Sorted options give the actual .min/.max values; sorting works for both
+    # numeric strings and ISO date strings
+    sorted_options = sorted(options)
+    return {
+        "values": ",".join(quoted_options),
+        "first": options[0],
+        "last": options[-1],
+        "min": sorted_options[0],
+        "max": sorted_options[-1],
+    }
+
+
+def quoted_placeholder_names(query: str) -> Set[Tuple[str, str]]:
+    """``(input_name, accessor)`` pairs whose every placeholder sits inside a
+    string literal, as in ``'${region.value}'``."""
+    quoted = set()
+    bare = set()
+    for pattern in (INPUT_FRONTEND_PATTERN, INPUT_ACCESSOR_PATTERN):
+        for match in re.finditer(pattern, query):
+            key = (match.group(1), match.group(2))
+            before = query[match.start() - 1 : match.start()]
+            after = query[match.end() : match.end() + 1]
+            (quoted if before == "'" and after == "'" else bare).add(key)
+    return quoted - bare
+
+
+def value_class(value: str, quoted: bool):
+    """What a value injected into the query can do to its parse.
+
+    Inside a string literal any value without a quote or backslash only
+    changes the literal's text, and any plain number parses as a number
+    literal. Other values may change the query's shape, so each is its own
+    class and is validated on its own.
+    """
+    value = str(value)
+    if quoted:
+        if "'" not in value and "\\" not in value:
+            return "text"
+    elif NUMBER_PATTERN.match(value):
+        return "number"
+    return ("value", value)
+
+
 def validate_insight_with_inputs(
     insight: Insight, query: str, dag: ProjectDag, output_dir: str, dialect: str = "duckdb"
 ) -> None:
@@ -235,38 +288,40 @@ def validate_insight_with_inputs(
         logger.debug(f"No combinations to validate for insight '{insight.name}'")
         return
 
-    logger.info(f"Validating insight '{insight.name}' with {len(combinations)} combinations...")
-
-    # For each combination, build the accessor values and validate
+    # Multi-select accessors do not depend on the combination, so they are
+    # worked out once per input rather than once per combination
+    multi_select_values = {
+        input_name: multi_select_accessor_values(inputs_dict[input_name])
+        for input_name in input_names
+        if input_types[input_name] != "single-select"
+    }
+
+    # Combinations whose values parse the same way validate the same way, so
+    # only the first combination of each shape is parsed
+    quoted_placeholders = quoted_placeholder_names(query)
+    shapes = {}
     for i, combo in enumerate(combinations):
+        shape = tuple(
+            (input_name, value_class(value, (input_name, "value") in quoted_placeholders))
+            for input_name, value in combo.items()
+            if input_types[input_name] == "single-select"
+        )
+        shapes.setdefault(shape, i)
+
+    logger.info(
+        f"Validating insight '{insight.name}' with {len(combinations)} combinations "
+        f"({len(shapes)} distinct)..."
+    )
+
+    for i in shapes.values():
+        combo = combinations[i]
         # Build accessor values for this combination
         accessor_values = {}
         for input_name, value in combo.items():
-            input_type = input_types[input_name]
-            accessor_values[input_name] = {}
-
-            if input_type == "single-select":
-                accessor_values[input_name]["value"] = value
+            if input_types[input_name] == "single-select":
+                accessor_values[input_name] = {"value": value}
             else:
-                # Multi-select - compute realistic accessor values
-                options = inputs_dict[input_name]
-
-                # .values is a pre-quoted SQL list for use in IN clauses
-                # e.g., ["Category A", "Category B"] => "'Category A','Category B'"
-                # Single quotes in values are escaped by doubling (SQL standard)
-                sample_options = options[:2] if len(options) >= 2 else options
-                quoted_options = ["'" + str(opt).replace("'", "''") + "'" for opt in sample_options]
-                accessor_values[input_name]["values"] = ",".join(quoted_options)
-
-                # Use first/last options for .first/.last accessors
-                accessor_values[input_name]["first"] = options[0] if options else value
-                accessor_values[input_name]["last"] = options[-1] if options else value
-
-                # Use sorted options for .min/.max to get actual min/max values
-                # Sorting works for both numeric strings and ISO date strings
-                sorted_options = sorted(options)
-                accessor_values[input_name]["min"] = sorted_options[0] if sorted_options else value
-                accessor_values[input_name]["max"] = sorted_options[-1] if sorted_options else value
+                accessor_values[input_name] = multi_select_values[input_name]
 
         # Inject values into query
         query_with_values = inject_input_accessor_values(query, accessor_values)
@@ -276,17 +331,14 @@ def validate_insight_with_inputs(
             "input_values": combo,
         }
 
-        try:
-            validate_query(
-                query_sql=query_with_values,
-                dialect=dialect,
-                insight_name=insight.name,
-                query_type=f"post_query (combination {i + 1}/{len(combinations)})",
-                context=context,
-                raise_on_error=True,
-            )
-        except Exception:
-            raise
+        validate_query(
+            query_sql=query_with_values,
+            dialect=dialect,
+            insight_name=insight.name,
+            query_type=f"post_query (combination {i + 1}/{len(combinations)})",
+            context=context,
+            raise_on_error=True,
+        )
 
     logger.info(
         f"Validation passed for insight '{insight.name}' ({len(combinations)} combinations)"
@@ -2,9 +2,10 @@
 (Explore 2.0 Phase 4 — see
 specs/plan/explorer-workspace-unification/research/s2-draft-rendering-decision.md).
 
-Reuses the exact ``deepcopy(project) -> inject_cached_objects() ->
-invalidate_dag_cache()`` overlay pattern ``save_run_executor.py`` already runs
-on every project save, plus the recovered pre-#507 ``_inject_context_objects``
+Reuses the ``deepcopy(project) -> inject_cached_objects() ->
+invalidate_dag_cache()`` overlay pattern ``save_run_executor.py`` ran on every
+project save before it moved to the copy-free ``overlay_cached_objects`` (drafts
+are merged into nested models here, so this keeps the deep copy), plus the recovered pre-#507 ``_inject_context_objects``
 merge-by-name logic (``git show df792c50^:visivo/server/jobs/
 preview_job_executor.py``) for objects that arrive straight off the wire and
 were never even cached in an editor session — a draft insight, and any
@@ -282,6 +282,7 @@ class InsightQueryBuilder:
         output_dir,
         schema_overrides: Optional[Dict[str, dict]] = None,
         force_dynamic: bool = False,
+        compilation_cache=None,
     ):
         self.logger = Logger.instance()
         self.insight = insight  # Store for placeholder replacement
@@ -309,14 +310,26 @@ class InsightQueryBuilder:
             output_dir=output_dir,
             native_dialect=self.native_dialect,
             schema_overrides=schema_overrides,
+            compilation_cache=compilation_cache,
         )
         self.field_resolver = field_resolver
+        # Only shared when nothing this builder was given changes the results
+        self.compilation_cache = None if schema_overrides else compilation_cache
         # Pass relevant_models to RelationGraph to scope relation resolution
         # This prevents resolving conditions for models that haven't been executed yet
         relevant_model_names = {m.name for m in self.models}
-        self.relation_graph = RelationGraph(
-            dag, field_resolver, relevant_models=relevant_model_names
-        )
+        if self.compilation_cache is not None:
+            # The graph is only read once built, so insights over the same
+            # models share one instead of each resolving every relation again
+            self.relation_graph = self.compilation_cache.get_or_build(
+                "relation_graph",
+                (output_dir, self.native_dialect, frozenset(relevant_model_names)),
+                lambda: RelationGraph(dag, field_resolver, relevant_models=relevant_model_names),
+            )
+        else:
+            self.relation_graph = RelationGraph(
+                dag, field_resolver, relevant_models=relevant_model_names
+            )
 
         self.main_query = None
         self.resolved_query_statements = None
@@ -838,46 +851,22 @@ class InsightQueryBuilder:
 
         for model in self.models:
             model_hash = model.name_hash()
-
-            # Load schema for this model to expand SELECT *
-            schema_data = SchemaAggregator.load_source_schema(
-                source_name=model.name, output_dir=self.output_dir
-            )
-
-            # Non-dynamic insights: Use model.sql directly
-            cte_sql = model.sql
             dialect_for_parse = self.native_dialect
 
-            # Parse the CTE SQL
-            cte_query = sqlglot.parse_one(cte_sql, read=dialect_for_parse)
-
-            # If we have schema data, use it to expand SELECT * and qualify columns
-            if schema_data and isinstance(cte_query, exp.Select):
-                # Build schema dict for SQLGlot
-                model_schema = {}
-                tables_data = schema_data.get("tables", {})
-
-                for table_name, table_info in tables_data.items():
-                    columns = {}
-                    for col_name, col_info in table_info.get("columns", {}).items():
-                        # Get the type string
-                        col_type = col_info.get("type", "VARCHAR")
-                        columns[col_name] = col_type
-                    model_schema[table_name] = columns
-
-                # Qualify the query with schema, default database, and default schema
-                try:
-                    qualified_query = qualify.qualify(
-                        cte_query,
-                        schema=model_schema,
-                        catalog=self.default_database,
-                        db=self.default_schema,
-                        dialect=dialect_for_parse,
-                    )
-                    cte_query = qualified_query
-                except Exception:
-                    # If qualification fails, use the original query
-                    pass
+            if self.compilation_cache is not None:
+                cte_query = self.compilation_cache.get_or_build(
+                    "model_cte",
+                    (
+                        self.output_dir,
+                        model_hash,
+                        dialect_for_parse,
+                        self.default_database,
+                        self.default_schema,
+                    ),
+                    lambda: self._build_model_cte_query(model),
+                ).copy()
+            else:
+                cte_query = self._build_model_cte_query(model)
 
             # For Snowflake, uppercase all alias identifiers in the CTE
             # This ensures CTE column aliases like "AS new_x" become "AS NEW_X"
@@ -900,6 +889,50 @@ class InsightQueryBuilder:
 
         return ctes
 
+    def _build_model_cte_query(self, model) -> exp.Expression:
+        """Parse ``model.sql``, qualified against its stored schema when there is one."""
+        # Load schema for this model to expand SELECT *
+        schema_data = SchemaAggregator.load_source_schema(
+            source_name=model.name, output_dir=self.output_dir
+        )
+
+        # Non-dynamic insights: Use model.sql directly
+        cte_sql = model.sql
+        dialect_for_parse = self.native_dialect
+
+        # Parse the CTE SQL
+        cte_query = sqlglot.parse_one(cte_sql, read=dialect_for_parse)
+
+        # If we have schema data, use it to expand SELECT * and qualify columns
+        if schema_data and isinstance(cte_query, exp.Select):
+            # Build schema dict for SQLGlot
+            model_schema = {}
+            tables_data = schema_data.get("tables", {})
+
+            for table_name, table_info in tables_data.items():
+                columns = {}
+                for col_name, col_info in table_info.get("columns", {}).items():
+                    # Get the type string
+                    col_type = col_info.get("type", "VARCHAR")
+                    columns[col_name] = col_type
+                model_schema[table_name] = columns
+
+            # Qualify the query with schema, default database, and default schema
+            try:
+                qualified_query = qualify.qualify(
+                    cte_query,
+                    schema=model_schema,
+                    catalog=self.default_database,
+                    db=self.default_schema,
+                    dialect=dialect_for_parse,
+                )
+                cte_query = qualified_query
+            except Exception:
+                # If qualification fails, use the original query
+                pass
+
+        return cte_query
+
     def _build_main_select(self):
         """
         Create the final select after the CTEs. Loop through resolved_query_statements filtering for props, split
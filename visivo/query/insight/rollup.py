@@ -0,0 +1,169 @@
+"""Rollups — a dynamic insight's model pre-aggregated to what its query reads.
+
+A dynamic insight's ``post_query`` runs in the viewer's DuckDB-WASM against the
+whole parquet of the model it reads, on every input change. When the query
+only aggregates with SUM, COUNT, MIN and MAX over plain columns, the model can
+be grouped ahead of time by every column the query reads outside those
+aggregates — its GROUP BY dimensions and the columns its input filters test —
+keeping one partial SUM/COUNT/MIN/MAX per group. Any filter on those columns
+keeps or drops whole groups, so re-aggregating the partials over the groups it
+keeps gives the same result as the original query over the model's rows:
+SUM of SUMs, SUM of COUNTs, MIN of MINs and MAX of MAXs.
+
+``plan_rollup`` returns the SQL that builds the rollup from the model and the
+``post_query`` rewritten to read it, or ``None`` when the query cannot be
+answered from one (joins, windows, DISTINCT, AVG and other aggregates).
+"""
+
+import re
+from typing import Dict, NamedTuple, Optional
+
+import sqlglot
+from sqlglot import exp
+
+from visivo.query.patterns import INPUT_FRONTEND_PATTERN
+
+# Prefix of the rollup's partial aggregate columns, and of the stand-ins for
+# ${input.accessor} placeholders while the query is parsed.
+_MEASURE_PREFIX = "__visivo_"
+_PLACEHOLDER = "__visivo_input_{}__"
+_PLACEHOLDER_PATTERN = re.compile(r'"?(__visivo_input_(\d+)__)"?')
+_ROW_COUNT = f"{_MEASURE_PREFIX}count"
+
+_DECOMPOSABLE = {exp.Sum: "sum", exp.Count: "count", exp.Min: "min", exp.Max: "max"}
+
+# A rollup is only worth shipping instead of the model when it is at most this
+# share of the model's rows.
+MAX_ROW_RATIO = 0.5
+
+
+class RollupPlan(NamedTuple):
+    # Builds the rollup; reads the model from a table named by its hash
+    rollup_sql: str
+    # The post_query, reading the rollup through a table named by rollup_hash
+    query: str
+
+
+def _substitute_placeholders(query: str):
+    placeholders = []
+
+    def replace(match):
+        placeholders.append(match.group(0))
+        return _PLACEHOLDER.format(len(placeholders) - 1)
+
+    return re.sub(INPUT_FRONTEND_PATTERN, replace, query), placeholders
+
+
+def _restore_placeholders(sql: str, placeholders) -> str:
+    # A stand-in parsed as a column may come back quoted; one inside a string
+    # literal keeps its single quotes, which belong to the literal.
+    return _PLACEHOLDER_PATTERN.sub(lambda match: placeholders[int(match.group(2))], sql)
+
+
+def _is_placeholder(column: exp.Column) -> bool:
+    return _PLACEHOLDER_PATTERN.fullmatch(column.name) is not None
+
+
+def _in_projection(node: exp.Expression, select: exp.Select) -> bool:
+    while node.parent is not select:
+        node = node.parent
+    return node.arg_key == "expressions"
+
+
+def _table(name: str) -> exp.Table:
+    return exp.Table(this=exp.to_identifier(name, quoted=True))
+
+
+def _measure_name(kind: str, column: Optional[exp.Column]) -> str:
+    if column is None:
+        return _ROW_COUNT
+    return f"{_MEASURE_PREFIX}{kind}_{column.name}"
+
+
+def plan_rollup(post_query: str, model_hash: str, rollup_hash: str) -> Optional[RollupPlan]:
+    """Plan a rollup of the model ``post_query`` reads as ``model_hash``.
+
+    Returns ``None`` when the query is not a single-model aggregate over
+    SUM, COUNT, MIN and MAX of plain columns.
+    """
+    sql, placeholders = _substitute_placeholders(post_query)
+    try:
+        select = sqlglot.parse_one(sql, read="duckdb")
+    except sqlglot.errors.ParseError:
+        return None
+
+    if not isinstance(select, exp.Select) or not select.args.get("group"):
+        return None
+    if select.args.get("joins") or select.args.get("distinct") or select.args.get("qualify"):
+        return None
+    tables = list(select.find_all(exp.Table))
+    if len(tables) != 1 or tables[0].name != model_hash:
+        return None
+    if select.find(exp.Window) or select.find(exp.Subquery):
+        return None
+
+    measures: Dict[str, exp.Expression] = {}
+    for aggregate in select.find_all(exp.AggFunc):
+        kind = _DECOMPOSABLE.get(type(aggregate))
+        argument = aggregate.this
+        if kind is None or aggregate.args.get("expressions"):
+            return None
+        if kind == "count" and isinstance(argument, exp.Star):
+            argument = None
+        elif not isinstance(argument, exp.Column) or _is_placeholder(argument):
+            return None
+        name = _measure_name(kind, argument)
+        if name not in measures:
+            if argument is None:
+                measures[name] = exp.Count(this=exp.Star())
+            else:
+                measures[name] = aggregate.__class__(this=exp.column(argument.name, quoted=True))
+
+    # ORDER BY, GROUP BY and HAVING may name a select alias rather than a model
+    # column. An alias of the same-named column (``x AS x``) still reads that column.
+    aliases = {
+        projection.alias
+        for projection in select.expressions
+        if projection.alias
+        and not (
+            isinstance(projection.this, exp.Column) and projection.this.name == projection.alias
+        )
+    }
+    dimensions = []
+    for column in select.find_all(exp.Column):
+        if column.find_ancestor(exp.AggFunc) or _is_placeholder(column):
+            continue
+        if not column.table and column.name in aliases and not _in_projection(column, select):
+            continue
+        if column.table and column.table != model_hash:
+            return None
+        if column.name not in dimensions:
+            dimensions.append(column.name)
+    if any(name.startswith(_MEASURE_PREFIX) for name in dimensions):
+        return None
+
+    rollup = exp.select(
+        *[exp.column(name, quoted=True) for name in dimensions],
+        *[exp.alias_(measure, name, quoted=True) for name, measure in measures.items()],
+    ).from_(_table(model_hash))
+    if dimensions:
+        rollup = rollup.group_by(*[exp.column(name, quoted=True) for name in dimensions])
+
+    def reaggregate(node):
+        kind = _DECOMPOSABLE.get(type(node))
+        if kind is None:
+            return node
+        argument = None if isinstance(node.this, exp.Star) else node.this
+        partial = exp.column(_measure_name(kind, argument), table=model_hash, quoted=True)
+        if kind == "count":
+            return exp.cast(exp.Sum(this=partial), "BIGINT")
+        return node.__class__(this=partial)
+
+    rewritten = select.transform(reaggregate)
+    rewritten.find(exp.Table).replace(
+        exp.alias_(_table(rollup_hash), model_hash, table=True, quoted=True)
+    )
+    return RollupPlan(
+        rollup_sql=rollup.sql(dialect="duckdb"),
+        query=_restore_placeholders(rewritten.sql(dialect="duckdb", pretty=True), placeholders),
+    )
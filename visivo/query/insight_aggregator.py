@@ -3,10 +3,11 @@ import json
 import base64
 from decimal import Decimal
 from datetime import datetime, date, time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from visivo.models.tokenized_insight import TokenizedInsight
 from visivo.logger.logger import Logger
+from visivo.query.aggregator import write_json
 
 
 class InsightAggregator:
@@ -48,7 +49,11 @@ class InsightAggregator:
 
     @classmethod
     def aggregate_insight_data(
-        cls, data: List[dict], insight_dir: str, tokenized_insight: TokenizedInsight
+        cls,
+        data: List[dict],
+        insight_dir: str,
+        tokenized_insight: TokenizedInsight,
+        compact: bool = False,
     ):
         """
         Main entry point for insight data aggregation.
@@ -57,6 +62,7 @@ class InsightAggregator:
             data: Raw SQL query results (list of dictionaries)
             insight_dir: Directory to write insight.json file
             tokenized_insight: Tokenized insight with metadata
+            compact: Write JSON without indentation or whitespace
         """
         try:
             # Create complete insight JSON with query template and metadata
@@ -64,13 +70,14 @@ class InsightAggregator:
                 flat_data=data, tokenized_insight=tokenized_insight
             )
 
-            # Make result JSON-serializable
-            json_safe_result = cls._make_json_serializable(insight_json)
-
-            # Write result to insight.json file
+            # Write result to insight.json file, converting values JSON has
+            # no type for as they are written
             os.makedirs(insight_dir, exist_ok=True)
-            with open(f"{insight_dir}/insight.json", "w") as fp:
-                json.dump(json_safe_result, fp, indent=4)
+            write_json(
+                insight_json,
+                f"{insight_dir}/insight.json",
+                "compact-json" if compact else "json",
+            )
 
             Logger.instance().debug(f"Generated insight.json for {tokenized_insight.name}")
 
@@ -107,6 +114,26 @@ class InsightAggregator:
         if not data:
             return {}
 
+        flat_data = cls._flat_columns(data)
+        if flat_data is None:
+            flat_data = cls._flat_rows(data)
+
+        # Add split column if we have a split interaction
+        if tokenized_insight.split_column:
+            cls._add_split_column_data(flat_data, tokenized_insight.split_column, data)
+
+        return flat_data
+
+    @classmethod
+    def _flat_columns(cls, data: List[dict]) -> Optional[Dict[str, List[Any]]]:
+        """Transpose rows that all share one set of keys, keeping their column order."""
+        columns = data[0].keys()
+        if any(row.keys() != columns for row in data):
+            return None
+        return {column: [row[column] for row in data] for column in columns}
+
+    @classmethod
+    def _flat_rows(cls, data: List[dict]) -> Dict[str, List[Any]]:
         # Get all unique column names across all rows
         all_columns = set()
         for row in data:
@@ -121,10 +148,6 @@ class InsightAggregator:
                 value = row.get(col)
                 flat_data[col].append(value)
 
-        # Add split column if we have a split interaction
-        if tokenized_insight.split_column:
-            cls._add_split_column_data(flat_data, tokenized_insight.split_column, data)
-
         return flat_data
 
     @classmethod
@@ -195,7 +218,11 @@ class InsightAggregator:
 
     @classmethod
     def aggregate_from_json_file(
-        cls, json_file: str, insight_dir: str, tokenized_insight: TokenizedInsight
+        cls,
+        json_file: str,
+        insight_dir: str,
+        tokenized_insight: TokenizedInsight,
+        compact: bool = False,
     ):
         """
         Aggregate insight data from a JSON file (for compatibility with existing patterns).
@@ -204,11 +231,12 @@ class InsightAggregator:
             json_file: Path to JSON file containing query results
             insight_dir: Directory to write insight.json
             tokenized_insight: Tokenized insight with metadata
+            compact: Write JSON without indentation or whitespace
         """
         with open(json_file, "r") as f:
             data = json.load(f)
 
-        cls.aggregate_insight_data(data, insight_dir, tokenized_insight)
+        cls.aggregate_insight_data(data, insight_dir, tokenized_insight, compact=compact)
 
     @classmethod
     def get_flat_data_summary(cls, flat_data: Dict[str, List]) -> Dict[str, Any]:
@@ -25,6 +25,7 @@ from typing import Any, Dict, Optional
 from sqlglot import exp
 
 from visivo.logger.logger import Logger
+from visivo.query.cached_mapping_schema import schema_fingerprint
 from visivo.query.sqlglot_utils import schema_from_sql
 
 
@@ -119,6 +120,7 @@ def infer_model_columns(
             schema=schema,
             model_hash=model_hash,
             default_schema=default_schema,
+            schema_fingerprint=schema_fingerprint(stored),
         )
     except Exception:
         if strict:
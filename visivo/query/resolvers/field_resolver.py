@@ -39,6 +39,7 @@ class FieldResolver:
         output_dir: str,
         native_dialect: str,
         schema_overrides: Optional[Dict[str, dict]] = None,
+        compilation_cache=None,
     ):
         """
         Initialize the FieldResolver.
@@ -57,6 +58,11 @@ class FieldResolver:
                 without ever touching disk. ``None`` (the default, every real
                 run pipeline caller) preserves today's disk-read-only behavior
                 exactly.
+            compilation_cache: Optional run-scoped ``CompilationCache``
+                shared with every other insight in the run, so model schemas
+                and resolved expressions are worked out once per run instead
+                of once per insight. Not consulted for resolution when
+                ``schema_overrides`` is given, since overrides change results.
         """
         self.dag = dag
         self.output_dir = output_dir
@@ -66,20 +72,33 @@ class FieldResolver:
         self._schema_cache: Dict[str, dict] = dict(schema_overrides) if schema_overrides else {}
         self._resolution_cache: Dict[str, str] = {}
         self._resolution_stack: list = []  # Track current resolution path for cycle detection
+        self.compilation_cache = compilation_cache
+        self._shares_resolutions = compilation_cache is not None and not schema_overrides
 
     def _load_model_schema(self, model_name: str) -> Optional[dict]:
         if model_name in self._schema_cache:
             return self._schema_cache[model_name]
 
+        if self.compilation_cache is not None:
+            schema = self.compilation_cache.get_or_build(
+                "model_schema",
+                (self.output_dir, model_name),
+                lambda: self._read_model_schema(model_name),
+            )
+        else:
+            schema = self._read_model_schema(model_name)
+        if schema is not None:
+            self._schema_cache[model_name] = schema
+        return schema
+
+    def _read_model_schema(self, model_name: str) -> Optional[dict]:
         # Build path to schema file
         schema_file = os.path.join(self.output_dir, "schemas", f"{model_name}.json")
 
         # Try to read schema file
         try:
             with open(schema_file, "r") as fp:
-                schema = json.load(fp)
-                self._schema_cache[model_name] = schema
-                return schema
+                return json.load(fp)
         except FileNotFoundError:
             Logger.instance().error(
                 f"Schema file not found for model '{model_name}' at {schema_file}"
@@ -403,6 +422,35 @@ class FieldResolver:
 
         Returns resolved sql str
         """
+        if self._shares_resolutions:
+            resolved_strip_alias, hashed_alias = self.compilation_cache.get_or_build(
+                "expression",
+                (self.output_dir, self.native_dialect, expression),
+                lambda: self._resolve_refs(expression),
+            )
+        else:
+            resolved_strip_alias, hashed_alias = self._resolve_refs(expression)
+
+        if alias:
+            # Always use raw lowercase hash as alias with quoting.
+            # Quoted identifiers preserve case in all databases, so the lowercase
+            # hash from alpha_hash() is stored exactly as-is. This ensures consistent
+            # aliases across parquet columns, DuckDB WASM results, and props_mapping.
+            alias_identifier = exp.Identifier(this=hashed_alias, quoted=True)
+            sqlglot_dialect = get_sqlglot_dialect(self.native_dialect)
+            alias_sql = alias_identifier.sql(dialect=sqlglot_dialect)
+            result = f"{resolved_strip_alias} AS {alias_sql}"
+            if return_hash:
+                return result, hashed_alias
+            return result
+        else:
+            if return_hash:
+                return resolved_strip_alias, hashed_alias
+            return resolved_strip_alias
+
+    def _resolve_refs(self, expression: str) -> tuple[str, str]:
+        """Resolve every ref in ``expression``; returns the SQL without a
+        trailing alias, and the alias hash of the resolved SQL."""
 
         def replace_one_by_one(text, repl_fn):
             # pattern is a compiled regex
@@ -537,19 +585,4 @@ class FieldResolver:
         # Use SQLGlot-based alias stripping to properly handle CAST(x AS type) syntax
         # The naive .split(" AS ")[0] approach incorrectly truncates expressions containing " AS "
         resolved_strip_alias = self._strip_trailing_alias(resolved_sql)
-        if alias:
-            # Always use raw lowercase hash as alias with quoting.
-            # Quoted identifiers preserve case in all databases, so the lowercase
-            # hash from alpha_hash() is stored exactly as-is. This ensures consistent
-            # aliases across parquet columns, DuckDB WASM results, and props_mapping.
-            alias_identifier = exp.Identifier(this=hashed_alias, quoted=True)
-            sqlglot_dialect = get_sqlglot_dialect(self.native_dialect)
-            alias_sql = alias_identifier.sql(dialect=sqlglot_dialect)
-            result = f"{resolved_strip_alias} AS {alias_sql}"
-            if return_hash:
-                return result, hashed_alias
-            return result
-        else:
-            if return_hash:
-                return resolved_strip_alias, hashed_alias
-            return resolved_strip_alias
+        return resolved_strip_alias, hashed_alias
@@ -0,0 +1,313 @@
+"""Result cache — query results the server has already fetched, kept as Arrow IPC on disk.
+
+The explorer's query tabs and the draft insight execute endpoint run SQL
+against a source every time a tab is re-opened or tweaked, though the same
+SQL over the same source mostly returns the same rows. Results are kept here,
+one Arrow IPC file each, keyed by:
+
+- the source's name and configuration, so editing a source misses,
+- its SQL, normalized by SQLGlot in the source's dialect, so whitespace and
+  keyword case do not, and the row limit it was read with, and
+- the source's stored schema, when there is one, so a schema refresh misses.
+
+The cache is bounded by the bytes of its files: the least recently used
+results are dropped first. Entries also expire after a TTL, and can be
+dropped by hand for one source or all of them, or skipped for one request
+with ``refresh``. The index is held in memory, so files left by a previous
+server are removed when the cache is created.
+
+``read_rows`` also pushes the row limit down into the SQL, so a query whose
+result is cut to ``max_rows`` fetches one row more than that rather than the
+whole result. The SQL as written is wrapped in a limiting query; the
+normalized SQL is only ever a cache key, never run.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import List, NamedTuple, Optional
+
+import sqlglot
+from sqlglot import exp
+
+from visivo.logger.logger import Logger
+from visivo.query.aggregator import uniform_column_types
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 15 * 60
+_FILE_SUFFIX = ".arrow"
+
+
+class QueryRows(NamedTuple):
+    rows: List[dict]
+    is_truncated: bool
+    cached: bool
+
+
+class _Entry(NamedTuple):
+    path: str
+    size: int
+    source_name: str
+    created_at: float
+
+
+def _sqlglot_dialect(source) -> Optional[str]:
+    from visivo.query.sqlglot_utils import get_sqlglot_dialect
+
+    dialect = source.get_dialect()
+    if not isinstance(dialect, str):
+        return None
+    try:
+        return get_sqlglot_dialect(dialect)
+    except NotImplementedError:
+        return None
+
+
+def _parse(sql: str, dialect: Optional[str]):
+    """The single statement in ``sql``, or ``None`` when it cannot be parsed as one."""
+    if dialect is None:
+        return None
+    try:
+        statements = sqlglot.parse(sql, read=dialect)
+    except sqlglot.errors.SqlglotError:
+        return None
+    if len(statements) != 1 or statements[0] is None:
+        return None
+    return statements[0]
+
+
+# Stands in for the user's SQL while SQLGlot writes the wrapper around it
+_QUERY_PLACEHOLDER = "__visivo_limited_query__"
+
+
+def limit_sql(sql: str, dialect: Optional[str], limit: int) -> Optional[str]:
+    """``sql`` wrapped in a query returning at most ``limit`` of its rows, or
+    ``None`` when it is not a single query in ``dialect``.
+
+    Only the wrapper is written by SQLGlot, in the source's dialect (``TOP``,
+    ``FETCH FIRST``, ...); the statement itself runs exactly as written.
+    """
+    if not isinstance(_parse(sql, dialect), exp.Query):
+        return None
+    statement = sql.strip().rstrip(";").rstrip()
+    wrapper = exp.select("*").from_(exp.to_table(_QUERY_PLACEHOLDER).as_("q")).limit(limit)
+    # Newlines keep a trailing line comment from swallowing the parenthesis
+    return wrapper.sql(dialect=dialect).replace(_QUERY_PLACEHOLDER, f"(\n{statement}\n)", 1)
+
+
+def _table_from_rows(rows: list):
+    """``rows`` as an Arrow table, or ``None`` when converting would change a value."""
+    import pyarrow as pa
+
+    if not rows:
+        return pa.table({})
+    columns = rows[0].keys()
+    if any(row.keys() != columns for row in rows) or not uniform_column_types(rows, columns):
+        return None
+    try:
+        return pa.Table.from_pylist(rows)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+
+
+class QueryResultCache:
+    """Query results on disk under ``cache_dir``, at most ``max_bytes`` of them.
+
+    ``schema_dir`` is where the sources' stored schemas are; a result is only
+    served while its source's schema file is unchanged.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        schema_dir: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+    ):
+        self.cache_dir = cache_dir
+        self.schema_dir = schema_dir
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._remove_stale_files()
+
+    def _remove_stale_files(self):
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(_FILE_SUFFIX) or name.endswith(".partial"):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _schema_version(self, source_name: str) -> Optional[str]:
+        if not self.schema_dir:
+            return None
+        try:
+            stat = os.stat(os.path.join(self.schema_dir, f"{source_name}.json"))
+        except OSError:
+            return None
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def key(
+        self, source, sql: str, dialect: Optional[str] = None, max_rows: Optional[int] = None
+    ) -> str:
+        expression = _parse(sql, dialect)
+        normalized = expression.sql(dialect=dialect) if expression is not None else sql.strip()
+        try:
+            config = source.model_dump(mode="json")
+        except AttributeError:
+            config = None
+        identity = json.dumps(
+            [source.name, config, normalized, max_rows, self._schema_version(source.name)],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def _expired(self, entry: _Entry) -> bool:
+        return self.ttl_seconds is not None and monotonic() - entry.created_at > self.ttl_seconds
+
+    def _drop(self, key: str):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+    def get(self, key: str):
+        """The Arrow table stored under ``key``, or ``None``."""
+        import pyarrow as pa
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        try:
+            with pa.OSFile(entry.path) as source:
+                return pa.ipc.open_file(source).read_all()
+        except (OSError, pa.ArrowInvalid):
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    self._drop(key)
+            return None
+
+    def put(self, key: str, source_name: str, table) -> bool:
+        """Store ``table`` under ``key``, dropping the least recently used
+        results to make room. Returns whether it was stored."""
+        import pyarrow as pa
+
+        path = os.path.join(self.cache_dir, f"{key}{_FILE_SUFFIX}")
+        partial_path = f"{path}.{threading.get_ident()}.partial"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with pa.OSFile(partial_path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            size = os.path.getsize(partial_path)
+            if size > self.max_bytes:
+                os.remove(partial_path)
+                return False
+            with self._lock:
+                if key in self._entries:
+                    self._drop(key)
+                os.replace(partial_path, path)
+                self._entries[key] = _Entry(path, size, source_name, monotonic())
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    self._drop(next(iter(self._entries)))
+        except OSError as e:
+            Logger.instance().debug(f"Query result not cached: {e}")
+            return False
+        return True
+
+    def invalidate(self, source_name: Optional[str] = None) -> int:
+        """Drop every result, or only ``source_name``'s. Returns how many were dropped."""
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if source_name is None or entry.source_name == source_name
+            ]
+            for key in keys:
+                self._drop(key)
+        return len(keys)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def read_rows(
+    source,
+    sql: str,
+    max_rows: Optional[int] = None,
+    cache: Optional[QueryResultCache] = None,
+    refresh: bool = False,
+) -> QueryRows:
+    """Run ``sql`` on ``source`` and return at most ``max_rows`` rows of it.
+
+    The limit is pushed into the SQL when it parses as a query in the source's
+    dialect; one row more than ``max_rows`` is fetched to tell a truncated
+    result from one that fits. If the limited query fails (a database that
+    rejects some statement as a subquery), the SQL is run as written. With a
+    ``cache``, a stored result is returned without running the query, unless
+    ``refresh`` is set, and a new one is stored.
+    """
+    dialect = _sqlglot_dialect(source)
+    key = cache.key(source, sql, dialect, max_rows) if cache is not None else None
+    table = cache.get(key) if key is not None and not refresh else None
+
+    if table is not None:
+        rows = table.to_pylist()
+        cached = True
+    else:
+        rows = None
+        limited = limit_sql(sql, dialect, max_rows + 1) if max_rows is not None else None
+        if limited is not None:
+            try:
+                rows = source.read_sql(limited) or []
+            except Exception as e:
+                Logger.instance().debug(f"Running the query without a row limit: {e}")
+        if rows is None:
+            rows = source.read_sql(sql) or []
+        if max_rows is not None:
+            rows = rows[: max_rows + 1]
+        if cache is not None:
+            table = _table_from_rows(rows)
+            if table is not None:
+                cache.put(key, source.name, table)
+        cached = False
+
+    is_truncated = max_rows is not None and len(rows) > max_rows
+    if is_truncated:
+        rows = rows[:max_rows]
+    return QueryRows(rows=rows, is_truncated=is_truncated, cached=cached)
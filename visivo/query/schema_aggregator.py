@@ -12,6 +12,8 @@ from sqlglot.schema import MappingSchema
 
 from visivo.constants import DEFAULT_RUN_ID
 from visivo.logger.logger import Logger
+from visivo.query.cached_mapping_schema import schema_fingerprint
+from visivo.query.source_schema_store import store_path, write_source_schema_store
 from visivo.query.sqlglot_type_mapper import SqlglotTypeMapper
 
 
@@ -25,7 +27,8 @@ class SchemaAggregator:
         schema_data: Dict[str, Any],
         output_dir: str,
         run_id: str = DEFAULT_RUN_ID,
-    ) -> None:
+        retained: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """
         Store source schema data in standard format.
 
@@ -35,6 +38,11 @@ class SchemaAggregator:
             schema_data: Schema data dictionary
             output_dir: Output directory for storage
             run_id: Run identifier for schema storage location
+            retained: Tables kept from the previously stored schema (see
+                ``retain_tables``); ``schema_data`` holds only the re-described ones
+
+        Returns:
+            The stored schema data
         """
         try:
             schema_dir = f"{output_dir}/{run_id}/schemas"
@@ -64,6 +72,16 @@ class SchemaAggregator:
             if "metadata" in schema_data:
                 storage_data["metadata"].update(schema_data["metadata"])
 
+            if retained:
+                storage_data["metadata"] = {
+                    **retained.get("metadata", {}),
+                    **storage_data["metadata"],
+                }
+                storage_data["tables"] = {**retained["tables"], **storage_data["tables"]}
+                storage_data["sqlglot_schema"] = SchemaAggregator._merge_serialized_schemas(
+                    retained["sqlglot_schema"], storage_data["sqlglot_schema"]
+                )
+
             # Calculate metadata
             total_tables = len(storage_data["tables"])
             total_columns = sum(
@@ -73,19 +91,83 @@ class SchemaAggregator:
             storage_data["metadata"]["total_columns"] = total_columns
 
             # Write to file
-            schema_file = f"{schema_dir}/{source_name}.json"
+            schema_file = SchemaAggregator.source_schema_file(source_name, output_dir, run_id)
             with open(schema_file, "w") as fp:
                 json.dump(storage_data, fp, indent=2, default=str)
+            SchemaAggregator._write_store(schema_file, storage_data)
 
             Logger.instance().debug(
                 f"Stored schema for source '{source_name}' with {total_tables} tables "
                 f"and {total_columns} columns"
             )
+            return storage_data
 
         except Exception as e:
             Logger.instance().error(f"Error storing schema for source {source_name}: {e}")
             raise
 
+    @staticmethod
+    def _write_store(schema_file: str, storage_data: Dict[str, Any]) -> None:
+        """Index the schema just written so runs read only the tables they need.
+
+        Best-effort: without the store, runs read the JSON as before.
+        """
+        try:
+            write_source_schema_store(schema_file, storage_data, schema_fingerprint(storage_data))
+        except Exception as e:
+            Logger.instance().debug(f"Error writing schema store for {schema_file}: {e}")
+            try:
+                os.remove(store_path(schema_file))
+            except OSError:
+                pass
+
+    @staticmethod
+    def retain_tables(stored: Dict[str, Any], table_names) -> Dict[str, Any]:
+        """The part of a stored schema covering only ``table_names``.
+
+        Used when a source re-describes just its changed tables: everything
+        else is carried over from the stored schema, and tables that no longer
+        exist are dropped by leaving them out of ``table_names``. Matching is
+        case-insensitive because ``sqlglot_schema`` keys are normalized.
+        """
+        keep = {name.lower() for name in table_names}
+        tables = {
+            name: info for name, info in stored.get("tables", {}).items() if name.lower() in keep
+        }
+        sqlglot_schema = {}
+        for key, value in stored.get("sqlglot_schema", {}).items():
+            if not isinstance(value, dict):
+                continue
+            first_val = next(iter(value.values()), None) if value else None
+            if isinstance(first_val, dict):
+                kept = {
+                    table: columns
+                    for table, columns in value.items()
+                    if f"{key}.{table}".lower() in keep
+                }
+                if kept:
+                    sqlglot_schema[key] = kept
+            elif key.lower() in keep:
+                sqlglot_schema[key] = value
+        return {
+            "tables": tables,
+            "sqlglot_schema": sqlglot_schema,
+            "metadata": stored.get("metadata", {}),
+        }
+
+    @staticmethod
+    def _merge_serialized_schemas(base: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+        """Overlay ``update`` on ``base``, merging nested ``{schema: {table: ...}}`` levels."""
+        merged = dict(base)
+        for key, value in update.items():
+            existing = merged.get(key)
+            first_val = next(iter(value.values()), None) if isinstance(value, dict) else None
+            if isinstance(existing, dict) and isinstance(first_val, dict):
+                merged[key] = {**existing, **value}
+            else:
+                merged[key] = value
+        return merged
+
     @staticmethod
     def _process_table_schemas(tables_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -197,6 +279,11 @@ class SchemaAggregator:
             Logger.instance().debug(f"Error serializing MappingSchema: {e}")
             return {}
 
+    @staticmethod
+    def source_schema_file(source_name: str, output_dir: str, run_id: str = DEFAULT_RUN_ID) -> str:
+        """Path of the JSON a source's schema is stored in."""
+        return f"{output_dir}/{run_id}/schemas/{source_name}.json"
+
     @staticmethod
     def load_source_schema(
         source_name: str, output_dir: str, run_id: str = DEFAULT_RUN_ID
@@ -213,7 +300,7 @@ class SchemaAggregator:
             Schema data dictionary or None if not found
         """
         try:
-            schema_file = f"{output_dir}/{run_id}/schemas/{source_name}.json"
+            schema_file = SchemaAggregator.source_schema_file(source_name, output_dir, run_id)
             if not os.path.exists(schema_file):
                 return None
 
@@ -268,18 +355,10 @@ class SchemaAggregator:
                     for table_name, columns in tables.items():
                         if not isinstance(columns, dict):
                             continue
-                        column_types = {}
-                        for col_name, col_type_str in columns.items():
-                            try:
-                                column_types[col_name] = exp.DataType.build(
-                                    col_type_str, dialect=dialect
-                                )
-                            except Exception as e:
-                                Logger.instance().debug(
-                                    f"Error parsing type '{col_type_str}' for column "
-                                    f"'{col_name}', using VARCHAR: {e}"
-                                )
-                                column_types[col_name] = exp.DataType.build("VARCHAR")
+                        column_types = {
+                            col_name: SqlglotTypeMapper.build_type(col_type_str, dialect=dialect)
+                            for col_name, col_type_str in columns.items()
+                        }
 
                         # Add table with qualified name to create nested structure
                         if column_types:
@@ -289,18 +368,10 @@ class SchemaAggregator:
                     # Flat structure: {table: {col: type}} - first_val is a type string
                     table_name = key
                     columns = value
-                    column_types = {}
-                    for col_name, col_type_str in columns.items():
-                        try:
-                            column_types[col_name] = exp.DataType.build(
-                                col_type_str, dialect=dialect
-                            )
-                        except Exception as e:
-                            Logger.instance().debug(
-                                f"Error parsing type '{col_type_str}' for column "
-                                f"'{col_name}', using VARCHAR: {e}"
-                            )
-                            column_types[col_name] = exp.DataType.build("VARCHAR")
+                    column_types = {
+                        col_name: SqlglotTypeMapper.build_type(col_type_str, dialect=dialect)
+                        for col_name, col_type_str in columns.items()
+                    }
 
                     if column_types:
                         schema.add_table(table_name, column_types)
@@ -2,7 +2,8 @@
 Source schema caching for efficient DAG execution.
 
 Caches CachedMappingSchemaProvider instances per source to avoid
-redundant schema loading and DataType building across model jobs.
+redundant schema loading and DataType building across model jobs. Providers
+read the source's indexed schema store when the run wrote one.
 """
 
 from threading import Lock
@@ -11,6 +12,7 @@ from typing import Dict, Optional
 from visivo.logger.logger import Logger
 from visivo.query.cached_mapping_schema import CachedMappingSchemaProvider
 from visivo.query.schema_aggregator import SchemaAggregator
+from visivo.query.source_schema_store import SourceSchemaStore
 from visivo.query.sqlglot_utils import get_sqlglot_dialect
 from visivo.constants import DEFAULT_RUN_ID
 
@@ -24,7 +26,8 @@ class SourceSchemaCache:
     with 20 models using the same source with 919 tables (15,995 columns):
 
     Before: 20 × JSON loads + 20 × 15,995 DataType.build() = 319,900 builds
-    After: 1 × JSON load + 1 × 15,995 DataType.build() = 15,995 builds
+    After: 1 × store open + a build per referenced table's column, with each
+    distinct type string parsed once
 
     Thread-safe: Uses a lock to prevent race conditions when multiple
     model jobs request the same provider concurrently.
@@ -77,24 +80,31 @@ class SourceSchemaCache:
                 Logger.instance().debug(f"Using cached schema provider for {source_name}")
                 return self._providers[cache_key]
 
-            # Load schema from disk and build provider
-            stored_schema = SchemaAggregator.load_source_schema(
-                source_name=source_name, output_dir=output_dir, run_id=run_id
-            )
-
-            if stored_schema is None:
-                Logger.instance().debug(f"No stored schema found for source {source_name}")
-                return None
-
             # Get dialect for proper type parsing
             try:
                 dialect = get_sqlglot_dialect(source_type) if source_type else None
             except NotImplementedError:
                 dialect = None
 
-            # Build and cache the provider
-            Logger.instance().debug(f"Building schema provider for {source_name}")
-            provider = CachedMappingSchemaProvider(stored_schema, dialect=dialect)
+            # Read tables from the indexed store when the run wrote one, so only
+            # the tables models reference are loaded; otherwise parse the JSON
+            store = SourceSchemaStore.open(
+                SchemaAggregator.source_schema_file(source_name, output_dir, run_id)
+            )
+            if store is not None:
+                Logger.instance().debug(f"Opening schema store for {source_name}")
+                provider = CachedMappingSchemaProvider.from_store(store, dialect=dialect)
+            else:
+                stored_schema = SchemaAggregator.load_source_schema(
+                    source_name=source_name, output_dir=output_dir, run_id=run_id
+                )
+
+                if stored_schema is None:
+                    Logger.instance().debug(f"No stored schema found for source {source_name}")
+                    return None
+
+                Logger.instance().debug(f"Building schema provider for {source_name}")
+                provider = CachedMappingSchemaProvider(stored_schema, dialect=dialect)
 
             self._providers[cache_key] = provider
 
@@ -106,20 +116,26 @@ class SourceSchemaCache:
             return provider
 
     def clear(self) -> None:
-        """Clear all cached providers."""
-        self._providers.clear()
+        """Clear all cached providers, closing the schema stores they read."""
+        with self._lock:
+            providers = list(self._providers.values())
+            self._providers.clear()
+        for provider in providers:
+            provider.close()
 
     def clear_source(self, source_name: str, run_id: str = DEFAULT_RUN_ID) -> None:
         """
-        Clear cached provider for a specific source.
+        Clear cached provider for a specific source, closing its schema store.
 
         Args:
             source_name: Name of the source to clear
             run_id: Run ID for the cached entry
         """
         cache_key = f"{source_name}:{run_id}"
-        if cache_key in self._providers:
-            del self._providers[cache_key]
+        with self._lock:
+            provider = self._providers.pop(cache_key, None)
+        if provider is not None:
+            provider.close()
 
     @property
     def cached_sources(self) -> int:
@@ -0,0 +1,170 @@
+"""
+Indexed on-disk store of a source's schema, for reading a few tables at a time.
+
+``schemas/<source>.json`` holds every table and column of a source; reading a
+model's schema from it meant parsing the whole file and building every column
+type, though a model's query names a handful of tables. Next to the JSON,
+``SchemaAggregator.aggregate_source_schema`` writes ``schemas/<source>.sqlite``:
+one row per table, indexed by table name, with the column type strings of the
+``sqlglot_schema`` block. ``CachedMappingSchemaProvider.from_store`` reads only
+the tables ``extract_table_references`` finds.
+
+The JSON stays the format the server and deploy read. The store records the
+size and mtime the JSON had when both were written and is ignored once they
+differ, so a JSON written some other way is never shadowed by a stale index.
+"""
+
+import json
+import os
+import sqlite3
+from threading import Lock
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from visivo.logger.logger import Logger
+
+# Rows are (schema name or None for a flat schema, table name, {column: type string})
+TableRow = Tuple[Optional[str], str, Dict[str, str]]
+
+# Stay under SQLite's limit on the parameters of one statement
+_MAX_PARAMS = 500
+
+
+def store_path(schema_file: str) -> str:
+    """Where the store for ``schemas/<source>.json`` lives."""
+    return f"{os.path.splitext(schema_file)[0]}.sqlite"
+
+
+def _stat(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def schema_tables(sqlglot_schema: Dict[str, Any]) -> Tuple[bool, List[TableRow]]:
+    """Whether a ``sqlglot_schema`` block is nested, and its tables as rows."""
+    first_value = next(iter(sqlglot_schema.values()), None)
+    sample = next(iter(first_value.values()), None) if isinstance(first_value, dict) else None
+    nested = isinstance(sample, dict)
+
+    rows = []
+    for key, value in sqlglot_schema.items():
+        if not isinstance(value, dict):
+            continue
+        if nested:
+            rows.extend(
+                (key, table, columns)
+                for table, columns in value.items()
+                if isinstance(columns, dict)
+            )
+        else:
+            rows.append((None, key, value))
+    return nested, rows
+
+
+def write_source_schema_store(
+    schema_file: str, stored_schema: Dict[str, Any], fingerprint: str
+) -> str:
+    """Write the store for ``schema_file``, which must already hold ``stored_schema``."""
+    path = store_path(schema_file)
+    nested, rows = schema_tables(stored_schema.get("sqlglot_schema", {}))
+    meta = {
+        "nested": nested,
+        "default_schema": stored_schema.get("metadata", {}).get("default_schema"),
+        "fingerprint": fingerprint,
+        "table_count": len(rows),
+        "column_count": sum(len(columns) for _, _, columns in rows),
+        "json_stat": _stat(schema_file),
+    }
+
+    tmp_path = f"{path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    connection = sqlite3.connect(tmp_path)
+    try:
+        connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        connection.execute(
+            "CREATE TABLE tables (schema_name TEXT, table_name TEXT NOT NULL, columns TEXT NOT NULL)"
+        )
+        connection.executemany(
+            "INSERT INTO meta VALUES (?, ?)", [(k, json.dumps(v)) for k, v in meta.items()]
+        )
+        connection.executemany(
+            "INSERT INTO tables VALUES (?, ?, ?)",
+            [(schema, table, json.dumps(columns)) for schema, table, columns in rows],
+        )
+        connection.execute("CREATE INDEX tables_by_name ON tables (table_name)")
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(tmp_path, path)
+    return path
+
+
+class SourceSchemaStore:
+    """Read access to a store written by ``write_source_schema_store``.
+
+    Thread-safe: model jobs look tables up concurrently through one store.
+    """
+
+    def __init__(self, path: str, connection: sqlite3.Connection, meta: Dict[str, Any]):
+        self.path = path
+        self._connection = connection
+        self._lock = Lock()
+        self.is_nested: bool = bool(meta.get("nested"))
+        self.default_schema: Optional[str] = meta.get("default_schema")
+        self.fingerprint: str = meta.get("fingerprint", "")
+        self.table_count: int = meta.get("table_count", 0)
+        self.column_count: int = meta.get("column_count", 0)
+
+    @classmethod
+    def open(cls, schema_file: str) -> Optional["SourceSchemaStore"]:
+        """The store for ``schema_file``, or None when missing or older than the JSON."""
+        path = store_path(schema_file)
+        if not os.path.exists(path):
+            return None
+        try:
+            connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+            meta = {
+                key: json.loads(value)
+                for key, value in connection.execute("SELECT key, value FROM meta")
+            }
+        except (sqlite3.Error, ValueError) as e:
+            Logger.instance().debug(f"Ignoring unreadable schema store {path}: {e}")
+            return None
+        if meta.get("json_stat") is None or meta["json_stat"] != _stat(schema_file):
+            connection.close()
+            Logger.instance().debug(f"Ignoring schema store {path}: the schema file changed")
+            return None
+        return cls(path, connection, meta)
+
+    def tables(self, table_names: Iterable[str]) -> List[TableRow]:
+        """The rows of the tables named ``table_names``, in any schema."""
+        names = list(dict.fromkeys(table_names))
+        rows = []
+        for start in range(0, len(names), _MAX_PARAMS):
+            chunk = names[start : start + _MAX_PARAMS]
+            rows.extend(
+                self._select(
+                    "SELECT schema_name, table_name, columns FROM tables "
+                    f"WHERE table_name IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+        return rows
+
+    def all_tables(self) -> List[TableRow]:
+        return list(
+            self._select("SELECT schema_name, table_name, columns FROM tables ORDER BY rowid")
+        )
+
+    def _select(self, sql: str, params: Iterable[Any] = ()) -> Iterator[TableRow]:
+        with self._lock:
+            fetched = self._connection.execute(sql, list(params)).fetchall()
+        for schema_name, table_name, columns in fetched:
+            yield schema_name, table_name, json.loads(columns)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
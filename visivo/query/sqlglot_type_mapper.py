@@ -2,19 +2,23 @@
 SQLGlot type mapping utilities for converting database types to SQLGlot DataTypes.
 """
 
+from functools import lru_cache
+
 import sqlglot
 from sqlglot import exp
-from sqlalchemy import types as sa_types
-from typing import Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union
 from visivo.logger.logger import Logger
 
+if TYPE_CHECKING:
+    from sqlalchemy import types as sa_types
+
 
 class SqlglotTypeMapper:
     """Maps database-specific types to SQLGlot DataTypes."""
 
     @staticmethod
     def sqlalchemy_to_sqlglot_type(
-        sa_type: sa_types.TypeEngine, dialect: str = None
+        sa_type: "sa_types.TypeEngine", dialect: str = None
     ) -> exp.DataType:
         """
         Convert SQLAlchemy type to SQLGlot DataType.
@@ -27,6 +31,8 @@ class SqlglotTypeMapper:
         Returns:
             SQLGlot DataType expression
         """
+        from sqlalchemy import types as sa_types
+
         try:
             # Get the type name and handle generics
             type_name = str(sa_type).upper()
@@ -96,6 +102,9 @@ class SqlglotTypeMapper:
         """
         Parse a type string into SQLGlot DataType.
 
+        Parsed once per (dialect, type string); each call returns its own copy,
+        which is several times cheaper than parsing again.
+
         Args:
             type_str: String representation of the type
             dialect: Optional SQLGlot dialect name for proper type resolution
@@ -104,6 +113,31 @@ class SqlglotTypeMapper:
         Returns:
             SQLGlot DataType expression
         """
+        return SqlglotTypeMapper._parsed_type(type_str, dialect).copy()
+
+    @staticmethod
+    def build_type(type_str: str, dialect: str = None) -> exp.DataType:
+        """
+        Build a stored type string exactly as ``exp.DataType.build`` would,
+        falling back to VARCHAR when it cannot be parsed. Memoized like
+        ``_parse_type_string``.
+        """
+        if not isinstance(type_str, str):
+            return SqlglotTypeMapper._built_type.__wrapped__(type_str, dialect)
+        return SqlglotTypeMapper._built_type(type_str, dialect).copy()
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _built_type(type_str: str, dialect: str = None) -> exp.DataType:
+        try:
+            return exp.DataType.build(type_str, dialect=dialect)
+        except Exception as e:
+            Logger.instance().debug(f"Error parsing type '{type_str}', using VARCHAR: {e}")
+            return exp.DataType.build("VARCHAR")
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parsed_type(type_str: str, dialect: str = None) -> exp.DataType:
         try:
             # Clean up the type string
             type_str = type_str.strip().upper()
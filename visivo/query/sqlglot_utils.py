@@ -3,6 +3,8 @@ SQLGlot utility functions for AST analysis and SQL building.
 """
 
 import sqlglot
+from collections import OrderedDict
+from threading import Lock
 from sqlglot import exp, parse_one
 from sqlglot.schema import MappingSchema
 from sqlglot.dialects import Dialects
@@ -427,6 +429,8 @@ def _describe_available(schema: dict) -> str:
     moment you are trying to work out whether anything was loaded, and sends you
     hunting for a missing schema when the real problem is usually a column name.
     """
+    if isinstance(schema, MappingSchema):
+        schema = schema.mapping
     if not isinstance(schema, dict) or not schema:
         return "Available schema: EMPTY (no schema was loaded for this source)"
 
@@ -446,12 +450,27 @@ def _describe_available(schema: dict) -> str:
     return f"Available tables: {shown}{suffix}"
 
 
+# Column schemas inferred by schema_from_sql, most recently used last. Keyed by
+# (dialect, sql, default_schema, schema fingerprint), so a model whose SQL and
+# source schema are unchanged - every model on a serve hot reload - is not
+# parsed, qualified and annotated again.
+SCHEMA_FROM_SQL_CACHE_SIZE = 512
+_schema_from_sql_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_schema_from_sql_lock = Lock()
+
+
+def clear_schema_from_sql_cache():
+    with _schema_from_sql_lock:
+        _schema_from_sql_cache.clear()
+
+
 def schema_from_sql(
     sqlglot_dialect: str,
     sql: str,
-    schema: dict,
+    schema,
     model_hash: str,
     default_schema: str = None,
+    schema_fingerprint: str = None,
 ) -> dict:
     """
     Uses input schema plus sql to produce the new schema expected from the query.
@@ -460,10 +479,15 @@ def schema_from_sql(
         sqlglot_dialect: SQLGlot dialect name (e.g., "snowflake", "postgres")
         sql: SQL query to analyze
         schema: Schema dict - can be flat {table: {col: type}} or
-                nested {schema: {table: {col: type}}}
+                nested {schema: {table: {col: type}}} - or a prebuilt
+                MappingSchema, such as one shared by CachedMappingSchemaProvider
         model_hash: Hash to use as key in returned schema
         default_schema: Default schema for unqualified table references.
                        Used as the `db` parameter in SQLGlot's qualify().
+        schema_fingerprint: Identifies the schema's contents for the result
+                       cache, e.g. the hash of the stored schema it was built
+                       from. Without one the result is not cached: hashing the
+                       built schema would cost as much as a lookup saves.
 
     Returns:
         Dict mapping model_hash to column schema: {model_hash: {col: type}}
@@ -483,6 +507,26 @@ def schema_from_sql(
         >>> schema_from_sql("snowflake", sql, schema, "model", default_schema="EDW")
         {'model': {'col1': 'INT', 'goal_col': 'DECIMAL'}}
     """
+    cache_key = None
+    if schema_fingerprint is not None:
+        cache_key = (sqlglot_dialect, sql, default_schema, schema_fingerprint)
+        with _schema_from_sql_lock:
+            column_schema = _schema_from_sql_cache.get(cache_key)
+            if column_schema is not None:
+                _schema_from_sql_cache.move_to_end(cache_key)
+                return {model_hash: dict(column_schema)}
+
+    column_schema = _column_schema_from_sql(sqlglot_dialect, sql, schema, default_schema)
+
+    if cache_key is not None:
+        with _schema_from_sql_lock:
+            _schema_from_sql_cache[cache_key] = dict(column_schema)
+            while len(_schema_from_sql_cache) > SCHEMA_FROM_SQL_CACHE_SIZE:
+                _schema_from_sql_cache.popitem(last=False)
+    return {model_hash: column_schema}
+
+
+def _column_schema_from_sql(sqlglot_dialect: str, sql: str, schema, default_schema) -> dict:
     # 1. Parse
     expr = sqlglot.parse_one(sql, read=sqlglot_dialect)
 
@@ -490,13 +534,14 @@ def schema_from_sql(
     # SQLGlot preserves comments in _comments metadata on AST nodes. When qualify()
     # looks up columns, it uses string representations that include comments, causing
     # lookups like '"col" /* comment */' to fail against schema entries like '"col"'.
-    # Solution: regenerate SQL without comments and re-parse for a clean AST.
-    sql_without_comments = expr.sql(dialect=sqlglot_dialect, comments=False)
-    expr = sqlglot.parse_one(sql_without_comments, read=sqlglot_dialect)
+    # Clearing them on the AST gives the same clean tree as regenerating the SQL
+    # without comments and parsing it again, without the second parse.
+    for node in expr.walk():
+        node.comments = None
 
     # 3. Qualify with schema so column refs resolve
     # Pass db parameter for default schema context (used for unqualified table references)
-    mapping_schema = MappingSchema(schema=schema)
+    mapping_schema = schema if isinstance(schema, MappingSchema) else MappingSchema(schema=schema)
     try:
         expr = qualify.qualify(
             expr,
@@ -527,8 +572,7 @@ def schema_from_sql(
         dtype = proj.type  # sqlglot.exp.DataType
         column_schema[alias] = dtype.this.value if dtype else None
 
-    result = {model_hash: column_schema}
-    return result
+    return column_schema
 
 
 def field_alias_hasher(expression) -> str:
@@ -21,6 +21,8 @@ from visivo.server.managers.dashboard_manager import DashboardManager
 from visivo.server.managers.project_manager import ProjectManager
 from visivo.server.managers.run_manager import RunManager
 from visivo.server.managers.staged_manager import StagedManager
+from visivo.constants import DEFAULT_RUN_ID
+from visivo.query.result_cache import QueryResultCache
 
 
 class FlaskApp:
@@ -48,6 +50,13 @@ class FlaskApp:
 
         self.app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 0
 
+        # Results of the explorer's and draft insights' source queries, so a
+        # re-opened tab does not run its query against the source again.
+        self.query_result_cache = QueryResultCache(
+            os.path.join(output_dir, "query_results"),
+            schema_dir=os.path.join(output_dir, DEFAULT_RUN_ID, "schemas"),
+        )
+
         # Explorations are project-root workbench data (NOT a rebuildable
         # target/ artifact), stored under a NEW `.visivo/explorations/` dir,
         # created lazily on first write (see ExplorationRepository). Falls
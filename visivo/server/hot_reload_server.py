@@ -17,6 +17,9 @@ class ProjectChangeHandler(FileSystemEventHandler):
         self.last_event_time = 0
         self.debounce_seconds = 0.5  # Debounce events within 500ms
         self.pause_lock = pause_lock or Lock()
+        # Files changed since the callback last ran, including those whose
+        # events the debounce swallowed
+        self.changed_paths = set()
 
     def on_modified(self, event):
         if event.is_directory:
@@ -36,11 +39,13 @@ class ProjectChangeHandler(FileSystemEventHandler):
             return
 
         try:
+            self.changed_paths.add(os.path.abspath(event.src_path))
             current_time = time.time()
             if current_time - self.last_event_time > self.debounce_seconds:
                 Logger.instance().debug(f"Triggering file modified: {event.src_path}")
                 self.last_event_time = current_time
-                self.callback()
+                changed_paths, self.changed_paths = self.changed_paths, set()
+                self.callback(changed_paths)
         finally:
             self.pause_lock.release()
 
@@ -83,9 +88,9 @@ class HotReloadServer:
     def start_file_watcher(self, callback, one_shot=False):
         """Start watching for file changes"""
 
-        def wrapped_callback():
-            # Pass one_shot context to the callback
-            callback(one_shot=one_shot)
+        def wrapped_callback(changed_paths=None):
+            # Pass one_shot context and the changed files to the callback
+            callback(one_shot=one_shot, changed_paths=changed_paths)
             # Notify clients to refresh after callback completes
             self.socketio.emit("reload")
 
@@ -0,0 +1,108 @@
+"""Bounded executor for server jobs that query a source.
+
+Model query jobs and source schema jobs used to start a thread per request,
+and cancelling one only changed its status: the query ran on, holding a
+warehouse slot and a server thread. Each job manager now runs its jobs here:
+
+- at most ``max_workers`` run at once and ``max_queued`` more wait; past that
+  ``submit`` raises ``ExecutorFull`` and the view answers 429,
+- each job runs under a ``CancellationToken``, so ``cancel`` interrupts the
+  query the job is running through the source's driver, and
+- a job still running ``timeout`` seconds after it started is cancelled the
+  same way and reported to ``on_timeout``.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from visivo.logger.logger import Logger
+from visivo.models.sources.cancellation import CancellationToken, cancellation_scope
+
+
+class ExecutorFull(Exception):
+    """Raised by ``submit`` when every worker is busy and the queue is full."""
+
+
+class BoundedJobExecutor:
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_queued: int,
+        timeout: Optional[float] = None,
+        on_timeout: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.timeout = timeout
+        self._on_timeout = on_timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._tokens: Dict[str, CancellationToken] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Jobs running or waiting to."""
+        return len(self._tokens)
+
+    def submit(self, job_id: str, work: Callable[[], None]) -> CancellationToken:
+        """Run ``work`` for ``job_id`` once a worker is free.
+
+        Raises ``ExecutorFull`` instead of queueing past ``max_queued``.
+        """
+        token = CancellationToken()
+        with self._lock:
+            if len(self._tokens) >= self.max_workers + self.max_queued:
+                raise ExecutorFull(
+                    f"{self.name}: {len(self._tokens)} jobs are already running or queued"
+                )
+            self._tokens[job_id] = token
+        try:
+            self._pool.submit(self._run, job_id, token, work)
+        except RuntimeError:
+            with self._lock:
+                self._tokens.pop(job_id, None)
+            raise
+        return token
+
+    def cancel(self, job_id: str, reason: str = "Cancelled by user") -> bool:
+        """Cancel ``job_id``, interrupting its running query. Returns False
+        when the job is not running or queued here."""
+        with self._lock:
+            token = self._tokens.get(job_id)
+        if token is None:
+            return False
+        token.cancel(reason)
+        return True
+
+    def _run(self, job_id: str, token: CancellationToken, work: Callable[[], None]):
+        timer = None
+        try:
+            if token.cancelled:
+                return
+            if self.timeout:
+                timer = threading.Timer(self.timeout, self._time_out, args=(job_id, token))
+                timer.daemon = True
+                timer.start()
+            with cancellation_scope(token):
+                work()
+        except Exception as e:
+            Logger.instance().error(f"{self.name} job {job_id} failed: {e}")
+        finally:
+            if timer is not None:
+                timer.cancel()
+            with self._lock:
+                self._tokens.pop(job_id, None)
+
+    def _time_out(self, job_id: str, token: CancellationToken):
+        if token.cancelled:
+            return
+        reason = f"Timed out after {self.timeout:g} seconds"
+        Logger.instance().info(f"{self.name} job {job_id} {reason.lower()}")
+        # Reported before the query is interrupted, so the job's status says it
+        # timed out rather than how the interrupted query failed
+        if self._on_timeout is not None:
+            self._on_timeout(job_id, reason)
+        token.cancel(reason)
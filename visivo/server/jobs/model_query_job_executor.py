@@ -2,6 +2,7 @@
 
 from visivo.jobs.run_model_data_job import execute_and_get_result
 from visivo.server.managers.preview_run_manager import RunStatus
+from visivo.server.services.query_service import MAX_ROWS
 from visivo.logger.logger import Logger
 
 
@@ -23,7 +24,9 @@ def execute_model_query_job(job_id, config, flask_app, output_dir, job_manager):
 
     Flow:
     1. Find the source by name in the project
-    2. Execute the SQL query using execute_and_get_result from run_model_data_job
+    2. Execute the SQL query using execute_and_get_result from run_model_data_job,
+       limited to MAX_ROWS and answered from the app's query result cache when
+       the same query was run before
     3. Return results in API format {columns, rows, row_count, ...}
 
     Args:
@@ -31,6 +34,7 @@ def execute_model_query_job(job_id, config, flask_app, output_dir, job_manager):
         config: Query configuration dict containing:
             - source_name: Name of the source to query
             - sql: SQL query to execute
+            - refresh: Optional, run the query even when its result is cached
         flask_app: Flask application instance with project
         output_dir: Output directory for files
         job_manager: ModelQueryJobManager instance
@@ -77,6 +81,9 @@ def execute_model_query_job(job_id, config, flask_app, output_dir, job_manager):
         result = execute_and_get_result(
             source=source,
             sql=sql,
+            max_rows=MAX_ROWS,
+            result_cache=flask_app.query_result_cache,
+            refresh=bool(config.get("refresh")),
         )
 
         job_manager.update_status(
@@ -3,7 +3,11 @@
 The editor saves resource edits into each manager's cached tier (not YAML) until
 commit. To rebuild what the user is actually looking at, a run must overlay those
 cached objects onto the published project before running. Shared by the on-save
-run executor (and previously the preview executor)."""
+run executor (and previously the preview executor).
+
+``overlay_cached_objects`` builds that view without copying the published
+project: the overlay shares every object nobody edited, and its DAG is the
+published DAG with only the edited objects linked again."""
 
 from copy import deepcopy
 
@@ -46,3 +50,40 @@ def inject_cached_objects(flask_app, project):
         obj_list = list(getattr(project, project_field, None) or [])
         new_objects = [(name, deepcopy(obj)) for name, obj in cached.items() if obj is not None]
         setattr(project, project_field, merge_objects_into_list(obj_list, new_objects))
+
+
+def overlay_cached_objects(flask_app, project):
+    """A copy of ``project`` with every manager's cached objects in place of the
+    published ones, sharing the rest, and its DAG patched from ``project``'s.
+
+    The cached objects are copied, so a save during the run cannot change what
+    it builds. DuckDB sources are copied too: a run caches a connection on its
+    sources, which must not leak to the server's queries on the published ones.
+    """
+    from visivo.models.sources.base_duckdb_source import BaseDuckdbSource
+
+    updates = {}
+    replacements = []
+    for manager_attr, project_field in MANAGER_TO_PROJECT_FIELD:
+        manager = getattr(flask_app, manager_attr, None)
+        cached = manager.cached_objects if manager else None
+        obj_list = list(getattr(project, project_field, None) or [])
+        new_objects = [
+            (name, deepcopy(obj)) for name, obj in (cached or {}).items() if obj is not None
+        ]
+        if project_field == "sources":
+            cached_names = {name for name, _ in new_objects}
+            new_objects += [
+                (source.name, source.model_copy())
+                for source in obj_list
+                if isinstance(source, BaseDuckdbSource) and source.name not in cached_names
+            ]
+        if not new_objects:
+            continue
+        published = {o.name: o for o in obj_list if hasattr(o, "name")}
+        replacements.extend((published.get(name), obj) for name, obj in new_objects)
+        updates[project_field] = merge_objects_into_list(obj_list, new_objects)
+
+    overlay = project.model_copy(update=updates)
+    overlay._cached_dag = project.dag().patched(overlay, replacements)
+    return overlay
@@ -9,12 +9,11 @@ and no full page reload.
 """
 
 import threading
-from copy import deepcopy
 
 from visivo.constants import DEFAULT_RUN_ID
 from visivo.jobs.filtered_runner import FilteredRunner
 from visivo.logger.logger import Logger
-from visivo.server.jobs.project_injection import inject_cached_objects
+from visivo.server.jobs.project_injection import overlay_cached_objects
 from visivo.server.managers.run_manager import RunState
 
 # Coalesce rapid saves (e.g. one editor action touching several rows) into one run.
@@ -98,9 +97,7 @@ def _execute(flask_app, run_id, dag_filter):
     run_manager = flask_app.run_manager
     run_manager.set_state(run_id, RunState.RUNNING)
     try:
-        project = deepcopy(flask_app.project)
-        inject_cached_objects(flask_app, project)
-        project.invalidate_dag_cache()
+        project = overlay_cached_objects(flask_app, flask_app.project)
 
         runner = FilteredRunner(
             project=project,
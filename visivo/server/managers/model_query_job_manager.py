@@ -5,6 +5,7 @@ Handles:
 - Job creation and ID generation
 - Job status tracking (queued, running, completed, failed, cancelled)
 - Result storage and retrieval
+- Running jobs on a bounded executor, with cancellation and timeouts
 - Automatic cleanup of old jobs
 
 Follows the same pattern as PreviewRunManager for consistency.
@@ -15,8 +16,9 @@ import json
 import threading
 import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
+from visivo.server.jobs.bounded_executor import BoundedJobExecutor
 from visivo.server.managers.preview_run_manager import RunStatus
 from visivo.logger.logger import Logger
 
@@ -74,6 +76,13 @@ class ModelQueryJobManager:
     _instance = None
     _lock = threading.Lock()
 
+    # Queries running at once, and waiting for a worker; beyond that a new
+    # job is refused with a 429
+    MAX_RUNNING = 4
+    MAX_QUEUED = 16
+    # A query still running this long after it started is cancelled
+    TIMEOUT_SECONDS = 300
+
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
@@ -92,6 +101,13 @@ class ModelQueryJobManager:
         self._jobs_lock = threading.Lock()
         self._cleanup_interval = 1800  # 30 minutes in seconds
         self._max_job_age = timedelta(hours=1)
+        self._executor = BoundedJobExecutor(
+            "model-query",
+            max_workers=self.MAX_RUNNING,
+            max_queued=self.MAX_QUEUED,
+            timeout=self.TIMEOUT_SECONDS,
+            on_timeout=self._timed_out,
+        )
         self._start_cleanup_thread()
         Logger.instance().info("ModelQueryJobManager initialization complete")
 
@@ -148,6 +164,11 @@ class ModelQueryJobManager:
                 Logger.instance().warning(f"Attempted to update non-existent job {job_id}")
                 return
 
+            if job.status == RunStatus.CANCELLED and status != RunStatus.CANCELLED:
+                # The worker of a cancelled job still reports how its
+                # interrupted query ended
+                return
+
             job.status = status
 
             if status == RunStatus.RUNNING and not job.started_at:
@@ -183,6 +204,8 @@ class ModelQueryJobManager:
             if not job:
                 Logger.instance().warning(f"Attempted to set result for non-existent job {job_id}")
                 return
+            if job.status == RunStatus.CANCELLED:
+                return
 
             job.result = result
             job.status = RunStatus.COMPLETED
@@ -206,14 +229,27 @@ class ModelQueryJobManager:
             if job:
                 job.run_id = run_id
 
+    def submit(self, job_id: str, work: Callable[[], None]):
+        """
+        Run a job's work on the bounded executor.
+
+        Raises:
+            ExecutorFull: when MAX_RUNNING jobs are running and MAX_QUEUED waiting
+        """
+        return self._executor.submit(job_id, work)
+
     def cancel_job(self, job_id: str):
         """
         Cancel a job (if queued or running).
 
-        Note: Actual job cancellation depends on executor implementation.
-        This marks the job as cancelled but doesn't stop running threads.
+        Marks the job as cancelled, then interrupts the query it is running
+        through the source's driver. A queued job never starts.
         """
         self.update_status(job_id, RunStatus.CANCELLED, progress_message="Cancelled by user")
+        self._executor.cancel(job_id)
+
+    def _timed_out(self, job_id: str, reason: str):
+        self.update_status(job_id, RunStatus.CANCELLED, error=reason, progress_message="Timed out")
 
     def delete_job(self, job_id: str):
         """Remove job from tracking (cleanup)"""
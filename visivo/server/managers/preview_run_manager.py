@@ -5,6 +5,7 @@ Handles:
 - Run creation and ID generation
 - Run status tracking (queued, running, completed, failed)
 - Result storage and retrieval
+- Running runs on a bounded executor, with cancellation and timeouts
 - Automatic cleanup of old runs
 
 Note: These are "runs" not "jobs" because each run executes many jobs in a DAG.
@@ -16,9 +17,10 @@ import threading
 import uuid
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from visivo.logger.logger import Logger
+from visivo.server.jobs.bounded_executor import BoundedJobExecutor
 
 
 class RunStatus(str, Enum):
@@ -94,6 +96,13 @@ class PreviewRunManager:
     _instance = None
     _lock = threading.Lock()
 
+    # Runs executing at once, and waiting for a worker; beyond that a new run
+    # is refused with a 429
+    MAX_RUNNING = 2
+    MAX_QUEUED = 8
+    # A run still executing this long after it started is cancelled
+    TIMEOUT_SECONDS = 900
+
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
@@ -117,6 +126,13 @@ class PreviewRunManager:
         Logger.instance().info("Created runs lock")
         self._cleanup_interval = 3600  # 1 hour in seconds
         self._max_run_age = timedelta(hours=2)  # Runs older than 2 hours are cleaned up
+        self._executor = BoundedJobExecutor(
+            "preview-run",
+            max_workers=self.MAX_RUNNING,
+            max_queued=self.MAX_QUEUED,
+            timeout=self.TIMEOUT_SECONDS,
+            on_timeout=self._timed_out,
+        )
         self._start_cleanup_thread()
         Logger.instance().info("PreviewRunManager initialization complete")
 
@@ -213,6 +229,11 @@ class PreviewRunManager:
                 Logger.instance().warning(f"Attempted to update non-existent run {run_id}")
                 return
 
+            if run.status == RunStatus.CANCELLED and status != RunStatus.CANCELLED:
+                # The worker of a cancelled run still reports how its
+                # interrupted queries ended
+                return
+
             run.status = status
 
             if status == RunStatus.RUNNING and not run.started_at:
@@ -251,6 +272,8 @@ class PreviewRunManager:
             if not run:
                 Logger.instance().warning(f"Attempted to set result for non-existent run {run_id}")
                 return
+            if run.status == RunStatus.CANCELLED:
+                return
 
             run.result = result
             # Update status directly without re-acquiring lock (to avoid deadlock)
@@ -273,14 +296,27 @@ class PreviewRunManager:
 
         return run.result
 
+    def submit(self, run_id: str, work: Callable[[], None]):
+        """
+        Execute a run's work on the bounded executor.
+
+        Raises:
+            ExecutorFull: when MAX_RUNNING runs are executing and MAX_QUEUED waiting
+        """
+        return self._executor.submit(run_id, work)
+
     def cancel_run(self, run_id: str):
         """
         Cancel a run (if queued or running).
 
-        Note: Actual run cancellation depends on runner implementation.
-        This marks the run as cancelled but doesn't stop running threads.
+        Marks the run as cancelled, then interrupts the query it is running
+        through the source's driver. A queued run never starts.
         """
         self.update_status(run_id, RunStatus.CANCELLED, progress_message="Cancelled by user")
+        self._executor.cancel(run_id)
+
+    def _timed_out(self, run_id: str, reason: str):
+        self.update_status(run_id, RunStatus.CANCELLED, error=reason, progress_message="Timed out")
 
     def delete_run(self, run_id: str):
         """Remove run from tracking (cleanup)"""
@@ -4,6 +4,7 @@ import time
 from typing import Dict, Any, Optional
 from visivo.logger.logger import Logger
 from visivo.models.project import Project
+from visivo.query.result_cache import QueryResultCache, read_rows
 
 # Maximum number of rows to return from a query (will truncate if exceeded)
 MAX_ROWS = 100000
@@ -62,15 +63,24 @@ def parse_sql_error(error: Exception, query: str) -> str:
 
 
 def execute_query_on_source(
-    query: str, source_name: Optional[str], project: Project
+    query: str,
+    source_name: Optional[str],
+    project: Project,
+    result_cache: Optional[QueryResultCache] = None,
+    refresh: bool = False,
 ) -> Dict[str, Any]:
     """
     Execute a SQL query on a specified source.
 
+    The query is limited to MAX_ROWS in SQL where it can be, rather than
+    fetched whole and cut afterwards.
+
     Args:
         query: The SQL query to execute
         source_name: Optional name of the source to use. If None, uses default source.
         project: The Visivo project containing source configurations
+        result_cache: Optional cache to answer the query from and store its result in
+        refresh: Run the query even when result_cache holds its result
 
     Returns:
         Dictionary containing:
@@ -78,6 +88,7 @@ def execute_query_on_source(
         - rows: List of row dictionaries
         - is_truncated: Boolean indicating if results were truncated at MAX_ROWS
         - execution_time: Query execution time in seconds
+        - cached: Whether the result came from result_cache
 
     Raises:
         ValueError: If no source is available or query execution fails
@@ -104,39 +115,26 @@ def execute_query_on_source(
     # Execute the query and measure execution time
     start_time = time.time()
     try:
-        result = source.read_sql(query)
+        result = read_rows(source, query, max_rows=MAX_ROWS, cache=result_cache, refresh=refresh)
     except Exception as e:
         # Parse and enhance the error message
         enhanced_error = parse_sql_error(e, query)
         raise ValueError(enhanced_error) from e
     execution_time = round(time.time() - start_time, 3)
 
-    # Check if we need to truncate results
-    is_truncated = False
-    if result and len(result) > MAX_ROWS:
-        original_length = len(result)
-        result = result[:MAX_ROWS]
-        is_truncated = True
-        Logger.instance().info(f"Query returned {original_length} rows, truncated to {MAX_ROWS}")
+    if result.is_truncated:
+        Logger.instance().info(f"Query returned more than {MAX_ROWS} rows, truncated to {MAX_ROWS}")
 
     # Transform the result into the expected format
-    if result is None or len(result) == 0:
-        response_data = {
-            "columns": [],
-            "rows": [],
-            "is_truncated": False,
-            "execution_time": execution_time,
-            "source_name": source.name,
-        }
-    else:
+    rows = result.rows
+    response_data = {
         # Extract column names from the first row
-        columns = list(result[0].keys()) if result else []
-        response_data = {
-            "columns": columns,
-            "rows": result,
-            "is_truncated": is_truncated,
-            "execution_time": execution_time,
-            "source_name": source.name,
-        }
+        "columns": list(rows[0].keys()) if rows else [],
+        "rows": rows,
+        "is_truncated": result.is_truncated,
+        "execution_time": execution_time,
+        "source_name": source.name,
+        "cached": result.cached,
+    }
 
     return response_data
@@ -1,15 +1,26 @@
 import os
 import threading
+from collections import OrderedDict
 from flask import jsonify, send_file
+from visivo.jobs.file_index import content_hash, entry_is_current, index_path, load_index
 from visivo.logger.logger import Logger
 from visivo.models.base.named_model import alpha_hash
 
+# Most parquet ETags kept in memory; the least recently served are dropped first.
+MAX_CACHED_ETAGS = 4096
+
 
 def register_file_views(app, output_dir):
     # Per-run cache: {run_id: {hash: parquet_filename}}. Lazy-built on first
     # request for a run; refreshed on a cache-miss before returning 404 so a
     # freshly-written parquet is served without restarting the server.
     _cache = {}
+    # Per-run file index written by the jobs: {run_id: (index mtime, entries)}.
+    # Reloaded when the index file changes.
+    _index_cache = {}
+    # Content-hash ETags, computed on first serve: {path: ((size, mtime), etag)},
+    # least recently served first.
+    _etag_cache = OrderedDict()
     _lock = threading.Lock()
 
     # Parquet is written into the directory named for what produced it, so the
@@ -40,6 +51,58 @@ def register_file_views(app, output_dir):
                 _cache[run_id] = mapping
             return mapping.get(hash_value)
 
+    def _index_entries(run_id):
+        run_output_dir = os.path.join(output_dir, run_id)
+        try:
+            mtime = os.stat(index_path(run_output_dir)).st_mtime_ns
+        except OSError:
+            return {}
+        with _lock:
+            cached = _index_cache.get(run_id)
+            if cached is None or cached[0] != mtime:
+                cached = (mtime, load_index(run_output_dir))
+                _index_cache[run_id] = cached
+            return cached[1]
+
+    def _resolve_from_index(hash_value, run_id):
+        """The path the run's file index records for ``hash_value``, or ``None``
+        when it has no entry or the file changed since it was indexed."""
+        entry = _index_entries(run_id).get(hash_value)
+        if not entry:
+            return None
+        path = os.path.join(output_dir, run_id, entry["path"])
+        if not entry_is_current(entry, path):
+            return None
+        return path
+
+    def _etag(path):
+        stat = os.stat(path)
+        key = (stat.st_size, stat.st_mtime_ns)
+        with _lock:
+            cached = _etag_cache.get(path)
+            if cached and cached[0] == key:
+                _etag_cache.move_to_end(path)
+                return cached[1]
+        etag = content_hash(path)
+        with _lock:
+            _etag_cache[path] = (key, etag)
+            _etag_cache.move_to_end(path)
+            while len(_etag_cache) > MAX_CACHED_ETAGS:
+                _etag_cache.popitem(last=False)
+        return etag
+
+    def _send_parquet(path):
+        # Conditional responses give If-None-Match 304s against the content
+        # hash and Range requests 206s, so DuckDB-WASM can read the footer and
+        # the row groups it needs rather than the whole file. max_age=0 keeps
+        # "no-cache": the viewer revalidates and gets a 304 when unchanged.
+        return send_file(
+            path,
+            conditional=True,
+            etag=_etag(path),
+            max_age=0,
+        )
+
     @app.route("/api/files/<hash>/<run_id>/")
     def serve_file_data_by_hash_with_run(hash, run_id):
         """Serve a parquet by hash, with a fallback that hashes on-disk stems.
@@ -47,20 +110,26 @@ def register_file_views(app, output_dir):
         Resolution order:
           1. Direct match: ``<run_id>/<dir>/<hash>.parquet`` (legacy path used
              pre-1.0.82 when parquets were written with hash filenames).
-          2. Hash-of-stem fallback: scan the run's parquet dirs, return the
-             one whose stem hashes to ``<hash>``. This is the post-1.0.82 path
-             — parquets are written under their clean name while the frontend
-             still requests ``alpha_hash(name)``.
+          2. The run's file index, written by the jobs as they write parquet
+             (``visivo.jobs.file_index``), saved when a run ends.
+          3. Hash-of-stem fallback: scan the run's parquet dirs, return the
+             one whose stem hashes to ``<hash>``. This covers runs written
+             before the index existed — parquets are written under their
+             clean name while the frontend still requests ``alpha_hash(name)``.
         """
         try:
             for files_dir in _parquet_dirs(run_id):
                 data_file = os.path.join(files_dir, f"{hash}.parquet")
                 if os.path.exists(data_file):
-                    return send_file(data_file)
+                    return _send_parquet(data_file)
+
+            indexed = _resolve_from_index(hash, run_id)
+            if indexed:
+                return _send_parquet(indexed)
 
             resolved = _resolve_filename(hash, run_id)
             if resolved and os.path.exists(resolved):
-                return send_file(resolved)
+                return _send_parquet(resolved)
 
             return (
                 jsonify({"message": f"Data file not found for hash: {hash} in run: {run_id}"}),
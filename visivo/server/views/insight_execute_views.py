@@ -9,7 +9,10 @@ over a 1,000-row sample is not the real result. This endpoint builds the SAME
 in-memory draft overlay compile-draft uses, but with ``force_dynamic=False`` so
 ``get_query_info`` yields the real SOURCE-dialect query (CTEs over the real
 tables + relation joins + aggregations + GROUP BY / HAVING / QUALIFY / ORDER BY),
-executes it ONCE against the source, and returns the final chart rows.
+executes it ONCE against the source, and returns the final chart rows. The
+result is kept in the app's query result cache, so re-opening the same draft
+does not run it again unless the body sets ``refresh: true``; the rows are
+never limited, as a chart needs all of them.
 
 Like compile-draft it builds an ephemeral deepcopy overlay and NEVER writes
 artifacts or schedules a run — it only adds a single blocking source read
@@ -50,7 +53,8 @@ from visivo.server.views.insight_draft_common import (
 def register_insight_execute_views(app, flask_app, output_dir):
     @app.route("/api/insight-execute-draft/", methods=["POST"])
     def execute_draft_insight():
-        fields, error = parse_draft_request(request.get_json(silent=True))
+        body = request.get_json(silent=True)
+        fields, error = parse_draft_request(body)
         if error:
             return error
         insight_config = fields["insight_config"]
@@ -157,7 +161,12 @@ def register_insight_execute_views(app, flask_app, output_dir):
 
         try:
             # No output_dir/name → pure in-memory execution, no parquet written.
-            result = execute_and_get_result(source=source, sql=query_info.pre_query)
+            result = execute_and_get_result(
+                source=source,
+                sql=query_info.pre_query,
+                result_cache=flask_app.query_result_cache,
+                refresh=bool(body.get("refresh")),
+            )
         except Exception as e:
             message = str(e)
             Logger.instance().error(f"execute-draft: source execution failed: {e}")
@@ -1,9 +1,11 @@
 """Model Query Jobs API endpoints for async SQL query execution."""
 
-import threading
+from functools import partial
+
 from flask import jsonify, request
 
 from visivo.logger.logger import Logger
+from visivo.server.jobs.bounded_executor import ExecutorFull
 from visivo.server.managers.model_query_job_manager import ModelQueryJobManager
 from visivo.server.jobs.model_query_job_executor import execute_model_query_job
 
@@ -16,9 +18,11 @@ def register_model_query_jobs_views(app, flask_app, output_dir):
 
         POST body: {
             "source_name": "source_name",  # Required: name of source to query
-            "sql": "SELECT * FROM ..."     # Required: SQL query to execute
+            "sql": "SELECT * FROM ...",    # Required: SQL query to execute
+            "refresh": true                # Optional: skip the query result cache
         }
         Returns: {"job_id": "uuid", "status": "queued"}
+        429 when too many queries are already running or queued.
         """
         try:
             Logger.instance().info("Received POST to /api/model-query-jobs/")
@@ -41,19 +45,25 @@ def register_model_query_jobs_views(app, flask_app, output_dir):
             config = {
                 "source_name": source_name,
                 "sql": sql,
+                "refresh": bool(data.get("refresh")),
             }
 
             # Create job via ModelQueryJobManager
             job_manager = ModelQueryJobManager.instance()
             job_id = job_manager.create_job(config)
 
-            # Execute job in background thread
-            thread = threading.Thread(
-                target=execute_model_query_job,
-                args=(job_id, config, flask_app, output_dir, job_manager),
-                daemon=True,
-            )
-            thread.start()
+            # Execute job on the manager's bounded executor
+            try:
+                job_manager.submit(
+                    job_id,
+                    partial(
+                        execute_model_query_job, job_id, config, flask_app, output_dir, job_manager
+                    ),
+                )
+            except ExecutorFull as e:
+                job_manager.delete_job(job_id)
+                Logger.instance().info(f"Refused model query job: {e}")
+                return jsonify({"error": str(e)}), 429, {"Retry-After": "1"}
 
             Logger.instance().info(f"Started model query job {job_id}")
             return jsonify({"job_id": job_id, "status": "queued"}), 202
@@ -81,6 +91,8 @@ def register_model_query_jobs_views(app, flask_app, output_dir):
             "rows": [{"col1": val1, "col2": val2}, ...],
             "row_count": 100,
             "execution_time_ms": 150,
+            "is_truncated": false,  # true when cut to MAX_ROWS
+            "cached": false,        # true when answered from the query result cache
             "source_name": "my_source"
         }
         """
@@ -99,7 +111,7 @@ def register_model_query_jobs_views(app, flask_app, output_dir):
 
     @app.route("/api/model-query-jobs/<job_id>/", methods=["DELETE"])
     def cancel_model_query_job(job_id):
-        """Cancel a running query job.
+        """Cancel a running query job, interrupting its query on the source.
 
         Returns: {"message": "Job cancelled", "job_id": "uuid"}
         """
@@ -118,3 +130,23 @@ def register_model_query_jobs_views(app, flask_app, output_dir):
         except Exception as e:
             Logger.instance().error(f"Error cancelling model query job: {str(e)}")
             return jsonify({"error": str(e)}), 500
+
+    @app.route("/api/query-cache/", methods=["GET"])
+    def get_query_cache():
+        """Sizes and hit counts of the query result cache.
+
+        Returns: {"entries": 3, "bytes": 1024, "max_bytes": ..., "ttl_seconds": ...,
+                  "hits": 5, "misses": 3}
+        """
+        return jsonify(flask_app.query_result_cache.stats())
+
+    @app.route("/api/query-cache/", methods=["DELETE"])
+    def clear_query_cache():
+        """Drop cached query results, for one source with ?source_name=..., or all.
+
+        Returns: {"invalidated": 3}
+        """
+        source_name = request.args.get("source_name")
+        invalidated = flask_app.query_result_cache.invalidate(source_name)
+        Logger.instance().info(f"Dropped {invalidated} cached query results")
+        return jsonify({"invalidated": invalidated})
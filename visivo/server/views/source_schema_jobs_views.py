@@ -5,16 +5,19 @@ with on-demand generation fallback.
 API Design follows the pattern from insight_views.py:
 - POST /api/source-schema-jobs/ with body {"config": {"source_name": "..."}, "run": true}
 - GET /api/source-schema-jobs/<job_id>/ for job status
+- DELETE /api/source-schema-jobs/<job_id>/ to cancel a job
 - GET /api/source-schema-jobs/ for listing sources
 - GET /api/source-schema-jobs/<source_name>/schema/ for reading cached schema
 """
 
-import threading
+from functools import partial
+
 from flask import jsonify, request
 
 from visivo.constants import DEFAULT_RUN_ID
 from visivo.logger.logger import Logger
 from visivo.query.schema_aggregator import SchemaAggregator
+from visivo.server.jobs.bounded_executor import ExecutorFull
 from visivo.server.managers.preview_run_manager import PreviewRunManager, RunStatus
 from visivo.server.jobs.source_schema_job_executor import execute_source_schema_job
 from visivo.server.views.schema_path_safety import is_safe_path_segment
@@ -178,12 +181,22 @@ def register_source_schema_jobs_views(app, flask_app, output_dir):
             run_id = run_manager.create_run(config, object_type="source_schema")
             Logger.instance().info(f"Created schema generation run with run_id: {run_id}")
 
-            thread = threading.Thread(
-                target=execute_source_schema_job,
-                args=(run_id, config, flask_app, output_dir, run_manager),
-                daemon=True,
-            )
-            thread.start()
+            try:
+                run_manager.submit(
+                    run_id,
+                    partial(
+                        execute_source_schema_job,
+                        run_id,
+                        config,
+                        flask_app,
+                        output_dir,
+                        run_manager,
+                    ),
+                )
+            except ExecutorFull as e:
+                run_manager.delete_run(run_id)
+                Logger.instance().info(f"Refused schema generation run: {e}")
+                return jsonify({"message": str(e)}), 429, {"Retry-After": "1"}
 
             Logger.instance().info(f"Started schema generation run {run_id} for {source_name}")
             return jsonify({"run_id": run_id}), 202
@@ -216,6 +229,21 @@ def register_source_schema_jobs_views(app, flask_app, output_dir):
             Logger.instance().error(f"Error in get_source_schema_or_job_status: {str(e)}")
             return jsonify({"message": str(e)}), 500
 
+    @app.route("/api/source-schema-jobs/<job_id>/", methods=["DELETE"])
+    def cancel_source_schema_job(job_id):
+        """Cancel a schema generation job, interrupting its query on the source.
+
+        Returns: {"message": "Job cancelled", "run_id": "uuid"}
+        """
+        run_manager = PreviewRunManager.instance()
+        run = run_manager.get_run(job_id)
+        if not run or run.object_type != "source_schema":
+            return jsonify({"message": f"Job {job_id} not found"}), 404
+
+        run_manager.cancel_run(job_id)
+        Logger.instance().info(f"Cancelled schema generation job {job_id}")
+        return jsonify({"message": "Job cancelled", "run_id": job_id})
+
     def _get_job_status(job_id):
         """Get status of a schema generation job."""
         Logger.instance().info(f"GET /api/source-schema-jobs/{job_id}/ - fetching job status")
@@ -8,7 +8,6 @@ Telemetry can be disabled via:
 - Global config: ~/.visivo/config.yml with telemetry_enabled: false
 """
 
-from .client import TelemetryClient, get_telemetry_client
 from .config import is_telemetry_enabled
 from .context import get_telemetry_context
 
@@ -18,3 +17,13 @@ __all__ = [
     "is_telemetry_enabled",
     "get_telemetry_context",
 ]
+
+
+def __getattr__(name):
+    # The client imports the PostHog SDK; loaded on first use, so a CLI run
+    # with telemetry disabled never imports it
+    if name in ("TelemetryClient", "get_telemetry_client"):
+        from . import client
+
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")